@@ -0,0 +1,6 @@
+"""Benchmarks for JITB's hot paths.
+
+Run them from a JITB source checkout (they read the test fixtures).
+
+Usage: jitb bench --help
+"""
@@ -0,0 +1,147 @@
+"""Runs the JITB benchmark suites, saves their results as JSON, and compares runs.
+
+Each suite is a function, given the number of samples to take, which returns a list of
+BenchResults.  The results are written as JSON:
+
+    {"created": "...", "jitb": "2.0.0", "python": "3.11.7", "platform": "...",
+     "results": {"<suite>/<measurement>": {"unit": "s", "better": "lower", "samples": [...],
+                                             "median": 0.0012, ...}, ...}}
+
+Compare a run to a baseline to flag any measurement which got more than threshold percent
+worse.
+
+Typical Usage:
+    results = run_benchmarks(suites=['id_page'], repeat=5)
+    write_results(results, 'after.json')
+    regressions = compare_results(load_results('before.json'), results, threshold=10.0)
+"""
+
+# Standard Imports
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+import json
+import platform
+import time
+# Third Party Imports
+from hobo.validation import validate_list, validate_string, validate_type
+# Local Imports
+from bench.bench_result import BenchResult
+from jitb.jitb_globals import JITB_BENCH_REPEAT, JITB_BENCH_SUITES, JITB_BENCH_THRESHOLD
+from jitb.jitb_logger import Logger
+from jitb.jitb_misc import get_jitb_version
+from jitb.jitb_validation import validate_pos_int
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = JITB_BENCH_THRESHOLD) -> List[str]:
+    """Flag measurements whose median got more than threshold percent worse than baseline.
+
+    Measurements missing from either run are ignored.
+
+    Args:
+        baseline: Results from an earlier run (see: load_results()).
+        current: Results from this run.
+        threshold: Optional; The percent change which counts as a regression.
+
+    Returns:
+        A description of each regression.  Empty if there are none.
+
+    Raises:
+        TypeError: Bad data type.
+        ValueError: Negative threshold.
+    """
+    # LOCAL VARIABLES
+    regressions = []  # Descriptions of each regression
+    change = 0.0      # Percent change of a measurement's median, positive is worse
+
+    # INPUT VALIDATION
+    validate_type(baseline, 'baseline', dict)
+    validate_type(current, 'current', dict)
+    validate_type(threshold, 'threshold', (int, float))
+    if threshold < 0:
+        raise ValueError(f'Invalid threshold: {threshold}')
+
+    # COMPARE
+    for name, result in current.get('results', {}).items():
+        before = baseline.get('results', {}).get(name)
+        if not before or not before['median']:
+            continue
+        change = (result['median'] - before['median']) / before['median'] * 100
+        if result['better'] == 'higher':
+            change = -change
+        if change > threshold:
+            regressions.append(f'{name}: {before["median"]:.6g} -> {result["median"]:.6g} '
+                               f'{result["unit"]} ({change:.1f}% worse)')
+
+    # DONE
+    return regressions
+
+
+def load_results(filename: str) -> Dict[str, Any]:
+    """Read results written by write_results()."""
+    validate_string(filename, 'filename', can_be_empty=False)
+    with open(filename, 'r', encoding='utf-8') as in_file:
+        return json.load(in_file)
+
+
+def run_benchmarks(suites: List[str] = None, repeat: int = JITB_BENCH_REPEAT) -> Dict[str, Any]:
+    """Run benchmark suites.
+
+    Args:
+        suites: Optional; The JITB_BENCH_SUITES to run.  Defaults to all of them.
+        repeat: Optional; The number of samples to take of each measurement.
+
+    Returns:
+        The results, ready for write_results().
+
+    Raises:
+        TypeError: Bad data type.
+        ValueError: Unknown suite or invalid repeat.
+    """
+    # LOCAL VARIABLES
+    suites = suites if suites else JITB_BENCH_SUITES  # Suites to run
+    results = {}                                       # Summarized BenchResults, by name
+    start = 0.0                                        # When a suite started
+
+    # INPUT VALIDATION
+    validate_list(suites, 'suites', can_be_empty=False)
+    validate_pos_int(repeat, 'repeat')
+    for suite in suites:
+        if suite not in JITB_BENCH_SUITES:
+            raise ValueError(f'Unknown benchmark suite: {suite}')
+
+    # RUN
+    for suite in suites:
+        start = time.perf_counter()
+        for result in _get_suite(suite)(repeat):
+            results[result.name] = result.summarize()
+        Logger.info(f'Ran the {suite} benchmarks in {time.perf_counter() - start:.1f} seconds')
+
+    # DONE
+    return {'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'jitb': get_jitb_version(), 'python': platform.python_version(),
+            'platform': platform.platform(), 'results': results}
+
+
+def write_results(results: Dict[str, Any], filename: str) -> None:
+    """Write results, from run_benchmarks(), to filename as JSON."""
+    validate_type(results, 'results', dict)
+    validate_string(filename, 'filename', can_be_empty=False)
+    with open(filename, 'w', encoding='utf-8') as out_file:
+        json.dump(results, out_file, indent=4)
+        out_file.write('\n')
+
+
+def _get_suite(suite: str) -> Callable[[int], List[BenchResult]]:
+    """Import a benchmark suite's function, so only the suites being run import their needs."""
+    # pylint: disable = import-outside-toplevel
+    if suite == 'id_page':
+        from bench.bench_pages import bench_id_page as bench_func
+    elif suite == 'play_tick':
+        from bench.bench_pages import bench_play_tick as bench_func
+    elif suite == 'strings':
+        from bench.bench_strings import bench_strings as bench_func
+    else:
+        from bench.bench_openai import bench_jitb_ai as bench_func
+    # pylint: enable = import-outside-toplevel
+    return bench_func
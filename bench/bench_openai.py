@@ -0,0 +1,158 @@
+"""Benchmarks JitbAi's end-to-end latency against a local mock of the OpenAI API.
+
+The mock serves /v1/chat/completions on localhost, as JSON or as a server-sent event stream,
+and sends its answer one word at a time, CHUNK_DELAY seconds apart.  The answer overflows the
+length limit, so a streaming JitbAi cuts it off early.  The OpenAI client, rate limiter, answer
+polishing, and HTTP round trip are all measured.  OpenAI itself is not.
+
+    jitb_ai/generate_answer: Seconds per JitbAi.generate_answer() call.
+    jitb_ai/generate_answer-stream: Same, with stream=True.
+"""
+
+# Standard Imports
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Final, Iterator, List
+from unittest import mock
+import json
+import os
+import threading
+import time
+# Third Party Imports
+# Local Imports
+from bench.bench_result import BenchResult
+from jitb.jitb_globals import OPENAI_KEY_ENV_VAR
+from jitb.jitb_openai import JitbAi
+from jitb.jitb_ratelimit import RateLimiter
+
+
+CHUNK_DELAY: Final[float] = 0.005  # Seconds the mock takes to generate each word
+# The mock's answer to every request
+MOCK_ANSWER: Final[str] = '"My grandma secretly loves pickles in space, where nobody can hear ' \
+                          'you scream about taxes, the robot butler, or the haunted toaster"'
+PROMPT: Final[str] = 'The worst thing to say at a funeral: _____'  # Prompt to answer
+
+
+class _MockOpenAiHandler(BaseHTTPRequestHandler):
+    """Answers chat.completions requests with MOCK_ANSWER."""
+
+    protocol_version = 'HTTP/1.1'  # Keep the connection alive between requests
+
+    def do_POST(self) -> None:  # pylint: disable = invalid-name
+        """Answer a chat.completions request."""
+        # LOCAL VARIABLES
+        # The request's JSON body
+        request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        words = MOCK_ANSWER.split(' ')  # The answer, one chunk at a time
+
+        # ANSWER IT
+        try:
+            if request.get('stream'):
+                self._send_stream(request['model'], words)
+            else:
+                time.sleep(CHUNK_DELAY * len(words))
+                self._send_json(_completion(request['model'], MOCK_ANSWER))
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # The client cut the stream off
+
+    def log_message(self, format: str, *args) -> None:  # pylint: disable = redefined-builtin
+        """Don't log each request."""
+
+    def _send_headers(self, content_type: str) -> None:
+        """Send the status line, and the headers which keep JitbAi's rate limiter out of it."""
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('x-ratelimit-limit-requests', '1000000')
+        self.send_header('x-ratelimit-remaining-requests', '1000000')
+        self.send_header('x-ratelimit-limit-tokens', '1000000000')
+        self.send_header('x-ratelimit-remaining-tokens', '1000000000')
+
+    def _send_json(self, body: dict) -> None:
+        """Send a JSON response."""
+        # LOCAL VARIABLES
+        data = json.dumps(body).encode('utf-8')  # Response body
+
+        # SEND IT
+        self._send_headers('application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, model: str, words: List[str]) -> None:
+        """Send a server-sent event stream, one word per chunk, and close the connection."""
+        self._send_headers('text/event-stream')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+        for num, word in enumerate(words):
+            time.sleep(CHUNK_DELAY)
+            self._send_event(_completion(model, word if not num else ' ' + word, chunk=True))
+        self.wfile.write(b'data: [DONE]\n\n')
+        self.wfile.flush()
+
+    def _send_event(self, body: dict) -> None:
+        """Send one server-sent event."""
+        self.wfile.write(f'data: {json.dumps(body)}\n\n'.encode('utf-8'))
+        self.wfile.flush()
+
+
+def bench_jitb_ai(repeat: int) -> List[BenchResult]:
+    """Time JitbAi.generate_answer(), with and without streaming, against the mock."""
+    # LOCAL VARIABLES
+    results = []   # One BenchResult per mode
+    ai_obj = None  # JitbAi to benchmark
+    start = 0.0    # When a call started
+
+    # BENCH IT
+    with _serve_mock_openai():
+        for stream in (False, True):
+            ai_obj = JitbAi(stream=stream, rate_limiter=RateLimiter(rpm=1000000, tpm=1000000000))
+            results.append(BenchResult('jitb_ai/generate_answer' + ('-stream' if stream else ''),
+                                       unit='s'))
+            for num in range(repeat + 1):
+                start = time.perf_counter()
+                ai_obj.generate_answer(prompt=PROMPT)
+                if num:
+                    results[-1].samples.append(time.perf_counter() - start)  # 0 connects
+            ai_obj.tear_down()
+
+    # DONE
+    return results
+
+
+def _completion(model: str, content: str, chunk: bool = False) -> dict:
+    """A chat.completion, or chat.completion.chunk, body with content."""
+    # LOCAL VARIABLES
+    choice = {'index': 0, 'finish_reason': None}  # The only choice
+
+    # BUILD IT
+    if chunk:
+        choice['delta'] = {'role': 'assistant', 'content': content}
+    else:
+        choice['message'] = {'role': 'assistant', 'content': content}
+        choice['finish_reason'] = 'stop'
+
+    # DONE
+    return {'id': 'chatcmpl-jitb-bench', 'created': int(time.time()), 'model': model,
+            'object': 'chat.completion.chunk' if chunk else 'chat.completion',
+            'choices': [choice]}
+
+
+@contextmanager
+def _serve_mock_openai() -> Iterator[None]:
+    """Serve the mock, and point the OpenAI client at it, until exit."""
+    # LOCAL VARIABLES
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _MockOpenAiHandler)  # Mock OpenAI API
+    # Serves the mock in the background
+    thread = threading.Thread(target=server.serve_forever, name='mock-openai', daemon=True)
+
+    # SERVE IT
+    thread.start()
+    try:
+        with mock.patch.dict(os.environ, {OPENAI_KEY_ENV_VAR: 'jitb-bench',
+                                          'OPENAI_BASE_URL':
+                                          f'http://127.0.0.1:{server.server_port}/v1'}):
+            yield
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,143 @@
+"""Benchmarks each game's page handling against the saved jackbox.tv pages.
+
+Every page in the fixture store (see: test.fixture_store) is loaded into an OfflineWebDriver
+(see: test.offline_web_driver), so no Chrome is needed, and handed to the game named by the
+game token in the page's filename (e.g., JackboxTV-Q3-...).
+
+    id_page/<game>/<page>: Seconds per JbgAbc.id_page() call, page snapshot included.
+    play_tick/<game>/<page>: WebDriver round trips (element lookups, element reads, scripts,
+        and writes) made by one JbgAbc.play() call.  Writes are accepted, and ignored, and
+        sleeps are skipped.  A saved page never changes, so a play() call which would wait for
+        the next page is stopped at MAX_TICK_ROUND_TRIPS.
+"""
+
+# Standard Imports
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Final, Iterator, List, Tuple
+from unittest import mock
+import time
+# Third Party Imports
+from test.fixture_store import FixtureStore, fixture_path
+from test.mocked_jitb_ai import MockedJitbAi
+from test.offline_web_driver import OfflineWebDriver, OfflineWebElement
+from selenium.common.exceptions import WebDriverException
+# Local Imports
+from bench.bench_result import BenchResult
+from jitb.jbgames.jbg_abc import JbgAbc
+from jitb.jitb_website import JITB_SUPPORTED_GAMES
+
+
+# JITB_SUPPORTED_GAMES names, by the game token in a saved page's filename
+GAME_TOKENS: Final[Dict[str, str]] = {'BR': "Blather 'Round", 'Dict': 'Dictionarium',
+                                      'JB': 'Joke Boat', 'Q2': 'Quiplash 2', 'Q3': 'Quiplash 3'}
+# A play() call is stopped once it makes this many round trips
+MAX_TICK_ROUND_TRIPS: Final[int] = 1000
+# WebDriver methods, and properties, which each cost a round trip to Chrome
+ROUND_TRIP_METHODS: Final[Tuple[Tuple[type, str], ...]] = (
+    (OfflineWebDriver, 'find_element'), (OfflineWebDriver, 'find_elements'),
+    (OfflineWebDriver, 'execute_script'), (OfflineWebDriver, 'get'),
+    (OfflineWebElement, 'find_element'), (OfflineWebElement, 'find_elements'),
+    (OfflineWebElement, 'get_attribute'), (OfflineWebElement, 'get_dom_attribute'),
+    (OfflineWebElement, 'is_displayed'), (OfflineWebElement, 'is_enabled'))
+ROUND_TRIP_PROPERTIES: Final[Tuple[Tuple[type, str], ...]] = (
+    (OfflineWebDriver, 'page_source'), (OfflineWebElement, 'text'),
+    (OfflineWebElement, 'tag_name'), (OfflineWebElement, 'accessible_name'))
+
+
+class _TickOver(BaseException):
+    """Stops a play() call which is waiting on a page that will never change.
+
+    Not an Exception, so the games' own error handling lets it through.
+    """
+
+
+def bench_id_page(repeat: int) -> List[BenchResult]:
+    """Time each game's id_page() against each of its saved pages."""
+    # LOCAL VARIABLES
+    results = []  # One BenchResult per game and page
+    start = 0.0   # When a call started
+
+    # BENCH IT
+    for game_name, page, web_driver in _load_pages():
+        game = _create_game(game_name)
+        results.append(BenchResult(f'id_page/{game_name}/{page}', unit='s'))
+        for num in range(repeat + 1):
+            start = time.perf_counter()
+            _call(game.id_page, web_driver)
+            if num:
+                results[-1].samples.append(time.perf_counter() - start)  # Call 0 warms up
+
+    # DONE
+    return results
+
+
+def bench_play_tick(repeat: int) -> List[BenchResult]:
+    """Count the WebDriver round trips each game's play() makes on each of its saved pages."""
+    # LOCAL VARIABLES
+    results = []  # One BenchResult per game and page
+
+    # BENCH IT
+    for game_name, page, web_driver in _load_pages():
+        results.append(BenchResult(f'play_tick/{game_name}/{page}', unit='round trips'))
+        for _ in range(repeat):
+            with _count_round_trips() as round_trips:
+                _call(_create_game(game_name).play, web_driver)  # Fresh game, fresh state
+            results[-1].samples.append(round_trips[0])
+
+    # DONE
+    return results
+
+
+def _call(func: Callable[[Any], Any], web_driver: OfflineWebDriver) -> None:
+    """Call func(web_driver), ignoring the errors JITB raises for pages it can't handle."""
+    try:
+        func(web_driver)
+    except (RuntimeError, ValueError, WebDriverException, _TickOver):
+        pass  # Error pages, and pages this game can't act on, still cost time and round trips
+
+
+@contextmanager
+def _count_round_trips() -> Iterator[List[int]]:
+    """Count OfflineWebDriver round trips, accept writes, and skip sleeps, until exit.
+
+    Raises _TickOver when MAX_TICK_ROUND_TRIPS is exceeded.
+    """
+    # LOCAL VARIABLES
+    round_trips = [0]  # Number of round trips made so far
+
+    # COUNT THEM
+    def counted(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            round_trips[0] += 1
+            if round_trips[0] > MAX_TICK_ROUND_TRIPS:
+                round_trips[0] = MAX_TICK_ROUND_TRIPS
+                raise _TickOver()
+            return func(*args, **kwargs)
+        return wrapper
+
+    with ExitStack() as stack:
+        for cls, name in ROUND_TRIP_METHODS:
+            stack.enter_context(mock.patch.object(cls, name, counted(getattr(cls, name))))
+        for cls, name in ROUND_TRIP_PROPERTIES:
+            stack.enter_context(mock.patch.object(cls, name,
+                                                  property(counted(getattr(cls, name).fget))))
+        # Every other command (e.g., click, send_keys) is a write
+        stack.enter_context(mock.patch.object(OfflineWebDriver, 'execute',
+                                              counted(lambda *args, **kwargs: {'value': None})))
+        stack.enter_context(mock.patch('time.sleep'))
+        yield round_trips
+
+
+def _create_game(game_name: str) -> JbgAbc:
+    """Create a game, played by a MockedJitbAi, to benchmark."""
+    return JITB_SUPPORTED_GAMES[game_name](ai_obj=MockedJitbAi(), username='JITB')
+
+
+def _load_pages() -> Iterator[Tuple[str, str, OfflineWebDriver]]:
+    """Yield the game name, page name, and loaded OfflineWebDriver for each saved game page."""
+    for page in FixtureStore().pages():
+        game_name = GAME_TOKENS.get(page.split('-')[1]) if page.count('-') else None
+        if game_name:
+            yield game_name, page, OfflineWebDriver(fixture_path(page))
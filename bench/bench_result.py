@@ -0,0 +1,23 @@
+"""Defines the BenchResult data class each benchmark suite returns its measurements in."""
+
+# Standard Imports
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+import statistics
+# Third Party Imports
+# Local Imports
+
+
+@dataclass
+class BenchResult:
+    """One benchmark measurement."""
+    name: str                                            # <suite>/<measurement>
+    unit: str                                            # e.g., s, ops/s, round trips
+    better: str = 'lower'                                # lower or higher
+    samples: List[float] = field(default_factory=list)  # One value per repetition
+
+    def summarize(self) -> Dict[str, Any]:
+        """The JSON-friendly version of this result, with summary statistics."""
+        return {'unit': self.unit, 'better': self.better, 'samples': self.samples,
+                'median': statistics.median(self.samples), 'mean': statistics.fmean(self.samples),
+                'min': min(self.samples), 'max': max(self.samples)}
@@ -0,0 +1,95 @@
+"""Benchmarks the throughput of JITB's answer string handling.
+
+Each function is called once per prompt and answer in a generated corpus of
+JITB_BENCH_CORPUS_SIZE pairs.  The corpus is seeded, so every run measures the same strings:
+fill-in-the-blank prompts with answers that repeat the prompt around the blank, open prompts,
+quoted answers, trailing punctuation, smart quotes, and newlines.
+
+    strings/<function>: Calls per second.
+"""
+
+# Standard Imports
+from typing import Callable, Final, List, Tuple
+import random
+import time
+# Third Party Imports
+# Local Imports
+from bench.bench_result import BenchResult
+from jitb.jitb_globals import JITB_BENCH_CORPUS_SIZE, JITB_FITB_STR
+from jitb.jitb_misc import clean_up_string
+from jitb.jitb_openai import polish_answer, remove_answer_overlap
+
+
+CORPUS_SEED: Final[int] = 1337   # Seeds the corpus so each run benchmarks the same strings
+LENGTH_LIMIT: Final[int] = 45    # polish_answer() length_limit, the Quiplash default
+# Words to build the corpus from
+WORDS: Final[Tuple[str, ...]] = (
+    'the', 'worst', 'thing', 'to', 'say', 'at', 'a', 'funeral', 'is', 'my', 'grandma',
+    'secretly', 'loves', 'pickles', 'in', 'space', 'nobody', 'can', 'hear', 'you', 'scream',
+    'about', 'taxes', 'robot', 'butler', 'haunted', 'toaster', 'wedding', 'cake', 'llama',
+    'café', 'naïve', '“quoted”', 'it’s')
+
+
+def bench_strings(repeat: int) -> List[BenchResult]:
+    """Time polish_answer(), remove_answer_overlap(), and clean_up_string() over the corpus."""
+    # LOCAL VARIABLES
+    corpus = _create_corpus(JITB_BENCH_CORPUS_SIZE)  # Prompts and answers
+    # Name, and call, of each function to benchmark
+    funcs = (('polish_answer',
+              lambda prompt, answer: polish_answer(prompt, answer, LENGTH_LIMIT)),
+             ('remove_answer_overlap', remove_answer_overlap),
+             ('clean_up_string', lambda prompt, answer: clean_up_string(answer)))
+    results = []  # One BenchResult per function
+
+    # BENCH IT
+    for name, func in funcs:
+        results.append(BenchResult(f'strings/{name}', unit='ops/s', better='higher'))
+        for _ in range(repeat):
+            results[-1].samples.append(_time_corpus(func, corpus))
+
+    # DONE
+    return results
+
+
+def _create_corpus(size: int) -> List[Tuple[str, str]]:
+    """Generate size prompts, and answers, that exercise the string handling."""
+    # LOCAL VARIABLES
+    rand = random.Random(CORPUS_SEED)  # Seeded, so every run generates the same corpus
+    corpus = []                        # Prompts and answers
+    opening = ''                       # Prompt text before the blank
+    closing = ''                       # Prompt text after the blank
+    answer = ''                        # Answer to the prompt
+
+    # GENERATE IT
+    for _ in range(size):
+        opening = ' '.join(rand.choices(WORDS, k=rand.randint(0, 8)))
+        closing = ' '.join(rand.choices(WORDS, k=rand.randint(0, 5)))
+        answer = ' '.join(rand.choices(WORDS, k=rand.randint(1, 12)))
+        if rand.random() < 0.5:
+            answer = f'{opening} {answer} {closing}'.strip()  # Repeats the prompt
+        if rand.random() < 0.3:
+            answer = f'"{answer}"'
+        if rand.random() < 0.3:
+            answer = answer + rand.choice('.!?')
+        if rand.random() < 0.1:
+            answer = answer.replace(' ', '\n', 1)
+        if rand.random() < 0.8:
+            corpus.append((f'{opening} {JITB_FITB_STR} {closing}'.strip(), answer))
+        else:
+            corpus.append((f'{opening} {closing}'.strip() + '?', answer))
+
+    # DONE
+    return corpus
+
+
+def _time_corpus(func: Callable[[str, str], str], corpus: List[Tuple[str, str]]) -> float:
+    """Call func(prompt, answer) for each entry in the corpus and return calls per second."""
+    # LOCAL VARIABLES
+    start = time.perf_counter()  # When the first call started
+
+    # TIME IT
+    for prompt, answer in corpus:
+        func(prompt, answer)
+
+    # DONE
+    return len(corpus) / (time.perf_counter() - start)
@@ -2,7 +2,9 @@
 
 # Standard
 from abc import ABC, abstractmethod
-from typing import Final, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Final, List, Tuple
+import time
 # Third Party
 from hobo.validation import validate_string, validate_type
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
@@ -10,15 +12,24 @@ from selenium.webdriver.common.by import By
 import selenium
 # Local
 from jitb.jbgames.jbg_page_ids import JbgPageIds
+from jitb.jitb_clues import ClueMatcher
+from jitb.jitb_ecast import EcastClient, EcastState
+from jitb.jitb_events import EventLog
+from jitb.jitb_globals import JITB_PREFETCH_MAX, JITB_PREFETCH_WORKERS
 from jitb.jitb_logger import Logger
+from jitb.jitb_metrics import Metrics
 from jitb.jitb_openai import JitbAi
+from jitb.jitb_snapshot import PageSnapshot, take_snapshot
+from jitb.jitb_tracer import Tracer
 from jitb.jitb_validation import validate_bool, validate_web_driver
+from jitb.jitb_webdriver import get_page_text
 
 
 # List of observed errors reported by Jackbox Games html
 ERROR_LIST: Final[List] = ['Room not found', 'GAME REQUIRES TWITCH LOGIN']
 
 
+# pylint: disable = too-many-instance-attributes
 class JbgAbc(ABC):
     """Jackbox Games (JBG) Abstract Base Class (ABC).
 
@@ -32,18 +43,25 @@ class JbgAbc(ABC):
     """
 
     # Methods are listed in expected 'call order'.
-    def __init__(self, ai_obj: JitbAi, username: str) -> None:
+    def __init__(self, ai_obj: JitbAi, username: str, pipeline: bool = False) -> None:
         """JbgAbc ctor.
 
         Args:
             ai_obj:  OpenAI API interface to use in this game.
             username:  The screen name used in this game.  May be None (for manual games).
+            pipeline:  Optional; If True, start generating answers in the background as soon as
+                a prompt is read.  See: prefetch_answer().
         """
         self._ai_obj = ai_obj                    # OpenAI API interface to use in this game
         self._avatar_chosen = False              # Only choose one avatar
         self._username = username                # The screen name used for auto commands
         self._last_page = JbgPageIds.UNKNOWN     # The last page processed
         self._current_page = JbgPageIds.UNKNOWN  # The current page being processed
+        self._pipeline = pipeline                # Pre-generate answers in the background
+        self._prefetch_pool = None               # Lazily created ThreadPoolExecutor
+        self._ecast_turn = None                  # The last ecast turn played by play_ecast()
+        # Background answers, keyed by (prompt, length_limit), in the order they were requested
+        self._prefetched: Dict[Tuple[str, int], Future] = {}
 
     @abstractmethod
     def play(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
@@ -51,7 +69,9 @@ class JbgAbc(ABC):
 
         Typical definition should look something like this:
 
-        self._current_page = self.id_page(web_driver=web_driver)
+        snapshot = self.snapshot_page(web_driver=web_driver)
+        self.validate_status(web_driver=web_driver, snapshot=snapshot)
+        self._current_page = self.id_page(web_driver=web_driver, snapshot=snapshot)
         if self._last_page != self._current_page:
             if self._current_page == JbgQuip3IntPages.LOGIN:
                 pass  # Wait for the page to change because we already logged in
@@ -70,9 +90,60 @@ class JbgAbc(ABC):
             ValueError: An internal attribute contains an invalid value.
         """
 
-    def validate_status(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
-        """Validates the web_driver and internal attributes."""
-        self._check_web_driver(web_driver=web_driver)
+    def play_ecast(self, client: EcastClient, state: EcastState) -> None:
+        """Respond to an ecast state, as play() responds to a web page, without a browser.
+
+        Answers ANSWER prompts with get_ai_answer() and votes on VOTE choices with the AI.  Each
+        turn is only played once, no matter how many times the state is read.  Override this
+        method to support game-specific ecast turns (e.g., Quiplash 3 Thriplash).
+
+        Args:
+            client: The EcastClient connected to this game's room.
+            state: The latest EcastState read from client.
+        """
+        # LOCAL VARIABLES
+        turn = (state.page_id, state.prompt, tuple(state.choices))  # Identifies this turn
+        favorite = ''                                               # The AI's favorite choice
+
+        # INPUT VALIDATION
+        validate_type(client, 'client', EcastClient)
+        validate_type(state, 'state', EcastState)
+
+        # PLAY IT
+        if turn == self._ecast_turn:
+            return  # Already played
+        self._ecast_turn = turn
+        self._last_page = self._current_page
+        self._current_page = state.page_id
+        if self._last_page != self._current_page:
+            self.report_page_change()
+        if state.page_id == JbgPageIds.ANSWER and state.prompt:
+            client.submit_answer(self.get_ai_answer(prompt=state.prompt,
+                                                    length_limit=state.length_limit))
+        elif state.page_id == JbgPageIds.VOTE and state.choices:
+            favorite = self._ai_obj.vote_favorite(prompt=state.prompt, answers=state.choices)
+            client.submit_vote(state.choices.index(favorite) if favorite in state.choices else 0)
+
+    def snapshot_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) \
+            -> PageSnapshot:
+        """Read everything needed to identify web_driver's page with a single WebDriver call.
+
+        Pass the result to validate_status() and id_page() to avoid per-element round trips.
+
+        Returns:
+            A PageSnapshot on success, None on failure (which callers treat as 'no snapshot').
+        """
+        return take_snapshot(web_driver=web_driver, error_list=ERROR_LIST)
+
+    def validate_status(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                        snapshot: PageSnapshot = None) -> None:
+        """Validates the web_driver and internal attributes.
+
+        Args:
+            web_driver: The webdriver object to interact with.
+            snapshot: Optional; Check this PageSnapshot for errors instead of web_driver.
+        """
+        self._check_web_driver(web_driver=web_driver, snapshot=snapshot)
         self._validate_core_attributes()
 
     @abstractmethod
@@ -95,6 +166,7 @@ class JbgAbc(ABC):
             web_driver: The webdriver object to interact with.
         """
 
+    @Tracer.traced('generate_ai_answer')
     def generate_ai_answer(self, prompt: str, ai_obj: JitbAi = None, length_limit: int = 45) -> str:
         """Wraps ai_obj.generate_answer() to inject context regarding prompts about the username.
 
@@ -125,10 +197,122 @@ class JbgAbc(ABC):
 
         # DONE
         if prompt != local_prompt:
-            Logger.debug(f'Changed "{prompt}" to "{local_prompt}" and received "{answer}" '
-                         'from the AI')
+            Logger.debug('Changed "%s" to "%s" and received "%s" from the AI', prompt,
+                         local_prompt, answer)
         return answer
 
+    def get_ai_answer(self, prompt: str, length_limit: int = 45) -> str:
+        """Claim a prefetched answer to prompt or, if there isn't one, generate it now.
+
+        Args:
+            prompt: Prompt to give the AI to generate an answer for.
+            length_limit: Optional; Maximum length of the answer.
+
+        Returns:
+            The JitbAi's answer as a string.
+        """
+        # LOCAL VARIABLES
+        # Prefetched answer, if any
+        future = self._prefetched.pop(_prefetch_key(prompt, length_limit), None)
+        answer = ''                  # AI-generated answer
+        start = time.perf_counter()  # When the wait started
+        seconds = 0.0                # How long the wait took
+
+        # GET IT
+        if future is not None:
+            Logger.debug('Claiming the prefetched answer for "%s"', prompt)
+            answer = future.result()
+        else:
+            answer = self.generate_ai_answer(prompt=prompt, ai_obj=self._ai_obj,
+                                             length_limit=length_limit)
+        seconds = time.perf_counter() - start
+        Metrics.observe('jitb_answer_seconds', seconds, game=type(self).__name__)
+        EventLog.record('answer', game=type(self).__name__, player=self._username, prompt=prompt,
+                        answer=answer, seconds=round(seconds, 3), prefetched=future is not None)
+
+        # DONE
+        return answer
+
+    def prefetch_answer(self, prompt: str, length_limit: int = 45) -> None:
+        """Start generating an answer to prompt in the background, if pipelining is enabled.
+
+        Claim the answer with get_ai_answer(), using the same prompt and length_limit.  Prompts
+        are matched regardless of whitespace, since a prompt read from a PageSnapshot and the same
+        prompt read from a WebElement may differ in spacing.  The oldest unclaimed answers are
+        discarded once there are more than JITB_PREFETCH_MAX of them.
+
+        Args:
+            prompt: Prompt to give the AI to generate an answer for.
+            length_limit: Optional; Maximum length of the answer.
+        """
+        # LOCAL VARIABLES
+        key = _prefetch_key(prompt, length_limit)  # Index into the prefetched answers
+
+        # PREFETCH IT
+        if self._pipeline and prompt and key not in self._prefetched:
+            if self._prefetch_pool is None:
+                self._prefetch_pool = ThreadPoolExecutor(max_workers=JITB_PREFETCH_WORKERS,
+                                                         thread_name_prefix='jitb_prefetch')
+            Logger.debug('Prefetching an answer for "%s"', prompt)
+            self._prefetched[key] = self._prefetch_pool.submit(self.generate_ai_answer,
+                                                               prompt=prompt,
+                                                               ai_obj=self._ai_obj,
+                                                               length_limit=length_limit)
+            while len(self._prefetched) > JITB_PREFETCH_MAX:
+                self._prefetched.pop(next(iter(self._prefetched))).cancel()
+
+    def prefetch_prompt(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                        snapshot: PageSnapshot = None, last_prompt: str = None) -> None:
+        """Read the prompt from a PageSnapshot and prefetch_answer() it, if pipelining is enabled.
+
+        Args:
+            web_driver: The webdriver object to interact with.
+            snapshot: Optional; A PageSnapshot of web_driver.  Taken if not provided.
+            last_prompt: Optional; The last prompt that was answered.  Not prefetched again.
+        """
+        # LOCAL VARIABLES
+        prompt_text = None   # The prompt, read from the snapshot
+        length_limit = None  # The prompt's character limit, read from the snapshot
+
+        # PREFETCH IT
+        if self._pipeline:
+            if snapshot is None:
+                snapshot = self.snapshot_page(web_driver=web_driver)
+            if snapshot is not None:
+                prompt_text, length_limit = self._snapshot_prompt(web_driver=web_driver,
+                                                                  snapshot=snapshot)
+            if prompt_text and prompt_text != last_prompt:
+                self.prefetch_answer(prompt=prompt_text, length_limit=length_limit)
+
+    def report_missed_prompt(self, prompt: str = '') -> None:
+        """Count, and record an event for, a prompt that wasn't answered.
+
+        Call this before raising the 'Did not answer the prompt' RuntimeError.
+
+        Args:
+            prompt: Optional; The prompt that wasn't answered, if it was read.
+        """
+        Metrics.inc('jitb_missed_prompts_total', game=type(self).__name__)
+        EventLog.record('missed_prompt', game=type(self).__name__, player=self._username,
+                        prompt=prompt)
+
+    def report_page_change(self) -> None:
+        """Count, and record an event for, the change from the last page to the current page."""
+        Metrics.inc('jitb_page_transitions_total', game=type(self).__name__,
+                    page=self._current_page.name)
+        EventLog.record('page', page=self._current_page.name, game=type(self).__name__,
+                        player=self._username, last_page=self._last_page.name)
+
+    def shutdown(self) -> None:
+        """Stop any background work, discarding unclaimed prefetched answers.
+
+        Call this once the game object is done.  Requests already in flight are not waited on.
+        """
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_pool = None
+        self._prefetched.clear()
+
     @abstractmethod
     def vote_answers(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
         """Read other answers to a prompt from the web_driver, ask the AI, and submit the answer.
@@ -138,47 +322,91 @@ class JbgAbc(ABC):
         """
 
     @abstractmethod
-    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> JbgPageIds:
+    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                snapshot: PageSnapshot = None) -> JbgPageIds:
         """Determine what type of Jackbox Games webpage web_driver is.
 
         The jackbox.tv login page should be universal so start with self._is_login_page()
-        when defining this method in the child class.
+        when defining this method in the child class.  Take a snapshot, with
+        self.snapshot_page(), if one wasn't provided and pass it to every page check.
 
         Args:
             web_driver: The webdriver object to interact with.
+            snapshot: Optional; A PageSnapshot of web_driver to identify the page from.
         """
 
     # Private methods in alphabetical order.
-    def _check_web_driver(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
+    def _check_web_driver(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                          snapshot: PageSnapshot = None) -> None:
         """Check the driver's page source for known errors.
 
+        Args:
+            web_driver: The webdriver object to check.
+            snapshot: Optional; Check this PageSnapshot instead of web_driver.
+
         Raises:
             RuntimeError: An error message was found in the HTML or the room was disconnected.
         """
         # LOCAL VARIABLES
-        temp_we = None  # Temp web element object
+        temp_we = None    # Temp web element object
+        temp_text = None  # Temp swal2-title text
 
         # CHECK IT
         validate_web_driver(web_driver=web_driver)
-        # Check for errors
-        for error in ERROR_LIST:
-            if error.lower() in web_driver.page_source.lower():
-                raise RuntimeError(error)
-        # Verify not disconnected
-        try:
-            temp_we = web_driver.find_element(By.ID, 'swal2-title')
-        except NoSuchElementException:
-            pass  # It's good that we didn't find it
+        if snapshot is not None:
+            validate_type(snapshot, 'snapshot', PageSnapshot)
+            # Check for errors
+            if snapshot.errors:
+                raise RuntimeError(snapshot.errors[0])
+            # Verify not disconnected
+            temp_text = snapshot.get_text(element_name='swal2-title', element_type=By.ID)
         else:
-            if temp_we.text.lower().startswith('Disconnected'.lower()):
-                raise RuntimeError('The room was disconnected')
+            # Check for errors
+            for error in ERROR_LIST:
+                if error.lower() in web_driver.page_source.lower():
+                    raise RuntimeError(error)
+            # Verify not disconnected
+            try:
+                temp_we = web_driver.find_element(By.ID, 'swal2-title')
+            except NoSuchElementException:
+                pass  # It's good that we didn't find it
+            else:
+                temp_text = temp_we.text
+        if temp_text and temp_text.lower().startswith('Disconnected'.lower()):
+            raise RuntimeError('The room was disconnected')
+
+    def _get_page_text(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       element_name: str, element_type: str = By.ID,
+                       snapshot: PageSnapshot = None) -> str:
+        """Wraps jitb_webdriver.get_page_text(), treating stale or missing elements as no text.
+
+        Returns:
+            The element's text, which could be empty, if found.  None otherwise.
+        """
+        # LOCAL VARIABLES
+        page_text = None  # Text from the web element
+
+        # GET IT
+        try:
+            page_text = get_page_text(web_driver=web_driver, element_name=element_name,
+                                      element_type=element_type, snapshot=snapshot)
+        except (NoSuchElementException, StaleElementReferenceException):
+            pass  # No text to match
 
-    def _is_login_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+        # DONE
+        return page_text
+
+    def _is_login_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       snapshot: PageSnapshot = None) -> bool:
         """Determine if this is this the login page.
 
         This method may not need to be a method but it's uniquely related to this class so
         here it is.
 
+        Args:
+            web_driver: The webdriver object to interact with.
+            snapshot: Optional; Read the login elements from this PageSnapshot instead.
+
         Returns:
             True if this is the login screen, False otherwise.
         """
@@ -186,18 +414,64 @@ class JbgAbc(ABC):
         login_page = False  # Prove this true
 
         # IS IT?
-        try:
-            web_driver.find_element(By.ID, 'roomcode')
-            web_driver.find_element(By.ID, 'username')
-            web_driver.find_element(By.ID, 'button-join')
-        except (NoSuchElementException, StaleElementReferenceException, TypeError, ValueError):
-            pass  # Not the character selection page
+        if snapshot is not None:
+            login_page = snapshot.login
         else:
-            login_page = True  # If we made it here, it's the login page
+            try:
+                web_driver.find_element(By.ID, 'roomcode')
+                web_driver.find_element(By.ID, 'username')
+                web_driver.find_element(By.ID, 'button-join')
+            except (NoSuchElementException, StaleElementReferenceException, TypeError,
+                    ValueError):
+                pass  # Not the character selection page
+            else:
+                login_page = True  # If we made it here, it's the login page
 
         # DONE
         return login_page
 
+    # pylint: disable = too-many-arguments
+    def _match_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                    matcher: ClueMatcher, element_name: str, element_type: str = By.ID,
+                    snapshot: PageSnapshot = None) -> JbgPageIds:
+        """Identify the page by matching an element's text against a precompiled ClueMatcher.
+
+        Args:
+            web_driver: The webdriver object to interact with.
+            matcher: A ClueMatcher, of JbgPageIds labels, compiled from the game's clue lists.
+            element_name: The element whose text holds the clues (e.g., prompt).
+            element_type: Optional; The element type (e.g., By.ID).
+            snapshot: Optional; Read element_name's text from this PageSnapshot, if it has it.
+
+        Returns:
+            The highest priority JbgPageIds whose clues were found, JbgPageIds.UNKNOWN otherwise.
+        """
+        validate_type(matcher, 'matcher', ClueMatcher)
+        return matcher.classify(text=self._get_page_text(web_driver=web_driver,
+                                                         element_name=element_name,
+                                                         element_type=element_type,
+                                                         snapshot=snapshot),
+                                default=JbgPageIds.UNKNOWN)
+    # pylint: enable = too-many-arguments
+
+    # pylint: disable = unused-argument
+    def _snapshot_prompt(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                         snapshot: PageSnapshot) -> Tuple[str, int]:
+        """Read the prompt and its character limit, for prefetch_prompt(), from a PageSnapshot.
+
+        Override this method in child classes that support pipelining.  The prompt and limit
+        must match what the child class will later pass to get_ai_answer().
+
+        Args:
+            web_driver: The webdriver object to interact with.
+            snapshot: A PageSnapshot of web_driver.
+
+        Returns:
+            A (prompt, length_limit) tuple.  The prompt is None if it can't be read.
+        """
+        return tuple((None, None))
+    # pylint: enable = unused-argument
+
     def _validate_core_attributes(self) -> None:
         """Validate private attribute types and values.
 
@@ -219,9 +493,16 @@ class JbgAbc(ABC):
         _validate_page_id(page_id=self._last_page, var_name='last page')
         # Current page
         _validate_page_id(page_id=self._current_page, var_name='current page')
+        # Pipeline
+        validate_bool(self._pipeline, 'Internal attribute _pipeline')
 
 
 # Private functions
+def _prefetch_key(prompt: str, length_limit: int) -> Tuple[str, int]:
+    """Index prompt, with its whitespace stripped and collapsed, into the prefetched answers."""
+    return tuple((' '.join(prompt.split()), length_limit))
+
+
 def _validate_page_id(page_id: JbgPageIds, var_name: str) -> None:
     """Validate a JbgPageIds object.
 
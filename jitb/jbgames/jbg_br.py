@@ -1,7 +1,8 @@
 """Defines the package's Jackbox Games Blather 'Round class."""
-
+# pylint: disable = too-many-lines
 # Standard
 from typing import Final, List, Tuple
+import re
 import string
 import time
 # Third Party
@@ -13,16 +14,22 @@ import selenium
 # Local
 from jitb.jbgames.jbg_abc import JbgAbc
 from jitb.jbgames.jbg_page_ids import JbgPageIds
+from jitb.jitb_clues import ClueMatcher
 from jitb.jitb_globals import JITB_FITB_STR, JITB_POLL_RATE
 from jitb.jitb_logger import Logger
 from jitb.jitb_openai import JitbAi
+from jitb.jitb_snapshot import PageSnapshot
 from jitb.jitb_selenium import get_web_element, get_web_elements
+from jitb.jitb_tracer import Tracer
 from jitb.jitb_webdriver import (click_a_button, get_char_limit, get_prompt, is_prompt_page,
                                  vote_answers, write_an_answer)
 from jitb.jitb_validation import validate_pos_int
 
 
 DEFAULT_CHAR_LIMIT: Final[int] = 40  # Default maximum character limit
+DESCRIBE_PLAN_SIZE: Final[int] = 40  # Number of ranked descriptor words to plan per secret
+GUESS_CANDIDATES: Final[int] = 10    # Number of ranked guesses to request at a time
+GUESS_DELAY: Final[int] = 3          # Seconds to wait between guesses
 
 
 # pylint: disable = too-many-instance-attributes, too-many-public-methods
@@ -30,12 +37,13 @@ class JbgBr(JbgAbc):
     """Jackbox Games (JBG) Blather 'Round (Br) class."""
 
     # Methods are listed in expected 'call order'.
-    def __init__(self, ai_obj: JitbAi, username: str) -> None:
+    def __init__(self, ai_obj: JitbAi, username: str, pipeline: bool = False) -> None:
         """JbgBr ctor.
 
         Args:
             ai_obj:  OpenAI API interface to use in this game.
             username:  The screen name used in this game.
+            pipeline:  Optional; Pre-generate answers in the background.
         """
         # Hints the page is on the Blather 'Round-specific "assign blame" page
         self._blame_clues = ['Do you think that you should']
@@ -45,21 +53,35 @@ class JbgBr(JbgAbc):
         self._guess_clues = ['What story', 'What person', 'What thing', 'What place']
         # Hints the page is on the Blather 'Round-specific "secret prompt" page
         self._secret_clues = ['Choose your secret prompt']
+        # All of the 'prompt' element clues, compiled once, in id_page() priority order
+        self._page_matcher = ClueMatcher({JbgPageIds.ANSWER: self._guess_clues,
+                                          JbgPageIds.BR_DESCRIBE: self._describe_clues,
+                                          JbgPageIds.BR_SECRET: self._secret_clues,
+                                          JbgPageIds.BR_FAULT: self._blame_clues})
         # Exclude these button names from selecting secret prompts
         self._exclude = ['Get 3 New Prompts', 'Skip']
         # Wrong guesses for another player's secret prompt
         self._wrong_guesses = []
+        # Ranked guesses, not yet made, for another player's secret prompt
+        self._guess_candidates = []
+        # The clue sentences self._guess_candidates were ranked for
+        self._guess_context = None
         # Previous descriptions for this player's secret prompt
         self._prev_descr = []
+        # Ranked descriptor words, not yet used, for this player's secret prompt
+        self._describe_plan = []
+        # The secret prompt self._describe_plan was made for
+        self._plan_secret = None
         # Update AI system: content message
         ai_obj.change_system_content('You are a smart person trying to win the Jackbox Game '
                                      "Blather 'Round. Do not add extra context "
                                      'and not not add extraneous commentary '
                                      'when choosing words or guessing answers. '
                                      'Respond with as few words as possible.')
-        super().__init__(ai_obj=ai_obj, username=username)
+        super().__init__(ai_obj=ai_obj, username=username, pipeline=pipeline)
 
     # Parent Class Abstract Methods
+    @Tracer.traced('play')
     def play(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
         """Determine web_driver's page id and call the relevant method.
 
@@ -68,18 +90,25 @@ class JbgBr(JbgAbc):
             TypeError: An internal attribute is the wrong data type.
             ValueError: An internal attribute contains an invalid value.
         """
+        # LOCAL VARIABLES
+        snapshot = self.snapshot_page(web_driver=web_driver)  # Everything needed to id the page
+
         # INPUT VALIDATION
-        self.validate_status(web_driver=web_driver)
+        self.validate_status(web_driver=web_driver, snapshot=snapshot)
 
         # SETUP
         self._last_page = self._current_page  # Store the last page
-        self._current_page = self.id_page(web_driver=web_driver)  # Get the current page
+        # Get the current page
+        self._current_page = self.id_page(web_driver=web_driver, snapshot=snapshot)
 
         # PLAY
         if self._last_page != self._current_page:
-            Logger.debug(f'Now viewing a(n) {self._current_page.name} page!')
+            self.report_page_change()
+            Logger.debug('Now viewing a(n) %s page!', self._current_page.name)
             if self._current_page == JbgPageIds.ANSWER:
                 self._wrong_guesses.clear()  # Empty the list
+                self._guess_candidates.clear()  # New secret prompt, new candidates
+                self._guess_context = None
                 self.answer_prompts(web_driver=web_driver, timeout=10)
             elif self._current_page == JbgPageIds.BR_DESCRIBE:
                 self._prev_descr.clear()  # Empty the list
@@ -134,7 +163,8 @@ class JbgBr(JbgAbc):
         # LOCAL VARIABLES
         prompt_text = ''  # The prompt text
         last_prompt = ''  # The last prompt
-        answer = ''       # JitbAi's answer to the prompt text
+        answer = ''       # Planned, or JitbAi's, answer to the prompt text
+        describe = None   # The describe page's prompt, sentence, and button lists
         num_unk = 0       # Number of concurrent UNKNOWN pages
         timeout = 10      # Number of non-vote pages before we give up
 
@@ -146,12 +176,16 @@ class JbgBr(JbgAbc):
             try:
                 last_prompt = prompt_text  # Save the last prompt
                 prompt_text = ''  # Reset reused variable
-                prompt_text = self.get_describe_prompt(web_driver=web_driver)
+                describe = self._read_describe_page(web_driver=web_driver)
+                if describe:
+                    prompt_text = _construct_full_describe_prompt(*describe, self._prev_descr)
                 if prompt_text and prompt_text != last_prompt:
-                    Logger.debug(f'Got a new "describe" prompt: {prompt_text}')
-                    # Ask the AI
-                    answer = self._ask_openai(prompt_text)
-                    Logger.debug(f'JitbAi answered "{prompt_text}" with "{answer}"')
+                    Logger.debug('Got a new "describe" prompt: %s', prompt_text)
+                    # Answer from the plan, only asking the AI when no planned word fits
+                    answer = self._plan_describe(*describe)
+                    if not answer:
+                        answer = self._ask_openai(prompt_text)
+                        Logger.debug('JitbAi answered "%s" with "%s"', prompt_text, answer)
                     if answer:
                         # Click the buttons
                         if self.click_describe_buttons(web_driver=web_driver, answer=answer):
@@ -170,11 +204,14 @@ class JbgBr(JbgAbc):
             time.sleep(JITB_POLL_RATE)  # Give the page a second to update
         Logger.debug('Done describing the secret prompt')
 
-    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> JbgPageIds:
+    @Tracer.traced('id_page')
+    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                snapshot: PageSnapshot = None) -> JbgPageIds:
         """Determine what type of Jackbox Games webpage web_driver is.
 
         Args:
             web_driver: The webdriver object to interact with.
+            snapshot: Optional; A PageSnapshot of web_driver.  Taken if not provided.
 
         Returns:
             The identified page as a JbgPageIds enum.
@@ -183,18 +220,16 @@ class JbgBr(JbgAbc):
         current_page = JbgPageIds.UNKNOWN  # What type of page is this?
 
         # INPUT VALIDATION
-        self.validate_status(web_driver=web_driver)
+        if snapshot is None:
+            snapshot = self.snapshot_page(web_driver=web_driver)
+        self.validate_status(web_driver=web_driver, snapshot=snapshot)
 
         # DETERMINE PAGE
-        if self.is_guess_page(web_driver=web_driver):
-            current_page = JbgPageIds.ANSWER
-        elif self.is_describe_page(web_driver=web_driver):
-            current_page = JbgPageIds.BR_DESCRIBE
-        elif self.is_secret_page(web_driver=web_driver):
-            current_page = JbgPageIds.BR_SECRET
-        elif self.is_blame_page(web_driver=web_driver):
-            current_page = JbgPageIds.BR_FAULT
-        elif self._is_login_page(web_driver=web_driver):
+        current_page = self._match_page(web_driver=web_driver, matcher=self._page_matcher,
+                                        element_name='prompt', element_type=By.ID,
+                                        snapshot=snapshot)
+        if current_page == JbgPageIds.UNKNOWN and \
+           self._is_login_page(web_driver=web_driver, snapshot=snapshot):
             current_page = JbgPageIds.LOGIN
 
         # DONE
@@ -215,25 +250,30 @@ class JbgBr(JbgAbc):
             RuntimeError: The prompt wasn't answered.
         """
         # LOCAL VARIABLES
-        prompt_text = None  # Input prompt
+        guess = None        # Clue sentences and the guess prompt
         answer = ''         # Answer to the prompt
         clicked_it = False  # Keep track of whether this prompt was answered or not
         num_unk = 0         # Number of concurrent UNKNOWN pages
+        length_limit = 0    # The answer's character limit
 
         # WAIT FOR IT
         while num_unk < timeout:
             if answer:
                 self._wrong_guesses.append(answer)  # If we're here, the answer was wrong
             try:
-                prompt_text = self.get_guess_prompt(web_driver=web_driver)
-                if prompt_text:
+                guess = self._read_guess_page(web_driver=web_driver)
+                if guess:
                     num_unk = 0  # Reset the counter
-                    answer = self.generate_ai_answer(prompt_text, self._ai_obj,
-                                                     self.get_char_limit(web_driver=web_driver))
-                    Logger.debug(f'Answered prompt "{prompt_text}" with "{answer}"!')
+                    length_limit = self.get_char_limit(web_driver=web_driver)
+                    answer = self._choose_guess(*guess, length_limit=length_limit)
+                    if not answer:
+                        answer = self.get_ai_answer(
+                            prompt=_construct_guess_prompt(*guess, self._wrong_guesses),
+                            length_limit=length_limit)
+                    Logger.debug('Answered prompt "%s" with "%s"!', guess[1], answer)
                     if self.submit_an_answer(web_driver=web_driver, submit_text=answer):
                         clicked_it = True  # As long as we submitted at least one answer, it's fine
-                        time.sleep(10)  # Don't spam the game
+                        time.sleep(GUESS_DELAY)  # Don't spam the game
                 else:
                     num_unk += 1
                     time.sleep(JITB_POLL_RATE)
@@ -243,6 +283,7 @@ class JbgBr(JbgAbc):
 
         # DONE
         if not clicked_it:
+            self.report_missed_prompt(prompt=guess[1] if guess else '')
             raise RuntimeError('Did not answer the prompt')
 
     def assign_blame(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
@@ -258,7 +299,7 @@ class JbgBr(JbgAbc):
                              element_name=element_name, element_type=By.ID,
                              vote_clues=self._blame_clues, clean_string=True, exclude=None)
             except RuntimeError as err:
-                Logger.debug(f'Failed to assign blame with {repr(err)} but continuing on')
+                Logger.debug('Failed to assign blame with %r but continuing on', err)
 
     def choose_secret(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
         """Ask the AI to choose a secret prompt.
@@ -280,7 +321,7 @@ class JbgBr(JbgAbc):
                                            ai_obj=self._ai_obj, element_name=element_name,
                                            element_type=By.ID, vote_clues=self._secret_clues,
                                            clean_string=True, exclude=self._exclude)
-                Logger.debug(f'Answered prompt "{prompt_text}"')
+                Logger.debug('Answered prompt "%s"', prompt_text)
             except (ElementNotInteractableException, RuntimeError,
                     StaleElementReferenceException) as err:
                 Logger.error(f'Failed to vote answers with {repr(err)}')
@@ -325,10 +366,10 @@ class JbgBr(JbgAbc):
             if extracted_sentence:
                 self._prev_descr.append(extracted_sentence)  # Store it
                 if click_a_button(web_driver=web_driver, button_str=submit_text):
-                    Logger.debug(f'Submitted the description with the "{submit_text}" button')
+                    Logger.debug('Submitted the description with the "%s" button', submit_text)
                 else:
                     Logger.debug('Failed, but will try again, to submit the description with the '
-                                 f'"{submit_text}" button')
+                                 '"%s" button', submit_text)
                     time.sleep(JITB_POLL_RATE)  # Give the page a second to update
                     # Give it one last shot
                     clicked_them = click_a_button(web_driver=web_driver, button_str=submit_text)
@@ -341,14 +382,15 @@ class JbgBr(JbgAbc):
                 Logger.debug('Skipping this page')
         return clicked_them
 
-    def get_char_limit(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> int:
+    def get_char_limit(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       snapshot: PageSnapshot = None) -> int:
         """Wraps jitb_webdriver.get_char_limit with game-specific details."""
         # LOCAL VARIABLES
         char_limit = None  # Character limit for the prompt
 
         # GET IT
         char_limit = get_char_limit(web_driver=web_driver, element_name='charRemaining',
-                                    element_type=By.CLASS_NAME)
+                                    element_type=By.CLASS_NAME, snapshot=snapshot)
         if char_limit is None:
             char_limit = DEFAULT_CHAR_LIMIT
 
@@ -389,7 +431,7 @@ class JbgBr(JbgAbc):
         if html_list:
             html_list = [_add_missing_punctuation(html_string) for html_string in html_list]
             context = ' '.join(html_list)
-            Logger.debug(f'Extracted the following context: {context}')
+            Logger.debug('Extracted the following context: %s', context)
 
         # DONE
         return context
@@ -438,28 +480,13 @@ class JbgBr(JbgAbc):
             RuntimeError: web_driver is not a describe page.
         """
         # LOCAL VARIABLES
-        prompt = ''               # Describe your secret prompt
-        full_prompt = None        # Prompt, sentence, and button choices
-        sentence = ''             # The blanky blank sentence to fill in
-        buttons_left = None       # List of buttons on the left
-        buttons_right = None      # List of buttons on the right
-
-        # INPUT VALIDATION
-        self.validate_describe_page(web_driver=web_driver)
-
-        # GET IT
-        prompt = self.get_prompt(web_driver=web_driver, clues=self._describe_clues)
-        prompt = prompt.capitalize()
-        if prompt:
-            sentence = _extract_sentence(web_driver=web_driver)
-            try:
-                (buttons_left, buttons_right) = self.get_describe_buttons(web_driver=web_driver)
+        full_prompt = None  # Prompt, sentence, and button choices
+        # Prompt, sentence, and button lists
+        describe = self._read_describe_page(web_driver=web_driver)
 
-                # FORM IT
-                full_prompt = _construct_full_describe_prompt(prompt, sentence, buttons_left,
-                                                              buttons_right, self._prev_descr)
-            except TypeError as err:
-                Logger.error(f'"Get describe prompt" encountered a type error of {repr(err)}')
+        # FORM IT
+        if describe:
+            full_prompt = _construct_full_describe_prompt(*describe, self._prev_descr)
 
         # DONE
         return full_prompt
@@ -474,26 +501,12 @@ class JbgBr(JbgAbc):
             RuntimeError: web_driver is not on a guess page.
         """
         # LOCAL VARIABLES
-        context = ''        # Text description with current context
-        prompt = ''         # Actual guess prompt, "What _____ is _____ describing?"
         full_prompt = None  # Context and prompt
-        bad_guesses = ''    # Let the AI know it's already guessed wrong
+        guess = self._read_guess_page(web_driver=web_driver)  # Context and prompt
 
-        # VALIDATION
-        if not self.is_guess_page(web_driver=web_driver):
-            raise RuntimeError("This is not a Blather 'Round guess page")
-
-        # GET IT
-        context = self.get_context(web_driver=web_driver)
-        if context:
-            prompt = self.get_prompt(web_driver=web_driver, clues=self._guess_clues)
-            if prompt:
-                if self._wrong_guesses:
-                    bad_guesses = ' The following guesses were already made and are wrong: ' \
-                                  + f'{", ".join(self._wrong_guesses)}.'
-                prompt = prompt.capitalize()  # It comes through lowercase for some reason.
-                full_prompt = context + bad_guesses + ' Answer the following in one or two ' \
-                    + 'words without adding adjectives or adverbs... ' + prompt
+        # FORM IT
+        if guess:
+            full_prompt = _construct_guess_prompt(*guess, self._wrong_guesses)
 
         # DONE
         return full_prompt
@@ -512,25 +525,29 @@ class JbgBr(JbgAbc):
         return get_prompt(web_driver=web_driver, element_name='prompt', element_type=By.ID,
                           prompt_clues=clues, clean_string=True)
 
-    def is_blame_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_blame_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                      snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_prompt_page with game-specific details to assign blame."""
         return is_prompt_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                              prompt_clues=self._blame_clues)
+                              prompt_clues=self._blame_clues, snapshot=snapshot)
 
-    def is_describe_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_describe_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                         snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_prompt_page with game-specific details to describe a secret."""
         return is_prompt_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                              prompt_clues=self._describe_clues)
+                              prompt_clues=self._describe_clues, snapshot=snapshot)
 
-    def is_guess_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_guess_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                      snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_prompt_page with game-specific details to guess a prompt."""
         return is_prompt_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                              prompt_clues=self._guess_clues)
+                              prompt_clues=self._guess_clues, snapshot=snapshot)
 
-    def is_secret_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_secret_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_prompt_page with game-specific details to choose a secret."""
         return is_prompt_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                              prompt_clues=self._secret_clues)
+                              prompt_clues=self._secret_clues, snapshot=snapshot)
 
     def submit_an_answer(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
                          submit_text: str) -> bool:
@@ -573,7 +590,8 @@ class JbgBr(JbgAbc):
         # DONE
         return wrote_it
 
-    def _ask_openai(self, question: str) -> str:
+    # Private Methods (alphabetical order)
+    def _ask_openai(self, question: str, max_tokens: int = 50) -> str:
         """Ask the JitbAi object a direct question.
 
         This method of communication flies in the face of everything previous because we're not
@@ -588,11 +606,189 @@ class JbgBr(JbgAbc):
 
         # ASK IT
         messages.append({'role': 'user', 'content': question})
-        answer = self._ai_obj.create_content(messages=messages)
+        answer = self._ai_obj.create_content(messages=messages, max_tokens=max_tokens)
+
+        # DONE
+        return answer
+
+    def _choose_guess(self, context: str, prompt: str, length_limit: int) -> str:
+        """Choose the next ranked guess, re-ranking only when new clue sentences appear.
+
+        Args:
+            context: The clue sentences (see: get_context()).
+            prompt: The guess prompt, "What _____ is _____ describing?"
+            length_limit: Maximum length of the guess.
+
+        Returns:
+            The highest-ranked candidate that hasn't been guessed, or None if the AI didn't
+            come up with one.
+        """
+        # LOCAL VARIABLES
+        guess = None  # The next guess
+        # Guesses already made, in lowercase
+        wrong_guesses = [wrong_guess.lower() for wrong_guess in self._wrong_guesses]
+
+        # CHOOSE IT
+        if context != self._guess_context:
+            self._guess_candidates = []  # New clues, new ranking
+        for _ in range(2):
+            while self._guess_candidates and not guess:
+                guess = self._guess_candidates.pop(0)
+                if guess.lower() in wrong_guesses or len(guess) > length_limit:
+                    guess = None
+            if guess:
+                break
+            self._rank_guesses(context=context, prompt=prompt)
+
+        # DONE
+        return guess
+
+    def _make_describe_plan(self, secret: str) -> None:
+        """Ask the AI, once per secret prompt, for a ranked list of words that describe it.
+
+        Args:
+            secret: The describe prompt (e.g., "Describe detective pikachu").
+        """
+        # LOCAL VARIABLES
+        answer = None  # JitbAi's ranked words
+        # Planning prompt
+        question = f'List the {DESCRIBE_PLAN_SIZE} simple words (adjectives, nouns, verbs, ' \
+                   + 'and places) that would best help someone guess this without saying it: ' \
+                   + f'"{secret.removeprefix(self._describe_clues[0])}". Most helpful first, ' \
+                   + 'as a comma-separated list, with no other commentary.'
+
+        # PLAN IT
+        self._plan_secret = secret
+        self._describe_plan = []
+        try:
+            answer = self._ask_openai(question, max_tokens=3 * DESCRIBE_PLAN_SIZE)
+        except (RuntimeError, TimeoutError) as err:
+            Logger.error(f'Failed to plan a description of "{secret}" with {repr(err)}')
+        if answer:
+            self._describe_plan = [word.lower() for word in _split_ranked_list(answer)]
+        Logger.debug('Planned to describe "%s" with %s', secret, self._describe_plan)
+
+    def _plan_describe(self, prompt: str, sentence: str, buttons_left: List[str],
+                       buttons_right: List[str] = None) -> str:
+        """Answer a describe page from the plan, making the plan first for a new secret prompt.
+
+        Args:
+            prompt: E.g., "Describe detective pikachu"
+            sentence: E.g., "It's a story about a _____ _____." (may have one or two blanks)
+            buttons_left: The button choices for the first blank.
+            buttons_right: Optional; The button choices for the second blank.
+
+        Returns:
+            The planned answer, formatted like JitbAi's describe answers (e.g., 'fun, family'),
+            or None if the plan doesn't fit every blank.
+        """
+        # LOCAL VARIABLES
+        answer = None  # Planned answer
+        answers = []   # Planned button for each blank
+        # The button choices for each blank in the sentence
+        choices = [buttons_left, buttons_right][:sentence.count(JITB_FITB_STR)]
+
+        # PLAN IT
+        if prompt != self._plan_secret:
+            self._make_describe_plan(secret=prompt)
+
+        # MATCH IT
+        for button_list in choices:
+            answers.append(_match_planned_word(self._describe_plan, button_list, answers))
+        if answers and None not in answers:
+            for button in answers:
+                self._describe_plan.remove(button.strip().lower())  # Don't repeat ourselves
+            answer = ', '.join(answers)
+            Logger.debug('Answered "%s" from the plan with "%s"', sentence, answer)
+        else:
+            Logger.debug('The plan for "%s" does not fit "%s"', prompt, sentence)
 
         # DONE
         return answer
 
+    def _rank_guesses(self, context: str, prompt: str) -> None:
+        """Ask the AI, once per set of clue sentences, for a ranked list of guesses."""
+        # LOCAL VARIABLES
+        answer = None  # JitbAi's ranked guesses
+        # Ranking prompt
+        question = _construct_guess_prompt(context, prompt, self._wrong_guesses,
+                                           num_guesses=GUESS_CANDIDATES)
+
+        # RANK THEM
+        self._guess_context = context
+        self._guess_candidates = []
+        try:
+            answer = self._ask_openai(question, max_tokens=8 * GUESS_CANDIDATES)
+        except (RuntimeError, TimeoutError) as err:
+            Logger.error(f'Failed to rank guesses for "{prompt}" with {repr(err)}')
+        if answer:
+            self._guess_candidates = _split_ranked_list(answer)
+        Logger.debug('Ranked these guesses for "%s": %s', prompt, self._guess_candidates)
+
+    def _read_describe_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) \
+            -> Tuple[str, str, List[str], List[str]]:
+        """Read the prompt, sentence, and button lists from a 'describe' page.
+
+        Returns:
+            A tuple of the prompt, sentence, left buttons and right buttons (may be None) on
+            success, None on failure.
+
+        Raises:
+            RuntimeError: web_driver is not a describe page.
+        """
+        # LOCAL VARIABLES
+        prompt = ''           # Describe your secret prompt
+        sentence = ''         # The blanky blank sentence to fill in
+        describe = None       # Prompt, sentence, and button lists
+        buttons_left = None   # List of buttons on the left
+        buttons_right = None  # List of buttons on the right
+
+        # INPUT VALIDATION
+        self.validate_describe_page(web_driver=web_driver)
+
+        # GET IT
+        prompt = self.get_prompt(web_driver=web_driver, clues=self._describe_clues)
+        prompt = prompt.capitalize()
+        if prompt:
+            sentence = _extract_sentence(web_driver=web_driver)
+            try:
+                (buttons_left, buttons_right) = self.get_describe_buttons(web_driver=web_driver)
+                describe = tuple((prompt, sentence, buttons_left, buttons_right))
+            except TypeError as err:
+                Logger.error(f'"Get describe prompt" encountered a type error of {repr(err)}')
+
+        # DONE
+        return describe
+
+    def _read_guess_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) \
+            -> Tuple[str, str]:
+        """Read the clue sentences and the guess prompt from a 'guess' page.
+
+        Returns:
+            A tuple of the context and the prompt on success, None on failure.
+
+        Raises:
+            RuntimeError: web_driver is not on a guess page.
+        """
+        # LOCAL VARIABLES
+        context = ''   # Text description with current context
+        prompt = ''    # Actual guess prompt, "What _____ is _____ describing?"
+        guess = None   # Context and prompt
+
+        # VALIDATION
+        if not self.is_guess_page(web_driver=web_driver):
+            raise RuntimeError("This is not a Blather 'Round guess page")
+
+        # GET IT
+        context = self.get_context(web_driver=web_driver)
+        if context:
+            prompt = self.get_prompt(web_driver=web_driver, clues=self._guess_clues)
+            if prompt:
+                guess = tuple((context, prompt))
+
+        # DONE
+        return guess
+
 
 def _add_missing_punctuation(raw_str: str, mark: str = '.') -> str:
     """Add a missing punctuation mark to raw_str."""
@@ -718,6 +914,39 @@ def _construct_full_describe_prompt(prompt: str, sentence: str, buttons_left: Li
     return full_prompt
 
 
+def _construct_guess_prompt(context: str, prompt: str, wrong_guesses: List[str] = None,
+                            num_guesses: int = 1) -> str:
+    """Form the full guess prompt based on extracted data.
+
+    Args:
+        context: The clue sentences (see: JbgBr.get_context()).
+        prompt: E.g., "what story is hark describing?"
+        wrong_guesses: Optional; Guesses that were already made.
+        num_guesses: Optional; Ask for a ranked, comma-separated list of this many guesses.
+
+    Returns:
+        A fully formed, AI-engineered, guess prompt.
+    """
+    # LOCAL VARIABLES
+    bad_guesses = ''  # Let the AI know it's already guessed wrong
+    # How to answer
+    instructions = ' Answer the following in one or two words without adding adjectives or ' \
+                   + 'adverbs... '
+
+    # FORM IT
+    if wrong_guesses:
+        bad_guesses = ' The following guesses were already made and are wrong: ' \
+                      + f'{", ".join(wrong_guesses)}.'
+    if num_guesses > 1:
+        instructions = f' List your {num_guesses} best guesses, most likely first, in a ' \
+                       + 'comma-separated list with no other commentary.  Each guess should be ' \
+                       + 'one or two words without adding adjectives or adverbs... '
+
+    # DONE
+    # It comes through lowercase for some reason.
+    return context + bad_guesses + instructions + prompt.capitalize()
+
+
 def _convert_button_text(button_elem: selenium.webdriver.remote.webelement.WebElement) -> List[str]:
     """Convert the text of a 'describe' page button element into a list of strings."""
     return button_elem.text.split('\n')
@@ -739,6 +968,25 @@ def _extract_sentence(web_driver: selenium.webdriver.chrome.webdriver.WebDriver)
     return sentence
 
 
+def _match_planned_word(plan: List[str], buttons: List[str], taken: List[str]) -> str:
+    """Find the highest-ranked planned word that is one of the buttons and not already taken.
+
+    Returns:
+        The matching button text, or None if no planned word fits.
+    """
+    # LOCAL VARIABLES
+    # Button text, by lowercase text
+    button_dict = {button.strip().lower(): button for button in buttons or [] if button}
+
+    # MATCH IT
+    for word in plan:
+        if word in button_dict and button_dict[word] not in taken:
+            return button_dict[word]
+
+    # DONE
+    return None
+
+
 def _reformat_sentence(sentence_elem: selenium.webdriver.remote.webelement.WebElement) -> str:
     """Extract the 'describe' sentence from its web element."""
     # LOCAL VARIABLES
@@ -756,6 +1004,21 @@ def _reformat_sentence(sentence_elem: selenium.webdriver.remote.webelement.WebEl
     return sentence
 
 
+def _split_ranked_list(answer: str) -> List[str]:
+    """Split a ranked list answer into entries, dropping numbering, quotes, and duplicates."""
+    # LOCAL VARIABLES
+    entries = []  # Ranked entries
+
+    # SPLIT IT
+    for entry in answer.replace('\n', ',').split(','):
+        entry = _strip_quotes(re.sub(r'^(?:\d+[.)]|[-*])\s*', '', entry.strip()).strip('. '))
+        if entry and entry.lower() not in [prev.lower() for prev in entries]:
+            entries.append(entry)
+
+    # DONE
+    return entries
+
+
 def _strip_quotes(quote: str) -> str:
     """Strip matched leading and trailing quotes from a string."""
     # LOCAL VARIABLES
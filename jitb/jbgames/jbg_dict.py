@@ -11,9 +11,12 @@ import selenium
 # Local
 from jitb.jbgames.jbg_abc import JbgAbc
 from jitb.jbgames.jbg_page_ids import JbgPageIds
+from jitb.jitb_clues import ClueMatcher
 from jitb.jitb_globals import JITB_POLL_RATE
 from jitb.jitb_logger import Logger
 from jitb.jitb_openai import JitbAi
+from jitb.jitb_snapshot import PageSnapshot
+from jitb.jitb_tracer import Tracer
 from jitb.jitb_webdriver import (click_a_button, get_char_limit, get_prompt,
                                  is_prompt_page, is_vote_page, vote_answers,
                                  write_an_answer)
@@ -27,12 +30,13 @@ class JbgDict(JbgAbc):
     """Jackbox Games (JBG) Dictionarium (Dict) class."""
 
     # Methods are listed in expected 'call order'.
-    def __init__(self, ai_obj: JitbAi, username: str) -> None:
+    def __init__(self, ai_obj: JitbAi, username: str, pipeline: bool = False) -> None:
         """JbgDict ctor.
 
         Args:
             ai_obj:  OpenAI API interface to use in this game.
             username:  The screen name used in this game.
+            pipeline:  Optional; Pre-generate answers in the background.
         """
         # Pass these values as prompt_clues arguments to jitb_webdriver functions
         self._prompt_clues = ['Write a definition for', 'Write a synonym for',
@@ -43,6 +47,11 @@ class JbgDict(JbgAbc):
                             'Vote for your favorite sentence using']
         # Hints the page is on the Dictionarium-specific "distribute likes" page
         self._wait_like_clues = ['distribute likes']
+        # All of the 'prompt' element clues, compiled once, in id_page() priority order
+        self._page_matcher = ClueMatcher({JbgPageIds.VOTE: self._vote_clues,
+                                          JbgPageIds.ANSWER: self._prompt_clues,
+                                          JbgPageIds.DICT_WAIT_LIKE: self._wait_like_clues},
+                                         clean_string=True)
         # Update AI system: content message
         ai_obj.change_system_content('You are a witty person trying to win the Jackbox Game'
                                      'Dictionarium. When giving definitions or synonyms, do not '
@@ -50,9 +59,10 @@ class JbgDict(JbgAbc):
                                      'do not provide the part of speech, do not add extra context, '
                                      'and not not add extraneous commentary. '
                                      'Respond with just the definition or synonym.')
-        super().__init__(ai_obj=ai_obj, username=username)
+        super().__init__(ai_obj=ai_obj, username=username, pipeline=pipeline)
 
     # Parent Class Abstract Methods
+    @Tracer.traced('play')
     def play(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
         """Determine web_driver's page id and call the relevant method.
 
@@ -61,15 +71,20 @@ class JbgDict(JbgAbc):
             TypeError: An internal attribute is the wrong data type.
             ValueError: An internal attribute contains an invalid value.
         """
+        # LOCAL VARIABLES
+        snapshot = self.snapshot_page(web_driver=web_driver)  # Everything needed to id the page
+
         # INPUT VALIDATION
-        self.validate_status(web_driver=web_driver)
+        self.validate_status(web_driver=web_driver, snapshot=snapshot)
 
         # SETUP
         self._last_page = self._current_page  # Store the last page
-        self._current_page = self.id_page(web_driver=web_driver)  # Get the current page
+        # Get the current page
+        self._current_page = self.id_page(web_driver=web_driver, snapshot=snapshot)
 
         # PLAY
         if self._last_page != self._current_page:
+            self.report_page_change()
             if self._current_page == JbgPageIds.VOTE:
                 self.vote_answers(web_driver=web_driver)
             elif self._current_page == JbgPageIds.ANSWER:
@@ -131,7 +146,9 @@ class JbgDict(JbgAbc):
             if not prompt_text:
                 break  # Nothing got answered
 
-    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> JbgPageIds:
+    @Tracer.traced('id_page')
+    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                snapshot: PageSnapshot = None) -> JbgPageIds:
         """Determine what type of Jackbox Games webpage web_driver is.
 
         The jackbox.tv login page should be universal so start with self._is_login_page()
@@ -139,6 +156,7 @@ class JbgDict(JbgAbc):
 
         Args:
             web_driver: The webdriver object to interact with.
+            snapshot: Optional; A PageSnapshot of web_driver.  Taken if not provided.
 
         Returns:
             The identified page as a JbgPageIds enum.
@@ -147,21 +165,22 @@ class JbgDict(JbgAbc):
         current_page = JbgPageIds.UNKNOWN  # What type of page is this?
 
         # INPUT VALIDATION
-        self.validate_status(web_driver=web_driver)
+        if snapshot is None:
+            snapshot = self.snapshot_page(web_driver=web_driver)
+        self.validate_status(web_driver=web_driver, snapshot=snapshot)
 
         # DETERMINE PAGE
-        if self.is_vote_page(web_driver=web_driver):
-            current_page = JbgPageIds.VOTE
-        elif self.is_prompt_page(web_driver=web_driver):
-            current_page = JbgPageIds.ANSWER
-        elif self._is_login_page(web_driver=web_driver):
+        current_page = self._match_page(web_driver=web_driver, matcher=self._page_matcher,
+                                        element_name='prompt', element_type=By.ID,
+                                        snapshot=snapshot)
+        # The login page still takes priority over the 'distribute likes' page
+        if current_page in (JbgPageIds.UNKNOWN, JbgPageIds.DICT_WAIT_LIKE) and \
+           self._is_login_page(web_driver=web_driver, snapshot=snapshot):
             current_page = JbgPageIds.LOGIN
-        elif self.is_waiting_likes_page(web_driver=web_driver):
-            current_page = JbgPageIds.DICT_WAIT_LIKE
 
         # DONE
         if current_page != JbgPageIds.UNKNOWN:
-            Logger.debug(f'This is a(n) {current_page.name} page!')
+            Logger.debug('This is a(n) %s page!', current_page.name)
         return current_page
 
     # Public Methods (alphabetical order)
@@ -203,24 +222,26 @@ class JbgDict(JbgAbc):
                 raise err from err
 
         # ANSWER IT
-        answer = self.generate_ai_answer(prompt=prompt_text, ai_obj=self._ai_obj,
-                                         length_limit=self.get_char_limit(web_driver=web_driver))
+        answer = self.get_ai_answer(prompt=prompt_text,
+                                    length_limit=self.get_char_limit(web_driver=web_driver))
         clicked_it = self.submit_an_answer(web_driver=web_driver, submit_text=answer)
 
         # DONE
         if not clicked_it:
+            self.report_missed_prompt(prompt=prompt_text)
             raise RuntimeError('Did not answer the prompt')
-        Logger.debug(f'Answered prompt "{prompt_text}" with "{answer}"!')
+        Logger.debug('Answered prompt "%s" with "%s"!', prompt_text, answer)
         return prompt_text
 
-    def get_char_limit(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> int:
+    def get_char_limit(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       snapshot: PageSnapshot = None) -> int:
         """Wraps jitb_webdriver.get_char_limit with game-specific details."""
         # LOCAL VARIABLES
         char_limit = None  # Character limit for the prompt
 
         # GET IT
         char_limit = get_char_limit(web_driver=web_driver, element_name='charRemaining',
-                                    element_type=By.CLASS_NAME)
+                                    element_type=By.CLASS_NAME, snapshot=snapshot)
         if char_limit is None:
             char_limit = DEFAULT_CHAR_LIMIT
 
@@ -232,25 +253,27 @@ class JbgDict(JbgAbc):
         return get_prompt(web_driver=web_driver, element_name='prompt', element_type=By.ID,
                           prompt_clues=self._prompt_clues, clean_string=True)
 
-    def is_prompt_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_prompt_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_prompt_page with game-specific details."""
         return is_prompt_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                              prompt_clues=self._prompt_clues)
+                              prompt_clues=self._prompt_clues, snapshot=snapshot)
 
-    def is_vote_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_vote_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                     snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_vote_page with game-specific details."""
         return is_vote_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                            vote_clues=self._vote_clues, clean_string=True)
+                            vote_clues=self._vote_clues, clean_string=True, snapshot=snapshot)
 
-    def is_waiting_likes_page(self,
-                              web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_waiting_likes_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                              snapshot: PageSnapshot = None) -> bool:
         """Determine if this is an award-likes-while-you-are-waiting page.
 
         Returns:
             True if this is a 'distribute likes' waiting screen, False otherwise.
         """
         return is_prompt_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                              prompt_clues=self._wait_like_clues)
+                              prompt_clues=self._wait_like_clues, snapshot=snapshot)
 
     def submit_an_answer(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
                          submit_text: str) -> bool:
@@ -1,9 +1,13 @@
 """Defines the package's Jackbox Games Joke Boat class."""
 
 # Standard
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from string import digits, punctuation, whitespace
-from typing import Final, List
-import random
+from typing import Dict, Final, List, Tuple
+import json
+import re
+import threading
 import time
 # Third Party
 from selenium.common.exceptions import (ElementNotInteractableException,
@@ -13,9 +17,13 @@ import selenium
 # Local
 from jitb.jbgames.jbg_abc import JbgAbc
 from jitb.jbgames.jbg_page_ids import JbgPageIds
+from jitb.jitb_clues import ClueMatcher
 from jitb.jitb_globals import JITB_POLL_RATE
 from jitb.jitb_logger import Logger
+from jitb.jitb_misc import clean_up_string
 from jitb.jitb_openai import JitbAi
+from jitb.jitb_snapshot import PageSnapshot
+from jitb.jitb_tracer import Tracer
 from jitb.jitb_webdriver import (click_a_button, get_char_limit, get_prompt, is_prompt_page,
                                  is_vote_page, vote_answers, write_an_answer)
 
@@ -24,8 +32,25 @@ DEFAULT_CHAR_LIMIT: Final[int] = 80  # Default maximum character limit
 # Known joke topic prompts to use as keys in the dictionary of answers
 KNOWN_JOKE_TOPICS: Final[List[str]] = ['A BRAND', 'AN OBJECT', 'A FOOD', 'A LOCATION',
                                        'A PLURAL NOUN', 'AN ANIMAL', 'A PERSON’S NAME']
+# Generic joke topics to submit when the topic worker can't keep up
+JOKE_TOPIC_FALLBACKS: Final[Dict[str, List[str]]] = {
+    'A BRAND': ['Duolingo', 'Crocs', 'Spam', 'IKEA', 'Nike'],
+    'AN OBJECT': ['Pool noodle', 'Lava lamp', 'Fidget spinner', 'Rubber duck', 'Toaster'],
+    'A FOOD': ['Fruitcake', 'Corn dog', 'Cottage cheese', 'Pineapple pizza', 'Meatloaf'],
+    'A LOCATION': ['The moon', 'Las Vegas', 'Atlantis', 'The DMV', 'Costco'],
+    'A PLURAL NOUN': ['Mimes', 'Hot tubs', 'Crayons', 'Llamas', 'Socks'],
+    'AN ANIMAL': ['Raccoon', 'Narwhal', 'Goose', 'Sloth', 'Platypus'],
+    'A PERSON’S NAME': ['Cleopatra', 'Bob Ross', 'Shrek', 'Napoleon', 'Dolly Parton']}
 # Maximum number of Joke Topic requests
 MAX_JOKE_TOPIC_REQUESTS: Final[int] = 10
+JOKE_TOPIC_BATCH: Final[int] = 10     # Number of examples to request for each joke topic
+JOKE_TOPIC_LOW: Final[int] = 3        # Top up joke topics with fewer examples than this
+# max_tokens to request for each joke topic's examples, with headroom for the JSON syntax
+JOKE_TOPIC_TOKENS: Final[int] = 150
+JOKE_TOPIC_WAIT: Final[float] = 5.0   # Seconds, per Joke Topic round, to wait on the worker
+# Matches a "key": [...] pair whose list of examples was completed, even if the JSON wasn't
+TOPIC_PAIR_REGEX: Final[re.Pattern] = re.compile(r'("(?:[^"\\]|\\.)*")\s*:\s*'
+                                                 r'(\[(?:[^\[\]"]|"(?:[^"\\]|\\.)*")*\])')
 
 
 # pylint: disable = too-many-instance-attributes
@@ -33,19 +58,27 @@ class JbgJb(JbgAbc):
     """Jackbox Games (JBG) Joke Boat (JB) class."""
 
     # Methods are listed in expected 'call order'.
-    def __init__(self, ai_obj: JitbAi, username: str) -> None:
+    def __init__(self, ai_obj: JitbAi, username: str, pipeline: bool = False) -> None:
         """JbgJb ctor.
 
         Args:
             ai_obj:  OpenAI API interface to use in this game.
             username:  The screen name used in this game.
+            pipeline:  Optional; Pre-generate answers in the background.
         """
         ai_obj.change_system_content('You are a witty person trying to win the Jackbox Game '
                                      'Joke Boat')
-        super().__init__(ai_obj=ai_obj, username=username)
+        super().__init__(ai_obj=ai_obj, username=username, pipeline=pipeline)
         self._joke_topic_dict = {}     # Dictionary of joke topics (see: KNOWN_JOKE_TOPICS)
-        self._joke_topic_init = False  # Joke Topic Dict prepopulated
+        self._joke_topic_init = False  # Joke Topic worker started
         self._num_requests = 0         # Number of Joke Topic AI requests; Capped by module constant
+        self._topic_lock = threading.Lock()  # Guards self._joke_topic_dict
+        self._topic_pool = None              # Lazily created joke topic worker
+        self._topic_future: Future = None    # The joke topic worker's latest request
+        self._topic_deadline = None          # Monotonic time this round stops waiting on it
+        # Unused JOKE_TOPIC_FALLBACKS, by normalized key
+        self._fallback_topics = {_normalize_topic_key(key): list(value)
+                                 for key, value in JOKE_TOPIC_FALLBACKS.items()}
         # A 'needle' to help identify the catchphrase page
         self._chatchphrase_clues = ['catchphrase']
         # A 'needle' to help identify the joke topic page
@@ -57,10 +90,18 @@ class JbgJb(JbgAbc):
         # Pass these values as vote_clues arguments to jitb_webdriver functions
         self._vote_clues = ['Choose a joke set-up', 'Complete your set-up',
                             'Pick your favorite joke', 'Pick the joke you want to compete against']
+        # All of the 'prompt' element clues, compiled once, in id_page() priority order
+        self._page_matcher = ClueMatcher({JbgPageIds.VOTE: self._vote_clues,
+                                          JbgPageIds.JB_TOPIC: self._joke_topic_clues,
+                                          JbgPageIds.ANSWER: self._prompt_clues,
+                                          JbgPageIds.JB_PERFORM: self._perform_clues,
+                                          JbgPageIds.JB_CATCH: self._chatchphrase_clues},
+                                         clean_string=True)
         # Exclude these button names from voting catchphrases
         self._exclude = ['Reset my choices']
 
     # Parent Class Abstract Methods
+    @Tracer.traced('play')
     def play(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
         """Determine web_driver's page id and call the relevant method.
 
@@ -69,25 +110,34 @@ class JbgJb(JbgAbc):
             TypeError: An internal attribute is the wrong data type.
             ValueError: An internal attribute contains an invalid value.
         """
+        # LOCAL VARIABLES
+        snapshot = self.snapshot_page(web_driver=web_driver)  # Everything needed to id the page
+
         # INPUT VALIDATION
-        self.validate_status(web_driver=web_driver)
+        self.validate_status(web_driver=web_driver, snapshot=snapshot)
 
         # SETUP
         self._last_page = self._current_page  # Store the last page
-        self._current_page = self.id_page(web_driver=web_driver)  # Get the current page
+        # Get the current page
+        self._current_page = self.id_page(web_driver=web_driver, snapshot=snapshot)
         if not self._joke_topic_init:
-            self._populate_joke_topic_dict(num_requests=1)  # Make this 2 when JitbAi has context
+            self._top_up_joke_topics()  # Fill the dict in the background, well before the round
+            self._joke_topic_init = True
 
         # PLAY
         if self._last_page != self._current_page:
+            self.report_page_change()
             if self._last_page == JbgPageIds.JB_TOPIC:
-                self._num_requests = 0  # Reset the count in case there's another game
+                self._num_requests = 0         # Reset the count in case there's another game
+                self._topic_deadline = None    # Reset the deadline too
+                self._top_up_joke_topics()
             if self._current_page == JbgPageIds.VOTE:
                 self.vote_answers(web_driver=web_driver, vote_clues=self._vote_clues,
                                   exclude=self._exclude)
             elif self._current_page == JbgPageIds.JB_TOPIC:
                 self.enter_vote_topics(web_driver=web_driver)
             elif self._current_page == JbgPageIds.ANSWER:
+                self.prefetch_prompt(web_driver=web_driver, snapshot=snapshot)
                 self.answer_prompts(web_driver=web_driver, num_answers=1)
             elif self._current_page == JbgPageIds.JB_PERFORM:
                 self.skip_perform(web_driver=web_driver)
@@ -158,7 +208,9 @@ class JbgJb(JbgAbc):
             if not prompt_text:
                 break  # Nothing got answered
 
-    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> JbgPageIds:
+    @Tracer.traced('id_page')
+    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                snapshot: PageSnapshot = None) -> JbgPageIds:
         """Determine what type of Jackbox Games webpage web_driver is.
 
         The jackbox.tv login page should be universal so start with self._is_login_page()
@@ -166,6 +218,7 @@ class JbgJb(JbgAbc):
 
         Args:
             web_driver: The webdriver object to interact with.
+            snapshot: Optional; A PageSnapshot of web_driver.  Taken if not provided.
 
         Returns:
             The identified page as a JbgPageIds enum.
@@ -174,25 +227,21 @@ class JbgJb(JbgAbc):
         current_page = JbgPageIds.UNKNOWN  # What type of page is this?
 
         # INPUT VALIDATION
-        self.validate_status(web_driver=web_driver)
+        if snapshot is None:
+            snapshot = self.snapshot_page(web_driver=web_driver)
+        self.validate_status(web_driver=web_driver, snapshot=snapshot)
 
         # DETERMINE PAGE
-        if self.is_vote_page(web_driver=web_driver):
-            current_page = JbgPageIds.VOTE
-        elif self.is_joke_topic_page(web_driver=web_driver):
-            current_page = JbgPageIds.JB_TOPIC
-        elif self.is_prompt_page(web_driver=web_driver):
-            current_page = JbgPageIds.ANSWER
-        elif self.is_perform_page(web_driver=web_driver):
-            current_page = JbgPageIds.JB_PERFORM
-        elif self.is_catchphrase_page(web_driver=web_driver):
-            current_page = JbgPageIds.JB_CATCH
-        elif self._is_login_page(web_driver=web_driver):
+        current_page = self._match_page(web_driver=web_driver, matcher=self._page_matcher,
+                                        element_name='prompt', element_type=By.ID,
+                                        snapshot=snapshot)
+        if current_page == JbgPageIds.UNKNOWN and \
+           self._is_login_page(web_driver=web_driver, snapshot=snapshot):
             current_page = JbgPageIds.LOGIN
 
         # DONE
         if current_page != JbgPageIds.UNKNOWN:
-            Logger.debug(f'This is a(n) {current_page.name} page!')
+            Logger.debug('This is a(n) %s page!', current_page.name)
         return current_page
 
     # Public Methods (alphabetical order)
@@ -240,35 +289,32 @@ class JbgJb(JbgAbc):
                 time.sleep(JITB_POLL_RATE)  # Give the page a chance to update
                 continue  # We're probably not on a Joke Topic page anymore...
             # ANSWER IT
-            if temp_key not in self._joke_topic_dict or not self._joke_topic_dict[temp_key]:
-                Logger.debug(f'{temp_key} was requested as a vote topic but not present')
-                if not self._gen_vote_topics(key=temp_key):
-                    break  # There's no more requests to be had
-            if self._joke_topic_dict[temp_key]:
-                answer = self._joke_topic_dict[temp_key].pop()
-                clicked_it = self.submit_an_answer(web_driver=web_driver, submit_text=answer)
-                if clicked_it:
-                    clicked_one = True
-                    Logger.debug(f'Submitted {answer} for the {prompt_text} joke topic')
-                else:
-                    Logger.debug(f'Failed to submit {answer} as a joke topic to {prompt_text}')
-                    break  # Something went wrong so let's stop looping
+            answer = self._pop_joke_topic(key=temp_key)
+            if not answer:
+                Logger.debug('The joke topic dictionary is missing entries for %s', temp_key)
+                break  # There's no more requests to be had
+            clicked_it = self.submit_an_answer(web_driver=web_driver, submit_text=answer)
+            if clicked_it:
+                clicked_one = True
+                Logger.debug('Submitted %s for the %s joke topic', answer, prompt_text)
             else:
-                Logger.debug(f'The joke topic dictionary is missing entries for {temp_key}')
+                Logger.debug('Failed to submit %s as a joke topic to %s', answer, prompt_text)
+                break  # Something went wrong so let's stop looping
             time.sleep(JITB_POLL_RATE)  # Give the page a chance to update
 
         # DONE
         if not clicked_one:
             raise RuntimeError('Did not answer any vote topics')
 
-    def get_char_limit(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> int:
+    def get_char_limit(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       snapshot: PageSnapshot = None) -> int:
         """Wraps jitb_webdriver.get_char_limit with game-specific details."""
         # LOCAL VARIABLES
         char_limit = None  # Character limit for the prompt
 
         # GET IT
         char_limit = get_char_limit(web_driver=web_driver, element_name='charRemaining',
-                                    element_type=By.CLASS_NAME)
+                                    element_type=By.CLASS_NAME, snapshot=snapshot)
         if char_limit is None:
             char_limit = DEFAULT_CHAR_LIMIT
 
@@ -281,41 +327,54 @@ class JbgJb(JbgAbc):
         return get_prompt(web_driver=web_driver, element_name='prompt', element_type=By.ID,
                           prompt_clues=prompt_clues, clean_string=clean_string)
 
-    def is_any_vote_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_any_vote_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                         snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_vote_page with game-specific details for vote & catchprhase."""
         return is_vote_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
                             vote_clues=self._vote_clues + self._chatchphrase_clues,
-                            clean_string=True)
+                            clean_string=True, snapshot=snapshot)
 
-    def is_catchphrase_page(self,
-                            web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_catchphrase_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                            snapshot: PageSnapshot = None) -> bool:
         """Determine if this is this a catchphrase page.
 
         Returns:
             True if this is a choose-a-catchphrase screen, False otherwise.
         """
         return is_vote_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                            vote_clues=self._chatchphrase_clues)
+                            vote_clues=self._chatchphrase_clues, snapshot=snapshot)
 
-    def is_joke_topic_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_joke_topic_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                           snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_vote_page with game-specific details."""
         return is_vote_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                            vote_clues=self._joke_topic_clues)
+                            vote_clues=self._joke_topic_clues, snapshot=snapshot)
 
-    def is_perform_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_perform_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                        snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_vote_page with game-specific details."""
         return is_vote_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                            vote_clues=self._perform_clues)
+                            vote_clues=self._perform_clues, snapshot=snapshot)
 
-    def is_prompt_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_prompt_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_prompt_page with game-specific details."""
         return is_prompt_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                              prompt_clues=self._prompt_clues)
+                              prompt_clues=self._prompt_clues, snapshot=snapshot)
 
-    def is_vote_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_vote_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                     snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_vote_page with game-specific details."""
         return is_vote_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                            vote_clues=self._vote_clues, clean_string=True)
+                            vote_clues=self._vote_clues, clean_string=True, snapshot=snapshot)
+
+    def shutdown(self) -> None:
+        """Stop the joke topic worker, too.  Extends the parent method."""
+        with self._topic_lock:
+            if self._topic_pool is not None:
+                self._topic_pool.shutdown(wait=False, cancel_futures=True)
+                self._topic_pool = None
+        super().shutdown()
 
     def skip_perform(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
         """Tell Joke Bote to perform the joke for JITB.
@@ -368,7 +427,7 @@ class JbgJb(JbgAbc):
     # Private Methods (alphabetical order)
     def _add_to_joke_topic_dict(self, key: str, value: List[str]) -> None:
         """Safely add key:value to self._joke_topic_dict."""
-        Logger.debug(f'Adding {key} : {value} to self._joke_topic_dict')
+        Logger.debug('Adding %s : %s to self._joke_topic_dict', key, value)
         if key in self._joke_topic_dict:
             self._joke_topic_dict[key].extend(value)
         else:
@@ -401,6 +460,8 @@ class JbgJb(JbgAbc):
         # WAIT FOR IT
         for _ in range(num_loops):
             try:
+                # Start the AI on the new prompt before reading it the slow way
+                self.prefetch_prompt(web_driver=web_driver, last_prompt=last_prompt)
                 prompt_text = self.get_prompt(web_driver=web_driver)
                 if prompt_text and prompt_text != last_prompt:
                     break
@@ -411,128 +472,206 @@ class JbgJb(JbgAbc):
                 raise err from err
 
         # ANSWER IT
-        answer = self.generate_ai_answer(prompt=prompt_text, ai_obj=self._ai_obj,
-                                         length_limit=self.get_char_limit(web_driver=web_driver))
+        answer = self.get_ai_answer(prompt=prompt_text,
+                                    length_limit=self.get_char_limit(web_driver=web_driver))
         clicked_it = self.submit_an_answer(web_driver=web_driver, submit_text=answer)
 
         # DONE
         if not clicked_it:
+            self.report_missed_prompt(prompt=prompt_text)
             raise RuntimeError('Did not answer the prompt')
-        Logger.debug(f'Answered prompt "{prompt_text}" with "{answer}"!')
+        Logger.debug('Answered prompt "%s" with "%s"!', prompt_text, answer)
         return prompt_text
 
-    def _generate_bulk_joke_topics(self, key: str) -> None:
-        """Generate bulk joke topic answers for the key and add them to the original dict.
-
-        Adds topics to self._joke_topic_dict[key].
+    def _fill_joke_topics(self, keys: List[str]) -> None:
+        """Request JOKE_TOPIC_BATCH examples of every key, in one request, on the topic worker.
 
-        Args:
-            key: The key to use in the dictionary.
+        Adds topics to self._joke_topic_dict.  The request asks for a JSON object, with
+        JOKE_TOPIC_TOKENS per key, and every key completed before a cut off answer is kept.
+        Errors are logged, not raised, since nothing waits on the worker until the Joke Topic
+        round.
         """
         # LOCAL VARIABLES
-        prompt = ''     # Crafted prompt to pass to JitbAi()
-        list_len = 10   # Number of entries to generate for key
-        # len_limit = list_len * 10 * 2  # Length limit for query to AI
-        temp_key = key  # Gives us a chance to mangle a key, for prompt engineering
-        # A list of different "people" types
-        people_types = ['Famous', 'Fictional', 'Fairytale', 'Historical', 'Futuristic', 'Cartoon',
-                        'Book', 'Movie', 'Comic Book']
-        if key.upper().startswith('A BRAND'.upper()):
-            prompt = f'Generate a list of {str(list_len)} well-known commercial brands.'
-        elif key.upper() == 'A PERSON’S NAME':
-            temp_key = f'A {random.choice(people_types).upper()} PERSON’S NAME'
-        if not prompt:
-            prompt = f'Give me a list of {str(list_len)} new examples of this ' \
-                     + f'thing with no other commentary or explanation: {temp_key}.'
-        # AI generated answer
-        messages = [{'role': 'user', 'content': prompt}]
-        answer = self._ai_obj.create_content(messages=messages, add_base_msgs=False,
-                                             max_tokens=100)
-        answers = _split_and_strip_answers(answer, '\n')
+        topics = {}  # Parsed topics, by key
+        # Crafted prompt to pass to JitbAi()
+        prompt = f'Give me {JOKE_TOPIC_BATCH} new, funny, well-known examples of each of these ' \
+                 + 'things.  Use real commercial brands for brands.  Mix famous, fictional, ' \
+                 + 'historical, and cartoon people for names.  Reply with only a JSON object ' \
+                 + 'mapping each thing, exactly as written, to a list of examples: ' \
+                 + json.dumps(keys, ensure_ascii=False)
+        messages = [{'role': 'user', 'content': prompt}]  # Request to JitbAi
+
+        # FILL IT
+        # pylint: disable = broad-exception-caught
+        try:
+            answer = self._ai_obj.create_content(messages=messages, add_base_msgs=False,
+                                                 max_tokens=JOKE_TOPIC_TOKENS * len(keys),
+                                                 response_format={'type': 'json_object'})
+            topics = _parse_joke_topics(answer=answer, keys=keys)
+        except Exception as err:
+            Logger.error(f'Failed to generate joke topics for {keys}: {err}')
+        # pylint: enable = broad-exception-caught
 
         # STORE IT
-        Logger.debug(f'JitbAi generated "{answers}" as bulk joke topics for the key "{key}"')
-        self._add_to_joke_topic_dict(key=key, value=answers)
+        Logger.debug('JitbAi generated "%s" as bulk joke topics', topics)
+        with self._topic_lock:
+            for key, value in topics.items():
+                self._add_to_joke_topic_dict(key=key, value=value)
+
+    def _pop_fallback_topic(self, key: str) -> str:
+        """Pop an unused JOKE_TOPIC_FALLBACKS topic for key, or None if there are none left."""
+        # LOCAL VARIABLES
+        fallbacks = self._fallback_topics.get(_normalize_topic_key(key))  # Unused fallbacks
+        answer = fallbacks.pop() if fallbacks else None                   # Generic joke topic
+
+        # DONE
+        if answer:
+            Logger.debug('Falling back to the generic %s joke topic %s', key, answer)
+        return answer
 
-    def _gen_vote_topics(self, key: str) -> bool:
-        """Generate AI-created vote topics, and add them to the dict, in a dynamic way.
+    def _pop_joke_topic(self, key: str) -> str:
+        """Pop a joke topic for key, waiting on the topic worker only if the key is empty.
 
-        The real problem is OpenAI doesn't like to be spammed.  Currently model in use restricts
-        requests to 3 requests per minute (rpm).  There's an attribute to keep track of the
-        number of requests.  Less than 3 requests, call self._generate_bulk_joke_topics().  Last
-        request will be to _populate_joke_topic_dict().  The Joke Topic round is only 45 seconds
-        so this method will stop attempting to generate Joke Topics after three JitbAi queries.
+        All of the waits in a Joke Topic round share one JOKE_TOPIC_WAIT deadline.  Once it
+        passes, or the worker runs out of requests, a generic JOKE_TOPIC_FALLBACKS topic is
+        popped instead.
 
         Returns:
-            True if a topic was generated, false otherise.
+            A joke topic, or None if neither the worker nor the fallbacks have any.
         """
-        # LOCAL VARIABLE
-        made_some = True  # Generated some vote topics
-        last_request = MAX_JOKE_TOPIC_REQUESTS - 1  # Last request number
+        # LOCAL VARIABLES
+        answer = None  # Joke topic
+        future = None  # The topic worker's request
+        num_tries = 2  # Number of times to wait on the worker
+
+        # POP IT
+        for _ in range(num_tries + 1):
+            with self._topic_lock:
+                if self._joke_topic_dict.get(key):
+                    answer = self._joke_topic_dict[key].pop()
+                    break
+            if not num_tries:
+                break
+            num_tries -= 1
+            Logger.debug('%s was requested as a vote topic but not present', key)
+            if self._topic_deadline is None:
+                self._topic_deadline = time.monotonic() + JOKE_TOPIC_WAIT
+            future = self._top_up_joke_topics(key=key)
+            if not future or time.monotonic() >= self._topic_deadline:
+                break  # There's no more requests, or time, to be had
+            try:
+                future.result(timeout=self._topic_deadline - time.monotonic())
+            except FutureTimeoutError:
+                Logger.error(f'Timed out waiting on joke topics for {key}')
+                break
 
-        # self._populate_joke_topic_dict()
-        if self._num_requests == last_request:
-            self._populate_joke_topic_dict(key=key)  # Gen 1 answer per KNOWN_JOKE_TOPICS
-            self._num_requests += 1
-        # self._generate_bulk_joke_topics()
-        elif self._num_requests < last_request:
-            self._generate_bulk_joke_topics(key=key)  # Gen 10 answers for key
-            self._num_requests += 1
+        # DONE
+        if answer:
+            self._top_up_joke_topics()  # Stay ahead of the round
         else:
-            made_some = False
-            Logger.debug(f'Max number of Joke Topic requests have been made: {self._num_requests}')
+            answer = self._pop_fallback_topic(key=key)
+        return answer
+
+    def _snapshot_prompt(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                         snapshot: PageSnapshot) -> Tuple[str, int]:
+        """Read the prompt, as _answer_prompt() does, and its character limit from snapshot."""
+        # LOCAL VARIABLES
+        prompt_text = None   # The cleaned up prompt
+        length_limit = None  # The answer's character limit
+        # The prompt element's text
+        raw_text = snapshot.get_text(element_name='prompt', element_type=By.ID)
+
+        # READ IT
+        if raw_text and self._page_matcher.classify(text=raw_text) == JbgPageIds.ANSWER:
+            prompt_text = clean_up_string(dirty_string=raw_text)
+            length_limit = self.get_char_limit(web_driver=web_driver, snapshot=snapshot)
 
         # DONE
-        return made_some
+        return tuple((prompt_text, length_limit))
 
-    def _populate_joke_topic_dict(self, num_requests: int = 1, key: str = None) -> None:
-        """Prepopulate self._joke_topic_dict with joke topic answers across the board.
+    def _top_up_joke_topics(self, key: str = None) -> Future:
+        """Start the topic worker on any joke topic keys that are running low.
+
+        Covers key, first, KNOWN_JOKE_TOPICS, and any keys seen so far.  Only one request is in
+        flight at a time and no more than MAX_JOKE_TOPIC_REQUESTS are made per round.
 
         Args:
-            num_requests: Optional; Number of times to request topics from JitbAi.
-            key: Optional; Ensure this key is part of KNOWN_JOKE_TOPICS, otherwise lump it in.
+            key: Optional; A joke topic key that must be topped up.
 
-        If _generate_bulk_joke_topics() generates many answers about one topic,
-        _populate_joke_topic_dict() one answer for each topic.
+        Returns:
+            The topic worker's in-flight request, or None if there's nothing to wait on.
         """
         # LOCAL VARIABLES
-        # Let's see if we can get JitbAi to do what we want.
-        base_prompt = 'Give me one example each for each of these, with no other commentary ' \
-                      + 'or explanation, in a comma-separated list: {}'
-        joke_topics = KNOWN_JOKE_TOPICS  # List of topics to query JitbAi for
-        actual_prompt = ''               # Formatted with the dynamic list of topics
-        answers = []                     # AI answer split and stripped into a list
-        topic_list = ''                  # Comma-separated list of Joke Topics
-
-        # SETUP
-        if key and key.lower() not in [topic.lower() for topic in joke_topics]:
-            Logger.debug(f'Be sure to add this key to the list of KNOWN_JOKE_TOPICS: {key}')
-            joke_topics.append(key)
-        topic_list = ', '.join(joke_topics)
-        actual_prompt = base_prompt.format(topic_list)
-
-        # POPULATE IT
-        for _ in range(num_requests):
-            # Get topcs from JitbAi
-            answer = self.generate_ai_answer(prompt=actual_prompt, ai_obj=self._ai_obj,
-                                             length_limit=len(joke_topics) * 10 * 2)
-            Logger.debug(f'JitbAi answered "{actual_prompt}" with "{answer}"')
-            answers = _split_and_strip_answers(answer)
-            # Populate internal dict
-            for joke_topic, answer in zip(joke_topics, answers):
-                self._add_to_joke_topic_dict(key=joke_topic, value=[answer])
+        low_keys = []  # Joke topic keys running low
+
+        # TOP IT UP
+        with self._topic_lock:
+            if self._topic_future and not self._topic_future.done():
+                return self._topic_future  # Already on it
+            for temp_key in [key] + KNOWN_JOKE_TOPICS + list(self._joke_topic_dict):
+                if temp_key and temp_key not in low_keys \
+                        and len(self._joke_topic_dict.get(temp_key, [])) < JOKE_TOPIC_LOW:
+                    low_keys.append(temp_key)
+            if not low_keys:
+                return None
+            if self._num_requests >= MAX_JOKE_TOPIC_REQUESTS:
+                Logger.debug('Max number of Joke Topic requests have been made: %s',
+                             self._num_requests)
+                return None
+            if self._topic_pool is None:
+                self._topic_pool = ThreadPoolExecutor(max_workers=1,
+                                                      thread_name_prefix='jitb_topics')
+            self._num_requests += 1
+            self._topic_future = self._topic_pool.submit(self._fill_joke_topics, keys=low_keys)
 
         # DONE
-        self._joke_topic_init = True  # It's initialized now
+        return self._topic_future
 # pylint: enable = too-many-instance-attributes
 
 
 # Private Functions (alphabetical order)
-def _split_and_strip_answers(answer: str, delimiter: str = ',') -> List[str]:
-    """Split a comma-separated answer into a list of strings stipped of garbage."""
-    # List of split and stripped answers
-    answers = [_strip_answer(entry) for entry in answer.split(delimiter) if entry]
-    return answers
+def _normalize_topic_key(key: str) -> str:
+    """Normalize a joke topic key so curly apostrophes and case don't matter."""
+    return clean_up_string(key).replace('’', "'").upper()
+
+
+def _parse_joke_topics(answer: str, keys: List[str]) -> Dict[str, List[str]]:
+    """Parse a JSON object of joke topic examples, matching the AI's keys back to keys.
+
+    If the answer was cut off (e.g., at max_tokens), every key whose examples were completed is
+    still parsed.
+
+    Raises:
+        ValueError: The answer isn't a JSON object.
+    """
+    # LOCAL VARIABLES
+    topics = {}  # Parsed topics, by key
+    # Find the original key using a loosely normalized version of it
+    lookup = {_normalize_topic_key(key): key for key in keys}
+    # The AI answer, without any Markdown code fences
+    raw_json = re.sub(r'^```(?:json)?|```$', '', answer.strip()).strip()
+    parsed = None  # The JSON object
+
+    # INPUT VALIDATION
+    try:
+        parsed = json.loads(raw_json)
+    except json.JSONDecodeError as err:
+        parsed = {json.loads(raw_key): json.loads(raw_values)
+                  for raw_key, raw_values in TOPIC_PAIR_REGEX.findall(raw_json)}
+        if not parsed:
+            raise ValueError(f'Expected a JSON object of joke topics instead of {answer}') from err
+    if not isinstance(parsed, dict):
+        raise ValueError(f'Expected a JSON object of joke topics instead of {answer}')
+
+    # PARSE IT
+    for raw_key, raw_values in parsed.items():
+        key = lookup.get(_normalize_topic_key(str(raw_key)))
+        if key and isinstance(raw_values, list):
+            topics[key] = [value for value in (_strip_answer(str(entry)) for entry in raw_values)
+                           if value]
+
+    # DONE
+    return topics
 
 
 def _strip_answer(answer: str) -> str:
@@ -1,7 +1,7 @@
 """Defines the package's Jackbox Games Quiplash 2 class."""
 
 # Standard
-from typing import Final, List
+from typing import Final, List, Tuple
 import time
 # Third Party
 from selenium.common.exceptions import (ElementNotInteractableException,
@@ -11,9 +11,13 @@ import selenium
 # Local
 from jitb.jbgames.jbg_abc import JbgAbc
 from jitb.jbgames.jbg_page_ids import JbgPageIds
+from jitb.jitb_clues import ClueMatcher
 from jitb.jitb_globals import JITB_POLL_RATE
 from jitb.jitb_logger import Logger
+from jitb.jitb_misc import clean_up_string
 from jitb.jitb_openai import JitbAi
+from jitb.jitb_snapshot import PageSnapshot
+from jitb.jitb_tracer import Tracer
 from jitb.jitb_webdriver import (click_a_button, get_prompt, get_char_limit_attr, get_vote_text,
                                  is_prompt_page, is_vote_page, vote_answers, write_an_answer)
 
@@ -25,16 +29,17 @@ class JbgQ2(JbgAbc):
     """Jackbox Games (JBG) Quiplash 2 (Q2) class."""
 
     # Methods are listed in expected 'call order'.
-    def __init__(self, ai_obj: JitbAi, username: str) -> None:
+    def __init__(self, ai_obj: JitbAi, username: str, pipeline: bool = False) -> None:
         """JbgQ2 ctor.
 
         Args:
             ai_obj:  OpenAI API interface to use in this game.
             username:  The screen name used in this game.
+            pipeline:  Optional; Pre-generate answers in the background.
         """
         ai_obj.change_system_content('You are a witty person trying to win the Jackbox Game '
                                      'Quiplash 2')
-        super().__init__(ai_obj=ai_obj, username=username)
+        super().__init__(ai_obj=ai_obj, username=username, pipeline=pipeline)
         self._prompt_clues = None  # Prompt page clues
         self._last_lash_clues = None  # Thriplash page clues
         # Vote page clues
@@ -44,8 +49,14 @@ class JbgQ2(JbgAbc):
         self._normal_prompt_clues = ['SEND SAFETY QUIP']  # This does not appears on the Last Lash
         # A 'needle' to help differentiate a Comic Lash from the other Round 3 'Last Last' examples.
         self._comic_lash_clues = ['   SEND']  # Only the Comic Last Lash seems to get this
+        # The 'vote-text' element clues, compiled once
+        self._vote_matcher = ClueMatcher({JbgPageIds.VOTE: self._vote_clues})
+        # The 'state-answer-question' element clues, compiled once.  Any other prompt text
+        # indicates the Last Lash.
+        self._prompt_matcher = ClueMatcher({JbgPageIds.ANSWER: self._normal_prompt_clues})
 
     # Parent Class Abstract Methods
+    @Tracer.traced('play')
     def play(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
         """Determine web_driver's page id and call the relevant method.
 
@@ -54,16 +65,22 @@ class JbgQ2(JbgAbc):
             TypeError: An internal attribute is the wrong data type.
             ValueError: An internal attribute contains an invalid value.
         """
+        # LOCAL VARIABLES
+        snapshot = self.snapshot_page(web_driver=web_driver)  # Everything needed to id the page
+
         # INPUT VALIDATION
-        self.validate_status(web_driver=web_driver)
+        self.validate_status(web_driver=web_driver, snapshot=snapshot)
 
         # SETUP
         self._last_page = self._current_page  # Store the last page
-        self._current_page = self.id_page(web_driver=web_driver)  # Get the current page
+        # Get the current page
+        self._current_page = self.id_page(web_driver=web_driver, snapshot=snapshot)
 
         # PLAY
         if self._last_page != self._current_page:
+            self.report_page_change()
             if self._current_page == JbgPageIds.ANSWER:
+                self.prefetch_prompt(web_driver=web_driver, snapshot=snapshot)
                 self.answer_prompts(web_driver=web_driver)
             elif self._current_page == JbgPageIds.Q2_LAST:
                 self.answer_last_lash(web_driver=web_driver)
@@ -141,7 +158,9 @@ class JbgQ2(JbgAbc):
             if not prompt_text:
                 break  # Nothing got answered
 
-    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> JbgPageIds:
+    @Tracer.traced('id_page')
+    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                snapshot: PageSnapshot = None) -> JbgPageIds:
         """Determine what type of Jackbox Games webpage web_driver is.
 
         The jackbox.tv login page should be universal so start with self._is_login_page()
@@ -149,33 +168,42 @@ class JbgQ2(JbgAbc):
 
         Args:
             web_driver: The webdriver object to interact with.
+            snapshot: Optional; A PageSnapshot of web_driver.  Taken if not provided.
 
         Returns:
             The identified page as a JbgPageIds enum.
         """
         # LOCAL VARIABLES
         current_page = JbgPageIds.UNKNOWN  # What type of page is this?
+        prompt_text = None                 # The 'state-answer-question' text
 
         # INPUT VALIDATION
-        self.validate_status(web_driver=web_driver)
+        if snapshot is None:
+            snapshot = self.snapshot_page(web_driver=web_driver)
+        self.validate_status(web_driver=web_driver, snapshot=snapshot)
 
         # DETERMINE PAGE
-        if self.is_vote_page(web_driver=web_driver):
-            current_page = JbgPageIds.VOTE
-        elif self.is_prompt_page(web_driver=web_driver):
-            current_page = JbgPageIds.ANSWER
-        elif self.is_last_lash_page(web_driver=web_driver):
-            current_page = JbgPageIds.Q2_LAST
-        elif self._is_login_page(web_driver=web_driver):
-            current_page = JbgPageIds.LOGIN
+        current_page = self._match_page(web_driver=web_driver, matcher=self._vote_matcher,
+                                        element_name='vote-text', element_type=By.ID,
+                                        snapshot=snapshot)
+        if current_page == JbgPageIds.UNKNOWN:
+            prompt_text = self._get_page_text(web_driver=web_driver,
+                                              element_name='state-answer-question',
+                                              element_type=By.ID, snapshot=snapshot)
+            if prompt_text:
+                current_page = self._prompt_matcher.classify(text=prompt_text,
+                                                             default=JbgPageIds.Q2_LAST)
+            elif self._is_login_page(web_driver=web_driver, snapshot=snapshot):
+                current_page = JbgPageIds.LOGIN
 
         # DONE
         if current_page != JbgPageIds.UNKNOWN:
-            Logger.debug(f'This is a(n) {current_page.name} page!')
+            Logger.debug('This is a(n) %s page!', current_page.name)
         return current_page
 
     # Public Methods (alphabetical order)
-    def get_char_limit(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> int:
+    def get_char_limit(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       snapshot: PageSnapshot = None) -> int:
         """Wraps jitb_webdriver.get_char_limit_attr with game-specific details."""
         # LOCAL VARIABLES
         char_limit = None                   # Character limit for the prompt
@@ -185,7 +213,7 @@ class JbgQ2(JbgAbc):
         # GET LIMIT
         # Get Web Element
         char_limit = get_char_limit_attr(web_driver=web_driver, element_name=field_id,
-                                         attr_name=attr_name, element_type=By.ID)
+                                         attr_name=attr_name, element_type=By.ID, snapshot=snapshot)
         # Did it work?  If not, use the default.
         if char_limit is None:
             char_limit = DEFAULT_CHAR_LIMIT
@@ -249,7 +277,8 @@ class JbgQ2(JbgAbc):
         return get_vote_text(web_driver=web_driver, element_name='state-vote', element_type=By.ID,
                              vote_clues=vote_clues, clean_string=clean_string)
 
-    def is_last_lash_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_last_lash_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                          snapshot: PageSnapshot = None) -> bool:
         """Determine if this is the Round 3 Last Lash prompt page.
 
         One (seemingly) easy way to differentiate between the Last Lash prompt and the Round 1 & 2
@@ -266,15 +295,18 @@ class JbgQ2(JbgAbc):
 
         # IS IT?
         if is_prompt_page(web_driver=web_driver, element_name=element_name, element_type=By.ID,
-                          prompt_clues=self._prompt_clues, clean_string=False) and not \
+                          prompt_clues=self._prompt_clues, clean_string=False,
+                          snapshot=snapshot) and not \
            is_prompt_page(web_driver=web_driver, element_name=element_name, element_type=By.ID,
-                          prompt_clues=self._normal_prompt_clues, clean_string=False):
+                          prompt_clues=self._normal_prompt_clues, clean_string=False,
+                          snapshot=snapshot):
             last_lash_page = True
 
         # DONE
         return last_lash_page
 
-    def is_prompt_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_prompt_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       snapshot: PageSnapshot = None) -> bool:
         """Determine if this is a round 1 or 2 prompt page.
 
         Returns:
@@ -286,22 +318,25 @@ class JbgQ2(JbgAbc):
 
         # IS IT?
         if is_prompt_page(web_driver=web_driver, element_name=element_name, element_type=By.ID,
-                          prompt_clues=self._prompt_clues, clean_string=False) and \
+                          prompt_clues=self._prompt_clues, clean_string=False,
+                          snapshot=snapshot) and \
             is_prompt_page(web_driver=web_driver, element_name=element_name, element_type=By.ID,
-                           prompt_clues=self._normal_prompt_clues, clean_string=False):
+                           prompt_clues=self._normal_prompt_clues, clean_string=False,
+                           snapshot=snapshot):
             prompt_page = True
 
         # DONE
         return prompt_page
 
-    def is_vote_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_vote_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                     snapshot: PageSnapshot = None) -> bool:
         """Determine if this is this a round 1 or 2 vote page.
 
         Returns:
             True if this is a regular vote screen, False otherwise.
         """
         return is_vote_page(web_driver=web_driver, element_name='vote-text', element_type=By.ID,
-                            vote_clues=self._vote_clues, clean_string=False)
+                            vote_clues=self._vote_clues, clean_string=False, snapshot=snapshot)
 
     def submit_an_answer(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
                          submit_text: str) -> bool:
@@ -359,17 +394,17 @@ class JbgQ2(JbgAbc):
         # prompt_text = get_prompt(web_driver=web_driver)
         prompt_text = self.get_last_lash_prompt(web_driver=web_driver)
         if self._comic_lash_clues[0].lower() in prompt_text.lower():
-            Logger.debug(f'It appears we have encountered a Comic Last because the "{prompt_text}" '
-                         f'is being repaced with "{comic_text}"')
+            Logger.debug('It appears we have encountered a Comic Last because the "%s" is being '
+                         'repaced with "%s"', prompt_text, comic_text)
             prompt_text = comic_text
-        answer = self.generate_ai_answer(prompt_text, ai_obj=self._ai_obj,
-                                         length_limit=self.get_char_limit(web_driver=web_driver))
+        answer = self.get_ai_answer(prompt=prompt_text,
+                                    length_limit=self.get_char_limit(web_driver=web_driver))
         clicked_it = self.submit_an_answer(web_driver=web_driver, submit_text=answer)
 
         # DONE
         if not clicked_it:
             raise RuntimeError('Did not answer the Last Lash prompt')
-        Logger.debug(f'Answered Last Lash prompt "{prompt_text}" with: "{answer}"!')
+        Logger.debug('Answered Last Lash prompt "%s" with: "%s"!', prompt_text, answer)
 
     def _answer_prompt(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
                        last_prompt: str) -> str:
@@ -398,6 +433,8 @@ class JbgQ2(JbgAbc):
         # WAIT FOR IT
         for _ in range(num_loops):
             try:
+                # Start the AI on the new prompt before reading it the slow way
+                self.prefetch_prompt(web_driver=web_driver, last_prompt=last_prompt)
                 prompt_text = self.get_prompt(web_driver=web_driver)
                 if prompt_text and prompt_text != last_prompt:
                     break
@@ -408,12 +445,32 @@ class JbgQ2(JbgAbc):
                 raise err from err
 
         # ANSWER IT
-        answer = self.generate_ai_answer(prompt=prompt_text, ai_obj=self._ai_obj,
-                                         length_limit=self.get_char_limit(web_driver=web_driver))
+        answer = self.get_ai_answer(prompt=prompt_text,
+                                    length_limit=self.get_char_limit(web_driver=web_driver))
         clicked_it = self.submit_an_answer(web_driver=web_driver, submit_text=answer)
 
         # DONE
         if not clicked_it:
+            self.report_missed_prompt(prompt=prompt_text)
             raise RuntimeError('Did not answer the prompt')
-        Logger.debug(f'Answered prompt "{prompt_text}" with "{answer}"!')
+        Logger.debug('Answered prompt "%s" with "%s"!', prompt_text, answer)
         return prompt_text
+
+    def _snapshot_prompt(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                         snapshot: PageSnapshot) -> Tuple[str, int]:
+        """Read the prompt, as _answer_prompt() does, and its character limit from snapshot."""
+        # LOCAL VARIABLES
+        prompt_text = None   # The cleaned up question-text
+        length_limit = None  # The answer's character limit
+        # The prompt element's text
+        raw_text = snapshot.get_text(element_name='question-text', element_type=By.ID)
+        # Differentiates regular prompts from the Last Lash
+        state_text = snapshot.get_text(element_name='state-answer-question', element_type=By.ID)
+
+        # READ IT
+        if raw_text and self._prompt_matcher.classify(text=state_text) == JbgPageIds.ANSWER:
+            prompt_text = clean_up_string(dirty_string=raw_text)
+            length_limit = self.get_char_limit(web_driver=web_driver, snapshot=snapshot)
+
+        # DONE
+        return tuple((prompt_text, length_limit))
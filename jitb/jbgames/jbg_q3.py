@@ -3,7 +3,7 @@
 # Standard
 import random
 import time
-from typing import Final, List
+from typing import Final, List, Tuple
 # Third Party
 from selenium.common.exceptions import (ElementClickInterceptedException,
                                         ElementNotInteractableException,
@@ -14,10 +14,13 @@ import selenium
 # Local
 from jitb.jbgames.jbg_abc import JbgAbc
 from jitb.jbgames.jbg_page_ids import JbgPageIds
+from jitb.jitb_clues import ClueMatcher
 from jitb.jitb_globals import JBG_QUIP3_CHAR_NAMES, JITB_POLL_RATE
 from jitb.jitb_logger import Logger
 from jitb.jitb_openai import JitbAi
+from jitb.jitb_snapshot import PageSnapshot
 from jitb.jitb_selenium import get_buttons
+from jitb.jitb_tracer import Tracer
 from jitb.jitb_webdriver import (click_a_button, get_char_limit_attr, get_prompt, get_vote_text,
                                  is_prompt_page, is_vote_page, vote_answers, write_an_answer)
 
@@ -33,22 +36,29 @@ class JbgQ3(JbgAbc):
     char_names = JBG_QUIP3_CHAR_NAMES  # Quiplash 3 avatar names
 
     # Methods are listed in expected 'call order'.
-    def __init__(self, ai_obj: JitbAi, username: str) -> None:
+    def __init__(self, ai_obj: JitbAi, username: str, pipeline: bool = False) -> None:
         """JbgQ3 ctor.
 
         Args:
             ai_obj:  OpenAI API interface to use in this game.
             username:  The screen name used in this game.
+            pipeline:  Optional; Pre-generate answers in the background.
         """
         ai_obj.change_system_content('You are a witty person trying to win the Jackbox Game '
                                      'Quiplash 3')
-        super().__init__(ai_obj=ai_obj, username=username)
+        super().__init__(ai_obj=ai_obj, username=username, pipeline=pipeline)
         self._character_clues = ['Select your character']        # Character selection clues
         self._prompt_clues = ['Prompt 1 of 2', 'Prompt 2 of 2']  # Prompt page clues
         self._thrip_clues = ['Final prompt']                     # Thriplash page clues
         self._vote_clues = ['Vote for your favorite']            # Vote page clues
+        # All of the 'prompt' element clues, compiled once, in id_page() priority order
+        self._page_matcher = ClueMatcher({JbgPageIds.ANSWER: self._prompt_clues,
+                                          JbgPageIds.VOTE: self._vote_clues,
+                                          JbgPageIds.Q3_THRIP: self._thrip_clues},
+                                         clean_string=True)
 
     # Parent Class Abstract Methods
+    @Tracer.traced('play')
     def play(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
         """Determine web_driver's page id and call the relevant method.
 
@@ -57,15 +67,20 @@ class JbgQ3(JbgAbc):
             TypeError: An internal attribute is the wrong data type.
             ValueError: An internal attribute contains an invalid value.
         """
+        # LOCAL VARIABLES
+        snapshot = self.snapshot_page(web_driver=web_driver)  # Everything needed to id the page
+
         # INPUT VALIDATION
-        self.validate_status(web_driver=web_driver)
+        self.validate_status(web_driver=web_driver, snapshot=snapshot)
 
         # SETUP
         self._last_page = self._current_page  # Store the last page
-        self._current_page = self.id_page(web_driver=web_driver)  # Get the current page
+        # Get the current page
+        self._current_page = self.id_page(web_driver=web_driver, snapshot=snapshot)
 
         # PLAY
         if self._last_page != self._current_page:
+            self.report_page_change()
             if self._current_page == JbgPageIds.LOGIN:
                 pass  # Wait for the page to change because the caller already logged in
             elif self._current_page == JbgPageIds.AVATAR and not self._avatar_chosen:
@@ -78,6 +93,7 @@ class JbgQ3(JbgAbc):
                     else:
                         raise err from err
             elif self._current_page == JbgPageIds.ANSWER:
+                self.prefetch_prompt(web_driver=web_driver, snapshot=snapshot)
                 self.answer_prompts(web_driver=web_driver)
             elif self._current_page == JbgPageIds.VOTE:
                 self.vote_answers(web_driver=web_driver)
@@ -117,11 +133,12 @@ class JbgQ3(JbgAbc):
                 button_entry.click()
             except (ElementClickInterceptedException, ElementNotInteractableException,
                     ElementNotVisibleException) as err:
-                Logger.debug('Tried to click the select character button '
-                             f'{button_entry.accessible_name} but caught {repr(err)}')
+                if Logger.enabled():  # Reading the accessible name is a WebDriver round trip
+                    Logger.debug('Tried to click the select character button %s but caught %r',
+                                 button_entry.accessible_name, err)
                 button_list.remove(button_entry)  # Bad button; remove it and keep trying
             except StaleElementReferenceException:
-                Logger.debug('Tried to click the select character button '
+                Logger.debug(lambda: 'Tried to click the select character button '
                              f'{button_entry.accessible_name} but caught a '
                              'StaleElementReferenceException exception.  Is this a race '
                              'condition? Did someone click start before I clicked the button?')
@@ -181,7 +198,9 @@ class JbgQ3(JbgAbc):
             if not prompt_text:
                 break  # Nothing got answered
 
-    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> JbgPageIds:
+    @Tracer.traced('id_page')
+    def id_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                snapshot: PageSnapshot = None) -> JbgPageIds:
         """Determine what type of Jackbox Games webpage web_driver is.
 
         The jackbox.tv login page should be universal so start with self._is_login_page()
@@ -189,28 +208,29 @@ class JbgQ3(JbgAbc):
 
         Args:
             web_driver: The webdriver object to interact with.
+            snapshot: Optional; A PageSnapshot of web_driver.  Taken if not provided.
         """
         # LOCAL VARIABLES
         current_page = JbgPageIds.UNKNOWN  # What type of page is this?
 
         # INPUT VALIDATION
-        self.validate_status(web_driver=web_driver)
+        if snapshot is None:
+            snapshot = self.snapshot_page(web_driver=web_driver)
+        self.validate_status(web_driver=web_driver, snapshot=snapshot)
 
         # DETERMINE PAGE
-        if self._is_login_page(web_driver=web_driver):
+        if self._is_login_page(web_driver=web_driver, snapshot=snapshot):
             current_page = JbgPageIds.LOGIN
-        elif self.is_char_selection_page(web_driver=web_driver):
+        elif self.is_char_selection_page(web_driver=web_driver, snapshot=snapshot):
             current_page = JbgPageIds.AVATAR
-        elif self.is_prompt_page(web_driver=web_driver):
-            current_page = JbgPageIds.ANSWER
-        elif self.is_vote_page(web_driver=web_driver):
-            current_page = JbgPageIds.VOTE
-        elif self.is_thrip_prompt_page(web_driver=web_driver):
-            current_page = JbgPageIds.Q3_THRIP
+        else:
+            current_page = self._match_page(web_driver=web_driver, matcher=self._page_matcher,
+                                            element_name='prompt', element_type=By.ID,
+                                            snapshot=snapshot)
 
         # DONE
         if current_page != JbgPageIds.UNKNOWN:
-            Logger.debug(f'This is a(n) {current_page.name} page!')
+            Logger.debug('This is a(n) %s page!', current_page.name)
         return current_page
 
     # Public Methods (alphabetical order)
@@ -246,9 +266,10 @@ class JbgQ3(JbgAbc):
         # DONE
         if not clicked_it:
             raise RuntimeError('Did not answer the Thriplash prompt')
-        Logger.debug(f'ANSWERED THRIPLASH {prompt_text} with: {", ".join(gen_answers)}!')
+        Logger.debug(lambda: f'ANSWERED THRIPLASH {prompt_text} with: {", ".join(gen_answers)}!')
 
-    def get_char_limit(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> int:
+    def get_char_limit(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       snapshot: PageSnapshot = None) -> int:
         """Wraps jitb_webdriver.get_char_limit_attr with game-specific details."""
         # LOCAL VARIABLES
         char_limit = None                   # Character limit for the prompt
@@ -258,7 +279,7 @@ class JbgQ3(JbgAbc):
         # GET LIMIT
         # Get Web Element
         char_limit = get_char_limit_attr(web_driver=web_driver, element_name=field_id,
-                                         attr_name=attr_name, element_type=By.ID)
+                                         attr_name=attr_name, element_type=By.ID, snapshot=snapshot)
         # Did it work?  If not, use the default.
         if char_limit is None:
             char_limit = DEFAULT_CHAR_LIMIT
@@ -286,27 +307,29 @@ class JbgQ3(JbgAbc):
         return get_vote_text(web_driver=web_driver, element_name='prompt', element_type=By.ID,
                              vote_clues=vote_clues, clean_string=clean_string)
 
-    def is_char_selection_page(self,
-                               web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_char_selection_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                               snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_vote_page with game-specific details."""
         return is_vote_page(web_driver=web_driver, element_name='charactersPrompt',
-                            element_type=By.ID, vote_clues=self._character_clues)
+                            element_type=By.ID, vote_clues=self._character_clues, snapshot=snapshot)
 
-    def is_prompt_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_prompt_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_prompt_page with game-specific details."""
         return is_prompt_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                              prompt_clues=self._prompt_clues)
+                              prompt_clues=self._prompt_clues, snapshot=snapshot)
 
-    def is_thrip_prompt_page(self,
-                             web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_thrip_prompt_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                             snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_prompt_page with game-specific details."""
         return is_prompt_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                              prompt_clues=self._thrip_clues)
+                              prompt_clues=self._thrip_clues, snapshot=snapshot)
 
-    def is_vote_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> bool:
+    def is_vote_page(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                     snapshot: PageSnapshot = None) -> bool:
         """Wraps jitb_webdirver.is_vote_page with game-specific details."""
         return is_vote_page(web_driver=web_driver, element_name='prompt', element_type=By.ID,
-                            vote_clues=self._vote_clues, clean_string=True)
+                            vote_clues=self._vote_clues, clean_string=True, snapshot=snapshot)
 
     def submit_an_answer(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
                          submit_text: str) -> bool:
@@ -373,6 +396,8 @@ class JbgQ3(JbgAbc):
         # WAIT FOR IT
         for _ in range(num_loops):
             try:
+                # Start the AI on the new prompt before reading it the slow way
+                self.prefetch_prompt(web_driver=web_driver, last_prompt=last_prompt)
                 prompt_list = self.get_prompt(web_driver=web_driver,
                                               prompt_clues=self._prompt_clues, clean_string=False)
                 prompt_text = prompt_list[1]
@@ -384,16 +409,35 @@ class JbgQ3(JbgAbc):
                     break  # It was(?) but now it's not...
                 raise err from err
             except IndexError as err:
-                Logger.debug(f'An assumption was made about the length of {prompt_list}')
+                Logger.debug('An assumption was made about the length of %s', prompt_list)
                 raise err from err
 
         # ANSWER IT
-        answer = self.generate_ai_answer(prompt=prompt_text, ai_obj=self._ai_obj,
-                                         length_limit=self.get_char_limit(web_driver=web_driver))
+        answer = self.get_ai_answer(prompt=prompt_text,
+                                    length_limit=self.get_char_limit(web_driver=web_driver))
         clicked_it = self.submit_an_answer(web_driver=web_driver, submit_text=answer)
 
         # DONE
         if not clicked_it:
+            self.report_missed_prompt(prompt=prompt_text)
             raise RuntimeError('Did not answer the prompt')
-        Logger.debug(f'Answered prompt "{prompt_text}" with "{answer}"!')
+        Logger.debug('Answered prompt "%s" with "%s"!', prompt_text, answer)
         return prompt_text
+
+    def _snapshot_prompt(self, web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                         snapshot: PageSnapshot) -> Tuple[str, int]:
+        """Read the prompt, as _answer_prompt() does, and its character limit from snapshot."""
+        # LOCAL VARIABLES
+        prompt_text = None   # The prompt, sans the 'Prompt # of 2' line
+        length_limit = None  # The answer's character limit
+        # The prompt element's text
+        raw_text = snapshot.get_text(element_name='prompt', element_type=By.ID)
+
+        # READ IT
+        if raw_text and self._page_matcher.classify(text=raw_text) == JbgPageIds.ANSWER \
+           and len(raw_text.split('\n')) > 1:
+            prompt_text = raw_text.split('\n')[1]
+            length_limit = self.get_char_limit(web_driver=web_driver, snapshot=snapshot)
+
+        # DONE
+        return tuple((prompt_text, length_limit))
@@ -6,12 +6,17 @@ import os
 # Third Party
 # Local
 from jitb.jitb_argvals import ArgVals
-from jitb.jitb_globals import JITB_ARG_CMDS_AUTO, JITB_ARG_CMDS_MAN, TEMP_DIR_ENV_VARS
+from jitb.jitb_fleet import parse_fleet_job
+from jitb.jitb_globals import (JITB_ARG_CMDS_AUTO, JITB_ARG_CMDS_BENCH, JITB_ARG_CMDS_FLEET,
+                               JITB_ARG_CMDS_MAN, JITB_BENCH_REPEAT, JITB_BENCH_SUITES,
+                               JITB_BENCH_THRESHOLD, JITB_CACHE_FILENAME, JITB_EVENTS_DIRNAME,
+                               JITB_FLEET_MAX_RESTARTS, JITB_METRICS_HOST, JITB_METRICS_INTERVAL,
+                               JITB_POLL_RATE, TEMP_DIR_ENV_VARS)
 from jitb.jitb_misc import determine_tmp_dir
 from jitb.jitb_website import JITB_SUPPORTED_GAMES
 
 
-def parse_args() -> ArgVals:
+def parse_args() -> ArgVals:  # pylint: disable = too-many-locals, too-many-statements
     """Parse the command line arguments.
 
     Returns:
@@ -22,14 +27,25 @@ def parse_args() -> ArgVals:
     user_arg_name = 'user'                          # The proper name of the username argument
     room_code = None                                # Parsed room value (may be None)
     username = None                                 # Parsed username (may be None)
+    extra_usernames = None                          # Parsed usernames for more bots (may be None)
     jitb_games = list(JITB_SUPPORTED_GAMES.keys())  # JITB supported games
     parser = None                                   # ArgumentParser object
     subparsers = None                               # Subparsers
     manual_parser = None                            # The 'manual' command subparser
     auto_parser = None                              # The 'automatic' command subparser
+    fleet_parser = None                             # The 'fleet' command subparser
+    bench_parser = None                             # The 'bench' command subparser
     args = None                                     # Parsed argument Namespace
     # Debug log location
     debug_log = os.path.join(determine_tmp_dir(), 'jitb_YYYYMMDD_HHMMSS-#.log')
+    cache_file = os.path.join(determine_tmp_dir(), JITB_CACHE_FILENAME)  # --cache location
+    # --record location
+    session_file = os.path.join(determine_tmp_dir(), 'jitb_session_YYYYMMDD_HHMMSS.jsonl.gz')
+    # --trace raw span dump location
+    spans_file = os.path.join(determine_tmp_dir(), 'jitb_YYYYMMDD_HHMMSS-#_spans.json')
+    events_dir = os.path.join(determine_tmp_dir(), JITB_EVENTS_DIRNAME)  # --events location
+    # jitb bench --output location
+    bench_output = os.path.join(determine_tmp_dir(), 'jitb_bench_YYYYMMDD_HHMMSS.json')
 
     # SETUP
     jitb_games.sort()
@@ -47,20 +63,108 @@ def parse_args() -> ArgVals:
                                         help='JITB will automatically login')
     auto_parser.add_argument(f'-{room_arg_name[0]}', f'--{room_arg_name}', action='store',
                              help='The Jackbox Games room code', required=True)
-    auto_parser.add_argument(f'-{user_arg_name[0]}', f'--{user_arg_name}', action='store',
-                             help='The Jackbox Games username', required=True)
+    auto_parser.add_argument(f'-{user_arg_name[0]}', f'--{user_arg_name}', action='append',
+                             help='The Jackbox Games username (repeat it to add more bots, all '
+                                  'sharing one Chrome)', required=True)
+    fleet_parser = subparsers.add_parser(JITB_ARG_CMDS_FLEET[0], aliases=JITB_ARG_CMDS_FLEET[1:],
+                                         help='JITB will automatically login to many rooms at '
+                                         'once, sharing one OpenAI rate limit budget')
+    fleet_parser.add_argument('-j', '--job', action='append', type=parse_fleet_job, dest='jobs',
+                              metavar='ROOM,USERNAME[,GAME]', required=True,
+                              help='A room code and username to play, and optionally the game '
+                                   'the room should be playing (repeatable)')
+    fleet_parser.add_argument('--max-restarts', action='store', type=int,
+                              default=JITB_FLEET_MAX_RESTARTS,
+                              help='Number of times to restart each crashed session (default: '
+                                   f'{JITB_FLEET_MAX_RESTARTS})')
+    bench_parser = subparsers.add_parser(JITB_ARG_CMDS_BENCH[0], aliases=JITB_ARG_CMDS_BENCH[1:],
+                                         help='Benchmark JITB\'s hot paths, offline, and save '
+                                         'the results as JSON (run it from a JITB source '
+                                         'checkout)')
+    bench_parser.add_argument('--suite', action='append', choices=JITB_BENCH_SUITES,
+                              dest='bench_suites',
+                              help='A benchmark suite to run (repeatable, default: all)')
+    bench_parser.add_argument('--repeat', action='store', type=int, default=JITB_BENCH_REPEAT,
+                              dest='bench_repeat',
+                              help='Number of samples to take of each measurement (default: '
+                                   f'{JITB_BENCH_REPEAT})')
+    bench_parser.add_argument('--output', action='store', dest='bench_output',
+                              help=f'Where to save the results (default: {bench_output})')
+    bench_parser.add_argument('--compare', action='store', dest='bench_baseline',
+                              metavar='BASELINE',
+                              help='Flag measurements that regressed from these earlier results')
+    bench_parser.add_argument('--threshold', action='store', type=float,
+                              default=JITB_BENCH_THRESHOLD, dest='bench_threshold',
+                              help='Percent worse than the --compare baseline that counts as a '
+                                   f'regression (default: {JITB_BENCH_THRESHOLD})')
+    parser.add_argument('-c', '--cache', action='store_true',
+                        help='Answer previously seen prompts from, and save new answers to, '
+                             f'{cache_file}', required=False)
+    parser.add_argument('--cache-read-only', action='store_true',
+                        help='Answer previously seen prompts from the --cache but never update it',
+                        required=False)
     parser.add_argument('-d', '--debug', action='store_true',
                         help=f'Log debug messages to {debug_log} (Change the dir with '
                              f'the {TEMP_DIR_ENV_VARS[0]} environment variable)',
                         required=False)
+    parser.add_argument('--ecast', action='store_true',
+                        help='Skip Chrome and play over the jackbox.tv room protocol directly '
+                             '(experimental)', required=False)
+    parser.add_argument('--events', action='store', nargs='?', const=events_dir, metavar='DIR',
+                        help='Write every page change, AI request, answer, and missed prompt to '
+                             f'rotated, gzipped, JSON Lines files in DIR (default: {events_dir})',
+                        required=False)
+    parser.add_argument('--headless', action='store_true',
+                        help='Run a lean, headless Chrome that blocks images, fonts, media, and '
+                             'animations', required=False)
+    parser.add_argument('--metrics-file', action='store', metavar='FILE',
+                        help='Rewrite FILE with Prometheus metrics every '
+                             f'{JITB_METRICS_INTERVAL:g} seconds (jitb fleet workers append '
+                             'their session name)', required=False)
+    parser.add_argument('--metrics-port', action='store', type=int, metavar='PORT',
+                        help=f'Serve Prometheus metrics at http://{JITB_METRICS_HOST}:PORT/metrics '
+                             '(jitb fleet workers use PORT plus their job number, from 0)',
+                        required=False)
+    parser.add_argument('-o', '--observe', action='store_true',
+                        help='Wait for the web page to change instead of polling it every '
+                             f'{JITB_POLL_RATE} seconds', required=False)
+    parser.add_argument('-p', '--pipeline', action='store_true',
+                        help='Start generating answers in the background as soon as a prompt '
+                             'appears', required=False)
+    parser.add_argument('-r', '--record', action='store_true',
+                        help='Record every page, AI request, click, and keystroke to '
+                             f'{session_file} so the session can be replayed offline',
+                        required=False)
+    parser.add_argument('-s', '--stream', action='store_true',
+                        help='Stream AI answers and stop the request as soon as the answer '
+                             'fills the character limit', required=False)
+    parser.add_argument('-t', '--trace', action='store_true',
+                        help='Time each phase of a round and report the p50/p95/p99, by page '
+                             f'type, on exit (the raw spans are saved to {spans_file})',
+                        required=False)
 
     # PARSE IT
     args = parser.parse_args()
     room_code = _get_eafp_attr(args, room_arg_name)  # Get the room code
-    username = _get_eafp_attr(args, user_arg_name)  # Get the username
+    username = _get_eafp_attr(args, user_arg_name)  # Get the username(s)
+    if username:
+        username, extra_usernames = username[0], username[1:] or None
 
     # DONE
-    return ArgVals(args.command, args.debug, room_code=room_code, username=username)
+    return ArgVals(args.command, args.debug, room_code=room_code, username=username,
+                   extra_usernames=extra_usernames,
+                   observe=args.observe, pipeline=args.pipeline, stream=args.stream,
+                   cache=args.cache or args.cache_read_only, cache_read_only=args.cache_read_only,
+                   headless=args.headless, ecast=args.ecast, record=args.record,
+                   trace=args.trace, metrics_port=args.metrics_port,
+                   metrics_file=args.metrics_file, events=args.events,
+                   jobs=_get_eafp_attr(args, 'jobs'),
+                   max_restarts=_get_eafp_attr(args, 'max_restarts'),
+                   bench_suites=_get_eafp_attr(args, 'bench_suites'),
+                   bench_repeat=_get_eafp_attr(args, 'bench_repeat'),
+                   bench_output=_get_eafp_attr(args, 'bench_output'),
+                   bench_baseline=_get_eafp_attr(args, 'bench_baseline'),
+                   bench_threshold=_get_eafp_attr(args, 'bench_threshold'))
 
 
 def _get_eafp_attr(args: argparse.Namespace, attr: str) -> Any:
@@ -2,14 +2,37 @@
 
 # Standard
 from dataclasses import dataclass, field
+from typing import List
 # Third Party
 # Local
 
 
+# pylint: disable = too-many-instance-attributes
 @dataclass
 class ArgVals:
     """Return value of the JITB argument parser."""
     command: str
     debug: bool
-    room_code: str = field(default=None)  # Not used for all commands
-    username: str = field(default=None)   # Not used for all commands
+    room_code: str = field(default=None)          # Not used for all commands
+    username: str = field(default=None)           # Not used for all commands
+    extra_usernames: List = field(default=None)   # More bots sharing username's Chrome
+    observe: bool = field(default=False)          # Wait for page changes instead of polling
+    pipeline: bool = field(default=False)         # Pre-generate answers in the background
+    stream: bool = field(default=False)           # Stream AI answers and cut them off early
+    cache: bool = field(default=False)            # Answer previously seen prompts from a cache
+    cache_read_only: bool = field(default=False)  # Never update the cache
+    headless: bool = field(default=False)         # Run a lean, headless Chrome
+    ecast: bool = field(default=False)            # Play over the room protocol, without Chrome
+    record: bool = field(default=False)           # Record the session for test.replayer
+    trace: bool = field(default=False)            # Report the time spent in each phase
+    metrics_port: int = field(default=None)       # Serve Prometheus metrics on this port
+    metrics_file: str = field(default=None)       # Rewrite this Prometheus metrics textfile
+    events: str = field(default=None)             # Write the structured event log to this dir
+    jobs: List = field(default=None)              # jitb fleet FleetJobs
+    max_restarts: int = field(default=None)       # jitb fleet crashed session restart limit
+    bench_suites: List = field(default=None)      # jitb bench suites to run (None means all)
+    bench_repeat: int = field(default=None)       # jitb bench samples per measurement
+    bench_output: str = field(default=None)       # jitb bench results JSON filename
+    bench_baseline: str = field(default=None)     # jitb bench results to compare against
+    bench_threshold: float = field(default=None)  # jitb bench regression threshold, in percent
+# pylint: enable = too-many-instance-attributes
@@ -0,0 +1,242 @@
+"""Defines a persistent, SQLite-backed prompt->answer cache for JitbAi.
+
+Quiplash and Dictionarium repeat prompts from game to game.  Caching the polished answers on
+disk means a repeated prompt is answered instantly without spending any OpenAI tokens.  Several
+candidate answers are stored per prompt so repeat games still rotate through answers.
+"""
+
+# Standard
+from typing import Dict, List
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+# Third Party
+from hobo.validation import validate_string, validate_type
+# Local
+from jitb.jitb_globals import (JITB_CACHE_CANDIDATES, JITB_CACHE_FILENAME,
+                               JITB_CACHE_MAX_ENTRIES, JITB_CACHE_TTL)
+from jitb.jitb_logger import Logger
+from jitb.jitb_misc import clean_up_string, determine_tmp_dir
+from jitb.jitb_validation import validate_bool, validate_pos_int
+
+
+# pylint: disable = too-many-instance-attributes
+class JitbCache:
+    """Cache AI answers keyed on request type, normalized prompt, model, system content and limit.
+
+    A key is a cache hit once candidates answers have been stored for it, repeated answers
+    included, so a prompt the AI always answers the same way still hits.  Until then, every
+    request is a miss so the new answer can be added to the rotation.  Hits return the least
+    recently used answer.
+    Read-only caches never add, rotate, or evict answers so any stored answer is a hit.
+    Answers expire ttl seconds after they were stored and the least recently used answers are
+    evicted once the cache holds more than max_entries answers.  The cache is thread-safe.
+
+    Typical Usage:
+        cache = JitbCache()
+        ai_obj = JitbAi(cache=cache)
+    """
+
+    # Methods are listed in expected 'call order'.
+    def __init__(self, db_path: str = None, read_only: bool = False,
+                 candidates: int = JITB_CACHE_CANDIDATES, max_entries: int = JITB_CACHE_MAX_ENTRIES,
+                 ttl: int = JITB_CACHE_TTL) -> None:
+        """JitbCache ctor.
+
+        Args:
+            db_path: Optional; SQLite database filename.  Defaults to JITB_CACHE_FILENAME in the
+                temp directory.
+            read_only: Optional; If True, never write to the database.
+            candidates: Optional; Number of answers to store for each key.
+            max_entries: Optional; Maximum number of answers to store.
+            ttl: Optional; Number of seconds an answer remains valid.
+
+        Raises:
+            RuntimeError: A read-only database does not exist.
+            TypeError: Bad data type.
+            ValueError: Invalid value.
+        """
+        # INPUT VALIDATION
+        if db_path is None:
+            db_path = os.path.join(determine_tmp_dir(), JITB_CACHE_FILENAME)
+        validate_string(db_path, 'db_path', can_be_empty=False)
+        validate_bool(read_only, 'read_only')
+        validate_pos_int(candidates, 'candidates')
+        validate_pos_int(max_entries, 'max_entries')
+        validate_pos_int(ttl, 'ttl')
+        if read_only and not os.path.isfile(db_path):
+            raise RuntimeError(f'Unable to find a read-only cache at {db_path}')
+
+        # SETUP
+        self._db_path = db_path          # SQLite database filename
+        self._read_only = read_only      # Never write to the database
+        self._candidates = candidates    # Answers to store for each key
+        self._max_entries = max_entries  # Maximum number of answers to store
+        self._ttl = ttl                  # Seconds an answer remains valid
+        self._hits = 0                   # Number of cache hits
+        self._misses = 0                 # Number of cache misses
+        self._lock = threading.Lock()    # --pipeline answers are generated in worker threads
+        # SQLite connection
+        if read_only:
+            self._conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True,
+                                         check_same_thread=False)
+        else:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute('CREATE TABLE IF NOT EXISTS answers (key TEXT NOT NULL, '
+                               'answer TEXT NOT NULL, created REAL NOT NULL, '
+                               'last_used REAL NOT NULL, PRIMARY KEY (key, answer))')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS answers_last_used '
+                               'ON answers (last_used)')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS put_counts (key TEXT PRIMARY KEY, '
+                               'puts INTEGER NOT NULL)')
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+        Logger.debug('Closed the JITB cache with these stats: %s', self.get_stats())
+
+    # pylint: disable = too-many-arguments
+    def get(self, request_type: str, prompt: str, model: str, system_content: str,
+            length_limit: int, candidates: int = None) -> str:
+        """Fetch a cached answer.
+
+        Args:
+            request_type: The type of AI request (e.g., 'answer', 'thriplash', 'vote').
+            prompt: The original prompt.
+            model: The OpenAI model.
+            system_content: The role:system content given to OpenAI.
+            length_limit: The answer's length limit.
+            candidates: Optional; Overrides the number of answers to store for this key (e.g.,
+                1 for keys that shouldn't rotate).
+
+        Returns:
+            A cached answer on a hit, None on a miss.
+        """
+        # LOCAL VARIABLES
+        key = _make_key(request_type, prompt, model, system_content, length_limit)  # Cache key
+        now = time.time()  # Current time
+        rows = []          # Unexpired (answer, rowid) rows for key, least recently used first
+        puts = 0           # Number of answers ever stored for key, repeats included
+        answer = None      # Cached answer
+
+        # INPUT VALIDATION
+        if candidates is None:
+            candidates = self._candidates
+        validate_pos_int(candidates, 'candidates')
+
+        # GET IT
+        with self._lock:
+            rows = self._conn.execute('SELECT answer, rowid FROM answers WHERE key = ? AND '
+                                      'created >= ? ORDER BY last_used ASC, rowid ASC',
+                                      (key, now - self._ttl)).fetchall()
+            if rows and not self._read_only:
+                puts = self._get_puts(key=key)
+            if rows and (self._read_only or max(len(rows), puts) >= candidates):
+                answer = rows[0][0]
+                self._hits += 1
+                if not self._read_only:
+                    self._conn.execute('UPDATE answers SET last_used = ? WHERE rowid = ?',
+                                       (now, rows[0][1]))
+                    self._conn.commit()
+            else:
+                self._misses += 1
+
+        # DONE
+        return answer
+    # pylint: enable = too-many-arguments
+
+    def get_stats(self) -> Dict[str, int]:
+        """Report the cache hit and miss counters."""
+        return {'hits': self._hits, 'misses': self._misses}
+
+    # pylint: disable = too-many-arguments
+    def put(self, request_type: str, prompt: str, model: str, system_content: str,
+            length_limit: int, answer: str) -> None:
+        """Store an answer.
+
+        Does nothing if the cache is read-only or the answer is empty.
+
+        Args:
+            request_type: The type of AI request (e.g., 'answer', 'thriplash', 'vote').
+            prompt: The original prompt.
+            model: The OpenAI model.
+            system_content: The role:system content given to OpenAI.
+            length_limit: The answer's length limit.
+            answer: The answer to store.
+        """
+        # LOCAL VARIABLES
+        key = _make_key(request_type, prompt, model, system_content, length_limit)  # Cache key
+        now = time.time()  # Current time
+
+        # INPUT VALIDATION
+        validate_string(answer, 'answer', can_be_empty=True)
+        if self._read_only or not answer:
+            return
+
+        # PUT IT
+        with self._lock:
+            self._conn.execute('INSERT OR IGNORE INTO answers VALUES (?, ?, ?, ?)',
+                               (key, answer, now, now))
+            self._conn.execute('INSERT INTO put_counts VALUES (?, 1) '
+                               'ON CONFLICT (key) DO UPDATE SET puts = puts + 1', (key,))
+            self._evict(now=now)
+            self._conn.commit()
+    # pylint: enable = too-many-arguments
+
+    # Private methods in alphabetical order.
+    def _evict(self, now: float) -> None:
+        """Evict expired answers, and then least recently used answers, on behalf of put()."""
+        # LOCAL VARIABLES
+        num_over = 0  # Number of answers over the max_entries limit
+
+        # EVICT IT
+        self._conn.execute('DELETE FROM answers WHERE created < ?', (now - self._ttl,))
+        num_over = self._conn.execute('SELECT COUNT(*) FROM answers').fetchone()[0] \
+            - self._max_entries
+        if num_over > 0:
+            self._conn.execute('DELETE FROM answers WHERE rowid IN (SELECT rowid FROM answers '
+                               'ORDER BY last_used ASC, rowid ASC LIMIT ?)',
+                               (num_over,))
+        self._conn.execute('DELETE FROM put_counts WHERE key NOT IN (SELECT key FROM answers)')
+
+    def _get_puts(self, key: str) -> int:
+        """Count the answers ever stored for key, repeats included, on behalf of get()."""
+        # LOCAL VARIABLES
+        row = self._conn.execute('SELECT puts FROM put_counts WHERE key = ?',
+                                 (key,)).fetchone()  # The key's put count, if any
+
+        # DONE
+        return row[0] if row else 0
+# pylint: enable = too-many-instance-attributes
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt so trivial differences (e.g., case, whitespace) share a cache key."""
+    validate_string(prompt, 'prompt', can_be_empty=True)
+    return re.sub(r'\s+', ' ', clean_up_string(prompt)).strip().lower()
+
+
+def _make_key(request_type: str, prompt: str, model: str, system_content: str,
+              length_limit: int) -> str:
+    """Hash the cache key fields into a single key."""
+    # LOCAL VARIABLES
+    fields: List[str] = []  # Key fields, as strings
+
+    # INPUT VALIDATION
+    validate_string(request_type, 'request_type', can_be_empty=False)
+    validate_string(model, 'model', can_be_empty=False)
+    validate_string(system_content, 'system_content', can_be_empty=True)
+    validate_type(length_limit, 'length_limit', int)
+
+    # HASH IT
+    fields = [request_type, normalize_prompt(prompt), model, system_content, str(length_limit)]
+
+    # DONE
+    return hashlib.sha256('\x1f'.join(fields).encode('utf-8')).hexdigest()
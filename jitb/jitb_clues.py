@@ -0,0 +1,165 @@
+"""Defines a precompiled, multi-pattern clue matcher for page identification.
+
+Identifying a page used to mean lowercasing the element text and looping over every clue list,
+one page type at a time.  A ClueMatcher compiles all of a game's clue lists, once, into a single
+Aho-Corasick automaton.  Matching text against it costs one pass over the text no matter how many
+clues (or page types) the game defines.
+"""
+
+# Standard
+from collections import deque
+from typing import Any, Dict, List
+# Third Party
+from hobo.validation import validate_list, validate_string, validate_type
+# Local
+from jitb.jitb_logger import Logger
+from jitb.jitb_misc import clean_up_string
+from jitb.jitb_validation import validate_bool
+
+
+class ClueMatcher:
+    """Map text to the labels (e.g., JbgPageIds) whose clues it contains in a single pass.
+
+    Matching is case-insensitive.  Labels are prioritized in clue_map order so list them in the
+    same order the pages used to be checked (e.g., vote before prompt).
+
+    Typical Usage:
+        matcher = ClueMatcher({JbgPageIds.VOTE: vote_clues, JbgPageIds.ANSWER: prompt_clues})
+        current_page = matcher.classify(text=prompt_text, default=JbgPageIds.UNKNOWN)
+    """
+
+    # Methods are listed in expected 'call order'.
+    def __init__(self, clue_map: Dict[Any, List[str]], clean_string: bool = False) -> None:
+        """ClueMatcher ctor.
+
+        Args:
+            clue_map: Clue lists keyed by the label they identify (e.g., a JbgPageIds).
+                Dictionary order defines label priority.  Clue lists may be empty.
+            clean_string: Optional; Call clean_up_string() on the clues, and on any text to
+                match, prior to compilation and evaluation.
+
+        Raises:
+            TypeError: Bad data type.
+            ValueError: Invalid value.
+        """
+        # INPUT VALIDATION
+        validate_type(clue_map, 'clue_map', dict)
+        validate_bool(clean_string, 'clean_string')
+        for clues in clue_map.values():
+            validate_list(clues, 'clue_map clues', can_be_empty=True)
+            for clue in clues:
+                validate_string(clue, 'clue_map clues entry', can_be_empty=False)
+
+        # SETUP
+        self._clean_string = clean_string             # Normalize clues and text
+        self._labels = list(clue_map.keys())          # Labels, in priority order
+        self._goto = [{}]                             # Trie transitions: state -> {char: state}
+        self._fail = [0]                              # Failure links: state -> fallback state
+        self._outputs = [set()]                       # Label indices that end in each state
+        for label_index, clues in enumerate(clue_map.values()):
+            for clue in clues:
+                self._add_clue(clue=self._normalize(text=clue), label_index=label_index)
+        self._link_failures()
+
+    # Public Methods (alphabetical order)
+    def classify(self, text: str, default: Any = None) -> Any:
+        """Identify the highest priority label with a clue in text.
+
+        Ambiguous matches, where clues for more than one label were found, are logged.
+
+        Args:
+            text: The text to search (e.g., a page's prompt text).  May be empty or None.
+            default: Optional; The value to return if nothing matched.
+
+        Returns:
+            The highest priority matching label, default if nothing matched.
+
+        Raises:
+            TypeError: Bad data type.
+        """
+        # LOCAL VARIABLES
+        labels = self.match(text=text)  # All matching labels, in priority order
+        label = default                 # The label to return
+
+        # CLASSIFY IT
+        if labels:
+            label = labels[0]
+            if len(labels) > 1:
+                Logger.debug('Ambiguous clue match for "%s": %s all matched so choosing %s',
+                             text, labels, label)
+
+        # DONE
+        return label
+
+    def match(self, text: str) -> List[Any]:
+        """Find every label with a clue in text.
+
+        Args:
+            text: The text to search (e.g., a page's prompt text).  May be empty or None.
+
+        Returns:
+            A list of matching labels in priority order.  Empty if nothing matched.
+
+        Raises:
+            TypeError: Bad data type.
+        """
+        # LOCAL VARIABLES
+        found = set()  # Indices of the labels found in text
+        state = 0      # Current automaton state
+
+        # INPUT VALIDATION
+        if text is None:
+            text = ''
+        validate_type(text, 'text', str)
+
+        # MATCH IT
+        for char in self._normalize(text=text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            found |= self._outputs[state]
+            if len(found) == len(self._labels):
+                break  # Everything matched.  Stop looking.
+
+        # DONE
+        return [self._labels[index] for index in sorted(found)]
+
+    # Private methods in alphabetical order.
+    def _add_clue(self, clue: str, label_index: int) -> None:
+        """Add a normalized clue to the trie."""
+        # LOCAL VARIABLES
+        state = 0  # Current trie state
+
+        # ADD IT
+        for char in clue:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(set())
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._outputs[state].add(label_index)
+
+    def _link_failures(self) -> None:
+        """Breadth-first construction of the failure links and merged outputs."""
+        # LOCAL VARIABLES
+        queue = deque(self._goto[0].values())  # States to link, shallowest first
+        state = 0                              # The state being linked
+        fallback = 0                           # Candidate failure state
+
+        # LINK THEM
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._outputs[child] |= self._outputs[self._fail[child]]
+
+    def _normalize(self, text: str) -> str:
+        """Standardize text, and clues, so matching is apples to apples."""
+        if self._clean_string and text:
+            text = clean_up_string(dirty_string=text)
+        return text.lower()
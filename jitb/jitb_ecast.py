@@ -0,0 +1,295 @@
+"""Defines a browserless jackbox.tv client which speaks the ecast room protocol directly.
+
+jackbox.tv is a thin client over a WebSocket room protocol (ecast).  The game host keeps a
+per-player JSON entity up to date and the players send their answers and votes back as JSON
+messages.  EcastClient joins a room, tracks this player's entity, translates it into an
+EcastState (the protocol's equivalent of a PageSnapshot), and submits answers and votes.
+No Chrome required.
+
+Typical Usage:
+    client = EcastClient(room_code='ABCD', username='JITB')
+    game = client.connect()
+    state = client.wait_for_state(last_version=0)
+    if state.page_id == JbgPageIds.ANSWER:
+        client.submit_answer('bubble gum')
+    client.close()
+"""
+# Standard
+from dataclasses import dataclass, field
+from html import unescape
+from typing import Any, Dict, Final, List
+from urllib.parse import urlencode
+from urllib.request import urlopen
+import json
+import re
+import threading
+import uuid
+# Third Party
+from hobo.validation import validate_string, validate_type
+import websocket
+# Local
+from jitb.jbgames.jbg_page_ids import JbgPageIds
+from jitb.jitb_globals import JITB_ECAST_HOST, JITB_ECAST_TIMEOUT, JITB_OBSERVE_TIMEOUT
+from jitb.jitb_logger import Logger
+from jitb.jitb_validation import validate_bool
+
+
+# Jackbox Games names, by the appTag reported by the ecast rooms API
+ECAST_APP_TAGS: Final[Dict[str, str]] = {'blanky-blank': "Blather 'Round",
+                                         'ridictionary': 'Dictionarium',
+                                         'jackbox-jokeboat': 'Joke Boat',
+                                         'quiplash2-international': 'Quiplash 2',
+                                         'quiplash3': 'Quiplash 3'}
+# JbgPageIds, by the 'kind' (or 'state') of the player entity
+ECAST_KINDS: Final[Dict[str, JbgPageIds]] = {'lobby': JbgPageIds.UNKNOWN,
+                                             'waiting': JbgPageIds.UNKNOWN,
+                                             'logo': JbgPageIds.UNKNOWN,
+                                             'writing': JbgPageIds.ANSWER,
+                                             'enterthing': JbgPageIds.ANSWER,
+                                             'voting': JbgPageIds.VOTE,
+                                             'makesinglechoice': JbgPageIds.VOTE}
+ECAST_SUBPROTOCOL: Final[str] = 'ecast-v0'  # WebSocket subprotocol spoken by the rooms
+ECAST_HOST_ID: Final[int] = 1               # The game host's ecast client ID
+_HTML_TAG: Final[re.Pattern] = re.compile(r'<[^>]+>')  # Stripped from prompts and choices
+
+
+@dataclass
+class EcastState:
+    """This player's view of the game, read from its ecast entity instead of a web page."""
+    version: int = 0                                      # Incremented by every entity update
+    page_id: JbgPageIds = JbgPageIds.UNKNOWN              # What the player is being asked to do
+    prompt: str = ''                                      # The prompt to answer or vote on
+    length_limit: int = 45                                # The answer's character limit
+    choices: List[str] = field(default_factory=list)      # Answers to vote for, in order
+    entity: Dict[str, Any] = field(default_factory=dict)  # The raw player entity
+
+
+# pylint: disable = too-many-instance-attributes
+class EcastClient:
+    """Join a jackbox.tv room, as a player, over the ecast WebSocket protocol.
+
+    A background thread reads every message the room sends.  Call wait_for_state() to block
+    until this player's entity changes.
+    """
+
+    # Methods are listed in expected 'call order'.
+    def __init__(self, room_code: str, username: str, host: str = JITB_ECAST_HOST,
+                 secure: bool = True) -> None:
+        """EcastClient ctor.
+
+        Args:
+            room_code: The room code to join.
+            username: The screen name to use during the game.
+            host: Optional; The ecast rooms API host.  The room itself may live on another host.
+            secure: Optional; If False, use http:// and ws:// instead of https:// and wss://.
+
+        Raises:
+            TypeError: Bad data type.
+            ValueError: Invalid value.
+        """
+        # INPUT VALIDATION
+        validate_string(room_code, 'room_code', can_be_empty=False)
+        validate_string(username, 'username', can_be_empty=False)
+        validate_string(host, 'host', can_be_empty=False)
+        validate_bool(secure, 'secure')
+
+        # SETUP
+        self._room_code = room_code.upper()      # The room code to join
+        self._username = username                # The screen name to join with
+        self._host = host                        # The ecast rooms API host
+        self._secure = secure                    # Use TLS
+        self._user_id = str(uuid.uuid4())        # Identifies this player to the room
+        self._player_id = None                   # This player's ecast client ID
+        self._socket = None                      # websocket.WebSocket connected to the room
+        self._reader = None                      # Background thread reading from _socket
+        self._seq = 0                            # Sequence number of the last message sent
+        self._send_lock = threading.Lock()       # Serializes _seq and _socket.send()
+        self._changed = threading.Condition()    # Notified every time _state changes
+        self._state = EcastState()               # This player's current state
+        self._error = None                       # Why the room stopped talking to us, if it did
+
+    def connect(self) -> str:
+        """Look up the room, join it as a player, and start reading its messages.
+
+        Returns:
+            The Jackbox Games name (e.g., Quiplash 3) the room is playing.
+
+        Raises:
+            RuntimeError: The room was not found, is playing an unsupported game, or refused
+                this player.
+        """
+        # LOCAL VARIABLES
+        room = self._get_room()                        # The ecast rooms API response body
+        game = ECAST_APP_TAGS.get(room.get('appTag'))  # The Jackbox Games name
+        url = ''                                       # The room's player WebSocket URL
+        welcome = {}                                   # The room's first message
+
+        # CONNECT
+        if not game:
+            raise RuntimeError(f'Room {self._room_code} is playing an unsupported game: '
+                               f'{room.get("appTag")}')
+        url = f'{"wss" if self._secure else "ws"}://{room.get("host") or self._host}' \
+              f'/api/v2/rooms/{self._room_code}/play?' \
+              + urlencode({'role': 'player', 'name': self._username, 'format': 'json',
+                           'user-id': self._user_id})
+        self._socket = websocket.create_connection(url, timeout=JITB_ECAST_TIMEOUT,
+                                                   subprotocols=[ECAST_SUBPROTOCOL])
+        welcome = json.loads(self._socket.recv())
+        if welcome.get('opcode') != 'client/welcome':
+            self.close()
+            raise RuntimeError(f'Room {self._room_code} refused {self._username}: '
+                               f'{welcome.get("result")}')
+        self._player_id = welcome['result']['id']
+        for key, entity in welcome['result'].get('entities', {}).items():
+            self._update_entity(key, entity[1] if isinstance(entity, list) else entity)
+        self._socket.settimeout(None)
+        self._reader = threading.Thread(target=self._read_messages, daemon=True,
+                                        name=f'jitb_ecast_{self._room_code}')
+        self._reader.start()
+        Logger.debug('Joined %s room %s as ecast player %s', game, self._room_code,
+                     self._player_id)
+
+        # DONE
+        return game
+
+    def wait_for_state(self, last_version: int,
+                       timeout: float = JITB_OBSERVE_TIMEOUT) -> EcastState:
+        """Block until this player's entity changes or timeout seconds have passed.
+
+        Args:
+            last_version: The version of the last EcastState returned.  Use 0 for the first call.
+            timeout: Optional; The maximum number of seconds to wait for a change.
+
+        Returns:
+            The current EcastState.
+
+        Raises:
+            RuntimeError: The room closed, or reported an error.
+            TypeError: Bad data type.
+            ValueError: Invalid value.
+        """
+        # INPUT VALIDATION
+        validate_type(last_version, 'last_version', int)
+        validate_type(timeout, 'timeout', (int, float))
+        if timeout <= 0:
+            raise ValueError(f'Invalid timeout value: {timeout}')
+
+        # WAIT FOR IT
+        with self._changed:
+            self._changed.wait_for(lambda: self._state.version != last_version or self._error,
+                                   timeout=timeout)
+            if self._error:
+                raise RuntimeError(self._error)
+            return self._state
+
+    def submit_answer(self, answer: str) -> None:
+        """Send an answer to the current prompt to the game host."""
+        validate_string(answer, 'answer', can_be_empty=False)
+        self._send('client/send', {'from': self._player_id, 'to': ECAST_HOST_ID,
+                                   'body': {'action': 'write', 'entry': answer}})
+
+    def submit_vote(self, choice: int) -> None:
+        """Send a vote, for the choice'th entry of EcastState.choices, to the game host."""
+        validate_type(choice, 'choice', int)
+        self._send('client/send', {'from': self._player_id, 'to': ECAST_HOST_ID,
+                                   'body': {'action': 'choose', 'choice': choice}})
+
+    def close(self) -> None:
+        """Leave the room."""
+        if self._socket:
+            self._socket.close()
+        if self._reader and self._reader is not threading.current_thread():
+            self._reader.join(timeout=JITB_ECAST_TIMEOUT)
+
+    # Private methods in alphabetical order.
+    def _get_room(self) -> Dict[str, Any]:
+        """Ask the ecast rooms API where the room is and what it's playing.
+
+        Raises:
+            RuntimeError: The room was not found.
+        """
+        # LOCAL VARIABLES
+        url = f'{"https" if self._secure else "http"}://{self._host}' \
+              f'/api/v2/rooms/{self._room_code}'  # The ecast rooms API URL
+        response = {}  # The ecast rooms API response
+
+        # GET IT
+        with urlopen(url, timeout=JITB_ECAST_TIMEOUT) as reply:
+            response = json.loads(reply.read())
+        if not response.get('ok') or not isinstance(response.get('body'), dict):
+            raise RuntimeError('Room not found')
+
+        # DONE
+        return response['body']
+
+    def _read_messages(self) -> None:
+        """Apply every message the room sends until the connection closes."""
+        # LOCAL VARIABLES
+        message = {}  # The latest message
+
+        # READ THEM
+        try:
+            while True:
+                message = json.loads(self._socket.recv())
+                if message.get('opcode') in ('object', 'text'):
+                    self._update_entity(message['result']['key'], message['result'])
+                elif message.get('opcode') == 'error':
+                    raise RuntimeError(f'Room {self._room_code} reported an error: '
+                                       f'{message.get("result")}')
+        except (RuntimeError, ValueError, websocket.WebSocketException, OSError) as err:
+            Logger.debug('Stopped reading room %s with %r', self._room_code, err)
+            with self._changed:
+                self._error = str(err) if isinstance(err, RuntimeError) else \
+                    f'Lost the connection to room {self._room_code}'
+                self._changed.notify_all()
+
+    def _send(self, opcode: str, params: Dict[str, Any]) -> None:
+        """Send an ecast message to the room."""
+        with self._send_lock:
+            self._seq += 1
+            self._socket.send(json.dumps({'seq': self._seq, 'opcode': opcode, 'params': params}))
+            Logger.debug('Sent %s %s to room %s', opcode, params.get('body', params),
+                         self._room_code)
+
+    def _update_entity(self, key: str, entity: Dict[str, Any]) -> None:
+        """Translate an update to this player's entity into a new EcastState."""
+        # LOCAL VARIABLES
+        value = entity.get('val')  # The entity's value
+
+        # UPDATE IT
+        if key != f'player:{self._player_id}':
+            return  # Not ours
+        if value is None and entity.get('text'):
+            value = json.loads(entity['text'])
+        if not isinstance(value, dict):
+            return
+        with self._changed:
+            self._state = _parse_player_entity(value, version=self._state.version + 1)
+            self._changed.notify_all()
+# pylint: enable = too-many-instance-attributes
+
+
+def _clean_text(text: Any) -> str:
+    """Read text, or its 'html' or 'text' field, without any markup."""
+    if isinstance(text, dict):
+        text = text.get('html', text.get('text', ''))
+    return unescape(_HTML_TAG.sub('', str(text))).strip() if text else ''
+
+
+def _parse_player_entity(value: Dict[str, Any], version: int) -> EcastState:
+    """Translate the value of a player entity into an EcastState."""
+    # LOCAL VARIABLES
+    kind = str(value.get('kind', value.get('state', ''))).lower()  # What the player is doing
+    page_id = ECAST_KINDS.get(kind, JbgPageIds.UNKNOWN)  # kind, as a JbgPageIds
+    length_limit = value.get('maxLength')                # The answer's character limit
+
+    # PARSE IT
+    if page_id == JbgPageIds.UNKNOWN and kind:
+        Logger.debug('Unknown ecast player kind: %s', kind)
+
+    # DONE
+    return EcastState(version=version, page_id=page_id,
+                      prompt=_clean_text(value.get('prompt', value.get('question', ''))),
+                      length_limit=length_limit if isinstance(length_limit, int) else 45,
+                      choices=[_clean_text(choice) for choice in value.get('choices', [])],
+                      entity=value)
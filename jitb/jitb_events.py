@@ -0,0 +1,272 @@
+"""Writes a structured event log, one JSON event per line, on behalf of the package.
+
+The --events command line argument writes every page change, AI request, answer, and missed
+prompt to JSON Lines segments in the events directory (default: jitb_events in the temporary
+directory).  Each segment is rotated once it holds JITB_EVENTS_MAX_BYTES and then gzipped, in the
+background.  Only the newest JITB_EVENTS_KEEP gzipped segments in the events directory, across
+every run, are kept.
+
+The on-disk layout is stable across versions.  Each run (one process) writes numbered segments:
+
+    jitb_events_YYYYMMDD_HHMMSS-PID.000001.jsonl.gz  A closed, gzipped, segment
+    jitb_events_YYYYMMDD_HHMMSS-PID.000002.jsonl     The segment being written
+
+Every event has the same keys, in this order, followed by the fields of its type:
+
+    {"v": 1, "ts": 1710800505.123, "session": "ABCD/JITB", "page": "ANSWER", "type": "answer",
+     "game": "JbgQ3", "player": "JITB", "prompt": "...", "answer": "...", "seconds": 1.42}
+
+    v        JITB_EVENTS_VERSION.  Only incremented when an existing key changes meaning.
+    ts       When the event happened, in seconds since the epoch.
+    session  The room code and username (e.g., the jitb fleet session name).
+    page     The JbgPageIds name of the page the event happened on.
+    type     session_start, page, ai_request, answer, missed_prompt, or session_end.
+
+Latency fields are named seconds.  Read the events back, in order, with read_events().
+"""
+# Standard
+from datetime import datetime
+from typing import Any, Dict, Final, Iterator
+import glob
+import gzip
+import json
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+# Third Party
+from hobo.validation import validate_string
+# Local
+from jitb.jitb_globals import (JITB_EVENTS_DIRNAME, JITB_EVENTS_KEEP, JITB_EVENTS_MAX_BYTES,
+                               JITB_EVENTS_VERSION, JITB_LOG_FLUSH_INTERVAL)
+from jitb.jitb_logger import Logger
+from jitb.jitb_misc import determine_tmp_dir
+
+
+# Matches a segment's filename: the run, the segment number, and whether it's gzipped
+_SEGMENT_REGEX: Final[re.Pattern] = re.compile(r'^(jitb_events_\d{8}_\d{6}-\d+)\.(\d{6})'
+                                               r'\.jsonl(\.gz)?$')
+
+
+class EventLog():
+    """Structured event log class for the package.
+
+    The record() method does nothing until start() is called.
+    """
+
+    _enabled = False        # Event log status
+    _session = ''           # The session every event belongs to
+    _page = 'UNKNOWN'       # The page most recently reported
+    _directory = ''         # Absolute events directory
+    _run = ''               # This run's segment filename prefix
+    _events = None          # Events waiting for the writer thread
+    _writer = None          # Writes the events to the segments
+    _compressor = None      # Gzips the closed segments
+    _closed = None          # Closed segments waiting for the compressor thread
+
+    @staticmethod
+    def start(directory: str = None, session: str = '') -> str:
+        """Start writing events, until Logger.shutdown() runs.
+
+        Args:
+            directory: Optional; Where to write the segments.  Defaults to jitb_events in the
+                temporary directory.
+            session: Optional; The session every event belongs to (e.g., ABCD/JITB).
+
+        Returns:
+            The absolute events directory.
+
+        Raises:
+            RuntimeError: The event log was already started.
+            TypeError: Bad data type.
+            ValueError: Empty directory.
+            OSError: The directory couldn't be created.
+        """
+        # INPUT VALIDATION
+        if EventLog._enabled:
+            raise RuntimeError('The event log was already started')
+        if directory is None:
+            directory = os.path.join(determine_tmp_dir(), JITB_EVENTS_DIRNAME)
+        validate_string(directory, 'directory', can_be_empty=False)
+        validate_string(session, 'session', can_be_empty=True)
+
+        # START IT
+        EventLog._directory = os.path.abspath(directory)
+        os.makedirs(EventLog._directory, exist_ok=True)
+        EventLog._run = f'jitb_events_{datetime.now().strftime("%Y%m%d_%H%M%S")}-{os.getpid()}'
+        EventLog._session = session
+        EventLog._page = 'UNKNOWN'
+        EventLog._events = queue.SimpleQueue()
+        EventLog._closed = queue.SimpleQueue()
+        EventLog._writer = threading.Thread(target=_write_events, name='jitb_events_writer',
+                                            daemon=True)
+        EventLog._compressor = threading.Thread(target=_compress_segments,
+                                                name='jitb_events_compressor', daemon=True)
+        EventLog._writer.start()
+        EventLog._compressor.start()
+        EventLog._enabled = True
+        EventLog.record('session_start')
+        Logger.add_shutdown_hook(EventLog.stop)
+
+        # DONE
+        return EventLog._directory
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Is the event log enabled?"""
+        return EventLog._enabled
+
+    @staticmethod
+    def record(event_type: str, page: str = None, **fields: Any) -> None:
+        """Queue one event for the writer thread.
+
+        Args:
+            event_type: The type of event (e.g., answer).
+            page: Optional; The JbgPageIds name of the page the event happened on.  Becomes the
+                page of every event that follows.  Defaults to the page most recently reported.
+            fields: The event's fields.  They must be JSON serializable.
+        """
+        if EventLog._enabled:
+            if page is not None:
+                EventLog._page = page
+            EventLog._events.put({'v': JITB_EVENTS_VERSION, 'ts': round(time.time(), 3),
+                                  'session': EventLog._session, 'page': EventLog._page,
+                                  'type': event_type, **fields})
+
+    @staticmethod
+    def stop() -> None:
+        """Write every queued event, then close and gzip the last segment."""
+        if EventLog._enabled:
+            EventLog.record('session_end')
+            EventLog._enabled = False
+            EventLog._events.put(None)
+            EventLog._writer.join()
+            EventLog._compressor.join()
+
+
+def read_events(directory: str) -> Iterator[Dict[str, Any]]:
+    """Read the events of every run in directory, oldest segment first.
+
+    A segment whose last line was cut off (e.g., JITB was killed) is read up to that line.
+
+    Args:
+        directory: The events directory.
+
+    Raises:
+        TypeError: Bad data type.
+        ValueError: Empty directory.
+    """
+    # LOCAL VARIABLES
+    segments = {}  # Segment filenames, by (run, number)
+
+    # INPUT VALIDATION
+    validate_string(directory, 'directory', can_be_empty=False)
+
+    # READ THEM
+    for filename in os.listdir(directory):
+        match = _SEGMENT_REGEX.match(filename)
+        if match:
+            # If a segment is being gzipped, its plain text copy is still complete
+            key = (match.group(1), match.group(2))
+            if key not in segments or not match.group(3):
+                segments[key] = os.path.join(directory, filename)
+    for key in sorted(segments):
+        yield from _read_segment(segments[key])
+
+
+def _compress_segments() -> None:
+    """Gzip each closed segment, then delete all but the newest JITB_EVENTS_KEEP of them.
+
+    Retention covers the gzipped segments of every run in the events directory, so the directory
+    doesn't grow without bound across runs.
+    """
+    # LOCAL VARIABLES
+    filename = ''  # The closed segment
+    kept = []      # Every run's gzipped segments, oldest first
+
+    # COMPRESS THEM
+    while True:
+        filename = EventLog._closed.get()  # pylint: disable = protected-access
+        if filename is None:
+            break
+        try:
+            with open(filename, 'rb') as in_file, \
+                    gzip.open(filename + '.gz.tmp', 'wb') as out_file:
+                shutil.copyfileobj(in_file, out_file)
+            os.replace(filename + '.gz.tmp', filename + '.gz')
+            os.remove(filename)
+            # Runs are named by start time, so sorting by filename sorts oldest first
+            kept = sorted(old_filename for old_filename
+                          in glob.glob(os.path.join(os.path.dirname(filename), '*.jsonl.gz'))
+                          if _SEGMENT_REGEX.match(os.path.basename(old_filename)))
+            for old_filename in kept[:-JITB_EVENTS_KEEP]:
+                try:
+                    os.remove(old_filename)
+                except FileNotFoundError:
+                    pass  # Another run deleted it first
+        except OSError as err:
+            Logger.error(f'Failed to compress the event log segment {filename} with {repr(err)}')
+
+
+def _read_segment(filename: str) -> Iterator[Dict[str, Any]]:
+    """Read the events from one segment, gzipped or not, stopping at a cut off line."""
+    # LOCAL VARIABLES
+    opener = gzip.open if filename.endswith('.gz') else open  # Segment file opener
+
+    # READ IT
+    try:
+        with opener(filename, 'rt', encoding='utf-8') as in_file:
+            for line in in_file:
+                if not line.endswith('\n'):
+                    break  # Cut off mid-write
+                yield json.loads(line)
+    except EOFError:
+        pass  # The gzip trailer was never written
+
+
+def _write_events() -> None:
+    """Write queued events to the current segment, rotating it every JITB_EVENTS_MAX_BYTES."""
+    # LOCAL VARIABLES
+    number = 0       # The current segment's number
+    filename = ''    # The current segment's filename
+    out_file = None  # The current segment
+    event = None     # The next event
+    line = ''        # The event, serialized
+    written = 0      # Bytes written to the current segment
+
+    # WRITE THEM
+    # pylint: disable = protected-access
+    try:
+        while True:
+            try:
+                event = EventLog._events.get(timeout=JITB_LOG_FLUSH_INTERVAL)
+            except queue.Empty:
+                if out_file:
+                    out_file.flush()
+                continue
+            if event is None:
+                break
+            if out_file is None or written >= JITB_EVENTS_MAX_BYTES:
+                if out_file:
+                    out_file.close()
+                    EventLog._closed.put(filename)
+                number += 1
+                filename = os.path.join(EventLog._directory, f'{EventLog._run}.{number:06}.jsonl')
+                out_file = open(filename, 'w',  # pylint: disable = consider-using-with
+                                encoding='utf-8')
+                written = 0
+            # ASCII-only, so its length is its size in bytes
+            line = json.dumps(event, separators=(',', ':'), default=str) + '\n'
+            out_file.write(line)
+            written += len(line)
+    except OSError as err:
+        Logger.error(f'Failed to write the event log segment {filename} with {repr(err)}')
+        EventLog._enabled = False  # Stop queueing events that will never be written
+    finally:
+        if out_file:
+            out_file.close()
+            EventLog._closed.put(filename)
+        EventLog._closed.put(None)  # Nothing left to compress
+    # pylint: enable = protected-access
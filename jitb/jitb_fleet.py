@@ -0,0 +1,261 @@
+"""Run many JITB sessions, one room per worker process, sharing one OpenAI rate limit budget.
+
+Each session gets its own worker process, Chrome, and JitbAi.  Every worker's RateLimiter draws
+from the same SharedBudget so the fleet, as a whole, stays within the OpenAI rate limits.
+Crashed workers are restarted, up to max_restarts times each.
+
+Typical Usage:
+    jitb fleet -j ROOM,USERNAME -j ROOM,USERNAME,Quiplash 3
+"""
+# Standard
+from dataclasses import dataclass
+from queue import Empty
+from typing import Any, Dict, Final, List, Tuple
+import multiprocessing
+import os
+import sys
+import time
+# Third Party
+from hobo.validation import validate_list, validate_string, validate_type
+# Local
+from jitb.jitb_argvals import ArgVals
+from jitb.jitb_cache import JitbCache
+from jitb.jitb_events import EventLog
+from jitb.jitb_globals import JITB_FLEET_MAX_RESTARTS, JITB_FLEET_POLL_RATE
+from jitb.jitb_logger import Logger
+from jitb.jitb_metrics import Metrics
+from jitb.jitb_openai import JitbAi
+from jitb.jitb_ratelimit import RateLimiter, SharedBudget, create_shared_budget
+from jitb.jitb_tracer import Tracer
+from jitb.jitb_website import JITB_SUPPORTED_GAMES, play_the_game, play_the_game_ecast
+
+
+_DONE: Final[Tuple[str, str]] = ('finished', 'failed')  # Final session statuses
+
+
+@dataclass
+class FleetJob:
+    """One JITB session: a room to join, the username to join it with, and the expected game."""
+    room_code: str
+    username: str
+    game: str = None  # Optional; Fail the session if the room is playing a different game
+
+    def get_name(self) -> str:
+        """Name the session for status reports."""
+        return f'{self.room_code}/{self.username}'
+
+
+def parse_fleet_job(job: str) -> FleetJob:
+    """Parse a 'ROOM,USERNAME[,GAME]' command line argument into a FleetJob.
+
+    Raises:
+        TypeError: Bad data type.
+        ValueError: Invalid value.
+    """
+    # LOCAL VARIABLES
+    fields = []  # Comma-separated fields
+
+    # INPUT VALIDATION
+    validate_string(job, 'job', can_be_empty=False)
+
+    # PARSE IT
+    fields = [field.strip() for field in job.split(',', 2)]
+    if len(fields) < 2 or not all(fields):
+        raise ValueError(f'Expected ROOM,USERNAME[,GAME] instead of {job}')
+    if len(fields) == 3 and fields[2] not in JITB_SUPPORTED_GAMES:
+        raise ValueError(f'{fields[2]} is not one of the supported games: '
+                         f'{", ".join(JITB_SUPPORTED_GAMES)}')
+
+    # DONE
+    return FleetJob(*fields)
+
+
+class JitbFleet:
+    """Play many jobs at once, each in its own worker process, sharing one rate limit budget.
+
+    Typical Usage:
+        statuses = JitbFleet(jobs=[FleetJob('ABCD', 'JITB')], arg_vals=arg_vals).run()
+    """
+
+    # Methods are listed in expected 'call order'.
+    def __init__(self, jobs: List[FleetJob], arg_vals: ArgVals,
+                 max_restarts: int = JITB_FLEET_MAX_RESTARTS) -> None:
+        """JitbFleet ctor.
+
+        Args:
+            jobs: The sessions to run.
+            arg_vals: The command line arguments to run each session with (e.g., headless).
+            max_restarts: Optional; Number of times to restart each crashed worker.
+
+        Raises:
+            TypeError: Bad data type.
+            ValueError: Invalid value.
+        """
+        # INPUT VALIDATION
+        validate_list(jobs, 'jobs', can_be_empty=False)
+        for job in jobs:
+            validate_type(job, 'jobs entry', FleetJob)
+        if len({job.get_name() for job in jobs}) != len(jobs):
+            raise ValueError('Each job must have a unique room code and username')
+        validate_type(arg_vals, 'arg_vals', ArgVals)
+        validate_type(max_restarts, 'max_restarts', int)
+        if max_restarts < 0:
+            raise ValueError(f'The max_restarts must be zero or more instead of {max_restarts}')
+
+        # SETUP
+        self._jobs = jobs                  # The sessions to run
+        self._arg_vals = arg_vals          # Command line arguments for each session
+        self._max_restarts = max_restarts  # Restarts allowed per crashed session
+        # Each worker gets a clean interpreter
+        self._context = multiprocessing.get_context('spawn')
+        # One rate limit budget for the whole fleet
+        self._budget = create_shared_budget(context=self._context)
+        self._status_queue = self._context.Queue()  # Worker status reports
+        self._sessions = {}                         # Session state, by session name
+
+    def run(self) -> Dict[str, str]:
+        """Play every job until every worker has exited for good.
+
+        Returns:
+            The final status of each session, by session name (see: FleetJob.get_name()):
+            'finished' or 'failed'.
+        """
+        # RUN IT
+        try:
+            for job in self._jobs:
+                self._sessions[job.get_name()] = {'job': job, 'restarts': 0, 'status': None,
+                                                  'process': self._start_session(job)}
+            while any(session['status'] not in _DONE for session in self._sessions.values()):
+                self._read_status()
+                for name in self._sessions:
+                    self._check_session(name)
+                time.sleep(JITB_FLEET_POLL_RATE)
+        finally:
+            for session in self._sessions.values():
+                if session['process'].is_alive():
+                    session['process'].terminate()
+                session['process'].join()
+
+        # DONE
+        return self.get_statuses()
+
+    def get_statuses(self) -> Dict[str, str]:
+        """Report the current status of each session, by session name."""
+        return {name: session['status'] for name, session in self._sessions.items()}
+
+    # Private methods in alphabetical order.
+    def _check_session(self, name: str) -> None:
+        """Finish, restart, or fail a session whose worker has exited."""
+        # LOCAL VARIABLES
+        session = self._sessions[name]  # Session state
+
+        # CHECK IT
+        if session['status'] in _DONE or session['process'].exitcode is None:
+            return  # Already handled, or still running
+        if session['process'].exitcode == 0:
+            self._set_status(name, 'finished')
+        elif session['restarts'] < self._max_restarts:
+            session['restarts'] += 1
+            self._set_status(name, f'restarting ({session["restarts"]}/{self._max_restarts})')
+            session['process'] = self._start_session(session['job'])
+        else:
+            self._set_status(name, 'failed')
+
+    def _read_status(self) -> None:
+        """Report every status update the workers have queued."""
+        while True:
+            try:
+                self._set_status(*self._status_queue.get_nowait())
+            except Empty:
+                break
+
+    def _set_status(self, name: str, status: str) -> None:
+        """Update, and report, a session's status."""
+        self._sessions[name]['status'] = status
+        Logger.info(f'Fleet session {name} is {status}')
+
+    def _start_session(self, job: FleetJob) -> multiprocessing.Process:
+        """Start a worker process to play job."""
+        # LOCAL VARIABLES
+        # Worker process
+        process = self._context.Process(target=_run_session,
+                                        args=(job, self._arg_vals, self._budget,
+                                              self._status_queue, self._jobs.index(job)),
+                                        name=f'jitb_fleet_{job.get_name()}')
+
+        # START IT
+        process.start()
+
+        # DONE
+        return process
+
+
+def _enable_metrics(job: FleetJob, arg_vals: ArgVals, index: int) -> None:
+    """Export a worker's metrics, labeled with its session name, if they were requested.
+
+    Each worker serves its metrics on --metrics-port plus index and writes them to the
+    --metrics-file with the session name appended (e.g., jitb.prom becomes jitb_ABCD_JITB.prom).
+    """
+    # LOCAL VARIABLES
+    port = None      # This worker's --metrics-port
+    filename = None  # This worker's --metrics-file
+    root = ''        # --metrics-file without its extension
+    ext = ''         # --metrics-file extension
+
+    # ENABLE IT
+    if arg_vals.metrics_port is not None:
+        port = arg_vals.metrics_port + index
+    if arg_vals.metrics_file:
+        root, ext = os.path.splitext(arg_vals.metrics_file)
+        filename = f'{root}_{job.get_name().replace("/", "_")}{ext}'
+    if port is not None or filename:
+        Metrics.enable(port=port, filename=filename, labels={'session': job.get_name()})
+
+
+# pylint: disable = broad-except
+def _run_session(job: FleetJob, arg_vals: ArgVals, budget: SharedBudget,
+                 status_queue: Any, index: int = 0) -> None:
+    """Play one job on behalf of a worker process.  Exits 1 if the session crashed.
+
+    The index is job's position in the fleet (see: _enable_metrics()).
+    """
+    # LOCAL VARIABLES
+    client = None    # JitbAi object
+    cache = None     # JitbCache object
+    crashed = False  # The session ended with an exception
+
+    # PLAY IT
+    Logger.initialize(debugging=arg_vals.debug)
+    if arg_vals.trace:
+        Tracer.enable()
+    try:
+        _enable_metrics(job=job, arg_vals=arg_vals, index=index)
+        if arg_vals.events:
+            EventLog.start(directory=arg_vals.events, session=job.get_name())
+        if arg_vals.cache:
+            cache = JitbCache(read_only=arg_vals.cache_read_only)
+        client = JitbAi(temperature=1.0, stream=arg_vals.stream, cache=cache,
+                        rate_limiter=RateLimiter(budget=budget))
+        client.setup()
+        status_queue.put((job.get_name(), 'playing'))
+        if arg_vals.ecast:
+            play_the_game_ecast(room_code=job.room_code, username=job.username, ai_obj=client,
+                                pipeline=arg_vals.pipeline, game=job.game)
+        else:
+            play_the_game(room_code=job.room_code, username=job.username, ai_obj=client,
+                          observe=arg_vals.observe, pipeline=arg_vals.pipeline,
+                          headless=arg_vals.headless, game=job.game)
+    except Exception as err:
+        crashed = True
+        status_queue.put((job.get_name(), f'crashed with {repr(err)}'))
+    finally:
+        if cache:
+            cache.close()
+        if client:
+            client.tear_down()
+        Logger.shutdown()
+
+    # DONE
+    if crashed:
+        sys.exit(1)
+# pylint: enable = broad-except
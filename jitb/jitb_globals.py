@@ -1,6 +1,6 @@
 """Defines global constants for the package."""
 # Standard
-from typing import Final, List
+from typing import Final, List, Tuple
 # Third Party
 # Local
 
@@ -10,10 +10,91 @@ DEFAULT_SYSTEM_CONTENT: Final[str] = 'You are a funny person trying to win Jackb
 # Argument parser supported "commands"
 JITB_ARG_CMDS_AUTO: Final[List[str]] = ['automatic', 'auto']              # Auto commands
 JITB_ARG_CMDS_MAN: Final[List[str]] = ['manual', 'man']                   # Man commands
-JITB_ARG_CMDS: Final[List[str]] = JITB_ARG_CMDS_AUTO + JITB_ARG_CMDS_MAN  # All commands
+JITB_ARG_CMDS_FLEET: Final[List[str]] = ['fleet']                         # Fleet commands
+JITB_ARG_CMDS_BENCH: Final[List[str]] = ['bench', 'benchmark']            # Bench commands
+# All commands
+JITB_ARG_CMDS: Final[List[str]] = JITB_ARG_CMDS_AUTO + JITB_ARG_CMDS_MAN + JITB_ARG_CMDS_FLEET \
+    + JITB_ARG_CMDS_BENCH
 
 JITB_POLL_RATE: Final[float] = 0.5   # Rate, in seconds, JITB will parse page content
 JITB_FITB_STR: Final[str] = '_____'  # Default string to use as a fill-in-the-blank placeholder
+# Maximum time, in seconds, --observe will wait for a page change before parsing the page anyway
+JITB_OBSERVE_TIMEOUT: Final[float] = 5.0
+JITB_PREFETCH_WORKERS: Final[int] = 2  # Maximum number of concurrent --pipeline AI requests
+JITB_PREFETCH_MAX: Final[int] = 4      # Maximum number of unclaimed --pipeline answers to keep
+
+# OpenAI rate limiting constants (the x-ratelimit-* response headers take precedence)
+JITB_RATE_LIMIT_RPM: Final[int] = 500       # Default OpenAI requests per minute
+JITB_RATE_LIMIT_TPM: Final[int] = 200000    # Default OpenAI tokens per minute
+JITB_REQUEST_DEADLINE: Final[float] = 20.0  # Seconds an OpenAI request may take, retries included
+JITB_BACKOFF_BASE: Final[float] = 0.5       # Seconds to back off after the first failure
+JITB_BACKOFF_MAX: Final[float] = 8.0        # Maximum seconds to back off between retries
+# Answers to give when OpenAI does not answer in time
+JITB_FALLBACK_ANSWERS: Final[List[str]] = ['42', 'the meaning of life', 'nothing', 'bubble gum',
+                                           'no one remembers', 'banana flavoring']
+
+# --cache constants
+JITB_CACHE_FILENAME: Final[str] = 'jitb_cache.sqlite3'  # Stored in the temp directory
+JITB_CACHE_CANDIDATES: Final[int] = 3                   # Answers to rotate through per prompt
+JITB_CACHE_MAX_ENTRIES: Final[int] = 10000              # Maximum number of cached answers
+JITB_CACHE_TTL: Final[int] = 30 * 24 * 60 * 60          # Seconds a cached answer remains valid
+
+# jitb fleet constants
+JITB_FLEET_MAX_RESTARTS: Final[int] = 3   # Number of times to restart each crashed session
+JITB_FLEET_POLL_RATE: Final[float] = 1.0  # Rate, in seconds, the fleet checks on its sessions
+
+# jitb bench constants
+JITB_BENCH_SUITES: Final[List[str]] = ['id_page', 'play_tick', 'strings', 'jitb_ai']  # In order
+JITB_BENCH_REPEAT: Final[int] = 5            # Number of samples to take of each measurement
+JITB_BENCH_THRESHOLD: Final[float] = 10.0    # Percent worse than the baseline that's a regression
+JITB_BENCH_CORPUS_SIZE: Final[int] = 10000   # Number of prompts and answers in the strings corpus
+
+# --trace constants
+# Upper bounds, in seconds, of the span duration histogram buckets (the last one is unbounded)
+JITB_TRACE_BUCKETS: Final[Tuple[float, ...]] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                                                0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+                                                float('inf'))
+JITB_TRACE_MAX_SPANS: Final[int] = 100000  # Maximum number of raw spans to keep for the JSON dump
+
+# --metrics-port and --metrics-file constants
+JITB_METRICS_HOST: Final[str] = '127.0.0.1'  # Interface --metrics-port listens on
+JITB_METRICS_INTERVAL: Final[float] = 15.0   # Seconds between --metrics-file rewrites
+# Upper bounds, in seconds, of the latency histogram buckets (the last one is unbounded)
+JITB_METRICS_BUCKETS: Final[Tuple[float, ...]] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0,
+                                                  float('inf'))
+
+# Logger constants
+JITB_LOG_FLUSH_BYTES: Final[int] = 64 * 1024  # Debug log bytes buffered before they're flushed
+JITB_LOG_FLUSH_INTERVAL: Final[float] = 1.0   # Maximum seconds a debug log message is buffered
+
+# --events constants
+JITB_EVENTS_DIRNAME: Final[str] = 'jitb_events'        # Default events dir, in the temp dir
+JITB_EVENTS_VERSION: Final[int] = 1                   # The "v" of every event.  See: jitb_events
+JITB_EVENTS_MAX_BYTES: Final[int] = 16 * 1024 * 1024  # Segment size that triggers a rotation
+JITB_EVENTS_KEEP: Final[int] = 32                     # Gzipped segments kept, all runs
+
+# Browserless (ecast protocol) constants
+JITB_ECAST_HOST: Final[str] = 'ecast.jackboxgames.com'  # The ecast rooms API host
+JITB_ECAST_TIMEOUT: Final[float] = 10.0                 # Seconds to wait to join a room
+
+# --headless constants
+# Lean Chrome command line switches: no GPU, no extensions, fewer renderer processes
+JITB_HEADLESS_ARGS: Final[List[str]] = ['--headless=new', '--disable-gpu', '--disable-extensions',
+                                        '--renderer-process-limit=1', '--disable-dev-shm-usage',
+                                        '--disable-background-networking', '--mute-audio',
+                                        '--no-first-run', '--blink-settings=imagesEnabled=false',
+                                        '--force-prefers-reduced-motion', '--window-size=800,600']
+# URL patterns blocked with CDP Network.setBlockedURLs: images, fonts, and media
+JITB_HEADLESS_BLOCKED_URLS: Final[List[str]] = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp',
+                                                '*.svg', '*.ico', '*.woff', '*.woff2', '*.ttf',
+                                                '*.otf', '*.mp3', '*.mp4', '*.ogg', '*.wav',
+                                                '*.webm']
+
+# Multiple bots in one Chrome constants
+# Keep background tabs running at full speed: only one bot's tab can be in the foreground
+JITB_MULTI_BOT_ARGS: Final[List[str]] = ['--disable-background-timer-throttling',
+                                         '--disable-backgrounding-occluded-windows',
+                                         '--disable-renderer-backgrounding']
 
 # List of Character accessible names for the Jackbox Games Quiplash 3 avatars
 # buttons = test.find_elements(By.XPATH, '//button')
@@ -3,19 +3,34 @@
 Using the --debug command line argument will duplicate any log output, and add debug messages,
 to jitb_YYYYMMDD_HHMMSS.log in the temporary directory.
 
+Logging never blocks on I/O.  Messages are queued for a listener thread which prints them, routes
+them by level, and writes them to the debug log through one buffered stream.  The debug log is
+flushed every JITB_LOG_FLUSH_BYTES, at least every JITB_LOG_FLUSH_INTERVAL seconds, after every
+error, and by Logger.shutdown().
+
 clear; tail -f `ls /tmp/jitb_* | tail -n 1`
 """
 # Standard
 from datetime import datetime
 from enum import IntEnum
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Final, List, Union
+import atexit
 import logging
 import os
+import queue
 import sys
+import time
 # Third Party
 # Local
+from jitb.jitb_globals import JITB_LOG_FLUSH_BYTES, JITB_LOG_FLUSH_INTERVAL
 from jitb.jitb_misc import determine_tmp_dir
 
 
+CONSOLE_ATTR: Final[str] = 'jitb_console'  # LogRecord attribute marking messages to print
+Message = Union[str, Callable[[], str]]    # A message, or a callable that builds it when logged
+
+
 # pylint: disable=too-few-public-methods, no-self-argument
 class LogLevel(IntEnum):
     """Defines logging levels."""
@@ -49,11 +64,85 @@ class JitbHandler(logging.Filter):
         return record.levelno in (LogLevel.JITB,)
 
 
+class LogFileHandler(logging.Filter):
+    """Filters what can be written to the debug log: INFO, JITB DEBUG, and ERROR messages."""
+    def filter(self, record):
+        return record.levelno in (logging.INFO, LogLevel.JITB, logging.ERROR)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """Writes the debug log through one buffered stream, flushing it by size, time, or error.
+
+    Only the listener thread writes to it so disk latency never stalls the caller.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """Class ctor."""
+        self._unflushed = 0                  # Bytes written since the last flush
+        self._flushed_at = time.monotonic()  # When the stream was last flushed
+        super().__init__(filename)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record, flushing if it's an error or the buffer is too big, or too old."""
+        # LOCAL VARIABLES
+        message = ''  # The formatted record
+
+        # WRITE IT
+        try:
+            message = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(message)
+            self._unflushed += len(message)
+            if record.levelno >= logging.ERROR or self._unflushed >= JITB_LOG_FLUSH_BYTES \
+                    or time.monotonic() - self._flushed_at >= JITB_LOG_FLUSH_INTERVAL:
+                self.flush()
+        except Exception:  # pylint: disable = broad-except
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush the stream, if anything was written since the last flush."""
+        if self._unflushed:
+            super().flush()
+        self._unflushed = 0
+        self._flushed_at = time.monotonic()
+
+    def _open(self):
+        """Open the debug log with a buffer big enough to hold JITB_LOG_FLUSH_BYTES."""
+        return open(self.baseFilename, self.mode, buffering=JITB_LOG_FLUSH_BYTES,
+                    encoding=self.encoding, errors=self.errors)
+
+
+class ConsoleHandler(logging.Handler):
+    """Prints Logger.info() messages to stdout, and Logger.error() messages to stderr."""
+    def emit(self, record):
+        if getattr(record, CONSOLE_ATTR, False):
+            print(record.getMessage(), file=sys.stderr if record.levelno >= logging.ERROR
+                  else sys.stdout, flush=True)
+
+
+class FlushingQueueListener(QueueListener):
+    """Flushes its handlers whenever JITB_LOG_FLUSH_INTERVAL seconds pass without a message."""
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, timeout=JITB_LOG_FLUSH_INTERVAL if block else None)
+            except queue.Empty:
+                if not block:
+                    raise
+                for handler in self.handlers:
+                    handler.flush()
+
+
 class Logger():
     """Logging class for the package."""
 
-    _initialized = False  # Logging subsystem status
-    _filename = ''        # Absolute debug log filename
+    _initialized = False      # Logging subsystem status
+    _filename = ''            # Absolute debug log filename
+    _shutdown_hooks = []      # Called, once, by the next shutdown()
+    _listener = None          # Handles the queued messages in its own thread
+    _root_handlers = []       # Handlers this class added to the root logger
+    _level = logging.WARNING  # The lowest level logged (logging's default until initialize())
 
     def __del__(self) -> None:
         """Class dtor."""
@@ -70,9 +159,8 @@ class Logger():
         Function is optional as the logging class auto-initializes if called without initialization
         """
         # LOCAL VARIABLES
-        debug = None                       # JITB Debug stream handler
-        error = None                       # Error stream handler
-        normal = None                      # Info stream handler
+        handlers = [ConsoleHandler()]      # Handlers the listener routes messages to
+        log_file = None                    # Debug log handler
         root_logger = logging.getLogger()  # Root logger
         # Message formatter
         formatter = logging.Formatter(fmt='[%(asctime)s.%(msecs)03d] %(levelname)-9s - %(message)s',
@@ -80,45 +168,64 @@ class Logger():
 
         # SETUP
         logging.addLevelName(LogLevel.JITB, 'DEBUGGING')
+        Logger._stop_listener()
         Logger._filename = _create_filename()
 
         if debugging:
-            normal = logging.FileHandler(Logger._filename)
-            normal.addFilter(InfoHandler())
-            normal.setFormatter(formatter)
-            normal.setLevel(logging.INFO)
-
             # Separate and distinct from Logger.DEBUG because good, bad, or indifferent...
             # Selenium uses DEBUG for very verbose logging
-            debug = logging.FileHandler(Logger._filename)
-            debug.addFilter(JitbHandler())
-            debug.setFormatter(formatter)
-            debug.setLevel(LogLevel.JITB)
-
-            error = logging.FileHandler(Logger._filename)
-            error.addFilter(ErrorHandler())
-            error.setFormatter(formatter)
-            error.setLevel(logging.ERROR)
-
-            root_logger.addHandler(normal)
-            root_logger.addHandler(debug)
-            root_logger.addHandler(error)
+            log_file = BufferedFileHandler(Logger._filename)
+            log_file.addFilter(LogFileHandler())
+            log_file.setFormatter(formatter)
+            log_file.setLevel(LogLevel.JITB)
+            handlers.append(log_file)
             root_logger.setLevel(LogLevel.JITB)
         else:
             root_logger.setLevel(logging.INFO)
+        Logger._level = root_logger.level
+        Logger._listener = FlushingQueueListener(queue.SimpleQueue(), *handlers,
+                                                 respect_handler_level=True)
+        Logger._set_root_handlers([QueueHandler(Logger._listener.queue)])
+        Logger._listener.start()
+        atexit.unregister(Logger._stop_listener)
+        atexit.register(Logger._stop_listener)  # Before logging's own atexit shutdown
 
         # DONE
         Logger._initialized = True
 
-    def debug(message: str, logger: str = __name__) -> None:
-        """Log debug level messages.
+    @staticmethod
+    def add_shutdown_hook(hook: Callable[[], None]) -> None:
+        """Call hook, once, the next time shutdown() runs (e.g., to log a final report).
 
         Args:
-            message: Message to log
+            hook: Called with no arguments, before logging shuts down, so it may still log.
+        """
+        Logger._shutdown_hooks.append(hook)
+
+    def debug(message: Message, *args: Any, logger: str = __name__) -> None:
+        """Log debug level messages.  Nothing is built unless JITB debug messages are enabled.
+
+        Typical Usage:
+            Logger.debug('Answered "%s" with "%s"', prompt, answer)
+            Logger.debug(lambda: f'Read {button.accessible_name}')  # Too costly to build eagerly
+
+        Args:
+            message: Message to log, a %-style format string for args, or a callable that
+                returns the message.
+            args: Optional; Arguments merged into message, with the % operator, when it's logged.
             logger: Logger name if needed.
         """
         Logger._check_logger()
-        Logger.log(level=LogLevel.JITB, message=message, logger=logger)
+        Logger.log(LogLevel.JITB, message, *args, logger=logger)
+
+    @staticmethod
+    def enabled(level: LogLevel = LogLevel.JITB) -> bool:
+        """Will messages of this level be logged?  Check it before building a costly message.
+
+        Args:
+            level: Optional; Priority level of the message.
+        """
+        return level >= Logger._level
 
     def error(message: str, logger: str = __name__) -> None:
         """Log error level messages.
@@ -127,9 +234,13 @@ class Logger():
             message: Message to log
             logger: Logger name if needed.
         """
-        print(message, file=sys.stderr)
         Logger._check_logger()
-        logging.getLogger(logger).error(message)
+        logging.getLogger(logger).error(message, extra={CONSOLE_ATTR: True})
+
+    @staticmethod
+    def get_filename() -> str:
+        """The absolute debug log filename (whether or not debug messages are being logged)."""
+        return Logger._filename
 
     def info(message: str, logger: str = __name__) -> None:
         """Log info level messages.
@@ -138,23 +249,36 @@ class Logger():
             message: Message to log
             logger: Logger name if needed.
         """
-        print(message, file=sys.stdout)
         Logger._check_logger()
-        logging.getLogger(logger).info(message)
+        logging.getLogger(logger).info(message, extra={CONSOLE_ATTR: True})
 
-    def log(level: LogLevel, message: str = '', logger: str = __name__) -> None:
-        """Log on behalf of the project.
+    # pylint: disable = keyword-arg-before-vararg
+    def log(level: LogLevel, message: Message = '', *args: Any, logger: str = __name__) -> None:
+        """Log on behalf of the project.  Nothing is built unless level is enabled.
 
         Args:
             level: Priority level of message
-            message: Message to log
+            message: Message to log, a %-style format string for args, or a callable that
+                returns the message.
+            args: Optional; Arguments merged into message, with the % operator, when it's logged.
             logger: Logger name if needed.
         """
-        logging.getLogger(logger).log(level, message)
+        if level >= Logger._level:
+            if callable(message):
+                message = message()
+            logging.getLogger(logger).log(level, message, *args)
+    # pylint: enable = keyword-arg-before-vararg
 
     @staticmethod
     def shutdown() -> None:
-        """Call logging.shutdown()."""
+        """Call the shutdown hooks, write every queued message, then logging.shutdown().
+
+        Messages logged afterwards are printed, but not written to the debug log, until the next
+        initialize().
+        """
+        while Logger._shutdown_hooks:
+            Logger._shutdown_hooks.pop(0)()
+        Logger._stop_listener()
         logging.shutdown()
 
     # pylint: disable=no-method-argument
@@ -163,6 +287,29 @@ class Logger():
         if Logger._initialized is False:
             raise RuntimeError('Call Logger.initialize() first!')
 
+    @staticmethod
+    def _set_root_handlers(handlers: List[logging.Handler]) -> None:
+        """Replace the handlers this class added to the root logger with handlers."""
+        # LOCAL VARIABLES
+        root_logger = logging.getLogger()  # Root logger
+
+        # REPLACE THEM
+        for handler in Logger._root_handlers:
+            root_logger.removeHandler(handler)
+        for handler in handlers:
+            root_logger.addHandler(handler)
+        Logger._root_handlers = handlers
+
+    @staticmethod
+    def _stop_listener() -> None:
+        """Handle every queued message, close the debug log, and print later messages directly."""
+        if Logger._listener:
+            Logger._set_root_handlers([ConsoleHandler()])
+            Logger._listener.stop()
+            for handler in Logger._listener.handlers:
+                handler.close()
+            Logger._listener = None
+
 
 def _create_filename() -> str:
     """Determine filename to use for logging."""
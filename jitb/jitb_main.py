@@ -1,15 +1,26 @@
 """Defines the entry-point function for this package."""
 # Standard
+from datetime import datetime
+import os
 import sys
 # Third Party
 # Local
 from jitb.jitb_args import parse_args
+from jitb.jitb_cache import JitbCache
+from jitb.jitb_events import EventLog
+from jitb.jitb_fleet import JitbFleet
+from jitb.jitb_argvals import ArgVals
+from jitb.jitb_globals import JITB_ARG_CMDS_BENCH, JITB_ARG_CMDS_FLEET
 from jitb.jitb_logger import Logger
+from jitb.jitb_metrics import Metrics
+from jitb.jitb_misc import determine_tmp_dir
 from jitb.jitb_openai import JitbAi
-from jitb.jitb_website import play_the_game
+from jitb.jitb_recorder import Recorder
+from jitb.jitb_tracer import Tracer
+from jitb.jitb_website import play_the_game, play_the_game_ecast
 
 
-# pylint: disable = broad-except
+# pylint: disable = broad-except, too-many-branches
 def main() -> int:
     """Entry point function.
 
@@ -19,29 +30,104 @@ def main() -> int:
     # LOCAL VARIABLES
     exit_code = 0    # 0 for success, 1 for failure.
     client = None    # JitbAi object
+    cache = None     # JitbCache object
     arg_vals = None  # ArgVals object
+    statuses = None  # Final jitb fleet session statuses
 
     # DO IT
     arg_vals = parse_args()
     try:
         Logger.initialize(debugging=arg_vals.debug)
-        client = JitbAi(temperature=1.0)
-        client.setup()
-        play_the_game(room_code=arg_vals.room_code, username=arg_vals.username, ai_obj=client)
+        if arg_vals.trace:
+            Tracer.enable()
+        if arg_vals.command in JITB_ARG_CMDS_FLEET:
+            statuses = JitbFleet(jobs=arg_vals.jobs, arg_vals=arg_vals,
+                                 max_restarts=arg_vals.max_restarts).run()
+            if 'failed' in statuses.values():
+                exit_code = 1
+        elif arg_vals.command in JITB_ARG_CMDS_BENCH:
+            exit_code = _run_benchmarks(arg_vals)
+        else:
+            if arg_vals.metrics_port is not None or arg_vals.metrics_file:
+                Metrics.enable(port=arg_vals.metrics_port, filename=arg_vals.metrics_file)
+            if arg_vals.events:
+                Logger.info('Writing the event log to '
+                            + EventLog.start(directory=arg_vals.events,
+                                             session=f'{arg_vals.room_code}/{arg_vals.username}'))
+            if arg_vals.cache:
+                cache = JitbCache(read_only=arg_vals.cache_read_only)
+            client = JitbAi(temperature=1.0, stream=arg_vals.stream, cache=cache)
+            client.setup()
+            if arg_vals.record:
+                Logger.info(f'Recording this session to {Recorder.start()}')
+            if arg_vals.ecast:
+                play_the_game_ecast(room_code=arg_vals.room_code, username=arg_vals.username,
+                                    ai_obj=client, pipeline=arg_vals.pipeline)
+            else:
+                play_the_game(room_code=arg_vals.room_code, username=arg_vals.username,
+                              ai_obj=client, observe=arg_vals.observe,
+                              pipeline=arg_vals.pipeline, headless=arg_vals.headless,
+                              extra_usernames=arg_vals.extra_usernames)
     except Exception as err:
         _print_exception(err)
         exit_code = 1
     finally:
+        if cache:
+            cache.close()
+        Recorder.stop()
         Logger.shutdown()
         if arg_vals.debug:
             input('[DEBUG] Game is over.  If there is an Exception, consider saving the log and '
-                  'webpage for testing.  Press [Enter] to exit.')
+                  + (f'the session recorded to {Recorder.get_filename()}'
+                     if Recorder.get_filename() else 'webpage (or --record the session)')
+                  + ' for testing.  Press [Enter] to exit.')
         if client:
             client.tear_down()
 
     # DONE
     return exit_code
-# pylint: enable = broad-except
+# pylint: enable = broad-except, too-many-branches
+
+
+def _run_benchmarks(arg_vals: ArgVals) -> int:
+    """Run jitb bench, save the results, and compare them to a baseline.
+
+    Returns:
+        0 on success, 1 if anything regressed.
+
+    Raises:
+        RuntimeError: The benchmarks aren't available (e.g., JITB was installed as a wheel).
+    """
+    # LOCAL VARIABLES
+    results = None     # Benchmark results
+    regressions = []   # Measurements which regressed from the baseline
+    # Where to save the results
+    output = arg_vals.bench_output if arg_vals.bench_output else os.path.join(
+        determine_tmp_dir(), datetime.now().strftime('jitb_bench_%Y%m%d_%H%M%S.json'))
+
+    # RUN THEM
+    try:
+        # pylint: disable = import-outside-toplevel
+        from bench.bench_main import compare_results, load_results, run_benchmarks, write_results
+        # pylint: enable = import-outside-toplevel
+    except ImportError as err:
+        raise RuntimeError('jitb bench must be run from a JITB source checkout') from err
+    results = run_benchmarks(suites=arg_vals.bench_suites, repeat=arg_vals.bench_repeat)
+    for name, result in results['results'].items():
+        print(f'{name}: {result["median"]:.6g} {result["unit"]}')
+    write_results(results, output)
+    print(f'Saved the results to {output}')
+
+    # COMPARE THEM
+    if arg_vals.bench_baseline:
+        regressions = compare_results(load_results(arg_vals.bench_baseline), results,
+                                      threshold=arg_vals.bench_threshold)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        print(f'{len(regressions)} regression(s) from {arg_vals.bench_baseline}')
+
+    # DONE
+    return 1 if regressions else 0
 
 
 def _print_exception(error: Exception) -> None:
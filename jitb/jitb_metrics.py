@@ -0,0 +1,343 @@
+"""Live counters and histograms, in the Prometheus text format, on behalf of the package.
+
+The --metrics-port command line argument serves the metrics at http://127.0.0.1:PORT/metrics.
+The --metrics-file command line argument rewrites a textfile (e.g., for the node_exporter
+textfile collector) every JITB_METRICS_INTERVAL seconds, and once more on exit.  Either way,
+nothing is counted until Metrics.enable() is called, and every metric is declared in METRICS:
+
+    jitb_ai_requests_total{outcome}         JitbAi requests: ok, timeout, or error
+    jitb_ai_request_seconds                 JitbAi request latency
+    jitb_ai_tokens_total{type}              Tokens OpenAI reported using: prompt or completion
+    jitb_ai_cache_lookups_total{result}     JitbCache lookups: hit or miss
+    jitb_ai_rate_limited_total              OpenAI 429 Too Many Requests responses
+    jitb_webdriver_commands_total{command}  WebDriver commands sent to Chrome
+    jitb_page_transitions_total{game,page}  Page changes the games saw, by the new page
+    jitb_missed_prompts_total{game}         "Did not answer the prompt" RuntimeErrors
+    jitb_answer_seconds{game}               How long each game waited for an AI answer
+
+Streamed completions report their token usage in a final chunk, so --stream sessions count
+tokens too.  Only streams cut off early by a stop_check go uncounted.
+"""
+# Standard
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Final, Tuple
+import math
+import os
+import threading
+# Third Party
+from hobo.validation import validate_string, validate_type
+# Local
+from jitb.jitb_globals import JITB_METRICS_BUCKETS, JITB_METRICS_HOST, JITB_METRICS_INTERVAL
+from jitb.jitb_logger import Logger
+
+
+# Every metric's type, label names, and help text, in the order they're rendered
+METRICS: Final[Dict[str, Tuple[str, Tuple[str, ...], str]]] = {
+    'jitb_ai_requests_total': ('counter', ('outcome',),
+                               'OpenAI requests made by JitbAi, by outcome (ok, timeout, error)'),
+    'jitb_ai_request_seconds': ('histogram', (), 'Seconds each successful OpenAI request took'),
+    'jitb_ai_tokens_total': ('counter', ('type',),
+                             'OpenAI tokens used, by type (prompt, completion), as reported by '
+                             'completions (streams cut off by a stop_check go uncounted)'),
+    'jitb_ai_cache_lookups_total': ('counter', ('result',),
+                                    'JitbCache lookups, by result (hit, miss)'),
+    'jitb_ai_rate_limited_total': ('counter', (), 'OpenAI 429 Too Many Requests responses'),
+    'jitb_webdriver_commands_total': ('counter', ('command',),
+                                      'WebDriver commands sent to Chrome, by command'),
+    'jitb_page_transitions_total': ('counter', ('game', 'page'),
+                                    'Page changes seen by each game, by the new page id'),
+    'jitb_missed_prompts_total': ('counter', ('game',),
+                                  'Prompts each game failed to answer'),
+    'jitb_answer_seconds': ('histogram', ('game',),
+                            'Seconds each game waited for an AI answer, prefetching included')}
+CONTENT_TYPE: Final[str] = 'text/plain; version=0.0.4; charset=utf-8'  # Prometheus text format
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves Metrics.render() at /metrics."""
+
+    def do_GET(self) -> None:  # pylint: disable = invalid-name
+        """Serve the metrics."""
+        # LOCAL VARIABLES
+        body = b''  # Response body
+
+        # SERVE IT
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = Metrics.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:  # pylint: disable = redefined-builtin
+        """Don't log each scrape."""
+
+
+class Metrics():
+    """Metrics class for the package.
+
+    The inc() and observe() methods do nothing until enable() is called.
+    """
+
+    _enabled = False                 # Metrics status
+    _lock = threading.Lock()         # Serializes updates (e.g., --pipeline threads)
+    _labels = {}                     # Labels added to every sample (e.g., the fleet session)
+    _counters = {}                   # Counter values, by (name, labels)
+    _histograms = {}                 # [bucket counts, sum of observations], by (name, labels)
+    _server = None                   # --metrics-port ThreadingHTTPServer
+    _filename = ''                   # Absolute --metrics-file filename
+    _writer = None                   # --metrics-file rewriting thread
+    _stopping = threading.Event()    # Stops the --metrics-file rewriting thread
+
+    @staticmethod
+    def enable(port: int = None, filename: str = None, interval: float = JITB_METRICS_INTERVAL,
+               labels: Dict[str, str] = None) -> None:
+        """Start counting, and exporting, the metrics until Logger.shutdown() runs.
+
+        Args:
+            port: Optional; Serve the metrics on this local port (0 picks a free port).
+            filename: Optional; Rewrite this textfile with the metrics every interval seconds.
+            interval: Optional; Seconds between textfile rewrites.
+            labels: Optional; Labels to add to every sample (e.g., {'session': 'ABCD-JITB'}).
+
+        Raises:
+            RuntimeError: The metrics are already enabled.
+            TypeError: Bad data type.
+            ValueError: Empty filename or a non-positive interval.
+            OSError: The port couldn't be bound.
+        """
+        # INPUT VALIDATION
+        if Metrics._enabled:
+            raise RuntimeError('The metrics are already enabled')
+        if port is not None:
+            validate_type(port, 'port', int)
+        if filename is not None:
+            validate_string(filename, 'filename', can_be_empty=False)
+        validate_type(interval, 'interval', (int, float))
+        if interval <= 0:
+            raise ValueError(f'The interval must be positive instead of {interval}')
+        validate_type(labels if labels is not None else {}, 'labels', dict)
+
+        # ENABLE IT
+        with Metrics._lock:
+            Metrics._labels = {str(key): str(value) for key, value in (labels or {}).items()}
+            Metrics._counters = {}
+            Metrics._histograms = {}
+            Metrics._enabled = True
+        if port is not None:
+            Metrics._server = ThreadingHTTPServer((JITB_METRICS_HOST, port), _MetricsHandler)
+            threading.Thread(target=Metrics._server.serve_forever, name='jitb_metrics_http',
+                             daemon=True).start()
+            Logger.info(f'Serving metrics at http://{JITB_METRICS_HOST}:{Metrics.get_port()}'
+                        '/metrics')
+        if filename is not None:
+            Metrics._filename = os.path.abspath(filename)
+            Metrics._stopping.clear()
+            Metrics.write_textfile(Metrics._filename)
+            Metrics._writer = threading.Thread(target=Metrics._rewrite_textfile, args=(interval,),
+                                               name='jitb_metrics_file', daemon=True)
+            Metrics._writer.start()
+            Logger.info(f'Writing metrics to {Metrics._filename} every {interval} seconds')
+        Logger.add_shutdown_hook(Metrics.stop)
+
+    @staticmethod
+    def get_port() -> int:
+        """The port the metrics are served on, or None if they aren't."""
+        return Metrics._server.server_address[1] if Metrics._server else None
+
+    @staticmethod
+    def inc(name: str, amount: float = 1, **labels: str) -> None:
+        """Add amount to a counter.
+
+        Args:
+            name: The counter's name.  See: METRICS.
+            amount: Optional; The amount to add.
+            labels: The counter's label values, by label name.
+
+        Raises:
+            ValueError: name isn't a counter or labels don't match its label names.
+        """
+        # LOCAL VARIABLES
+        key = None  # Index into the counters
+
+        # COUNT IT
+        if Metrics._enabled:
+            key = (name, _check_labels(name, 'counter', labels))
+            with Metrics._lock:
+                Metrics._counters[key] = Metrics._counters.get(key, 0) + amount
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Are the metrics enabled?"""
+        return Metrics._enabled
+
+    @staticmethod
+    def observe(name: str, seconds: float, **labels: str) -> None:
+        """Count one observation in a histogram.
+
+        Args:
+            name: The histogram's name.  See: METRICS.
+            seconds: The observation.
+            labels: The histogram's label values, by label name.
+
+        Raises:
+            ValueError: name isn't a histogram or labels don't match its label names.
+        """
+        # LOCAL VARIABLES
+        key = None        # Index into the histograms
+        histogram = None  # The histogram's bucket counts and sum
+
+        # COUNT IT
+        if Metrics._enabled:
+            key = (name, _check_labels(name, 'histogram', labels))
+            with Metrics._lock:
+                histogram = Metrics._histograms.setdefault(key,
+                                                           [[0] * len(JITB_METRICS_BUCKETS), 0.0])
+                for index, bound in enumerate(JITB_METRICS_BUCKETS):
+                    if seconds <= bound:
+                        histogram[0][index] += 1
+                        break
+                histogram[1] += seconds
+
+    @staticmethod
+    def render() -> str:  # pylint: disable = too-many-locals
+        """Format every metric in the Prometheus text format.
+
+        Counters without labels are reported as 0 until they're counted.  The others only appear
+        once they've been counted.
+        """
+        # LOCAL VARIABLES
+        lines = []         # The metrics
+        counters = {}      # Copy of the counters
+        histograms = {}    # Copy of the histograms
+        cumulative = 0     # Observations in this bucket and the ones before it
+        const_labels = ()  # Labels added to every sample
+
+        # RENDER IT
+        with Metrics._lock:
+            counters = dict(Metrics._counters)
+            histograms = {key: (list(counts), total)
+                          for key, (counts, total) in Metrics._histograms.items()}
+            const_labels = tuple(Metrics._labels.items())
+        for name, (kind, label_names, help_text) in METRICS.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            if kind == 'counter':
+                samples = sorted((labels, value) for (metric, labels), value in counters.items()
+                                 if metric == name)
+                if not samples and not label_names:
+                    samples = [((), 0)]
+                for labels, value in samples:
+                    lines.append(f'{name}{_format_labels(const_labels + labels)} '
+                                 f'{_format_value(value)}')
+            else:
+                for labels, (counts, total) in sorted((labels, value) for (metric, labels), value
+                                                      in histograms.items() if metric == name):
+                    cumulative = 0
+                    for bound, count in zip(JITB_METRICS_BUCKETS, counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket'
+                                     + _format_labels(const_labels + labels
+                                                      + (('le', _format_bound(bound)),))
+                                     + f' {cumulative}')
+                    lines.append(f'{name}_sum{_format_labels(const_labels + labels)} '
+                                 f'{_format_value(total)}')
+                    lines.append(f'{name}_count{_format_labels(const_labels + labels)} '
+                                 f'{cumulative}')
+
+        # DONE
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def stop() -> None:
+        """Stop counting and exporting the metrics.  The textfile is rewritten one last time."""
+        if Metrics._server:
+            Metrics._server.shutdown()
+            Metrics._server.server_close()
+            Metrics._server = None
+        if Metrics._writer:
+            Metrics._stopping.set()
+            Metrics._writer.join()
+            Metrics._writer = None
+            Metrics._write_final_textfile()
+        Metrics._enabled = False
+
+    @staticmethod
+    def write_textfile(filename: str) -> None:
+        """Atomically replace filename with the rendered metrics.
+
+        Args:
+            filename: The textfile to write.
+
+        Raises:
+            TypeError: Bad data type.
+            ValueError: Empty filename.
+            OSError: The file couldn't be written.
+        """
+        # LOCAL VARIABLES
+        temp_filename = f'{filename}.{os.getpid()}.tmp'  # Written first, so scrapes never tear
+
+        # WRITE IT
+        validate_string(filename, 'filename', can_be_empty=False)
+        with open(temp_filename, 'w', encoding='utf-8') as out_file:
+            out_file.write(Metrics.render())
+        os.replace(temp_filename, filename)
+
+    @staticmethod
+    def _rewrite_textfile(interval: float) -> None:
+        """Rewrite the --metrics-file every interval seconds until stop() is called."""
+        while not Metrics._stopping.wait(interval):
+            try:
+                Metrics.write_textfile(Metrics._filename)
+            except OSError as err:
+                Logger.debug('Failed to write the metrics to %s with %r', Metrics._filename,
+                             err)
+
+    @staticmethod
+    def _write_final_textfile() -> None:
+        """Rewrite the --metrics-file one last time, on the way out."""
+        try:
+            Metrics.write_textfile(Metrics._filename)
+        except OSError as err:
+            Logger.error(f'Failed to write the metrics to {Metrics._filename} with {repr(err)}')
+
+
+def _check_labels(name: str, kind: str, labels: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+    """Verify name is a kind of metric with these label names and return them, in order.
+
+    Raises:
+        ValueError: name isn't a kind of metric or labels don't match its label names.
+    """
+    if name not in METRICS or METRICS[name][0] != kind:
+        raise ValueError(f'{name} is not a {kind}')
+    if set(labels) != set(METRICS[name][1]):
+        raise ValueError(f'{name} is labeled by {", ".join(METRICS[name][1]) or "nothing"}, '
+                         f'not {", ".join(labels) or "nothing"}')
+    return tuple((label, str(labels[label])) for label in METRICS[name][1])
+
+
+def _format_bound(bound: float) -> str:
+    """Format a histogram bucket's upper bound as its le label value."""
+    return '+Inf' if math.isinf(bound) else repr(float(bound))
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    """Format labels as {name="value",...}, escaped, or nothing if there aren't any."""
+    # LOCAL VARIABLES
+    pairs = []  # Formatted labels
+
+    # FORMAT THEM
+    for label, value in labels:
+        value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{label}="{value}"')
+
+    # DONE
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value: integers without a decimal point, everything else as a float."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -1,5 +1,6 @@
 """Miscellaneous functions used by JITB."""
 # Standard
+from importlib.metadata import PackageNotFoundError, version
 from sys import platform
 import os
 import re
@@ -110,6 +111,14 @@ def determine_tmp_dir() -> str:
     return tmp_dir
 
 
+def get_jitb_version() -> str:
+    """The installed JITB version, if it's installed, or 'unknown'."""
+    try:
+        return version('jitb')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
 def _read_env_var(env_var: str) -> str:
     """Read an environment variable and return the value read.
 
@@ -1,32 +1,45 @@
 """The package's interface to OpenAI's API."""
+# pylint: disable = too-many-lines
 # Standard
 from collections import OrderedDict
+from functools import partial
 from string import punctuation
-from typing import Final, List
+from typing import Any, Callable, Final, List, Tuple
+import asyncio
 import os
 import re
 import random
 import string
 import sys
+import time
 # Third Party
 from hobo.validation import validate_list, validate_string, validate_type
-from openai import OpenAI
+from openai import NOT_GIVEN, AsyncOpenAI, OpenAI
 # Local
-from jitb.jitb_globals import DEFAULT_SYSTEM_CONTENT, OPENAI_KEY_ENV_VAR
+from jitb.jitb_cache import JitbCache
+from jitb.jitb_events import EventLog
+from jitb.jitb_globals import DEFAULT_SYSTEM_CONTENT, JITB_FALLBACK_ANSWERS, OPENAI_KEY_ENV_VAR
 from jitb.jitb_logger import Logger
+from jitb.jitb_metrics import Metrics
 from jitb.jitb_misc import clean_up_string
+from jitb.jitb_ratelimit import RateLimiter, estimate_tokens
+from jitb.jitb_recorder import Recorder
 from jitb.jitb_validation import validate_pos_int
 
 
 # Minimum number of underscores to be considered a fill-in-the-blank
 MIN_FITB_LEN: Final[int] = 4                  # Minimum fill-in-the-blank underscores
 BASE_MSG_CONTENT_KEY: Final[str] = 'content'  # Key value for JitbAi base messages
+DEFAULT_MAX_CONCURRENCY: Final[int] = 4       # Default AsyncJitbAi concurrent request cap
 
 
+# pylint: disable = too-many-instance-attributes
 class JitbAi:
     """Implements the interface to the OpenAI API."""
 
-    def __init__(self, model: str = 'gpt-4o-mini', temperature: float = 1.0) -> None:
+    def __init__(self, model: str = 'gpt-4o-mini', temperature: float = 1.0,
+                 stream: bool = False, cache: JitbCache = None,
+                 rate_limiter: RateLimiter = None) -> None:
         """Class ctor.
 
         Args:
@@ -34,10 +47,19 @@ class JitbAi:
             temperature: Optional; What sampling temperature to use, between 0.0 and 2.0. Higher
                 values like 0.8 will make the output more random, while lower values like 0.2
                 will make it more focused and deterministic.
+            stream: Optional; If True, stream completions and stop reading them as soon as the
+                answer is long enough.
+            cache: Optional; Answer previously seen prompts from this cache.
+            rate_limiter: Optional; Throttles, and retries, OpenAI requests.  Defaults to a
+                RateLimiter() using the JITB_RATE_LIMIT_* defaults.
         """
         self._client = None            # OpenAI() object
         self._model = model            # OpenAI model
         self._base_temp = temperature  # Temperature (see: help(OpenAI().chat.completions.create))
+        self._stream = stream          # Stream completions and cut them off early
+        self._cache = cache            # Persistent prompt->answer cache
+        # Throttles, and retries, OpenAI requests
+        self._rate_limiter = rate_limiter if rate_limiter else RateLimiter()
         self._base_messages = [
             {'role': 'system', BASE_MSG_CONTENT_KEY: DEFAULT_SYSTEM_CONTENT},
         ]
@@ -59,18 +81,12 @@ class JitbAi:
 
     def setup(self) -> None:
         """Validate everything but prepare just once."""
-        # LOCAL VARIABLES
-        api_key = os.environ.get(OPENAI_KEY_ENV_VAR)  # OpenAi API key
-        if not api_key:
-            raise RuntimeError('Be sure to export your OpenAI API key into the '
-                               f'{OPENAI_KEY_ENV_VAR} environment variable')
-
         # VALIDATION
         self._validate_attributes()
 
         # SETUP
         if not self._client:
-            self._client = OpenAI(api_key=api_key)
+            self._client = OpenAI(api_key=_get_api_key(), max_retries=0)
 
     def tear_down(self) -> None:
         """Shut it all down."""
@@ -90,29 +106,54 @@ class JitbAi:
         # CHANGE IT
         self._base_messages[0][BASE_MSG_CONTENT_KEY] = new_content
 
+    # pylint: disable = too-many-arguments
     def create_content(self, messages: List, add_base_msgs: bool = True,
-                       max_tokens: int = 50) -> str:
+                       max_tokens: int = 50, stop_check: Callable[[str], bool] = None,
+                       response_format: dict = None) -> str:
         """Communicate with OpenAI using the API.
 
         Args:
             messages: A list of string to pass to the OpenAi API.
             add_base_mesgs: Optional; If True, prepend messages with self._base_messages.
+            max_tokens: Optional; Maximum number of tokens to generate.
+            stop_check: Optional; Only used when streaming.  Called with the content received
+                so far (sans leading newlines).  Return True to stop the request early.
+            response_format: Optional; The chat.completion response_format (e.g.,
+                {'type': 'json_object'}).  Such requests are never streamed since a partial
+                answer isn't worth cutting off.
 
         Returns:
             The message content from the first choice.
         """
-        local_msgs = messages  # Local copy of messages
+        local_msgs = messages        # Local copy of messages
+        start = time.perf_counter()  # When the request started, for --record, etc.
         if add_base_msgs:
             local_msgs = self._base_messages + messages
         # chat.completion endpoint
-        completion = self._client.chat.completions.create(model=self._model, messages=local_msgs,
-                                                          max_tokens=max_tokens,
-                                                          temperature=self._base_temp)
+        try:
+            if self._stream and not response_format:
+                answer = self._stream_content(messages=local_msgs, max_tokens=max_tokens,
+                                              stop_check=stop_check)
+            else:
+                completion = self._create_completion(messages=local_msgs, max_tokens=max_tokens,
+                                                     response_format=response_format)
+                answer = completion.choices[0].message.content
+                _count_tokens(completion)
+        except TimeoutError:
+            _report_request('timeout', start=start, max_tokens=max_tokens)
+            raise
+        except Exception:
+            _report_request('error', start=start, max_tokens=max_tokens)
+            raise
+        _report_request('ok', start=start, max_tokens=max_tokens, answer=answer)
         # Strip all leading and trailing newlines
-        answer = re.sub(r'^\n+|\n+$', '', completion.choices[0].message.content)
+        answer = re.sub(r'^\n+|\n+$', '', answer)
+        Recorder.record_ai(messages=local_msgs, max_tokens=max_tokens, response=answer,
+                           latency=time.perf_counter() - start)
 
         # DONE
         return answer
+    # pylint: enable = too-many-arguments
 
     def generate_answer(self, prompt: str, length_limit: int = 45,
                         min_len: int = MIN_FITB_LEN) -> str:
@@ -127,23 +168,24 @@ class JitbAi:
             The generated answer as a string.
         """
         # LOCAL VARIABLES
-        answer = ''    # Answer to the provided prompt
-        messages = []  # Local copy of messages to update with actual query
-        # Base prompt to prompt OpenAI to generate a single answer to a prompt
-        content = f'Provide a humorous response within {length_limit} characters ' \
-                  + f'characters for this prompt: "{prompt}".'
+        answer = ''  # Answer to the provided prompt
+        # Query to send OpenAI
+        messages = self._answer_messages(prompt=prompt, length_limit=length_limit, min_len=min_len)
 
         # CLASS VALIDATION
         self.setup()
 
         # GENERATE IT
-        if '_' * min_len in prompt:
-            content = content + '  The prompt has a fill-in-the-blank placeholder so ensure ' \
-                      + 'your answer makes sense grammatically.  Do not restate any part of ' \
-                      + 'the orignal prompt in your answer.'
-        messages.append({'role': 'user', 'content': content})
-        answer = self.create_content(messages=messages)
-        answer = polish_answer(prompt=prompt, answer=answer, length_limit=length_limit)
+        answer = self._cache_get(request_type='answer', prompt=prompt, length_limit=length_limit)
+        if answer is None:
+            try:
+                answer = self.create_content(
+                    messages=messages, stop_check=partial(_answer_overflows, prompt, length_limit))
+            except TimeoutError as err:
+                return _fallback_answers(err=err, length_limit=length_limit)[0]
+            answer = polish_answer(prompt=prompt, answer=answer, length_limit=length_limit)
+            self._cache_put(request_type='answer', prompt=prompt, length_limit=length_limit,
+                            answer=answer)
 
         # DONE
         return answer
@@ -163,39 +205,29 @@ class JitbAi:
         """
         # LOCAL VARIABLES
         raw_answer = ''  # Answer to the provided prompt
-        answers = []     # Parse the raw answer into a list of length 3
-        messages = []    # Local copy of messages to update with actual query
-        # Base prompt to prompt OpenAI to generate a single answer to a prompt
-        content = f'Answer the following Quiplash 3 Thriplash prompt: "{prompt}".  ' \
-                  + f'Each individual funny answer should be less than {length_limit} ' \
-                  + 'characters and should be on its own line.'
+        # Query to send OpenAI
+        messages = self._thriplash_messages(prompt=prompt, length_limit=length_limit,
+                                            min_len=min_len)
+        # Previously cached answers, joined by newlines
+        cached = self._cache_get(request_type='thriplash', prompt=prompt,
+                                 length_limit=length_limit)
 
         # CLASS VALIDATION
         self.setup()
 
         # GENERATE IT
-        # Generate
-        if '_' * min_len in prompt:
-            content = content + '  The prompt has some fill-in-the-blank placeholders so ensure ' \
-                      + 'your answers make sense grammatically.  Do not restate any part of ' \
-                      + 'the orignal prompt in your answer.'
-        messages.append({'role': 'user', 'content': content})
-        raw_answer = self.create_content(messages=messages)
-        answers = [answer for answer in raw_answer.split('\n') if answer]
-        # Validate results
-        if not answers:
-            raise RuntimeError(f'OpenAI did *not* generate content for {prompt}')
-        if len(answers) < 3:
-            for _ in range(3 - len(answers)):
-                answers.append('')
-        elif len(answers) > 3:
-            Logger.debug(f'OpenAI generated more than just three lines here {answers}')
-            answers = self._extract_thriplash_answer(answers=answers, length_limit=length_limit)
-        # Polish the format
-        answers = self._polish_thriplash_answers(answers=answers, length_limit=length_limit)
+        if cached is not None:
+            return cached.split('\n')
+        try:
+            raw_answer = self.create_content(messages=messages, stop_check=_thriplash_complete)
+        except TimeoutError as err:
+            return _fallback_answers(err=err, length_limit=length_limit, num=3)
 
         # DONE
-        return answers
+        return self._cache_thriplash(prompt=prompt, length_limit=length_limit,
+                                     answers=self._parse_thriplash(prompt=prompt,
+                                                                   raw_answer=raw_answer,
+                                                                   length_limit=length_limit))
 
     def vote_favorite(self, prompt: str, answers: list) -> str:
         """Prompt OpenAI to choose a favorite answer for the prompt from a list of options.
@@ -208,36 +240,119 @@ class JitbAi:
             One of the answers entries.
         """
         # LOCAL VARIABLES
-        favorite = ''                # Favorite from the answers list
-        messages = []                # Local copy of messages to update with actual query
-        choice_dict = OrderedDict()  # Ordered dictionary of choices
-        choices = ''                 # Human-readable list formed from choice_dict
-        # Base prompt to prompt OpenAI to generate a single answer to a prompt
-        content = 'I am going to give you some answers for the Jackbox Games prompt ' \
-                  + f'"{prompt}".  Pick the funniest answer from the choice list I give you.  ' \
-                  + 'Your comma-separated choice list is: {}.  ' \
-                  + 'Choose an answer from the choice list but only give me the letter.  ' \
-                  + 'Do not create new content.  Do not create any additional answers.  ' \
-                  + 'Do not create any new choices.  ' \
-                  + 'Do not choose a letter that was not in your choice list.'
+        favorite = ''       # Favorite from the answers list
+        messages = []       # Local copy of messages to update with actual query
+        choice_dict = None  # Ordered dictionary of choices
 
         # CLASS VALIDATION
         self.setup()
 
-        # SETUP
-        for answer in answers:
-            choice_dict[chr(answers.index(answer) + 65)] = answer
-        choices = ', '.join([key + '. ' + val.strip('\n') for (key, val) in choice_dict.items()])
-        content = content.format(choices)
-
         # VOTE IT
-        messages.append({'role': 'user', 'content': content})
-        answer = self.create_content(messages=messages)
-        favorite = self._extract_favorite(answer, choice_dict)
+        favorite = self._cache_get_favorite(prompt=prompt, answers=answers)
+        if favorite is None:
+            messages, choice_dict = self._favorite_messages(prompt=prompt, answers=answers)
+            try:
+                favorite = self._extract_favorite(self.create_content(messages=messages),
+                                                  choice_dict)
+            except TimeoutError as err:
+                Logger.error(f'{err} so a favorite was chosen randomly')
+                return _randomize_choice(choice_dict)
+            self._cache_put(request_type='vote', prompt=_vote_key(prompt, answers),
+                            length_limit=0, answer=favorite)
 
         # DONE
         return favorite
 
+    # Private methods in alphabetical order.
+    def _answer_messages(self, prompt: str, length_limit: int, min_len: int) -> List[dict]:
+        """Build the generate_answer() messages for the given prompt.
+
+        Returns:
+            A list of messages to pass to create_content().
+        """
+        # LOCAL VARIABLES
+        # Base prompt to prompt OpenAI to generate a single answer to a prompt
+        content = f'Provide a humorous response within {length_limit} characters ' \
+                  + f'characters for this prompt: "{prompt}".'
+
+        # BUILD IT
+        if '_' * min_len in prompt:
+            content = content + '  The prompt has a fill-in-the-blank placeholder so ensure ' \
+                      + 'your answer makes sense grammatically.  Do not restate any part of ' \
+                      + 'the orignal prompt in your answer.'
+
+        # DONE
+        return [{'role': 'user', 'content': content}]
+
+    def _cache_get(self, request_type: str, prompt: str, length_limit: int,
+                   candidates: int = None) -> str:
+        """Fetch a cached answer for this model and system content.
+
+        Args:
+            request_type: The type of AI request (e.g., 'answer', 'thriplash', 'vote').
+            prompt: The original prompt.
+            length_limit: The answer's length limit.
+            candidates: Optional; Overrides the cache's number of answers to store for this key.
+
+        Returns:
+            The cached answer on a hit, None on a miss or if there is no cache.
+        """
+        # LOCAL VARIABLES
+        answer = None  # Cached answer
+
+        # FETCH IT
+        if not self._cache:
+            return None
+        answer = self._cache.get(request_type=request_type, prompt=prompt, model=self._model,
+                                 system_content=self._base_messages[0][BASE_MSG_CONTENT_KEY],
+                                 length_limit=length_limit, candidates=candidates)
+        Metrics.inc('jitb_ai_cache_lookups_total', result='miss' if answer is None else 'hit')
+
+        # DONE
+        return answer
+
+    def _cache_get_favorite(self, prompt: str, answers: list) -> str:
+        """Fetch a cached favorite, ignoring any favorite that is no longer an option.
+
+        A vote has one favorite, so any stored favorite is a hit.
+        """
+        # LOCAL VARIABLES
+        favorite = self._cache_get(request_type='vote', prompt=_vote_key(prompt, answers),
+                                   length_limit=0, candidates=1)  # Cached favorite
+
+        # DONE
+        if favorite not in answers:
+            favorite = None
+        return favorite
+
+    def _cache_put(self, request_type: str, prompt: str, length_limit: int, answer: str) -> None:
+        """Store an answer for this model and system content, if there is a cache."""
+        if self._cache:
+            self._cache.put(request_type=request_type, prompt=prompt, model=self._model,
+                            system_content=self._base_messages[0][BASE_MSG_CONTENT_KEY],
+                            length_limit=length_limit, answer=answer)
+
+    def _cache_thriplash(self, prompt: str, length_limit: int, answers: List[str]) -> List[str]:
+        """Store newly generated Thriplash answers, as one answer, and return them."""
+        if any(answers):
+            self._cache_put(request_type='thriplash', prompt=prompt, length_limit=length_limit,
+                            answer='\n'.join(answers))
+        return answers
+
+    def _create_completion(self, messages: List, max_tokens: int, stream: bool = False,
+                           response_format: dict = None) -> Any:
+        """Make a rate limited chat.completion request.
+
+        Raises:
+            TimeoutError: The rate limiter's deadline passed before OpenAI answered.
+        """
+        return self._rate_limiter.call(
+            partial(self._client.chat.completions.with_raw_response.create, model=self._model,
+                    messages=messages, max_tokens=max_tokens, temperature=self._base_temp,
+                    stream=stream, response_format=response_format or NOT_GIVEN,
+                    stream_options={'include_usage': True} if stream else NOT_GIVEN),
+            tokens=estimate_tokens(messages=messages, max_tokens=max_tokens))
+
     def _extract_favorite(self, answer: str, choices: dict) -> str:
         """Extract a favorite from created content.
 
@@ -258,18 +373,18 @@ class JitbAi:
         # INPUT VALIDATION
         if self._failed_request(answer):
             favorite = _randomize_choice(choices=choices)
-            Logger.debug(f'OpenAI failed with {answer} so {favorite} was chosen randomly')
+            Logger.debug('OpenAI failed with %s so %s was chosen randomly', answer, favorite)
         # EXTRACT IT
         elif answer in choices.keys():
             favorite = choices[answer]  # Sometimes OpenAI follows instructions
-            Logger.debug(f'OpenAI followed instructions and {favorite} was chosen')
+            Logger.debug('OpenAI followed instructions and %s was chosen', favorite)
         elif len(answer) != len(list(choices.keys())[0]) and answer[0] in choices.keys():
             favorite = choices[answer[0]]  # Sometimes OpenAI likes to add words
-            Logger.debug(f'OpenAI added words but we extracted {favorite} from {answer}')
+            Logger.debug('OpenAI added words but we extracted %s from %s', favorite, answer)
         else:
             # Did OpenAI give a response that wasn't a choice without failing the request?!
             favorite = _randomize_choice(choices=choices)
-            Logger.debug(f'OpenAI went crazy with {answer} so {favorite} was chosen randomly')
+            Logger.debug('OpenAI went crazy with %s so %s was chosen randomly', answer, favorite)
 
         # DONE
         return favorite
@@ -328,6 +443,59 @@ class JitbAi:
         # DONE
         return failed
 
+    def _favorite_messages(self, prompt: str, answers: list) -> Tuple[List[dict], OrderedDict]:
+        """Build the vote_favorite() messages for the given prompt and answers.
+
+        Returns:
+            A tuple of the messages to pass to create_content() and the ordered dictionary of
+            choices to pass to _extract_favorite().
+        """
+        # LOCAL VARIABLES
+        choice_dict = OrderedDict()  # Ordered dictionary of choices
+        choices = ''                 # Human-readable list formed from choice_dict
+        # Base prompt to prompt OpenAI to generate a single answer to a prompt
+        content = 'I am going to give you some answers for the Jackbox Games prompt ' \
+                  + f'"{prompt}".  Pick the funniest answer from the choice list I give you.  ' \
+                  + 'Your comma-separated choice list is: {}.  ' \
+                  + 'Choose an answer from the choice list but only give me the letter.  ' \
+                  + 'Do not create new content.  Do not create any additional answers.  ' \
+                  + 'Do not create any new choices.  ' \
+                  + 'Do not choose a letter that was not in your choice list.'
+
+        # BUILD IT
+        for answer in answers:
+            choice_dict[chr(answers.index(answer) + 65)] = answer
+        choices = ', '.join([key + '. ' + val.strip('\n') for (key, val) in choice_dict.items()])
+        content = content.format(choices)
+
+        # DONE
+        return tuple(([{'role': 'user', 'content': content}], choice_dict))
+
+    def _parse_thriplash(self, prompt: str, raw_answer: str, length_limit: int) -> List[str]:
+        """Parse generate_thriplash() content into a polished list of three answers.
+
+        Raises:
+            RuntimeError: OpenAI did not generate any content.
+        """
+        # LOCAL VARIABLES
+        answers = [answer for answer in raw_answer.split('\n') if answer]  # Non-empty lines
+
+        # PARSE IT
+        # Validate results
+        if not answers:
+            raise RuntimeError(f'OpenAI did *not* generate content for {prompt}')
+        if len(answers) < 3:
+            for _ in range(3 - len(answers)):
+                answers.append('')
+        elif len(answers) > 3:
+            Logger.debug('OpenAI generated more than just three lines here %s', answers)
+            answers = self._extract_thriplash_answer(answers=answers, length_limit=length_limit)
+        # Polish the format
+        answers = self._polish_thriplash_answers(answers=answers, length_limit=length_limit)
+
+        # DONE
+        return answers
+
     def _polish_thriplash_answers(self, answers: list, length_limit: int) -> list:
         """Polish the Thriplash answers in the list.
 
@@ -376,6 +544,76 @@ class JitbAi:
         # DONE
         return new_answers
 
+    def _stream_content(self, messages: List, max_tokens: int,
+                        stop_check: Callable[[str], bool] = None) -> str:
+        """Stream the chat completion, stopping as soon as stop_check() is satisfied.
+
+        Closing the stream drops the connection so OpenAI stops generating the unused tokens.
+        Streams that aren't cut off end with a chunk reporting the token usage, which is counted.
+        The rate limiter's deadline covers reading the stream, too.  If the stream fails, or
+        passes the deadline, part way through, the content received so far is kept.
+
+        Returns:
+            The message content received before the stream ended or was cut off.
+
+        Raises:
+            TimeoutError: The stream failed, or passed the deadline, before any content arrived.
+        """
+        # LOCAL VARIABLES
+        content = ''  # Message content received so far
+        # Monotonic time the stream must finish by
+        deadline = time.monotonic() + self._rate_limiter.get_deadline()
+        # Chunked chat.completion response
+        stream = self._create_completion(messages=messages, max_tokens=max_tokens, stream=True)
+        chunks = iter(stream)  # The stream's chunks
+        chunk = None           # The next chunk
+
+        # READ IT
+        try:
+            while True:
+                try:
+                    chunk = next(chunks, None)
+                except Exception as err:  # pylint: disable = broad-except
+                    # E.g., httpx.ReadTimeout, openai.APIError, or a dropped connection
+                    return _salvage_stream(content=content, err=err)
+                if chunk is None:
+                    break
+                if time.monotonic() > deadline:
+                    return _salvage_stream(content=content, err=_stream_timeout(self._rate_limiter))
+                _count_tokens(chunk)  # Only the final chunk reports usage
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                content += chunk.choices[0].delta.content
+                if stop_check and stop_check(content.lstrip('\n')):
+                    Logger.debug('Cut off the completion stream after "%s"', content)
+                    break
+        finally:
+            stream.close()
+
+        # DONE
+        return content
+
+    def _thriplash_messages(self, prompt: str, length_limit: int, min_len: int) -> List[dict]:
+        """Build the generate_thriplash() messages for the given prompt.
+
+        Returns:
+            A list of messages to pass to create_content().
+        """
+        # LOCAL VARIABLES
+        # Base prompt to prompt OpenAI to generate a single answer to a prompt
+        content = f'Answer the following Quiplash 3 Thriplash prompt: "{prompt}".  ' \
+                  + f'Each individual funny answer should be less than {length_limit} ' \
+                  + 'characters and should be on its own line.'
+
+        # BUILD IT
+        if '_' * min_len in prompt:
+            content = content + '  The prompt has some fill-in-the-blank placeholders so ensure ' \
+                      + 'your answers make sense grammatically.  Do not restate any part of ' \
+                      + 'the orignal prompt in your answer.'
+
+        # DONE
+        return [{'role': 'user', 'content': content}]
+
     def _validate_attributes(self) -> None:
         """Validate internal attributes."""
         # Temperature
@@ -383,6 +621,280 @@ class JitbAi:
             raise TypeError(f'Invalid temperature type of {type(self._base_temp)}')
         if self._base_temp < 0.0 or self._base_temp > 2.0:
             raise ValueError(f'Invalid temperature of {self._base_temp} (must be between 0 and 2)')
+        # Stream
+        validate_type(self._stream, 'stream', bool)
+        # Cache
+        if self._cache is not None:
+            validate_type(self._cache, 'cache', JitbCache)
+        # Rate limiter
+        validate_type(self._rate_limiter, 'rate_limiter', RateLimiter)
+
+
+class AsyncJitbAi(JitbAi):
+    """Implements an asyncio-native interface to the OpenAI API.
+
+    The a*() coroutines mirror the JitbAi methods, and share their prompts and post-processing,
+    but await an AsyncOpenAI client.  Callers may await many of them concurrently (e.g., with
+    asyncio.gather()).  No more than max_concurrency requests will be in flight at once.  The
+    synchronous JitbAi methods still work and use their own OpenAI client.
+
+    Typical Usage:
+        ai_obj = AsyncJitbAi(max_concurrency=4)
+        answers = await asyncio.gather(*[ai_obj.agenerate_answer(prompt) for prompt in prompts])
+        await ai_obj.atear_down()
+    """
+
+    # pylint: disable = too-many-arguments
+    def __init__(self, model: str = 'gpt-4o-mini', temperature: float = 1.0,
+                 stream: bool = False, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 cache: JitbCache = None, rate_limiter: RateLimiter = None) -> None:
+        """Class ctor.
+
+        Args:
+            model: Optional; OpenAI model to use.  See: https://platform.openai.com/docs/models
+            temperature: Optional; What sampling temperature to use, between 0.0 and 2.0.
+            stream: Optional; If True, stream completions and stop reading them as soon as the
+                answer is long enough.
+            max_concurrency: Optional; Maximum number of concurrent OpenAI requests.
+            cache: Optional; Answer previously seen prompts from this cache.
+            rate_limiter: Optional; Throttles, and retries, OpenAI requests.  Defaults to a
+                RateLimiter() using the JITB_RATE_LIMIT_* defaults.
+        """
+        super().__init__(model=model, temperature=temperature, stream=stream, cache=cache,
+                         rate_limiter=rate_limiter)
+        self._async_client = None                # AsyncOpenAI() object
+        self._max_concurrency = max_concurrency  # Maximum number of requests in flight
+        self._semaphore = None                   # Caps the requests in flight; Created lazily
+    # pylint: enable = too-many-arguments
+
+    async def asetup(self) -> None:
+        """Validate everything but prepare the AsyncOpenAI client just once."""
+        # VALIDATION
+        self._validate_attributes()
+
+        # SETUP
+        if not self._async_client:
+            self._async_client = AsyncOpenAI(api_key=_get_api_key(), max_retries=0)
+        if not self._semaphore:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+    async def atear_down(self) -> None:
+        """Shut it all down."""
+        if self._async_client:
+            await self._async_client.close()
+            self._async_client = None
+        self.tear_down()
+
+    async def acreate_content(self, messages: List, add_base_msgs: bool = True,
+                              max_tokens: int = 50,
+                              stop_check: Callable[[str], bool] = None) -> str:
+        """Communicate with OpenAI using the asynchronous API.
+
+        Args:
+            messages: A list of string to pass to the OpenAi API.
+            add_base_mesgs: Optional; If True, prepend messages with self._base_messages.
+            max_tokens: Optional; Maximum number of tokens to generate.
+            stop_check: Optional; Only used when streaming.  Called with the content received
+                so far (sans leading newlines).  Return True to stop the request early.
+
+        Returns:
+            The message content from the first choice.
+        """
+        local_msgs = messages  # Local copy of messages
+        start = 0.0            # When the request started, for --record, --metrics-*, etc.
+        if add_base_msgs:
+            local_msgs = self._base_messages + messages
+        # chat.completion endpoint
+        async with self._semaphore:
+            start = time.perf_counter()
+            try:
+                if self._stream:
+                    answer = await self._astream_content(messages=local_msgs,
+                                                         max_tokens=max_tokens,
+                                                         stop_check=stop_check)
+                else:
+                    completion = await self._acreate_completion(messages=local_msgs,
+                                                                max_tokens=max_tokens)
+                    answer = completion.choices[0].message.content
+                    _count_tokens(completion)
+            except TimeoutError:
+                _report_request('timeout', start=start, max_tokens=max_tokens)
+                raise
+            except Exception:
+                _report_request('error', start=start, max_tokens=max_tokens)
+                raise
+        _report_request('ok', start=start, max_tokens=max_tokens, answer=answer)
+        # Strip all leading and trailing newlines
+        answer = re.sub(r'^\n+|\n+$', '', answer)
+        Recorder.record_ai(messages=local_msgs, max_tokens=max_tokens, response=answer,
+                           latency=time.perf_counter() - start)
+
+        # DONE
+        return answer
+
+    async def agenerate_answer(self, prompt: str, length_limit: int = 45,
+                               min_len: int = MIN_FITB_LEN) -> str:
+        """Asynchronous generate_answer().
+
+        Args:
+            prompt: Prompt to give the AI to generate an answer for.
+            length_limit: Optional; Maximum length of the answer.
+            min_len: Optional; Min length of repeating undescores to be considered a fitb prompt.
+
+        Returns:
+            The generated answer as a string.
+        """
+        # LOCAL VARIABLES
+        answer = ''  # Answer to the provided prompt
+        # Query to send OpenAI
+        messages = self._answer_messages(prompt=prompt, length_limit=length_limit, min_len=min_len)
+
+        # CLASS VALIDATION
+        await self.asetup()
+
+        # GENERATE IT
+        answer = self._cache_get(request_type='answer', prompt=prompt, length_limit=length_limit)
+        if answer is None:
+            try:
+                answer = await self.acreate_content(
+                    messages=messages, stop_check=partial(_answer_overflows, prompt, length_limit))
+            except TimeoutError as err:
+                return _fallback_answers(err=err, length_limit=length_limit)[0]
+            answer = polish_answer(prompt=prompt, answer=answer, length_limit=length_limit)
+            self._cache_put(request_type='answer', prompt=prompt, length_limit=length_limit,
+                            answer=answer)
+
+        # DONE
+        return answer
+
+    async def agenerate_thriplash(self, prompt: str, length_limit: int = 30,
+                                  min_len: int = MIN_FITB_LEN) -> List[str]:
+        """Asynchronous generate_thriplash().
+
+        Args:
+            prompt: Prompt to give the AI to generate an answer for.
+            length_limit: Optional; Maximum length of the answer.
+            min_len: Optional; Min length of repeating undescores to be considered a fitb prompt.
+
+        Returns:
+            A list of length 3 which contains three strings.  One or more of the three strings
+            may be empty.
+        """
+        # LOCAL VARIABLES
+        raw_answer = ''  # Answer to the provided prompt
+        # Query to send OpenAI
+        messages = self._thriplash_messages(prompt=prompt, length_limit=length_limit,
+                                            min_len=min_len)
+        # Previously cached answers, joined by newlines
+        cached = self._cache_get(request_type='thriplash', prompt=prompt,
+                                 length_limit=length_limit)
+
+        # CLASS VALIDATION
+        await self.asetup()
+
+        # GENERATE IT
+        if cached is not None:
+            return cached.split('\n')
+        try:
+            raw_answer = await self.acreate_content(messages=messages,
+                                                    stop_check=_thriplash_complete)
+        except TimeoutError as err:
+            return _fallback_answers(err=err, length_limit=length_limit, num=3)
+
+        # DONE
+        return self._cache_thriplash(prompt=prompt, length_limit=length_limit,
+                                     answers=self._parse_thriplash(prompt=prompt,
+                                                                   raw_answer=raw_answer,
+                                                                   length_limit=length_limit))
+
+    async def avote_favorite(self, prompt: str, answers: list) -> str:
+        """Asynchronous vote_favorite().
+
+        Args:
+            prompt: The original prompt.
+            answers: A non-empty list of answers, as strings, to choose from.
+
+        Returns:
+            One of the answers entries.
+        """
+        # LOCAL VARIABLES
+        favorite = ''       # Favorite from the answers list
+        messages = []       # Local copy of messages to update with actual query
+        choice_dict = None  # Ordered dictionary of choices
+
+        # CLASS VALIDATION
+        await self.asetup()
+
+        # VOTE IT
+        favorite = self._cache_get_favorite(prompt=prompt, answers=answers)
+        if favorite is None:
+            messages, choice_dict = self._favorite_messages(prompt=prompt, answers=answers)
+            try:
+                favorite = self._extract_favorite(await self.acreate_content(messages=messages),
+                                                  choice_dict)
+            except TimeoutError as err:
+                Logger.error(f'{err} so a favorite was chosen randomly')
+                return _randomize_choice(choice_dict)
+            self._cache_put(request_type='vote', prompt=_vote_key(prompt, answers),
+                            length_limit=0, answer=favorite)
+
+        # DONE
+        return favorite
+
+    # Private methods in alphabetical order.
+    async def _acreate_completion(self, messages: List, max_tokens: int,
+                                  stream: bool = False) -> Any:
+        """Asynchronous _create_completion()."""
+        return await self._rate_limiter.acall(
+            partial(self._async_client.chat.completions.with_raw_response.create,
+                    model=self._model, messages=messages, max_tokens=max_tokens,
+                    temperature=self._base_temp, stream=stream,
+                    stream_options={'include_usage': True} if stream else NOT_GIVEN),
+            tokens=estimate_tokens(messages=messages, max_tokens=max_tokens))
+
+    async def _astream_content(self, messages: List, max_tokens: int,
+                               stop_check: Callable[[str], bool] = None) -> str:
+        """Asynchronous _stream_content()."""
+        # LOCAL VARIABLES
+        content = ''  # Message content received so far
+        # Monotonic time the stream must finish by
+        deadline = time.monotonic() + self._rate_limiter.get_deadline()
+        # Chunked chat.completion response
+        stream = await self._acreate_completion(messages=messages, max_tokens=max_tokens,
+                                                stream=True)
+        chunks = aiter(stream)  # The stream's chunks
+        chunk = None            # The next chunk
+
+        # READ IT
+        try:
+            while True:
+                try:
+                    chunk = await anext(chunks, None)
+                except Exception as err:  # pylint: disable = broad-except
+                    # E.g., httpx.ReadTimeout, openai.APIError, or a dropped connection
+                    return _salvage_stream(content=content, err=err)
+                if chunk is None:
+                    break
+                if time.monotonic() > deadline:
+                    return _salvage_stream(content=content, err=_stream_timeout(self._rate_limiter))
+                _count_tokens(chunk)  # Only the final chunk reports usage
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                content += chunk.choices[0].delta.content
+                if stop_check and stop_check(content.lstrip('\n')):
+                    Logger.debug('Cut off the completion stream after "%s"', content)
+                    break
+        finally:
+            await stream.close()
+
+        # DONE
+        return content
+
+    def _validate_attributes(self) -> None:
+        """Validate internal attributes."""
+        super()._validate_attributes()
+        validate_pos_int(self._max_concurrency, 'max_concurrency')
+# pylint: enable = too-many-instance-attributes
 
 
 def polish_answer(prompt: str, answer: str, length_limit: int, original_answer: str = None) -> str:
@@ -429,9 +941,9 @@ def polish_answer(prompt: str, answer: str, length_limit: int, original_answer:
     clean_prompt = clean_up_string(prompt)
     new_answer = clean_up_string(answer)
     if clean_prompt != prompt:
-        Logger.debug(f'Successfully cleaned "{prompt}" to "{clean_prompt}"')
+        Logger.debug('Successfully cleaned "%s" to "%s"', prompt, clean_prompt)
     if new_answer != answer:
-        Logger.debug(f'Successfully cleaned "{answer}" to "{new_answer}"')
+        Logger.debug('Successfully cleaned "%s" to "%s"', answer, new_answer)
     # 1. Removes leading and trailing quotes
     new_answer = re.sub(r'^"|"$', '', new_answer)  # Strip leading and trailing quotes
     # 2. Removes overlap between the prompt and answer
@@ -450,7 +962,8 @@ def polish_answer(prompt: str, answer: str, length_limit: int, original_answer:
 
     # DONE
     if new_answer != original_answer and final_run:
-        Logger.debug(f'Polished "{new_answer}" from "{original_answer}" for this: "{clean_prompt}"')
+        Logger.debug('Polished "%s" from "%s" for this: "%s"', new_answer, original_answer,
+                     clean_prompt)
     return new_answer
 
 
@@ -502,21 +1015,21 @@ def remove_answer_overlap(prompt: str, answer: str, min_len: int = MIN_FITB_LEN)
                 new_answer = new_answer[new_answer.lower().index(opening.lower()) + len(opening):]
             except ValueError as err:
                 Logger.debug('remove_answer_overlap() failed slicing the opening overlap of '
-                             + f'"{opening}" off of the current working answer of '
-                             + f'"{new_answer}" with {repr(err)}!')
+                             '"%s" off of the current working answer of "%s" with %r!', opening,
+                             new_answer, err)
         if closing:
             try:
                 # Slice off trailing overlap
                 new_answer = new_answer[:new_answer.lower().index(closing.lower())]
             except ValueError as err:
                 Logger.debug('remove_answer_overlap() failed slicing the trailing overlap of '
-                             + f'"{closing}" off of the current working answer of '
-                             + f'"{new_answer}" with {repr(err)}!')
+                             '"%s" off of the current working answer of "%s" with %r!', closing,
+                             new_answer, err)
 
     # DONE
     if new_answer != answer:
-        Logger.debug(f'Trimmed "{new_answer}" from "{answer}" by removing overlap with '
-                     f'this prompt: "{prompt}"')
+        Logger.debug('Trimmed "%s" from "%s" by removing overlap with this prompt: "%s"',
+                     new_answer, answer, prompt)
     return new_answer
 
 
@@ -554,6 +1067,67 @@ def remove_punctuation(prompt: str, answer: str, min_len: int = MIN_FITB_LEN) ->
     return new_answer
 
 
+def _answer_overflows(prompt: str, length_limit: int, content: str) -> bool:
+    """Determine if a partial answer, once polished, already fills length_limit.
+
+    Polishing never lengthens an answer, so content shorter than length_limit is never checked.
+    Any further content would just be truncated by polish_answer().  Content which is still
+    restating the prompt is never considered complete since polish_answer() can only remove the
+    overlap once the restatement is finished.
+    """
+    # LOCAL VARIABLES
+    overflows = False  # True if content has more than length_limit polished characters
+    polished = ''      # Polished, but not truncated, version of content
+
+    # CHECK IT
+    if len(content) > length_limit:
+        polished = polish_answer(prompt=prompt, answer=content, length_limit=len(content))
+        overflows = len(polished) > length_limit \
+            and not clean_up_string(prompt).lower().startswith(polished.lower())
+
+    # DONE
+    return overflows
+
+
+def _count_tokens(completion: Any) -> None:
+    """Count the tokens a completion, or completion chunk, reports using, if it reports any.
+
+    Streams report their usage in a final chunk (see: stream_options), so streams that are cut
+    off early don't report any.
+    """
+    # LOCAL VARIABLES
+    usage = getattr(completion, 'usage', None)  # The completion's token usage
+
+    # COUNT THEM
+    if usage:
+        Metrics.inc('jitb_ai_tokens_total', amount=usage.prompt_tokens, type='prompt')
+        Metrics.inc('jitb_ai_tokens_total', amount=usage.completion_tokens, type='completion')
+
+
+def _fallback_answers(err: TimeoutError, length_limit: int, num: int = 1) -> List[str]:
+    """Choose num different JITB_FALLBACK_ANSWERS because OpenAI did not answer in time."""
+    Logger.error(f'{err} so {num} fallback answer(s) were chosen randomly')
+    return [answer[:length_limit] for answer in random.sample(JITB_FALLBACK_ANSWERS, num)]
+
+
+def _get_api_key() -> str:
+    """Read the OpenAI API key from the environment.
+
+    Raises:
+        RuntimeError: The OPENAI_KEY_ENV_VAR environment variable is not set.
+    """
+    # LOCAL VARIABLES
+    api_key = os.environ.get(OPENAI_KEY_ENV_VAR)  # OpenAi API key
+
+    # INPUT VALIDATION
+    if not api_key:
+        raise RuntimeError('Be sure to export your OpenAI API key into the '
+                           f'{OPENAI_KEY_ENV_VAR} environment variable')
+
+    # DONE
+    return api_key
+
+
 def _get_leading_overlap(haystack: str, needle: str) -> str:
     """Returns the trailing haystack and leading needle overlap sub-string."""
     overlap = ''  # Overlap between haystack and needle
@@ -619,3 +1193,40 @@ def _match_phrase(needle: str, haystack: str, threshold: float = 0.75) -> bool:
 def _randomize_choice(choices: dict) -> str:
     """Randomize one of the values from choices."""
     return random.choice(list(choices.values()))
+
+
+def _report_request(outcome: str, start: float, max_tokens: int, answer: str = None) -> None:
+    """Count, time, and record an event for, an OpenAI request that started at start."""
+    # LOCAL VARIABLES
+    seconds = time.perf_counter() - start  # How long the request took
+
+    # REPORT IT
+    Metrics.inc('jitb_ai_requests_total', outcome=outcome)
+    if outcome == 'ok':
+        Metrics.observe('jitb_ai_request_seconds', seconds)
+    EventLog.record('ai_request', outcome=outcome, seconds=round(seconds, 3),
+                    max_tokens=max_tokens, answer=answer)
+
+
+def _salvage_stream(content: str, err: Exception) -> str:
+    """Keep the content a stream received before err, or raise TimeoutError if there is none."""
+    if not content.strip('\n'):
+        raise TimeoutError(f'OpenAI stopped streaming with {repr(err)}') from err
+    Logger.debug('Kept "%s" from a stream that stopped with %r', content, err)
+    return content
+
+
+def _stream_timeout(rate_limiter: RateLimiter) -> TimeoutError:
+    """Describe a stream that passed rate_limiter's deadline."""
+    return TimeoutError(f'OpenAI did not finish streaming within {rate_limiter.get_deadline()} '
+                        'seconds')
+
+
+def _thriplash_complete(content: str) -> bool:
+    """Determine if a partial Thriplash answer already has three complete lines."""
+    return len([line for line in content.split('\n')[:-1] if line]) >= 3
+
+
+def _vote_key(prompt: str, answers: list) -> str:
+    """Combine a prompt and its answers, in any order, into one vote_favorite() cache prompt."""
+    return '\n'.join([prompt] + sorted(answers))
@@ -0,0 +1,386 @@
+"""Defines a client-side OpenAI rate limiter with 429-aware backoff.
+
+OpenAI limits both requests per minute (RPM) and tokens per minute (TPM).  Exceeding either one
+results in "429 Too Many Requests".  A RateLimiter spaces requests out with a token bucket for each
+limit, keeps those buckets in sync with the x-ratelimit-* response headers, and retries 429s
+and 5xxs with jittered exponential backoff (or Retry-After) until a per-call deadline passes.
+Each attempt's HTTP request is given whatever is left of the deadline as its timeout.
+RateLimiters in separate processes (see: jitb_fleet) can share one budget (see: SharedBudget).
+"""
+
+# Standard
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, MutableSequence
+import asyncio
+import multiprocessing
+import random
+import re
+import threading
+import time
+# Third Party
+from hobo.validation import validate_type
+from openai import APIConnectionError, APIStatusError, APITimeoutError
+# Local
+from jitb.jitb_globals import (JITB_BACKOFF_BASE, JITB_BACKOFF_MAX, JITB_RATE_LIMIT_RPM,
+                               JITB_RATE_LIMIT_TPM, JITB_REQUEST_DEADLINE)
+from jitb.jitb_logger import Logger
+from jitb.jitb_metrics import Metrics
+from jitb.jitb_validation import validate_pos_int
+
+
+# Indices into a TokenBucket's state
+_CAPACITY = 0  # Maximum number of tokens
+_TOKENS = 1    # Currently available tokens
+_UPDATED = 2   # Last time the bucket was refilled
+
+
+class TokenBucket:
+    """Refill capacity tokens per minute, one fraction of a token at a time.
+
+    Not thread-safe on its own.  The RateLimiter serializes access.
+    """
+
+    # Methods are listed in expected 'call order'.
+    def __init__(self, capacity: int, state: MutableSequence[float] = None) -> None:
+        """TokenBucket ctor.
+
+        Args:
+            capacity: Maximum number of tokens, refilled evenly over a minute.
+            state: Optional; Three floats to keep the bucket's state in (e.g., a shared
+                multiprocessing.Array from SharedBudget).  Initialized if the capacity is zero.
+        """
+        validate_pos_int(capacity, 'capacity')
+        self._state = state if state is not None else [0.0] * 3  # Capacity, tokens, updated
+        if not self._state[_CAPACITY]:
+            self._state[_CAPACITY] = float(capacity)
+            self._state[_TOKENS] = float(capacity)
+            self._state[_UPDATED] = time.monotonic()
+
+    def get_wait(self, amount: int) -> float:
+        """Seconds until amount tokens are available.  Never more than a minute."""
+        self._refill()
+        amount = min(amount, self._state[_CAPACITY])  # Never wait on more than a full bucket
+        return max(0.0, (amount - self._state[_TOKENS]) * 60 / self._state[_CAPACITY])
+
+    def take(self, amount: int) -> None:
+        """Remove amount tokens.  The bucket may go negative, delaying later callers."""
+        self._refill()
+        self._state[_TOKENS] -= min(amount, self._state[_CAPACITY])
+
+    def sync(self, limit: int = None, remaining: int = None) -> None:
+        """Synchronize the bucket with the server's view of the limit and remaining tokens."""
+        self._refill()
+        if limit:
+            self._state[_CAPACITY] = float(limit)
+        if remaining is not None:
+            self._state[_TOKENS] = min(self._state[_TOKENS], float(remaining))
+
+    # Private methods in alphabetical order.
+    def _refill(self) -> None:
+        """Add the tokens that have accumulated since the last refill."""
+        # LOCAL VARIABLES
+        now = time.monotonic()             # Current time
+        capacity = self._state[_CAPACITY]  # Maximum number of tokens
+
+        # REFILL IT
+        self._state[_TOKENS] = min(capacity, self._state[_TOKENS]
+                                   + (now - self._state[_UPDATED]) * capacity / 60)
+        self._state[_UPDATED] = now
+
+
+@dataclass
+class SharedBudget:
+    """One OpenAI rate limit budget shared by the RateLimiters of many processes.
+
+    Create it with create_shared_budget() in the parent process and pass it to each worker
+    process (e.g., as a multiprocessing.Process argument).
+    """
+    lock: Any                              # multiprocessing.Lock guarding the budget
+    requests: MutableSequence[float]       # Requests per minute TokenBucket state
+    tokens: MutableSequence[float]         # Tokens per minute TokenBucket state
+    blocked_until: MutableSequence[float]  # Monotonic time Retry-After says to wait until
+
+
+class RateLimiter:
+    """Throttle, and retry, OpenAI API calls.
+
+    Wrap each API call in call() (or acall()) along with an estimate of the tokens it will use.
+    Calls with_raw_response API methods so the rate limit headers can be read.  The API call is
+    passed a timeout keyword argument, the seconds left before the deadline, on every attempt.
+    The OpenAI client's own retries should be disabled (max_retries=0) so they don't count
+    against the deadline without backing off.
+
+    Typical Usage:
+        limiter = RateLimiter()
+        completion = limiter.call(partial(client.chat.completions.with_raw_response.create, ...),
+                                  tokens=100)
+    """
+
+    # Methods are listed in expected 'call order'.
+    def __init__(self, rpm: int = JITB_RATE_LIMIT_RPM, tpm: int = JITB_RATE_LIMIT_TPM,
+                 deadline: float = JITB_REQUEST_DEADLINE, budget: SharedBudget = None) -> None:
+        """RateLimiter ctor.
+
+        Args:
+            rpm: Optional; Requests per minute.  Updated by x-ratelimit-limit-requests.
+            tpm: Optional; Tokens per minute.  Updated by x-ratelimit-limit-tokens.
+            deadline: Optional; Seconds each call() may take, including waits and retries.
+            budget: Optional; Share this budget with other processes instead of keeping a
+                private one.  Its limits take precedence over rpm and tpm.
+
+        Raises:
+            TypeError: Bad data type.
+            ValueError: Invalid value.
+        """
+        # INPUT VALIDATION
+        validate_type(deadline, 'deadline', (int, float))
+        if deadline <= 0:
+            raise ValueError(f'The deadline must be a positive number instead of {deadline}')
+        if budget is not None:
+            validate_type(budget, 'budget', SharedBudget)
+        else:
+            # --pipeline requests are made in worker threads
+            budget = SharedBudget(lock=threading.Lock(), requests=[0.0] * 3, tokens=[0.0] * 3,
+                                  blocked_until=[0.0])
+
+        # SETUP
+        self._requests = TokenBucket(rpm, state=budget.requests)  # Requests per minute
+        self._tokens = TokenBucket(tpm, state=budget.tokens)      # Tokens per minute
+        self._deadline = deadline                                 # Seconds each call may take
+        self._blocked_until = budget.blocked_until                # Retry-After monotonic time
+        self._lock = budget.lock                                  # Serializes budget access
+
+    def call(self, api_call: Callable[..., Any], tokens: int) -> Any:
+        """Make a throttled API call, retrying 429s and 5xxs until the deadline passes.
+
+        Args:
+            api_call: Makes the with_raw_response API call.  Called with a timeout keyword
+                argument: the number of seconds left before the deadline.
+            tokens: Estimated number of tokens the API call will use.
+
+        Returns:
+            The parsed API response.
+
+        Raises:
+            TimeoutError: The deadline passed before the API call succeeded.
+        """
+        # LOCAL VARIABLES
+        deadline = time.monotonic() + self._deadline  # Monotonic time this call must finish by
+        attempt = 0                                    # Retry attempt number
+        raw_response = None                            # Raw API response
+
+        # CALL IT
+        while True:
+            time.sleep(self._reserve(tokens=tokens, deadline=deadline))
+            try:
+                raw_response = api_call(timeout=self._get_timeout(deadline=deadline))
+                break
+            except APITimeoutError as err:
+                raise TimeoutError(f'OpenAI did not answer within {self._deadline} '
+                                   'seconds') from err
+            except (APIConnectionError, APIStatusError) as err:
+                time.sleep(self._backoff(err=err, attempt=attempt, deadline=deadline))
+                attempt += 1
+
+        # DONE
+        self._sync(raw_response.headers)
+        return raw_response.parse()
+
+    async def acall(self, api_call: Callable[..., Awaitable[Any]], tokens: int) -> Any:
+        """Asynchronous call()."""
+        # LOCAL VARIABLES
+        deadline = time.monotonic() + self._deadline  # Monotonic time this call must finish by
+        attempt = 0                                    # Retry attempt number
+        raw_response = None                            # Raw API response
+
+        # CALL IT
+        while True:
+            await asyncio.sleep(self._reserve(tokens=tokens, deadline=deadline))
+            try:
+                raw_response = await api_call(timeout=self._get_timeout(deadline=deadline))
+                break
+            except APITimeoutError as err:
+                raise TimeoutError(f'OpenAI did not answer within {self._deadline} '
+                                   'seconds') from err
+            except (APIConnectionError, APIStatusError) as err:
+                await asyncio.sleep(self._backoff(err=err, attempt=attempt, deadline=deadline))
+                attempt += 1
+
+        # DONE
+        self._sync(raw_response.headers)
+        return raw_response.parse()
+
+    def get_deadline(self) -> float:
+        """Report the number of seconds each call() may take, including waits and retries."""
+        return self._deadline
+
+    # Private methods in alphabetical order.
+    def _backoff(self, err: Exception, attempt: int, deadline: float) -> float:
+        """Decide how long to wait before retrying a failed API call.
+
+        Honors Retry-After, and the rate limit headers, when the server provides them.
+        Otherwise, waits a jittered exponential backoff.
+
+        Returns:
+            Number of seconds to sleep.
+
+        Raises:
+            The original err if it can't be retried.
+            TimeoutError: Retrying would pass the deadline.
+        """
+        # LOCAL VARIABLES
+        headers = {}  # Error response headers
+        delay = 0.0   # Seconds to wait
+
+        # CHECK IT
+        if isinstance(err, APIStatusError):
+            if err.status_code == 429:
+                Metrics.inc('jitb_ai_rate_limited_total')
+            elif err.status_code < 500:
+                raise err  # Retrying won't help
+            headers = err.response.headers
+            self._sync(headers)
+        delay = _parse_retry_after(headers)
+        if delay is None:
+            delay = random.uniform(0, min(JITB_BACKOFF_MAX, JITB_BACKOFF_BASE * 2 ** attempt))
+        with self._lock:
+            self._blocked_until[0] = max(self._blocked_until[0], time.monotonic() + delay)
+        if time.monotonic() + delay > deadline:
+            raise TimeoutError(f'OpenAI did not answer within {self._deadline} seconds') from err
+
+        # DONE
+        Logger.debug('Retrying OpenAI in %.2f seconds (attempt %d): %s', delay, attempt + 1, err)
+        return delay
+
+    def _get_timeout(self, deadline: float) -> float:
+        """Seconds left before the deadline, for the next attempt's HTTP request.
+
+        Raises:
+            TimeoutError: The deadline already passed.
+        """
+        # LOCAL VARIABLES
+        timeout = deadline - time.monotonic()  # Seconds left
+
+        # CHECK IT
+        if timeout <= 0:
+            raise TimeoutError(f'OpenAI did not answer within {self._deadline} seconds')
+
+        # DONE
+        return timeout
+
+    def _reserve(self, tokens: int, deadline: float) -> float:
+        """Reserve capacity for an API call.
+
+        Returns:
+            Number of seconds to sleep before making the API call.
+
+        Raises:
+            TimeoutError: Waiting would pass the deadline.
+        """
+        # LOCAL VARIABLES
+        wait = 0.0  # Seconds to wait
+
+        # RESERVE IT
+        with self._lock:
+            wait = max(self._blocked_until[0] - time.monotonic(), self._requests.get_wait(1),
+                       self._tokens.get_wait(tokens), 0.0)
+            if time.monotonic() + wait > deadline:
+                raise TimeoutError(f'OpenAI rate limits would exceed the {self._deadline} '
+                                   'second deadline')
+            self._requests.take(1)
+            self._tokens.take(tokens)
+
+        # DONE
+        if wait:
+            Logger.debug('Waiting %.2f seconds for the OpenAI rate limits', wait)
+        return wait
+
+    def _sync(self, headers: Dict[str, str]) -> None:
+        """Synchronize the buckets with the x-ratelimit-* headers."""
+        with self._lock:
+            self._requests.sync(limit=_parse_int(headers.get('x-ratelimit-limit-requests')),
+                                remaining=_parse_int(
+                                    headers.get('x-ratelimit-remaining-requests')))
+            self._tokens.sync(limit=_parse_int(headers.get('x-ratelimit-limit-tokens')),
+                              remaining=_parse_int(headers.get('x-ratelimit-remaining-tokens')))
+
+
+def create_shared_budget(rpm: int = JITB_RATE_LIMIT_RPM, tpm: int = JITB_RATE_LIMIT_TPM,
+                         context: Any = None) -> SharedBudget:
+    """Create a rate limit budget, in shared memory, for RateLimiters in many processes.
+
+    Args:
+        rpm: Optional; Requests per minute shared by every process.
+        tpm: Optional; Tokens per minute shared by every process.
+        context: Optional; The multiprocessing context the worker processes will be started
+            with.  Defaults to the default multiprocessing context.
+    """
+    # LOCAL VARIABLES
+    budget = None  # Shared budget
+
+    # CREATE IT
+    if context is None:
+        context = multiprocessing.get_context()
+    budget = SharedBudget(lock=context.Lock(), requests=context.Array('d', 3, lock=False),
+                          tokens=context.Array('d', 3, lock=False),
+                          blocked_until=context.Array('d', 1, lock=False))
+
+    # INITIALIZE IT
+    TokenBucket(rpm, state=budget.requests)
+    TokenBucket(tpm, state=budget.tokens)
+
+    # DONE
+    return budget
+
+
+def estimate_tokens(messages: list, max_tokens: int) -> int:
+    """Estimate the tokens a chat completion will use (roughly four characters per token)."""
+    return sum(len(str(message.get('content', ''))) for message in messages) // 4 + max_tokens
+
+
+def _parse_duration(duration: str) -> float:
+    """Convert an OpenAI reset duration (e.g., '6m0s', '20ms', '1.5s') into seconds."""
+    # LOCAL VARIABLES
+    units = {'h': 3600.0, 'm': 60.0, 's': 1.0, 'ms': 0.001}  # Seconds per unit
+    seconds = 0.0                                               # Total duration
+
+    # PARSE IT
+    for number, unit in re.findall(r'(\d+(?:\.\d+)?)(ms|h|m|s)', duration):
+        seconds += float(number) * units[unit]
+
+    # DONE
+    return seconds
+
+
+def _parse_int(value: str) -> int:
+    """Convert a header value into an int, or None."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_retry_after(headers: Dict[str, str]) -> float:
+    """Read the number of seconds the server asked us to wait, if any.
+
+    Returns:
+        Seconds to wait, or None if the server didn't say.
+    """
+    # LOCAL VARIABLES
+    delay = None  # Seconds to wait
+
+    # PARSE IT
+    if headers.get('retry-after-ms'):
+        delay = float(_parse_int(headers.get('retry-after-ms')) or 0) / 1000
+    elif headers.get('retry-after'):
+        try:
+            delay = float(headers.get('retry-after'))
+        except ValueError:
+            delay = None  # HTTP-date form; Fall back to the reset headers
+    if delay is None and _parse_int(headers.get('x-ratelimit-remaining-requests')) == 0:
+        delay = _parse_duration(headers.get('x-ratelimit-reset-requests', ''))
+    if delay is None and _parse_int(headers.get('x-ratelimit-remaining-tokens')) == 0:
+        delay = _parse_duration(headers.get('x-ratelimit-reset-tokens', ''))
+
+    # DONE
+    return delay
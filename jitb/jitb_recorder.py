@@ -0,0 +1,300 @@
+"""Records game sessions so they can be replayed, offline, to reproduce bugs.
+
+The --record command line argument writes a session file, gzipped JSON Lines, to the temporary
+directory.  Every line is one event, timestamped with the seconds since the recording started:
+
+    {"t": 0.0, "type": "start", "jitb": "2.0.0"}
+    {"t": 0.8, "type": "game", "game": "Quiplash 3", "players": {"<window handle>": "JITB"}}
+    {"t": 1.2, "type": "dom", "id": "<sha256>", "html": "<!DOCTYPE html><html>...</html>"}
+    {"t": 1.2, "type": "tick", "handle": "<window handle>", "url": "...", "dom": "<sha256>"}
+    {"t": 1.3, "type": "ai", "messages": [...], "max_tokens": 50, "response": "...",
+     "latency": 0.9}
+    {"t": 2.3, "type": "input", "handle": "<window handle>", "action": "send_keys", "text": "..."}
+
+A tick is recorded before every JbgAbc.play() call.  Each distinct DOM is only stored once, the
+first time it's seen.  The DOM is the page as rendered: elements which aren't laid out carry the
+hidden attribute, the rest carry their computed display (and any change in visibility or
+text-transform) as an inline style, and the scripts and stylesheets are dropped, so the page
+reads the same without them.
+
+Replay a session with: python -m test.replayer <session file>
+"""
+# Standard
+from datetime import datetime
+from typing import Any, Dict, Final, List
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+# Third Party
+from hobo.validation import validate_string, validate_type
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+import selenium
+# Local
+from jitb.jitb_logger import Logger
+from jitb.jitb_misc import determine_tmp_dir, get_jitb_version
+from jitb.jitb_validation import validate_web_driver
+
+
+# Executed by Recorder.record_tick() to read the page, as rendered, in a single round trip
+_RECORD_DOM_JS: Final[str] = '''
+const live = document.documentElement.getElementsByTagName('*');
+const clone = document.documentElement.cloneNode(true);
+const copies = clone.getElementsByTagName('*');
+const dropped = [];
+const unrendered = ['HEAD', 'TITLE', 'META', 'BASE', 'TEMPLATE', 'NOSCRIPT'];
+for (let i = 0; i < live.length; i++) {
+    const elem = live[i];
+    const copy = copies[i];
+    if (elem.tagName === 'SCRIPT' || elem.tagName === 'STYLE' || elem.tagName === 'LINK') {
+        dropped.push(copy);
+        continue;
+    } else if (unrendered.includes(elem.tagName)) {
+        continue;
+    }
+    const style = window.getComputedStyle(elem);
+    if (elem.getClientRects().length === 0 && style.display !== 'contents') {
+        copy.setAttribute('hidden', '');
+        continue;
+    }
+    const parent = elem.parentElement ? window.getComputedStyle(elem.parentElement) :
+        {visibility: 'visible', textTransform: 'none'};
+    let inline = 'display: ' + style.display;
+    if (style.visibility !== parent.visibility) {
+        inline += '; visibility: ' + style.visibility;
+    }
+    if (style.textTransform !== parent.textTransform) {
+        inline += '; text-transform: ' + style.textTransform;
+    }
+    copy.setAttribute('style', inline);
+    if (elem.tagName === 'INPUT') {
+        copy.setAttribute('value', elem.value);
+    } else if (elem.tagName === 'TEXTAREA') {
+        copy.textContent = elem.value;
+    }
+}
+dropped.forEach(function (copy) { copy.remove(); });
+return {url: window.location.href, html: '<!DOCTYPE html>' + clone.outerHTML};
+'''
+
+
+class RecordingWebElement(WebElement):
+    """Records every click, keystroke, and clear before passing it along to the page."""
+
+    def clear(self) -> None:
+        """Clear this text entry element."""
+        Recorder.record_input(action='clear')
+        super().clear()
+
+    def click(self) -> None:
+        """Click this element."""
+        Recorder.record_input(action='click', text=_read_text(self))
+        super().click()
+
+    def send_keys(self, *value: str) -> None:
+        """Type into this element."""
+        Recorder.record_input(action='send_keys', text=''.join(str(keys) for keys in value))
+        super().send_keys(*value)
+
+
+class Recorder():
+    """Session recording class for the package.
+
+    Only one session is recorded per process.  The record_*() methods do nothing unless a
+    recording was started.
+    """
+
+    _file = None              # The open session file
+    _filename = ''            # Absolute session filename
+    _lock = threading.Lock()  # Serializes writes (e.g., --pipeline threads make AI requests)
+    _start = 0.0              # When the recording started, in perf_counter() seconds
+    _doms = set()             # IDs of the DOMs already written
+    _handle = None            # Window handle of the current tick
+
+    @staticmethod
+    def start(filename: str = None) -> str:
+        """Start recording a session.
+
+        Args:
+            filename: Optional; Where to write the session.  Defaults to
+                jitb_session_YYYYMMDD_HHMMSS.jsonl.gz in the temporary directory.
+
+        Returns:
+            The session's absolute filename.
+
+        Raises:
+            RuntimeError: A session is already being recorded.
+            TypeError: Bad data type.
+            ValueError: Empty filename.
+        """
+        # INPUT VALIDATION
+        if Recorder._file:
+            raise RuntimeError(f'Already recording a session to {Recorder._filename}')
+        if filename is None:
+            filename = os.path.join(determine_tmp_dir(), datetime.now().strftime(
+                'jitb_session_%Y%m%d_%H%M%S.jsonl.gz'))
+        validate_string(filename, 'filename', can_be_empty=False)
+
+        # START IT
+        Recorder._filename = os.path.abspath(filename)
+        Recorder._file = gzip.open(Recorder._filename, 'wt', encoding='utf-8')
+        Recorder._start = time.perf_counter()
+        Recorder._doms = set()
+        Recorder._handle = None
+        Recorder._write(type='start', jitb=get_jitb_version())
+        Logger.debug('Recording this session to %s', Recorder._filename)
+
+        # DONE
+        return Recorder._filename
+
+    @staticmethod
+    def get_filename() -> str:
+        """The absolute filename of the session being recorded, or last recorded."""
+        return Recorder._filename
+
+    @staticmethod
+    def is_recording() -> bool:
+        """Is a session being recorded?"""
+        return Recorder._file is not None
+
+    @staticmethod
+    def record_ai(messages: List[dict], max_tokens: int, response: str, latency: float) -> None:
+        """Record one JitbAi request, and its response.
+
+        Args:
+            messages: Every message sent, base messages included.
+            max_tokens: The maximum number of tokens requested.
+            response: The message content received.
+            latency: Seconds the request took.
+        """
+        if Recorder._file:
+            Recorder._write(type='ai', messages=messages, max_tokens=max_tokens,
+                            response=response, latency=round(latency, 3))
+
+    @staticmethod
+    def record_game(web_driver: selenium.webdriver.chrome.webdriver.WebDriver, game: str,
+                    players: Dict[str, str]) -> None:
+        """Record the game being played and start recording web_driver's clicks and keystrokes.
+
+        Args:
+            web_driver: The web driver playing the game.  Only elements found from now on are
+                recorded.
+            game: The game being played (e.g., Quiplash 3).
+            players: The username (None for a manual login) playing in each window handle.
+        """
+        if Recorder._file:
+            validate_web_driver(web_driver=web_driver)
+            validate_string(game, 'game', can_be_empty=False)
+            validate_type(players, 'players', dict)
+            web_driver._web_element_cls = RecordingWebElement  # pylint: disable=protected-access
+            Recorder._write(type='game', game=game, players=players)
+
+    @staticmethod
+    def record_input(action: str, text: str = '') -> None:
+        """Record a click, keystroke, or clear in the current tick's window.
+
+        Args:
+            action: click, send_keys, or clear.
+            text: Optional; The keys sent or, for clicks, the element's text.
+        """
+        if Recorder._file:
+            Recorder._write(type='input', handle=Recorder._handle, action=action, text=text)
+
+    @staticmethod
+    def record_tick(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                    handle: str) -> None:
+        """Record the page web_driver is about to play() in a single round trip.
+
+        Args:
+            web_driver: The web driver about to play().
+            handle: The window handle web_driver is on.
+        """
+        # LOCAL VARIABLES
+        page = None   # The page's URL and rendered DOM
+        dom_id = ''   # The DOM's SHA-256 digest
+
+        # RECORD IT
+        if not Recorder._file:
+            return
+        Recorder._handle = handle
+        try:
+            page = web_driver.execute_script(_RECORD_DOM_JS)
+        except WebDriverException as err:
+            Logger.debug('Failed to record the page with %r', err)
+            return
+        if not isinstance(page, dict) or not isinstance(page.get('html'), str):
+            Logger.debug('The record script returned an unexpected %s', type(page))
+            return
+        dom_id = hashlib.sha256(page['html'].encode('utf-8')).hexdigest()
+        if dom_id not in Recorder._doms:
+            Recorder._doms.add(dom_id)
+            Recorder._write(type='dom', id=dom_id, html=page['html'])
+        Recorder._write(type='tick', handle=handle, url=page.get('url'), dom=dom_id)
+
+    @staticmethod
+    def stop() -> None:
+        """Stop recording the session, if one is being recorded."""
+        with Recorder._lock:
+            if Recorder._file:
+                Recorder._file.close()
+                Recorder._file = None
+                Logger.debug('Recorded this session to %s', Recorder._filename)
+
+    @staticmethod
+    def _write(**event: Any) -> None:
+        """Timestamp, write, and flush one event."""
+        with Recorder._lock:
+            if Recorder._file:
+                Recorder._file.write(json.dumps({'t': round(time.perf_counter()
+                                                            - Recorder._start, 3), **event})
+                                     + '\n')
+                Recorder._file.flush()  # Readable up to here, even if JITB dies
+
+
+def load_session(filename: str) -> List[Dict[str, Any]]:
+    """Read the events of a session recorded by Recorder.
+
+    Args:
+        filename: The session file.
+
+    Returns:
+        The session's events, in the order they were recorded.
+
+    Raises:
+        TypeError: Bad data type.
+        ValueError: Empty filename or a corrupt session.
+        OSError: The file couldn't be read.
+    """
+    # LOCAL VARIABLES
+    events = []  # The session's events
+
+    # INPUT VALIDATION
+    validate_string(filename, 'filename', can_be_empty=False)
+
+    # READ IT
+    with gzip.open(filename, 'rt', encoding='utf-8') as in_file:
+        try:
+            for line in in_file:
+                if not line.endswith('\n'):
+                    raise EOFError('The last event was only partially written')
+                events.append(json.loads(line))
+        except EOFError:
+            Logger.debug('%s was cut off (e.g., JITB was killed) but was read', filename)
+        except (json.JSONDecodeError, gzip.BadGzipFile) as err:
+            raise ValueError(f'{filename} is not a JITB session') from err
+    if not events or events[0].get('type') != 'start':
+        raise ValueError(f'{filename} is not a JITB session')
+
+    # DONE
+    return events
+
+
+def _read_text(element: WebElement) -> str:
+    """Read an element's visible text, for the record, without letting a failure stop a click."""
+    try:
+        return element.text
+    except WebDriverException:
+        return ''
@@ -110,7 +110,7 @@ def get_sub_element(web_element: selenium.webdriver.remote.webelement.WebElement
     try:
         element = _get_element(web_thing=web_element, by_arg=by_arg, value=value)
     except (NoSuchElementException, StaleElementReferenceException) as err:
-        Logger.debug(f'get_sub_element() getting {by_arg}:{value} raised {repr(err)}!')
+        Logger.debug('get_sub_element() getting %s:%s raised %r!', by_arg, value, err)
 
     # DONE
     return element
@@ -143,7 +143,7 @@ def get_web_element(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
     try:
         element = _get_element(web_thing=web_driver, by_arg=by_arg, value=value)
     except (NoSuchElementException, StaleElementReferenceException) as err:
-        Logger.debug(f'get_web_element() getting {by_arg}:{value} raised {repr(err)}!')
+        Logger.debug('get_web_element() getting %s:%s raised %r!', by_arg, value, err)
 
     # DONE
     return element
@@ -176,7 +176,7 @@ def get_web_elements(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
     try:
         elem_list = _get_elements(web_thing=web_driver, by_arg=by_arg, value=value)
     except (NoSuchElementException, StaleElementReferenceException) as err:
-        Logger.debug(f'get_web_elements() getting {by_arg}:{value} raised {repr(err)}!')
+        Logger.debug('get_web_elements() getting %s:%s raised %r!', by_arg, value, err)
 
     # DONE
     return elem_list
@@ -211,12 +211,12 @@ def get_web_element_int(web_driver: selenium.webdriver.chrome.webdriver.WebDrive
     try:
         elem_text = get_web_element_text(web_driver=web_driver, by_arg=by_arg, value=value)
     except (NoSuchElementException, StaleElementReferenceException) as err:
-        Logger.debug(f'get_web_element_int() getting {by_arg}:{value} raised {repr(err)}!')
+        Logger.debug('get_web_element_int() getting %s:%s raised %r!', by_arg, value, err)
     else:
         if elem_text:
             elem_int = convert_str_to_int(elem_text)
             if elem_int is None:
-                Logger.debug(f'get_web_element_int() failed to convert {elem_text} to an int')
+                Logger.debug('get_web_element_int() failed to convert %s to an int', elem_text)
 
     # DONE
     return elem_int
@@ -248,7 +248,7 @@ def get_web_element_text(web_driver: selenium.webdriver.chrome.webdriver.WebDriv
     try:
         element = get_web_element(web_driver=web_driver, by_arg=by_arg, value=value)
     except (NoSuchElementException, StaleElementReferenceException) as err:
-        Logger.debug(f'get_web_element_text() getting {by_arg}:{value} raised {repr(err)}!')
+        Logger.debug('get_web_element_text() getting %s:%s raised %r!', by_arg, value, err)
     else:
         if element:
             elem_text = element.text
@@ -286,7 +286,7 @@ def _get_element(web_thing: Any, by_arg: str = By.ID, value: str = None) \
             except NoSuchElementException:
                 pass  # Too verbose in the debug log
             except StaleElementReferenceException as err:
-                Logger.debug(f'_get_element() {by_arg}:{value} raised {repr(err)}!')
+                Logger.debug('_get_element() %s:%s raised %r!', by_arg, value, err)
 
     # DONE
     return element
@@ -319,9 +319,9 @@ def _get_elements(web_thing: Any, by_arg: str = By.ID, value: str = None) \
             try:
                 elements = get_it(by=by_arg, value=value)
             except (NoSuchElementException, StaleElementReferenceException) as err:
-                Logger.debug(f'_get_elements() {by_arg}:{value} raised {repr(err)}!')
+                Logger.debug('_get_elements() %s:%s raised %r!', by_arg, value, err)
     else:
-        Logger.debug(f'_get_elements() reports the web thing had no attr {attr_name}!')
+        Logger.debug('_get_elements() reports the web thing had no attr %s!', attr_name)
 
     # DONE
     return elements
@@ -0,0 +1,201 @@
+"""Defines a single-round-trip snapshot of a jackbox.tv web page.
+
+Every find_element() and .text call is an HTTP round trip to the WebDriver.  Identifying a page
+can require dozens of them.  take_snapshot() reads everything JITB needs to identify a page with
+one execute_script() call and stores it in a PageSnapshot.  The jitb_webdriver functions
+accept an optional PageSnapshot and will read from it instead of the live web driver.
+"""
+
+# Standard
+from dataclasses import dataclass, field
+from typing import Dict, Final, List, Tuple
+# Third Party
+from hobo.validation import validate_list, validate_string
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+import selenium
+# Local
+from jitb.jitb_logger import Logger
+from jitb.jitb_validation import validate_web_driver
+
+
+# Default (By, value) locators whose visible text take_snapshot() reads
+SNAPSHOT_LOCATORS: Final[List[Tuple[str, str]]] = [(By.ID, 'prompt'),
+                                                   (By.ID, 'charactersPrompt'),
+                                                   (By.ID, 'state-answer-question'),
+                                                   (By.ID, 'vote-text'),
+                                                   (By.ID, 'question-text'),
+                                                   (By.ID, 'swal2-title'),
+                                                   (By.CLASS_NAME, 'charRemaining')]
+# Default input field IDs whose maxlength attribute take_snapshot() reads
+SNAPSHOT_MAX_LENGTH_IDS: Final[List[str]] = ['quiplash-answer-input', 'input-text-textarea']
+# Element IDs which, together, indicate the jackbox.tv login page
+SNAPSHOT_LOGIN_IDS: Final[List[str]] = ['roomcode', 'username', 'button-join']
+# Supported By values for SNAPSHOT_LOCATORS entries
+SNAPSHOT_BY_VALUES: Final[List[str]] = [By.ID, By.CLASS_NAME, By.TAG_NAME, By.CSS_SELECTOR]
+# Executed by take_snapshot().  Hidden elements report empty text, just like WebElement.text.
+_SNAPSHOT_JS: Final[str] = '''
+const locators = arguments[0];
+const maxLengthIds = arguments[1];
+const loginIds = arguments[2];
+const errorList = arguments[3];
+const findOne = function (by, value) {
+    if (by === 'id') {
+        return document.getElementById(value);
+    } else if (by === 'class name') {
+        return document.getElementsByClassName(value)[0] || null;
+    } else if (by === 'tag name') {
+        return document.getElementsByTagName(value)[0] || null;
+    }
+    return document.querySelector(value);
+};
+const visibleText = function (elem) {
+    return elem.getClientRects().length === 0 ? '' : elem.innerText;
+};
+const texts = {};
+locators.forEach(function (locator) {
+    const elem = findOne(locator[0], locator[1]);
+    texts[locator[0] + ':' + locator[1]] = elem === null ? null : visibleText(elem);
+});
+const maxLengths = {};
+maxLengthIds.forEach(function (elemId) {
+    const elem = document.getElementById(elemId);
+    maxLengths[elemId] = elem === null ? null : elem.getAttribute('maxlength');
+});
+const buttons = Array.from(document.getElementsByTagName('button')).map(function (button) {
+    const text = visibleText(button);
+    return {text: text, enabled: !button.disabled,
+            accessible_name: (button.getAttribute('aria-label') || text || '').trim()};
+});
+const source = document.documentElement.outerHTML.toLowerCase();
+return {
+    texts: texts,
+    buttons: buttons,
+    max_lengths: maxLengths,
+    errors: errorList.filter(function (error) { return source.includes(error.toLowerCase()); }),
+    login: loginIds.every(function (elemId) { return document.getElementById(elemId) !== null; })
+};
+'''
+
+
+@dataclass
+class ButtonSnapshot:
+    """The state of one button element at the time of the snapshot."""
+    text: str              # Visible text, empty if hidden (just like WebElement.text)
+    enabled: bool          # Mirrors WebElement.is_enabled()
+    accessible_name: str   # The aria-label, if defined, otherwise the visible text
+
+
+@dataclass
+class PageSnapshot:
+    """Everything JITB needs to identify a jackbox.tv page, read with a single WebDriver call."""
+    # Visible text, keyed by snapshot_key(), for each locator.  None if the element wasn't found.
+    texts: Dict[str, str] = field(default_factory=dict)
+    buttons: List[ButtonSnapshot] = field(default_factory=list)  # All button elements, in order
+    # Raw maxlength attribute values, keyed by element ID.  None if the element wasn't found.
+    max_lengths: Dict[str, str] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)  # Error list entries found in the page source
+    login: bool = False                              # All the SNAPSHOT_LOGIN_IDS were found
+
+    def get_max_length(self, element_id: str) -> str:
+        """Get the raw maxlength attribute value for element_id.
+
+        Returns:
+            The maxlength attribute string, None if the element (or attribute) wasn't found.
+        """
+        return self.max_lengths.get(element_id)
+
+    def get_text(self, element_name: str, element_type: str = By.ID) -> str:
+        """Get the visible text for an element.
+
+        Args:
+            element_name: The element name (e.g., prompt).
+            element_type: Optional; The element type (e.g., By.ID).
+
+        Returns:
+            A string, which could be empty, if found.  None otherwise.
+        """
+        return self.texts.get(snapshot_key(element_name=element_name,
+                                           element_type=element_type))
+
+    def has_max_length(self, element_id: str) -> bool:
+        """Determine if this snapshot read the maxlength attribute of element_id."""
+        return element_id in self.max_lengths
+
+    def has_text(self, element_name: str, element_type: str = By.ID) -> bool:
+        """Determine if this snapshot read the text of the element_type element_name."""
+        return snapshot_key(element_name=element_name, element_type=element_type) in self.texts
+
+
+def snapshot_key(element_name: str, element_type: str = By.ID) -> str:
+    """Standardize the PageSnapshot.texts key for an element (e.g., 'id:prompt')."""
+    return f'{element_type}:{element_name}'
+
+
+def take_snapshot(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                  error_list: List[str] = None,
+                  locators: List[Tuple[str, str]] = None,
+                  max_length_ids: List[str] = None) -> PageSnapshot:
+    """Read the current state of web_driver's page with a single execute_script() call.
+
+    Args:
+        web_driver: The web driver to take a snapshot of.
+        error_list: Optional; Case-insensitive error strings to search the page source for.
+        locators: Optional; A list of (By, value) tuples whose text should be read.
+            Defaults to SNAPSHOT_LOCATORS.  See SNAPSHOT_BY_VALUES for supported By values.
+        max_length_ids: Optional; A list of element IDs whose maxlength attribute should be read.
+            Defaults to SNAPSHOT_MAX_LENGTH_IDS.
+
+    Returns:
+        A PageSnapshot on success, None if the script failed (e.g., mid-navigation).  Callers
+        should fall back to live web driver lookups on None.
+
+    Raises:
+        TypeError: Bad data type.
+        ValueError: Invalid value.
+    """
+    # LOCAL VARIABLES
+    snapshot = None  # The PageSnapshot to return
+    raw_snap = None  # The raw object returned by the script
+
+    # INPUT VALIDATION
+    validate_web_driver(web_driver=web_driver)
+    error_list = _validate_str_list(error_list, 'error_list', [])
+    max_length_ids = _validate_str_list(max_length_ids, 'max_length_ids', SNAPSHOT_MAX_LENGTH_IDS)
+    if locators is None:
+        locators = SNAPSHOT_LOCATORS
+    validate_list(locators, 'locators', can_be_empty=True)
+    for by_arg, value in locators:
+        if by_arg not in SNAPSHOT_BY_VALUES:
+            raise ValueError(f'Unsupported snapshot locator type: {by_arg}')
+        validate_string(value, 'locators value', can_be_empty=False)
+
+    # TAKE IT
+    try:
+        raw_snap = web_driver.execute_script(_SNAPSHOT_JS, [list(loc) for loc in locators],
+                                             max_length_ids, SNAPSHOT_LOGIN_IDS, error_list)
+    except WebDriverException as err:
+        Logger.debug('Failed to take a page snapshot with %r', err)
+    else:
+        if isinstance(raw_snap, dict):
+            snapshot = PageSnapshot(texts=raw_snap.get('texts', {}),
+                                    buttons=[ButtonSnapshot(**button)
+                                             for button in raw_snap.get('buttons', [])],
+                                    max_lengths=raw_snap.get('max_lengths', {}),
+                                    errors=raw_snap.get('errors', []),
+                                    login=bool(raw_snap.get('login', False)))
+        else:
+            Logger.debug('The page snapshot script returned an unexpected %s', type(raw_snap))
+
+    # DONE
+    return snapshot
+
+
+def _validate_str_list(str_list: List[str], param_name: str, default: List[str]) -> List[str]:
+    """Validate an optional list of non-empty strings, returning default if str_list is None."""
+    if str_list is None:
+        str_list = default
+    validate_list(str_list, param_name, can_be_empty=True)
+    for entry in str_list:
+        validate_string(entry, f'{param_name} entry', can_be_empty=False)
+    return str_list
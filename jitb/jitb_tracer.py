@@ -0,0 +1,296 @@
+"""Times each phase of a round, by page type, on behalf of the package.
+
+The --trace command line argument times every play(), id_page(), generate_ai_answer(),
+write_an_answer(), and click_a_button() call as a span.  Each span is counted in a fixed-bucket
+histogram (see: JITB_TRACE_BUCKETS) for its phase and page type: the JbgPageIds most recently
+returned by id_page().  When Logger.shutdown() runs, the p50/p95/p99 of each phase and page type
+is logged and the raw spans are dumped, as JSON, beside the debug log:
+jitb_YYYYMMDD_HHMMSS-#_spans.json.
+
+Percentiles are estimated from the histogram buckets, so they're only as precise as the bucket
+they fall in.  Until tracing is enabled, a traced call costs one attribute check.
+
+Typical Usage:
+    @Tracer.traced('play')
+    def play(self, web_driver): ...
+
+    with Tracer.span('wait_for_page_change'):
+        ...
+"""
+# Standard
+from bisect import bisect_left
+from contextlib import nullcontext
+from functools import wraps
+from typing import Any, Callable, Final, List, Tuple
+import json
+import math
+import os
+import threading
+import time
+# Third Party
+from hobo.validation import validate_string, validate_type
+# Local
+from jitb.jbgames.jbg_page_ids import JbgPageIds
+from jitb.jitb_globals import JITB_TRACE_BUCKETS, JITB_TRACE_MAX_SPANS
+from jitb.jitb_logger import Logger
+from jitb.jitb_misc import determine_tmp_dir
+
+
+TRACE_PERCENTILES: Final[Tuple[int, ...]] = (50, 95, 99)  # Percentiles to report
+_NULL_SPAN: Final[nullcontext] = nullcontext()            # What span() returns when disabled
+
+
+class _Span:  # pylint: disable = too-few-public-methods
+    """Times one phase, from __enter__() to __exit__(), on behalf of Tracer.span()."""
+
+    def __init__(self, phase: str) -> None:
+        """Class ctor."""
+        self._phase = phase  # The phase being timed
+        self._start = 0.0    # When the phase started, in perf_counter() seconds
+
+    def __enter__(self) -> '_Span':
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        Tracer.record(phase=self._phase, start=self._start,
+                      seconds=time.perf_counter() - self._start)
+
+
+class Tracer():
+    """Span tracing class for the package.
+
+    The span(), traced(), and record() methods do nothing until enable() is called.
+    """
+
+    _enabled = False            # Tracing status
+    _lock = threading.Lock()    # Serializes updates (e.g., --pipeline threads make AI requests)
+    _origin = 0.0               # When tracing was enabled, in perf_counter() seconds
+    _page = JbgPageIds.UNKNOWN  # The page type most recently identified
+    _histograms = {}            # Bucket counts, by (phase, page name)
+    _spans = []                 # Raw spans, in the order they ended
+    _dropped = 0                # Spans not kept once there were JITB_TRACE_MAX_SPANS of them
+
+    @staticmethod
+    def enable() -> None:
+        """Start tracing, and report the results when Logger.shutdown() runs."""
+        if not Tracer._enabled:
+            with Tracer._lock:
+                Tracer._origin = time.perf_counter()
+                Tracer._page = JbgPageIds.UNKNOWN
+                Tracer._histograms = {}
+                Tracer._spans = []
+                Tracer._dropped = 0
+                Tracer._enabled = True
+            Logger.add_shutdown_hook(Tracer._shutdown)
+
+    @staticmethod
+    def disable() -> None:
+        """Stop tracing.  The results are kept until the next enable()."""
+        Tracer._enabled = False
+
+    @staticmethod
+    def get_report() -> List[str]:
+        """Format the estimated percentiles of each phase and page type as a table.
+
+        Returns:
+            The table's lines, sorted by phase and page name, or an empty list if nothing was
+            traced.
+        """
+        # LOCAL VARIABLES
+        lines = []       # The table
+        histograms = {}  # Copy of the bucket counts
+
+        # FORMAT IT
+        with Tracer._lock:
+            histograms = {key: list(counts) for key, counts in Tracer._histograms.items()}
+        if histograms:
+            lines.append(f'{"phase":<20} {"page":<16} {"count":>7}'
+                         + ''.join(f' {f"p{percent}":>8}' for percent in TRACE_PERCENTILES))
+            for (phase, page), counts in sorted(histograms.items()):
+                lines.append(f'{phase:<20} {page:<16} {sum(counts):>7}'
+                             + ''.join(f' {estimate_percentile(counts, percent):>8.3f}'
+                                       for percent in TRACE_PERCENTILES))
+
+        # DONE
+        return lines
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Is tracing enabled?"""
+        return Tracer._enabled
+
+    @staticmethod
+    def record(phase: str, start: float, seconds: float, page: JbgPageIds = None) -> None:
+        """Count one span in its phase's histogram and keep it for the JSON dump.
+
+        Args:
+            phase: The phase timed (e.g., play).
+            start: When the phase started, in perf_counter() seconds.
+            seconds: How long the phase took.
+            page: Optional; The page type the phase identified.  Becomes the page type of every
+                span that follows.  Defaults to the page type most recently identified.
+        """
+        # LOCAL VARIABLES
+        page_name = ''  # The span's page type
+
+        # RECORD IT
+        if not Tracer._enabled:
+            return
+        with Tracer._lock:
+            if page is not None:
+                Tracer._page = page
+            page_name = Tracer._page.name
+            Tracer._histograms.setdefault((phase, page_name), [0] * len(JITB_TRACE_BUCKETS))[
+                bisect_left(JITB_TRACE_BUCKETS, seconds)] += 1
+            if len(Tracer._spans) < JITB_TRACE_MAX_SPANS:
+                Tracer._spans.append({'phase': phase, 'page': page_name,
+                                      'start': round(start - Tracer._origin, 6),
+                                      'seconds': round(seconds, 6),
+                                      'thread': threading.current_thread().name})
+            else:
+                Tracer._dropped += 1
+
+    @staticmethod
+    def span(phase: str) -> Any:
+        """Time a with statement's block as one phase.
+
+        Args:
+            phase: The phase to time (e.g., wait_for_page_change).
+
+        Returns:
+            A context manager that records the span on exit, or a no-op if tracing is disabled.
+        """
+        return _Span(phase) if Tracer._enabled else _NULL_SPAN
+
+    @staticmethod
+    def traced(phase: str) -> Callable[[Callable], Callable]:
+        """Decorate a function to time every call as one phase.
+
+        If the function returns a JbgPageIds (e.g., id_page()), it becomes the page type of this,
+        and every following, span.  Calls that raise are timed too.
+
+        Args:
+            phase: The phase to time (e.g., play).
+        """
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs) -> Any:
+                # LOCAL VARIABLES
+                start = 0.0    # When the call started
+                result = None  # func's return value
+
+                # CALL IT
+                if not Tracer._enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    Tracer.record(phase=phase, start=start, seconds=time.perf_counter() - start,
+                                  page=result if isinstance(result, JbgPageIds) else None)
+                return result
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def write_spans(filename: str) -> str:
+        """Dump the histograms, and the raw spans, as JSON.
+
+        Args:
+            filename: Where to write the spans.
+
+        Returns:
+            The absolute filename written.
+
+        Raises:
+            TypeError: Bad data type.
+            ValueError: Empty filename.
+            OSError: The file couldn't be written.
+        """
+        # LOCAL VARIABLES
+        dump = {}  # The JSON document
+
+        # INPUT VALIDATION
+        validate_string(filename, 'filename', can_be_empty=False)
+
+        # WRITE IT
+        with Tracer._lock:
+            # The last bucket has no upper bound, so it's left out of the bucket list
+            dump = {'buckets': list(JITB_TRACE_BUCKETS[:-1]),
+                    'histograms': [{'phase': phase, 'page': page, 'counts': counts}
+                                   for (phase, page), counts in Tracer._histograms.items()],
+                    'dropped': Tracer._dropped, 'spans': Tracer._spans}
+            with open(filename, 'w', encoding='utf-8') as out_file:
+                json.dump(dump, out_file)
+
+        # DONE
+        return os.path.abspath(filename)
+
+    @staticmethod
+    def _shutdown() -> None:
+        """Stop tracing, log the report, and dump the spans beside the debug log."""
+        # LOCAL VARIABLES
+        filename = Logger.get_filename()  # The debug log filename
+        lines = []                         # The report
+
+        # REPORT IT
+        Tracer.disable()
+        if not filename:
+            filename = os.path.join(determine_tmp_dir(), 'jitb.log')
+        filename = os.path.splitext(filename)[0] + '_spans.json'
+        if os.path.exists(filename):
+            # Without --debug, jitb fleet workers share a debug log filename
+            filename = os.path.splitext(filename)[0] + f'-{os.getpid()}.json'
+        lines = Tracer.get_report()
+        if lines:
+            Logger.info('Seconds spent in each phase, by page type (estimated percentiles):\n'
+                        + '\n'.join(lines))
+        try:
+            Logger.info(f'Wrote the raw spans to {Tracer.write_spans(filename)}')
+        except OSError as err:
+            Logger.error(f'Failed to write the raw spans to {filename} with {repr(err)}')
+
+
+def estimate_percentile(counts: List[int], percent: float) -> float:
+    """Estimate a percentile from a JITB_TRACE_BUCKETS histogram.
+
+    The percentile is interpolated, linearly, within the bucket it falls in.  A percentile that
+    falls in the unbounded last bucket is reported as the largest bounded one.
+
+    Args:
+        counts: Number of spans in each bucket.
+        percent: The percentile, 0 through 100.
+
+    Returns:
+        The estimated percentile, in seconds, or NaN if counts is empty.
+
+    Raises:
+        TypeError: Bad data type.
+        ValueError: counts doesn't match JITB_TRACE_BUCKETS or percent is out of range.
+    """
+    # LOCAL VARIABLES
+    rank = 0.0      # The rank of the percentile among the spans
+    cumulative = 0  # Number of spans in the buckets before this one
+    lower = 0.0     # The lower bound of the bucket the percentile falls in
+
+    # INPUT VALIDATION
+    validate_type(counts, 'counts', list)
+    validate_type(percent, 'percent', (int, float))
+    if len(counts) != len(JITB_TRACE_BUCKETS):
+        raise ValueError(f'Expected {len(JITB_TRACE_BUCKETS)} bucket counts, not {len(counts)}')
+    if not 0 <= percent <= 100:
+        raise ValueError(f'The percent must be 0 through 100, not {percent}')
+
+    # ESTIMATE IT
+    rank = percent / 100 * sum(counts)
+    for index, count in enumerate(counts):
+        if count and cumulative + count >= rank:
+            lower = JITB_TRACE_BUCKETS[index - 1] if index else 0.0
+            if math.isinf(JITB_TRACE_BUCKETS[index]):
+                return lower
+            return lower + (JITB_TRACE_BUCKETS[index] - lower) * (rank - cumulative) / count
+        cumulative += count
+
+    # DONE
+    return math.nan
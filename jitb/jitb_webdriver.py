@@ -6,25 +6,82 @@ defined in the jitb.jbgames module.
 
 
 # Standard
-from typing import Dict, List
+from typing import Any, Dict, Final, List
 import time
 # Third Party
 from hobo.validation import validate_list, validate_string, validate_type
 from selenium.common.exceptions import (ElementNotInteractableException, NoSuchElementException,
-                                        StaleElementReferenceException)
+                                        StaleElementReferenceException, WebDriverException)
 from selenium.webdriver.common.by import By
 import selenium
 # Local
-from jitb.jitb_globals import JITB_POLL_RATE
+from jitb.jitb_globals import JITB_OBSERVE_TIMEOUT, JITB_POLL_RATE
 from jitb.jitb_logger import Logger
+from jitb.jitb_metrics import Metrics
 from jitb.jitb_misc import clean_up_string, convert_str_to_int
 from jitb.jitb_openai import JitbAi
 from jitb.jitb_selenium import (get_buttons, get_web_element, get_web_element_int,
                                 get_web_element_text)
+from jitb.jitb_snapshot import ButtonSnapshot, PageSnapshot
+from jitb.jitb_tracer import Tracer
 from jitb.jitb_validation import validate_bool, validate_element_type, validate_web_driver
 
 
+# CSS selectors, for the jackbox.tv elements, whose changes should wake wait_for_page_change()
+OBSERVED_SELECTORS: Final[List[str]] = ['#prompt', '#state-answer-question', '#question-text',
+                                        '#vote-text', '#charactersPrompt', '.choices', 'button']
+# Injected by wait_for_page_change().  The first call installs a single MutationObserver which
+# increments window.__jitbObserver.version every time an observed element changes.  Every call
+# resolves as soon as the version differs from last_version or once the timeout expires.
+_OBSERVE_JS: Final[str] = '''
+const lastVersion = arguments[0];
+const timeoutMs = arguments[1];
+const selectors = arguments[2];
+const done = arguments[arguments.length - 1];
+const state = window.__jitbObserver || (window.__jitbObserver = {version: 0, waiters: []});
+const isWatched = function (node) {
+    const elem = node.nodeType === Node.ELEMENT_NODE ? node : node.parentElement;
+    return elem !== null && elem.closest(selectors) !== null;
+};
+const hasWatched = function (node) {
+    return node.nodeType === Node.ELEMENT_NODE &&
+        (node.matches(selectors) || node.querySelector(selectors) !== null);
+};
+if (!state.observer) {
+    state.observer = new MutationObserver(function (mutations) {
+        const changed = mutations.some(function (mutation) {
+            return isWatched(mutation.target) ||
+                Array.from(mutation.addedNodes).some(hasWatched) ||
+                Array.from(mutation.removedNodes).some(hasWatched);
+        });
+        if (changed) {
+            state.version += 1;
+            state.waiters.splice(0).forEach(function (waiter) { waiter(state.version); });
+        }
+    });
+    state.observer.observe(document.documentElement, {
+        subtree: true, childList: true, characterData: true, attributes: true,
+        attributeFilter: ['class', 'disabled', 'style', 'hidden']
+    });
+}
+if (state.version !== lastVersion) {
+    done(state.version);
+} else {
+    const waiter = function (version) { clearTimeout(timer); done(version); };
+    const timer = setTimeout(function () {
+        const index = state.waiters.indexOf(waiter);
+        if (index >= 0) {
+            state.waiters.splice(index, 1);
+        }
+        done(state.version);
+    }, timeoutMs);
+    state.waiters.push(waiter);
+}
+'''
+
+
 # Public Module Functions
+@Tracer.traced('click_a_button')
 def click_a_button(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
                    button_str: str) -> bool:
     """Standardize the way buttons are clicked.
@@ -46,7 +103,7 @@ def click_a_button(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
     try:
         buttons = get_buttons(web_driver=web_driver)
     except StaleElementReferenceException as err:
-        Logger.debug(f'Failed to get buttons with {repr(err)}')
+        Logger.debug('Failed to get buttons with %r', err)
 
     # CLICK IT
     for button in buttons:
@@ -62,30 +119,56 @@ def click_a_button(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
             Logger.error(f'Failed to click button "{temp_text}" with {repr(err)}')
         else:
             clicked_it = True
-            Logger.debug(f'Clicked the "{button_str}" button')
+            Logger.debug('Clicked the "%s" button', button_str)
             break
 
     # DONE
     if not attempted_it:
-        Logger.debug(f'Unable to find an enabled button matching "{button_str}"')
+        Logger.debug('Unable to find an enabled button matching "%s"', button_str)
     return clicked_it
 
 
+def count_web_driver_commands(web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
+    """Count every command web_driver sends to Chrome in the jitb_webdriver_commands_total metric.
+
+    Args:
+        web_driver: The webdriver object to count the commands of.
+
+    Raises:
+        TypeError: Bad data type.
+    """
+    # LOCAL VARIABLES
+    execute = None  # web_driver's original execute() method
+
+    # INPUT VALIDATION
+    validate_web_driver(web_driver=web_driver)
+
+    # WRAP IT
+    execute = web_driver.execute
+
+    def counted_execute(driver_command: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        Metrics.inc('jitb_webdriver_commands_total', command=driver_command)
+        return execute(driver_command, params)
+
+    web_driver.execute = counted_execute
+
+
 def get_button_choices(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
-                       exclude: List[str] = None) -> Dict[str, str]:
+                       exclude: List[str] = None, snapshot: PageSnapshot = None) -> Dict[str, str]:
     """Get a list of all the button text fields from web_driver starting at the root XPath.
 
     Args:
         web_driver: Selenium web driver to search for buttons.
         exclude: Optional; A list of button text strings to exclude from the button list.
             Disable this check with a value of None.
+        snapshot: Optional; Read the buttons from this PageSnapshot instead of web_driver.
 
     Returns:
         A dictionary of all button text fields on success.  Each dict key is the sanitized button
         name but the value is the actual button name.  Returns an empty dict if none were found.
     """
     # LOCAL VARIABLES
-    button_elements = []  # List of button web elements extracted from web_driver
+    button_elements = []  # List of button web elements (or ButtonSnapshots) from web_driver
     enabled_buttons = []  # List of enabled button web elements extracted from button_elements
     button_choices = {}   # Dictionary of button_names:button_text extracted from enabled_buttons
     local_exclude = []    # Lower case conversion from exclude
@@ -97,12 +180,17 @@ def get_button_choices(web_driver: selenium.webdriver.chrome.webdriver.WebDriver
         for exclusion in exclude:
             validate_string(exclusion, 'exclude list entry', can_be_empty=False)
             local_exclude.append(exclusion.lower())
+    if snapshot is not None:
+        validate_type(snapshot, 'snapshot', PageSnapshot)
 
     # GET CHOICES
     # Get Buttons
-    button_elements = get_buttons(web_driver=web_driver)
+    if snapshot is not None:
+        button_elements = snapshot.buttons
+    else:
+        button_elements = get_buttons(web_driver=web_driver)
     # Only Choose Enabled Buttons
-    enabled_buttons = [button for button in button_elements if button.is_enabled()]
+    enabled_buttons = [button for button in button_elements if _is_enabled(button)]
     # Extract Text
     for enabled_button in enabled_buttons:
         if enabled_button.text and enabled_button.text.lower() not in local_exclude:
@@ -114,7 +202,8 @@ def get_button_choices(web_driver: selenium.webdriver.chrome.webdriver.WebDriver
 
 
 def get_char_limit(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
-                   element_name: str, element_type: str = By.CLASS_NAME) -> int:
+                   element_name: str, element_type: str = By.CLASS_NAME,
+                   snapshot: PageSnapshot = None) -> int:
     """Get the character limit for an input field.
 
     Searches web_driver for element_name using element_type and attempts to convert the value
@@ -125,6 +214,8 @@ def get_char_limit(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
         element_name: The prompt's element name (e.g., charRemaining).
         element_type: Optional; The prompt's element type (e.g., By.CLASS_NAME).
             See: help(selenium.webdriver.common.by.By).
+        snapshot: Optional; Read the element's text from this PageSnapshot, if it has it,
+            instead of web_driver.
 
     Returns:
         The integer value for element_name as read from web_driver.
@@ -139,14 +230,21 @@ def get_char_limit(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
     # INPUT VALIDATION handled by get_web_element_int()
 
     # GET LIMIT
-    char_limit = get_web_element_int(web_driver=web_driver, by_arg=element_type, value=element_name)
+    if snapshot is not None and snapshot.has_text(element_name=element_name,
+                                                  element_type=element_type):
+        char_limit = convert_str_to_int(snapshot.get_text(element_name=element_name,
+                                                          element_type=element_type))
+    else:
+        char_limit = get_web_element_int(web_driver=web_driver, by_arg=element_type,
+                                         value=element_name)
 
     # DONE
     return char_limit
 
 
 def get_char_limit_attr(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
-                        element_name: str, attr_name: str, element_type: str = By.ID) -> int:
+                        element_name: str, attr_name: str, element_type: str = By.ID,
+                        snapshot: PageSnapshot = None) -> int:
     """Get the character limit for an input field from its attribute.
 
     Searches web_driver for element_name using element_type, reads the given attribute,
@@ -158,6 +256,8 @@ def get_char_limit_attr(web_driver: selenium.webdriver.chrome.webdriver.WebDrive
         attr_name: The attribute name to read from element name (e.g., maxlength).
         element_type: Optional; The field's element type (e.g., By.ID).
             See: help(selenium.webdriver.common.by.By).
+        snapshot: Optional; Read a maxlength attribute from this PageSnapshot, if it has it,
+            instead of web_driver.
 
     Returns:
         The integer value for element_name's attr_name attribute as read from web_driver on succes,
@@ -175,22 +275,69 @@ def get_char_limit_attr(web_driver: selenium.webdriver.chrome.webdriver.WebDrive
     # INPUT VALIDATION handled by get_web_element_int()
 
     # GET IT
-    # Get Web Element
-    web_element = get_web_element(web_driver=web_driver, by_arg=element_type, value=element_name)
-    # Get Attribute
-    if web_element:
-        attr_string = web_element.get_attribute(attr_name)
+    if snapshot is not None and attr_name == 'maxlength' and element_type == By.ID \
+       and snapshot.has_max_length(element_id=element_name):
+        attr_string = snapshot.get_max_length(element_id=element_name)
+    else:
+        # Get Web Element
+        web_element = get_web_element(web_driver=web_driver, by_arg=element_type,
+                                      value=element_name)
+        # Get Attribute
+        if web_element:
+            attr_string = web_element.get_attribute(attr_name)
 
     # GET LIMIT
     if attr_string:
         char_limit = convert_str_to_int(attr_string)
         if char_limit is None:
-            Logger.debug(f'get_char_limit_attr() failed to convert {attr_string} to an int')
+            Logger.debug('get_char_limit_attr() failed to convert %s to an int', attr_string)
 
     # DONE
     return char_limit
 
 
+def get_page_text(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                  element_name: str, element_type: str = By.ID,
+                  snapshot: PageSnapshot = None) -> str:
+    """Get the text page identification clues are matched against.
+
+    Args:
+        web_driver: The web driver to get the text from.
+        element_name: The element name to read (e.g., prompt).
+        element_type: Optional; The way to search for element_name.
+            See: help(selenium.webdriver.common.by.By).
+        snapshot: Optional; Read element_name's text from this PageSnapshot, if it has it,
+            instead of web_driver.
+
+    Returns:
+        The element's text, which could be empty, if found.  None otherwise.
+
+    Raises:
+        TypeError: Bad data type.
+        ValueError: Invalid value.
+    """
+    # LOCAL VARIABLES
+    page_text = None  # Text from the web element
+
+    # INPUT VALIDATION
+    validate_web_driver(web_driver=web_driver)
+    validate_string(element_name, 'element_name', can_be_empty=False)
+    validate_element_type(element_type=element_type)
+    if snapshot is not None:
+        validate_type(snapshot, 'snapshot', PageSnapshot)
+
+    # GET IT
+    if snapshot is not None and snapshot.has_text(element_name=element_name,
+                                                  element_type=element_type):
+        page_text = snapshot.get_text(element_name=element_name, element_type=element_type)
+    else:
+        page_text = get_web_element_text(web_driver=web_driver, by_arg=element_type,
+                                         value=element_name)
+
+    # DONE
+    return page_text
+
+
 def get_prompt(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
                element_name: str, element_type: str = By.ID,
                prompt_clues: List[str] = None, clean_string: bool = False) -> str:
@@ -301,9 +448,11 @@ def get_vote_text(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
     return vote_text
 
 
+# pylint: disable = too-many-arguments
 def is_prompt_page(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
                    element_name: str, element_type: str = By.ID,
-                   prompt_clues: List[str] = None, clean_string: bool = False) -> bool:
+                   prompt_clues: List[str] = None, clean_string: bool = False,
+                   snapshot: PageSnapshot = None) -> bool:
     """Determine if web_driver is a prompt page.
 
     Args:
@@ -317,6 +466,8 @@ def is_prompt_page(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
             E.g., ['Write a definition', 'Write a synonym', 'Write a sentence']
         clean_string: Optional; Call clean_up_string() on the text prior to vote_clue-evaluation.
             (Sometimes, the strings have non-standard characters in them.)
+        snapshot: Optional; Read element_name's text from this PageSnapshot, if it has it,
+            instead of web_driver.
 
     Returns:
         True if this is a regular prompt screen, False otherwise.
@@ -328,7 +479,8 @@ def is_prompt_page(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
 
     # IS IT?
     prompt_page = _is_page(web_driver=web_driver, element_name=element_name,
-                           element_type=element_type, clues=prompt_clues, clean_string=clean_string)
+                           element_type=element_type, clues=prompt_clues, clean_string=clean_string,
+                           snapshot=snapshot)
 
     # DONE
     return prompt_page
@@ -336,7 +488,8 @@ def is_prompt_page(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
 
 def is_vote_page(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
                  element_name: str, element_type: str = By.ID,
-                 vote_clues: List[str] = None, clean_string: bool = False) -> bool:
+                 vote_clues: List[str] = None, clean_string: bool = False,
+                 snapshot: PageSnapshot = None) -> bool:
     """Determine if web_driver is a vote page.
 
     Args:
@@ -350,6 +503,8 @@ def is_vote_page(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
             E.g., ['Vote your favorite definition', 'Vote your favorite synonym']
         clean_string: Optional; Call clean_up_string() on the text prior to vote_clue-evaluation.
             (Sometimes, the strings have non-standard characters in them.)
+        snapshot: Optional; Read element_name's text from this PageSnapshot, if it has it,
+            instead of web_driver.
 
     Returns:
         True if this is a regular prompt screen, False otherwise.
@@ -361,10 +516,12 @@ def is_vote_page(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
 
     # IS IT?
     vote_page = _is_page(web_driver=web_driver, element_name=element_name,
-                         element_type=element_type, clues=vote_clues, clean_string=clean_string)
+                         element_type=element_type, clues=vote_clues, clean_string=clean_string,
+                         snapshot=snapshot)
 
     # DONE
     return vote_page
+# pylint: enable = too-many-arguments
 
 
 # pylint: disable = too-many-arguments, too-many-locals
@@ -448,11 +605,12 @@ def vote_answers(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
         raise RuntimeError('Did not vote an answer')
     if clicked_it:
         temp_text = prompt_text.replace('\n', ' ')
-        Logger.debug(f'Chose "{favorite}" for "{temp_text}"!')
+        Logger.debug('Chose "%s" for "%s"!', favorite, temp_text)
     return prompt_text
 # pylint: enable = too-many-arguments, too-many-locals
 
 
+@Tracer.traced('write_an_answer')
 def write_an_answer(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
                     submit_text: str, element_name: str, element_type: str = By.ID) -> bool:
     """Standardize the way keys are sent to text fields.
@@ -479,20 +637,70 @@ def write_an_answer(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
         try:
             prompt_input.send_keys(submit_text)
         except (ElementNotInteractableException, StaleElementReferenceException) as err:
-            Logger.debug(f'Failed to submit "{submit_text}" into "{element_name}" with {repr(err)}')
+            Logger.debug('Failed to submit "%s" into "%s" with %r', submit_text, element_name, err)
         else:
             wrote_it = True
     else:
-        Logger.debug(f'Unable to locate "{element_name}" by {element_type}')
+        Logger.debug('Unable to locate "%s" by %s', element_name, element_type)
 
     # DONE
     return wrote_it
 
 
+def wait_for_page_change(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                         last_version: int, timeout: float = JITB_OBSERVE_TIMEOUT) -> int:
+    """Block until the observed jackbox.tv elements change or timeout seconds have passed.
+
+    The first call injects a MutationObserver into the page which watches the OBSERVED_SELECTORS.
+    Each change increments a version counter stored in the page.  This function returns as soon
+    as that counter differs from last_version.  A fresh page (e.g., after navigation) starts a
+    new observer with a counter of 0.  The web_driver's script timeout must exceed timeout.
+    Falls back to sleeping for JITB_POLL_RATE if the script fails.
+
+    Args:
+        web_driver: The webdriver object to observe.
+        last_version: The value this function last returned.  Use 0 for the first call.
+        timeout: Optional; The maximum number of seconds to wait for a change.
+
+    Returns:
+        The page's current change counter.  Pass it back in as last_version on the next call.
+
+    Raises:
+        TypeError: Bad data type.
+        ValueError: Invalid value.
+    """
+    # LOCAL VARIABLES
+    version = last_version  # The page's change counter
+
+    # INPUT VALIDATION
+    validate_web_driver(web_driver=web_driver)
+    validate_type(last_version, 'last_version', int)
+    validate_type(timeout, 'timeout', (int, float))
+    if timeout <= 0:
+        raise ValueError(f'Invalid timeout value: {timeout}')
+
+    # WAIT FOR IT
+    try:
+        version = web_driver.execute_async_script(_OBSERVE_JS, last_version, int(timeout * 1000),
+                                                  ', '.join(OBSERVED_SELECTORS))
+    except WebDriverException as err:
+        Logger.debug('Failed to observe the page with %r', err)
+        time.sleep(JITB_POLL_RATE)  # Poll the old-fashioned way
+    else:
+        if not isinstance(version, int):
+            version = last_version  # Unexpected return value; start over
+            time.sleep(JITB_POLL_RATE)  # Poll the old-fashioned way
+
+    # DONE
+    return version
+
+
 # Private Module Functions
+# pylint: disable = too-many-arguments
 def _is_page(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
              element_name: str, element_type: str = By.ID,
-             clues: List[str] = None, clean_string: bool = False) -> bool:
+             clues: List[str] = None, clean_string: bool = False,
+             snapshot: PageSnapshot = None) -> bool:
     """Determine if web_driver is the page you think it is.
 
     Args:
@@ -506,6 +714,8 @@ def _is_page(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
             E.g., ['Write a definition', 'Write a synonym', 'Write a sentence']
         clean_string: Optional; Call clean_up_string() on the text prior to vote_clue-evaluation.
             (Sometimes, the strings have non-standard characters in them.)
+        snapshot: Optional; Read element_name's text from this PageSnapshot, if it has it,
+            instead of web_driver.
 
     Returns:
         True if this is the screen you think it is, False otherwise.
@@ -520,11 +730,13 @@ def _is_page(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
     validate_element_type(element_type=element_type)
     _validate_clues(clues=clues)
     validate_bool(clean_string, 'clean_string')
+    if snapshot is not None:
+        validate_type(snapshot, 'snapshot', PageSnapshot)
 
     # IS IT?
     try:
-        temp_text = get_web_element_text(web_driver=web_driver, by_arg=element_type,
-                                         value=element_name)
+        temp_text = get_page_text(web_driver=web_driver, element_name=element_name,
+                                  element_type=element_type, snapshot=snapshot)
         if clean_string:
             temp_text = clean_up_string(dirty_string=temp_text)
         if temp_text:
@@ -540,6 +752,14 @@ def _is_page(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
 
     # DONE
     return page
+# pylint: enable = too-many-arguments
+
+
+def _is_enabled(button: Any) -> bool:
+    """Determine if a button WebElement, or ButtonSnapshot, is enabled."""
+    if isinstance(button, ButtonSnapshot):
+        return button.enabled
+    return button.is_enabled()
 
 
 def _validate_clues(clues: List[str] = None) -> None:
@@ -1,9 +1,11 @@
 """Defines web-based functionality for the package."""
 # Standard
-from typing import Dict, Final, Tuple
+from typing import Dict, Final, List, Tuple
 import time
 # Third Party
+from hobo.validation import validate_list, validate_string
 from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 import selenium
 # Local
@@ -13,74 +15,335 @@ from jitb.jbgames.jbg_dict import JbgDict
 from jitb.jbgames.jbg_jb import JbgJb
 from jitb.jbgames.jbg_q2 import JbgQ2
 from jitb.jbgames.jbg_q3 import JbgQ3
-from jitb.jitb_globals import JITB_POLL_RATE
+from jitb.jitb_ecast import EcastClient, EcastState
+from jitb.jitb_globals import (JITB_HEADLESS_ARGS, JITB_HEADLESS_BLOCKED_URLS,
+                               JITB_MULTI_BOT_ARGS, JITB_OBSERVE_TIMEOUT, JITB_POLL_RATE)
 from jitb.jitb_logger import Logger
+from jitb.jitb_metrics import Metrics
 from jitb.jitb_openai import JitbAi
-from jitb.jitb_validation import validate_game
+from jitb.jitb_recorder import Recorder
+from jitb.jitb_tracer import Tracer
+from jitb.jitb_validation import validate_bool, validate_game
+from jitb.jitb_webdriver import count_web_driver_commands, wait_for_page_change
 
 # List of Jackbox Games that JITB supports
 JITB_SUPPORTED_GAMES: Final[Dict[str, JbgAbc]] = {"Blather 'Round": JbgBr, 'Dictionarium': JbgDict,
                                                   'Joke Boat': JbgJb, 'Quiplash 2': JbgQ2,
                                                   'Quiplash 3': JbgQ3}
+# Injected into every page, by --headless, to disable CSS animations and transitions
+JITB_NO_ANIMATIONS_JS: Final[str] = """
+document.addEventListener('DOMContentLoaded', () => {
+    const style = document.createElement('style');
+    style.textContent = '*, *::before, *::after { animation: none !important; ' +
+                        'transition: none !important; }';
+    document.head.appendChild(style);
+});
+"""
 
 
-def join_room(room_code: str,
-              username: str) -> Tuple[str, selenium.webdriver.chrome.webdriver.WebDriver]:
+def create_web_driver(headless: bool = False,
+                      multi_bot: bool = False) -> selenium.webdriver.chrome.webdriver.WebDriver:
+    """Launch Chrome.
+
+    Args:
+        headless: Optional; If True, launch a lean, headless Chrome: no GPU, no extensions, one
+            renderer process, images/fonts/media blocked, and animations disabled.
+        multi_bot: Optional; If True, keep background tabs running at full speed so many bots
+            can share this Chrome.  See: join_room_bots().
+
+    Returns:
+        The webdriver object.
+    """
+    # LOCAL VARIABLES
+    driver = None        # Webdriver object
+    options = Options()  # Chrome options
+
+    # INPUT VALIDATION
+    validate_bool(headless, 'headless')
+    validate_bool(multi_bot, 'multi_bot')
+
+    # CREATE IT
+    for argument in (JITB_HEADLESS_ARGS if headless else []) + \
+            (JITB_MULTI_BOT_ARGS if multi_bot else []):
+        options.add_argument(argument)
+    driver = webdriver.Chrome(options=options)
+    if Metrics.is_enabled():
+        count_web_driver_commands(web_driver=driver)
+    if headless:
+        _lean_tab(driver)
+        Logger.debug('Launched a lean, headless Chrome')
+
+    # DONE
+    return driver
+
+
+def join_room(room_code: str, username: str, headless: bool = False) \
+        -> Tuple[str, selenium.webdriver.chrome.webdriver.WebDriver]:
     """Join a https://jackbox.tv/ game with room_code and username.
 
     Args:
         room_code:  The room code to join.
         username:  The screen name to use during the game.  May be None for manual logins.
+        headless:  Optional; If True, use a lean, headless Chrome.  See: create_web_driver().
 
     Returns:
         The a tuple containing the game type (e.g., Quiplash 3) and the webdriver object on success.
     """
     # LOCAL VARIABLES
-    driver = webdriver.Chrome()  # Webdriver object
-    game = ''                    # Status text of the roomcode
+    driver = create_web_driver(headless=headless)  # Webdriver object
+    game = ''                                      # Status text of the roomcode
 
     # JOIN IT
-    driver.implicitly_wait(2)
-    driver.get('https://jackbox.tv/')
-    room_code_box = driver.find_element(By.ID, 'roomcode')
-    room_code_box.send_keys(room_code)
-    game = _verify_room_code(driver)
-    validate_game(game=game, games=JITB_SUPPORTED_GAMES)
-    if username:
-        username_box = driver.find_element(By.ID, 'username')
-        username_box.send_keys(username)
-        play_button = driver.find_element(By.ID, 'button-join')
-        play_button.click()
+    game = _join_tab(driver, room_code=room_code, username=username)
 
     # DONE
     return tuple((game, driver))
 
 
-def play_the_game(room_code: str, username: str, ai_obj: JitbAi) -> None:
-    """Dynamically respond to the flow of the game."""
+def join_room_bots(room_code: str, usernames: List[str], headless: bool = False) \
+        -> Tuple[str, selenium.webdriver.chrome.webdriver.WebDriver, Dict[str, str]]:
+    """Join a https://jackbox.tv/ game once per username, sharing one Chrome.
+
+    The first username joins in Chrome's default browser context.  Every other username joins
+    in a tab of its own isolated browser context (see: _open_isolated_tab()) so no two players
+    share cookies or local storage.
+
+    Args:
+        room_code:  The room code to join.
+        usernames:  The screen names to use during the game.  Only a single username may be
+            None (for manual logins).
+        headless:  Optional; If True, use a lean, headless Chrome.  See: create_web_driver().
+
+    Returns:
+        A tuple containing the game type (e.g., Quiplash 3), the webdriver object, and each
+        username by window handle, in join order.
+
+    Raises:
+        ValueError: Invalid value.
+    """
     # LOCAL VARIABLES
-    game = ''          # What Jackbox game is associated with this room code?
-    web_driver = None  # Selenium webdriver for Jackbox Games
-    jbg_obj = None     # The jitb.jbgames object to handle this game
+    driver = None  # Webdriver object
+    game = ''      # Status text of the roomcode
+    players = {}   # Usernames by window handle
 
-    # LOGIN
-    game, web_driver = join_room(room_code=room_code, username=username)
+    # INPUT VALIDATION
+    validate_list(usernames, 'usernames', can_be_empty=False)
+    if len(usernames) > 1:
+        for username in usernames:
+            validate_string(username, 'usernames entry', can_be_empty=False)
+        if len(set(usernames)) != len(usernames):
+            raise ValueError('Each bot in a room must have a unique username')
 
-    # SETUP
-    validate_game(game=game, games=JITB_SUPPORTED_GAMES)
-    jbg_obj = JITB_SUPPORTED_GAMES[game](ai_obj=ai_obj, username=username)
+    # JOIN IT
+    driver = create_web_driver(headless=headless, multi_bot=len(usernames) > 1)
+    try:
+        for username in usernames:
+            if players:
+                driver.switch_to.window(_open_isolated_tab(driver, headless=headless))
+            game = _join_tab(driver, room_code=room_code, username=username)
+            players[driver.current_window_handle] = username
+    except Exception:
+        driver.quit()
+        raise
+
+    # DONE
+    return tuple((game, driver, players))
+
+
+# pylint: disable = too-many-arguments, too-many-branches
+def play_the_game(room_code: str, username: str, ai_obj: JitbAi, observe: bool = False,
+                  pipeline: bool = False, headless: bool = False, game: str = None,
+                  extra_usernames: List[str] = None) -> None:
+    """Dynamically respond to the flow of the game.
+
+    Bots (see: extra_usernames) take turns in a single thread, one window handle at a time.
+    Each bot's play() blocks for its whole turn, including any wait for an AI answer, so one slow
+    answer delays every other bot's turn.  The pipeline option shortens those waits.
+
+    Args:
+        room_code:  The room code to join.
+        username:  The screen name to use during the game.  May be None for manual logins.
+        ai_obj: The JitbAi object to use.
+        observe: Optional; If True, wait for the page to change between turns instead of polling
+            every JITB_POLL_RATE seconds.  See: jitb_webdriver.wait_for_page_change().
+        pipeline: Optional; If True, start generating answers in the background as soon as a
+            prompt appears.  See: JbgAbc.prefetch_answer().
+        headless: Optional; If True, use a lean, headless Chrome.  See: create_web_driver().
+        game: Optional; The game room_code is expected to be playing (e.g., Quiplash 3).
+        extra_usernames: Optional; More bots to join room_code with, each in its own browser
+            context of the same Chrome.  Every bot gets its own Jackbox Games object and the bots
+            take turns playing.  See: join_room_bots().
+
+    Raises:
+        RuntimeError: The room is not playing the expected game.
+        TypeError: extra_usernames were given for a manual login.
+    """
+    # LOCAL VARIABLES
+    room_game = ''                    # What Jackbox game is associated with this room code?
+    web_driver = None                 # Selenium webdriver for Jackbox Games
+    players = {}                      # Usernames, then jitb.jbgames objects, by window handle
+    page_versions = {}                # The last page change counters, by window handle
+    wait_time = JITB_OBSERVE_TIMEOUT  # Seconds to wait for each bot's page to change
+
+    # INPUT VALIDATION
+    validate_bool(observe, 'observe')
+    validate_bool(pipeline, 'pipeline')
+    validate_bool(headless, 'headless')
+    if game is not None:
+        validate_game(game=game, games=JITB_SUPPORTED_GAMES)
+    if extra_usernames is not None:
+        validate_list(extra_usernames, 'extra_usernames', can_be_empty=False)
+
+    # LOGIN
+    room_game, web_driver, players = join_room_bots(room_code=room_code,
+                                                    usernames=[username] + (extra_usernames or []),
+                                                    headless=headless)
 
     # PLAY IT
     try:
+        # SETUP
+        validate_game(game=room_game, games=JITB_SUPPORTED_GAMES)
+        if game and game != room_game:
+            raise RuntimeError(f'Room {room_code} is playing {room_game} instead of {game}')
+        Recorder.record_game(web_driver=web_driver, game=room_game, players=players)
+        players = {handle: JITB_SUPPORTED_GAMES[room_game](ai_obj=ai_obj, username=player,
+                                                           pipeline=pipeline)
+                   for handle, player in players.items()}
+        page_versions = {handle: 0 for handle in players}
+        if observe:
+            # Every bot gets a turn within the usual observe timeout
+            wait_time = wait_time / len(players)
+            web_driver.set_script_timeout(wait_time + JITB_POLL_RATE)
         if not username:
-            Logger.info(f'It appears you must login to play {game}.  '
+            Logger.info(f'It appears you must login to play {room_game}.  '
                         'JITB will take over once it has detected a login.')
         while True:
-            jbg_obj.play(web_driver=web_driver)
-            time.sleep(JITB_POLL_RATE)  # Zzzzz...
+            for handle, jbg_obj in players.items():
+                if len(players) > 1:
+                    web_driver.switch_to.window(handle)
+                Recorder.record_tick(web_driver=web_driver, handle=handle)
+                jbg_obj.play(web_driver=web_driver)
+                if observe:
+                    with Tracer.span('wait_for_page_change'):
+                        page_versions[handle] = wait_for_page_change(
+                            web_driver=web_driver, last_version=page_versions[handle],
+                            timeout=wait_time)
+            if not observe:
+                time.sleep(JITB_POLL_RATE)  # Zzzzz...
     finally:
+        for jbg_obj in players.values():
+            if isinstance(jbg_obj, JbgAbc):
+                jbg_obj.shutdown()
         if web_driver:
-            web_driver.close()
+            web_driver.quit()
+# pylint: enable = too-many-arguments, too-many-branches
+
+
+def play_the_game_ecast(room_code: str, username: str, ai_obj: JitbAi, pipeline: bool = False,
+                        game: str = None) -> None:
+    """Dynamically respond to the flow of the game over the ecast room protocol, without Chrome.
+
+    Args:
+        room_code:  The room code to join.
+        username:  The screen name to use during the game.
+        ai_obj: The JitbAi object to use.
+        pipeline: Optional; If True, start generating answers in the background as soon as a
+            prompt appears.  See: JbgAbc.prefetch_answer().
+        game: Optional; The game room_code is expected to be playing (e.g., Quiplash 3).
+
+    Raises:
+        RuntimeError: The room is not playing the expected game, or the room closed.
+    """
+    # LOCAL VARIABLES
+    client = EcastClient(room_code=room_code, username=username)  # Room protocol client
+    room_game = ''                                                # The room's Jackbox game
+    jbg_obj = None                                                # jitb.jbgames object
+    state = EcastState()                                          # Latest ecast state
+
+    # INPUT VALIDATION
+    validate_bool(pipeline, 'pipeline')
+    if game is not None:
+        validate_game(game=game, games=JITB_SUPPORTED_GAMES)
+
+    # PLAY IT
+    try:
+        room_game = client.connect()
+        validate_game(game=room_game, games=JITB_SUPPORTED_GAMES)
+        if game and game != room_game:
+            raise RuntimeError(f'Room {room_code} is playing {room_game} instead of {game}')
+        jbg_obj = JITB_SUPPORTED_GAMES[room_game](ai_obj=ai_obj, username=username,
+                                                  pipeline=pipeline)
+        while True:
+            state = client.wait_for_state(last_version=state.version)
+            jbg_obj.play_ecast(client=client, state=state)
+    finally:
+        if jbg_obj:
+            jbg_obj.shutdown()
+        client.close()
+
+
+def _join_tab(web_driver: selenium.webdriver.chrome.webdriver.WebDriver, room_code: str,
+              username: str) -> str:
+    """Join a https://jackbox.tv/ game with room_code and username in web_driver's current tab.
+
+    Returns:
+        The game type (e.g., Quiplash 3).
+    """
+    # LOCAL VARIABLES
+    game = ''  # Status text of the roomcode
+
+    # JOIN IT
+    web_driver.implicitly_wait(2)
+    web_driver.get('https://jackbox.tv/')
+    room_code_box = web_driver.find_element(By.ID, 'roomcode')
+    room_code_box.send_keys(room_code)
+    game = _verify_room_code(web_driver)
+    validate_game(game=game, games=JITB_SUPPORTED_GAMES)
+    if username:
+        username_box = web_driver.find_element(By.ID, 'username')
+        username_box.send_keys(username)
+        play_button = web_driver.find_element(By.ID, 'button-join')
+        play_button.click()
+
+    # DONE
+    return game
+
+
+def _lean_tab(web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> None:
+    """Block images, fonts, and media, and disable animations, in web_driver's current tab."""
+    web_driver.execute_cdp_cmd('Network.enable', {})
+    web_driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': JITB_HEADLESS_BLOCKED_URLS})
+    web_driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument',
+                               {'source': JITB_NO_ANIMATIONS_JS})
+
+
+def _open_isolated_tab(web_driver: selenium.webdriver.chrome.webdriver.WebDriver,
+                       headless: bool = False) -> str:
+    """Open a tab in a new browser context: an incognito-like profile within the same Chrome.
+
+    Args:
+        web_driver: The webdriver object to open the tab with.
+        headless: Optional; If True, lean the new tab out.  See: create_web_driver().
+
+    Returns:
+        The new tab's window handle.
+    """
+    # LOCAL VARIABLES
+    context_id = None  # CDP browser context ID
+    handle = None      # The new tab's window handle (chromedriver uses the CDP target ID)
+
+    # OPEN IT
+    context_id = web_driver.execute_cdp_cmd('Target.createBrowserContext',
+                                            {'disposeOnDetach': True})['browserContextId']
+    handle = web_driver.execute_cdp_cmd('Target.createTarget',
+                                        {'url': 'about:blank',
+                                         'browserContextId': context_id})['targetId']
+    if headless:
+        web_driver.switch_to.window(handle)
+        _lean_tab(web_driver)
+
+    # DONE
+    return handle
 
 
 def _verify_room_code(web_driver: selenium.webdriver.chrome.webdriver.WebDriver) -> str:
@@ -108,7 +371,7 @@ def _verify_room_code(web_driver: selenium.webdriver.chrome.webdriver.WebDriver)
                 raise RuntimeError(error)
     # 3. Read the status text
     status_text = web_driver.find_element(By.CLASS_NAME, 'status').text
-    Logger.debug(f'This room code is a {status_text} game')
+    Logger.debug('This room code is a %s game', status_text)
 
     # DONE
     return status_text
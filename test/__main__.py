@@ -3,8 +3,10 @@
     Typical usage example:
 
     python -m test
+    python -m test -j 8  # Run the test classes across 8 worker processes
 """
 # Standard Imports
+import argparse
 import sys
 # Third Party Imports
 # Local Imports
@@ -14,4 +16,7 @@ from test.loader import load_and_run
 if __name__ == '__main__':
     # Run all test cases discovered in this package
     # Exit 0 on success, 1 otherwise
-    sys.exit(not load_and_run('test'))
+    PARSER = argparse.ArgumentParser(prog='python -m test')
+    PARSER.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Number of worker processes to run the test classes in')
+    sys.exit(not load_and_run('test', jobs=PARSER.parse_args().jobs))
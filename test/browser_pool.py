@@ -0,0 +1,76 @@
+"""Keeps one warm, headless Chrome per test process for the unit tests to share.
+
+Starting Chrome costs far more than most of the test cases that use it.  The parallel test
+runner (see: test.loader) sets SHARED_BROWSER_ENV_VAR in each worker process so
+TestJackboxGames borrows the worker's Chrome, and navigates it to the next fixture, instead of
+starting and quitting its own.
+
+Typical Usage:
+    web_driver = BrowserPool.acquire()
+    web_driver.get(input_html.absolute().as_uri())
+    BrowserPool.release(web_driver)
+"""
+
+# Standard Imports
+import atexit
+# Third Party Imports
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+# Local Imports
+
+
+SHARED_BROWSER_ENV_VAR = 'JITB_TEST_SHARED_BROWSER'  # Set to 1 to share one Chrome per process
+
+
+class BrowserPool():
+    """One shared Chrome for every test case in this process."""
+
+    _browser = None  # This process's shared Chrome
+
+    @staticmethod
+    def acquire() -> webdriver.Chrome:
+        """Return this process's shared Chrome, starting (or restarting) it if necessary."""
+        # LOCAL VARIABLES
+        options = Options()  # Options for the web driver
+
+        # ACQUIRE IT
+        if BrowserPool._browser:
+            try:
+                _ = BrowserPool._browser.current_url
+            except WebDriverException:
+                BrowserPool.quit()  # A test case broke it
+        if not BrowserPool._browser:
+            options.add_argument('--headless')
+            BrowserPool._browser = webdriver.Chrome(options=options)
+            BrowserPool._browser.minimize_window()
+            atexit.register(BrowserPool.quit)
+
+        # DONE
+        return BrowserPool._browser
+
+    @staticmethod
+    def quit() -> None:
+        """Quit this process's shared Chrome, if it's running."""
+        if BrowserPool._browser:
+            atexit.unregister(BrowserPool.quit)
+            try:
+                BrowserPool._browser.quit()
+            except WebDriverException:
+                pass  # It's already gone
+            BrowserPool._browser = None
+
+    @staticmethod
+    def release(web_driver: webdriver.Chrome) -> None:
+        """Reset the shared Chrome, for the next test case, instead of quitting it.
+
+        Any other web driver (e.g., an OfflineWebDriver) is quit.
+        """
+        if web_driver is not BrowserPool._browser:
+            web_driver.quit()
+            return
+        try:
+            web_driver.delete_all_cookies()
+            web_driver.get('about:blank')
+        except WebDriverException:
+            BrowserPool.quit()  # Start a fresh one next time
@@ -0,0 +1,130 @@
+"""A local stand-in for a jackbox.tv ecast room which replays recorded traffic.
+
+No need to host a real Jackbox Games room while we test the jitb.jitb_ecast functionality.
+The recorded traffic is a JSON file containing the ecast rooms API response ('room') and the
+room's side of the conversation ('messages').  Each message is either a message to 'send' to the
+player or an 'expect'ed opcode to read from the player.  The connection is closed once every
+message has been replayed.
+"""
+
+# Standard Imports
+from base64 import b64encode
+from hashlib import sha1
+from typing import Any, Dict, List
+import json
+import socket
+import struct
+import threading
+# Third Party Imports
+# Local Imports
+
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'  # RFC 6455 Sec-WebSocket-Accept magic
+
+
+class EcastServer:
+    """Serve the ecast rooms API, and a single player WebSocket, from recorded traffic."""
+
+    def __init__(self, traffic_file: str) -> None:
+        """Class ctor.
+
+        Args:
+            traffic_file: The recorded traffic JSON file to replay.
+        """
+        with open(traffic_file, 'r', encoding='utf-8') as in_file:
+            self.traffic = json.load(in_file)  # Recorded traffic
+        self.received: List[Dict[str, Any]] = []  # Messages read from the player, in order
+        self._listener = socket.create_server(('127.0.0.1', 0))  # Listening socket
+        self._listener.settimeout(0.1)                           # Check self._stopped this often
+        self._stopped = threading.Event()                        # Tells self._thread to stop
+        # Serves connections
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def start(self) -> str:
+        """Start serving and return the 'host:port' to connect to."""
+        self._thread.start()
+        return f'127.0.0.1:{self._listener.getsockname()[1]}'
+
+    def stop(self) -> None:
+        """Stop serving."""
+        self._stopped.set()
+        self._thread.join(timeout=5)
+        self._listener.close()
+
+    def _handle(self, conn: socket.socket) -> bool:
+        """Answer one HTTP request.  Returns True once the WebSocket traffic has been replayed."""
+        request = b''  # The HTTP request headers
+        while b'\r\n\r\n' not in request:
+            request += conn.recv(4096)
+        headers = dict(line.split(': ', 1) for line in request.decode().split('\r\n')[1:] if line)
+        headers = {key.lower(): value for key, value in headers.items()}
+        if headers.get('upgrade', '').lower() != 'websocket':
+            room = dict(self.traffic['room'])  # Point the player at this stand-in room
+            if isinstance(room.get('body'), dict):
+                room['body'] = dict(room['body'], host=':'.join(map(str, conn.getsockname())))
+            room = json.dumps(room).encode()
+            conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                         + f'Content-Length: {len(room)}\r\nConnection: close\r\n\r\n'.encode()
+                         + room)
+            return False
+        accept = b64encode(sha1((headers['sec-websocket-key'] + WS_GUID).encode()).digest())
+        conn.sendall(b'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n'
+                     b'Connection: Upgrade\r\nSec-WebSocket-Accept: ' + accept + b'\r\n'
+                     b'Sec-WebSocket-Protocol: ' + headers['sec-websocket-protocol'].encode()
+                     + b'\r\n\r\n')
+        for message in self.traffic['messages']:
+            if 'expect' in message:
+                self.received.append(json.loads(_read_frame(conn)))
+                if self.received[-1].get('opcode') != message['expect']:
+                    break
+            else:
+                _send_frame(conn, json.dumps(message['send']).encode())
+        _send_frame(conn, struct.pack('!H', 1000), opcode=0x8)  # Close
+        return True
+
+    def _serve(self) -> None:
+        """Answer requests until the WebSocket traffic has been replayed."""
+        done = False  # The WebSocket traffic has been replayed
+        while not done and not self._stopped.is_set():
+            try:
+                conn = self._listener.accept()[0]
+            except TimeoutError:
+                continue  # Check self._stopped
+            with conn:
+                conn.settimeout(5)
+                done = self._handle(conn)
+
+
+def _read_exactly(conn: socket.socket, num_bytes: int) -> bytes:
+    """Read num_bytes from conn."""
+    data = b''  # Bytes read
+    while len(data) < num_bytes:
+        chunk = conn.recv(num_bytes - len(data))
+        if not chunk:
+            raise ConnectionError('The player hung up')
+        data += chunk
+    return data
+
+
+def _read_frame(conn: socket.socket) -> bytes:
+    """Read one masked WebSocket frame's payload from conn."""
+    header = _read_exactly(conn, 2)  # Opcode, mask bit, and payload length
+    length = header[1] & 0x7F        # Payload length
+    if length == 126:
+        length = struct.unpack('!H', _read_exactly(conn, 2))[0]
+    elif length == 127:
+        length = struct.unpack('!Q', _read_exactly(conn, 8))[0]
+    mask = _read_exactly(conn, 4)
+    return bytes(byte ^ mask[index % 4] for index, byte in enumerate(_read_exactly(conn, length)))
+
+
+def _send_frame(conn: socket.socket, payload: bytes, opcode: int = 0x1) -> None:
+    """Send one unmasked WebSocket frame to conn."""
+    header = bytes([0x80 | opcode])  # FIN + opcode
+    if len(payload) < 126:
+        header += bytes([len(payload)])
+    elif len(payload) < 65536:
+        header += bytes([126]) + struct.pack('!H', len(payload))
+    else:
+        header += bytes([127]) + struct.pack('!Q', len(payload))
+    conn.sendall(header + payload)
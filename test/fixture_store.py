@@ -0,0 +1,235 @@
+"""A content-addressed store for the saved jackbox.tv pages used as file-based test input.
+
+Every browser "Save page as" capture saves the same JavaScript, CSS, and image bundles next to
+the page.  The store keeps one copy of each file (a blob, named by its SHA-256) plus a manifest
+per page which maps each of the page's relative paths to a blob.  Pages are reassembled, on
+demand, into a cache directory of hard links.
+
+Typical Usage:
+    python -m test.fixture_store import ~/Downloads/JackboxTv-Q3-Round_1-Prompt_1.html
+    python -m test.fixture_store import --move test/test_input/JackboxTv-Q3-Round_1-Prompt_1.html
+    python -m test.fixture_store verify
+    input_html = fixture_path('JackboxTv-Q3-Round_1-Prompt_1.html')
+"""
+
+# Standard Imports
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, List
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+# Third Party Imports
+# Local Imports
+
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures'        # The default store
+CACHE_DIR = Path(__file__).parent / '.fixture_cache'    # Reassembled pages (see: .gitignore)
+TEST_INPUT_DIR = Path(__file__).parent / 'test_input'   # Test input not (yet) in the store
+
+
+class FixtureStore:
+    """Store, and reassemble, saved web pages as deduplicated blobs plus per-page manifests."""
+
+    def __init__(self, root: Path = FIXTURE_DIR, cache: Path = CACHE_DIR) -> None:
+        """Class ctor.
+
+        Args:
+            root: Optional; The store's directory.  Holds blobs/ and manifests/.
+            cache: Optional; The directory to reassemble pages in.
+        """
+        self.blob_dir = Path(root) / 'blobs'          # Files, named by their SHA-256
+        self.manifest_dir = Path(root) / 'manifests'  # One <page>.json per page
+        self.cache = Path(cache)                      # Reassembled pages
+
+    def import_capture(self, html_file: Path, move: bool = False) -> Path:
+        """Add a "Save page as" capture (an HTML file and its <stem>_files dir) to the store.
+
+        Args:
+            html_file: The saved HTML file.
+            move: Optional; If True, delete the capture once it's stored.
+
+        Returns:
+            The page's manifest.
+
+        Raises:
+            ValueError: html_file is not a file.
+        """
+        # LOCAL VARIABLES
+        html_file = Path(html_file)                                # The saved HTML file
+        files_dir = html_file.with_name(f'{html_file.stem}_files')  # The saved page's files
+        manifest = {}                                              # Relative path: blob name
+
+        # INPUT VALIDATION
+        if not html_file.is_file():
+            raise ValueError(f'Filename {html_file} is not actually a file')
+
+        # IMPORT IT
+        manifest[html_file.name] = self._store_blob(html_file)
+        if files_dir.is_dir():
+            for file in sorted(path for path in files_dir.rglob('*') if path.is_file()):
+                manifest[file.relative_to(html_file.parent).as_posix()] = self._store_blob(file)
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+        (self.manifest_dir / f'{html_file.name}.json').write_text(
+            json.dumps({'page': html_file.name, 'files': manifest}, indent=1, sort_keys=True)
+            + '\n', encoding='utf-8')
+        if move:
+            html_file.unlink()
+            shutil.rmtree(files_dir, ignore_errors=True)
+
+        # DONE
+        return self.manifest_dir / f'{html_file.name}.json'
+
+    def pages(self) -> List[str]:
+        """List the filenames of every page in the store."""
+        return sorted(manifest.name[:-len('.json')]
+                      for manifest in self.manifest_dir.glob('*.json'))
+
+    def path(self, filename: str) -> Path:
+        """Reassemble a stored page, if it isn't already, and return its path.
+
+        Args:
+            filename: The page's filename (e.g., JackboxTV-login_start.html).
+
+        Returns:
+            The reassembled page, or None if filename isn't in the store.
+        """
+        # LOCAL VARIABLES
+        manifest_file = self.manifest_dir / f'{filename}.json'  # The page's manifest
+        manifest_text = ''                                       # manifest_file's contents
+        page_dir = None                                          # The reassembled page's dir
+        temp_dir = None                                          # page_dir, under construction
+
+        # REASSEMBLE IT
+        if not manifest_file.is_file():
+            return None
+        manifest_text = manifest_file.read_text(encoding='utf-8')
+        # Keyed by the manifest's contents so re-imported pages get reassembled
+        page_dir = self.cache / f'{Path(filename).stem}-' \
+                                f'{sha256(manifest_text.encode()).hexdigest()[:12]}'
+        if not page_dir.is_dir():
+            self.cache.mkdir(parents=True, exist_ok=True)
+            temp_dir = Path(tempfile.mkdtemp(dir=self.cache, prefix='.'))
+            for rel_path, blob in json.loads(manifest_text)['files'].items():
+                (temp_dir / rel_path).parent.mkdir(parents=True, exist_ok=True)
+                _link_or_copy(self._blob_path(blob), temp_dir / rel_path)
+            try:
+                temp_dir.rename(page_dir)
+            except OSError:
+                shutil.rmtree(temp_dir, ignore_errors=True)  # Another process beat us to it
+
+        # DONE
+        return page_dir / filename
+
+    def verify(self) -> List[str]:
+        """Check every manifest's blobs exist, unchanged, and that every blob is referenced.
+
+        Returns:
+            A list of problems.  Empty if there are none.
+        """
+        # LOCAL VARIABLES
+        problems = []                    # Missing, corrupt, and orphaned blobs
+        referenced: Dict[str, str] = {}  # Blob name: first manifest referencing it
+
+        # VERIFY IT
+        for manifest_file in sorted(self.manifest_dir.glob('*.json')):
+            for rel_path, blob in json.loads(manifest_file.read_text(
+                    encoding='utf-8'))['files'].items():
+                referenced.setdefault(blob, manifest_file.name)
+                if not self._blob_path(blob).is_file():
+                    problems.append(f'{manifest_file.name}: {rel_path} is missing blob {blob}')
+        for blob in sorted(referenced):
+            if self._blob_path(blob).is_file() and _hash_file(self._blob_path(blob)) != blob:
+                problems.append(f'{referenced[blob]}: blob {blob} is corrupt')
+        for blob_file in sorted(self.blob_dir.glob('*/*')):
+            if blob_file.name not in referenced:
+                problems.append(f'Blob {blob_file.name} is not referenced by any manifest')
+
+        # DONE
+        return problems
+
+    def _blob_path(self, blob: str) -> Path:
+        """Where the blob named blob lives."""
+        return self.blob_dir / blob[:2] / blob
+
+    def _store_blob(self, file: Path) -> str:
+        """Add file to the store, if it isn't already, and return its blob name."""
+        # LOCAL VARIABLES
+        blob = _hash_file(file)            # The blob's name
+        blob_file = self._blob_path(blob)  # Where the blob lives
+
+        # STORE IT
+        if not blob_file.is_file():
+            blob_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(file, blob_file.with_suffix('.tmp'))
+            os.replace(blob_file.with_suffix('.tmp'), blob_file)
+
+        # DONE
+        return blob
+
+
+def fixture_path(filename: str) -> Path:
+    """Find file-based test input by filename.
+
+    Files in test/test_input (e.g., new captures and non-HTML input) are used as-is.  Pages in
+    the default FixtureStore are reassembled on demand.
+
+    Args:
+        filename: The test input's filename (e.g., JackboxTV-login_start.html).
+
+    Returns:
+        The test input's path.  Check that it exists before using it.
+    """
+    if (TEST_INPUT_DIR / filename).exists():
+        return TEST_INPUT_DIR / filename
+    return FixtureStore().path(filename) or TEST_INPUT_DIR / filename
+
+
+def _hash_file(file: Path) -> str:
+    """SHA-256 of file's contents."""
+    return sha256(Path(file).read_bytes()).hexdigest()
+
+
+def _link_or_copy(source: Path, dest: Path) -> None:
+    """Hard link dest to source.  Copy source if hard links aren't supported."""
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
+
+
+def main() -> int:
+    """Import captures into, or verify, the default FixtureStore."""
+    # LOCAL VARIABLES
+    parser = argparse.ArgumentParser(prog='python -m test.fixture_store',
+                                     description='Manage the deduplicated test input store')
+    subparsers = parser.add_subparsers(dest='command', required=True)  # import, verify
+    import_parser = subparsers.add_parser('import', help='Import "Save page as" captures')
+    args = None                                                       # Parsed arguments
+    store = FixtureStore()                                            # The default store
+    problems = []                                                     # store.verify() results
+
+    # PARSE ARGS
+    import_parser.add_argument('html_files', nargs='+', type=Path, help='Saved HTML files')
+    import_parser.add_argument('--move', action='store_true',
+                               help='Delete each capture once it is stored')
+    subparsers.add_parser('verify', help='Check for missing, corrupt, and orphaned blobs')
+    args = parser.parse_args()
+
+    # DO IT
+    if args.command == 'import':
+        for html_file in args.html_files:
+            print(f'Stored {html_file.name} as {store.import_capture(html_file, args.move)}')
+    else:
+        problems = store.verify()
+        print('\n'.join(problems) if problems else 'The fixture store is OK')
+
+    # DONE
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,18 +10,36 @@ test cases.
 
     if __name__ == '__main__':
         load_and_run('test/unit_test')  # Loads and runs all unit tests
+
+Use jobs to shard the test classes across worker processes.  Each worker keeps one warm Chrome
+(see: test.browser_pool) for its test cases to share.  The workers aren't daemonic, so test cases
+may start processes of their own.
 """
 
 
 # Standard Imports
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from typing import Final, List, Tuple
+import itertools
+import multiprocessing
+import os
+import sys
+import time
 import unittest
 # Third Party Imports
+from test.browser_pool import SHARED_BROWSER_ENV_VAR
 from hobo.disk_operations import validate_directory
 from hobo.validation import validate_type
 # Local Imports
 
 
-def load_and_run(dirname: str, verbosity: int = 2) -> bool:
+# Counted, after the number of test cases run, by _run_suite()
+RESULT_LABELS: Final[Tuple[str, ...]] = ('failures', 'errors', 'skipped', 'expected failures',
+                                         'unexpected successes')
+
+
+def load_and_run(dirname: str, verbosity: int = 2, jobs: int = 1) -> bool:
     """Load and run all unittest test cases found within dirname.
 
     Args:
@@ -30,13 +48,15 @@ def load_and_run(dirname: str, verbosity: int = 2) -> bool:
             0 (quiet): total numbers of tests executed and the global result
             1 (default): verbosity=0 plus a dot for every successful test or a F for every failure
             2 (verbose): you get the help string of every test and the result
+        jobs: Optional; The number of worker processes to run the test cases in.  Test classes
+            are run, whole, by whichever worker is free next.
 
     Returns:
         True if all test cases passed, false otherwise.
 
     Raises:
         TypeError: Invalid data type.
-        ValueError: Empty dirname or unsupported verbosity level.
+        ValueError: Empty dirname, unsupported verbosity level, or jobs < 1.
         FileNotFoundError: Unable to locate dirname.
     """
     # LOCAL VARIABLES
@@ -51,6 +71,10 @@ def load_and_run(dirname: str, verbosity: int = 2) -> bool:
     validate_type(verbosity, 'verbosity', int)
     if verbosity not in [0, 1, 2]:
         raise ValueError(f'Unsupported verbosity level: {verbosity}')
+    # jobs
+    validate_type(jobs, 'jobs', int)
+    if jobs < 1:
+        raise ValueError(f'Invalid number of jobs: {jobs}')
 
     # LOAD
     loader = unittest.TestLoader()  # Test case loading object
@@ -58,4 +82,121 @@ def load_and_run(dirname: str, verbosity: int = 2) -> bool:
     test_runner = unittest.TextTestRunner(verbosity=verbosity)
 
     # RUN
+    if jobs > 1:
+        return _run_parallel(test_suite, verbosity=verbosity, jobs=jobs)
     return test_runner.run(test_suite).wasSuccessful()
+
+
+class _ResultStream(StringIO):
+    """A StringIO which unittest.TextTestResult can write to."""
+
+    def writeln(self, arg: str = None) -> None:
+        """Write arg, if any, and a newline."""
+        if arg:
+            self.write(arg)
+        self.write('\n')
+
+
+def _flatten(test_suite: unittest.TestSuite) -> List[unittest.TestCase]:
+    """List every test case in test_suite, in order."""
+    tests = []  # Every test case
+
+    for test in test_suite:
+        if isinstance(test, unittest.TestSuite):
+            tests.extend(_flatten(test))
+        else:
+            tests.append(test)
+    return tests
+
+
+def _init_worker() -> None:
+    """Have this worker's test cases share one Chrome."""
+    os.environ[SHARED_BROWSER_ENV_VAR] = '1'
+
+
+def _report(totals: List[int], time_taken: float) -> bool:
+    """Write TextTestRunner's summary, of totals, to stderr and return True if it's a pass."""
+    # LOCAL VARIABLES
+    run = totals[0]                                      # Number of test cases run
+    success = not (totals[1] or totals[2] or totals[5])  # No failures, errors, or surprises
+    # Non-zero totals, labeled as TextTestRunner would
+    details = [f'{label}={count}' for label, count in zip(RESULT_LABELS, totals[1:]) if count]
+
+    # REPORT
+    sys.stderr.write(f'{unittest.TextTestResult.separator2}\n'
+                     f'Ran {run} test{"s" if run != 1 else ""} in {time_taken:.3f}s\n\n'
+                     f'{"OK" if success else "FAILED"}'
+                     f'{" (" + ", ".join(details) + ")" if details else ""}\n')
+    sys.stderr.flush()
+
+    # DONE
+    return success
+
+
+def _run_parallel(test_suite: unittest.TestSuite, verbosity: int, jobs: int) -> bool:
+    """Run test_suite's test classes across jobs worker processes and report like TextTestRunner.
+
+    Test cases which can't be loaded by ID (e.g., modules which failed to import) are run in
+    this process.
+    """
+    # LOCAL VARIABLES
+    shards = {}                              # Test IDs, by test class
+    local_suite = unittest.TestSuite()       # Test cases which can't be loaded by ID
+    totals = [0] * (len(RESULT_LABELS) + 1)  # See: _run_suite()
+    reports = []                             # Each shard's failure and error details
+    start_time = time.perf_counter()         # When the run started
+
+    # SHARD
+    for test in _flatten(test_suite):
+        if type(test).__module__.startswith('unittest'):
+            local_suite.addTest(test)
+        else:
+            shards.setdefault(f'{type(test).__module__}.{type(test).__qualname__}',
+                              []).append(test.id())
+
+    # RUN
+    # A multiprocessing.Pool's daemonic workers can't start processes, so use an executor's
+    with ProcessPoolExecutor(max_workers=min(jobs, max(len(shards), 1)),
+                             mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_worker) as executor:
+        for progress, report, counts in itertools.chain(
+                executor.map(_run_shard, [(test_ids, verbosity) for test_ids in shards.values()]),
+                [_run_suite(local_suite, verbosity)]):
+            sys.stderr.write(progress)
+            sys.stderr.flush()
+            reports.append(report)
+            totals = [total + count for total, count in zip(totals, counts)]
+
+    # REPORT
+    sys.stderr.write(('\n' if verbosity else '') + ''.join(reports))
+    return _report(totals, time.perf_counter() - start_time)
+
+
+def _run_shard(shard: Tuple[List[str], int]) -> Tuple[str, str, List[int]]:
+    """Load, by ID, and run one test class's test cases in a worker process."""
+    return _run_suite(unittest.TestLoader().loadTestsFromNames(shard[0]), verbosity=shard[1])
+
+
+def _run_suite(test_suite: unittest.TestSuite, verbosity: int) -> Tuple[str, str, List[int]]:
+    """Run test_suite as TextTestRunner would.
+
+    Returns:
+        A tuple of the progress output, the failure and error details, and the number of test
+        cases run followed by the count of each RESULT_LABELS.
+    """
+    # LOCAL VARIABLES
+    progress = _ResultStream()  # Per test case output
+    report = _ResultStream()    # Failure and error details
+    # Test results, recorded as TextTestRunner would
+    result = unittest.TextTestResult(progress, descriptions=True, verbosity=verbosity)
+
+    # RUN
+    test_suite.run(result)
+    result.stream = report
+    result.printErrorList('ERROR', result.errors)
+    result.printErrorList('FAIL', result.failures)
+
+    # DONE
+    return progress.getvalue(), report.getvalue(), \
+        [result.testsRun, len(result.failures), len(result.errors), len(result.skipped),
+         len(result.expectedFailures), len(result.unexpectedSuccesses)]
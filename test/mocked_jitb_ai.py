@@ -6,6 +6,7 @@ JitbAi methods, and even saves the sole constructor argument as an attribute.
 """
 
 # Standard Imports
+from typing import Callable, List
 import random
 # Third Party Imports
 # Local Imports
@@ -29,6 +30,12 @@ class MockedJitbAi(JitbAi):
     def tear_down(self) -> None:
         """Do nothing."""
 
+    def create_content(self, messages: List, add_base_msgs: bool = True,
+                       max_tokens: int = 50, stop_check: Callable[[str], bool] = None,
+                       response_format: dict = None) -> str:
+        """Answer any request with one of generate_answer()'s generic answers."""
+        return self.generate_answer(prompt='')
+
     def generate_answer(self, prompt: str, length_limit: int = 45,
                         min_len: int = MIN_FITB_LEN) -> str:
         """Randomize from a generic list of answers."""
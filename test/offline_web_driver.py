@@ -0,0 +1,566 @@
+"""A Chrome-free stand-in for the Selenium web driver which reads saved jackbox.tv pages.
+
+No need to launch Chrome to test jitb functionality against the saved HTML test input
+(see: test.fixture_store).
+OfflineWebDriver parses the saved page with html.parser and implements the subset of the
+WebDriver/WebElement surface JITB reads: find_element(s), text, is_enabled(), is_displayed(),
+get_attribute(), accessible_name, page_source, and the take_snapshot() and Recorder scripts.
+Visibility comes from the hidden attribute, inline styles, and the display/visibility rules
+(without pseudo-classes) in the page's local stylesheets.  Anything else (e.g., click(), arbitrary
+JavaScript) raises a WebDriverException.
+
+Only test classes which read the page opt in (see: TestJackboxGames.offline_dom).  Test cases
+fail offline if they click or type, or if their pages only hide an element with a script (e.g.,
+the cookie consent buttons: 'Got it!' and 'Opt out').
+
+These classes were inherited from the real Selenium classes, so they will pass input validation.
+"""
+
+# Standard Imports
+from functools import lru_cache
+from html import escape
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, Final, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+import re
+# Third Party Imports
+from selenium.common.exceptions import (InvalidSelectorException, NoSuchElementException,
+                                        WebDriverException)
+from selenium.webdriver.chrome.webdriver import WebDriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+# Local Imports
+from jitb.jitb_recorder import _RECORD_DOM_JS
+from jitb.jitb_snapshot import _SNAPSHOT_JS
+
+
+# Elements without an end tag
+VOID_TAGS: Final[frozenset] = frozenset(['area', 'base', 'br', 'col', 'embed', 'hr', 'img',
+                                         'input', 'link', 'meta', 'source', 'track', 'wbr'])
+# Elements which are never rendered
+UNRENDERED_TAGS: Final[frozenset] = frozenset(['head', 'script', 'style', 'template', 'noscript',
+                                               'title', 'meta', 'link'])
+# Elements whose text starts, and ends, on its own line
+BLOCK_TAGS: Final[frozenset] = frozenset(['address', 'article', 'aside', 'blockquote', 'dd',
+                                          'div', 'dl', 'dt', 'fieldset', 'figure', 'footer',
+                                          'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header',
+                                          'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section',
+                                          'table', 'tr', 'ul'])
+# One compound selector (e.g., button.choice#first[disabled]) broken into its parts
+_COMPOUND: Final[re.Pattern] = re.compile(r'([#.]?[\w-]+|\*|\[[^\]]+\])')
+# CSS text-transform values, applied to the visible text
+_TRANSFORMS: Final[Dict[str, Any]] = {'uppercase': str.upper, 'lowercase': str.lower,
+                                      'capitalize': str.title}
+# A supported XPath: //tag, .//tag, or either with a single [@attr='value'] predicate
+_XPATH: Final[re.Pattern] = re.compile(r"^\.?//([\w*-]+)(?:\[@([\w-]+)=['\"]([^'\"]*)['\"]\])?$")
+
+
+class _Node:  # pylint: disable = too-few-public-methods
+    """One element of the parsed page."""
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional['_Node']) -> None:
+        """Class ctor."""
+        self.tag = tag                       # Lower case tag name
+        self.attrs = attrs                   # Attribute values, by name
+        self.parent = parent                 # Parent element (None for the root)
+        self.children: List[Any] = []        # Child _Nodes and text strings, in order
+        self.style: Dict[str, str] = {}      # Cascaded display, visibility, and text-transform
+
+    def iter(self) -> Any:
+        """Yield every descendant element, in document order."""
+        for child in self.children:
+            if isinstance(child, _Node):
+                yield child
+                yield from child.iter()
+
+
+class _TreeBuilder(HTMLParser):
+    """Build a tree of _Nodes from HTML."""
+
+    def __init__(self) -> None:
+        """Class ctor."""
+        super().__init__(convert_charrefs=True)
+        self.root = _Node('#document', {}, None)  # The document
+        self._stack = [self.root]                 # Open elements
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, str]]) -> None:
+        """Open an element."""
+        node = _Node(tag, {name: value or '' for name, value in attrs}, self._stack[-1])
+        self._stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, str]]) -> None:
+        """Open, and close, an element."""
+        self._stack[-1].children.append(_Node(tag, {name: value or '' for name, value in attrs},
+                                              self._stack[-1]))
+
+    def handle_endtag(self, tag: str) -> None:
+        """Close the nearest open tag element, and anything left open inside it."""
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                del self._stack[index:]
+                break
+
+    def handle_data(self, data: str) -> None:
+        """Add text to the current element."""
+        self._stack[-1].children.append(data)
+
+
+class OfflineWebElement(WebElement):
+    """A read-only WebElement backed by a parsed _Node."""
+
+    def __init__(self, parent: 'OfflineWebDriver', node: _Node) -> None:
+        """Class ctor."""
+        super().__init__(parent, str(id(node)))
+        self._node = node  # The parsed element
+
+    @property
+    def tag_name(self) -> str:
+        """This element's tag name."""
+        return self._node.tag
+
+    @property
+    def text(self) -> str:
+        """This element's visible text, as Selenium would report it."""
+        return _visible_text(self._node)
+
+    @property
+    def accessible_name(self) -> str:
+        """This element's aria-label or, failing that, its visible text."""
+        return self._node.attrs.get('aria-label', '').strip() or self.text
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """Read an attribute (or a boolean attribute as 'true')."""
+        if name in self._node.attrs and name in ('disabled', 'hidden', 'checked', 'selected'):
+            return 'true'
+        if name == 'value' and self._node.tag == 'textarea':
+            return _raw_text(self._node)
+        if name in ('innerHTML', 'outerHTML', 'textContent'):
+            return {'innerHTML': _inner_html, 'outerHTML': _outer_html,
+                    'textContent': _raw_text}[name](self._node)
+        return self._node.attrs.get(name)
+
+    def get_dom_attribute(self, name: str) -> Optional[str]:
+        """Read an attribute, exactly as it appears in the HTML."""
+        return self._node.attrs.get(name)
+
+    def is_displayed(self) -> bool:
+        """Is this element rendered?"""
+        return _is_displayed(self._node)
+
+    def is_enabled(self) -> bool:
+        """Is this element, and its fieldset, missing the disabled attribute?"""
+        node = self._node  # Walks up the fieldsets
+        while node is not None:
+            if 'disabled' in node.attrs and (node is self._node or node.tag == 'fieldset'):
+                return False
+            node = node.parent
+        return True
+
+    def find_element(self, by: str = By.ID, value: Optional[str] = None) -> WebElement:
+        """Find the first element, below this one, matching by and value."""
+        return _first(self._parent, _find(self._node, by, value), by, value)
+
+    def find_elements(self, by: str = By.ID, value: Optional[str] = None) -> List[WebElement]:
+        """Find every element, below this one, matching by and value."""
+        return [OfflineWebElement(self._parent, node) for node in _find(self._node, by, value)]
+
+
+class OfflineWebDriver(WebDriver):  # pylint: disable = abstract-method
+    """A read-only WebDriver backed by a saved HTML file instead of Chrome."""
+
+    def __init__(self, filename: Path) -> None:  # pylint: disable = super-init-not-called
+        """Class ctor.
+
+        Args:
+            filename: The saved HTML file to load.
+        """
+        self._html = ''          # The HTML source
+        self._root = None        # The parsed document
+        self._url = ''           # The loaded URL
+        self._is_remote = False  # Read by WebElement.send_keys()
+        self.get(Path(filename).absolute().as_uri())
+
+    @property
+    def page_source(self) -> str:
+        """The HTML source of the page."""
+        return self._html
+
+    def get(self, url: str) -> None:
+        """Load a file:// URL."""
+        path = Path(unquote(urlparse(url).path))  # The file to load
+        if urlparse(url).scheme != 'file' or not path.is_file():
+            raise WebDriverException(f'Unable to load {url} offline')
+        self.load_html(path.read_text(encoding='utf-8', errors='replace'), path.parent)
+        self._url = url
+
+    def load_html(self, html: str, page_dir: Optional[Path] = None) -> None:
+        """Load a page from its HTML, with its local stylesheets (if any) in page_dir."""
+        self._html = html
+        self._root = _parse_page(html, page_dir if page_dir else Path())
+
+    def find_element(self, by: str = By.ID, value: Optional[str] = None) -> WebElement:
+        """Find the first element matching by and value."""
+        return _first(self, _find(self._root, by, value), by, value)
+
+    def find_elements(self, by: str = By.ID, value: Optional[str] = None) -> List[WebElement]:
+        """Find every element matching by and value."""
+        return [OfflineWebElement(self, node) for node in _find(self._root, by, value)]
+
+    def execute_script(self, script: str, *args) -> Any:
+        """Run the take_snapshot(), or Recorder, script.  No other JavaScript is supported."""
+        if script == _RECORD_DOM_JS:
+            return {'url': self._url, 'html': '<!DOCTYPE html>' + ''.join(
+                _rendered_html(child) for child in self._root.children if isinstance(child, _Node))}
+        if script != _SNAPSHOT_JS:
+            raise WebDriverException('JavaScript is not supported offline')
+        return _snapshot(self._root, self._html, *args)
+
+    def execute(self, driver_command: str, params: Optional[dict] = None) -> Any:
+        """Fail every other WebDriver command."""
+        raise WebDriverException(f'{driver_command} is not supported offline')
+
+    def implicitly_wait(self, time_to_wait: float) -> None:
+        """Do nothing."""
+
+    def minimize_window(self) -> None:
+        """Do nothing."""
+
+    def close(self) -> None:
+        """Do nothing."""
+
+    def quit(self) -> None:
+        """Do nothing."""
+
+
+def _apply_stylesheets(root: _Node, page_dir: Path) -> None:
+    """Cascade the display and visibility rules from the page's local stylesheets."""
+    rules = []  # (specificity, order, selector steps, declarations)
+    for node in root.iter():
+        if node.tag == 'style':
+            rules.extend(_parse_css(_raw_text(node)))
+        elif node.tag == 'link' and 'stylesheet' in node.attrs.get('rel', '') and \
+                not urlparse(node.attrs.get('href', '')).scheme:
+            rules.extend(_read_stylesheet(page_dir / unquote(node.attrs['href'])))
+    rules = [(_specificity(steps), order, steps, decls)
+             for order, (steps, decls) in enumerate(rules)]
+    rules.sort(key=lambda rule: (rule[0], rule[1]))
+    for node in root.iter():
+        for _, _, steps, decls in rules:
+            if _select_matches(node, steps, root):
+                node.style.update(decls)
+        node.style.update(_parse_declarations(node.attrs.get('style', '')))
+
+
+def _find(root: _Node, by: str, value: Optional[str]) -> List[_Node]:
+    """Find every element, below root, matching by and value."""
+    # LOCAL VARIABLES
+    match = None  # Regular expression match
+
+    # FIND THEM
+    if by == By.ID:
+        return [node for node in root.iter() if node.attrs.get('id') == value]
+    if by == By.CLASS_NAME:
+        return [node for node in root.iter() if value in node.attrs.get('class', '').split()]
+    if by == By.TAG_NAME:
+        return [node for node in root.iter() if node.tag == value.lower()]
+    if by == By.NAME:
+        return [node for node in root.iter() if node.attrs.get('name') == value]
+    if by == By.CSS_SELECTOR:
+        return _select(root, value)
+    if by == By.XPATH:
+        match = _XPATH.match(value or '')
+        if match:
+            return [node for node in root.iter()
+                    if match.group(1) in ('*', node.tag) and
+                    (not match.group(2) or node.attrs.get(match.group(2)) == match.group(3))]
+    raise InvalidSelectorException(f'{by}:{value} is not supported offline')
+
+
+def _first(driver: 'OfflineWebDriver', nodes: List[_Node], by: str,
+           value: Optional[str]) -> WebElement:
+    """Wrap the first node, or raise NoSuchElementException."""
+    if not nodes:
+        raise NoSuchElementException(f'Unable to locate element: {by}:{value}')
+    return OfflineWebElement(driver, nodes[0])
+
+
+def _inherited(node: Optional[_Node], name: str, default: str) -> str:
+    """The nearest value of an inherited CSS property, from node up."""
+    while node is not None:
+        if name in node.style:
+            return node.style[name]
+        node = node.parent
+    return default
+
+
+def _inner_html(node: _Node) -> str:
+    """Serialize node's children as HTML."""
+    return ''.join(escape(child, quote=False) if isinstance(child, str) else _outer_html(child)
+                   for child in node.children)
+
+
+def _has_box(node: _Node) -> bool:
+    """Is node, and every element above it, laid out (even if it's invisible)?"""
+    while node is not None:
+        if node.tag in UNRENDERED_TAGS or 'hidden' in node.attrs or \
+                node.style.get('display') == 'none' or \
+                (node.tag == 'input' and node.attrs.get('type') == 'hidden'):
+            return False
+        node = node.parent
+    return True
+
+
+def _is_displayed(node: _Node) -> bool:
+    """Is node, and every element above it, rendered?"""
+    return _has_box(node) and \
+        _inherited(node, 'visibility', 'visible') not in ('hidden', 'collapse')
+
+
+def _matches(node: _Node, parts: List[str]) -> bool:
+    """Does node match every part of a compound selector?"""
+    for part in parts:
+        if part.startswith('#'):
+            matched = node.attrs.get('id') == part[1:]
+        elif part.startswith('.'):
+            matched = part[1:] in node.attrs.get('class', '').split()
+        elif part.startswith('['):
+            name, _, expected = part[1:-1].partition('=')
+            matched = name.strip() in node.attrs and \
+                (not expected or node.attrs[name.strip()] == expected.strip('\'" '))
+        else:
+            matched = part in ('*', node.tag)
+        if not matched:
+            return False
+    return True
+
+
+def _outer_html(node: _Node) -> str:
+    """Serialize node, and its children, as HTML."""
+    attrs = ''.join(f' {name}="{escape(value)}"' for name, value in node.attrs.items())
+    if node.tag in VOID_TAGS:
+        return f'<{node.tag}{attrs}>'
+    return f'<{node.tag}{attrs}>{_inner_html(node)}</{node.tag}>'
+
+
+def _parse_css(css: str) -> List[Tuple[List[str], Dict[str, str]]]:
+    """Read the top-level display and visibility rules, without pseudo-classes, from css."""
+    rules = []  # (selector steps, declarations)
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    for selectors, body in _top_level_blocks(css):
+        decls = _parse_declarations(body)
+        if not decls or selectors.startswith('@'):
+            continue
+        for selector in selectors.split(','):
+            steps = _split_selector(selector)
+            if steps:
+                rules.append((steps, decls))
+    return rules
+
+
+def _parse_declarations(body: str) -> Dict[str, str]:
+    """Read the display, visibility, and text-transform declarations from a CSS block/style."""
+    decls = {}  # Values, by property
+    for declaration in body.split(';'):
+        name, _, value = declaration.partition(':')
+        name = name.strip().lower()
+        if name in ('display', 'visibility', 'text-transform'):
+            decls[name] = value.replace('!important', '').strip().lower()
+    return decls
+
+
+def _parse_page(html: str, page_dir: Path) -> _Node:
+    """Parse html, and its stylesheets, into a tree of _Nodes."""
+    builder = _TreeBuilder()  # Parses the HTML
+    builder.feed(html)
+    builder.close()
+    _apply_stylesheets(builder.root, page_dir)
+    return builder.root
+
+
+def _raw_text(node: _Node) -> str:
+    """Every bit of text below node, visible or not."""
+    return ''.join(child if isinstance(child, str) else _raw_text(child)
+                   for child in node.children)
+
+
+@lru_cache(maxsize=None)
+def _read_stylesheet(path: Path) -> List[Tuple[List[str], Dict[str, str]]]:
+    """Read the display and visibility rules from a local stylesheet."""
+    if not path.is_file():
+        return []
+    return _parse_css(path.read_text(encoding='utf-8', errors='replace'))
+
+
+def _rendered_html(node: _Node) -> str:
+    """Serialize node as the Recorder script would: visibility, display, and text-transform
+    inlined, and no scripts or stylesheets."""
+    # LOCAL VARIABLES
+    attrs = dict(node.attrs)  # The serialized attributes
+    inline = ''               # The inlined style
+
+    # SERIALIZE IT
+    if node.tag in ('script', 'style', 'link'):
+        return ''
+    if node.tag in UNRENDERED_TAGS:
+        pass  # Never rendered, so never marked
+    elif not _has_box(node):
+        attrs['hidden'] = ''
+    else:
+        inline = 'display: ' + node.style.get('display', 'block' if node.tag in BLOCK_TAGS
+                                              else 'inline')
+        for name, default in (('visibility', 'visible'), ('text-transform', 'none')):
+            if _inherited(node, name, default) != _inherited(node.parent, name, default):
+                inline += f'; {name}: {_inherited(node, name, default)}'
+        attrs['style'] = inline
+    html = '<' + node.tag + ''.join(f' {name}="{escape(value)}"' for name, value in attrs.items())
+    if node.tag in VOID_TAGS:
+        return html + '>'
+    return html + '>' + ''.join(escape(child, quote=False) if isinstance(child, str)
+                                else _rendered_html(child) for child in node.children) \
+        + f'</{node.tag}>'
+
+
+def _select(root: _Node, selector: str) -> List[_Node]:
+    """Find every element, below root, matching a CSS selector group.
+
+    Supports compound selectors joined by descendant (' ') and child ('>') combinators.
+    """
+    found = []  # Matching nodes, in document order
+    for group in selector.split(','):
+        steps = _split_selector(group)
+        if not steps:
+            raise InvalidSelectorException(f'{selector} is not supported offline')
+        found.extend(node for node in root.iter()
+                     if node not in found and _select_matches(node, steps, root))
+    return [node for node in root.iter() if node in found]
+
+
+def _select_matches(node: _Node, steps: List[str], root: _Node) -> bool:
+    """Does node match the last step, with its ancestors (below root) matching the rest?"""
+    if not _matches(node, _COMPOUND.findall(steps[-1])):
+        return False
+    if len(steps) == 1:
+        return True
+    if steps[-2] == '>':
+        return node.parent is not root and node.parent is not None and \
+            _select_matches(node.parent, steps[:-2], root)
+    ancestor = node.parent  # Walks up to root
+    while ancestor is not None and ancestor is not root:
+        if _select_matches(ancestor, steps[:-1], root):
+            return True
+        ancestor = ancestor.parent
+    return False
+
+
+def _split_selector(selector: str) -> List[str]:
+    """Split a CSS selector into compound selectors and '>'s.  Empty if it isn't supported."""
+    steps = re.sub(r'\s*>\s*', ' > ', selector.strip()).split()  # Compound selectors and '>'s
+    if any(step != '>' and ''.join(_COMPOUND.findall(step)) != step for step in steps):
+        return []
+    return steps
+
+
+# pylint: disable = too-many-arguments
+def _snapshot(root: _Node, html: str, locators: List[List[str]], max_length_ids: List[str],
+              login_ids: List[str], error_list: List[str]) -> Dict[str, Any]:
+    """Return what the take_snapshot() script would."""
+    # LOCAL VARIABLES
+    texts = {}                 # Visible text, by 'by:value'
+    source = html.lower()      # Searched for errors
+    by_id = {}                 # Elements, by id
+    nodes = []                 # Elements found for a locator
+
+    # SNAPSHOT IT
+    for node in root.iter():
+        by_id.setdefault(node.attrs.get('id'), node)
+    for by_arg, value in locators:
+        nodes = [by_id[value]] if by_arg == By.ID and value in by_id else \
+            [] if by_arg == By.ID else _find(root, by_arg, value)
+        texts[f'{by_arg}:{value}'] = _visible_text(nodes[0]) if nodes else None
+
+    # DONE
+    return {'texts': texts,
+            'buttons': [{'text': _visible_text(node), 'enabled': 'disabled' not in node.attrs,
+                         'accessible_name': (node.attrs.get('aria-label') or
+                                             _visible_text(node)).strip()}
+                        for node in root.iter() if node.tag == 'button'],
+            'max_lengths': {elem_id: by_id[elem_id].attrs.get('maxlength')
+                            if elem_id in by_id else None for elem_id in max_length_ids},
+            'errors': [error for error in error_list if error.lower() in source],
+            'login': all(elem_id in by_id for elem_id in login_ids)}
+# pylint: enable = too-many-arguments
+
+
+def _specificity(steps: List[str]) -> Tuple[int, int, int]:
+    """Calculate a CSS selector's specificity."""
+    parts = [part for step in steps for part in _COMPOUND.findall(step)]  # Simple selectors
+    return tuple((sum(part.startswith('#') for part in parts),
+                  sum(part[0] in '.[' for part in parts),
+                  sum(part[0] not in '#.[*' for part in parts)))
+
+
+def _top_level_blocks(css: str) -> List[Tuple[str, str]]:
+    """Split css into (prelude, body) blocks, skipping the contents of nested @-rules."""
+    blocks = []  # (prelude, body)
+    depth = 0    # Brace depth
+    start = 0    # Start of the current prelude (depth 0) or body (depth 1)
+    prelude = ''  # The current block's prelude
+    for index, char in enumerate(css):
+        if char == '{':
+            if depth == 0:
+                prelude = css[start:index].strip()
+                start = index + 1
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                blocks.append((prelude, css[start:index]))
+                start = index + 1
+    return blocks
+
+
+def _visible_text(node: _Node) -> str:
+    """node's rendered text, one line per block or <br>, like WebElement.text.
+
+    Like Selenium, runs of whitespace are collapsed and lines are trimmed, but non-breaking spaces
+    are neither, and they're reported as plain spaces.
+    """
+    # LOCAL VARIABLES
+    pieces = []  # Text, hard line breaks ('\n'), and soft line breaks (None)
+    lines = ['']  # Rendered lines
+
+    # READ IT
+    if not _is_displayed(node):
+        return ''
+    _walk_text(node, pieces, _inherited(node.parent, 'text-transform', 'none'))
+    for piece in pieces:
+        if piece == '\n' or (piece is None and lines[-1].strip()):
+            lines.append('')  # Blocks only break non-empty lines; <br>s always break
+        elif piece is not None:
+            lines[-1] += piece
+    lines = [re.sub(' +', ' ', line).strip(' ') for line in lines]  # Collapse across elements
+
+    # DONE
+    return '\n'.join(lines).strip('\n').replace('\xa0', ' ')
+
+
+def _walk_text(node: _Node, pieces: List[str], transform: str = 'none') -> None:
+    """Append node's rendered text, with its inherited text-transform, to pieces."""
+    transform = node.style.get('text-transform', transform)  # Inherited text-transform
+    for child in node.children:
+        if isinstance(child, str):
+            pieces.append(_TRANSFORMS.get(transform, str)(re.sub(r'[^\S\xa0]+', ' ', child)))
+        elif child.tag == 'br':
+            pieces.append('\n')
+        elif child.tag not in UNRENDERED_TAGS and 'hidden' not in child.attrs and \
+                child.style.get('display') != 'none':
+            if child.style.get('display', 'block' if child.tag in BLOCK_TAGS else 'inline') \
+                    .startswith(('block', 'flex', 'grid', 'list-item', 'table')):
+                pieces.append(None)
+                _walk_text(child, pieces, transform)
+                pieces.append(None)
+            elif child.style.get('visibility') not in ('hidden', 'collapse'):
+                _walk_text(child, pieces, transform)
@@ -0,0 +1,367 @@
+"""Replays a session recorded by jitb --record (see: jitb.jitb_recorder) without Chrome or OpenAI.
+
+Each player's game object is driven through the recorded ticks.  Its web driver is a
+ReplayWebDriver, an OfflineWebDriver (see: test.offline_web_driver) that shows whichever of the
+player's recorded pages was on screen at the replay clock's time, and its AI is a ReplayJitbAi
+which answers each request with the recorded response.  Clicks and keystrokes are compared to
+the recorded ones.
+
+At wall-clock speed the replay takes as long as the session did, AI latency included, to
+reproduce timing bugs.  At max speed the clock is virtual: sleeps, and AI latency, advance it
+instantly so the whole decision loop can be benchmarked.  The replay ends when the clock passes
+the end of the recording.
+
+Typical Usage:
+    python -m test.replayer /tmp/jitb_session_20240101_120000.jsonl.gz
+    python -m test.replayer --speed wall /tmp/jitb_session_20240101_120000.jsonl.gz
+    report = replay_session('/tmp/jitb_session_20240101_120000.jsonl.gz')
+"""
+
+# Standard Imports
+from bisect import bisect_right
+from collections import deque
+from difflib import SequenceMatcher
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple
+from unittest import mock
+import argparse
+import json
+import statistics
+import sys
+import time
+# Third Party Imports
+from test.offline_web_driver import OfflineWebDriver, OfflineWebElement
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+# Local Imports
+from jitb.jitb_logger import Logger
+from jitb.jitb_openai import JitbAi
+from jitb.jitb_recorder import load_session
+from jitb.jitb_validation import validate_game
+from jitb.jitb_website import JITB_SUPPORTED_GAMES
+
+
+REPLAY_SPEEDS: Final[List[str]] = ['max', 'wall']  # Virtual clock or wall-clock replays
+# Recorded input actions, by the WebDriver command which performs them
+INPUT_COMMANDS: Final[Dict[str, str]] = {Command.CLICK_ELEMENT: 'click',
+                                         Command.SEND_KEYS_TO_ELEMENT: 'send_keys',
+                                         Command.CLEAR_ELEMENT: 'clear'}
+# time.sleep is patched during replays
+_REAL_SLEEP: Final[Callable[[float], None]] = time.sleep  # pylint: disable = invalid-name
+
+
+class _SessionOver(BaseException):
+    """Ends a replay once the clock passes the end of the recording.
+
+    Not an Exception, so the games' own error handling lets it through.
+    """
+
+
+class ReplayClock:
+    """The replay's clock, in seconds since the recording started."""
+
+    def __init__(self, wall: bool, end: float) -> None:
+        """Class ctor.
+
+        Args:
+            wall: If True, follow the wall clock.  Otherwise, keep virtual time.
+            end: When the recording ended.
+        """
+        self._wall = wall                   # Follow the wall clock
+        self._end = end                     # When the recording ended
+        self._origin = time.perf_counter()  # When the replay started
+        self._now = 0.0                     # Virtual time
+
+    def advance_to(self, when: float) -> None:
+        """Wait, or skip ahead, until when."""
+        if self._wall:
+            _REAL_SLEEP(max(0.0, when - self.now()))
+        else:
+            self._now = max(self._now, when)
+
+    def now(self) -> float:
+        """Seconds since the recording started."""
+        return time.perf_counter() - self._origin if self._wall else self._now
+
+    def sleep(self, seconds: float) -> None:
+        """Stands in for time.sleep().
+
+        Raises:
+            _SessionOver: The clock passed the end of the recording.
+        """
+        if self._wall:
+            _REAL_SLEEP(seconds)
+        else:
+            self._now += seconds
+        if self.now() > self._end:
+            raise _SessionOver()
+
+
+class ReplayJitbAi(JitbAi):
+    """Answers each AI request with its recorded response, after its recorded latency."""
+
+    def __init__(self, ai_events: List[Dict[str, Any]], clock: ReplayClock) -> None:
+        """Class ctor.
+
+        Args:
+            ai_events: The recorded ai events.
+            clock: The replay clock, which the recorded latency is slept on.
+        """
+        super().__init__()
+        self._clock = clock   # The replay clock
+        self._responses = {}  # Recorded (latency, response) tuples, by request, in order
+        self.replayed = 0     # Number of requests answered
+        self.missed = 0       # Number of requests that weren't recorded
+        for event in ai_events:
+            self._responses.setdefault(_ai_key(event['messages'], event['max_tokens']),
+                                       deque()).append((event['latency'], event['response']))
+
+    def setup(self) -> None:
+        """Validate everything, without an OpenAI client."""
+        self._validate_attributes()
+
+    def create_content(self, messages: List, add_base_msgs: bool = True,
+                       max_tokens: int = 50, stop_check: Callable[[str], bool] = None,
+                       response_format: dict = None) -> str:
+        """Answer with the recorded response to this request.
+
+        Repeats the last recorded response once each one has been used.
+
+        Raises:
+            TimeoutError: The request wasn't recorded, so callers use their fallbacks.
+        """
+        # LOCAL VARIABLES
+        local_msgs = self._base_messages + messages if add_base_msgs else messages  # Request
+        recorded = self._responses.get(_ai_key(local_msgs, max_tokens))  # Recorded responses
+        latency = 0.0  # Seconds the recorded request took
+        response = ''  # The recorded response
+
+        # ANSWER IT
+        if not recorded:
+            self.missed += 1
+            Logger.debug(f'The replay made a request that was not recorded: {local_msgs}')
+            raise TimeoutError('This request was not recorded')
+        latency, response = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        self.replayed += 1
+        self._clock.sleep(latency)
+
+        # DONE
+        return response
+
+
+# pylint: disable = too-many-instance-attributes
+class ReplayWebDriver(OfflineWebDriver):  # pylint: disable = abstract-method
+    """An OfflineWebDriver which shows the recorded page that's on screen at the replay's time.
+
+    Clicks, keystrokes, and clears are accepted, and saved in inputs, instead of failing.
+    """
+
+    # pylint: disable = super-init-not-called
+    def __init__(self, timeline: List[Tuple[float, str]], clock: ReplayClock) -> None:
+        """Class ctor.
+
+        Args:
+            timeline: When each of this player's pages was recorded, and its HTML, in order.
+            clock: The replay clock.
+        """
+        self._html = ''                                     # The HTML source
+        self._root = None                                   # The parsed document
+        self._is_remote = False                             # Read by WebElement.send_keys()
+        self._timeline = timeline                           # Recorded pages
+        self._times = [when for when, _ in timeline]        # When each page was recorded
+        self._clock = clock                                 # The replay clock
+        self._shown = None                                  # Index of the loaded page
+        self._nodes = {}                                    # Parsed elements, by element ID
+        self.inputs: List[Tuple[str, str]] = []             # (action, text) of each input
+        self._sync()
+    # pylint: enable = super-init-not-called
+
+    @property
+    def page_source(self) -> str:
+        """The HTML source of the page on screen."""
+        self._sync()
+        return self._html
+
+    def execute(self, driver_command: str, params: Optional[dict] = None) -> Any:
+        """Save clicks, keystrokes, and clears.  Ignore every other command."""
+        # LOCAL VARIABLES
+        action = INPUT_COMMANDS.get(driver_command)                 # click, send_keys, or clear
+        node = self._nodes.get((params if params else {}).get('id'))  # The element acted on
+        text = ''                                                   # Keys sent, or clicked text
+
+        # SAVE IT
+        if action == 'click' and node:
+            text = OfflineWebElement(self, node).text
+        elif action == 'send_keys':
+            text = params.get('text', '')
+        if action:
+            self.inputs.append(tuple((action, text)))
+
+        # DONE
+        return {'value': None}
+
+    def execute_script(self, script: str, *args) -> Any:
+        """Run the take_snapshot() script against the page on screen."""
+        self._sync()
+        return super().execute_script(script, *args)
+
+    def find_element(self, by: str = By.ID, value: Optional[str] = None) -> WebElement:
+        """Find the first element, on the page on screen, matching by and value."""
+        self._sync()
+        return super().find_element(by, value)
+
+    def find_elements(self, by: str = By.ID, value: Optional[str] = None) -> List[WebElement]:
+        """Find every element, on the page on screen, matching by and value."""
+        self._sync()
+        return super().find_elements(by, value)
+
+    def _sync(self) -> None:
+        """Load the page that's on screen at the replay clock's time, if it isn't loaded."""
+        # LOCAL VARIABLES
+        index = max(0, bisect_right(self._times, self._clock.now()) - 1)  # Page on screen
+
+        # LOAD IT
+        if index != self._shown and self._timeline:
+            self.load_html(self._timeline[index][1])
+            self._nodes = {str(id(node)): node for node in self._root.iter()}
+            self._shown = index
+        elif self._root is None:
+            self.load_html('<html></html>')
+# pylint: enable = too-many-instance-attributes
+
+
+# pylint: disable = too-many-locals
+def replay_session(filename: str, speed: str = 'max', game: str = None) -> Dict[str, Any]:
+    """Replay a recorded session.
+
+    Exceptions raised by the game are not caught, so they can be reproduced.
+
+    Args:
+        filename: The session file.
+        speed: Optional; max or wall.  See: REPLAY_SPEEDS.
+        game: Optional; Play the session with this game instead of the recorded one.
+
+    Returns:
+        A report of the replay: the game, the number of ticks played (and skipped because the
+        replay ran long), seconds per play() call, wall-clock seconds, AI requests replayed (and
+        missed), and the number of inputs recorded, replayed, and matched.
+
+    Raises:
+        ValueError: Unknown speed or an unreplayable session.
+    """
+    # LOCAL VARIABLES
+    events = load_session(filename)                         # The recorded events
+    # The recorded game, and its players
+    game_event = next((event for event in events if event['type'] == 'game'), None)
+    doms = {event['id']: event['html'] for event in events if event['type'] == 'dom'}
+    ticks = [event for event in events if event['type'] == 'tick']  # Ticks, in order
+    clock = ReplayClock(wall=speed == 'wall', end=events[-1]['t'])  # The replay clock
+    ai_obj = ReplayJitbAi([event for event in events if event['type'] == 'ai'], clock)
+    drivers = {}      # ReplayWebDrivers, by window handle
+    players = {}      # jitb.jbgames objects, by window handle
+    play_times = []   # Seconds each play() call took
+    skipped = 0       # Ticks skipped because the replay was already past them
+    start = 0.0       # When each play() call started
+    wall_start = 0.0  # When the replay started
+    wall_time = 0.0   # Wall-clock seconds the replay took
+
+    # INPUT VALIDATION
+    if speed not in REPLAY_SPEEDS:
+        raise ValueError(f'Unknown replay speed: {speed}')
+    if not game_event:
+        raise ValueError(f'{filename} did not record a game')
+    game = game if game else game_event['game']
+    validate_game(game=game, games=JITB_SUPPORTED_GAMES)
+
+    # SETUP
+    for handle, username in game_event['players'].items():
+        drivers[handle] = ReplayWebDriver([(tick['t'], doms[tick['dom']]) for tick in ticks
+                                           if tick['handle'] == handle], clock)
+        players[handle] = JITB_SUPPORTED_GAMES[game](ai_obj=ai_obj, username=username)
+
+    # REPLAY IT
+    with mock.patch('time.sleep', clock.sleep):
+        wall_start = time.perf_counter()
+        try:
+            for tick in ticks:
+                if tick['handle'] not in players or tick['t'] < clock.now():
+                    skipped += 1
+                    continue
+                clock.advance_to(tick['t'])
+                start = time.perf_counter()
+                players[tick['handle']].play(web_driver=drivers[tick['handle']])
+                play_times.append(time.perf_counter() - start)
+        except _SessionOver:
+            play_times.append(time.perf_counter() - start)  # Cut off at the end of the session
+        wall_time = time.perf_counter() - wall_start
+
+    # DONE
+    return {'game': game, 'ticks': len(play_times), 'skipped': skipped,
+            'play_seconds': play_times, 'wall_seconds': wall_time,
+            'session_seconds': events[-1]['t'], 'ai_replayed': ai_obj.replayed,
+            'ai_missed': ai_obj.missed, **_compare_inputs(events, drivers)}
+# pylint: enable = too-many-locals
+
+
+def _ai_key(messages: List[dict], max_tokens: int) -> str:
+    """Identify an AI request by its messages and max_tokens."""
+    return json.dumps([messages, max_tokens], sort_keys=True)
+
+
+def _compare_inputs(events: List[Dict[str, Any]],
+                    drivers: Dict[str, ReplayWebDriver]) -> Dict[str, int]:
+    """Count the inputs recorded, replayed, and matched (in order) for every player."""
+    # LOCAL VARIABLES
+    counts = {'inputs_recorded': 0, 'inputs_replayed': 0, 'inputs_matched': 0}  # Totals
+    recorded = []  # One player's recorded (action, text) inputs
+
+    # COUNT THEM
+    for handle, driver in drivers.items():
+        recorded = [tuple((event['action'], event['text'])) for event in events
+                    if event['type'] == 'input' and event['handle'] == handle]
+        counts['inputs_recorded'] += len(recorded)
+        counts['inputs_replayed'] += len(driver.inputs)
+        counts['inputs_matched'] += sum(block.size for block in SequenceMatcher(
+            None, recorded, driver.inputs, autojunk=False).get_matching_blocks())
+
+    # DONE
+    return counts
+
+
+def main() -> int:
+    """Replay a session and print a report.  Exits 1 if the replay's inputs diverged."""
+    # LOCAL VARIABLES
+    parser = argparse.ArgumentParser(prog='python -m test.replayer',
+                                     description='Replay a session recorded by jitb --record')
+    args = None    # Parsed arguments
+    report = None  # replay_session() return value
+
+    # PARSE ARGS
+    parser.add_argument('session', help='The recorded session file')
+    parser.add_argument('--speed', choices=REPLAY_SPEEDS, default=REPLAY_SPEEDS[0],
+                        help='max skips every wait, wall waits as long as the session did '
+                             f'(default: {REPLAY_SPEEDS[0]})')
+    parser.add_argument('--game', choices=sorted(JITB_SUPPORTED_GAMES),
+                        help='Replay with this game instead of the recorded one')
+    parser.add_argument('-d', '--debug', action='store_true', help='Log debug messages')
+    args = parser.parse_args()
+
+    # REPLAY IT
+    Logger.initialize(debugging=args.debug)
+    report = replay_session(args.session, speed=args.speed, game=args.game)
+    print(f'Replayed {report["ticks"]} ticks of {report["game"]} ({report["skipped"]} skipped) '
+          f'in {report["wall_seconds"]:.2f} seconds (recorded: {report["session_seconds"]:.2f})')
+    if report['play_seconds']:
+        print(f'play(): {statistics.fmean(report["play_seconds"]) * 1000:.2f} ms mean, '
+              f'{max(report["play_seconds"]) * 1000:.2f} ms max')
+    print(f'AI requests: {report["ai_replayed"]} replayed, {report["ai_missed"]} not recorded')
+    print(f'Inputs: {report["inputs_matched"]} matched of {report["inputs_recorded"]} recorded '
+          f'and {report["inputs_replayed"]} replayed')
+
+    # DONE
+    return int(report['inputs_matched'] != max(report['inputs_recorded'],
+                                                report['inputs_replayed']))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,206 +0,0 @@
-var qU=Object.defineProperty;var YU=(t,e,r)=>e in t?qU(t,e,{enumerable:!0,configurable:!0,writable:!0,value:r}):t[e]=r;var Wn=(t,e,r)=>YU(t,typeof e!="symbol"?e+"":e,r);(function(){const e=document.createElement("link").relList;if(e&&e.supports&&e.supports("modulepreload"))return;for(const i of document.querySelectorAll('link[rel="modulepreload"]'))n(i);new MutationObserver(i=>{for(const s of i)if(s.type==="childList")for(const o of s.addedNodes)o.tagName==="LINK"&&o.rel==="modulepreload"&&n(o)}).observe(document,{childList:!0,subtree:!0});function r(i){const s={};return i.integrity&&(s.integrity=i.integrity),i.referrerPolicy&&(s.referrerPolicy=i.referrerPolicy),i.crossOrigin==="use-credentials"?s.credentials="include":i.crossOrigin==="anonymous"?s.credentials="omit":s.credentials="same-origin",s}function n(i){if(i.ep)return;i.ep=!0;const s=r(i);fetch(i.href,s)}})();/**
-* @vue/shared v3.5.13
-* (c) 2018-present Yuxi (Evan) You and Vue contributors
-* @license MIT
-**//*! #__NO_SIDE_EFFECTS__ */function AE(t){const e=Object.create(null);for(const r of t.split(","))e[r]=1;return r=>r in e}const Mt={},Xa=[],ni=()=>{},JU=()=>!1,nc=t=>t.charCodeAt(0)===111&&t.charCodeAt(1)===110&&(t.charCodeAt(2)>122||t.charCodeAt(2)<97),LE=t=>t.startsWith("onUpdate:"),sr=Object.assign,CE=(t,e)=>{const r=t.indexOf(e);r>-1&&t.splice(r,1)},QU=Object.prototype.hasOwnProperty,Ot=(t,e)=>QU.call(t,e),Xe=Array.isArray,ja=t=>Ml(t)==="[object Map]",ic=t=>Ml(t)==="[object Set]",sT=t=>Ml(t)==="[object Date]",rt=t=>typeof t=="function",rr=t=>typeof t=="string",li=t=>typeof t=="symbol",kt=t=>t!==null&&typeof t=="object",rR=t=>(kt(t)||rt(t))&&rt(t.then)&&rt(t.catch),nR=Object.prototype.toString,Ml=t=>nR.call(t),ZU=t=>Ml(t).slice(8,-1),iR=t=>Ml(t)==="[object Object]",wE=t=>rr(t)&&t!=="NaN"&&t[0]!=="-"&&""+parseInt(t,10)===t,ol=AE(",key,ref,ref_for,ref_key,onVnodeBeforeMount,onVnodeMounted,onVnodeBeforeUpdate,onVnodeUpdated,onVnodeBeforeUnmount,onVnodeUnmounted"),sc=t=>{const e=Object.create(null);return r=>e[r]||(e[r]=t(r))},eD=/-(\w)/g,Cn=sc(t=>t.replace(eD,(e,r)=>r?r.toUpperCase():"")),tD=/\B([A-Z])/g,Ts=sc(t=>t.replace(tD,"-$1").toLowerCase()),ac=sc(t=>t.charAt(0).toUpperCase()+t.slice(1)),sd=sc(t=>t?`on${ac(t)}`:""),cs=(t,e)=>!Object.is(t,e),af=(t,...e)=>{for(let r=0;r<t.length;r++)t[r](...e)},sR=(t,e,r,n=!1)=>{Object.defineProperty(t,e,{configurable:!0,enumerable:!1,writable:n,value:r})},xf=t=>{const e=parseFloat(t);return isNaN(e)?t:e},rD=t=>{const e=rr(t)?Number(t):NaN;return isNaN(e)?t:e};let aT;const oc=()=>aT||(aT=typeof globalThis<"u"?globalThis:typeof self<"u"?self:typeof window<"u"?window:typeof global<"u"?global:{});function lc(t){if(Xe(t)){const e={};for(let r=0;r<t.length;r++){const n=t[r],i=rr(n)?aD(n):lc(n);if(i)for(const s in i)e[s]=i[s]}return e}else if(rr(t)||kt(t))return t}const nD=/;(?![^(]*\))/g,iD=/:([^]+)/,sD=/\/\*[^]*?\*\//g;function aD(t){const e={};return t.replace(sD,"").split(nD).forEach(r=>{if(r){const n=r.split(iD);n.length>1&&(e[n[0].trim()]=n[1].trim())}}),e}function Vr(t){let e="";if(rr(t))e=t;else if(Xe(t))for(let r=0;r<t.length;r++){const n=Vr(t[r]);n&&(e+=n+" ")}else if(kt(t))for(const r in t)t[r]&&(e+=r+" ");return e.trim()}const oD="itemscope,allowfullscreen,formnovalidate,ismap,nomodule,novalidate,readonly",lD=AE(oD);function aR(t){return!!t||t===""}function uD(t,e){if(t.length!==e.length)return!1;let r=!0;for(let n=0;r&&n<t.length;n++)r=io(t[n],e[n]);return r}function io(t,e){if(t===e)return!0;let r=sT(t),n=sT(e);if(r||n)return r&&n?t.getTime()===e.getTime():!1;if(r=li(t),n=li(e),r||n)return t===e;if(r=Xe(t),n=Xe(e),r||n)return r&&n?uD(t,e):!1;if(r=kt(t),n=kt(e),r||n){if(!r||!n)return!1;const i=Object.keys(t).length,s=Object.keys(e).length;if(i!==s)return!1;for(const o in t){const f=t.hasOwnProperty(o),c=e.hasOwnProperty(o);if(f&&!c||!f&&c||!io(t[o],e[o]))return!1}}return String(t)===String(e)}function fD(t,e){return t.findIndex(r=>io(r,e))}const oR=t=>!!(t&&t.__v_isRef===!0),Ye=t=>rr(t)?t:t==null?"":Xe(t)||kt(t)&&(t.toString===nR||!rt(t.toString))?oR(t)?Ye(t.value):JSON.stringify(t,lR,2):String(t),lR=(t,e)=>oR(e)?lR(t,e.value):ja(e)?{[`Map(${e.size})`]:[...e.entries()].reduce((r,[n,i],s)=>(r[ad(n,s)+" =>"]=i,r),{})}:ic(e)?{[`Set(${e.size})`]:[...e.values()].map(r=>ad(r))}:li(e)?ad(e):kt(e)&&!Xe(e)&&!iR(e)?String(e):e,ad=(t,e="")=>{var r;return li(t)?`Symbol(${(r=t.description)!=null?r:e})`:t};/**
-* @vue/reactivity v3.5.13
-* (c) 2018-present Yuxi (Evan) You and Vue contributors
-* @license MIT
-**/let ln;class uR{constructor(e=!1){this.detached=e,this._active=!0,this.effects=[],this.cleanups=[],this._isPaused=!1,this.parent=ln,!e&&ln&&(this.index=(ln.scopes||(ln.scopes=[])).push(this)-1)}get active(){return this._active}pause(){if(this._active){this._isPaused=!0;let e,r;if(this.scopes)for(e=0,r=this.scopes.length;e<r;e++)this.scopes[e].pause();for(e=0,r=this.effects.length;e<r;e++)this.effects[e].pause()}}resume(){if(this._active&&this._isPaused){this._isPaused=!1;let e,r;if(this.scopes)for(e=0,r=this.scopes.length;e<r;e++)this.scopes[e].resume();for(e=0,r=this.effects.length;e<r;e++)this.effects[e].resume()}}run(e){if(this._active){const r=ln;try{return ln=this,e()}finally{ln=r}}}on(){ln=this}off(){ln=this.parent}stop(e){if(this._active){this._active=!1;let r,n;for(r=0,n=this.effects.length;r<n;r++)this.effects[r].stop();for(this.effects.length=0,r=0,n=this.cleanups.length;r<n;r++)this.cleanups[r]();if(this.cleanups.length=0,this.scopes){for(r=0,n=this.scopes.length;r<n;r++)this.scopes[r].stop(!0);this.scopes.length=0}if(!this.detached&&this.parent&&!e){const i=this.parent.scopes.pop();i&&i!==this&&(this.parent.scopes[this.index]=i,i.index=this.index)}this.parent=void 0}}}function cD(t){return new uR(t)}function pD(){return ln}let Vt;const od=new WeakSet;class fR{constructor(e){this.fn=e,this.deps=void 0,this.depsTail=void 0,this.flags=5,this.next=void 0,this.cleanup=void 0,this.scheduler=void 0,ln&&ln.active&&ln.effects.push(this)}pause(){this.flags|=64}resume(){this.flags&64&&(this.flags&=-65,od.has(this)&&(od.delete(this),this.trigger()))}notify(){this.flags&2&&!(this.flags&32)||this.flags&8||pR(this)}run(){if(!(this.flags&1))return this.fn();this.flags|=2,oT(this),dR(this);const e=Vt,r=kn;Vt=this,kn=!0;try{return this.fn()}finally{hR(this),Vt=e,kn=r,this.flags&=-3}}stop(){if(this.flags&1){for(let e=this.deps;e;e=e.nextDep)NE(e);this.deps=this.depsTail=void 0,oT(this),this.onStop&&this.onStop(),this.flags&=-2}}trigger(){this.flags&64?od.add(this):this.scheduler?this.scheduler():this.runIfDirty()}runIfDirty(){Th(this)&&this.run()}get dirty(){return Th(this)}}let cR=0,ll,ul;function pR(t,e=!1){if(t.flags|=8,e){t.next=ul,ul=t;return}t.next=ll,ll=t}function OE(){cR++}function IE(){if(--cR>0)return;if(ul){let e=ul;for(ul=void 0;e;){const r=e.next;e.next=void 0,e.flags&=-9,e=r}}let t;for(;ll;){let e=ll;for(ll=void 0;e;){const r=e.next;if(e.next=void 0,e.flags&=-9,e.flags&1)try{e.trigger()}catch(n){t||(t=n)}e=r}}if(t)throw t}function dR(t){for(let e=t.deps;e;e=e.nextDep)e.version=-1,e.prevActiveLink=e.dep.activeLink,e.dep.activeLink=e}function hR(t){let e,r=t.depsTail,n=r;for(;n;){const i=n.prevDep;n.version===-1?(n===r&&(r=i),NE(n),dD(n)):e=n,n.dep.activeLink=n.prevActiveLink,n.prevActiveLink=void 0,n=i}t.deps=e,t.depsTail=r}function Th(t){for(let e=t.deps;e;e=e.nextDep)if(e.dep.version!==e.version||e.dep.computed&&(ER(e.dep.computed)||e.dep.version!==e.version))return!0;return!!t._dirty}function ER(t){if(t.flags&4&&!(t.flags&16)||(t.flags&=-17,t.globalVersion===xl))return;t.globalVersion=xl;const e=t.dep;if(t.flags|=2,e.version>0&&!t.isSSR&&t.deps&&!Th(t)){t.flags&=-3;return}const r=Vt,n=kn;Vt=t,kn=!0;try{dR(t);const i=t.fn(t._value);(e.version===0||cs(i,t._value))&&(t._value=i,e.version++)}catch(i){throw e.version++,i}finally{Vt=r,kn=n,hR(t),t.flags&=-3}}function NE(t,e=!1){const{dep:r,prevSub:n,nextSub:i}=t;if(n&&(n.nextSub=i,t.prevSub=void 0),i&&(i.prevSub=n,t.nextSub=void 0),r.subs===t&&(r.subs=n,!n&&r.computed)){r.computed.flags&=-5;for(let s=r.computed.deps;s;s=s.nextDep)NE(s,!0)}!e&&!--r.sc&&r.map&&r.map.delete(r.key)}function dD(t){const{prevDep:e,nextDep:r}=t;e&&(e.nextDep=r,t.prevDep=void 0),r&&(r.prevDep=e,t.nextDep=void 0)}let kn=!0;const mR=[];function vs(){mR.push(kn),kn=!1}function bs(){const t=mR.pop();kn=t===void 0?!0:t}function oT(t){const{cleanup:e}=t;if(t.cleanup=void 0,e){const r=Vt;Vt=void 0;try{e()}finally{Vt=r}}}let xl=0;class hD{constructor(e,r){this.sub=e,this.dep=r,this.version=r.version,this.nextDep=this.prevDep=this.nextSub=this.prevSub=this.prevActiveLink=void 0}}class PE{constructor(e){this.computed=e,this.version=0,this.activeLink=void 0,this.subs=void 0,this.map=void 0,this.key=void 0,this.sc=0}track(e){if(!Vt||!kn||Vt===this.computed)return;let r=this.activeLink;if(r===void 0||r.sub!==Vt)r=this.activeLink=new hD(Vt,this),Vt.deps?(r.prevDep=Vt.depsTail,Vt.depsTail.nextDep=r,Vt.depsTail=r):Vt.deps=Vt.depsTail=r,gR(r);else if(r.version===-1&&(r.version=this.version,r.nextDep)){const n=r.nextDep;n.prevDep=r.prevDep,r.prevDep&&(r.prevDep.nextDep=n),r.prevDep=Vt.depsTail,r.nextDep=void 0,Vt.depsTail.nextDep=r,Vt.depsTail=r,Vt.deps===r&&(Vt.deps=n)}return r}trigger(e){this.version++,xl++,this.notify(e)}notify(e){OE();try{for(let r=this.subs;r;r=r.prevSub)r.sub.notify()&&r.sub.dep.notify()}finally{IE()}}}function gR(t){if(t.dep.sc++,t.sub.flags&4){const e=t.dep.computed;if(e&&!t.dep.subs){e.flags|=20;for(let n=e.deps;n;n=n.nextDep)gR(n)}const r=t.dep.subs;r!==t&&(t.prevSub=r,r&&(r.nextSub=t)),t.dep.subs=t}}const vh=new WeakMap,zs=Symbol(""),bh=Symbol(""),Rl=Symbol("");function Or(t,e,r){if(kn&&Vt){let n=vh.get(t);n||vh.set(t,n=new Map);let i=n.get(r);i||(n.set(r,i=new PE),i.map=n,i.key=r),i.track()}}function Ci(t,e,r,n,i,s){const o=vh.get(t);if(!o){xl++;return}const f=c=>{c&&c.trigger()};if(OE(),e==="clear")o.forEach(f);else{const c=Xe(t),d=c&&wE(r);if(c&&r==="length"){const p=Number(n);o.forEach((E,m)=>{(m==="length"||m===Rl||!li(m)&&m>=p)&&f(E)})}else switch((r!==void 0||o.has(void 0))&&f(o.get(r)),d&&f(o.get(Rl)),e){case"add":c?d&&f(o.get("length")):(f(o.get(zs)),ja(t)&&f(o.get(bh)));break;case"delete":c||(f(o.get(zs)),ja(t)&&f(o.get(bh)));break;case"set":ja(t)&&f(o.get(zs));break}}IE()}function Ca(t){const e=Rt(t);return e===t?e:(Or(e,"iterate",Rl),Ln(t)?e:e.map(Ir))}function uc(t){return Or(t=Rt(t),"iterate",Rl),t}const ED={__proto__:null,[Symbol.iterator](){return ld(this,Symbol.iterator,Ir)},concat(...t){return Ca(this).concat(...t.map(e=>Xe(e)?Ca(e):e))},entries(){return ld(this,"entries",t=>(t[1]=Ir(t[1]),t))},every(t,e){return bi(this,"every",t,e,void 0,arguments)},filter(t,e){return bi(this,"filter",t,e,r=>r.map(Ir),arguments)},find(t,e){return bi(this,"find",t,e,Ir,arguments)},findIndex(t,e){return bi(this,"findIndex",t,e,void 0,arguments)},findLast(t,e){return bi(this,"findLast",t,e,Ir,arguments)},findLastIndex(t,e){return bi(this,"findLastIndex",t,e,void 0,arguments)},forEach(t,e){return bi(this,"forEach",t,e,void 0,arguments)},includes(...t){return ud(this,"includes",t)},indexOf(...t){return ud(this,"indexOf",t)},join(t){return Ca(this).join(t)},lastIndexOf(...t){return ud(this,"lastIndexOf",t)},map(t,e){return bi(this,"map",t,e,void 0,arguments)},pop(){return Yo(this,"pop")},push(...t){return Yo(this,"push",t)},reduce(t,...e){return lT(this,"reduce",t,e)},reduceRight(t,...e){return lT(this,"reduceRight",t,e)},shift(){return Yo(this,"shift")},some(t,e){return bi(this,"some",t,e,void 0,arguments)},splice(...t){return Yo(this,"splice",t)},toReversed(){return Ca(this).toReversed()},toSorted(t){return Ca(this).toSorted(t)},toSpliced(...t){return Ca(this).toSpliced(...t)},unshift(...t){return Yo(this,"unshift",t)},values(){return ld(this,"values",Ir)}};function ld(t,e,r){const n=uc(t),i=n[e]();return n!==t&&!Ln(t)&&(i._next=i.next,i.next=()=>{const s=i._next();return s.value&&(s.value=r(s.value)),s}),i}const mD=Array.prototype;function bi(t,e,r,n,i,s){const o=uc(t),f=o!==t&&!Ln(t),c=o[e];if(c!==mD[e]){const E=c.apply(t,s);return f?Ir(E):E}let d=r;o!==t&&(f?d=function(E,m){return r.call(this,Ir(E),m,t)}:r.length>2&&(d=function(E,m){return r.call(this,E,m,t)}));const p=c.call(o,d,n);return f&&i?i(p):p}function lT(t,e,r,n){const i=uc(t);let s=r;return i!==t&&(Ln(t)?r.length>3&&(s=function(o,f,c){return r.call(this,o,f,c,t)}):s=function(o,f,c){return r.call(this,o,Ir(f),c,t)}),i[e](s,...n)}function ud(t,e,r){const n=Rt(t);Or(n,"iterate",Rl);const i=n[e](...r);return(i===-1||i===!1)&&BE(r[0])?(r[0]=Rt(r[0]),n[e](...r)):i}function Yo(t,e,r=[]){vs(),OE();const n=Rt(t)[e].apply(t,r);return IE(),bs(),n}const gD=AE("__proto__,__v_isRef,__isVue"),_R=new Set(Object.getOwnPropertyNames(Symbol).filter(t=>t!=="arguments"&&t!=="caller").map(t=>Symbol[t]).filter(li));function _D(t){li(t)||(t=String(t));const e=Rt(this);return Or(e,"has",t),e.hasOwnProperty(t)}class TR{constructor(e=!1,r=!1){this._isReadonly=e,this._isShallow=r}get(e,r,n){if(r==="__v_skip")return e.__v_skip;const i=this._isReadonly,s=this._isShallow;if(r==="__v_isReactive")return!i;if(r==="__v_isReadonly")return i;if(r==="__v_isShallow")return s;if(r==="__v_raw")return n===(i?s?CD:RR:s?xR:bR).get(e)||Object.getPrototypeOf(e)===Object.getPrototypeOf(n)?e:void 0;const o=Xe(e);if(!i){let c;if(o&&(c=ED[r]))return c;if(r==="hasOwnProperty")return _D}const f=Reflect.get(e,r,Sr(e)?e:n);return(li(r)?_R.has(r):gD(r))||(i||Or(e,"get",r),s)?f:Sr(f)?o&&wE(r)?f:f.value:kt(f)?i?SR(f):fc(f):f}}class vR extends TR{constructor(e=!1){super(!1,e)}set(e,r,n,i){let s=e[r];if(!this._isShallow){const c=ta(s);if(!Ln(n)&&!ta(n)&&(s=Rt(s),n=Rt(n)),!Xe(e)&&Sr(s)&&!Sr(n))return c?!1:(s.value=n,!0)}const o=Xe(e)&&wE(r)?Number(r)<e.length:Ot(e,r),f=Reflect.set(e,r,n,Sr(e)?e:i);return e===Rt(i)&&(o?cs(n,s)&&Ci(e,"set",r,n):Ci(e,"add",r,n)),f}deleteProperty(e,r){const n=Ot(e,r);e[r];const i=Reflect.deleteProperty(e,r);return i&&n&&Ci(e,"delete",r,void 0),i}has(e,r){const n=Reflect.has(e,r);return(!li(r)||!_R.has(r))&&Or(e,"has",r),n}ownKeys(e){return Or(e,"iterate",Xe(e)?"length":zs),Reflect.ownKeys(e)}}class TD extends TR{constructor(e=!1){super(!0,e)}set(e,r){return!0}deleteProperty(e,r){return!0}}const vD=new vR,bD=new TD,xD=new vR(!0);const xh=t=>t,ku=t=>Reflect.getPrototypeOf(t);function RD(t,e,r){return function(...n){const i=this.__v_raw,s=Rt(i),o=ja(s),f=t==="entries"||t===Symbol.iterator&&o,c=t==="keys"&&o,d=i[t](...n),p=r?xh:e?Rh:Ir;return!e&&Or(s,"iterate",c?bh:zs),{next(){const{value:E,done:m}=d.next();return m?{value:E,done:m}:{value:f?[p(E[0]),p(E[1])]:p(E),done:m}},[Symbol.iterator](){return this}}}}function Gu(t){return function(...e){return t==="delete"?!1:t==="clear"?void 0:this}}function SD(t,e){const r={get(i){const s=this.__v_raw,o=Rt(s),f=Rt(i);t||(cs(i,f)&&Or(o,"get",i),Or(o,"get",f));const{has:c}=ku(o),d=e?xh:t?Rh:Ir;if(c.call(o,i))return d(s.get(i));if(c.call(o,f))return d(s.get(f));s!==o&&s.get(i)},get size(){const i=this.__v_raw;return!t&&Or(Rt(i),"iterate",zs),Reflect.get(i,"size",i)},has(i){const s=this.__v_raw,o=Rt(s),f=Rt(i);return t||(cs(i,f)&&Or(o,"has",i),Or(o,"has",f)),i===f?s.has(i):s.has(i)||s.has(f)},forEach(i,s){const o=this,f=o.__v_raw,c=Rt(f),d=e?xh:t?Rh:Ir;return!t&&Or(c,"iterate",zs),f.forEach((p,E)=>i.call(s,d(p),d(E),o))}};return sr(r,t?{add:Gu("add"),set:Gu("set"),delete:Gu("delete"),clear:Gu("clear")}:{add(i){!e&&!Ln(i)&&!ta(i)&&(i=Rt(i));const s=Rt(this);return ku(s).has.call(s,i)||(s.add(i),Ci(s,"add",i,i)),this},set(i,s){!e&&!Ln(s)&&!ta(s)&&(s=Rt(s));const o=Rt(this),{has:f,get:c}=ku(o);let d=f.call(o,i);d||(i=Rt(i),d=f.call(o,i));const p=c.call(o,i);return o.set(i,s),d?cs(s,p)&&Ci(o,"set",i,s):Ci(o,"add",i,s),this},delete(i){const s=Rt(this),{has:o,get:f}=ku(s);let c=o.call(s,i);c||(i=Rt(i),c=o.call(s,i)),f&&f.call(s,i);const d=s.delete(i);return c&&Ci(s,"delete",i,void 0),d},clear(){const i=Rt(this),s=i.size!==0,o=i.clear();return s&&Ci(i,"clear",void 0,void 0),o}}),["keys","values","entries",Symbol.iterator].forEach(i=>{r[i]=RD(i,t,e)}),r}function UE(t,e){const r=SD(t,e);return(n,i,s)=>i==="__v_isReactive"?!t:i==="__v_isReadonly"?t:i==="__v_raw"?n:Reflect.get(Ot(r,i)&&i in n?r:n,i,s)}const yD={get:UE(!1,!1)},AD={get:UE(!1,!0)},LD={get:UE(!0,!1)};const bR=new WeakMap,xR=new WeakMap,RR=new WeakMap,CD=new WeakMap;function wD(t){switch(t){case"Object":case"Array":return 1;case"Map":case"Set":case"WeakMap":case"WeakSet":return 2;default:return 0}}function OD(t){return t.__v_skip||!Object.isExtensible(t)?0:wD(ZU(t))}function fc(t){return ta(t)?t:DE(t,!1,vD,yD,bR)}function ID(t){return DE(t,!1,xD,AD,xR)}function SR(t){return DE(t,!0,bD,LD,RR)}function DE(t,e,r,n,i){if(!kt(t)||t.__v_raw&&!(e&&t.__v_isReactive))return t;const s=i.get(t);if(s)return s;const o=OD(t);if(o===0)return t;const f=new Proxy(t,o===2?n:r);return i.set(t,f),f}function za(t){return ta(t)?za(t.__v_raw):!!(t&&t.__v_isReactive)}function ta(t){return!!(t&&t.__v_isReadonly)}function Ln(t){return!!(t&&t.__v_isShallow)}function BE(t){return t?!!t.__v_raw:!1}function Rt(t){const e=t&&t.__v_raw;return e?Rt(e):t}function ND(t){return!Ot(t,"__v_skip")&&Object.isExtensible(t)&&sR(t,"__v_skip",!0),t}const Ir=t=>kt(t)?fc(t):t,Rh=t=>kt(t)?SR(t):t;function Sr(t){return t?t.__v_isRef===!0:!1}function Hs(t){return AR(t,!1)}function yR(t){return AR(t,!0)}function AR(t,e){return Sr(t)?t:new PD(t,e)}class PD{constructor(e,r){this.dep=new PE,this.__v_isRef=!0,this.__v_isShallow=!1,this._rawValue=r?e:Rt(e),this._value=r?e:Ir(e),this.__v_isShallow=r}get value(){return this.dep.track(),this._value}set value(e){const r=this._rawValue,n=this.__v_isShallow||Ln(e)||ta(e);e=n?e:Rt(e),cs(e,r)&&(this._rawValue=e,this._value=n?e:Ir(e),this.dep.trigger())}}function UD(t){return Sr(t)?t.value:t}const DD={get:(t,e,r)=>e==="__v_raw"?t:UD(Reflect.get(t,e,r)),set:(t,e,r,n)=>{const i=t[e];return Sr(i)&&!Sr(r)?(i.value=r,!0):Reflect.set(t,e,r,n)}};function LR(t){return za(t)?t:new Proxy(t,DD)}class BD{constructor(e,r,n){this.fn=e,this.setter=r,this._value=void 0,this.dep=new PE(this),this.__v_isRef=!0,this.deps=void 0,this.depsTail=void 0,this.flags=16,this.globalVersion=xl-1,this.next=void 0,this.effect=this,this.__v_isReadonly=!r,this.isSSR=n}notify(){if(this.flags|=16,!(this.flags&8)&&Vt!==this)return pR(this,!0),!0}get value(){const e=this.dep.track();return ER(this),e&&(e.version=this.dep.version),this._value}set value(e){this.setter&&this.setter(e)}}function MD(t,e,r=!1){let n,i;return rt(t)?n=t:(n=t.get,i=t.set),new BD(n,i,r)}const Vu={},Rf=new WeakMap;let Fs;function $D(t,e=!1,r=Fs){if(r){let n=Rf.get(r);n||Rf.set(r,n=[]),n.push(t)}}function KD(t,e,r=Mt){const{immediate:n,deep:i,once:s,scheduler:o,augmentJob:f,call:c}=r,d=R=>i?R:Ln(R)||i===!1||i===0?wi(R,1):wi(R);let p,E,m,g,_=!1,b=!1;if(Sr(t)?(E=()=>t.value,_=Ln(t)):za(t)?(E=()=>d(t),_=!0):Xe(t)?(b=!0,_=t.some(R=>za(R)||Ln(R)),E=()=>t.map(R=>{if(Sr(R))return R.value;if(za(R))return d(R);if(rt(R))return c?c(R,2):R()})):rt(t)?e?E=c?()=>c(t,2):t:E=()=>{if(m){vs();try{m()}finally{bs()}}const R=Fs;Fs=p;try{return c?c(t,3,[g]):t(g)}finally{Fs=R}}:E=ni,e&&i){const R=E,w=i===!0?1/0:i;E=()=>wi(R(),w)}const x=pD(),S=()=>{p.stop(),x&&x.active&&CE(x.effects,p)};if(s&&e){const R=e;e=(...w)=>{R(...w),S()}}let y=b?new Array(t.length).fill(Vu):Vu;const v=R=>{if(!(!(p.flags&1)||!p.dirty&&!R))if(e){const w=p.run();if(i||_||(b?w.some((M,k)=>cs(M,y[k])):cs(w,y))){m&&m();const M=Fs;Fs=p;try{const k=[w,y===Vu?void 0:b&&y[0]===Vu?[]:y,g];c?c(e,3,k):e(...k),y=w}finally{Fs=M}}}else p.run()};return f&&f(v),p=new fR(E),p.scheduler=o?()=>o(v,!1):v,g=R=>$D(R,!1,p),m=p.onStop=()=>{const R=Rf.get(p);if(R){if(c)c(R,4);else for(const w of R)w();Rf.delete(p)}},e?n?v(!0):y=p.run():o?o(v.bind(null,!0),!0):p.run(),S.pause=p.pause.bind(p),S.resume=p.resume.bind(p),S.stop=S,S}function wi(t,e=1/0,r){if(e<=0||!kt(t)||t.__v_skip||(r=r||new Set,r.has(t)))return t;if(r.add(t),e--,Sr(t))wi(t.value,e,r);else if(Xe(t))for(let n=0;n<t.length;n++)wi(t[n],e,r);else if(ic(t)||ja(t))t.forEach(n=>{wi(n,e,r)});else if(iR(t)){for(const n in t)wi(t[n],e,r);for(const n of Object.getOwnPropertySymbols(t))Object.prototype.propertyIsEnumerable.call(t,n)&&wi(t[n],e,r)}return t}/**
-* @vue/runtime-core v3.5.13
-* (c) 2018-present Yuxi (Evan) You and Vue contributors
-* @license MIT
-**/function $l(t,e,r,n){try{return n?t(...n):t()}catch(i){cc(i,e,r)}}function Gn(t,e,r,n){if(rt(t)){const i=$l(t,e,r,n);return i&&rR(i)&&i.catch(s=>{cc(s,e,r)}),i}if(Xe(t)){const i=[];for(let s=0;s<t.length;s++)i.push(Gn(t[s],e,r,n));return i}}function cc(t,e,r,n=!0){const i=e?e.vnode:null,{errorHandler:s,throwUnhandledErrorInProduction:o}=e&&e.appContext.config||Mt;if(e){let f=e.parent;const c=e.proxy,d=`https://vuejs.org/error-reference/#runtime-${r}`;for(;f;){const p=f.ec;if(p){for(let E=0;E<p.length;E++)if(p[E](t,c,d)===!1)return}f=f.parent}if(s){vs(),$l(s,null,10,[t,c,d]),bs();return}}kD(t,r,i,n,o)}function kD(t,e,r,n=!0,i=!1){if(i)throw t;console.error(t)}const Gr=[];let Yn=-1;const qa=[];let ts=null,Ba=0;const CR=Promise.resolve();let Sf=null;function wR(t){const e=Sf||CR;return t?e.then(this?t.bind(this):t):e}function GD(t){let e=Yn+1,r=Gr.length;for(;e<r;){const n=e+r>>>1,i=Gr[n],s=Sl(i);s<t||s===t&&i.flags&2?e=n+1:r=n}return e}function ME(t){if(!(t.flags&1)){const e=Sl(t),r=Gr[Gr.length-1];!r||!(t.flags&2)&&e>=Sl(r)?Gr.push(t):Gr.splice(GD(e),0,t),t.flags|=1,OR()}}function OR(){Sf||(Sf=CR.then(NR))}function VD(t){Xe(t)?qa.push(...t):ts&&t.id===-1?ts.splice(Ba+1,0,t):t.flags&1||(qa.push(t),t.flags|=1),OR()}function uT(t,e,r=Yn+1){for(;r<Gr.length;r++){const n=Gr[r];if(n&&n.flags&2){if(t&&n.id!==t.uid)continue;Gr.splice(r,1),r--,n.flags&4&&(n.flags&=-2),n(),n.flags&4||(n.flags&=-2)}}}function IR(t){if(qa.length){const e=[...new Set(qa)].sort((r,n)=>Sl(r)-Sl(n));if(qa.length=0,ts){ts.push(...e);return}for(ts=e,Ba=0;Ba<ts.length;Ba++){const r=ts[Ba];r.flags&4&&(r.flags&=-2),r.flags&8||r(),r.flags&=-2}ts=null,Ba=0}}const Sl=t=>t.id==null?t.flags&2?-1:1/0:t.id;function NR(t){try{for(Yn=0;Yn<Gr.length;Yn++){const e=Gr[Yn];e&&!(e.flags&8)&&(e.flags&4&&(e.flags&=-2),$l(e,e.i,e.i?15:14),e.flags&4||(e.flags&=-2))}}finally{for(;Yn<Gr.length;Yn++){const e=Gr[Yn];e&&(e.flags&=-2)}Yn=-1,Gr.length=0,IR(),Sf=null,(Gr.length||qa.length)&&NR()}}let Jr=null,PR=null;function yf(t){const e=Jr;return Jr=t,PR=t&&t.type.__scopeId||null,e}function pc(t,e=Jr,r){if(!e||t._n)return t;const n=(...i)=>{n._d&&TT(-1);const s=yf(e);let o;try{o=t(...i)}finally{yf(s),n._d&&TT(1)}return o};return n._n=!0,n._c=!0,n._d=!0,n}function or(t,e){if(Jr===null)return t;const r=mc(Jr),n=t.dirs||(t.dirs=[]);for(let i=0;i<e.length;i++){let[s,o,f,c=Mt]=e[i];s&&(rt(s)&&(s={mounted:s,updated:s}),s.deep&&wi(o),n.push({dir:s,instance:r,value:o,oldValue:void 0,arg:f,modifiers:c}))}return t}function $s(t,e,r,n){const i=t.dirs,s=e&&e.dirs;for(let o=0;o<i.length;o++){const f=i[o];s&&(f.oldValue=s[o].value);let c=f.dir[n];c&&(vs(),Gn(c,r,8,[t.el,f,t,e]),bs())}}const FD=Symbol("_vte"),UR=t=>t.__isTeleport,rs=Symbol("_leaveCb"),Fu=Symbol("_enterCb");function DR(){const t={isMounted:!1,isLeaving:!1,isUnmounting:!1,leavingVNodes:new Map};return KE(()=>{t.isMounted=!0}),HR(()=>{t.isUnmounting=!0}),t}const Rn=[Function,Array],BR={mode:String,appear:Boolean,persisted:Boolean,onBeforeEnter:Rn,onEnter:Rn,onAfterEnter:Rn,onEnterCancelled:Rn,onBeforeLeave:Rn,onLeave:Rn,onAfterLeave:Rn,onLeaveCancelled:Rn,onBeforeAppear:Rn,onAppear:Rn,onAfterAppear:Rn,onAppearCancelled:Rn},MR=t=>{const e=t.subTree;return e.component?MR(e.component):e},HD={name:"BaseTransition",props:BR,setup(t,{slots:e}){const r=so(),n=DR();return()=>{const i=e.default&&$E(e.default(),!0);if(!i||!i.length)return;const s=$R(i),o=Rt(t),{mode:f}=o;if(n.isLeaving)return fd(s);const c=fT(s);if(!c)return fd(s);let d=yl(c,o,n,r,E=>d=E);c.type!==Yr&&ra(c,d);let p=r.subTree&&fT(r.subTree);if(p&&p.type!==Yr&&!Ws(c,p)&&MR(r).type!==Yr){let E=yl(p,o,n,r);if(ra(p,E),f==="out-in"&&c.type!==Yr)return n.isLeaving=!0,E.afterLeave=()=>{n.isLeaving=!1,r.job.flags&8||r.update(),delete E.afterLeave,p=void 0},fd(s);f==="in-out"&&c.type!==Yr?E.delayLeave=(m,g,_)=>{const b=KR(n,p);b[String(p.key)]=p,m[rs]=()=>{g(),m[rs]=void 0,delete d.delayedLeave,p=void 0},d.delayedLeave=()=>{_(),delete d.delayedLeave,p=void 0}}:p=void 0}else p&&(p=void 0);return s}}};function $R(t){let e=t[0];if(t.length>1){for(const r of t)if(r.type!==Yr){e=r;break}}return e}const WD=HD;function KR(t,e){const{leavingVNodes:r}=t;let n=r.get(e.type);return n||(n=Object.create(null),r.set(e.type,n)),n}function yl(t,e,r,n,i){const{appear:s,mode:o,persisted:f=!1,onBeforeEnter:c,onEnter:d,onAfterEnter:p,onEnterCancelled:E,onBeforeLeave:m,onLeave:g,onAfterLeave:_,onLeaveCancelled:b,onBeforeAppear:x,onAppear:S,onAfterAppear:y,onAppearCancelled:v}=e,R=String(t.key),w=KR(r,t),M=(O,z)=>{O&&Gn(O,n,9,z)},k=(O,z)=>{const ie=z[1];M(O,z),Xe(O)?O.every(G=>G.length<=1)&&ie():O.length<=1&&ie()},H={mode:o,persisted:f,beforeEnter(O){let z=c;if(!r.isMounted)if(s)z=x||c;else return;O[rs]&&O[rs](!0);const ie=w[R];ie&&Ws(t,ie)&&ie.el[rs]&&ie.el[rs](),M(z,[O])},enter(O){let z=d,ie=p,G=E;if(!r.isMounted)if(s)z=S||d,ie=y||p,G=v||E;else return;let X=!1;const ee=O[Fu]=B=>{X||(X=!0,B?M(G,[O]):M(ie,[O]),H.delayedLeave&&H.delayedLeave(),O[Fu]=void 0)};z?k(z,[O,ee]):ee()},leave(O,z){const ie=String(t.key);if(O[Fu]&&O[Fu](!0),r.isUnmounting)return z();M(m,[O]);let G=!1;const X=O[rs]=ee=>{G||(G=!0,z(),ee?M(b,[O]):M(_,[O]),O[rs]=void 0,w[ie]===t&&delete w[ie])};w[ie]=t,g?k(g,[O,X]):X()},clone(O){const z=yl(O,e,r,n,i);return i&&i(z),z}};return H}function fd(t){if(dc(t))return t=ms(t),t.children=null,t}function fT(t){if(!dc(t))return UR(t.type)&&t.children?$R(t.children):t;const{shapeFlag:e,children:r}=t;if(r){if(e&16)return r[0];if(e&32&&rt(r.default))return r.default()}}function ra(t,e){t.shapeFlag&6&&t.component?(t.transition=e,ra(t.component.subTree,e)):t.shapeFlag&128?(t.ssContent.transition=e.clone(t.ssContent),t.ssFallback.transition=e.clone(t.ssFallback)):t.transition=e}function $E(t,e=!1,r){let n=[],i=0;for(let s=0;s<t.length;s++){let o=t[s];const f=r==null?o.key:String(r)+String(o.key!=null?o.key:s);o.type===Yt?(o.patchFlag&128&&i++,n=n.concat($E(o.children,e,f))):(e||o.type!==Yr)&&n.push(f!=null?ms(o,{key:f}):o)}if(i>1)for(let s=0;s<n.length;s++)n[s].patchFlag=-2;return n}/*! #__NO_SIDE_EFFECTS__ */function lr(t,e){return rt(t)?sr({name:t.name},e,{setup:t}):t}function kR(t){t.ids=[t.ids[0]+t.ids[2]+++"-",0,0]}function Af(t,e,r,n,i=!1){if(Xe(t)){t.forEach((_,b)=>Af(_,e&&(Xe(e)?e[b]:e),r,n,i));return}if(fl(n)&&!i){n.shapeFlag&512&&n.type.__asyncResolved&&n.component.subTree.component&&Af(t,e,r,n.component.subTree);return}const s=n.shapeFlag&4?mc(n.component):n.el,o=i?null:s,{i:f,r:c}=t,d=e&&e.r,p=f.refs===Mt?f.refs={}:f.refs,E=f.setupState,m=Rt(E),g=E===Mt?()=>!1:_=>Ot(m,_);if(d!=null&&d!==c&&(rr(d)?(p[d]=null,g(d)&&(E[d]=null)):Sr(d)&&(d.value=null)),rt(c))$l(c,f,12,[o,p]);else{const _=rr(c),b=Sr(c);if(_||b){const x=()=>{if(t.f){const S=_?g(c)?E[c]:p[c]:c.value;i?Xe(S)&&CE(S,s):Xe(S)?S.includes(s)||S.push(s):_?(p[c]=[s],g(c)&&(E[c]=p[c])):(c.value=[s],t.k&&(p[t.k]=c.value))}else _?(p[c]=o,g(c)&&(E[c]=o)):b&&(c.value=o,t.k&&(p[t.k]=o))};o?(x.id=-1,on(x,r)):x()}}}oc().requestIdleCallback;oc().cancelIdleCallback;const fl=t=>!!t.type.__asyncLoader,dc=t=>t.type.__isKeepAlive;function XD(t,e){GR(t,"a",e)}function jD(t,e){GR(t,"da",e)}function GR(t,e,r=xr){const n=t.__wdc||(t.__wdc=()=>{let i=r;for(;i;){if(i.isDeactivated)return;i=i.parent}return t()});if(hc(e,n,r),r){let i=r.parent;for(;i&&i.parent;)dc(i.parent.vnode)&&zD(n,e,r,i),i=i.parent}}function zD(t,e,r,n){const i=hc(e,t,n,!0);kE(()=>{CE(n[e],i)},r)}function hc(t,e,r=xr,n=!1){if(r){const i=r[t]||(r[t]=[]),s=e.__weh||(e.__weh=(...o)=>{vs();const f=kl(r),c=Gn(e,r,t,o);return f(),bs(),c});return n?i.unshift(s):i.push(s),s}}const $i=t=>(e,r=xr)=>{(!Ll||t==="sp")&&hc(t,(...n)=>e(...n),r)},VR=$i("bm"),KE=$i("m"),qD=$i("bu"),FR=$i("u"),HR=$i("bum"),kE=$i("um"),YD=$i("sp"),JD=$i("rtg"),QD=$i("rtc");function ZD(t,e=xr){hc("ec",t,e)}const GE="components",eB="directives";function qr(t,e){return VE(GE,t,!0,e)||t}const WR=Symbol.for("v-ndc");function tB(t){return rr(t)?VE(GE,t,!1)||t:t||WR}function hs(t){return VE(eB,t)}function VE(t,e,r=!0,n=!1){const i=Jr||xr;if(i){const s=i.type;if(t===GE){const f=VB(s,!1);if(f&&(f===e||f===Cn(e)||f===ac(Cn(e))))return s}const o=cT(i[t]||s[t],e)||cT(i.appContext[t],e);return!o&&n?s:o}}function cT(t,e){return t&&(t[e]||t[Cn(e)]||t[ac(Cn(e))])}function Es(t,e,r,n){let i;const s=r,o=Xe(t);if(o||rr(t)){const f=o&&za(t);let c=!1;f&&(c=!Ln(t),t=uc(t)),i=new Array(t.length);for(let d=0,p=t.length;d<p;d++)i[d]=e(c?Ir(t[d]):t[d],d,void 0,s)}else if(typeof t=="number"){i=new Array(t);for(let f=0;f<t;f++)i[f]=e(f+1,f,void 0,s)}else if(kt(t))if(t[Symbol.iterator])i=Array.from(t,(f,c)=>e(f,c,void 0,s));else{const f=Object.keys(t);i=new Array(f.length);for(let c=0,d=f.length;c<d;c++){const p=f[c];i[c]=e(t[p],p,c,s)}}else i=[];return i}const Sh=t=>t?pS(t)?mc(t):Sh(t.parent):null,cl=sr(Object.create(null),{$:t=>t,$el:t=>t.vnode.el,$data:t=>t.data,$props:t=>t.props,$attrs:t=>t.attrs,$slots:t=>t.slots,$refs:t=>t.refs,$parent:t=>Sh(t.parent),$root:t=>Sh(t.root),$host:t=>t.ce,$emit:t=>t.emit,$options:t=>FE(t),$forceUpdate:t=>t.f||(t.f=()=>{ME(t.update)}),$nextTick:t=>t.n||(t.n=wR.bind(t.proxy)),$watch:t=>RB.bind(t)}),cd=(t,e)=>t!==Mt&&!t.__isScriptSetup&&Ot(t,e),rB={get({_:t},e){if(e==="__v_skip")return!0;const{ctx:r,setupState:n,data:i,props:s,accessCache:o,type:f,appContext:c}=t;let d;if(e[0]!=="$"){const g=o[e];if(g!==void 0)switch(g){case 1:return n[e];case 2:return i[e];case 4:return r[e];case 3:return s[e]}else{if(cd(n,e))return o[e]=1,n[e];if(i!==Mt&&Ot(i,e))return o[e]=2,i[e];if((d=t.propsOptions[0])&&Ot(d,e))return o[e]=3,s[e];if(r!==Mt&&Ot(r,e))return o[e]=4,r[e];yh&&(o[e]=0)}}const p=cl[e];let E,m;if(p)return e==="$attrs"&&Or(t.attrs,"get",""),p(t);if((E=f.__cssModules)&&(E=E[e]))return E;if(r!==Mt&&Ot(r,e))return o[e]=4,r[e];if(m=c.config.globalProperties,Ot(m,e))return m[e]},set({_:t},e,r){const{data:n,setupState:i,ctx:s}=t;return cd(i,e)?(i[e]=r,!0):n!==Mt&&Ot(n,e)?(n[e]=r,!0):Ot(t.props,e)||e[0]==="$"&&e.slice(1)in t?!1:(s[e]=r,!0)},has({_:{data:t,setupState:e,accessCache:r,ctx:n,appContext:i,propsOptions:s}},o){let f;return!!r[o]||t!==Mt&&Ot(t,o)||cd(e,o)||(f=s[0])&&Ot(f,o)||Ot(n,o)||Ot(cl,o)||Ot(i.config.globalProperties,o)},defineProperty(t,e,r){return r.get!=null?t._.accessCache[e]=0:Ot(r,"value")&&this.set(t,e,r.value,null),Reflect.defineProperty(t,e,r)}};function pT(t){return Xe(t)?t.reduce((e,r)=>(e[r]=null,e),{}):t}let yh=!0;function nB(t){const e=FE(t),r=t.proxy,n=t.ctx;yh=!1,e.beforeCreate&&dT(e.beforeCreate,t,"bc");const{data:i,computed:s,methods:o,watch:f,provide:c,inject:d,created:p,beforeMount:E,mounted:m,beforeUpdate:g,updated:_,activated:b,deactivated:x,beforeDestroy:S,beforeUnmount:y,destroyed:v,unmounted:R,render:w,renderTracked:M,renderTriggered:k,errorCaptured:H,serverPrefetch:O,expose:z,inheritAttrs:ie,components:G,directives:X,filters:ee}=e;if(d&&iB(d,n,null),o)for(const W in o){const j=o[W];rt(j)&&(n[W]=j.bind(r))}if(i){const W=i.call(r,r);kt(W)&&(t.data=fc(W))}if(yh=!0,s)for(const W in s){const j=s[W],ue=rt(j)?j.bind(r,r):rt(j.get)?j.get.bind(r,r):ni,ve=!rt(j)&&rt(j.set)?j.set.bind(r):ni,ae=Sn({get:ue,set:ve});Object.defineProperty(n,W,{enumerable:!0,configurable:!0,get:()=>ae.value,set:he=>ae.value=he})}if(f)for(const W in f)XR(f[W],n,r,W);if(c){const W=rt(c)?c.call(r):c;Reflect.ownKeys(W).forEach(j=>{fB(j,W[j])})}p&&dT(p,t,"c");function Q(W,j){Xe(j)?j.forEach(ue=>W(ue.bind(r))):j&&W(j.bind(r))}if(Q(VR,E),Q(KE,m),Q(qD,g),Q(FR,_),Q(XD,b),Q(jD,x),Q(ZD,H),Q(QD,M),Q(JD,k),Q(HR,y),Q(kE,R),Q(YD,O),Xe(z))if(z.length){const W=t.exposed||(t.exposed={});z.forEach(j=>{Object.defineProperty(W,j,{get:()=>r[j],set:ue=>r[j]=ue})})}else t.exposed||(t.exposed={});w&&t.render===ni&&(t.render=w),ie!=null&&(t.inheritAttrs=ie),G&&(t.components=G),X&&(t.directives=X),O&&kR(t)}function iB(t,e,r=ni){Xe(t)&&(t=Ah(t));for(const n in t){const i=t[n];let s;kt(i)?"default"in i?s=qs(i.from||n,i.default,!0):s=qs(i.from||n):s=qs(i),Sr(s)?Object.defineProperty(e,n,{enumerable:!0,configurable:!0,get:()=>s.value,set:o=>s.value=o}):e[n]=s}}function dT(t,e,r){Gn(Xe(t)?t.map(n=>n.bind(e.proxy)):t.bind(e.proxy),e,r)}function XR(t,e,r,n){let i=n.includes(".")?aS(r,n):()=>r[n];if(rr(t)){const s=e[t];rt(s)&&Ja(i,s)}else if(rt(t))Ja(i,t.bind(r));else if(kt(t))if(Xe(t))t.forEach(s=>XR(s,e,r,n));else{const s=rt(t.handler)?t.handler.bind(r):e[t.handler];rt(s)&&Ja(i,s,t)}}function FE(t){const e=t.type,{mixins:r,extends:n}=e,{mixins:i,optionsCache:s,config:{optionMergeStrategies:o}}=t.appContext,f=s.get(e);let c;return f?c=f:!i.length&&!r&&!n?c=e:(c={},i.length&&i.forEach(d=>Lf(c,d,o,!0)),Lf(c,e,o)),kt(e)&&s.set(e,c),c}function Lf(t,e,r,n=!1){const{mixins:i,extends:s}=e;s&&Lf(t,s,r,!0),i&&i.forEach(o=>Lf(t,o,r,!0));for(const o in e)if(!(n&&o==="expose")){const f=sB[o]||r&&r[o];t[o]=f?f(t[o],e[o]):e[o]}return t}const sB={data:hT,props:ET,emits:ET,methods:nl,computed:nl,beforeCreate:Kr,created:Kr,beforeMount:Kr,mounted:Kr,beforeUpdate:Kr,updated:Kr,beforeDestroy:Kr,beforeUnmount:Kr,destroyed:Kr,unmounted:Kr,activated:Kr,deactivated:Kr,errorCaptured:Kr,serverPrefetch:Kr,components:nl,directives:nl,watch:oB,provide:hT,inject:aB};function hT(t,e){return e?t?function(){return sr(rt(t)?t.call(this,this):t,rt(e)?e.call(this,this):e)}:e:t}function aB(t,e){return nl(Ah(t),Ah(e))}function Ah(t){if(Xe(t)){const e={};for(let r=0;r<t.length;r++)e[t[r]]=t[r];return e}return t}function Kr(t,e){return t?[...new Set([].concat(t,e))]:e}function nl(t,e){return t?sr(Object.create(null),t,e):e}function ET(t,e){return t?Xe(t)&&Xe(e)?[...new Set([...t,...e])]:sr(Object.create(null),pT(t),pT(e??{})):e}function oB(t,e){if(!t)return e;if(!e)return t;const r=sr(Object.create(null),t);for(const n in e)r[n]=Kr(t[n],e[n]);return r}function jR(){return{app:null,config:{isNativeTag:JU,performance:!1,globalProperties:{},optionMergeStrategies:{},errorHandler:void 0,warnHandler:void 0,compilerOptions:{}},mixins:[],components:{},directives:{},provides:Object.create(null),optionsCache:new WeakMap,propsCache:new WeakMap,emitsCache:new WeakMap}}let lB=0;function uB(t,e){return function(n,i=null){rt(n)||(n=sr({},n)),i!=null&&!kt(i)&&(i=null);const s=jR(),o=new WeakSet,f=[];let c=!1;const d=s.app={_uid:lB++,_component:n,_props:i,_container:null,_context:s,_instance:null,version:HB,get config(){return s.config},set config(p){},use(p,...E){return o.has(p)||(p&&rt(p.install)?(o.add(p),p.install(d,...E)):rt(p)&&(o.add(p),p(d,...E))),d},mixin(p){return s.mixins.includes(p)||s.mixins.push(p),d},component(p,E){return E?(s.components[p]=E,d):s.components[p]},directive(p,E){return E?(s.directives[p]=E,d):s.directives[p]},mount(p,E,m){if(!c){const g=d._ceVNode||Kt(n,i);return g.appContext=s,m===!0?m="svg":m===!1&&(m=void 0),E&&e?e(g,p):t(g,p,m),c=!0,d._container=p,p.__vue_app__=d,mc(g.component)}},onUnmount(p){f.push(p)},unmount(){c&&(Gn(f,d._instance,16),t(null,d._container),delete d._container.__vue_app__)},provide(p,E){return s.provides[p]=E,d},runWithContext(p){const E=Ya;Ya=d;try{return p()}finally{Ya=E}}};return d}}let Ya=null;function fB(t,e){if(xr){let r=xr.provides;const n=xr.parent&&xr.parent.provides;n===r&&(r=xr.provides=Object.create(n)),r[t]=e}}function qs(t,e,r=!1){const n=xr||Jr;if(n||Ya){const i=Ya?Ya._context.provides:n?n.parent==null?n.vnode.appContext&&n.vnode.appContext.provides:n.parent.provides:void 0;if(i&&t in i)return i[t];if(arguments.length>1)return r&&rt(e)?e.call(n&&n.proxy):e}}const zR={},qR=()=>Object.create(zR),YR=t=>Object.getPrototypeOf(t)===zR;function cB(t,e,r,n=!1){const i={},s=qR();t.propsDefaults=Object.create(null),JR(t,e,i,s);for(const o in t.propsOptions[0])o in i||(i[o]=void 0);r?t.props=n?i:ID(i):t.type.props?t.props=i:t.props=s,t.attrs=s}function pB(t,e,r,n){const{props:i,attrs:s,vnode:{patchFlag:o}}=t,f=Rt(i),[c]=t.propsOptions;let d=!1;if((n||o>0)&&!(o&16)){if(o&8){const p=t.vnode.dynamicProps;for(let E=0;E<p.length;E++){let m=p[E];if(Ec(t.emitsOptions,m))continue;const g=e[m];if(c)if(Ot(s,m))g!==s[m]&&(s[m]=g,d=!0);else{const _=Cn(m);i[_]=Lh(c,f,_,g,t,!1)}else g!==s[m]&&(s[m]=g,d=!0)}}}else{JR(t,e,i,s)&&(d=!0);let p;for(const E in f)(!e||!Ot(e,E)&&((p=Ts(E))===E||!Ot(e,p)))&&(c?r&&(r[E]!==void 0||r[p]!==void 0)&&(i[E]=Lh(c,f,E,void 0,t,!0)):delete i[E]);if(s!==f)for(const E in s)(!e||!Ot(e,E))&&(delete s[E],d=!0)}d&&Ci(t.attrs,"set","")}function JR(t,e,r,n){const[i,s]=t.propsOptions;let o=!1,f;if(e)for(let c in e){if(ol(c))continue;const d=e[c];let p;i&&Ot(i,p=Cn(c))?!s||!s.includes(p)?r[p]=d:(f||(f={}))[p]=d:Ec(t.emitsOptions,c)||(!(c in n)||d!==n[c])&&(n[c]=d,o=!0)}if(s){const c=Rt(r),d=f||Mt;for(let p=0;p<s.length;p++){const E=s[p];r[E]=Lh(i,c,E,d[E],t,!Ot(d,E))}}return o}function Lh(t,e,r,n,i,s){const o=t[r];if(o!=null){const f=Ot(o,"default");if(f&&n===void 0){const c=o.default;if(o.type!==Function&&!o.skipFactory&&rt(c)){const{propsDefaults:d}=i;if(r in d)n=d[r];else{const p=kl(i);n=d[r]=c.call(null,e),p()}}else n=c;i.ce&&i.ce._setProp(r,n)}o[0]&&(s&&!f?n=!1:o[1]&&(n===""||n===Ts(r))&&(n=!0))}return n}const dB=new WeakMap;function QR(t,e,r=!1){const n=r?dB:e.propsCache,i=n.get(t);if(i)return i;const s=t.props,o={},f=[];let c=!1;if(!rt(t)){const p=E=>{c=!0;const[m,g]=QR(E,e,!0);sr(o,m),g&&f.push(...g)};!r&&e.mixins.length&&e.mixins.forEach(p),t.extends&&p(t.extends),t.mixins&&t.mixins.forEach(p)}if(!s&&!c)return kt(t)&&n.set(t,Xa),Xa;if(Xe(s))for(let p=0;p<s.length;p++){const E=Cn(s[p]);mT(E)&&(o[E]=Mt)}else if(s)for(const p in s){const E=Cn(p);if(mT(E)){const m=s[p],g=o[E]=Xe(m)||rt(m)?{type:m}:sr({},m),_=g.type;let b=!1,x=!0;if(Xe(_))for(let S=0;S<_.length;++S){const y=_[S],v=rt(y)&&y.name;if(v==="Boolean"){b=!0;break}else v==="String"&&(x=!1)}else b=rt(_)&&_.name==="Boolean";g[0]=b,g[1]=x,(b||Ot(g,"default"))&&f.push(E)}}const d=[o,f];return kt(t)&&n.set(t,d),d}function mT(t){return t[0]!=="$"&&!ol(t)}const ZR=t=>t[0]==="_"||t==="$stable",HE=t=>Xe(t)?t.map(Qn):[Qn(t)],hB=(t,e,r)=>{if(e._n)return e;const n=pc((...i)=>HE(e(...i)),r);return n._c=!1,n},eS=(t,e,r)=>{const n=t._ctx;for(const i in t){if(ZR(i))continue;const s=t[i];if(rt(s))e[i]=hB(i,s,n);else if(s!=null){const o=HE(s);e[i]=()=>o}}},tS=(t,e)=>{const r=HE(e);t.slots.default=()=>r},rS=(t,e,r)=>{for(const n in e)(r||n!=="_")&&(t[n]=e[n])},EB=(t,e,r)=>{const n=t.slots=qR();if(t.vnode.shapeFlag&32){const i=e._;i?(rS(n,e,r),r&&sR(n,"_",i,!0)):eS(e,n)}else e&&tS(t,e)},mB=(t,e,r)=>{const{vnode:n,slots:i}=t;let s=!0,o=Mt;if(n.shapeFlag&32){const f=e._;f?r&&f===1?s=!1:rS(i,e,r):(s=!e.$stable,eS(e,i)),o=e}else e&&(tS(t,e),o={default:1});if(s)for(const f in i)!ZR(f)&&o[f]==null&&delete i[f]},on=OB;function gB(t){return _B(t)}function _B(t,e){const r=oc();r.__VUE__=!0;const{insert:n,remove:i,patchProp:s,createElement:o,createText:f,createComment:c,setText:d,setElementText:p,parentNode:E,nextSibling:m,setScopeId:g=ni,insertStaticContent:_}=t,b=(V,P,re,me=null,pe=null,be=null,xe=void 0,N=null,U=!!P.dynamicChildren)=>{if(V===P)return;V&&!Ws(V,P)&&(me=nt(V),he(V,pe,be,!0),V=null),P.patchFlag===-2&&(U=!1,P.dynamicChildren=null);const{type:q,ref:ge,shapeFlag:ye}=P;switch(q){case Kl:x(V,P,re,me);break;case Yr:S(V,P,re,me);break;case of:V==null&&y(P,re,me,xe);break;case Yt:G(V,P,re,me,pe,be,xe,N,U);break;default:ye&1?w(V,P,re,me,pe,be,xe,N,U):ye&6?X(V,P,re,me,pe,be,xe,N,U):(ye&64||ye&128)&&q.process(V,P,re,me,pe,be,xe,N,U,et)}ge!=null&&pe&&Af(ge,V&&V.ref,be,P||V,!P)},x=(V,P,re,me)=>{if(V==null)n(P.el=f(P.children),re,me);else{const pe=P.el=V.el;P.children!==V.children&&d(pe,P.children)}},S=(V,P,re,me)=>{V==null?n(P.el=c(P.children||""),re,me):P.el=V.el},y=(V,P,re,me)=>{[V.el,V.anchor]=_(V.children,P,re,me,V.el,V.anchor)},v=({el:V,anchor:P},re,me)=>{let pe;for(;V&&V!==P;)pe=m(V),n(V,re,me),V=pe;n(P,re,me)},R=({el:V,anchor:P})=>{let re;for(;V&&V!==P;)re=m(V),i(V),V=re;i(P)},w=(V,P,re,me,pe,be,xe,N,U)=>{P.type==="svg"?xe="svg":P.type==="math"&&(xe="mathml"),V==null?M(P,re,me,pe,be,xe,N,U):O(V,P,pe,be,xe,N,U)},M=(V,P,re,me,pe,be,xe,N)=>{let U,q;const{props:ge,shapeFlag:ye,transition:Re,dirs:se}=V;if(U=V.el=o(V.type,be,ge&&ge.is,ge),ye&8?p(U,V.children):ye&16&&H(V.children,U,null,me,pe,pd(V,be),xe,N),se&&$s(V,null,me,"created"),k(U,V,V.scopeId,xe,me),ge){for(const Ke in ge)Ke!=="value"&&!ol(Ke)&&s(U,Ke,null,ge[Ke],be,me);"value"in ge&&s(U,"value",null,ge.value,be),(q=ge.onVnodeBeforeMount)&&Xn(q,me,V)}se&&$s(V,null,me,"beforeMount");const le=TB(pe,Re);le&&Re.beforeEnter(U),n(U,P,re),((q=ge&&ge.onVnodeMounted)||le||se)&&on(()=>{q&&Xn(q,me,V),le&&Re.enter(U),se&&$s(V,null,me,"mounted")},pe)},k=(V,P,re,me,pe)=>{if(re&&g(V,re),me)for(let be=0;be<me.length;be++)g(V,me[be]);if(pe){let be=pe.subTree;if(P===be||lS(be.type)&&(be.ssContent===P||be.ssFallback===P)){const xe=pe.vnode;k(V,xe,xe.scopeId,xe.slotScopeIds,pe.parent)}}},H=(V,P,re,me,pe,be,xe,N,U=0)=>{for(let q=U;q<V.length;q++){const ge=V[q]=N?ns(V[q]):Qn(V[q]);b(null,ge,P,re,me,pe,be,xe,N)}},O=(V,P,re,me,pe,be,xe)=>{const N=P.el=V.el;let{patchFlag:U,dynamicChildren:q,dirs:ge}=P;U|=V.patchFlag&16;const ye=V.props||Mt,Re=P.props||Mt;let se;if(re&&Ks(re,!1),(se=Re.onVnodeBeforeUpdate)&&Xn(se,re,P,V),ge&&$s(P,V,re,"beforeUpdate"),re&&Ks(re,!0),(ye.innerHTML&&Re.innerHTML==null||ye.textContent&&Re.textContent==null)&&p(N,""),q?z(V.dynamicChildren,q,N,re,me,pd(P,pe),be):xe||j(V,P,N,null,re,me,pd(P,pe),be,!1),U>0){if(U&16)ie(N,ye,Re,re,pe);else if(U&2&&ye.class!==Re.class&&s(N,"class",null,Re.class,pe),U&4&&s(N,"style",ye.style,Re.style,pe),U&8){const le=P.dynamicProps;for(let Ke=0;Ke<le.length;Ke++){const K=le[Ke],$=ye[K],Z=Re[K];(Z!==$||K==="value")&&s(N,K,$,Z,pe,re)}}U&1&&V.children!==P.children&&p(N,P.children)}else!xe&&q==null&&ie(N,ye,Re,re,pe);((se=Re.onVnodeUpdated)||ge)&&on(()=>{se&&Xn(se,re,P,V),ge&&$s(P,V,re,"updated")},me)},z=(V,P,re,me,pe,be,xe)=>{for(let N=0;N<P.length;N++){const U=V[N],q=P[N],ge=U.el&&(U.type===Yt||!Ws(U,q)||U.shapeFlag&70)?E(U.el):re;b(U,q,ge,null,me,pe,be,xe,!0)}},ie=(V,P,re,me,pe)=>{if(P!==re){if(P!==Mt)for(const be in P)!ol(be)&&!(be in re)&&s(V,be,P[be],null,pe,me);for(const be in re){if(ol(be))continue;const xe=re[be],N=P[be];xe!==N&&be!=="value"&&s(V,be,N,xe,pe,me)}"value"in re&&s(V,"value",P.value,re.value,pe)}},G=(V,P,re,me,pe,be,xe,N,U)=>{const q=P.el=V?V.el:f(""),ge=P.anchor=V?V.anchor:f("");let{patchFlag:ye,dynamicChildren:Re,slotScopeIds:se}=P;se&&(N=N?N.concat(se):se),V==null?(n(q,re,me),n(ge,re,me),H(P.children||[],re,ge,pe,be,xe,N,U)):ye>0&&ye&64&&Re&&V.dynamicChildren?(z(V.dynamicChildren,Re,re,pe,be,xe,N),(P.key!=null||pe&&P===pe.subTree)&&nS(V,P,!0)):j(V,P,re,ge,pe,be,xe,N,U)},X=(V,P,re,me,pe,be,xe,N,U)=>{P.slotScopeIds=N,V==null?P.shapeFlag&512?pe.ctx.activate(P,re,me,xe,U):ee(P,re,me,pe,be,xe,U):B(V,P,U)},ee=(V,P,re,me,pe,be,xe)=>{const N=V.component=MB(V,me,pe);if(dc(V)&&(N.ctx.renderer=et),$B(N,!1,xe),N.asyncDep){if(pe&&pe.registerDep(N,Q,xe),!V.el){const U=N.subTree=Kt(Yr);S(null,U,P,re)}}else Q(N,V,P,re,pe,be,xe)},B=(V,P,re)=>{const me=P.component=V.component;if(CB(V,P,re))if(me.asyncDep&&!me.asyncResolved){W(me,P,re);return}else me.next=P,me.update();else P.el=V.el,me.vnode=P},Q=(V,P,re,me,pe,be,xe)=>{const N=()=>{if(V.isMounted){let{next:ye,bu:Re,u:se,parent:le,vnode:Ke}=V;{const J=iS(V);if(J){ye&&(ye.el=Ke.el,W(V,ye,xe)),J.asyncDep.then(()=>{V.isUnmounted||N()});return}}let K=ye,$;Ks(V,!1),ye?(ye.el=Ke.el,W(V,ye,xe)):ye=Ke,Re&&af(Re),($=ye.props&&ye.props.onVnodeBeforeUpdate)&&Xn($,le,ye,Ke),Ks(V,!0);const Z=dd(V),D=V.subTree;V.subTree=Z,b(D,Z,E(D.el),nt(D),V,pe,be),ye.el=Z.el,K===null&&wB(V,Z.el),se&&on(se,pe),($=ye.props&&ye.props.onVnodeUpdated)&&on(()=>Xn($,le,ye,Ke),pe)}else{let ye;const{el:Re,props:se}=P,{bm:le,m:Ke,parent:K,root:$,type:Z}=V,D=fl(P);if(Ks(V,!1),le&&af(le),!D&&(ye=se&&se.onVnodeBeforeMount)&&Xn(ye,K,P),Ks(V,!0),Re&&zt){const J=()=>{V.subTree=dd(V),zt(Re,V.subTree,V,pe,null)};D&&Z.__asyncHydrate?Z.__asyncHydrate(Re,V,J):J()}else{$.ce&&$.ce._injectChildStyle(Z);const J=V.subTree=dd(V);b(null,J,re,me,V,pe,be),P.el=J.el}if(Ke&&on(Ke,pe),!D&&(ye=se&&se.onVnodeMounted)){const J=P;on(()=>Xn(ye,K,J),pe)}(P.shapeFlag&256||K&&fl(K.vnode)&&K.vnode.shapeFlag&256)&&V.a&&on(V.a,pe),V.isMounted=!0,P=re=me=null}};V.scope.on();const U=V.effect=new fR(N);V.scope.off();const q=V.update=U.run.bind(U),ge=V.job=U.runIfDirty.bind(U);ge.i=V,ge.id=V.uid,U.scheduler=()=>ME(ge),Ks(V,!0),q()},W=(V,P,re)=>{P.component=V;const me=V.vnode.props;V.vnode=P,V.next=null,pB(V,P.props,me,re),mB(V,P.children,re),vs(),uT(V),bs()},j=(V,P,re,me,pe,be,xe,N,U=!1)=>{const q=V&&V.children,ge=V?V.shapeFlag:0,ye=P.children,{patchFlag:Re,shapeFlag:se}=P;if(Re>0){if(Re&128){ve(q,ye,re,me,pe,be,xe,N,U);return}else if(Re&256){ue(q,ye,re,me,pe,be,xe,N,U);return}}se&8?(ge&16&&$e(q,pe,be),ye!==q&&p(re,ye)):ge&16?se&16?ve(q,ye,re,me,pe,be,xe,N,U):$e(q,pe,be,!0):(ge&8&&p(re,""),se&16&&H(ye,re,me,pe,be,xe,N,U))},ue=(V,P,re,me,pe,be,xe,N,U)=>{V=V||Xa,P=P||Xa;const q=V.length,ge=P.length,ye=Math.min(q,ge);let Re;for(Re=0;Re<ye;Re++){const se=P[Re]=U?ns(P[Re]):Qn(P[Re]);b(V[Re],se,re,null,pe,be,xe,N,U)}q>ge?$e(V,pe,be,!0,!1,ye):H(P,re,me,pe,be,xe,N,U,ye)},ve=(V,P,re,me,pe,be,xe,N,U)=>{let q=0;const ge=P.length;let ye=V.length-1,Re=ge-1;for(;q<=ye&&q<=Re;){const se=V[q],le=P[q]=U?ns(P[q]):Qn(P[q]);if(Ws(se,le))b(se,le,re,null,pe,be,xe,N,U);else break;q++}for(;q<=ye&&q<=Re;){const se=V[ye],le=P[Re]=U?ns(P[Re]):Qn(P[Re]);if(Ws(se,le))b(se,le,re,null,pe,be,xe,N,U);else break;ye--,Re--}if(q>ye){if(q<=Re){const se=Re+1,le=se<ge?P[se].el:me;for(;q<=Re;)b(null,P[q]=U?ns(P[q]):Qn(P[q]),re,le,pe,be,xe,N,U),q++}}else if(q>Re)for(;q<=ye;)he(V[q],pe,be,!0),q++;else{const se=q,le=q,Ke=new Map;for(q=le;q<=Re;q++){const Ce=P[q]=U?ns(P[q]):Qn(P[q]);Ce.key!=null&&Ke.set(Ce.key,q)}let K,$=0;const Z=Re-le+1;let D=!1,J=0;const fe=new Array(Z);for(q=0;q<Z;q++)fe[q]=0;for(q=se;q<=ye;q++){const Ce=V[q];if($>=Z){he(Ce,pe,be,!0);continue}let ke;if(Ce.key!=null)ke=Ke.get(Ce.key);else for(K=le;K<=Re;K++)if(fe[K-le]===0&&Ws(Ce,P[K])){ke=K;break}ke===void 0?he(Ce,pe,be,!0):(fe[ke-le]=q+1,ke>=J?J=ke:D=!0,b(Ce,P[ke],re,null,pe,be,xe,N,U),$++)}const we=D?vB(fe):Xa;for(K=we.length-1,q=Z-1;q>=0;q--){const Ce=le+q,ke=P[Ce],Ct=Ce+1<ge?P[Ce+1].el:me;fe[q]===0?b(null,ke,re,Ct,pe,be,xe,N,U):D&&(K<0||q!==we[K]?ae(ke,re,Ct,2):K--)}}},ae=(V,P,re,me,pe=null)=>{const{el:be,type:xe,transition:N,children:U,shapeFlag:q}=V;if(q&6){ae(V.component.subTree,P,re,me);return}if(q&128){V.suspense.move(P,re,me);return}if(q&64){xe.move(V,P,re,et);return}if(xe===Yt){n(be,P,re);for(let ye=0;ye<U.length;ye++)ae(U[ye],P,re,me);n(V.anchor,P,re);return}if(xe===of){v(V,P,re);return}if(me!==2&&q&1&&N)if(me===0)N.beforeEnter(be),n(be,P,re),on(()=>N.enter(be),pe);else{const{leave:ye,delayLeave:Re,afterLeave:se}=N,le=()=>n(be,P,re),Ke=()=>{ye(be,()=>{le(),se&&se()})};Re?Re(be,le,Ke):Ke()}else n(be,P,re)},he=(V,P,re,me=!1,pe=!1)=>{const{type:be,props:xe,ref:N,children:U,dynamicChildren:q,shapeFlag:ge,patchFlag:ye,dirs:Re,cacheIndex:se}=V;if(ye===-2&&(pe=!1),N!=null&&Af(N,null,re,V,!0),se!=null&&(P.renderCache[se]=void 0),ge&256){P.ctx.deactivate(V);return}const le=ge&1&&Re,Ke=!fl(V);let K;if(Ke&&(K=xe&&xe.onVnodeBeforeUnmount)&&Xn(K,P,V),ge&6)Ie(V.component,re,me);else{if(ge&128){V.suspense.unmount(re,me);return}le&&$s(V,null,P,"beforeUnmount"),ge&64?V.type.remove(V,P,re,et,me):q&&!q.hasOnce&&(be!==Yt||ye>0&&ye&64)?$e(q,P,re,!1,!0):(be===Yt&&ye&384||!pe&&ge&16)&&$e(U,P,re),me&&Se(V)}(Ke&&(K=xe&&xe.onVnodeUnmounted)||le)&&on(()=>{K&&Xn(K,P,V),le&&$s(V,null,P,"unmounted")},re)},Se=V=>{const{type:P,el:re,anchor:me,transition:pe}=V;if(P===Yt){He(re,me);return}if(P===of){R(V);return}const be=()=>{i(re),pe&&!pe.persisted&&pe.afterLeave&&pe.afterLeave()};if(V.shapeFlag&1&&pe&&!pe.persisted){const{leave:xe,delayLeave:N}=pe,U=()=>xe(re,be);N?N(V.el,be,U):U()}else be()},He=(V,P)=>{let re;for(;V!==P;)re=m(V),i(V),V=re;i(P)},Ie=(V,P,re)=>{const{bum:me,scope:pe,job:be,subTree:xe,um:N,m:U,a:q}=V;gT(U),gT(q),me&&af(me),pe.stop(),be&&(be.flags|=8,he(xe,V,P,re)),N&&on(N,P),on(()=>{V.isUnmounted=!0},P),P&&P.pendingBranch&&!P.isUnmounted&&V.asyncDep&&!V.asyncResolved&&V.suspenseId===P.pendingId&&(P.deps--,P.deps===0&&P.resolve())},$e=(V,P,re,me=!1,pe=!1,be=0)=>{for(let xe=be;xe<V.length;xe++)he(V[xe],P,re,me,pe)},nt=V=>{if(V.shapeFlag&6)return nt(V.component.subTree);if(V.shapeFlag&128)return V.suspense.next();const P=m(V.anchor||V.el),re=P&&P[FD];return re?m(re):P};let Fe=!1;const ot=(V,P,re)=>{V==null?P._vnode&&he(P._vnode,null,null,!0):b(P._vnode||null,V,P,null,null,null,re),P._vnode=V,Fe||(Fe=!0,uT(),IR(),Fe=!1)},et={p:b,um:he,m:ae,r:Se,mt:ee,mc:H,pc:j,pbc:z,n:nt,o:t};let xt,zt;return{render:ot,hydrate:xt,createApp:uB(ot,xt)}}function pd({type:t,props:e},r){return r==="svg"&&t==="foreignObject"||r==="mathml"&&t==="annotation-xml"&&e&&e.encoding&&e.encoding.includes("html")?void 0:r}function Ks({effect:t,job:e},r){r?(t.flags|=32,e.flags|=4):(t.flags&=-33,e.flags&=-5)}function TB(t,e){return(!t||t&&!t.pendingBranch)&&e&&!e.persisted}function nS(t,e,r=!1){const n=t.children,i=e.children;if(Xe(n)&&Xe(i))for(let s=0;s<n.length;s++){const o=n[s];let f=i[s];f.shapeFlag&1&&!f.dynamicChildren&&((f.patchFlag<=0||f.patchFlag===32)&&(f=i[s]=ns(i[s]),f.el=o.el),!r&&f.patchFlag!==-2&&nS(o,f)),f.type===Kl&&(f.el=o.el)}}function vB(t){const e=t.slice(),r=[0];let n,i,s,o,f;const c=t.length;for(n=0;n<c;n++){const d=t[n];if(d!==0){if(i=r[r.length-1],t[i]<d){e[n]=i,r.push(n);continue}for(s=0,o=r.length-1;s<o;)f=s+o>>1,t[r[f]]<d?s=f+1:o=f;d<t[r[s]]&&(s>0&&(e[n]=r[s-1]),r[s]=n)}}for(s=r.length,o=r[s-1];s-- >0;)r[s]=o,o=e[o];return r}function iS(t){const e=t.subTree.component;if(e)return e.asyncDep&&!e.asyncResolved?e:iS(e)}function gT(t){if(t)for(let e=0;e<t.length;e++)t[e].flags|=8}const bB=Symbol.for("v-scx"),xB=()=>qs(bB);function Ja(t,e,r){return sS(t,e,r)}function sS(t,e,r=Mt){const{immediate:n,deep:i,flush:s,once:o}=r,f=sr({},r),c=e&&n||!e&&s!=="post";let d;if(Ll){if(s==="sync"){const g=xB();d=g.__watcherHandles||(g.__watcherHandles=[])}else if(!c){const g=()=>{};return g.stop=ni,g.resume=ni,g.pause=ni,g}}const p=xr;f.call=(g,_,b)=>Gn(g,p,_,b);let E=!1;s==="post"?f.scheduler=g=>{on(g,p&&p.suspense)}:s!=="sync"&&(E=!0,f.scheduler=(g,_)=>{_?g():ME(g)}),f.augmentJob=g=>{e&&(g.flags|=4),E&&(g.flags|=2,p&&(g.id=p.uid,g.i=p))};const m=KD(t,e,f);return Ll&&(d?d.push(m):c&&m()),m}function RB(t,e,r){const n=this.proxy,i=rr(t)?t.includes(".")?aS(n,t):()=>n[t]:t.bind(n,n);let s;rt(e)?s=e:(s=e.handler,r=e);const o=kl(this),f=sS(i,s.bind(n),r);return o(),f}function aS(t,e){const r=e.split(".");return()=>{let n=t;for(let i=0;i<r.length&&n;i++)n=n[r[i]];return n}}const SB=(t,e)=>e==="modelValue"||e==="model-value"?t.modelModifiers:t[`${e}Modifiers`]||t[`${Cn(e)}Modifiers`]||t[`${Ts(e)}Modifiers`];function yB(t,e,...r){if(t.isUnmounted)return;const n=t.vnode.props||Mt;let i=r;const s=e.startsWith("update:"),o=s&&SB(n,e.slice(7));o&&(o.trim&&(i=r.map(p=>rr(p)?p.trim():p)),o.number&&(i=r.map(xf)));let f,c=n[f=sd(e)]||n[f=sd(Cn(e))];!c&&s&&(c=n[f=sd(Ts(e))]),c&&Gn(c,t,6,i);const d=n[f+"Once"];if(d){if(!t.emitted)t.emitted={};else if(t.emitted[f])return;t.emitted[f]=!0,Gn(d,t,6,i)}}function oS(t,e,r=!1){const n=e.emitsCache,i=n.get(t);if(i!==void 0)return i;const s=t.emits;let o={},f=!1;if(!rt(t)){const c=d=>{const p=oS(d,e,!0);p&&(f=!0,sr(o,p))};!r&&e.mixins.length&&e.mixins.forEach(c),t.extends&&c(t.extends),t.mixins&&t.mixins.forEach(c)}return!s&&!f?(kt(t)&&n.set(t,null),null):(Xe(s)?s.forEach(c=>o[c]=null):sr(o,s),kt(t)&&n.set(t,o),o)}function Ec(t,e){return!t||!nc(e)?!1:(e=e.slice(2).replace(/Once$/,""),Ot(t,e[0].toLowerCase()+e.slice(1))||Ot(t,Ts(e))||Ot(t,e))}function dd(t){const{type:e,vnode:r,proxy:n,withProxy:i,propsOptions:[s],slots:o,attrs:f,emit:c,render:d,renderCache:p,props:E,data:m,setupState:g,ctx:_,inheritAttrs:b}=t,x=yf(t);let S,y;try{if(r.shapeFlag&4){const R=i||n,w=R;S=Qn(d.call(w,R,p,E,g,m,_)),y=f}else{const R=e;S=Qn(R.length>1?R(E,{attrs:f,slots:o,emit:c}):R(E,null)),y=e.props?f:AB(f)}}catch(R){pl.length=0,cc(R,t,1),S=Kt(Yr)}let v=S;if(y&&b!==!1){const R=Object.keys(y),{shapeFlag:w}=v;R.length&&w&7&&(s&&R.some(LE)&&(y=LB(y,s)),v=ms(v,y,!1,!0))}return r.dirs&&(v=ms(v,null,!1,!0),v.dirs=v.dirs?v.dirs.concat(r.dirs):r.dirs),r.transition&&ra(v,r.transition),S=v,yf(x),S}const AB=t=>{let e;for(const r in t)(r==="class"||r==="style"||nc(r))&&((e||(e={}))[r]=t[r]);return e},LB=(t,e)=>{const r={};for(const n in t)(!LE(n)||!(n.slice(9)in e))&&(r[n]=t[n]);return r};function CB(t,e,r){const{props:n,children:i,component:s}=t,{props:o,children:f,patchFlag:c}=e,d=s.emitsOptions;if(e.dirs||e.transition)return!0;if(r&&c>=0){if(c&1024)return!0;if(c&16)return n?_T(n,o,d):!!o;if(c&8){const p=e.dynamicProps;for(let E=0;E<p.length;E++){const m=p[E];if(o[m]!==n[m]&&!Ec(d,m))return!0}}}else return(i||f)&&(!f||!f.$stable)?!0:n===o?!1:n?o?_T(n,o,d):!0:!!o;return!1}function _T(t,e,r){const n=Object.keys(e);if(n.length!==Object.keys(t).length)return!0;for(let i=0;i<n.length;i++){const s=n[i];if(e[s]!==t[s]&&!Ec(r,s))return!0}return!1}function wB({vnode:t,parent:e},r){for(;e;){const n=e.subTree;if(n.suspense&&n.suspense.activeBranch===t&&(n.el=t.el),n===t)(t=e.vnode).el=r,e=e.parent;else break}}const lS=t=>t.__isSuspense;function OB(t,e){e&&e.pendingBranch?Xe(t)?e.effects.push(...t):e.effects.push(t):VD(t)}const Yt=Symbol.for("v-fgt"),Kl=Symbol.for("v-txt"),Yr=Symbol.for("v-cmt"),of=Symbol.for("v-stc"),pl=[];let cn=null;function Oe(t=!1){pl.push(cn=t?null:[])}function IB(){pl.pop(),cn=pl[pl.length-1]||null}let Al=1;function TT(t,e=!1){Al+=t,t<0&&cn&&e&&(cn.hasOnce=!0)}function uS(t){return t.dynamicChildren=Al>0?cn||Xa:null,IB(),Al>0&&cn&&cn.push(t),t}function Pe(t,e,r,n,i,s){return uS(Ae(t,e,r,n,i,s,!0))}function Bi(t,e,r,n,i){return uS(Kt(t,e,r,n,i,!0))}function Cf(t){return t?t.__v_isVNode===!0:!1}function Ws(t,e){return t.type===e.type&&t.key===e.key}const fS=({key:t})=>t??null,lf=({ref:t,ref_key:e,ref_for:r})=>(typeof t=="number"&&(t=""+t),t!=null?rr(t)||Sr(t)||rt(t)?{i:Jr,r:t,k:e,f:!!r}:t:null);function Ae(t,e=null,r=null,n=0,i=null,s=t===Yt?0:1,o=!1,f=!1){const c={__v_isVNode:!0,__v_skip:!0,type:t,props:e,key:e&&fS(e),ref:e&&lf(e),scopeId:PR,slotScopeIds:null,children:r,component:null,suspense:null,ssContent:null,ssFallback:null,dirs:null,transition:null,el:null,anchor:null,target:null,targetStart:null,targetAnchor:null,staticCount:0,shapeFlag:s,patchFlag:n,dynamicProps:i,dynamicChildren:null,appContext:null,ctx:Jr};return f?(WE(c,r),s&128&&t.normalize(c)):r&&(c.shapeFlag|=rr(r)?8:16),Al>0&&!o&&cn&&(c.patchFlag>0||s&6)&&c.patchFlag!==32&&cn.push(c),c}const Kt=NB;function NB(t,e=null,r=null,n=0,i=null,s=!1){if((!t||t===WR)&&(t=Yr),Cf(t)){const f=ms(t,e,!0);return r&&WE(f,r),Al>0&&!s&&cn&&(f.shapeFlag&6?cn[cn.indexOf(t)]=f:cn.push(f)),f.patchFlag=-2,f}if(FB(t)&&(t=t.__vccOpts),e){e=PB(e);let{class:f,style:c}=e;f&&!rr(f)&&(e.class=Vr(f)),kt(c)&&(BE(c)&&!Xe(c)&&(c=sr({},c)),e.style=lc(c))}const o=rr(t)?1:lS(t)?128:UR(t)?64:kt(t)?4:rt(t)?2:0;return Ae(t,e,r,n,i,o,s,!0)}function PB(t){return t?BE(t)||YR(t)?sr({},t):t:null}function ms(t,e,r=!1,n=!1){const{props:i,ref:s,patchFlag:o,children:f,transition:c}=t,d=e?cS(i||{},e):i,p={__v_isVNode:!0,__v_skip:!0,type:t.type,props:d,key:d&&fS(d),ref:e&&e.ref?r&&s?Xe(s)?s.concat(lf(e)):[s,lf(e)]:lf(e):s,scopeId:t.scopeId,slotScopeIds:t.slotScopeIds,children:f,target:t.target,targetStart:t.targetStart,targetAnchor:t.targetAnchor,staticCount:t.staticCount,shapeFlag:t.shapeFlag,patchFlag:e&&t.type!==Yt?o===-1?16:o|16:o,dynamicProps:t.dynamicProps,dynamicChildren:t.dynamicChildren,appContext:t.appContext,dirs:t.dirs,transition:c,component:t.component,suspense:t.suspense,ssContent:t.ssContent&&ms(t.ssContent),ssFallback:t.ssFallback&&ms(t.ssFallback),el:t.el,anchor:t.anchor,ctx:t.ctx,ce:t.ce};return c&&n&&ra(p,c.clone(p)),p}function ps(t=" ",e=0){return Kt(Kl,null,t,e)}function UB(t,e){const r=Kt(of,null,t);return r.staticCount=e,r}function vt(t="",e=!1){return e?(Oe(),Bi(Yr,null,t)):Kt(Yr,null,t)}function Qn(t){return t==null||typeof t=="boolean"?Kt(Yr):Xe(t)?Kt(Yt,null,t.slice()):Cf(t)?ns(t):Kt(Kl,null,String(t))}function ns(t){return t.el===null&&t.patchFlag!==-1||t.memo?t:ms(t)}function WE(t,e){let r=0;const{shapeFlag:n}=t;if(e==null)e=null;else if(Xe(e))r=16;else if(typeof e=="object")if(n&65){const i=e.default;i&&(i._c&&(i._d=!1),WE(t,i()),i._c&&(i._d=!0));return}else{r=32;const i=e._;!i&&!YR(e)?e._ctx=Jr:i===3&&Jr&&(Jr.slots._===1?e._=1:(e._=2,t.patchFlag|=1024))}else rt(e)?(e={default:e,_ctx:Jr},r=32):(e=String(e),n&64?(r=16,e=[ps(e)]):r=8);t.children=e,t.shapeFlag|=r}function cS(...t){const e={};for(let r=0;r<t.length;r++){const n=t[r];for(const i in n)if(i==="class")e.class!==n.class&&(e.class=Vr([e.class,n.class]));else if(i==="style")e.style=lc([e.style,n.style]);else if(nc(i)){const s=e[i],o=n[i];o&&s!==o&&!(Xe(s)&&s.includes(o))&&(e[i]=s?[].concat(s,o):o)}else i!==""&&(e[i]=n[i])}return e}function Xn(t,e,r,n=null){Gn(t,e,7,[r,n])}const DB=jR();let BB=0;function MB(t,e,r){const n=t.type,i=(e?e.appContext:t.appContext)||DB,s={uid:BB++,vnode:t,type:n,parent:e,appContext:i,root:null,next:null,subTree:null,effect:null,update:null,job:null,scope:new uR(!0),render:null,proxy:null,exposed:null,exposeProxy:null,withProxy:null,provides:e?e.provides:Object.create(i.provides),ids:e?e.ids:["",0,0],accessCache:null,renderCache:[],components:null,directives:null,propsOptions:QR(n,i),emitsOptions:oS(n,i),emit:null,emitted:null,propsDefaults:Mt,inheritAttrs:n.inheritAttrs,ctx:Mt,data:Mt,props:Mt,attrs:Mt,slots:Mt,refs:Mt,setupState:Mt,setupContext:null,suspense:r,suspenseId:r?r.pendingId:0,asyncDep:null,asyncResolved:!1,isMounted:!1,isUnmounted:!1,isDeactivated:!1,bc:null,c:null,bm:null,m:null,bu:null,u:null,um:null,bum:null,da:null,a:null,rtg:null,rtc:null,ec:null,sp:null};return s.ctx={_:s},s.root=e?e.root:s,s.emit=yB.bind(null,s),t.ce&&t.ce(s),s}let xr=null;const so=()=>xr||Jr;let wf,Ch;{const t=oc(),e=(r,n)=>{let i;return(i=t[r])||(i=t[r]=[]),i.push(n),s=>{i.length>1?i.forEach(o=>o(s)):i[0](s)}};wf=e("__VUE_INSTANCE_SETTERS__",r=>xr=r),Ch=e("__VUE_SSR_SETTERS__",r=>Ll=r)}const kl=t=>{const e=xr;return wf(t),t.scope.on(),()=>{t.scope.off(),wf(e)}},vT=()=>{xr&&xr.scope.off(),wf(null)};function pS(t){return t.vnode.shapeFlag&4}let Ll=!1;function $B(t,e=!1,r=!1){e&&Ch(e);const{props:n,children:i}=t.vnode,s=pS(t);cB(t,n,s,e),EB(t,i,r);const o=s?KB(t,e):void 0;return e&&Ch(!1),o}function KB(t,e){const r=t.type;t.accessCache=Object.create(null),t.proxy=new Proxy(t.ctx,rB);const{setup:n}=r;if(n){vs();const i=t.setupContext=n.length>1?GB(t):null,s=kl(t),o=$l(n,t,0,[t.props,i]),f=rR(o);if(bs(),s(),(f||t.sp)&&!fl(t)&&kR(t),f){if(o.then(vT,vT),e)return o.then(c=>{bT(t,c,e)}).catch(c=>{cc(c,t,0)});t.asyncDep=o}else bT(t,o,e)}else dS(t,e)}function bT(t,e,r){rt(e)?t.type.__ssrInlineRender?t.ssrRender=e:t.render=e:kt(e)&&(t.setupState=LR(e)),dS(t,r)}let xT;function dS(t,e,r){const n=t.type;if(!t.render){if(!e&&xT&&!n.render){const i=n.template||FE(t).template;if(i){const{isCustomElement:s,compilerOptions:o}=t.appContext.config,{delimiters:f,compilerOptions:c}=n,d=sr(sr({isCustomElement:s,delimiters:f},o),c);n.render=xT(i,d)}}t.render=n.render||ni}{const i=kl(t);vs();try{nB(t)}finally{bs(),i()}}}const kB={get(t,e){return Or(t,"get",""),t[e]}};function GB(t){const e=r=>{t.exposed=r||{}};return{attrs:new Proxy(t.attrs,kB),slots:t.slots,emit:t.emit,expose:e}}function mc(t){return t.exposed?t.exposeProxy||(t.exposeProxy=new Proxy(LR(ND(t.exposed)),{get(e,r){if(r in e)return e[r];if(r in cl)return cl[r](t)},has(e,r){return r in e||r in cl}})):t.proxy}function VB(t,e=!0){return rt(t)?t.displayName||t.name:t.name||e&&t.__name}function FB(t){return rt(t)&&"__vccOpts"in t}const Sn=(t,e)=>MD(t,e,Ll);function XE(t,e,r){const n=arguments.length;return n===2?kt(e)&&!Xe(e)?Cf(e)?Kt(t,null,[e]):Kt(t,e):Kt(t,null,e):(n>3?r=Array.prototype.slice.call(arguments,2):n===3&&Cf(r)&&(r=[r]),Kt(t,e,r))}const HB="3.5.13";/**
-* @vue/runtime-dom v3.5.13
-* (c) 2018-present Yuxi (Evan) You and Vue contributors
-* @license MIT
-**/let wh;const RT=typeof window<"u"&&window.trustedTypes;if(RT)try{wh=RT.createPolicy("vue",{createHTML:t=>t})}catch{}const hS=wh?t=>wh.createHTML(t):t=>t,WB="http://www.w3.org/2000/svg",XB="http://www.w3.org/1998/Math/MathML",Ai=typeof document<"u"?document:null,ST=Ai&&Ai.createElement("template"),jB={insert:(t,e,r)=>{e.insertBefore(t,r||null)},remove:t=>{const e=t.parentNode;e&&e.removeChild(t)},createElement:(t,e,r,n)=>{const i=e==="svg"?Ai.createElementNS(WB,t):e==="mathml"?Ai.createElementNS(XB,t):r?Ai.createElement(t,{is:r}):Ai.createElement(t);return t==="select"&&n&&n.multiple!=null&&i.setAttribute("multiple",n.multiple),i},createText:t=>Ai.createTextNode(t),createComment:t=>Ai.createComment(t),setText:(t,e)=>{t.nodeValue=e},setElementText:(t,e)=>{t.textContent=e},parentNode:t=>t.parentNode,nextSibling:t=>t.nextSibling,querySelector:t=>Ai.querySelector(t),setScopeId(t,e){t.setAttribute(e,"")},insertStaticContent(t,e,r,n,i,s){const o=r?r.previousSibling:e.lastChild;if(i&&(i===s||i.nextSibling))for(;e.insertBefore(i.cloneNode(!0),r),!(i===s||!(i=i.nextSibling)););else{ST.innerHTML=hS(n==="svg"?`<svg>${t}</svg>`:n==="mathml"?`<math>${t}</math>`:t);const f=ST.content;if(n==="svg"||n==="mathml"){const c=f.firstChild;for(;c.firstChild;)f.appendChild(c.firstChild);f.removeChild(c)}e.insertBefore(f,r)}return[o?o.nextSibling:e.firstChild,r?r.previousSibling:e.lastChild]}},Yi="transition",Jo="animation",ao=Symbol("_vtc"),ES={name:String,type:String,css:{type:Boolean,default:!0},duration:[String,Number,Object],enterFromClass:String,enterActiveClass:String,enterToClass:String,appearFromClass:String,appearActiveClass:String,appearToClass:String,leaveFromClass:String,leaveActiveClass:String,leaveToClass:String},mS=sr({},BR,ES),zB=t=>(t.displayName="Transition",t.props=mS,t),gS=zB((t,{slots:e})=>XE(WD,_S(t),e)),ks=(t,e=[])=>{Xe(t)?t.forEach(r=>r(...e)):t&&t(...e)},yT=t=>t?Xe(t)?t.some(e=>e.length>1):t.length>1:!1;function _S(t){const e={};for(const G in t)G in ES||(e[G]=t[G]);if(t.css===!1)return e;const{name:r="v",type:n,duration:i,enterFromClass:s=`${r}-enter-from`,enterActiveClass:o=`${r}-enter-active`,enterToClass:f=`${r}-enter-to`,appearFromClass:c=s,appearActiveClass:d=o,appearToClass:p=f,leaveFromClass:E=`${r}-leave-from`,leaveActiveClass:m=`${r}-leave-active`,leaveToClass:g=`${r}-leave-to`}=t,_=qB(i),b=_&&_[0],x=_&&_[1],{onBeforeEnter:S,onEnter:y,onEnterCancelled:v,onLeave:R,onLeaveCancelled:w,onBeforeAppear:M=S,onAppear:k=y,onAppearCancelled:H=v}=e,O=(G,X,ee,B)=>{G._enterCancelled=B,Zi(G,X?p:f),Zi(G,X?d:o),ee&&ee()},z=(G,X)=>{G._isLeaving=!1,Zi(G,E),Zi(G,g),Zi(G,m),X&&X()},ie=G=>(X,ee)=>{const B=G?k:y,Q=()=>O(X,G,ee);ks(B,[X,Q]),AT(()=>{Zi(X,G?c:s),qn(X,G?p:f),yT(B)||LT(X,n,b,Q)})};return sr(e,{onBeforeEnter(G){ks(S,[G]),qn(G,s),qn(G,o)},onBeforeAppear(G){ks(M,[G]),qn(G,c),qn(G,d)},onEnter:ie(!1),onAppear:ie(!0),onLeave(G,X){G._isLeaving=!0;const ee=()=>z(G,X);qn(G,E),G._enterCancelled?(qn(G,m),Oh()):(Oh(),qn(G,m)),AT(()=>{G._isLeaving&&(Zi(G,E),qn(G,g),yT(R)||LT(G,n,x,ee))}),ks(R,[G,ee])},onEnterCancelled(G){O(G,!1,void 0,!0),ks(v,[G])},onAppearCancelled(G){O(G,!0,void 0,!0),ks(H,[G])},onLeaveCancelled(G){z(G),ks(w,[G])}})}function qB(t){if(t==null)return null;if(kt(t))return[hd(t.enter),hd(t.leave)];{const e=hd(t);return[e,e]}}function hd(t){return rD(t)}function qn(t,e){e.split(/\s+/).forEach(r=>r&&t.classList.add(r)),(t[ao]||(t[ao]=new Set)).add(e)}function Zi(t,e){e.split(/\s+/).forEach(n=>n&&t.classList.remove(n));const r=t[ao];r&&(r.delete(e),r.size||(t[ao]=void 0))}function AT(t){requestAnimationFrame(()=>{requestAnimationFrame(t)})}let YB=0;function LT(t,e,r,n){const i=t._endId=++YB,s=()=>{i===t._endId&&n()};if(r!=null)return setTimeout(s,r);const{type:o,timeout:f,propCount:c}=TS(t,e);if(!o)return n();const d=o+"end";let p=0;const E=()=>{t.removeEventListener(d,m),s()},m=g=>{g.target===t&&++p>=c&&E()};setTimeout(()=>{p<c&&E()},f+1),t.addEventListener(d,m)}function TS(t,e){const r=window.getComputedStyle(t),n=_=>(r[_]||"").split(", "),i=n(`${Yi}Delay`),s=n(`${Yi}Duration`),o=CT(i,s),f=n(`${Jo}Delay`),c=n(`${Jo}Duration`),d=CT(f,c);let p=null,E=0,m=0;e===Yi?o>0&&(p=Yi,E=o,m=s.length):e===Jo?d>0&&(p=Jo,E=d,m=c.length):(E=Math.max(o,d),p=E>0?o>d?Yi:Jo:null,m=p?p===Yi?s.length:c.length:0);const g=p===Yi&&/\b(transform|all)(,|$)/.test(n(`${Yi}Property`).toString());return{type:p,timeout:E,propCount:m,hasTransform:g}}function CT(t,e){for(;t.length<e.length;)t=t.concat(t);return Math.max(...e.map((r,n)=>wT(r)+wT(t[n])))}function wT(t){return t==="auto"?0:Number(t.slice(0,-1).replace(",","."))*1e3}function Oh(){return document.body.offsetHeight}function JB(t,e,r){const n=t[ao];n&&(e=(e?[e,...n]:[...n]).join(" ")),e==null?t.removeAttribute("class"):r?t.setAttribute("class",e):t.className=e}const OT=Symbol("_vod"),QB=Symbol("_vsh"),ZB=Symbol(""),eM=/(^|;)\s*display\s*:/;function tM(t,e,r){const n=t.style,i=rr(r);let s=!1;if(r&&!i){if(e)if(rr(e))for(const o of e.split(";")){const f=o.slice(0,o.indexOf(":")).trim();r[f]==null&&uf(n,f,"")}else for(const o in e)r[o]==null&&uf(n,o,"");for(const o in r)o==="display"&&(s=!0),uf(n,o,r[o])}else if(i){if(e!==r){const o=n[ZB];o&&(r+=";"+o),n.cssText=r,s=eM.test(r)}}else e&&t.removeAttribute("style");OT in t&&(t[OT]=s?n.display:"",t[QB]&&(n.display="none"))}const IT=/\s*!important$/;function uf(t,e,r){if(Xe(r))r.forEach(n=>uf(t,e,n));else if(r==null&&(r=""),e.startsWith("--"))t.setProperty(e,r);else{const n=rM(t,e);IT.test(r)?t.setProperty(Ts(n),r.replace(IT,""),"important"):t[n]=r}}const NT=["Webkit","Moz","ms"],Ed={};function rM(t,e){const r=Ed[e];if(r)return r;let n=Cn(e);if(n!=="filter"&&n in t)return Ed[e]=n;n=ac(n);for(let i=0;i<NT.length;i++){const s=NT[i]+n;if(s in t)return Ed[e]=s}return e}const PT="http://www.w3.org/1999/xlink";function UT(t,e,r,n,i,s=lD(e)){n&&e.startsWith("xlink:")?r==null?t.removeAttributeNS(PT,e.slice(6,e.length)):t.setAttributeNS(PT,e,r):r==null||s&&!aR(r)?t.removeAttribute(e):t.setAttribute(e,s?"":li(r)?String(r):r)}function DT(t,e,r,n,i){if(e==="innerHTML"||e==="textContent"){r!=null&&(t[e]=e==="innerHTML"?hS(r):r);return}const s=t.tagName;if(e==="value"&&s!=="PROGRESS"&&!s.includes("-")){const f=s==="OPTION"?t.getAttribute("value")||"":t.value,c=r==null?t.type==="checkbox"?"on":"":String(r);(f!==c||!("_value"in t))&&(t.value=c),r==null&&t.removeAttribute(e),t._value=r;return}let o=!1;if(r===""||r==null){const f=typeof t[e];f==="boolean"?r=aR(r):r==null&&f==="string"?(r="",o=!0):f==="number"&&(r=0,o=!0)}try{t[e]=r}catch{}o&&t.removeAttribute(i||e)}function ss(t,e,r,n){t.addEventListener(e,r,n)}function nM(t,e,r,n){t.removeEventListener(e,r,n)}const BT=Symbol("_vei");function iM(t,e,r,n,i=null){const s=t[BT]||(t[BT]={}),o=s[e];if(n&&o)o.value=n;else{const[f,c]=sM(e);if(n){const d=s[e]=lM(n,i);ss(t,f,d,c)}else o&&(nM(t,f,o,c),s[e]=void 0)}}const MT=/(?:Once|Passive|Capture)$/;function sM(t){let e;if(MT.test(t)){e={};let n;for(;n=t.match(MT);)t=t.slice(0,t.length-n[0].length),e[n[0].toLowerCase()]=!0}return[t[2]===":"?t.slice(3):Ts(t.slice(2)),e]}let md=0;const aM=Promise.resolve(),oM=()=>md||(aM.then(()=>md=0),md=Date.now());function lM(t,e){const r=n=>{if(!n._vts)n._vts=Date.now();else if(n._vts<=r.attached)return;Gn(uM(n,r.value),e,5,[n])};return r.value=t,r.attached=oM(),r}function uM(t,e){if(Xe(e)){const r=t.stopImmediatePropagation;return t.stopImmediatePropagation=()=>{r.call(t),t._stopped=!0},e.map(n=>i=>!i._stopped&&n&&n(i))}else return e}const $T=t=>t.charCodeAt(0)===111&&t.charCodeAt(1)===110&&t.charCodeAt(2)>96&&t.charCodeAt(2)<123,fM=(t,e,r,n,i,s)=>{const o=i==="svg";e==="class"?JB(t,n,o):e==="style"?tM(t,r,n):nc(e)?LE(e)||iM(t,e,r,n,s):(e[0]==="."?(e=e.slice(1),!0):e[0]==="^"?(e=e.slice(1),!1):cM(t,e,n,o))?(DT(t,e,n),!t.tagName.includes("-")&&(e==="value"||e==="checked"||e==="selected")&&UT(t,e,n,o,s,e!=="value")):t._isVueCE&&(/[A-Z]/.test(e)||!rr(n))?DT(t,Cn(e),n,s,e):(e==="true-value"?t._trueValue=n:e==="false-value"&&(t._falseValue=n),UT(t,e,n,o))};function cM(t,e,r,n){if(n)return!!(e==="innerHTML"||e==="textContent"||e in t&&$T(e)&&rt(r));if(e==="spellcheck"||e==="draggable"||e==="translate"||e==="form"||e==="list"&&t.tagName==="INPUT"||e==="type"&&t.tagName==="TEXTAREA")return!1;if(e==="width"||e==="height"){const i=t.tagName;if(i==="IMG"||i==="VIDEO"||i==="CANVAS"||i==="SOURCE")return!1}return $T(e)&&rr(r)?!1:e in t}const vS=new WeakMap,bS=new WeakMap,Of=Symbol("_moveCb"),KT=Symbol("_enterCb"),pM=t=>(delete t.props.mode,t),dM=pM({name:"TransitionGroup",props:sr({},mS,{tag:String,moveClass:String}),setup(t,{slots:e}){const r=so(),n=DR();let i,s;return FR(()=>{if(!i.length)return;const o=t.moveClass||`${t.name||"v"}-move`;if(!_M(i[0].el,r.vnode.el,o))return;i.forEach(EM),i.forEach(mM);const f=i.filter(gM);Oh(),f.forEach(c=>{const d=c.el,p=d.style;qn(d,o),p.transform=p.webkitTransform=p.transitionDuration="";const E=d[Of]=m=>{m&&m.target!==d||(!m||/transform$/.test(m.propertyName))&&(d.removeEventListener("transitionend",E),d[Of]=null,Zi(d,o))};d.addEventListener("transitionend",E)})}),()=>{const o=Rt(t),f=_S(o);let c=o.tag||Yt;if(i=[],s)for(let d=0;d<s.length;d++){const p=s[d];p.el&&p.el instanceof Element&&(i.push(p),ra(p,yl(p,f,n,r)),vS.set(p,p.el.getBoundingClientRect()))}s=e.default?$E(e.default()):[];for(let d=0;d<s.length;d++){const p=s[d];p.key!=null&&ra(p,yl(p,f,n,r))}return Kt(c,null,s)}}}),hM=dM;function EM(t){const e=t.el;e[Of]&&e[Of](),e[KT]&&e[KT]()}function mM(t){bS.set(t,t.el.getBoundingClientRect())}function gM(t){const e=vS.get(t),r=bS.get(t),n=e.left-r.left,i=e.top-r.top;if(n||i){const s=t.el.style;return s.transform=s.webkitTransform=`translate(${n}px,${i}px)`,s.transitionDuration="0s",t}}function _M(t,e,r){const n=t.cloneNode(),i=t[ao];i&&i.forEach(f=>{f.split(/\s+/).forEach(c=>c&&n.classList.remove(c))}),r.split(/\s+/).forEach(f=>f&&n.classList.add(f)),n.style.display="none";const s=e.nodeType===1?e:e.parentNode;s.appendChild(n);const{hasTransform:o}=TS(n);return s.removeChild(n),o}const oo=t=>{const e=t.props["onUpdate:modelValue"]||!1;return Xe(e)?r=>af(e,r):e};function TM(t){t.target.composing=!0}function kT(t){const e=t.target;e.composing&&(e.composing=!1,e.dispatchEvent(new Event("input")))}const Ni=Symbol("_assign"),vM={created(t,{modifiers:{lazy:e,trim:r,number:n}},i){t[Ni]=oo(i);const s=n||i.props&&i.props.type==="number";ss(t,e?"change":"input",o=>{if(o.target.composing)return;let f=t.value;r&&(f=f.trim()),s&&(f=xf(f)),t[Ni](f)}),r&&ss(t,"change",()=>{t.value=t.value.trim()}),e||(ss(t,"compositionstart",TM),ss(t,"compositionend",kT),ss(t,"change",kT))},mounted(t,{value:e}){t.value=e??""},beforeUpdate(t,{value:e,oldValue:r,modifiers:{lazy:n,trim:i,number:s}},o){if(t[Ni]=oo(o),t.composing)return;const f=(s||t.type==="number")&&!/^0\d/.test(t.value)?xf(t.value):t.value,c=e??"";f!==c&&(document.activeElement===t&&t.type!=="range"&&(n&&e===r||i&&t.value.trim()===c)||(t.value=c))}},GT={created(t,{value:e},r){t.checked=io(e,r.props.value),t[Ni]=oo(r),ss(t,"change",()=>{t[Ni](Cl(t))})},beforeUpdate(t,{value:e,oldValue:r},n){t[Ni]=oo(n),e!==r&&(t.checked=io(e,n.props.value))}},xS={deep:!0,created(t,{value:e,modifiers:{number:r}},n){const i=ic(e);ss(t,"change",()=>{const s=Array.prototype.filter.call(t.options,o=>o.selected).map(o=>r?xf(Cl(o)):Cl(o));t[Ni](t.multiple?i?new Set(s):s:s[0]),t._assigning=!0,wR(()=>{t._assigning=!1})}),t[Ni]=oo(n)},mounted(t,{value:e}){VT(t,e)},beforeUpdate(t,e,r){t[Ni]=oo(r)},updated(t,{value:e}){t._assigning||VT(t,e)}};function VT(t,e){const r=t.multiple,n=Xe(e);if(!(r&&!n&&!ic(e))){for(let i=0,s=t.options.length;i<s;i++){const o=t.options[i],f=Cl(o);if(r)if(n){const c=typeof f;c==="string"||c==="number"?o.selected=e.some(d=>String(d)===String(f)):o.selected=fD(e,f)>-1}else o.selected=e.has(f);else if(io(Cl(o),e)){t.selectedIndex!==i&&(t.selectedIndex=i);return}}!r&&t.selectedIndex!==-1&&(t.selectedIndex=-1)}}function Cl(t){return"_value"in t?t._value:t.value}const bM=["ctrl","shift","alt","meta"],xM={stop:t=>t.stopPropagation(),prevent:t=>t.preventDefault(),self:t=>t.target!==t.currentTarget,ctrl:t=>!t.ctrlKey,shift:t=>!t.shiftKey,alt:t=>!t.altKey,meta:t=>!t.metaKey,left:t=>"button"in t&&t.button!==0,middle:t=>"button"in t&&t.button!==1,right:t=>"button"in t&&t.button!==2,exact:(t,e)=>bM.some(r=>t[`${r}Key`]&&!e.includes(r))},dn=(t,e)=>{const r=t._withMods||(t._withMods={}),n=e.join(".");return r[n]||(r[n]=(i,...s)=>{for(let o=0;o<e.length;o++){const f=xM[e[o]];if(f&&f(i,e))return}return t(i,...s)})},RM={esc:"escape",space:" ",up:"arrow-up",left:"arrow-left",right:"arrow-right",down:"arrow-down",delete:"backspace"},Ys=(t,e)=>{const r=t._withKeys||(t._withKeys={}),n=e.join(".");return r[n]||(r[n]=i=>{if(!("key"in i))return;const s=Ts(i.key);if(e.some(o=>o===s||RM[o]===s))return t(i)})},SM=sr({patchProp:fM},jB);let FT;function yM(){return FT||(FT=gB(SM))}const AM=(...t)=>{const e=yM().createApp(...t),{mount:r}=e;return e.mount=n=>{const i=CM(n);if(!i)return;const s=e._component;!rt(s)&&!s.render&&!s.template&&(s.template=i.innerHTML),i.nodeType===1&&(i.textContent="");const o=r(i,!1,LM(i));return i instanceof Element&&(i.removeAttribute("v-cloak"),i.setAttribute("data-v-app","")),o},e};function LM(t){if(t instanceof SVGElement)return"svg";if(typeof MathMLElement=="function"&&t instanceof MathMLElement)return"mathml"}function CM(t){return rr(t)?document.querySelector(t):t}/*!
-  * shared v9.14.1
-  * (c) 2024 kazuya kawaguchi
-  * Released under the MIT License.
-  */const If=typeof window<"u",xs=(t,e=!1)=>e?Symbol.for(t):Symbol(t),wM=(t,e,r)=>OM({l:t,k:e,s:r}),OM=t=>JSON.stringify(t).replace(/\u2028/g,"\\u2028").replace(/\u2029/g,"\\u2029").replace(/\u0027/g,"\\u0027"),pr=t=>typeof t=="number"&&isFinite(t),IM=t=>SS(t)==="[object Date]",gs=t=>SS(t)==="[object RegExp]",gc=t=>Ze(t)&&Object.keys(t).length===0,Pr=Object.assign;let HT;const Nf=()=>HT||(HT=typeof globalThis<"u"?globalThis:typeof self<"u"?self:typeof window<"u"?window:typeof global<"u"?global:{});function WT(t){return t.replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;").replace(/'/g,"&apos;")}const NM=Object.prototype.hasOwnProperty;function Pf(t,e){return NM.call(t,e)}const Xt=Array.isArray,Ft=t=>typeof t=="function",Ue=t=>typeof t=="string",ct=t=>typeof t=="boolean",yt=t=>t!==null&&typeof t=="object",PM=t=>yt(t)&&Ft(t.then)&&Ft(t.catch),RS=Object.prototype.toString,SS=t=>RS.call(t),Ze=t=>{if(!yt(t))return!1;const e=Object.getPrototypeOf(t);return e===null||e.constructor===Object},UM=t=>t==null?"":Xt(t)||Ze(t)&&t.toString===RS?JSON.stringify(t,null,2):String(t);function DM(t,e=""){return t.reduce((r,n,i)=>i===0?r+n:r+e+n,"")}function _c(t){let e=t;return()=>++e}function BM(t,e){typeof console<"u"&&(console.warn("[intlify] "+t),e&&console.warn(e.stack))}const Hu=t=>!yt(t)||Xt(t);function ff(t,e){if(Hu(t)||Hu(e))throw new Error("Invalid value");const r=[{src:t,des:e}];for(;r.length;){const{src:n,des:i}=r.pop();Object.keys(n).forEach(s=>{yt(n[s])&&!yt(i[s])&&(i[s]=Array.isArray(n[s])?[]:{}),Hu(i[s])||Hu(n[s])?i[s]=n[s]:r.push({src:n[s],des:i[s]})})}}/*!
-  * message-compiler v9.14.1
-  * (c) 2024 kazuya kawaguchi
-  * Released under the MIT License.
-  */function MM(t,e,r){return{line:t,column:e,offset:r}}function Uf(t,e,r){return{start:t,end:e}}const $M=/\{([0-9a-zA-Z]+)\}/g;function yS(t,...e){return e.length===1&&KM(e[0])&&(e=e[0]),(!e||!e.hasOwnProperty)&&(e={}),t.replace($M,(r,n)=>e.hasOwnProperty(n)?e[n]:"")}const AS=Object.assign,XT=t=>typeof t=="string",KM=t=>t!==null&&typeof t=="object";function LS(t,e=""){return t.reduce((r,n,i)=>i===0?r+n:r+e+n,"")}const jE={USE_MODULO_SYNTAX:1,__EXTEND_POINT__:2},kM={[jE.USE_MODULO_SYNTAX]:"Use modulo before '{{0}}'."};function GM(t,e,...r){const n=yS(kM[t],...r||[]),i={message:String(n),code:t};return e&&(i.location=e),i}const qe={EXPECTED_TOKEN:1,INVALID_TOKEN_IN_PLACEHOLDER:2,UNTERMINATED_SINGLE_QUOTE_IN_PLACEHOLDER:3,UNKNOWN_ESCAPE_SEQUENCE:4,INVALID_UNICODE_ESCAPE_SEQUENCE:5,UNBALANCED_CLOSING_BRACE:6,UNTERMINATED_CLOSING_BRACE:7,EMPTY_PLACEHOLDER:8,NOT_ALLOW_NEST_PLACEHOLDER:9,INVALID_LINKED_FORMAT:10,MUST_HAVE_MESSAGES_IN_PLURAL:11,UNEXPECTED_EMPTY_LINKED_MODIFIER:12,UNEXPECTED_EMPTY_LINKED_KEY:13,UNEXPECTED_LEXICAL_ANALYSIS:14,UNHANDLED_CODEGEN_NODE_TYPE:15,UNHANDLED_MINIFIER_NODE_TYPE:16,__EXTEND_POINT__:17},VM={[qe.EXPECTED_TOKEN]:"Expected token: '{0}'",[qe.INVALID_TOKEN_IN_PLACEHOLDER]:"Invalid token in placeholder: '{0}'",[qe.UNTERMINATED_SINGLE_QUOTE_IN_PLACEHOLDER]:"Unterminated single quote in placeholder",[qe.UNKNOWN_ESCAPE_SEQUENCE]:"Unknown escape sequence: \\{0}",[qe.INVALID_UNICODE_ESCAPE_SEQUENCE]:"Invalid unicode escape sequence: {0}",[qe.UNBALANCED_CLOSING_BRACE]:"Unbalanced closing brace",[qe.UNTERMINATED_CLOSING_BRACE]:"Unterminated closing brace",[qe.EMPTY_PLACEHOLDER]:"Empty placeholder",[qe.NOT_ALLOW_NEST_PLACEHOLDER]:"Not allowed nest placeholder",[qe.INVALID_LINKED_FORMAT]:"Invalid linked format",[qe.MUST_HAVE_MESSAGES_IN_PLURAL]:"Plural must have messages",[qe.UNEXPECTED_EMPTY_LINKED_MODIFIER]:"Unexpected empty linked modifier",[qe.UNEXPECTED_EMPTY_LINKED_KEY]:"Unexpected empty linked key",[qe.UNEXPECTED_LEXICAL_ANALYSIS]:"Unexpected lexical analysis in token: '{0}'",[qe.UNHANDLED_CODEGEN_NODE_TYPE]:"unhandled codegen node type: '{0}'",[qe.UNHANDLED_MINIFIER_NODE_TYPE]:"unhandled mimifier node type: '{0}'"};function bo(t,e,r={}){const{domain:n,messages:i,args:s}=r,o=yS((i||VM)[t]||"",...s||[]),f=new SyntaxError(String(o));return f.code=t,e&&(f.location=e),f.domain=n,f}function FM(t){throw t}const xi=" ",HM="\r",kr=`
-`,WM="\u2028",XM="\u2029";function jM(t){const e=t;let r=0,n=1,i=1,s=0;const o=k=>e[k]===HM&&e[k+1]===kr,f=k=>e[k]===kr,c=k=>e[k]===XM,d=k=>e[k]===WM,p=k=>o(k)||f(k)||c(k)||d(k),E=()=>r,m=()=>n,g=()=>i,_=()=>s,b=k=>o(k)||c(k)||d(k)?kr:e[k],x=()=>b(r),S=()=>b(r+s);function y(){return s=0,p(r)&&(n++,i=0),o(r)&&r++,r++,i++,e[r]}function v(){return o(r+s)&&s++,s++,e[r+s]}function R(){r=0,n=1,i=1,s=0}function w(k=0){s=k}function M(){const k=r+s;for(;k!==r;)y();s=0}return{index:E,line:m,column:g,peekOffset:_,charAt:b,currentChar:x,currentPeek:S,next:y,peek:v,reset:R,resetPeek:w,skipToPeek:M}}const Ji=void 0,zM=".",jT="'",qM="tokenizer";function YM(t,e={}){const r=e.location!==!1,n=jM(t),i=()=>n.index(),s=()=>MM(n.line(),n.column(),n.index()),o=s(),f=i(),c={currentType:14,offset:f,startLoc:o,endLoc:o,lastType:14,lastOffset:f,lastStartLoc:o,lastEndLoc:o,braceNest:0,inLinked:!1,text:""},d=()=>c,{onError:p}=e;function E(N,U,q,...ge){const ye=d();if(U.column+=q,U.offset+=q,p){const Re=r?Uf(ye.startLoc,U):null,se=bo(N,Re,{domain:qM,args:ge});p(se)}}function m(N,U,q){N.endLoc=s(),N.currentType=U;const ge={type:U};return r&&(ge.loc=Uf(N.startLoc,N.endLoc)),q!=null&&(ge.value=q),ge}const g=N=>m(N,14);function _(N,U){return N.currentChar()===U?(N.next(),U):(E(qe.EXPECTED_TOKEN,s(),0,U),"")}function b(N){let U="";for(;N.currentPeek()===xi||N.currentPeek()===kr;)U+=N.currentPeek(),N.peek();return U}function x(N){const U=b(N);return N.skipToPeek(),U}function S(N){if(N===Ji)return!1;const U=N.charCodeAt(0);return U>=97&&U<=122||U>=65&&U<=90||U===95}function y(N){if(N===Ji)return!1;const U=N.charCodeAt(0);return U>=48&&U<=57}function v(N,U){const{currentType:q}=U;if(q!==2)return!1;b(N);const ge=S(N.currentPeek());return N.resetPeek(),ge}function R(N,U){const{currentType:q}=U;if(q!==2)return!1;b(N);const ge=N.currentPeek()==="-"?N.peek():N.currentPeek(),ye=y(ge);return N.resetPeek(),ye}function w(N,U){const{currentType:q}=U;if(q!==2)return!1;b(N);const ge=N.currentPeek()===jT;return N.resetPeek(),ge}function M(N,U){const{currentType:q}=U;if(q!==8)return!1;b(N);const ge=N.currentPeek()===".";return N.resetPeek(),ge}function k(N,U){const{currentType:q}=U;if(q!==9)return!1;b(N);const ge=S(N.currentPeek());return N.resetPeek(),ge}function H(N,U){const{currentType:q}=U;if(!(q===8||q===12))return!1;b(N);const ge=N.currentPeek()===":";return N.resetPeek(),ge}function O(N,U){const{currentType:q}=U;if(q!==10)return!1;const ge=()=>{const Re=N.currentPeek();return Re==="{"?S(N.peek()):Re==="@"||Re==="%"||Re==="|"||Re===":"||Re==="."||Re===xi||!Re?!1:Re===kr?(N.peek(),ge()):G(N,!1)},ye=ge();return N.resetPeek(),ye}function z(N){b(N);const U=N.currentPeek()==="|";return N.resetPeek(),U}function ie(N){const U=b(N),q=N.currentPeek()==="%"&&N.peek()==="{";return N.resetPeek(),{isModulo:q,hasSpace:U.length>0}}function G(N,U=!0){const q=(ye=!1,Re="",se=!1)=>{const le=N.currentPeek();return le==="{"?Re==="%"?!1:ye:le==="@"||!le?Re==="%"?!0:ye:le==="%"?(N.peek(),q(ye,"%",!0)):le==="|"?Re==="%"||se?!0:!(Re===xi||Re===kr):le===xi?(N.peek(),q(!0,xi,se)):le===kr?(N.peek(),q(!0,kr,se)):!0},ge=q();return U&&N.resetPeek(),ge}function X(N,U){const q=N.currentChar();return q===Ji?Ji:U(q)?(N.next(),q):null}function ee(N){const U=N.charCodeAt(0);return U>=97&&U<=122||U>=65&&U<=90||U>=48&&U<=57||U===95||U===36}function B(N){return X(N,ee)}function Q(N){const U=N.charCodeAt(0);return U>=97&&U<=122||U>=65&&U<=90||U>=48&&U<=57||U===95||U===36||U===45}function W(N){return X(N,Q)}function j(N){const U=N.charCodeAt(0);return U>=48&&U<=57}function ue(N){return X(N,j)}function ve(N){const U=N.charCodeAt(0);return U>=48&&U<=57||U>=65&&U<=70||U>=97&&U<=102}function ae(N){return X(N,ve)}function he(N){let U="",q="";for(;U=ue(N);)q+=U;return q}function Se(N){x(N);const U=N.currentChar();return U!=="%"&&E(qe.EXPECTED_TOKEN,s(),0,U),N.next(),"%"}function He(N){let U="";for(;;){const q=N.currentChar();if(q==="{"||q==="}"||q==="@"||q==="|"||!q)break;if(q==="%")if(G(N))U+=q,N.next();else break;else if(q===xi||q===kr)if(G(N))U+=q,N.next();else{if(z(N))break;U+=q,N.next()}else U+=q,N.next()}return U}function Ie(N){x(N);let U="",q="";for(;U=W(N);)q+=U;return N.currentChar()===Ji&&E(qe.UNTERMINATED_CLOSING_BRACE,s(),0),q}function $e(N){x(N);let U="";return N.currentChar()==="-"?(N.next(),U+=`-${he(N)}`):U+=he(N),N.currentChar()===Ji&&E(qe.UNTERMINATED_CLOSING_BRACE,s(),0),U}function nt(N){return N!==jT&&N!==kr}function Fe(N){x(N),_(N,"'");let U="",q="";for(;U=X(N,nt);)U==="\\"?q+=ot(N):q+=U;const ge=N.currentChar();return ge===kr||ge===Ji?(E(qe.UNTERMINATED_SINGLE_QUOTE_IN_PLACEHOLDER,s(),0),ge===kr&&(N.next(),_(N,"'")),q):(_(N,"'"),q)}function ot(N){const U=N.currentChar();switch(U){case"\\":case"'":return N.next(),`\\${U}`;case"u":return et(N,U,4);case"U":return et(N,U,6);default:return E(qe.UNKNOWN_ESCAPE_SEQUENCE,s(),0,U),""}}function et(N,U,q){_(N,U);let ge="";for(let ye=0;ye<q;ye++){const Re=ae(N);if(!Re){E(qe.INVALID_UNICODE_ESCAPE_SEQUENCE,s(),0,`\\${U}${ge}${N.currentChar()}`);break}ge+=Re}return`\\${U}${ge}`}function xt(N){return N!=="{"&&N!=="}"&&N!==xi&&N!==kr}function zt(N){x(N);let U="",q="";for(;U=X(N,xt);)q+=U;return q}function V(N){let U="",q="";for(;U=B(N);)q+=U;return q}function P(N){const U=q=>{const ge=N.currentChar();return ge==="{"||ge==="%"||ge==="@"||ge==="|"||ge==="("||ge===")"||!ge||ge===xi?q:(q+=ge,N.next(),U(q))};return U("")}function re(N){x(N);const U=_(N,"|");return x(N),U}function me(N,U){let q=null;switch(N.currentChar()){case"{":return U.braceNest>=1&&E(qe.NOT_ALLOW_NEST_PLACEHOLDER,s(),0),N.next(),q=m(U,2,"{"),x(N),U.braceNest++,q;case"}":return U.braceNest>0&&U.currentType===2&&E(qe.EMPTY_PLACEHOLDER,s(),0),N.next(),q=m(U,3,"}"),U.braceNest--,U.braceNest>0&&x(N),U.inLinked&&U.braceNest===0&&(U.inLinked=!1),q;case"@":return U.braceNest>0&&E(qe.UNTERMINATED_CLOSING_BRACE,s(),0),q=pe(N,U)||g(U),U.braceNest=0,q;default:{let ye=!0,Re=!0,se=!0;if(z(N))return U.braceNest>0&&E(qe.UNTERMINATED_CLOSING_BRACE,s(),0),q=m(U,1,re(N)),U.braceNest=0,U.inLinked=!1,q;if(U.braceNest>0&&(U.currentType===5||U.currentType===6||U.currentType===7))return E(qe.UNTERMINATED_CLOSING_BRACE,s(),0),U.braceNest=0,be(N,U);if(ye=v(N,U))return q=m(U,5,Ie(N)),x(N),q;if(Re=R(N,U))return q=m(U,6,$e(N)),x(N),q;if(se=w(N,U))return q=m(U,7,Fe(N)),x(N),q;if(!ye&&!Re&&!se)return q=m(U,13,zt(N)),E(qe.INVALID_TOKEN_IN_PLACEHOLDER,s(),0,q.value),x(N),q;break}}return q}function pe(N,U){const{currentType:q}=U;let ge=null;const ye=N.currentChar();switch((q===8||q===9||q===12||q===10)&&(ye===kr||ye===xi)&&E(qe.INVALID_LINKED_FORMAT,s(),0),ye){case"@":return N.next(),ge=m(U,8,"@"),U.inLinked=!0,ge;case".":return x(N),N.next(),m(U,9,".");case":":return x(N),N.next(),m(U,10,":");default:return z(N)?(ge=m(U,1,re(N)),U.braceNest=0,U.inLinked=!1,ge):M(N,U)||H(N,U)?(x(N),pe(N,U)):k(N,U)?(x(N),m(U,12,V(N))):O(N,U)?(x(N),ye==="{"?me(N,U)||ge:m(U,11,P(N))):(q===8&&E(qe.INVALID_LINKED_FORMAT,s(),0),U.braceNest=0,U.inLinked=!1,be(N,U))}}function be(N,U){let q={type:14};if(U.braceNest>0)return me(N,U)||g(U);if(U.inLinked)return pe(N,U)||g(U);switch(N.currentChar()){case"{":return me(N,U)||g(U);case"}":return E(qe.UNBALANCED_CLOSING_BRACE,s(),0),N.next(),m(U,3,"}");case"@":return pe(N,U)||g(U);default:{if(z(N))return q=m(U,1,re(N)),U.braceNest=0,U.inLinked=!1,q;const{isModulo:ye,hasSpace:Re}=ie(N);if(ye)return Re?m(U,0,He(N)):m(U,4,Se(N));if(G(N))return m(U,0,He(N));break}}return q}function xe(){const{currentType:N,offset:U,startLoc:q,endLoc:ge}=c;return c.lastType=N,c.lastOffset=U,c.lastStartLoc=q,c.lastEndLoc=ge,c.offset=i(),c.startLoc=s(),n.currentChar()===Ji?m(c,14):be(n,c)}return{nextToken:xe,currentOffset:i,currentPosition:s,context:d}}const JM="parser",QM=/(?:\\\\|\\'|\\u([0-9a-fA-F]{4})|\\U([0-9a-fA-F]{6}))/g;function ZM(t,e,r){switch(t){case"\\\\":return"\\";case"\\'":return"'";default:{const n=parseInt(e||r,16);return n<=55295||n>=57344?String.fromCodePoint(n):"�"}}}function e$(t={}){const e=t.location!==!1,{onError:r,onWarn:n}=t;function i(v,R,w,M,...k){const H=v.currentPosition();if(H.offset+=M,H.column+=M,r){const O=e?Uf(w,H):null,z=bo(R,O,{domain:JM,args:k});r(z)}}function s(v,R,w,M,...k){const H=v.currentPosition();if(H.offset+=M,H.column+=M,n){const O=e?Uf(w,H):null;n(GM(R,O,k))}}function o(v,R,w){const M={type:v};return e&&(M.start=R,M.end=R,M.loc={start:w,end:w}),M}function f(v,R,w,M){e&&(v.end=R,v.loc&&(v.loc.end=w))}function c(v,R){const w=v.context(),M=o(3,w.offset,w.startLoc);return M.value=R,f(M,v.currentOffset(),v.currentPosition()),M}function d(v,R){const w=v.context(),{lastOffset:M,lastStartLoc:k}=w,H=o(5,M,k);return H.index=parseInt(R,10),v.nextToken(),f(H,v.currentOffset(),v.currentPosition()),H}function p(v,R,w){const M=v.context(),{lastOffset:k,lastStartLoc:H}=M,O=o(4,k,H);return O.key=R,w===!0&&(O.modulo=!0),v.nextToken(),f(O,v.currentOffset(),v.currentPosition()),O}function E(v,R){const w=v.context(),{lastOffset:M,lastStartLoc:k}=w,H=o(9,M,k);return H.value=R.replace(QM,ZM),v.nextToken(),f(H,v.currentOffset(),v.currentPosition()),H}function m(v){const R=v.nextToken(),w=v.context(),{lastOffset:M,lastStartLoc:k}=w,H=o(8,M,k);return R.type!==12?(i(v,qe.UNEXPECTED_EMPTY_LINKED_MODIFIER,w.lastStartLoc,0),H.value="",f(H,M,k),{nextConsumeToken:R,node:H}):(R.value==null&&i(v,qe.UNEXPECTED_LEXICAL_ANALYSIS,w.lastStartLoc,0,Pn(R)),H.value=R.value||"",f(H,v.currentOffset(),v.currentPosition()),{node:H})}function g(v,R){const w=v.context(),M=o(7,w.offset,w.startLoc);return M.value=R,f(M,v.currentOffset(),v.currentPosition()),M}function _(v){const R=v.context(),w=o(6,R.offset,R.startLoc);let M=v.nextToken();if(M.type===9){const k=m(v);w.modifier=k.node,M=k.nextConsumeToken||v.nextToken()}switch(M.type!==10&&i(v,qe.UNEXPECTED_LEXICAL_ANALYSIS,R.lastStartLoc,0,Pn(M)),M=v.nextToken(),M.type===2&&(M=v.nextToken()),M.type){case 11:M.value==null&&i(v,qe.UNEXPECTED_LEXICAL_ANALYSIS,R.lastStartLoc,0,Pn(M)),w.key=g(v,M.value||"");break;case 5:M.value==null&&i(v,qe.UNEXPECTED_LEXICAL_ANALYSIS,R.lastStartLoc,0,Pn(M)),w.key=p(v,M.value||"");break;case 6:M.value==null&&i(v,qe.UNEXPECTED_LEXICAL_ANALYSIS,R.lastStartLoc,0,Pn(M)),w.key=d(v,M.value||"");break;case 7:M.value==null&&i(v,qe.UNEXPECTED_LEXICAL_ANALYSIS,R.lastStartLoc,0,Pn(M)),w.key=E(v,M.value||"");break;default:{i(v,qe.UNEXPECTED_EMPTY_LINKED_KEY,R.lastStartLoc,0);const k=v.context(),H=o(7,k.offset,k.startLoc);return H.value="",f(H,k.offset,k.startLoc),w.key=H,f(w,k.offset,k.startLoc),{nextConsumeToken:M,node:w}}}return f(w,v.currentOffset(),v.currentPosition()),{node:w}}function b(v){const R=v.context(),w=R.currentType===1?v.currentOffset():R.offset,M=R.currentType===1?R.endLoc:R.startLoc,k=o(2,w,M);k.items=[];let H=null,O=null;do{const G=H||v.nextToken();switch(H=null,G.type){case 0:G.value==null&&i(v,qe.UNEXPECTED_LEXICAL_ANALYSIS,R.lastStartLoc,0,Pn(G)),k.items.push(c(v,G.value||""));break;case 6:G.value==null&&i(v,qe.UNEXPECTED_LEXICAL_ANALYSIS,R.lastStartLoc,0,Pn(G)),k.items.push(d(v,G.value||""));break;case 4:O=!0;break;case 5:G.value==null&&i(v,qe.UNEXPECTED_LEXICAL_ANALYSIS,R.lastStartLoc,0,Pn(G)),k.items.push(p(v,G.value||"",!!O)),O&&(s(v,jE.USE_MODULO_SYNTAX,R.lastStartLoc,0,Pn(G)),O=null);break;case 7:G.value==null&&i(v,qe.UNEXPECTED_LEXICAL_ANALYSIS,R.lastStartLoc,0,Pn(G)),k.items.push(E(v,G.value||""));break;case 8:{const X=_(v);k.items.push(X.node),H=X.nextConsumeToken||null;break}}}while(R.currentType!==14&&R.currentType!==1);const z=R.currentType===1?R.lastOffset:v.currentOffset(),ie=R.currentType===1?R.lastEndLoc:v.currentPosition();return f(k,z,ie),k}function x(v,R,w,M){const k=v.context();let H=M.items.length===0;const O=o(1,R,w);O.cases=[],O.cases.push(M);do{const z=b(v);H||(H=z.items.length===0),O.cases.push(z)}while(k.currentType!==14);return H&&i(v,qe.MUST_HAVE_MESSAGES_IN_PLURAL,w,0),f(O,v.currentOffset(),v.currentPosition()),O}function S(v){const R=v.context(),{offset:w,startLoc:M}=R,k=b(v);return R.currentType===14?k:x(v,w,M,k)}function y(v){const R=YM(v,AS({},t)),w=R.context(),M=o(0,w.offset,w.startLoc);return e&&M.loc&&(M.loc.source=v),M.body=S(R),t.onCacheKey&&(M.cacheKey=t.onCacheKey(v)),w.currentType!==14&&i(R,qe.UNEXPECTED_LEXICAL_ANALYSIS,w.lastStartLoc,0,v[w.offset]||""),f(M,R.currentOffset(),R.currentPosition()),M}return{parse:y}}function Pn(t){if(t.type===14)return"EOF";const e=(t.value||"").replace(/\r?\n/gu,"\\n");return e.length>10?e.slice(0,9)+"…":e}function t$(t,e={}){const r={ast:t,helpers:new Set};return{context:()=>r,helper:s=>(r.helpers.add(s),s)}}function zT(t,e){for(let r=0;r<t.length;r++)zE(t[r],e)}function zE(t,e){switch(t.type){case 1:zT(t.cases,e),e.helper("plural");break;case 2:zT(t.items,e);break;case 6:{zE(t.key,e),e.helper("linked"),e.helper("type");break}case 5:e.helper("interpolate"),e.helper("list");break;case 4:e.helper("interpolate"),e.helper("named");break}}function r$(t,e={}){const r=t$(t);r.helper("normalize"),t.body&&zE(t.body,r);const n=r.context();t.helpers=Array.from(n.helpers)}function n$(t){const e=t.body;return e.type===2?qT(e):e.cases.forEach(r=>qT(r)),t}function qT(t){if(t.items.length===1){const e=t.items[0];(e.type===3||e.type===9)&&(t.static=e.value,delete e.value)}else{const e=[];for(let r=0;r<t.items.length;r++){const n=t.items[r];if(!(n.type===3||n.type===9)||n.value==null)break;e.push(n.value)}if(e.length===t.items.length){t.static=LS(e);for(let r=0;r<t.items.length;r++){const n=t.items[r];(n.type===3||n.type===9)&&delete n.value}}}}const i$="minifier";function Ma(t){switch(t.t=t.type,t.type){case 0:{const e=t;Ma(e.body),e.b=e.body,delete e.body;break}case 1:{const e=t,r=e.cases;for(let n=0;n<r.length;n++)Ma(r[n]);e.c=r,delete e.cases;break}case 2:{const e=t,r=e.items;for(let n=0;n<r.length;n++)Ma(r[n]);e.i=r,delete e.items,e.static&&(e.s=e.static,delete e.static);break}case 3:case 9:case 8:case 7:{const e=t;e.value&&(e.v=e.value,delete e.value);break}case 6:{const e=t;Ma(e.key),e.k=e.key,delete e.key,e.modifier&&(Ma(e.modifier),e.m=e.modifier,delete e.modifier);break}case 5:{const e=t;e.i=e.index,delete e.index;break}case 4:{const e=t;e.k=e.key,delete e.key;break}default:throw bo(qe.UNHANDLED_MINIFIER_NODE_TYPE,null,{domain:i$,args:[t.type]})}delete t.type}const s$="parser";function a$(t,e){const{filename:r,breakLineCode:n,needIndent:i}=e,s=e.location!==!1,o={filename:r,code:"",column:1,line:1,offset:0,map:void 0,breakLineCode:n,needIndent:i,indentLevel:0};s&&t.loc&&(o.source=t.loc.source);const f=()=>o;function c(b,x){o.code+=b}function d(b,x=!0){const S=x?n:"";c(i?S+"  ".repeat(b):S)}function p(b=!0){const x=++o.indentLevel;b&&d(x)}function E(b=!0){const x=--o.indentLevel;b&&d(x)}function m(){d(o.indentLevel)}return{context:f,push:c,indent:p,deindent:E,newline:m,helper:b=>`_${b}`,needIndent:()=>o.needIndent}}function o$(t,e){const{helper:r}=t;t.push(`${r("linked")}(`),lo(t,e.key),e.modifier?(t.push(", "),lo(t,e.modifier),t.push(", _type")):t.push(", undefined, _type"),t.push(")")}function l$(t,e){const{helper:r,needIndent:n}=t;t.push(`${r("normalize")}([`),t.indent(n());const i=e.items.length;for(let s=0;s<i&&(lo(t,e.items[s]),s!==i-1);s++)t.push(", ");t.deindent(n()),t.push("])")}function u$(t,e){const{helper:r,needIndent:n}=t;if(e.cases.length>1){t.push(`${r("plural")}([`),t.indent(n());const i=e.cases.length;for(let s=0;s<i&&(lo(t,e.cases[s]),s!==i-1);s++)t.push(", ");t.deindent(n()),t.push("])")}}function f$(t,e){e.body?lo(t,e.body):t.push("null")}function lo(t,e){const{helper:r}=t;switch(e.type){case 0:f$(t,e);break;case 1:u$(t,e);break;case 2:l$(t,e);break;case 6:o$(t,e);break;case 8:t.push(JSON.stringify(e.value),e);break;case 7:t.push(JSON.stringify(e.value),e);break;case 5:t.push(`${r("interpolate")}(${r("list")}(${e.index}))`,e);break;case 4:t.push(`${r("interpolate")}(${r("named")}(${JSON.stringify(e.key)}))`,e);break;case 9:t.push(JSON.stringify(e.value),e);break;case 3:t.push(JSON.stringify(e.value),e);break;default:throw bo(qe.UNHANDLED_CODEGEN_NODE_TYPE,null,{domain:s$,args:[e.type]})}}const c$=(t,e={})=>{const r=XT(e.mode)?e.mode:"normal",n=XT(e.filename)?e.filename:"message.intl";e.sourceMap;const i=e.breakLineCode!=null?e.breakLineCode:r==="arrow"?";":`
-`,s=e.needIndent?e.needIndent:r!=="arrow",o=t.helpers||[],f=a$(t,{filename:n,breakLineCode:i,needIndent:s});f.push(r==="normal"?"function __msg__ (ctx) {":"(ctx) => {"),f.indent(s),o.length>0&&(f.push(`const { ${LS(o.map(p=>`${p}: _${p}`),", ")} } = ctx`),f.newline()),f.push("return "),lo(f,t),f.deindent(s),f.push("}"),delete t.helpers;const{code:c,map:d}=f.context();return{ast:t,code:c,map:d?d.toJSON():void 0}};function p$(t,e={}){const r=AS({},e),n=!!r.jit,i=!!r.minify,s=r.optimize==null?!0:r.optimize,f=e$(r).parse(t);return n?(s&&n$(f),i&&Ma(f),{ast:f,code:""}):(r$(f,r),c$(f,r))}/*!
-  * core-base v9.14.1
-  * (c) 2024 kazuya kawaguchi
-  * Released under the MIT License.
-  */function d$(){typeof __INTLIFY_JIT_COMPILATION__!="boolean"&&(Nf().__INTLIFY_JIT_COMPILATION__=!1),typeof __INTLIFY_DROP_MESSAGE_COMPILER__!="boolean"&&(Nf().__INTLIFY_DROP_MESSAGE_COMPILER__=!1)}const Rs=[];Rs[0]={w:[0],i:[3,0],"[":[4],o:[7]};Rs[1]={w:[1],".":[2],"[":[4],o:[7]};Rs[2]={w:[2],i:[3,0],0:[3,0]};Rs[3]={i:[3,0],0:[3,0],w:[1,1],".":[2,1],"[":[4,1],o:[7,1]};Rs[4]={"'":[5,0],'"':[6,0],"[":[4,2],"]":[1,3],o:8,l:[4,0]};Rs[5]={"'":[4,0],o:8,l:[5,0]};Rs[6]={'"':[4,0],o:8,l:[6,0]};const h$=/^\s?(?:true|false|-?[\d.]+|'[^']*'|"[^"]*")\s?$/;function E$(t){return h$.test(t)}function m$(t){const e=t.charCodeAt(0),r=t.charCodeAt(t.length-1);return e===r&&(e===34||e===39)?t.slice(1,-1):t}function g$(t){if(t==null)return"o";switch(t.charCodeAt(0)){case 91:case 93:case 46:case 34:case 39:return t;case 95:case 36:case 45:return"i";case 9:case 10:case 13:case 160:case 65279:case 8232:case 8233:return"w"}return"i"}function _$(t){const e=t.trim();return t.charAt(0)==="0"&&isNaN(parseInt(t))?!1:E$(e)?m$(e):"*"+e}function T$(t){const e=[];let r=-1,n=0,i=0,s,o,f,c,d,p,E;const m=[];m[0]=()=>{o===void 0?o=f:o+=f},m[1]=()=>{o!==void 0&&(e.push(o),o=void 0)},m[2]=()=>{m[0](),i++},m[3]=()=>{if(i>0)i--,n=4,m[0]();else{if(i=0,o===void 0||(o=_$(o),o===!1))return!1;m[1]()}};function g(){const _=t[r+1];if(n===5&&_==="'"||n===6&&_==='"')return r++,f="\\"+_,m[0](),!0}for(;n!==null;)if(r++,s=t[r],!(s==="\\"&&g())){if(c=g$(s),E=Rs[n],d=E[c]||E.l||8,d===8||(n=d[0],d[1]!==void 0&&(p=m[d[1]],p&&(f=s,p()===!1))))return;if(n===7)return e}}const YT=new Map;function v$(t,e){return yt(t)?t[e]:null}function b$(t,e){if(!yt(t))return null;let r=YT.get(e);if(r||(r=T$(e),r&&YT.set(e,r)),!r)return null;const n=r.length;let i=t,s=0;for(;s<n;){const o=i[r[s]];if(o===void 0||Ft(i))return null;i=o,s++}return i}const x$=t=>t,R$=t=>"",S$="text",y$=t=>t.length===0?"":DM(t),A$=UM;function JT(t,e){return t=Math.abs(t),e===2?t?t>1?1:0:1:t?Math.min(t,2):0}function L$(t){const e=pr(t.pluralIndex)?t.pluralIndex:-1;return t.named&&(pr(t.named.count)||pr(t.named.n))?pr(t.named.count)?t.named.count:pr(t.named.n)?t.named.n:e:e}function C$(t,e){e.count||(e.count=t),e.n||(e.n=t)}function w$(t={}){const e=t.locale,r=L$(t),n=yt(t.pluralRules)&&Ue(e)&&Ft(t.pluralRules[e])?t.pluralRules[e]:JT,i=yt(t.pluralRules)&&Ue(e)&&Ft(t.pluralRules[e])?JT:void 0,s=S=>S[n(r,S.length,i)],o=t.list||[],f=S=>o[S],c=t.named||{};pr(t.pluralIndex)&&C$(r,c);const d=S=>c[S];function p(S){const y=Ft(t.messages)?t.messages(S):yt(t.messages)?t.messages[S]:!1;return y||(t.parent?t.parent.message(S):R$)}const E=S=>t.modifiers?t.modifiers[S]:x$,m=Ze(t.processor)&&Ft(t.processor.normalize)?t.processor.normalize:y$,g=Ze(t.processor)&&Ft(t.processor.interpolate)?t.processor.interpolate:A$,_=Ze(t.processor)&&Ue(t.processor.type)?t.processor.type:S$,x={list:f,named:d,plural:s,linked:(S,...y)=>{const[v,R]=y;let w="text",M="";y.length===1?yt(v)?(M=v.modifier||M,w=v.type||w):Ue(v)&&(M=v||M):y.length===2&&(Ue(v)&&(M=v||M),Ue(R)&&(w=R||w));const k=p(S)(x),H=w==="vnode"&&Xt(k)&&M?k[0]:k;return M?E(M)(H,w):H},message:p,type:_,interpolate:g,normalize:m,values:Pr({},o,c)};return x}const O$=jE.__EXTEND_POINT__,Gs=_c(O$),I$={FALLBACK_TO_TRANSLATE:Gs(),CANNOT_FORMAT_NUMBER:Gs(),FALLBACK_TO_NUMBER_FORMAT:Gs(),CANNOT_FORMAT_DATE:Gs(),FALLBACK_TO_DATE_FORMAT:Gs(),EXPERIMENTAL_CUSTOM_MESSAGE_COMPILER:Gs(),__EXTEND_POINT__:Gs()},CS=qe.__EXTEND_POINT__,Vs=_c(CS),$n={INVALID_ARGUMENT:CS,INVALID_DATE_ARGUMENT:Vs(),INVALID_ISO_DATE_ARGUMENT:Vs(),NOT_SUPPORT_NON_STRING_MESSAGE:Vs(),NOT_SUPPORT_LOCALE_PROMISE_VALUE:Vs(),NOT_SUPPORT_LOCALE_ASYNC_FUNCTION:Vs(),NOT_SUPPORT_LOCALE_TYPE:Vs(),__EXTEND_POINT__:Vs()};function ri(t){return bo(t,null,void 0)}function qE(t,e){return e.locale!=null?QT(e.locale):QT(t.locale)}let gd;function QT(t){if(Ue(t))return t;if(Ft(t)){if(t.resolvedOnce&&gd!=null)return gd;if(t.constructor.name==="Function"){const e=t();if(PM(e))throw ri($n.NOT_SUPPORT_LOCALE_PROMISE_VALUE);return gd=e}else throw ri($n.NOT_SUPPORT_LOCALE_ASYNC_FUNCTION)}else throw ri($n.NOT_SUPPORT_LOCALE_TYPE)}function N$(t,e,r){return[...new Set([r,...Xt(e)?e:yt(e)?Object.keys(e):Ue(e)?[e]:[r]])]}function wS(t,e,r){const n=Ue(r)?r:uo,i=t;i.__localeChainCache||(i.__localeChainCache=new Map);let s=i.__localeChainCache.get(n);if(!s){s=[];let o=[r];for(;Xt(o);)o=ZT(s,o,e);const f=Xt(e)||!Ze(e)?e:e.default?e.default:null;o=Ue(f)?[f]:f,Xt(o)&&ZT(s,o,!1),i.__localeChainCache.set(n,s)}return s}function ZT(t,e,r){let n=!0;for(let i=0;i<e.length&&ct(n);i++){const s=e[i];Ue(s)&&(n=P$(t,e[i],r))}return n}function P$(t,e,r){let n;const i=e.split("-");do{const s=i.join("-");n=U$(t,s,r),i.splice(-1,1)}while(i.length&&n===!0);return n}function U$(t,e,r){let n=!1;if(!t.includes(e)&&(n=!0,e)){n=e[e.length-1]!=="!";const i=e.replace(/!/g,"");t.push(i),(Xt(r)||Ze(r))&&r[i]&&(n=r[i])}return n}const D$="9.14.1",Tc=-1,uo="en-US",ev="",tv=t=>`${t.charAt(0).toLocaleUpperCase()}${t.substr(1)}`;function B$(){return{upper:(t,e)=>e==="text"&&Ue(t)?t.toUpperCase():e==="vnode"&&yt(t)&&"__v_isVNode"in t?t.children.toUpperCase():t,lower:(t,e)=>e==="text"&&Ue(t)?t.toLowerCase():e==="vnode"&&yt(t)&&"__v_isVNode"in t?t.children.toLowerCase():t,capitalize:(t,e)=>e==="text"&&Ue(t)?tv(t):e==="vnode"&&yt(t)&&"__v_isVNode"in t?tv(t.children):t}}let OS;function rv(t){OS=t}let IS;function M$(t){IS=t}let NS;function $$(t){NS=t}let PS=null;const nv=t=>{PS=t},K$=()=>PS;let iv=0;function k$(t={}){const e=Ft(t.onWarn)?t.onWarn:BM,r=Ue(t.version)?t.version:D$,n=Ue(t.locale)||Ft(t.locale)?t.locale:uo,i=Ft(n)?uo:n,s=Xt(t.fallbackLocale)||Ze(t.fallbackLocale)||Ue(t.fallbackLocale)||t.fallbackLocale===!1?t.fallbackLocale:i,o=Ze(t.messages)?t.messages:{[i]:{}},f=Ze(t.datetimeFormats)?t.datetimeFormats:{[i]:{}},c=Ze(t.numberFormats)?t.numberFormats:{[i]:{}},d=Pr({},t.modifiers||{},B$()),p=t.pluralRules||{},E=Ft(t.missing)?t.missing:null,m=ct(t.missingWarn)||gs(t.missingWarn)?t.missingWarn:!0,g=ct(t.fallbackWarn)||gs(t.fallbackWarn)?t.fallbackWarn:!0,_=!!t.fallbackFormat,b=!!t.unresolving,x=Ft(t.postTranslation)?t.postTranslation:null,S=Ze(t.processor)?t.processor:null,y=ct(t.warnHtmlMessage)?t.warnHtmlMessage:!0,v=!!t.escapeParameter,R=Ft(t.messageCompiler)?t.messageCompiler:OS,w=Ft(t.messageResolver)?t.messageResolver:IS||v$,M=Ft(t.localeFallbacker)?t.localeFallbacker:NS||N$,k=yt(t.fallbackContext)?t.fallbackContext:void 0,H=t,O=yt(H.__datetimeFormatters)?H.__datetimeFormatters:new Map,z=yt(H.__numberFormatters)?H.__numberFormatters:new Map,ie=yt(H.__meta)?H.__meta:{};iv++;const G={version:r,cid:iv,locale:n,fallbackLocale:s,messages:o,modifiers:d,pluralRules:p,missing:E,missingWarn:m,fallbackWarn:g,fallbackFormat:_,unresolving:b,postTranslation:x,processor:S,warnHtmlMessage:y,escapeParameter:v,messageCompiler:R,messageResolver:w,localeFallbacker:M,fallbackContext:k,onWarn:e,__meta:ie};return G.datetimeFormats=f,G.numberFormats=c,G.__datetimeFormatters=O,G.__numberFormatters=z,G}function YE(t,e,r,n,i){const{missing:s,onWarn:o}=t;if(s!==null){const f=s(t,r,e,i);return Ue(f)?f:e}else return e}function Qo(t,e,r){const n=t;n.__localeChainCache=new Map,t.localeFallbacker(t,r,e)}function G$(t,e){return t===e?!1:t.split("-")[0]===e.split("-")[0]}function V$(t,e){const r=e.indexOf(t);if(r===-1)return!1;for(let n=r+1;n<e.length;n++)if(G$(t,e[n]))return!0;return!1}function _d(t){return r=>F$(r,t)}function F$(t,e){const r=e.b||e.body;if((r.t||r.type)===1){const n=r,i=n.c||n.cases;return t.plural(i.reduce((s,o)=>[...s,sv(t,o)],[]))}else return sv(t,r)}function sv(t,e){const r=e.s||e.static;if(r)return t.type==="text"?r:t.normalize([r]);{const n=(e.i||e.items).reduce((i,s)=>[...i,Ih(t,s)],[]);return t.normalize(n)}}function Ih(t,e){const r=e.t||e.type;switch(r){case 3:{const n=e;return n.v||n.value}case 9:{const n=e;return n.v||n.value}case 4:{const n=e;return t.interpolate(t.named(n.k||n.key))}case 5:{const n=e;return t.interpolate(t.list(n.i!=null?n.i:n.index))}case 6:{const n=e,i=n.m||n.modifier;return t.linked(Ih(t,n.k||n.key),i?Ih(t,i):void 0,t.type)}case 7:{const n=e;return n.v||n.value}case 8:{const n=e;return n.v||n.value}default:throw new Error(`unhandled node type on format message part: ${r}`)}}const US=t=>t;let ka=Object.create(null);const fo=t=>yt(t)&&(t.t===0||t.type===0)&&("b"in t||"body"in t);function DS(t,e={}){let r=!1;const n=e.onError||FM;return e.onError=i=>{r=!0,n(i)},{...p$(t,e),detectError:r}}const H$=(t,e)=>{if(!Ue(t))throw ri($n.NOT_SUPPORT_NON_STRING_MESSAGE);{ct(e.warnHtmlMessage)&&e.warnHtmlMessage;const n=(e.onCacheKey||US)(t),i=ka[n];if(i)return i;const{code:s,detectError:o}=DS(t,e),f=new Function(`return ${s}`)();return o?f:ka[n]=f}};function W$(t,e){if(__INTLIFY_JIT_COMPILATION__&&!__INTLIFY_DROP_MESSAGE_COMPILER__&&Ue(t)){ct(e.warnHtmlMessage)&&e.warnHtmlMessage;const n=(e.onCacheKey||US)(t),i=ka[n];if(i)return i;const{ast:s,detectError:o}=DS(t,{...e,location:!1,jit:!0}),f=_d(s);return o?f:ka[n]=f}else{const r=t.cacheKey;if(r){const n=ka[r];return n||(ka[r]=_d(t))}else return _d(t)}}const av=()=>"",Pi=t=>Ft(t);function ov(t,...e){const{fallbackFormat:r,postTranslation:n,unresolving:i,messageCompiler:s,fallbackLocale:o,messages:f}=t,[c,d]=Nh(...e),p=ct(d.missingWarn)?d.missingWarn:t.missingWarn,E=ct(d.fallbackWarn)?d.fallbackWarn:t.fallbackWarn,m=ct(d.escapeParameter)?d.escapeParameter:t.escapeParameter,g=!!d.resolvedMessage,_=Ue(d.default)||ct(d.default)?ct(d.default)?s?c:()=>c:d.default:r?s?c:()=>c:"",b=r||_!=="",x=qE(t,d);m&&X$(d);let[S,y,v]=g?[c,x,f[x]||{}]:BS(t,c,x,o,E,p),R=S,w=c;if(!g&&!(Ue(R)||fo(R)||Pi(R))&&b&&(R=_,w=R),!g&&(!(Ue(R)||fo(R)||Pi(R))||!Ue(y)))return i?Tc:c;let M=!1;const k=()=>{M=!0},H=Pi(R)?R:MS(t,c,y,R,w,k);if(M)return R;const O=q$(t,y,v,d),z=w$(O),ie=j$(t,H,z);return n?n(ie,c):ie}function X$(t){Xt(t.list)?t.list=t.list.map(e=>Ue(e)?WT(e):e):yt(t.named)&&Object.keys(t.named).forEach(e=>{Ue(t.named[e])&&(t.named[e]=WT(t.named[e]))})}function BS(t,e,r,n,i,s){const{messages:o,onWarn:f,messageResolver:c,localeFallbacker:d}=t,p=d(t,n,r);let E={},m,g=null;const _="translate";for(let b=0;b<p.length&&(m=p[b],E=o[m]||{},(g=c(E,e))===null&&(g=E[e]),!(Ue(g)||fo(g)||Pi(g)));b++)if(!V$(m,p)){const x=YE(t,e,m,s,_);x!==e&&(g=x)}return[g,m,E]}function MS(t,e,r,n,i,s){const{messageCompiler:o,warnHtmlMessage:f}=t;if(Pi(n)){const d=n;return d.locale=d.locale||r,d.key=d.key||e,d}if(o==null){const d=()=>n;return d.locale=r,d.key=e,d}const c=o(n,z$(t,r,i,n,f,s));return c.locale=r,c.key=e,c.source=n,c}function j$(t,e,r){return e(r)}function Nh(...t){const[e,r,n]=t,i={};if(!Ue(e)&&!pr(e)&&!Pi(e)&&!fo(e))throw ri($n.INVALID_ARGUMENT);const s=pr(e)?String(e):(Pi(e),e);return pr(r)?i.plural=r:Ue(r)?i.default=r:Ze(r)&&!gc(r)?i.named=r:Xt(r)&&(i.list=r),pr(n)?i.plural=n:Ue(n)?i.default=n:Ze(n)&&Pr(i,n),[s,i]}function z$(t,e,r,n,i,s){return{locale:e,key:r,warnHtmlMessage:i,onError:o=>{throw s&&s(o),o},onCacheKey:o=>wM(e,r,o)}}function q$(t,e,r,n){const{modifiers:i,pluralRules:s,messageResolver:o,fallbackLocale:f,fallbackWarn:c,missingWarn:d,fallbackContext:p}=t,m={locale:e,modifiers:i,pluralRules:s,messages:g=>{let _=o(r,g);if(_==null&&p){const[,,b]=BS(p,g,e,f,c,d);_=o(b,g)}if(Ue(_)||fo(_)){let b=!1;const S=MS(t,g,e,_,g,()=>{b=!0});return b?av:S}else return Pi(_)?_:av}};return t.processor&&(m.processor=t.processor),n.list&&(m.list=n.list),n.named&&(m.named=n.named),pr(n.plural)&&(m.pluralIndex=n.plural),m}function lv(t,...e){const{datetimeFormats:r,unresolving:n,fallbackLocale:i,onWarn:s,localeFallbacker:o}=t,{__datetimeFormatters:f}=t,[c,d,p,E]=Ph(...e),m=ct(p.missingWarn)?p.missingWarn:t.missingWarn;ct(p.fallbackWarn)?p.fallbackWarn:t.fallbackWarn;const g=!!p.part,_=qE(t,p),b=o(t,i,_);if(!Ue(c)||c==="")return new Intl.DateTimeFormat(_,E).format(d);let x={},S,y=null;const v="datetime format";for(let M=0;M<b.length&&(S=b[M],x=r[S]||{},y=x[c],!Ze(y));M++)YE(t,c,S,m,v);if(!Ze(y)||!Ue(S))return n?Tc:c;let R=`${S}__${c}`;gc(E)||(R=`${R}__${JSON.stringify(E)}`);let w=f.get(R);return w||(w=new Intl.DateTimeFormat(S,Pr({},y,E)),f.set(R,w)),g?w.formatToParts(d):w.format(d)}const $S=["localeMatcher","weekday","era","year","month","day","hour","minute","second","timeZoneName","formatMatcher","hour12","timeZone","dateStyle","timeStyle","calendar","dayPeriod","numberingSystem","hourCycle","fractionalSecondDigits"];function Ph(...t){const[e,r,n,i]=t,s={};let o={},f;if(Ue(e)){const c=e.match(/(\d{4}-\d{2}-\d{2})(T|\s)?(.*)/);if(!c)throw ri($n.INVALID_ISO_DATE_ARGUMENT);const d=c[3]?c[3].trim().startsWith("T")?`${c[1].trim()}${c[3].trim()}`:`${c[1].trim()}T${c[3].trim()}`:c[1].trim();f=new Date(d);try{f.toISOString()}catch{throw ri($n.INVALID_ISO_DATE_ARGUMENT)}}else if(IM(e)){if(isNaN(e.getTime()))throw ri($n.INVALID_DATE_ARGUMENT);f=e}else if(pr(e))f=e;else throw ri($n.INVALID_ARGUMENT);return Ue(r)?s.key=r:Ze(r)&&Object.keys(r).forEach(c=>{$S.includes(c)?o[c]=r[c]:s[c]=r[c]}),Ue(n)?s.locale=n:Ze(n)&&(o=n),Ze(i)&&(o=i),[s.key||"",f,s,o]}function uv(t,e,r){const n=t;for(const i in r){const s=`${e}__${i}`;n.__datetimeFormatters.has(s)&&n.__datetimeFormatters.delete(s)}}function fv(t,...e){const{numberFormats:r,unresolving:n,fallbackLocale:i,onWarn:s,localeFallbacker:o}=t,{__numberFormatters:f}=t,[c,d,p,E]=Uh(...e),m=ct(p.missingWarn)?p.missingWarn:t.missingWarn;ct(p.fallbackWarn)?p.fallbackWarn:t.fallbackWarn;const g=!!p.part,_=qE(t,p),b=o(t,i,_);if(!Ue(c)||c==="")return new Intl.NumberFormat(_,E).format(d);let x={},S,y=null;const v="number format";for(let M=0;M<b.length&&(S=b[M],x=r[S]||{},y=x[c],!Ze(y));M++)YE(t,c,S,m,v);if(!Ze(y)||!Ue(S))return n?Tc:c;let R=`${S}__${c}`;gc(E)||(R=`${R}__${JSON.stringify(E)}`);let w=f.get(R);return w||(w=new Intl.NumberFormat(S,Pr({},y,E)),f.set(R,w)),g?w.formatToParts(d):w.format(d)}const KS=["localeMatcher","style","currency","currencyDisplay","currencySign","useGrouping","minimumIntegerDigits","minimumFractionDigits","maximumFractionDigits","minimumSignificantDigits","maximumSignificantDigits","compactDisplay","notation","signDisplay","unit","unitDisplay","roundingMode","roundingPriority","roundingIncrement","trailingZeroDisplay"];function Uh(...t){const[e,r,n,i]=t,s={};let o={};if(!pr(e))throw ri($n.INVALID_ARGUMENT);const f=e;return Ue(r)?s.key=r:Ze(r)&&Object.keys(r).forEach(c=>{KS.includes(c)?o[c]=r[c]:s[c]=r[c]}),Ue(n)?s.locale=n:Ze(n)&&(o=n),Ze(i)&&(o=i),[s.key||"",f,s,o]}function cv(t,e,r){const n=t;for(const i in r){const s=`${e}__${i}`;n.__numberFormatters.has(s)&&n.__numberFormatters.delete(s)}}d$();/*!
-  * vue-i18n v9.14.1
-  * (c) 2024 kazuya kawaguchi
-  * Released under the MIT License.
-  */const Y$="9.14.1";function J$(){typeof __INTLIFY_JIT_COMPILATION__!="boolean"&&(Nf().__INTLIFY_JIT_COMPILATION__=!1),typeof __INTLIFY_DROP_MESSAGE_COMPILER__!="boolean"&&(Nf().__INTLIFY_DROP_MESSAGE_COMPILER__=!1)}const Q$=I$.__EXTEND_POINT__,Ri=_c(Q$);Ri(),Ri(),Ri(),Ri(),Ri(),Ri(),Ri(),Ri(),Ri();const kS=$n.__EXTEND_POINT__,zr=_c(kS),dr={UNEXPECTED_RETURN_TYPE:kS,INVALID_ARGUMENT:zr(),MUST_BE_CALL_SETUP_TOP:zr(),NOT_INSTALLED:zr(),NOT_AVAILABLE_IN_LEGACY_MODE:zr(),REQUIRED_VALUE:zr(),INVALID_VALUE:zr(),CANNOT_SETUP_VUE_DEVTOOLS_PLUGIN:zr(),NOT_INSTALLED_WITH_PROVIDE:zr(),UNEXPECTED_ERROR:zr(),NOT_COMPATIBLE_LEGACY_VUE_I18N:zr(),BRIDGE_SUPPORT_VUE_2_ONLY:zr(),MUST_DEFINE_I18N_OPTION_IN_ALLOW_COMPOSITION:zr(),NOT_AVAILABLE_COMPOSITION_IN_LEGACY:zr(),__EXTEND_POINT__:zr()};function gr(t,...e){return bo(t,null,void 0)}const Dh=xs("__translateVNode"),Bh=xs("__datetimeParts"),Mh=xs("__numberParts"),GS=xs("__setPluralRules"),VS=xs("__injectWithOption"),$h=xs("__dispose");function wl(t){if(!yt(t))return t;for(const e in t)if(Pf(t,e))if(!e.includes("."))yt(t[e])&&wl(t[e]);else{const r=e.split("."),n=r.length-1;let i=t,s=!1;for(let o=0;o<n;o++){if(r[o]in i||(i[r[o]]={}),!yt(i[r[o]])){s=!0;break}i=i[r[o]]}s||(i[r[n]]=t[e],delete t[e]),yt(i[r[n]])&&wl(i[r[n]])}return t}function vc(t,e){const{messages:r,__i18n:n,messageResolver:i,flatJson:s}=e,o=Ze(r)?r:Xt(n)?{}:{[t]:{}};if(Xt(n)&&n.forEach(f=>{if("locale"in f&&"resource"in f){const{locale:c,resource:d}=f;c?(o[c]=o[c]||{},ff(d,o[c])):ff(d,o)}else Ue(f)&&ff(JSON.parse(f),o)}),i==null&&s)for(const f in o)Pf(o,f)&&wl(o[f]);return o}function Z$(t){return t.type}function FS(t,e,r){let n=yt(e.messages)?e.messages:{};"__i18nGlobal"in r&&(n=vc(t.locale.value,{messages:n,__i18n:r.__i18nGlobal}));const i=Object.keys(n);i.length&&i.forEach(s=>{t.mergeLocaleMessage(s,n[s])});{if(yt(e.datetimeFormats)){const s=Object.keys(e.datetimeFormats);s.length&&s.forEach(o=>{t.mergeDateTimeFormat(o,e.datetimeFormats[o])})}if(yt(e.numberFormats)){const s=Object.keys(e.numberFormats);s.length&&s.forEach(o=>{t.mergeNumberFormat(o,e.numberFormats[o])})}}}function pv(t){return Kt(Kl,null,t,0)}const dv=()=>[],eK=()=>!1;let hv=0;function Ev(t){return(e,r,n,i)=>t(r,n,so()||void 0,i)}function JE(t={},e){const{__root:r,__injectWithOption:n}=t,i=r===void 0,s=t.flatJson,o=If?Hs:yR,f=!!t.translateExistCompatible;let c=ct(t.inheritLocale)?t.inheritLocale:!0;const d=o(r&&c?r.locale.value:Ue(t.locale)?t.locale:uo),p=o(r&&c?r.fallbackLocale.value:Ue(t.fallbackLocale)||Xt(t.fallbackLocale)||Ze(t.fallbackLocale)||t.fallbackLocale===!1?t.fallbackLocale:d.value),E=o(vc(d.value,t)),m=o(Ze(t.datetimeFormats)?t.datetimeFormats:{[d.value]:{}}),g=o(Ze(t.numberFormats)?t.numberFormats:{[d.value]:{}});let _=r?r.missingWarn:ct(t.missingWarn)||gs(t.missingWarn)?t.missingWarn:!0,b=r?r.fallbackWarn:ct(t.fallbackWarn)||gs(t.fallbackWarn)?t.fallbackWarn:!0,x=r?r.fallbackRoot:ct(t.fallbackRoot)?t.fallbackRoot:!0,S=!!t.fallbackFormat,y=Ft(t.missing)?t.missing:null,v=Ft(t.missing)?Ev(t.missing):null,R=Ft(t.postTranslation)?t.postTranslation:null,w=r?r.warnHtmlMessage:ct(t.warnHtmlMessage)?t.warnHtmlMessage:!0,M=!!t.escapeParameter;const k=r?r.modifiers:Ze(t.modifiers)?t.modifiers:{};let H=t.pluralRules||r&&r.pluralRules,O;O=(()=>{i&&nv(null);const se={version:Y$,locale:d.value,fallbackLocale:p.value,messages:E.value,modifiers:k,pluralRules:H,missing:v===null?void 0:v,missingWarn:_,fallbackWarn:b,fallbackFormat:S,unresolving:!0,postTranslation:R===null?void 0:R,warnHtmlMessage:w,escapeParameter:M,messageResolver:t.messageResolver,messageCompiler:t.messageCompiler,__meta:{framework:"vue"}};se.datetimeFormats=m.value,se.numberFormats=g.value,se.__datetimeFormatters=Ze(O)?O.__datetimeFormatters:void 0,se.__numberFormatters=Ze(O)?O.__numberFormatters:void 0;const le=k$(se);return i&&nv(le),le})(),Qo(O,d.value,p.value);function ie(){return[d.value,p.value,E.value,m.value,g.value]}const G=Sn({get:()=>d.value,set:se=>{d.value=se,O.locale=d.value}}),X=Sn({get:()=>p.value,set:se=>{p.value=se,O.fallbackLocale=p.value,Qo(O,d.value,se)}}),ee=Sn(()=>E.value),B=Sn(()=>m.value),Q=Sn(()=>g.value);function W(){return Ft(R)?R:null}function j(se){R=se,O.postTranslation=se}function ue(){return y}function ve(se){se!==null&&(v=Ev(se)),y=se,O.missing=v}const ae=(se,le,Ke,K,$,Z)=>{ie();let D;try{i||(O.fallbackContext=r?K$():void 0),D=se(O)}finally{i||(O.fallbackContext=void 0)}if(Ke!=="translate exists"&&pr(D)&&D===Tc||Ke==="translate exists"&&!D){const[J,fe]=le();return r&&x?K(r):$(J)}else{if(Z(D))return D;throw gr(dr.UNEXPECTED_RETURN_TYPE)}};function he(...se){return ae(le=>Reflect.apply(ov,null,[le,...se]),()=>Nh(...se),"translate",le=>Reflect.apply(le.t,le,[...se]),le=>le,le=>Ue(le))}function Se(...se){const[le,Ke,K]=se;if(K&&!yt(K))throw gr(dr.INVALID_ARGUMENT);return he(le,Ke,Pr({resolvedMessage:!0},K||{}))}function He(...se){return ae(le=>Reflect.apply(lv,null,[le,...se]),()=>Ph(...se),"datetime format",le=>Reflect.apply(le.d,le,[...se]),()=>ev,le=>Ue(le))}function Ie(...se){return ae(le=>Reflect.apply(fv,null,[le,...se]),()=>Uh(...se),"number format",le=>Reflect.apply(le.n,le,[...se]),()=>ev,le=>Ue(le))}function $e(se){return se.map(le=>Ue(le)||pr(le)||ct(le)?pv(String(le)):le)}const Fe={normalize:$e,interpolate:se=>se,type:"vnode"};function ot(...se){return ae(le=>{let Ke;const K=le;try{K.processor=Fe,Ke=Reflect.apply(ov,null,[K,...se])}finally{K.processor=null}return Ke},()=>Nh(...se),"translate",le=>le[Dh](...se),le=>[pv(le)],le=>Xt(le))}function et(...se){return ae(le=>Reflect.apply(fv,null,[le,...se]),()=>Uh(...se),"number format",le=>le[Mh](...se),dv,le=>Ue(le)||Xt(le))}function xt(...se){return ae(le=>Reflect.apply(lv,null,[le,...se]),()=>Ph(...se),"datetime format",le=>le[Bh](...se),dv,le=>Ue(le)||Xt(le))}function zt(se){H=se,O.pluralRules=H}function V(se,le){return ae(()=>{if(!se)return!1;const Ke=Ue(le)?le:d.value,K=me(Ke),$=O.messageResolver(K,se);return f?$!=null:fo($)||Pi($)||Ue($)},()=>[se],"translate exists",Ke=>Reflect.apply(Ke.te,Ke,[se,le]),eK,Ke=>ct(Ke))}function P(se){let le=null;const Ke=wS(O,p.value,d.value);for(let K=0;K<Ke.length;K++){const $=E.value[Ke[K]]||{},Z=O.messageResolver($,se);if(Z!=null){le=Z;break}}return le}function re(se){const le=P(se);return le??(r?r.tm(se)||{}:{})}function me(se){return E.value[se]||{}}function pe(se,le){if(s){const Ke={[se]:le};for(const K in Ke)Pf(Ke,K)&&wl(Ke[K]);le=Ke[se]}E.value[se]=le,O.messages=E.value}function be(se,le){E.value[se]=E.value[se]||{};const Ke={[se]:le};if(s)for(const K in Ke)Pf(Ke,K)&&wl(Ke[K]);le=Ke[se],ff(le,E.value[se]),O.messages=E.value}function xe(se){return m.value[se]||{}}function N(se,le){m.value[se]=le,O.datetimeFormats=m.value,uv(O,se,le)}function U(se,le){m.value[se]=Pr(m.value[se]||{},le),O.datetimeFormats=m.value,uv(O,se,le)}function q(se){return g.value[se]||{}}function ge(se,le){g.value[se]=le,O.numberFormats=g.value,cv(O,se,le)}function ye(se,le){g.value[se]=Pr(g.value[se]||{},le),O.numberFormats=g.value,cv(O,se,le)}hv++,r&&If&&(Ja(r.locale,se=>{c&&(d.value=se,O.locale=se,Qo(O,d.value,p.value))}),Ja(r.fallbackLocale,se=>{c&&(p.value=se,O.fallbackLocale=se,Qo(O,d.value,p.value))}));const Re={id:hv,locale:G,fallbackLocale:X,get inheritLocale(){return c},set inheritLocale(se){c=se,se&&r&&(d.value=r.locale.value,p.value=r.fallbackLocale.value,Qo(O,d.value,p.value))},get availableLocales(){return Object.keys(E.value).sort()},messages:ee,get modifiers(){return k},get pluralRules(){return H||{}},get isGlobal(){return i},get missingWarn(){return _},set missingWarn(se){_=se,O.missingWarn=_},get fallbackWarn(){return b},set fallbackWarn(se){b=se,O.fallbackWarn=b},get fallbackRoot(){return x},set fallbackRoot(se){x=se},get fallbackFormat(){return S},set fallbackFormat(se){S=se,O.fallbackFormat=S},get warnHtmlMessage(){return w},set warnHtmlMessage(se){w=se,O.warnHtmlMessage=se},get escapeParameter(){return M},set escapeParameter(se){M=se,O.escapeParameter=se},t:he,getLocaleMessage:me,setLocaleMessage:pe,mergeLocaleMessage:be,getPostTranslationHandler:W,setPostTranslationHandler:j,getMissingHandler:ue,setMissingHandler:ve,[GS]:zt};return Re.datetimeFormats=B,Re.numberFormats=Q,Re.rt=Se,Re.te=V,Re.tm=re,Re.d=He,Re.n=Ie,Re.getDateTimeFormat=xe,Re.setDateTimeFormat=N,Re.mergeDateTimeFormat=U,Re.getNumberFormat=q,Re.setNumberFormat=ge,Re.mergeNumberFormat=ye,Re[VS]=n,Re[Dh]=ot,Re[Bh]=xt,Re[Mh]=et,Re}function tK(t){const e=Ue(t.locale)?t.locale:uo,r=Ue(t.fallbackLocale)||Xt(t.fallbackLocale)||Ze(t.fallbackLocale)||t.fallbackLocale===!1?t.fallbackLocale:e,n=Ft(t.missing)?t.missing:void 0,i=ct(t.silentTranslationWarn)||gs(t.silentTranslationWarn)?!t.silentTranslationWarn:!0,s=ct(t.silentFallbackWarn)||gs(t.silentFallbackWarn)?!t.silentFallbackWarn:!0,o=ct(t.fallbackRoot)?t.fallbackRoot:!0,f=!!t.formatFallbackMessages,c=Ze(t.modifiers)?t.modifiers:{},d=t.pluralizationRules,p=Ft(t.postTranslation)?t.postTranslation:void 0,E=Ue(t.warnHtmlInMessage)?t.warnHtmlInMessage!=="off":!0,m=!!t.escapeParameterHtml,g=ct(t.sync)?t.sync:!0;let _=t.messages;if(Ze(t.sharedMessages)){const M=t.sharedMessages;_=Object.keys(M).reduce((H,O)=>{const z=H[O]||(H[O]={});return Pr(z,M[O]),H},_||{})}const{__i18n:b,__root:x,__injectWithOption:S}=t,y=t.datetimeFormats,v=t.numberFormats,R=t.flatJson,w=t.translateExistCompatible;return{locale:e,fallbackLocale:r,messages:_,flatJson:R,datetimeFormats:y,numberFormats:v,missing:n,missingWarn:i,fallbackWarn:s,fallbackRoot:o,fallbackFormat:f,modifiers:c,pluralRules:d,postTranslation:p,warnHtmlMessage:E,escapeParameter:m,messageResolver:t.messageResolver,inheritLocale:g,translateExistCompatible:w,__i18n:b,__root:x,__injectWithOption:S}}function Kh(t={},e){{const r=JE(tK(t)),{__extender:n}=t,i={id:r.id,get locale(){return r.locale.value},set locale(s){r.locale.value=s},get fallbackLocale(){return r.fallbackLocale.value},set fallbackLocale(s){r.fallbackLocale.value=s},get messages(){return r.messages.value},get datetimeFormats(){return r.datetimeFormats.value},get numberFormats(){return r.numberFormats.value},get availableLocales(){return r.availableLocales},get formatter(){return{interpolate(){return[]}}},set formatter(s){},get missing(){return r.getMissingHandler()},set missing(s){r.setMissingHandler(s)},get silentTranslationWarn(){return ct(r.missingWarn)?!r.missingWarn:r.missingWarn},set silentTranslationWarn(s){r.missingWarn=ct(s)?!s:s},get silentFallbackWarn(){return ct(r.fallbackWarn)?!r.fallbackWarn:r.fallbackWarn},set silentFallbackWarn(s){r.fallbackWarn=ct(s)?!s:s},get modifiers(){return r.modifiers},get formatFallbackMessages(){return r.fallbackFormat},set formatFallbackMessages(s){r.fallbackFormat=s},get postTranslation(){return r.getPostTranslationHandler()},set postTranslation(s){r.setPostTranslationHandler(s)},get sync(){return r.inheritLocale},set sync(s){r.inheritLocale=s},get warnHtmlInMessage(){return r.warnHtmlMessage?"warn":"off"},set warnHtmlInMessage(s){r.warnHtmlMessage=s!=="off"},get escapeParameterHtml(){return r.escapeParameter},set escapeParameterHtml(s){r.escapeParameter=s},get preserveDirectiveContent(){return!0},set preserveDirectiveContent(s){},get pluralizationRules(){return r.pluralRules||{}},__composer:r,t(...s){const[o,f,c]=s,d={};let p=null,E=null;if(!Ue(o))throw gr(dr.INVALID_ARGUMENT);const m=o;return Ue(f)?d.locale=f:Xt(f)?p=f:Ze(f)&&(E=f),Xt(c)?p=c:Ze(c)&&(E=c),Reflect.apply(r.t,r,[m,p||E||{},d])},rt(...s){return Reflect.apply(r.rt,r,[...s])},tc(...s){const[o,f,c]=s,d={plural:1};let p=null,E=null;if(!Ue(o))throw gr(dr.INVALID_ARGUMENT);const m=o;return Ue(f)?d.locale=f:pr(f)?d.plural=f:Xt(f)?p=f:Ze(f)&&(E=f),Ue(c)?d.locale=c:Xt(c)?p=c:Ze(c)&&(E=c),Reflect.apply(r.t,r,[m,p||E||{},d])},te(s,o){return r.te(s,o)},tm(s){return r.tm(s)},getLocaleMessage(s){return r.getLocaleMessage(s)},setLocaleMessage(s,o){r.setLocaleMessage(s,o)},mergeLocaleMessage(s,o){r.mergeLocaleMessage(s,o)},d(...s){return Reflect.apply(r.d,r,[...s])},getDateTimeFormat(s){return r.getDateTimeFormat(s)},setDateTimeFormat(s,o){r.setDateTimeFormat(s,o)},mergeDateTimeFormat(s,o){r.mergeDateTimeFormat(s,o)},n(...s){return Reflect.apply(r.n,r,[...s])},getNumberFormat(s){return r.getNumberFormat(s)},setNumberFormat(s,o){r.setNumberFormat(s,o)},mergeNumberFormat(s,o){r.mergeNumberFormat(s,o)},getChoiceIndex(s,o){return-1}};return i.__extender=n,i}}const QE={tag:{type:[String,Object]},locale:{type:String},scope:{type:String,validator:t=>t==="parent"||t==="global",default:"parent"},i18n:{type:Object}};function rK({slots:t},e){return e.length===1&&e[0]==="default"?(t.default?t.default():[]).reduce((n,i)=>[...n,...i.type===Yt?i.children:[i]],[]):e.reduce((r,n)=>{const i=t[n];return i&&(r[n]=i()),r},{})}function HS(t){return Yt}const nK=lr({name:"i18n-t",props:Pr({keypath:{type:String,required:!0},plural:{type:[Number,String],validator:t=>pr(t)||!isNaN(t)}},QE),setup(t,e){const{slots:r,attrs:n}=e,i=t.i18n||ZE({useScope:t.scope,__useComponent:!0});return()=>{const s=Object.keys(r).filter(E=>E!=="_"),o={};t.locale&&(o.locale=t.locale),t.plural!==void 0&&(o.plural=Ue(t.plural)?+t.plural:t.plural);const f=rK(e,s),c=i[Dh](t.keypath,f,o),d=Pr({},n),p=Ue(t.tag)||yt(t.tag)?t.tag:HS();return XE(p,d,c)}}}),mv=nK;function iK(t){return Xt(t)&&!Ue(t[0])}function WS(t,e,r,n){const{slots:i,attrs:s}=e;return()=>{const o={part:!0};let f={};t.locale&&(o.locale=t.locale),Ue(t.format)?o.key=t.format:yt(t.format)&&(Ue(t.format.key)&&(o.key=t.format.key),f=Object.keys(t.format).reduce((m,g)=>r.includes(g)?Pr({},m,{[g]:t.format[g]}):m,{}));const c=n(t.value,o,f);let d=[o.key];Xt(c)?d=c.map((m,g)=>{const _=i[m.type],b=_?_({[m.type]:m.value,index:g,parts:c}):[m.value];return iK(b)&&(b[0].key=`${m.type}-${g}`),b}):Ue(c)&&(d=[c]);const p=Pr({},s),E=Ue(t.tag)||yt(t.tag)?t.tag:HS();return XE(E,p,d)}}const sK=lr({name:"i18n-n",props:Pr({value:{type:Number,required:!0},format:{type:[String,Object]}},QE),setup(t,e){const r=t.i18n||ZE({useScope:t.scope,__useComponent:!0});return WS(t,e,KS,(...n)=>r[Mh](...n))}}),gv=sK,aK=lr({name:"i18n-d",props:Pr({value:{type:[Number,Date],required:!0},format:{type:[String,Object]}},QE),setup(t,e){const r=t.i18n||ZE({useScope:t.scope,__useComponent:!0});return WS(t,e,$S,(...n)=>r[Bh](...n))}}),_v=aK;function oK(t,e){const r=t;if(t.mode==="composition")return r.__getInstance(e)||t.global;{const n=r.__getInstance(e);return n!=null?n.__composer:t.global.__composer}}function lK(t){const e=o=>{const{instance:f,modifiers:c,value:d}=o;if(!f||!f.$)throw gr(dr.UNEXPECTED_ERROR);const p=oK(t,f.$),E=Tv(d);return[Reflect.apply(p.t,p,[...vv(E)]),p]};return{created:(o,f)=>{const[c,d]=e(f);If&&t.global===d&&(o.__i18nWatcher=Ja(d.locale,()=>{f.instance&&f.instance.$forceUpdate()})),o.__composer=d,o.textContent=c},unmounted:o=>{If&&o.__i18nWatcher&&(o.__i18nWatcher(),o.__i18nWatcher=void 0,delete o.__i18nWatcher),o.__composer&&(o.__composer=void 0,delete o.__composer)},beforeUpdate:(o,{value:f})=>{if(o.__composer){const c=o.__composer,d=Tv(f);o.textContent=Reflect.apply(c.t,c,[...vv(d)])}},getSSRProps:o=>{const[f]=e(o);return{textContent:f}}}}function Tv(t){if(Ue(t))return{path:t};if(Ze(t)){if(!("path"in t))throw gr(dr.REQUIRED_VALUE,"path");return t}else throw gr(dr.INVALID_VALUE)}function vv(t){const{path:e,locale:r,args:n,choice:i,plural:s}=t,o={},f=n||{};return Ue(r)&&(o.locale=r),pr(i)&&(o.plural=i),pr(s)&&(o.plural=s),[e,f,o]}function uK(t,e,...r){const n=Ze(r[0])?r[0]:{},i=!!n.useI18nComponentName;(ct(n.globalInstall)?n.globalInstall:!0)&&([i?"i18n":mv.name,"I18nT"].forEach(o=>t.component(o,mv)),[gv.name,"I18nN"].forEach(o=>t.component(o,gv)),[_v.name,"I18nD"].forEach(o=>t.component(o,_v))),t.directive("t",lK(e))}function fK(t,e,r){return{beforeCreate(){const n=so();if(!n)throw gr(dr.UNEXPECTED_ERROR);const i=this.$options;if(i.i18n){const s=i.i18n;if(i.__i18n&&(s.__i18n=i.__i18n),s.__root=e,this===this.$root)this.$i18n=bv(t,s);else{s.__injectWithOption=!0,s.__extender=r.__vueI18nExtend,this.$i18n=Kh(s);const o=this.$i18n;o.__extender&&(o.__disposer=o.__extender(this.$i18n))}}else if(i.__i18n)if(this===this.$root)this.$i18n=bv(t,i);else{this.$i18n=Kh({__i18n:i.__i18n,__injectWithOption:!0,__extender:r.__vueI18nExtend,__root:e});const s=this.$i18n;s.__extender&&(s.__disposer=s.__extender(this.$i18n))}else this.$i18n=t;i.__i18nGlobal&&FS(e,i,i),this.$t=(...s)=>this.$i18n.t(...s),this.$rt=(...s)=>this.$i18n.rt(...s),this.$tc=(...s)=>this.$i18n.tc(...s),this.$te=(s,o)=>this.$i18n.te(s,o),this.$d=(...s)=>this.$i18n.d(...s),this.$n=(...s)=>this.$i18n.n(...s),this.$tm=s=>this.$i18n.tm(s),r.__setInstance(n,this.$i18n)},mounted(){},unmounted(){const n=so();if(!n)throw gr(dr.UNEXPECTED_ERROR);const i=this.$i18n;delete this.$t,delete this.$rt,delete this.$tc,delete this.$te,delete this.$d,delete this.$n,delete this.$tm,i.__disposer&&(i.__disposer(),delete i.__disposer,delete i.__extender),r.__deleteInstance(n),delete this.$i18n}}}function bv(t,e){t.locale=e.locale||t.locale,t.fallbackLocale=e.fallbackLocale||t.fallbackLocale,t.missing=e.missing||t.missing,t.silentTranslationWarn=e.silentTranslationWarn||t.silentFallbackWarn,t.silentFallbackWarn=e.silentFallbackWarn||t.silentFallbackWarn,t.formatFallbackMessages=e.formatFallbackMessages||t.formatFallbackMessages,t.postTranslation=e.postTranslation||t.postTranslation,t.warnHtmlInMessage=e.warnHtmlInMessage||t.warnHtmlInMessage,t.escapeParameterHtml=e.escapeParameterHtml||t.escapeParameterHtml,t.sync=e.sync||t.sync,t.__composer[GS](e.pluralizationRules||t.pluralizationRules);const r=vc(t.locale,{messages:e.messages,__i18n:e.__i18n});return Object.keys(r).forEach(n=>t.mergeLocaleMessage(n,r[n])),e.datetimeFormats&&Object.keys(e.datetimeFormats).forEach(n=>t.mergeDateTimeFormat(n,e.datetimeFormats[n])),e.numberFormats&&Object.keys(e.numberFormats).forEach(n=>t.mergeNumberFormat(n,e.numberFormats[n])),t}const cK=xs("global-vue-i18n");function pK(t={},e){const r=ct(t.legacy)?t.legacy:!0,n=ct(t.globalInjection)?t.globalInjection:!0,i=r?!!t.allowComposition:!0,s=new Map,[o,f]=dK(t,r),c=xs("");function d(m){return s.get(m)||null}function p(m,g){s.set(m,g)}function E(m){s.delete(m)}{const m={get mode(){return r?"legacy":"composition"},get allowComposition(){return i},async install(g,..._){if(g.__VUE_I18N_SYMBOL__=c,g.provide(g.__VUE_I18N_SYMBOL__,m),Ze(_[0])){const S=_[0];m.__composerExtend=S.__composerExtend,m.__vueI18nExtend=S.__vueI18nExtend}let b=null;!r&&n&&(b=xK(g,m.global)),uK(g,m,..._),r&&g.mixin(fK(f,f.__composer,m));const x=g.unmount;g.unmount=()=>{b&&b(),m.dispose(),x()}},get global(){return f},dispose(){o.stop()},__instances:s,__getInstance:d,__setInstance:p,__deleteInstance:E};return m}}function ZE(t={}){const e=so();if(e==null)throw gr(dr.MUST_BE_CALL_SETUP_TOP);if(!e.isCE&&e.appContext.app!=null&&!e.appContext.app.__VUE_I18N_SYMBOL__)throw gr(dr.NOT_INSTALLED);const r=hK(e),n=mK(r),i=Z$(e),s=EK(t,i);if(r.mode==="legacy"&&!t.__useComponent){if(!r.allowComposition)throw gr(dr.NOT_AVAILABLE_IN_LEGACY_MODE);return vK(e,s,n,t)}if(s==="global")return FS(n,t,i),n;if(s==="parent"){let c=gK(r,e,t.__useComponent);return c==null&&(c=n),c}const o=r;let f=o.__getInstance(e);if(f==null){const c=Pr({},t);"__i18n"in i&&(c.__i18n=i.__i18n),n&&(c.__root=n),f=JE(c),o.__composerExtend&&(f[$h]=o.__composerExtend(f)),TK(o,e,f),o.__setInstance(e,f)}return f}function dK(t,e,r){const n=cD();{const i=e?n.run(()=>Kh(t)):n.run(()=>JE(t));if(i==null)throw gr(dr.UNEXPECTED_ERROR);return[n,i]}}function hK(t){{const e=qs(t.isCE?cK:t.appContext.app.__VUE_I18N_SYMBOL__);if(!e)throw gr(t.isCE?dr.NOT_INSTALLED_WITH_PROVIDE:dr.UNEXPECTED_ERROR);return e}}function EK(t,e){return gc(t)?"__i18n"in e?"local":"global":t.useScope?t.useScope:"local"}function mK(t){return t.mode==="composition"?t.global:t.global.__composer}function gK(t,e,r=!1){let n=null;const i=e.root;let s=_K(e,r);for(;s!=null;){const o=t;if(t.mode==="composition")n=o.__getInstance(s);else{const f=o.__getInstance(s);f!=null&&(n=f.__composer,r&&n&&!n[VS]&&(n=null))}if(n!=null||i===s)break;s=s.parent}return n}function _K(t,e=!1){return t==null?null:e&&t.vnode.ctx||t.parent}function TK(t,e,r){KE(()=>{},e),kE(()=>{const n=r;t.__deleteInstance(e);const i=n[$h];i&&(i(),delete n[$h])},e)}function vK(t,e,r,n={}){const i=e==="local",s=yR(null);if(i&&t.proxy&&!(t.proxy.$options.i18n||t.proxy.$options.__i18n))throw gr(dr.MUST_DEFINE_I18N_OPTION_IN_ALLOW_COMPOSITION);const o=ct(n.inheritLocale)?n.inheritLocale:!Ue(n.locale),f=Hs(!i||o?r.locale.value:Ue(n.locale)?n.locale:uo),c=Hs(!i||o?r.fallbackLocale.value:Ue(n.fallbackLocale)||Xt(n.fallbackLocale)||Ze(n.fallbackLocale)||n.fallbackLocale===!1?n.fallbackLocale:f.value),d=Hs(vc(f.value,n)),p=Hs(Ze(n.datetimeFormats)?n.datetimeFormats:{[f.value]:{}}),E=Hs(Ze(n.numberFormats)?n.numberFormats:{[f.value]:{}}),m=i?r.missingWarn:ct(n.missingWarn)||gs(n.missingWarn)?n.missingWarn:!0,g=i?r.fallbackWarn:ct(n.fallbackWarn)||gs(n.fallbackWarn)?n.fallbackWarn:!0,_=i?r.fallbackRoot:ct(n.fallbackRoot)?n.fallbackRoot:!0,b=!!n.fallbackFormat,x=Ft(n.missing)?n.missing:null,S=Ft(n.postTranslation)?n.postTranslation:null,y=i?r.warnHtmlMessage:ct(n.warnHtmlMessage)?n.warnHtmlMessage:!0,v=!!n.escapeParameter,R=i?r.modifiers:Ze(n.modifiers)?n.modifiers:{},w=n.pluralRules||i&&r.pluralRules;function M(){return[f.value,c.value,d.value,p.value,E.value]}const k=Sn({get:()=>s.value?s.value.locale.value:f.value,set:P=>{s.value&&(s.value.locale.value=P),f.value=P}}),H=Sn({get:()=>s.value?s.value.fallbackLocale.value:c.value,set:P=>{s.value&&(s.value.fallbackLocale.value=P),c.value=P}}),O=Sn(()=>s.value?s.value.messages.value:d.value),z=Sn(()=>p.value),ie=Sn(()=>E.value);function G(){return s.value?s.value.getPostTranslationHandler():S}function X(P){s.value&&s.value.setPostTranslationHandler(P)}function ee(){return s.value?s.value.getMissingHandler():x}function B(P){s.value&&s.value.setMissingHandler(P)}function Q(P){return M(),P()}function W(...P){return s.value?Q(()=>Reflect.apply(s.value.t,null,[...P])):Q(()=>"")}function j(...P){return s.value?Reflect.apply(s.value.rt,null,[...P]):""}function ue(...P){return s.value?Q(()=>Reflect.apply(s.value.d,null,[...P])):Q(()=>"")}function ve(...P){return s.value?Q(()=>Reflect.apply(s.value.n,null,[...P])):Q(()=>"")}function ae(P){return s.value?s.value.tm(P):{}}function he(P,re){return s.value?s.value.te(P,re):!1}function Se(P){return s.value?s.value.getLocaleMessage(P):{}}function He(P,re){s.value&&(s.value.setLocaleMessage(P,re),d.value[P]=re)}function Ie(P,re){s.value&&s.value.mergeLocaleMessage(P,re)}function $e(P){return s.value?s.value.getDateTimeFormat(P):{}}function nt(P,re){s.value&&(s.value.setDateTimeFormat(P,re),p.value[P]=re)}function Fe(P,re){s.value&&s.value.mergeDateTimeFormat(P,re)}function ot(P){return s.value?s.value.getNumberFormat(P):{}}function et(P,re){s.value&&(s.value.setNumberFormat(P,re),E.value[P]=re)}function xt(P,re){s.value&&s.value.mergeNumberFormat(P,re)}const zt={get id(){return s.value?s.value.id:-1},locale:k,fallbackLocale:H,messages:O,datetimeFormats:z,numberFormats:ie,get inheritLocale(){return s.value?s.value.inheritLocale:o},set inheritLocale(P){s.value&&(s.value.inheritLocale=P)},get availableLocales(){return s.value?s.value.availableLocales:Object.keys(d.value)},get modifiers(){return s.value?s.value.modifiers:R},get pluralRules(){return s.value?s.value.pluralRules:w},get isGlobal(){return s.value?s.value.isGlobal:!1},get missingWarn(){return s.value?s.value.missingWarn:m},set missingWarn(P){s.value&&(s.value.missingWarn=P)},get fallbackWarn(){return s.value?s.value.fallbackWarn:g},set fallbackWarn(P){s.value&&(s.value.missingWarn=P)},get fallbackRoot(){return s.value?s.value.fallbackRoot:_},set fallbackRoot(P){s.value&&(s.value.fallbackRoot=P)},get fallbackFormat(){return s.value?s.value.fallbackFormat:b},set fallbackFormat(P){s.value&&(s.value.fallbackFormat=P)},get warnHtmlMessage(){return s.value?s.value.warnHtmlMessage:y},set warnHtmlMessage(P){s.value&&(s.value.warnHtmlMessage=P)},get escapeParameter(){return s.value?s.value.escapeParameter:v},set escapeParameter(P){s.value&&(s.value.escapeParameter=P)},t:W,getPostTranslationHandler:G,setPostTranslationHandler:X,getMissingHandler:ee,setMissingHandler:B,rt:j,d:ue,n:ve,tm:ae,te:he,getLocaleMessage:Se,setLocaleMessage:He,mergeLocaleMessage:Ie,getDateTimeFormat:$e,setDateTimeFormat:nt,mergeDateTimeFormat:Fe,getNumberFormat:ot,setNumberFormat:et,mergeNumberFormat:xt};function V(P){P.locale.value=f.value,P.fallbackLocale.value=c.value,Object.keys(d.value).forEach(re=>{P.mergeLocaleMessage(re,d.value[re])}),Object.keys(p.value).forEach(re=>{P.mergeDateTimeFormat(re,p.value[re])}),Object.keys(E.value).forEach(re=>{P.mergeNumberFormat(re,E.value[re])}),P.escapeParameter=v,P.fallbackFormat=b,P.fallbackRoot=_,P.fallbackWarn=g,P.missingWarn=m,P.warnHtmlMessage=y}return VR(()=>{if(t.proxy==null||t.proxy.$i18n==null)throw gr(dr.NOT_AVAILABLE_COMPOSITION_IN_LEGACY);const P=s.value=t.proxy.$i18n.__composer;e==="global"?(f.value=P.locale.value,c.value=P.fallbackLocale.value,d.value=P.messages.value,p.value=P.datetimeFormats.value,E.value=P.numberFormats.value):i&&V(P)}),zt}const bK=["locale","fallbackLocale","availableLocales"],xv=["t","rt","d","n","tm","te"];function xK(t,e){const r=Object.create(null);return bK.forEach(i=>{const s=Object.getOwnPropertyDescriptor(e,i);if(!s)throw gr(dr.UNEXPECTED_ERROR);const o=Sr(s.value)?{get(){return s.value.value},set(f){s.value.value=f}}:{get(){return s.get&&s.get()}};Object.defineProperty(r,i,o)}),t.config.globalProperties.$i18n=r,xv.forEach(i=>{const s=Object.getOwnPropertyDescriptor(e,i);if(!s||!s.value)throw gr(dr.UNEXPECTED_ERROR);Object.defineProperty(t.config.globalProperties,`$${i}`,s)}),()=>{delete t.config.globalProperties.$i18n,xv.forEach(i=>{delete t.config.globalProperties[`$${i}`]})}}J$();__INTLIFY_JIT_COMPILATION__?rv(W$):rv(H$);M$(b$);$$(wS);function Rv(t){return t!==null&&typeof t=="object"&&"constructor"in t&&t.constructor===Object}function e0(t,e){t===void 0&&(t={}),e===void 0&&(e={}),Object.keys(e).forEach(r=>{typeof t[r]>"u"?t[r]=e[r]:Rv(e[r])&&Rv(t[r])&&Object.keys(e[r]).length>0&&e0(t[r],e[r])})}const XS={body:{},addEventListener(){},removeEventListener(){},activeElement:{blur(){},nodeName:""},querySelector(){return null},querySelectorAll(){return[]},getElementById(){return null},createEvent(){return{initEvent(){}}},createElement(){return{children:[],childNodes:[],style:{},setAttribute(){},getElementsByTagName(){return[]}}},createElementNS(){return{}},importNode(){return null},location:{hash:"",host:"",hostname:"",href:"",origin:"",pathname:"",protocol:"",search:""}};function yr(){const t=typeof document<"u"?document:{};return e0(t,XS),t}const RK={document:XS,navigator:{userAgent:""},location:{hash:"",host:"",hostname:"",href:"",origin:"",pathname:"",protocol:"",search:""},history:{replaceState(){},pushState(){},go(){},back(){}},CustomEvent:function(){return this},addEventListener(){},removeEventListener(){},getComputedStyle(){return{getPropertyValue(){return""}}},Image(){},Date(){},screen:{},setTimeout(){},clearTimeout(){},matchMedia(){return{}},requestAnimationFrame(t){return typeof setTimeout>"u"?(t(),null):setTimeout(t,0)},cancelAnimationFrame(t){typeof setTimeout>"u"||clearTimeout(t)}};function tr(){const t=typeof window<"u"?window:{};return e0(t,RK),t}function es(t){return t===void 0&&(t=""),t.trim().split(" ").filter(e=>!!e.trim())}function SK(t){const e=t;Object.keys(e).forEach(r=>{try{e[r]=null}catch{}try{delete e[r]}catch{}})}function na(t,e){return e===void 0&&(e=0),setTimeout(t,e)}function yn(){return Date.now()}function yK(t){const e=tr();let r;return e.getComputedStyle&&(r=e.getComputedStyle(t,null)),!r&&t.currentStyle&&(r=t.currentStyle),r||(r=t.style),r}function kh(t,e){e===void 0&&(e="x");const r=tr();let n,i,s;const o=yK(t);return r.WebKitCSSMatrix?(i=o.transform||o.webkitTransform,i.split(",").length>6&&(i=i.split(", ").map(f=>f.replace(",",".")).join(", ")),s=new r.WebKitCSSMatrix(i==="none"?"":i)):(s=o.MozTransform||o.OTransform||o.MsTransform||o.msTransform||o.transform||o.getPropertyValue("transform").replace("translate(","matrix(1, 0, 0, 1,"),n=s.toString().split(",")),e==="x"&&(r.WebKitCSSMatrix?i=s.m41:n.length===16?i=parseFloat(n[12]):i=parseFloat(n[4])),e==="y"&&(r.WebKitCSSMatrix?i=s.m42:n.length===16?i=parseFloat(n[13]):i=parseFloat(n[5])),i||0}function il(t){return typeof t=="object"&&t!==null&&t.constructor&&Object.prototype.toString.call(t).slice(8,-1)==="Object"}function AK(t){return typeof window<"u"&&typeof window.HTMLElement<"u"?t instanceof HTMLElement:t&&(t.nodeType===1||t.nodeType===11)}function fn(){const t=Object(arguments.length<=0?void 0:arguments[0]),e=["__proto__","constructor","prototype"];for(let r=1;r<arguments.length;r+=1){const n=r<0||arguments.length<=r?void 0:arguments[r];if(n!=null&&!AK(n)){const i=Object.keys(Object(n)).filter(s=>e.indexOf(s)<0);for(let s=0,o=i.length;s<o;s+=1){const f=i[s],c=Object.getOwnPropertyDescriptor(n,f);c!==void 0&&c.enumerable&&(il(t[f])&&il(n[f])?n[f].__swiper__?t[f]=n[f]:fn(t[f],n[f]):!il(t[f])&&il(n[f])?(t[f]={},n[f].__swiper__?t[f]=n[f]:fn(t[f],n[f])):t[f]=n[f])}}}return t}function sl(t,e,r){t.style.setProperty(e,r)}function jS(t){let{swiper:e,targetPosition:r,side:n}=t;const i=tr(),s=-e.translate;let o=null,f;const c=e.params.speed;e.wrapperEl.style.scrollSnapType="none",i.cancelAnimationFrame(e.cssModeFrameID);const d=r>s?"next":"prev",p=(m,g)=>d==="next"&&m>=g||d==="prev"&&m<=g,E=()=>{f=new Date().getTime(),o===null&&(o=f);const m=Math.max(Math.min((f-o)/c,1),0),g=.5-Math.cos(m*Math.PI)/2;let _=s+g*(r-s);if(p(_,r)&&(_=r),e.wrapperEl.scrollTo({[n]:_}),p(_,r)){e.wrapperEl.style.overflow="hidden",e.wrapperEl.style.scrollSnapType="",setTimeout(()=>{e.wrapperEl.style.overflow="",e.wrapperEl.scrollTo({[n]:_})}),i.cancelAnimationFrame(e.cssModeFrameID);return}e.cssModeFrameID=i.requestAnimationFrame(E)};E()}function oa(t){return t.querySelector(".swiper-slide-transform")||t.shadowRoot&&t.shadowRoot.querySelector(".swiper-slide-transform")||t}function Rr(t,e){e===void 0&&(e="");const r=[...t.children];return t instanceof HTMLSlotElement&&r.push(...t.assignedElements()),e?r.filter(n=>n.matches(e)):r}function LK(t,e){const r=e.contains(t);return!r&&e instanceof HTMLSlotElement?[...e.assignedElements()].includes(t):r}function Df(t){try{console.warn(t);return}catch{}}function pn(t,e){e===void 0&&(e=[]);const r=document.createElement(t);return r.classList.add(...Array.isArray(e)?e:es(e)),r}function Bf(t){const e=tr(),r=yr(),n=t.getBoundingClientRect(),i=r.body,s=t.clientTop||i.clientTop||0,o=t.clientLeft||i.clientLeft||0,f=t===e?e.scrollY:t.scrollTop,c=t===e?e.scrollX:t.scrollLeft;return{top:n.top+f-s,left:n.left+c-o}}function CK(t,e){const r=[];for(;t.previousElementSibling;){const n=t.previousElementSibling;e?n.matches(e)&&r.push(n):r.push(n),t=n}return r}function wK(t,e){const r=[];for(;t.nextElementSibling;){const n=t.nextElementSibling;e?n.matches(e)&&r.push(n):r.push(n),t=n}return r}function as(t,e){return tr().getComputedStyle(t,null).getPropertyValue(e)}function Ol(t){let e=t,r;if(e){for(r=0;(e=e.previousSibling)!==null;)e.nodeType===1&&(r+=1);return r}}function Js(t,e){const r=[];let n=t.parentElement;for(;n;)e?n.matches(e)&&r.push(n):r.push(n),n=n.parentElement;return r}function dl(t,e){function r(n){n.target===t&&(e.call(t,n),t.removeEventListener("transitionend",r))}e&&t.addEventListener("transitionend",r)}function Gh(t,e,r){const n=tr();return t[e==="width"?"offsetWidth":"offsetHeight"]+parseFloat(n.getComputedStyle(t,null).getPropertyValue(e==="width"?"margin-right":"margin-top"))+parseFloat(n.getComputedStyle(t,null).getPropertyValue(e==="width"?"margin-left":"margin-bottom"))}function Et(t){return(Array.isArray(t)?t:[t]).filter(e=>!!e)}function bc(t){return e=>Math.abs(e)>0&&t.browser&&t.browser.need3dFix&&Math.abs(e)%90===0?e+.001:e}let Td;function OK(){const t=tr(),e=yr();return{smoothScroll:e.documentElement&&e.documentElement.style&&"scrollBehavior"in e.documentElement.style,touch:!!("ontouchstart"in t||t.DocumentTouch&&e instanceof t.DocumentTouch)}}function zS(){return Td||(Td=OK()),Td}let vd;function IK(t){let{userAgent:e}=t===void 0?{}:t;const r=zS(),n=tr(),i=n.navigator.platform,s=e||n.navigator.userAgent,o={ios:!1,android:!1},f=n.screen.width,c=n.screen.height,d=s.match(/(Android);?[\s\/]+([\d.]+)?/);let p=s.match(/(iPad).*OS\s([\d_]+)/);const E=s.match(/(iPod)(.*OS\s([\d_]+))?/),m=!p&&s.match(/(iPhone\sOS|iOS)\s([\d_]+)/),g=i==="Win32";let _=i==="MacIntel";const b=["1024x1366","1366x1024","834x1194","1194x834","834x1112","1112x834","768x1024","1024x768","820x1180","1180x820","810x1080","1080x810"];return!p&&_&&r.touch&&b.indexOf(`${f}x${c}`)>=0&&(p=s.match(/(Version)\/([\d.]+)/),p||(p=[0,1,"13_0_0"]),_=!1),d&&!g&&(o.os="android",o.android=!0),(p||m||E)&&(o.os="ios",o.ios=!0),o}function qS(t){return t===void 0&&(t={}),vd||(vd=IK(t)),vd}let bd;function NK(){const t=tr(),e=qS();let r=!1;function n(){const f=t.navigator.userAgent.toLowerCase();return f.indexOf("safari")>=0&&f.indexOf("chrome")<0&&f.indexOf("android")<0}if(n()){const f=String(t.navigator.userAgent);if(f.includes("Version/")){const[c,d]=f.split("Version/")[1].split(" ")[0].split(".").map(p=>Number(p));r=c<16||c===16&&d<2}}const i=/(iPhone|iPod|iPad).*AppleWebKit(?!.*Safari)/i.test(t.navigator.userAgent),s=n(),o=s||i&&e.ios;return{isSafari:r||s,needPerspectiveFix:r,need3dFix:o,isWebView:i}}function PK(){return bd||(bd=NK()),bd}function UK(t){let{swiper:e,on:r,emit:n}=t;const i=tr();let s=null,o=null;const f=()=>{!e||e.destroyed||!e.initialized||(n("beforeResize"),n("resize"))},c=()=>{!e||e.destroyed||!e.initialized||(s=new ResizeObserver(E=>{o=i.requestAnimationFrame(()=>{const{width:m,height:g}=e;let _=m,b=g;E.forEach(x=>{let{contentBoxSize:S,contentRect:y,target:v}=x;v&&v!==e.el||(_=y?y.width:(S[0]||S).inlineSize,b=y?y.height:(S[0]||S).blockSize)}),(_!==m||b!==g)&&f()})}),s.observe(e.el))},d=()=>{o&&i.cancelAnimationFrame(o),s&&s.unobserve&&e.el&&(s.unobserve(e.el),s=null)},p=()=>{!e||e.destroyed||!e.initialized||n("orientationchange")};r("init",()=>{if(e.params.resizeObserver&&typeof i.ResizeObserver<"u"){c();return}i.addEventListener("resize",f),i.addEventListener("orientationchange",p)}),r("destroy",()=>{d(),i.removeEventListener("resize",f),i.removeEventListener("orientationchange",p)})}function DK(t){let{swiper:e,extendParams:r,on:n,emit:i}=t;const s=[],o=tr(),f=function(p,E){E===void 0&&(E={});const m=o.MutationObserver||o.WebkitMutationObserver,g=new m(_=>{if(e.__preventObserver__)return;if(_.length===1){i("observerUpdate",_[0]);return}const b=function(){i("observerUpdate",_[0])};o.requestAnimationFrame?o.requestAnimationFrame(b):o.setTimeout(b,0)});g.observe(p,{attributes:typeof E.attributes>"u"?!0:E.attributes,childList:e.isElement||(typeof E.childList>"u"?!0:E).childList,characterData:typeof E.characterData>"u"?!0:E.characterData}),s.push(g)},c=()=>{if(e.params.observer){if(e.params.observeParents){const p=Js(e.hostEl);for(let E=0;E<p.length;E+=1)f(p[E])}f(e.hostEl,{childList:e.params.observeSlideChildren}),f(e.wrapperEl,{attributes:!1})}},d=()=>{s.forEach(p=>{p.disconnect()}),s.splice(0,s.length)};r({observer:!1,observeParents:!1,observeSlideChildren:!1}),n("init",c),n("destroy",d)}var BK={on(t,e,r){const n=this;if(!n.eventsListeners||n.destroyed||typeof e!="function")return n;const i=r?"unshift":"push";return t.split(" ").forEach(s=>{n.eventsListeners[s]||(n.eventsListeners[s]=[]),n.eventsListeners[s][i](e)}),n},once(t,e,r){const n=this;if(!n.eventsListeners||n.destroyed||typeof e!="function")return n;function i(){n.off(t,i),i.__emitterProxy&&delete i.__emitterProxy;for(var s=arguments.length,o=new Array(s),f=0;f<s;f++)o[f]=arguments[f];e.apply(n,o)}return i.__emitterProxy=e,n.on(t,i,r)},onAny(t,e){const r=this;if(!r.eventsListeners||r.destroyed||typeof t!="function")return r;const n=e?"unshift":"push";return r.eventsAnyListeners.indexOf(t)<0&&r.eventsAnyListeners[n](t),r},offAny(t){const e=this;if(!e.eventsListeners||e.destroyed||!e.eventsAnyListeners)return e;const r=e.eventsAnyListeners.indexOf(t);return r>=0&&e.eventsAnyListeners.splice(r,1),e},off(t,e){const r=this;return!r.eventsListeners||r.destroyed||!r.eventsListeners||t.split(" ").forEach(n=>{typeof e>"u"?r.eventsListeners[n]=[]:r.eventsListeners[n]&&r.eventsListeners[n].forEach((i,s)=>{(i===e||i.__emitterProxy&&i.__emitterProxy===e)&&r.eventsListeners[n].splice(s,1)})}),r},emit(){const t=this;if(!t.eventsListeners||t.destroyed||!t.eventsListeners)return t;let e,r,n;for(var i=arguments.length,s=new Array(i),o=0;o<i;o++)s[o]=arguments[o];return typeof s[0]=="string"||Array.isArray(s[0])?(e=s[0],r=s.slice(1,s.length),n=t):(e=s[0].events,r=s[0].data,n=s[0].context||t),r.unshift(n),(Array.isArray(e)?e:e.split(" ")).forEach(c=>{t.eventsAnyListeners&&t.eventsAnyListeners.length&&t.eventsAnyListeners.forEach(d=>{d.apply(n,[c,...r])}),t.eventsListeners&&t.eventsListeners[c]&&t.eventsListeners[c].forEach(d=>{d.apply(n,r)})}),t}};function MK(){const t=this;let e,r;const n=t.el;typeof t.params.width<"u"&&t.params.width!==null?e=t.params.width:e=n.clientWidth,typeof t.params.height<"u"&&t.params.height!==null?r=t.params.height:r=n.clientHeight,!(e===0&&t.isHorizontal()||r===0&&t.isVertical())&&(e=e-parseInt(as(n,"padding-left")||0,10)-parseInt(as(n,"padding-right")||0,10),r=r-parseInt(as(n,"padding-top")||0,10)-parseInt(as(n,"padding-bottom")||0,10),Number.isNaN(e)&&(e=0),Number.isNaN(r)&&(r=0),Object.assign(t,{width:e,height:r,size:t.isHorizontal()?e:r}))}function $K(){const t=this;function e(z,ie){return parseFloat(z.getPropertyValue(t.getDirectionLabel(ie))||0)}const r=t.params,{wrapperEl:n,slidesEl:i,size:s,rtlTranslate:o,wrongRTL:f}=t,c=t.virtual&&r.virtual.enabled,d=c?t.virtual.slides.length:t.slides.length,p=Rr(i,`.${t.params.slideClass}, swiper-slide`),E=c?t.virtual.slides.length:p.length;let m=[];const g=[],_=[];let b=r.slidesOffsetBefore;typeof b=="function"&&(b=r.slidesOffsetBefore.call(t));let x=r.slidesOffsetAfter;typeof x=="function"&&(x=r.slidesOffsetAfter.call(t));const S=t.snapGrid.length,y=t.slidesGrid.length;let v=r.spaceBetween,R=-b,w=0,M=0;if(typeof s>"u")return;typeof v=="string"&&v.indexOf("%")>=0?v=parseFloat(v.replace("%",""))/100*s:typeof v=="string"&&(v=parseFloat(v)),t.virtualSize=-v,p.forEach(z=>{o?z.style.marginLeft="":z.style.marginRight="",z.style.marginBottom="",z.style.marginTop=""}),r.centeredSlides&&r.cssMode&&(sl(n,"--swiper-centered-offset-before",""),sl(n,"--swiper-centered-offset-after",""));const k=r.grid&&r.grid.rows>1&&t.grid;k?t.grid.initSlides(p):t.grid&&t.grid.unsetSlides();let H;const O=r.slidesPerView==="auto"&&r.breakpoints&&Object.keys(r.breakpoints).filter(z=>typeof r.breakpoints[z].slidesPerView<"u").length>0;for(let z=0;z<E;z+=1){H=0;let ie;if(p[z]&&(ie=p[z]),k&&t.grid.updateSlide(z,ie,p),!(p[z]&&as(ie,"display")==="none")){if(r.slidesPerView==="auto"){O&&(p[z].style[t.getDirectionLabel("width")]="");const G=getComputedStyle(ie),X=ie.style.transform,ee=ie.style.webkitTransform;if(X&&(ie.style.transform="none"),ee&&(ie.style.webkitTransform="none"),r.roundLengths)H=t.isHorizontal()?Gh(ie,"width"):Gh(ie,"height");else{const B=e(G,"width"),Q=e(G,"padding-left"),W=e(G,"padding-right"),j=e(G,"margin-left"),ue=e(G,"margin-right"),ve=G.getPropertyValue("box-sizing");if(ve&&ve==="border-box")H=B+j+ue;else{const{clientWidth:ae,offsetWidth:he}=ie;H=B+Q+W+j+ue+(he-ae)}}X&&(ie.style.transform=X),ee&&(ie.style.webkitTransform=ee),r.roundLengths&&(H=Math.floor(H))}else H=(s-(r.slidesPerView-1)*v)/r.slidesPerView,r.roundLengths&&(H=Math.floor(H)),p[z]&&(p[z].style[t.getDirectionLabel("width")]=`${H}px`);p[z]&&(p[z].swiperSlideSize=H),_.push(H),r.centeredSlides?(R=R+H/2+w/2+v,w===0&&z!==0&&(R=R-s/2-v),z===0&&(R=R-s/2-v),Math.abs(R)<1/1e3&&(R=0),r.roundLengths&&(R=Math.floor(R)),M%r.slidesPerGroup===0&&m.push(R),g.push(R)):(r.roundLengths&&(R=Math.floor(R)),(M-Math.min(t.params.slidesPerGroupSkip,M))%t.params.slidesPerGroup===0&&m.push(R),g.push(R),R=R+H+v),t.virtualSize+=H+v,w=H,M+=1}}if(t.virtualSize=Math.max(t.virtualSize,s)+x,o&&f&&(r.effect==="slide"||r.effect==="coverflow")&&(n.style.width=`${t.virtualSize+v}px`),r.setWrapperSize&&(n.style[t.getDirectionLabel("width")]=`${t.virtualSize+v}px`),k&&t.grid.updateWrapperSize(H,m),!r.centeredSlides){const z=[];for(let ie=0;ie<m.length;ie+=1){let G=m[ie];r.roundLengths&&(G=Math.floor(G)),m[ie]<=t.virtualSize-s&&z.push(G)}m=z,Math.floor(t.virtualSize-s)-Math.floor(m[m.length-1])>1&&m.push(t.virtualSize-s)}if(c&&r.loop){const z=_[0]+v;if(r.slidesPerGroup>1){const ie=Math.ceil((t.virtual.slidesBefore+t.virtual.slidesAfter)/r.slidesPerGroup),G=z*r.slidesPerGroup;for(let X=0;X<ie;X+=1)m.push(m[m.length-1]+G)}for(let ie=0;ie<t.virtual.slidesBefore+t.virtual.slidesAfter;ie+=1)r.slidesPerGroup===1&&m.push(m[m.length-1]+z),g.push(g[g.length-1]+z),t.virtualSize+=z}if(m.length===0&&(m=[0]),v!==0){const z=t.isHorizontal()&&o?"marginLeft":t.getDirectionLabel("marginRight");p.filter((ie,G)=>!r.cssMode||r.loop?!0:G!==p.length-1).forEach(ie=>{ie.style[z]=`${v}px`})}if(r.centeredSlides&&r.centeredSlidesBounds){let z=0;_.forEach(G=>{z+=G+(v||0)}),z-=v;const ie=z>s?z-s:0;m=m.map(G=>G<=0?-b:G>ie?ie+x:G)}if(r.centerInsufficientSlides){let z=0;_.forEach(G=>{z+=G+(v||0)}),z-=v;const ie=(r.slidesOffsetBefore||0)+(r.slidesOffsetAfter||0);if(z+ie<s){const G=(s-z-ie)/2;m.forEach((X,ee)=>{m[ee]=X-G}),g.forEach((X,ee)=>{g[ee]=X+G})}}if(Object.assign(t,{slides:p,snapGrid:m,slidesGrid:g,slidesSizesGrid:_}),r.centeredSlides&&r.cssMode&&!r.centeredSlidesBounds){sl(n,"--swiper-centered-offset-before",`${-m[0]}px`),sl(n,"--swiper-centered-offset-after",`${t.size/2-_[_.length-1]/2}px`);const z=-t.snapGrid[0],ie=-t.slidesGrid[0];t.snapGrid=t.snapGrid.map(G=>G+z),t.slidesGrid=t.slidesGrid.map(G=>G+ie)}if(E!==d&&t.emit("slidesLengthChange"),m.length!==S&&(t.params.watchOverflow&&t.checkOverflow(),t.emit("snapGridLengthChange")),g.length!==y&&t.emit("slidesGridLengthChange"),r.watchSlidesProgress&&t.updateSlidesOffset(),t.emit("slidesUpdated"),!c&&!r.cssMode&&(r.effect==="slide"||r.effect==="fade")){const z=`${r.containerModifierClass}backface-hidden`,ie=t.el.classList.contains(z);E<=r.maxBackfaceHiddenSlides?ie||t.el.classList.add(z):ie&&t.el.classList.remove(z)}}function KK(t){const e=this,r=[],n=e.virtual&&e.params.virtual.enabled;let i=0,s;typeof t=="number"?e.setTransition(t):t===!0&&e.setTransition(e.params.speed);const o=f=>n?e.slides[e.getSlideIndexByData(f)]:e.slides[f];if(e.params.slidesPerView!=="auto"&&e.params.slidesPerView>1)if(e.params.centeredSlides)(e.visibleSlides||[]).forEach(f=>{r.push(f)});else for(s=0;s<Math.ceil(e.params.slidesPerView);s+=1){const f=e.activeIndex+s;if(f>e.slides.length&&!n)break;r.push(o(f))}else r.push(o(e.activeIndex));for(s=0;s<r.length;s+=1)if(typeof r[s]<"u"){const f=r[s].offsetHeight;i=f>i?f:i}(i||i===0)&&(e.wrapperEl.style.height=`${i}px`)}function kK(){const t=this,e=t.slides,r=t.isElement?t.isHorizontal()?t.wrapperEl.offsetLeft:t.wrapperEl.offsetTop:0;for(let n=0;n<e.length;n+=1)e[n].swiperSlideOffset=(t.isHorizontal()?e[n].offsetLeft:e[n].offsetTop)-r-t.cssOverflowAdjustment()}const Sv=(t,e,r)=>{e&&!t.classList.contains(r)?t.classList.add(r):!e&&t.classList.contains(r)&&t.classList.remove(r)};function GK(t){t===void 0&&(t=this&&this.translate||0);const e=this,r=e.params,{slides:n,rtlTranslate:i,snapGrid:s}=e;if(n.length===0)return;typeof n[0].swiperSlideOffset>"u"&&e.updateSlidesOffset();let o=-t;i&&(o=t),e.visibleSlidesIndexes=[],e.visibleSlides=[];let f=r.spaceBetween;typeof f=="string"&&f.indexOf("%")>=0?f=parseFloat(f.replace("%",""))/100*e.size:typeof f=="string"&&(f=parseFloat(f));for(let c=0;c<n.length;c+=1){const d=n[c];let p=d.swiperSlideOffset;r.cssMode&&r.centeredSlides&&(p-=n[0].swiperSlideOffset);const E=(o+(r.centeredSlides?e.minTranslate():0)-p)/(d.swiperSlideSize+f),m=(o-s[0]+(r.centeredSlides?e.minTranslate():0)-p)/(d.swiperSlideSize+f),g=-(o-p),_=g+e.slidesSizesGrid[c],b=g>=0&&g<=e.size-e.slidesSizesGrid[c],x=g>=0&&g<e.size-1||_>1&&_<=e.size||g<=0&&_>=e.size;x&&(e.visibleSlides.push(d),e.visibleSlidesIndexes.push(c)),Sv(d,x,r.slideVisibleClass),Sv(d,b,r.slideFullyVisibleClass),d.progress=i?-E:E,d.originalProgress=i?-m:m}}function VK(t){const e=this;if(typeof t>"u"){const p=e.rtlTranslate?-1:1;t=e&&e.translate&&e.translate*p||0}const r=e.params,n=e.maxTranslate()-e.minTranslate();let{progress:i,isBeginning:s,isEnd:o,progressLoop:f}=e;const c=s,d=o;if(n===0)i=0,s=!0,o=!0;else{i=(t-e.minTranslate())/n;const p=Math.abs(t-e.minTranslate())<1,E=Math.abs(t-e.maxTranslate())<1;s=p||i<=0,o=E||i>=1,p&&(i=0),E&&(i=1)}if(r.loop){const p=e.getSlideIndexByData(0),E=e.getSlideIndexByData(e.slides.length-1),m=e.slidesGrid[p],g=e.slidesGrid[E],_=e.slidesGrid[e.slidesGrid.length-1],b=Math.abs(t);b>=m?f=(b-m)/_:f=(b+_-g)/_,f>1&&(f-=1)}Object.assign(e,{progress:i,progressLoop:f,isBeginning:s,isEnd:o}),(r.watchSlidesProgress||r.centeredSlides&&r.autoHeight)&&e.updateSlidesProgress(t),s&&!c&&e.emit("reachBeginning toEdge"),o&&!d&&e.emit("reachEnd toEdge"),(c&&!s||d&&!o)&&e.emit("fromEdge"),e.emit("progress",i)}const xd=(t,e,r)=>{e&&!t.classList.contains(r)?t.classList.add(r):!e&&t.classList.contains(r)&&t.classList.remove(r)};function FK(){const t=this,{slides:e,params:r,slidesEl:n,activeIndex:i}=t,s=t.virtual&&r.virtual.enabled,o=t.grid&&r.grid&&r.grid.rows>1,f=E=>Rr(n,`.${r.slideClass}${E}, swiper-slide${E}`)[0];let c,d,p;if(s)if(r.loop){let E=i-t.virtual.slidesBefore;E<0&&(E=t.virtual.slides.length+E),E>=t.virtual.slides.length&&(E-=t.virtual.slides.length),c=f(`[data-swiper-slide-index="${E}"]`)}else c=f(`[data-swiper-slide-index="${i}"]`);else o?(c=e.filter(E=>E.column===i)[0],p=e.filter(E=>E.column===i+1)[0],d=e.filter(E=>E.column===i-1)[0]):c=e[i];c&&(o||(p=wK(c,`.${r.slideClass}, swiper-slide`)[0],r.loop&&!p&&(p=e[0]),d=CK(c,`.${r.slideClass}, swiper-slide`)[0],r.loop&&!d===0&&(d=e[e.length-1]))),e.forEach(E=>{xd(E,E===c,r.slideActiveClass),xd(E,E===p,r.slideNextClass),xd(E,E===d,r.slidePrevClass)}),t.emitSlidesClasses()}const cf=(t,e)=>{if(!t||t.destroyed||!t.params)return;const r=()=>t.isElement?"swiper-slide":`.${t.params.slideClass}`,n=e.closest(r());if(n){let i=n.querySelector(`.${t.params.lazyPreloaderClass}`);!i&&t.isElement&&(n.shadowRoot?i=n.shadowRoot.querySelector(`.${t.params.lazyPreloaderClass}`):requestAnimationFrame(()=>{n.shadowRoot&&(i=n.shadowRoot.querySelector(`.${t.params.lazyPreloaderClass}`),i&&i.remove())})),i&&i.remove()}},Rd=(t,e)=>{if(!t.slides[e])return;const r=t.slides[e].querySelector('[loading="lazy"]');r&&r.removeAttribute("loading")},Vh=t=>{if(!t||t.destroyed||!t.params)return;let e=t.params.lazyPreloadPrevNext;const r=t.slides.length;if(!r||!e||e<0)return;e=Math.min(e,r);const n=t.params.slidesPerView==="auto"?t.slidesPerViewDynamic():Math.ceil(t.params.slidesPerView),i=t.activeIndex;if(t.params.grid&&t.params.grid.rows>1){const o=i,f=[o-e];f.push(...Array.from({length:e}).map((c,d)=>o+n+d)),t.slides.forEach((c,d)=>{f.includes(c.column)&&Rd(t,d)});return}const s=i+n-1;if(t.params.rewind||t.params.loop)for(let o=i-e;o<=s+e;o+=1){const f=(o%r+r)%r;(f<i||f>s)&&Rd(t,f)}else for(let o=Math.max(i-e,0);o<=Math.min(s+e,r-1);o+=1)o!==i&&(o>s||o<i)&&Rd(t,o)};function HK(t){const{slidesGrid:e,params:r}=t,n=t.rtlTranslate?t.translate:-t.translate;let i;for(let s=0;s<e.length;s+=1)typeof e[s+1]<"u"?n>=e[s]&&n<e[s+1]-(e[s+1]-e[s])/2?i=s:n>=e[s]&&n<e[s+1]&&(i=s+1):n>=e[s]&&(i=s);return r.normalizeSlideIndex&&(i<0||typeof i>"u")&&(i=0),i}function WK(t){const e=this,r=e.rtlTranslate?e.translate:-e.translate,{snapGrid:n,params:i,activeIndex:s,realIndex:o,snapIndex:f}=e;let c=t,d;const p=g=>{let _=g-e.virtual.slidesBefore;return _<0&&(_=e.virtual.slides.length+_),_>=e.virtual.slides.length&&(_-=e.virtual.slides.length),_};if(typeof c>"u"&&(c=HK(e)),n.indexOf(r)>=0)d=n.indexOf(r);else{const g=Math.min(i.slidesPerGroupSkip,c);d=g+Math.floor((c-g)/i.slidesPerGroup)}if(d>=n.length&&(d=n.length-1),c===s&&!e.params.loop){d!==f&&(e.snapIndex=d,e.emit("snapIndexChange"));return}if(c===s&&e.params.loop&&e.virtual&&e.params.virtual.enabled){e.realIndex=p(c);return}const E=e.grid&&i.grid&&i.grid.rows>1;let m;if(e.virtual&&i.virtual.enabled&&i.loop)m=p(c);else if(E){const g=e.slides.filter(b=>b.column===c)[0];let _=parseInt(g.getAttribute("data-swiper-slide-index"),10);Number.isNaN(_)&&(_=Math.max(e.slides.indexOf(g),0)),m=Math.floor(_/i.grid.rows)}else if(e.slides[c]){const g=e.slides[c].getAttribute("data-swiper-slide-index");g?m=parseInt(g,10):m=c}else m=c;Object.assign(e,{previousSnapIndex:f,snapIndex:d,previousRealIndex:o,realIndex:m,previousIndex:s,activeIndex:c}),e.initialized&&Vh(e),e.emit("activeIndexChange"),e.emit("snapIndexChange"),(e.initialized||e.params.runCallbacksOnInit)&&(o!==m&&e.emit("realIndexChange"),e.emit("slideChange"))}function XK(t,e){const r=this,n=r.params;let i=t.closest(`.${n.slideClass}, swiper-slide`);!i&&r.isElement&&e&&e.length>1&&e.includes(t)&&[...e.slice(e.indexOf(t)+1,e.length)].forEach(f=>{!i&&f.matches&&f.matches(`.${n.slideClass}, swiper-slide`)&&(i=f)});let s=!1,o;if(i){for(let f=0;f<r.slides.length;f+=1)if(r.slides[f]===i){s=!0,o=f;break}}if(i&&s)r.clickedSlide=i,r.virtual&&r.params.virtual.enabled?r.clickedIndex=parseInt(i.getAttribute("data-swiper-slide-index"),10):r.clickedIndex=o;else{r.clickedSlide=void 0,r.clickedIndex=void 0;return}n.slideToClickedSlide&&r.clickedIndex!==void 0&&r.clickedIndex!==r.activeIndex&&r.slideToClickedSlide()}var jK={updateSize:MK,updateSlides:$K,updateAutoHeight:KK,updateSlidesOffset:kK,updateSlidesProgress:GK,updateProgress:VK,updateSlidesClasses:FK,updateActiveIndex:WK,updateClickedSlide:XK};function zK(t){t===void 0&&(t=this.isHorizontal()?"x":"y");const e=this,{params:r,rtlTranslate:n,translate:i,wrapperEl:s}=e;if(r.virtualTranslate)return n?-i:i;if(r.cssMode)return i;let o=kh(s,t);return o+=e.cssOverflowAdjustment(),n&&(o=-o),o||0}function qK(t,e){const r=this,{rtlTranslate:n,params:i,wrapperEl:s,progress:o}=r;let f=0,c=0;const d=0;r.isHorizontal()?f=n?-t:t:c=t,i.roundLengths&&(f=Math.floor(f),c=Math.floor(c)),r.previousTranslate=r.translate,r.translate=r.isHorizontal()?f:c,i.cssMode?s[r.isHorizontal()?"scrollLeft":"scrollTop"]=r.isHorizontal()?-f:-c:i.virtualTranslate||(r.isHorizontal()?f-=r.cssOverflowAdjustment():c-=r.cssOverflowAdjustment(),s.style.transform=`translate3d(${f}px, ${c}px, ${d}px)`);let p;const E=r.maxTranslate()-r.minTranslate();E===0?p=0:p=(t-r.minTranslate())/E,p!==o&&r.updateProgress(t),r.emit("setTranslate",r.translate,e)}function YK(){return-this.snapGrid[0]}function JK(){return-this.snapGrid[this.snapGrid.length-1]}function QK(t,e,r,n,i){t===void 0&&(t=0),e===void 0&&(e=this.params.speed),r===void 0&&(r=!0),n===void 0&&(n=!0);const s=this,{params:o,wrapperEl:f}=s;if(s.animating&&o.preventInteractionOnTransition)return!1;const c=s.minTranslate(),d=s.maxTranslate();let p;if(n&&t>c?p=c:n&&t<d?p=d:p=t,s.updateProgress(p),o.cssMode){const E=s.isHorizontal();if(e===0)f[E?"scrollLeft":"scrollTop"]=-p;else{if(!s.support.smoothScroll)return jS({swiper:s,targetPosition:-p,side:E?"left":"top"}),!0;f.scrollTo({[E?"left":"top"]:-p,behavior:"smooth"})}return!0}return e===0?(s.setTransition(0),s.setTranslate(p),r&&(s.emit("beforeTransitionStart",e,i),s.emit("transitionEnd"))):(s.setTransition(e),s.setTranslate(p),r&&(s.emit("beforeTransitionStart",e,i),s.emit("transitionStart")),s.animating||(s.animating=!0,s.onTranslateToWrapperTransitionEnd||(s.onTranslateToWrapperTransitionEnd=function(m){!s||s.destroyed||m.target===this&&(s.wrapperEl.removeEventListener("transitionend",s.onTranslateToWrapperTransitionEnd),s.onTranslateToWrapperTransitionEnd=null,delete s.onTranslateToWrapperTransitionEnd,s.animating=!1,r&&s.emit("transitionEnd"))}),s.wrapperEl.addEventListener("transitionend",s.onTranslateToWrapperTransitionEnd))),!0}var ZK={getTranslate:zK,setTranslate:qK,minTranslate:YK,maxTranslate:JK,translateTo:QK};function ek(t,e){const r=this;r.params.cssMode||(r.wrapperEl.style.transitionDuration=`${t}ms`,r.wrapperEl.style.transitionDelay=t===0?"0ms":""),r.emit("setTransition",t,e)}function YS(t){let{swiper:e,runCallbacks:r,direction:n,step:i}=t;const{activeIndex:s,previousIndex:o}=e;let f=n;if(f||(s>o?f="next":s<o?f="prev":f="reset"),e.emit(`transition${i}`),r&&s!==o){if(f==="reset"){e.emit(`slideResetTransition${i}`);return}e.emit(`slideChangeTransition${i}`),f==="next"?e.emit(`slideNextTransition${i}`):e.emit(`slidePrevTransition${i}`)}}function tk(t,e){t===void 0&&(t=!0);const r=this,{params:n}=r;n.cssMode||(n.autoHeight&&r.updateAutoHeight(),YS({swiper:r,runCallbacks:t,direction:e,step:"Start"}))}function rk(t,e){t===void 0&&(t=!0);const r=this,{params:n}=r;r.animating=!1,!n.cssMode&&(r.setTransition(0),YS({swiper:r,runCallbacks:t,direction:e,step:"End"}))}var nk={setTransition:ek,transitionStart:tk,transitionEnd:rk};function ik(t,e,r,n,i){t===void 0&&(t=0),r===void 0&&(r=!0),typeof t=="string"&&(t=parseInt(t,10));const s=this;let o=t;o<0&&(o=0);const{params:f,snapGrid:c,slidesGrid:d,previousIndex:p,activeIndex:E,rtlTranslate:m,wrapperEl:g,enabled:_}=s;if(!_&&!n&&!i||s.destroyed||s.animating&&f.preventInteractionOnTransition)return!1;typeof e>"u"&&(e=s.params.speed);const b=Math.min(s.params.slidesPerGroupSkip,o);let x=b+Math.floor((o-b)/s.params.slidesPerGroup);x>=c.length&&(x=c.length-1);const S=-c[x];if(f.normalizeSlideIndex)for(let w=0;w<d.length;w+=1){const M=-Math.floor(S*100),k=Math.floor(d[w]*100),H=Math.floor(d[w+1]*100);typeof d[w+1]<"u"?M>=k&&M<H-(H-k)/2?o=w:M>=k&&M<H&&(o=w+1):M>=k&&(o=w)}if(s.initialized&&o!==E&&(!s.allowSlideNext&&(m?S>s.translate&&S>s.minTranslate():S<s.translate&&S<s.minTranslate())||!s.allowSlidePrev&&S>s.translate&&S>s.maxTranslate()&&(E||0)!==o))return!1;o!==(p||0)&&r&&s.emit("beforeSlideChangeStart"),s.updateProgress(S);let y;o>E?y="next":o<E?y="prev":y="reset";const v=s.virtual&&s.params.virtual.enabled;if(!(v&&i)&&(m&&-S===s.translate||!m&&S===s.translate))return s.updateActiveIndex(o),f.autoHeight&&s.updateAutoHeight(),s.updateSlidesClasses(),f.effect!=="slide"&&s.setTranslate(S),y!=="reset"&&(s.transitionStart(r,y),s.transitionEnd(r,y)),!1;if(f.cssMode){const w=s.isHorizontal(),M=m?S:-S;if(e===0)v&&(s.wrapperEl.style.scrollSnapType="none",s._immediateVirtual=!0),v&&!s._cssModeVirtualInitialSet&&s.params.initialSlide>0?(s._cssModeVirtualInitialSet=!0,requestAnimationFrame(()=>{g[w?"scrollLeft":"scrollTop"]=M})):g[w?"scrollLeft":"scrollTop"]=M,v&&requestAnimationFrame(()=>{s.wrapperEl.style.scrollSnapType="",s._immediateVirtual=!1});else{if(!s.support.smoothScroll)return jS({swiper:s,targetPosition:M,side:w?"left":"top"}),!0;g.scrollTo({[w?"left":"top"]:M,behavior:"smooth"})}return!0}return s.setTransition(e),s.setTranslate(S),s.updateActiveIndex(o),s.updateSlidesClasses(),s.emit("beforeTransitionStart",e,n),s.transitionStart(r,y),e===0?s.transitionEnd(r,y):s.animating||(s.animating=!0,s.onSlideToWrapperTransitionEnd||(s.onSlideToWrapperTransitionEnd=function(M){!s||s.destroyed||M.target===this&&(s.wrapperEl.removeEventListener("transitionend",s.onSlideToWrapperTransitionEnd),s.onSlideToWrapperTransitionEnd=null,delete s.onSlideToWrapperTransitionEnd,s.transitionEnd(r,y))}),s.wrapperEl.addEventListener("transitionend",s.onSlideToWrapperTransitionEnd)),!0}function sk(t,e,r,n){t===void 0&&(t=0),r===void 0&&(r=!0),typeof t=="string"&&(t=parseInt(t,10));const i=this;if(i.destroyed)return;typeof e>"u"&&(e=i.params.speed);const s=i.grid&&i.params.grid&&i.params.grid.rows>1;let o=t;if(i.params.loop)if(i.virtual&&i.params.virtual.enabled)o=o+i.virtual.slidesBefore;else{let f;if(s){const m=o*i.params.grid.rows;f=i.slides.filter(g=>g.getAttribute("data-swiper-slide-index")*1===m)[0].column}else f=i.getSlideIndexByData(o);const c=s?Math.ceil(i.slides.length/i.params.grid.rows):i.slides.length,{centeredSlides:d}=i.params;let p=i.params.slidesPerView;p==="auto"?p=i.slidesPerViewDynamic():(p=Math.ceil(parseFloat(i.params.slidesPerView,10)),d&&p%2===0&&(p=p+1));let E=c-f<p;if(d&&(E=E||f<Math.ceil(p/2)),n&&d&&i.params.slidesPerView!=="auto"&&!s&&(E=!1),E){const m=d?f<i.activeIndex?"prev":"next":f-i.activeIndex-1<i.params.slidesPerView?"next":"prev";i.loopFix({direction:m,slideTo:!0,activeSlideIndex:m==="next"?f+1:f-c+1,slideRealIndex:m==="next"?i.realIndex:void 0})}if(s){const m=o*i.params.grid.rows;o=i.slides.filter(g=>g.getAttribute("data-swiper-slide-index")*1===m)[0].column}else o=i.getSlideIndexByData(o)}return requestAnimationFrame(()=>{i.slideTo(o,e,r,n)}),i}function ak(t,e,r){e===void 0&&(e=!0);const n=this,{enabled:i,params:s,animating:o}=n;if(!i||n.destroyed)return n;typeof t>"u"&&(t=n.params.speed);let f=s.slidesPerGroup;s.slidesPerView==="auto"&&s.slidesPerGroup===1&&s.slidesPerGroupAuto&&(f=Math.max(n.slidesPerViewDynamic("current",!0),1));const c=n.activeIndex<s.slidesPerGroupSkip?1:f,d=n.virtual&&s.virtual.enabled;if(s.loop){if(o&&!d&&s.loopPreventsSliding)return!1;if(n.loopFix({direction:"next"}),n._clientLeft=n.wrapperEl.clientLeft,n.activeIndex===n.slides.length-1&&s.cssMode)return requestAnimationFrame(()=>{n.slideTo(n.activeIndex+c,t,e,r)}),!0}return s.rewind&&n.isEnd?n.slideTo(0,t,e,r):n.slideTo(n.activeIndex+c,t,e,r)}function ok(t,e,r){e===void 0&&(e=!0);const n=this,{params:i,snapGrid:s,slidesGrid:o,rtlTranslate:f,enabled:c,animating:d}=n;if(!c||n.destroyed)return n;typeof t>"u"&&(t=n.params.speed);const p=n.virtual&&i.virtual.enabled;if(i.loop){if(d&&!p&&i.loopPreventsSliding)return!1;n.loopFix({direction:"prev"}),n._clientLeft=n.wrapperEl.clientLeft}const E=f?n.translate:-n.translate;function m(S){return S<0?-Math.floor(Math.abs(S)):Math.floor(S)}const g=m(E),_=s.map(S=>m(S));let b=s[_.indexOf(g)-1];if(typeof b>"u"&&i.cssMode){let S;s.forEach((y,v)=>{g>=y&&(S=v)}),typeof S<"u"&&(b=s[S>0?S-1:S])}let x=0;if(typeof b<"u"&&(x=o.indexOf(b),x<0&&(x=n.activeIndex-1),i.slidesPerView==="auto"&&i.slidesPerGroup===1&&i.slidesPerGroupAuto&&(x=x-n.slidesPerViewDynamic("previous",!0)+1,x=Math.max(x,0))),i.rewind&&n.isBeginning){const S=n.params.virtual&&n.params.virtual.enabled&&n.virtual?n.virtual.slides.length-1:n.slides.length-1;return n.slideTo(S,t,e,r)}else if(i.loop&&n.activeIndex===0&&i.cssMode)return requestAnimationFrame(()=>{n.slideTo(x,t,e,r)}),!0;return n.slideTo(x,t,e,r)}function lk(t,e,r){e===void 0&&(e=!0);const n=this;if(!n.destroyed)return typeof t>"u"&&(t=n.params.speed),n.slideTo(n.activeIndex,t,e,r)}function uk(t,e,r,n){e===void 0&&(e=!0),n===void 0&&(n=.5);const i=this;if(i.destroyed)return;typeof t>"u"&&(t=i.params.speed);let s=i.activeIndex;const o=Math.min(i.params.slidesPerGroupSkip,s),f=o+Math.floor((s-o)/i.params.slidesPerGroup),c=i.rtlTranslate?i.translate:-i.translate;if(c>=i.snapGrid[f]){const d=i.snapGrid[f],p=i.snapGrid[f+1];c-d>(p-d)*n&&(s+=i.params.slidesPerGroup)}else{const d=i.snapGrid[f-1],p=i.snapGrid[f];c-d<=(p-d)*n&&(s-=i.params.slidesPerGroup)}return s=Math.max(s,0),s=Math.min(s,i.slidesGrid.length-1),i.slideTo(s,t,e,r)}function fk(){const t=this;if(t.destroyed)return;const{params:e,slidesEl:r}=t,n=e.slidesPerView==="auto"?t.slidesPerViewDynamic():e.slidesPerView;let i=t.clickedIndex,s;const o=t.isElement?"swiper-slide":`.${e.slideClass}`;if(e.loop){if(t.animating)return;s=parseInt(t.clickedSlide.getAttribute("data-swiper-slide-index"),10),e.centeredSlides?i<t.loopedSlides-n/2||i>t.slides.length-t.loopedSlides+n/2?(t.loopFix(),i=t.getSlideIndex(Rr(r,`${o}[data-swiper-slide-index="${s}"]`)[0]),na(()=>{t.slideTo(i)})):t.slideTo(i):i>t.slides.length-n?(t.loopFix(),i=t.getSlideIndex(Rr(r,`${o}[data-swiper-slide-index="${s}"]`)[0]),na(()=>{t.slideTo(i)})):t.slideTo(i)}else t.slideTo(i)}var ck={slideTo:ik,slideToLoop:sk,slideNext:ak,slidePrev:ok,slideReset:lk,slideToClosest:uk,slideToClickedSlide:fk};function pk(t){const e=this,{params:r,slidesEl:n}=e;if(!r.loop||e.virtual&&e.params.virtual.enabled)return;const i=()=>{Rr(n,`.${r.slideClass}, swiper-slide`).forEach((E,m)=>{E.setAttribute("data-swiper-slide-index",m)})},s=e.grid&&r.grid&&r.grid.rows>1,o=r.slidesPerGroup*(s?r.grid.rows:1),f=e.slides.length%o!==0,c=s&&e.slides.length%r.grid.rows!==0,d=p=>{for(let E=0;E<p;E+=1){const m=e.isElement?pn("swiper-slide",[r.slideBlankClass]):pn("div",[r.slideClass,r.slideBlankClass]);e.slidesEl.append(m)}};if(f){if(r.loopAddBlankSlides){const p=o-e.slides.length%o;d(p),e.recalcSlides(),e.updateSlides()}else Df("Swiper Loop Warning: The number of slides is not even to slidesPerGroup, loop mode may not function properly. You need to add more slides (or make duplicates, or empty slides)");i()}else if(c){if(r.loopAddBlankSlides){const p=r.grid.rows-e.slides.length%r.grid.rows;d(p),e.recalcSlides(),e.updateSlides()}else Df("Swiper Loop Warning: The number of slides is not even to grid.rows, loop mode may not function properly. You need to add more slides (or make duplicates, or empty slides)");i()}else i();e.loopFix({slideRealIndex:t,direction:r.centeredSlides?void 0:"next"})}function dk(t){let{slideRealIndex:e,slideTo:r=!0,direction:n,setTranslate:i,activeSlideIndex:s,byController:o,byMousewheel:f}=t===void 0?{}:t;const c=this;if(!c.params.loop)return;c.emit("beforeLoopFix");const{slides:d,allowSlidePrev:p,allowSlideNext:E,slidesEl:m,params:g}=c,{centeredSlides:_}=g;if(c.allowSlidePrev=!0,c.allowSlideNext=!0,c.virtual&&g.virtual.enabled){r&&(!g.centeredSlides&&c.snapIndex===0?c.slideTo(c.virtual.slides.length,0,!1,!0):g.centeredSlides&&c.snapIndex<g.slidesPerView?c.slideTo(c.virtual.slides.length+c.snapIndex,0,!1,!0):c.snapIndex===c.snapGrid.length-1&&c.slideTo(c.virtual.slidesBefore,0,!1,!0)),c.allowSlidePrev=p,c.allowSlideNext=E,c.emit("loopFix");return}let b=g.slidesPerView;b==="auto"?b=c.slidesPerViewDynamic():(b=Math.ceil(parseFloat(g.slidesPerView,10)),_&&b%2===0&&(b=b+1));const x=g.slidesPerGroupAuto?b:g.slidesPerGroup;let S=x;S%x!==0&&(S+=x-S%x),S+=g.loopAdditionalSlides,c.loopedSlides=S;const y=c.grid&&g.grid&&g.grid.rows>1;d.length<b+S?Df("Swiper Loop Warning: The number of slides is not enough for loop mode, it will be disabled and not function properly. You need to add more slides (or make duplicates) or lower the values of slidesPerView and slidesPerGroup parameters"):y&&g.grid.fill==="row"&&Df("Swiper Loop Warning: Loop mode is not compatible with grid.fill = `row`");const v=[],R=[];let w=c.activeIndex;typeof s>"u"?s=c.getSlideIndex(d.filter(X=>X.classList.contains(g.slideActiveClass))[0]):w=s;const M=n==="next"||!n,k=n==="prev"||!n;let H=0,O=0;const z=y?Math.ceil(d.length/g.grid.rows):d.length,G=(y?d[s].column:s)+(_&&typeof i>"u"?-b/2+.5:0);if(G<S){H=Math.max(S-G,x);for(let X=0;X<S-G;X+=1){const ee=X-Math.floor(X/z)*z;if(y){const B=z-ee-1;for(let Q=d.length-1;Q>=0;Q-=1)d[Q].column===B&&v.push(Q)}else v.push(z-ee-1)}}else if(G+b>z-S){O=Math.max(G-(z-S*2),x);for(let X=0;X<O;X+=1){const ee=X-Math.floor(X/z)*z;y?d.forEach((B,Q)=>{B.column===ee&&R.push(Q)}):R.push(ee)}}if(c.__preventObserver__=!0,requestAnimationFrame(()=>{c.__preventObserver__=!1}),k&&v.forEach(X=>{d[X].swiperLoopMoveDOM=!0,m.prepend(d[X]),d[X].swiperLoopMoveDOM=!1}),M&&R.forEach(X=>{d[X].swiperLoopMoveDOM=!0,m.append(d[X]),d[X].swiperLoopMoveDOM=!1}),c.recalcSlides(),g.slidesPerView==="auto"?c.updateSlides():y&&(v.length>0&&k||R.length>0&&M)&&c.slides.forEach((X,ee)=>{c.grid.updateSlide(ee,X,c.slides)}),g.watchSlidesProgress&&c.updateSlidesOffset(),r){if(v.length>0&&k){if(typeof e>"u"){const X=c.slidesGrid[w],B=c.slidesGrid[w+H]-X;f?c.setTranslate(c.translate-B):(c.slideTo(w+Math.ceil(H),0,!1,!0),i&&(c.touchEventsData.startTranslate=c.touchEventsData.startTranslate-B,c.touchEventsData.currentTranslate=c.touchEventsData.currentTranslate-B))}else if(i){const X=y?v.length/g.grid.rows:v.length;c.slideTo(c.activeIndex+X,0,!1,!0),c.touchEventsData.currentTranslate=c.translate}}else if(R.length>0&&M)if(typeof e>"u"){const X=c.slidesGrid[w],B=c.slidesGrid[w-O]-X;f?c.setTranslate(c.translate-B):(c.slideTo(w-O,0,!1,!0),i&&(c.touchEventsData.startTranslate=c.touchEventsData.startTranslate-B,c.touchEventsData.currentTranslate=c.touchEventsData.currentTranslate-B))}else{const X=y?R.length/g.grid.rows:R.length;c.slideTo(c.activeIndex-X,0,!1,!0)}}if(c.allowSlidePrev=p,c.allowSlideNext=E,c.controller&&c.controller.control&&!o){const X={slideRealIndex:e,direction:n,setTranslate:i,activeSlideIndex:s,byController:!0};Array.isArray(c.controller.control)?c.controller.control.forEach(ee=>{!ee.destroyed&&ee.params.loop&&ee.loopFix({...X,slideTo:ee.params.slidesPerView===g.slidesPerView?r:!1})}):c.controller.control instanceof c.constructor&&c.controller.control.params.loop&&c.controller.control.loopFix({...X,slideTo:c.controller.control.params.slidesPerView===g.slidesPerView?r:!1})}c.emit("loopFix")}function hk(){const t=this,{params:e,slidesEl:r}=t;if(!e.loop||t.virtual&&t.params.virtual.enabled)return;t.recalcSlides();const n=[];t.slides.forEach(i=>{const s=typeof i.swiperSlideIndex>"u"?i.getAttribute("data-swiper-slide-index")*1:i.swiperSlideIndex;n[s]=i}),t.slides.forEach(i=>{i.removeAttribute("data-swiper-slide-index")}),n.forEach(i=>{r.append(i)}),t.recalcSlides(),t.slideTo(t.realIndex,0)}var Ek={loopCreate:pk,loopFix:dk,loopDestroy:hk};function mk(t){const e=this;if(!e.params.simulateTouch||e.params.watchOverflow&&e.isLocked||e.params.cssMode)return;const r=e.params.touchEventsTarget==="container"?e.el:e.wrapperEl;e.isElement&&(e.__preventObserver__=!0),r.style.cursor="move",r.style.cursor=t?"grabbing":"grab",e.isElement&&requestAnimationFrame(()=>{e.__preventObserver__=!1})}function gk(){const t=this;t.params.watchOverflow&&t.isLocked||t.params.cssMode||(t.isElement&&(t.__preventObserver__=!0),t[t.params.touchEventsTarget==="container"?"el":"wrapperEl"].style.cursor="",t.isElement&&requestAnimationFrame(()=>{t.__preventObserver__=!1}))}var _k={setGrabCursor:mk,unsetGrabCursor:gk};function Tk(t,e){e===void 0&&(e=this);function r(n){if(!n||n===yr()||n===tr())return null;n.assignedSlot&&(n=n.assignedSlot);const i=n.closest(t);return!i&&!n.getRootNode?null:i||r(n.getRootNode().host)}return r(e)}function yv(t,e,r){const n=tr(),{params:i}=t,s=i.edgeSwipeDetection,o=i.edgeSwipeThreshold;return s&&(r<=o||r>=n.innerWidth-o)?s==="prevent"?(e.preventDefault(),!0):!1:!0}function vk(t){const e=this,r=yr();let n=t;n.originalEvent&&(n=n.originalEvent);const i=e.touchEventsData;if(n.type==="pointerdown"){if(i.pointerId!==null&&i.pointerId!==n.pointerId)return;i.pointerId=n.pointerId}else n.type==="touchstart"&&n.targetTouches.length===1&&(i.touchId=n.targetTouches[0].identifier);if(n.type==="touchstart"){yv(e,n,n.targetTouches[0].pageX);return}const{params:s,touches:o,enabled:f}=e;if(!f||!s.simulateTouch&&n.pointerType==="mouse"||e.animating&&s.preventInteractionOnTransition)return;!e.animating&&s.cssMode&&s.loop&&e.loopFix();let c=n.target;if(s.touchEventsTarget==="wrapper"&&!LK(c,e.wrapperEl)||"which"in n&&n.which===3||"button"in n&&n.button>0||i.isTouched&&i.isMoved)return;const d=!!s.noSwipingClass&&s.noSwipingClass!=="",p=n.composedPath?n.composedPath():n.path;d&&n.target&&n.target.shadowRoot&&p&&(c=p[0]);const E=s.noSwipingSelector?s.noSwipingSelector:`.${s.noSwipingClass}`,m=!!(n.target&&n.target.shadowRoot);if(s.noSwiping&&(m?Tk(E,c):c.closest(E))){e.allowClick=!0;return}if(s.swipeHandler&&!c.closest(s.swipeHandler))return;o.currentX=n.pageX,o.currentY=n.pageY;const g=o.currentX,_=o.currentY;if(!yv(e,n,g))return;Object.assign(i,{isTouched:!0,isMoved:!1,allowTouchCallbacks:!0,isScrolling:void 0,startMoving:void 0}),o.startX=g,o.startY=_,i.touchStartTime=yn(),e.allowClick=!0,e.updateSize(),e.swipeDirection=void 0,s.threshold>0&&(i.allowThresholdMove=!1);let b=!0;c.matches(i.focusableElements)&&(b=!1,c.nodeName==="SELECT"&&(i.isTouched=!1)),r.activeElement&&r.activeElement.matches(i.focusableElements)&&r.activeElement!==c&&(n.pointerType==="mouse"||n.pointerType!=="mouse"&&!c.matches(i.focusableElements))&&r.activeElement.blur();const x=b&&e.allowTouchMove&&s.touchStartPreventDefault;(s.touchStartForcePreventDefault||x)&&!c.isContentEditable&&n.preventDefault(),s.freeMode&&s.freeMode.enabled&&e.freeMode&&e.animating&&!s.cssMode&&e.freeMode.onTouchStart(),e.emit("touchStart",n)}function bk(t){const e=yr(),r=this,n=r.touchEventsData,{params:i,touches:s,rtlTranslate:o,enabled:f}=r;if(!f||!i.simulateTouch&&t.pointerType==="mouse")return;let c=t;if(c.originalEvent&&(c=c.originalEvent),c.type==="pointermove"&&(n.touchId!==null||c.pointerId!==n.pointerId))return;let d;if(c.type==="touchmove"){if(d=[...c.changedTouches].filter(M=>M.identifier===n.touchId)[0],!d||d.identifier!==n.touchId)return}else d=c;if(!n.isTouched){n.startMoving&&n.isScrolling&&r.emit("touchMoveOpposite",c);return}const p=d.pageX,E=d.pageY;if(c.preventedByNestedSwiper){s.startX=p,s.startY=E;return}if(!r.allowTouchMove){c.target.matches(n.focusableElements)||(r.allowClick=!1),n.isTouched&&(Object.assign(s,{startX:p,startY:E,currentX:p,currentY:E}),n.touchStartTime=yn());return}if(i.touchReleaseOnEdges&&!i.loop){if(r.isVertical()){if(E<s.startY&&r.translate<=r.maxTranslate()||E>s.startY&&r.translate>=r.minTranslate()){n.isTouched=!1,n.isMoved=!1;return}}else if(p<s.startX&&r.translate<=r.maxTranslate()||p>s.startX&&r.translate>=r.minTranslate())return}if(e.activeElement&&e.activeElement.matches(n.focusableElements)&&e.activeElement!==c.target&&c.pointerType!=="mouse"&&e.activeElement.blur(),e.activeElement&&c.target===e.activeElement&&c.target.matches(n.focusableElements)){n.isMoved=!0,r.allowClick=!1;return}n.allowTouchCallbacks&&r.emit("touchMove",c),s.previousX=s.currentX,s.previousY=s.currentY,s.currentX=p,s.currentY=E;const m=s.currentX-s.startX,g=s.currentY-s.startY;if(r.params.threshold&&Math.sqrt(m**2+g**2)<r.params.threshold)return;if(typeof n.isScrolling>"u"){let M;r.isHorizontal()&&s.currentY===s.startY||r.isVertical()&&s.currentX===s.startX?n.isScrolling=!1:m*m+g*g>=25&&(M=Math.atan2(Math.abs(g),Math.abs(m))*180/Math.PI,n.isScrolling=r.isHorizontal()?M>i.touchAngle:90-M>i.touchAngle)}if(n.isScrolling&&r.emit("touchMoveOpposite",c),typeof n.startMoving>"u"&&(s.currentX!==s.startX||s.currentY!==s.startY)&&(n.startMoving=!0),n.isScrolling||c.type==="touchmove"&&n.preventTouchMoveFromPointerMove){n.isTouched=!1;return}if(!n.startMoving)return;r.allowClick=!1,!i.cssMode&&c.cancelable&&c.preventDefault(),i.touchMoveStopPropagation&&!i.nested&&c.stopPropagation();let _=r.isHorizontal()?m:g,b=r.isHorizontal()?s.currentX-s.previousX:s.currentY-s.previousY;i.oneWayMovement&&(_=Math.abs(_)*(o?1:-1),b=Math.abs(b)*(o?1:-1)),s.diff=_,_*=i.touchRatio,o&&(_=-_,b=-b);const x=r.touchesDirection;r.swipeDirection=_>0?"prev":"next",r.touchesDirection=b>0?"prev":"next";const S=r.params.loop&&!i.cssMode,y=r.touchesDirection==="next"&&r.allowSlideNext||r.touchesDirection==="prev"&&r.allowSlidePrev;if(!n.isMoved){if(S&&y&&r.loopFix({direction:r.swipeDirection}),n.startTranslate=r.getTranslate(),r.setTransition(0),r.animating){const M=new window.CustomEvent("transitionend",{bubbles:!0,cancelable:!0,detail:{bySwiperTouchMove:!0}});r.wrapperEl.dispatchEvent(M)}n.allowMomentumBounce=!1,i.grabCursor&&(r.allowSlideNext===!0||r.allowSlidePrev===!0)&&r.setGrabCursor(!0),r.emit("sliderFirstMove",c)}let v;if(new Date().getTime(),n.isMoved&&n.allowThresholdMove&&x!==r.touchesDirection&&S&&y&&Math.abs(_)>=1){Object.assign(s,{startX:p,startY:E,currentX:p,currentY:E,startTranslate:n.currentTranslate}),n.loopSwapReset=!0,n.startTranslate=n.currentTranslate;return}r.emit("sliderMove",c),n.isMoved=!0,n.currentTranslate=_+n.startTranslate;let R=!0,w=i.resistanceRatio;if(i.touchReleaseOnEdges&&(w=0),_>0?(S&&y&&!v&&n.allowThresholdMove&&n.currentTranslate>(i.centeredSlides?r.minTranslate()-r.slidesSizesGrid[r.activeIndex+1]-(i.slidesPerView!=="auto"&&r.slides.length-i.slidesPerView>=2?r.slidesSizesGrid[r.activeIndex+1]+r.params.spaceBetween:0)-r.params.spaceBetween:r.minTranslate())&&r.loopFix({direction:"prev",setTranslate:!0,activeSlideIndex:0}),n.currentTranslate>r.minTranslate()&&(R=!1,i.resistance&&(n.currentTranslate=r.minTranslate()-1+(-r.minTranslate()+n.startTranslate+_)**w))):_<0&&(S&&y&&!v&&n.allowThresholdMove&&n.currentTranslate<(i.centeredSlides?r.maxTranslate()+r.slidesSizesGrid[r.slidesSizesGrid.length-1]+r.params.spaceBetween+(i.slidesPerView!=="auto"&&r.slides.length-i.slidesPerView>=2?r.slidesSizesGrid[r.slidesSizesGrid.length-1]+r.params.spaceBetween:0):r.maxTranslate())&&r.loopFix({direction:"next",setTranslate:!0,activeSlideIndex:r.slides.length-(i.slidesPerView==="auto"?r.slidesPerViewDynamic():Math.ceil(parseFloat(i.slidesPerView,10)))}),n.currentTranslate<r.maxTranslate()&&(R=!1,i.resistance&&(n.currentTranslate=r.maxTranslate()+1-(r.maxTranslate()-n.startTranslate-_)**w))),R&&(c.preventedByNestedSwiper=!0),!r.allowSlideNext&&r.swipeDirection==="next"&&n.currentTranslate<n.startTranslate&&(n.currentTranslate=n.startTranslate),!r.allowSlidePrev&&r.swipeDirection==="prev"&&n.currentTranslate>n.startTranslate&&(n.currentTranslate=n.startTranslate),!r.allowSlidePrev&&!r.allowSlideNext&&(n.currentTranslate=n.startTranslate),i.threshold>0)if(Math.abs(_)>i.threshold||n.allowThresholdMove){if(!n.allowThresholdMove){n.allowThresholdMove=!0,s.startX=s.currentX,s.startY=s.currentY,n.currentTranslate=n.startTranslate,s.diff=r.isHorizontal()?s.currentX-s.startX:s.currentY-s.startY;return}}else{n.currentTranslate=n.startTranslate;return}!i.followFinger||i.cssMode||((i.freeMode&&i.freeMode.enabled&&r.freeMode||i.watchSlidesProgress)&&(r.updateActiveIndex(),r.updateSlidesClasses()),i.freeMode&&i.freeMode.enabled&&r.freeMode&&r.freeMode.onTouchMove(),r.updateProgress(n.currentTranslate),r.setTranslate(n.currentTranslate))}function xk(t){const e=this,r=e.touchEventsData;let n=t;n.originalEvent&&(n=n.originalEvent);let i;if(n.type==="touchend"||n.type==="touchcancel"){if(i=[...n.changedTouches].filter(w=>w.identifier===r.touchId)[0],!i||i.identifier!==r.touchId)return}else{if(r.touchId!==null||n.pointerId!==r.pointerId)return;i=n}if(["pointercancel","pointerout","pointerleave","contextmenu"].includes(n.type)&&!(["pointercancel","contextmenu"].includes(n.type)&&(e.browser.isSafari||e.browser.isWebView)))return;r.pointerId=null,r.touchId=null;const{params:o,touches:f,rtlTranslate:c,slidesGrid:d,enabled:p}=e;if(!p||!o.simulateTouch&&n.pointerType==="mouse")return;if(r.allowTouchCallbacks&&e.emit("touchEnd",n),r.allowTouchCallbacks=!1,!r.isTouched){r.isMoved&&o.grabCursor&&e.setGrabCursor(!1),r.isMoved=!1,r.startMoving=!1;return}o.grabCursor&&r.isMoved&&r.isTouched&&(e.allowSlideNext===!0||e.allowSlidePrev===!0)&&e.setGrabCursor(!1);const E=yn(),m=E-r.touchStartTime;if(e.allowClick){const w=n.path||n.composedPath&&n.composedPath();e.updateClickedSlide(w&&w[0]||n.target,w),e.emit("tap click",n),m<300&&E-r.lastClickTime<300&&e.emit("doubleTap doubleClick",n)}if(r.lastClickTime=yn(),na(()=>{e.destroyed||(e.allowClick=!0)}),!r.isTouched||!r.isMoved||!e.swipeDirection||f.diff===0&&!r.loopSwapReset||r.currentTranslate===r.startTranslate&&!r.loopSwapReset){r.isTouched=!1,r.isMoved=!1,r.startMoving=!1;return}r.isTouched=!1,r.isMoved=!1,r.startMoving=!1;let g;if(o.followFinger?g=c?e.translate:-e.translate:g=-r.currentTranslate,o.cssMode)return;if(o.freeMode&&o.freeMode.enabled){e.freeMode.onTouchEnd({currentPos:g});return}const _=g>=-e.maxTranslate()&&!e.params.loop;let b=0,x=e.slidesSizesGrid[0];for(let w=0;w<d.length;w+=w<o.slidesPerGroupSkip?1:o.slidesPerGroup){const M=w<o.slidesPerGroupSkip-1?1:o.slidesPerGroup;typeof d[w+M]<"u"?(_||g>=d[w]&&g<d[w+M])&&(b=w,x=d[w+M]-d[w]):(_||g>=d[w])&&(b=w,x=d[d.length-1]-d[d.length-2])}let S=null,y=null;o.rewind&&(e.isBeginning?y=o.virtual&&o.virtual.enabled&&e.virtual?e.virtual.slides.length-1:e.slides.length-1:e.isEnd&&(S=0));const v=(g-d[b])/x,R=b<o.slidesPerGroupSkip-1?1:o.slidesPerGroup;if(m>o.longSwipesMs){if(!o.longSwipes){e.slideTo(e.activeIndex);return}e.swipeDirection==="next"&&(v>=o.longSwipesRatio?e.slideTo(o.rewind&&e.isEnd?S:b+R):e.slideTo(b)),e.swipeDirection==="prev"&&(v>1-o.longSwipesRatio?e.slideTo(b+R):y!==null&&v<0&&Math.abs(v)>o.longSwipesRatio?e.slideTo(y):e.slideTo(b))}else{if(!o.shortSwipes){e.slideTo(e.activeIndex);return}e.navigation&&(n.target===e.navigation.nextEl||n.target===e.navigation.prevEl)?n.target===e.navigation.nextEl?e.slideTo(b+R):e.slideTo(b):(e.swipeDirection==="next"&&e.slideTo(S!==null?S:b+R),e.swipeDirection==="prev"&&e.slideTo(y!==null?y:b))}}function Av(){const t=this,{params:e,el:r}=t;if(r&&r.offsetWidth===0)return;e.breakpoints&&t.setBreakpoint();const{allowSlideNext:n,allowSlidePrev:i,snapGrid:s}=t,o=t.virtual&&t.params.virtual.enabled;t.allowSlideNext=!0,t.allowSlidePrev=!0,t.updateSize(),t.updateSlides(),t.updateSlidesClasses();const f=o&&e.loop;(e.slidesPerView==="auto"||e.slidesPerView>1)&&t.isEnd&&!t.isBeginning&&!t.params.centeredSlides&&!f?t.slideTo(t.slides.length-1,0,!1,!0):t.params.loop&&!o?t.slideToLoop(t.realIndex,0,!1,!0):t.slideTo(t.activeIndex,0,!1,!0),t.autoplay&&t.autoplay.running&&t.autoplay.paused&&(clearTimeout(t.autoplay.resizeTimeout),t.autoplay.resizeTimeout=setTimeout(()=>{t.autoplay&&t.autoplay.running&&t.autoplay.paused&&t.autoplay.resume()},500)),t.allowSlidePrev=i,t.allowSlideNext=n,t.params.watchOverflow&&s!==t.snapGrid&&t.checkOverflow()}function Rk(t){const e=this;e.enabled&&(e.allowClick||(e.params.preventClicks&&t.preventDefault(),e.params.preventClicksPropagation&&e.animating&&(t.stopPropagation(),t.stopImmediatePropagation())))}function Sk(){const t=this,{wrapperEl:e,rtlTranslate:r,enabled:n}=t;if(!n)return;t.previousTranslate=t.translate,t.isHorizontal()?t.translate=-e.scrollLeft:t.translate=-e.scrollTop,t.translate===0&&(t.translate=0),t.updateActiveIndex(),t.updateSlidesClasses();let i;const s=t.maxTranslate()-t.minTranslate();s===0?i=0:i=(t.translate-t.minTranslate())/s,i!==t.progress&&t.updateProgress(r?-t.translate:t.translate),t.emit("setTranslate",t.translate,!1)}function yk(t){const e=this;cf(e,t.target),!(e.params.cssMode||e.params.slidesPerView!=="auto"&&!e.params.autoHeight)&&e.update()}function Ak(){const t=this;t.documentTouchHandlerProceeded||(t.documentTouchHandlerProceeded=!0,t.params.touchReleaseOnEdges&&(t.el.style.touchAction="auto"))}const JS=(t,e)=>{const r=yr(),{params:n,el:i,wrapperEl:s,device:o}=t,f=!!n.nested,c=e==="on"?"addEventListener":"removeEventListener",d=e;!i||typeof i=="string"||(r[c]("touchstart",t.onDocumentTouchStart,{passive:!1,capture:f}),i[c]("touchstart",t.onTouchStart,{passive:!1}),i[c]("pointerdown",t.onTouchStart,{passive:!1}),r[c]("touchmove",t.onTouchMove,{passive:!1,capture:f}),r[c]("pointermove",t.onTouchMove,{passive:!1,capture:f}),r[c]("touchend",t.onTouchEnd,{passive:!0}),r[c]("pointerup",t.onTouchEnd,{passive:!0}),r[c]("pointercancel",t.onTouchEnd,{passive:!0}),r[c]("touchcancel",t.onTouchEnd,{passive:!0}),r[c]("pointerout",t.onTouchEnd,{passive:!0}),r[c]("pointerleave",t.onTouchEnd,{passive:!0}),r[c]("contextmenu",t.onTouchEnd,{passive:!0}),(n.preventClicks||n.preventClicksPropagation)&&i[c]("click",t.onClick,!0),n.cssMode&&s[c]("scroll",t.onScroll),n.updateOnWindowResize?t[d](o.ios||o.android?"resize orientationchange observerUpdate":"resize observerUpdate",Av,!0):t[d]("observerUpdate",Av,!0),i[c]("load",t.onLoad,{capture:!0}))};function Lk(){const t=this,{params:e}=t;t.onTouchStart=vk.bind(t),t.onTouchMove=bk.bind(t),t.onTouchEnd=xk.bind(t),t.onDocumentTouchStart=Ak.bind(t),e.cssMode&&(t.onScroll=Sk.bind(t)),t.onClick=Rk.bind(t),t.onLoad=yk.bind(t),JS(t,"on")}function Ck(){JS(this,"off")}var wk={attachEvents:Lk,detachEvents:Ck};const Lv=(t,e)=>t.grid&&e.grid&&e.grid.rows>1;function Ok(){const t=this,{realIndex:e,initialized:r,params:n,el:i}=t,s=n.breakpoints;if(!s||s&&Object.keys(s).length===0)return;const o=t.getBreakpoint(s,t.params.breakpointsBase,t.el);if(!o||t.currentBreakpoint===o)return;const c=(o in s?s[o]:void 0)||t.originalParams,d=Lv(t,n),p=Lv(t,c),E=t.params.grabCursor,m=c.grabCursor,g=n.enabled;d&&!p?(i.classList.remove(`${n.containerModifierClass}grid`,`${n.containerModifierClass}grid-column`),t.emitContainerClasses()):!d&&p&&(i.classList.add(`${n.containerModifierClass}grid`),(c.grid.fill&&c.grid.fill==="column"||!c.grid.fill&&n.grid.fill==="column")&&i.classList.add(`${n.containerModifierClass}grid-column`),t.emitContainerClasses()),E&&!m?t.unsetGrabCursor():!E&&m&&t.setGrabCursor(),["navigation","pagination","scrollbar"].forEach(v=>{if(typeof c[v]>"u")return;const R=n[v]&&n[v].enabled,w=c[v]&&c[v].enabled;R&&!w&&t[v].disable(),!R&&w&&t[v].enable()});const _=c.direction&&c.direction!==n.direction,b=n.loop&&(c.slidesPerView!==n.slidesPerView||_),x=n.loop;_&&r&&t.changeDirection(),fn(t.params,c);const S=t.params.enabled,y=t.params.loop;Object.assign(t,{allowTouchMove:t.params.allowTouchMove,allowSlideNext:t.params.allowSlideNext,allowSlidePrev:t.params.allowSlidePrev}),g&&!S?t.disable():!g&&S&&t.enable(),t.currentBreakpoint=o,t.emit("_beforeBreakpoint",c),r&&(b?(t.loopDestroy(),t.loopCreate(e),t.updateSlides()):!x&&y?(t.loopCreate(e),t.updateSlides()):x&&!y&&t.loopDestroy()),t.emit("breakpoint",c)}function Ik(t,e,r){if(e===void 0&&(e="window"),!t||e==="container"&&!r)return;let n=!1;const i=tr(),s=e==="window"?i.innerHeight:r.clientHeight,o=Object.keys(t).map(f=>{if(typeof f=="string"&&f.indexOf("@")===0){const c=parseFloat(f.substr(1));return{value:s*c,point:f}}return{value:f,point:f}});o.sort((f,c)=>parseInt(f.value,10)-parseInt(c.value,10));for(let f=0;f<o.length;f+=1){const{point:c,value:d}=o[f];e==="window"?i.matchMedia(`(min-width: ${d}px)`).matches&&(n=c):d<=r.clientWidth&&(n=c)}return n||"max"}var Nk={setBreakpoint:Ok,getBreakpoint:Ik};function Pk(t,e){const r=[];return t.forEach(n=>{typeof n=="object"?Object.keys(n).forEach(i=>{n[i]&&r.push(e+i)}):typeof n=="string"&&r.push(e+n)}),r}function Uk(){const t=this,{classNames:e,params:r,rtl:n,el:i,device:s}=t,o=Pk(["initialized",r.direction,{"free-mode":t.params.freeMode&&r.freeMode.enabled},{autoheight:r.autoHeight},{rtl:n},{grid:r.grid&&r.grid.rows>1},{"grid-column":r.grid&&r.grid.rows>1&&r.grid.fill==="column"},{android:s.android},{ios:s.ios},{"css-mode":r.cssMode},{centered:r.cssMode&&r.centeredSlides},{"watch-progress":r.watchSlidesProgress}],r.containerModifierClass);e.push(...o),i.classList.add(...e),t.emitContainerClasses()}function Dk(){const t=this,{el:e,classNames:r}=t;!e||typeof e=="string"||(e.classList.remove(...r),t.emitContainerClasses())}var Bk={addClasses:Uk,removeClasses:Dk};function Mk(){const t=this,{isLocked:e,params:r}=t,{slidesOffsetBefore:n}=r;if(n){const i=t.slides.length-1,s=t.slidesGrid[i]+t.slidesSizesGrid[i]+n*2;t.isLocked=t.size>s}else t.isLocked=t.snapGrid.length===1;r.allowSlideNext===!0&&(t.allowSlideNext=!t.isLocked),r.allowSlidePrev===!0&&(t.allowSlidePrev=!t.isLocked),e&&e!==t.isLocked&&(t.isEnd=!1),e!==t.isLocked&&t.emit(t.isLocked?"lock":"unlock")}var $k={checkOverflow:Mk},Fh={init:!0,direction:"horizontal",oneWayMovement:!1,swiperElementNodeName:"SWIPER-CONTAINER",touchEventsTarget:"wrapper",initialSlide:0,speed:300,cssMode:!1,updateOnWindowResize:!0,resizeObserver:!0,nested:!1,createElements:!1,eventsPrefix:"swiper",enabled:!0,focusableElements:"input, select, option, textarea, button, video, label",width:null,height:null,preventInteractionOnTransition:!1,userAgent:null,url:null,edgeSwipeDetection:!1,edgeSwipeThreshold:20,autoHeight:!1,setWrapperSize:!1,virtualTranslate:!1,effect:"slide",breakpoints:void 0,breakpointsBase:"window",spaceBetween:0,slidesPerView:1,slidesPerGroup:1,slidesPerGroupSkip:0,slidesPerGroupAuto:!1,centeredSlides:!1,centeredSlidesBounds:!1,slidesOffsetBefore:0,slidesOffsetAfter:0,normalizeSlideIndex:!0,centerInsufficientSlides:!1,watchOverflow:!0,roundLengths:!1,touchRatio:1,touchAngle:45,simulateTouch:!0,shortSwipes:!0,longSwipes:!0,longSwipesRatio:.5,longSwipesMs:300,followFinger:!0,allowTouchMove:!0,threshold:5,touchMoveStopPropagation:!1,touchStartPreventDefault:!0,touchStartForcePreventDefault:!1,touchReleaseOnEdges:!1,uniqueNavElements:!0,resistance:!0,resistanceRatio:.85,watchSlidesProgress:!1,grabCursor:!1,preventClicks:!0,preventClicksPropagation:!0,slideToClickedSlide:!1,loop:!1,loopAddBlankSlides:!0,loopAdditionalSlides:0,loopPreventsSliding:!0,rewind:!1,allowSlidePrev:!0,allowSlideNext:!0,swipeHandler:null,noSwiping:!0,noSwipingClass:"swiper-no-swiping",noSwipingSelector:null,passiveListeners:!0,maxBackfaceHiddenSlides:10,containerModifierClass:"swiper-",slideClass:"swiper-slide",slideBlankClass:"swiper-slide-blank",slideActiveClass:"swiper-slide-active",slideVisibleClass:"swiper-slide-visible",slideFullyVisibleClass:"swiper-slide-fully-visible",slideNextClass:"swiper-slide-next",slidePrevClass:"swiper-slide-prev",wrapperClass:"swiper-wrapper",lazyPreloaderClass:"swiper-lazy-preloader",lazyPreloadPrevNext:0,runCallbacksOnInit:!0,_emitClasses:!1};function Kk(t,e){return function(n){n===void 0&&(n={});const i=Object.keys(n)[0],s=n[i];if(typeof s!="object"||s===null){fn(e,n);return}if(t[i]===!0&&(t[i]={enabled:!0}),i==="navigation"&&t[i]&&t[i].enabled&&!t[i].prevEl&&!t[i].nextEl&&(t[i].auto=!0),["pagination","scrollbar"].indexOf(i)>=0&&t[i]&&t[i].enabled&&!t[i].el&&(t[i].auto=!0),!(i in t&&"enabled"in s)){fn(e,n);return}typeof t[i]=="object"&&!("enabled"in t[i])&&(t[i].enabled=!0),t[i]||(t[i]={enabled:!1}),fn(e,n)}}const Sd={eventsEmitter:BK,update:jK,translate:ZK,transition:nk,slide:ck,loop:Ek,grabCursor:_k,events:wk,breakpoints:Nk,checkOverflow:$k,classes:Bk},yd={};class un{constructor(){let e,r;for(var n=arguments.length,i=new Array(n),s=0;s<n;s++)i[s]=arguments[s];i.length===1&&i[0].constructor&&Object.prototype.toString.call(i[0]).slice(8,-1)==="Object"?r=i[0]:[e,r]=i,r||(r={}),r=fn({},r),e&&!r.el&&(r.el=e);const o=yr();if(r.el&&typeof r.el=="string"&&o.querySelectorAll(r.el).length>1){const p=[];return o.querySelectorAll(r.el).forEach(E=>{const m=fn({},r,{el:E});p.push(new un(m))}),p}const f=this;f.__swiper__=!0,f.support=zS(),f.device=qS({userAgent:r.userAgent}),f.browser=PK(),f.eventsListeners={},f.eventsAnyListeners=[],f.modules=[...f.__modules__],r.modules&&Array.isArray(r.modules)&&f.modules.push(...r.modules);const c={};f.modules.forEach(p=>{p({params:r,swiper:f,extendParams:Kk(r,c),on:f.on.bind(f),once:f.once.bind(f),off:f.off.bind(f),emit:f.emit.bind(f)})});const d=fn({},Fh,c);return f.params=fn({},d,yd,r),f.originalParams=fn({},f.params),f.passedParams=fn({},r),f.params&&f.params.on&&Object.keys(f.params.on).forEach(p=>{f.on(p,f.params.on[p])}),f.params&&f.params.onAny&&f.onAny(f.params.onAny),Object.assign(f,{enabled:f.params.enabled,el:e,classNames:[],slides:[],slidesGrid:[],snapGrid:[],slidesSizesGrid:[],isHorizontal(){return f.params.direction==="horizontal"},isVertical(){return f.params.direction==="vertical"},activeIndex:0,realIndex:0,isBeginning:!0,isEnd:!1,translate:0,previousTranslate:0,progress:0,velocity:0,animating:!1,cssOverflowAdjustment(){return Math.trunc(this.translate/2**23)*2**23},allowSlideNext:f.params.allowSlideNext,allowSlidePrev:f.params.allowSlidePrev,touchEventsData:{isTouched:void 0,isMoved:void 0,allowTouchCallbacks:void 0,touchStartTime:void 0,isScrolling:void 0,currentTranslate:void 0,startTranslate:void 0,allowThresholdMove:void 0,focusableElements:f.params.focusableElements,lastClickTime:0,clickTimeout:void 0,velocities:[],allowMomentumBounce:void 0,startMoving:void 0,pointerId:null,touchId:null},allowClick:!0,allowTouchMove:f.params.allowTouchMove,touches:{startX:0,startY:0,currentX:0,currentY:0,diff:0},imagesToLoad:[],imagesLoaded:0}),f.emit("_swiper"),f.params.init&&f.init(),f}getDirectionLabel(e){return this.isHorizontal()?e:{width:"height","margin-top":"margin-left","margin-bottom ":"margin-right","margin-left":"margin-top","margin-right":"margin-bottom","padding-left":"padding-top","padding-right":"padding-bottom",marginRight:"marginBottom"}[e]}getSlideIndex(e){const{slidesEl:r,params:n}=this,i=Rr(r,`.${n.slideClass}, swiper-slide`),s=Ol(i[0]);return Ol(e)-s}getSlideIndexByData(e){return this.getSlideIndex(this.slides.filter(r=>r.getAttribute("data-swiper-slide-index")*1===e)[0])}recalcSlides(){const e=this,{slidesEl:r,params:n}=e;e.slides=Rr(r,`.${n.slideClass}, swiper-slide`)}enable(){const e=this;e.enabled||(e.enabled=!0,e.params.grabCursor&&e.setGrabCursor(),e.emit("enable"))}disable(){const e=this;e.enabled&&(e.enabled=!1,e.params.grabCursor&&e.unsetGrabCursor(),e.emit("disable"))}setProgress(e,r){const n=this;e=Math.min(Math.max(e,0),1);const i=n.minTranslate(),o=(n.maxTranslate()-i)*e+i;n.translateTo(o,typeof r>"u"?0:r),n.updateActiveIndex(),n.updateSlidesClasses()}emitContainerClasses(){const e=this;if(!e.params._emitClasses||!e.el)return;const r=e.el.className.split(" ").filter(n=>n.indexOf("swiper")===0||n.indexOf(e.params.containerModifierClass)===0);e.emit("_containerClasses",r.join(" "))}getSlideClasses(e){const r=this;return r.destroyed?"":e.className.split(" ").filter(n=>n.indexOf("swiper-slide")===0||n.indexOf(r.params.slideClass)===0).join(" ")}emitSlidesClasses(){const e=this;if(!e.params._emitClasses||!e.el)return;const r=[];e.slides.forEach(n=>{const i=e.getSlideClasses(n);r.push({slideEl:n,classNames:i}),e.emit("_slideClass",n,i)}),e.emit("_slideClasses",r)}slidesPerViewDynamic(e,r){e===void 0&&(e="current"),r===void 0&&(r=!1);const n=this,{params:i,slides:s,slidesGrid:o,slidesSizesGrid:f,size:c,activeIndex:d}=n;let p=1;if(typeof i.slidesPerView=="number")return i.slidesPerView;if(i.centeredSlides){let E=s[d]?Math.ceil(s[d].swiperSlideSize):0,m;for(let g=d+1;g<s.length;g+=1)s[g]&&!m&&(E+=Math.ceil(s[g].swiperSlideSize),p+=1,E>c&&(m=!0));for(let g=d-1;g>=0;g-=1)s[g]&&!m&&(E+=s[g].swiperSlideSize,p+=1,E>c&&(m=!0))}else if(e==="current")for(let E=d+1;E<s.length;E+=1)(r?o[E]+f[E]-o[d]<c:o[E]-o[d]<c)&&(p+=1);else for(let E=d-1;E>=0;E-=1)o[d]-o[E]<c&&(p+=1);return p}update(){const e=this;if(!e||e.destroyed)return;const{snapGrid:r,params:n}=e;n.breakpoints&&e.setBreakpoint(),[...e.el.querySelectorAll('[loading="lazy"]')].forEach(o=>{o.complete&&cf(e,o)}),e.updateSize(),e.updateSlides(),e.updateProgress(),e.updateSlidesClasses();function i(){const o=e.rtlTranslate?e.translate*-1:e.translate,f=Math.min(Math.max(o,e.maxTranslate()),e.minTranslate());e.setTranslate(f),e.updateActiveIndex(),e.updateSlidesClasses()}let s;if(n.freeMode&&n.freeMode.enabled&&!n.cssMode)i(),n.autoHeight&&e.updateAutoHeight();else{if((n.slidesPerView==="auto"||n.slidesPerView>1)&&e.isEnd&&!n.centeredSlides){const o=e.virtual&&n.virtual.enabled?e.virtual.slides:e.slides;s=e.slideTo(o.length-1,0,!1,!0)}else s=e.slideTo(e.activeIndex,0,!1,!0);s||i()}n.watchOverflow&&r!==e.snapGrid&&e.checkOverflow(),e.emit("update")}changeDirection(e,r){r===void 0&&(r=!0);const n=this,i=n.params.direction;return e||(e=i==="horizontal"?"vertical":"horizontal"),e===i||e!=="horizontal"&&e!=="vertical"||(n.el.classList.remove(`${n.params.containerModifierClass}${i}`),n.el.classList.add(`${n.params.containerModifierClass}${e}`),n.emitContainerClasses(),n.params.direction=e,n.slides.forEach(s=>{e==="vertical"?s.style.width="":s.style.height=""}),n.emit("changeDirection"),r&&n.update()),n}changeLanguageDirection(e){const r=this;r.rtl&&e==="rtl"||!r.rtl&&e==="ltr"||(r.rtl=e==="rtl",r.rtlTranslate=r.params.direction==="horizontal"&&r.rtl,r.rtl?(r.el.classList.add(`${r.params.containerModifierClass}rtl`),r.el.dir="rtl"):(r.el.classList.remove(`${r.params.containerModifierClass}rtl`),r.el.dir="ltr"),r.update())}mount(e){const r=this;if(r.mounted)return!0;let n=e||r.params.el;if(typeof n=="string"&&(n=document.querySelector(n)),!n)return!1;n.swiper=r,n.parentNode&&n.parentNode.host&&n.parentNode.host.nodeName===r.params.swiperElementNodeName.toUpperCase()&&(r.isElement=!0);const i=()=>`.${(r.params.wrapperClass||"").trim().split(" ").join(".")}`;let o=n&&n.shadowRoot&&n.shadowRoot.querySelector?n.shadowRoot.querySelector(i()):Rr(n,i())[0];return!o&&r.params.createElements&&(o=pn("div",r.params.wrapperClass),n.append(o),Rr(n,`.${r.params.slideClass}`).forEach(f=>{o.append(f)})),Object.assign(r,{el:n,wrapperEl:o,slidesEl:r.isElement&&!n.parentNode.host.slideSlots?n.parentNode.host:o,hostEl:r.isElement?n.parentNode.host:n,mounted:!0,rtl:n.dir.toLowerCase()==="rtl"||as(n,"direction")==="rtl",rtlTranslate:r.params.direction==="horizontal"&&(n.dir.toLowerCase()==="rtl"||as(n,"direction")==="rtl"),wrongRTL:as(o,"display")==="-webkit-box"}),!0}init(e){const r=this;if(r.initialized||r.mount(e)===!1)return r;r.emit("beforeInit"),r.params.breakpoints&&r.setBreakpoint(),r.addClasses(),r.updateSize(),r.updateSlides(),r.params.watchOverflow&&r.checkOverflow(),r.params.grabCursor&&r.enabled&&r.setGrabCursor(),r.params.loop&&r.virtual&&r.params.virtual.enabled?r.slideTo(r.params.initialSlide+r.virtual.slidesBefore,0,r.params.runCallbacksOnInit,!1,!0):r.slideTo(r.params.initialSlide,0,r.params.runCallbacksOnInit,!1,!0),r.params.loop&&r.loopCreate(),r.attachEvents();const i=[...r.el.querySelectorAll('[loading="lazy"]')];return r.isElement&&i.push(...r.hostEl.querySelectorAll('[loading="lazy"]')),i.forEach(s=>{s.complete?cf(r,s):s.addEventListener("load",o=>{cf(r,o.target)})}),Vh(r),r.initialized=!0,Vh(r),r.emit("init"),r.emit("afterInit"),r}destroy(e,r){e===void 0&&(e=!0),r===void 0&&(r=!0);const n=this,{params:i,el:s,wrapperEl:o,slides:f}=n;return typeof n.params>"u"||n.destroyed||(n.emit("beforeDestroy"),n.initialized=!1,n.detachEvents(),i.loop&&n.loopDestroy(),r&&(n.removeClasses(),s&&typeof s!="string"&&s.removeAttribute("style"),o&&o.removeAttribute("style"),f&&f.length&&f.forEach(c=>{c.classList.remove(i.slideVisibleClass,i.slideFullyVisibleClass,i.slideActiveClass,i.slideNextClass,i.slidePrevClass),c.removeAttribute("style"),c.removeAttribute("data-swiper-slide-index")})),n.emit("destroy"),Object.keys(n.eventsListeners).forEach(c=>{n.off(c)}),e!==!1&&(n.el&&typeof n.el!="string"&&(n.el.swiper=null),SK(n)),n.destroyed=!0),null}static extendDefaults(e){fn(yd,e)}static get extendedDefaults(){return yd}static get defaults(){return Fh}static installModule(e){un.prototype.__modules__||(un.prototype.__modules__=[]);const r=un.prototype.__modules__;typeof e=="function"&&r.indexOf(e)<0&&r.push(e)}static use(e){return Array.isArray(e)?(e.forEach(r=>un.installModule(r)),un):(un.installModule(e),un)}}Object.keys(Sd).forEach(t=>{Object.keys(Sd[t]).forEach(e=>{un.prototype[e]=Sd[t][e]})});un.use([UK,DK]);function kk(t){let{swiper:e,extendParams:r,on:n,emit:i}=t;r({virtual:{enabled:!1,slides:[],cache:!0,renderSlide:null,renderExternal:null,renderExternalUpdate:!0,addSlidesBefore:0,addSlidesAfter:0}});let s;const o=yr();e.virtual={cache:{},from:void 0,to:void 0,slides:[],offset:0,slidesGrid:[]};const f=o.createElement("div");function c(_,b){const x=e.params.virtual;if(x.cache&&e.virtual.cache[b])return e.virtual.cache[b];let S;return x.renderSlide?(S=x.renderSlide.call(e,_,b),typeof S=="string"&&(f.innerHTML=S,S=f.children[0])):e.isElement?S=pn("swiper-slide"):S=pn("div",e.params.slideClass),S.setAttribute("data-swiper-slide-index",b),x.renderSlide||(S.innerHTML=_),x.cache&&(e.virtual.cache[b]=S),S}function d(_,b){const{slidesPerView:x,slidesPerGroup:S,centeredSlides:y,loop:v,initialSlide:R}=e.params;if(b&&!v&&R>0)return;const{addSlidesBefore:w,addSlidesAfter:M}=e.params.virtual,{from:k,to:H,slides:O,slidesGrid:z,offset:ie}=e.virtual;e.params.cssMode||e.updateActiveIndex();const G=e.activeIndex||0;let X;e.rtlTranslate?X="right":X=e.isHorizontal()?"left":"top";let ee,B;y?(ee=Math.floor(x/2)+S+M,B=Math.floor(x/2)+S+w):(ee=x+(S-1)+M,B=(v?x:S)+w);let Q=G-B,W=G+ee;v||(Q=Math.max(Q,0),W=Math.min(W,O.length-1));let j=(e.slidesGrid[Q]||0)-(e.slidesGrid[0]||0);v&&G>=B?(Q-=B,y||(j+=e.slidesGrid[0])):v&&G<B&&(Q=-B,y&&(j+=e.slidesGrid[0])),Object.assign(e.virtual,{from:Q,to:W,offset:j,slidesGrid:e.slidesGrid,slidesBefore:B,slidesAfter:ee});function ue(){e.updateSlides(),e.updateProgress(),e.updateSlidesClasses(),i("virtualUpdate")}if(k===Q&&H===W&&!_){e.slidesGrid!==z&&j!==ie&&e.slides.forEach(Ie=>{Ie.style[X]=`${j-Math.abs(e.cssOverflowAdjustment())}px`}),e.updateProgress(),i("virtualUpdate");return}if(e.params.virtual.renderExternal){e.params.virtual.renderExternal.call(e,{offset:j,from:Q,to:W,slides:function(){const $e=[];for(let nt=Q;nt<=W;nt+=1)$e.push(O[nt]);return $e}()}),e.params.virtual.renderExternalUpdate?ue():i("virtualUpdate");return}const ve=[],ae=[],he=Ie=>{let $e=Ie;return Ie<0?$e=O.length+Ie:$e>=O.length&&($e=$e-O.length),$e};if(_)e.slides.filter(Ie=>Ie.matches(`.${e.params.slideClass}, swiper-slide`)).forEach(Ie=>{Ie.remove()});else for(let Ie=k;Ie<=H;Ie+=1)if(Ie<Q||Ie>W){const $e=he(Ie);e.slides.filter(nt=>nt.matches(`.${e.params.slideClass}[data-swiper-slide-index="${$e}"], swiper-slide[data-swiper-slide-index="${$e}"]`)).forEach(nt=>{nt.remove()})}const Se=v?-O.length:0,He=v?O.length*2:O.length;for(let Ie=Se;Ie<He;Ie+=1)if(Ie>=Q&&Ie<=W){const $e=he(Ie);typeof H>"u"||_?ae.push($e):(Ie>H&&ae.push($e),Ie<k&&ve.push($e))}if(ae.forEach(Ie=>{e.slidesEl.append(c(O[Ie],Ie))}),v)for(let Ie=ve.length-1;Ie>=0;Ie-=1){const $e=ve[Ie];e.slidesEl.prepend(c(O[$e],$e))}else ve.sort((Ie,$e)=>$e-Ie),ve.forEach(Ie=>{e.slidesEl.prepend(c(O[Ie],Ie))});Rr(e.slidesEl,".swiper-slide, swiper-slide").forEach(Ie=>{Ie.style[X]=`${j-Math.abs(e.cssOverflowAdjustment())}px`}),ue()}function p(_){if(typeof _=="object"&&"length"in _)for(let b=0;b<_.length;b+=1)_[b]&&e.virtual.slides.push(_[b]);else e.virtual.slides.push(_);d(!0)}function E(_){const b=e.activeIndex;let x=b+1,S=1;if(Array.isArray(_)){for(let y=0;y<_.length;y+=1)_[y]&&e.virtual.slides.unshift(_[y]);x=b+_.length,S=_.length}else e.virtual.slides.unshift(_);if(e.params.virtual.cache){const y=e.virtual.cache,v={};Object.keys(y).forEach(R=>{const w=y[R],M=w.getAttribute("data-swiper-slide-index");M&&w.setAttribute("data-swiper-slide-index",parseInt(M,10)+S),v[parseInt(R,10)+S]=w}),e.virtual.cache=v}d(!0),e.slideTo(x,0)}function m(_){if(typeof _>"u"||_===null)return;let b=e.activeIndex;if(Array.isArray(_))for(let x=_.length-1;x>=0;x-=1)e.params.virtual.cache&&(delete e.virtual.cache[_[x]],Object.keys(e.virtual.cache).forEach(S=>{S>_&&(e.virtual.cache[S-1]=e.virtual.cache[S],e.virtual.cache[S-1].setAttribute("data-swiper-slide-index",S-1),delete e.virtual.cache[S])})),e.virtual.slides.splice(_[x],1),_[x]<b&&(b-=1),b=Math.max(b,0);else e.params.virtual.cache&&(delete e.virtual.cache[_],Object.keys(e.virtual.cache).forEach(x=>{x>_&&(e.virtual.cache[x-1]=e.virtual.cache[x],e.virtual.cache[x-1].setAttribute("data-swiper-slide-index",x-1),delete e.virtual.cache[x])})),e.virtual.slides.splice(_,1),_<b&&(b-=1),b=Math.max(b,0);d(!0),e.slideTo(b,0)}function g(){e.virtual.slides=[],e.params.virtual.cache&&(e.virtual.cache={}),d(!0),e.slideTo(0,0)}n("beforeInit",()=>{if(!e.params.virtual.enabled)return;let _;if(typeof e.passedParams.virtual.slides>"u"){const b=[...e.slidesEl.children].filter(x=>x.matches(`.${e.params.slideClass}, swiper-slide`));b&&b.length&&(e.virtual.slides=[...b],_=!0,b.forEach((x,S)=>{x.setAttribute("data-swiper-slide-index",S),e.virtual.cache[S]=x,x.remove()}))}_||(e.virtual.slides=e.params.virtual.slides),e.classNames.push(`${e.params.containerModifierClass}virtual`),e.params.watchSlidesProgress=!0,e.originalParams.watchSlidesProgress=!0,d(!1,!0)}),n("setTranslate",()=>{e.params.virtual.enabled&&(e.params.cssMode&&!e._immediateVirtual?(clearTimeout(s),s=setTimeout(()=>{d()},100)):d())}),n("init update resize",()=>{e.params.virtual.enabled&&e.params.cssMode&&sl(e.wrapperEl,"--swiper-virtual-size",`${e.virtualSize}px`)}),Object.assign(e.virtual,{appendSlide:p,prependSlide:E,removeSlide:m,removeAllSlides:g,update:d})}function Gk(t){let{swiper:e,extendParams:r,on:n,emit:i}=t;const s=yr(),o=tr();e.keyboard={enabled:!1},r({keyboard:{enabled:!1,onlyInViewport:!0,pageUpDown:!0}});function f(p){if(!e.enabled)return;const{rtlTranslate:E}=e;let m=p;m.originalEvent&&(m=m.originalEvent);const g=m.keyCode||m.charCode,_=e.params.keyboard.pageUpDown,b=_&&g===33,x=_&&g===34,S=g===37,y=g===39,v=g===38,R=g===40;if(!e.allowSlideNext&&(e.isHorizontal()&&y||e.isVertical()&&R||x)||!e.allowSlidePrev&&(e.isHorizontal()&&S||e.isVertical()&&v||b))return!1;if(!(m.shiftKey||m.altKey||m.ctrlKey||m.metaKey)&&!(s.activeElement&&s.activeElement.nodeName&&(s.activeElement.nodeName.toLowerCase()==="input"||s.activeElement.nodeName.toLowerCase()==="textarea"))){if(e.params.keyboard.onlyInViewport&&(b||x||S||y||v||R)){let w=!1;if(Js(e.el,`.${e.params.slideClass}, swiper-slide`).length>0&&Js(e.el,`.${e.params.slideActiveClass}`).length===0)return;const M=e.el,k=M.clientWidth,H=M.clientHeight,O=o.innerWidth,z=o.innerHeight,ie=Bf(M);E&&(ie.left-=M.scrollLeft);const G=[[ie.left,ie.top],[ie.left+k,ie.top],[ie.left,ie.top+H],[ie.left+k,ie.top+H]];for(let X=0;X<G.length;X+=1){const ee=G[X];if(ee[0]>=0&&ee[0]<=O&&ee[1]>=0&&ee[1]<=z){if(ee[0]===0&&ee[1]===0)continue;w=!0}}if(!w)return}e.isHorizontal()?((b||x||S||y)&&(m.preventDefault?m.preventDefault():m.returnValue=!1),((x||y)&&!E||(b||S)&&E)&&e.slideNext(),((b||S)&&!E||(x||y)&&E)&&e.slidePrev()):((b||x||v||R)&&(m.preventDefault?m.preventDefault():m.returnValue=!1),(x||R)&&e.slideNext(),(b||v)&&e.slidePrev()),i("keyPress",g)}}function c(){e.keyboard.enabled||(s.addEventListener("keydown",f),e.keyboard.enabled=!0)}function d(){e.keyboard.enabled&&(s.removeEventListener("keydown",f),e.keyboard.enabled=!1)}n("init",()=>{e.params.keyboard.enabled&&c()}),n("destroy",()=>{e.keyboard.enabled&&d()}),Object.assign(e.keyboard,{enable:c,disable:d})}function Vk(t){let{swiper:e,extendParams:r,on:n,emit:i}=t;const s=tr();r({mousewheel:{enabled:!1,releaseOnEdges:!1,invert:!1,forceToAxis:!1,sensitivity:1,eventsTarget:"container",thresholdDelta:null,thresholdTime:null,noMousewheelClass:"swiper-no-mousewheel"}}),e.mousewheel={enabled:!1};let o,f=yn(),c;const d=[];function p(v){let k=0,H=0,O=0,z=0;return"detail"in v&&(H=v.detail),"wheelDelta"in v&&(H=-v.wheelDelta/120),"wheelDeltaY"in v&&(H=-v.wheelDeltaY/120),"wheelDeltaX"in v&&(k=-v.wheelDeltaX/120),"axis"in v&&v.axis===v.HORIZONTAL_AXIS&&(k=H,H=0),O=k*10,z=H*10,"deltaY"in v&&(z=v.deltaY),"deltaX"in v&&(O=v.deltaX),v.shiftKey&&!O&&(O=z,z=0),(O||z)&&v.deltaMode&&(v.deltaMode===1?(O*=40,z*=40):(O*=800,z*=800)),O&&!k&&(k=O<1?-1:1),z&&!H&&(H=z<1?-1:1),{spinX:k,spinY:H,pixelX:O,pixelY:z}}function E(){e.enabled&&(e.mouseEntered=!0)}function m(){e.enabled&&(e.mouseEntered=!1)}function g(v){return e.params.mousewheel.thresholdDelta&&v.delta<e.params.mousewheel.thresholdDelta||e.params.mousewheel.thresholdTime&&yn()-f<e.params.mousewheel.thresholdTime?!1:v.delta>=6&&yn()-f<60?!0:(v.direction<0?(!e.isEnd||e.params.loop)&&!e.animating&&(e.slideNext(),i("scroll",v.raw)):(!e.isBeginning||e.params.loop)&&!e.animating&&(e.slidePrev(),i("scroll",v.raw)),f=new s.Date().getTime(),!1)}function _(v){const R=e.params.mousewheel;if(v.direction<0){if(e.isEnd&&!e.params.loop&&R.releaseOnEdges)return!0}else if(e.isBeginning&&!e.params.loop&&R.releaseOnEdges)return!0;return!1}function b(v){let R=v,w=!0;if(!e.enabled||v.target.closest(`.${e.params.mousewheel.noMousewheelClass}`))return;const M=e.params.mousewheel;e.params.cssMode&&R.preventDefault();let k=e.el;e.params.mousewheel.eventsTarget!=="container"&&(k=document.querySelector(e.params.mousewheel.eventsTarget));const H=k&&k.contains(R.target);if(!e.mouseEntered&&!H&&!M.releaseOnEdges)return!0;R.originalEvent&&(R=R.originalEvent);let O=0;const z=e.rtlTranslate?-1:1,ie=p(R);if(M.forceToAxis)if(e.isHorizontal())if(Math.abs(ie.pixelX)>Math.abs(ie.pixelY))O=-ie.pixelX*z;else return!0;else if(Math.abs(ie.pixelY)>Math.abs(ie.pixelX))O=-ie.pixelY;else return!0;else O=Math.abs(ie.pixelX)>Math.abs(ie.pixelY)?-ie.pixelX*z:-ie.pixelY;if(O===0)return!0;M.invert&&(O=-O);let G=e.getTranslate()+O*M.sensitivity;if(G>=e.minTranslate()&&(G=e.minTranslate()),G<=e.maxTranslate()&&(G=e.maxTranslate()),w=e.params.loop?!0:!(G===e.minTranslate()||G===e.maxTranslate()),w&&e.params.nested&&R.stopPropagation(),!e.params.freeMode||!e.params.freeMode.enabled){const X={time:yn(),delta:Math.abs(O),direction:Math.sign(O),raw:v};d.length>=2&&d.shift();const ee=d.length?d[d.length-1]:void 0;if(d.push(X),ee?(X.direction!==ee.direction||X.delta>ee.delta||X.time>ee.time+150)&&g(X):g(X),_(X))return!0}else{const X={time:yn(),delta:Math.abs(O),direction:Math.sign(O)},ee=c&&X.time<c.time+500&&X.delta<=c.delta&&X.direction===c.direction;if(!ee){c=void 0;let B=e.getTranslate()+O*M.sensitivity;const Q=e.isBeginning,W=e.isEnd;if(B>=e.minTranslate()&&(B=e.minTranslate()),B<=e.maxTranslate()&&(B=e.maxTranslate()),e.setTransition(0),e.setTranslate(B),e.updateProgress(),e.updateActiveIndex(),e.updateSlidesClasses(),(!Q&&e.isBeginning||!W&&e.isEnd)&&e.updateSlidesClasses(),e.params.loop&&e.loopFix({direction:X.direction<0?"next":"prev",byMousewheel:!0}),e.params.freeMode.sticky){clearTimeout(o),o=void 0,d.length>=15&&d.shift();const j=d.length?d[d.length-1]:void 0,ue=d[0];if(d.push(X),j&&(X.delta>j.delta||X.direction!==j.direction))d.splice(0);else if(d.length>=15&&X.time-ue.time<500&&ue.delta-X.delta>=1&&X.delta<=6){const ve=O>0?.8:.2;c=X,d.splice(0),o=na(()=>{e.destroyed||!e.params||e.slideToClosest(e.params.speed,!0,void 0,ve)},0)}o||(o=na(()=>{if(e.destroyed||!e.params)return;const ve=.5;c=X,d.splice(0),e.slideToClosest(e.params.speed,!0,void 0,ve)},500))}if(ee||i("scroll",R),e.params.autoplay&&e.params.autoplayDisableOnInteraction&&e.autoplay.stop(),M.releaseOnEdges&&(B===e.minTranslate()||B===e.maxTranslate()))return!0}}return R.preventDefault?R.preventDefault():R.returnValue=!1,!1}function x(v){let R=e.el;e.params.mousewheel.eventsTarget!=="container"&&(R=document.querySelector(e.params.mousewheel.eventsTarget)),R[v]("mouseenter",E),R[v]("mouseleave",m),R[v]("wheel",b)}function S(){return e.params.cssMode?(e.wrapperEl.removeEventListener("wheel",b),!0):e.mousewheel.enabled?!1:(x("addEventListener"),e.mousewheel.enabled=!0,!0)}function y(){return e.params.cssMode?(e.wrapperEl.addEventListener(event,b),!0):e.mousewheel.enabled?(x("removeEventListener"),e.mousewheel.enabled=!1,!0):!1}n("init",()=>{!e.params.mousewheel.enabled&&e.params.cssMode&&y(),e.params.mousewheel.enabled&&S()}),n("destroy",()=>{e.params.cssMode&&S(),e.mousewheel.enabled&&y()}),Object.assign(e.mousewheel,{enable:S,disable:y})}function t0(t,e,r,n){return t.params.createElements&&Object.keys(n).forEach(i=>{if(!r[i]&&r.auto===!0){let s=Rr(t.el,`.${n[i]}`)[0];s||(s=pn("div",n[i]),s.className=n[i],t.el.append(s)),r[i]=s,e[i]=s}}),r}function Fk(t){let{swiper:e,extendParams:r,on:n,emit:i}=t;r({navigation:{nextEl:null,prevEl:null,hideOnClick:!1,disabledClass:"swiper-button-disabled",hiddenClass:"swiper-button-hidden",lockClass:"swiper-button-lock",navigationDisabledClass:"swiper-navigation-disabled"}}),e.navigation={nextEl:null,prevEl:null};function s(_){let b;return _&&typeof _=="string"&&e.isElement&&(b=e.el.querySelector(_)||e.hostEl.querySelector(_),b)?b:(_&&(typeof _=="string"&&(b=[...document.querySelectorAll(_)]),e.params.uniqueNavElements&&typeof _=="string"&&b&&b.length>1&&e.el.querySelectorAll(_).length===1?b=e.el.querySelector(_):b&&b.length===1&&(b=b[0])),_&&!b?_:b)}function o(_,b){const x=e.params.navigation;_=Et(_),_.forEach(S=>{S&&(S.classList[b?"add":"remove"](...x.disabledClass.split(" ")),S.tagName==="BUTTON"&&(S.disabled=b),e.params.watchOverflow&&e.enabled&&S.classList[e.isLocked?"add":"remove"](x.lockClass))})}function f(){const{nextEl:_,prevEl:b}=e.navigation;if(e.params.loop){o(b,!1),o(_,!1);return}o(b,e.isBeginning&&!e.params.rewind),o(_,e.isEnd&&!e.params.rewind)}function c(_){_.preventDefault(),!(e.isBeginning&&!e.params.loop&&!e.params.rewind)&&(e.slidePrev(),i("navigationPrev"))}function d(_){_.preventDefault(),!(e.isEnd&&!e.params.loop&&!e.params.rewind)&&(e.slideNext(),i("navigationNext"))}function p(){const _=e.params.navigation;if(e.params.navigation=t0(e,e.originalParams.navigation,e.params.navigation,{nextEl:"swiper-button-next",prevEl:"swiper-button-prev"}),!(_.nextEl||_.prevEl))return;let b=s(_.nextEl),x=s(_.prevEl);Object.assign(e.navigation,{nextEl:b,prevEl:x}),b=Et(b),x=Et(x);const S=(y,v)=>{y&&y.addEventListener("click",v==="next"?d:c),!e.enabled&&y&&y.classList.add(..._.lockClass.split(" "))};b.forEach(y=>S(y,"next")),x.forEach(y=>S(y,"prev"))}function E(){let{nextEl:_,prevEl:b}=e.navigation;_=Et(_),b=Et(b);const x=(S,y)=>{S.removeEventListener("click",y==="next"?d:c),S.classList.remove(...e.params.navigation.disabledClass.split(" "))};_.forEach(S=>x(S,"next")),b.forEach(S=>x(S,"prev"))}n("init",()=>{e.params.navigation.enabled===!1?g():(p(),f())}),n("toEdge fromEdge lock unlock",()=>{f()}),n("destroy",()=>{E()}),n("enable disable",()=>{let{nextEl:_,prevEl:b}=e.navigation;if(_=Et(_),b=Et(b),e.enabled){f();return}[..._,...b].filter(x=>!!x).forEach(x=>x.classList.add(e.params.navigation.lockClass))}),n("click",(_,b)=>{let{nextEl:x,prevEl:S}=e.navigation;x=Et(x),S=Et(S);const y=b.target;let v=S.includes(y)||x.includes(y);if(e.isElement&&!v){const R=b.path||b.composedPath&&b.composedPath();R&&(v=R.find(w=>x.includes(w)||S.includes(w)))}if(e.params.navigation.hideOnClick&&!v){if(e.pagination&&e.params.pagination&&e.params.pagination.clickable&&(e.pagination.el===y||e.pagination.el.contains(y)))return;let R;x.length?R=x[0].classList.contains(e.params.navigation.hiddenClass):S.length&&(R=S[0].classList.contains(e.params.navigation.hiddenClass)),i(R===!0?"navigationShow":"navigationHide"),[...x,...S].filter(w=>!!w).forEach(w=>w.classList.toggle(e.params.navigation.hiddenClass))}});const m=()=>{e.el.classList.remove(...e.params.navigation.navigationDisabledClass.split(" ")),p(),f()},g=()=>{e.el.classList.add(...e.params.navigation.navigationDisabledClass.split(" ")),E()};Object.assign(e.navigation,{enable:m,disable:g,update:f,init:p,destroy:E})}function Oi(t){return t===void 0&&(t=""),`.${t.trim().replace(/([\.:!+\/])/g,"\\$1").replace(/ /g,".")}`}function Hk(t){let{swiper:e,extendParams:r,on:n,emit:i}=t;const s="swiper-pagination";r({pagination:{el:null,bulletElement:"span",clickable:!1,hideOnClick:!1,renderBullet:null,renderProgressbar:null,renderFraction:null,renderCustom:null,progressbarOpposite:!1,type:"bullets",dynamicBullets:!1,dynamicMainBullets:1,formatFractionCurrent:y=>y,formatFractionTotal:y=>y,bulletClass:`${s}-bullet`,bulletActiveClass:`${s}-bullet-active`,modifierClass:`${s}-`,currentClass:`${s}-current`,totalClass:`${s}-total`,hiddenClass:`${s}-hidden`,progressbarFillClass:`${s}-progressbar-fill`,progressbarOppositeClass:`${s}-progressbar-opposite`,clickableClass:`${s}-clickable`,lockClass:`${s}-lock`,horizontalClass:`${s}-horizontal`,verticalClass:`${s}-vertical`,paginationDisabledClass:`${s}-disabled`}}),e.pagination={el:null,bullets:[]};let o,f=0;function c(){return!e.params.pagination.el||!e.pagination.el||Array.isArray(e.pagination.el)&&e.pagination.el.length===0}function d(y,v){const{bulletActiveClass:R}=e.params.pagination;y&&(y=y[`${v==="prev"?"previous":"next"}ElementSibling`],y&&(y.classList.add(`${R}-${v}`),y=y[`${v==="prev"?"previous":"next"}ElementSibling`],y&&y.classList.add(`${R}-${v}-${v}`)))}function p(y,v,R){if(y=y%R,v=v%R,v===y+1)return"next";if(v===y-1)return"previous"}function E(y){const v=y.target.closest(Oi(e.params.pagination.bulletClass));if(!v)return;y.preventDefault();const R=Ol(v)*e.params.slidesPerGroup;if(e.params.loop){if(e.realIndex===R)return;const w=p(e.realIndex,R,e.slides.length);w==="next"?e.slideNext():w==="previous"?e.slidePrev():e.slideToLoop(R)}else e.slideTo(R)}function m(){const y=e.rtl,v=e.params.pagination;if(c())return;let R=e.pagination.el;R=Et(R);let w,M;const k=e.virtual&&e.params.virtual.enabled?e.virtual.slides.length:e.slides.length,H=e.params.loop?Math.ceil(k/e.params.slidesPerGroup):e.snapGrid.length;if(e.params.loop?(M=e.previousRealIndex||0,w=e.params.slidesPerGroup>1?Math.floor(e.realIndex/e.params.slidesPerGroup):e.realIndex):typeof e.snapIndex<"u"?(w=e.snapIndex,M=e.previousSnapIndex):(M=e.previousIndex||0,w=e.activeIndex||0),v.type==="bullets"&&e.pagination.bullets&&e.pagination.bullets.length>0){const O=e.pagination.bullets;let z,ie,G;if(v.dynamicBullets&&(o=Gh(O[0],e.isHorizontal()?"width":"height"),R.forEach(X=>{X.style[e.isHorizontal()?"width":"height"]=`${o*(v.dynamicMainBullets+4)}px`}),v.dynamicMainBullets>1&&M!==void 0&&(f+=w-(M||0),f>v.dynamicMainBullets-1?f=v.dynamicMainBullets-1:f<0&&(f=0)),z=Math.max(w-f,0),ie=z+(Math.min(O.length,v.dynamicMainBullets)-1),G=(ie+z)/2),O.forEach(X=>{const ee=[...["","-next","-next-next","-prev","-prev-prev","-main"].map(B=>`${v.bulletActiveClass}${B}`)].map(B=>typeof B=="string"&&B.includes(" ")?B.split(" "):B).flat();X.classList.remove(...ee)}),R.length>1)O.forEach(X=>{const ee=Ol(X);ee===w?X.classList.add(...v.bulletActiveClass.split(" ")):e.isElement&&X.setAttribute("part","bullet"),v.dynamicBullets&&(ee>=z&&ee<=ie&&X.classList.add(...`${v.bulletActiveClass}-main`.split(" ")),ee===z&&d(X,"prev"),ee===ie&&d(X,"next"))});else{const X=O[w];if(X&&X.classList.add(...v.bulletActiveClass.split(" ")),e.isElement&&O.forEach((ee,B)=>{ee.setAttribute("part",B===w?"bullet-active":"bullet")}),v.dynamicBullets){const ee=O[z],B=O[ie];for(let Q=z;Q<=ie;Q+=1)O[Q]&&O[Q].classList.add(...`${v.bulletActiveClass}-main`.split(" "));d(ee,"prev"),d(B,"next")}}if(v.dynamicBullets){const X=Math.min(O.length,v.dynamicMainBullets+4),ee=(o*X-o)/2-G*o,B=y?"right":"left";O.forEach(Q=>{Q.style[e.isHorizontal()?B:"top"]=`${ee}px`})}}R.forEach((O,z)=>{if(v.type==="fraction"&&(O.querySelectorAll(Oi(v.currentClass)).forEach(ie=>{ie.textContent=v.formatFractionCurrent(w+1)}),O.querySelectorAll(Oi(v.totalClass)).forEach(ie=>{ie.textContent=v.formatFractionTotal(H)})),v.type==="progressbar"){let ie;v.progressbarOpposite?ie=e.isHorizontal()?"vertical":"horizontal":ie=e.isHorizontal()?"horizontal":"vertical";const G=(w+1)/H;let X=1,ee=1;ie==="horizontal"?X=G:ee=G,O.querySelectorAll(Oi(v.progressbarFillClass)).forEach(B=>{B.style.transform=`translate3d(0,0,0) scaleX(${X}) scaleY(${ee})`,B.style.transitionDuration=`${e.params.speed}ms`})}v.type==="custom"&&v.renderCustom?(O.innerHTML=v.renderCustom(e,w+1,H),z===0&&i("paginationRender",O)):(z===0&&i("paginationRender",O),i("paginationUpdate",O)),e.params.watchOverflow&&e.enabled&&O.classList[e.isLocked?"add":"remove"](v.lockClass)})}function g(){const y=e.params.pagination;if(c())return;const v=e.virtual&&e.params.virtual.enabled?e.virtual.slides.length:e.grid&&e.params.grid.rows>1?e.slides.length/Math.ceil(e.params.grid.rows):e.slides.length;let R=e.pagination.el;R=Et(R);let w="";if(y.type==="bullets"){let M=e.params.loop?Math.ceil(v/e.params.slidesPerGroup):e.snapGrid.length;e.params.freeMode&&e.params.freeMode.enabled&&M>v&&(M=v);for(let k=0;k<M;k+=1)y.renderBullet?w+=y.renderBullet.call(e,k,y.bulletClass):w+=`<${y.bulletElement} ${e.isElement?'part="bullet"':""} class="${y.bulletClass}"></${y.bulletElement}>`}y.type==="fraction"&&(y.renderFraction?w=y.renderFraction.call(e,y.currentClass,y.totalClass):w=`<span class="${y.currentClass}"></span> / <span class="${y.totalClass}"></span>`),y.type==="progressbar"&&(y.renderProgressbar?w=y.renderProgressbar.call(e,y.progressbarFillClass):w=`<span class="${y.progressbarFillClass}"></span>`),e.pagination.bullets=[],R.forEach(M=>{y.type!=="custom"&&(M.innerHTML=w||""),y.type==="bullets"&&e.pagination.bullets.push(...M.querySelectorAll(Oi(y.bulletClass)))}),y.type!=="custom"&&i("paginationRender",R[0])}function _(){e.params.pagination=t0(e,e.originalParams.pagination,e.params.pagination,{el:"swiper-pagination"});const y=e.params.pagination;if(!y.el)return;let v;typeof y.el=="string"&&e.isElement&&(v=e.el.querySelector(y.el)),!v&&typeof y.el=="string"&&(v=[...document.querySelectorAll(y.el)]),v||(v=y.el),!(!v||v.length===0)&&(e.params.uniqueNavElements&&typeof y.el=="string"&&Array.isArray(v)&&v.length>1&&(v=[...e.el.querySelectorAll(y.el)],v.length>1&&(v=v.filter(R=>Js(R,".swiper")[0]===e.el)[0])),Array.isArray(v)&&v.length===1&&(v=v[0]),Object.assign(e.pagination,{el:v}),v=Et(v),v.forEach(R=>{y.type==="bullets"&&y.clickable&&R.classList.add(...(y.clickableClass||"").split(" ")),R.classList.add(y.modifierClass+y.type),R.classList.add(e.isHorizontal()?y.horizontalClass:y.verticalClass),y.type==="bullets"&&y.dynamicBullets&&(R.classList.add(`${y.modifierClass}${y.type}-dynamic`),f=0,y.dynamicMainBullets<1&&(y.dynamicMainBullets=1)),y.type==="progressbar"&&y.progressbarOpposite&&R.classList.add(y.progressbarOppositeClass),y.clickable&&R.addEventListener("click",E),e.enabled||R.classList.add(y.lockClass)}))}function b(){const y=e.params.pagination;if(c())return;let v=e.pagination.el;v&&(v=Et(v),v.forEach(R=>{R.classList.remove(y.hiddenClass),R.classList.remove(y.modifierClass+y.type),R.classList.remove(e.isHorizontal()?y.horizontalClass:y.verticalClass),y.clickable&&(R.classList.remove(...(y.clickableClass||"").split(" ")),R.removeEventListener("click",E))})),e.pagination.bullets&&e.pagination.bullets.forEach(R=>R.classList.remove(...y.bulletActiveClass.split(" ")))}n("changeDirection",()=>{if(!e.pagination||!e.pagination.el)return;const y=e.params.pagination;let{el:v}=e.pagination;v=Et(v),v.forEach(R=>{R.classList.remove(y.horizontalClass,y.verticalClass),R.classList.add(e.isHorizontal()?y.horizontalClass:y.verticalClass)})}),n("init",()=>{e.params.pagination.enabled===!1?S():(_(),g(),m())}),n("activeIndexChange",()=>{typeof e.snapIndex>"u"&&m()}),n("snapIndexChange",()=>{m()}),n("snapGridLengthChange",()=>{g(),m()}),n("destroy",()=>{b()}),n("enable disable",()=>{let{el:y}=e.pagination;y&&(y=Et(y),y.forEach(v=>v.classList[e.enabled?"remove":"add"](e.params.pagination.lockClass)))}),n("lock unlock",()=>{m()}),n("click",(y,v)=>{const R=v.target,w=Et(e.pagination.el);if(e.params.pagination.el&&e.params.pagination.hideOnClick&&w&&w.length>0&&!R.classList.contains(e.params.pagination.bulletClass)){if(e.navigation&&(e.navigation.nextEl&&R===e.navigation.nextEl||e.navigation.prevEl&&R===e.navigation.prevEl))return;const M=w[0].classList.contains(e.params.pagination.hiddenClass);i(M===!0?"paginationShow":"paginationHide"),w.forEach(k=>k.classList.toggle(e.params.pagination.hiddenClass))}});const x=()=>{e.el.classList.remove(e.params.pagination.paginationDisabledClass);let{el:y}=e.pagination;y&&(y=Et(y),y.forEach(v=>v.classList.remove(e.params.pagination.paginationDisabledClass))),_(),g(),m()},S=()=>{e.el.classList.add(e.params.pagination.paginationDisabledClass);let{el:y}=e.pagination;y&&(y=Et(y),y.forEach(v=>v.classList.add(e.params.pagination.paginationDisabledClass))),b()};Object.assign(e.pagination,{enable:x,disable:S,render:g,update:m,init:_,destroy:b})}function Wk(t){let{swiper:e,extendParams:r,on:n,emit:i}=t;const s=yr();let o=!1,f=null,c=null,d,p,E,m;r({scrollbar:{el:null,dragSize:"auto",hide:!1,draggable:!1,snapOnRelease:!0,lockClass:"swiper-scrollbar-lock",dragClass:"swiper-scrollbar-drag",scrollbarDisabledClass:"swiper-scrollbar-disabled",horizontalClass:"swiper-scrollbar-horizontal",verticalClass:"swiper-scrollbar-vertical"}}),e.scrollbar={el:null,dragEl:null};function g(){if(!e.params.scrollbar.el||!e.scrollbar.el)return;const{scrollbar:G,rtlTranslate:X}=e,{dragEl:ee,el:B}=G,Q=e.params.scrollbar,W=e.params.loop?e.progressLoop:e.progress;let j=p,ue=(E-p)*W;X?(ue=-ue,ue>0?(j=p-ue,ue=0):-ue+p>E&&(j=E+ue)):ue<0?(j=p+ue,ue=0):ue+p>E&&(j=E-ue),e.isHorizontal()?(ee.style.transform=`translate3d(${ue}px, 0, 0)`,ee.style.width=`${j}px`):(ee.style.transform=`translate3d(0px, ${ue}px, 0)`,ee.style.height=`${j}px`),Q.hide&&(clearTimeout(f),B.style.opacity=1,f=setTimeout(()=>{B.style.opacity=0,B.style.transitionDuration="400ms"},1e3))}function _(G){!e.params.scrollbar.el||!e.scrollbar.el||(e.scrollbar.dragEl.style.transitionDuration=`${G}ms`)}function b(){if(!e.params.scrollbar.el||!e.scrollbar.el)return;const{scrollbar:G}=e,{dragEl:X,el:ee}=G;X.style.width="",X.style.height="",E=e.isHorizontal()?ee.offsetWidth:ee.offsetHeight,m=e.size/(e.virtualSize+e.params.slidesOffsetBefore-(e.params.centeredSlides?e.snapGrid[0]:0)),e.params.scrollbar.dragSize==="auto"?p=E*m:p=parseInt(e.params.scrollbar.dragSize,10),e.isHorizontal()?X.style.width=`${p}px`:X.style.height=`${p}px`,m>=1?ee.style.display="none":ee.style.display="",e.params.scrollbar.hide&&(ee.style.opacity=0),e.params.watchOverflow&&e.enabled&&G.el.classList[e.isLocked?"add":"remove"](e.params.scrollbar.lockClass)}function x(G){return e.isHorizontal()?G.clientX:G.clientY}function S(G){const{scrollbar:X,rtlTranslate:ee}=e,{el:B}=X;let Q;Q=(x(G)-Bf(B)[e.isHorizontal()?"left":"top"]-(d!==null?d:p/2))/(E-p),Q=Math.max(Math.min(Q,1),0),ee&&(Q=1-Q);const W=e.minTranslate()+(e.maxTranslate()-e.minTranslate())*Q;e.updateProgress(W),e.setTranslate(W),e.updateActiveIndex(),e.updateSlidesClasses()}function y(G){const X=e.params.scrollbar,{scrollbar:ee,wrapperEl:B}=e,{el:Q,dragEl:W}=ee;o=!0,d=G.target===W?x(G)-G.target.getBoundingClientRect()[e.isHorizontal()?"left":"top"]:null,G.preventDefault(),G.stopPropagation(),B.style.transitionDuration="100ms",W.style.transitionDuration="100ms",S(G),clearTimeout(c),Q.style.transitionDuration="0ms",X.hide&&(Q.style.opacity=1),e.params.cssMode&&(e.wrapperEl.style["scroll-snap-type"]="none"),i("scrollbarDragStart",G)}function v(G){const{scrollbar:X,wrapperEl:ee}=e,{el:B,dragEl:Q}=X;o&&(G.preventDefault&&G.cancelable?G.preventDefault():G.returnValue=!1,S(G),ee.style.transitionDuration="0ms",B.style.transitionDuration="0ms",Q.style.transitionDuration="0ms",i("scrollbarDragMove",G))}function R(G){const X=e.params.scrollbar,{scrollbar:ee,wrapperEl:B}=e,{el:Q}=ee;o&&(o=!1,e.params.cssMode&&(e.wrapperEl.style["scroll-snap-type"]="",B.style.transitionDuration=""),X.hide&&(clearTimeout(c),c=na(()=>{Q.style.opacity=0,Q.style.transitionDuration="400ms"},1e3)),i("scrollbarDragEnd",G),X.snapOnRelease&&e.slideToClosest())}function w(G){const{scrollbar:X,params:ee}=e,B=X.el;if(!B)return;const Q=B,W=ee.passiveListeners?{passive:!1,capture:!1}:!1,j=ee.passiveListeners?{passive:!0,capture:!1}:!1;if(!Q)return;const ue=G==="on"?"addEventListener":"removeEventListener";Q[ue]("pointerdown",y,W),s[ue]("pointermove",v,W),s[ue]("pointerup",R,j)}function M(){!e.params.scrollbar.el||!e.scrollbar.el||w("on")}function k(){!e.params.scrollbar.el||!e.scrollbar.el||w("off")}function H(){const{scrollbar:G,el:X}=e;e.params.scrollbar=t0(e,e.originalParams.scrollbar,e.params.scrollbar,{el:"swiper-scrollbar"});const ee=e.params.scrollbar;if(!ee.el)return;let B;if(typeof ee.el=="string"&&e.isElement&&(B=e.el.querySelector(ee.el)),!B&&typeof ee.el=="string"){if(B=s.querySelectorAll(ee.el),!B.length)return}else B||(B=ee.el);e.params.uniqueNavElements&&typeof ee.el=="string"&&B.length>1&&X.querySelectorAll(ee.el).length===1&&(B=X.querySelector(ee.el)),B.length>0&&(B=B[0]),B.classList.add(e.isHorizontal()?ee.horizontalClass:ee.verticalClass);let Q;B&&(Q=B.querySelector(Oi(e.params.scrollbar.dragClass)),Q||(Q=pn("div",e.params.scrollbar.dragClass),B.append(Q))),Object.assign(G,{el:B,dragEl:Q}),ee.draggable&&M(),B&&B.classList[e.enabled?"remove":"add"](...es(e.params.scrollbar.lockClass))}function O(){const G=e.params.scrollbar,X=e.scrollbar.el;X&&X.classList.remove(...es(e.isHorizontal()?G.horizontalClass:G.verticalClass)),k()}n("changeDirection",()=>{if(!e.scrollbar||!e.scrollbar.el)return;const G=e.params.scrollbar;let{el:X}=e.scrollbar;X=Et(X),X.forEach(ee=>{ee.classList.remove(G.horizontalClass,G.verticalClass),ee.classList.add(e.isHorizontal()?G.horizontalClass:G.verticalClass)})}),n("init",()=>{e.params.scrollbar.enabled===!1?ie():(H(),b(),g())}),n("update resize observerUpdate lock unlock changeDirection",()=>{b()}),n("setTranslate",()=>{g()}),n("setTransition",(G,X)=>{_(X)}),n("enable disable",()=>{const{el:G}=e.scrollbar;G&&G.classList[e.enabled?"remove":"add"](...es(e.params.scrollbar.lockClass))}),n("destroy",()=>{O()});const z=()=>{e.el.classList.remove(...es(e.params.scrollbar.scrollbarDisabledClass)),e.scrollbar.el&&e.scrollbar.el.classList.remove(...es(e.params.scrollbar.scrollbarDisabledClass)),H(),b(),g()},ie=()=>{e.el.classList.add(...es(e.params.scrollbar.scrollbarDisabledClass)),e.scrollbar.el&&e.scrollbar.el.classList.add(...es(e.params.scrollbar.scrollbarDisabledClass)),O()};Object.assign(e.scrollbar,{enable:z,disable:ie,updateSize:b,setTranslate:g,init:H,destroy:O})}function Xk(t){let{swiper:e,extendParams:r,on:n}=t;r({parallax:{enabled:!1}});const i="[data-swiper-parallax], [data-swiper-parallax-x], [data-swiper-parallax-y], [data-swiper-parallax-opacity], [data-swiper-parallax-scale]",s=(c,d)=>{const{rtl:p}=e,E=p?-1:1,m=c.getAttribute("data-swiper-parallax")||"0";let g=c.getAttribute("data-swiper-parallax-x"),_=c.getAttribute("data-swiper-parallax-y");const b=c.getAttribute("data-swiper-parallax-scale"),x=c.getAttribute("data-swiper-parallax-opacity"),S=c.getAttribute("data-swiper-parallax-rotate");if(g||_?(g=g||"0",_=_||"0"):e.isHorizontal()?(g=m,_="0"):(_=m,g="0"),g.indexOf("%")>=0?g=`${parseInt(g,10)*d*E}%`:g=`${g*d*E}px`,_.indexOf("%")>=0?_=`${parseInt(_,10)*d}%`:_=`${_*d}px`,typeof x<"u"&&x!==null){const v=x-(x-1)*(1-Math.abs(d));c.style.opacity=v}let y=`translate3d(${g}, ${_}, 0px)`;if(typeof b<"u"&&b!==null){const v=b-(b-1)*(1-Math.abs(d));y+=` scale(${v})`}if(S&&typeof S<"u"&&S!==null){const v=S*d*-1;y+=` rotate(${v}deg)`}c.style.transform=y},o=()=>{const{el:c,slides:d,progress:p,snapGrid:E,isElement:m}=e,g=Rr(c,i);e.isElement&&g.push(...Rr(e.hostEl,i)),g.forEach(_=>{s(_,p)}),d.forEach((_,b)=>{let x=_.progress;e.params.slidesPerGroup>1&&e.params.slidesPerView!=="auto"&&(x+=Math.ceil(b/2)-p*(E.length-1)),x=Math.min(Math.max(x,-1),1),_.querySelectorAll(`${i}, [data-swiper-parallax-rotate]`).forEach(S=>{s(S,x)})})},f=function(c){c===void 0&&(c=e.params.speed);const{el:d,hostEl:p}=e,E=[...d.querySelectorAll(i)];e.isElement&&E.push(...p.querySelectorAll(i)),E.forEach(m=>{let g=parseInt(m.getAttribute("data-swiper-parallax-duration"),10)||c;c===0&&(g=0),m.style.transitionDuration=`${g}ms`})};n("beforeInit",()=>{e.params.parallax.enabled&&(e.params.watchSlidesProgress=!0,e.originalParams.watchSlidesProgress=!0)}),n("init",()=>{e.params.parallax.enabled&&o()}),n("setTranslate",()=>{e.params.parallax.enabled&&o()}),n("setTransition",(c,d)=>{e.params.parallax.enabled&&f(d)})}function jk(t){let{swiper:e,extendParams:r,on:n,emit:i}=t;const s=tr();r({zoom:{enabled:!1,limitToOriginalSize:!1,maxRatio:3,minRatio:1,toggle:!0,containerClass:"swiper-zoom-container",zoomedSlideClass:"swiper-slide-zoomed"}}),e.zoom={enabled:!1};let o=1,f=!1,c,d;const p=[],E={originX:0,originY:0,slideEl:void 0,slideWidth:void 0,slideHeight:void 0,imageEl:void 0,imageWrapEl:void 0,maxRatio:3},m={isTouched:void 0,isMoved:void 0,currentX:void 0,currentY:void 0,minX:void 0,minY:void 0,maxX:void 0,maxY:void 0,width:void 0,height:void 0,startX:void 0,startY:void 0,touchesStart:{},touchesCurrent:{}},g={x:void 0,y:void 0,prevPositionX:void 0,prevPositionY:void 0,prevTime:void 0};let _=1;Object.defineProperty(e.zoom,"scale",{get(){return _},set(ae){if(_!==ae){const he=E.imageEl,Se=E.slideEl;i("zoomChange",ae,he,Se)}_=ae}});function b(){if(p.length<2)return 1;const ae=p[0].pageX,he=p[0].pageY,Se=p[1].pageX,He=p[1].pageY;return Math.sqrt((Se-ae)**2+(He-he)**2)}function x(){const ae=e.params.zoom,he=E.imageWrapEl.getAttribute("data-swiper-zoom")||ae.maxRatio;if(ae.limitToOriginalSize&&E.imageEl&&E.imageEl.naturalWidth){const Se=E.imageEl.naturalWidth/E.imageEl.offsetWidth;return Math.min(Se,he)}return he}function S(){if(p.length<2)return{x:null,y:null};const ae=E.imageEl.getBoundingClientRect();return[(p[0].pageX+(p[1].pageX-p[0].pageX)/2-ae.x-s.scrollX)/o,(p[0].pageY+(p[1].pageY-p[0].pageY)/2-ae.y-s.scrollY)/o]}function y(){return e.isElement?"swiper-slide":`.${e.params.slideClass}`}function v(ae){const he=y();return!!(ae.target.matches(he)||e.slides.filter(Se=>Se.contains(ae.target)).length>0)}function R(ae){const he=`.${e.params.zoom.containerClass}`;return!!(ae.target.matches(he)||[...e.hostEl.querySelectorAll(he)].filter(Se=>Se.contains(ae.target)).length>0)}function w(ae){if(ae.pointerType==="mouse"&&p.splice(0,p.length),!v(ae))return;const he=e.params.zoom;if(c=!1,d=!1,p.push(ae),!(p.length<2)){if(c=!0,E.scaleStart=b(),!E.slideEl){E.slideEl=ae.target.closest(`.${e.params.slideClass}, swiper-slide`),E.slideEl||(E.slideEl=e.slides[e.activeIndex]);let Se=E.slideEl.querySelector(`.${he.containerClass}`);if(Se&&(Se=Se.querySelectorAll("picture, img, svg, canvas, .swiper-zoom-target")[0]),E.imageEl=Se,Se?E.imageWrapEl=Js(E.imageEl,`.${he.containerClass}`)[0]:E.imageWrapEl=void 0,!E.imageWrapEl){E.imageEl=void 0;return}E.maxRatio=x()}if(E.imageEl){const[Se,He]=S();E.originX=Se,E.originY=He,E.imageEl.style.transitionDuration="0ms"}f=!0}}function M(ae){if(!v(ae))return;const he=e.params.zoom,Se=e.zoom,He=p.findIndex(Ie=>Ie.pointerId===ae.pointerId);He>=0&&(p[He]=ae),!(p.length<2)&&(d=!0,E.scaleMove=b(),E.imageEl&&(Se.scale=E.scaleMove/E.scaleStart*o,Se.scale>E.maxRatio&&(Se.scale=E.maxRatio-1+(Se.scale-E.maxRatio+1)**.5),Se.scale<he.minRatio&&(Se.scale=he.minRatio+1-(he.minRatio-Se.scale+1)**.5),E.imageEl.style.transform=`translate3d(0,0,0) scale(${Se.scale})`))}function k(ae){if(!v(ae)||ae.pointerType==="mouse"&&ae.type==="pointerout")return;const he=e.params.zoom,Se=e.zoom,He=p.findIndex(Ie=>Ie.pointerId===ae.pointerId);He>=0&&p.splice(He,1),!(!c||!d)&&(c=!1,d=!1,E.imageEl&&(Se.scale=Math.max(Math.min(Se.scale,E.maxRatio),he.minRatio),E.imageEl.style.transitionDuration=`${e.params.speed}ms`,E.imageEl.style.transform=`translate3d(0,0,0) scale(${Se.scale})`,o=Se.scale,f=!1,Se.scale>1&&E.slideEl?E.slideEl.classList.add(`${he.zoomedSlideClass}`):Se.scale<=1&&E.slideEl&&E.slideEl.classList.remove(`${he.zoomedSlideClass}`),Se.scale===1&&(E.originX=0,E.originY=0,E.slideEl=void 0)))}let H;function O(){e.touchEventsData.preventTouchMoveFromPointerMove=!1}function z(){clearTimeout(H),e.touchEventsData.preventTouchMoveFromPointerMove=!0,H=setTimeout(()=>{e.destroyed||O()})}function ie(ae){const he=e.device;if(!E.imageEl||m.isTouched)return;he.android&&ae.cancelable&&ae.preventDefault(),m.isTouched=!0;const Se=p.length>0?p[0]:ae;m.touchesStart.x=Se.pageX,m.touchesStart.y=Se.pageY}function G(ae){if(!v(ae)||!R(ae))return;const he=e.zoom;if(!E.imageEl||!m.isTouched||!E.slideEl)return;m.isMoved||(m.width=E.imageEl.offsetWidth||E.imageEl.clientWidth,m.height=E.imageEl.offsetHeight||E.imageEl.clientHeight,m.startX=kh(E.imageWrapEl,"x")||0,m.startY=kh(E.imageWrapEl,"y")||0,E.slideWidth=E.slideEl.offsetWidth,E.slideHeight=E.slideEl.offsetHeight,E.imageWrapEl.style.transitionDuration="0ms");const Se=m.width*he.scale,He=m.height*he.scale;if(m.minX=Math.min(E.slideWidth/2-Se/2,0),m.maxX=-m.minX,m.minY=Math.min(E.slideHeight/2-He/2,0),m.maxY=-m.minY,m.touchesCurrent.x=p.length>0?p[0].pageX:ae.pageX,m.touchesCurrent.y=p.length>0?p[0].pageY:ae.pageY,Math.max(Math.abs(m.touchesCurrent.x-m.touchesStart.x),Math.abs(m.touchesCurrent.y-m.touchesStart.y))>5&&(e.allowClick=!1),!m.isMoved&&!f){if(e.isHorizontal()&&(Math.floor(m.minX)===Math.floor(m.startX)&&m.touchesCurrent.x<m.touchesStart.x||Math.floor(m.maxX)===Math.floor(m.startX)&&m.touchesCurrent.x>m.touchesStart.x)){m.isTouched=!1,O();return}if(!e.isHorizontal()&&(Math.floor(m.minY)===Math.floor(m.startY)&&m.touchesCurrent.y<m.touchesStart.y||Math.floor(m.maxY)===Math.floor(m.startY)&&m.touchesCurrent.y>m.touchesStart.y)){m.isTouched=!1,O();return}}ae.cancelable&&ae.preventDefault(),ae.stopPropagation(),z(),m.isMoved=!0;const $e=(he.scale-o)/(E.maxRatio-e.params.zoom.minRatio),{originX:nt,originY:Fe}=E;m.currentX=m.touchesCurrent.x-m.touchesStart.x+m.startX+$e*(m.width-nt*2),m.currentY=m.touchesCurrent.y-m.touchesStart.y+m.startY+$e*(m.height-Fe*2),m.currentX<m.minX&&(m.currentX=m.minX+1-(m.minX-m.currentX+1)**.8),m.currentX>m.maxX&&(m.currentX=m.maxX-1+(m.currentX-m.maxX+1)**.8),m.currentY<m.minY&&(m.currentY=m.minY+1-(m.minY-m.currentY+1)**.8),m.currentY>m.maxY&&(m.currentY=m.maxY-1+(m.currentY-m.maxY+1)**.8),g.prevPositionX||(g.prevPositionX=m.touchesCurrent.x),g.prevPositionY||(g.prevPositionY=m.touchesCurrent.y),g.prevTime||(g.prevTime=Date.now()),g.x=(m.touchesCurrent.x-g.prevPositionX)/(Date.now()-g.prevTime)/2,g.y=(m.touchesCurrent.y-g.prevPositionY)/(Date.now()-g.prevTime)/2,Math.abs(m.touchesCurrent.x-g.prevPositionX)<2&&(g.x=0),Math.abs(m.touchesCurrent.y-g.prevPositionY)<2&&(g.y=0),g.prevPositionX=m.touchesCurrent.x,g.prevPositionY=m.touchesCurrent.y,g.prevTime=Date.now(),E.imageWrapEl.style.transform=`translate3d(${m.currentX}px, ${m.currentY}px,0)`}function X(){const ae=e.zoom;if(!E.imageEl)return;if(!m.isTouched||!m.isMoved){m.isTouched=!1,m.isMoved=!1;return}m.isTouched=!1,m.isMoved=!1;let he=300,Se=300;const He=g.x*he,Ie=m.currentX+He,$e=g.y*Se,nt=m.currentY+$e;g.x!==0&&(he=Math.abs((Ie-m.currentX)/g.x)),g.y!==0&&(Se=Math.abs((nt-m.currentY)/g.y));const Fe=Math.max(he,Se);m.currentX=Ie,m.currentY=nt;const ot=m.width*ae.scale,et=m.height*ae.scale;m.minX=Math.min(E.slideWidth/2-ot/2,0),m.maxX=-m.minX,m.minY=Math.min(E.slideHeight/2-et/2,0),m.maxY=-m.minY,m.currentX=Math.max(Math.min(m.currentX,m.maxX),m.minX),m.currentY=Math.max(Math.min(m.currentY,m.maxY),m.minY),E.imageWrapEl.style.transitionDuration=`${Fe}ms`,E.imageWrapEl.style.transform=`translate3d(${m.currentX}px, ${m.currentY}px,0)`}function ee(){const ae=e.zoom;E.slideEl&&e.activeIndex!==e.slides.indexOf(E.slideEl)&&(E.imageEl&&(E.imageEl.style.transform="translate3d(0,0,0) scale(1)"),E.imageWrapEl&&(E.imageWrapEl.style.transform="translate3d(0,0,0)"),E.slideEl.classList.remove(`${e.params.zoom.zoomedSlideClass}`),ae.scale=1,o=1,E.slideEl=void 0,E.imageEl=void 0,E.imageWrapEl=void 0,E.originX=0,E.originY=0)}function B(ae){const he=e.zoom,Se=e.params.zoom;if(!E.slideEl){ae&&ae.target&&(E.slideEl=ae.target.closest(`.${e.params.slideClass}, swiper-slide`)),E.slideEl||(e.params.virtual&&e.params.virtual.enabled&&e.virtual?E.slideEl=Rr(e.slidesEl,`.${e.params.slideActiveClass}`)[0]:E.slideEl=e.slides[e.activeIndex]);let ye=E.slideEl.querySelector(`.${Se.containerClass}`);ye&&(ye=ye.querySelectorAll("picture, img, svg, canvas, .swiper-zoom-target")[0]),E.imageEl=ye,ye?E.imageWrapEl=Js(E.imageEl,`.${Se.containerClass}`)[0]:E.imageWrapEl=void 0}if(!E.imageEl||!E.imageWrapEl)return;e.params.cssMode&&(e.wrapperEl.style.overflow="hidden",e.wrapperEl.style.touchAction="none"),E.slideEl.classList.add(`${Se.zoomedSlideClass}`);let He,Ie,$e,nt,Fe,ot,et,xt,zt,V,P,re,me,pe,be,xe,N,U;typeof m.touchesStart.x>"u"&&ae?(He=ae.pageX,Ie=ae.pageY):(He=m.touchesStart.x,Ie=m.touchesStart.y);const q=typeof ae=="number"?ae:null;o===1&&q&&(He=void 0,Ie=void 0,m.touchesStart.x=void 0,m.touchesStart.y=void 0);const ge=x();he.scale=q||ge,o=q||ge,ae&&!(o===1&&q)?(N=E.slideEl.offsetWidth,U=E.slideEl.offsetHeight,$e=Bf(E.slideEl).left+s.scrollX,nt=Bf(E.slideEl).top+s.scrollY,Fe=$e+N/2-He,ot=nt+U/2-Ie,zt=E.imageEl.offsetWidth||E.imageEl.clientWidth,V=E.imageEl.offsetHeight||E.imageEl.clientHeight,P=zt*he.scale,re=V*he.scale,me=Math.min(N/2-P/2,0),pe=Math.min(U/2-re/2,0),be=-me,xe=-pe,et=Fe*he.scale,xt=ot*he.scale,et<me&&(et=me),et>be&&(et=be),xt<pe&&(xt=pe),xt>xe&&(xt=xe)):(et=0,xt=0),q&&he.scale===1&&(E.originX=0,E.originY=0),E.imageWrapEl.style.transitionDuration="300ms",E.imageWrapEl.style.transform=`translate3d(${et}px, ${xt}px,0)`,E.imageEl.style.transitionDuration="300ms",E.imageEl.style.transform=`translate3d(0,0,0) scale(${he.scale})`}function Q(){const ae=e.zoom,he=e.params.zoom;if(!E.slideEl){e.params.virtual&&e.params.virtual.enabled&&e.virtual?E.slideEl=Rr(e.slidesEl,`.${e.params.slideActiveClass}`)[0]:E.slideEl=e.slides[e.activeIndex];let Se=E.slideEl.querySelector(`.${he.containerClass}`);Se&&(Se=Se.querySelectorAll("picture, img, svg, canvas, .swiper-zoom-target")[0]),E.imageEl=Se,Se?E.imageWrapEl=Js(E.imageEl,`.${he.containerClass}`)[0]:E.imageWrapEl=void 0}!E.imageEl||!E.imageWrapEl||(e.params.cssMode&&(e.wrapperEl.style.overflow="",e.wrapperEl.style.touchAction=""),ae.scale=1,o=1,m.touchesStart.x=void 0,m.touchesStart.y=void 0,E.imageWrapEl.style.transitionDuration="300ms",E.imageWrapEl.style.transform="translate3d(0,0,0)",E.imageEl.style.transitionDuration="300ms",E.imageEl.style.transform="translate3d(0,0,0) scale(1)",E.slideEl.classList.remove(`${he.zoomedSlideClass}`),E.slideEl=void 0,E.originX=0,E.originY=0)}function W(ae){const he=e.zoom;he.scale&&he.scale!==1?Q():B(ae)}function j(){const ae=e.params.passiveListeners?{passive:!0,capture:!1}:!1,he=e.params.passiveListeners?{passive:!1,capture:!0}:!0;return{passiveListener:ae,activeListenerWithCapture:he}}function ue(){const ae=e.zoom;if(ae.enabled)return;ae.enabled=!0;const{passiveListener:he,activeListenerWithCapture:Se}=j();e.wrapperEl.addEventListener("pointerdown",w,he),e.wrapperEl.addEventListener("pointermove",M,Se),["pointerup","pointercancel","pointerout"].forEach(He=>{e.wrapperEl.addEventListener(He,k,he)}),e.wrapperEl.addEventListener("pointermove",G,Se)}function ve(){const ae=e.zoom;if(!ae.enabled)return;ae.enabled=!1;const{passiveListener:he,activeListenerWithCapture:Se}=j();e.wrapperEl.removeEventListener("pointerdown",w,he),e.wrapperEl.removeEventListener("pointermove",M,Se),["pointerup","pointercancel","pointerout"].forEach(He=>{e.wrapperEl.removeEventListener(He,k,he)}),e.wrapperEl.removeEventListener("pointermove",G,Se)}n("init",()=>{e.params.zoom.enabled&&ue()}),n("destroy",()=>{ve()}),n("touchStart",(ae,he)=>{e.zoom.enabled&&ie(he)}),n("touchEnd",(ae,he)=>{e.zoom.enabled&&X()}),n("doubleTap",(ae,he)=>{!e.animating&&e.params.zoom.enabled&&e.zoom.enabled&&e.params.zoom.toggle&&W(he)}),n("transitionEnd",()=>{e.zoom.enabled&&e.params.zoom.enabled&&ee()}),n("slideChange",()=>{e.zoom.enabled&&e.params.zoom.enabled&&e.params.cssMode&&ee()}),Object.assign(e.zoom,{enable:ue,disable:ve,in:B,out:Q,toggle:W})}function zk(t){let{swiper:e,extendParams:r,on:n}=t;r({controller:{control:void 0,inverse:!1,by:"slide"}}),e.controller={control:void 0};function i(d,p){const E=function(){let b,x,S;return(y,v)=>{for(x=-1,b=y.length;b-x>1;)S=b+x>>1,y[S]<=v?x=S:b=S;return b}}();this.x=d,this.y=p,this.lastIndex=d.length-1;let m,g;return this.interpolate=function(b){return b?(g=E(this.x,b),m=g-1,(b-this.x[m])*(this.y[g]-this.y[m])/(this.x[g]-this.x[m])+this.y[m]):0},this}function s(d){e.controller.spline=e.params.loop?new i(e.slidesGrid,d.slidesGrid):new i(e.snapGrid,d.snapGrid)}function o(d,p){const E=e.controller.control;let m,g;const _=e.constructor;function b(x){if(x.destroyed)return;const S=e.rtlTranslate?-e.translate:e.translate;e.params.controller.by==="slide"&&(s(x),g=-e.controller.spline.interpolate(-S)),(!g||e.params.controller.by==="container")&&(m=(x.maxTranslate()-x.minTranslate())/(e.maxTranslate()-e.minTranslate()),(Number.isNaN(m)||!Number.isFinite(m))&&(m=1),g=(S-e.minTranslate())*m+x.minTranslate()),e.params.controller.inverse&&(g=x.maxTranslate()-g),x.updateProgress(g),x.setTranslate(g,e),x.updateActiveIndex(),x.updateSlidesClasses()}if(Array.isArray(E))for(let x=0;x<E.length;x+=1)E[x]!==p&&E[x]instanceof _&&b(E[x]);else E instanceof _&&p!==E&&b(E)}function f(d,p){const E=e.constructor,m=e.controller.control;let g;function _(b){b.destroyed||(b.setTransition(d,e),d!==0&&(b.transitionStart(),b.params.autoHeight&&na(()=>{b.updateAutoHeight()}),dl(b.wrapperEl,()=>{m&&b.transitionEnd()})))}if(Array.isArray(m))for(g=0;g<m.length;g+=1)m[g]!==p&&m[g]instanceof E&&_(m[g]);else m instanceof E&&p!==m&&_(m)}function c(){e.controller.control&&e.controller.spline&&(e.controller.spline=void 0,delete e.controller.spline)}n("beforeInit",()=>{if(typeof window<"u"&&(typeof e.params.controller.control=="string"||e.params.controller.control instanceof HTMLElement)){(typeof e.params.controller.control=="string"?[...document.querySelectorAll(e.params.controller.control)]:[e.params.controller.control]).forEach(p=>{if(e.controller.control||(e.controller.control=[]),p&&p.swiper)e.controller.control.push(p.swiper);else if(p){const E=`${e.params.eventsPrefix}init`,m=g=>{e.controller.control.push(g.detail[0]),e.update(),p.removeEventListener(E,m)};p.addEventListener(E,m)}});return}e.controller.control=e.params.controller.control}),n("update",()=>{c()}),n("resize",()=>{c()}),n("observerUpdate",()=>{c()}),n("setTranslate",(d,p,E)=>{!e.controller.control||e.controller.control.destroyed||e.controller.setTranslate(p,E)}),n("setTransition",(d,p,E)=>{!e.controller.control||e.controller.control.destroyed||e.controller.setTransition(p,E)}),Object.assign(e.controller,{setTranslate:o,setTransition:f})}function qk(t){let{swiper:e,extendParams:r,on:n}=t;r({a11y:{enabled:!0,notificationClass:"swiper-notification",prevSlideMessage:"Previous slide",nextSlideMessage:"Next slide",firstSlideMessage:"This is the first slide",lastSlideMessage:"This is the last slide",paginationBulletMessage:"Go to slide {{index}}",slideLabelMessage:"{{index}} / {{slidesLength}}",containerMessage:null,containerRoleDescriptionMessage:null,containerRole:null,itemRoleDescriptionMessage:null,slideRole:"group",id:null,scrollOnFocus:!0}}),e.a11y={clicked:!1};let i=null,s,o,f=new Date().getTime();function c(W){const j=i;j.length!==0&&(j.innerHTML="",j.innerHTML=W)}function d(W){const j=()=>Math.round(16*Math.random()).toString(16);return"x".repeat(W).replace(/x/g,j)}function p(W){W=Et(W),W.forEach(j=>{j.setAttribute("tabIndex","0")})}function E(W){W=Et(W),W.forEach(j=>{j.setAttribute("tabIndex","-1")})}function m(W,j){W=Et(W),W.forEach(ue=>{ue.setAttribute("role",j)})}function g(W,j){W=Et(W),W.forEach(ue=>{ue.setAttribute("aria-roledescription",j)})}function _(W,j){W=Et(W),W.forEach(ue=>{ue.setAttribute("aria-controls",j)})}function b(W,j){W=Et(W),W.forEach(ue=>{ue.setAttribute("aria-label",j)})}function x(W,j){W=Et(W),W.forEach(ue=>{ue.setAttribute("id",j)})}function S(W,j){W=Et(W),W.forEach(ue=>{ue.setAttribute("aria-live",j)})}function y(W){W=Et(W),W.forEach(j=>{j.setAttribute("aria-disabled",!0)})}function v(W){W=Et(W),W.forEach(j=>{j.setAttribute("aria-disabled",!1)})}function R(W){if(W.keyCode!==13&&W.keyCode!==32)return;const j=e.params.a11y,ue=W.target;if(!(e.pagination&&e.pagination.el&&(ue===e.pagination.el||e.pagination.el.contains(W.target))&&!W.target.matches(Oi(e.params.pagination.bulletClass)))){if(e.navigation&&e.navigation.prevEl&&e.navigation.nextEl){const ve=Et(e.navigation.prevEl);Et(e.navigation.nextEl).includes(ue)&&(e.isEnd&&!e.params.loop||e.slideNext(),e.isEnd?c(j.lastSlideMessage):c(j.nextSlideMessage)),ve.includes(ue)&&(e.isBeginning&&!e.params.loop||e.slidePrev(),e.isBeginning?c(j.firstSlideMessage):c(j.prevSlideMessage))}e.pagination&&ue.matches(Oi(e.params.pagination.bulletClass))&&ue.click()}}function w(){if(e.params.loop||e.params.rewind||!e.navigation)return;const{nextEl:W,prevEl:j}=e.navigation;j&&(e.isBeginning?(y(j),E(j)):(v(j),p(j))),W&&(e.isEnd?(y(W),E(W)):(v(W),p(W)))}function M(){return e.pagination&&e.pagination.bullets&&e.pagination.bullets.length}function k(){return M()&&e.params.pagination.clickable}function H(){const W=e.params.a11y;M()&&e.pagination.bullets.forEach(j=>{e.params.pagination.clickable&&(p(j),e.params.pagination.renderBullet||(m(j,"button"),b(j,W.paginationBulletMessage.replace(/\{\{index\}\}/,Ol(j)+1)))),j.matches(Oi(e.params.pagination.bulletActiveClass))?j.setAttribute("aria-current","true"):j.removeAttribute("aria-current")})}const O=(W,j,ue)=>{p(W),W.tagName!=="BUTTON"&&(m(W,"button"),W.addEventListener("keydown",R)),b(W,ue),_(W,j)},z=W=>{o&&o!==W.target&&!o.contains(W.target)&&(s=!0),e.a11y.clicked=!0},ie=()=>{s=!1,requestAnimationFrame(()=>{requestAnimationFrame(()=>{e.destroyed||(e.a11y.clicked=!1)})})},G=W=>{f=new Date().getTime()},X=W=>{if(e.a11y.clicked||!e.params.a11y.scrollOnFocus||new Date().getTime()-f<100)return;const j=W.target.closest(`.${e.params.slideClass}, swiper-slide`);if(!j||!e.slides.includes(j))return;o=j;const ue=e.slides.indexOf(j)===e.activeIndex,ve=e.params.watchSlidesProgress&&e.visibleSlides&&e.visibleSlides.includes(j);ue||ve||W.sourceCapabilities&&W.sourceCapabilities.firesTouchEvents||(e.isHorizontal()?e.el.scrollLeft=0:e.el.scrollTop=0,requestAnimationFrame(()=>{s||(e.params.loop?e.slideToLoop(parseInt(j.getAttribute("data-swiper-slide-index")),0):e.slideTo(e.slides.indexOf(j),0),s=!1)}))},ee=()=>{const W=e.params.a11y;W.itemRoleDescriptionMessage&&g(e.slides,W.itemRoleDescriptionMessage),W.slideRole&&m(e.slides,W.slideRole);const j=e.slides.length;W.slideLabelMessage&&e.slides.forEach((ue,ve)=>{const ae=e.params.loop?parseInt(ue.getAttribute("data-swiper-slide-index"),10):ve,he=W.slideLabelMessage.replace(/\{\{index\}\}/,ae+1).replace(/\{\{slidesLength\}\}/,j);b(ue,he)})},B=()=>{const W=e.params.a11y;e.el.append(i);const j=e.el;W.containerRoleDescriptionMessage&&g(j,W.containerRoleDescriptionMessage),W.containerMessage&&b(j,W.containerMessage),W.containerRole&&m(j,W.containerRole);const ue=e.wrapperEl,ve=W.id||ue.getAttribute("id")||`swiper-wrapper-${d(16)}`,ae=e.params.autoplay&&e.params.autoplay.enabled?"off":"polite";x(ue,ve),S(ue,ae),ee();let{nextEl:he,prevEl:Se}=e.navigation?e.navigation:{};he=Et(he),Se=Et(Se),he&&he.forEach(Ie=>O(Ie,ve,W.nextSlideMessage)),Se&&Se.forEach(Ie=>O(Ie,ve,W.prevSlideMessage)),k()&&Et(e.pagination.el).forEach($e=>{$e.addEventListener("keydown",R)}),yr().addEventListener("visibilitychange",G),e.el.addEventListener("focus",X,!0),e.el.addEventListener("focus",X,!0),e.el.addEventListener("pointerdown",z,!0),e.el.addEventListener("pointerup",ie,!0)};function Q(){i&&i.remove();let{nextEl:W,prevEl:j}=e.navigation?e.navigation:{};W=Et(W),j=Et(j),W&&W.forEach(ve=>ve.removeEventListener("keydown",R)),j&&j.forEach(ve=>ve.removeEventListener("keydown",R)),k()&&Et(e.pagination.el).forEach(ae=>{ae.removeEventListener("keydown",R)}),yr().removeEventListener("visibilitychange",G),e.el&&typeof e.el!="string"&&(e.el.removeEventListener("focus",X,!0),e.el.removeEventListener("pointerdown",z,!0),e.el.removeEventListener("pointerup",ie,!0))}n("beforeInit",()=>{i=pn("span",e.params.a11y.notificationClass),i.setAttribute("aria-live","assertive"),i.setAttribute("aria-atomic","true")}),n("afterInit",()=>{e.params.a11y.enabled&&B()}),n("slidesLengthChange snapGridLengthChange slidesGridLengthChange",()=>{e.params.a11y.enabled&&ee()}),n("fromEdge toEdge afterInit lock unlock",()=>{e.params.a11y.enabled&&w()}),n("paginationUpdate",()=>{e.params.a11y.enabled&&H()}),n("destroy",()=>{e.params.a11y.enabled&&Q()})}function Yk(t){let{swiper:e,extendParams:r,on:n}=t;r({history:{enabled:!1,root:"",replaceState:!1,key:"slides",keepQuery:!1}});let i=!1,s={};const o=g=>g.toString().replace(/\s+/g,"-").replace(/[^\w-]+/g,"").replace(/--+/g,"-").replace(/^-+/,"").replace(/-+$/,""),f=g=>{const _=tr();let b;g?b=new URL(g):b=_.location;const x=b.pathname.slice(1).split("/").filter(R=>R!==""),S=x.length,y=x[S-2],v=x[S-1];return{key:y,value:v}},c=(g,_)=>{const b=tr();if(!i||!e.params.history.enabled)return;let x;e.params.url?x=new URL(e.params.url):x=b.location;const S=e.virtual&&e.params.virtual.enabled?e.slidesEl.querySelector(`[data-swiper-slide-index="${_}"]`):e.slides[_];let y=o(S.getAttribute("data-history"));if(e.params.history.root.length>0){let R=e.params.history.root;R[R.length-1]==="/"&&(R=R.slice(0,R.length-1)),y=`${R}/${g?`${g}/`:""}${y}`}else x.pathname.includes(g)||(y=`${g?`${g}/`:""}${y}`);e.params.history.keepQuery&&(y+=x.search);const v=b.history.state;v&&v.value===y||(e.params.history.replaceState?b.history.replaceState({value:y},null,y):b.history.pushState({value:y},null,y))},d=(g,_,b)=>{if(_)for(let x=0,S=e.slides.length;x<S;x+=1){const y=e.slides[x];if(o(y.getAttribute("data-history"))===_){const R=e.getSlideIndex(y);e.slideTo(R,g,b)}}else e.slideTo(0,g,b)},p=()=>{s=f(e.params.url),d(e.params.speed,s.value,!1)},E=()=>{const g=tr();if(e.params.history){if(!g.history||!g.history.pushState){e.params.history.enabled=!1,e.params.hashNavigation.enabled=!0;return}if(i=!0,s=f(e.params.url),!s.key&&!s.value){e.params.history.replaceState||g.addEventListener("popstate",p);return}d(0,s.value,e.params.runCallbacksOnInit),e.params.history.replaceState||g.addEventListener("popstate",p)}},m=()=>{const g=tr();e.params.history.replaceState||g.removeEventListener("popstate",p)};n("init",()=>{e.params.history.enabled&&E()}),n("destroy",()=>{e.params.history.enabled&&m()}),n("transitionEnd _freeModeNoMomentumRelease",()=>{i&&c(e.params.history.key,e.activeIndex)}),n("slideChange",()=>{i&&e.params.cssMode&&c(e.params.history.key,e.activeIndex)})}function Jk(t){let{swiper:e,extendParams:r,emit:n,on:i}=t,s=!1;const o=yr(),f=tr();r({hashNavigation:{enabled:!1,replaceState:!1,watchState:!1,getSlideIndex(m,g){if(e.virtual&&e.params.virtual.enabled){const _=e.slides.filter(x=>x.getAttribute("data-hash")===g)[0];return _?parseInt(_.getAttribute("data-swiper-slide-index"),10):0}return e.getSlideIndex(Rr(e.slidesEl,`.${e.params.slideClass}[data-hash="${g}"], swiper-slide[data-hash="${g}"]`)[0])}}});const c=()=>{n("hashChange");const m=o.location.hash.replace("#",""),g=e.virtual&&e.params.virtual.enabled?e.slidesEl.querySelector(`[data-swiper-slide-index="${e.activeIndex}"]`):e.slides[e.activeIndex],_=g?g.getAttribute("data-hash"):"";if(m!==_){const b=e.params.hashNavigation.getSlideIndex(e,m);if(typeof b>"u"||Number.isNaN(b))return;e.slideTo(b)}},d=()=>{if(!s||!e.params.hashNavigation.enabled)return;const m=e.virtual&&e.params.virtual.enabled?e.slidesEl.querySelector(`[data-swiper-slide-index="${e.activeIndex}"]`):e.slides[e.activeIndex],g=m?m.getAttribute("data-hash")||m.getAttribute("data-history"):"";e.params.hashNavigation.replaceState&&f.history&&f.history.replaceState?(f.history.replaceState(null,null,`#${g}`||""),n("hashSet")):(o.location.hash=g||"",n("hashSet"))},p=()=>{if(!e.params.hashNavigation.enabled||e.params.history&&e.params.history.enabled)return;s=!0;const m=o.location.hash.replace("#","");if(m){const _=e.params.hashNavigation.getSlideIndex(e,m);e.slideTo(_||0,0,e.params.runCallbacksOnInit,!0)}e.params.hashNavigation.watchState&&f.addEventListener("hashchange",c)},E=()=>{e.params.hashNavigation.watchState&&f.removeEventListener("hashchange",c)};i("init",()=>{e.params.hashNavigation.enabled&&p()}),i("destroy",()=>{e.params.hashNavigation.enabled&&E()}),i("transitionEnd _freeModeNoMomentumRelease",()=>{s&&d()}),i("slideChange",()=>{s&&e.params.cssMode&&d()})}function Qk(t){let{swiper:e,extendParams:r,on:n,emit:i,params:s}=t;e.autoplay={running:!1,paused:!1,timeLeft:0},r({autoplay:{enabled:!1,delay:3e3,waitForTransition:!0,disableOnInteraction:!1,stopOnLastSlide:!1,reverseDirection:!1,pauseOnMouseEnter:!1}});let o,f,c=s&&s.autoplay?s.autoplay.delay:3e3,d=s&&s.autoplay?s.autoplay.delay:3e3,p,E=new Date().getTime(),m,g,_,b,x,S,y;function v(j){!e||e.destroyed||!e.wrapperEl||j.target===e.wrapperEl&&(e.wrapperEl.removeEventListener("transitionend",v),!(y||j.detail&&j.detail.bySwiperTouchMove)&&z())}const R=()=>{if(e.destroyed||!e.autoplay.running)return;e.autoplay.paused?m=!0:m&&(d=p,m=!1);const j=e.autoplay.paused?p:E+d-new Date().getTime();e.autoplay.timeLeft=j,i("autoplayTimeLeft",j,j/c),f=requestAnimationFrame(()=>{R()})},w=()=>{let j;return e.virtual&&e.params.virtual.enabled?j=e.slides.filter(ve=>ve.classList.contains("swiper-slide-active"))[0]:j=e.slides[e.activeIndex],j?parseInt(j.getAttribute("data-swiper-autoplay"),10):void 0},M=j=>{if(e.destroyed||!e.autoplay.running)return;cancelAnimationFrame(f),R();let ue=typeof j>"u"?e.params.autoplay.delay:j;c=e.params.autoplay.delay,d=e.params.autoplay.delay;const ve=w();!Number.isNaN(ve)&&ve>0&&typeof j>"u"&&(ue=ve,c=ve,d=ve),p=ue;const ae=e.params.speed,he=()=>{!e||e.destroyed||(e.params.autoplay.reverseDirection?!e.isBeginning||e.params.loop||e.params.rewind?(e.slidePrev(ae,!0,!0),i("autoplay")):e.params.autoplay.stopOnLastSlide||(e.slideTo(e.slides.length-1,ae,!0,!0),i("autoplay")):!e.isEnd||e.params.loop||e.params.rewind?(e.slideNext(ae,!0,!0),i("autoplay")):e.params.autoplay.stopOnLastSlide||(e.slideTo(0,ae,!0,!0),i("autoplay")),e.params.cssMode&&(E=new Date().getTime(),requestAnimationFrame(()=>{M()})))};return ue>0?(clearTimeout(o),o=setTimeout(()=>{he()},ue)):requestAnimationFrame(()=>{he()}),ue},k=()=>{E=new Date().getTime(),e.autoplay.running=!0,M(),i("autoplayStart")},H=()=>{e.autoplay.running=!1,clearTimeout(o),cancelAnimationFrame(f),i("autoplayStop")},O=(j,ue)=>{if(e.destroyed||!e.autoplay.running)return;clearTimeout(o),j||(S=!0);const ve=()=>{i("autoplayPause"),e.params.autoplay.waitForTransition?e.wrapperEl.addEventListener("transitionend",v):z()};if(e.autoplay.paused=!0,ue){x&&(p=e.params.autoplay.delay),x=!1,ve();return}p=(p||e.params.autoplay.delay)-(new Date().getTime()-E),!(e.isEnd&&p<0&&!e.params.loop)&&(p<0&&(p=0),ve())},z=()=>{e.isEnd&&p<0&&!e.params.loop||e.destroyed||!e.autoplay.running||(E=new Date().getTime(),S?(S=!1,M(p)):M(),e.autoplay.paused=!1,i("autoplayResume"))},ie=()=>{if(e.destroyed||!e.autoplay.running)return;const j=yr();j.visibilityState==="hidden"&&(S=!0,O(!0)),j.visibilityState==="visible"&&z()},G=j=>{j.pointerType==="mouse"&&(S=!0,y=!0,!(e.animating||e.autoplay.paused)&&O(!0))},X=j=>{j.pointerType==="mouse"&&(y=!1,e.autoplay.paused&&z())},ee=()=>{e.params.autoplay.pauseOnMouseEnter&&(e.el.addEventListener("pointerenter",G),e.el.addEventListener("pointerleave",X))},B=()=>{e.el&&typeof e.el!="string"&&(e.el.removeEventListener("pointerenter",G),e.el.removeEventListener("pointerleave",X))},Q=()=>{yr().addEventListener("visibilitychange",ie)},W=()=>{yr().removeEventListener("visibilitychange",ie)};n("init",()=>{e.params.autoplay.enabled&&(ee(),Q(),k())}),n("destroy",()=>{B(),W(),e.autoplay.running&&H()}),n("_freeModeStaticRelease",()=>{(_||S)&&z()}),n("_freeModeNoMomentumRelease",()=>{e.params.autoplay.disableOnInteraction?H():O(!0,!0)}),n("beforeTransitionStart",(j,ue,ve)=>{e.destroyed||!e.autoplay.running||(ve||!e.params.autoplay.disableOnInteraction?O(!0,!0):H())}),n("sliderFirstMove",()=>{if(!(e.destroyed||!e.autoplay.running)){if(e.params.autoplay.disableOnInteraction){H();return}g=!0,_=!1,S=!1,b=setTimeout(()=>{S=!0,_=!0,O(!0)},200)}}),n("touchEnd",()=>{if(!(e.destroyed||!e.autoplay.running||!g)){if(clearTimeout(b),clearTimeout(o),e.params.autoplay.disableOnInteraction){_=!1,g=!1;return}_&&e.params.cssMode&&z(),_=!1,g=!1}}),n("slideChange",()=>{e.destroyed||!e.autoplay.running||(x=!0)}),Object.assign(e.autoplay,{start:k,stop:H,pause:O,resume:z})}function Zk(t){let{swiper:e,extendParams:r,on:n}=t;r({thumbs:{swiper:null,multipleActiveThumbs:!0,autoScrollOffset:0,slideThumbActiveClass:"swiper-slide-thumb-active",thumbsContainerClass:"swiper-thumbs"}});let i=!1,s=!1;e.thumbs={swiper:null};function o(){const d=e.thumbs.swiper;if(!d||d.destroyed)return;const p=d.clickedIndex,E=d.clickedSlide;if(E&&E.classList.contains(e.params.thumbs.slideThumbActiveClass)||typeof p>"u"||p===null)return;let m;d.params.loop?m=parseInt(d.clickedSlide.getAttribute("data-swiper-slide-index"),10):m=p,e.params.loop?e.slideToLoop(m):e.slideTo(m)}function f(){const{thumbs:d}=e.params;if(i)return!1;i=!0;const p=e.constructor;if(d.swiper instanceof p)e.thumbs.swiper=d.swiper,Object.assign(e.thumbs.swiper.originalParams,{watchSlidesProgress:!0,slideToClickedSlide:!1}),Object.assign(e.thumbs.swiper.params,{watchSlidesProgress:!0,slideToClickedSlide:!1}),e.thumbs.swiper.update();else if(il(d.swiper)){const E=Object.assign({},d.swiper);Object.assign(E,{watchSlidesProgress:!0,slideToClickedSlide:!1}),e.thumbs.swiper=new p(E),s=!0}return e.thumbs.swiper.el.classList.add(e.params.thumbs.thumbsContainerClass),e.thumbs.swiper.on("tap",o),!0}function c(d){const p=e.thumbs.swiper;if(!p||p.destroyed)return;const E=p.params.slidesPerView==="auto"?p.slidesPerViewDynamic():p.params.slidesPerView;let m=1;const g=e.params.thumbs.slideThumbActiveClass;if(e.params.slidesPerView>1&&!e.params.centeredSlides&&(m=e.params.slidesPerView),e.params.thumbs.multipleActiveThumbs||(m=1),m=Math.floor(m),p.slides.forEach(x=>x.classList.remove(g)),p.params.loop||p.params.virtual&&p.params.virtual.enabled)for(let x=0;x<m;x+=1)Rr(p.slidesEl,`[data-swiper-slide-index="${e.realIndex+x}"]`).forEach(S=>{S.classList.add(g)});else for(let x=0;x<m;x+=1)p.slides[e.realIndex+x]&&p.slides[e.realIndex+x].classList.add(g);const _=e.params.thumbs.autoScrollOffset,b=_&&!p.params.loop;if(e.realIndex!==p.realIndex||b){const x=p.activeIndex;let S,y;if(p.params.loop){const v=p.slides.filter(R=>R.getAttribute("data-swiper-slide-index")===`${e.realIndex}`)[0];S=p.slides.indexOf(v),y=e.activeIndex>e.previousIndex?"next":"prev"}else S=e.realIndex,y=S>e.previousIndex?"next":"prev";b&&(S+=y==="next"?_:-1*_),p.visibleSlidesIndexes&&p.visibleSlidesIndexes.indexOf(S)<0&&(p.params.centeredSlides?S>x?S=S-Math.floor(E/2)+1:S=S+Math.floor(E/2)-1:S>x&&p.params.slidesPerGroup,p.slideTo(S,d?0:void 0))}}n("beforeInit",()=>{const{thumbs:d}=e.params;if(!(!d||!d.swiper))if(typeof d.swiper=="string"||d.swiper instanceof HTMLElement){const p=yr(),E=()=>{const g=typeof d.swiper=="string"?p.querySelector(d.swiper):d.swiper;if(g&&g.swiper)d.swiper=g.swiper,f(),c(!0);else if(g){const _=`${e.params.eventsPrefix}init`,b=x=>{d.swiper=x.detail[0],g.removeEventListener(_,b),f(),c(!0),d.swiper.update(),e.update()};g.addEventListener(_,b)}return g},m=()=>{if(e.destroyed)return;E()||requestAnimationFrame(m)};requestAnimationFrame(m)}else f(),c(!0)}),n("slideChange update resize observerUpdate",()=>{c()}),n("setTransition",(d,p)=>{const E=e.thumbs.swiper;!E||E.destroyed||E.setTransition(p)}),n("beforeDestroy",()=>{const d=e.thumbs.swiper;!d||d.destroyed||s&&d.destroy()}),Object.assign(e.thumbs,{init:f,update:c})}function e2(t){let{swiper:e,extendParams:r,emit:n,once:i}=t;r({freeMode:{enabled:!1,momentum:!0,momentumRatio:1,momentumBounce:!0,momentumBounceRatio:1,momentumVelocityRatio:1,sticky:!1,minimumVelocity:.02}});function s(){if(e.params.cssMode)return;const c=e.getTranslate();e.setTranslate(c),e.setTransition(0),e.touchEventsData.velocities.length=0,e.freeMode.onTouchEnd({currentPos:e.rtl?e.translate:-e.translate})}function o(){if(e.params.cssMode)return;const{touchEventsData:c,touches:d}=e;c.velocities.length===0&&c.velocities.push({position:d[e.isHorizontal()?"startX":"startY"],time:c.touchStartTime}),c.velocities.push({position:d[e.isHorizontal()?"currentX":"currentY"],time:yn()})}function f(c){let{currentPos:d}=c;if(e.params.cssMode)return;const{params:p,wrapperEl:E,rtlTranslate:m,snapGrid:g,touchEventsData:_}=e,x=yn()-_.touchStartTime;if(d<-e.minTranslate()){e.slideTo(e.activeIndex);return}if(d>-e.maxTranslate()){e.slides.length<g.length?e.slideTo(g.length-1):e.slideTo(e.slides.length-1);return}if(p.freeMode.momentum){if(_.velocities.length>1){const H=_.velocities.pop(),O=_.velocities.pop(),z=H.position-O.position,ie=H.time-O.time;e.velocity=z/ie,e.velocity/=2,Math.abs(e.velocity)<p.freeMode.minimumVelocity&&(e.velocity=0),(ie>150||yn()-H.time>300)&&(e.velocity=0)}else e.velocity=0;e.velocity*=p.freeMode.momentumVelocityRatio,_.velocities.length=0;let S=1e3*p.freeMode.momentumRatio;const y=e.velocity*S;let v=e.translate+y;m&&(v=-v);let R=!1,w;const M=Math.abs(e.velocity)*20*p.freeMode.momentumBounceRatio;let k;if(v<e.maxTranslate())p.freeMode.momentumBounce?(v+e.maxTranslate()<-M&&(v=e.maxTranslate()-M),w=e.maxTranslate(),R=!0,_.allowMomentumBounce=!0):v=e.maxTranslate(),p.loop&&p.centeredSlides&&(k=!0);else if(v>e.minTranslate())p.freeMode.momentumBounce?(v-e.minTranslate()>M&&(v=e.minTranslate()+M),w=e.minTranslate(),R=!0,_.allowMomentumBounce=!0):v=e.minTranslate(),p.loop&&p.centeredSlides&&(k=!0);else if(p.freeMode.sticky){let H;for(let O=0;O<g.length;O+=1)if(g[O]>-v){H=O;break}Math.abs(g[H]-v)<Math.abs(g[H-1]-v)||e.swipeDirection==="next"?v=g[H]:v=g[H-1],v=-v}if(k&&i("transitionEnd",()=>{e.loopFix()}),e.velocity!==0){if(m?S=Math.abs((-v-e.translate)/e.velocity):S=Math.abs((v-e.translate)/e.velocity),p.freeMode.sticky){const H=Math.abs((m?-v:v)-e.translate),O=e.slidesSizesGrid[e.activeIndex];H<O?S=p.speed:H<2*O?S=p.speed*1.5:S=p.speed*2.5}}else if(p.freeMode.sticky){e.slideToClosest();return}p.freeMode.momentumBounce&&R?(e.updateProgress(w),e.setTransition(S),e.setTranslate(v),e.transitionStart(!0,e.swipeDirection),e.animating=!0,dl(E,()=>{!e||e.destroyed||!_.allowMomentumBounce||(n("momentumBounce"),e.setTransition(p.speed),setTimeout(()=>{e.setTranslate(w),dl(E,()=>{!e||e.destroyed||e.transitionEnd()})},0))})):e.velocity?(n("_freeModeNoMomentumRelease"),e.updateProgress(v),e.setTransition(S),e.setTranslate(v),e.transitionStart(!0,e.swipeDirection),e.animating||(e.animating=!0,dl(E,()=>{!e||e.destroyed||e.transitionEnd()}))):e.updateProgress(v),e.updateActiveIndex(),e.updateSlidesClasses()}else if(p.freeMode.sticky){e.slideToClosest();return}else p.freeMode&&n("_freeModeNoMomentumRelease");(!p.freeMode.momentum||x>=p.longSwipesMs)&&(n("_freeModeStaticRelease"),e.updateProgress(),e.updateActiveIndex(),e.updateSlidesClasses())}Object.assign(e,{freeMode:{onTouchStart:s,onTouchMove:o,onTouchEnd:f}})}function t2(t){let{swiper:e,extendParams:r,on:n}=t;r({grid:{rows:1,fill:"column"}});let i,s,o,f;const c=()=>{let b=e.params.spaceBetween;return typeof b=="string"&&b.indexOf("%")>=0?b=parseFloat(b.replace("%",""))/100*e.size:typeof b=="string"&&(b=parseFloat(b)),b},d=b=>{const{slidesPerView:x}=e.params,{rows:S,fill:y}=e.params.grid,v=e.virtual&&e.params.virtual.enabled?e.virtual.slides.length:b.length;o=Math.floor(v/S),Math.floor(v/S)===v/S?i=v:i=Math.ceil(v/S)*S,x!=="auto"&&y==="row"&&(i=Math.max(i,x*S)),s=i/S},p=()=>{e.slides&&e.slides.forEach(b=>{b.swiperSlideGridSet&&(b.style.height="",b.style[e.getDirectionLabel("margin-top")]="")})},E=(b,x,S)=>{const{slidesPerGroup:y}=e.params,v=c(),{rows:R,fill:w}=e.params.grid,M=e.virtual&&e.params.virtual.enabled?e.virtual.slides.length:S.length;let k,H,O;if(w==="row"&&y>1){const z=Math.floor(b/(y*R)),ie=b-R*y*z,G=z===0?y:Math.min(Math.ceil((M-z*R*y)/R),y);O=Math.floor(ie/G),H=ie-O*G+z*y,k=H+O*i/R,x.style.order=k}else w==="column"?(H=Math.floor(b/R),O=b-H*R,(H>o||H===o&&O===R-1)&&(O+=1,O>=R&&(O=0,H+=1))):(O=Math.floor(b/s),H=b-O*s);x.row=O,x.column=H,x.style.height=`calc((100% - ${(R-1)*v}px) / ${R})`,x.style[e.getDirectionLabel("margin-top")]=O!==0?v&&`${v}px`:"",x.swiperSlideGridSet=!0},m=(b,x)=>{const{centeredSlides:S,roundLengths:y}=e.params,v=c(),{rows:R}=e.params.grid;if(e.virtualSize=(b+v)*i,e.virtualSize=Math.ceil(e.virtualSize/R)-v,e.params.cssMode||(e.wrapperEl.style[e.getDirectionLabel("width")]=`${e.virtualSize+v}px`),S){const w=[];for(let M=0;M<x.length;M+=1){let k=x[M];y&&(k=Math.floor(k)),x[M]<e.virtualSize+x[0]&&w.push(k)}x.splice(0,x.length),x.push(...w)}},g=()=>{f=e.params.grid&&e.params.grid.rows>1},_=()=>{const{params:b,el:x}=e,S=b.grid&&b.grid.rows>1;f&&!S?(x.classList.remove(`${b.containerModifierClass}grid`,`${b.containerModifierClass}grid-column`),o=1,e.emitContainerClasses()):!f&&S&&(x.classList.add(`${b.containerModifierClass}grid`),b.grid.fill==="column"&&x.classList.add(`${b.containerModifierClass}grid-column`),e.emitContainerClasses()),f=S};n("init",g),n("update",_),e.grid={initSlides:d,unsetSlides:p,updateSlide:E,updateWrapperSize:m}}function r2(t){const e=this,{params:r,slidesEl:n}=e;r.loop&&e.loopDestroy();const i=s=>{if(typeof s=="string"){const o=document.createElement("div");o.innerHTML=s,n.append(o.children[0]),o.innerHTML=""}else n.append(s)};if(typeof t=="object"&&"length"in t)for(let s=0;s<t.length;s+=1)t[s]&&i(t[s]);else i(t);e.recalcSlides(),r.loop&&e.loopCreate(),(!r.observer||e.isElement)&&e.update()}function n2(t){const e=this,{params:r,activeIndex:n,slidesEl:i}=e;r.loop&&e.loopDestroy();let s=n+1;const o=f=>{if(typeof f=="string"){const c=document.createElement("div");c.innerHTML=f,i.prepend(c.children[0]),c.innerHTML=""}else i.prepend(f)};if(typeof t=="object"&&"length"in t){for(let f=0;f<t.length;f+=1)t[f]&&o(t[f]);s=n+t.length}else o(t);e.recalcSlides(),r.loop&&e.loopCreate(),(!r.observer||e.isElement)&&e.update(),e.slideTo(s,0,!1)}function i2(t,e){const r=this,{params:n,activeIndex:i,slidesEl:s}=r;let o=i;n.loop&&(o-=r.loopedSlides,r.loopDestroy(),r.recalcSlides());const f=r.slides.length;if(t<=0){r.prependSlide(e);return}if(t>=f){r.appendSlide(e);return}let c=o>t?o+1:o;const d=[];for(let p=f-1;p>=t;p-=1){const E=r.slides[p];E.remove(),d.unshift(E)}if(typeof e=="object"&&"length"in e){for(let p=0;p<e.length;p+=1)e[p]&&s.append(e[p]);c=o>t?o+e.length:o}else s.append(e);for(let p=0;p<d.length;p+=1)s.append(d[p]);r.recalcSlides(),n.loop&&r.loopCreate(),(!n.observer||r.isElement)&&r.update(),n.loop?r.slideTo(c+r.loopedSlides,0,!1):r.slideTo(c,0,!1)}function s2(t){const e=this,{params:r,activeIndex:n}=e;let i=n;r.loop&&(i-=e.loopedSlides,e.loopDestroy());let s=i,o;if(typeof t=="object"&&"length"in t){for(let f=0;f<t.length;f+=1)o=t[f],e.slides[o]&&e.slides[o].remove(),o<s&&(s-=1);s=Math.max(s,0)}else o=t,e.slides[o]&&e.slides[o].remove(),o<s&&(s-=1),s=Math.max(s,0);e.recalcSlides(),r.loop&&e.loopCreate(),(!r.observer||e.isElement)&&e.update(),r.loop?e.slideTo(s+e.loopedSlides,0,!1):e.slideTo(s,0,!1)}function a2(){const t=this,e=[];for(let r=0;r<t.slides.length;r+=1)e.push(r);t.removeSlide(e)}function o2(t){let{swiper:e}=t;Object.assign(e,{appendSlide:r2.bind(e),prependSlide:n2.bind(e),addSlide:i2.bind(e),removeSlide:s2.bind(e),removeAllSlides:a2.bind(e)})}function xo(t){const{effect:e,swiper:r,on:n,setTranslate:i,setTransition:s,overwriteParams:o,perspective:f,recreateShadows:c,getEffectParams:d}=t;n("beforeInit",()=>{if(r.params.effect!==e)return;r.classNames.push(`${r.params.containerModifierClass}${e}`),f&&f()&&r.classNames.push(`${r.params.containerModifierClass}3d`);const E=o?o():{};Object.assign(r.params,E),Object.assign(r.originalParams,E)}),n("setTranslate",()=>{r.params.effect===e&&i()}),n("setTransition",(E,m)=>{r.params.effect===e&&s(m)}),n("transitionEnd",()=>{if(r.params.effect===e&&c){if(!d||!d().slideShadows)return;r.slides.forEach(E=>{E.querySelectorAll(".swiper-slide-shadow-top, .swiper-slide-shadow-right, .swiper-slide-shadow-bottom, .swiper-slide-shadow-left").forEach(m=>m.remove())}),c()}});let p;n("virtualUpdate",()=>{r.params.effect===e&&(r.slides.length||(p=!0),requestAnimationFrame(()=>{p&&r.slides&&r.slides.length&&(i(),p=!1)}))})}function Gl(t,e){const r=oa(e);return r!==e&&(r.style.backfaceVisibility="hidden",r.style["-webkit-backface-visibility"]="hidden"),r}function xc(t){let{swiper:e,duration:r,transformElements:n,allSlides:i}=t;const{activeIndex:s}=e,o=f=>f.parentElement?f.parentElement:e.slides.filter(d=>d.shadowRoot&&d.shadowRoot===f.parentNode)[0];if(e.params.virtualTranslate&&r!==0){let f=!1,c;i?c=n:c=n.filter(d=>{const p=d.classList.contains("swiper-slide-transform")?o(d):d;return e.getSlideIndex(p)===s}),c.forEach(d=>{dl(d,()=>{if(f||!e||e.destroyed)return;f=!0,e.animating=!1;const p=new window.CustomEvent("transitionend",{bubbles:!0,cancelable:!0});e.wrapperEl.dispatchEvent(p)})})}}function l2(t){let{swiper:e,extendParams:r,on:n}=t;r({fadeEffect:{crossFade:!1}}),xo({effect:"fade",swiper:e,on:n,setTranslate:()=>{const{slides:o}=e,f=e.params.fadeEffect;for(let c=0;c<o.length;c+=1){const d=e.slides[c];let E=-d.swiperSlideOffset;e.params.virtualTranslate||(E-=e.translate);let m=0;e.isHorizontal()||(m=E,E=0);const g=e.params.fadeEffect.crossFade?Math.max(1-Math.abs(d.progress),0):1+Math.min(Math.max(d.progress,-1),0),_=Gl(f,d);_.style.opacity=g,_.style.transform=`translate3d(${E}px, ${m}px, 0px)`}},setTransition:o=>{const f=e.slides.map(c=>oa(c));f.forEach(c=>{c.style.transitionDuration=`${o}ms`}),xc({swiper:e,duration:o,transformElements:f,allSlides:!0})},overwriteParams:()=>({slidesPerView:1,slidesPerGroup:1,watchSlidesProgress:!0,spaceBetween:0,virtualTranslate:!e.params.cssMode})})}function u2(t){let{swiper:e,extendParams:r,on:n}=t;r({cubeEffect:{slideShadows:!0,shadow:!0,shadowOffset:20,shadowScale:.94}});const i=(c,d,p)=>{let E=p?c.querySelector(".swiper-slide-shadow-left"):c.querySelector(".swiper-slide-shadow-top"),m=p?c.querySelector(".swiper-slide-shadow-right"):c.querySelector(".swiper-slide-shadow-bottom");E||(E=pn("div",`swiper-slide-shadow-cube swiper-slide-shadow-${p?"left":"top"}`.split(" ")),c.append(E)),m||(m=pn("div",`swiper-slide-shadow-cube swiper-slide-shadow-${p?"right":"bottom"}`.split(" ")),c.append(m)),E&&(E.style.opacity=Math.max(-d,0)),m&&(m.style.opacity=Math.max(d,0))};xo({effect:"cube",swiper:e,on:n,setTranslate:()=>{const{el:c,wrapperEl:d,slides:p,width:E,height:m,rtlTranslate:g,size:_,browser:b}=e,x=bc(e),S=e.params.cubeEffect,y=e.isHorizontal(),v=e.virtual&&e.params.virtual.enabled;let R=0,w;S.shadow&&(y?(w=e.wrapperEl.querySelector(".swiper-cube-shadow"),w||(w=pn("div","swiper-cube-shadow"),e.wrapperEl.append(w)),w.style.height=`${E}px`):(w=c.querySelector(".swiper-cube-shadow"),w||(w=pn("div","swiper-cube-shadow"),c.append(w))));for(let k=0;k<p.length;k+=1){const H=p[k];let O=k;v&&(O=parseInt(H.getAttribute("data-swiper-slide-index"),10));let z=O*90,ie=Math.floor(z/360);g&&(z=-z,ie=Math.floor(-z/360));const G=Math.max(Math.min(H.progress,1),-1);let X=0,ee=0,B=0;O%4===0?(X=-ie*4*_,B=0):(O-1)%4===0?(X=0,B=-ie*4*_):(O-2)%4===0?(X=_+ie*4*_,B=_):(O-3)%4===0&&(X=-_,B=3*_+_*4*ie),g&&(X=-X),y||(ee=X,X=0);const Q=`rotateX(${x(y?0:-z)}deg) rotateY(${x(y?z:0)}deg) translate3d(${X}px, ${ee}px, ${B}px)`;G<=1&&G>-1&&(R=O*90+G*90,g&&(R=-O*90-G*90)),H.style.transform=Q,S.slideShadows&&i(H,G,y)}if(d.style.transformOrigin=`50% 50% -${_/2}px`,d.style["-webkit-transform-origin"]=`50% 50% -${_/2}px`,S.shadow)if(y)w.style.transform=`translate3d(0px, ${E/2+S.shadowOffset}px, ${-E/2}px) rotateX(89.99deg) rotateZ(0deg) scale(${S.shadowScale})`;else{const k=Math.abs(R)-Math.floor(Math.abs(R)/90)*90,H=1.5-(Math.sin(k*2*Math.PI/360)/2+Math.cos(k*2*Math.PI/360)/2),O=S.shadowScale,z=S.shadowScale/H,ie=S.shadowOffset;w.style.transform=`scale3d(${O}, 1, ${z}) translate3d(0px, ${m/2+ie}px, ${-m/2/z}px) rotateX(-89.99deg)`}const M=(b.isSafari||b.isWebView)&&b.needPerspectiveFix?-_/2:0;d.style.transform=`translate3d(0px,0,${M}px) rotateX(${x(e.isHorizontal()?0:R)}deg) rotateY(${x(e.isHorizontal()?-R:0)}deg)`,d.style.setProperty("--swiper-cube-translate-z",`${M}px`)},setTransition:c=>{const{el:d,slides:p}=e;if(p.forEach(E=>{E.style.transitionDuration=`${c}ms`,E.querySelectorAll(".swiper-slide-shadow-top, .swiper-slide-shadow-right, .swiper-slide-shadow-bottom, .swiper-slide-shadow-left").forEach(m=>{m.style.transitionDuration=`${c}ms`})}),e.params.cubeEffect.shadow&&!e.isHorizontal()){const E=d.querySelector(".swiper-cube-shadow");E&&(E.style.transitionDuration=`${c}ms`)}},recreateShadows:()=>{const c=e.isHorizontal();e.slides.forEach(d=>{const p=Math.max(Math.min(d.progress,1),-1);i(d,p,c)})},getEffectParams:()=>e.params.cubeEffect,perspective:()=>!0,overwriteParams:()=>({slidesPerView:1,slidesPerGroup:1,watchSlidesProgress:!0,resistanceRatio:0,spaceBetween:0,centeredSlides:!1,virtualTranslate:!0})})}function co(t,e,r){const n=`swiper-slide-shadow${r?`-${r}`:""}${t?` swiper-slide-shadow-${t}`:""}`,i=oa(e);let s=i.querySelector(`.${n.split(" ").join(".")}`);return s||(s=pn("div",n.split(" ")),i.append(s)),s}function f2(t){let{swiper:e,extendParams:r,on:n}=t;r({flipEffect:{slideShadows:!0,limitRotation:!0}});const i=(c,d)=>{let p=e.isHorizontal()?c.querySelector(".swiper-slide-shadow-left"):c.querySelector(".swiper-slide-shadow-top"),E=e.isHorizontal()?c.querySelector(".swiper-slide-shadow-right"):c.querySelector(".swiper-slide-shadow-bottom");p||(p=co("flip",c,e.isHorizontal()?"left":"top")),E||(E=co("flip",c,e.isHorizontal()?"right":"bottom")),p&&(p.style.opacity=Math.max(-d,0)),E&&(E.style.opacity=Math.max(d,0))};xo({effect:"flip",swiper:e,on:n,setTranslate:()=>{const{slides:c,rtlTranslate:d}=e,p=e.params.flipEffect,E=bc(e);for(let m=0;m<c.length;m+=1){const g=c[m];let _=g.progress;e.params.flipEffect.limitRotation&&(_=Math.max(Math.min(g.progress,1),-1));const b=g.swiperSlideOffset;let S=-180*_,y=0,v=e.params.cssMode?-b-e.translate:-b,R=0;e.isHorizontal()?d&&(S=-S):(R=v,v=0,y=-S,S=0),g.style.zIndex=-Math.abs(Math.round(_))+c.length,p.slideShadows&&i(g,_);const w=`translate3d(${v}px, ${R}px, 0px) rotateX(${E(y)}deg) rotateY(${E(S)}deg)`,M=Gl(p,g);M.style.transform=w}},setTransition:c=>{const d=e.slides.map(p=>oa(p));d.forEach(p=>{p.style.transitionDuration=`${c}ms`,p.querySelectorAll(".swiper-slide-shadow-top, .swiper-slide-shadow-right, .swiper-slide-shadow-bottom, .swiper-slide-shadow-left").forEach(E=>{E.style.transitionDuration=`${c}ms`})}),xc({swiper:e,duration:c,transformElements:d})},recreateShadows:()=>{e.params.flipEffect,e.slides.forEach(c=>{let d=c.progress;e.params.flipEffect.limitRotation&&(d=Math.max(Math.min(c.progress,1),-1)),i(c,d)})},getEffectParams:()=>e.params.flipEffect,perspective:()=>!0,overwriteParams:()=>({slidesPerView:1,slidesPerGroup:1,watchSlidesProgress:!0,spaceBetween:0,virtualTranslate:!e.params.cssMode})})}function c2(t){let{swiper:e,extendParams:r,on:n}=t;r({coverflowEffect:{rotate:50,stretch:0,depth:100,scale:1,modifier:1,slideShadows:!0}}),xo({effect:"coverflow",swiper:e,on:n,setTranslate:()=>{const{width:o,height:f,slides:c,slidesSizesGrid:d}=e,p=e.params.coverflowEffect,E=e.isHorizontal(),m=e.translate,g=E?-m+o/2:-m+f/2,_=E?p.rotate:-p.rotate,b=p.depth,x=bc(e);for(let S=0,y=c.length;S<y;S+=1){const v=c[S],R=d[S],w=v.swiperSlideOffset,M=(g-w-R/2)/R,k=typeof p.modifier=="function"?p.modifier(M):M*p.modifier;let H=E?_*k:0,O=E?0:_*k,z=-b*Math.abs(k),ie=p.stretch;typeof ie=="string"&&ie.indexOf("%")!==-1&&(ie=parseFloat(p.stretch)/100*R);let G=E?0:ie*k,X=E?ie*k:0,ee=1-(1-p.scale)*Math.abs(k);Math.abs(X)<.001&&(X=0),Math.abs(G)<.001&&(G=0),Math.abs(z)<.001&&(z=0),Math.abs(H)<.001&&(H=0),Math.abs(O)<.001&&(O=0),Math.abs(ee)<.001&&(ee=0);const B=`translate3d(${X}px,${G}px,${z}px)  rotateX(${x(O)}deg) rotateY(${x(H)}deg) scale(${ee})`,Q=Gl(p,v);if(Q.style.transform=B,v.style.zIndex=-Math.abs(Math.round(k))+1,p.slideShadows){let W=E?v.querySelector(".swiper-slide-shadow-left"):v.querySelector(".swiper-slide-shadow-top"),j=E?v.querySelector(".swiper-slide-shadow-right"):v.querySelector(".swiper-slide-shadow-bottom");W||(W=co("coverflow",v,E?"left":"top")),j||(j=co("coverflow",v,E?"right":"bottom")),W&&(W.style.opacity=k>0?k:0),j&&(j.style.opacity=-k>0?-k:0)}}},setTransition:o=>{e.slides.map(c=>oa(c)).forEach(c=>{c.style.transitionDuration=`${o}ms`,c.querySelectorAll(".swiper-slide-shadow-top, .swiper-slide-shadow-right, .swiper-slide-shadow-bottom, .swiper-slide-shadow-left").forEach(d=>{d.style.transitionDuration=`${o}ms`})})},perspective:()=>!0,overwriteParams:()=>({watchSlidesProgress:!0})})}function p2(t){let{swiper:e,extendParams:r,on:n}=t;r({creativeEffect:{limitProgress:1,shadowPerProgress:!1,progressMultiplier:1,perspective:!0,prev:{translate:[0,0,0],rotate:[0,0,0],opacity:1,scale:1},next:{translate:[0,0,0],rotate:[0,0,0],opacity:1,scale:1}}});const i=f=>typeof f=="string"?f:`${f}px`;xo({effect:"creative",swiper:e,on:n,setTranslate:()=>{const{slides:f,wrapperEl:c,slidesSizesGrid:d}=e,p=e.params.creativeEffect,{progressMultiplier:E}=p,m=e.params.centeredSlides,g=bc(e);if(m){const _=d[0]/2-e.params.slidesOffsetBefore||0;c.style.transform=`translateX(calc(50% - ${_}px))`}for(let _=0;_<f.length;_+=1){const b=f[_],x=b.progress,S=Math.min(Math.max(b.progress,-p.limitProgress),p.limitProgress);let y=S;m||(y=Math.min(Math.max(b.originalProgress,-p.limitProgress),p.limitProgress));const v=b.swiperSlideOffset,R=[e.params.cssMode?-v-e.translate:-v,0,0],w=[0,0,0];let M=!1;e.isHorizontal()||(R[1]=R[0],R[0]=0);let k={translate:[0,0,0],rotate:[0,0,0],scale:1,opacity:1};S<0?(k=p.next,M=!0):S>0&&(k=p.prev,M=!0),R.forEach((ee,B)=>{R[B]=`calc(${ee}px + (${i(k.translate[B])} * ${Math.abs(S*E)}))`}),w.forEach((ee,B)=>{let Q=k.rotate[B]*Math.abs(S*E);w[B]=Q}),b.style.zIndex=-Math.abs(Math.round(x))+f.length;const H=R.join(", "),O=`rotateX(${g(w[0])}deg) rotateY(${g(w[1])}deg) rotateZ(${g(w[2])}deg)`,z=y<0?`scale(${1+(1-k.scale)*y*E})`:`scale(${1-(1-k.scale)*y*E})`,ie=y<0?1+(1-k.opacity)*y*E:1-(1-k.opacity)*y*E,G=`translate3d(${H}) ${O} ${z}`;if(M&&k.shadow||!M){let ee=b.querySelector(".swiper-slide-shadow");if(!ee&&k.shadow&&(ee=co("creative",b)),ee){const B=p.shadowPerProgress?S*(1/p.limitProgress):S;ee.style.opacity=Math.min(Math.max(Math.abs(B),0),1)}}const X=Gl(p,b);X.style.transform=G,X.style.opacity=ie,k.origin&&(X.style.transformOrigin=k.origin)}},setTransition:f=>{const c=e.slides.map(d=>oa(d));c.forEach(d=>{d.style.transitionDuration=`${f}ms`,d.querySelectorAll(".swiper-slide-shadow").forEach(p=>{p.style.transitionDuration=`${f}ms`})}),xc({swiper:e,duration:f,transformElements:c,allSlides:!0})},perspective:()=>e.params.creativeEffect.perspective,overwriteParams:()=>({watchSlidesProgress:!0,virtualTranslate:!e.params.cssMode})})}function d2(t){let{swiper:e,extendParams:r,on:n}=t;r({cardsEffect:{slideShadows:!0,rotate:!0,perSlideRotate:2,perSlideOffset:8}}),xo({effect:"cards",swiper:e,on:n,setTranslate:()=>{const{slides:o,activeIndex:f,rtlTranslate:c}=e,d=e.params.cardsEffect,{startTranslate:p,isTouched:E}=e.touchEventsData,m=c?-e.translate:e.translate;for(let g=0;g<o.length;g+=1){const _=o[g],b=_.progress,x=Math.min(Math.max(b,-4),4);let S=_.swiperSlideOffset;e.params.centeredSlides&&!e.params.cssMode&&(e.wrapperEl.style.transform=`translateX(${e.minTranslate()}px)`),e.params.centeredSlides&&e.params.cssMode&&(S-=o[0].swiperSlideOffset);let y=e.params.cssMode?-S-e.translate:-S,v=0;const R=-100*Math.abs(x);let w=1,M=-d.perSlideRotate*x,k=d.perSlideOffset-Math.abs(x)*.75;const H=e.virtual&&e.params.virtual.enabled?e.virtual.from+g:g,O=(H===f||H===f-1)&&x>0&&x<1&&(E||e.params.cssMode)&&m<p,z=(H===f||H===f+1)&&x<0&&x>-1&&(E||e.params.cssMode)&&m>p;if(O||z){const ee=(1-Math.abs((Math.abs(x)-.5)/.5))**.5;M+=-28*x*ee,w+=-.5*ee,k+=96*ee,v=`${-25*ee*Math.abs(x)}%`}if(x<0?y=`calc(${y}px ${c?"-":"+"} (${k*Math.abs(x)}%))`:x>0?y=`calc(${y}px ${c?"-":"+"} (-${k*Math.abs(x)}%))`:y=`${y}px`,!e.isHorizontal()){const ee=v;v=y,y=ee}const ie=x<0?`${1+(1-w)*x}`:`${1-(1-w)*x}`,G=`
-        translate3d(${y}, ${v}, ${R}px)
-        rotateZ(${d.rotate?c?-M:M:0}deg)
-        scale(${ie})
-      `;if(d.slideShadows){let ee=_.querySelector(".swiper-slide-shadow");ee||(ee=co("cards",_)),ee&&(ee.style.opacity=Math.min(Math.max((Math.abs(x)-.5)/.5,0),1))}_.style.zIndex=-Math.abs(Math.round(b))+o.length;const X=Gl(d,_);X.style.transform=G}},setTransition:o=>{const f=e.slides.map(c=>oa(c));f.forEach(c=>{c.style.transitionDuration=`${o}ms`,c.querySelectorAll(".swiper-slide-shadow").forEach(d=>{d.style.transitionDuration=`${o}ms`})}),xc({swiper:e,duration:o,transformElements:f})},perspective:()=>!0,overwriteParams:()=>({watchSlidesProgress:!0,virtualTranslate:!e.params.cssMode})})}const h2=[kk,Gk,Vk,Fk,Hk,Wk,Xk,jk,zk,qk,Yk,Jk,Qk,Zk,e2,t2,o2,l2,u2,f2,c2,p2,d2];un.use(h2);const Rc=["eventsPrefix","injectStyles","injectStylesUrls","modules","init","_direction","oneWayMovement","swiperElementNodeName","touchEventsTarget","initialSlide","_speed","cssMode","updateOnWindowResize","resizeObserver","nested","focusableElements","_enabled","_width","_height","preventInteractionOnTransition","userAgent","url","_edgeSwipeDetection","_edgeSwipeThreshold","_freeMode","_autoHeight","setWrapperSize","virtualTranslate","_effect","breakpoints","breakpointsBase","_spaceBetween","_slidesPerView","maxBackfaceHiddenSlides","_grid","_slidesPerGroup","_slidesPerGroupSkip","_slidesPerGroupAuto","_centeredSlides","_centeredSlidesBounds","_slidesOffsetBefore","_slidesOffsetAfter","normalizeSlideIndex","_centerInsufficientSlides","_watchOverflow","roundLengths","touchRatio","touchAngle","simulateTouch","_shortSwipes","_longSwipes","longSwipesRatio","longSwipesMs","_followFinger","allowTouchMove","_threshold","touchMoveStopPropagation","touchStartPreventDefault","touchStartForcePreventDefault","touchReleaseOnEdges","uniqueNavElements","_resistance","_resistanceRatio","_watchSlidesProgress","_grabCursor","preventClicks","preventClicksPropagation","_slideToClickedSlide","_loop","loopAdditionalSlides","loopAddBlankSlides","loopPreventsSliding","_rewind","_allowSlidePrev","_allowSlideNext","_swipeHandler","_noSwiping","noSwipingClass","noSwipingSelector","passiveListeners","containerModifierClass","slideClass","slideActiveClass","slideVisibleClass","slideFullyVisibleClass","slideNextClass","slidePrevClass","slideBlankClass","wrapperClass","lazyPreloaderClass","lazyPreloadPrevNext","runCallbacksOnInit","observer","observeParents","observeSlideChildren","a11y","_autoplay","_controller","coverflowEffect","cubeEffect","fadeEffect","flipEffect","creativeEffect","cardsEffect","hashNavigation","history","keyboard","mousewheel","_navigation","_pagination","parallax","_scrollbar","_thumbs","virtual","zoom","control"];function po(t){return typeof t=="object"&&t!==null&&t.constructor&&Object.prototype.toString.call(t).slice(8,-1)==="Object"&&!t.__swiper__}function Hh(t,e){const r=["__proto__","constructor","prototype"];Object.keys(e).filter(n=>r.indexOf(n)<0).forEach(n=>{typeof t[n]>"u"?t[n]=e[n]:po(e[n])&&po(t[n])&&Object.keys(e[n]).length>0?e[n].__swiper__?t[n]=e[n]:Hh(t[n],e[n]):t[n]=e[n]})}function E2(t){return t===void 0&&(t={}),t.navigation&&typeof t.navigation.nextEl>"u"&&typeof t.navigation.prevEl>"u"}function m2(t){return t===void 0&&(t={}),t.pagination&&typeof t.pagination.el>"u"}function g2(t){return t===void 0&&(t={}),t.scrollbar&&typeof t.scrollbar.el>"u"}function pf(t){return t===void 0&&(t=""),t.replace(/-[a-z]/g,e=>e.toUpperCase().replace("-",""))}function _2(t){let{swiper:e,slides:r,passedParams:n,changedParams:i,nextEl:s,prevEl:o,scrollbarEl:f,paginationEl:c}=t;const d=i.filter(O=>O!=="children"&&O!=="direction"&&O!=="wrapperClass"),{params:p,pagination:E,navigation:m,scrollbar:g,virtual:_,thumbs:b}=e;let x,S,y,v,R,w,M,k;i.includes("thumbs")&&n.thumbs&&n.thumbs.swiper&&!n.thumbs.swiper.destroyed&&p.thumbs&&(!p.thumbs.swiper||p.thumbs.swiper.destroyed)&&(x=!0),i.includes("controller")&&n.controller&&n.controller.control&&p.controller&&!p.controller.control&&(S=!0),i.includes("pagination")&&n.pagination&&(n.pagination.el||c)&&(p.pagination||p.pagination===!1)&&E&&!E.el&&(y=!0),i.includes("scrollbar")&&n.scrollbar&&(n.scrollbar.el||f)&&(p.scrollbar||p.scrollbar===!1)&&g&&!g.el&&(v=!0),i.includes("navigation")&&n.navigation&&(n.navigation.prevEl||o)&&(n.navigation.nextEl||s)&&(p.navigation||p.navigation===!1)&&m&&!m.prevEl&&!m.nextEl&&(R=!0);const H=O=>{e[O]&&(e[O].destroy(),O==="navigation"?(e.isElement&&(e[O].prevEl.remove(),e[O].nextEl.remove()),p[O].prevEl=void 0,p[O].nextEl=void 0,e[O].prevEl=void 0,e[O].nextEl=void 0):(e.isElement&&e[O].el.remove(),p[O].el=void 0,e[O].el=void 0))};i.includes("loop")&&e.isElement&&(p.loop&&!n.loop?w=!0:!p.loop&&n.loop?M=!0:k=!0),d.forEach(O=>{if(po(p[O])&&po(n[O]))Object.assign(p[O],n[O]),(O==="navigation"||O==="pagination"||O==="scrollbar")&&"enabled"in n[O]&&!n[O].enabled&&H(O);else{const z=n[O];(z===!0||z===!1)&&(O==="navigation"||O==="pagination"||O==="scrollbar")?z===!1&&H(O):p[O]=n[O]}}),d.includes("controller")&&!S&&e.controller&&e.controller.control&&p.controller&&p.controller.control&&(e.controller.control=p.controller.control),i.includes("children")&&r&&_&&p.virtual.enabled?(_.slides=r,_.update(!0)):i.includes("virtual")&&_&&p.virtual.enabled&&(r&&(_.slides=r),_.update(!0)),i.includes("children")&&r&&p.loop&&(k=!0),x&&b.init()&&b.update(!0),S&&(e.controller.control=p.controller.control),y&&(e.isElement&&(!c||typeof c=="string")&&(c=document.createElement("div"),c.classList.add("swiper-pagination"),c.part.add("pagination"),e.el.appendChild(c)),c&&(p.pagination.el=c),E.init(),E.render(),E.update()),v&&(e.isElement&&(!f||typeof f=="string")&&(f=document.createElement("div"),f.classList.add("swiper-scrollbar"),f.part.add("scrollbar"),e.el.appendChild(f)),f&&(p.scrollbar.el=f),g.init(),g.updateSize(),g.setTranslate()),R&&(e.isElement&&((!s||typeof s=="string")&&(s=document.createElement("div"),s.classList.add("swiper-button-next"),s.innerHTML=e.hostEl.constructor.nextButtonSvg,s.part.add("button-next"),e.el.appendChild(s)),(!o||typeof o=="string")&&(o=document.createElement("div"),o.classList.add("swiper-button-prev"),o.innerHTML=e.hostEl.constructor.prevButtonSvg,o.part.add("button-prev"),e.el.appendChild(o))),s&&(p.navigation.nextEl=s),o&&(p.navigation.prevEl=o),m.init(),m.update()),i.includes("allowSlideNext")&&(e.allowSlideNext=n.allowSlideNext),i.includes("allowSlidePrev")&&(e.allowSlidePrev=n.allowSlidePrev),i.includes("direction")&&e.changeDirection(n.direction,!1),(w||k)&&e.loopDestroy(),(M||k)&&e.loopCreate(),e.update()}const Cv=t=>{if(parseFloat(t)===Number(t))return Number(t);if(t==="true"||t==="")return!0;if(t==="false")return!1;if(t==="null")return null;if(t!=="undefined"){if(typeof t=="string"&&t.includes("{")&&t.includes("}")&&t.includes('"')){let e;try{e=JSON.parse(t)}catch{e=t}return e}return t}},wv=["a11y","autoplay","controller","cards-effect","coverflow-effect","creative-effect","cube-effect","fade-effect","flip-effect","free-mode","grid","hash-navigation","history","keyboard","mousewheel","navigation","pagination","parallax","scrollbar","thumbs","virtual","zoom"];function Ov(t,e,r){const n={},i={};Hh(n,Fh);const s=[...Rc,"on"],o=s.map(c=>c.replace(/_/,""));s.forEach(c=>{c=c.replace("_",""),typeof t[c]<"u"&&(i[c]=t[c])});const f=[...t.attributes];return typeof e=="string"&&typeof r<"u"&&f.push({name:e,value:po(r)?{...r}:r}),f.forEach(c=>{const d=wv.filter(p=>c.name.indexOf(`${p}-`)===0)[0];if(d){const p=pf(d),E=pf(c.name.split(`${d}-`)[1]);typeof i[p]>"u"&&(i[p]={}),i[p]===!0&&(i[p]={enabled:!0}),i[p][E]=Cv(c.value)}else{const p=pf(c.name);if(!o.includes(p))return;const E=Cv(c.value);i[p]&&wv.includes(c.name)&&!po(E)?(i[p].constructor!==Object&&(i[p]={}),i[p].enabled=!!E):i[p]=E}}),Hh(n,i),n.navigation?n.navigation={prevEl:".swiper-button-prev",nextEl:".swiper-button-next",...n.navigation!==!0?n.navigation:{}}:n.navigation===!1&&delete n.navigation,n.scrollbar?n.scrollbar={el:".swiper-scrollbar",...n.scrollbar!==!0?n.scrollbar:{}}:n.scrollbar===!1&&delete n.scrollbar,n.pagination?n.pagination={el:".swiper-pagination",...n.pagination!==!0?n.pagination:{}}:n.pagination===!1&&delete n.pagination,{params:n,passedParams:i}}const T2=":host{--swiper-theme-color:#007aff}:host{position:relative;display:block;margin-left:auto;margin-right:auto;z-index:1}.swiper{width:100%;height:100%;margin-left:auto;margin-right:auto;position:relative;overflow:hidden;list-style:none;padding:0;z-index:1;display:block}.swiper-vertical>.swiper-wrapper{flex-direction:column}.swiper-wrapper{position:relative;width:100%;height:100%;z-index:1;display:flex;transition-property:transform;transition-timing-function:var(--swiper-wrapper-transition-timing-function,initial);box-sizing:content-box}.swiper-android ::slotted(swiper-slide),.swiper-ios ::slotted(swiper-slide),.swiper-wrapper{transform:translate3d(0px,0,0)}.swiper-horizontal{touch-action:pan-y}.swiper-vertical{touch-action:pan-x}::slotted(swiper-slide){flex-shrink:0;width:100%;height:100%;position:relative;transition-property:transform;display:block}::slotted(.swiper-slide-invisible-blank){visibility:hidden}.swiper-autoheight,.swiper-autoheight ::slotted(swiper-slide){height:auto}.swiper-autoheight .swiper-wrapper{align-items:flex-start;transition-property:transform,height}.swiper-backface-hidden ::slotted(swiper-slide){transform:translateZ(0);-webkit-backface-visibility:hidden;backface-visibility:hidden}.swiper-3d.swiper-css-mode .swiper-wrapper{perspective:1200px}.swiper-3d .swiper-wrapper{transform-style:preserve-3d}.swiper-3d{perspective:1200px}.swiper-3d .swiper-cube-shadow,.swiper-3d ::slotted(swiper-slide){transform-style:preserve-3d}.swiper-css-mode>.swiper-wrapper{overflow:auto;scrollbar-width:none;-ms-overflow-style:none}.swiper-css-mode>.swiper-wrapper::-webkit-scrollbar{display:none}.swiper-css-mode ::slotted(swiper-slide){scroll-snap-align:start start}.swiper-css-mode.swiper-horizontal>.swiper-wrapper{scroll-snap-type:x mandatory}.swiper-css-mode.swiper-vertical>.swiper-wrapper{scroll-snap-type:y mandatory}.swiper-css-mode.swiper-free-mode>.swiper-wrapper{scroll-snap-type:none}.swiper-css-mode.swiper-free-mode ::slotted(swiper-slide){scroll-snap-align:none}.swiper-css-mode.swiper-centered>.swiper-wrapper::before{content:'';flex-shrink:0;order:9999}.swiper-css-mode.swiper-centered ::slotted(swiper-slide){scroll-snap-align:center center;scroll-snap-stop:always}.swiper-css-mode.swiper-centered.swiper-horizontal ::slotted(swiper-slide):first-child{margin-inline-start:var(--swiper-centered-offset-before)}.swiper-css-mode.swiper-centered.swiper-horizontal>.swiper-wrapper::before{height:100%;min-height:1px;width:var(--swiper-centered-offset-after)}.swiper-css-mode.swiper-centered.swiper-vertical ::slotted(swiper-slide):first-child{margin-block-start:var(--swiper-centered-offset-before)}.swiper-css-mode.swiper-centered.swiper-vertical>.swiper-wrapper::before{width:100%;min-width:1px;height:var(--swiper-centered-offset-after)}.swiper-virtual ::slotted(swiper-slide){-webkit-backface-visibility:hidden;transform:translateZ(0)}.swiper-virtual.swiper-css-mode .swiper-wrapper::after{content:'';position:absolute;left:0;top:0;pointer-events:none}.swiper-virtual.swiper-css-mode.swiper-horizontal .swiper-wrapper::after{height:1px;width:var(--swiper-virtual-size)}.swiper-virtual.swiper-css-mode.swiper-vertical .swiper-wrapper::after{width:1px;height:var(--swiper-virtual-size)}:host{--swiper-navigation-size:44px}.swiper-button-next,.swiper-button-prev{position:absolute;top:var(--swiper-navigation-top-offset,50%);width:calc(var(--swiper-navigation-size)/ 44 * 27);height:var(--swiper-navigation-size);margin-top:calc(0px - (var(--swiper-navigation-size)/ 2));z-index:10;cursor:pointer;display:flex;align-items:center;justify-content:center;color:var(--swiper-navigation-color,var(--swiper-theme-color))}.swiper-button-next.swiper-button-disabled,.swiper-button-prev.swiper-button-disabled{opacity:.35;cursor:auto;pointer-events:none}.swiper-button-next.swiper-button-hidden,.swiper-button-prev.swiper-button-hidden{opacity:0;cursor:auto;pointer-events:none}.swiper-navigation-disabled .swiper-button-next,.swiper-navigation-disabled .swiper-button-prev{display:none!important}.swiper-button-next svg,.swiper-button-prev svg{width:100%;height:100%;object-fit:contain;transform-origin:center}.swiper-rtl .swiper-button-next svg,.swiper-rtl .swiper-button-prev svg{transform:rotate(180deg)}.swiper-button-prev,.swiper-rtl .swiper-button-next{left:var(--swiper-navigation-sides-offset,10px);right:auto}.swiper-button-next,.swiper-rtl .swiper-button-prev{right:var(--swiper-navigation-sides-offset,10px);left:auto}.swiper-button-lock{display:none}.swiper-pagination{position:absolute;text-align:center;transition:.3s opacity;transform:translate3d(0,0,0);z-index:10}.swiper-pagination.swiper-pagination-hidden{opacity:0}.swiper-pagination-disabled>.swiper-pagination,.swiper-pagination.swiper-pagination-disabled{display:none!important}.swiper-horizontal>.swiper-pagination-bullets,.swiper-pagination-bullets.swiper-pagination-horizontal,.swiper-pagination-custom,.swiper-pagination-fraction{bottom:var(--swiper-pagination-bottom,8px);top:var(--swiper-pagination-top,auto);left:0;width:100%}.swiper-pagination-bullets-dynamic{overflow:hidden;font-size:0}.swiper-pagination-bullets-dynamic .swiper-pagination-bullet{transform:scale(.33);position:relative}.swiper-pagination-bullets-dynamic .swiper-pagination-bullet-active{transform:scale(1)}.swiper-pagination-bullets-dynamic .swiper-pagination-bullet-active-main{transform:scale(1)}.swiper-pagination-bullets-dynamic .swiper-pagination-bullet-active-prev{transform:scale(.66)}.swiper-pagination-bullets-dynamic .swiper-pagination-bullet-active-prev-prev{transform:scale(.33)}.swiper-pagination-bullets-dynamic .swiper-pagination-bullet-active-next{transform:scale(.66)}.swiper-pagination-bullets-dynamic .swiper-pagination-bullet-active-next-next{transform:scale(.33)}.swiper-pagination-bullet{width:var(--swiper-pagination-bullet-width,var(--swiper-pagination-bullet-size,8px));height:var(--swiper-pagination-bullet-height,var(--swiper-pagination-bullet-size,8px));display:inline-block;border-radius:var(--swiper-pagination-bullet-border-radius,50%);background:var(--swiper-pagination-bullet-inactive-color,#000);opacity:var(--swiper-pagination-bullet-inactive-opacity, .2)}button.swiper-pagination-bullet{border:none;margin:0;padding:0;box-shadow:none;-webkit-appearance:none;appearance:none}.swiper-pagination-clickable .swiper-pagination-bullet{cursor:pointer}.swiper-pagination-bullet:only-child{display:none!important}.swiper-pagination-bullet-active{opacity:var(--swiper-pagination-bullet-opacity, 1);background:var(--swiper-pagination-color,var(--swiper-theme-color))}.swiper-pagination-vertical.swiper-pagination-bullets,.swiper-vertical>.swiper-pagination-bullets{right:var(--swiper-pagination-right,8px);left:var(--swiper-pagination-left,auto);top:50%;transform:translate3d(0px,-50%,0)}.swiper-pagination-vertical.swiper-pagination-bullets .swiper-pagination-bullet,.swiper-vertical>.swiper-pagination-bullets .swiper-pagination-bullet{margin:var(--swiper-pagination-bullet-vertical-gap,6px) 0;display:block}.swiper-pagination-vertical.swiper-pagination-bullets.swiper-pagination-bullets-dynamic,.swiper-vertical>.swiper-pagination-bullets.swiper-pagination-bullets-dynamic{top:50%;transform:translateY(-50%);width:8px}.swiper-pagination-vertical.swiper-pagination-bullets.swiper-pagination-bullets-dynamic .swiper-pagination-bullet,.swiper-vertical>.swiper-pagination-bullets.swiper-pagination-bullets-dynamic .swiper-pagination-bullet{display:inline-block;transition:.2s transform,.2s top}.swiper-horizontal>.swiper-pagination-bullets .swiper-pagination-bullet,.swiper-pagination-horizontal.swiper-pagination-bullets .swiper-pagination-bullet{margin:0 var(--swiper-pagination-bullet-horizontal-gap,4px)}.swiper-horizontal>.swiper-pagination-bullets.swiper-pagination-bullets-dynamic,.swiper-pagination-horizontal.swiper-pagination-bullets.swiper-pagination-bullets-dynamic{left:50%;transform:translateX(-50%);white-space:nowrap}.swiper-horizontal>.swiper-pagination-bullets.swiper-pagination-bullets-dynamic .swiper-pagination-bullet,.swiper-pagination-horizontal.swiper-pagination-bullets.swiper-pagination-bullets-dynamic .swiper-pagination-bullet{transition:.2s transform,.2s left}.swiper-horizontal.swiper-rtl>.swiper-pagination-bullets-dynamic .swiper-pagination-bullet{transition:.2s transform,.2s right}.swiper-pagination-fraction{color:var(--swiper-pagination-fraction-color,inherit)}.swiper-pagination-progressbar{background:var(--swiper-pagination-progressbar-bg-color,rgba(0,0,0,.25));position:absolute}.swiper-pagination-progressbar .swiper-pagination-progressbar-fill{background:var(--swiper-pagination-color,var(--swiper-theme-color));position:absolute;left:0;top:0;width:100%;height:100%;transform:scale(0);transform-origin:left top}.swiper-rtl .swiper-pagination-progressbar .swiper-pagination-progressbar-fill{transform-origin:right top}.swiper-horizontal>.swiper-pagination-progressbar,.swiper-pagination-progressbar.swiper-pagination-horizontal,.swiper-pagination-progressbar.swiper-pagination-vertical.swiper-pagination-progressbar-opposite,.swiper-vertical>.swiper-pagination-progressbar.swiper-pagination-progressbar-opposite{width:100%;height:var(--swiper-pagination-progressbar-size,4px);left:0;top:0}.swiper-horizontal>.swiper-pagination-progressbar.swiper-pagination-progressbar-opposite,.swiper-pagination-progressbar.swiper-pagination-horizontal.swiper-pagination-progressbar-opposite,.swiper-pagination-progressbar.swiper-pagination-vertical,.swiper-vertical>.swiper-pagination-progressbar{width:var(--swiper-pagination-progressbar-size,4px);height:100%;left:0;top:0}.swiper-pagination-lock{display:none}.swiper-scrollbar{border-radius:var(--swiper-scrollbar-border-radius,10px);position:relative;touch-action:none;background:var(--swiper-scrollbar-bg-color,rgba(0,0,0,.1))}.swiper-scrollbar-disabled>.swiper-scrollbar,.swiper-scrollbar.swiper-scrollbar-disabled{display:none!important}.swiper-horizontal>.swiper-scrollbar,.swiper-scrollbar.swiper-scrollbar-horizontal{position:absolute;left:var(--swiper-scrollbar-sides-offset,1%);bottom:var(--swiper-scrollbar-bottom,4px);top:var(--swiper-scrollbar-top,auto);z-index:50;height:var(--swiper-scrollbar-size,4px);width:calc(100% - 2 * var(--swiper-scrollbar-sides-offset,1%))}.swiper-scrollbar.swiper-scrollbar-vertical,.swiper-vertical>.swiper-scrollbar{position:absolute;left:var(--swiper-scrollbar-left,auto);right:var(--swiper-scrollbar-right,4px);top:var(--swiper-scrollbar-sides-offset,1%);z-index:50;width:var(--swiper-scrollbar-size,4px);height:calc(100% - 2 * var(--swiper-scrollbar-sides-offset,1%))}.swiper-scrollbar-drag{height:100%;width:100%;position:relative;background:var(--swiper-scrollbar-drag-bg-color,rgba(0,0,0,.5));border-radius:var(--swiper-scrollbar-border-radius,10px);left:0;top:0}.swiper-scrollbar-cursor-drag{cursor:move}.swiper-scrollbar-lock{display:none}::slotted(.swiper-slide-zoomed){cursor:move;touch-action:none}.swiper .swiper-notification{position:absolute;left:0;top:0;pointer-events:none;opacity:0;z-index:-1000}.swiper-free-mode>.swiper-wrapper{transition-timing-function:ease-out;margin:0 auto}.swiper-grid>.swiper-wrapper{flex-wrap:wrap}.swiper-grid-column>.swiper-wrapper{flex-wrap:wrap;flex-direction:column}.swiper-fade.swiper-free-mode ::slotted(swiper-slide){transition-timing-function:ease-out}.swiper-fade ::slotted(swiper-slide){pointer-events:none;transition-property:opacity}.swiper-fade ::slotted(swiper-slide) ::slotted(swiper-slide){pointer-events:none}.swiper-fade ::slotted(.swiper-slide-active){pointer-events:auto}.swiper-fade ::slotted(.swiper-slide-active) ::slotted(.swiper-slide-active){pointer-events:auto}.swiper.swiper-cube{overflow:visible}.swiper-cube ::slotted(swiper-slide){pointer-events:none;-webkit-backface-visibility:hidden;backface-visibility:hidden;z-index:1;visibility:hidden;transform-origin:0 0;width:100%;height:100%}.swiper-cube ::slotted(swiper-slide) ::slotted(swiper-slide){pointer-events:none}.swiper-cube.swiper-rtl ::slotted(swiper-slide){transform-origin:100% 0}.swiper-cube ::slotted(.swiper-slide-active),.swiper-cube ::slotted(.swiper-slide-active) ::slotted(.swiper-slide-active){pointer-events:auto}.swiper-cube ::slotted(.swiper-slide-active),.swiper-cube ::slotted(.swiper-slide-next),.swiper-cube ::slotted(.swiper-slide-prev){pointer-events:auto;visibility:visible}.swiper-cube .swiper-cube-shadow{position:absolute;left:0;bottom:0px;width:100%;height:100%;opacity:.6;z-index:0}.swiper-cube .swiper-cube-shadow:before{content:'';background:#000;position:absolute;left:0;top:0;bottom:0;right:0;filter:blur(50px)}.swiper-cube ::slotted(.swiper-slide-next)+::slotted(swiper-slide){pointer-events:auto;visibility:visible}.swiper.swiper-flip{overflow:visible}.swiper-flip ::slotted(swiper-slide){pointer-events:none;-webkit-backface-visibility:hidden;backface-visibility:hidden;z-index:1}.swiper-flip ::slotted(swiper-slide) ::slotted(swiper-slide){pointer-events:none}.swiper-flip ::slotted(.swiper-slide-active),.swiper-flip ::slotted(.swiper-slide-active) ::slotted(.swiper-slide-active){pointer-events:auto}.swiper-creative ::slotted(swiper-slide){-webkit-backface-visibility:hidden;backface-visibility:hidden;overflow:hidden;transition-property:transform,opacity,height}.swiper.swiper-cards{overflow:visible}.swiper-cards ::slotted(swiper-slide){transform-origin:center bottom;-webkit-backface-visibility:hidden;backface-visibility:hidden;overflow:hidden}",v2="::slotted(.swiper-slide-shadow),::slotted(.swiper-slide-shadow-bottom),::slotted(.swiper-slide-shadow-left),::slotted(.swiper-slide-shadow-right),::slotted(.swiper-slide-shadow-top){position:absolute;left:0;top:0;width:100%;height:100%;pointer-events:none;z-index:10}::slotted(.swiper-slide-shadow){background:rgba(0,0,0,.15)}::slotted(.swiper-slide-shadow-left){background-image:linear-gradient(to left,rgba(0,0,0,.5),rgba(0,0,0,0))}::slotted(.swiper-slide-shadow-right){background-image:linear-gradient(to right,rgba(0,0,0,.5),rgba(0,0,0,0))}::slotted(.swiper-slide-shadow-top){background-image:linear-gradient(to top,rgba(0,0,0,.5),rgba(0,0,0,0))}::slotted(.swiper-slide-shadow-bottom){background-image:linear-gradient(to bottom,rgba(0,0,0,.5),rgba(0,0,0,0))}.swiper-lazy-preloader{animation:swiper-preloader-spin 1s infinite linear;width:42px;height:42px;position:absolute;left:50%;top:50%;margin-left:-21px;margin-top:-21px;z-index:10;transform-origin:50%;box-sizing:border-box;border:4px solid var(--swiper-preloader-color,var(--swiper-theme-color));border-radius:50%;border-top-color:transparent}@keyframes swiper-preloader-spin{0%{transform:rotate(0deg)}100%{transform:rotate(360deg)}}::slotted(.swiper-slide-shadow-cube.swiper-slide-shadow-bottom),::slotted(.swiper-slide-shadow-cube.swiper-slide-shadow-left),::slotted(.swiper-slide-shadow-cube.swiper-slide-shadow-right),::slotted(.swiper-slide-shadow-cube.swiper-slide-shadow-top){z-index:0;-webkit-backface-visibility:hidden;backface-visibility:hidden}::slotted(.swiper-slide-shadow-flip.swiper-slide-shadow-bottom),::slotted(.swiper-slide-shadow-flip.swiper-slide-shadow-left),::slotted(.swiper-slide-shadow-flip.swiper-slide-shadow-right),::slotted(.swiper-slide-shadow-flip.swiper-slide-shadow-top){z-index:0;-webkit-backface-visibility:hidden;backface-visibility:hidden}::slotted(.swiper-zoom-container){width:100%;height:100%;display:flex;justify-content:center;align-items:center;text-align:center}::slotted(.swiper-zoom-container)>canvas,::slotted(.swiper-zoom-container)>img,::slotted(.swiper-zoom-container)>svg{max-width:100%;max-height:100%;object-fit:contain}";class b2{}const QS=typeof window>"u"||typeof HTMLElement>"u"?b2:HTMLElement,Iv=`<svg width="11" height="20" viewBox="0 0 11 20" fill="none" xmlns="http://www.w3.org/2000/svg"><path d="M0.38296 20.0762C0.111788 19.805 0.111788 19.3654 0.38296 19.0942L9.19758 10.2796L0.38296 1.46497C0.111788 1.19379 0.111788 0.754138 0.38296 0.482966C0.654131 0.211794 1.09379 0.211794 1.36496 0.482966L10.4341 9.55214C10.8359 9.9539 10.8359 10.6053 10.4341 11.007L1.36496 20.0762C1.09379 20.3474 0.654131 20.3474 0.38296 20.0762Z" fill="currentColor"/></svg>
-    `,ZS=(t,e)=>{if(typeof CSSStyleSheet<"u"&&t.adoptedStyleSheets){const r=new CSSStyleSheet;r.replaceSync(e),t.adoptedStyleSheets=[r]}else{const r=document.createElement("style");r.rel="stylesheet",r.textContent=e,t.appendChild(r)}};class ey extends QS{constructor(){super(),this.attachShadow({mode:"open"})}static get nextButtonSvg(){return Iv}static get prevButtonSvg(){return Iv.replace("/></svg>",' transform-origin="center" transform="rotate(180)"/></svg>')}cssStyles(){return[T2,...this.injectStyles&&Array.isArray(this.injectStyles)?this.injectStyles:[]].join(`
-`)}cssLinks(){return this.injectStylesUrls||[]}calcSlideSlots(){const e=this.slideSlots||0,r=[...this.querySelectorAll("[slot^=slide-]")].map(n=>parseInt(n.getAttribute("slot").split("slide-")[1],10));if(this.slideSlots=r.length?Math.max(...r)+1:0,!!this.rendered){if(this.slideSlots>e)for(let n=e;n<this.slideSlots;n+=1){const i=document.createElement("swiper-slide");i.setAttribute("part",`slide slide-${n+1}`);const s=document.createElement("slot");s.setAttribute("name",`slide-${n+1}`),i.appendChild(s),this.shadowRoot.querySelector(".swiper-wrapper").appendChild(i)}else if(this.slideSlots<e){const n=this.swiper.slides;for(let i=n.length-1;i>=0;i-=1)i>this.slideSlots&&n[i].remove()}}}render(){if(this.rendered)return;this.calcSlideSlots();let e=this.cssStyles();this.slideSlots>0&&(e=e.replace(/::slotted\(([a-z-0-9.]*)\)/g,"$1")),e.length&&ZS(this.shadowRoot,e),this.cssLinks().forEach(n=>{if(this.shadowRoot.querySelector(`link[href="${n}"]`))return;const s=document.createElement("link");s.rel="stylesheet",s.href=n,this.shadowRoot.appendChild(s)});const r=document.createElement("div");r.classList.add("swiper"),r.part="container",r.innerHTML=`
-      <slot name="container-start"></slot>
-      <div class="swiper-wrapper" part="wrapper">
-        <slot></slot>
-        ${Array.from({length:this.slideSlots}).map((n,i)=>`
-        <swiper-slide part="slide slide-${i}">
-          <slot name="slide-${i}"></slot>
-        </swiper-slide>
-        `).join("")}
-      </div>
-      <slot name="container-end"></slot>
-      ${E2(this.passedParams)?`
-        <div part="button-prev" class="swiper-button-prev">${this.constructor.prevButtonSvg}</div>
-        <div part="button-next" class="swiper-button-next">${this.constructor.nextButtonSvg}</div>
-      `:""}
-      ${m2(this.passedParams)?`
-        <div part="pagination" class="swiper-pagination"></div>
-      `:""}
-      ${g2(this.passedParams)?`
-        <div part="scrollbar" class="swiper-scrollbar"></div>
-      `:""}
-    `,this.shadowRoot.appendChild(r),this.rendered=!0}initialize(){var e=this;if(this.initialized)return;this.initialized=!0;const{params:r,passedParams:n}=Ov(this);this.swiperParams=r,this.passedParams=n,delete this.swiperParams.init,this.render(),this.swiper=new un(this.shadowRoot.querySelector(".swiper"),{...r.virtual?{}:{observer:!0},...r,touchEventsTarget:"container",onAny:function(i){i==="observerUpdate"&&e.calcSlideSlots();const s=r.eventsPrefix?`${r.eventsPrefix}${i.toLowerCase()}`:i.toLowerCase();for(var o=arguments.length,f=new Array(o>1?o-1:0),c=1;c<o;c++)f[c-1]=arguments[c];const d=new CustomEvent(s,{detail:f,bubbles:i!=="hashChange",cancelable:!0});e.dispatchEvent(d)}})}connectedCallback(){this.initialized&&this.nested&&this.closest("swiper-slide")&&this.closest("swiper-slide").swiperLoopMoveDOM||this.init===!1||this.getAttribute("init")==="false"||this.initialize()}disconnectedCallback(){this.nested&&this.closest("swiper-slide")&&this.closest("swiper-slide").swiperLoopMoveDOM||(this.swiper&&this.swiper.destroy&&this.swiper.destroy(),this.initialized=!1)}updateSwiperOnPropChange(e,r){const{params:n,passedParams:i}=Ov(this,e,r);this.passedParams=i,this.swiperParams=n,!(this.swiper&&this.swiper.params[e]===r)&&_2({swiper:this.swiper,passedParams:this.passedParams,changedParams:[pf(e)],...e==="navigation"&&i[e]?{prevEl:".swiper-button-prev",nextEl:".swiper-button-next"}:{},...e==="pagination"&&i[e]?{paginationEl:".swiper-pagination"}:{},...e==="scrollbar"&&i[e]?{scrollbarEl:".swiper-scrollbar"}:{}})}attributeChangedCallback(e,r,n){this.initialized&&(r==="true"&&n===null&&(n=!1),this.updateSwiperOnPropChange(e,n))}static get observedAttributes(){return Rc.filter(r=>r.includes("_")).map(r=>r.replace(/[A-Z]/g,n=>`-${n}`).replace("_","").toLowerCase())}}Rc.forEach(t=>{t!=="init"&&(t=t.replace("_",""),Object.defineProperty(ey.prototype,t,{configurable:!0,get(){return(this.passedParams||{})[t]},set(e){this.passedParams||(this.passedParams={}),this.passedParams[t]=e,this.initialized&&this.updateSwiperOnPropChange(t,e)}}))});class x2 extends QS{constructor(){super(),this.attachShadow({mode:"open"})}render(){const e=this.lazy||this.getAttribute("lazy")===""||this.getAttribute("lazy")==="true";if(ZS(this.shadowRoot,v2),this.shadowRoot.appendChild(document.createElement("slot")),e){const r=document.createElement("div");r.classList.add("swiper-lazy-preloader"),r.part.add("preloader"),this.shadowRoot.appendChild(r)}}initialize(){this.render()}connectedCallback(){this.initialize()}}const R2=()=>{typeof window>"u"||(window.customElements.get("swiper-container")||window.customElements.define("swiper-container",ey),window.customElements.get("swiper-slide")||window.customElements.define("swiper-slide",x2))};typeof window<"u"&&(window.SwiperElementRegisterParams=t=>{Rc.push(...t)});var Ut=typeof globalThis<"u"?globalThis:typeof window<"u"?window:typeof global<"u"?global:typeof self<"u"?self:{};function Sc(t){return t&&t.__esModule&&Object.prototype.hasOwnProperty.call(t,"default")?t.default:t}function S2(t){if(t.__esModule)return t;var e=t.default;if(typeof e=="function"){var r=function n(){return this instanceof n?Reflect.construct(e,arguments,this.constructor):e.apply(this,arguments)};r.prototype=e.prototype}else r={};return Object.defineProperty(r,"__esModule",{value:!0}),Object.keys(t).forEach(function(n){var i=Object.getOwnPropertyDescriptor(t,n);Object.defineProperty(r,n,i.get?i:{enumerable:!0,get:function(){return t[n]}})}),r}var Ui={DEBUG:!1,LIB_VERSION:"2.53.0"},ft;if(typeof window>"u"){var Nv={hostname:""};ft={navigator:{userAgent:""},document:{location:Nv,referrer:""},screen:{width:0,height:0},location:Nv}}else ft=window;var y2=24*60*60*1e3,yc=Array.prototype,A2=Function.prototype,ty=Object.prototype,os=yc.slice,Vl=ty.toString,Ac=ty.hasOwnProperty,ar=ft.console,ls=ft.navigator,Pt=ft.document,Wu=ft.opera,Mf=ft.screen,Zn=ls.userAgent,Ad=A2.bind,Pv=yc.forEach,Uv=yc.indexOf,Dv=yc.map,L2=Array.isArray,Wh={},L={trim:function(t){return t.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,"")}},Lt={log:function(){if(Ui.DEBUG&&!L.isUndefined(ar)&&ar)try{ar.log.apply(ar,arguments)}catch{L.each(arguments,function(e){ar.log(e)})}},warn:function(){if(Ui.DEBUG&&!L.isUndefined(ar)&&ar){var t=["Mixpanel warning:"].concat(L.toArray(arguments));try{ar.warn.apply(ar,t)}catch{L.each(t,function(r){ar.warn(r)})}}},error:function(){if(Ui.DEBUG&&!L.isUndefined(ar)&&ar){var t=["Mixpanel error:"].concat(L.toArray(arguments));try{ar.error.apply(ar,t)}catch{L.each(t,function(r){ar.error(r)})}}},critical:function(){if(!L.isUndefined(ar)&&ar){var t=["Mixpanel error:"].concat(L.toArray(arguments));try{ar.error.apply(ar,t)}catch{L.each(t,function(r){ar.error(r)})}}}},Ld=function(t,e){return function(){return arguments[0]="["+e+"] "+arguments[0],t.apply(Lt,arguments)}},r0=function(t){return{log:Ld(Lt.log,t),error:Ld(Lt.error,t),critical:Ld(Lt.critical,t)}};L.bind=function(t,e){var r,n;if(Ad&&t.bind===Ad)return Ad.apply(t,os.call(arguments,1));if(!L.isFunction(t))throw new TypeError;return r=os.call(arguments,2),n=function(){if(!(this instanceof n))return t.apply(e,r.concat(os.call(arguments)));var i={};i.prototype=t.prototype;var s=new i;i.prototype=null;var o=t.apply(s,r.concat(os.call(arguments)));return Object(o)===o?o:s},n};L.each=function(t,e,r){if(t!=null){if(Pv&&t.forEach===Pv)t.forEach(e,r);else if(t.length===+t.length){for(var n=0,i=t.length;n<i;n++)if(n in t&&e.call(r,t[n],n,t)===Wh)return}else for(var s in t)if(Ac.call(t,s)&&e.call(r,t[s],s,t)===Wh)return}};L.extend=function(t){return L.each(os.call(arguments,1),function(e){for(var r in e)e[r]!==void 0&&(t[r]=e[r])}),t};L.isArray=L2||function(t){return Vl.call(t)==="[object Array]"};L.isFunction=function(t){try{return/^\s*\bfunction\b/.test(t)}catch{return!1}};L.isArguments=function(t){return!!(t&&Ac.call(t,"callee"))};L.toArray=function(t){return t?t.toArray?t.toArray():L.isArray(t)||L.isArguments(t)?os.call(t):L.values(t):[]};L.map=function(t,e,r){if(Dv&&t.map===Dv)return t.map(e,r);var n=[];return L.each(t,function(i){n.push(e.call(r,i))}),n};L.keys=function(t){var e=[];return t===null||L.each(t,function(r,n){e[e.length]=n}),e};L.values=function(t){var e=[];return t===null||L.each(t,function(r){e[e.length]=r}),e};L.include=function(t,e){var r=!1;return t===null?r:Uv&&t.indexOf===Uv?t.indexOf(e)!=-1:(L.each(t,function(n){if(r||(r=n===e))return Wh}),r)};L.includes=function(t,e){return t.indexOf(e)!==-1};L.inherit=function(t,e){return t.prototype=new e,t.prototype.constructor=t,t.superclass=e.prototype,t};L.isObject=function(t){return t===Object(t)&&!L.isArray(t)};L.isEmptyObject=function(t){if(L.isObject(t)){for(var e in t)if(Ac.call(t,e))return!1;return!0}return!1};L.isUndefined=function(t){return t===void 0};L.isString=function(t){return Vl.call(t)=="[object String]"};L.isDate=function(t){return Vl.call(t)=="[object Date]"};L.isNumber=function(t){return Vl.call(t)=="[object Number]"};L.isElement=function(t){return!!(t&&t.nodeType===1)};L.encodeDates=function(t){return L.each(t,function(e,r){L.isDate(e)?t[r]=L.formatDate(e):L.isObject(e)&&(t[r]=L.encodeDates(e))}),t};L.timestamp=function(){return Date.now=Date.now||function(){return+new Date},Date.now()};L.formatDate=function(t){function e(r){return r<10?"0"+r:r}return t.getUTCFullYear()+"-"+e(t.getUTCMonth()+1)+"-"+e(t.getUTCDate())+"T"+e(t.getUTCHours())+":"+e(t.getUTCMinutes())+":"+e(t.getUTCSeconds())};L.strip_empty_properties=function(t){var e={};return L.each(t,function(r,n){L.isString(r)&&r.length>0&&(e[n]=r)}),e};L.truncate=function(t,e){var r;return typeof t=="string"?r=t.slice(0,e):L.isArray(t)?(r=[],L.each(t,function(n){r.push(L.truncate(n,e))})):L.isObject(t)?(r={},L.each(t,function(n,i){r[i]=L.truncate(n,e)})):r=t,r};L.JSONEncode=function(){return function(t){var e=t,r=function(i){var s=/[\\"\x00-\x1f\x7f-\x9f\u00ad\u0600-\u0604\u070f\u17b4\u17b5\u200c-\u200f\u2028-\u202f\u2060-\u206f\ufeff\ufff0-\uffff]/g,o={"\b":"\\b","	":"\\t","\n":"\\n","\f":"\\f","\r":"\\r",'"':'\\"',"\\":"\\\\"};return s.lastIndex=0,s.test(i)?'"'+i.replace(s,function(f){var c=o[f];return typeof c=="string"?c:"\\u"+("0000"+f.charCodeAt(0).toString(16)).slice(-4)})+'"':'"'+i+'"'},n=function(i,s){var o="",f="    ",c=0,d="",p="",E=0,m=o,g=[],_=s[i];switch(_&&typeof _=="object"&&typeof _.toJSON=="function"&&(_=_.toJSON(i)),typeof _){case"string":return r(_);case"number":return isFinite(_)?String(_):"null";case"boolean":case"null":return String(_);case"object":if(!_)return"null";if(o+=f,g=[],Vl.apply(_)==="[object Array]"){for(E=_.length,c=0;c<E;c+=1)g[c]=n(c,_)||"null";return p=g.length===0?"[]":o?`[
-`+o+g.join(`,
-`+o)+`
-`+m+"]":"["+g.join(",")+"]",o=m,p}for(d in _)Ac.call(_,d)&&(p=n(d,_),p&&g.push(r(d)+(o?": ":":")+p));return p=g.length===0?"{}":o?"{"+g.join(",")+m+"}":"{"+g.join(",")+"}",o=m,p}};return n("",{"":e})}}();L.JSONDecode=function(){var t,e,r={'"':'"',"\\":"\\","/":"/",b:"\b",f:"\f",n:`
-`,r:"\r",t:"	"},n,i=function(g){var _=new SyntaxError(g);throw _.at=t,_.text=n,_},s=function(g){return g&&g!==e&&i("Expected '"+g+"' instead of '"+e+"'"),e=n.charAt(t),t+=1,e},o=function(){var g,_="";for(e==="-"&&(_="-",s("-"));e>="0"&&e<="9";)_+=e,s();if(e===".")for(_+=".";s()&&e>="0"&&e<="9";)_+=e;if(e==="e"||e==="E")for(_+=e,s(),(e==="-"||e==="+")&&(_+=e,s());e>="0"&&e<="9";)_+=e,s();if(g=+_,!isFinite(g))i("Bad number");else return g},f=function(){var g,_,b="",x;if(e==='"')for(;s();){if(e==='"')return s(),b;if(e==="\\")if(s(),e==="u"){for(x=0,_=0;_<4&&(g=parseInt(s(),16),!!isFinite(g));_+=1)x=x*16+g;b+=String.fromCharCode(x)}else if(typeof r[e]=="string")b+=r[e];else break;else b+=e}i("Bad string")},c=function(){for(;e&&e<=" ";)s()},d=function(){switch(e){case"t":return s("t"),s("r"),s("u"),s("e"),!0;case"f":return s("f"),s("a"),s("l"),s("s"),s("e"),!1;case"n":return s("n"),s("u"),s("l"),s("l"),null}i('Unexpected "'+e+'"')},p,E=function(){var g=[];if(e==="["){if(s("["),c(),e==="]")return s("]"),g;for(;e;){if(g.push(p()),c(),e==="]")return s("]"),g;s(","),c()}}i("Bad array")},m=function(){var g,_={};if(e==="{"){if(s("{"),c(),e==="}")return s("}"),_;for(;e;){if(g=f(),c(),s(":"),Object.hasOwnProperty.call(_,g)&&i('Duplicate key "'+g+'"'),_[g]=p(),c(),e==="}")return s("}"),_;s(","),c()}}i("Bad object")};return p=function(){switch(c(),e){case"{":return m();case"[":return E();case'"':return f();case"-":return o();default:return e>="0"&&e<="9"?o():d()}},function(g){var _;return n=g,t=0,e=" ",_=p(),c(),e&&i("Syntax error"),_}}();L.base64Encode=function(t){var e="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=",r,n,i,s,o,f,c,d,p=0,E=0,m="",g=[];if(!t)return t;t=L.utf8Encode(t);do r=t.charCodeAt(p++),n=t.charCodeAt(p++),i=t.charCodeAt(p++),d=r<<16|n<<8|i,s=d>>18&63,o=d>>12&63,f=d>>6&63,c=d&63,g[E++]=e.charAt(s)+e.charAt(o)+e.charAt(f)+e.charAt(c);while(p<t.length);switch(m=g.join(""),t.length%3){case 1:m=m.slice(0,-2)+"==";break;case 2:m=m.slice(0,-1)+"=";break}return m};L.utf8Encode=function(t){t=(t+"").replace(/\r\n/g,`
-`).replace(/\r/g,`
-`);var e="",r,n,i=0,s;for(r=n=0,i=t.length,s=0;s<i;s++){var o=t.charCodeAt(s),f=null;o<128?n++:o>127&&o<2048?f=String.fromCharCode(o>>6|192,o&63|128):f=String.fromCharCode(o>>12|224,o>>6&63|128,o&63|128),f!==null&&(n>r&&(e+=t.substring(r,n)),e+=f,r=n=s+1)}return n>r&&(e+=t.substring(r,t.length)),e};L.UUID=function(){var t=function(){var n=1*new Date,i;if(ft.performance&&ft.performance.now)i=ft.performance.now();else for(i=0;n==1*new Date;)i++;return n.toString(16)+Math.floor(i).toString(16)},e=function(){return Math.random().toString(16).replace(".","")},r=function(){var n=Zn,i,s,o=[],f=0;function c(d,p){var E,m=0;for(E=0;E<p.length;E++)m|=o[E]<<E*8;return d^m}for(i=0;i<n.length;i++)s=n.charCodeAt(i),o.unshift(s&255),o.length>=4&&(f=c(f,o),o=[]);return o.length>0&&(f=c(f,o)),f.toString(16)};return function(){var n=(Mf.height*Mf.width).toString(16);return t()+"-"+e()+"-"+r()+"-"+n+"-"+t()}}();var Bv=["ahrefsbot","ahrefssiteaudit","baiduspider","bingbot","bingpreview","chrome-lighthouse","facebookexternal","petalbot","pinterest","screaming frog","yahoo! slurp","yandexbot","adsbot-google","apis-google","duplexweb-google","feedfetcher-google","google favicon","google web preview","google-read-aloud","googlebot","googleweblight","mediapartners-google","storebot-google"];L.isBlockedUA=function(t){var e;for(t=t.toLowerCase(),e=0;e<Bv.length;e++)if(t.indexOf(Bv[e])!==-1)return!0;return!1};L.HTTPBuildQuery=function(t,e){var r,n,i=[];return L.isUndefined(e)&&(e="&"),L.each(t,function(s,o){r=encodeURIComponent(s.toString()),n=encodeURIComponent(o),i[i.length]=n+"="+r}),i.join(e)};L.getQueryParam=function(t,e){e=e.replace(/[[]/,"\\[").replace(/[\]]/,"\\]");var r="[\\?&]"+e+"=([^&#]*)",n=new RegExp(r),i=n.exec(t);if(i===null||i&&typeof i[1]!="string"&&i[1].length)return"";var s=i[1];try{s=decodeURIComponent(s)}catch{Lt.error("Skipping decoding for malformed query param: "+s)}return s.replace(/\+/g," ")};L.cookie={get:function(t){for(var e=t+"=",r=Pt.cookie.split(";"),n=0;n<r.length;n++){for(var i=r[n];i.charAt(0)==" ";)i=i.substring(1,i.length);if(i.indexOf(e)===0)return decodeURIComponent(i.substring(e.length,i.length))}return null},parse:function(t){var e;try{e=L.JSONDecode(L.cookie.get(t))||{}}catch{}return e},set_seconds:function(t,e,r,n,i,s,o){var f="",c="",d="";if(o)f="; domain="+o;else if(n){var p=Mv(Pt.location.hostname);f=p?"; domain=."+p:""}if(r){var E=new Date;E.setTime(E.getTime()+r*1e3),c="; expires="+E.toGMTString()}s&&(i=!0,d="; SameSite=None"),i&&(d+="; secure"),Pt.cookie=t+"="+encodeURIComponent(e)+c+"; path=/"+f+d},set:function(t,e,r,n,i,s,o){var f="",c="",d="";if(o)f="; domain="+o;else if(n){var p=Mv(Pt.location.hostname);f=p?"; domain=."+p:""}if(r){var E=new Date;E.setTime(E.getTime()+r*24*60*60*1e3),c="; expires="+E.toGMTString()}s&&(i=!0,d="; SameSite=None"),i&&(d+="; secure");var m=t+"="+encodeURIComponent(e)+c+"; path=/"+f+d;return Pt.cookie=m,m},remove:function(t,e,r){L.cookie.set(t,"",-1,e,!1,!1,r)}};var Cd=null,$f=function(t,e){if(Cd!==null&&!e)return Cd;var r=!0;try{t=t||window.localStorage;var n="__mplss_"+n0(8),i="xyz";t.setItem(n,i),t.getItem(n)!==i&&(r=!1),t.removeItem(n)}catch{r=!1}return Cd=r,r};L.localStorage={is_supported:function(t){var e=$f(null,t);return e||Lt.error("localStorage unsupported; falling back to cookie store"),e},error:function(t){Lt.error("localStorage error: "+t)},get:function(t){try{return window.localStorage.getItem(t)}catch(e){L.localStorage.error(e)}return null},parse:function(t){try{return L.JSONDecode(L.localStorage.get(t))||{}}catch{}return null},set:function(t,e){try{window.localStorage.setItem(t,e)}catch(r){L.localStorage.error(r)}},remove:function(t){try{window.localStorage.removeItem(t)}catch(e){L.localStorage.error(e)}}};L.register_event=function(){var t=function(n,i,s,o,f){if(!n){Lt.error("No valid element provided to register_event");return}if(n.addEventListener&&!o)n.addEventListener(i,s,!!f);else{var c="on"+i,d=n[c];n[c]=e(n,s,d)}};function e(n,i,s){var o=function(f){if(f=f||r(window.event),!!f){var c=!0,d,p;return L.isFunction(s)&&(d=s(f)),p=i.call(n,f),(d===!1||p===!1)&&(c=!1),c}};return o}function r(n){return n&&(n.preventDefault=r.preventDefault,n.stopPropagation=r.stopPropagation),n}return r.preventDefault=function(){this.returnValue=!1},r.stopPropagation=function(){this.cancelBubble=!0},t}();var C2=new RegExp('^(\\w*)\\[(\\w+)([=~\\|\\^\\$\\*]?)=?"?([^\\]"]*)"?\\]$');L.dom_query=function(){function t(i){return i.all?i.all:i.getElementsByTagName("*")}var e=/[\t\r\n]/g;function r(i,s){var o=" "+s+" ";return(" "+i.className+" ").replace(e," ").indexOf(o)>=0}function n(i){if(!Pt.getElementsByTagName)return[];var s=i.split(" "),o,f,c,d,p,E,m,g,_,b,x=[Pt];for(E=0;E<s.length;E++){if(o=s[E].replace(/^\s+/,"").replace(/\s+$/,""),o.indexOf("#")>-1){f=o.split("#"),c=f[0];var S=f[1],y=Pt.getElementById(S);if(!y||c&&y.nodeName.toLowerCase()!=c)return[];x=[y];continue}if(o.indexOf(".")>-1){f=o.split("."),c=f[0];var v=f[1];for(c||(c="*"),d=[],p=0,m=0;m<x.length;m++)for(c=="*"?_=t(x[m]):_=x[m].getElementsByTagName(c),g=0;g<_.length;g++)d[p++]=_[g];for(x=[],b=0,m=0;m<d.length;m++)d[m].className&&L.isString(d[m].className)&&r(d[m],v)&&(x[b++]=d[m]);continue}var R=o.match(C2);if(R){c=R[1];var w=R[2],M=R[3],k=R[4];for(c||(c="*"),d=[],p=0,m=0;m<x.length;m++)for(c=="*"?_=t(x[m]):_=x[m].getElementsByTagName(c),g=0;g<_.length;g++)d[p++]=_[g];x=[],b=0;var H;switch(M){case"=":H=function(O){return O.getAttribute(w)==k};break;case"~":H=function(O){return O.getAttribute(w).match(new RegExp("\\b"+k+"\\b"))};break;case"|":H=function(O){return O.getAttribute(w).match(new RegExp("^"+k+"-?"))};break;case"^":H=function(O){return O.getAttribute(w).indexOf(k)===0};break;case"$":H=function(O){return O.getAttribute(w).lastIndexOf(k)==O.getAttribute(w).length-k.length};break;case"*":H=function(O){return O.getAttribute(w).indexOf(k)>-1};break;default:H=function(O){return O.getAttribute(w)}}for(x=[],b=0,m=0;m<d.length;m++)H(d[m])&&(x[b++]=d[m]);continue}for(c=o,d=[],p=0,m=0;m<x.length;m++)for(_=x[m].getElementsByTagName(c),g=0;g<_.length;g++)d[p++]=_[g];x=d}return x}return function(i){return L.isElement(i)?[i]:L.isObject(i)&&!L.isUndefined(i.length)?i:n.call(this,i)}}();var w2=["utm_source","utm_medium","utm_campaign","utm_content","utm_term"],O2=["dclid","fbclid","gclid","ko_click_id","li_fat_id","msclkid","ttclid","twclid","wbraid"];L.info={campaignParams:function(t){var e="",r={};return L.each(w2,function(n){e=L.getQueryParam(Pt.URL,n),e.length?r[n]=e:t!==void 0&&(r[n]=t)}),r},clickParams:function(){var t="",e={};return L.each(O2,function(r){t=L.getQueryParam(Pt.URL,r),t.length&&(e[r]=t)}),e},marketingParams:function(){return L.extend(L.info.campaignParams(),L.info.clickParams())},searchEngine:function(t){return t.search("https?://(.*)google.([^/?]*)")===0?"google":t.search("https?://(.*)bing.com")===0?"bing":t.search("https?://(.*)yahoo.com")===0?"yahoo":t.search("https?://(.*)duckduckgo.com")===0?"duckduckgo":null},searchInfo:function(t){var e=L.info.searchEngine(t),r=e!="yahoo"?"q":"p",n={};if(e!==null){n.$search_engine=e;var i=L.getQueryParam(t,r);i.length&&(n.mp_keyword=i)}return n},browser:function(t,e,r){return e=e||"",r||L.includes(t," OPR/")?L.includes(t,"Mini")?"Opera Mini":"Opera":/(BlackBerry|PlayBook|BB10)/i.test(t)?"BlackBerry":L.includes(t,"IEMobile")||L.includes(t,"WPDesktop")?"Internet Explorer Mobile":L.includes(t,"SamsungBrowser/")?"Samsung Internet":L.includes(t,"Edge")||L.includes(t,"Edg/")?"Microsoft Edge":L.includes(t,"FBIOS")?"Facebook Mobile":L.includes(t,"Chrome")?"Chrome":L.includes(t,"CriOS")?"Chrome iOS":L.includes(t,"UCWEB")||L.includes(t,"UCBrowser")?"UC Browser":L.includes(t,"FxiOS")?"Firefox iOS":L.includes(e,"Apple")?L.includes(t,"Mobile")?"Mobile Safari":"Safari":L.includes(t,"Android")?"Android Mobile":L.includes(t,"Konqueror")?"Konqueror":L.includes(t,"Firefox")?"Firefox":L.includes(t,"MSIE")||L.includes(t,"Trident/")?"Internet Explorer":L.includes(t,"Gecko")?"Mozilla":""},browserVersion:function(t,e,r){var n=L.info.browser(t,e,r),i={"Internet Explorer Mobile":/rv:(\d+(\.\d+)?)/,"Microsoft Edge":/Edge?\/(\d+(\.\d+)?)/,Chrome:/Chrome\/(\d+(\.\d+)?)/,"Chrome iOS":/CriOS\/(\d+(\.\d+)?)/,"UC Browser":/(UCBrowser|UCWEB)\/(\d+(\.\d+)?)/,Safari:/Version\/(\d+(\.\d+)?)/,"Mobile Safari":/Version\/(\d+(\.\d+)?)/,Opera:/(Opera|OPR)\/(\d+(\.\d+)?)/,Firefox:/Firefox\/(\d+(\.\d+)?)/,"Firefox iOS":/FxiOS\/(\d+(\.\d+)?)/,Konqueror:/Konqueror:(\d+(\.\d+)?)/,BlackBerry:/BlackBerry (\d+(\.\d+)?)/,"Android Mobile":/android\s(\d+(\.\d+)?)/,"Samsung Internet":/SamsungBrowser\/(\d+(\.\d+)?)/,"Internet Explorer":/(rv:|MSIE )(\d+(\.\d+)?)/,Mozilla:/rv:(\d+(\.\d+)?)/},s=i[n];if(s===void 0)return null;var o=t.match(s);return o?parseFloat(o[o.length-2]):null},os:function(){var t=Zn;return/Windows/i.test(t)?/Phone/.test(t)||/WPDesktop/.test(t)?"Windows Phone":"Windows":/(iPhone|iPad|iPod)/.test(t)?"iOS":/Android/.test(t)?"Android":/(BlackBerry|PlayBook|BB10)/i.test(t)?"BlackBerry":/Mac/i.test(t)?"Mac OS X":/Linux/.test(t)?"Linux":/CrOS/.test(t)?"Chrome OS":""},device:function(t){return/Windows Phone/i.test(t)||/WPDesktop/.test(t)?"Windows Phone":/iPad/.test(t)?"iPad":/iPod/.test(t)?"iPod Touch":/iPhone/.test(t)?"iPhone":/(BlackBerry|PlayBook|BB10)/i.test(t)?"BlackBerry":/Android/.test(t)?"Android":""},referringDomain:function(t){var e=t.split("/");return e.length>=3?e[2]:""},currentUrl:function(){return ft.location.href},properties:function(t){return typeof t!="object"&&(t={}),L.extend(L.strip_empty_properties({$os:L.info.os(),$browser:L.info.browser(Zn,ls.vendor,Wu),$referrer:Pt.referrer,$referring_domain:L.info.referringDomain(Pt.referrer),$device:L.info.device(Zn)}),{$current_url:L.info.currentUrl(),$browser_version:L.info.browserVersion(Zn,ls.vendor,Wu),$screen_height:Mf.height,$screen_width:Mf.width,mp_lib:"web",$lib_version:Ui.LIB_VERSION,$insert_id:n0(),time:L.timestamp()/1e3},L.strip_empty_properties(t))},people_properties:function(){return L.extend(L.strip_empty_properties({$os:L.info.os(),$browser:L.info.browser(Zn,ls.vendor,Wu)}),{$browser_version:L.info.browserVersion(Zn,ls.vendor,Wu)})},mpPageViewProperties:function(){return L.strip_empty_properties({current_page_title:Pt.title,current_domain:ft.location.hostname,current_url_path:ft.location.pathname,current_url_protocol:ft.location.protocol,current_url_search:ft.location.search})}};var n0=function(t){var e=Math.random().toString(36).substring(2,10)+Math.random().toString(36).substring(2,10);return t?e.substring(0,t):e},I2=/[a-z0-9][a-z0-9-]*\.[a-z]+$/i,N2=/[a-z0-9][a-z0-9-]+\.[a-z.]{2,6}$/i,Mv=function(t){var e=N2,r=t.split("."),n=r[r.length-1];(n.length>4||n==="com"||n==="org")&&(e=I2);var i=t.match(e);return i?i[0]:""},Kf=null,kf=null;typeof JSON<"u"&&(Kf=JSON.stringify,kf=JSON.parse);Kf=Kf||L.JSONEncode;kf=kf||L.JSONDecode;L.toArray=L.toArray;L.isObject=L.isObject;L.JSONEncode=L.JSONEncode;L.JSONDecode=L.JSONDecode;L.isBlockedUA=L.isBlockedUA;L.isEmptyObject=L.isEmptyObject;L.info=L.info;L.info.device=L.info.device;L.info.browser=L.info.browser;L.info.browserVersion=L.info.browserVersion;L.info.properties=L.info.properties;var Ki=function(){};Ki.prototype.create_properties=function(){};Ki.prototype.event_handler=function(){};Ki.prototype.after_track_handler=function(){};Ki.prototype.init=function(t){return this.mp=t,this};Ki.prototype.track=function(t,e,r,n){var i=this,s=L.dom_query(t);if(s.length===0){Lt.error("The DOM query ("+t+") returned 0 elements");return}return L.each(s,function(o){L.register_event(o,this.override_event,function(f){var c={},d=i.create_properties(r,this),p=i.mp.get_config("track_links_timeout");i.event_handler(f,this,c),window.setTimeout(i.track_callback(n,d,c,!0),p),i.mp.track(e,d,i.track_callback(n,d,c))})},this),!0};Ki.prototype.track_callback=function(t,e,r,n){n=n||!1;var i=this;return function(){r.callback_fired||(r.callback_fired=!0,!(t&&t(n,e)===!1)&&i.after_track_handler(e,r,n))}};Ki.prototype.create_properties=function(t,e){var r;return typeof t=="function"?r=t(e):r=L.extend({},t),r};var ho=function(){this.override_event="click"};L.inherit(ho,Ki);ho.prototype.create_properties=function(t,e){var r=ho.superclass.create_properties.apply(this,arguments);return e.href&&(r.url=e.href),r};ho.prototype.event_handler=function(t,e,r){r.new_tab=t.which===2||t.metaKey||t.ctrlKey||e.target==="_blank",r.href=e.href,r.new_tab||t.preventDefault()};ho.prototype.after_track_handler=function(t,e){e.new_tab||setTimeout(function(){window.location=e.href},0)};var Lc=function(){this.override_event="submit"};L.inherit(Lc,Ki);Lc.prototype.event_handler=function(t,e,r){r.element=e,t.preventDefault()};Lc.prototype.after_track_handler=function(t,e){setTimeout(function(){e.element.submit()},0)};var P2=r0("lock"),ry=function(t,e){e=e||{},this.storageKey=t,this.storage=e.storage||window.localStorage,this.pollIntervalMS=e.pollIntervalMS||100,this.timeoutMS=e.timeoutMS||2e3};ry.prototype.withLock=function(t,e,r){!r&&typeof e!="function"&&(r=e,e=null);var n=r||new Date().getTime()+"|"+Math.random(),i=new Date().getTime(),s=this.storageKey,o=this.pollIntervalMS,f=this.timeoutMS,c=this.storage,d=s+":X",p=s+":Y",E=s+":Z",m=function(y){e&&e(y)},g=function(y){if(new Date().getTime()-i>f){P2.error("Timeout waiting for mutex on "+s+"; clearing lock. ["+n+"]"),c.removeItem(E),c.removeItem(p),x();return}setTimeout(function(){try{y()}catch(v){m(v)}},o*(Math.random()+.1))},_=function(y,v){y()?v():g(function(){_(y,v)})},b=function(){var y=c.getItem(p);if(y&&y!==n)return!1;if(c.setItem(p,n),c.getItem(p)===n)return!0;if(!$f(c,!0))throw new Error("localStorage support dropped while acquiring lock");return!1},x=function(){c.setItem(d,n),_(b,function(){if(c.getItem(d)===n){S();return}g(function(){if(c.getItem(p)!==n){x();return}_(function(){return!c.getItem(E)},S)})})},S=function(){c.setItem(E,"1");try{t()}finally{c.removeItem(E),c.getItem(p)===n&&c.removeItem(p),c.getItem(d)===n&&c.removeItem(d)}};try{if($f(c,!0))x();else throw new Error("localStorage support check failed")}catch(y){m(y)}};var $v=r0("batch"),Ss=function(t,e){e=e||{},this.storageKey=t,this.storage=e.storage||window.localStorage,this.reportError=e.errorReporter||L.bind($v.error,$v),this.lock=new ry(t,{storage:this.storage}),this.pid=e.pid||null,this.memQueue=[]};Ss.prototype.enqueue=function(t,e,r){var n={id:n0(),flushAfter:new Date().getTime()+e*2,payload:t};this.lock.withLock(L.bind(function(){var s;try{var o=this.readFromStorage();o.push(n),s=this.saveToStorage(o),s&&this.memQueue.push(n)}catch{this.reportError("Error enqueueing item",t),s=!1}r&&r(s)},this),L.bind(function(s){this.reportError("Error acquiring storage lock",s),r&&r(!1)},this),this.pid)};Ss.prototype.fillBatch=function(t){var e=this.memQueue.slice(0,t);if(e.length<t){var r=this.readFromStorage();if(r.length){var n={};L.each(e,function(o){n[o.id]=!0});for(var i=0;i<r.length;i++){var s=r[i];if(new Date().getTime()>s.flushAfter&&!n[s.id]&&(s.orphaned=!0,e.push(s),e.length>=t))break}}}return e};var Kv=function(t,e){var r=[];return L.each(t,function(n){n.id&&!e[n.id]&&r.push(n)}),r};Ss.prototype.removeItemsByID=function(t,e){var r={};L.each(t,function(i){r[i]=!0}),this.memQueue=Kv(this.memQueue,r);var n=L.bind(function(){var i;try{var s=this.readFromStorage();if(s=Kv(s,r),i=this.saveToStorage(s),i){s=this.readFromStorage();for(var o=0;o<s.length;o++){var f=s[o];if(f.id&&r[f.id])return this.reportError("Item not removed from storage"),!1}}}catch{this.reportError("Error removing items",t),i=!1}return i},this);this.lock.withLock(function(){var s=n();e&&e(s)},L.bind(function(s){var o=!1;if(this.reportError("Error acquiring storage lock",s),!$f(this.storage,!0)&&(o=n(),!o))try{this.storage.removeItem(this.storageKey)}catch(f){this.reportError("Error clearing queue",f)}e&&e(o)},this),this.pid)};var kv=function(t,e){var r=[];return L.each(t,function(n){var i=n.id;if(i in e){var s=e[i];s!==null&&(n.payload=s,r.push(n))}else r.push(n)}),r};Ss.prototype.updatePayloads=function(t,e){this.memQueue=kv(this.memQueue,t),this.lock.withLock(L.bind(function(){var n;try{var i=this.readFromStorage();i=kv(i,t),n=this.saveToStorage(i)}catch{this.reportError("Error updating items",t),n=!1}e&&e(n)},this),L.bind(function(n){this.reportError("Error acquiring storage lock",n),e&&e(!1)},this),this.pid)};Ss.prototype.readFromStorage=function(){var t;try{t=this.storage.getItem(this.storageKey),t&&(t=kf(t),L.isArray(t)||(this.reportError("Invalid storage entry:",t),t=null))}catch(e){this.reportError("Error retrieving queue",e),t=null}return t||[]};Ss.prototype.saveToStorage=function(t){try{return this.storage.setItem(this.storageKey,Kf(t)),!0}catch(e){return this.reportError("Error saving queue",e),!1}};Ss.prototype.clear=function(){this.memQueue=[],this.storage.removeItem(this.storageKey)};var U2=10*60*1e3,hl=r0("batch"),fi=function(t,e){this.errorReporter=e.errorReporter,this.queue=new Ss(t,{errorReporter:L.bind(this.reportError,this),storage:e.storage}),this.libConfig=e.libConfig,this.sendRequest=e.sendRequestFunc,this.beforeSendHook=e.beforeSendHook,this.stopAllBatching=e.stopAllBatchingFunc,this.batchSize=this.libConfig.batch_size,this.flushInterval=this.libConfig.batch_flush_interval_ms,this.stopped=!this.libConfig.batch_autostart,this.consecutiveRemovalFailures=0,this.itemIdsSentSuccessfully={}};fi.prototype.enqueue=function(t,e){this.queue.enqueue(t,this.flushInterval,e)};fi.prototype.start=function(){this.stopped=!1,this.consecutiveRemovalFailures=0,this.flush()};fi.prototype.stop=function(){this.stopped=!0,this.timeoutID&&(clearTimeout(this.timeoutID),this.timeoutID=null)};fi.prototype.clear=function(){this.queue.clear()};fi.prototype.resetBatchSize=function(){this.batchSize=this.libConfig.batch_size};fi.prototype.resetFlush=function(){this.scheduleFlush(this.libConfig.batch_flush_interval_ms)};fi.prototype.scheduleFlush=function(t){this.flushInterval=t,this.stopped||(this.timeoutID=setTimeout(L.bind(this.flush,this),this.flushInterval))};fi.prototype.flush=function(t){try{if(this.requestInProgress){hl.log("Flush: Request already in progress");return}t=t||{};var e=this.libConfig.batch_request_timeout_ms,r=new Date().getTime(),n=this.batchSize,i=this.queue.fillBatch(n),s=[],o={};if(L.each(i,function(d){var p=d.payload;if(this.beforeSendHook&&!d.orphaned&&(p=this.beforeSendHook(p)),p){p.event&&p.properties&&(p.properties=L.extend({},p.properties,{mp_sent_by_lib_version:Ui.LIB_VERSION}));var E=!0,m=d.id;m?(this.itemIdsSentSuccessfully[m]||0)>5&&(this.reportError("[dupe] item ID sent too many times, not sending",{item:d,batchSize:i.length,timesSent:this.itemIdsSentSuccessfully[m]}),E=!1):this.reportError("[dupe] found item with no ID",{item:d}),E&&s.push(p)}o[d.id]=p},this),s.length<1){this.resetFlush();return}this.requestInProgress=!0;var f=L.bind(function(d){this.requestInProgress=!1;try{var p=!1;if(t.unloading)this.queue.updatePayloads(o);else if(L.isObject(d)&&d.error==="timeout"&&new Date().getTime()-r>=e)this.reportError("Network timeout; retrying"),this.flush();else if(L.isObject(d)&&d.xhr_req&&(d.xhr_req.status>=500||d.xhr_req.status===429||d.error==="timeout")){var E=this.flushInterval*2,m=d.xhr_req.responseHeaders;if(m){var g=m["Retry-After"];g&&(E=parseInt(g,10)*1e3||E)}E=Math.min(U2,E),this.reportError("Error; retry in "+E+" ms"),this.scheduleFlush(E)}else if(L.isObject(d)&&d.xhr_req&&d.xhr_req.status===413)if(i.length>1){var _=Math.max(1,Math.floor(n/2));this.batchSize=Math.min(this.batchSize,_,i.length-1),this.reportError("413 response; reducing batch size to "+this.batchSize),this.resetFlush()}else this.reportError("Single-event request too large; dropping",i),this.resetBatchSize(),p=!0;else p=!0;p&&(this.queue.removeItemsByID(L.map(i,function(b){return b.id}),L.bind(function(b){b?(this.consecutiveRemovalFailures=0,this.flush()):(this.reportError("Failed to remove items from queue"),++this.consecutiveRemovalFailures>5?(this.reportError("Too many queue failures; disabling batching system."),this.stopAllBatching()):this.resetFlush())},this)),L.each(i,L.bind(function(b){var x=b.id;x?(this.itemIdsSentSuccessfully[x]=this.itemIdsSentSuccessfully[x]||0,this.itemIdsSentSuccessfully[x]++,this.itemIdsSentSuccessfully[x]>5&&this.reportError("[dupe] item ID sent too many times",{item:b,batchSize:i.length,timesSent:this.itemIdsSentSuccessfully[x]})):this.reportError("[dupe] found item with no ID while removing",{item:b})},this)))}catch(b){this.reportError("Error handling API response",b),this.resetFlush()}},this),c={method:"POST",verbose:!0,ignore_json_errors:!0,timeout_ms:e};t.unloading&&(c.transport="sendBeacon"),hl.log("MIXPANEL REQUEST:",s),this.sendRequest(s,c,f)}catch(d){this.reportError("Error flushing request queue",d),this.resetFlush()}};fi.prototype.reportError=function(t,e){if(hl.error.apply(hl.error,arguments),this.errorReporter)try{e instanceof Error||(e=new Error(t)),this.errorReporter(t,e)}catch(r){hl.error(r)}};var D2="__mp_opt_in_out_";function B2(t,e){sy(!0,t,e)}function M2(t,e){sy(!1,t,e)}function $2(t,e){return iy(t,e)==="1"}function ny(t,e){if(k2(e))return Lt.warn('This browser has "Do Not Track" enabled. This will prevent the Mixpanel SDK from sending any data. To ignore the "Do Not Track" browser setting, initialize the Mixpanel instance with the config "ignore_dnt: true"'),!0;var r=iy(t,e)==="0";return r&&Lt.warn("You are opted out of Mixpanel tracking. This will prevent the Mixpanel SDK from sending any data."),r}function la(t){return a0(t,function(e){return this.get_config(e)})}function ys(t){return a0(t,function(e){return this._get_config(e)})}function Ro(t){return a0(t,function(e){return this._get_config(e)})}function K2(t,e){e=e||{},i0(e).remove(s0(t,e),!!e.crossSubdomainCookie,e.cookieDomain)}function i0(t){return t=t||{},t.persistenceType==="localStorage"?L.localStorage:L.cookie}function s0(t,e){return e=e||{},(e.persistencePrefix||D2)+t}function iy(t,e){return i0(e).get(s0(t,e))}function k2(t){if(t&&t.ignoreDnt)return!1;var e=t&&t.window||ft,r=e.navigator||{},n=!1;return L.each([r.doNotTrack,r.msDoNotTrack,e.doNotTrack],function(i){L.includes([!0,1,"1","yes"],i)&&(n=!0)}),n}function sy(t,e,r){if(!L.isString(e)||!e.length){Lt.error("gdpr."+(t?"optIn":"optOut")+" called with an invalid token");return}r=r||{},i0(r).set(s0(e,r),t?1:0,L.isNumber(r.cookieExpiration)?r.cookieExpiration:null,!!r.crossSubdomainCookie,!!r.secureCookie,!!r.crossSiteCookie,r.cookieDomain),r.track&&t&&r.track(r.trackEventName||"$opt_in",r.trackProperties,{send_immediately:!0})}function a0(t,e){return function(){var r=!1;try{var n=e.call(this,"token"),i=e.call(this,"ignore_dnt"),s=e.call(this,"opt_out_tracking_persistence_type"),o=e.call(this,"opt_out_tracking_cookie_prefix"),f=e.call(this,"window");n&&(r=ny(n,{ignoreDnt:i,persistenceType:s,persistencePrefix:o,window:f}))}catch(d){Lt.error("Unexpected error when checking tracking opt-out status: "+d)}if(!r)return t.apply(this,arguments);var c=arguments[arguments.length-1];typeof c=="function"&&c(0)}}var _s="$set",Eo="$set_once",Un="$unset",ia="$add",ii="$append",sa="$union",Di="$remove",G2="$delete",ay={set_action:function(t,e){var r={},n={};return L.isObject(t)?L.each(t,function(i,s){this._is_reserved_property(s)||(n[s]=i)},this):n[t]=e,r[_s]=n,r},unset_action:function(t){var e={},r=[];return L.isArray(t)||(t=[t]),L.each(t,function(n){this._is_reserved_property(n)||r.push(n)},this),e[Un]=r,e},set_once_action:function(t,e){var r={},n={};return L.isObject(t)?L.each(t,function(i,s){this._is_reserved_property(s)||(n[s]=i)},this):n[t]=e,r[Eo]=n,r},union_action:function(t,e){var r={},n={};return L.isObject(t)?L.each(t,function(i,s){this._is_reserved_property(s)||(n[s]=L.isArray(i)?i:[i])},this):n[t]=L.isArray(e)?e:[e],r[sa]=n,r},append_action:function(t,e){var r={},n={};return L.isObject(t)?L.each(t,function(i,s){this._is_reserved_property(s)||(n[s]=i)},this):n[t]=e,r[ii]=n,r},remove_action:function(t,e){var r={},n={};return L.isObject(t)?L.each(t,function(i,s){this._is_reserved_property(s)||(n[s]=i)},this):n[t]=e,r[Di]=n,r},delete_action:function(){var t={};return t[G2]="",t}},jt=function(){};L.extend(jt.prototype,ay);jt.prototype._init=function(t,e,r){this._mixpanel=t,this._group_key=e,this._group_id=r};jt.prototype.set=Ro(function(t,e,r){var n=this.set_action(t,e);return L.isObject(t)&&(r=e),this._send_request(n,r)});jt.prototype.set_once=Ro(function(t,e,r){var n=this.set_once_action(t,e);return L.isObject(t)&&(r=e),this._send_request(n,r)});jt.prototype.unset=Ro(function(t,e){var r=this.unset_action(t);return this._send_request(r,e)});jt.prototype.union=Ro(function(t,e,r){L.isObject(t)&&(r=e);var n=this.union_action(t,e);return this._send_request(n,r)});jt.prototype.delete=Ro(function(t){var e=this.delete_action();return this._send_request(e,t)});jt.prototype.remove=Ro(function(t,e,r){var n=this.remove_action(t,e);return this._send_request(n,r)});jt.prototype._send_request=function(t,e){t.$group_key=this._group_key,t.$group_id=this._group_id,t.$token=this._get_config("token");var r=L.encodeDates(t);return this._mixpanel._track_or_batch({type:"groups",data:r,endpoint:this._get_config("api_host")+"/"+this._get_config("api_routes").groups,batcher:this._mixpanel.request_batchers.groups},e)};jt.prototype._is_reserved_property=function(t){return t==="$group_key"||t==="$group_id"};jt.prototype._get_config=function(t){return this._mixpanel.get_config(t)};jt.prototype.toString=function(){return this._mixpanel.toString()+".group."+this._group_key+"."+this._group_id};jt.prototype.remove=jt.prototype.remove;jt.prototype.set=jt.prototype.set;jt.prototype.set_once=jt.prototype.set_once;jt.prototype.union=jt.prototype.union;jt.prototype.unset=jt.prototype.unset;jt.prototype.toString=jt.prototype.toString;var st=function(){};L.extend(st.prototype,ay);st.prototype._init=function(t){this._mixpanel=t};st.prototype.set=ys(function(t,e,r){var n=this.set_action(t,e);return L.isObject(t)&&(r=e),this._get_config("save_referrer")&&this._mixpanel.persistence.update_referrer_info(document.referrer),n[_s]=L.extend({},L.info.people_properties(),n[_s]),this._send_request(n,r)});st.prototype.set_once=ys(function(t,e,r){var n=this.set_once_action(t,e);return L.isObject(t)&&(r=e),this._send_request(n,r)});st.prototype.unset=ys(function(t,e){var r=this.unset_action(t);return this._send_request(r,e)});st.prototype.increment=ys(function(t,e,r){var n={},i={};return L.isObject(t)?(L.each(t,function(s,o){if(!this._is_reserved_property(o))if(isNaN(parseFloat(s))){Lt.error("Invalid increment value passed to mixpanel.people.increment - must be a number");return}else i[o]=s},this),r=e):(L.isUndefined(e)&&(e=1),i[t]=e),n[ia]=i,this._send_request(n,r)});st.prototype.append=ys(function(t,e,r){L.isObject(t)&&(r=e);var n=this.append_action(t,e);return this._send_request(n,r)});st.prototype.remove=ys(function(t,e,r){L.isObject(t)&&(r=e);var n=this.remove_action(t,e);return this._send_request(n,r)});st.prototype.union=ys(function(t,e,r){L.isObject(t)&&(r=e);var n=this.union_action(t,e);return this._send_request(n,r)});st.prototype.track_charge=ys(function(t,e,r){if(!L.isNumber(t)&&(t=parseFloat(t),isNaN(t))){Lt.error("Invalid value passed to mixpanel.people.track_charge - must be a number");return}return this.append("$transactions",L.extend({$amount:t},e),r)});st.prototype.clear_charges=function(t){return this.set("$transactions",[],t)};st.prototype.delete_user=function(){if(!this._identify_called()){Lt.error("mixpanel.people.delete_user() requires you to call identify() first");return}var t={$delete:this._mixpanel.get_distinct_id()};return this._send_request(t)};st.prototype.toString=function(){return this._mixpanel.toString()+".people"};st.prototype._send_request=function(t,e){t.$token=this._get_config("token"),t.$distinct_id=this._mixpanel.get_distinct_id();var r=this._mixpanel.get_property("$device_id"),n=this._mixpanel.get_property("$user_id"),i=this._mixpanel.get_property("$had_persisted_distinct_id");r&&(t.$device_id=r),n&&(t.$user_id=n),i&&(t.$had_persisted_distinct_id=i);var s=L.encodeDates(t);return this._identify_called()?this._mixpanel._track_or_batch({type:"people",data:s,endpoint:this._get_config("api_host")+"/"+this._get_config("api_routes").engage,batcher:this._mixpanel.request_batchers.people},e):(this._enqueue(t),L.isUndefined(e)||(this._get_config("verbose")?e({status:-1,error:null}):e(-1)),L.truncate(s,255))};st.prototype._get_config=function(t){return this._mixpanel.get_config(t)};st.prototype._identify_called=function(){return this._mixpanel._flags.identify_called===!0};st.prototype._enqueue=function(t){_s in t?this._mixpanel.persistence._add_to_people_queue(_s,t):Eo in t?this._mixpanel.persistence._add_to_people_queue(Eo,t):Un in t?this._mixpanel.persistence._add_to_people_queue(Un,t):ia in t?this._mixpanel.persistence._add_to_people_queue(ia,t):ii in t?this._mixpanel.persistence._add_to_people_queue(ii,t):Di in t?this._mixpanel.persistence._add_to_people_queue(Di,t):sa in t?this._mixpanel.persistence._add_to_people_queue(sa,t):Lt.error("Invalid call to _enqueue():",t)};st.prototype._flush_one_queue=function(t,e,r,n){var i=this,s=L.extend({},this._mixpanel.persistence.load_queue(t)),o=s;!L.isUndefined(s)&&L.isObject(s)&&!L.isEmptyObject(s)&&(i._mixpanel.persistence._pop_from_people_queue(t,s),i._mixpanel.persistence.save(),n&&(o=n(s)),e.call(i,o,function(f,c){f===0&&i._mixpanel.persistence._add_to_people_queue(t,s),L.isUndefined(r)||r(f,c)}))};st.prototype._flush=function(t,e,r,n,i,s,o){var f=this;this._flush_one_queue(_s,this.set,t),this._flush_one_queue(Eo,this.set_once,n),this._flush_one_queue(Un,this.unset,s,function(x){return L.keys(x)}),this._flush_one_queue(ia,this.increment,e),this._flush_one_queue(sa,this.union,i);var c=this._mixpanel.persistence.load_queue(ii);if(!L.isUndefined(c)&&L.isArray(c)&&c.length)for(var d,p=function(x,S){x===0&&f._mixpanel.persistence._add_to_people_queue(ii,d),L.isUndefined(r)||r(x,S)},E=c.length-1;E>=0;E--)c=this._mixpanel.persistence.load_queue(ii),d=c.pop(),f._mixpanel.persistence.save(),L.isEmptyObject(d)||f.append(d,p);var m=this._mixpanel.persistence.load_queue(Di);if(!L.isUndefined(m)&&L.isArray(m)&&m.length)for(var g,_=function(x,S){x===0&&f._mixpanel.persistence._add_to_people_queue(Di,g),L.isUndefined(o)||o(x,S)},b=m.length-1;b>=0;b--)m=this._mixpanel.persistence.load_queue(Di),g=m.pop(),f._mixpanel.persistence.save(),L.isEmptyObject(g)||f.remove(g,_)};st.prototype._is_reserved_property=function(t){return t==="$distinct_id"||t==="$token"||t==="$device_id"||t==="$user_id"||t==="$had_persisted_distinct_id"};st.prototype.set=st.prototype.set;st.prototype.set_once=st.prototype.set_once;st.prototype.unset=st.prototype.unset;st.prototype.increment=st.prototype.increment;st.prototype.append=st.prototype.append;st.prototype.remove=st.prototype.remove;st.prototype.union=st.prototype.union;st.prototype.track_charge=st.prototype.track_charge;st.prototype.clear_charges=st.prototype.clear_charges;st.prototype.delete_user=st.prototype.delete_user;st.prototype.toString=st.prototype.toString;var o0="__mps",l0="__mpso",u0="__mpus",f0="__mpa",c0="__mpap",p0="__mpr",d0="__mpu",oy="$people_distinct_id",Gf="__alias",Il="__timers",V2=[o0,l0,u0,f0,c0,p0,d0,oy,Gf,Il],pt=function(t){this.props={},this.campaign_params_saved=!1,t.persistence_name?this.name="mp_"+t.persistence_name:this.name="mp_"+t.token+"_mixpanel";var e=t.persistence;e!=="cookie"&&e!=="localStorage"&&(Lt.critical("Unknown persistence type "+e+"; falling back to cookie"),e=t.persistence="cookie"),e==="localStorage"&&L.localStorage.is_supported()?this.storage=L.localStorage:this.storage=L.cookie,this.load(),this.update_config(t),this.upgrade(),this.save()};pt.prototype.properties=function(){var t={};return this.load(),L.each(this.props,function(e,r){L.include(V2,r)||(t[r]=e)}),t};pt.prototype.load=function(){if(!this.disabled){var t=this.storage.parse(this.name);t&&(this.props=L.extend({},t))}};pt.prototype.upgrade=function(){var t,e;this.storage===L.localStorage?(t=L.cookie.parse(this.name),L.cookie.remove(this.name),L.cookie.remove(this.name,!0),t&&this.register_once(t)):this.storage===L.cookie&&(e=L.localStorage.parse(this.name),L.localStorage.remove(this.name),e&&this.register_once(e))};pt.prototype.save=function(){this.disabled||this.storage.set(this.name,L.JSONEncode(this.props),this.expire_days,this.cross_subdomain,this.secure,this.cross_site,this.cookie_domain)};pt.prototype.load_prop=function(t){return this.load(),this.props[t]};pt.prototype.remove=function(){this.storage.remove(this.name,!1,this.cookie_domain),this.storage.remove(this.name,!0,this.cookie_domain)};pt.prototype.clear=function(){this.remove(),this.props={}};pt.prototype.register_once=function(t,e,r){return L.isObject(t)?(typeof e>"u"&&(e="None"),this.expire_days=typeof r>"u"?this.default_expiry:r,this.load(),L.each(t,function(n,i){(!this.props.hasOwnProperty(i)||this.props[i]===e)&&(this.props[i]=n)},this),this.save(),!0):!1};pt.prototype.register=function(t,e){return L.isObject(t)?(this.expire_days=typeof e>"u"?this.default_expiry:e,this.load(),L.extend(this.props,t),this.save(),!0):!1};pt.prototype.unregister=function(t){this.load(),t in this.props&&(delete this.props[t],this.save())};pt.prototype.update_search_keyword=function(t){this.register(L.info.searchInfo(t))};pt.prototype.update_referrer_info=function(t){this.register_once({$initial_referrer:t||"$direct",$initial_referring_domain:L.info.referringDomain(t)||"$direct"},"")};pt.prototype.get_referrer_info=function(){return L.strip_empty_properties({$initial_referrer:this.props.$initial_referrer,$initial_referring_domain:this.props.$initial_referring_domain})};pt.prototype.update_config=function(t){this.default_expiry=this.expire_days=t.cookie_expiration,this.set_disabled(t.disable_persistence),this.set_cookie_domain(t.cookie_domain),this.set_cross_site(t.cross_site_cookie),this.set_cross_subdomain(t.cross_subdomain_cookie),this.set_secure(t.secure_cookie)};pt.prototype.set_disabled=function(t){this.disabled=t,this.disabled?this.remove():this.save()};pt.prototype.set_cookie_domain=function(t){t!==this.cookie_domain&&(this.remove(),this.cookie_domain=t,this.save())};pt.prototype.set_cross_site=function(t){t!==this.cross_site&&(this.cross_site=t,this.remove(),this.save())};pt.prototype.set_cross_subdomain=function(t){t!==this.cross_subdomain&&(this.cross_subdomain=t,this.remove(),this.save())};pt.prototype.get_cross_subdomain=function(){return this.cross_subdomain};pt.prototype.set_secure=function(t){t!==this.secure&&(this.secure=!!t,this.remove(),this.save())};pt.prototype._add_to_people_queue=function(t,e){var r=this._get_queue_key(t),n=e[t],i=this._get_or_create_queue(_s),s=this._get_or_create_queue(Eo),o=this._get_or_create_queue(Un),f=this._get_or_create_queue(ia),c=this._get_or_create_queue(sa),d=this._get_or_create_queue(Di,[]),p=this._get_or_create_queue(ii,[]);r===o0?(L.extend(i,n),this._pop_from_people_queue(ia,n),this._pop_from_people_queue(sa,n),this._pop_from_people_queue(Un,n)):r===l0?(L.each(n,function(E,m){m in s||(s[m]=E)}),this._pop_from_people_queue(Un,n)):r===u0?L.each(n,function(E){L.each([i,s,f,c],function(m){E in m&&delete m[E]}),L.each(p,function(m){E in m&&delete m[E]}),o[E]=!0}):r===f0?(L.each(n,function(E,m){m in i?i[m]+=E:(m in f||(f[m]=0),f[m]+=E)},this),this._pop_from_people_queue(Un,n)):r===d0?(L.each(n,function(E,m){L.isArray(E)&&(m in c||(c[m]=[]),c[m]=c[m].concat(E))}),this._pop_from_people_queue(Un,n)):r===p0?(d.push(n),this._pop_from_people_queue(ii,n)):r===c0&&(p.push(n),this._pop_from_people_queue(Un,n)),Lt.log("MIXPANEL PEOPLE REQUEST (QUEUED, PENDING IDENTIFY):"),Lt.log(e),this.save()};pt.prototype._pop_from_people_queue=function(t,e){var r=this.props[this._get_queue_key(t)];L.isUndefined(r)||L.each(e,function(n,i){t===ii||t===Di?L.each(r,function(s){s[i]===n&&delete s[i]}):delete r[i]},this)};pt.prototype.load_queue=function(t){return this.load_prop(this._get_queue_key(t))};pt.prototype._get_queue_key=function(t){if(t===_s)return o0;if(t===Eo)return l0;if(t===Un)return u0;if(t===ia)return f0;if(t===ii)return c0;if(t===Di)return p0;if(t===sa)return d0;Lt.error("Invalid queue:",t)};pt.prototype._get_or_create_queue=function(t,e){var r=this._get_queue_key(t);return e=L.isUndefined(e)?{}:e,this.props[r]||(this.props[r]=e)};pt.prototype.set_event_timer=function(t,e){var r=this.load_prop(Il)||{};r[t]=e,this.props[Il]=r,this.save()};pt.prototype.remove_event_timer=function(t){var e=this.load_prop(Il)||{},r=e[t];return L.isUndefined(r)||(delete this.props[Il][t],this.save()),r};var h0,wr,ly=0,F2=1,H2=function(t){return t},Nl=function(){},An="mixpanel",uy="base64",W2="json",E0="$device:",Qa=ft.XMLHttpRequest&&"withCredentials"in new XMLHttpRequest,fy=!Qa&&Zn.indexOf("MSIE")===-1&&Zn.indexOf("Mozilla")===-1,Vf=null;ls.sendBeacon&&(Vf=function(){return ls.sendBeacon.apply(ls,arguments)});var cy={track:"track/",engage:"engage/",groups:"groups/",record:"record/"},Gv={api_host:"https://api-js.mixpanel.com",api_routes:cy,api_method:"POST",api_transport:"XHR",api_payload_format:uy,app_host:"https://mixpanel.com",cdn:"https://cdn.mxpnl.com",cross_site_cookie:!1,cross_subdomain_cookie:!0,error_reporter:Nl,persistence:"cookie",persistence_name:"",cookie_domain:"",cookie_name:"",loaded:Nl,mp_loader:null,track_marketing:!0,track_pageview:!1,skip_first_touch_marketing:!1,store_google:!0,stop_utm_persistence:!1,save_referrer:!0,test:!1,verbose:!1,img:!1,debug:!1,track_links_timeout:300,cookie_expiration:365,upgrade:!1,disable_persistence:!1,disable_cookie:!1,secure_cookie:!1,ip:!0,opt_out_tracking_by_default:!1,opt_out_persistence_by_default:!1,opt_out_tracking_persistence_type:"localStorage",opt_out_tracking_cookie_prefix:null,property_blacklist:[],xhr_headers:{},ignore_dnt:!1,batch_requests:!0,batch_size:50,batch_flush_interval_ms:5e3,batch_request_timeout_ms:9e4,batch_autostart:!0,hooks:{},record_block_class:new RegExp("^(mp-block|fs-exclude|amp-block|rr-block|ph-no-capture)$"),record_block_selector:"img, video",record_idle_timeout_ms:30*60*1e3,record_mask_text_class:new RegExp("^(mp-mask|fs-mask|amp-mask|rr-mask|ph-mask)$"),record_mask_text_selector:"*",record_max_ms:y2,record_sessions_percent:0,recorder_src:"https://cdn.mxpnl.com/libs/mixpanel-recorder.min.js"},py=!1,ce=function(){},Xh=function(t,e,r){var n,i=r===An?wr:wr[r];if(i&&h0===ly)n=i;else{if(i&&!L.isArray(i)){Lt.error("You have already initialized "+r);return}n=new ce}if(n._cached_groups={},n._init(t,e,r),n.people=new st,n.people._init(n),!n.get_config("skip_first_touch_marketing")){var s=L.info.campaignParams(null),o={},f=!1;L.each(s,function(c,d){o["initial_"+d]=c,c&&(f=!0)}),f&&n.people.set_once(o)}return Ui.DEBUG=Ui.DEBUG||n.get_config("debug"),!L.isUndefined(i)&&L.isArray(i)&&(n._execute_array.call(n.people,i.people),n._execute_array(i)),n};ce.prototype.init=function(t,e,r){if(L.isUndefined(r)){this.report_error("You must name your new library: init(token, config, name)");return}if(r===An){this.report_error("You must initialize the main mixpanel object right after you include the Mixpanel js snippet");return}var n=Xh(t,e,r);return wr[r]=n,n._loaded(),n};ce.prototype._init=function(t,e,r){e=e||{},this.__loaded=!0,this.config={};var n={};if(!("api_payload_format"in e)){var i=e.api_host||Gv.api_host;i.match(/\.mixpanel\.com/)&&(n.api_payload_format=W2)}if(this.set_config(L.extend({},Gv,n,e,{name:r,token:t,callback_fn:(r===An?r:An+"."+r)+"._jsc"})),this._jsc=Nl,this.__dom_loaded_queue=[],this.__request_queue=[],this.__disabled_events=[],this._flags={disable_all_events:!1,identify_called:!1},this.request_batchers={},this._batch_requests=this.get_config("batch_requests"),this._batch_requests){if(!L.localStorage.is_supported(!0)||!Qa)this._batch_requests=!1,Lt.log("Turning off Mixpanel request-queueing; needs XHR and localStorage support"),L.each(this.get_batcher_configs(),function(c){Lt.log("Clearing batch queue "+c.queue_key),L.localStorage.remove(c.queue_key)});else if(this.init_batchers(),Vf&&ft.addEventListener){var s=L.bind(function(){this.request_batchers.events.stopped||this.request_batchers.events.flush({unloading:!0})},this);ft.addEventListener("pagehide",function(c){c.persisted&&s()}),ft.addEventListener("visibilitychange",function(){Pt.visibilityState==="hidden"&&s()})}}this.persistence=this.cookie=new pt(this.config),this.unpersisted_superprops={},this._gdpr_init();var o=L.UUID();this.get_distinct_id()||this.register_once({distinct_id:E0+o,$device_id:o},"");var f=this.get_config("track_pageview");f&&this._init_url_change_tracking(f),this.get_config("record_sessions_percent")>0&&Math.random()*100<=this.get_config("record_sessions_percent")&&this.start_session_recording()};ce.prototype.start_session_recording=la(function(){if(!ft.MutationObserver){Lt.critical("Browser does not support MutationObserver; skipping session recording");return}var t=L.bind(function(){this._recorder=this._recorder||new ft.__mp_recorder(this),this._recorder.startRecording()},this);if(L.isUndefined(ft.__mp_recorder)){var e=Pt.createElement("script");e.type="text/javascript",e.async=!0,e.onload=t,e.src=this.get_config("recorder_src"),Pt.head.appendChild(e)}else t()});ce.prototype.stop_session_recording=function(){this._recorder?this._recorder.stopRecording():Lt.critical("Session recorder module not loaded")};ce.prototype.get_session_recording_properties=function(){var t={};if(this._recorder){var e=this._recorder.replayId;e&&(t.$mp_replay_id=e)}return t};ce.prototype._loaded=function(){if(this.get_config("loaded")(this),this._set_default_superprops(),this.people.set_once(this.persistence.get_referrer_info()),this.get_config("store_google")&&this.get_config("stop_utm_persistence")){var t=L.info.campaignParams(null);L.each(t,(function(e,r){this.unregister(r)}).bind(this))}};ce.prototype._set_default_superprops=function(){this.persistence.update_search_keyword(Pt.referrer),this.get_config("store_google")&&!this.get_config("stop_utm_persistence")&&this.register(L.info.campaignParams()),this.get_config("save_referrer")&&this.persistence.update_referrer_info(Pt.referrer)};ce.prototype._dom_loaded=function(){L.each(this.__dom_loaded_queue,function(t){this._track_dom.apply(this,t)},this),this.has_opted_out_tracking()||L.each(this.__request_queue,function(t){this._send_request.apply(this,t)},this),delete this.__dom_loaded_queue,delete this.__request_queue};ce.prototype._track_dom=function(t,e){if(this.get_config("img"))return this.report_error("You can't use DOM tracking functions with img = true."),!1;if(!py)return this.__dom_loaded_queue.push([t,e]),!1;var r=new t().init(this);return r.track.apply(r,e)};ce.prototype._init_url_change_tracking=function(t){var e="",r=this.track_pageview();if(r&&(e=L.info.currentUrl()),L.include(["full-url","url-with-path-and-query-string","url-with-path"],t)){ft.addEventListener("popstate",function(){ft.dispatchEvent(new Event("mp_locationchange"))}),ft.addEventListener("hashchange",function(){ft.dispatchEvent(new Event("mp_locationchange"))});var n=ft.history.pushState;typeof n=="function"&&(ft.history.pushState=function(s,o,f){n.call(ft.history,s,o,f),ft.dispatchEvent(new Event("mp_locationchange"))});var i=ft.history.replaceState;typeof i=="function"&&(ft.history.replaceState=function(s,o,f){i.call(ft.history,s,o,f),ft.dispatchEvent(new Event("mp_locationchange"))}),ft.addEventListener("mp_locationchange",(function(){var s=L.info.currentUrl(),o=!1;if(t==="full-url"?o=s!==e:t==="url-with-path-and-query-string"?o=s.split("#")[0]!==e.split("#")[0]:t==="url-with-path"&&(o=s.split("#")[0].split("?")[0]!==e.split("#")[0].split("?")[0]),o){var f=this.track_pageview();f&&(e=s)}}).bind(this))}};ce.prototype._prepare_callback=function(t,e){if(L.isUndefined(t))return null;if(Qa){var r=function(o){t(o,e)};return r}else{var n=this._jsc,i=""+Math.floor(Math.random()*1e8),s=this.get_config("callback_fn")+"["+i+"]";return n[i]=function(o){delete n[i],t(o,e)},s}};ce.prototype._send_request=function(t,e,r,n){var i=!0;if(fy)return this.__request_queue.push(arguments),i;var s={method:this.get_config("api_method"),transport:this.get_config("api_transport"),verbose:this.get_config("verbose")},o=null;!n&&(L.isFunction(r)||typeof r=="string")&&(n=r,r=null),r=L.extend(s,r||{}),Qa||(r.method="GET");var f=r.method==="POST",c=Vf&&f&&r.transport.toLowerCase()==="sendbeacon",d=r.verbose;e.verbose&&(d=!0),this.get_config("test")&&(e.test=1),d&&(e.verbose=1),this.get_config("img")&&(e.img=1),Qa||(n?e.callback=n:(d||this.get_config("test"))&&(e.callback="(function(){})")),e.ip=this.get_config("ip")?1:0,e._=new Date().getTime().toString(),f&&(o="data="+encodeURIComponent(e.data),delete e.data),t+="?"+L.HTTPBuildQuery(e);var p=this;if("img"in e){var E=Pt.createElement("img");E.src=t,Pt.body.appendChild(E)}else if(c){try{i=Vf(t,o)}catch(S){p.report_error(S),i=!1}try{n&&n(i?1:0)}catch(S){p.report_error(S)}}else if(Qa)try{var m=new XMLHttpRequest;m.open(r.method,t,!0);var g=this.get_config("xhr_headers");if(f&&(g["Content-Type"]="application/x-www-form-urlencoded"),L.each(g,function(S,y){m.setRequestHeader(y,S)}),r.timeout_ms&&typeof m.timeout<"u"){m.timeout=r.timeout_ms;var _=new Date().getTime()}m.withCredentials=!0,m.onreadystatechange=function(){if(m.readyState===4)if(m.status===200){if(n)if(d){var S;try{S=L.JSONDecode(m.responseText)}catch(v){if(p.report_error(v),r.ignore_json_errors)S=m.responseText;else return}n(S)}else n(Number(m.responseText))}else{var y;m.timeout&&!m.status&&new Date().getTime()-_>=m.timeout?y="timeout":y="Bad HTTP status: "+m.status+" "+m.statusText,p.report_error(y),n&&n(d?{status:0,error:y,xhr_req:m}:0)}},m.send(o)}catch(S){p.report_error(S),i=!1}else{var b=Pt.createElement("script");b.type="text/javascript",b.async=!0,b.defer=!0,b.src=t;var x=Pt.getElementsByTagName("script")[0];x.parentNode.insertBefore(b,x)}return i};ce.prototype._execute_array=function(t){var e,r=[],n=[],i=[];L.each(t,function(o){o&&(e=o[0],L.isArray(e)?i.push(o):typeof o=="function"?o.call(this):L.isArray(o)&&e==="alias"?r.push(o):L.isArray(o)&&e.indexOf("track")!==-1&&typeof this[e]=="function"?i.push(o):n.push(o))},this);var s=function(o,f){L.each(o,function(c){if(L.isArray(c[0])){var d=f;L.each(c,function(p){d=d[p[0]].apply(d,p.slice(1))})}else this[c[0]].apply(this,c.slice(1))},f)};s(r,this),s(n,this),s(i,this)};ce.prototype.are_batchers_initialized=function(){return!!this.request_batchers.events};ce.prototype.get_batcher_configs=function(){var t="__mpq_"+this.get_config("token"),e=this.get_config("api_routes");return this._batcher_configs=this._batcher_configs||{events:{type:"events",endpoint:"/"+e.track,queue_key:t+"_ev"},people:{type:"people",endpoint:"/"+e.engage,queue_key:t+"_pp"},groups:{type:"groups",endpoint:"/"+e.groups,queue_key:t+"_gr"}},this._batcher_configs};ce.prototype.init_batchers=function(){if(!this.are_batchers_initialized()){var t=L.bind(function(r){return new fi(r.queue_key,{libConfig:this.config,sendRequestFunc:L.bind(function(n,i,s){this._send_request(this.get_config("api_host")+r.endpoint,this._encode_data_for_request(n),i,this._prepare_callback(s,n))},this),beforeSendHook:L.bind(function(n){return this._run_hook("before_send_"+r.type,n)},this),errorReporter:this.get_config("error_reporter"),stopAllBatchingFunc:L.bind(this.stop_batch_senders,this)})},this),e=this.get_batcher_configs();this.request_batchers={events:t(e.events),people:t(e.people),groups:t(e.groups)}}this.get_config("batch_autostart")&&this.start_batch_senders()};ce.prototype.start_batch_senders=function(){this._batchers_were_started=!0,this.are_batchers_initialized()&&(this._batch_requests=!0,L.each(this.request_batchers,function(t){t.start()}))};ce.prototype.stop_batch_senders=function(){this._batch_requests=!1,L.each(this.request_batchers,function(t){t.stop(),t.clear()})};ce.prototype.push=function(t){this._execute_array([t])};ce.prototype.disable=function(t){typeof t>"u"?this._flags.disable_all_events=!0:this.__disabled_events=this.__disabled_events.concat(t)};ce.prototype._encode_data_for_request=function(t){var e=L.JSONEncode(t);return this.get_config("api_payload_format")===uy&&(e=L.base64Encode(e)),{data:e}};ce.prototype._track_or_batch=function(t,e){var r=L.truncate(t.data,255),n=t.endpoint,i=t.batcher,s=t.should_send_immediately,o=t.send_request_options||{};e=e||Nl;var f=!0,c=L.bind(function(){return o.skip_hooks||(r=this._run_hook("before_send_"+t.type,r)),r?(Lt.log("MIXPANEL REQUEST:"),Lt.log(r),this._send_request(n,this._encode_data_for_request(r),o,this._prepare_callback(e,r))):null},this);return this._batch_requests&&!s?i.enqueue(r,function(d){d?e(1,r):c()}):f=c(),f&&r};ce.prototype.track=la(function(t,e,r,n){!n&&typeof r=="function"&&(n=r,r=null),r=r||{};var i=r.transport;i&&(r.transport=i);var s=r.send_immediately;if(typeof n!="function"&&(n=Nl),L.isUndefined(t)){this.report_error("No event name provided to mixpanel.track");return}if(this._event_is_disabled(t)){n(0);return}e=L.extend({},e),e.token=this.get_config("token");var o=this.persistence.remove_event_timer(t);if(!L.isUndefined(o)){var f=new Date().getTime()-o;e.$duration=parseFloat((f/1e3).toFixed(3))}this._set_default_superprops();var c=this.get_config("track_marketing")?L.info.marketingParams():{};e=L.extend({},L.info.properties({mp_loader:this.get_config("mp_loader")}),c,this.persistence.properties(),this.unpersisted_superprops,this.get_session_recording_properties(),e);var d=this.get_config("property_blacklist");L.isArray(d)?L.each(d,function(m){delete e[m]}):this.report_error("Invalid value for property_blacklist config: "+d);var p={event:t,properties:e},E=this._track_or_batch({type:"events",data:p,endpoint:this.get_config("api_host")+"/"+this.get_config("api_routes").track,batcher:this.request_batchers.events,should_send_immediately:s,send_request_options:r},n);return E});ce.prototype.set_group=la(function(t,e,r){L.isArray(e)||(e=[e]);var n={};return n[t]=e,this.register(n),this.people.set(t,e,r)});ce.prototype.add_group=la(function(t,e,r){var n=this.get_property(t),i={};return n===void 0?(i[t]=[e],this.register(i)):n.indexOf(e)===-1&&(n.push(e),i[t]=n,this.register(i)),this.people.union(t,e,r)});ce.prototype.remove_group=la(function(t,e,r){var n=this.get_property(t);if(n!==void 0){var i=n.indexOf(e);i>-1&&(n.splice(i,1),this.register({group_key:n})),n.length===0&&this.unregister(t)}return this.people.remove(t,e,r)});ce.prototype.track_with_groups=la(function(t,e,r,n){var i=L.extend({},e||{});return L.each(r,function(s,o){s!=null&&(i[o]=s)}),this.track(t,i,n)});ce.prototype._create_map_key=function(t,e){return t+"_"+JSON.stringify(e)};ce.prototype._remove_group_from_cache=function(t,e){delete this._cached_groups[this._create_map_key(t,e)]};ce.prototype.get_group=function(t,e){var r=this._create_map_key(t,e),n=this._cached_groups[r];return(n===void 0||n._group_key!==t||n._group_id!==e)&&(n=new jt,n._init(this,t,e),this._cached_groups[r]=n),n};ce.prototype.track_pageview=la(function(t,e){typeof t!="object"&&(t={}),e=e||{};var r=e.event_name||"$mp_web_page_view",n=L.extend(L.info.mpPageViewProperties(),L.info.campaignParams(),L.info.clickParams()),i=L.extend({},n,t);return this.track(r,i)});ce.prototype.track_links=function(){return this._track_dom.call(this,ho,arguments)};ce.prototype.track_forms=function(){return this._track_dom.call(this,Lc,arguments)};ce.prototype.time_event=function(t){if(L.isUndefined(t)){this.report_error("No event name provided to mixpanel.time_event");return}this._event_is_disabled(t)||this.persistence.set_event_timer(t,new Date().getTime())};var X2={persistent:!0},m0=function(t){var e;return L.isObject(t)?e=t:L.isUndefined(t)?e={}:e={days:t},L.extend({},X2,e)};ce.prototype.register=function(t,e){var r=m0(e);r.persistent?this.persistence.register(t,r.days):L.extend(this.unpersisted_superprops,t)};ce.prototype.register_once=function(t,e,r){var n=m0(r);n.persistent?this.persistence.register_once(t,e,n.days):(typeof e>"u"&&(e="None"),L.each(t,function(i,s){(!this.unpersisted_superprops.hasOwnProperty(s)||this.unpersisted_superprops[s]===e)&&(this.unpersisted_superprops[s]=i)},this))};ce.prototype.unregister=function(t,e){e=m0(e),e.persistent?this.persistence.unregister(t):delete this.unpersisted_superprops[t]};ce.prototype._register_single=function(t,e){var r={};r[t]=e,this.register(r)};ce.prototype.identify=function(t,e,r,n,i,s,o,f){var c=this.get_distinct_id();if(t&&c!==t){if(typeof t=="string"&&t.indexOf(E0)===0)return this.report_error("distinct_id cannot have $device: prefix"),-1;this.register({$user_id:t})}if(!this.get_property("$device_id")){var d=c;this.register_once({$had_persisted_distinct_id:!0,$device_id:d},"")}t!==c&&t!==this.get_property(Gf)&&(this.unregister(Gf),this.register({distinct_id:t})),this._flags.identify_called=!0,this.people._flush(e,r,n,i,s,o,f),t!==c&&this.track("$identify",{distinct_id:t,$anon_distinct_id:c},{skip_hooks:!0})};ce.prototype.reset=function(){this.persistence.clear(),this._flags.identify_called=!1;var t=L.UUID();this.register_once({distinct_id:E0+t,$device_id:t},"")};ce.prototype.get_distinct_id=function(){return this.get_property("distinct_id")};ce.prototype.alias=function(t,e){if(t===this.get_property(oy))return this.report_error("Attempting to create alias for existing People user - aborting."),-2;var r=this;return L.isUndefined(e)&&(e=this.get_distinct_id()),t!==e?(this._register_single(Gf,t),this.track("$create_alias",{alias:t,distinct_id:e},{skip_hooks:!0},function(){r.identify(t)})):(this.report_error("alias matches current distinct_id - skipping api call."),this.identify(t),-1)};ce.prototype.name_tag=function(t){this._register_single("mp_name_tag",t)};ce.prototype.set_config=function(t){if(L.isObject(t)){L.extend(this.config,t);var e=t.batch_size;e&&L.each(this.request_batchers,function(r){r.resetBatchSize()}),this.get_config("persistence_name")||(this.config.persistence_name=this.config.cookie_name),this.get_config("disable_persistence")||(this.config.disable_persistence=this.config.disable_cookie),this.persistence&&this.persistence.update_config(this.config),Ui.DEBUG=Ui.DEBUG||this.get_config("debug")}};ce.prototype.get_config=function(t){return this.config[t]};ce.prototype._run_hook=function(t){var e=(this.config.hooks[t]||H2).apply(this,os.call(arguments,1));return typeof e>"u"&&(this.report_error(t+" hook did not return a value"),e=null),e};ce.prototype.get_property=function(t){return this.persistence.load_prop([t])};ce.prototype.toString=function(){var t=this.get_config("name");return t!==An&&(t=An+"."+t),t};ce.prototype._event_is_disabled=function(t){return L.isBlockedUA(Zn)||this._flags.disable_all_events||L.include(this.__disabled_events,t)};ce.prototype._gdpr_init=function(){var t=this.get_config("opt_out_tracking_persistence_type")==="localStorage";t&&L.localStorage.is_supported()&&(!this.has_opted_in_tracking()&&this.has_opted_in_tracking({persistence_type:"cookie"})&&this.opt_in_tracking({enable_persistence:!1}),!this.has_opted_out_tracking()&&this.has_opted_out_tracking({persistence_type:"cookie"})&&this.opt_out_tracking({clear_persistence:!1}),this.clear_opt_in_out_tracking({persistence_type:"cookie",enable_persistence:!1})),this.has_opted_out_tracking()?this._gdpr_update_persistence({clear_persistence:!0}):!this.has_opted_in_tracking()&&(this.get_config("opt_out_tracking_by_default")||L.cookie.get("mp_optout"))&&(L.cookie.remove("mp_optout"),this.opt_out_tracking({clear_persistence:this.get_config("opt_out_persistence_by_default")}))};ce.prototype._gdpr_update_persistence=function(t){var e;if(t&&t.clear_persistence)e=!0;else if(t&&t.enable_persistence)e=!1;else return;!this.get_config("disable_persistence")&&this.persistence.disabled!==e&&this.persistence.set_disabled(e),e?this.stop_batch_senders():this._batchers_were_started&&this.start_batch_senders()};ce.prototype._gdpr_call_func=function(t,e){return e=L.extend({track:L.bind(this.track,this),persistence_type:this.get_config("opt_out_tracking_persistence_type"),cookie_prefix:this.get_config("opt_out_tracking_cookie_prefix"),cookie_expiration:this.get_config("cookie_expiration"),cross_site_cookie:this.get_config("cross_site_cookie"),cross_subdomain_cookie:this.get_config("cross_subdomain_cookie"),cookie_domain:this.get_config("cookie_domain"),secure_cookie:this.get_config("secure_cookie"),ignore_dnt:this.get_config("ignore_dnt")},e),L.localStorage.is_supported()||(e.persistence_type="cookie"),t(this.get_config("token"),{track:e.track,trackEventName:e.track_event_name,trackProperties:e.track_properties,persistenceType:e.persistence_type,persistencePrefix:e.cookie_prefix,cookieDomain:e.cookie_domain,cookieExpiration:e.cookie_expiration,crossSiteCookie:e.cross_site_cookie,crossSubdomainCookie:e.cross_subdomain_cookie,secureCookie:e.secure_cookie,ignoreDnt:e.ignore_dnt})};ce.prototype.opt_in_tracking=function(t){t=L.extend({enable_persistence:!0},t),this._gdpr_call_func(B2,t),this._gdpr_update_persistence(t)};ce.prototype.opt_out_tracking=function(t){t=L.extend({clear_persistence:!0,delete_user:!0},t),t.delete_user&&this.people&&this.people._identify_called()&&(this.people.delete_user(),this.people.clear_charges()),this._gdpr_call_func(M2,t),this._gdpr_update_persistence(t)};ce.prototype.has_opted_in_tracking=function(t){return this._gdpr_call_func($2,t)};ce.prototype.has_opted_out_tracking=function(t){return this._gdpr_call_func(ny,t)};ce.prototype.clear_opt_in_out_tracking=function(t){t=L.extend({enable_persistence:!0},t),this._gdpr_call_func(K2,t),this._gdpr_update_persistence(t)};ce.prototype.report_error=function(t,e){Lt.error.apply(Lt.error,arguments);try{!e&&!(t instanceof Error)&&(t=new Error(t)),this.get_config("error_reporter")(t,e)}catch(r){Lt.error(r)}};ce.prototype.init=ce.prototype.init;ce.prototype.reset=ce.prototype.reset;ce.prototype.disable=ce.prototype.disable;ce.prototype.time_event=ce.prototype.time_event;ce.prototype.track=ce.prototype.track;ce.prototype.track_links=ce.prototype.track_links;ce.prototype.track_forms=ce.prototype.track_forms;ce.prototype.track_pageview=ce.prototype.track_pageview;ce.prototype.register=ce.prototype.register;ce.prototype.register_once=ce.prototype.register_once;ce.prototype.unregister=ce.prototype.unregister;ce.prototype.identify=ce.prototype.identify;ce.prototype.alias=ce.prototype.alias;ce.prototype.name_tag=ce.prototype.name_tag;ce.prototype.set_config=ce.prototype.set_config;ce.prototype.get_config=ce.prototype.get_config;ce.prototype.get_property=ce.prototype.get_property;ce.prototype.get_distinct_id=ce.prototype.get_distinct_id;ce.prototype.toString=ce.prototype.toString;ce.prototype.opt_out_tracking=ce.prototype.opt_out_tracking;ce.prototype.opt_in_tracking=ce.prototype.opt_in_tracking;ce.prototype.has_opted_out_tracking=ce.prototype.has_opted_out_tracking;ce.prototype.has_opted_in_tracking=ce.prototype.has_opted_in_tracking;ce.prototype.clear_opt_in_out_tracking=ce.prototype.clear_opt_in_out_tracking;ce.prototype.get_group=ce.prototype.get_group;ce.prototype.set_group=ce.prototype.set_group;ce.prototype.add_group=ce.prototype.add_group;ce.prototype.remove_group=ce.prototype.remove_group;ce.prototype.track_with_groups=ce.prototype.track_with_groups;ce.prototype.start_batch_senders=ce.prototype.start_batch_senders;ce.prototype.stop_batch_senders=ce.prototype.stop_batch_senders;ce.prototype.start_session_recording=ce.prototype.start_session_recording;ce.prototype.stop_session_recording=ce.prototype.stop_session_recording;ce.prototype.get_session_recording_properties=ce.prototype.get_session_recording_properties;ce.prototype.DEFAULT_API_ROUTES=cy;pt.prototype.properties=pt.prototype.properties;pt.prototype.update_search_keyword=pt.prototype.update_search_keyword;pt.prototype.update_referrer_info=pt.prototype.update_referrer_info;pt.prototype.get_cross_subdomain=pt.prototype.get_cross_subdomain;pt.prototype.clear=pt.prototype.clear;var Ga={},j2=function(){L.each(Ga,function(t,e){e!==An&&(wr[e]=t)}),wr._=L},z2=function(){wr.init=function(t,e,r){if(r)return wr[r]||(wr[r]=Ga[r]=Xh(t,e,r),wr[r]._loaded()),wr[r];var n=wr;Ga[An]?n=Ga[An]:t&&(n=Xh(t,e,An),n._loaded(),Ga[An]=n),wr=n,h0===F2&&(ft[An]=wr),j2()}},q2=function(){function t(){t.done||(t.done=!0,py=!0,fy=!1,L.each(Ga,function(n){n._dom_loaded()}))}function e(){try{Pt.documentElement.doScroll("left")}catch{setTimeout(e,1);return}t()}if(Pt.addEventListener)Pt.readyState==="complete"?t():Pt.addEventListener("DOMContentLoaded",t,!1);else if(Pt.attachEvent){Pt.attachEvent("onreadystatechange",t);var r=!1;try{r=ft.frameElement===null}catch{}Pt.documentElement.doScroll&&r&&e()}L.register_event(ft,"load",t,!0)};function Y2(){return h0=ly,wr=new ce,z2(),wr.init(),q2(),wr}var J2=Y2(),Q2=J2;const Vv=Sc(Q2);class aa{static setup(){this.isSetup=!0,gtag("config","G-V1QJVQMYF1",{send_page_view:!1}),Vv.init("2e284873b7269f13b850ac994abfd848",{debug:"false"})}static ga(e,r){this.isSetup||this.setup(),gtag("event",e,r)}static mp(e,r){this.isSetup||this.setup(),Vv.track(e,r)}static pageView(e){this.ga("page_view",{page_title:e,page_location:`https://jackbox.tv/${e}`})}static gameStarted(e,r){const n={tag:e};r.isUGC!==void 0&&(n.is_ugc=r.isUGC),r.isSequel!==void 0&&(n.is_sequel=r.isSequel),r.locale!==void 0&&(n.locale=r.locale),r.mode!==void 0&&(n.mode=r.mode),r.numberOfPlayer!==void 0&&(n.number_of_players=r.numberOfPlayer),this.ga("game_start",n)}static gameJoined(e,r){this.mp("Game Joined",{tag:e,...r})}static bannerClick(e,r){this.ga("banner_click",{url:e,location:r})}static externalLinkClick(e,r){this.ga("external_link_click",{url:e,location:r})}static moderatorConnected(e){this.ga("moderator_connected",{tag:e}),this.mp("Moderator Connected",{tag:e})}static itemModerated(e,r){this.ga("item_moderated",{tag:e,was_rejected:r}),this.mp("Moderator Item",{tag:e,wasRejected:r})}static playerKicked(e,r){this.ga("player_kicked",{tag:e,is_lobby:r}),this.mp("Moderator Kick",{tag:e,isLobby:r})}static galleryImpression(e,r){this.ga("gallery_impression",{category_id:e,location:r})}static galleryClick(e,r){this.ga("gallery_click",{category_id:e,location:r}),this.mp("Gallery Click",{categoryId:e,location:r})}static galleryAddToCart(e,r){this.mp("Gallery Add To Cart",{categoryId:e,...r})}static galleryCheckout(e,r){this.mp("Gallery Checkout",{categoryId:e,...r})}static galleryShare(e,r){this.mp("Gallery Share",{categoryId:e,...r})}static galleryWatch(e,r){this.mp("Gallery Watch",{categoryId:e,...r})}static galleryDownload(e,r){this.mp("Gallery Download",{categoryId:e,...r})}}Wn(aa,"isSetup",!1);const Z2=[{name:"Prototype",tag:"prototype",wrapper:"vue",isPublic:!0,directory:"internal/prototype"},{name:"EcastTestClient",tag:"ecast-test-client",wrapper:"marionette",isPublic:!0,directory:"internal/ecast-test-client"},{name:"Quiplash 3",tag:"quiplash3-tjsp",wrapper:"vue",isPublic:!0,directory:"tjsp/quiplash3",features:["moderation"],categoryId:"quiplash3Game"},{name:"Tee K.O.",tag:"awshirt-tjsp",wrapper:"vue",isPublic:!0,directory:"tjsp/awshirt",features:["moderation"],shopItems:["shirts"],categoryId:"TeeKOGame",galleryId:"teeko"},{name:"Trivia Murder Party 2",tag:"triviadeath2-tjsp",wrapper:"vue",isPublic:!0,directory:"tjsp/triviadeath2",categoryId:"TriviaMurderParty2Game"},{name:"Quiplash 2 InterLASHional",tag:"quiplash2-international",wrapper:"marionette",isPublic:!0,directory:"standalone/quiplash2-international",categoryId:"quiplash2-internationalGame"},{name:"Guesspionage Crowdplay",tag:"guesspionage-crowdplay",wrapper:"marionette",isPublic:!0,directory:"standalone/guesspionage-crowdplay"},{name:"Drawful 2",tag:"drawful2",wrapper:"marionette",isPublic:!0,directory:"standalone/drawful2",categoryId:"DrawfulGame",shopItems:["shirts"]},{name:"Drawful 2",tag:"drawful2international",wrapper:"marionette",isPublic:!0,directory:"standalone/drawful2-international",features:["moderation"]},{name:"Acquisitions, Inc.",tag:"acquisitions-inc",wrapper:"marionette",isPublic:!0,directory:"standalone/acquisitions-inc"},{name:"The Jackbox Survey Scramble",tag:"bigsurvey",wrapper:"vue",isPublic:!0,directory:"standalone/bigsurvey",features:["moderation","kicking","dropInDropOut"],categoryId:"BigSurveyGame",galleryId:"survey-scramble"},{name:"You Don't Know Jack 2015",tag:"ydkj2015",wrapper:"marionette",isPublic:!0,directory:"pp1/ydkj2015"},{name:"Drawful",tag:"drawful",wrapper:"marionette",isPublic:!0,directory:"pp1/drawful"},{name:"Word Spud",tag:"wordspud",wrapper:"marionette",isPublic:!0,directory:"pp1/wordspud"},{name:"Lie Swatter",tag:"lieswatter",wrapper:"marionette",isPublic:!0,directory:"pp1/lieswatter"},{name:"Fibbage",tag:"fibbage",wrapper:"marionette",isPublic:!0,directory:"pp1/fibbage"},{name:"Fibbage 2",tag:"fibbage2",wrapper:"marionette",isPublic:!0,directory:"pp2/fibbage2"},{name:"Earwax",tag:"earwax",wrapper:"marionette",isPublic:!0,directory:"pp2/earwax"},{name:"Bidiots",tag:"auction",wrapper:"marionette",isPublic:!0,directory:"pp2/auction"},{name:"Bomb Corp",tag:"bombintern",wrapper:"marionette",isPublic:!0,directory:"pp2/bombintern"},{name:"Quiplash",tag:"quiplash",wrapper:"marionette",isPublic:!0,directory:"pp2/quiplash"},{name:"Fakin' It",tag:"fakinit",wrapper:"marionette",isPublic:!0,directory:"pp3/fakinit"},{name:"Tee K.O.",tag:"awshirt",wrapper:"marionette",isPublic:!0,directory:"pp3/awshirt",shopItems:["shirts"],galleryId:"teeko"},{name:"Quiplash 2",tag:"quiplash2",wrapper:"marionette",isPublic:!0,directory:"pp3/quiplash2",categoryId:"Quiplash2Game"},{name:"Trivia Murder Party",tag:"triviadeath",wrapper:"marionette",isPublic:!0,directory:"pp3/triviadeath",categoryId:"TriviaDeathResults"},{name:"Guesspionage",tag:"pollposition",wrapper:"marionette",isPublic:!0,directory:"pp3/pollposition"},{name:"Fibbage 3",tag:"fibbage3",wrapper:"marionette",isPublic:!0,directory:"pp4/fibbage3"},{name:"Survive the Internet",tag:"survivetheinternet",wrapper:"marionette",isPublic:!0,directory:"pp4/survivetheinternet",categoryId:"STIGame"},{name:"Monster Seeking Monster",tag:"monstermingle",wrapper:"marionette",isPublic:!0,directory:"pp4/monstermingle",categoryId:"MonsterMingleGame"},{name:"Bracketeering",tag:"bracketeering",wrapper:"marionette",isPublic:!0,directory:"pp4/bracketeering",categoryId:"BRKGame"},{name:"Civic Doodle",tag:"overdrawn",wrapper:"marionette",isPublic:!0,directory:"pp4/overdrawn",categoryId:"OverdrawnGame",shopItems:["shirts"]},{name:"You Don't Know Jack: Full Stream",tag:"ydkj2018",wrapper:"marionette",isPublic:!0,directory:"pp5/ydkj2018",categoryId:"YDKJ2018Game"},{name:"Split the Room",tag:"splittheroom",wrapper:"marionette",isPublic:!0,directory:"pp5/splittheroom",categoryId:"SplitTheRoomGame"},{name:"Mad Verse City",tag:"rapbattle",wrapper:"marionette",isPublic:!0,directory:"pp5/rapbattle",categoryId:"RapBattleGame"},{name:"Zeeple Dome",tag:"slingshoot",wrapper:"marionette",isPublic:!0,directory:"pp5/slingshoot",categoryId:"SlingShootGame"},{name:"Patently Stupid",tag:"patentlystupid",wrapper:"marionette",isPublic:!0,directory:"pp5/patentlystupid",categoryId:"PatentlyStupidGame",shopItems:["mugs"]},{name:"Trivia Murder Party 2",tag:"triviadeath2",wrapper:"marionette",isPublic:!0,directory:"pp6/triviadeath2",categoryId:"TriviaDeath2Game"},{name:"Role Models",tag:"rolemodels",wrapper:"marionette",isPublic:!0,features:["camera"],directory:"pp6/rolemodels",categoryId:"RoleModelsGame",shopItems:["shirts"]},{name:"Joke Boat",tag:"jokeboat",wrapper:"marionette",isPublic:!0,directory:"pp6/jokeboat",categoryId:"JokeboatGame"},{name:"Dictionarium",tag:"ridictionary",wrapper:"marionette",isPublic:!0,directory:"pp6/ridictionary",categoryId:"RidictionaryGame"},{name:"Push the Button",tag:"pushthebutton",wrapper:"marionette",isPublic:!0,directory:"pp6/pushthebutton",categoryId:"PushTheButtonGame"},{name:"Talking Points",tag:"jackbox-talks",wrapper:"marionette",isPublic:!0,directory:"pp7/jackboxtalks",features:["camera","moderation"],categoryId:"JackboxTalksGame"},{name:"Quiplash 3",tag:"quiplash3",wrapper:"marionette",isPublic:!0,directory:"pp7/quiplash3",features:["moderation"],categoryId:"quiplash3Game"},{name:"The Devils and the Details",tag:"everyday",wrapper:"marionette",isPublic:!0,directory:"pp7/everyday",categoryId:"EverydayGame",shopItems:["mugs"]},{name:"Champ'd Up",tag:"worldchamps",wrapper:"marionette",isPublic:!0,directory:"pp7/worldchamps",features:["moderation"],categoryId:"WorldChampionsGame",shopItems:["cards"]},{name:"Blather 'Round",tag:"blanky-blank",wrapper:"marionette",isPublic:!0,directory:"pp7/blanky-blank",categoryId:"BlankyBlankGame"},{name:"Job Job",tag:"apply-yourself",wrapper:"vue",isPublic:!0,directory:"pp8/apply-yourself",categoryId:"JobGameGame",features:["moderation","previews"]},{name:"Drawful Animate",tag:"drawful-animate",wrapper:"vue",isPublic:!0,directory:"pp8/drawful-animate",categoryId:"DrawfulAnimateGame",features:["moderation"]},{name:"The Wheel of Enormous Proportions",tag:"the-wheel",wrapper:"vue",isPublic:!0,directory:"pp8/the-wheel",categoryId:"TheWheelGame"},{name:"The Poll Mine",tag:"survey-bomb",wrapper:"vue",isPublic:!0,directory:"pp8/survey-bomb",categoryId:"SurveyBombGame"},{name:"Weapons Drawn",tag:"murder-detectives",wrapper:"vue",isPublic:!0,directory:"pp8/murder-detectives",categoryId:"MurderDetectivesGame",features:["moderation"]},{name:"Fibbage 4",tag:"fourbage",wrapper:"vue",isPublic:!0,directory:"pp9/fourbage",features:["moderation","kicking"],categoryId:"Fibbage4Game"},{name:"Roomerang",tag:"htmf",wrapper:"vue",isPublic:!0,directory:"pp9/htmf",features:["moderation","kicking"],categoryId:"MakeFriendsGame"},{name:"Junktopia",tag:"antique-freak",wrapper:"vue",isPublic:!0,directory:"pp9/antique-freak",features:["moderation","kicking"],categoryId:"AntiqueGameGame"},{name:"Nonsensory",tag:"range-game",wrapper:"vue",isPublic:!0,directory:"pp9/range-game",features:["moderation","kicking"],categoryId:"RangeGameGame"},{name:"Quixort",tag:"lineup",wrapper:"vue",isPublic:!0,directory:"pp9/lineup",features:["kicking","previews"],categoryId:"LineupGame"},{name:"Tee K.O. 2",tag:"awshirt2",wrapper:"vue",isPublic:!0,directory:"pp10/awshirt2",features:["moderation","kicking"],shopItems:["shirts"],categoryId:"TeeKO2Game",galleryId:"teeko2"},{name:"Dodo Re Mi",tag:"nopus-opus",wrapper:"vue",isPublic:!0,directory:"pp10/nopus-opus",features:["dropInDropOut","kicking"],categoryId:"NopusOpusGame",galleryId:"dodo-re-mi"},{name:"FixyText",tag:"risky-text",wrapper:"vue",isPublic:!0,directory:"pp10/risky-text",features:["moderation","kicking"],categoryId:"FixyTextGame",galleryId:"fixytext"},{name:"Timejinx",tag:"time-trivia",wrapper:"vue",isPublic:!0,directory:"pp10/time-trivia",features:["kicking"],categoryId:"TimeTriviaGame",galleryId:"timejinx"},{name:"Hypnotorious",tag:"us-them",wrapper:"vue",isPublic:!0,directory:"pp10/us-them",features:["moderation","kicking"],categoryId:"StrangersGame",galleryId:"hypnotorious"},{name:"Fakin' It All Night Long",tag:"fakinit2",wrapper:"vue",isPublic:!0,directory:"ppad/fakinit2",features:["moderation","kicking"],categoryId:"FakinIt2Game",galleryId:"fakin-it-all-night-long"},{name:"Dirty Drawful",tag:"drawful3",wrapper:"vue",isPublic:!0,directory:"ppad/drawful3",features:["moderation","kicking"],categoryId:"Drawful3Game",galleryId:"dirty-drawful"},{name:"Let Me Finish",tag:"captcha",wrapper:"vue",isPublic:!0,directory:"ppad/captcha",features:["moderation","kicking"],categoryId:"CAPTCHAGame",galleryId:"let-me-finish"}];let eG=[];const tG=[...Z2,...eG],Fl=t=>{var r;return(((r=window==null?void 0:window.tv)==null?void 0:r.games)||tG).find(n=>n.tag===t||n.galleryId===t||n.categoryId===t)};function rG(){this.__data__=[],this.size=0}var nG=rG;function iG(t,e){return t===e||t!==t&&e!==e}var Cc=iG,sG=Cc;function aG(t,e){for(var r=t.length;r--;)if(sG(t[r][0],e))return r;return-1}var wc=aG,oG=wc,lG=Array.prototype,uG=lG.splice;function fG(t){var e=this.__data__,r=oG(e,t);if(r<0)return!1;var n=e.length-1;return r==n?e.pop():uG.call(e,r,1),--this.size,!0}var cG=fG,pG=wc;function dG(t){var e=this.__data__,r=pG(e,t);return r<0?void 0:e[r][1]}var hG=dG,EG=wc;function mG(t){return EG(this.__data__,t)>-1}var gG=mG,_G=wc;function TG(t,e){var r=this.__data__,n=_G(r,t);return n<0?(++this.size,r.push([t,e])):r[n][1]=e,this}var vG=TG,bG=nG,xG=cG,RG=hG,SG=gG,yG=vG;function So(t){var e=-1,r=t==null?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}So.prototype.clear=bG;So.prototype.delete=xG;So.prototype.get=RG;So.prototype.has=SG;So.prototype.set=yG;var Oc=So,AG=Oc;function LG(){this.__data__=new AG,this.size=0}var CG=LG;function wG(t){var e=this.__data__,r=e.delete(t);return this.size=e.size,r}var OG=wG;function IG(t){return this.__data__.get(t)}var NG=IG;function PG(t){return this.__data__.has(t)}var UG=PG,DG=typeof Ut=="object"&&Ut&&Ut.Object===Object&&Ut,dy=DG,BG=dy,MG=typeof self=="object"&&self&&self.Object===Object&&self,$G=BG||MG||Function("return this")(),ci=$G,KG=ci,kG=KG.Symbol,Ic=kG,Fv=Ic,hy=Object.prototype,GG=hy.hasOwnProperty,VG=hy.toString,Zo=Fv?Fv.toStringTag:void 0;function FG(t){var e=GG.call(t,Zo),r=t[Zo];try{t[Zo]=void 0;var n=!0}catch{}var i=VG.call(t);return n&&(e?t[Zo]=r:delete t[Zo]),i}var HG=FG,WG=Object.prototype,XG=WG.toString;function jG(t){return XG.call(t)}var zG=jG,Hv=Ic,qG=HG,YG=zG,JG="[object Null]",QG="[object Undefined]",Wv=Hv?Hv.toStringTag:void 0;function ZG(t){return t==null?t===void 0?QG:JG:Wv&&Wv in Object(t)?qG(t):YG(t)}var yo=ZG;function e3(t){var e=typeof t;return t!=null&&(e=="object"||e=="function")}var ua=e3,t3=yo,r3=ua,n3="[object AsyncFunction]",i3="[object Function]",s3="[object GeneratorFunction]",a3="[object Proxy]";function o3(t){if(!r3(t))return!1;var e=t3(t);return e==i3||e==s3||e==n3||e==a3}var g0=o3,l3=ci,u3=l3["__core-js_shared__"],f3=u3,wd=f3,Xv=function(){var t=/[^.]+$/.exec(wd&&wd.keys&&wd.keys.IE_PROTO||"");return t?"Symbol(src)_1."+t:""}();function c3(t){return!!Xv&&Xv in t}var p3=c3,d3=Function.prototype,h3=d3.toString;function E3(t){if(t!=null){try{return h3.call(t)}catch{}try{return t+""}catch{}}return""}var Ey=E3,m3=g0,g3=p3,_3=ua,T3=Ey,v3=/[\\^$.*+?()[\]{}|]/g,b3=/^\[object .+?Constructor\]$/,x3=Function.prototype,R3=Object.prototype,S3=x3.toString,y3=R3.hasOwnProperty,A3=RegExp("^"+S3.call(y3).replace(v3,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$");function L3(t){if(!_3(t)||g3(t))return!1;var e=m3(t)?A3:b3;return e.test(T3(t))}var C3=L3;function w3(t,e){return t==null?void 0:t[e]}var O3=w3,I3=C3,N3=O3;function P3(t,e){var r=N3(t,e);return I3(r)?r:void 0}var fa=P3,U3=fa,D3=ci,B3=U3(D3,"Map"),_0=B3,M3=fa,$3=M3(Object,"create"),Nc=$3,jv=Nc;function K3(){this.__data__=jv?jv(null):{},this.size=0}var k3=K3;function G3(t){var e=this.has(t)&&delete this.__data__[t];return this.size-=e?1:0,e}var V3=G3,F3=Nc,H3="__lodash_hash_undefined__",W3=Object.prototype,X3=W3.hasOwnProperty;function j3(t){var e=this.__data__;if(F3){var r=e[t];return r===H3?void 0:r}return X3.call(e,t)?e[t]:void 0}var z3=j3,q3=Nc,Y3=Object.prototype,J3=Y3.hasOwnProperty;function Q3(t){var e=this.__data__;return q3?e[t]!==void 0:J3.call(e,t)}var Z3=Q3,eV=Nc,tV="__lodash_hash_undefined__";function rV(t,e){var r=this.__data__;return this.size+=this.has(t)?0:1,r[t]=eV&&e===void 0?tV:e,this}var nV=rV,iV=k3,sV=V3,aV=z3,oV=Z3,lV=nV;function Ao(t){var e=-1,r=t==null?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}Ao.prototype.clear=iV;Ao.prototype.delete=sV;Ao.prototype.get=aV;Ao.prototype.has=oV;Ao.prototype.set=lV;var uV=Ao,zv=uV,fV=Oc,cV=_0;function pV(){this.size=0,this.__data__={hash:new zv,map:new(cV||fV),string:new zv}}var dV=pV;function hV(t){var e=typeof t;return e=="string"||e=="number"||e=="symbol"||e=="boolean"?t!=="__proto__":t===null}var EV=hV,mV=EV;function gV(t,e){var r=t.__data__;return mV(e)?r[typeof e=="string"?"string":"hash"]:r.map}var Pc=gV,_V=Pc;function TV(t){var e=_V(this,t).delete(t);return this.size-=e?1:0,e}var vV=TV,bV=Pc;function xV(t){return bV(this,t).get(t)}var RV=xV,SV=Pc;function yV(t){return SV(this,t).has(t)}var AV=yV,LV=Pc;function CV(t,e){var r=LV(this,t),n=r.size;return r.set(t,e),this.size+=r.size==n?0:1,this}var wV=CV,OV=dV,IV=vV,NV=RV,PV=AV,UV=wV;function Lo(t){var e=-1,r=t==null?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}Lo.prototype.clear=OV;Lo.prototype.delete=IV;Lo.prototype.get=NV;Lo.prototype.has=PV;Lo.prototype.set=UV;var my=Lo,DV=Oc,BV=_0,MV=my,$V=200;function KV(t,e){var r=this.__data__;if(r instanceof DV){var n=r.__data__;if(!BV||n.length<$V-1)return n.push([t,e]),this.size=++r.size,this;r=this.__data__=new MV(n)}return r.set(t,e),this.size=r.size,this}var kV=KV,GV=Oc,VV=CG,FV=OG,HV=NG,WV=UG,XV=kV;function Co(t){var e=this.__data__=new GV(t);this.size=e.size}Co.prototype.clear=VV;Co.prototype.delete=FV;Co.prototype.get=HV;Co.prototype.has=WV;Co.prototype.set=XV;var jV=Co,zV=fa,qV=function(){try{var t=zV(Object,"defineProperty");return t({},"",{}),t}catch{}}(),gy=qV,qv=gy;function YV(t,e,r){e=="__proto__"&&qv?qv(t,e,{configurable:!0,enumerable:!0,value:r,writable:!0}):t[e]=r}var T0=YV,JV=T0,QV=Cc;function ZV(t,e,r){(r!==void 0&&!QV(t[e],r)||r===void 0&&!(e in t))&&JV(t,e,r)}var _y=ZV;function e4(t){return function(e,r,n){for(var i=-1,s=Object(e),o=n(e),f=o.length;f--;){var c=o[t?f:++i];if(r(s[c],c,s)===!1)break}return e}}var t4=e4,r4=t4,n4=r4(),i4=n4,Ff={exports:{}};Ff.exports;(function(t,e){var r=ci,n=e&&!e.nodeType&&e,i=n&&!0&&t&&!t.nodeType&&t,s=i&&i.exports===n,o=s?r.Buffer:void 0,f=o?o.allocUnsafe:void 0;function c(d,p){if(p)return d.slice();var E=d.length,m=f?f(E):new d.constructor(E);return d.copy(m),m}t.exports=c})(Ff,Ff.exports);var s4=Ff.exports,a4=ci,o4=a4.Uint8Array,l4=o4,Yv=l4;function u4(t){var e=new t.constructor(t.byteLength);return new Yv(e).set(new Yv(t)),e}var f4=u4,c4=f4;function p4(t,e){var r=e?c4(t.buffer):t.buffer;return new t.constructor(r,t.byteOffset,t.length)}var d4=p4;function h4(t,e){var r=-1,n=t.length;for(e||(e=Array(n));++r<n;)e[r]=t[r];return e}var E4=h4,m4=ua,Jv=Object.create,g4=function(){function t(){}return function(e){if(!m4(e))return{};if(Jv)return Jv(e);t.prototype=e;var r=new t;return t.prototype=void 0,r}}(),_4=g4;function T4(t,e){return function(r){return t(e(r))}}var Ty=T4,v4=Ty,b4=v4(Object.getPrototypeOf,Object),vy=b4,x4=Object.prototype;function R4(t){var e=t&&t.constructor,r=typeof e=="function"&&e.prototype||x4;return t===r}var v0=R4,S4=_4,y4=vy,A4=v0;function L4(t){return typeof t.constructor=="function"&&!A4(t)?S4(y4(t)):{}}var C4=L4;function w4(t){return t!=null&&typeof t=="object"}var wo=w4,O4=yo,I4=wo,N4="[object Arguments]";function P4(t){return I4(t)&&O4(t)==N4}var U4=P4,Qv=U4,D4=wo,by=Object.prototype,B4=by.hasOwnProperty,M4=by.propertyIsEnumerable,$4=Qv(function(){return arguments}())?Qv:function(t){return D4(t)&&B4.call(t,"callee")&&!M4.call(t,"callee")},xy=$4,K4=Array.isArray,Oo=K4,k4=9007199254740991;function G4(t){return typeof t=="number"&&t>-1&&t%1==0&&t<=k4}var Ry=G4,V4=g0,F4=Ry;function H4(t){return t!=null&&F4(t.length)&&!V4(t)}var Uc=H4,W4=Uc,X4=wo;function j4(t){return X4(t)&&W4(t)}var z4=j4,Hf={exports:{}};function q4(){return!1}var Y4=q4;Hf.exports;(function(t,e){var r=ci,n=Y4,i=e&&!e.nodeType&&e,s=i&&!0&&t&&!t.nodeType&&t,o=s&&s.exports===i,f=o?r.Buffer:void 0,c=f?f.isBuffer:void 0,d=c||n;t.exports=d})(Hf,Hf.exports);var Sy=Hf.exports,J4=yo,Q4=vy,Z4=wo,e8="[object Object]",t8=Function.prototype,r8=Object.prototype,yy=t8.toString,n8=r8.hasOwnProperty,i8=yy.call(Object);function s8(t){if(!Z4(t)||J4(t)!=e8)return!1;var e=Q4(t);if(e===null)return!0;var r=n8.call(e,"constructor")&&e.constructor;return typeof r=="function"&&r instanceof r&&yy.call(r)==i8}var a8=s8,o8=yo,l8=Ry,u8=wo,f8="[object Arguments]",c8="[object Array]",p8="[object Boolean]",d8="[object Date]",h8="[object Error]",E8="[object Function]",m8="[object Map]",g8="[object Number]",_8="[object Object]",T8="[object RegExp]",v8="[object Set]",b8="[object String]",x8="[object WeakMap]",R8="[object ArrayBuffer]",S8="[object DataView]",y8="[object Float32Array]",A8="[object Float64Array]",L8="[object Int8Array]",C8="[object Int16Array]",w8="[object Int32Array]",O8="[object Uint8Array]",I8="[object Uint8ClampedArray]",N8="[object Uint16Array]",P8="[object Uint32Array]",Wt={};Wt[y8]=Wt[A8]=Wt[L8]=Wt[C8]=Wt[w8]=Wt[O8]=Wt[I8]=Wt[N8]=Wt[P8]=!0;Wt[f8]=Wt[c8]=Wt[R8]=Wt[p8]=Wt[S8]=Wt[d8]=Wt[h8]=Wt[E8]=Wt[m8]=Wt[g8]=Wt[_8]=Wt[T8]=Wt[v8]=Wt[b8]=Wt[x8]=!1;function U8(t){return u8(t)&&l8(t.length)&&!!Wt[o8(t)]}var D8=U8;function B8(t){return function(e){return t(e)}}var M8=B8,Wf={exports:{}};Wf.exports;(function(t,e){var r=dy,n=e&&!e.nodeType&&e,i=n&&!0&&t&&!t.nodeType&&t,s=i&&i.exports===n,o=s&&r.process,f=function(){try{var c=i&&i.require&&i.require("util").types;return c||o&&o.binding&&o.binding("util")}catch{}}();t.exports=f})(Wf,Wf.exports);var b0=Wf.exports,$8=D8,K8=M8,Zv=b0,eb=Zv&&Zv.isTypedArray,k8=eb?K8(eb):$8,Ay=k8;function G8(t,e){if(!(e==="constructor"&&typeof t[e]=="function")&&e!="__proto__")return t[e]}var Ly=G8,V8=T0,F8=Cc,H8=Object.prototype,W8=H8.hasOwnProperty;function X8(t,e,r){var n=t[e];(!(W8.call(t,e)&&F8(n,r))||r===void 0&&!(e in t))&&V8(t,e,r)}var j8=X8,z8=j8,q8=T0;function Y8(t,e,r,n){var i=!r;r||(r={});for(var s=-1,o=e.length;++s<o;){var f=e[s],c=n?n(r[f],t[f],f,r,t):void 0;c===void 0&&(c=t[f]),i?q8(r,f,c):z8(r,f,c)}return r}var J8=Y8;function Q8(t,e){for(var r=-1,n=Array(t);++r<t;)n[r]=e(r);return n}var Z8=Q8,eF=9007199254740991,tF=/^(?:0|[1-9]\d*)$/;function rF(t,e){var r=typeof t;return e=e??eF,!!e&&(r=="number"||r!="symbol"&&tF.test(t))&&t>-1&&t%1==0&&t<e}var Cy=rF,nF=Z8,iF=xy,sF=Oo,aF=Sy,oF=Cy,lF=Ay,uF=Object.prototype,fF=uF.hasOwnProperty;function cF(t,e){var r=sF(t),n=!r&&iF(t),i=!r&&!n&&aF(t),s=!r&&!n&&!i&&lF(t),o=r||n||i||s,f=o?nF(t.length,String):[],c=f.length;for(var d in t)(e||fF.call(t,d))&&!(o&&(d=="length"||i&&(d=="offset"||d=="parent")||s&&(d=="buffer"||d=="byteLength"||d=="byteOffset")||oF(d,c)))&&f.push(d);return f}var wy=cF;function pF(t){var e=[];if(t!=null)for(var r in Object(t))e.push(r);return e}var dF=pF,hF=ua,EF=v0,mF=dF,gF=Object.prototype,_F=gF.hasOwnProperty;function TF(t){if(!hF(t))return mF(t);var e=EF(t),r=[];for(var n in t)n=="constructor"&&(e||!_F.call(t,n))||r.push(n);return r}var vF=TF,bF=wy,xF=vF,RF=Uc;function SF(t){return RF(t)?bF(t,!0):xF(t)}var Oy=SF,yF=J8,AF=Oy;function LF(t){return yF(t,AF(t))}var CF=LF,tb=_y,wF=s4,OF=d4,IF=E4,NF=C4,rb=xy,nb=Oo,PF=z4,UF=Sy,DF=g0,BF=ua,MF=a8,$F=Ay,ib=Ly,KF=CF;function kF(t,e,r,n,i,s,o){var f=ib(t,r),c=ib(e,r),d=o.get(c);if(d){tb(t,r,d);return}var p=s?s(f,c,r+"",t,e,o):void 0,E=p===void 0;if(E){var m=nb(c),g=!m&&UF(c),_=!m&&!g&&$F(c);p=c,m||g||_?nb(f)?p=f:PF(f)?p=IF(f):g?(E=!1,p=wF(c,!0)):_?(E=!1,p=OF(c,!0)):p=[]:MF(c)||rb(c)?(p=f,rb(f)?p=KF(f):(!BF(f)||DF(f))&&(p=NF(c))):E=!1}E&&(o.set(c,p),i(p,c,n,s,o),o.delete(c)),tb(t,r,p)}var GF=kF,VF=jV,FF=_y,HF=i4,WF=GF,XF=ua,jF=Oy,zF=Ly;function Iy(t,e,r,n,i){t!==e&&HF(e,function(s,o){if(i||(i=new VF),XF(s))WF(t,e,o,r,Iy,n,i);else{var f=n?n(zF(t,o),s,o+"",t,e,i):void 0;f===void 0&&(f=s),FF(t,o,f)}},jF)}var qF=Iy;function YF(t){return t}var Ny=YF;function JF(t,e,r){switch(r.length){case 0:return t.call(e);case 1:return t.call(e,r[0]);case 2:return t.call(e,r[0],r[1]);case 3:return t.call(e,r[0],r[1],r[2])}return t.apply(e,r)}var QF=JF,ZF=QF,sb=Math.max;function e5(t,e,r){return e=sb(e===void 0?t.length-1:e,0),function(){for(var n=arguments,i=-1,s=sb(n.length-e,0),o=Array(s);++i<s;)o[i]=n[e+i];i=-1;for(var f=Array(e+1);++i<e;)f[i]=n[i];return f[e]=r(o),ZF(t,this,f)}}var t5=e5;function r5(t){return function(){return t}}var n5=r5,i5=n5,ab=gy,s5=Ny,a5=ab?function(t,e){return ab(t,"toString",{configurable:!0,enumerable:!1,value:i5(e),writable:!0})}:s5,o5=a5,l5=800,u5=16,f5=Date.now;function c5(t){var e=0,r=0;return function(){var n=f5(),i=u5-(n-r);if(r=n,i>0){if(++e>=l5)return arguments[0]}else e=0;return t.apply(void 0,arguments)}}var p5=c5,d5=o5,h5=p5,E5=h5(d5),m5=E5,g5=Ny,_5=t5,T5=m5;function v5(t,e){return T5(_5(t,e,g5),t+"")}var b5=v5,x5=Cc,R5=Uc,S5=Cy,y5=ua;function A5(t,e,r){if(!y5(r))return!1;var n=typeof e;return(n=="number"?R5(r)&&S5(e,r.length):n=="string"&&e in r)?x5(r[e],t):!1}var L5=A5,C5=b5,w5=L5;function O5(t){return C5(function(e,r){var n=-1,i=r.length,s=i>1?r[i-1]:void 0,o=i>2?r[2]:void 0;for(s=t.length>3&&typeof s=="function"?(i--,s):void 0,o&&w5(r[0],r[1],o)&&(s=i<3?void 0:s,i=1),e=Object(e);++n<i;){var f=r[n];f&&t(e,f,n,s)}return e})}var I5=O5,N5=qF,P5=I5,U5=P5(function(t,e,r){N5(t,e,r)}),D5=U5;const B5=Sc(D5);class js{static set(e){if(e&&this.isSupported(e)){this.locale=e;return}this.locale=this.getPreferredDeviceLocale()}static getPreferredDeviceLocale(){const e=navigator.languages;for(let r=0;r<e.length;r++)if(this.isSupported(e[r]))return e[r];return this.supported[0]}static isSupported(e){return Object.values(this.supported).includes(e)}static mergeMessages(...e){return B5(e[0],...e)}}Wn(js,"locale"),Wn(js,"supported",["en","fr","it","de","es","es-XL","pt-BR"]);const Wa=class Wa{static get serverUrl(){const e=this.getQueryParam("server")??this.getQueryParam("s");return!e||e==="live"?"ecast.jackboxgames.com":e==="local"?"https://localhost":e.includes("localhost")?e:`${e}.jackboxgames.com`}static isDevelopment(){return window.location.hostname==="dev.jackbox.tv"||window.location.hostname==="localhost"}static isProduction(){return window.location.hostname==="jackbox.tv"}static get isCanvasSupported(){const e=document.createElement("canvas");return!!(e.getContext&&e.getContext("2d"))}static htmlUnescape(e){return String(e).replace(/&quot;/gi,'"').replace(/&#39;/gi,"'").replace(/&lt;/gi,"<").replace(/&gt;/gi,">").replace(/&amp;/gi,"&")}static htmlEscape(e){return String(e).replace(/&/g,"&amp;").replace(/"/g,"&quot;").replace(/'/g,"&#39;").replace(/</g,"&lt;").replace(/>/g,"&gt;")}static sanitize(e){const r=this.sanitizeInput(e).replace(/'/g,"’");return this.htmlEscape(r).trim()}static sanitizeName(e){return e.replace(/[^A-Z0-9\u00A1\u0020-\u002F\u00BF-\u00FF\u2026!?*$+\-'_ .,]/gi,"").replace(/'/g,"’")}static sanitizeInput(e){return e=e.replace("…","..."),e.replace(/[^\u00A1\u0020-\u007E\u00BF-\u00FF’]/gi,"")}static sanitizeEmoji(e){return e.replace(/(\u00a9|\u00ae|[\u2000-\u2017]|[\u2020-\u3300]|\ud83c[\ud000-\udfff]|\ud83d[\ud000-\udfff]|\ud83e[\ud000-\udfff])/,"")}static safeText(e){const r=document.createElement("div");return r.textContent=e,r.innerHTML}static htmlTagsToBBCode(e,r){if(!r.length)throw new Error("[Utils.htmlTagsToBBCode] No tag pairs were passed in");return r.reduce((n,i)=>(n.replaceAll(`<${i[0]}>`,`[${i[1]}]`),n.replaceAll(`</${i[0]}>`,`</${i[1]}>`),n),e)}static hexToRgb(e){const r=new ArrayBuffer(4);new DataView(r).setUint32(0,parseInt(e.replace("#",""),16),!1);const i=new Uint8Array(r);return`${i[1]},${i[2]},${i[3]}`}static adjustColor(e,r){let n=!1,i=e;i[0]==="#"&&(i=i.slice(1),n=!0);const s=parseInt(i,16),o=Math.min(Math.max(0,(s>>16)*r),255),f=Math.min(Math.max(0,(s>>8&255)*r),255);let d=(Math.min(Math.max(0,(s&255)*r),255)|f<<8|o<<16).toString(16);for(;d.length<i.length;)d=`0${d}`;return(n?"#":"")+d}static isInTolerance(e,r,n){return!(Math.abs(e.x-r.x)<n||Math.abs(e.y-r.y)>n)}static getDistanceBetweenPoints(e,r){const n=[e.x-r.x,e.y-r.y],i=Math.hypot(...n);return Math.round(i*100)/100}static getMidpoint(e,r){return{x:(e.x+r.x)/2,y:(e.y+r.y)/2}}static getAngleBetweenPoints(e,r){let i=Math.atan2(r.y-e.y,r.x-e.x)*(180/Math.PI);return i<0&&(i+=360),360-i}static getAngularDistance(e,r){let n=(r-e)%360;const i=n<0?1:-1;return n=Math.abs(n),n>180?i*(360-n):i*n}static getVelocity(e,r,n,i){return this.getDistanceBetweenPoints(e,n)/(i-r)}static isInsideElement(e,r){const n=r.getBoundingClientRect();return!(e.x<n.left||e.x>n.left+n.width||e.y<n.top||e.y>n.top+n.height)}static rotatePoint(e,r,n){const i=n*(Math.PI/180),s=r.x+(e.x-r.x)*Math.cos(i)-(e.y-r.y)*Math.sin(i),o=r.y+(e.x-r.x)*Math.sin(i)+(e.y-r.y)*Math.cos(i);return{x:s,y:o}}static cyrb128(e){let r=1779033703,n=3144134277,i=1013904242,s=2773480762;for(let o=0,f;o<e.length;o++)f=e.charCodeAt(o),r=n^Math.imul(r^f,597399067),n=i^Math.imul(n^f,2869860233),i=s^Math.imul(i^f,951274213),s=r^Math.imul(s^f,2716044179);return r=Math.imul(i^r>>>18,597399067),n=Math.imul(s^n>>>22,2869860233),i=Math.imul(r^i>>>17,951274213),s=Math.imul(n^s>>>19,2716044179),[(r^n^i^s)>>>0,(n^r)>>>0,(i^r)>>>0,(s^r)>>>0]}static sfc32(e,r,n,i){return function(){e>>>=0,r>>>=0,n>>>=0,i>>>=0;let o=e+r|0;return e=r^r>>>9,r=n+(n<<3)|0,n=n<<21|n>>>11,i=i+1|0,o=o+i|0,n=n+o|0,(o>>>0)/4294967296}}};Wn(Wa,"queryParams",new URLSearchParams(window.location.search)),Wn(Wa,"getQueryParam",e=>Wa.queryParams.get(e)),Wn(Wa,"sleep",e=>new Promise(r=>{window.setTimeout(r,e)}));let us=Wa;class Je{static get namespace(){var e;return((e=window.tv.storage)==null?void 0:e.namespace)??this.defaultNamespace}static get isDisabled(){var e;return((e=window.tv.storage)==null?void 0:e.isDisabled)??!1}static get tag(){var e;return(e=window.tv.storage)==null?void 0:e.tag}static get code(){var e;return(e=window.tv.storage)==null?void 0:e.code}static get isSupported(){if(this.isDisabled)return!1;try{return window.localStorage?(window.localStorage.setItem("support-check","1"),window.localStorage.removeItem("support-check"),!0):!1}catch{return!1}}static setup(e,r){delete window.tv.storage,window.tv.storage={namespace:us.getQueryParam("namespace")??us.getQueryParam("ns")??this.defaultNamespace,isDisabled:us.queryParams.has("incognito")||us.queryParams.has("nc")},e&&(window.tv.storage.tag=e),r&&(window.tv.storage.code=r.toLowerCase(),this.clearCodeScopedKeys(window.tv.storage.code))}static get(e,r){return this.isSupported?window.localStorage.getItem(this.getScopedKey(e,r)):null}static set(e,r,n="none"){if(this.isSupported)return window.localStorage.setItem(this.getScopedSetKey(e,n),r)}static remove(e,r){if(this.isSupported)return window.localStorage.removeItem(this.getScopedKey(e,r))}static setTag(e){const r=e.toLowerCase(),n=this.get("tags")??"[]",i=r.split("-")[0];let s=JSON.parse(n);s=s.filter(o=>{const f=o.split("-")[0];return i!==f}),s.push(r),this.set("tags",JSON.stringify(s))}static getScopedKey(e,r){const n=`${this.namespace}:${e}`,i=this.tag?`${this.namespace}:${e}:tag:${this.tag}`:null,s=this.code?`${this.namespace}:${e}:code:${this.code}`:null;if(r==="none")return n;if(r==="tag"){if(!i)throw new Error('[Storage] requested "tag" scope but tv.storage.tag is undefined');return i}if(r==="code"){if(!s)throw new Error('[Storage] requested "code" scope but tv.storage.code is undefined');return s}return s&&window.localStorage.getItem(s)!==null?s:i&&window.localStorage.getItem(i)!==null?i:n}static getScopedSetKey(e,r="none"){if(r==="tag"){if(!this.tag)throw new Error('[Storage] requested "room" scope but tv.storage.tag is undefined');return`${this.namespace}:${e}:tag:${this.tag}`}if(r==="code"){if(!this.code)throw new Error('[Storage] requested "code" scope but tv.storage.code is undefined');return`${this.namespace}:${e}:code:${this.code}`}return`${this.namespace}:${e}`}static clearCodeScopedKeys(e){this.isSupported&&Object.keys(window.localStorage).forEach(r=>{const n=r.split(":code:");n.length<=1||n[1]!==e&&window.localStorage.removeItem(r)})}}Wn(Je,"defaultNamespace","tv");class Za{constructor(){Wn(this,"artifacts");this.migrate(),this.artifacts=this.list()}get hasUnviewed(){return this.artifacts.some(e=>!e.isViewed)}getUrl(e,r){return r.galleryId?`/gallery/${r.galleryId}/${e.artifactId}`:e.isTest?`http://games-test.jackbox.tv/artifact/${e.categoryId}/${e.artifactId}/`:`https://games.jackbox.tv/artifact/${e.categoryId}/${e.artifactId}/`}getLocalArtifact(e){const r=new Intl.DateTimeFormat(js.locale,{year:"numeric",month:"short",day:"numeric"}),n=Fl(e.categoryId);if(!n)throw new Error(`[Artifacts] Unknown game with categoryId ${e.categoryId}`);const i=new Date(e.time),s=r.format(i),o=this.getUrl(e,n);return{...e,gameName:n.name??"",date:s,url:o}}list(){if(!Je.isSupported)return[];const e=Date.now(),r=Je.get("artifacts");if(!r)return[];try{return JSON.parse(r).filter(i=>e-i.time<525600*60*1e3).map(i=>this.getLocalArtifact(i))}catch{return console.warn("[Artifacts] Unable to parse artifacts array"),[]}}persist(){const e=this.artifacts.map(r=>({artifactId:r.artifactId,categoryId:r.categoryId,isTest:r.isTest,isViewed:r.isViewed,time:r.time}));Je.set("artifacts",JSON.stringify(e))}setAsViewed(e){if(Je.isSupported&&this.artifacts[e])try{this.artifacts[e].isViewed=!0,this.persist()}catch{console.warn(`[Artifacts] Unable to mark artifact ${e} as viewed`)}}add(e){var n;if(!Je.isSupported)return;const r={categoryId:e.categoryId,artifactId:e.artifactId,isTest:((n=e.rootId)==null?void 0:n.includes("test"))??!1,time:new Date().getTime(),isViewed:!1};this.artifacts.unshift(this.getLocalArtifact(r)),this.persist()}remove(e){if(Je.isSupported)try{this.artifacts.splice(e,1),this.persist()}catch{console.warn("[Artifacts] Unable to remove artifact")}}static setAsViewed(e){new Za().setAsViewed(e)}static add(e){new Za().add(e)}static remove(e){new Za().remove(e)}migrate(){const e=Je.get("galleries");if(!e)return;const n=JSON.parse(e).map(s=>{const o=s.url.split("/"),f=o[o.length-2],c=s.url.includes("games-test");return{categoryId:s.categoryId,artifactId:f,isTest:c,time:s.time,isViewed:s.viewed}}),i=JSON.parse(Je.get("artifacts")??"[]");Je.set("artifacts",JSON.stringify([...n,...i])),Je.remove("galleries")}}var jh={exports:{}};(function(t,e){var r=typeof globalThis<"u"&&globalThis||typeof self<"u"&&self||typeof Ut<"u"&&Ut,n=function(){function s(){this.fetch=!1,this.DOMException=r.DOMException}return s.prototype=r,new s}();(function(s){(function(o){var f=typeof s<"u"&&s||typeof self<"u"&&self||typeof f<"u"&&f,c={searchParams:"URLSearchParams"in f,iterable:"Symbol"in f&&"iterator"in Symbol,blob:"FileReader"in f&&"Blob"in f&&function(){try{return new Blob,!0}catch{return!1}}(),formData:"FormData"in f,arrayBuffer:"ArrayBuffer"in f};function d(B){return B&&DataView.prototype.isPrototypeOf(B)}if(c.arrayBuffer)var p=["[object Int8Array]","[object Uint8Array]","[object Uint8ClampedArray]","[object Int16Array]","[object Uint16Array]","[object Int32Array]","[object Uint32Array]","[object Float32Array]","[object Float64Array]"],E=ArrayBuffer.isView||function(B){return B&&p.indexOf(Object.prototype.toString.call(B))>-1};function m(B){if(typeof B!="string"&&(B=String(B)),/[^a-z0-9\-#$%&'*+.^_`|~!]/i.test(B)||B==="")throw new TypeError('Invalid character in header field name: "'+B+'"');return B.toLowerCase()}function g(B){return typeof B!="string"&&(B=String(B)),B}function _(B){var Q={next:function(){var W=B.shift();return{done:W===void 0,value:W}}};return c.iterable&&(Q[Symbol.iterator]=function(){return Q}),Q}function b(B){this.map={},B instanceof b?B.forEach(function(Q,W){this.append(W,Q)},this):Array.isArray(B)?B.forEach(function(Q){this.append(Q[0],Q[1])},this):B&&Object.getOwnPropertyNames(B).forEach(function(Q){this.append(Q,B[Q])},this)}b.prototype.append=function(B,Q){B=m(B),Q=g(Q);var W=this.map[B];this.map[B]=W?W+", "+Q:Q},b.prototype.delete=function(B){delete this.map[m(B)]},b.prototype.get=function(B){return B=m(B),this.has(B)?this.map[B]:null},b.prototype.has=function(B){return this.map.hasOwnProperty(m(B))},b.prototype.set=function(B,Q){this.map[m(B)]=g(Q)},b.prototype.forEach=function(B,Q){for(var W in this.map)this.map.hasOwnProperty(W)&&B.call(Q,this.map[W],W,this)},b.prototype.keys=function(){var B=[];return this.forEach(function(Q,W){B.push(W)}),_(B)},b.prototype.values=function(){var B=[];return this.forEach(function(Q){B.push(Q)}),_(B)},b.prototype.entries=function(){var B=[];return this.forEach(function(Q,W){B.push([W,Q])}),_(B)},c.iterable&&(b.prototype[Symbol.iterator]=b.prototype.entries);function x(B){if(B.bodyUsed)return Promise.reject(new TypeError("Already read"));B.bodyUsed=!0}function S(B){return new Promise(function(Q,W){B.onload=function(){Q(B.result)},B.onerror=function(){W(B.error)}})}function y(B){var Q=new FileReader,W=S(Q);return Q.readAsArrayBuffer(B),W}function v(B){var Q=new FileReader,W=S(Q);return Q.readAsText(B),W}function R(B){for(var Q=new Uint8Array(B),W=new Array(Q.length),j=0;j<Q.length;j++)W[j]=String.fromCharCode(Q[j]);return W.join("")}function w(B){if(B.slice)return B.slice(0);var Q=new Uint8Array(B.byteLength);return Q.set(new Uint8Array(B)),Q.buffer}function M(){return this.bodyUsed=!1,this._initBody=function(B){this.bodyUsed=this.bodyUsed,this._bodyInit=B,B?typeof B=="string"?this._bodyText=B:c.blob&&Blob.prototype.isPrototypeOf(B)?this._bodyBlob=B:c.formData&&FormData.prototype.isPrototypeOf(B)?this._bodyFormData=B:c.searchParams&&URLSearchParams.prototype.isPrototypeOf(B)?this._bodyText=B.toString():c.arrayBuffer&&c.blob&&d(B)?(this._bodyArrayBuffer=w(B.buffer),this._bodyInit=new Blob([this._bodyArrayBuffer])):c.arrayBuffer&&(ArrayBuffer.prototype.isPrototypeOf(B)||E(B))?this._bodyArrayBuffer=w(B):this._bodyText=B=Object.prototype.toString.call(B):this._bodyText="",this.headers.get("content-type")||(typeof B=="string"?this.headers.set("content-type","text/plain;charset=UTF-8"):this._bodyBlob&&this._bodyBlob.type?this.headers.set("content-type",this._bodyBlob.type):c.searchParams&&URLSearchParams.prototype.isPrototypeOf(B)&&this.headers.set("content-type","application/x-www-form-urlencoded;charset=UTF-8"))},c.blob&&(this.blob=function(){var B=x(this);if(B)return B;if(this._bodyBlob)return Promise.resolve(this._bodyBlob);if(this._bodyArrayBuffer)return Promise.resolve(new Blob([this._bodyArrayBuffer]));if(this._bodyFormData)throw new Error("could not read FormData body as blob");return Promise.resolve(new Blob([this._bodyText]))},this.arrayBuffer=function(){if(this._bodyArrayBuffer){var B=x(this);return B||(ArrayBuffer.isView(this._bodyArrayBuffer)?Promise.resolve(this._bodyArrayBuffer.buffer.slice(this._bodyArrayBuffer.byteOffset,this._bodyArrayBuffer.byteOffset+this._bodyArrayBuffer.byteLength)):Promise.resolve(this._bodyArrayBuffer))}else return this.blob().then(y)}),this.text=function(){var B=x(this);if(B)return B;if(this._bodyBlob)return v(this._bodyBlob);if(this._bodyArrayBuffer)return Promise.resolve(R(this._bodyArrayBuffer));if(this._bodyFormData)throw new Error("could not read FormData body as text");return Promise.resolve(this._bodyText)},c.formData&&(this.formData=function(){return this.text().then(z)}),this.json=function(){return this.text().then(JSON.parse)},this}var k=["DELETE","GET","HEAD","OPTIONS","POST","PUT"];function H(B){var Q=B.toUpperCase();return k.indexOf(Q)>-1?Q:B}function O(B,Q){if(!(this instanceof O))throw new TypeError('Please use the "new" operator, this DOM object constructor cannot be called as a function.');Q=Q||{};var W=Q.body;if(B instanceof O){if(B.bodyUsed)throw new TypeError("Already read");this.url=B.url,this.credentials=B.credentials,Q.headers||(this.headers=new b(B.headers)),this.method=B.method,this.mode=B.mode,this.signal=B.signal,!W&&B._bodyInit!=null&&(W=B._bodyInit,B.bodyUsed=!0)}else this.url=String(B);if(this.credentials=Q.credentials||this.credentials||"same-origin",(Q.headers||!this.headers)&&(this.headers=new b(Q.headers)),this.method=H(Q.method||this.method||"GET"),this.mode=Q.mode||this.mode||null,this.signal=Q.signal||this.signal,this.referrer=null,(this.method==="GET"||this.method==="HEAD")&&W)throw new TypeError("Body not allowed for GET or HEAD requests");if(this._initBody(W),(this.method==="GET"||this.method==="HEAD")&&(Q.cache==="no-store"||Q.cache==="no-cache")){var j=/([?&])_=[^&]*/;if(j.test(this.url))this.url=this.url.replace(j,"$1_="+new Date().getTime());else{var ue=/\?/;this.url+=(ue.test(this.url)?"&":"?")+"_="+new Date().getTime()}}}O.prototype.clone=function(){return new O(this,{body:this._bodyInit})};function z(B){var Q=new FormData;return B.trim().split("&").forEach(function(W){if(W){var j=W.split("="),ue=j.shift().replace(/\+/g," "),ve=j.join("=").replace(/\+/g," ");Q.append(decodeURIComponent(ue),decodeURIComponent(ve))}}),Q}function ie(B){var Q=new b,W=B.replace(/\r?\n[\t ]+/g," ");return W.split("\r").map(function(j){return j.indexOf(`
-`)===0?j.substr(1,j.length):j}).forEach(function(j){var ue=j.split(":"),ve=ue.shift().trim();if(ve){var ae=ue.join(":").trim();Q.append(ve,ae)}}),Q}M.call(O.prototype);function G(B,Q){if(!(this instanceof G))throw new TypeError('Please use the "new" operator, this DOM object constructor cannot be called as a function.');Q||(Q={}),this.type="default",this.status=Q.status===void 0?200:Q.status,this.ok=this.status>=200&&this.status<300,this.statusText=Q.statusText===void 0?"":""+Q.statusText,this.headers=new b(Q.headers),this.url=Q.url||"",this._initBody(B)}M.call(G.prototype),G.prototype.clone=function(){return new G(this._bodyInit,{status:this.status,statusText:this.statusText,headers:new b(this.headers),url:this.url})},G.error=function(){var B=new G(null,{status:0,statusText:""});return B.type="error",B};var X=[301,302,303,307,308];G.redirect=function(B,Q){if(X.indexOf(Q)===-1)throw new RangeError("Invalid status code");return new G(null,{status:Q,headers:{location:B}})},o.DOMException=f.DOMException;try{new o.DOMException}catch{o.DOMException=function(Q,W){this.message=Q,this.name=W;var j=Error(Q);this.stack=j.stack},o.DOMException.prototype=Object.create(Error.prototype),o.DOMException.prototype.constructor=o.DOMException}function ee(B,Q){return new Promise(function(W,j){var ue=new O(B,Q);if(ue.signal&&ue.signal.aborted)return j(new o.DOMException("Aborted","AbortError"));var ve=new XMLHttpRequest;function ae(){ve.abort()}ve.onload=function(){var Se={status:ve.status,statusText:ve.statusText,headers:ie(ve.getAllResponseHeaders()||"")};Se.url="responseURL"in ve?ve.responseURL:Se.headers.get("X-Request-URL");var He="response"in ve?ve.response:ve.responseText;setTimeout(function(){W(new G(He,Se))},0)},ve.onerror=function(){setTimeout(function(){j(new TypeError("Network request failed"))},0)},ve.ontimeout=function(){setTimeout(function(){j(new TypeError("Network request failed"))},0)},ve.onabort=function(){setTimeout(function(){j(new o.DOMException("Aborted","AbortError"))},0)};function he(Se){try{return Se===""&&f.location.href?f.location.href:Se}catch{return Se}}ve.open(ue.method,he(ue.url),!0),ue.credentials==="include"?ve.withCredentials=!0:ue.credentials==="omit"&&(ve.withCredentials=!1),"responseType"in ve&&(c.blob?ve.responseType="blob":c.arrayBuffer&&ue.headers.get("Content-Type")&&ue.headers.get("Content-Type").indexOf("application/octet-stream")!==-1&&(ve.responseType="arraybuffer")),Q&&typeof Q.headers=="object"&&!(Q.headers instanceof b)?Object.getOwnPropertyNames(Q.headers).forEach(function(Se){ve.setRequestHeader(Se,g(Q.headers[Se]))}):ue.headers.forEach(function(Se,He){ve.setRequestHeader(He,Se)}),ue.signal&&(ue.signal.addEventListener("abort",ae),ve.onreadystatechange=function(){ve.readyState===4&&ue.signal.removeEventListener("abort",ae)}),ve.send(typeof ue._bodyInit>"u"?null:ue._bodyInit)})}return ee.polyfill=!0,f.fetch||(f.fetch=ee,f.Headers=b,f.Request=O,f.Response=G),o.Headers=b,o.Request=O,o.Response=G,o.fetch=ee,o})({})})(n),n.fetch.ponyfill=!0,delete n.fetch.polyfill;var i=r.fetch?r:n;e=i.fetch,e.default=i.fetch,e.fetch=i.fetch,e.Headers=i.Headers,e.Request=i.Request,e.Response=i.Response,t.exports=e})(jh,jh.exports);var M5=jh.exports,$5=Error,K5=EvalError,k5=RangeError,G5=ReferenceError,Py=SyntaxError,Hl=TypeError,V5=URIError,F5=function(){if(typeof Symbol!="function"||typeof Object.getOwnPropertySymbols!="function")return!1;if(typeof Symbol.iterator=="symbol")return!0;var e={},r=Symbol("test"),n=Object(r);if(typeof r=="string"||Object.prototype.toString.call(r)!=="[object Symbol]"||Object.prototype.toString.call(n)!=="[object Symbol]")return!1;var i=42;e[r]=i;for(r in e)return!1;if(typeof Object.keys=="function"&&Object.keys(e).length!==0||typeof Object.getOwnPropertyNames=="function"&&Object.getOwnPropertyNames(e).length!==0)return!1;var s=Object.getOwnPropertySymbols(e);if(s.length!==1||s[0]!==r||!Object.prototype.propertyIsEnumerable.call(e,r))return!1;if(typeof Object.getOwnPropertyDescriptor=="function"){var o=Object.getOwnPropertyDescriptor(e,r);if(o.value!==i||o.enumerable!==!0)return!1}return!0},ob=typeof Symbol<"u"&&Symbol,H5=F5,W5=function(){return typeof ob!="function"||typeof Symbol!="function"||typeof ob("foo")!="symbol"||typeof Symbol("bar")!="symbol"?!1:H5()},Od={__proto__:null,foo:{}},X5=Object,j5=function(){return{__proto__:Od}.foo===Od.foo&&!(Od instanceof X5)},z5="Function.prototype.bind called on incompatible ",q5=Object.prototype.toString,Y5=Math.max,J5="[object Function]",lb=function(e,r){for(var n=[],i=0;i<e.length;i+=1)n[i]=e[i];for(var s=0;s<r.length;s+=1)n[s+e.length]=r[s];return n},Q5=function(e,r){for(var n=[],i=r,s=0;i<e.length;i+=1,s+=1)n[s]=e[i];return n},Z5=function(t,e){for(var r="",n=0;n<t.length;n+=1)r+=t[n],n+1<t.length&&(r+=e);return r},e9=function(e){var r=this;if(typeof r!="function"||q5.apply(r)!==J5)throw new TypeError(z5+r);for(var n=Q5(arguments,1),i,s=function(){if(this instanceof i){var p=r.apply(this,lb(n,arguments));return Object(p)===p?p:this}return r.apply(e,lb(n,arguments))},o=Y5(0,r.length-n.length),f=[],c=0;c<o;c++)f[c]="$"+c;if(i=Function("binder","return function ("+Z5(f,",")+"){ return binder.apply(this,arguments); }")(s),r.prototype){var d=function(){};d.prototype=r.prototype,i.prototype=new d,d.prototype=null}return i},t9=e9,x0=Function.prototype.bind||t9,r9=Function.prototype.call,n9=Object.prototype.hasOwnProperty,i9=x0,s9=i9.call(r9,n9),gt,a9=$5,o9=K5,l9=k5,u9=G5,mo=Py,eo=Hl,f9=V5,Uy=Function,Id=function(t){try{return Uy('"use strict"; return ('+t+").constructor;")()}catch{}},Qs=Object.getOwnPropertyDescriptor;if(Qs)try{Qs({},"")}catch{Qs=null}var Nd=function(){throw new eo},c9=Qs?function(){try{return arguments.callee,Nd}catch{try{return Qs(arguments,"callee").get}catch{return Nd}}}():Nd,wa=W5(),p9=j5(),mr=Object.getPrototypeOf||(p9?function(t){return t.__proto__}:null),$a={},d9=typeof Uint8Array>"u"||!mr?gt:mr(Uint8Array),Zs={__proto__:null,"%AggregateError%":typeof AggregateError>"u"?gt:AggregateError,"%Array%":Array,"%ArrayBuffer%":typeof ArrayBuffer>"u"?gt:ArrayBuffer,"%ArrayIteratorPrototype%":wa&&mr?mr([][Symbol.iterator]()):gt,"%AsyncFromSyncIteratorPrototype%":gt,"%AsyncFunction%":$a,"%AsyncGenerator%":$a,"%AsyncGeneratorFunction%":$a,"%AsyncIteratorPrototype%":$a,"%Atomics%":typeof Atomics>"u"?gt:Atomics,"%BigInt%":typeof BigInt>"u"?gt:BigInt,"%BigInt64Array%":typeof BigInt64Array>"u"?gt:BigInt64Array,"%BigUint64Array%":typeof BigUint64Array>"u"?gt:BigUint64Array,"%Boolean%":Boolean,"%DataView%":typeof DataView>"u"?gt:DataView,"%Date%":Date,"%decodeURI%":decodeURI,"%decodeURIComponent%":decodeURIComponent,"%encodeURI%":encodeURI,"%encodeURIComponent%":encodeURIComponent,"%Error%":a9,"%eval%":eval,"%EvalError%":o9,"%Float32Array%":typeof Float32Array>"u"?gt:Float32Array,"%Float64Array%":typeof Float64Array>"u"?gt:Float64Array,"%FinalizationRegistry%":typeof FinalizationRegistry>"u"?gt:FinalizationRegistry,"%Function%":Uy,"%GeneratorFunction%":$a,"%Int8Array%":typeof Int8Array>"u"?gt:Int8Array,"%Int16Array%":typeof Int16Array>"u"?gt:Int16Array,"%Int32Array%":typeof Int32Array>"u"?gt:Int32Array,"%isFinite%":isFinite,"%isNaN%":isNaN,"%IteratorPrototype%":wa&&mr?mr(mr([][Symbol.iterator]())):gt,"%JSON%":typeof JSON=="object"?JSON:gt,"%Map%":typeof Map>"u"?gt:Map,"%MapIteratorPrototype%":typeof Map>"u"||!wa||!mr?gt:mr(new Map()[Symbol.iterator]()),"%Math%":Math,"%Number%":Number,"%Object%":Object,"%parseFloat%":parseFloat,"%parseInt%":parseInt,"%Promise%":typeof Promise>"u"?gt:Promise,"%Proxy%":typeof Proxy>"u"?gt:Proxy,"%RangeError%":l9,"%ReferenceError%":u9,"%Reflect%":typeof Reflect>"u"?gt:Reflect,"%RegExp%":RegExp,"%Set%":typeof Set>"u"?gt:Set,"%SetIteratorPrototype%":typeof Set>"u"||!wa||!mr?gt:mr(new Set()[Symbol.iterator]()),"%SharedArrayBuffer%":typeof SharedArrayBuffer>"u"?gt:SharedArrayBuffer,"%String%":String,"%StringIteratorPrototype%":wa&&mr?mr(""[Symbol.iterator]()):gt,"%Symbol%":wa?Symbol:gt,"%SyntaxError%":mo,"%ThrowTypeError%":c9,"%TypedArray%":d9,"%TypeError%":eo,"%Uint8Array%":typeof Uint8Array>"u"?gt:Uint8Array,"%Uint8ClampedArray%":typeof Uint8ClampedArray>"u"?gt:Uint8ClampedArray,"%Uint16Array%":typeof Uint16Array>"u"?gt:Uint16Array,"%Uint32Array%":typeof Uint32Array>"u"?gt:Uint32Array,"%URIError%":f9,"%WeakMap%":typeof WeakMap>"u"?gt:WeakMap,"%WeakRef%":typeof WeakRef>"u"?gt:WeakRef,"%WeakSet%":typeof WeakSet>"u"?gt:WeakSet};if(mr)try{null.error}catch(t){var h9=mr(mr(t));Zs["%Error.prototype%"]=h9}var E9=function t(e){var r;if(e==="%AsyncFunction%")r=Id("async function () {}");else if(e==="%GeneratorFunction%")r=Id("function* () {}");else if(e==="%AsyncGeneratorFunction%")r=Id("async function* () {}");else if(e==="%AsyncGenerator%"){var n=t("%AsyncGeneratorFunction%");n&&(r=n.prototype)}else if(e==="%AsyncIteratorPrototype%"){var i=t("%AsyncGenerator%");i&&mr&&(r=mr(i.prototype))}return Zs[e]=r,r},ub={__proto__:null,"%ArrayBufferPrototype%":["ArrayBuffer","prototype"],"%ArrayPrototype%":["Array","prototype"],"%ArrayProto_entries%":["Array","prototype","entries"],"%ArrayProto_forEach%":["Array","prototype","forEach"],"%ArrayProto_keys%":["Array","prototype","keys"],"%ArrayProto_values%":["Array","prototype","values"],"%AsyncFunctionPrototype%":["AsyncFunction","prototype"],"%AsyncGenerator%":["AsyncGeneratorFunction","prototype"],"%AsyncGeneratorPrototype%":["AsyncGeneratorFunction","prototype","prototype"],"%BooleanPrototype%":["Boolean","prototype"],"%DataViewPrototype%":["DataView","prototype"],"%DatePrototype%":["Date","prototype"],"%ErrorPrototype%":["Error","prototype"],"%EvalErrorPrototype%":["EvalError","prototype"],"%Float32ArrayPrototype%":["Float32Array","prototype"],"%Float64ArrayPrototype%":["Float64Array","prototype"],"%FunctionPrototype%":["Function","prototype"],"%Generator%":["GeneratorFunction","prototype"],"%GeneratorPrototype%":["GeneratorFunction","prototype","prototype"],"%Int8ArrayPrototype%":["Int8Array","prototype"],"%Int16ArrayPrototype%":["Int16Array","prototype"],"%Int32ArrayPrototype%":["Int32Array","prototype"],"%JSONParse%":["JSON","parse"],"%JSONStringify%":["JSON","stringify"],"%MapPrototype%":["Map","prototype"],"%NumberPrototype%":["Number","prototype"],"%ObjectPrototype%":["Object","prototype"],"%ObjProto_toString%":["Object","prototype","toString"],"%ObjProto_valueOf%":["Object","prototype","valueOf"],"%PromisePrototype%":["Promise","prototype"],"%PromiseProto_then%":["Promise","prototype","then"],"%Promise_all%":["Promise","all"],"%Promise_reject%":["Promise","reject"],"%Promise_resolve%":["Promise","resolve"],"%RangeErrorPrototype%":["RangeError","prototype"],"%ReferenceErrorPrototype%":["ReferenceError","prototype"],"%RegExpPrototype%":["RegExp","prototype"],"%SetPrototype%":["Set","prototype"],"%SharedArrayBufferPrototype%":["SharedArrayBuffer","prototype"],"%StringPrototype%":["String","prototype"],"%SymbolPrototype%":["Symbol","prototype"],"%SyntaxErrorPrototype%":["SyntaxError","prototype"],"%TypedArrayPrototype%":["TypedArray","prototype"],"%TypeErrorPrototype%":["TypeError","prototype"],"%Uint8ArrayPrototype%":["Uint8Array","prototype"],"%Uint8ClampedArrayPrototype%":["Uint8ClampedArray","prototype"],"%Uint16ArrayPrototype%":["Uint16Array","prototype"],"%Uint32ArrayPrototype%":["Uint32Array","prototype"],"%URIErrorPrototype%":["URIError","prototype"],"%WeakMapPrototype%":["WeakMap","prototype"],"%WeakSetPrototype%":["WeakSet","prototype"]},Wl=x0,Xf=s9,m9=Wl.call(Function.call,Array.prototype.concat),g9=Wl.call(Function.apply,Array.prototype.splice),fb=Wl.call(Function.call,String.prototype.replace),jf=Wl.call(Function.call,String.prototype.slice),_9=Wl.call(Function.call,RegExp.prototype.exec),T9=/[^%.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|%$))/g,v9=/\\(\\)?/g,b9=function(e){var r=jf(e,0,1),n=jf(e,-1);if(r==="%"&&n!=="%")throw new mo("invalid intrinsic syntax, expected closing `%`");if(n==="%"&&r!=="%")throw new mo("invalid intrinsic syntax, expected opening `%`");var i=[];return fb(e,T9,function(s,o,f,c){i[i.length]=f?fb(c,v9,"$1"):o||s}),i},x9=function(e,r){var n=e,i;if(Xf(ub,n)&&(i=ub[n],n="%"+i[0]+"%"),Xf(Zs,n)){var s=Zs[n];if(s===$a&&(s=E9(n)),typeof s>"u"&&!r)throw new eo("intrinsic "+e+" exists, but is not available. Please file an issue!");return{alias:i,name:n,value:s}}throw new mo("intrinsic "+e+" does not exist!")},Io=function(e,r){if(typeof e!="string"||e.length===0)throw new eo("intrinsic name must be a non-empty string");if(arguments.length>1&&typeof r!="boolean")throw new eo('"allowMissing" argument must be a boolean');if(_9(/^%?[^%]*%?$/,e)===null)throw new mo("`%` may not be present anywhere but at the beginning and end of the intrinsic name");var n=b9(e),i=n.length>0?n[0]:"",s=x9("%"+i+"%",r),o=s.name,f=s.value,c=!1,d=s.alias;d&&(i=d[0],g9(n,m9([0,1],d)));for(var p=1,E=!0;p<n.length;p+=1){var m=n[p],g=jf(m,0,1),_=jf(m,-1);if((g==='"'||g==="'"||g==="`"||_==='"'||_==="'"||_==="`")&&g!==_)throw new mo("property names with quotes must have matching quotes");if((m==="constructor"||!E)&&(c=!0),i+="."+m,o="%"+i+"%",Xf(Zs,o))f=Zs[o];else if(f!=null){if(!(m in f)){if(!r)throw new eo("base intrinsic for "+e+" exists, but the property is not available.");return}if(Qs&&p+1>=n.length){var b=Qs(f,m);E=!!b,E&&"get"in b&&!("originalValue"in b.get)?f=b.get:f=f[m]}else E=Xf(f,m),f=f[m];E&&!c&&(Zs[o]=f)}}return f},Dy={exports:{}},Pd,cb;function R0(){if(cb)return Pd;cb=1;var t=Io,e=t("%Object.defineProperty%",!0)||!1;if(e)try{e({},"a",{value:1})}catch{e=!1}return Pd=e,Pd}var R9=Io,df=R9("%Object.getOwnPropertyDescriptor%",!0);if(df)try{df([],"length")}catch{df=null}var By=df,pb=R0(),S9=Py,Oa=Hl,db=By,y9=function(e,r,n){if(!e||typeof e!="object"&&typeof e!="function")throw new Oa("`obj` must be an object or a function`");if(typeof r!="string"&&typeof r!="symbol")throw new Oa("`property` must be a string or a symbol`");if(arguments.length>3&&typeof arguments[3]!="boolean"&&arguments[3]!==null)throw new Oa("`nonEnumerable`, if provided, must be a boolean or null");if(arguments.length>4&&typeof arguments[4]!="boolean"&&arguments[4]!==null)throw new Oa("`nonWritable`, if provided, must be a boolean or null");if(arguments.length>5&&typeof arguments[5]!="boolean"&&arguments[5]!==null)throw new Oa("`nonConfigurable`, if provided, must be a boolean or null");if(arguments.length>6&&typeof arguments[6]!="boolean")throw new Oa("`loose`, if provided, must be a boolean");var i=arguments.length>3?arguments[3]:null,s=arguments.length>4?arguments[4]:null,o=arguments.length>5?arguments[5]:null,f=arguments.length>6?arguments[6]:!1,c=!!db&&db(e,r);if(pb)pb(e,r,{configurable:o===null&&c?c.configurable:!o,enumerable:i===null&&c?c.enumerable:!i,value:n,writable:s===null&&c?c.writable:!s});else if(f||!i&&!s&&!o)e[r]=n;else throw new S9("This environment does not support defining a property as non-configurable, non-writable, or non-enumerable.")},zh=R0(),My=function(){return!!zh};My.hasArrayLengthDefineBug=function(){if(!zh)return null;try{return zh([],"length",{value:1}).length!==1}catch{return!0}};var A9=My,L9=Io,hb=y9,C9=A9(),Eb=By,mb=Hl,w9=L9("%Math.floor%"),O9=function(e,r){if(typeof e!="function")throw new mb("`fn` is not a function");if(typeof r!="number"||r<0||r>4294967295||w9(r)!==r)throw new mb("`length` must be a positive 32-bit integer");var n=arguments.length>2&&!!arguments[2],i=!0,s=!0;if("length"in e&&Eb){var o=Eb(e,"length");o&&!o.configurable&&(i=!1),o&&!o.writable&&(s=!1)}return(i||s||!n)&&(C9?hb(e,"length",r,!0,!0):hb(e,"length",r)),e};(function(t){var e=x0,r=Io,n=O9,i=Hl,s=r("%Function.prototype.apply%"),o=r("%Function.prototype.call%"),f=r("%Reflect.apply%",!0)||e.call(o,s),c=R0(),d=r("%Math.max%");t.exports=function(m){if(typeof m!="function")throw new i("a function is required");var g=f(e,o,arguments);return n(g,1+d(0,m.length-(arguments.length-1)),!0)};var p=function(){return f(e,s,arguments)};c?c(t.exports,"apply",{value:p}):t.exports.apply=p})(Dy);var I9=Dy.exports,$y=Io,Ky=I9,N9=Ky($y("String.prototype.indexOf")),P9=function(e,r){var n=$y(e,!!r);return typeof n=="function"&&N9(e,".prototype.")>-1?Ky(n):n};const U9={},D9=Object.freeze(Object.defineProperty({__proto__:null,default:U9},Symbol.toStringTag,{value:"Module"})),B9=S2(D9);var S0=typeof Map=="function"&&Map.prototype,Ud=Object.getOwnPropertyDescriptor&&S0?Object.getOwnPropertyDescriptor(Map.prototype,"size"):null,zf=S0&&Ud&&typeof Ud.get=="function"?Ud.get:null,gb=S0&&Map.prototype.forEach,y0=typeof Set=="function"&&Set.prototype,Dd=Object.getOwnPropertyDescriptor&&y0?Object.getOwnPropertyDescriptor(Set.prototype,"size"):null,qf=y0&&Dd&&typeof Dd.get=="function"?Dd.get:null,_b=y0&&Set.prototype.forEach,M9=typeof WeakMap=="function"&&WeakMap.prototype,El=M9?WeakMap.prototype.has:null,$9=typeof WeakSet=="function"&&WeakSet.prototype,ml=$9?WeakSet.prototype.has:null,K9=typeof WeakRef=="function"&&WeakRef.prototype,Tb=K9?WeakRef.prototype.deref:null,k9=Boolean.prototype.valueOf,G9=Object.prototype.toString,V9=Function.prototype.toString,F9=String.prototype.match,A0=String.prototype.slice,fs=String.prototype.replace,H9=String.prototype.toUpperCase,vb=String.prototype.toLowerCase,ky=RegExp.prototype.test,bb=Array.prototype.concat,ei=Array.prototype.join,W9=Array.prototype.slice,xb=Math.floor,qh=typeof BigInt=="function"?BigInt.prototype.valueOf:null,Bd=Object.getOwnPropertySymbols,Yh=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?Symbol.prototype.toString:null,go=typeof Symbol=="function"&&typeof Symbol.iterator=="object",Ur=typeof Symbol=="function"&&Symbol.toStringTag&&(typeof Symbol.toStringTag===go||!0)?Symbol.toStringTag:null,Gy=Object.prototype.propertyIsEnumerable,Rb=(typeof Reflect=="function"?Reflect.getPrototypeOf:Object.getPrototypeOf)||([].__proto__===Array.prototype?function(t){return t.__proto__}:null);function Sb(t,e){if(t===1/0||t===-1/0||t!==t||t&&t>-1e3&&t<1e3||ky.call(/e/,e))return e;var r=/[0-9](?=(?:[0-9]{3})+(?![0-9]))/g;if(typeof t=="number"){var n=t<0?-xb(-t):xb(t);if(n!==t){var i=String(n),s=A0.call(e,i.length+1);return fs.call(i,r,"$&_")+"."+fs.call(fs.call(s,/([0-9]{3})/g,"$&_"),/_$/,"")}}return fs.call(e,r,"$&_")}var Jh=B9,yb=Jh.custom,Ab=Fy(yb)?yb:null,X9=function t(e,r,n,i){var s=r||{};if(is(s,"quoteStyle")&&s.quoteStyle!=="single"&&s.quoteStyle!=="double")throw new TypeError('option "quoteStyle" must be "single" or "double"');if(is(s,"maxStringLength")&&(typeof s.maxStringLength=="number"?s.maxStringLength<0&&s.maxStringLength!==1/0:s.maxStringLength!==null))throw new TypeError('option "maxStringLength", if provided, must be a positive integer, Infinity, or `null`');var o=is(s,"customInspect")?s.customInspect:!0;if(typeof o!="boolean"&&o!=="symbol")throw new TypeError("option \"customInspect\", if provided, must be `true`, `false`, or `'symbol'`");if(is(s,"indent")&&s.indent!==null&&s.indent!=="	"&&!(parseInt(s.indent,10)===s.indent&&s.indent>0))throw new TypeError('option "indent" must be "\\t", an integer > 0, or `null`');if(is(s,"numericSeparator")&&typeof s.numericSeparator!="boolean")throw new TypeError('option "numericSeparator", if provided, must be `true` or `false`');var f=s.numericSeparator;if(typeof e>"u")return"undefined";if(e===null)return"null";if(typeof e=="boolean")return e?"true":"false";if(typeof e=="string")return Wy(e,s);if(typeof e=="number"){if(e===0)return 1/0/e>0?"0":"-0";var c=String(e);return f?Sb(e,c):c}if(typeof e=="bigint"){var d=String(e)+"n";return f?Sb(e,d):d}var p=typeof s.depth>"u"?5:s.depth;if(typeof n>"u"&&(n=0),n>=p&&p>0&&typeof e=="object")return Qh(e)?"[Array]":"[Object]";var E=f6(s,n);if(typeof i>"u")i=[];else if(Hy(i,e)>=0)return"[Circular]";function m(X,ee,B){if(ee&&(i=W9.call(i),i.push(ee)),B){var Q={depth:s.depth};return is(s,"quoteStyle")&&(Q.quoteStyle=s.quoteStyle),t(X,Q,n+1,i)}return t(X,s,n+1,i)}if(typeof e=="function"&&!Lb(e)){var g=t6(e),_=Xu(e,m);return"[Function"+(g?": "+g:" (anonymous)")+"]"+(_.length>0?" { "+ei.call(_,", ")+" }":"")}if(Fy(e)){var b=go?fs.call(String(e),/^(Symbol\(.*\))_[^)]*$/,"$1"):Yh.call(e);return typeof e=="object"&&!go?el(b):b}if(o6(e)){for(var x="<"+vb.call(String(e.nodeName)),S=e.attributes||[],y=0;y<S.length;y++)x+=" "+S[y].name+"="+Vy(j9(S[y].value),"double",s);return x+=">",e.childNodes&&e.childNodes.length&&(x+="..."),x+="</"+vb.call(String(e.nodeName))+">",x}if(Qh(e)){if(e.length===0)return"[]";var v=Xu(e,m);return E&&!u6(v)?"["+Zh(v,E)+"]":"[ "+ei.call(v,", ")+" ]"}if(q9(e)){var R=Xu(e,m);return!("cause"in Error.prototype)&&"cause"in e&&!Gy.call(e,"cause")?"{ ["+String(e)+"] "+ei.call(bb.call("[cause]: "+m(e.cause),R),", ")+" }":R.length===0?"["+String(e)+"]":"{ ["+String(e)+"] "+ei.call(R,", ")+" }"}if(typeof e=="object"&&o){if(Ab&&typeof e[Ab]=="function"&&Jh)return Jh(e,{depth:p-n});if(o!=="symbol"&&typeof e.inspect=="function")return e.inspect()}if(r6(e)){var w=[];return gb&&gb.call(e,function(X,ee){w.push(m(ee,e,!0)+" => "+m(X,e))}),Cb("Map",zf.call(e),w,E)}if(s6(e)){var M=[];return _b&&_b.call(e,function(X){M.push(m(X,e))}),Cb("Set",qf.call(e),M,E)}if(n6(e))return Md("WeakMap");if(a6(e))return Md("WeakSet");if(i6(e))return Md("WeakRef");if(J9(e))return el(m(Number(e)));if(Z9(e))return el(m(qh.call(e)));if(Q9(e))return el(k9.call(e));if(Y9(e))return el(m(String(e)));if(typeof window<"u"&&e===window)return"{ [object Window] }";if(typeof globalThis<"u"&&e===globalThis||typeof Ut<"u"&&e===Ut)return"{ [object globalThis] }";if(!z9(e)&&!Lb(e)){var k=Xu(e,m),H=Rb?Rb(e)===Object.prototype:e instanceof Object||e.constructor===Object,O=e instanceof Object?"":"null prototype",z=!H&&Ur&&Object(e)===e&&Ur in e?A0.call(As(e),8,-1):O?"Object":"",ie=H||typeof e.constructor!="function"?"":e.constructor.name?e.constructor.name+" ":"",G=ie+(z||O?"["+ei.call(bb.call([],z||[],O||[]),": ")+"] ":"");return k.length===0?G+"{}":E?G+"{"+Zh(k,E)+"}":G+"{ "+ei.call(k,", ")+" }"}return String(e)};function Vy(t,e,r){var n=(r.quoteStyle||e)==="double"?'"':"'";return n+t+n}function j9(t){return fs.call(String(t),/"/g,"&quot;")}function Qh(t){return As(t)==="[object Array]"&&(!Ur||!(typeof t=="object"&&Ur in t))}function z9(t){return As(t)==="[object Date]"&&(!Ur||!(typeof t=="object"&&Ur in t))}function Lb(t){return As(t)==="[object RegExp]"&&(!Ur||!(typeof t=="object"&&Ur in t))}function q9(t){return As(t)==="[object Error]"&&(!Ur||!(typeof t=="object"&&Ur in t))}function Y9(t){return As(t)==="[object String]"&&(!Ur||!(typeof t=="object"&&Ur in t))}function J9(t){return As(t)==="[object Number]"&&(!Ur||!(typeof t=="object"&&Ur in t))}function Q9(t){return As(t)==="[object Boolean]"&&(!Ur||!(typeof t=="object"&&Ur in t))}function Fy(t){if(go)return t&&typeof t=="object"&&t instanceof Symbol;if(typeof t=="symbol")return!0;if(!t||typeof t!="object"||!Yh)return!1;try{return Yh.call(t),!0}catch{}return!1}function Z9(t){if(!t||typeof t!="object"||!qh)return!1;try{return qh.call(t),!0}catch{}return!1}var e6=Object.prototype.hasOwnProperty||function(t){return t in this};function is(t,e){return e6.call(t,e)}function As(t){return G9.call(t)}function t6(t){if(t.name)return t.name;var e=F9.call(V9.call(t),/^function\s*([\w$]+)/);return e?e[1]:null}function Hy(t,e){if(t.indexOf)return t.indexOf(e);for(var r=0,n=t.length;r<n;r++)if(t[r]===e)return r;return-1}function r6(t){if(!zf||!t||typeof t!="object")return!1;try{zf.call(t);try{qf.call(t)}catch{return!0}return t instanceof Map}catch{}return!1}function n6(t){if(!El||!t||typeof t!="object")return!1;try{El.call(t,El);try{ml.call(t,ml)}catch{return!0}return t instanceof WeakMap}catch{}return!1}function i6(t){if(!Tb||!t||typeof t!="object")return!1;try{return Tb.call(t),!0}catch{}return!1}function s6(t){if(!qf||!t||typeof t!="object")return!1;try{qf.call(t);try{zf.call(t)}catch{return!0}return t instanceof Set}catch{}return!1}function a6(t){if(!ml||!t||typeof t!="object")return!1;try{ml.call(t,ml);try{El.call(t,El)}catch{return!0}return t instanceof WeakSet}catch{}return!1}function o6(t){return!t||typeof t!="object"?!1:typeof HTMLElement<"u"&&t instanceof HTMLElement?!0:typeof t.nodeName=="string"&&typeof t.getAttribute=="function"}function Wy(t,e){if(t.length>e.maxStringLength){var r=t.length-e.maxStringLength,n="... "+r+" more character"+(r>1?"s":"");return Wy(A0.call(t,0,e.maxStringLength),e)+n}var i=fs.call(fs.call(t,/(['\\])/g,"\\$1"),/[\x00-\x1f]/g,l6);return Vy(i,"single",e)}function l6(t){var e=t.charCodeAt(0),r={8:"b",9:"t",10:"n",12:"f",13:"r"}[e];return r?"\\"+r:"\\x"+(e<16?"0":"")+H9.call(e.toString(16))}function el(t){return"Object("+t+")"}function Md(t){return t+" { ? }"}function Cb(t,e,r,n){var i=n?Zh(r,n):ei.call(r,", ");return t+" ("+e+") {"+i+"}"}function u6(t){for(var e=0;e<t.length;e++)if(Hy(t[e],`
-`)>=0)return!1;return!0}function f6(t,e){var r;if(t.indent==="	")r="	";else if(typeof t.indent=="number"&&t.indent>0)r=ei.call(Array(t.indent+1)," ");else return null;return{base:r,prev:ei.call(Array(e+1),r)}}function Zh(t,e){if(t.length===0)return"";var r=`
-`+e.prev+e.base;return r+ei.call(t,","+r)+`
-`+e.prev}function Xu(t,e){var r=Qh(t),n=[];if(r){n.length=t.length;for(var i=0;i<t.length;i++)n[i]=is(t,i)?e(t[i],t):""}var s=typeof Bd=="function"?Bd(t):[],o;if(go){o={};for(var f=0;f<s.length;f++)o["$"+s[f]]=s[f]}for(var c in t)is(t,c)&&(r&&String(Number(c))===c&&c<t.length||go&&o["$"+c]instanceof Symbol||(ky.call(/[^\w$]/,c)?n.push(e(c,t)+": "+e(t[c],t)):n.push(c+": "+e(t[c],t))));if(typeof Bd=="function")for(var d=0;d<s.length;d++)Gy.call(t,s[d])&&n.push("["+e(s[d])+"]: "+e(t[s[d]],t));return n}var Xy=Io,No=P9,c6=X9,p6=Hl,ju=Xy("%WeakMap%",!0),zu=Xy("%Map%",!0),d6=No("WeakMap.prototype.get",!0),h6=No("WeakMap.prototype.set",!0),E6=No("WeakMap.prototype.has",!0),m6=No("Map.prototype.get",!0),g6=No("Map.prototype.set",!0),_6=No("Map.prototype.has",!0),L0=function(t,e){for(var r=t,n;(n=r.next)!==null;r=n)if(n.key===e)return r.next=n.next,n.next=t.next,t.next=n,n},T6=function(t,e){var r=L0(t,e);return r&&r.value},v6=function(t,e,r){var n=L0(t,e);n?n.value=r:t.next={key:e,next:t.next,value:r}},b6=function(t,e){return!!L0(t,e)},x6=function(){var e,r,n,i={assert:function(s){if(!i.has(s))throw new p6("Side channel does not contain "+c6(s))},get:function(s){if(ju&&s&&(typeof s=="object"||typeof s=="function")){if(e)return d6(e,s)}else if(zu){if(r)return m6(r,s)}else if(n)return T6(n,s)},has:function(s){if(ju&&s&&(typeof s=="object"||typeof s=="function")){if(e)return E6(e,s)}else if(zu){if(r)return _6(r,s)}else if(n)return b6(n,s);return!1},set:function(s,o){ju&&s&&(typeof s=="object"||typeof s=="function")?(e||(e=new ju),h6(e,s,o)):zu?(r||(r=new zu),g6(r,s,o)):(n||(n={key:{},next:null}),v6(n,s,o))}};return i},R6=String.prototype.replace,S6=/%20/g,$d={RFC1738:"RFC1738",RFC3986:"RFC3986"},C0={default:$d.RFC3986,formatters:{RFC1738:function(t){return R6.call(t,S6,"+")},RFC3986:function(t){return String(t)}},RFC1738:$d.RFC1738,RFC3986:$d.RFC3986},y6=C0,Kd=Object.prototype.hasOwnProperty,Xs=Array.isArray,jn=function(){for(var t=[],e=0;e<256;++e)t.push("%"+((e<16?"0":"")+e.toString(16)).toUpperCase());return t}(),A6=function(e){for(;e.length>1;){var r=e.pop(),n=r.obj[r.prop];if(Xs(n)){for(var i=[],s=0;s<n.length;++s)typeof n[s]<"u"&&i.push(n[s]);r.obj[r.prop]=i}}},jy=function(e,r){for(var n=r&&r.plainObjects?Object.create(null):{},i=0;i<e.length;++i)typeof e[i]<"u"&&(n[i]=e[i]);return n},L6=function t(e,r,n){if(!r)return e;if(typeof r!="object"){if(Xs(e))e.push(r);else if(e&&typeof e=="object")(n&&(n.plainObjects||n.allowPrototypes)||!Kd.call(Object.prototype,r))&&(e[r]=!0);else return[e,r];return e}if(!e||typeof e!="object")return[e].concat(r);var i=e;return Xs(e)&&!Xs(r)&&(i=jy(e,n)),Xs(e)&&Xs(r)?(r.forEach(function(s,o){if(Kd.call(e,o)){var f=e[o];f&&typeof f=="object"&&s&&typeof s=="object"?e[o]=t(f,s,n):e.push(s)}else e[o]=s}),e):Object.keys(r).reduce(function(s,o){var f=r[o];return Kd.call(s,o)?s[o]=t(s[o],f,n):s[o]=f,s},i)},C6=function(e,r){return Object.keys(r).reduce(function(n,i){return n[i]=r[i],n},e)},w6=function(t,e,r){var n=t.replace(/\+/g," ");if(r==="iso-8859-1")return n.replace(/%[0-9a-f]{2}/gi,unescape);try{return decodeURIComponent(n)}catch{return n}},kd=1024,O6=function(e,r,n,i,s){if(e.length===0)return e;var o=e;if(typeof e=="symbol"?o=Symbol.prototype.toString.call(e):typeof e!="string"&&(o=String(e)),n==="iso-8859-1")return escape(o).replace(/%u[0-9a-f]{4}/gi,function(g){return"%26%23"+parseInt(g.slice(2),16)+"%3B"});for(var f="",c=0;c<o.length;c+=kd){for(var d=o.length>=kd?o.slice(c,c+kd):o,p=[],E=0;E<d.length;++E){var m=d.charCodeAt(E);if(m===45||m===46||m===95||m===126||m>=48&&m<=57||m>=65&&m<=90||m>=97&&m<=122||s===y6.RFC1738&&(m===40||m===41)){p[p.length]=d.charAt(E);continue}if(m<128){p[p.length]=jn[m];continue}if(m<2048){p[p.length]=jn[192|m>>6]+jn[128|m&63];continue}if(m<55296||m>=57344){p[p.length]=jn[224|m>>12]+jn[128|m>>6&63]+jn[128|m&63];continue}E+=1,m=65536+((m&1023)<<10|d.charCodeAt(E)&1023),p[p.length]=jn[240|m>>18]+jn[128|m>>12&63]+jn[128|m>>6&63]+jn[128|m&63]}f+=p.join("")}return f},I6=function(e){for(var r=[{obj:{o:e},prop:"o"}],n=[],i=0;i<r.length;++i)for(var s=r[i],o=s.obj[s.prop],f=Object.keys(o),c=0;c<f.length;++c){var d=f[c],p=o[d];typeof p=="object"&&p!==null&&n.indexOf(p)===-1&&(r.push({obj:o,prop:d}),n.push(p))}return A6(r),e},N6=function(e){return Object.prototype.toString.call(e)==="[object RegExp]"},P6=function(e){return!e||typeof e!="object"?!1:!!(e.constructor&&e.constructor.isBuffer&&e.constructor.isBuffer(e))},U6=function(e,r){return[].concat(e,r)},D6=function(e,r){if(Xs(e)){for(var n=[],i=0;i<e.length;i+=1)n.push(r(e[i]));return n}return r(e)},zy={arrayToObject:jy,assign:C6,combine:U6,compact:I6,decode:w6,encode:O6,isBuffer:P6,isRegExp:N6,maybeMap:D6,merge:L6},qy=x6,hf=zy,gl=C0,B6=Object.prototype.hasOwnProperty,Yy={brackets:function(e){return e+"[]"},comma:"comma",indices:function(e,r){return e+"["+r+"]"},repeat:function(e){return e}},Jn=Array.isArray,M6=Array.prototype.push,Jy=function(t,e){M6.apply(t,Jn(e)?e:[e])},$6=Date.prototype.toISOString,wb=gl.default,cr={addQueryPrefix:!1,allowDots:!1,allowEmptyArrays:!1,arrayFormat:"indices",charset:"utf-8",charsetSentinel:!1,delimiter:"&",encode:!0,encodeDotInKeys:!1,encoder:hf.encode,encodeValuesOnly:!1,format:wb,formatter:gl.formatters[wb],indices:!1,serializeDate:function(e){return $6.call(e)},skipNulls:!1,strictNullHandling:!1},K6=function(e){return typeof e=="string"||typeof e=="number"||typeof e=="boolean"||typeof e=="symbol"||typeof e=="bigint"},Gd={},k6=function t(e,r,n,i,s,o,f,c,d,p,E,m,g,_,b,x,S,y){for(var v=e,R=y,w=0,M=!1;(R=R.get(Gd))!==void 0&&!M;){var k=R.get(e);if(w+=1,typeof k<"u"){if(k===w)throw new RangeError("Cyclic object value");M=!0}typeof R.get(Gd)>"u"&&(w=0)}if(typeof p=="function"?v=p(r,v):v instanceof Date?v=g(v):n==="comma"&&Jn(v)&&(v=hf.maybeMap(v,function(ve){return ve instanceof Date?g(ve):ve})),v===null){if(o)return d&&!x?d(r,cr.encoder,S,"key",_):r;v=""}if(K6(v)||hf.isBuffer(v)){if(d){var H=x?r:d(r,cr.encoder,S,"key",_);return[b(H)+"="+b(d(v,cr.encoder,S,"value",_))]}return[b(r)+"="+b(String(v))]}var O=[];if(typeof v>"u")return O;var z;if(n==="comma"&&Jn(v))x&&d&&(v=hf.maybeMap(v,d)),z=[{value:v.length>0?v.join(",")||null:void 0}];else if(Jn(p))z=p;else{var ie=Object.keys(v);z=E?ie.sort(E):ie}var G=c?r.replace(/\./g,"%2E"):r,X=i&&Jn(v)&&v.length===1?G+"[]":G;if(s&&Jn(v)&&v.length===0)return X+"[]";for(var ee=0;ee<z.length;++ee){var B=z[ee],Q=typeof B=="object"&&typeof B.value<"u"?B.value:v[B];if(!(f&&Q===null)){var W=m&&c?B.replace(/\./g,"%2E"):B,j=Jn(v)?typeof n=="function"?n(X,W):X:X+(m?"."+W:"["+W+"]");y.set(e,w);var ue=qy();ue.set(Gd,y),Jy(O,t(Q,j,n,i,s,o,f,c,n==="comma"&&x&&Jn(v)?null:d,p,E,m,g,_,b,x,S,ue))}}return O},G6=function(e){if(!e)return cr;if(typeof e.allowEmptyArrays<"u"&&typeof e.allowEmptyArrays!="boolean")throw new TypeError("`allowEmptyArrays` option can only be `true` or `false`, when provided");if(typeof e.encodeDotInKeys<"u"&&typeof e.encodeDotInKeys!="boolean")throw new TypeError("`encodeDotInKeys` option can only be `true` or `false`, when provided");if(e.encoder!==null&&typeof e.encoder<"u"&&typeof e.encoder!="function")throw new TypeError("Encoder has to be a function.");var r=e.charset||cr.charset;if(typeof e.charset<"u"&&e.charset!=="utf-8"&&e.charset!=="iso-8859-1")throw new TypeError("The charset option must be either utf-8, iso-8859-1, or undefined");var n=gl.default;if(typeof e.format<"u"){if(!B6.call(gl.formatters,e.format))throw new TypeError("Unknown format option provided.");n=e.format}var i=gl.formatters[n],s=cr.filter;(typeof e.filter=="function"||Jn(e.filter))&&(s=e.filter);var o;if(e.arrayFormat in Yy?o=e.arrayFormat:"indices"in e?o=e.indices?"indices":"repeat":o=cr.arrayFormat,"commaRoundTrip"in e&&typeof e.commaRoundTrip!="boolean")throw new TypeError("`commaRoundTrip` must be a boolean, or absent");var f=typeof e.allowDots>"u"?e.encodeDotInKeys===!0?!0:cr.allowDots:!!e.allowDots;return{addQueryPrefix:typeof e.addQueryPrefix=="boolean"?e.addQueryPrefix:cr.addQueryPrefix,allowDots:f,allowEmptyArrays:typeof e.allowEmptyArrays=="boolean"?!!e.allowEmptyArrays:cr.allowEmptyArrays,arrayFormat:o,charset:r,charsetSentinel:typeof e.charsetSentinel=="boolean"?e.charsetSentinel:cr.charsetSentinel,commaRoundTrip:e.commaRoundTrip,delimiter:typeof e.delimiter>"u"?cr.delimiter:e.delimiter,encode:typeof e.encode=="boolean"?e.encode:cr.encode,encodeDotInKeys:typeof e.encodeDotInKeys=="boolean"?e.encodeDotInKeys:cr.encodeDotInKeys,encoder:typeof e.encoder=="function"?e.encoder:cr.encoder,encodeValuesOnly:typeof e.encodeValuesOnly=="boolean"?e.encodeValuesOnly:cr.encodeValuesOnly,filter:s,format:n,formatter:i,serializeDate:typeof e.serializeDate=="function"?e.serializeDate:cr.serializeDate,skipNulls:typeof e.skipNulls=="boolean"?e.skipNulls:cr.skipNulls,sort:typeof e.sort=="function"?e.sort:null,strictNullHandling:typeof e.strictNullHandling=="boolean"?e.strictNullHandling:cr.strictNullHandling}},V6=function(t,e){var r=t,n=G6(e),i,s;typeof n.filter=="function"?(s=n.filter,r=s("",r)):Jn(n.filter)&&(s=n.filter,i=s);var o=[];if(typeof r!="object"||r===null)return"";var f=Yy[n.arrayFormat],c=f==="comma"&&n.commaRoundTrip;i||(i=Object.keys(r)),n.sort&&i.sort(n.sort);for(var d=qy(),p=0;p<i.length;++p){var E=i[p];n.skipNulls&&r[E]===null||Jy(o,k6(r[E],E,f,c,n.allowEmptyArrays,n.strictNullHandling,n.skipNulls,n.encodeDotInKeys,n.encode?n.encoder:null,n.filter,n.sort,n.allowDots,n.serializeDate,n.format,n.formatter,n.encodeValuesOnly,n.charset,d))}var m=o.join(n.delimiter),g=n.addQueryPrefix===!0?"?":"";return n.charsetSentinel&&(n.charset==="iso-8859-1"?g+="utf8=%26%2310003%3B&":g+="utf8=%E2%9C%93&"),m.length>0?g+m:""},_o=zy,eE=Object.prototype.hasOwnProperty,F6=Array.isArray,er={allowDots:!1,allowEmptyArrays:!1,allowPrototypes:!1,allowSparse:!1,arrayLimit:20,charset:"utf-8",charsetSentinel:!1,comma:!1,decodeDotInKeys:!1,decoder:_o.decode,delimiter:"&",depth:5,duplicates:"combine",ignoreQueryPrefix:!1,interpretNumericEntities:!1,parameterLimit:1e3,parseArrays:!0,plainObjects:!1,strictDepth:!1,strictNullHandling:!1},H6=function(t){return t.replace(/&#(\d+);/g,function(e,r){return String.fromCharCode(parseInt(r,10))})},Qy=function(t,e){return t&&typeof t=="string"&&e.comma&&t.indexOf(",")>-1?t.split(","):t},W6="utf8=%26%2310003%3B",X6="utf8=%E2%9C%93",j6=function(e,r){var n={__proto__:null},i=r.ignoreQueryPrefix?e.replace(/^\?/,""):e;i=i.replace(/%5B/gi,"[").replace(/%5D/gi,"]");var s=r.parameterLimit===1/0?void 0:r.parameterLimit,o=i.split(r.delimiter,s),f=-1,c,d=r.charset;if(r.charsetSentinel)for(c=0;c<o.length;++c)o[c].indexOf("utf8=")===0&&(o[c]===X6?d="utf-8":o[c]===W6&&(d="iso-8859-1"),f=c,c=o.length);for(c=0;c<o.length;++c)if(c!==f){var p=o[c],E=p.indexOf("]="),m=E===-1?p.indexOf("="):E+1,g,_;m===-1?(g=r.decoder(p,er.decoder,d,"key"),_=r.strictNullHandling?null:""):(g=r.decoder(p.slice(0,m),er.decoder,d,"key"),_=_o.maybeMap(Qy(p.slice(m+1),r),function(x){return r.decoder(x,er.decoder,d,"value")})),_&&r.interpretNumericEntities&&d==="iso-8859-1"&&(_=H6(_)),p.indexOf("[]=")>-1&&(_=F6(_)?[_]:_);var b=eE.call(n,g);b&&r.duplicates==="combine"?n[g]=_o.combine(n[g],_):(!b||r.duplicates==="last")&&(n[g]=_)}return n},z6=function(t,e,r,n){for(var i=n?e:Qy(e,r),s=t.length-1;s>=0;--s){var o,f=t[s];if(f==="[]"&&r.parseArrays)o=r.allowEmptyArrays&&(i===""||r.strictNullHandling&&i===null)?[]:[].concat(i);else{o=r.plainObjects?Object.create(null):{};var c=f.charAt(0)==="["&&f.charAt(f.length-1)==="]"?f.slice(1,-1):f,d=r.decodeDotInKeys?c.replace(/%2E/g,"."):c,p=parseInt(d,10);!r.parseArrays&&d===""?o={0:i}:!isNaN(p)&&f!==d&&String(p)===d&&p>=0&&r.parseArrays&&p<=r.arrayLimit?(o=[],o[p]=i):d!=="__proto__"&&(o[d]=i)}i=o}return i},q6=function(e,r,n,i){if(e){var s=n.allowDots?e.replace(/\.([^.[]+)/g,"[$1]"):e,o=/(\[[^[\]]*])/,f=/(\[[^[\]]*])/g,c=n.depth>0&&o.exec(s),d=c?s.slice(0,c.index):s,p=[];if(d){if(!n.plainObjects&&eE.call(Object.prototype,d)&&!n.allowPrototypes)return;p.push(d)}for(var E=0;n.depth>0&&(c=f.exec(s))!==null&&E<n.depth;){if(E+=1,!n.plainObjects&&eE.call(Object.prototype,c[1].slice(1,-1))&&!n.allowPrototypes)return;p.push(c[1])}if(c){if(n.strictDepth===!0)throw new RangeError("Input depth exceeded depth option of "+n.depth+" and strictDepth is true");p.push("["+s.slice(c.index)+"]")}return z6(p,r,n,i)}},Y6=function(e){if(!e)return er;if(typeof e.allowEmptyArrays<"u"&&typeof e.allowEmptyArrays!="boolean")throw new TypeError("`allowEmptyArrays` option can only be `true` or `false`, when provided");if(typeof e.decodeDotInKeys<"u"&&typeof e.decodeDotInKeys!="boolean")throw new TypeError("`decodeDotInKeys` option can only be `true` or `false`, when provided");if(e.decoder!==null&&typeof e.decoder<"u"&&typeof e.decoder!="function")throw new TypeError("Decoder has to be a function.");if(typeof e.charset<"u"&&e.charset!=="utf-8"&&e.charset!=="iso-8859-1")throw new TypeError("The charset option must be either utf-8, iso-8859-1, or undefined");var r=typeof e.charset>"u"?er.charset:e.charset,n=typeof e.duplicates>"u"?er.duplicates:e.duplicates;if(n!=="combine"&&n!=="first"&&n!=="last")throw new TypeError("The duplicates option must be either combine, first, or last");var i=typeof e.allowDots>"u"?e.decodeDotInKeys===!0?!0:er.allowDots:!!e.allowDots;return{allowDots:i,allowEmptyArrays:typeof e.allowEmptyArrays=="boolean"?!!e.allowEmptyArrays:er.allowEmptyArrays,allowPrototypes:typeof e.allowPrototypes=="boolean"?e.allowPrototypes:er.allowPrototypes,allowSparse:typeof e.allowSparse=="boolean"?e.allowSparse:er.allowSparse,arrayLimit:typeof e.arrayLimit=="number"?e.arrayLimit:er.arrayLimit,charset:r,charsetSentinel:typeof e.charsetSentinel=="boolean"?e.charsetSentinel:er.charsetSentinel,comma:typeof e.comma=="boolean"?e.comma:er.comma,decodeDotInKeys:typeof e.decodeDotInKeys=="boolean"?e.decodeDotInKeys:er.decodeDotInKeys,decoder:typeof e.decoder=="function"?e.decoder:er.decoder,delimiter:typeof e.delimiter=="string"||_o.isRegExp(e.delimiter)?e.delimiter:er.delimiter,depth:typeof e.depth=="number"||e.depth===!1?+e.depth:er.depth,duplicates:n,ignoreQueryPrefix:e.ignoreQueryPrefix===!0,interpretNumericEntities:typeof e.interpretNumericEntities=="boolean"?e.interpretNumericEntities:er.interpretNumericEntities,parameterLimit:typeof e.parameterLimit=="number"?e.parameterLimit:er.parameterLimit,parseArrays:e.parseArrays!==!1,plainObjects:typeof e.plainObjects=="boolean"?e.plainObjects:er.plainObjects,strictDepth:typeof e.strictDepth=="boolean"?!!e.strictDepth:er.strictDepth,strictNullHandling:typeof e.strictNullHandling=="boolean"?e.strictNullHandling:er.strictNullHandling}},J6=function(t,e){var r=Y6(e);if(t===""||t===null||typeof t>"u")return r.plainObjects?Object.create(null):{};for(var n=typeof t=="string"?j6(t,r):t,i=r.plainObjects?Object.create(null):{},s=Object.keys(n),o=0;o<s.length;++o){var f=s[o],c=q6(f,n[f],r,typeof t=="string");i=_o.merge(i,c,r)}return r.allowSparse===!0?i:_o.compact(i)},Q6=V6,Z6=J6,eH=C0,Zy={formats:eH,parse:Z6,stringify:Q6};let tH=class{constructor(e){this.code=e.code,this.token=e.token,this.host=e.host}},rH=class{constructor(e){this.appId=e.appId,this.appTag=e.appTag,this.audienceEnabled=e.audienceEnabled,this.code=e.code,this.host=e.host,this.audienceHost=e.audienceHost,this.locked=e.locked,this.full=e.full,this.maxPlayers=e.maxPlayers,this.minPlayers=e.minPlayers,this.moderationEnabled=e.moderationEnabled,this.passwordRequired=e.passwordRequired,this.twitchLocked=e.twitchLocked,this.locale=e.locale,this.keepalive=e.keepalive,this.controllerBranch=e.controllerBranch}},nH=class{constructor(e){this.connections=e.connections}},iH=class{constructor(e){this.cause=e.cause}whenReceived(e){e.disconnect()}},sH=class{};var Dc={CreateRoomReply:tH,GetRoomReply:rH,GetAudienceReply:nH,RoomExit:iH,RoomLock:sH};const Ob=M5,aH=Zy,{CreateRoomReply:oH,GetRoomReply:lH}=Dc;let uH=class{constructor(e){if(!e.host)throw new Error("unable to create ecast APIClient: no host provided");if(this.host=e.host,!e.scheme)throw new Error("unable to create ecast APIClient: no scheme provided");this.scheme=e.scheme}url(e,r){if(r){let n=aH.stringify(r);return`${this.scheme}://${this.host}/api/v2${e}?${n}`}return`${this.scheme}://${this.host}/api/v2${e}`}async createRoom(e){let r={appTag:"test",userId:"fart",...e},n=this.url("/rooms",r),s=await Ob(n,{method:"POST"});const{body:o,error:f,ok:c}=await s.json();if(!c)throw new Error(`failed to create room: ${f}`);return new oH({code:o.code,token:o.token,host:o.host})}async getRoom(e){let r=this.url(`/rooms/${e.code}`),i=await(await Ob(r)).json();if(!i.ok)throw new Error(`unable to get room with options ${JSON.stringify(e)}: ${i.error}`);let s=i.body;return new lH({appId:s.appId,appTag:s.appTag,audienceEnabled:s.audienceEnabled,code:s.code,host:s.host,audienceHost:s.audienceHost,locked:s.locked,full:s.full,maxPlayers:s.maxPlayers,minPlayers:s.minPlayers,moderationEnabled:s.moderationEnabled,passwordRequired:s.passwordRequired,twitchLocked:s.twitchLocked,locale:s.locale,keepalive:s.keepalive,controllerBranch:s.controllerBranch})}};var fH={APIClient:uH},Ka=null;typeof WebSocket<"u"?Ka=WebSocket:typeof MozWebSocket<"u"?Ka=MozWebSocket:typeof Ut<"u"?Ka=Ut.WebSocket||Ut.MozWebSocket:typeof window<"u"?Ka=window.WebSocket||window.MozWebSocket:typeof self<"u"&&(Ka=self.WebSocket||self.MozWebSocket);var cH=Ka,w0={exports:{}},to=typeof Reflect=="object"?Reflect:null,Ib=to&&typeof to.apply=="function"?to.apply:function(e,r,n){return Function.prototype.apply.call(e,r,n)},Ef;to&&typeof to.ownKeys=="function"?Ef=to.ownKeys:Object.getOwnPropertySymbols?Ef=function(e){return Object.getOwnPropertyNames(e).concat(Object.getOwnPropertySymbols(e))}:Ef=function(e){return Object.getOwnPropertyNames(e)};function pH(t){console&&console.warn&&console.warn(t)}var eA=Number.isNaN||function(e){return e!==e};function Dt(){Dt.init.call(this)}w0.exports=Dt;w0.exports.once=mH;Dt.EventEmitter=Dt;Dt.prototype._events=void 0;Dt.prototype._eventsCount=0;Dt.prototype._maxListeners=void 0;var Nb=10;function Bc(t){if(typeof t!="function")throw new TypeError('The "listener" argument must be of type Function. Received type '+typeof t)}Object.defineProperty(Dt,"defaultMaxListeners",{enumerable:!0,get:function(){return Nb},set:function(t){if(typeof t!="number"||t<0||eA(t))throw new RangeError('The value of "defaultMaxListeners" is out of range. It must be a non-negative number. Received '+t+".");Nb=t}});Dt.init=function(){(this._events===void 0||this._events===Object.getPrototypeOf(this)._events)&&(this._events=Object.create(null),this._eventsCount=0),this._maxListeners=this._maxListeners||void 0};Dt.prototype.setMaxListeners=function(e){if(typeof e!="number"||e<0||eA(e))throw new RangeError('The value of "n" is out of range. It must be a non-negative number. Received '+e+".");return this._maxListeners=e,this};function tA(t){return t._maxListeners===void 0?Dt.defaultMaxListeners:t._maxListeners}Dt.prototype.getMaxListeners=function(){return tA(this)};Dt.prototype.emit=function(e){for(var r=[],n=1;n<arguments.length;n++)r.push(arguments[n]);var i=e==="error",s=this._events;if(s!==void 0)i=i&&s.error===void 0;else if(!i)return!1;if(i){var o;if(r.length>0&&(o=r[0]),o instanceof Error)throw o;var f=new Error("Unhandled error."+(o?" ("+o.message+")":""));throw f.context=o,f}var c=s[e];if(c===void 0)return!1;if(typeof c=="function")Ib(c,this,r);else for(var d=c.length,p=aA(c,d),n=0;n<d;++n)Ib(p[n],this,r);return!0};function rA(t,e,r,n){var i,s,o;if(Bc(r),s=t._events,s===void 0?(s=t._events=Object.create(null),t._eventsCount=0):(s.newListener!==void 0&&(t.emit("newListener",e,r.listener?r.listener:r),s=t._events),o=s[e]),o===void 0)o=s[e]=r,++t._eventsCount;else if(typeof o=="function"?o=s[e]=n?[r,o]:[o,r]:n?o.unshift(r):o.push(r),i=tA(t),i>0&&o.length>i&&!o.warned){o.warned=!0;var f=new Error("Possible EventEmitter memory leak detected. "+o.length+" "+String(e)+" listeners added. Use emitter.setMaxListeners() to increase limit");f.name="MaxListenersExceededWarning",f.emitter=t,f.type=e,f.count=o.length,pH(f)}return t}Dt.prototype.addListener=function(e,r){return rA(this,e,r,!1)};Dt.prototype.on=Dt.prototype.addListener;Dt.prototype.prependListener=function(e,r){return rA(this,e,r,!0)};function dH(){if(!this.fired)return this.target.removeListener(this.type,this.wrapFn),this.fired=!0,arguments.length===0?this.listener.call(this.target):this.listener.apply(this.target,arguments)}function nA(t,e,r){var n={fired:!1,wrapFn:void 0,target:t,type:e,listener:r},i=dH.bind(n);return i.listener=r,n.wrapFn=i,i}Dt.prototype.once=function(e,r){return Bc(r),this.on(e,nA(this,e,r)),this};Dt.prototype.prependOnceListener=function(e,r){return Bc(r),this.prependListener(e,nA(this,e,r)),this};Dt.prototype.removeListener=function(e,r){var n,i,s,o,f;if(Bc(r),i=this._events,i===void 0)return this;if(n=i[e],n===void 0)return this;if(n===r||n.listener===r)--this._eventsCount===0?this._events=Object.create(null):(delete i[e],i.removeListener&&this.emit("removeListener",e,n.listener||r));else if(typeof n!="function"){for(s=-1,o=n.length-1;o>=0;o--)if(n[o]===r||n[o].listener===r){f=n[o].listener,s=o;break}if(s<0)return this;s===0?n.shift():hH(n,s),n.length===1&&(i[e]=n[0]),i.removeListener!==void 0&&this.emit("removeListener",e,f||r)}return this};Dt.prototype.off=Dt.prototype.removeListener;Dt.prototype.removeAllListeners=function(e){var r,n,i;if(n=this._events,n===void 0)return this;if(n.removeListener===void 0)return arguments.length===0?(this._events=Object.create(null),this._eventsCount=0):n[e]!==void 0&&(--this._eventsCount===0?this._events=Object.create(null):delete n[e]),this;if(arguments.length===0){var s=Object.keys(n),o;for(i=0;i<s.length;++i)o=s[i],o!=="removeListener"&&this.removeAllListeners(o);return this.removeAllListeners("removeListener"),this._events=Object.create(null),this._eventsCount=0,this}if(r=n[e],typeof r=="function")this.removeListener(e,r);else if(r!==void 0)for(i=r.length-1;i>=0;i--)this.removeListener(e,r[i]);return this};function iA(t,e,r){var n=t._events;if(n===void 0)return[];var i=n[e];return i===void 0?[]:typeof i=="function"?r?[i.listener||i]:[i]:r?EH(i):aA(i,i.length)}Dt.prototype.listeners=function(e){return iA(this,e,!0)};Dt.prototype.rawListeners=function(e){return iA(this,e,!1)};Dt.listenerCount=function(t,e){return typeof t.listenerCount=="function"?t.listenerCount(e):sA.call(t,e)};Dt.prototype.listenerCount=sA;function sA(t){var e=this._events;if(e!==void 0){var r=e[t];if(typeof r=="function")return 1;if(r!==void 0)return r.length}return 0}Dt.prototype.eventNames=function(){return this._eventsCount>0?Ef(this._events):[]};function aA(t,e){for(var r=new Array(e),n=0;n<e;++n)r[n]=t[n];return r}function hH(t,e){for(;e+1<t.length;e++)t[e]=t[e+1];t.pop()}function EH(t){for(var e=new Array(t.length),r=0;r<e.length;++r)e[r]=t[r].listener||t[r];return e}function mH(t,e){return new Promise(function(r,n){function i(o){t.removeListener(e,s),n(o)}function s(){typeof t.removeListener=="function"&&t.removeListener("error",i),r([].slice.call(arguments))}oA(t,e,s,{once:!0}),e!=="error"&&gH(t,i,{once:!0})})}function gH(t,e,r){typeof t.on=="function"&&oA(t,"error",e,r)}function oA(t,e,r,n){if(typeof t.on=="function")n.once?t.once(e,r):t.on(e,r);else if(typeof t.addEventListener=="function")t.addEventListener(e,function i(s){n.once&&t.removeEventListener(e,i),r(s)});else throw new TypeError('The "emitter" argument must be of type EventEmitter. Received type '+typeof t)}var _H=w0.exports;let TH=class{constructor(e){e&&(this.error=e.error,this.to=e.to,this.opcode=e.opcode)}toString(){return`ObservedError{
-	to:${this.to}
-	error:${this.error}
-	opcode:${this.opcode}
-}`}},Mc=class extends Error{constructor(e){super(e),e&&(this.code=e.code,this.message=e.message)}};class Xl extends Mc{constructor(e){super(e),this.code=1e3,this.message=e&&e.message?e.message:"ecast server error"}}class lA extends Xl{constructor(e){super(e),this.code=1001,this.message=e&&e.message?e.message:"create room failed"}}class uA extends Xl{constructor(e){super(e),this.code=1002,this.message=e&&e.message?e.message:"unable to connect to room"}}class fA extends Xl{constructor(e){super(e),this.code=1003,this.message=e&&e.message?e.message:"server is shutting down"}}class It extends Mc{constructor(e){super(e),this.code=2e3,this.message=e&&e.message?e.message:"ecast client error"}}class cA extends It{constructor(e){super(e),this.code=2001,this.message=e&&e.message?e.message:"parse error in ecast protocol"}}class pA extends It{constructor(e){super(e),this.code=2002,this.message=e&&e.message?e.message:"missing opcode"}}class dA extends It{constructor(e){super(e),this.code=2003,this.message=e&&e.message?e.message:"invalid opcode"}}class hA extends It{constructor(e){super(e),this.code=2004,this.message=e&&e.message?e.message:"invalid arguments"}}class EA extends It{constructor(e){super(e),this.code=2005,this.message=e&&e.message?e.message:"entity not found"}}class mA extends It{constructor(e){super(e),this.code=2006,this.message=e&&e.message?e.message:"an entity already exists with that key"}}class gA extends It{constructor(e){super(e),this.code=2007,this.message=e&&e.message?e.message:"the entity is not of the expected type"}}class _A extends It{constructor(e){super(e),this.code=2008,this.message=e&&e.message?e.message:"no such client"}}class TA extends It{constructor(e){super(e),this.code=2009,this.message=e&&e.message?e.message:"room is locked"}}class vA extends It{constructor(e){super(e),this.code=2010,this.message=e&&e.message?e.message:"room is full"}}class bA extends It{constructor(e){super(e),this.code=2011,this.message=e&&e.message?e.message:"no such license"}}class xA extends It{constructor(e){super(e),this.code=2012,this.message=e&&e.message?e.message:"invalid license"}}class RA extends It{constructor(e){super(e),this.code=2013,this.message=e&&e.message?e.message:"room not found"}}class SA extends It{constructor(e){super(e),this.code=2014,this.message=e&&e.message?e.message:"requested role does not exist"}}class yA extends It{constructor(e){super(e),this.code=2015,this.message=e&&e.message?e.message:"twitch login required"}}class AA extends It{constructor(e){super(e),this.code=2016,this.message=e&&e.message?e.message:"no such option"}}class LA extends It{constructor(e){super(e),this.code=2017,this.message=e&&e.message?e.message:"password required"}}class CA extends It{constructor(e){super(e),this.code=2018,this.message=e&&e.message?e.message:"invalid room password"}}class wA extends It{constructor(e){super(e),this.code=2019,this.message=e&&e.message?e.message:"missing name"}}class OA extends It{constructor(e){super(e),this.code=2021,this.message=e&&e.message?e.message:"text did not pass text filters"}}class IA extends It{constructor(e){super(e),this.code=2022,this.message=e&&e.message?e.message:"no such filter"}}class NA extends It{constructor(e){super(e),this.code=2023,this.message=e&&e.message?e.message:"permission denied"}}class PA extends It{constructor(e){super(e),this.code=2024,this.message=e&&e.message?e.message:"not connected to a room"}}class UA extends It{constructor(e){super(e),this.code=2025,this.message=e&&e.message?e.message:"illegal operation"}}class DA extends It{constructor(e){super(e),this.code=2026,this.message=e&&e.message?e.message:"invalid ACL change"}}class BA extends It{constructor(e){super(e),this.code=2027,this.message=e&&e.message?e.message:"room has already ended"}}class MA extends It{constructor(e){super(e),this.code=2028,this.message=e&&e.message?e.message:"the entity is locked"}}class $A extends It{constructor(e){super(e),this.code=2420,this.message=e&&e.message?e.message:"rate limit exceeded"}}function vH({code:t,message:e}){const r=bH[t];return r?new r({message:e}):new Mc({message:e})}var _l={createError:vH,CallError:Mc,EcastServerError:Xl,EcastCreateRoomFailed:lA,EcastDialRoomFailed:uA,EcastServerIsShuttingDown:fA,EcastClientError:It,EcastParseError:cA,EcastRequestIsMissingOpcode:pA,EcastRequestHasInvalidOpcode:dA,EcastRequestHasInvalidArguments:hA,EcastEntityNotFound:EA,EcastEntityAlreadyExists:mA,EcastEntityTypeError:gA,EcastNoSuchClient:_A,EcastRoomIsLocked:TA,EcastRoomIsFull:vA,EcastLicenseNotFound:bA,EcastLicenseCheckFailed:xA,EcastRoomNotFound:RA,EcastInvalidRole:SA,EcastTwitchLoginRequired:yA,EcastInvalidOption:AA,EcastPasswordRequired:LA,EcastInvalidPassword:CA,EcastNameRequired:wA,EcastFilterError:OA,EcastNoSuchFilter:IA,EcastPermissionDenied:NA,EcastNotConnected:PA,EcastIllegalOperation:UA,EcastACLChangeDenied:DA,EcastRoomHasEnded:BA,EcastEntityLocked:MA,EcastRateLimitExceeded:$A,ObservedError:TH};const bH={1e3:Xl,1001:lA,1002:uA,1003:fA,2e3:It,2001:cA,2002:pA,2003:dA,2004:hA,2005:EA,2006:mA,2007:gA,2008:_A,2009:TA,2010:vA,2011:bA,2012:xA,2013:RA,2014:SA,2015:yA,2016:AA,2017:LA,2018:CA,2019:wA,2021:OA,2022:IA,2023:NA,2024:PA,2025:UA,2026:DA,2027:BA,2028:MA,2420:$A};let xH=class{constructor(e){this.id=e.id,this.deviceId=e.deviceId,this.name=e.name,this.secret=e.secret,this.reconnect=e.reconnect,this.entities=e.entities,this.here=e.here,this.profile=e.profile,this.replayEnd=e.replayEnd}},RH=class{constructor(e){this.id=e.id,this.userId=e.userId,this.name=e.name,this.role=e.role,this.reconnect=e.reconnect}},SH=class{constructor(e){this.id=e.id,this.role=e.role}},yH=class{constructor(e){this.to=e.to,this.from=e.from,this.body=e.body,this.userId=e.userId}},AH=class{constructor(e){this.id=e.id,this.banned=e.banned,this.reason=e.reason}};var O0={ClientConnected:RH,ClientDisconnected:SH,ClientKicked:AH,ClientSend:yH,ClientWelcome:xH};let LH=class{constructor(e){this.choices=e.choices,this.key=e.key,this.meta=e.meta||{}}whenReceived(e){e.entities[this.key]=this}toString(){return`CountGroup{
-	choices: ${this.choices}
-	meta:${JSON.stringify(this.meta)}
-}`}};var I0={CountGroup:LH};let CH=class{constructor(e){this.key=e.key,this.from=e.from,this.colors=e.colors,this.lines=e.lines,this.live=e.live,this.maxLayer=e.maxLayer,this.maxPoints=e.maxPoints,this.size=e.size,this.weights=e.weights,this.meta=e.meta||{},e.acl&&(this.acl=e.acl)}whenReceived(e){e.entities[this.key]=this}toString(){return`Doodle{
-	key:${this.key}
-	colors:${this.colors}
-	lines:${this.lines}
-	live:${this.live}
-	maxLayer:${this.maxLayer}
-	maxPoints:${this.maxPoints}
-	size:${this.size}
-	weights:${this.weights}
-	meta:${JSON.stringify(this.meta)}
-}`}},wH=class{constructor(e){this.key=e.key,this.from=e.from,this.line=e.line}whenReceived(e){e.entities[this.key].lines.push(this.line)}toString(){return`DoodleLine{
-	val:${this.line}
-}`}},OH=class{constructor(e){this.key=e.key,this.from=e.from,this.index=e.index}whenReceived(e){e.entities[this.key].lines.splice(this.index,1)}toString(){return`DoodleLineRemoved{
-	index:${this.index}
-}`}};var N0={DoodleEntity:CH,DoodleLine:wH,DoodleLineRemoved:OH};let IH=class{constructor(e){this.key=e.key,this.count=e.count,this.meta=e.meta||{}}whenReceived(e){e.entities[this.key]=this}toString(){return`GCounter{
-	count:${this.count}
-	meta:${this.meta}
-}`}};var P0={GCounter:IH};let NH=class{constructor(e){this.pc=e.pc,this.opcode=e.opcode,this.result=e.result}};var KA={Notification:NH};let PH=class kA{constructor(e){this.from=e.from,this.key=e.key,this.val=e.val,this.restrictions=e.restrictions,this.version=e.version,this.meta=e.meta||{},e.acl&&(this.acl=e.acl)}whenReceived(e){if(e.entities[this.key]&&e.entities[this.key]instanceof kA&&!this.restrictions){e.entities[this.key].val=this.val,e.entities[this.key].meta=this.meta,e.entities[this.key].version=this.version,e.entities[this.key].from=this.from;return}e.entities[this.key]=this}toString(){return`NumberEntity{
-	key:${this.key}
-	val: ${this.val}
-	restrictions: ${JSON.stringify(this.restrictions)}
-	meta: ${JSON.stringify(this.meta)}
-}`}};var U0={NumberEntity:PH};let UH=class{constructor(e){this.from=e.from,this.key=e.key,this.val=e.val,this.version=e.version,this.meta=e.meta||{},e.acl&&(this.acl=e.acl)}whenReceived(e){e.entities[this.key]=this}toString(){return`ObjectEntity{
-	key:${this.key}
-	value: ${JSON.stringify(this.val)}
-	meta:${JSON.stringify(this.meta)}
-}`}toBlob(){return this.val}},DH=class{constructor(e){this.message=e.message}toString(){return`ObjectEcho{message: ${this.message}}`}};var D0={ObjectEntity:UH,ObjectEcho:DH};let BH=class{constructor(e){this.key=e.key,this.count=e.count,this.meta=e.meta||{}}whenReceived(e){e.entities[this.key]=this}toString(){return`PNCounter{
-	count:${this.count}
-	meta:${JSON.stringify(this.meta)}
-}`}};var B0={PNCounter:BH};let MH=class{constructor(e){this.pc=e.pc,this.re=e.re,this.opcode=e.opcode,this.result=e.result}};var GA={Reply:MH};let $H=class{constructor(e){this.seq=e.seq,this.opcode=e.opcode,this.params=e.params}};var KH={Request:$H};let kH=class{constructor(e){this.key=e.key,this.size=e.size,this.version=e.version,this.from=e.from,this.meta=e.meta||{},e.acl&&(this.acl=e.acl)}whenRecived(e){e.entities[this.key]=this}toString(){return`Stack{
-	key:${this.key}
-	size:${this.size}
-	version:${this.version}
-	from:${this.from}
-	meta:${this.meta}
-}`}},GH=class{constructor(e){this.key=e.key,this.val=e.val}toString(){return`StackElement{
-	key:${this.key}
-	value: ${JSON.stringify(this.val)}
-}`}},VH=class{constructor(e){this.key=e.key,this.vals=e.vals}toString(){return`StackElements{
-	key:${this.key}
-	values: ${JSON.stringify(this.vals)}
-}`}};var VA={StackEntity:kH,StackElement:GH,StackElements:VH};let FH=class{constructor(e){this.from=e.from,this.key=e.key,this.text=e.text,this.version=e.version,this.meta=e.meta||{},e.acl&&(this.acl=e.acl)}whenReceived(e){e.entities[this.key]=this,e.emit("text "+this.key,this)}toString(){return`TextEntity{
-	key: ${this.key}
-	text: ${this.text}
-	meta:${JSON.stringify(this.meta)}
-}`}toBlob(){return JSON.parse(this.text)}},HH=class{constructor(e){this.message=e.message}toString(){return`TextEcho{
-	key: ${this.key}
-	message: ${this.message}
-}`}};var M0={TextEntity:FH,TextEcho:HH};let WH=class{constructor(e){this.from=e.from,this.key=e.key,this.meta=e.meta||{},this.root=e.root,e.acl&&(this.acl=e.acl)}whenReceived(e){e.entities[this.key]=this}toString(){return`TextMap{
-	key:${this.key}
-	meta:${JSON.stringify(this.meta)}
-}`}},XH=class{constructor(e){this.from=e.from,this.key=e.key,this.msg=e.msg}toString(){const e=this.msg?this.msg.join(", "):this.msg;return`TextMapSynced{
-	key:${this.key}
-	from:${this.from}
-	msg:${e}
-}`}},jH=class{constructor(e){this.from=e.from,this.key=e.key,this.text=e.text,this.attributions=e.attributions}toString(){return`TextMapState{
-	key: ${this.key}
-	from:${this.from}
-	text:${this.text}
-	attributions:${this.attributions}
-}`}};var $0={TextMapEntity:WH,TextMapSynced:XH,TextMapState:jH};let zH=class{constructor(e){this.key=e.key,this.elements=e.elements,this.limit=e.limit,this.meta=e.meta||{}}whenReceived(e){e.entities[this.key]=this}toString(){return`TextRing{
-	elements: ${this.elements}
-	meta:${JSON.stringify(this.meta)}
-}`}};var K0={TextRing:zH};let qH=class{constructor(e){this.key=e.key,this.artifactId=e.artifactId,this.categoryId=e.categoryId,this.rootId=e.rootId,this.meta=e.meta||{}}whenReceived(e){e.entities[this.key]=this}toString(){return`ArtifactEntity${JSON.stringify(this)}
-`}};var FA={ArtifactEntity:qH};let YH=class{constructor(e){this.key=e.key}whenReceived(e){delete e.entities[this.key]}toString(){return`DropEntity{
-	key:${this.key}
-}`}};var HA={DropEntity:YH};let JH=class{constructor(e){this.message=e.message}toString(){return`Echo{message: ${this.message}
-}`}};var QH={Echo:JH};let ZH=class{constructor(e){this.key=e.key,this.from=e.from}whenReceived(e){e.entities[this.key]&&(e.entities[this.key].meta.locked=!0)}toString(){return`LockEntity{
-	key:${this.key}
-}`}};var e7={LockEntity:ZH};let t7=class{constructor(){}toString(){return"OK"}};var WA={OK:t7};const{ArtifactEntity:r7}=FA,{ClientWelcome:n7,ClientConnected:i7,ClientDisconnected:s7,ClientKicked:a7,ClientSend:o7}=O0,{CountGroup:l7}=I0,{DoodleEntity:u7,DoodleLine:f7,DoodleLineRemoved:c7}=N0,{StackEntity:p7,StackElement:d7,StackElements:h7}=VA,{DropEntity:E7}=HA,{Echo:m7}=QH,{LockEntity:g7}=e7,{GCounter:_7}=P0,{GetAudienceReply:T7,RoomExit:v7,RoomLock:b7}=Dc,{Notification:x7}=KA,{OK:R7}=WA,{NumberEntity:S7}=U0,{ObjectEcho:y7,ObjectEntity:A7}=D0,{PNCounter:Pb}=B0,{Reply:L7}=GA,{TextEcho:C7,TextEntity:w7}=M0,{TextRing:O7}=K0,{createError:Ub,ObservedError:I7}=_l,{TextMapEntity:N7,TextMapSynced:P7,TextMapState:U7}=$0;function tE(t,e,r){switch(t){case"ok":return new R7;case"echo":return new m7({message:e.message});case"lock":return new g7({key:e.key,from:e.from});case"error":return Ub({code:e.code,message:e.msg});case"error/observed":return new I7({to:e.to,opcode:e.opcode,error:Ub({code:e.error.code,message:e.error.msg})});case"string":return e;case"text":return new w7({from:e.from,key:e.key,text:e.val,version:e.version,meta:r,acl:e.acl});case"text/echo":return new C7({message:e.message});case"object":return new A7({from:e.from,key:e.key,val:e.val,meta:r,acl:e.acl});case"object/echo":return new y7({message:e.message});case"drop":return new E7({key:e.key});case"artifact":return new r7({key:e.key,artifactId:e.artifactId,categoryId:e.categoryId,rootId:e.rootId,meta:r});case"client/connected":return new i7({id:e.id,userId:e.userId,name:e.name,role:e.role,reconnect:e.reconnect});case"client/disconnected":return new s7({id:e.id,role:e.role});case"client/kicked":return new a7({id:e.id,banned:e.banned,reason:e.reason});case"client/send":return new o7({to:e.to,from:e.from,body:e.body,userId:e.userID});case"client/welcome":{let n=new n7({id:e.id,name:e.name,secret:e.secret,reconnect:e.reconnect,here:e.here,profile:e.profile,replayEnd:e.replayEnd});if(e.entities){let i={};Object.entries(e.entities).forEach(([s,o])=>{i[s]=tE(o[0],o[1],o[2])}),n.entities=i}return n}case"doodle":return new u7({key:e.key,from:e.from,colors:e.val.colors,lines:e.val.lines,live:e.val.live,maxLayer:e.val.maxLayer,maxPoints:e.val.maxPoints,size:e.val.size,weights:e.val.weights,meta:r,acl:e.acl});case"doodle/line":return new f7({key:e.key,from:e.from,line:e.val});case"doodle/line/removed":return new c7({key:e.key,from:e.from,index:e.index});case"stack":return new p7({key:e.key,size:e.size,from:e.from,version:e.version,meta:e.meta,acl:e.acl});case"stack/element":return new d7({key:e.key,val:e.val});case"stack/elements":return new h7({key:e.key,vals:e.vals});case"number":return new S7({key:e.key,val:e.val,restrictions:e.restrictions,from:e.from,version:e.version,meta:r,acl:e.acl});case"text-map":return new N7({key:e.key,from:e.from,root:e.root,meta:r,acl:e.acl});case"text-map/state":return new U7({key:e.key,from:e.from,attributions:e.attributions,text:e.text});case"text-map/synced":return new P7({key:e.key,from:e.from,msg:e.msg});case"room/exit":return new v7({cause:e.cause});case"room/lock":return new b7;case"room/get-audience":return new T7({connections:e.connections});case"audience":return new Pb({key:t,count:e[1]});case"audience/count-group":return new l7({key:e.key,choices:e.choices,meta:r});case"audience/text-ring":return new O7({key:e.key,elements:e.elements,meta:r});case"audience/g-counter":return new _7({key:e.key,count:e.count,meta:r});case"audience/pn-counter":return new Pb({key:e.key,count:e.count,meta:r});default:return console.error(`failed to parse result of type ${t}: ${JSON.stringify(e,null,2)}`),e}}function D7(t){let e=JSON.parse(t.data),r=e.opcode||e.type;return e.re?new L7({pc:e.pc,re:e.re,opcode:r,result:tE(r,e.result)}):new x7({pc:e.pc,opcode:r,result:tE(r,e.result)})}var B7={parseResponseMessage:D7};const Db=cH,M7=Zy,$7=_H,{CallError:K7}=_l,{ClientWelcome:k7}=O0,{CountGroup:G7}=I0,{DoodleEntity:V7}=N0,{GCounter:F7}=P0,{Notification:Bb}=KA,{NumberEntity:H7}=U0,{ObjectEntity:Vd}=D0,{PNCounter:W7}=B0,{Reply:X7}=GA,{Request:j7}=KH,{StackEntity:z7}=VA,{TextEntity:Fd}=M0,{TextMapEntity:q7}=$0,{TextRing:Y7}=K0,{parseResponseMessage:J7}=B7,Q7=1e3+Math.floor(Math.random()*500),Mb=13e3;let Z7=class extends $7{constructor(e){if(super(),this.debug=e.debug||!1,!e.host)throw new Error("unable to create ecast WSClient: no host provided");if(this.host=e.host,!e.code)throw new Error("unable to create ecast WSClient: no room code provided");if(this.code=e.code,e.scheme?this.scheme=e.scheme:this.scheme="wss",e.secret&&e.id)this.id=e.id,this.secret=e.secret;else{switch(e.role){case"player":if(!e.name)throw new Error("unable to create ecast WSClient: no name provided");break;case"host":if(!e.token)throw new Error("unable to create ecast WSClient: tried to connect with host role but without host token");this.token=e.token;break;case"moderator":if(!e.password)throw new Error("unable to create ecast WSClient: tried to connect with moderator role but without password");break}e.password&&(this.password=e.password),e.twitchToken&&(this.twitchToken=e.twitchToken)}this.name=e.name,this.role=e.role,this.deviceId=e.deviceId,this.userId=e.userId,this.conn=null,this.seq=0,this.pending={},this.entities={},e.role=="host"&&(this.replaySince=e.replaySince||0,this.syncEntities=e.syncEntities||!1)}connect(){const e={id:this.id,role:this.role,name:this.name,format:"json","user-id":this.userId,password:this.password};this.deviceId&&(e["device-id"]=this.deviceId),this.twitchToken&&(e["twitch-token"]=this.twitchToken),this.secret&&(e.secret=this.secret),this.role==="host"&&(e["host-token"]=this.token,this.replaySince>0&&(e["replay-since"]=this.replaySince),this.syncEntities&&(e["sync-entities"]=this.syncEntities));const r=M7.stringify(e),n=this.role==="audience"||this.id>1e7?`${this.scheme}://${this.host}/api/v2/audience/${this.code}/play?${r}`:`${this.scheme}://${this.host}/api/v2/rooms/${this.code}/play?${r}`;return new Promise((i,s)=>{let o=!1,f=!1,c=p=>{i(p),o=!0},d=p=>{s(p),o=!0};this.conn=new Db(n,"ecast-v0"),this.conn.onmessage=p=>{this.debugLog(`recv <- ${JSON.stringify(JSON.parse(p.data),null,2)}`);const E=J7(p);if(E instanceof X7)this.onReply(E);else if(E instanceof Bb){if(E.result instanceof k7)f=!0,this.id=E.result.id,this.deviceId=E.result.deviceId,this.entities=E.result.entities,this.secret=E.result.secret,E.result.name&&(this.name=E.result.name),c(E.result);else if(!o){d(E.result);return}this.onNotification(E)}else console.error(`failed to parse response messsage: ${E}`)},this.conn.onerror=p=>{o?this.emit("socketError",p):d(p)},this.conn.onclose=p=>{this.debugLog("onclose",p.code),f&&p.code===1006?this.reconnect():this.emit("socketClose",p)},this.conn.onopen=p=>{this.emit("socketOpen",p)}})}sleep(e){return new Promise(r=>setTimeout(r,e))}debugLog(...e){this.debug&&console.log(`%c[WSClient:${this.name}]`,"background-color:blue;color:white;",...e)}async reconnect(){this.disconnect(),this.debugLog("Attempting to reconnect");let e=1,r=Q7;for(;;)try{this.emit("connection",{status:"connecting",attempt:e}),await this.connect(),this.debugLog("reconnected"),this.emit("connection",{status:"connected"});return}catch(n){if(this.debugLog("reconnect error",n),n.code===1005||n.code===1e3){this.debugLog("unable to reconnect!",n),this.emit("socketClose",n);return}if(r>=Mb){this.debugLog("reconnect failed!",n),this.emit("socketClose",n);return}e+=1,this.debugLog("waiting",r),this.emit("connection",{status:"waiting",attempt:e}),await this.sleep(r),r=Math.min(Mb,r*2)}}disconnect(){this.conn&&(this.conn.close(),this.conn.onmessage=null,this.conn.onerror=null,this.conn.onopen=null,this.conn.onclose=null,this.conn=null)}onReply(e){const r=e.re,n=this.pending[r];if(!n){const i=new Bb(e);i.re=r,this.emit("notification",i);return}delete this.pending[r],e.result instanceof K7?n.reject(e.result):n.resolve(e.result)}onNotification(e){typeof e.result.whenReceived=="function"&&e.result.whenReceived(this),this.emit("notification",e),this.emit(e.opcode,e.result)}send(e,r={}){if(!this.conn)throw new Error("No connection available");if(this.conn.readyState!==Db.OPEN)throw new Error(`Socket not ready to send, readyState is ${this.conn.readyState}`);const n=++this.seq,i=new j7({seq:n,opcode:e,params:r}),s=new Promise((f,c)=>{this.pending[n]={resolve:f,reject:c,request:i}}),o=JSON.stringify(i);return this.debugLog(`send -> ${o}`),this.conn.send(o),s}lockRoom(){return this.send("room/lock")}startAudience(){return this.send("room/start-audience")}getAudience(){return this.send("room/get-audience")}mail(e,r){return this.send("client/send",{from:this.id,to:e,body:r})}kick(e,r=!1,n){return this.send("client/kick",{id:e,ban:r,reason:n})}async drop(e){const r=await this.send("drop",{key:e});return delete this.entities[e],r}echo(e){return this.send("echo",{message:e})}async lock(e){const r=await this.send("lock",{key:e});return this.entities[e].meta.locked=!0,r}async createNumber(e,r={}){let n={key:e};const{val:i=0,acl:s,min:o,max:f,increment:c,type:d}=r;n.val=i,s&&(n.acl=s),o!=null&&(n.min=o),f!=null&&(n.max=f),c&&(n.increment=c),d&&(n.type=d);const p=await this.send("number/create",n);return this.entities[e]=new H7({key:e,val:i,restrictions:{min:o,max:f,increment:c,type:d},meta:{locked:!1}}),p}async decrementNumber(e){const r=await this.send("number/decrement",{key:e});return this.entities[e].val=r.val,r}async getNumber(e){const r=await this.send("number/get",{key:e});return this.entities[e]?(this.entities[e].val=r.val,this.entities[e].restrictions=r.restrictions):this.entities[e]=r,r}async incrementNumber(e){const r=await this.send("number/increment",{key:e});return this.entities[e].val=r.val,r}async updateNumber(e,r){const n=await this.send("number/update",{key:e,val:r});return this.entities[e].val=r,n}async createObject(e,r,n){const i={key:e,val:r};n&&(i.acl=n);const s=await this.send("object/create",i);return this.entities[e]=new Vd({key:e,val:r,meta:{locked:!1}}),s}echoObject(e){return this.send("object/echo",{message:e})}async getObject(e){const r=await this.send("object/get",{key:e});return this.entities[e]?(this.entities[e].val=r.val,this.entities[e].version=r.version,this.entities[e].from=r.from):this.entities[e]=r,r}async setObject(e,r,n){const i={key:e,val:r};n&&(i.acl=n);const s=await this.send("object/set",i);return this.entities[e]=new Vd({key:e,val:r,meta:{locked:!1}}),s}async updateObject(e,r){const n=await this.send("object/update",{key:e,val:r});return this.entities[e]=new Vd({key:e,val:r,meta:{locked:!1}}),n}echoText(e){return this.send("text/echo",{message:e})}getText(e){return this.send("text/get",{key:e})}async createText(e,r,n){const i={key:e,val:r},{acl:s,accept:o,reject:f}=n;s&&(i.acl=s),o&&(i.accept=o),f&&(i.reject=f);const c=await this.send("text/create",i);return this.entities[e]=new Fd({key:e,text:r,meta:{locked:!1}}),c}async setText(e,r,n){const i={key:e,val:r};n&&(i.acl=n);const s=await this.send("text/set",i);return this.entities[e]=new Fd({key:e,text:r,meta:{locked:!1}}),s}async updateText(e,r){const n=await this.send("text/update",{key:e,val:r});return this.entities[e]=new Fd({key:e,text:r,meta:{locked:!1}}),n}async createTextMap(e,r={}){const{val:n,notifyHost:i,acl:s,accept:o,reject:f}=r;let c={key:e};n&&(c.val=r.val),i&&(c.notifyHost=r.notifyHost),s&&(c.acl=s),o&&(c.accept=o),f&&(c.reject=f);const d=await this.send("text-map/create",c);return this.entities[e]=new q7({key:e,acl:s,meta:{locked:!1}}),d}async syncTextMap(e,r){return await this.send("text-map/sync",{key:e,msg:r})}async getTextMap(e,r){const{includeNodes:n}=r;return await this.send("text-map/get",{key:e,includeNodes:n})}async createDoodle(e,r){let n={key:e};const{acl:i,colors:s,live:o,maxLayer:f,maxPoints:c,size:d,weights:p}=r;i&&(n.acl=i),s&&(n.colors=s),n.live=o,f!=null&&(n.maxLayer=f),c!=null&&(n.maxPoints=c),d&&(n.size=d),p&&(n.weights=p);const E=await this.send("doodle/create",n);return this.entities[e]=new V7({key:e,colors:s,lines:[],live:o,maxLayer:n.maxLayer||0,maxPoints:n.maxPoints||0,size:d,weights:p,meta:{locked:!1}}),E}async getDoodle(e){const r=await this.send("doodle/get",{key:e});return this.entities[e]?this.entities[e].lines=r.lines:this.entities[e]=r,r}async strokeDoodle(e,r){const{color:n,weight:i,layer:s,points:o,brush:f}=r,c={color:n,weight:i,layer:s,points:o};f&&(c.brush=f);const d=await this.send("doodle/stroke",{key:e,...c});return this.entities[e].lines.push(c),d}async undoDoodle(e){const r=await this.send("doodle/undo",{key:e});return this.entities[e].lines.pop(),r}async createStack(e,r){const n={key:e};r&&(n.acl=r);const i=await this.send("stack/create",n);return this.entities[e]=new z7({key:e,size:0,meta:{locked:!1}}),i}pushStack(e,r){return this.send("stack/push",{key:e,val:r})}bulkPushStack(e,r){return this.send("stack/bulkpush",{key:e,vals:r})}peekStack(e,r){return this.send("stack/peek",{key:e,size:r})}popStack(e){return this.send("stack/pop",{key:e})}async createCountGroup(e,r){const n=await this.send("audience/count-group/create",{name:e,options:r});return this.entities[e]=new G7({key:e,choices:r,meta:{locked:!1}}),n}incrementCountGroupCounter(e,r,n=1){return this.send("audience/count-group/increment",{name:e,vote:r,times:n})}getCountGroup(e){return this.send("audience/count-group/get",{name:e})}async createGCounter(e,r){const n=await this.send("audience/g-counter/create",{key:e,count:r});return this.entities[e]=new F7({key:e,count:r,meta:{locked:!1}}),n}incrementGCounter(e,r){return this.send("audience/g-counter/increment",{key:e,times:r})}getGCounter(e){return this.send("audience/g-counter/get",{key:e})}async createPNCounter(e,r){const n=await this.send("audience/pn-counter/create",{key:e,count:r});return this.entities[e]=new W7({key:e,count:r,meta:{locked:!1}}),n}incrementPNCounter(e,r){return this.send("audience/pn-counter/increment",{key:e,times:r})}decrementPNCounter(e,r){return this.send("audience/pn-counter/decrement",{key:e,times:r})}getPNCounter(e){return this.send("audience/pn-counter/get",{key:e})}async createTextRing(e,r){const n={key:e},{limit:i,accept:s,reject:o}=r;i&&(n.limit=i),s&&(n.accept=s),o&&(n.reject=o);const f=await this.send("audience/text-ring/create",n);return this.entities[e]=new Y7({key:e,elements:[],limit:i,meta:{locked:!1}}),f}getTextRing(e){return this.send("audience/text-ring/get",{name:e})}pushTextRing(e,r){return this.send("audience/text-ring/push",{name:e,text:r})}};var eW={WSClient:Z7};const{APIClient:tW}=fH,{WSClient:rW}=eW,{CreateRoomReply:nW,GetRoomReply:iW}=Dc,{ClientWelcome:sW,ClientDisconnected:aW}=O0,{ArtifactEntity:oW}=FA,{GCounter:lW}=P0,{NumberEntity:uW}=U0,{TextEntity:fW}=M0,{DoodleEntity:cW}=N0,{ObjectEntity:pW}=D0,{CountGroup:dW}=I0,{DropEntity:hW}=HA,{OK:EW}=WA,{RoomExit:mW}=Dc,{TextRing:gW}=K0,{TextMapEntity:_W}=$0,{PNCounter:TW}=B0;var vW={APIClient:tW,WSClient:rW,ClientWelcome:sW,CreateRoomReply:nW,DropEntity:hW,GetRoomReply:iW,ClientDisconnected:aW,RoomExit:mW,OK:EW,ArtifactEntity:oW,DoodleEntity:cW,NumberEntity:uW,CountGroup:dW,GCounter:lW,ObjectEntity:pW,PNCounter:TW,TextEntity:fW,TextRing:gW,TextMapEntity:_W};function bW(t){throw new Error('Could not dynamically require "'+t+'". Please configure the dynamicRequireTargets or/and ignoreDynamicRequires option of @rollup/plugin-commonjs appropriately for this require call to work.')}var $b={exports:{}};(function(t,e){(function(r,n){n(e)})(Ut,function(r){var n=typeof window<"u"?window:typeof Ut<"u"?Ut:typeof self<"u"?self:{},i=function($,Z){if(Z=Z.split(":")[0],$=+$,!$)return!1;switch(Z){case"http":case"ws":return $!==80;case"https":case"wss":return $!==443;case"ftp":return $!==21;case"gopher":return $!==70;case"file":return!1}return $!==0},s=Object.prototype.hasOwnProperty,o;function f(K){try{return decodeURIComponent(K.replace(/\+/g," "))}catch{return null}}function c(K){try{return encodeURIComponent(K)}catch{return null}}function d(K){for(var $=/([^=?#&]+)=?([^&]*)/g,Z={},D;D=$.exec(K);){var J=f(D[1]),fe=f(D[2]);J===null||fe===null||J in Z||(Z[J]=fe)}return Z}function p(K,$){$=$||"";var Z=[],D,J;typeof $!="string"&&($="?");for(J in K)if(s.call(K,J)){if(D=K[J],!D&&(D===null||D===o||isNaN(D))&&(D=""),J=c(J),D=c(D),J===null||D===null)continue;Z.push(J+"="+D)}return Z.length?$+Z.join("&"):""}var E=p,m=d,g={stringify:E,parse:m},_=/[\n\r\t]/g,b=/^[A-Za-z][A-Za-z0-9+-.]*:\/\//,x=/^([a-z][a-z0-9.+-]*:)?(\/\/)?([\\/]+)?([\S\s]*)/i,S=/^[a-zA-Z]:/,y=/^[\x00-\x20\u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff]+/;function v(K){return(K||"").toString().replace(y,"")}var R=[["#","hash"],["?","query"],function($,Z){return k(Z.protocol)?$.replace(/\\/g,"/"):$},["/","pathname"],["@","auth",1],[NaN,"host",void 0,1,1],[/:(\d*)$/,"port",void 0,1],[NaN,"hostname",void 0,1,1]],w={hash:1,query:1};function M(K){var $;typeof window<"u"?$=window:typeof n<"u"?$=n:typeof self<"u"?$=self:$={};var Z=$.location||{};K=K||Z;var D={},J=typeof K,fe;if(K.protocol==="blob:")D=new z(unescape(K.pathname),{});else if(J==="string"){D=new z(K,{});for(fe in w)delete D[fe]}else if(J==="object"){for(fe in K)fe in w||(D[fe]=K[fe]);D.slashes===void 0&&(D.slashes=b.test(K.href))}return D}function k(K){return K==="file:"||K==="ftp:"||K==="http:"||K==="https:"||K==="ws:"||K==="wss:"}function H(K,$){K=v(K),K=K.replace(_,""),$=$||{};var Z=x.exec(K),D=Z[1]?Z[1].toLowerCase():"",J=!!Z[2],fe=!!Z[3],we=0,Ce;return J?fe?(Ce=Z[2]+Z[3]+Z[4],we=Z[2].length+Z[3].length):(Ce=Z[2]+Z[4],we=Z[2].length):fe?(Ce=Z[3]+Z[4],we=Z[3].length):Ce=Z[4],D==="file:"?we>=2&&(Ce=Ce.slice(2)):k(D)?Ce=Z[4]:D?J&&(Ce=Ce.slice(2)):we>=2&&k($.protocol)&&(Ce=Z[4]),{protocol:D,slashes:J||k(D),slashesCount:we,rest:Ce}}function O(K,$){if(K==="")return $;for(var Z=($||"/").split("/").slice(0,-1).concat(K.split("/")),D=Z.length,J=Z[D-1],fe=!1,we=0;D--;)Z[D]==="."?Z.splice(D,1):Z[D]===".."?(Z.splice(D,1),we++):we&&(D===0&&(fe=!0),Z.splice(D,1),we--);return fe&&Z.unshift(""),(J==="."||J==="..")&&Z.push(""),Z.join("/")}function z(K,$,Z){if(K=v(K),K=K.replace(_,""),!(this instanceof z))return new z(K,$,Z);var D,J,fe,we,Ce,ke,Ct=R.slice(),hr=typeof $,Ve=this,da=0;for(hr!=="object"&&hr!=="string"&&(Z=$,$=null),Z&&typeof Z!="function"&&(Z=g.parse),$=M($),J=H(K||"",$),D=!J.protocol&&!J.slashes,Ve.slashes=J.slashes||D&&$.slashes,Ve.protocol=J.protocol||$.protocol||"",K=J.rest,(J.protocol==="file:"&&(J.slashesCount!==2||S.test(K))||!J.slashes&&(J.protocol||J.slashesCount<2||!k(Ve.protocol)))&&(Ct[3]=[/(.*)/,"pathname"]);da<Ct.length;da++){if(we=Ct[da],typeof we=="function"){K=we(K,Ve);continue}fe=we[0],ke=we[1],fe!==fe?Ve[ke]=K:typeof fe=="string"?(Ce=fe==="@"?K.lastIndexOf(fe):K.indexOf(fe),~Ce&&(typeof we[2]=="number"?(Ve[ke]=K.slice(0,Ce),K=K.slice(Ce+we[2])):(Ve[ke]=K.slice(Ce),K=K.slice(0,Ce)))):(Ce=fe.exec(K))&&(Ve[ke]=Ce[1],K=K.slice(0,Ce.index)),Ve[ke]=Ve[ke]||D&&we[3]&&$[ke]||"",we[4]&&(Ve[ke]=Ve[ke].toLowerCase())}Z&&(Ve.query=Z(Ve.query)),D&&$.slashes&&Ve.pathname.charAt(0)!=="/"&&(Ve.pathname!==""||$.pathname!=="")&&(Ve.pathname=O(Ve.pathname,$.pathname)),Ve.pathname.charAt(0)!=="/"&&k(Ve.protocol)&&(Ve.pathname="/"+Ve.pathname),i(Ve.port,Ve.protocol)||(Ve.host=Ve.hostname,Ve.port=""),Ve.username=Ve.password="",Ve.auth&&(Ce=Ve.auth.indexOf(":"),~Ce?(Ve.username=Ve.auth.slice(0,Ce),Ve.username=encodeURIComponent(decodeURIComponent(Ve.username)),Ve.password=Ve.auth.slice(Ce+1),Ve.password=encodeURIComponent(decodeURIComponent(Ve.password))):Ve.username=encodeURIComponent(decodeURIComponent(Ve.auth)),Ve.auth=Ve.password?Ve.username+":"+Ve.password:Ve.username),Ve.origin=Ve.protocol!=="file:"&&k(Ve.protocol)&&Ve.host?Ve.protocol+"//"+Ve.host:"null",Ve.href=Ve.toString()}function ie(K,$,Z){var D=this;switch(K){case"query":typeof $=="string"&&$.length&&($=(Z||g.parse)($)),D[K]=$;break;case"port":D[K]=$,i($,D.protocol)?$&&(D.host=D.hostname+":"+$):(D.host=D.hostname,D[K]="");break;case"hostname":D[K]=$,D.port&&($+=":"+D.port),D.host=$;break;case"host":D[K]=$,/:\d+$/.test($)?($=$.split(":"),D.port=$.pop(),D.hostname=$.join(":")):(D.hostname=$,D.port="");break;case"protocol":D.protocol=$.toLowerCase(),D.slashes=!Z;break;case"pathname":case"hash":if($){var J=K==="pathname"?"/":"#";D[K]=$.charAt(0)!==J?J+$:$}else D[K]=$;break;case"username":case"password":D[K]=encodeURIComponent($);break;case"auth":var fe=$.indexOf(":");~fe?(D.username=$.slice(0,fe),D.username=encodeURIComponent(decodeURIComponent(D.username)),D.password=$.slice(fe+1),D.password=encodeURIComponent(decodeURIComponent(D.password))):D.username=encodeURIComponent(decodeURIComponent($))}for(var we=0;we<R.length;we++){var Ce=R[we];Ce[4]&&(D[Ce[1]]=D[Ce[1]].toLowerCase())}return D.auth=D.password?D.username+":"+D.password:D.username,D.origin=D.protocol!=="file:"&&k(D.protocol)&&D.host?D.protocol+"//"+D.host:"null",D.href=D.toString(),D}function G(K){(!K||typeof K!="function")&&(K=g.stringify);var $,Z=this,D=Z.host,J=Z.protocol;J&&J.charAt(J.length-1)!==":"&&(J+=":");var fe=J+(Z.protocol&&Z.slashes||k(Z.protocol)?"//":"");return Z.username?(fe+=Z.username,Z.password&&(fe+=":"+Z.password),fe+="@"):Z.password?(fe+=":"+Z.password,fe+="@"):Z.protocol!=="file:"&&k(Z.protocol)&&!D&&Z.pathname!=="/"&&(fe+="@"),D[D.length-1]===":"&&(D+=":"),fe+=D+Z.pathname,$=typeof Z.query=="object"?K(Z.query):Z.query,$&&(fe+=$.charAt(0)!=="?"?"?"+$:$),Z.hash&&(fe+=Z.hash),fe}z.prototype={set:ie,toString:G},z.extractProtocol=H,z.location=M,z.trimLeft=v,z.qs=g;var X=z;function ee(K,$){setTimeout(function(Z){return K.call(Z)},4,$)}function B(K,$){typeof process<"u"&&console[K].call(null,$)}function Q(K,$){K===void 0&&(K=[]);var Z=[];return K.forEach(function(D){$(D)||Z.push(D)}),Z}function W(K,$){K===void 0&&(K=[]);var Z=[];return K.forEach(function(D){$(D)&&Z.push(D)}),Z}var j=function(){this.listeners={}};j.prototype.addEventListener=function($,Z){typeof Z=="function"&&(Array.isArray(this.listeners[$])||(this.listeners[$]=[]),W(this.listeners[$],function(D){return D===Z}).length===0&&this.listeners[$].push(Z))},j.prototype.removeEventListener=function($,Z){var D=this.listeners[$];this.listeners[$]=Q(D,function(J){return J===Z})},j.prototype.dispatchEvent=function($){for(var Z=this,D=[],J=arguments.length-1;J-- >0;)D[J]=arguments[J+1];var fe=$.type,we=this.listeners[fe];return Array.isArray(we)?(we.forEach(function(Ce){D.length>0?Ce.apply(Z,D):Ce.call(Z,$)}),!0):!1};function ue(K){var $=K.indexOf("?");return $>=0?K.slice(0,$):K}var ve=function(){this.urlMap={}};ve.prototype.attachWebSocket=function($,Z){var D=ue(Z),J=this.urlMap[D];if(J&&J.server&&J.websockets.indexOf($)===-1)return J.websockets.push($),J.server},ve.prototype.addMembershipToRoom=function($,Z){var D=this.urlMap[ue($.url)];D&&D.server&&D.websockets.indexOf($)!==-1&&(D.roomMemberships[Z]||(D.roomMemberships[Z]=[]),D.roomMemberships[Z].push($))},ve.prototype.attachServer=function($,Z){var D=ue(Z),J=this.urlMap[D];if(!J)return this.urlMap[D]={server:$,websockets:[],roomMemberships:{}},$},ve.prototype.serverLookup=function($){var Z=ue($),D=this.urlMap[Z];if(D)return D.server},ve.prototype.websocketsLookup=function($,Z,D){var J=ue($),fe,we=this.urlMap[J];if(fe=we?we.websockets:[],Z){var Ce=we.roomMemberships[Z];fe=Ce||[]}return D?fe.filter(function(ke){return ke!==D}):fe},ve.prototype.removeServer=function($){delete this.urlMap[ue($)]},ve.prototype.removeWebSocket=function($,Z){var D=ue(Z),J=this.urlMap[D];J&&(J.websockets=Q(J.websockets,function(fe){return fe===$}))},ve.prototype.removeMembershipFromRoom=function($,Z){var D=this.urlMap[ue($.url)],J=D.roomMemberships[Z];D&&J!==null&&(D.roomMemberships[Z]=Q(J,function(fe){return fe===$}))};var ae=new ve,he={CLOSE_NORMAL:1e3,CLOSE_NO_STATUS:1005,CLOSE_ABNORMAL:1006},Se={CONSTRUCTOR_ERROR:"Failed to construct 'WebSocket':",CLOSE_ERROR:"Failed to execute 'close' on 'WebSocket':",EVENT:{MESSAGE:"Failed to construct 'MessageEvent':",CLOSE:"Failed to construct 'CloseEvent':"}},He=function(){};He.prototype.stopPropagation=function(){},He.prototype.stopImmediatePropagation=function(){},He.prototype.initEvent=function($,Z,D){$===void 0&&($="undefined"),Z===void 0&&(Z=!1),D===void 0&&(D=!1),this.type=""+$,this.bubbles=!!Z,this.cancelable=!!D};var Ie=function(K){function $(Z,D){if(D===void 0&&(D={}),K.call(this),!Z)throw new TypeError(Se.EVENT_ERROR+" 1 argument required, but only 0 present.");if(typeof D!="object")throw new TypeError(Se.EVENT_ERROR+" parameter 2 ('eventInitDict') is not an object.");var J=D.bubbles,fe=D.cancelable;this.type=""+Z,this.timeStamp=Date.now(),this.target=null,this.srcElement=null,this.returnValue=!0,this.isTrusted=!1,this.eventPhase=0,this.defaultPrevented=!1,this.currentTarget=null,this.cancelable=fe?!!fe:!1,this.cancelBubble=!1,this.bubbles=J?!!J:!1}return K&&($.__proto__=K),$.prototype=Object.create(K&&K.prototype),$.prototype.constructor=$,$}(He),$e=function(K){function $(Z,D){if(D===void 0&&(D={}),K.call(this),!Z)throw new TypeError(Se.EVENT.MESSAGE+" 1 argument required, but only 0 present.");if(typeof D!="object")throw new TypeError(Se.EVENT.MESSAGE+" parameter 2 ('eventInitDict') is not an object");var J=D.bubbles,fe=D.cancelable,we=D.data,Ce=D.origin,ke=D.lastEventId,Ct=D.ports;this.type=""+Z,this.timeStamp=Date.now(),this.target=null,this.srcElement=null,this.returnValue=!0,this.isTrusted=!1,this.eventPhase=0,this.defaultPrevented=!1,this.currentTarget=null,this.cancelable=fe?!!fe:!1,this.canncelBubble=!1,this.bubbles=J?!!J:!1,this.origin=""+Ce,this.ports=typeof Ct>"u"?null:Ct,this.data=typeof we>"u"?null:we,this.lastEventId=""+(ke||"")}return K&&($.__proto__=K),$.prototype=Object.create(K&&K.prototype),$.prototype.constructor=$,$}(He),nt=function(K){function $(Z,D){if(D===void 0&&(D={}),K.call(this),!Z)throw new TypeError(Se.EVENT.CLOSE+" 1 argument required, but only 0 present.");if(typeof D!="object")throw new TypeError(Se.EVENT.CLOSE+" parameter 2 ('eventInitDict') is not an object");var J=D.bubbles,fe=D.cancelable,we=D.code,Ce=D.reason,ke=D.wasClean;this.type=""+Z,this.timeStamp=Date.now(),this.target=null,this.srcElement=null,this.returnValue=!0,this.isTrusted=!1,this.eventPhase=0,this.defaultPrevented=!1,this.currentTarget=null,this.cancelable=fe?!!fe:!1,this.cancelBubble=!1,this.bubbles=J?!!J:!1,this.code=typeof we=="number"?parseInt(we,10):0,this.reason=""+(Ce||""),this.wasClean=ke?!!ke:!1}return K&&($.__proto__=K),$.prototype=Object.create(K&&K.prototype),$.prototype.constructor=$,$}(He);function Fe(K){var $=K.type,Z=K.target,D=new Ie($);return Z&&(D.target=Z,D.srcElement=Z,D.currentTarget=Z),D}function ot(K){var $=K.type,Z=K.origin,D=K.data,J=K.target,fe=new $e($,{data:D,origin:Z});return J&&(fe.target=J,fe.srcElement=J,fe.currentTarget=J),fe}function et(K){var $=K.code,Z=K.reason,D=K.type,J=K.target,fe=K.wasClean;fe||(fe=$===he.CLOSE_NORMAL||$===he.CLOSE_NO_STATUS);var we=new nt(D,{code:$,reason:Z,wasClean:fe});return J&&(we.target=J,we.srcElement=J,we.currentTarget=J),we}function xt(K,$,Z){K.readyState=xe.CLOSING;var D=ae.serverLookup(K.url),J=et({type:"close",target:K.target,code:$,reason:Z});ee(function(){ae.removeWebSocket(K,K.url),K.readyState=xe.CLOSED,K.dispatchEvent(J),D&&D.dispatchEvent(J,D)},K)}function zt(K,$,Z){K.readyState=xe.CLOSING;var D=ae.serverLookup(K.url),J=et({type:"close",target:K.target,code:$,reason:Z,wasClean:!1}),fe=Fe({type:"error",target:K.target});ee(function(){ae.removeWebSocket(K,K.url),K.readyState=xe.CLOSED,K.dispatchEvent(fe),K.dispatchEvent(J),D&&D.dispatchEvent(J,D)},K)}function V(K){return Object.prototype.toString.call(K)!=="[object Blob]"&&!(K instanceof ArrayBuffer)&&(K=String(K)),K}var P=new WeakMap;function re(K){if(P.has(K))return P.get(K);var $=new Proxy(K,{get:function(D,J){if(J==="close")return function(Ce){Ce===void 0&&(Ce={});var ke=Ce.code||he.CLOSE_NORMAL,Ct=Ce.reason||"";xt($,ke,Ct)};if(J==="send")return function(Ce){Ce=V(Ce),K.dispatchEvent(ot({type:"message",data:Ce,origin:this.url,target:K}))};var fe=function(we){return we==="message"?"server::"+we:we};return J==="on"?function(Ce,ke){K.addEventListener(fe(Ce),ke)}:J==="off"?function(Ce,ke){K.removeEventListener(fe(Ce),ke)}:J==="target"?K:D[J]}});return P.set(K,$),$}function me(K){var $=encodeURIComponent(K).match(/%[89ABab]/g);return K.length+($?$.length:0)}function pe(K){var $=new X(K),Z=$.pathname,D=$.protocol,J=$.hash;if(!K)throw new TypeError(Se.CONSTRUCTOR_ERROR+" 1 argument required, but only 0 present.");if(Z||($.pathname="/"),D==="")throw new SyntaxError(Se.CONSTRUCTOR_ERROR+" The URL '"+$.toString()+"' is invalid.");if(D!=="ws:"&&D!=="wss:")throw new SyntaxError(Se.CONSTRUCTOR_ERROR+" The URL's scheme must be either 'ws' or 'wss'. '"+D+"' is not allowed.");if(J!=="")throw new SyntaxError(Se.CONSTRUCTOR_ERROR+" The URL contains a fragment identifier ('"+J+"'). Fragment identifiers are not allowed in WebSocket URLs.");return $.toString()}function be(K){if(K===void 0&&(K=[]),!Array.isArray(K)&&typeof K!="string")throw new SyntaxError(Se.CONSTRUCTOR_ERROR+" The subprotocol '"+K.toString()+"' is invalid.");typeof K=="string"&&(K=[K]);var $=K.map(function(D){return{count:1,protocol:D}}).reduce(function(D,J){return D[J.protocol]=(D[J.protocol]||0)+J.count,D},{}),Z=Object.keys($).filter(function(D){return $[D]>1});if(Z.length>0)throw new SyntaxError(Se.CONSTRUCTOR_ERROR+" The subprotocol '"+Z[0]+"' is duplicated.");return K}var xe=function(K){function $(D,J){K.call(this),this._onopen=null,this._onmessage=null,this._onerror=null,this._onclose=null,this.url=pe(D),J=be(J),this.protocol=J[0]||"",this.binaryType="blob",this.readyState=$.CONNECTING;var fe=re(this),we=ae.attachWebSocket(fe,this.url);ee(function(){if(this.readyState===$.CONNECTING)if(we)if(we.options.verifyClient&&typeof we.options.verifyClient=="function"&&!we.options.verifyClient())this.readyState=$.CLOSED,B("error","WebSocket connection to '"+this.url+"' failed: HTTP Authentication failed; no valid credentials available"),ae.removeWebSocket(fe,this.url),this.dispatchEvent(Fe({type:"error",target:this})),this.dispatchEvent(et({type:"close",target:this,code:he.CLOSE_NORMAL}));else{if(we.options.selectProtocol&&typeof we.options.selectProtocol=="function"){var ke=we.options.selectProtocol(J),Ct=ke!=="",hr=J.indexOf(ke)!==-1;if(Ct&&!hr){this.readyState=$.CLOSED,B("error","WebSocket connection to '"+this.url+"' failed: Invalid Sub-Protocol"),ae.removeWebSocket(fe,this.url),this.dispatchEvent(Fe({type:"error",target:this})),this.dispatchEvent(et({type:"close",target:this,code:he.CLOSE_NORMAL}));return}this.protocol=ke}this.readyState=$.OPEN,this.dispatchEvent(Fe({type:"open",target:this})),we.dispatchEvent(Fe({type:"connection"}),fe)}else this.readyState=$.CLOSED,this.dispatchEvent(Fe({type:"error",target:this})),this.dispatchEvent(et({type:"close",target:this,code:he.CLOSE_NORMAL})),B("error","WebSocket connection to '"+this.url+"' failed")},this)}K&&($.__proto__=K),$.prototype=Object.create(K&&K.prototype),$.prototype.constructor=$;var Z={onopen:{},onmessage:{},onclose:{},onerror:{}};return Z.onopen.get=function(){return this._onopen},Z.onmessage.get=function(){return this._onmessage},Z.onclose.get=function(){return this._onclose},Z.onerror.get=function(){return this._onerror},Z.onopen.set=function(D){this.removeEventListener("open",this._onopen),this._onopen=D,this.addEventListener("open",D)},Z.onmessage.set=function(D){this.removeEventListener("message",this._onmessage),this._onmessage=D,this.addEventListener("message",D)},Z.onclose.set=function(D){this.removeEventListener("close",this._onclose),this._onclose=D,this.addEventListener("close",D)},Z.onerror.set=function(D){this.removeEventListener("error",this._onerror),this._onerror=D,this.addEventListener("error",D)},$.prototype.send=function(J){var fe=this;if(this.readyState===$.CONNECTING)throw new Error("Failed to execute 'send' on 'WebSocket': Still in CONNECTING state");var we=ot({type:"server::message",origin:this.url,data:V(J)}),Ce=ae.serverLookup(this.url);Ce&&ee(function(){fe.dispatchEvent(we,J)},Ce)},$.prototype.close=function(J,fe){if(J!==void 0&&(typeof J!="number"||J!==1e3&&(J<3e3||J>4999)))throw new TypeError(Se.CLOSE_ERROR+" The code must be either 1000, or between 3000 and 4999. "+J+" is neither.");if(fe!==void 0){var we=me(fe);if(we>123)throw new SyntaxError(Se.CLOSE_ERROR+" The message must not be greater than 123 bytes.")}if(!(this.readyState===$.CLOSING||this.readyState===$.CLOSED)){var Ce=re(this);this.readyState===$.CONNECTING?zt(Ce,J||he.CLOSE_ABNORMAL,fe):xt(Ce,J||he.CLOSE_NO_STATUS,fe)}},Object.defineProperties($.prototype,Z),$}(j);xe.CONNECTING=0,xe.prototype.CONNECTING=xe.CONNECTING,xe.OPEN=1,xe.prototype.OPEN=xe.OPEN,xe.CLOSING=2,xe.prototype.CLOSING=xe.CLOSING,xe.CLOSED=3,xe.prototype.CLOSED=xe.CLOSED;var N=function(K){function $(D,J){var fe=this;D===void 0&&(D="socket.io"),J===void 0&&(J=""),K.call(this),this.binaryType="blob";var we=new X(D);we.pathname||(we.pathname="/"),this.url=we.toString(),this.readyState=$.CONNECTING,this.protocol="",this.target=this,typeof J=="string"||typeof J=="object"&&J!==null?this.protocol=J:Array.isArray(J)&&J.length>0&&(this.protocol=J[0]);var Ce=ae.attachWebSocket(this,this.url);ee(function(){Ce?(this.readyState=$.OPEN,Ce.dispatchEvent(Fe({type:"connection"}),Ce,this),Ce.dispatchEvent(Fe({type:"connect"}),Ce,this),this.dispatchEvent(Fe({type:"connect",target:this}))):(this.readyState=$.CLOSED,this.dispatchEvent(Fe({type:"error",target:this})),this.dispatchEvent(et({type:"close",target:this,code:he.CLOSE_NORMAL})),B("error","Socket.io connection to '"+this.url+"' failed"))},this),this.addEventListener("close",function(ke){fe.dispatchEvent(et({type:"disconnect",target:ke.target,code:ke.code}))})}K&&($.__proto__=K),$.prototype=Object.create(K&&K.prototype),$.prototype.constructor=$;var Z={broadcast:{}};return $.prototype.close=function(){if(this.readyState===$.OPEN){var J=ae.serverLookup(this.url);return ae.removeWebSocket(this,this.url),this.readyState=$.CLOSED,this.dispatchEvent(et({type:"close",target:this,code:he.CLOSE_NORMAL})),J&&J.dispatchEvent(et({type:"disconnect",target:this,code:he.CLOSE_NORMAL}),J),this}},$.prototype.disconnect=function(){return this.close()},$.prototype.emit=function(J){for(var fe=[],we=arguments.length-1;we-- >0;)fe[we]=arguments[we+1];if(this.readyState!==$.OPEN)throw new Error("SocketIO is already in CLOSING or CLOSED state");var Ce=ot({type:J,origin:this.url,data:fe}),ke=ae.serverLookup(this.url);return ke&&ke.dispatchEvent.apply(ke,[Ce].concat(fe)),this},$.prototype.send=function(J){return this.emit("message",J),this},Z.broadcast.get=function(){if(this.readyState!==$.OPEN)throw new Error("SocketIO is already in CLOSING or CLOSED state");var D=this,J=ae.serverLookup(this.url);if(!J)throw new Error("SocketIO can not find a server at the specified URL ("+this.url+")");return{emit:function(we,Ce){return J.emit(we,Ce,{websockets:ae.websocketsLookup(D.url,null,D)}),D},to:function(we){return J.to(we,D)},in:function(we){return J.in(we,D)}}},$.prototype.on=function(J,fe){return this.addEventListener(J,fe),this},$.prototype.off=function(J,fe){this.removeEventListener(J,fe)},$.prototype.hasListeners=function(J){var fe=this.listeners[J];return Array.isArray(fe)?!!fe.length:!1},$.prototype.join=function(J){ae.addMembershipToRoom(this,J)},$.prototype.leave=function(J){ae.removeMembershipFromRoom(this,J)},$.prototype.to=function(J){return this.broadcast.to(J)},$.prototype.in=function(){return this.to.apply(null,arguments)},$.prototype.dispatchEvent=function(J){for(var fe=this,we=[],Ce=arguments.length-1;Ce-- >0;)we[Ce]=arguments[Ce+1];var ke=J.type,Ct=this.listeners[ke];if(!Array.isArray(Ct))return!1;Ct.forEach(function(hr){we.length>0?hr.apply(fe,we):hr.call(fe,J.data?J.data:J)})},Object.defineProperties($.prototype,Z),$}(j);N.CONNECTING=0,N.OPEN=1,N.CLOSING=2,N.CLOSED=3;var U=function($,Z){return new N($,Z)};U.connect=function($,Z){return U($,Z)};var q=function(K){return K.reduce(function($,Z){return $.indexOf(Z)>-1?$:$.concat(Z)},[])};function ge(){return typeof window<"u"?window:typeof process=="object"&&typeof bW=="function"&&typeof Ut=="object"?Ut:this}var ye={mock:!0,verifyClient:null,selectProtocol:null},Re=function(K){function $(Z,D){D===void 0&&(D=ye),K.call(this);var J=new X(Z);J.pathname||(J.pathname="/"),this.url=J.toString(),this.originalWebSocket=null;var fe=ae.attachServer(this,this.url);if(!fe)throw this.dispatchEvent(Fe({type:"error"})),new Error("A mock server is already listening on this url");this.options=Object.assign({},ye,D),this.options.mock&&this.mockWebsocket()}return K&&($.__proto__=K),$.prototype=Object.create(K&&K.prototype),$.prototype.constructor=$,$.prototype.mockWebsocket=function(){var D=ge();this.originalWebSocket=D.WebSocket,D.WebSocket=xe},$.prototype.restoreWebsocket=function(){var D=ge();this.originalWebSocket!==null&&(D.WebSocket=this.originalWebSocket),this.originalWebSocket=null},$.prototype.stop=function(D){D===void 0&&(D=function(){}),this.options.mock&&this.restoreWebsocket(),ae.removeServer(this.url),typeof D=="function"&&D()},$.prototype.on=function(D,J){this.addEventListener(D,J)},$.prototype.off=function(D,J){this.removeEventListener(D,J)},$.prototype.close=function(D){D===void 0&&(D={});var J=D.code,fe=D.reason,we=D.wasClean,Ce=ae.websocketsLookup(this.url);ae.removeServer(this.url),Ce.forEach(function(ke){ke.readyState=xe.CLOSED,ke.dispatchEvent(et({type:"close",target:ke.target,code:J||he.CLOSE_NORMAL,reason:fe||"",wasClean:we}))}),this.dispatchEvent(et({type:"close"}),this)},$.prototype.emit=function(D,J,fe){var we=this;fe===void 0&&(fe={});var Ce=fe.websockets;Ce||(Ce=ae.websocketsLookup(this.url));var ke;typeof fe!="object"||arguments.length>3?(J=Array.prototype.slice.call(arguments,1,arguments.length),ke=J.map(function(Ct){return V(Ct)})):ke=V(J),Ce.forEach(function(Ct){var hr=Ct instanceof N?J:ke;Array.isArray(hr)?Ct.dispatchEvent.apply(Ct,[ot({type:D,data:hr,origin:we.url,target:Ct.target})].concat(hr)):Ct.dispatchEvent(ot({type:D,data:hr,origin:we.url,target:Ct.target}))})},$.prototype.clients=function(){return ae.websocketsLookup(this.url)},$.prototype.to=function(D,J,fe){var we=this;fe===void 0&&(fe=[]);var Ce=this,ke=q(fe.concat(ae.websocketsLookup(this.url,D,J)));return{to:function(Ct,hr){return we.to.call(we,Ct,hr,ke)},emit:function(hr,Ve){Ce.emit(hr,Ve,{websockets:ke})}}},$.prototype.in=function(){for(var D=[],J=arguments.length;J--;)D[J]=arguments[J];return this.to.apply(null,D)},$.prototype.simulate=function(D){var J=ae.websocketsLookup(this.url);D==="error"&&J.forEach(function(fe){fe.readyState=xe.CLOSED,fe.dispatchEvent(Fe({type:"error",target:fe.target}))})},$}(j);Re.of=function($){return new Re($)};var se=Re,le=xe,Ke=U;r.Server=se,r.WebSocket=le,r.SocketIO=Ke,Object.defineProperty(r,"__esModule",{value:!0})})})($b,$b.exports);var xW={exports:{}};(function(t){(function(){function e(f,c){var d=f.x-c.x,p=f.y-c.y;return d*d+p*p}function r(f,c,d){var p=c.x,E=c.y,m=d.x-p,g=d.y-E;if(m!==0||g!==0){var _=((f.x-p)*m+(f.y-E)*g)/(m*m+g*g);_>1?(p=d.x,E=d.y):_>0&&(p+=m*_,E+=g*_)}return m=f.x-p,g=f.y-E,m*m+g*g}function n(f,c){for(var d=f[0],p=[d],E,m=1,g=f.length;m<g;m++)E=f[m],e(E,d)>c&&(p.push(E),d=E);return d!==E&&p.push(E),p}function i(f,c,d,p,E){for(var m=p,g,_=c+1;_<d;_++){var b=r(f[_],f[c],f[d]);b>m&&(g=_,m=b)}m>p&&(g-c>1&&i(f,c,g,p,E),E.push(f[g]),d-g>1&&i(f,g,d,p,E))}function s(f,c){var d=f.length-1,p=[f[0]];return i(f,0,d,c,p),p.push(f[d]),p}function o(f,c,d){if(f.length<=2)return f;var p=c!==void 0?c*c:1;return f=d?f:n(f,p),f=s(f,p),f}t.exports=o,t.exports.default=o})()})(xW);var XA={},k0={},G0={};(function(t){Object.defineProperty(t,"__esModule",{value:!0}),t.EXTENDED_PICTOGRAPHIC=t.CLUSTER_BREAK=void 0,function(e){e[e.CR=0]="CR",e[e.LF=1]="LF",e[e.CONTROL=2]="CONTROL",e[e.EXTEND=3]="EXTEND",e[e.REGIONAL_INDICATOR=4]="REGIONAL_INDICATOR",e[e.SPACINGMARK=5]="SPACINGMARK",e[e.L=6]="L",e[e.V=7]="V",e[e.T=8]="T",e[e.LV=9]="LV",e[e.LVT=10]="LVT",e[e.OTHER=11]="OTHER",e[e.PREPEND=12]="PREPEND",e[e.E_BASE=13]="E_BASE",e[e.E_MODIFIER=14]="E_MODIFIER",e[e.ZWJ=15]="ZWJ",e[e.GLUE_AFTER_ZWJ=16]="GLUE_AFTER_ZWJ",e[e.E_BASE_GAZ=17]="E_BASE_GAZ"}(t.CLUSTER_BREAK||(t.CLUSTER_BREAK={})),t.EXTENDED_PICTOGRAPHIC=101})(G0);var V0={};Object.defineProperty(V0,"__esModule",{value:!0});const ht=G0,Si=0,Hd=1,RW=2,SW=3,yW=4;class AW{static isSurrogate(e,r){return 55296<=e.charCodeAt(r)&&e.charCodeAt(r)<=56319&&56320<=e.charCodeAt(r+1)&&e.charCodeAt(r+1)<=57343}static codePointAt(e,r){r===void 0&&(r=0);const n=e.charCodeAt(r);if(55296<=n&&n<=56319&&r<e.length-1){const i=n,s=e.charCodeAt(r+1);return 56320<=s&&s<=57343?(i-55296)*1024+(s-56320)+65536:i}if(56320<=n&&n<=57343&&r>=1){const i=e.charCodeAt(r-1),s=n;return 55296<=i&&i<=56319?(i-55296)*1024+(s-56320)+65536:s}return n}static shouldBreak(e,r,n,i,s,o){const f=[e].concat(r).concat([n]),c=[i].concat(s).concat([o]),d=f[f.length-2],p=n,E=o,m=f.lastIndexOf(ht.CLUSTER_BREAK.REGIONAL_INDICATOR);if(m>0&&f.slice(1,m).every(function(_){return _===ht.CLUSTER_BREAK.REGIONAL_INDICATOR})&&[ht.CLUSTER_BREAK.PREPEND,ht.CLUSTER_BREAK.REGIONAL_INDICATOR].indexOf(d)===-1)return f.filter(function(_){return _===ht.CLUSTER_BREAK.REGIONAL_INDICATOR}).length%2===1?SW:yW;if(d===ht.CLUSTER_BREAK.CR&&p===ht.CLUSTER_BREAK.LF)return Si;if(d===ht.CLUSTER_BREAK.CONTROL||d===ht.CLUSTER_BREAK.CR||d===ht.CLUSTER_BREAK.LF)return Hd;if(p===ht.CLUSTER_BREAK.CONTROL||p===ht.CLUSTER_BREAK.CR||p===ht.CLUSTER_BREAK.LF)return Hd;if(d===ht.CLUSTER_BREAK.L&&(p===ht.CLUSTER_BREAK.L||p===ht.CLUSTER_BREAK.V||p===ht.CLUSTER_BREAK.LV||p===ht.CLUSTER_BREAK.LVT))return Si;if((d===ht.CLUSTER_BREAK.LV||d===ht.CLUSTER_BREAK.V)&&(p===ht.CLUSTER_BREAK.V||p===ht.CLUSTER_BREAK.T))return Si;if((d===ht.CLUSTER_BREAK.LVT||d===ht.CLUSTER_BREAK.T)&&p===ht.CLUSTER_BREAK.T)return Si;if(p===ht.CLUSTER_BREAK.EXTEND||p===ht.CLUSTER_BREAK.ZWJ)return Si;if(p===ht.CLUSTER_BREAK.SPACINGMARK)return Si;if(d===ht.CLUSTER_BREAK.PREPEND)return Si;const g=c.slice(0,-1).lastIndexOf(ht.EXTENDED_PICTOGRAPHIC);return g!==-1&&c[g]===ht.EXTENDED_PICTOGRAPHIC&&f.slice(g+1,-2).every(function(_){return _===ht.CLUSTER_BREAK.EXTEND})&&d===ht.CLUSTER_BREAK.ZWJ&&E===ht.EXTENDED_PICTOGRAPHIC?Si:r.indexOf(ht.CLUSTER_BREAK.REGIONAL_INDICATOR)!==-1?RW:d===ht.CLUSTER_BREAK.REGIONAL_INDICATOR&&p===ht.CLUSTER_BREAK.REGIONAL_INDICATOR?Si:Hd}}V0.default=AW;var F0={};Object.defineProperty(F0,"__esModule",{value:!0});class LW{constructor(e,r){this._index=0,this._str=e,this._nextBreak=r}[Symbol.iterator](){return this}next(){let e;if((e=this._nextBreak(this._str,this._index))<this._str.length){const r=this._str.slice(this._index,e);return this._index=e,{value:r,done:!1}}if(this._index<this._str.length){const r=this._str.slice(this._index);return this._index=this._str.length,{value:r,done:!1}}return{value:void 0,done:!0}}}F0.default=LW;var jA=Ut&&Ut.__importDefault||function(t){return t&&t.__esModule?t:{default:t}};Object.defineProperty(k0,"__esModule",{value:!0});const u=G0,qu=jA(V0),CW=jA(F0);class Li{static nextBreak(e,r){if(r===void 0&&(r=0),r<0)return 0;if(r>=e.length-1)return e.length;const n=qu.default.codePointAt(e,r),i=Li.getGraphemeBreakProperty(n),s=Li.getEmojiProperty(n),o=[],f=[];for(let c=r+1;c<e.length;c++){if(qu.default.isSurrogate(e,c-1))continue;const d=qu.default.codePointAt(e,c),p=Li.getGraphemeBreakProperty(d),E=Li.getEmojiProperty(d);if(qu.default.shouldBreak(i,o,p,s,f,E))return c;o.push(p),f.push(E)}return e.length}splitGraphemes(e){const r=[];let n=0,i;for(;(i=Li.nextBreak(e,n))<e.length;)r.push(e.slice(n,i)),n=i;return n<e.length&&r.push(e.slice(n)),r}iterateGraphemes(e){return new CW.default(e,Li.nextBreak)}countGraphemes(e){let r=0,n=0,i;for(;(i=Li.nextBreak(e,n))<e.length;)n=i,r++;return n<e.length&&r++,r}static getGraphemeBreakProperty(e){if(e<48905){if(e<44116){if(e<4141){if(e<2818){if(e<2363)if(e<1759){if(e<1471){if(e<127){if(e<11){if(e<10){if(0<=e&&e<=9)return u.CLUSTER_BREAK.CONTROL}else if(e===10)return u.CLUSTER_BREAK.LF}else if(e<13){if(11<=e&&e<=12)return u.CLUSTER_BREAK.CONTROL}else if(e<14){if(e===13)return u.CLUSTER_BREAK.CR}else if(14<=e&&e<=31)return u.CLUSTER_BREAK.CONTROL}else if(e<768){if(e<173){if(127<=e&&e<=159)return u.CLUSTER_BREAK.CONTROL}else if(e===173)return u.CLUSTER_BREAK.CONTROL}else if(e<1155){if(768<=e&&e<=879)return u.CLUSTER_BREAK.EXTEND}else if(e<1425){if(1155<=e&&e<=1161)return u.CLUSTER_BREAK.EXTEND}else if(1425<=e&&e<=1469)return u.CLUSTER_BREAK.EXTEND}else if(e<1552){if(e<1476){if(e<1473){if(e===1471)return u.CLUSTER_BREAK.EXTEND}else if(1473<=e&&e<=1474)return u.CLUSTER_BREAK.EXTEND}else if(e<1479){if(1476<=e&&e<=1477)return u.CLUSTER_BREAK.EXTEND}else if(e<1536){if(e===1479)return u.CLUSTER_BREAK.EXTEND}else if(1536<=e&&e<=1541)return u.CLUSTER_BREAK.PREPEND}else if(e<1648){if(e<1564){if(1552<=e&&e<=1562)return u.CLUSTER_BREAK.EXTEND}else if(e<1611){if(e===1564)return u.CLUSTER_BREAK.CONTROL}else if(1611<=e&&e<=1631)return u.CLUSTER_BREAK.EXTEND}else if(e<1750){if(e===1648)return u.CLUSTER_BREAK.EXTEND}else if(e<1757){if(1750<=e&&e<=1756)return u.CLUSTER_BREAK.EXTEND}else if(e===1757)return u.CLUSTER_BREAK.PREPEND}else if(e<2075){if(e<1840)if(e<1770){if(e<1767){if(1759<=e&&e<=1764)return u.CLUSTER_BREAK.EXTEND}else if(1767<=e&&e<=1768)return u.CLUSTER_BREAK.EXTEND}else if(e<1807){if(1770<=e&&e<=1773)return u.CLUSTER_BREAK.EXTEND}else{if(e===1807)return u.CLUSTER_BREAK.PREPEND;if(e===1809)return u.CLUSTER_BREAK.EXTEND}else if(e<2027){if(e<1958){if(1840<=e&&e<=1866)return u.CLUSTER_BREAK.EXTEND}else if(1958<=e&&e<=1968)return u.CLUSTER_BREAK.EXTEND}else if(e<2045){if(2027<=e&&e<=2035)return u.CLUSTER_BREAK.EXTEND}else if(e<2070){if(e===2045)return u.CLUSTER_BREAK.EXTEND}else if(2070<=e&&e<=2073)return u.CLUSTER_BREAK.EXTEND}else if(e<2200){if(e<2089){if(e<2085){if(2075<=e&&e<=2083)return u.CLUSTER_BREAK.EXTEND}else if(2085<=e&&e<=2087)return u.CLUSTER_BREAK.EXTEND}else if(e<2137){if(2089<=e&&e<=2093)return u.CLUSTER_BREAK.EXTEND}else if(e<2192){if(2137<=e&&e<=2139)return u.CLUSTER_BREAK.EXTEND}else if(2192<=e&&e<=2193)return u.CLUSTER_BREAK.PREPEND}else if(e<2275){if(e<2250){if(2200<=e&&e<=2207)return u.CLUSTER_BREAK.EXTEND}else if(e<2274){if(2250<=e&&e<=2273)return u.CLUSTER_BREAK.EXTEND}else if(e===2274)return u.CLUSTER_BREAK.PREPEND}else if(e<2307){if(2275<=e&&e<=2306)return u.CLUSTER_BREAK.EXTEND}else{if(e===2307)return u.CLUSTER_BREAK.SPACINGMARK;if(e===2362)return u.CLUSTER_BREAK.EXTEND}else if(e<2561){if(e<2434){if(e<2381){if(e<2366){if(e===2363)return u.CLUSTER_BREAK.SPACINGMARK;if(e===2364)return u.CLUSTER_BREAK.EXTEND}else if(e<2369){if(2366<=e&&e<=2368)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<2377){if(2369<=e&&e<=2376)return u.CLUSTER_BREAK.EXTEND}else if(2377<=e&&e<=2380)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<2385){if(e<2382){if(e===2381)return u.CLUSTER_BREAK.EXTEND}else if(2382<=e&&e<=2383)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<2402){if(2385<=e&&e<=2391)return u.CLUSTER_BREAK.EXTEND}else if(e<2433){if(2402<=e&&e<=2403)return u.CLUSTER_BREAK.EXTEND}else if(e===2433)return u.CLUSTER_BREAK.EXTEND}else if(e<2503){if(e<2494){if(e<2492){if(2434<=e&&e<=2435)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===2492)return u.CLUSTER_BREAK.EXTEND}else if(e<2495){if(e===2494)return u.CLUSTER_BREAK.EXTEND}else if(e<2497){if(2495<=e&&e<=2496)return u.CLUSTER_BREAK.SPACINGMARK}else if(2497<=e&&e<=2500)return u.CLUSTER_BREAK.EXTEND}else if(e<2519){if(e<2507){if(2503<=e&&e<=2504)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<2509){if(2507<=e&&e<=2508)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===2509)return u.CLUSTER_BREAK.EXTEND}else if(e<2530){if(e===2519)return u.CLUSTER_BREAK.EXTEND}else if(e<2558){if(2530<=e&&e<=2531)return u.CLUSTER_BREAK.EXTEND}else if(e===2558)return u.CLUSTER_BREAK.EXTEND}else if(e<2691){if(e<2631){if(e<2620){if(e<2563){if(2561<=e&&e<=2562)return u.CLUSTER_BREAK.EXTEND}else if(e===2563)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<2622){if(e===2620)return u.CLUSTER_BREAK.EXTEND}else if(e<2625){if(2622<=e&&e<=2624)return u.CLUSTER_BREAK.SPACINGMARK}else if(2625<=e&&e<=2626)return u.CLUSTER_BREAK.EXTEND}else if(e<2672){if(e<2635){if(2631<=e&&e<=2632)return u.CLUSTER_BREAK.EXTEND}else if(e<2641){if(2635<=e&&e<=2637)return u.CLUSTER_BREAK.EXTEND}else if(e===2641)return u.CLUSTER_BREAK.EXTEND}else if(e<2677){if(2672<=e&&e<=2673)return u.CLUSTER_BREAK.EXTEND}else if(e<2689){if(e===2677)return u.CLUSTER_BREAK.EXTEND}else if(2689<=e&&e<=2690)return u.CLUSTER_BREAK.EXTEND}else if(e<2761){if(e<2750){if(e===2691)return u.CLUSTER_BREAK.SPACINGMARK;if(e===2748)return u.CLUSTER_BREAK.EXTEND}else if(e<2753){if(2750<=e&&e<=2752)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<2759){if(2753<=e&&e<=2757)return u.CLUSTER_BREAK.EXTEND}else if(2759<=e&&e<=2760)return u.CLUSTER_BREAK.EXTEND}else if(e<2786){if(e<2763){if(e===2761)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<2765){if(2763<=e&&e<=2764)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===2765)return u.CLUSTER_BREAK.EXTEND}else if(e<2810){if(2786<=e&&e<=2787)return u.CLUSTER_BREAK.EXTEND}else if(e<2817){if(2810<=e&&e<=2815)return u.CLUSTER_BREAK.EXTEND}else if(e===2817)return u.CLUSTER_BREAK.EXTEND}else if(e<3315){if(e<3076){if(e<2946){if(e<2887){if(e<2878){if(e<2876){if(2818<=e&&e<=2819)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===2876)return u.CLUSTER_BREAK.EXTEND}else if(e<2880){if(2878<=e&&e<=2879)return u.CLUSTER_BREAK.EXTEND}else if(e<2881){if(e===2880)return u.CLUSTER_BREAK.SPACINGMARK}else if(2881<=e&&e<=2884)return u.CLUSTER_BREAK.EXTEND}else if(e<2893){if(e<2891){if(2887<=e&&e<=2888)return u.CLUSTER_BREAK.SPACINGMARK}else if(2891<=e&&e<=2892)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<2901){if(e===2893)return u.CLUSTER_BREAK.EXTEND}else if(e<2914){if(2901<=e&&e<=2903)return u.CLUSTER_BREAK.EXTEND}else if(2914<=e&&e<=2915)return u.CLUSTER_BREAK.EXTEND}else if(e<3014){if(e<3007){if(e===2946||e===3006)return u.CLUSTER_BREAK.EXTEND}else if(e<3008){if(e===3007)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3009){if(e===3008)return u.CLUSTER_BREAK.EXTEND}else if(3009<=e&&e<=3010)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3031){if(e<3018){if(3014<=e&&e<=3016)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3021){if(3018<=e&&e<=3020)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===3021)return u.CLUSTER_BREAK.EXTEND}else if(e<3072){if(e===3031)return u.CLUSTER_BREAK.EXTEND}else if(e<3073){if(e===3072)return u.CLUSTER_BREAK.EXTEND}else if(3073<=e&&e<=3075)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3262){if(e<3146){if(e<3134){if(e===3076||e===3132)return u.CLUSTER_BREAK.EXTEND}else if(e<3137){if(3134<=e&&e<=3136)return u.CLUSTER_BREAK.EXTEND}else if(e<3142){if(3137<=e&&e<=3140)return u.CLUSTER_BREAK.SPACINGMARK}else if(3142<=e&&e<=3144)return u.CLUSTER_BREAK.EXTEND}else if(e<3201){if(e<3157){if(3146<=e&&e<=3149)return u.CLUSTER_BREAK.EXTEND}else if(e<3170){if(3157<=e&&e<=3158)return u.CLUSTER_BREAK.EXTEND}else if(3170<=e&&e<=3171)return u.CLUSTER_BREAK.EXTEND}else if(e<3202){if(e===3201)return u.CLUSTER_BREAK.EXTEND}else if(e<3260){if(3202<=e&&e<=3203)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===3260)return u.CLUSTER_BREAK.EXTEND}else if(e<3270){if(e<3264){if(e===3262)return u.CLUSTER_BREAK.SPACINGMARK;if(e===3263)return u.CLUSTER_BREAK.EXTEND}else if(e<3266){if(3264<=e&&e<=3265)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3267){if(e===3266)return u.CLUSTER_BREAK.EXTEND}else if(3267<=e&&e<=3268)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3276){if(e<3271){if(e===3270)return u.CLUSTER_BREAK.EXTEND}else if(e<3274){if(3271<=e&&e<=3272)return u.CLUSTER_BREAK.SPACINGMARK}else if(3274<=e&&e<=3275)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3285){if(3276<=e&&e<=3277)return u.CLUSTER_BREAK.EXTEND}else if(e<3298){if(3285<=e&&e<=3286)return u.CLUSTER_BREAK.EXTEND}else if(3298<=e&&e<=3299)return u.CLUSTER_BREAK.EXTEND}else if(e<3551){if(e<3406){if(e<3391){if(e<3330){if(e<3328){if(e===3315)return u.CLUSTER_BREAK.SPACINGMARK}else if(3328<=e&&e<=3329)return u.CLUSTER_BREAK.EXTEND}else if(e<3387){if(3330<=e&&e<=3331)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3390){if(3387<=e&&e<=3388)return u.CLUSTER_BREAK.EXTEND}else if(e===3390)return u.CLUSTER_BREAK.EXTEND}else if(e<3398){if(e<3393){if(3391<=e&&e<=3392)return u.CLUSTER_BREAK.SPACINGMARK}else if(3393<=e&&e<=3396)return u.CLUSTER_BREAK.EXTEND}else if(e<3402){if(3398<=e&&e<=3400)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3405){if(3402<=e&&e<=3404)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===3405)return u.CLUSTER_BREAK.EXTEND}else if(e<3530){if(e<3426){if(e===3406)return u.CLUSTER_BREAK.PREPEND;if(e===3415)return u.CLUSTER_BREAK.EXTEND}else if(e<3457){if(3426<=e&&e<=3427)return u.CLUSTER_BREAK.EXTEND}else if(e<3458){if(e===3457)return u.CLUSTER_BREAK.EXTEND}else if(3458<=e&&e<=3459)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3538){if(e<3535){if(e===3530)return u.CLUSTER_BREAK.EXTEND}else if(e<3536){if(e===3535)return u.CLUSTER_BREAK.EXTEND}else if(3536<=e&&e<=3537)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3542){if(3538<=e&&e<=3540)return u.CLUSTER_BREAK.EXTEND}else if(e<3544){if(e===3542)return u.CLUSTER_BREAK.EXTEND}else if(3544<=e&&e<=3550)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3893){if(e<3655){if(e<3633){if(e<3570){if(e===3551)return u.CLUSTER_BREAK.EXTEND}else if(3570<=e&&e<=3571)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3635){if(e===3633)return u.CLUSTER_BREAK.EXTEND}else if(e<3636){if(e===3635)return u.CLUSTER_BREAK.SPACINGMARK}else if(3636<=e&&e<=3642)return u.CLUSTER_BREAK.EXTEND}else if(e<3764)if(e<3761){if(3655<=e&&e<=3662)return u.CLUSTER_BREAK.EXTEND}else{if(e===3761)return u.CLUSTER_BREAK.EXTEND;if(e===3763)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3784){if(3764<=e&&e<=3772)return u.CLUSTER_BREAK.EXTEND}else if(e<3864){if(3784<=e&&e<=3790)return u.CLUSTER_BREAK.EXTEND}else if(3864<=e&&e<=3865)return u.CLUSTER_BREAK.EXTEND}else if(e<3967){if(e<3897){if(e===3893||e===3895)return u.CLUSTER_BREAK.EXTEND}else if(e<3902){if(e===3897)return u.CLUSTER_BREAK.EXTEND}else if(e<3953){if(3902<=e&&e<=3903)return u.CLUSTER_BREAK.SPACINGMARK}else if(3953<=e&&e<=3966)return u.CLUSTER_BREAK.EXTEND}else if(e<3981){if(e<3968){if(e===3967)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<3974){if(3968<=e&&e<=3972)return u.CLUSTER_BREAK.EXTEND}else if(3974<=e&&e<=3975)return u.CLUSTER_BREAK.EXTEND}else if(e<3993){if(3981<=e&&e<=3991)return u.CLUSTER_BREAK.EXTEND}else if(e<4038){if(3993<=e&&e<=4028)return u.CLUSTER_BREAK.EXTEND}else if(e===4038)return u.CLUSTER_BREAK.EXTEND}else if(e<7204){if(e<6448){if(e<5938){if(e<4226){if(e<4157){if(e<4146){if(e<4145){if(4141<=e&&e<=4144)return u.CLUSTER_BREAK.EXTEND}else if(e===4145)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<4153){if(4146<=e&&e<=4151)return u.CLUSTER_BREAK.EXTEND}else if(e<4155){if(4153<=e&&e<=4154)return u.CLUSTER_BREAK.EXTEND}else if(4155<=e&&e<=4156)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<4184){if(e<4182){if(4157<=e&&e<=4158)return u.CLUSTER_BREAK.EXTEND}else if(4182<=e&&e<=4183)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<4190){if(4184<=e&&e<=4185)return u.CLUSTER_BREAK.EXTEND}else if(e<4209){if(4190<=e&&e<=4192)return u.CLUSTER_BREAK.EXTEND}else if(4209<=e&&e<=4212)return u.CLUSTER_BREAK.EXTEND}else if(e<4352){if(e<4229){if(e===4226)return u.CLUSTER_BREAK.EXTEND;if(e===4228)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<4237){if(4229<=e&&e<=4230)return u.CLUSTER_BREAK.EXTEND}else if(e===4237||e===4253)return u.CLUSTER_BREAK.EXTEND}else if(e<4957){if(e<4448){if(4352<=e&&e<=4447)return u.CLUSTER_BREAK.L}else if(e<4520){if(4448<=e&&e<=4519)return u.CLUSTER_BREAK.V}else if(4520<=e&&e<=4607)return u.CLUSTER_BREAK.T}else if(e<5906){if(4957<=e&&e<=4959)return u.CLUSTER_BREAK.EXTEND}else if(e<5909){if(5906<=e&&e<=5908)return u.CLUSTER_BREAK.EXTEND}else if(e===5909)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<6089){if(e<6070){if(e<5970){if(e<5940){if(5938<=e&&e<=5939)return u.CLUSTER_BREAK.EXTEND}else if(e===5940)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<6002){if(5970<=e&&e<=5971)return u.CLUSTER_BREAK.EXTEND}else if(e<6068){if(6002<=e&&e<=6003)return u.CLUSTER_BREAK.EXTEND}else if(6068<=e&&e<=6069)return u.CLUSTER_BREAK.EXTEND}else if(e<6078){if(e<6071){if(e===6070)return u.CLUSTER_BREAK.SPACINGMARK}else if(6071<=e&&e<=6077)return u.CLUSTER_BREAK.EXTEND}else if(e<6086){if(6078<=e&&e<=6085)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<6087){if(e===6086)return u.CLUSTER_BREAK.EXTEND}else if(6087<=e&&e<=6088)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<6277)if(e<6155){if(e<6109){if(6089<=e&&e<=6099)return u.CLUSTER_BREAK.EXTEND}else if(e===6109)return u.CLUSTER_BREAK.EXTEND}else if(e<6158){if(6155<=e&&e<=6157)return u.CLUSTER_BREAK.EXTEND}else{if(e===6158)return u.CLUSTER_BREAK.CONTROL;if(e===6159)return u.CLUSTER_BREAK.EXTEND}else if(e<6435){if(e<6313){if(6277<=e&&e<=6278)return u.CLUSTER_BREAK.EXTEND}else if(e<6432){if(e===6313)return u.CLUSTER_BREAK.EXTEND}else if(6432<=e&&e<=6434)return u.CLUSTER_BREAK.EXTEND}else if(e<6439){if(6435<=e&&e<=6438)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<6441){if(6439<=e&&e<=6440)return u.CLUSTER_BREAK.EXTEND}else if(6441<=e&&e<=6443)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<6971){if(e<6744)if(e<6681){if(e<6451){if(e<6450){if(6448<=e&&e<=6449)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===6450)return u.CLUSTER_BREAK.EXTEND}else if(e<6457){if(6451<=e&&e<=6456)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<6679){if(6457<=e&&e<=6459)return u.CLUSTER_BREAK.EXTEND}else if(6679<=e&&e<=6680)return u.CLUSTER_BREAK.EXTEND}else if(e<6741){if(e<6683){if(6681<=e&&e<=6682)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===6683)return u.CLUSTER_BREAK.EXTEND}else if(e<6742){if(e===6741)return u.CLUSTER_BREAK.SPACINGMARK}else{if(e===6742)return u.CLUSTER_BREAK.EXTEND;if(e===6743)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<6771){if(e<6754){if(e<6752){if(6744<=e&&e<=6750)return u.CLUSTER_BREAK.EXTEND}else if(e===6752)return u.CLUSTER_BREAK.EXTEND}else if(e<6757){if(e===6754)return u.CLUSTER_BREAK.EXTEND}else if(e<6765){if(6757<=e&&e<=6764)return u.CLUSTER_BREAK.EXTEND}else if(6765<=e&&e<=6770)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<6912){if(e<6783){if(6771<=e&&e<=6780)return u.CLUSTER_BREAK.EXTEND}else if(e<6832){if(e===6783)return u.CLUSTER_BREAK.EXTEND}else if(6832<=e&&e<=6862)return u.CLUSTER_BREAK.EXTEND}else if(e<6916){if(6912<=e&&e<=6915)return u.CLUSTER_BREAK.EXTEND}else if(e<6964){if(e===6916)return u.CLUSTER_BREAK.SPACINGMARK}else if(6964<=e&&e<=6970)return u.CLUSTER_BREAK.EXTEND}else if(e<7080){if(e<7019){if(e<6973){if(e===6971)return u.CLUSTER_BREAK.SPACINGMARK;if(e===6972)return u.CLUSTER_BREAK.EXTEND}else if(e<6978){if(6973<=e&&e<=6977)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<6979){if(e===6978)return u.CLUSTER_BREAK.EXTEND}else if(6979<=e&&e<=6980)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<7073){if(e<7040){if(7019<=e&&e<=7027)return u.CLUSTER_BREAK.EXTEND}else if(e<7042){if(7040<=e&&e<=7041)return u.CLUSTER_BREAK.EXTEND}else if(e===7042)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<7074){if(e===7073)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<7078){if(7074<=e&&e<=7077)return u.CLUSTER_BREAK.EXTEND}else if(7078<=e&&e<=7079)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<7144)if(e<7083){if(e<7082){if(7080<=e&&e<=7081)return u.CLUSTER_BREAK.EXTEND}else if(e===7082)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<7142){if(7083<=e&&e<=7085)return u.CLUSTER_BREAK.EXTEND}else{if(e===7142)return u.CLUSTER_BREAK.EXTEND;if(e===7143)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<7150){if(e<7146){if(7144<=e&&e<=7145)return u.CLUSTER_BREAK.EXTEND}else if(e<7149){if(7146<=e&&e<=7148)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===7149)return u.CLUSTER_BREAK.EXTEND}else if(e<7151){if(e===7150)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<7154){if(7151<=e&&e<=7153)return u.CLUSTER_BREAK.EXTEND}else if(7154<=e&&e<=7155)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<43346){if(e<11647){if(e<7415){if(e<7380){if(e<7220){if(e<7212){if(7204<=e&&e<=7211)return u.CLUSTER_BREAK.SPACINGMARK}else if(7212<=e&&e<=7219)return u.CLUSTER_BREAK.EXTEND}else if(e<7222){if(7220<=e&&e<=7221)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<7376){if(7222<=e&&e<=7223)return u.CLUSTER_BREAK.EXTEND}else if(7376<=e&&e<=7378)return u.CLUSTER_BREAK.EXTEND}else if(e<7394){if(e<7393){if(7380<=e&&e<=7392)return u.CLUSTER_BREAK.EXTEND}else if(e===7393)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<7405){if(7394<=e&&e<=7400)return u.CLUSTER_BREAK.EXTEND}else if(e===7405||e===7412)return u.CLUSTER_BREAK.EXTEND}else if(e<8205)if(e<7616){if(e<7416){if(e===7415)return u.CLUSTER_BREAK.SPACINGMARK}else if(7416<=e&&e<=7417)return u.CLUSTER_BREAK.EXTEND}else if(e<8203){if(7616<=e&&e<=7679)return u.CLUSTER_BREAK.EXTEND}else{if(e===8203)return u.CLUSTER_BREAK.CONTROL;if(e===8204)return u.CLUSTER_BREAK.EXTEND}else if(e<8288){if(e<8206){if(e===8205)return u.CLUSTER_BREAK.ZWJ}else if(e<8232){if(8206<=e&&e<=8207)return u.CLUSTER_BREAK.CONTROL}else if(8232<=e&&e<=8238)return u.CLUSTER_BREAK.CONTROL}else if(e<8400){if(8288<=e&&e<=8303)return u.CLUSTER_BREAK.CONTROL}else if(e<11503){if(8400<=e&&e<=8432)return u.CLUSTER_BREAK.EXTEND}else if(11503<=e&&e<=11505)return u.CLUSTER_BREAK.EXTEND}else if(e<43043){if(e<42612){if(e<12330){if(e<11744){if(e===11647)return u.CLUSTER_BREAK.EXTEND}else if(11744<=e&&e<=11775)return u.CLUSTER_BREAK.EXTEND}else if(e<12441){if(12330<=e&&e<=12335)return u.CLUSTER_BREAK.EXTEND}else if(e<42607){if(12441<=e&&e<=12442)return u.CLUSTER_BREAK.EXTEND}else if(42607<=e&&e<=42610)return u.CLUSTER_BREAK.EXTEND}else if(e<43010){if(e<42654){if(42612<=e&&e<=42621)return u.CLUSTER_BREAK.EXTEND}else if(e<42736){if(42654<=e&&e<=42655)return u.CLUSTER_BREAK.EXTEND}else if(42736<=e&&e<=42737)return u.CLUSTER_BREAK.EXTEND}else if(e<43014){if(e===43010)return u.CLUSTER_BREAK.EXTEND}else if(e===43014||e===43019)return u.CLUSTER_BREAK.EXTEND}else if(e<43188){if(e<43047){if(e<43045){if(43043<=e&&e<=43044)return u.CLUSTER_BREAK.SPACINGMARK}else if(43045<=e&&e<=43046)return u.CLUSTER_BREAK.EXTEND}else if(e<43052){if(e===43047)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<43136){if(e===43052)return u.CLUSTER_BREAK.EXTEND}else if(43136<=e&&e<=43137)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<43263){if(e<43204){if(43188<=e&&e<=43203)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<43232){if(43204<=e&&e<=43205)return u.CLUSTER_BREAK.EXTEND}else if(43232<=e&&e<=43249)return u.CLUSTER_BREAK.EXTEND}else if(e<43302){if(e===43263)return u.CLUSTER_BREAK.EXTEND}else if(e<43335){if(43302<=e&&e<=43309)return u.CLUSTER_BREAK.EXTEND}else if(43335<=e&&e<=43345)return u.CLUSTER_BREAK.EXTEND}else if(e<43698){if(e<43493){if(e<43444)if(e<43392){if(e<43360){if(43346<=e&&e<=43347)return u.CLUSTER_BREAK.SPACINGMARK}else if(43360<=e&&e<=43388)return u.CLUSTER_BREAK.L}else if(e<43395){if(43392<=e&&e<=43394)return u.CLUSTER_BREAK.EXTEND}else{if(e===43395)return u.CLUSTER_BREAK.SPACINGMARK;if(e===43443)return u.CLUSTER_BREAK.EXTEND}else if(e<43450){if(e<43446){if(43444<=e&&e<=43445)return u.CLUSTER_BREAK.SPACINGMARK}else if(43446<=e&&e<=43449)return u.CLUSTER_BREAK.EXTEND}else if(e<43452){if(43450<=e&&e<=43451)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<43454){if(43452<=e&&e<=43453)return u.CLUSTER_BREAK.EXTEND}else if(43454<=e&&e<=43456)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<43573){if(e<43567){if(e<43561){if(e===43493)return u.CLUSTER_BREAK.EXTEND}else if(43561<=e&&e<=43566)return u.CLUSTER_BREAK.EXTEND}else if(e<43569){if(43567<=e&&e<=43568)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<43571){if(43569<=e&&e<=43570)return u.CLUSTER_BREAK.EXTEND}else if(43571<=e&&e<=43572)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<43597){if(e<43587){if(43573<=e&&e<=43574)return u.CLUSTER_BREAK.EXTEND}else if(e===43587||e===43596)return u.CLUSTER_BREAK.EXTEND}else if(e<43644){if(e===43597)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===43644||e===43696)return u.CLUSTER_BREAK.EXTEND}else if(e<44006){if(e<43756)if(e<43710){if(e<43703){if(43698<=e&&e<=43700)return u.CLUSTER_BREAK.EXTEND}else if(43703<=e&&e<=43704)return u.CLUSTER_BREAK.EXTEND}else if(e<43713){if(43710<=e&&e<=43711)return u.CLUSTER_BREAK.EXTEND}else{if(e===43713)return u.CLUSTER_BREAK.EXTEND;if(e===43755)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<43766){if(e<43758){if(43756<=e&&e<=43757)return u.CLUSTER_BREAK.EXTEND}else if(e<43765){if(43758<=e&&e<=43759)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===43765)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<44003){if(e===43766)return u.CLUSTER_BREAK.EXTEND}else if(e<44005){if(44003<=e&&e<=44004)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===44005)return u.CLUSTER_BREAK.EXTEND}else if(e<44032)if(e<44009){if(e<44008){if(44006<=e&&e<=44007)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===44008)return u.CLUSTER_BREAK.EXTEND}else if(e<44012){if(44009<=e&&e<=44010)return u.CLUSTER_BREAK.SPACINGMARK}else{if(e===44012)return u.CLUSTER_BREAK.SPACINGMARK;if(e===44013)return u.CLUSTER_BREAK.EXTEND}else if(e<44061){if(e<44033){if(e===44032)return u.CLUSTER_BREAK.LV}else if(e<44060){if(44033<=e&&e<=44059)return u.CLUSTER_BREAK.LVT}else if(e===44060)return u.CLUSTER_BREAK.LV}else if(e<44088){if(44061<=e&&e<=44087)return u.CLUSTER_BREAK.LVT}else if(e<44089){if(e===44088)return u.CLUSTER_BREAK.LV}else if(44089<=e&&e<=44115)return u.CLUSTER_BREAK.LVT}else if(e<46497){if(e<45293){if(e<44704){if(e<44397){if(e<44256){if(e<44173){if(e<44144){if(e<44117){if(e===44116)return u.CLUSTER_BREAK.LV}else if(44117<=e&&e<=44143)return u.CLUSTER_BREAK.LVT}else if(e<44145){if(e===44144)return u.CLUSTER_BREAK.LV}else if(e<44172){if(44145<=e&&e<=44171)return u.CLUSTER_BREAK.LVT}else if(e===44172)return u.CLUSTER_BREAK.LV}else if(e<44201){if(e<44200){if(44173<=e&&e<=44199)return u.CLUSTER_BREAK.LVT}else if(e===44200)return u.CLUSTER_BREAK.LV}else if(e<44228){if(44201<=e&&e<=44227)return u.CLUSTER_BREAK.LVT}else if(e<44229){if(e===44228)return u.CLUSTER_BREAK.LV}else if(44229<=e&&e<=44255)return u.CLUSTER_BREAK.LVT}else if(e<44313){if(e<44284){if(e<44257){if(e===44256)return u.CLUSTER_BREAK.LV}else if(44257<=e&&e<=44283)return u.CLUSTER_BREAK.LVT}else if(e<44285){if(e===44284)return u.CLUSTER_BREAK.LV}else if(e<44312){if(44285<=e&&e<=44311)return u.CLUSTER_BREAK.LVT}else if(e===44312)return u.CLUSTER_BREAK.LV}else if(e<44368){if(e<44340){if(44313<=e&&e<=44339)return u.CLUSTER_BREAK.LVT}else if(e<44341){if(e===44340)return u.CLUSTER_BREAK.LV}else if(44341<=e&&e<=44367)return u.CLUSTER_BREAK.LVT}else if(e<44369){if(e===44368)return u.CLUSTER_BREAK.LV}else if(e<44396){if(44369<=e&&e<=44395)return u.CLUSTER_BREAK.LVT}else if(e===44396)return u.CLUSTER_BREAK.LV}else if(e<44537){if(e<44480){if(e<44425){if(e<44424){if(44397<=e&&e<=44423)return u.CLUSTER_BREAK.LVT}else if(e===44424)return u.CLUSTER_BREAK.LV}else if(e<44452){if(44425<=e&&e<=44451)return u.CLUSTER_BREAK.LVT}else if(e<44453){if(e===44452)return u.CLUSTER_BREAK.LV}else if(44453<=e&&e<=44479)return u.CLUSTER_BREAK.LVT}else if(e<44508){if(e<44481){if(e===44480)return u.CLUSTER_BREAK.LV}else if(44481<=e&&e<=44507)return u.CLUSTER_BREAK.LVT}else if(e<44509){if(e===44508)return u.CLUSTER_BREAK.LV}else if(e<44536){if(44509<=e&&e<=44535)return u.CLUSTER_BREAK.LVT}else if(e===44536)return u.CLUSTER_BREAK.LV}else if(e<44620){if(e<44565){if(e<44564){if(44537<=e&&e<=44563)return u.CLUSTER_BREAK.LVT}else if(e===44564)return u.CLUSTER_BREAK.LV}else if(e<44592){if(44565<=e&&e<=44591)return u.CLUSTER_BREAK.LVT}else if(e<44593){if(e===44592)return u.CLUSTER_BREAK.LV}else if(44593<=e&&e<=44619)return u.CLUSTER_BREAK.LVT}else if(e<44649){if(e<44621){if(e===44620)return u.CLUSTER_BREAK.LV}else if(e<44648){if(44621<=e&&e<=44647)return u.CLUSTER_BREAK.LVT}else if(e===44648)return u.CLUSTER_BREAK.LV}else if(e<44676){if(44649<=e&&e<=44675)return u.CLUSTER_BREAK.LVT}else if(e<44677){if(e===44676)return u.CLUSTER_BREAK.LV}else if(44677<=e&&e<=44703)return u.CLUSTER_BREAK.LVT}else if(e<44985){if(e<44844){if(e<44761){if(e<44732){if(e<44705){if(e===44704)return u.CLUSTER_BREAK.LV}else if(44705<=e&&e<=44731)return u.CLUSTER_BREAK.LVT}else if(e<44733){if(e===44732)return u.CLUSTER_BREAK.LV}else if(e<44760){if(44733<=e&&e<=44759)return u.CLUSTER_BREAK.LVT}else if(e===44760)return u.CLUSTER_BREAK.LV}else if(e<44789){if(e<44788){if(44761<=e&&e<=44787)return u.CLUSTER_BREAK.LVT}else if(e===44788)return u.CLUSTER_BREAK.LV}else if(e<44816){if(44789<=e&&e<=44815)return u.CLUSTER_BREAK.LVT}else if(e<44817){if(e===44816)return u.CLUSTER_BREAK.LV}else if(44817<=e&&e<=44843)return u.CLUSTER_BREAK.LVT}else if(e<44901){if(e<44872){if(e<44845){if(e===44844)return u.CLUSTER_BREAK.LV}else if(44845<=e&&e<=44871)return u.CLUSTER_BREAK.LVT}else if(e<44873){if(e===44872)return u.CLUSTER_BREAK.LV}else if(e<44900){if(44873<=e&&e<=44899)return u.CLUSTER_BREAK.LVT}else if(e===44900)return u.CLUSTER_BREAK.LV}else if(e<44956){if(e<44928){if(44901<=e&&e<=44927)return u.CLUSTER_BREAK.LVT}else if(e<44929){if(e===44928)return u.CLUSTER_BREAK.LV}else if(44929<=e&&e<=44955)return u.CLUSTER_BREAK.LVT}else if(e<44957){if(e===44956)return u.CLUSTER_BREAK.LV}else if(e<44984){if(44957<=e&&e<=44983)return u.CLUSTER_BREAK.LVT}else if(e===44984)return u.CLUSTER_BREAK.LV}else if(e<45152){if(e<45068){if(e<45013){if(e<45012){if(44985<=e&&e<=45011)return u.CLUSTER_BREAK.LVT}else if(e===45012)return u.CLUSTER_BREAK.LV}else if(e<45040){if(45013<=e&&e<=45039)return u.CLUSTER_BREAK.LVT}else if(e<45041){if(e===45040)return u.CLUSTER_BREAK.LV}else if(45041<=e&&e<=45067)return u.CLUSTER_BREAK.LVT}else if(e<45097){if(e<45069){if(e===45068)return u.CLUSTER_BREAK.LV}else if(e<45096){if(45069<=e&&e<=45095)return u.CLUSTER_BREAK.LVT}else if(e===45096)return u.CLUSTER_BREAK.LV}else if(e<45124){if(45097<=e&&e<=45123)return u.CLUSTER_BREAK.LVT}else if(e<45125){if(e===45124)return u.CLUSTER_BREAK.LV}else if(45125<=e&&e<=45151)return u.CLUSTER_BREAK.LVT}else if(e<45209){if(e<45180){if(e<45153){if(e===45152)return u.CLUSTER_BREAK.LV}else if(45153<=e&&e<=45179)return u.CLUSTER_BREAK.LVT}else if(e<45181){if(e===45180)return u.CLUSTER_BREAK.LV}else if(e<45208){if(45181<=e&&e<=45207)return u.CLUSTER_BREAK.LVT}else if(e===45208)return u.CLUSTER_BREAK.LV}else if(e<45264){if(e<45236){if(45209<=e&&e<=45235)return u.CLUSTER_BREAK.LVT}else if(e<45237){if(e===45236)return u.CLUSTER_BREAK.LV}else if(45237<=e&&e<=45263)return u.CLUSTER_BREAK.LVT}else if(e<45265){if(e===45264)return u.CLUSTER_BREAK.LV}else if(e<45292){if(45265<=e&&e<=45291)return u.CLUSTER_BREAK.LVT}else if(e===45292)return u.CLUSTER_BREAK.LV}else if(e<45908){if(e<45600){if(e<45433){if(e<45376){if(e<45321){if(e<45320){if(45293<=e&&e<=45319)return u.CLUSTER_BREAK.LVT}else if(e===45320)return u.CLUSTER_BREAK.LV}else if(e<45348){if(45321<=e&&e<=45347)return u.CLUSTER_BREAK.LVT}else if(e<45349){if(e===45348)return u.CLUSTER_BREAK.LV}else if(45349<=e&&e<=45375)return u.CLUSTER_BREAK.LVT}else if(e<45404){if(e<45377){if(e===45376)return u.CLUSTER_BREAK.LV}else if(45377<=e&&e<=45403)return u.CLUSTER_BREAK.LVT}else if(e<45405){if(e===45404)return u.CLUSTER_BREAK.LV}else if(e<45432){if(45405<=e&&e<=45431)return u.CLUSTER_BREAK.LVT}else if(e===45432)return u.CLUSTER_BREAK.LV}else if(e<45516){if(e<45461){if(e<45460){if(45433<=e&&e<=45459)return u.CLUSTER_BREAK.LVT}else if(e===45460)return u.CLUSTER_BREAK.LV}else if(e<45488){if(45461<=e&&e<=45487)return u.CLUSTER_BREAK.LVT}else if(e<45489){if(e===45488)return u.CLUSTER_BREAK.LV}else if(45489<=e&&e<=45515)return u.CLUSTER_BREAK.LVT}else if(e<45545){if(e<45517){if(e===45516)return u.CLUSTER_BREAK.LV}else if(e<45544){if(45517<=e&&e<=45543)return u.CLUSTER_BREAK.LVT}else if(e===45544)return u.CLUSTER_BREAK.LV}else if(e<45572){if(45545<=e&&e<=45571)return u.CLUSTER_BREAK.LVT}else if(e<45573){if(e===45572)return u.CLUSTER_BREAK.LV}else if(45573<=e&&e<=45599)return u.CLUSTER_BREAK.LVT}else if(e<45741){if(e<45657){if(e<45628){if(e<45601){if(e===45600)return u.CLUSTER_BREAK.LV}else if(45601<=e&&e<=45627)return u.CLUSTER_BREAK.LVT}else if(e<45629){if(e===45628)return u.CLUSTER_BREAK.LV}else if(e<45656){if(45629<=e&&e<=45655)return u.CLUSTER_BREAK.LVT}else if(e===45656)return u.CLUSTER_BREAK.LV}else if(e<45712){if(e<45684){if(45657<=e&&e<=45683)return u.CLUSTER_BREAK.LVT}else if(e<45685){if(e===45684)return u.CLUSTER_BREAK.LV}else if(45685<=e&&e<=45711)return u.CLUSTER_BREAK.LVT}else if(e<45713){if(e===45712)return u.CLUSTER_BREAK.LV}else if(e<45740){if(45713<=e&&e<=45739)return u.CLUSTER_BREAK.LVT}else if(e===45740)return u.CLUSTER_BREAK.LV}else if(e<45824){if(e<45769){if(e<45768){if(45741<=e&&e<=45767)return u.CLUSTER_BREAK.LVT}else if(e===45768)return u.CLUSTER_BREAK.LV}else if(e<45796){if(45769<=e&&e<=45795)return u.CLUSTER_BREAK.LVT}else if(e<45797){if(e===45796)return u.CLUSTER_BREAK.LV}else if(45797<=e&&e<=45823)return u.CLUSTER_BREAK.LVT}else if(e<45853){if(e<45825){if(e===45824)return u.CLUSTER_BREAK.LV}else if(e<45852){if(45825<=e&&e<=45851)return u.CLUSTER_BREAK.LVT}else if(e===45852)return u.CLUSTER_BREAK.LV}else if(e<45880){if(45853<=e&&e<=45879)return u.CLUSTER_BREAK.LVT}else if(e<45881){if(e===45880)return u.CLUSTER_BREAK.LV}else if(45881<=e&&e<=45907)return u.CLUSTER_BREAK.LVT}else if(e<46189){if(e<46048){if(e<45965){if(e<45936){if(e<45909){if(e===45908)return u.CLUSTER_BREAK.LV}else if(45909<=e&&e<=45935)return u.CLUSTER_BREAK.LVT}else if(e<45937){if(e===45936)return u.CLUSTER_BREAK.LV}else if(e<45964){if(45937<=e&&e<=45963)return u.CLUSTER_BREAK.LVT}else if(e===45964)return u.CLUSTER_BREAK.LV}else if(e<45993){if(e<45992){if(45965<=e&&e<=45991)return u.CLUSTER_BREAK.LVT}else if(e===45992)return u.CLUSTER_BREAK.LV}else if(e<46020){if(45993<=e&&e<=46019)return u.CLUSTER_BREAK.LVT}else if(e<46021){if(e===46020)return u.CLUSTER_BREAK.LV}else if(46021<=e&&e<=46047)return u.CLUSTER_BREAK.LVT}else if(e<46105){if(e<46076){if(e<46049){if(e===46048)return u.CLUSTER_BREAK.LV}else if(46049<=e&&e<=46075)return u.CLUSTER_BREAK.LVT}else if(e<46077){if(e===46076)return u.CLUSTER_BREAK.LV}else if(e<46104){if(46077<=e&&e<=46103)return u.CLUSTER_BREAK.LVT}else if(e===46104)return u.CLUSTER_BREAK.LV}else if(e<46160){if(e<46132){if(46105<=e&&e<=46131)return u.CLUSTER_BREAK.LVT}else if(e<46133){if(e===46132)return u.CLUSTER_BREAK.LV}else if(46133<=e&&e<=46159)return u.CLUSTER_BREAK.LVT}else if(e<46161){if(e===46160)return u.CLUSTER_BREAK.LV}else if(e<46188){if(46161<=e&&e<=46187)return u.CLUSTER_BREAK.LVT}else if(e===46188)return u.CLUSTER_BREAK.LV}else if(e<46356){if(e<46272){if(e<46217){if(e<46216){if(46189<=e&&e<=46215)return u.CLUSTER_BREAK.LVT}else if(e===46216)return u.CLUSTER_BREAK.LV}else if(e<46244){if(46217<=e&&e<=46243)return u.CLUSTER_BREAK.LVT}else if(e<46245){if(e===46244)return u.CLUSTER_BREAK.LV}else if(46245<=e&&e<=46271)return u.CLUSTER_BREAK.LVT}else if(e<46301){if(e<46273){if(e===46272)return u.CLUSTER_BREAK.LV}else if(e<46300){if(46273<=e&&e<=46299)return u.CLUSTER_BREAK.LVT}else if(e===46300)return u.CLUSTER_BREAK.LV}else if(e<46328){if(46301<=e&&e<=46327)return u.CLUSTER_BREAK.LVT}else if(e<46329){if(e===46328)return u.CLUSTER_BREAK.LV}else if(46329<=e&&e<=46355)return u.CLUSTER_BREAK.LVT}else if(e<46413){if(e<46384){if(e<46357){if(e===46356)return u.CLUSTER_BREAK.LV}else if(46357<=e&&e<=46383)return u.CLUSTER_BREAK.LVT}else if(e<46385){if(e===46384)return u.CLUSTER_BREAK.LV}else if(e<46412){if(46385<=e&&e<=46411)return u.CLUSTER_BREAK.LVT}else if(e===46412)return u.CLUSTER_BREAK.LV}else if(e<46468){if(e<46440){if(46413<=e&&e<=46439)return u.CLUSTER_BREAK.LVT}else if(e<46441){if(e===46440)return u.CLUSTER_BREAK.LV}else if(46441<=e&&e<=46467)return u.CLUSTER_BREAK.LVT}else if(e<46469){if(e===46468)return u.CLUSTER_BREAK.LV}else if(e<46496){if(46469<=e&&e<=46495)return u.CLUSTER_BREAK.LVT}else if(e===46496)return u.CLUSTER_BREAK.LV}else if(e<47701){if(e<47112){if(e<46804){if(e<46637){if(e<46580){if(e<46525){if(e<46524){if(46497<=e&&e<=46523)return u.CLUSTER_BREAK.LVT}else if(e===46524)return u.CLUSTER_BREAK.LV}else if(e<46552){if(46525<=e&&e<=46551)return u.CLUSTER_BREAK.LVT}else if(e<46553){if(e===46552)return u.CLUSTER_BREAK.LV}else if(46553<=e&&e<=46579)return u.CLUSTER_BREAK.LVT}else if(e<46608){if(e<46581){if(e===46580)return u.CLUSTER_BREAK.LV}else if(46581<=e&&e<=46607)return u.CLUSTER_BREAK.LVT}else if(e<46609){if(e===46608)return u.CLUSTER_BREAK.LV}else if(e<46636){if(46609<=e&&e<=46635)return u.CLUSTER_BREAK.LVT}else if(e===46636)return u.CLUSTER_BREAK.LV}else if(e<46720){if(e<46665){if(e<46664){if(46637<=e&&e<=46663)return u.CLUSTER_BREAK.LVT}else if(e===46664)return u.CLUSTER_BREAK.LV}else if(e<46692){if(46665<=e&&e<=46691)return u.CLUSTER_BREAK.LVT}else if(e<46693){if(e===46692)return u.CLUSTER_BREAK.LV}else if(46693<=e&&e<=46719)return u.CLUSTER_BREAK.LVT}else if(e<46749){if(e<46721){if(e===46720)return u.CLUSTER_BREAK.LV}else if(e<46748){if(46721<=e&&e<=46747)return u.CLUSTER_BREAK.LVT}else if(e===46748)return u.CLUSTER_BREAK.LV}else if(e<46776){if(46749<=e&&e<=46775)return u.CLUSTER_BREAK.LVT}else if(e<46777){if(e===46776)return u.CLUSTER_BREAK.LV}else if(46777<=e&&e<=46803)return u.CLUSTER_BREAK.LVT}else if(e<46945){if(e<46861){if(e<46832){if(e<46805){if(e===46804)return u.CLUSTER_BREAK.LV}else if(46805<=e&&e<=46831)return u.CLUSTER_BREAK.LVT}else if(e<46833){if(e===46832)return u.CLUSTER_BREAK.LV}else if(e<46860){if(46833<=e&&e<=46859)return u.CLUSTER_BREAK.LVT}else if(e===46860)return u.CLUSTER_BREAK.LV}else if(e<46916){if(e<46888){if(46861<=e&&e<=46887)return u.CLUSTER_BREAK.LVT}else if(e<46889){if(e===46888)return u.CLUSTER_BREAK.LV}else if(46889<=e&&e<=46915)return u.CLUSTER_BREAK.LVT}else if(e<46917){if(e===46916)return u.CLUSTER_BREAK.LV}else if(e<46944){if(46917<=e&&e<=46943)return u.CLUSTER_BREAK.LVT}else if(e===46944)return u.CLUSTER_BREAK.LV}else if(e<47028){if(e<46973){if(e<46972){if(46945<=e&&e<=46971)return u.CLUSTER_BREAK.LVT}else if(e===46972)return u.CLUSTER_BREAK.LV}else if(e<47e3){if(46973<=e&&e<=46999)return u.CLUSTER_BREAK.LVT}else if(e<47001){if(e===47e3)return u.CLUSTER_BREAK.LV}else if(47001<=e&&e<=47027)return u.CLUSTER_BREAK.LVT}else if(e<47057){if(e<47029){if(e===47028)return u.CLUSTER_BREAK.LV}else if(e<47056){if(47029<=e&&e<=47055)return u.CLUSTER_BREAK.LVT}else if(e===47056)return u.CLUSTER_BREAK.LV}else if(e<47084){if(47057<=e&&e<=47083)return u.CLUSTER_BREAK.LVT}else if(e<47085){if(e===47084)return u.CLUSTER_BREAK.LV}else if(47085<=e&&e<=47111)return u.CLUSTER_BREAK.LVT}else if(e<47393){if(e<47252){if(e<47169){if(e<47140){if(e<47113){if(e===47112)return u.CLUSTER_BREAK.LV}else if(47113<=e&&e<=47139)return u.CLUSTER_BREAK.LVT}else if(e<47141){if(e===47140)return u.CLUSTER_BREAK.LV}else if(e<47168){if(47141<=e&&e<=47167)return u.CLUSTER_BREAK.LVT}else if(e===47168)return u.CLUSTER_BREAK.LV}else if(e<47197){if(e<47196){if(47169<=e&&e<=47195)return u.CLUSTER_BREAK.LVT}else if(e===47196)return u.CLUSTER_BREAK.LV}else if(e<47224){if(47197<=e&&e<=47223)return u.CLUSTER_BREAK.LVT}else if(e<47225){if(e===47224)return u.CLUSTER_BREAK.LV}else if(47225<=e&&e<=47251)return u.CLUSTER_BREAK.LVT}else if(e<47309){if(e<47280){if(e<47253){if(e===47252)return u.CLUSTER_BREAK.LV}else if(47253<=e&&e<=47279)return u.CLUSTER_BREAK.LVT}else if(e<47281){if(e===47280)return u.CLUSTER_BREAK.LV}else if(e<47308){if(47281<=e&&e<=47307)return u.CLUSTER_BREAK.LVT}else if(e===47308)return u.CLUSTER_BREAK.LV}else if(e<47364){if(e<47336){if(47309<=e&&e<=47335)return u.CLUSTER_BREAK.LVT}else if(e<47337){if(e===47336)return u.CLUSTER_BREAK.LV}else if(47337<=e&&e<=47363)return u.CLUSTER_BREAK.LVT}else if(e<47365){if(e===47364)return u.CLUSTER_BREAK.LV}else if(e<47392){if(47365<=e&&e<=47391)return u.CLUSTER_BREAK.LVT}else if(e===47392)return u.CLUSTER_BREAK.LV}else if(e<47560){if(e<47476){if(e<47421){if(e<47420){if(47393<=e&&e<=47419)return u.CLUSTER_BREAK.LVT}else if(e===47420)return u.CLUSTER_BREAK.LV}else if(e<47448){if(47421<=e&&e<=47447)return u.CLUSTER_BREAK.LVT}else if(e<47449){if(e===47448)return u.CLUSTER_BREAK.LV}else if(47449<=e&&e<=47475)return u.CLUSTER_BREAK.LVT}else if(e<47505){if(e<47477){if(e===47476)return u.CLUSTER_BREAK.LV}else if(e<47504){if(47477<=e&&e<=47503)return u.CLUSTER_BREAK.LVT}else if(e===47504)return u.CLUSTER_BREAK.LV}else if(e<47532){if(47505<=e&&e<=47531)return u.CLUSTER_BREAK.LVT}else if(e<47533){if(e===47532)return u.CLUSTER_BREAK.LV}else if(47533<=e&&e<=47559)return u.CLUSTER_BREAK.LVT}else if(e<47617){if(e<47588){if(e<47561){if(e===47560)return u.CLUSTER_BREAK.LV}else if(47561<=e&&e<=47587)return u.CLUSTER_BREAK.LVT}else if(e<47589){if(e===47588)return u.CLUSTER_BREAK.LV}else if(e<47616){if(47589<=e&&e<=47615)return u.CLUSTER_BREAK.LVT}else if(e===47616)return u.CLUSTER_BREAK.LV}else if(e<47672){if(e<47644){if(47617<=e&&e<=47643)return u.CLUSTER_BREAK.LVT}else if(e<47645){if(e===47644)return u.CLUSTER_BREAK.LV}else if(47645<=e&&e<=47671)return u.CLUSTER_BREAK.LVT}else if(e<47673){if(e===47672)return u.CLUSTER_BREAK.LV}else if(e<47700){if(47673<=e&&e<=47699)return u.CLUSTER_BREAK.LVT}else if(e===47700)return u.CLUSTER_BREAK.LV}else if(e<48316){if(e<48008){if(e<47841){if(e<47784){if(e<47729){if(e<47728){if(47701<=e&&e<=47727)return u.CLUSTER_BREAK.LVT}else if(e===47728)return u.CLUSTER_BREAK.LV}else if(e<47756){if(47729<=e&&e<=47755)return u.CLUSTER_BREAK.LVT}else if(e<47757){if(e===47756)return u.CLUSTER_BREAK.LV}else if(47757<=e&&e<=47783)return u.CLUSTER_BREAK.LVT}else if(e<47812){if(e<47785){if(e===47784)return u.CLUSTER_BREAK.LV}else if(47785<=e&&e<=47811)return u.CLUSTER_BREAK.LVT}else if(e<47813){if(e===47812)return u.CLUSTER_BREAK.LV}else if(e<47840){if(47813<=e&&e<=47839)return u.CLUSTER_BREAK.LVT}else if(e===47840)return u.CLUSTER_BREAK.LV}else if(e<47924){if(e<47869){if(e<47868){if(47841<=e&&e<=47867)return u.CLUSTER_BREAK.LVT}else if(e===47868)return u.CLUSTER_BREAK.LV}else if(e<47896){if(47869<=e&&e<=47895)return u.CLUSTER_BREAK.LVT}else if(e<47897){if(e===47896)return u.CLUSTER_BREAK.LV}else if(47897<=e&&e<=47923)return u.CLUSTER_BREAK.LVT}else if(e<47953){if(e<47925){if(e===47924)return u.CLUSTER_BREAK.LV}else if(e<47952){if(47925<=e&&e<=47951)return u.CLUSTER_BREAK.LVT}else if(e===47952)return u.CLUSTER_BREAK.LV}else if(e<47980){if(47953<=e&&e<=47979)return u.CLUSTER_BREAK.LVT}else if(e<47981){if(e===47980)return u.CLUSTER_BREAK.LV}else if(47981<=e&&e<=48007)return u.CLUSTER_BREAK.LVT}else if(e<48149){if(e<48065){if(e<48036){if(e<48009){if(e===48008)return u.CLUSTER_BREAK.LV}else if(48009<=e&&e<=48035)return u.CLUSTER_BREAK.LVT}else if(e<48037){if(e===48036)return u.CLUSTER_BREAK.LV}else if(e<48064){if(48037<=e&&e<=48063)return u.CLUSTER_BREAK.LVT}else if(e===48064)return u.CLUSTER_BREAK.LV}else if(e<48120){if(e<48092){if(48065<=e&&e<=48091)return u.CLUSTER_BREAK.LVT}else if(e<48093){if(e===48092)return u.CLUSTER_BREAK.LV}else if(48093<=e&&e<=48119)return u.CLUSTER_BREAK.LVT}else if(e<48121){if(e===48120)return u.CLUSTER_BREAK.LV}else if(e<48148){if(48121<=e&&e<=48147)return u.CLUSTER_BREAK.LVT}else if(e===48148)return u.CLUSTER_BREAK.LV}else if(e<48232){if(e<48177){if(e<48176){if(48149<=e&&e<=48175)return u.CLUSTER_BREAK.LVT}else if(e===48176)return u.CLUSTER_BREAK.LV}else if(e<48204){if(48177<=e&&e<=48203)return u.CLUSTER_BREAK.LVT}else if(e<48205){if(e===48204)return u.CLUSTER_BREAK.LV}else if(48205<=e&&e<=48231)return u.CLUSTER_BREAK.LVT}else if(e<48261){if(e<48233){if(e===48232)return u.CLUSTER_BREAK.LV}else if(e<48260){if(48233<=e&&e<=48259)return u.CLUSTER_BREAK.LVT}else if(e===48260)return u.CLUSTER_BREAK.LV}else if(e<48288){if(48261<=e&&e<=48287)return u.CLUSTER_BREAK.LVT}else if(e<48289){if(e===48288)return u.CLUSTER_BREAK.LV}else if(48289<=e&&e<=48315)return u.CLUSTER_BREAK.LVT}else if(e<48597){if(e<48456){if(e<48373){if(e<48344){if(e<48317){if(e===48316)return u.CLUSTER_BREAK.LV}else if(48317<=e&&e<=48343)return u.CLUSTER_BREAK.LVT}else if(e<48345){if(e===48344)return u.CLUSTER_BREAK.LV}else if(e<48372){if(48345<=e&&e<=48371)return u.CLUSTER_BREAK.LVT}else if(e===48372)return u.CLUSTER_BREAK.LV}else if(e<48401){if(e<48400){if(48373<=e&&e<=48399)return u.CLUSTER_BREAK.LVT}else if(e===48400)return u.CLUSTER_BREAK.LV}else if(e<48428){if(48401<=e&&e<=48427)return u.CLUSTER_BREAK.LVT}else if(e<48429){if(e===48428)return u.CLUSTER_BREAK.LV}else if(48429<=e&&e<=48455)return u.CLUSTER_BREAK.LVT}else if(e<48513){if(e<48484){if(e<48457){if(e===48456)return u.CLUSTER_BREAK.LV}else if(48457<=e&&e<=48483)return u.CLUSTER_BREAK.LVT}else if(e<48485){if(e===48484)return u.CLUSTER_BREAK.LV}else if(e<48512){if(48485<=e&&e<=48511)return u.CLUSTER_BREAK.LVT}else if(e===48512)return u.CLUSTER_BREAK.LV}else if(e<48568){if(e<48540){if(48513<=e&&e<=48539)return u.CLUSTER_BREAK.LVT}else if(e<48541){if(e===48540)return u.CLUSTER_BREAK.LV}else if(48541<=e&&e<=48567)return u.CLUSTER_BREAK.LVT}else if(e<48569){if(e===48568)return u.CLUSTER_BREAK.LV}else if(e<48596){if(48569<=e&&e<=48595)return u.CLUSTER_BREAK.LVT}else if(e===48596)return u.CLUSTER_BREAK.LV}else if(e<48764){if(e<48680){if(e<48625){if(e<48624){if(48597<=e&&e<=48623)return u.CLUSTER_BREAK.LVT}else if(e===48624)return u.CLUSTER_BREAK.LV}else if(e<48652){if(48625<=e&&e<=48651)return u.CLUSTER_BREAK.LVT}else if(e<48653){if(e===48652)return u.CLUSTER_BREAK.LV}else if(48653<=e&&e<=48679)return u.CLUSTER_BREAK.LVT}else if(e<48709){if(e<48681){if(e===48680)return u.CLUSTER_BREAK.LV}else if(e<48708){if(48681<=e&&e<=48707)return u.CLUSTER_BREAK.LVT}else if(e===48708)return u.CLUSTER_BREAK.LV}else if(e<48736){if(48709<=e&&e<=48735)return u.CLUSTER_BREAK.LVT}else if(e<48737){if(e===48736)return u.CLUSTER_BREAK.LV}else if(48737<=e&&e<=48763)return u.CLUSTER_BREAK.LVT}else if(e<48821){if(e<48792){if(e<48765){if(e===48764)return u.CLUSTER_BREAK.LV}else if(48765<=e&&e<=48791)return u.CLUSTER_BREAK.LVT}else if(e<48793){if(e===48792)return u.CLUSTER_BREAK.LV}else if(e<48820){if(48793<=e&&e<=48819)return u.CLUSTER_BREAK.LVT}else if(e===48820)return u.CLUSTER_BREAK.LV}else if(e<48876){if(e<48848){if(48821<=e&&e<=48847)return u.CLUSTER_BREAK.LVT}else if(e<48849){if(e===48848)return u.CLUSTER_BREAK.LV}else if(48849<=e&&e<=48875)return u.CLUSTER_BREAK.LVT}else if(e<48877){if(e===48876)return u.CLUSTER_BREAK.LV}else if(e<48904){if(48877<=e&&e<=48903)return u.CLUSTER_BREAK.LVT}else if(e===48904)return u.CLUSTER_BREAK.LV}else if(e<53720){if(e<51312){if(e<50108){if(e<49493){if(e<49212){if(e<49045){if(e<48988){if(e<48933){if(e<48932){if(48905<=e&&e<=48931)return u.CLUSTER_BREAK.LVT}else if(e===48932)return u.CLUSTER_BREAK.LV}else if(e<48960){if(48933<=e&&e<=48959)return u.CLUSTER_BREAK.LVT}else if(e<48961){if(e===48960)return u.CLUSTER_BREAK.LV}else if(48961<=e&&e<=48987)return u.CLUSTER_BREAK.LVT}else if(e<49016){if(e<48989){if(e===48988)return u.CLUSTER_BREAK.LV}else if(48989<=e&&e<=49015)return u.CLUSTER_BREAK.LVT}else if(e<49017){if(e===49016)return u.CLUSTER_BREAK.LV}else if(e<49044){if(49017<=e&&e<=49043)return u.CLUSTER_BREAK.LVT}else if(e===49044)return u.CLUSTER_BREAK.LV}else if(e<49128){if(e<49073){if(e<49072){if(49045<=e&&e<=49071)return u.CLUSTER_BREAK.LVT}else if(e===49072)return u.CLUSTER_BREAK.LV}else if(e<49100){if(49073<=e&&e<=49099)return u.CLUSTER_BREAK.LVT}else if(e<49101){if(e===49100)return u.CLUSTER_BREAK.LV}else if(49101<=e&&e<=49127)return u.CLUSTER_BREAK.LVT}else if(e<49157){if(e<49129){if(e===49128)return u.CLUSTER_BREAK.LV}else if(e<49156){if(49129<=e&&e<=49155)return u.CLUSTER_BREAK.LVT}else if(e===49156)return u.CLUSTER_BREAK.LV}else if(e<49184){if(49157<=e&&e<=49183)return u.CLUSTER_BREAK.LVT}else if(e<49185){if(e===49184)return u.CLUSTER_BREAK.LV}else if(49185<=e&&e<=49211)return u.CLUSTER_BREAK.LVT}else if(e<49352){if(e<49269){if(e<49240){if(e<49213){if(e===49212)return u.CLUSTER_BREAK.LV}else if(49213<=e&&e<=49239)return u.CLUSTER_BREAK.LVT}else if(e<49241){if(e===49240)return u.CLUSTER_BREAK.LV}else if(e<49268){if(49241<=e&&e<=49267)return u.CLUSTER_BREAK.LVT}else if(e===49268)return u.CLUSTER_BREAK.LV}else if(e<49297){if(e<49296){if(49269<=e&&e<=49295)return u.CLUSTER_BREAK.LVT}else if(e===49296)return u.CLUSTER_BREAK.LV}else if(e<49324){if(49297<=e&&e<=49323)return u.CLUSTER_BREAK.LVT}else if(e<49325){if(e===49324)return u.CLUSTER_BREAK.LV}else if(49325<=e&&e<=49351)return u.CLUSTER_BREAK.LVT}else if(e<49409){if(e<49380){if(e<49353){if(e===49352)return u.CLUSTER_BREAK.LV}else if(49353<=e&&e<=49379)return u.CLUSTER_BREAK.LVT}else if(e<49381){if(e===49380)return u.CLUSTER_BREAK.LV}else if(e<49408){if(49381<=e&&e<=49407)return u.CLUSTER_BREAK.LVT}else if(e===49408)return u.CLUSTER_BREAK.LV}else if(e<49464){if(e<49436){if(49409<=e&&e<=49435)return u.CLUSTER_BREAK.LVT}else if(e<49437){if(e===49436)return u.CLUSTER_BREAK.LV}else if(49437<=e&&e<=49463)return u.CLUSTER_BREAK.LVT}else if(e<49465){if(e===49464)return u.CLUSTER_BREAK.LV}else if(e<49492){if(49465<=e&&e<=49491)return u.CLUSTER_BREAK.LVT}else if(e===49492)return u.CLUSTER_BREAK.LV}else if(e<49800){if(e<49633){if(e<49576){if(e<49521){if(e<49520){if(49493<=e&&e<=49519)return u.CLUSTER_BREAK.LVT}else if(e===49520)return u.CLUSTER_BREAK.LV}else if(e<49548){if(49521<=e&&e<=49547)return u.CLUSTER_BREAK.LVT}else if(e<49549){if(e===49548)return u.CLUSTER_BREAK.LV}else if(49549<=e&&e<=49575)return u.CLUSTER_BREAK.LVT}else if(e<49604){if(e<49577){if(e===49576)return u.CLUSTER_BREAK.LV}else if(49577<=e&&e<=49603)return u.CLUSTER_BREAK.LVT}else if(e<49605){if(e===49604)return u.CLUSTER_BREAK.LV}else if(e<49632){if(49605<=e&&e<=49631)return u.CLUSTER_BREAK.LVT}else if(e===49632)return u.CLUSTER_BREAK.LV}else if(e<49716){if(e<49661){if(e<49660){if(49633<=e&&e<=49659)return u.CLUSTER_BREAK.LVT}else if(e===49660)return u.CLUSTER_BREAK.LV}else if(e<49688){if(49661<=e&&e<=49687)return u.CLUSTER_BREAK.LVT}else if(e<49689){if(e===49688)return u.CLUSTER_BREAK.LV}else if(49689<=e&&e<=49715)return u.CLUSTER_BREAK.LVT}else if(e<49745){if(e<49717){if(e===49716)return u.CLUSTER_BREAK.LV}else if(e<49744){if(49717<=e&&e<=49743)return u.CLUSTER_BREAK.LVT}else if(e===49744)return u.CLUSTER_BREAK.LV}else if(e<49772){if(49745<=e&&e<=49771)return u.CLUSTER_BREAK.LVT}else if(e<49773){if(e===49772)return u.CLUSTER_BREAK.LV}else if(49773<=e&&e<=49799)return u.CLUSTER_BREAK.LVT}else if(e<49941){if(e<49857){if(e<49828){if(e<49801){if(e===49800)return u.CLUSTER_BREAK.LV}else if(49801<=e&&e<=49827)return u.CLUSTER_BREAK.LVT}else if(e<49829){if(e===49828)return u.CLUSTER_BREAK.LV}else if(e<49856){if(49829<=e&&e<=49855)return u.CLUSTER_BREAK.LVT}else if(e===49856)return u.CLUSTER_BREAK.LV}else if(e<49912){if(e<49884){if(49857<=e&&e<=49883)return u.CLUSTER_BREAK.LVT}else if(e<49885){if(e===49884)return u.CLUSTER_BREAK.LV}else if(49885<=e&&e<=49911)return u.CLUSTER_BREAK.LVT}else if(e<49913){if(e===49912)return u.CLUSTER_BREAK.LV}else if(e<49940){if(49913<=e&&e<=49939)return u.CLUSTER_BREAK.LVT}else if(e===49940)return u.CLUSTER_BREAK.LV}else if(e<50024){if(e<49969){if(e<49968){if(49941<=e&&e<=49967)return u.CLUSTER_BREAK.LVT}else if(e===49968)return u.CLUSTER_BREAK.LV}else if(e<49996){if(49969<=e&&e<=49995)return u.CLUSTER_BREAK.LVT}else if(e<49997){if(e===49996)return u.CLUSTER_BREAK.LV}else if(49997<=e&&e<=50023)return u.CLUSTER_BREAK.LVT}else if(e<50053){if(e<50025){if(e===50024)return u.CLUSTER_BREAK.LV}else if(e<50052){if(50025<=e&&e<=50051)return u.CLUSTER_BREAK.LVT}else if(e===50052)return u.CLUSTER_BREAK.LV}else if(e<50080){if(50053<=e&&e<=50079)return u.CLUSTER_BREAK.LVT}else if(e<50081){if(e===50080)return u.CLUSTER_BREAK.LV}else if(50081<=e&&e<=50107)return u.CLUSTER_BREAK.LVT}else if(e<50697){if(e<50389){if(e<50248){if(e<50165){if(e<50136){if(e<50109){if(e===50108)return u.CLUSTER_BREAK.LV}else if(50109<=e&&e<=50135)return u.CLUSTER_BREAK.LVT}else if(e<50137){if(e===50136)return u.CLUSTER_BREAK.LV}else if(e<50164){if(50137<=e&&e<=50163)return u.CLUSTER_BREAK.LVT}else if(e===50164)return u.CLUSTER_BREAK.LV}else if(e<50193){if(e<50192){if(50165<=e&&e<=50191)return u.CLUSTER_BREAK.LVT}else if(e===50192)return u.CLUSTER_BREAK.LV}else if(e<50220){if(50193<=e&&e<=50219)return u.CLUSTER_BREAK.LVT}else if(e<50221){if(e===50220)return u.CLUSTER_BREAK.LV}else if(50221<=e&&e<=50247)return u.CLUSTER_BREAK.LVT}else if(e<50305){if(e<50276){if(e<50249){if(e===50248)return u.CLUSTER_BREAK.LV}else if(50249<=e&&e<=50275)return u.CLUSTER_BREAK.LVT}else if(e<50277){if(e===50276)return u.CLUSTER_BREAK.LV}else if(e<50304){if(50277<=e&&e<=50303)return u.CLUSTER_BREAK.LVT}else if(e===50304)return u.CLUSTER_BREAK.LV}else if(e<50360){if(e<50332){if(50305<=e&&e<=50331)return u.CLUSTER_BREAK.LVT}else if(e<50333){if(e===50332)return u.CLUSTER_BREAK.LV}else if(50333<=e&&e<=50359)return u.CLUSTER_BREAK.LVT}else if(e<50361){if(e===50360)return u.CLUSTER_BREAK.LV}else if(e<50388){if(50361<=e&&e<=50387)return u.CLUSTER_BREAK.LVT}else if(e===50388)return u.CLUSTER_BREAK.LV}else if(e<50556){if(e<50472){if(e<50417){if(e<50416){if(50389<=e&&e<=50415)return u.CLUSTER_BREAK.LVT}else if(e===50416)return u.CLUSTER_BREAK.LV}else if(e<50444){if(50417<=e&&e<=50443)return u.CLUSTER_BREAK.LVT}else if(e<50445){if(e===50444)return u.CLUSTER_BREAK.LV}else if(50445<=e&&e<=50471)return u.CLUSTER_BREAK.LVT}else if(e<50501){if(e<50473){if(e===50472)return u.CLUSTER_BREAK.LV}else if(e<50500){if(50473<=e&&e<=50499)return u.CLUSTER_BREAK.LVT}else if(e===50500)return u.CLUSTER_BREAK.LV}else if(e<50528){if(50501<=e&&e<=50527)return u.CLUSTER_BREAK.LVT}else if(e<50529){if(e===50528)return u.CLUSTER_BREAK.LV}else if(50529<=e&&e<=50555)return u.CLUSTER_BREAK.LVT}else if(e<50613){if(e<50584){if(e<50557){if(e===50556)return u.CLUSTER_BREAK.LV}else if(50557<=e&&e<=50583)return u.CLUSTER_BREAK.LVT}else if(e<50585){if(e===50584)return u.CLUSTER_BREAK.LV}else if(e<50612){if(50585<=e&&e<=50611)return u.CLUSTER_BREAK.LVT}else if(e===50612)return u.CLUSTER_BREAK.LV}else if(e<50668){if(e<50640){if(50613<=e&&e<=50639)return u.CLUSTER_BREAK.LVT}else if(e<50641){if(e===50640)return u.CLUSTER_BREAK.LV}else if(50641<=e&&e<=50667)return u.CLUSTER_BREAK.LVT}else if(e<50669){if(e===50668)return u.CLUSTER_BREAK.LV}else if(e<50696){if(50669<=e&&e<=50695)return u.CLUSTER_BREAK.LVT}else if(e===50696)return u.CLUSTER_BREAK.LV}else if(e<51004){if(e<50837){if(e<50780){if(e<50725){if(e<50724){if(50697<=e&&e<=50723)return u.CLUSTER_BREAK.LVT}else if(e===50724)return u.CLUSTER_BREAK.LV}else if(e<50752){if(50725<=e&&e<=50751)return u.CLUSTER_BREAK.LVT}else if(e<50753){if(e===50752)return u.CLUSTER_BREAK.LV}else if(50753<=e&&e<=50779)return u.CLUSTER_BREAK.LVT}else if(e<50808){if(e<50781){if(e===50780)return u.CLUSTER_BREAK.LV}else if(50781<=e&&e<=50807)return u.CLUSTER_BREAK.LVT}else if(e<50809){if(e===50808)return u.CLUSTER_BREAK.LV}else if(e<50836){if(50809<=e&&e<=50835)return u.CLUSTER_BREAK.LVT}else if(e===50836)return u.CLUSTER_BREAK.LV}else if(e<50920){if(e<50865){if(e<50864){if(50837<=e&&e<=50863)return u.CLUSTER_BREAK.LVT}else if(e===50864)return u.CLUSTER_BREAK.LV}else if(e<50892){if(50865<=e&&e<=50891)return u.CLUSTER_BREAK.LVT}else if(e<50893){if(e===50892)return u.CLUSTER_BREAK.LV}else if(50893<=e&&e<=50919)return u.CLUSTER_BREAK.LVT}else if(e<50949){if(e<50921){if(e===50920)return u.CLUSTER_BREAK.LV}else if(e<50948){if(50921<=e&&e<=50947)return u.CLUSTER_BREAK.LVT}else if(e===50948)return u.CLUSTER_BREAK.LV}else if(e<50976){if(50949<=e&&e<=50975)return u.CLUSTER_BREAK.LVT}else if(e<50977){if(e===50976)return u.CLUSTER_BREAK.LV}else if(50977<=e&&e<=51003)return u.CLUSTER_BREAK.LVT}else if(e<51145){if(e<51061){if(e<51032){if(e<51005){if(e===51004)return u.CLUSTER_BREAK.LV}else if(51005<=e&&e<=51031)return u.CLUSTER_BREAK.LVT}else if(e<51033){if(e===51032)return u.CLUSTER_BREAK.LV}else if(e<51060){if(51033<=e&&e<=51059)return u.CLUSTER_BREAK.LVT}else if(e===51060)return u.CLUSTER_BREAK.LV}else if(e<51116){if(e<51088){if(51061<=e&&e<=51087)return u.CLUSTER_BREAK.LVT}else if(e<51089){if(e===51088)return u.CLUSTER_BREAK.LV}else if(51089<=e&&e<=51115)return u.CLUSTER_BREAK.LVT}else if(e<51117){if(e===51116)return u.CLUSTER_BREAK.LV}else if(e<51144){if(51117<=e&&e<=51143)return u.CLUSTER_BREAK.LVT}else if(e===51144)return u.CLUSTER_BREAK.LV}else if(e<51228){if(e<51173){if(e<51172){if(51145<=e&&e<=51171)return u.CLUSTER_BREAK.LVT}else if(e===51172)return u.CLUSTER_BREAK.LV}else if(e<51200){if(51173<=e&&e<=51199)return u.CLUSTER_BREAK.LVT}else if(e<51201){if(e===51200)return u.CLUSTER_BREAK.LV}else if(51201<=e&&e<=51227)return u.CLUSTER_BREAK.LVT}else if(e<51257){if(e<51229){if(e===51228)return u.CLUSTER_BREAK.LV}else if(e<51256){if(51229<=e&&e<=51255)return u.CLUSTER_BREAK.LVT}else if(e===51256)return u.CLUSTER_BREAK.LV}else if(e<51284){if(51257<=e&&e<=51283)return u.CLUSTER_BREAK.LVT}else if(e<51285){if(e===51284)return u.CLUSTER_BREAK.LV}else if(51285<=e&&e<=51311)return u.CLUSTER_BREAK.LVT}else if(e<52516){if(e<51901){if(e<51593){if(e<51452){if(e<51369){if(e<51340){if(e<51313){if(e===51312)return u.CLUSTER_BREAK.LV}else if(51313<=e&&e<=51339)return u.CLUSTER_BREAK.LVT}else if(e<51341){if(e===51340)return u.CLUSTER_BREAK.LV}else if(e<51368){if(51341<=e&&e<=51367)return u.CLUSTER_BREAK.LVT}else if(e===51368)return u.CLUSTER_BREAK.LV}else if(e<51397){if(e<51396){if(51369<=e&&e<=51395)return u.CLUSTER_BREAK.LVT}else if(e===51396)return u.CLUSTER_BREAK.LV}else if(e<51424){if(51397<=e&&e<=51423)return u.CLUSTER_BREAK.LVT}else if(e<51425){if(e===51424)return u.CLUSTER_BREAK.LV}else if(51425<=e&&e<=51451)return u.CLUSTER_BREAK.LVT}else if(e<51509){if(e<51480){if(e<51453){if(e===51452)return u.CLUSTER_BREAK.LV}else if(51453<=e&&e<=51479)return u.CLUSTER_BREAK.LVT}else if(e<51481){if(e===51480)return u.CLUSTER_BREAK.LV}else if(e<51508){if(51481<=e&&e<=51507)return u.CLUSTER_BREAK.LVT}else if(e===51508)return u.CLUSTER_BREAK.LV}else if(e<51564){if(e<51536){if(51509<=e&&e<=51535)return u.CLUSTER_BREAK.LVT}else if(e<51537){if(e===51536)return u.CLUSTER_BREAK.LV}else if(51537<=e&&e<=51563)return u.CLUSTER_BREAK.LVT}else if(e<51565){if(e===51564)return u.CLUSTER_BREAK.LV}else if(e<51592){if(51565<=e&&e<=51591)return u.CLUSTER_BREAK.LVT}else if(e===51592)return u.CLUSTER_BREAK.LV}else if(e<51760){if(e<51676){if(e<51621){if(e<51620){if(51593<=e&&e<=51619)return u.CLUSTER_BREAK.LVT}else if(e===51620)return u.CLUSTER_BREAK.LV}else if(e<51648){if(51621<=e&&e<=51647)return u.CLUSTER_BREAK.LVT}else if(e<51649){if(e===51648)return u.CLUSTER_BREAK.LV}else if(51649<=e&&e<=51675)return u.CLUSTER_BREAK.LVT}else if(e<51705){if(e<51677){if(e===51676)return u.CLUSTER_BREAK.LV}else if(e<51704){if(51677<=e&&e<=51703)return u.CLUSTER_BREAK.LVT}else if(e===51704)return u.CLUSTER_BREAK.LV}else if(e<51732){if(51705<=e&&e<=51731)return u.CLUSTER_BREAK.LVT}else if(e<51733){if(e===51732)return u.CLUSTER_BREAK.LV}else if(51733<=e&&e<=51759)return u.CLUSTER_BREAK.LVT}else if(e<51817){if(e<51788){if(e<51761){if(e===51760)return u.CLUSTER_BREAK.LV}else if(51761<=e&&e<=51787)return u.CLUSTER_BREAK.LVT}else if(e<51789){if(e===51788)return u.CLUSTER_BREAK.LV}else if(e<51816){if(51789<=e&&e<=51815)return u.CLUSTER_BREAK.LVT}else if(e===51816)return u.CLUSTER_BREAK.LV}else if(e<51872){if(e<51844){if(51817<=e&&e<=51843)return u.CLUSTER_BREAK.LVT}else if(e<51845){if(e===51844)return u.CLUSTER_BREAK.LV}else if(51845<=e&&e<=51871)return u.CLUSTER_BREAK.LVT}else if(e<51873){if(e===51872)return u.CLUSTER_BREAK.LV}else if(e<51900){if(51873<=e&&e<=51899)return u.CLUSTER_BREAK.LVT}else if(e===51900)return u.CLUSTER_BREAK.LV}else if(e<52208){if(e<52041){if(e<51984){if(e<51929){if(e<51928){if(51901<=e&&e<=51927)return u.CLUSTER_BREAK.LVT}else if(e===51928)return u.CLUSTER_BREAK.LV}else if(e<51956){if(51929<=e&&e<=51955)return u.CLUSTER_BREAK.LVT}else if(e<51957){if(e===51956)return u.CLUSTER_BREAK.LV}else if(51957<=e&&e<=51983)return u.CLUSTER_BREAK.LVT}else if(e<52012){if(e<51985){if(e===51984)return u.CLUSTER_BREAK.LV}else if(51985<=e&&e<=52011)return u.CLUSTER_BREAK.LVT}else if(e<52013){if(e===52012)return u.CLUSTER_BREAK.LV}else if(e<52040){if(52013<=e&&e<=52039)return u.CLUSTER_BREAK.LVT}else if(e===52040)return u.CLUSTER_BREAK.LV}else if(e<52124){if(e<52069){if(e<52068){if(52041<=e&&e<=52067)return u.CLUSTER_BREAK.LVT}else if(e===52068)return u.CLUSTER_BREAK.LV}else if(e<52096){if(52069<=e&&e<=52095)return u.CLUSTER_BREAK.LVT}else if(e<52097){if(e===52096)return u.CLUSTER_BREAK.LV}else if(52097<=e&&e<=52123)return u.CLUSTER_BREAK.LVT}else if(e<52153){if(e<52125){if(e===52124)return u.CLUSTER_BREAK.LV}else if(e<52152){if(52125<=e&&e<=52151)return u.CLUSTER_BREAK.LVT}else if(e===52152)return u.CLUSTER_BREAK.LV}else if(e<52180){if(52153<=e&&e<=52179)return u.CLUSTER_BREAK.LVT}else if(e<52181){if(e===52180)return u.CLUSTER_BREAK.LV}else if(52181<=e&&e<=52207)return u.CLUSTER_BREAK.LVT}else if(e<52349){if(e<52265){if(e<52236){if(e<52209){if(e===52208)return u.CLUSTER_BREAK.LV}else if(52209<=e&&e<=52235)return u.CLUSTER_BREAK.LVT}else if(e<52237){if(e===52236)return u.CLUSTER_BREAK.LV}else if(e<52264){if(52237<=e&&e<=52263)return u.CLUSTER_BREAK.LVT}else if(e===52264)return u.CLUSTER_BREAK.LV}else if(e<52320){if(e<52292){if(52265<=e&&e<=52291)return u.CLUSTER_BREAK.LVT}else if(e<52293){if(e===52292)return u.CLUSTER_BREAK.LV}else if(52293<=e&&e<=52319)return u.CLUSTER_BREAK.LVT}else if(e<52321){if(e===52320)return u.CLUSTER_BREAK.LV}else if(e<52348){if(52321<=e&&e<=52347)return u.CLUSTER_BREAK.LVT}else if(e===52348)return u.CLUSTER_BREAK.LV}else if(e<52432){if(e<52377){if(e<52376){if(52349<=e&&e<=52375)return u.CLUSTER_BREAK.LVT}else if(e===52376)return u.CLUSTER_BREAK.LV}else if(e<52404){if(52377<=e&&e<=52403)return u.CLUSTER_BREAK.LVT}else if(e<52405){if(e===52404)return u.CLUSTER_BREAK.LV}else if(52405<=e&&e<=52431)return u.CLUSTER_BREAK.LVT}else if(e<52461){if(e<52433){if(e===52432)return u.CLUSTER_BREAK.LV}else if(e<52460){if(52433<=e&&e<=52459)return u.CLUSTER_BREAK.LVT}else if(e===52460)return u.CLUSTER_BREAK.LV}else if(e<52488){if(52461<=e&&e<=52487)return u.CLUSTER_BREAK.LVT}else if(e<52489){if(e===52488)return u.CLUSTER_BREAK.LV}else if(52489<=e&&e<=52515)return u.CLUSTER_BREAK.LVT}else if(e<53105){if(e<52797){if(e<52656){if(e<52573){if(e<52544){if(e<52517){if(e===52516)return u.CLUSTER_BREAK.LV}else if(52517<=e&&e<=52543)return u.CLUSTER_BREAK.LVT}else if(e<52545){if(e===52544)return u.CLUSTER_BREAK.LV}else if(e<52572){if(52545<=e&&e<=52571)return u.CLUSTER_BREAK.LVT}else if(e===52572)return u.CLUSTER_BREAK.LV}else if(e<52601){if(e<52600){if(52573<=e&&e<=52599)return u.CLUSTER_BREAK.LVT}else if(e===52600)return u.CLUSTER_BREAK.LV}else if(e<52628){if(52601<=e&&e<=52627)return u.CLUSTER_BREAK.LVT}else if(e<52629){if(e===52628)return u.CLUSTER_BREAK.LV}else if(52629<=e&&e<=52655)return u.CLUSTER_BREAK.LVT}else if(e<52713){if(e<52684){if(e<52657){if(e===52656)return u.CLUSTER_BREAK.LV}else if(52657<=e&&e<=52683)return u.CLUSTER_BREAK.LVT}else if(e<52685){if(e===52684)return u.CLUSTER_BREAK.LV}else if(e<52712){if(52685<=e&&e<=52711)return u.CLUSTER_BREAK.LVT}else if(e===52712)return u.CLUSTER_BREAK.LV}else if(e<52768){if(e<52740){if(52713<=e&&e<=52739)return u.CLUSTER_BREAK.LVT}else if(e<52741){if(e===52740)return u.CLUSTER_BREAK.LV}else if(52741<=e&&e<=52767)return u.CLUSTER_BREAK.LVT}else if(e<52769){if(e===52768)return u.CLUSTER_BREAK.LV}else if(e<52796){if(52769<=e&&e<=52795)return u.CLUSTER_BREAK.LVT}else if(e===52796)return u.CLUSTER_BREAK.LV}else if(e<52964){if(e<52880){if(e<52825){if(e<52824){if(52797<=e&&e<=52823)return u.CLUSTER_BREAK.LVT}else if(e===52824)return u.CLUSTER_BREAK.LV}else if(e<52852){if(52825<=e&&e<=52851)return u.CLUSTER_BREAK.LVT}else if(e<52853){if(e===52852)return u.CLUSTER_BREAK.LV}else if(52853<=e&&e<=52879)return u.CLUSTER_BREAK.LVT}else if(e<52909){if(e<52881){if(e===52880)return u.CLUSTER_BREAK.LV}else if(e<52908){if(52881<=e&&e<=52907)return u.CLUSTER_BREAK.LVT}else if(e===52908)return u.CLUSTER_BREAK.LV}else if(e<52936){if(52909<=e&&e<=52935)return u.CLUSTER_BREAK.LVT}else if(e<52937){if(e===52936)return u.CLUSTER_BREAK.LV}else if(52937<=e&&e<=52963)return u.CLUSTER_BREAK.LVT}else if(e<53021){if(e<52992){if(e<52965){if(e===52964)return u.CLUSTER_BREAK.LV}else if(52965<=e&&e<=52991)return u.CLUSTER_BREAK.LVT}else if(e<52993){if(e===52992)return u.CLUSTER_BREAK.LV}else if(e<53020){if(52993<=e&&e<=53019)return u.CLUSTER_BREAK.LVT}else if(e===53020)return u.CLUSTER_BREAK.LV}else if(e<53076){if(e<53048){if(53021<=e&&e<=53047)return u.CLUSTER_BREAK.LVT}else if(e<53049){if(e===53048)return u.CLUSTER_BREAK.LV}else if(53049<=e&&e<=53075)return u.CLUSTER_BREAK.LVT}else if(e<53077){if(e===53076)return u.CLUSTER_BREAK.LV}else if(e<53104){if(53077<=e&&e<=53103)return u.CLUSTER_BREAK.LVT}else if(e===53104)return u.CLUSTER_BREAK.LV}else if(e<53412){if(e<53245){if(e<53188){if(e<53133){if(e<53132){if(53105<=e&&e<=53131)return u.CLUSTER_BREAK.LVT}else if(e===53132)return u.CLUSTER_BREAK.LV}else if(e<53160){if(53133<=e&&e<=53159)return u.CLUSTER_BREAK.LVT}else if(e<53161){if(e===53160)return u.CLUSTER_BREAK.LV}else if(53161<=e&&e<=53187)return u.CLUSTER_BREAK.LVT}else if(e<53216){if(e<53189){if(e===53188)return u.CLUSTER_BREAK.LV}else if(53189<=e&&e<=53215)return u.CLUSTER_BREAK.LVT}else if(e<53217){if(e===53216)return u.CLUSTER_BREAK.LV}else if(e<53244){if(53217<=e&&e<=53243)return u.CLUSTER_BREAK.LVT}else if(e===53244)return u.CLUSTER_BREAK.LV}else if(e<53328){if(e<53273){if(e<53272){if(53245<=e&&e<=53271)return u.CLUSTER_BREAK.LVT}else if(e===53272)return u.CLUSTER_BREAK.LV}else if(e<53300){if(53273<=e&&e<=53299)return u.CLUSTER_BREAK.LVT}else if(e<53301){if(e===53300)return u.CLUSTER_BREAK.LV}else if(53301<=e&&e<=53327)return u.CLUSTER_BREAK.LVT}else if(e<53357){if(e<53329){if(e===53328)return u.CLUSTER_BREAK.LV}else if(e<53356){if(53329<=e&&e<=53355)return u.CLUSTER_BREAK.LVT}else if(e===53356)return u.CLUSTER_BREAK.LV}else if(e<53384){if(53357<=e&&e<=53383)return u.CLUSTER_BREAK.LVT}else if(e<53385){if(e===53384)return u.CLUSTER_BREAK.LV}else if(53385<=e&&e<=53411)return u.CLUSTER_BREAK.LVT}else if(e<53553){if(e<53469){if(e<53440){if(e<53413){if(e===53412)return u.CLUSTER_BREAK.LV}else if(53413<=e&&e<=53439)return u.CLUSTER_BREAK.LVT}else if(e<53441){if(e===53440)return u.CLUSTER_BREAK.LV}else if(e<53468){if(53441<=e&&e<=53467)return u.CLUSTER_BREAK.LVT}else if(e===53468)return u.CLUSTER_BREAK.LV}else if(e<53524){if(e<53496){if(53469<=e&&e<=53495)return u.CLUSTER_BREAK.LVT}else if(e<53497){if(e===53496)return u.CLUSTER_BREAK.LV}else if(53497<=e&&e<=53523)return u.CLUSTER_BREAK.LVT}else if(e<53525){if(e===53524)return u.CLUSTER_BREAK.LV}else if(e<53552){if(53525<=e&&e<=53551)return u.CLUSTER_BREAK.LVT}else if(e===53552)return u.CLUSTER_BREAK.LV}else if(e<53636){if(e<53581){if(e<53580){if(53553<=e&&e<=53579)return u.CLUSTER_BREAK.LVT}else if(e===53580)return u.CLUSTER_BREAK.LV}else if(e<53608){if(53581<=e&&e<=53607)return u.CLUSTER_BREAK.LVT}else if(e<53609){if(e===53608)return u.CLUSTER_BREAK.LV}else if(53609<=e&&e<=53635)return u.CLUSTER_BREAK.LVT}else if(e<53665){if(e<53637){if(e===53636)return u.CLUSTER_BREAK.LV}else if(e<53664){if(53637<=e&&e<=53663)return u.CLUSTER_BREAK.LVT}else if(e===53664)return u.CLUSTER_BREAK.LV}else if(e<53692){if(53665<=e&&e<=53691)return u.CLUSTER_BREAK.LVT}else if(e<53693){if(e===53692)return u.CLUSTER_BREAK.LV}else if(53693<=e&&e<=53719)return u.CLUSTER_BREAK.LVT}else if(e<70459){if(e<54897){if(e<54308){if(e<54001){if(e<53860){if(e<53777){if(e<53748){if(e<53721){if(e===53720)return u.CLUSTER_BREAK.LV}else if(53721<=e&&e<=53747)return u.CLUSTER_BREAK.LVT}else if(e<53749){if(e===53748)return u.CLUSTER_BREAK.LV}else if(e<53776){if(53749<=e&&e<=53775)return u.CLUSTER_BREAK.LVT}else if(e===53776)return u.CLUSTER_BREAK.LV}else if(e<53805){if(e<53804){if(53777<=e&&e<=53803)return u.CLUSTER_BREAK.LVT}else if(e===53804)return u.CLUSTER_BREAK.LV}else if(e<53832){if(53805<=e&&e<=53831)return u.CLUSTER_BREAK.LVT}else if(e<53833){if(e===53832)return u.CLUSTER_BREAK.LV}else if(53833<=e&&e<=53859)return u.CLUSTER_BREAK.LVT}else if(e<53917){if(e<53888){if(e<53861){if(e===53860)return u.CLUSTER_BREAK.LV}else if(53861<=e&&e<=53887)return u.CLUSTER_BREAK.LVT}else if(e<53889){if(e===53888)return u.CLUSTER_BREAK.LV}else if(e<53916){if(53889<=e&&e<=53915)return u.CLUSTER_BREAK.LVT}else if(e===53916)return u.CLUSTER_BREAK.LV}else if(e<53972){if(e<53944){if(53917<=e&&e<=53943)return u.CLUSTER_BREAK.LVT}else if(e<53945){if(e===53944)return u.CLUSTER_BREAK.LV}else if(53945<=e&&e<=53971)return u.CLUSTER_BREAK.LVT}else if(e<53973){if(e===53972)return u.CLUSTER_BREAK.LV}else if(e<54e3){if(53973<=e&&e<=53999)return u.CLUSTER_BREAK.LVT}else if(e===54e3)return u.CLUSTER_BREAK.LV}else if(e<54141){if(e<54084){if(e<54029){if(e<54028){if(54001<=e&&e<=54027)return u.CLUSTER_BREAK.LVT}else if(e===54028)return u.CLUSTER_BREAK.LV}else if(e<54056){if(54029<=e&&e<=54055)return u.CLUSTER_BREAK.LVT}else if(e<54057){if(e===54056)return u.CLUSTER_BREAK.LV}else if(54057<=e&&e<=54083)return u.CLUSTER_BREAK.LVT}else if(e<54112){if(e<54085){if(e===54084)return u.CLUSTER_BREAK.LV}else if(54085<=e&&e<=54111)return u.CLUSTER_BREAK.LVT}else if(e<54113){if(e===54112)return u.CLUSTER_BREAK.LV}else if(e<54140){if(54113<=e&&e<=54139)return u.CLUSTER_BREAK.LVT}else if(e===54140)return u.CLUSTER_BREAK.LV}else if(e<54224){if(e<54169){if(e<54168){if(54141<=e&&e<=54167)return u.CLUSTER_BREAK.LVT}else if(e===54168)return u.CLUSTER_BREAK.LV}else if(e<54196){if(54169<=e&&e<=54195)return u.CLUSTER_BREAK.LVT}else if(e<54197){if(e===54196)return u.CLUSTER_BREAK.LV}else if(54197<=e&&e<=54223)return u.CLUSTER_BREAK.LVT}else if(e<54253){if(e<54225){if(e===54224)return u.CLUSTER_BREAK.LV}else if(e<54252){if(54225<=e&&e<=54251)return u.CLUSTER_BREAK.LVT}else if(e===54252)return u.CLUSTER_BREAK.LV}else if(e<54280){if(54253<=e&&e<=54279)return u.CLUSTER_BREAK.LVT}else if(e<54281){if(e===54280)return u.CLUSTER_BREAK.LV}else if(54281<=e&&e<=54307)return u.CLUSTER_BREAK.LVT}else if(e<54589){if(e<54448){if(e<54365){if(e<54336){if(e<54309){if(e===54308)return u.CLUSTER_BREAK.LV}else if(54309<=e&&e<=54335)return u.CLUSTER_BREAK.LVT}else if(e<54337){if(e===54336)return u.CLUSTER_BREAK.LV}else if(e<54364){if(54337<=e&&e<=54363)return u.CLUSTER_BREAK.LVT}else if(e===54364)return u.CLUSTER_BREAK.LV}else if(e<54393){if(e<54392){if(54365<=e&&e<=54391)return u.CLUSTER_BREAK.LVT}else if(e===54392)return u.CLUSTER_BREAK.LV}else if(e<54420){if(54393<=e&&e<=54419)return u.CLUSTER_BREAK.LVT}else if(e<54421){if(e===54420)return u.CLUSTER_BREAK.LV}else if(54421<=e&&e<=54447)return u.CLUSTER_BREAK.LVT}else if(e<54505){if(e<54476){if(e<54449){if(e===54448)return u.CLUSTER_BREAK.LV}else if(54449<=e&&e<=54475)return u.CLUSTER_BREAK.LVT}else if(e<54477){if(e===54476)return u.CLUSTER_BREAK.LV}else if(e<54504){if(54477<=e&&e<=54503)return u.CLUSTER_BREAK.LVT}else if(e===54504)return u.CLUSTER_BREAK.LV}else if(e<54560){if(e<54532){if(54505<=e&&e<=54531)return u.CLUSTER_BREAK.LVT}else if(e<54533){if(e===54532)return u.CLUSTER_BREAK.LV}else if(54533<=e&&e<=54559)return u.CLUSTER_BREAK.LVT}else if(e<54561){if(e===54560)return u.CLUSTER_BREAK.LV}else if(e<54588){if(54561<=e&&e<=54587)return u.CLUSTER_BREAK.LVT}else if(e===54588)return u.CLUSTER_BREAK.LV}else if(e<54756){if(e<54672){if(e<54617){if(e<54616){if(54589<=e&&e<=54615)return u.CLUSTER_BREAK.LVT}else if(e===54616)return u.CLUSTER_BREAK.LV}else if(e<54644){if(54617<=e&&e<=54643)return u.CLUSTER_BREAK.LVT}else if(e<54645){if(e===54644)return u.CLUSTER_BREAK.LV}else if(54645<=e&&e<=54671)return u.CLUSTER_BREAK.LVT}else if(e<54701){if(e<54673){if(e===54672)return u.CLUSTER_BREAK.LV}else if(e<54700){if(54673<=e&&e<=54699)return u.CLUSTER_BREAK.LVT}else if(e===54700)return u.CLUSTER_BREAK.LV}else if(e<54728){if(54701<=e&&e<=54727)return u.CLUSTER_BREAK.LVT}else if(e<54729){if(e===54728)return u.CLUSTER_BREAK.LV}else if(54729<=e&&e<=54755)return u.CLUSTER_BREAK.LVT}else if(e<54813){if(e<54784){if(e<54757){if(e===54756)return u.CLUSTER_BREAK.LV}else if(54757<=e&&e<=54783)return u.CLUSTER_BREAK.LVT}else if(e<54785){if(e===54784)return u.CLUSTER_BREAK.LV}else if(e<54812){if(54785<=e&&e<=54811)return u.CLUSTER_BREAK.LVT}else if(e===54812)return u.CLUSTER_BREAK.LV}else if(e<54868){if(e<54840){if(54813<=e&&e<=54839)return u.CLUSTER_BREAK.LVT}else if(e<54841){if(e===54840)return u.CLUSTER_BREAK.LV}else if(54841<=e&&e<=54867)return u.CLUSTER_BREAK.LVT}else if(e<54869){if(e===54868)return u.CLUSTER_BREAK.LV}else if(e<54896){if(54869<=e&&e<=54895)return u.CLUSTER_BREAK.LVT}else if(e===54896)return u.CLUSTER_BREAK.LV}else if(e<69632){if(e<55216){if(e<55037){if(e<54980){if(e<54925){if(e<54924){if(54897<=e&&e<=54923)return u.CLUSTER_BREAK.LVT}else if(e===54924)return u.CLUSTER_BREAK.LV}else if(e<54952){if(54925<=e&&e<=54951)return u.CLUSTER_BREAK.LVT}else if(e<54953){if(e===54952)return u.CLUSTER_BREAK.LV}else if(54953<=e&&e<=54979)return u.CLUSTER_BREAK.LVT}else if(e<55008){if(e<54981){if(e===54980)return u.CLUSTER_BREAK.LV}else if(54981<=e&&e<=55007)return u.CLUSTER_BREAK.LVT}else if(e<55009){if(e===55008)return u.CLUSTER_BREAK.LV}else if(e<55036){if(55009<=e&&e<=55035)return u.CLUSTER_BREAK.LVT}else if(e===55036)return u.CLUSTER_BREAK.LV}else if(e<55120){if(e<55065){if(e<55064){if(55037<=e&&e<=55063)return u.CLUSTER_BREAK.LVT}else if(e===55064)return u.CLUSTER_BREAK.LV}else if(e<55092){if(55065<=e&&e<=55091)return u.CLUSTER_BREAK.LVT}else if(e<55093){if(e===55092)return u.CLUSTER_BREAK.LV}else if(55093<=e&&e<=55119)return u.CLUSTER_BREAK.LVT}else if(e<55149){if(e<55121){if(e===55120)return u.CLUSTER_BREAK.LV}else if(e<55148){if(55121<=e&&e<=55147)return u.CLUSTER_BREAK.LVT}else if(e===55148)return u.CLUSTER_BREAK.LV}else if(e<55176){if(55149<=e&&e<=55175)return u.CLUSTER_BREAK.LVT}else if(e<55177){if(e===55176)return u.CLUSTER_BREAK.LV}else if(55177<=e&&e<=55203)return u.CLUSTER_BREAK.LVT}else if(e<68097){if(e<65279){if(e<64286){if(e<55243){if(55216<=e&&e<=55238)return u.CLUSTER_BREAK.V}else if(55243<=e&&e<=55291)return u.CLUSTER_BREAK.T}else if(e<65024){if(e===64286)return u.CLUSTER_BREAK.EXTEND}else if(e<65056){if(65024<=e&&e<=65039)return u.CLUSTER_BREAK.EXTEND}else if(65056<=e&&e<=65071)return u.CLUSTER_BREAK.EXTEND}else if(e<66045){if(e<65438){if(e===65279)return u.CLUSTER_BREAK.CONTROL}else if(e<65520){if(65438<=e&&e<=65439)return u.CLUSTER_BREAK.EXTEND}else if(65520<=e&&e<=65531)return u.CLUSTER_BREAK.CONTROL}else if(e<66272){if(e===66045)return u.CLUSTER_BREAK.EXTEND}else if(e<66422){if(e===66272)return u.CLUSTER_BREAK.EXTEND}else if(66422<=e&&e<=66426)return u.CLUSTER_BREAK.EXTEND}else if(e<68325){if(e<68108){if(e<68101){if(68097<=e&&e<=68099)return u.CLUSTER_BREAK.EXTEND}else if(68101<=e&&e<=68102)return u.CLUSTER_BREAK.EXTEND}else if(e<68152){if(68108<=e&&e<=68111)return u.CLUSTER_BREAK.EXTEND}else if(e<68159){if(68152<=e&&e<=68154)return u.CLUSTER_BREAK.EXTEND}else if(e===68159)return u.CLUSTER_BREAK.EXTEND}else if(e<69373){if(e<68900){if(68325<=e&&e<=68326)return u.CLUSTER_BREAK.EXTEND}else if(e<69291){if(68900<=e&&e<=68903)return u.CLUSTER_BREAK.EXTEND}else if(69291<=e&&e<=69292)return u.CLUSTER_BREAK.EXTEND}else if(e<69446){if(69373<=e&&e<=69375)return u.CLUSTER_BREAK.EXTEND}else if(e<69506){if(69446<=e&&e<=69456)return u.CLUSTER_BREAK.EXTEND}else if(69506<=e&&e<=69509)return u.CLUSTER_BREAK.EXTEND}else if(e<70016){if(e<69815){if(e<69747){if(e<69634){if(e===69632)return u.CLUSTER_BREAK.SPACINGMARK;if(e===69633)return u.CLUSTER_BREAK.EXTEND}else if(e<69688){if(e===69634)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<69744){if(69688<=e&&e<=69702)return u.CLUSTER_BREAK.EXTEND}else if(e===69744)return u.CLUSTER_BREAK.EXTEND}else if(e<69762){if(e<69759){if(69747<=e&&e<=69748)return u.CLUSTER_BREAK.EXTEND}else if(69759<=e&&e<=69761)return u.CLUSTER_BREAK.EXTEND}else if(e<69808){if(e===69762)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<69811){if(69808<=e&&e<=69810)return u.CLUSTER_BREAK.SPACINGMARK}else if(69811<=e&&e<=69814)return u.CLUSTER_BREAK.EXTEND}else if(e<69888)if(e<69821){if(e<69817){if(69815<=e&&e<=69816)return u.CLUSTER_BREAK.SPACINGMARK}else if(69817<=e&&e<=69818)return u.CLUSTER_BREAK.EXTEND}else if(e<69826){if(e===69821)return u.CLUSTER_BREAK.PREPEND}else{if(e===69826)return u.CLUSTER_BREAK.EXTEND;if(e===69837)return u.CLUSTER_BREAK.PREPEND}else if(e<69933){if(e<69927){if(69888<=e&&e<=69890)return u.CLUSTER_BREAK.EXTEND}else if(e<69932){if(69927<=e&&e<=69931)return u.CLUSTER_BREAK.EXTEND}else if(e===69932)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<69957){if(69933<=e&&e<=69940)return u.CLUSTER_BREAK.EXTEND}else if(e<70003){if(69957<=e&&e<=69958)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===70003)return u.CLUSTER_BREAK.EXTEND}else if(e<70194){if(e<70082){if(e<70067){if(e<70018){if(70016<=e&&e<=70017)return u.CLUSTER_BREAK.EXTEND}else if(e===70018)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<70070){if(70067<=e&&e<=70069)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<70079){if(70070<=e&&e<=70078)return u.CLUSTER_BREAK.EXTEND}else if(70079<=e&&e<=70080)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<70095){if(e<70089){if(70082<=e&&e<=70083)return u.CLUSTER_BREAK.PREPEND}else if(e<70094){if(70089<=e&&e<=70092)return u.CLUSTER_BREAK.EXTEND}else if(e===70094)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<70188){if(e===70095)return u.CLUSTER_BREAK.EXTEND}else if(e<70191){if(70188<=e&&e<=70190)return u.CLUSTER_BREAK.SPACINGMARK}else if(70191<=e&&e<=70193)return u.CLUSTER_BREAK.EXTEND}else if(e<70209){if(e<70197){if(e<70196){if(70194<=e&&e<=70195)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===70196)return u.CLUSTER_BREAK.EXTEND}else if(e<70198){if(e===70197)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<70206){if(70198<=e&&e<=70199)return u.CLUSTER_BREAK.EXTEND}else if(e===70206)return u.CLUSTER_BREAK.EXTEND}else if(e<70371){if(e<70367){if(e===70209)return u.CLUSTER_BREAK.EXTEND}else if(e<70368){if(e===70367)return u.CLUSTER_BREAK.EXTEND}else if(70368<=e&&e<=70370)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<70400){if(70371<=e&&e<=70378)return u.CLUSTER_BREAK.EXTEND}else if(e<70402){if(70400<=e&&e<=70401)return u.CLUSTER_BREAK.EXTEND}else if(70402<=e&&e<=70403)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<72343){if(e<71339){if(e<70841){if(e<70512){if(e<70471){if(e<70463){if(e<70462){if(70459<=e&&e<=70460)return u.CLUSTER_BREAK.EXTEND}else if(e===70462)return u.CLUSTER_BREAK.EXTEND}else if(e<70464){if(e===70463)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<70465){if(e===70464)return u.CLUSTER_BREAK.EXTEND}else if(70465<=e&&e<=70468)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<70487){if(e<70475){if(70471<=e&&e<=70472)return u.CLUSTER_BREAK.SPACINGMARK}else if(70475<=e&&e<=70477)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<70498){if(e===70487)return u.CLUSTER_BREAK.EXTEND}else if(e<70502){if(70498<=e&&e<=70499)return u.CLUSTER_BREAK.SPACINGMARK}else if(70502<=e&&e<=70508)return u.CLUSTER_BREAK.EXTEND}else if(e<70725){if(e<70712){if(e<70709){if(70512<=e&&e<=70516)return u.CLUSTER_BREAK.EXTEND}else if(70709<=e&&e<=70711)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<70720){if(70712<=e&&e<=70719)return u.CLUSTER_BREAK.EXTEND}else if(e<70722){if(70720<=e&&e<=70721)return u.CLUSTER_BREAK.SPACINGMARK}else if(70722<=e&&e<=70724)return u.CLUSTER_BREAK.EXTEND}else if(e<70832){if(e<70726){if(e===70725)return u.CLUSTER_BREAK.SPACINGMARK}else if(e===70726||e===70750)return u.CLUSTER_BREAK.EXTEND}else if(e<70833){if(e===70832)return u.CLUSTER_BREAK.EXTEND}else if(e<70835){if(70833<=e&&e<=70834)return u.CLUSTER_BREAK.SPACINGMARK}else if(70835<=e&&e<=70840)return u.CLUSTER_BREAK.EXTEND}else if(e<71096){if(e<70847)if(e<70843){if(e===70841)return u.CLUSTER_BREAK.SPACINGMARK;if(e===70842)return u.CLUSTER_BREAK.EXTEND}else if(e<70845){if(70843<=e&&e<=70844)return u.CLUSTER_BREAK.SPACINGMARK}else{if(e===70845)return u.CLUSTER_BREAK.EXTEND;if(e===70846)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<71087){if(e<70849){if(70847<=e&&e<=70848)return u.CLUSTER_BREAK.EXTEND}else if(e<70850){if(e===70849)return u.CLUSTER_BREAK.SPACINGMARK}else if(70850<=e&&e<=70851)return u.CLUSTER_BREAK.EXTEND}else if(e<71088){if(e===71087)return u.CLUSTER_BREAK.EXTEND}else if(e<71090){if(71088<=e&&e<=71089)return u.CLUSTER_BREAK.SPACINGMARK}else if(71090<=e&&e<=71093)return u.CLUSTER_BREAK.EXTEND}else if(e<71216){if(e<71102){if(e<71100){if(71096<=e&&e<=71099)return u.CLUSTER_BREAK.SPACINGMARK}else if(71100<=e&&e<=71101)return u.CLUSTER_BREAK.EXTEND}else if(e<71103){if(e===71102)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<71132){if(71103<=e&&e<=71104)return u.CLUSTER_BREAK.EXTEND}else if(71132<=e&&e<=71133)return u.CLUSTER_BREAK.EXTEND}else if(e<71229){if(e<71219){if(71216<=e&&e<=71218)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<71227){if(71219<=e&&e<=71226)return u.CLUSTER_BREAK.EXTEND}else if(71227<=e&&e<=71228)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<71230){if(e===71229)return u.CLUSTER_BREAK.EXTEND}else if(e<71231){if(e===71230)return u.CLUSTER_BREAK.SPACINGMARK}else if(71231<=e&&e<=71232)return u.CLUSTER_BREAK.EXTEND}else if(e<71999)if(e<71463){if(e<71350){if(e<71341){if(e===71339)return u.CLUSTER_BREAK.EXTEND;if(e===71340)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<71342){if(e===71341)return u.CLUSTER_BREAK.EXTEND}else if(e<71344){if(71342<=e&&e<=71343)return u.CLUSTER_BREAK.SPACINGMARK}else if(71344<=e&&e<=71349)return u.CLUSTER_BREAK.EXTEND}else if(e<71453){if(e===71350)return u.CLUSTER_BREAK.SPACINGMARK;if(e===71351)return u.CLUSTER_BREAK.EXTEND}else if(e<71458){if(71453<=e&&e<=71455)return u.CLUSTER_BREAK.EXTEND}else if(e<71462){if(71458<=e&&e<=71461)return u.CLUSTER_BREAK.EXTEND}else if(e===71462)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<71984){if(e<71727){if(e<71724){if(71463<=e&&e<=71467)return u.CLUSTER_BREAK.EXTEND}else if(71724<=e&&e<=71726)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<71736){if(71727<=e&&e<=71735)return u.CLUSTER_BREAK.EXTEND}else if(e<71737){if(e===71736)return u.CLUSTER_BREAK.SPACINGMARK}else if(71737<=e&&e<=71738)return u.CLUSTER_BREAK.EXTEND}else if(e<71995){if(e<71985){if(e===71984)return u.CLUSTER_BREAK.EXTEND}else if(e<71991){if(71985<=e&&e<=71989)return u.CLUSTER_BREAK.SPACINGMARK}else if(71991<=e&&e<=71992)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<71997){if(71995<=e&&e<=71996)return u.CLUSTER_BREAK.EXTEND}else{if(e===71997)return u.CLUSTER_BREAK.SPACINGMARK;if(e===71998)return u.CLUSTER_BREAK.EXTEND}else if(e<72193)if(e<72145)if(e<72001){if(e===71999)return u.CLUSTER_BREAK.PREPEND;if(e===72e3)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<72002){if(e===72001)return u.CLUSTER_BREAK.PREPEND}else{if(e===72002)return u.CLUSTER_BREAK.SPACINGMARK;if(e===72003)return u.CLUSTER_BREAK.EXTEND}else if(e<72156){if(e<72148){if(72145<=e&&e<=72147)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<72154){if(72148<=e&&e<=72151)return u.CLUSTER_BREAK.EXTEND}else if(72154<=e&&e<=72155)return u.CLUSTER_BREAK.EXTEND}else if(e<72160){if(72156<=e&&e<=72159)return u.CLUSTER_BREAK.SPACINGMARK}else{if(e===72160)return u.CLUSTER_BREAK.EXTEND;if(e===72164)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<72263){if(e<72249){if(e<72243){if(72193<=e&&e<=72202)return u.CLUSTER_BREAK.EXTEND}else if(72243<=e&&e<=72248)return u.CLUSTER_BREAK.EXTEND}else if(e<72250){if(e===72249)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<72251){if(e===72250)return u.CLUSTER_BREAK.PREPEND}else if(72251<=e&&e<=72254)return u.CLUSTER_BREAK.EXTEND}else if(e<72281){if(e<72273){if(e===72263)return u.CLUSTER_BREAK.EXTEND}else if(e<72279){if(72273<=e&&e<=72278)return u.CLUSTER_BREAK.EXTEND}else if(72279<=e&&e<=72280)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<72324){if(72281<=e&&e<=72283)return u.CLUSTER_BREAK.EXTEND}else if(e<72330){if(72324<=e&&e<=72329)return u.CLUSTER_BREAK.PREPEND}else if(72330<=e&&e<=72342)return u.CLUSTER_BREAK.EXTEND}else if(e<94033){if(e<73104){if(e<72881){if(e<72766){if(e<72751){if(e<72344){if(e===72343)return u.CLUSTER_BREAK.SPACINGMARK}else if(72344<=e&&e<=72345)return u.CLUSTER_BREAK.EXTEND}else if(e<72752){if(e===72751)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<72760){if(72752<=e&&e<=72758)return u.CLUSTER_BREAK.EXTEND}else if(72760<=e&&e<=72765)return u.CLUSTER_BREAK.EXTEND}else if(e<72850){if(e===72766)return u.CLUSTER_BREAK.SPACINGMARK;if(e===72767)return u.CLUSTER_BREAK.EXTEND}else if(e<72873){if(72850<=e&&e<=72871)return u.CLUSTER_BREAK.EXTEND}else if(e<72874){if(e===72873)return u.CLUSTER_BREAK.SPACINGMARK}else if(72874<=e&&e<=72880)return u.CLUSTER_BREAK.EXTEND}else if(e<73018){if(e<72884){if(e<72882){if(e===72881)return u.CLUSTER_BREAK.SPACINGMARK}else if(72882<=e&&e<=72883)return u.CLUSTER_BREAK.EXTEND}else if(e<72885){if(e===72884)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<73009){if(72885<=e&&e<=72886)return u.CLUSTER_BREAK.EXTEND}else if(73009<=e&&e<=73014)return u.CLUSTER_BREAK.EXTEND}else if(e<73030){if(e<73020){if(e===73018)return u.CLUSTER_BREAK.EXTEND}else if(e<73023){if(73020<=e&&e<=73021)return u.CLUSTER_BREAK.EXTEND}else if(73023<=e&&e<=73029)return u.CLUSTER_BREAK.EXTEND}else if(e<73031){if(e===73030)return u.CLUSTER_BREAK.PREPEND}else if(e<73098){if(e===73031)return u.CLUSTER_BREAK.EXTEND}else if(73098<=e&&e<=73102)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<73526){if(e<73459)if(e<73109){if(e<73107){if(73104<=e&&e<=73105)return u.CLUSTER_BREAK.EXTEND}else if(73107<=e&&e<=73108)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<73110){if(e===73109)return u.CLUSTER_BREAK.EXTEND}else{if(e===73110)return u.CLUSTER_BREAK.SPACINGMARK;if(e===73111)return u.CLUSTER_BREAK.EXTEND}else if(e<73474){if(e<73461){if(73459<=e&&e<=73460)return u.CLUSTER_BREAK.EXTEND}else if(e<73472){if(73461<=e&&e<=73462)return u.CLUSTER_BREAK.SPACINGMARK}else if(73472<=e&&e<=73473)return u.CLUSTER_BREAK.EXTEND}else if(e<73475){if(e===73474)return u.CLUSTER_BREAK.PREPEND}else if(e<73524){if(e===73475)return u.CLUSTER_BREAK.SPACINGMARK}else if(73524<=e&&e<=73525)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<78896)if(e<73536){if(e<73534){if(73526<=e&&e<=73530)return u.CLUSTER_BREAK.EXTEND}else if(73534<=e&&e<=73535)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<73537){if(e===73536)return u.CLUSTER_BREAK.EXTEND}else{if(e===73537)return u.CLUSTER_BREAK.SPACINGMARK;if(e===73538)return u.CLUSTER_BREAK.EXTEND}else if(e<92912){if(e<78912){if(78896<=e&&e<=78911)return u.CLUSTER_BREAK.CONTROL}else if(e<78919){if(e===78912)return u.CLUSTER_BREAK.EXTEND}else if(78919<=e&&e<=78933)return u.CLUSTER_BREAK.EXTEND}else if(e<92976){if(92912<=e&&e<=92916)return u.CLUSTER_BREAK.EXTEND}else if(e<94031){if(92976<=e&&e<=92982)return u.CLUSTER_BREAK.EXTEND}else if(e===94031)return u.CLUSTER_BREAK.EXTEND}else if(e<121476){if(e<119143)if(e<113824){if(e<94180){if(e<94095){if(94033<=e&&e<=94087)return u.CLUSTER_BREAK.SPACINGMARK}else if(94095<=e&&e<=94098)return u.CLUSTER_BREAK.EXTEND}else if(e<94192){if(e===94180)return u.CLUSTER_BREAK.EXTEND}else if(e<113821){if(94192<=e&&e<=94193)return u.CLUSTER_BREAK.SPACINGMARK}else if(113821<=e&&e<=113822)return u.CLUSTER_BREAK.EXTEND}else if(e<118576){if(e<118528){if(113824<=e&&e<=113827)return u.CLUSTER_BREAK.CONTROL}else if(118528<=e&&e<=118573)return u.CLUSTER_BREAK.EXTEND}else if(e<119141){if(118576<=e&&e<=118598)return u.CLUSTER_BREAK.EXTEND}else{if(e===119141)return u.CLUSTER_BREAK.EXTEND;if(e===119142)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<119173){if(e<119150){if(e<119149){if(119143<=e&&e<=119145)return u.CLUSTER_BREAK.EXTEND}else if(e===119149)return u.CLUSTER_BREAK.SPACINGMARK}else if(e<119155){if(119150<=e&&e<=119154)return u.CLUSTER_BREAK.EXTEND}else if(e<119163){if(119155<=e&&e<=119162)return u.CLUSTER_BREAK.CONTROL}else if(119163<=e&&e<=119170)return u.CLUSTER_BREAK.EXTEND}else if(e<121344){if(e<119210){if(119173<=e&&e<=119179)return u.CLUSTER_BREAK.EXTEND}else if(e<119362){if(119210<=e&&e<=119213)return u.CLUSTER_BREAK.EXTEND}else if(119362<=e&&e<=119364)return u.CLUSTER_BREAK.EXTEND}else if(e<121403){if(121344<=e&&e<=121398)return u.CLUSTER_BREAK.EXTEND}else if(e<121461){if(121403<=e&&e<=121452)return u.CLUSTER_BREAK.EXTEND}else if(e===121461)return u.CLUSTER_BREAK.EXTEND}else if(e<123628){if(e<122907){if(e<121505){if(e<121499){if(e===121476)return u.CLUSTER_BREAK.EXTEND}else if(121499<=e&&e<=121503)return u.CLUSTER_BREAK.EXTEND}else if(e<122880){if(121505<=e&&e<=121519)return u.CLUSTER_BREAK.EXTEND}else if(e<122888){if(122880<=e&&e<=122886)return u.CLUSTER_BREAK.EXTEND}else if(122888<=e&&e<=122904)return u.CLUSTER_BREAK.EXTEND}else if(e<123023){if(e<122915){if(122907<=e&&e<=122913)return u.CLUSTER_BREAK.EXTEND}else if(e<122918){if(122915<=e&&e<=122916)return u.CLUSTER_BREAK.EXTEND}else if(122918<=e&&e<=122922)return u.CLUSTER_BREAK.EXTEND}else if(e<123184){if(e===123023)return u.CLUSTER_BREAK.EXTEND}else if(e<123566){if(123184<=e&&e<=123190)return u.CLUSTER_BREAK.EXTEND}else if(e===123566)return u.CLUSTER_BREAK.EXTEND}else if(e<127995){if(e<125136){if(e<124140){if(123628<=e&&e<=123631)return u.CLUSTER_BREAK.EXTEND}else if(124140<=e&&e<=124143)return u.CLUSTER_BREAK.EXTEND}else if(e<125252){if(125136<=e&&e<=125142)return u.CLUSTER_BREAK.EXTEND}else if(e<127462){if(125252<=e&&e<=125258)return u.CLUSTER_BREAK.EXTEND}else if(127462<=e&&e<=127487)return u.CLUSTER_BREAK.REGIONAL_INDICATOR}else if(e<917632){if(e<917504){if(127995<=e&&e<=127999)return u.CLUSTER_BREAK.EXTEND}else if(e<917536){if(917504<=e&&e<=917535)return u.CLUSTER_BREAK.CONTROL}else if(917536<=e&&e<=917631)return u.CLUSTER_BREAK.EXTEND}else if(e<917760){if(917632<=e&&e<=917759)return u.CLUSTER_BREAK.CONTROL}else if(e<918e3){if(917760<=e&&e<=917999)return u.CLUSTER_BREAK.EXTEND}else if(918e3<=e&&e<=921599)return u.CLUSTER_BREAK.CONTROL;return u.CLUSTER_BREAK.OTHER}static getEmojiProperty(e){if(e<10160){if(e<9728){if(e<9e3){if(e<8482){if(e<8252){if(e===169||e===174)return u.EXTENDED_PICTOGRAPHIC}else if(e===8252||e===8265)return u.EXTENDED_PICTOGRAPHIC}else if(e<8596){if(e===8482||e===8505)return u.EXTENDED_PICTOGRAPHIC}else if(e<8617){if(8596<=e&&e<=8601)return u.EXTENDED_PICTOGRAPHIC}else if(e<8986){if(8617<=e&&e<=8618)return u.EXTENDED_PICTOGRAPHIC}else if(8986<=e&&e<=8987)return u.EXTENDED_PICTOGRAPHIC}else if(e<9410){if(e<9167){if(e===9e3||e===9096)return u.EXTENDED_PICTOGRAPHIC}else if(e<9193){if(e===9167)return u.EXTENDED_PICTOGRAPHIC}else if(e<9208){if(9193<=e&&e<=9203)return u.EXTENDED_PICTOGRAPHIC}else if(9208<=e&&e<=9210)return u.EXTENDED_PICTOGRAPHIC}else if(e<9654){if(e<9642){if(e===9410)return u.EXTENDED_PICTOGRAPHIC}else if(9642<=e&&e<=9643)return u.EXTENDED_PICTOGRAPHIC}else if(e<9664){if(e===9654)return u.EXTENDED_PICTOGRAPHIC}else if(e<9723){if(e===9664)return u.EXTENDED_PICTOGRAPHIC}else if(9723<=e&&e<=9726)return u.EXTENDED_PICTOGRAPHIC}else if(e<10035){if(e<10004){if(e<9748){if(e<9735){if(9728<=e&&e<=9733)return u.EXTENDED_PICTOGRAPHIC}else if(9735<=e&&e<=9746)return u.EXTENDED_PICTOGRAPHIC}else if(e<9872){if(9748<=e&&e<=9861)return u.EXTENDED_PICTOGRAPHIC}else if(e<9992){if(9872<=e&&e<=9989)return u.EXTENDED_PICTOGRAPHIC}else if(9992<=e&&e<=10002)return u.EXTENDED_PICTOGRAPHIC}else if(e<10013){if(e===10004||e===10006)return u.EXTENDED_PICTOGRAPHIC}else if(e<10017){if(e===10013)return u.EXTENDED_PICTOGRAPHIC}else if(e===10017||e===10024)return u.EXTENDED_PICTOGRAPHIC}else if(e<10067){if(e<10055){if(e<10052){if(10035<=e&&e<=10036)return u.EXTENDED_PICTOGRAPHIC}else if(e===10052)return u.EXTENDED_PICTOGRAPHIC}else if(e<10060){if(e===10055)return u.EXTENDED_PICTOGRAPHIC}else if(e===10060||e===10062)return u.EXTENDED_PICTOGRAPHIC}else if(e<10083){if(e<10071){if(10067<=e&&e<=10069)return u.EXTENDED_PICTOGRAPHIC}else if(e===10071)return u.EXTENDED_PICTOGRAPHIC}else if(e<10133){if(10083<=e&&e<=10087)return u.EXTENDED_PICTOGRAPHIC}else if(e<10145){if(10133<=e&&e<=10135)return u.EXTENDED_PICTOGRAPHIC}else if(e===10145)return u.EXTENDED_PICTOGRAPHIC}else if(e<127489){if(e<12951){if(e<11035){if(e<10548){if(e===10160||e===10175)return u.EXTENDED_PICTOGRAPHIC}else if(e<11013){if(10548<=e&&e<=10549)return u.EXTENDED_PICTOGRAPHIC}else if(11013<=e&&e<=11015)return u.EXTENDED_PICTOGRAPHIC}else if(e<11093){if(e<11088){if(11035<=e&&e<=11036)return u.EXTENDED_PICTOGRAPHIC}else if(e===11088)return u.EXTENDED_PICTOGRAPHIC}else if(e<12336){if(e===11093)return u.EXTENDED_PICTOGRAPHIC}else if(e===12336||e===12349)return u.EXTENDED_PICTOGRAPHIC}else if(e<127340){if(e<126976){if(e===12951||e===12953)return u.EXTENDED_PICTOGRAPHIC}else if(e<127245){if(126976<=e&&e<=127231)return u.EXTENDED_PICTOGRAPHIC}else if(e<127279){if(127245<=e&&e<=127247)return u.EXTENDED_PICTOGRAPHIC}else if(e===127279)return u.EXTENDED_PICTOGRAPHIC}else if(e<127374){if(e<127358){if(127340<=e&&e<=127345)return u.EXTENDED_PICTOGRAPHIC}else if(127358<=e&&e<=127359)return u.EXTENDED_PICTOGRAPHIC}else if(e<127377){if(e===127374)return u.EXTENDED_PICTOGRAPHIC}else if(e<127405){if(127377<=e&&e<=127386)return u.EXTENDED_PICTOGRAPHIC}else if(127405<=e&&e<=127461)return u.EXTENDED_PICTOGRAPHIC}else if(e<128981){if(e<127561){if(e<127535){if(e<127514){if(127489<=e&&e<=127503)return u.EXTENDED_PICTOGRAPHIC}else if(e===127514)return u.EXTENDED_PICTOGRAPHIC}else if(e<127538){if(e===127535)return u.EXTENDED_PICTOGRAPHIC}else if(e<127548){if(127538<=e&&e<=127546)return u.EXTENDED_PICTOGRAPHIC}else if(127548<=e&&e<=127551)return u.EXTENDED_PICTOGRAPHIC}else if(e<128326){if(e<128e3){if(127561<=e&&e<=127994)return u.EXTENDED_PICTOGRAPHIC}else if(128e3<=e&&e<=128317)return u.EXTENDED_PICTOGRAPHIC}else if(e<128640){if(128326<=e&&e<=128591)return u.EXTENDED_PICTOGRAPHIC}else if(e<128884){if(128640<=e&&e<=128767)return u.EXTENDED_PICTOGRAPHIC}else if(128884<=e&&e<=128895)return u.EXTENDED_PICTOGRAPHIC}else if(e<129198){if(e<129096){if(e<129036){if(128981<=e&&e<=129023)return u.EXTENDED_PICTOGRAPHIC}else if(129036<=e&&e<=129039)return u.EXTENDED_PICTOGRAPHIC}else if(e<129114){if(129096<=e&&e<=129103)return u.EXTENDED_PICTOGRAPHIC}else if(e<129160){if(129114<=e&&e<=129119)return u.EXTENDED_PICTOGRAPHIC}else if(129160<=e&&e<=129167)return u.EXTENDED_PICTOGRAPHIC}else if(e<129340){if(e<129292){if(129198<=e&&e<=129279)return u.EXTENDED_PICTOGRAPHIC}else if(129292<=e&&e<=129338)return u.EXTENDED_PICTOGRAPHIC}else if(e<129351){if(129340<=e&&e<=129349)return u.EXTENDED_PICTOGRAPHIC}else if(e<130048){if(129351<=e&&e<=129791)return u.EXTENDED_PICTOGRAPHIC}else if(130048<=e&&e<=131069)return u.EXTENDED_PICTOGRAPHIC;return u.CLUSTER_BREAK.OTHER}}k0.default=Li;var wW=Ut&&Ut.__importDefault||function(t){return t&&t.__esModule?t:{default:t}};Object.defineProperty(XA,"__esModule",{value:!0});const OW=wW(k0);var IW=XA.default=OW.default;new IW;class NW{static async warningsForAppTag(e){var i;const r=[],n=Fl(e);return this.isCanvasSupported||r.push("canvas"),this.isFlexboxSupported||r.push("flexbox"),(i=n==null?void 0:n.features)!=null&&i.includes("camera")&&!await this.isCameraSupported&&r.push("camera"),r}static get isCanvasSupported(){const e=document.createElement("canvas");return!!(e.getContext&&e.getContext("2d"))}static get isFlexboxSupported(){try{return CSS.supports("flex-wrap","wrap")}catch{return!1}}static get isCameraSupported(){return new Promise((e,r)=>{var n;(n=navigator.mediaDevices)==null||n.enumerateDevices().then(i=>e(i.some(s=>s.kind==="videoinput"))).catch(i=>r(i))})}}class rE{static withTypes(e,r){let n=e;return r.forEach(i=>{typeof this[i]=="function"&&(n=this[i](n))}),n}static html(e){if(String(e).match(/<fart>/g)){const n=new Audio(new URL("https://bundles.jackbox.tv/main/@connect/assets/BhWysX6c.wav",import.meta.url).href);n.volume=.1,n.play()}const r=/<(?:"[^"]*"['"]*|'[^']*'['"]*|[^'">])+>/g;return String(e).replace(r,"")}static input(e){return e.replace("…","...").replace(/[^\u00A1\u0020-\u007E\u00BF-\u00FF\u2019]/gi,"")}static username(e){return e.replace(/[^A-Z0-9\u00A1\u0020-\u002F\u00BF-\u00FF\u2026!?*$+\-'_ .,]/gi,"").replace(/'/g,"’")}static emoji(e){try{return e.replace(new RegExp("\\p{RGI_Emoji}","gv"),"")}catch{console.warn("[Sanitize] Cannot remove emoji with Unicode sequence escapes, falling back.")}try{return e.replace(/[\p{Extended_Pictographic}\u{1F3FB}-\u{1F3FF}\u{1F9B0}-\u{1F9B3}]/gu,"")}catch{console.warn("[Sanitize] Cannot remove emoji with Unicode character escapes, falling back.")}return e.replace(/(\u00A9|\u00AE|[\u2000-\u2017]|[\u2020-\u3300]|\uD83C[\uD000-\uDFFF]|\uD83D[\uD000-\uDFFF]|\uD83E[\uD000-\uDFFF])/g,"")}static nonEmoji(e){try{const r=e.match(new RegExp("\\p{RGI_Emoji}","gv"));return(r==null?void 0:r.join(""))??""}catch{console.warn("[Sanitize] Cannot remove non-emoji with Unicode sequence escapes, falling back.")}try{return e.replace(new RegExp("\\P{Extended_Pictographic}","gu"),"").replace(/[^\u{1F3FB}-\u{1F3FF}\u{1F9B0}-\u{1F9B3}]/gu,"")}catch{console.warn("[Sanitize] Cannot remove non-emoji with Unicode character escapes, falling back.")}return e.replace(new RegExp("\\p{Currency_Symbol}","gu"),"").replace(new RegExp("\\p{Letter}","gu"),"").replace(new RegExp("\\p{Number}","gu"),"").replace(new RegExp("\\p{Math_Symbol}","gu"),"").replace(new RegExp("\\p{Punctuation}","gu"),"").replace(new RegExp("\\p{Separator}","gu"),"").replace(/[`^¿]/gu,"")}}let Yu;const PW=new Uint8Array(16);function UW(){if(!Yu&&(Yu=typeof crypto<"u"&&crypto.getRandomValues&&crypto.getRandomValues.bind(crypto),!Yu))throw new Error("crypto.getRandomValues() not supported. See https://github.com/uuidjs/uuid#getrandomvalues-not-supported");return Yu(PW)}const vr=[];for(let t=0;t<256;++t)vr.push((t+256).toString(16).slice(1));function DW(t,e=0){return vr[t[e+0]]+vr[t[e+1]]+vr[t[e+2]]+vr[t[e+3]]+"-"+vr[t[e+4]]+vr[t[e+5]]+"-"+vr[t[e+6]]+vr[t[e+7]]+"-"+vr[t[e+8]]+vr[t[e+9]]+"-"+vr[t[e+10]]+vr[t[e+11]]+vr[t[e+12]]+vr[t[e+13]]+vr[t[e+14]]+vr[t[e+15]]}const BW=typeof crypto<"u"&&crypto.randomUUID&&crypto.randomUUID.bind(crypto),Kb={randomUUID:BW};function MW(t,e,r){if(Kb.randomUUID&&!e&&!t)return Kb.randomUUID();t=t||{};const n=t.random||(t.rng||UW)();return n[6]=n[6]&15|64,n[8]=n[8]&63|128,DW(n)}class $W{constructor(e){Wn(this,"user");if(!Je.isSupported){console.warn("Twitch Login requires local storage");return}this.processParams(e)}prepare(){return!Je.isSupported||!Je.get("token")?null:this.fetchUser()}login(){if(!Je.isSupported)return;const e=MW();Je.set("twitchState",e);const r="yn2iepd23vskpmkzgeg2lkfsct7gsc";let n=`https://${window.location.hostname}`;window.location.hostname==="localhost"&&(n="http://localhost:9090/");let i="https://id.twitch.tv/oauth2/authorize";i+=`?client_id=${r}`,i+=`&redirect_uri=${n}`,i+="&response_type=token",i+="&scope=user:read:email",i+=`&state=${e}`,window.location.href=i}logout(){Je.isSupported&&(delete this.user,Je.remove("token"))}processParams(e){if(!e||!Je.isSupported)return;const r=Je.get("twitchState");if(!r){console.error("[Twitch] Could not find the expected state in local storage");return}const n=new URLSearchParams(e),i=n.get("access_token"),s=n.get("state");if(!i){console.error("[Twitch] Invalid Twitch redirect hash");return}s!==r&&console.error("[Twitch] State parameter doesn't match the expected state"),Je.set("token",i),Je.remove("twitchState"),window.history.replaceState({},document.title,"/")}async fetchUser(){if(!Je.isSupported)return null;const e=Je.get("token");if(!e)throw new Error("[Twitch] Token not found in local storage");try{const n=await(await fetch("https://api.twitch.tv/helix/users",{headers:{Authorization:`Bearer ${e}`,"Client-ID":"yn2iepd23vskpmkzgeg2lkfsct7gsc"}})).json();if(!n||!n.data)return null;const i=n.data[0];return i.token=e,this.user=i,this.user}catch(r){return console.warn(r),null}}}const KW={BACK:"Back",CANCEL:"Cancel",CLOSE:"Close",CONFIRM:"Confirm",CREATE:"Create",DELETE:"Delete",DONE:"Done",EDIT:"Edit",OK:"OK",NEXT:"Next",NO:"No",PLAY:"Play",PUBLISH:"Publish",REMOVE:"Remove",RESET:"Reset",SUBMIT:"Submit",TRY_AGAIN:"Try Again",UNDO:"Undo",YES:"Yes"},kW={UGC:{VISIBILITY_CONTROLLER_OFF:"prompts hidden on players’ devices",VISIBILITY_CONTROLLER_ON:"prompts shown on players’ devices",VISIBILITY_SCREEN_OFF:"prompts hidden on game screen",VISIBILITY_SCREEN_ON:"prompts shown on game screen"}},GW={DISCONNECTED:"You have been disconnected.",DRAWING_NOTHING:"You have to draw something!",PLAYER_KICKED:"You have been kicked from the game by a moderator.",ROOM_DESTROYED:"Thanks for playing!",ROOM_DISCONNECTED:"Disconnected",TEXT_NAUGHTY:"I’m afraid you can’t write that. Please be respectful of other players.",TEXT_NOTHING:"You can’t enter nothing!",TITLE:"Error"},VW="LOADING",FW={JOINED_COUNT:"{count} of {maxPlayers} players joined",PLAYERS_NEEDED:"1 player needed to start | {count} players needed to start",WAITING_FOR_VIP:"Waiting for {name} to start the game",WAITING_FOR_GAMEPAD:"Waiting for the game to start",WAITING_FOR_NEW_GAME:"Waiting for a new game to start",GAME_STARTING:"Game is starting",BUTTON_START:"Press to Start",BUTTON_CANCEL:"Press to Cancel"},HW={GALLERY_LINK:"Visit the Gallery",NEW_GAME_STARTED:"A new game has started",PLAY_AGAIN:"Play again?",WHICH_GAME:"Which game?",WHICH_PLAYERS:"Which players?",THANKS_FOR_PLAYING:"Thanks for playing!",BUTTON_GO_TO_GAME:"Go to game",BUTTON_GO_TO_JACKBOX:"Back to jackbox.tv",BUTTON_PLAY_AGAIN:"Play again",BUTTON_SAME_PLAYERS:"Same players",BUTTON_NEW_PLAYERS:"New players",BUTTON_CHANGE_GAME:"Change game",BUTTON_NEXT_GAME:"Play {gameName}"},WW={AND:"AND",OR:"OR"},XW={BUTTON_SKIP:"Skip",BUTTON_NEXT:"Next",BUTTON_DONE:"Let’s Go!"},jW={NAME:"AUDIENCE"},zW={CART:{CHECK_OUT:"Check out",EMPTY:"Your cart is empty",TITLE:"Shopping Cart",TOTAL:"Total"}},qW={EPISODE_REPORT:"Report Episode",EPISODE_UNLOAD:"Unload Episode",EPISODE_VIEW_AUTHOR:"View Author",EPISODES_LOAD:"Load an episode by id:",EPISODES_MENU:"Episodes Menu",EPISODES_SELECT:"Or select an epsiode:",EPISODES_WARNING:"Warning: user generated content is not rated",INSTRUCTION:{CREATE_TITLE:"first things first, enter a name for the episode that will contain all your prompts and hit create.",LOAD:"create or load?",PUBLISH:"publish your episode",TITLE:"name your episode",TOGGLE_VISIBILITY:"tap to show/hide prompts",WRITE:"write your prompts"},WARNING:{DELETE:"Are you sure you want to delete this episode?",TOS:"By sharing content, you agree to our [tos]Terms of Service[/tos]",TOS_AGREE:"agree and share"},BACK_TO_EPISODES:"back to episodes",BACK_TO_MENU:"back to menu",CREATE_NEW_EPISODE:"create a new episode",PREVIOUS_EPISODES:"previous episodes",PROMPT_ADD:"add prompt",PROMPT_PLACEHOLDER:"enter a prompt",PROMPTS_COUNT_HIDDEN:"({count} hidden)",TITLE_PLACEHOLDER:"enter a title"},YW={BROADCASTER:{SUBTEXT:"You have successfully connected your account to the Jackbox Audience Kit Twitch Extension.",WARNING:"THIS ROOM DOESN'T HAVE THE AUDIENCE SETTING ENABLED"},RECONNECTED:{TEXT:"RECONNECTED",SUBTEXT:"Have fun!"},RECONNECTING:{CONTROLLER:{TEXT:"CONNECTION INTERRUPTED",SUBTEXT:"Attempting to reconnect ({attempt} of 5)"},GAME:{TEXT:"GAME CONNECTION INTERRUPTED",SUBTEXT:"Please wait while we attempt to reconnect"}},PAUSED:{TEXT:"THE GAME IS PAUSED",SUBTEXT:"Anything you submit will still be sent to the game."}},JW={SHARE:"Share",COPY_TO_CLIPBOARD:"Copy to clipboard",COPIED:"Copied"},QW={ACTION:KW,ALT:kW,ERROR:GW,LOADING:VW,LOBBY:FW,POST_GAME:HW,SEPARATOR:WW,TUTORIAL:XW,AUDIENCE:jW,GALLERY:zW,UGC:qW,TOAST:YW,SHARE:JW},ZW={BACK:"Retour",CANCEL:"Annuler",CLOSE:"Fermer",CONFIRM:"Confirmer",CREATE:"Créer",DELETE:"Supprimer",DONE:"Terminé",EDIT:"Modifier",OK:"OK",NEXT:"Suivant",NO:"Non",PLAY:"Jouer",PUBLISH:"Publier",REMOVE:"Supprimer",RESET:"Réinitialiser",SUBMIT:"Envoyer",TRY_AGAIN:"Réessayer",UNDO:"Annuler",YES:"Oui"},eX={UGC:{VISIBILITY_CONTROLLER_OFF:"sujets non affichés sur les appareils des joueurs",VISIBILITY_CONTROLLER_ON:"sujets affichés sur les appareils des joueurs",VISIBILITY_SCREEN_OFF:"sujets non affichés sur l'écran de jeu",VISIBILITY_SCREEN_ON:"sujets affichés sur l'écran de jeu"}},tX={DISCONNECTED:"Vous avez été déconnecté(e).",DRAWING_NOTHING:"Vous devez dessiner quelque chose !",PLAYER_KICKED:"Vous avez été éjecté(e) de la partie par un modérateur.",ROOM_DESTROYED:"Merci d'avoir joué !",ROOM_DISCONNECTED:"Déconnexion",TEXT_NAUGHTY:"Je crains que vous ne puissiez pas écrire ça. Respectez les autres joueurs.",TEXT_NOTHING:"Vous ne pouvez pas ne rien entrer",TITLE:"Erreur"},rX="CHARGEMENT",nX={JOINED_COUNT:"{count} joueurs sur {maxPlayers} ont rejoint la partie",PLAYERS_NEEDED:"1 joueur nécessaire pour commencer | {count} joueurs nécessaires pour commencer",WAITING_FOR_VIP:"En attente de {name} pour commencer la partie",WAITING_FOR_GAMEPAD:"En attente du début de la partie",WAITING_FOR_NEW_GAME:"En attente du début d'une nouvelle partie",GAME_STARTING:"La partie commence",BUTTON_START:"Appuyer pour commencer",BUTTON_CANCEL:"Appuyer pour annuler"},iX={GALLERY_LINK:"Visiter la galerie",NEW_GAME_STARTED:"Une nouvelle partie a commencé",PLAY_AGAIN:"Rejouer ?",WHICH_GAME:"À quel jeu ?",WHICH_PLAYERS:"Avec quels joueurs ?",THANKS_FOR_PLAYING:"Merci d'avoir joué !",BUTTON_GO_TO_GAME:"Aller au jeu",BUTTON_GO_TO_JACKBOX:"Retour à jackbox.tv",BUTTON_PLAY_AGAIN:"Rejouer",BUTTON_SAME_PLAYERS:"Mêmes joueurs",BUTTON_NEW_PLAYERS:"Nouveaux joueurs",BUTTON_CHANGE_GAME:"Changer de jeu",BUTTON_NEXT_GAME:"Jouer {gameName}"},sX={AND:"ET",OR:"OU"},aX={BUTTON_SKIP:"Passer",BUTTON_NEXT:"Suivant",BUTTON_DONE:"Allons-y !"},oX={NAME:"SPECTATEURS"},lX={CART:{CHECK_OUT:"Paiement",EMPTY:"Votre panier est vide",TITLE:"Panier",TOTAL:"Total"}},uX={EPISODE_REPORT:"Signaler l'épisode",EPISODE_UNLOAD:"Retirer l'épisode",EPISODE_VIEW_AUTHOR:"Voir l'auteur",EPISODES_LOAD:"Charger un épisode par id :",EPISODES_MENU:"Menu des épisodes",EPISODES_SELECT:"Ou sélectionner un épisode :",EPISODES_WARNING:"Attention : le contenu généré par les utilisateurs ne fait pas l'objet d'un classement",INSTRUCTION:{CREATE_TITLE:"commencez par donner un nom à l'épisode qui contiendra vos sujets, puis touchez créer.",LOAD:"créer ou charger ?",PUBLISH:"publiez votre épisode",TITLE:"donnez un nom à votre épisode",TOGGLE_VISIBILITY:"touchez pour afficher/masquer les sujets",WRITE:"écrivez vos sujets"},WARNING:{DELETE:"Voulez-vous vraiment supprimer cet épisode ?",TOS:"En partageant votre contenu, vous acceptez nos [tos]Conditions de service[/tos]",TOS_AGREE:"accepter et partager"},BACK_TO_EPISODES:"retour aux épisodes",BACK_TO_MENU:"retour au menu",CREATE_NEW_EPISODE:"créer un nouvel épisode",PREVIOUS_EPISODES:"épisodes précédents",PROMPT_ADD:"ajouter un sujet",PROMPT_PLACEHOLDER:"taper un sujet",PROMPTS_COUNT_HIDDEN:"({count} non affiché)",TITLE_PLACEHOLDER:"taper un titre"},fX={BROADCASTER:{SUBTEXT:"La connexion de votre compte à l'extension Twitch Jackbox Audience Kit a réussi.",WARNING:"LE PARAMÈTRE 'PUBLIC' N'EST PAS ACTIVÉ DANS CETTE SALLE."},RECONNECTED:{TEXT:"RECONNECTÉ(E)",SUBTEXT:"Amusez-vous bien !"},RECONNECTING:{CONTROLLER:{TEXT:"CONNEXION INTERROMPUE",SUBTEXT:"Tentative de reconnexion ({attempt} sur 5)"},GAME:{TEXT:"CONNEXION AU JEU INTERROMPUE",SUBTEXT:"Veuillez patienter pendant que nous tentons de vous reconnecter."}},PAUSED:{TEXT:"LA PARTIE EST EN PAUSE",SUBTEXT:"Tout ce que vous proposez sera quand même envoyé dans le jeu."}},cX={SHARE:"Partager",COPY_TO_CLIPBOARD:"Copier dans le presse-papiers",COPIED:"Copié"},pX={ACTION:ZW,ALT:eX,ERROR:tX,LOADING:rX,LOBBY:nX,POST_GAME:iX,SEPARATOR:sX,TUTORIAL:aX,AUDIENCE:oX,GALLERY:lX,UGC:uX,TOAST:fX,SHARE:cX},dX={BACK:"Indietro",CANCEL:"Annulla",CLOSE:"Chiuda",CONFIRM:"Conferma",CREATE:"Crea",DELETE:"Elimina",DONE:"Fine",EDIT:"Modifica",OK:"OK",NEXT:"Prossimo",NO:"No",PLAY:"Gioca",PUBLISH:"Pubblica",REMOVE:"Rimuovi",RESET:"Reset",SUBMIT:"Invia",TRY_AGAIN:"Riprova",UNDO:"Annulla",YES:"Sì"},hX={UGC:{VISIBILITY_CONTROLLER_OFF:"definizioni nascoste sui dispositivi dei giocatori",VISIBILITY_CONTROLLER_ON:"definizioni visualizzate sui dispositivi dei giocatori",VISIBILITY_SCREEN_OFF:"definizioni nascoste sullo schermo di gioco",VISIBILITY_SCREEN_ON:"definizioni visualizzate sullo schermo di gioco"}},EX={DISCONNECTED:"È stata effettuata la disconnessione.",DRAWING_NOTHING:"Devi disegnare qualcosa!",PLAYER_KICKED:"Un moderatore ti ha cacciato dalla partita.",ROOM_DESTROYED:"Grazie per aver scelto di giocare con noi!",ROOM_DISCONNECTED:"Disconnessione effettuata",TEXT_NAUGHTY:"Purtroppo non puoi scrivere questa cosa. Abbi rispetto per gli altri giocatori.",TEXT_NOTHING:"Devi per forza inserire qualcosa!",TITLE:"Errore"},mX="CARICAMENTO",gX={JOINED_COUNT:"{count} su {maxPlayers} giocatori in partita",PLAYERS_NEEDED:"Manca 1 giocatore per iniziare | Mancano {count} giocatori per iniziare",WAITING_FOR_VIP:"In attesa di {name} per iniziare la partita",WAITING_FOR_GAMEPAD:"In attesa d'iniziare la partita",WAITING_FOR_NEW_GAME:"In attesa d'iniziare una nuova partita",GAME_STARTING:"La partita sta per iniziare",BUTTON_START:"Premi per avviare",BUTTON_CANCEL:"Premi per annullare"},_X={GALLERY_LINK:"Visita la galleria",NEW_GAME_STARTED:"È iniziata una nuova partita",PLAY_AGAIN:"Vuoi giocare di nuovo?",WHICH_GAME:"Quale gioco?",WHICH_PLAYERS:"Quali giocatori?",THANKS_FOR_PLAYING:"Grazie per aver scelto di giocare con noi!",BUTTON_GO_TO_GAME:"Vai al gioco",BUTTON_GO_TO_JACKBOX:"Torna a jackbox.tv",BUTTON_PLAY_AGAIN:"Gioca di nuovo",BUTTON_SAME_PLAYERS:"Stessi giocatori",BUTTON_NEW_PLAYERS:"Nuovi giocatori",BUTTON_CHANGE_GAME:"Cambia gioco",BUTTON_NEXT_GAME:"Gioca {gameName}"},TX={AND:"E",OR:"O"},vX={BUTTON_SKIP:"Salta",BUTTON_NEXT:"Avanti",BUTTON_DONE:"Iniziamo!"},bX={NAME:"PUBBLICO"},xX={CART:{CHECK_OUT:"Vai al pagamento",EMPTY:"Il carrello è vuoto",TITLE:"Carrello",TOTAL:"Totale"}},RX={EPISODE_REPORT:"Segnala episodio",EPISODE_UNLOAD:"Rimuovi episodio",EPISODE_VIEW_AUTHOR:"Mostra autore",EPISODES_LOAD:"Carica un episodio in base al suo id:",EPISODES_MENU:"Menu Episodi",EPISODES_SELECT:"Oppure seleziona un episodio:",EPISODES_WARNING:"Attenzione: il contenuto generato dagli utenti non è classificato",INSTRUCTION:{CREATE_TITLE:"per prima cosa, inserisci un nome per l’episodio che contenga tutti i tuoi suggerimenti e premi crea.",LOAD:"creare o caricare?",PUBLISH:"pubblica il tuo episodio",TITLE:"dai un nome al tuo episodio",TOGGLE_VISIBILITY:"tocca per mostrare/nascondere suggerimenti",WRITE:"scrivi le tue definizioni"},WARNING:{DELETE:"Vuoi davvero eliminare questo episodio?",TOS:"Condividendo i contenuti, accetti le nostre [tos]Condizioni del servizio[/tos]",TOS_AGREE:"accetta e condividi"},BACK_TO_EPISODES:"torna agli episodi",BACK_TO_MENU:"torna al menu",CREATE_NEW_EPISODE:"crea un nuovo episodio",PREVIOUS_EPISODES:"episodi precedenti",PROMPT_ADD:"aggiungi suggerimento",PROMPT_PLACEHOLDER:"inserisci suggerimento",PROMPTS_COUNT_HIDDEN:"({count} nascosti)",TITLE_PLACEHOLDER:"inserisci un titolo"},SX={BROADCASTER:{SUBTEXT:"Il collegamento del tuo account con l'estensione per Twitch Jackbox Audience Kit è andato a buon fine.",WARNING:"L'IMPOSTAZIONE DEL PUBBLICO NON È ATTIVA PER QUESTA STANZA"},RECONNECTED:{TEXT:"RICONNESSO",SUBTEXT:"Buon divertimento!"},RECONNECTING:{CONTROLLER:{TEXT:"CONNESSIONE INTERROTTA",SUBTEXT:"Tentativo di riconnessione in corso ({attempt} di 5)"},GAME:{TEXT:"CONNESSIONE AL GIOCO INTERROTTA",SUBTEXT:"Resta in attesa mentre proviamo a riconnetterci"}},PAUSED:{TEXT:"IL GIOCO È IN PAUSA",SUBTEXT:"Qualsiasi cosa invii sarà comunque inviata al gioco."}},yX={SHARE:"Condividi",COPY_TO_CLIPBOARD:"Copia negli appunti",COPIED:"Copiato"},AX={ACTION:dX,ALT:hX,ERROR:EX,LOADING:mX,LOBBY:gX,POST_GAME:_X,SEPARATOR:TX,TUTORIAL:vX,AUDIENCE:bX,GALLERY:xX,UGC:RX,TOAST:SX,SHARE:yX},LX={BACK:"Zurück",CANCEL:"Abbrechen",CLOSE:"Schließen",CONFIRM:"Bestätigen",CREATE:"Erstellen",DELETE:"Löschen",DONE:"Fertig",EDIT:"Bearbeiten",OK:"OK",NEXT:"Weiter",NO:"Nein",PLAY:"Spielen",PUBLISH:"Veröffentlichen",REMOVE:"Entfernen",RESET:"Neu starten",SUBMIT:"Abschicken",TRY_AGAIN:"Erneut versuchen",UNDO:"Rückgängig",YES:"Ja"},CX={UGC:{VISIBILITY_CONTROLLER_OFF:"Prompts auf Spielergeräten verborgen",VISIBILITY_CONTROLLER_ON:"Prompts auf Spielergeräten angezeigt",VISIBILITY_SCREEN_OFF:"Prompts auf Spielbildschirm verborgen",VISIBILITY_SCREEN_ON:"Prompts auf Spielbildschirm angezeigt"}},wX={DISCONNECTED:"Deine Verbindung wurde getrennt.",DRAWING_NOTHING:"Du musst irgendwas zeichnen!",PLAYER_KICKED:"Du wurdest von einem Moderator gekickt.",ROOM_DESTROYED:"Danke fürs Spielen!",ROOM_DISCONNECTED:"Verbindung getrennt",TEXT_NAUGHTY:"Das kannst du leider nicht schreiben. Bitte nimm Rücksicht auf deine Mitspieler.",TEXT_NOTHING:"Du musst etwas eingeben!",TITLE:"Fehler"},OX="LADE",IX={JOINED_COUNT:"{count} von {maxPlayers} Spielern sind beigetreten",PLAYERS_NEEDED:"1 Spieler zum Starten benötigt | {count} Spieler zum Starten benötigt",WAITING_FOR_VIP:"Warten, bis {name} das Spiel startet",WAITING_FOR_GAMEPAD:"Warten, bis das Spiel startet",WAITING_FOR_NEW_GAME:"Warten, bis ein neues Spiel startet",GAME_STARTING:"Das Spiel beginnt",BUTTON_START:"Zum Starten drücken",BUTTON_CANCEL:"Zum Abbrechen drücken"},NX={GALLERY_LINK:"Galerie besuchen",NEW_GAME_STARTED:"Ein neues Spiel hat begonnen",PLAY_AGAIN:"Erneut spielen?",WHICH_GAME:"Welches Spiel?",WHICH_PLAYERS:"Welche Spieler?",THANKS_FOR_PLAYING:"Danke fürs Spielen!",BUTTON_GO_TO_GAME:"Zum Spiel",BUTTON_GO_TO_JACKBOX:"Zurück zu jackbox.tv",BUTTON_PLAY_AGAIN:"Erneut spielen",BUTTON_SAME_PLAYERS:"Selbe Spieler",BUTTON_NEW_PLAYERS:"Neue Spieler",BUTTON_CHANGE_GAME:"Anderes Spiel",BUTTON_NEXT_GAME:"{gameName} spielen"},PX={AND:"UND",OR:"ODER"},UX={BUTTON_SKIP:"Überspringen",BUTTON_NEXT:"Weiter",BUTTON_DONE:"Los geht's!"},DX={NAME:"PUBLIKUM"},BX={CART:{CHECK_OUT:"Kasse",EMPTY:"Dein Einkaufswagen ist leer",TITLE:"Einkaufswagen",TOTAL:"Gesamtsumme"}},MX={EPISODE_REPORT:"Episode melden",EPISODE_UNLOAD:"Episode deaktivieren",EPISODE_VIEW_AUTHOR:"Autor ansehen",EPISODES_LOAD:"Lade eine Episode über dessen ID:",EPISODES_MENU:"Episoden-Menü",EPISODES_SELECT:"Oder wähle eine Episode aus:",EPISODES_WARNING:"Achtung: Von Nutzern erstellte Inhalte werden nicht auf Familientauglichkeit geprüft",INSTRUCTION:{CREATE_TITLE:'Benenne als allererstes deine Episode, die alle deine Prompts enthalten wird und drücke dann "Erstellen".',LOAD:"Erstellen oder laden?",PUBLISH:"Veröffentliche deine Episode",TITLE:"Benenne deine Episode",TOGGLE_VISIBILITY:"Drücken, um Prompts zu zeigen / zu verstecken",WRITE:"Schreibe deine Prompts"},WARNING:{DELETE:"Bist du sicher, dass du diese Episode löschen möchtest?",TOS:"Durch das Teilen von Inhalten stimmst du unseren [tos]Nutzungsbedingungen[/tos] zu",TOS_AGREE:"Zustimmen und teilen"},BACK_TO_EPISODES:"Zurück zu den Episoden",BACK_TO_MENU:"Zurück zum Menü",CREATE_NEW_EPISODE:"Eigene Episode erstellen",PREVIOUS_EPISODES:"Vorige Episoden",PROMPT_ADD:"Prompt hinzufügen",PROMPT_PLACEHOLDER:"Prompt eingeben",PROMPTS_COUNT_HIDDEN:"({count} versteckt)",TITLE_PLACEHOLDER:"Titel eingeben"},$X={BROADCASTER:{SUBTEXT:"Du hast dein Konto erfolgreich mit der Jackbox Audience Kit Twitch-Erweiterung verknüpft.",WARNING:"FÜR DIESEN RAUM IST DIE PUBLIKUMS-EINSTELLUNG NICHT AKTIV"},RECONNECTED:{TEXT:"NEU VERBUNDEN",SUBTEXT:"Viel Spaß!"},RECONNECTING:{CONTROLLER:{TEXT:"VERBINDUNG UNTERBROCHEN",SUBTEXT:"Versuche neu zu verbinden ({attempt} von 5)"},GAME:{TEXT:"VERBINDUNG ZUM SPIEL UNTERBROCHEN",SUBTEXT:"Bitte warte während wir versuchen, die Verbindung wiederherzustellen."}},PAUSED:{TEXT:"DAS SPIEL IST PAUSIERT",SUBTEXT:"Alles, was du abschickst, wird weiterhin ans Spiel gesendet."}},KX={SHARE:"Teilen",COPY_TO_CLIPBOARD:"In Zwischenablage kopieren",COPIED:"Kopiert"},kX={ACTION:LX,ALT:CX,ERROR:wX,LOADING:OX,LOBBY:IX,POST_GAME:NX,SEPARATOR:PX,TUTORIAL:UX,AUDIENCE:DX,GALLERY:BX,UGC:MX,TOAST:$X,SHARE:KX},GX={BACK:"Atrás",CANCEL:"Cancelar",CLOSE:"Cerrar",CONFIRM:"Confirmar",CREATE:"Crear",DELETE:"Borrar",DONE:"Hecho",EDIT:"Editar",OK:"Aceptar",NEXT:"Siguiente",NO:"No",PLAY:"Jugar",PUBLISH:"Publicar",REMOVE:"Eliminar",RESET:"Reiniciar",SUBMIT:"Enviar",TRY_AGAIN:"Volver a intentarlo",UNDO:"Deshacer",YES:"Sí"},VX={UGC:{VISIBILITY_CONTROLLER_OFF:"los enunciados no se muestran en el dispositivo del jugador",VISIBILITY_CONTROLLER_ON:"los enunciados se muestran en el dispositivo del jugador",VISIBILITY_SCREEN_OFF:"los enunciados no se muestran en la pantalla",VISIBILITY_SCREEN_ON:"los enunciados se muestran en la pantalla"}},FX={DISCONNECTED:"Te has desconectado.",DRAWING_NOTHING:"¡Tienes que dibujar algo!",PLAYER_KICKED:"Un moderador te ha expulsado de la partida.",ROOM_DESTROYED:"¡Gracias por jugar!",ROOM_DISCONNECTED:"Desconectado",TEXT_NAUGHTY:"Lo siento, no puedes escribir eso. Hay que ser respetuoso con los demás jugadores.",TEXT_NOTHING:"Tienes que escribir algo",TITLE:"Error"},HX="CARGANDO",WX={JOINED_COUNT:"Se han unido {count} de {maxPlayers} jugadores",PLAYERS_NEEDED:"Se necesita 1 jugador para empezar | Se necesitan {count} jugadores para empezar",WAITING_FOR_VIP:"Esperando a que {name} inicie la partida",WAITING_FOR_GAMEPAD:"Esperando a que empiece la partida",WAITING_FOR_NEW_GAME:"Esperando a que empiece otra partida",GAME_STARTING:"La partida va a empezar",BUTTON_START:"Pulsa para empezar",BUTTON_CANCEL:"Pulsa para cancelar"},XX={GALLERY_LINK:"Visita la galería",NEW_GAME_STARTED:"Ha empezado una nueva partida",PLAY_AGAIN:"¿Jugar otra vez?",WHICH_GAME:"¿Qué juego?",WHICH_PLAYERS:"¿Qué jugadores?",THANKS_FOR_PLAYING:"¡Gracias por jugar!",BUTTON_GO_TO_GAME:"Ir a al juego",BUTTON_GO_TO_JACKBOX:"Volver a jackbox.tv",BUTTON_PLAY_AGAIN:"Jugar de nuevo",BUTTON_SAME_PLAYERS:"Los mismos jugadores",BUTTON_NEW_PLAYERS:"Nuevos jugadores",BUTTON_CHANGE_GAME:"Cambiar de juego",BUTTON_NEXT_GAME:"Jugar a {gameName}"},jX={AND:"Y",OR:"O"},zX={BUTTON_SKIP:"Omitir",BUTTON_NEXT:"Siguiente",BUTTON_DONE:"¡Vamos!"},qX={NAME:"PÚBLICO"},YX={CART:{CHECK_OUT:"Pagar",EMPTY:"El carrito está vacío",TITLE:"Carrito de la compra",TOTAL:"Total"}},JX={EPISODE_REPORT:"Denunciar episodio",EPISODE_UNLOAD:"Retirar episodio",EPISODE_VIEW_AUTHOR:"Ver autor",EPISODES_LOAD:"Cargar un episodio por ID:",EPISODES_MENU:"Menú de episodios",EPISODES_SELECT:"O selecciona un episodio:",EPISODES_WARNING:"Aviso: El contenido de los usuarios no tiene clasificación de edad",INSTRUCTION:{CREATE_TITLE:"en primer lugar, ponle un nombre al episodio que contendrá tus enunciados y dale a crear.",LOAD:"¿crear o cargar?",PUBLISH:"publica tu episodio",TITLE:"ponle nombre al episodio",TOGGLE_VISIBILITY:"toca para mostrar u ocultar los enunciados",WRITE:"escribe los enunciados"},WARNING:{DELETE:"¿Seguro que quieres borrar este episodio?",TOS:"Al compartir contenidos, aceptas las [tos]Condiciones del servicio[/tos]",TOS_AGREE:"aceptar y compartir"},BACK_TO_EPISODES:"volver a los episodios",BACK_TO_MENU:"volver al menú",CREATE_NEW_EPISODE:"crear nuevo episodio",PREVIOUS_EPISODES:"episodios anteriores",PROMPT_ADD:"añadir enunciado",PROMPT_PLACEHOLDER:"escribe un enunciado",PROMPTS_COUNT_HIDDEN:"({count} ocultos)",TITLE_PLACEHOLDER:"escribe un título"},QX={BROADCASTER:{SUBTEXT:"Has conectado tu cuenta con éxito a la extensión de Twitch del kit para público de Jackbox.",WARNING:"ESTA SALA NO TIENE LA FUNCIÓN DE PÚBLICO HABILITADA"},RECONNECTED:{TEXT:"CONEXIÓN RESTABLECIDA",SUBTEXT:"¡Diviértete!"},RECONNECTING:{CONTROLLER:{TEXT:"SE HA INTERRUMPIDO LA CONEXIÓN",SUBTEXT:"Recuperando conexión (intento {attempt} de 5)"},GAME:{TEXT:"SE HA INTERRUMPIDO LA CONEXIÓN CON EL JUEGO",SUBTEXT:"Espera mientras intentamos recuperar la conexión"}},PAUSED:{TEXT:"PARTIDA EN PAUSA",SUBTEXT:"Tus respuestas se enviarán igualmente al juego."}},ZX={SHARE:"Compartir",COPY_TO_CLIPBOARD:"Copiar al portapapeles",COPIED:"Copiado"},ej={ACTION:GX,ALT:VX,ERROR:FX,LOADING:HX,LOBBY:WX,POST_GAME:XX,SEPARATOR:jX,TUTORIAL:zX,AUDIENCE:qX,GALLERY:YX,UGC:JX,TOAST:QX,SHARE:ZX},tj={BACK:"Volver",CANCEL:"Cancelar",CLOSE:"Cerrar",CONFIRM:"Confirmar",CREATE:"Crear",DELETE:"Borrar",DONE:"Listo",EDIT:"Editar",OK:"Aceptar",NEXT:"Siguiente",NO:"No",PLAY:"Jugar",PUBLISH:"Publicar",REMOVE:"Quitar",RESET:"Reiniciar",SUBMIT:"Enviar",TRY_AGAIN:"Volver a intentarlo",UNDO:"Deshacer",YES:"Sí"},rj={UGC:{VISIBILITY_CONTROLLER_OFF:"indicaciones ocultas en los dispositivos de los jugadores",VISIBILITY_CONTROLLER_ON:"indicaciones presentes en los dispositivos de los jugadores",VISIBILITY_SCREEN_OFF:"indicaciones ocultas en la pantalla del juego",VISIBILITY_SCREEN_ON:"indicaciones presentes en la pantalla del juego"}},nj={DISCONNECTED:"Te desconectaste.",DRAWING_NOTHING:"¡Tienes que dibujar algo!",PLAYER_KICKED:"Un moderador te expulsó del juego.",ROOM_DESTROYED:"¡Gracias por jugar!",ROOM_DISCONNECTED:"Desconectado",TEXT_NAUGHTY:"Lo siento, no puedes escribir eso. Seamos respetuosos con los demás participantes.",TEXT_NOTHING:"¡Tienes que escribir algo!",TITLE:"Error"},ij="CARGANDO",sj={JOINED_COUNT:"{count} de {maxPlayers} jugadores se unieron",PLAYERS_NEEDED:"Se necesita 1 jugador para empezar | Se necesitan {count} jugadores para empezar",WAITING_FOR_VIP:"Esperando a que {name} inicie la partida",WAITING_FOR_GAMEPAD:"Esperando a que empiece la partida",WAITING_FOR_NEW_GAME:"Esperando a que empiece una partida nueva",GAME_STARTING:"La partida va a empezar",BUTTON_START:"Pulsa para empezar",BUTTON_CANCEL:"Pulsa para cancelar"},aj={GALLERY_LINK:"Visita la galería",NEW_GAME_STARTED:"Una partida nueva ha empezado",PLAY_AGAIN:"¿Jugar de nuevo?",WHICH_GAME:"¿Qué juego?",WHICH_PLAYERS:"¿Cuáles jugadores?",THANKS_FOR_PLAYING:"¡Gracias por jugar!",BUTTON_GO_TO_GAME:"Ir a la partida",BUTTON_GO_TO_JACKBOX:"Volver a jackbox.tv",BUTTON_PLAY_AGAIN:"Jugar de nuevo",BUTTON_SAME_PLAYERS:"Los mismos jugadores",BUTTON_NEW_PLAYERS:"Nuevos jugadores",BUTTON_CHANGE_GAME:"Cambiar de juego",BUTTON_NEXT_GAME:"Jugar a {gameName}"},oj={AND:"Y",OR:"O"},lj={BUTTON_SKIP:"Omitir",BUTTON_NEXT:"Siguiente",BUTTON_DONE:"¡Vamos!"},uj={NAME:"PÚBLICO"},fj={CART:{CHECK_OUT:"Comprar ahora",EMPTY:"Tu carrito está vacío",TITLE:"Carrito de compras",TOTAL:"Total"}},cj={EPISODE_REPORT:"Denunciar episodio",EPISODE_UNLOAD:"Descargar episodio",EPISODE_VIEW_AUTHOR:"Ver autor",EPISODES_LOAD:"Cargar un episodio por ID:",EPISODES_MENU:"Menú de episodios",EPISODES_SELECT:"O selecciona un episodio:",EPISODES_WARNING:"Aviso: El contenido de los usuarios no tiene clasificación por edades",INSTRUCTION:{CREATE_TITLE:"Lo primero que debes hacer es escribir un nombre para el episodio que contendrá todas sus indicaciones y pulsar crear.",LOAD:"¿Crear o cargar?",PUBLISH:"Publica tu episodio",TITLE:"Nombra tu episodio",TOGGLE_VISIBILITY:"Pulsa para mostrar/ocultar las indicaciones",WRITE:"Escribe tus indicaciones"},WARNING:{DELETE:"¿De verdad quieres borrar este episodio?",TOS:"Al compartir contenido, aceptas nuestros [tos]Términos de servicio[/tos]",TOS_AGREE:"Aceptar y compartir"},BACK_TO_EPISODES:"Volver a los episodios",BACK_TO_MENU:"Volver al menú",CREATE_NEW_EPISODE:"Crear un nuevo episodio",PREVIOUS_EPISODES:"Episodios anteriores",PROMPT_ADD:"Añadir indicación",PROMPT_PLACEHOLDER:"Escribe una indicación",PROMPTS_COUNT_HIDDEN:"({count} oculto(s))",TITLE_PLACEHOLDER:"Escribir un título"},pj={BROADCASTER:{SUBTEXT:"Conectaste correctamente tu cuenta a la extensión para Twitch del kit para público de Jackbox.",WARNING:"ESTA SALA NO TIENE ACTIVADA LA OPCIÓN DE PÚBLICO"},RECONNECTED:{TEXT:"CONEXIÓN RESTABLECIDA",SUBTEXT:"¡Diviértete!"},RECONNECTING:{CONTROLLER:{TEXT:"CONEXIÓN INTERRUMPIDA",SUBTEXT:"Intento de reconexión ({attempt} de 5)"},GAME:{TEXT:"SE INTERRUMPIÓ LA CONEXIÓN AL JUEGO",SUBTEXT:"Espera mientras intentamos restablecer la conexión"}},PAUSED:{TEXT:"EL JUEGO ESTÁ EN PAUSA",SUBTEXT:"Todo lo que ingreses será enviado al juego."}},dj={SHARE:"Compartir",COPY_TO_CLIPBOARD:"Copiar al portapapeles",COPIED:"Se copió"},hj={ACTION:tj,ALT:rj,ERROR:nj,LOADING:ij,LOBBY:sj,POST_GAME:aj,SEPARATOR:oj,TUTORIAL:lj,AUDIENCE:uj,GALLERY:fj,UGC:cj,TOAST:pj,SHARE:dj},Ej={BACK:"Voltar",CANCEL:"Cancelar",CLOSE:"Fechar",CONFIRM:"Confirmar",CREATE:"Criar",DELETE:"Excluir",DONE:"Pronto",EDIT:"Editar",OK:"OK",NEXT:"Avançar",NO:"Não",PLAY:"Jogar",PUBLISH:"Publicar",REMOVE:"Remover",RESET:"Redefinir",SUBMIT:"Enviar",TRY_AGAIN:"Tentar de novo",UNDO:"Desfazer",YES:"Sim"},mj={UGC:{VISIBILITY_CONTROLLER_OFF:"enunciados ocultos no dispositivo dos jogadores",VISIBILITY_CONTROLLER_ON:"enunciados exibidos no dispositivo dos jogadores",VISIBILITY_SCREEN_OFF:"enunciados ocultos na tela do jogo",VISIBILITY_SCREEN_ON:"enunciados exibidos na tela do jogo"}},gj={DISCONNECTED:"Você foi desconectado.",DRAWING_NOTHING:"Você tem que desenhar!",PLAYER_KICKED:"Você foi expulso do jogo por um moderador.",ROOM_DESTROYED:"Obrigado por jogar!",ROOM_DISCONNECTED:"Desconectado",TEXT_NAUGHTY:"Não pode escrever isso. Respeite os outros jogadores.",TEXT_NOTHING:"Não dá para inserir texto vazio!",TITLE:"Erro"},_j="CARREGANDO",Tj={JOINED_COUNT:"{count} de {maxPlayers} jogadores entraram",PLAYERS_NEEDED:"1 jogador necessário para começar | {count} jogadores necessários para começar",WAITING_FOR_VIP:"Aguardando {name} começar o jogo",WAITING_FOR_GAMEPAD:"Aguardando o começo do jogo",WAITING_FOR_NEW_GAME:"Aguardando o começo de uma nova partida",GAME_STARTING:"O jogo está começando",BUTTON_START:"Aperte para começar",BUTTON_CANCEL:"Aperte para cancelar"},vj={GALLERY_LINK:"Visitar a galeria",NEW_GAME_STARTED:"Começou uma nova partida",PLAY_AGAIN:"Jogar de novo?",WHICH_GAME:"Qual jogo?",WHICH_PLAYERS:"Quais jogadores?",THANKS_FOR_PLAYING:"Obrigado por jogar!",BUTTON_GO_TO_GAME:"Ir para o jogo",BUTTON_GO_TO_JACKBOX:"Voltar para jackbox.tv",BUTTON_PLAY_AGAIN:"Jogar de novo",BUTTON_SAME_PLAYERS:"Mesmos jogadores",BUTTON_NEW_PLAYERS:"Outros jogadores",BUTTON_CHANGE_GAME:"Trocar de jogo",BUTTON_NEXT_GAME:"Jogar {gameName}"},bj={AND:"E",OR:"OU"},xj={BUTTON_SKIP:"Pular",BUTTON_NEXT:"Avançar",BUTTON_DONE:"Vamos lá!"},Rj={NAME:"PLATEIA"},Sj={CART:{CHECK_OUT:"Finalizar",EMPTY:"Seu carrinho está vazio",TITLE:"Carrinho de Compras",TOTAL:"Total"}},yj={EPISODE_REPORT:"Denunciar episódio",EPISODE_UNLOAD:"Excluir cópia local do episódio",EPISODE_VIEW_AUTHOR:"Visualizar autor",EPISODES_LOAD:"Carregar um episódio por ID:",EPISODES_MENU:"Menu de episódios",EPISODES_SELECT:"Ou selecione um episódio:",EPISODES_WARNING:"Aviso: os conteúdos gerados pelos usuários não têm classificação indicativa",INSTRUCTION:{CREATE_TITLE:"para começar, insira o nome do episódio que conterá todos os seus enunciados e aperte “Criar”.",LOAD:"criar ou carregar?",PUBLISH:"publicar seu episódio",TITLE:"dê um nome ao seu episódio",TOGGLE_VISIBILITY:"toque para exibir/ocultar enunciados",WRITE:"escreva seus enunciados"},WARNING:{DELETE:"Deseja mesmo excluir este episódio?",TOS:"Ao compartilhar conteúdo, você concordará com os nossos [tos]Termos de Serviço[/tos]",TOS_AGREE:"concordar e compartilhar"},BACK_TO_EPISODES:"voltar aos episódios",BACK_TO_MENU:"voltar ao menu",CREATE_NEW_EPISODE:"criar novo episódio",PREVIOUS_EPISODES:"episódios anteriores",PROMPT_ADD:"adicionar enunciado",PROMPT_PLACEHOLDER:"insira um enunciado",PROMPTS_COUNT_HIDDEN:"({count} oculto[s])",TITLE_PLACEHOLDER:"insira um título"},Aj={BROADCASTER:{SUBTEXT:"Você conectou sua conta à extensão Jackbox Audience Kit para Twitch.",WARNING:"A CONFIGURAÇÃO DE PLATEIA NÃO ESTÁ ATIVA NESTA SALA"},RECONNECTED:{TEXT:"CONEXÃO RESTABELECIDA",SUBTEXT:"Divirtam-se!"},RECONNECTING:{CONTROLLER:{TEXT:"CONEXÃO INTERROMPIDA",SUBTEXT:"Tentando reconectar-se ({attempt} de 5)"},GAME:{TEXT:"CONEXÃO DO JOGO INTERROMPIDA",SUBTEXT:"Aguarde enquanto tentamos restabelecer a conexão"}},PAUSED:{TEXT:"O JOGO ESTÁ PAUSADO",SUBTEXT:"Tudo que você enviar ainda será enviado ao jogo."}},Lj={SHARE:"Compartilhar",COPY_TO_CLIPBOARD:"Copiar para área de transferência",COPIED:"Copiado"},Cj={ACTION:Ej,ALT:mj,ERROR:gj,LOADING:_j,LOBBY:Tj,POST_GAME:vj,SEPARATOR:bj,TUTORIAL:xj,AUDIENCE:Rj,GALLERY:Sj,UGC:yj,TOAST:Aj,SHARE:Lj},wj={en:QW,fr:pX,it:AX,de:kX,es:ej,"es-XL":hj,"pt-BR":Cj},Ar=(t,e)=>{const r=t.__vccOpts||t;for(const[n,i]of e)r[n]=i;return r};var Yf={exports:{}};/**
- * @license
- * Lodash <https://lodash.com/>
- * Copyright OpenJS Foundation and other contributors <https://openjsf.org/>
- * Released under MIT license <https://lodash.com/license>
- * Based on Underscore.js 1.8.3 <http://underscorejs.org/LICENSE>
- * Copyright Jeremy Ashkenas, DocumentCloud and Investigative Reporters & Editors
- */Yf.exports;(function(t,e){(function(){var r,n="4.17.21",i=200,s="Unsupported core-js use. Try https://npms.io/search?q=ponyfill.",o="Expected a function",f="Invalid `variable` option passed into `_.template`",c="__lodash_hash_undefined__",d=500,p="__lodash_placeholder__",E=1,m=2,g=4,_=1,b=2,x=1,S=2,y=4,v=8,R=16,w=32,M=64,k=128,H=256,O=512,z=30,ie="...",G=800,X=16,ee=1,B=2,Q=3,W=1/0,j=9007199254740991,ue=17976931348623157e292,ve=NaN,ae=4294967295,he=ae-1,Se=ae>>>1,He=[["ary",k],["bind",x],["bindKey",S],["curry",v],["curryRight",R],["flip",O],["partial",w],["partialRight",M],["rearg",H]],Ie="[object Arguments]",$e="[object Array]",nt="[object AsyncFunction]",Fe="[object Boolean]",ot="[object Date]",et="[object DOMException]",xt="[object Error]",zt="[object Function]",V="[object GeneratorFunction]",P="[object Map]",re="[object Number]",me="[object Null]",pe="[object Object]",be="[object Promise]",xe="[object Proxy]",N="[object RegExp]",U="[object Set]",q="[object String]",ge="[object Symbol]",ye="[object Undefined]",Re="[object WeakMap]",se="[object WeakSet]",le="[object ArrayBuffer]",Ke="[object DataView]",K="[object Float32Array]",$="[object Float64Array]",Z="[object Int8Array]",D="[object Int16Array]",J="[object Int32Array]",fe="[object Uint8Array]",we="[object Uint8ClampedArray]",Ce="[object Uint16Array]",ke="[object Uint32Array]",Ct=/\b__p \+= '';/g,hr=/\b(__p \+=) '' \+/g,Ve=/(__e\(.*?\)|\b__t\)) \+\n'';/g,da=/&(?:amp|lt|gt|quot|#39);/g,Im=/[&<>"']/g,TL=RegExp(da.source),vL=RegExp(Im.source),bL=/<%-([\s\S]+?)%>/g,xL=/<%([\s\S]+?)%>/g,Nm=/<%=([\s\S]+?)%>/g,RL=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,SL=/^\w*$/,yL=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,jc=/[\\^$.*+?()[\]{}|]/g,AL=RegExp(jc.source),zc=/^\s+/,LL=/\s/,CL=/\{(?:\n\/\* \[wrapped with .+\] \*\/)?\n?/,wL=/\{\n\/\* \[wrapped with (.+)\] \*/,OL=/,? & /,IL=/[^\x00-\x2f\x3a-\x40\x5b-\x60\x7b-\x7f]+/g,NL=/[()=,{}\[\]\/\s]/,PL=/\\(\\)?/g,UL=/\$\{([^\\}]*(?:\\.[^\\}]*)*)\}/g,Pm=/\w*$/,DL=/^[-+]0x[0-9a-f]+$/i,BL=/^0b[01]+$/i,ML=/^\[object .+?Constructor\]$/,$L=/^0o[0-7]+$/i,KL=/^(?:0|[1-9]\d*)$/,kL=/[\xc0-\xd6\xd8-\xf6\xf8-\xff\u0100-\u017f]/g,Ql=/($^)/,GL=/['\n\r\u2028\u2029\\]/g,Zl="\\ud800-\\udfff",VL="\\u0300-\\u036f",FL="\\ufe20-\\ufe2f",HL="\\u20d0-\\u20ff",Um=VL+FL+HL,Dm="\\u2700-\\u27bf",Bm="a-z\\xdf-\\xf6\\xf8-\\xff",WL="\\xac\\xb1\\xd7\\xf7",XL="\\x00-\\x2f\\x3a-\\x40\\x5b-\\x60\\x7b-\\xbf",jL="\\u2000-\\u206f",zL=" \\t\\x0b\\f\\xa0\\ufeff\\n\\r\\u2028\\u2029\\u1680\\u180e\\u2000\\u2001\\u2002\\u2003\\u2004\\u2005\\u2006\\u2007\\u2008\\u2009\\u200a\\u202f\\u205f\\u3000",Mm="A-Z\\xc0-\\xd6\\xd8-\\xde",$m="\\ufe0e\\ufe0f",Km=WL+XL+jL+zL,qc="['’]",qL="["+Zl+"]",km="["+Km+"]",eu="["+Um+"]",Gm="\\d+",YL="["+Dm+"]",Vm="["+Bm+"]",Fm="[^"+Zl+Km+Gm+Dm+Bm+Mm+"]",Yc="\\ud83c[\\udffb-\\udfff]",JL="(?:"+eu+"|"+Yc+")",Hm="[^"+Zl+"]",Jc="(?:\\ud83c[\\udde6-\\uddff]){2}",Qc="[\\ud800-\\udbff][\\udc00-\\udfff]",ha="["+Mm+"]",Wm="\\u200d",Xm="(?:"+Vm+"|"+Fm+")",QL="(?:"+ha+"|"+Fm+")",jm="(?:"+qc+"(?:d|ll|m|re|s|t|ve))?",zm="(?:"+qc+"(?:D|LL|M|RE|S|T|VE))?",qm=JL+"?",Ym="["+$m+"]?",ZL="(?:"+Wm+"(?:"+[Hm,Jc,Qc].join("|")+")"+Ym+qm+")*",eC="\\d*(?:1st|2nd|3rd|(?![123])\\dth)(?=\\b|[A-Z_])",tC="\\d*(?:1ST|2ND|3RD|(?![123])\\dTH)(?=\\b|[a-z_])",Jm=Ym+qm+ZL,rC="(?:"+[YL,Jc,Qc].join("|")+")"+Jm,nC="(?:"+[Hm+eu+"?",eu,Jc,Qc,qL].join("|")+")",iC=RegExp(qc,"g"),sC=RegExp(eu,"g"),Zc=RegExp(Yc+"(?="+Yc+")|"+nC+Jm,"g"),aC=RegExp([ha+"?"+Vm+"+"+jm+"(?="+[km,ha,"$"].join("|")+")",QL+"+"+zm+"(?="+[km,ha+Xm,"$"].join("|")+")",ha+"?"+Xm+"+"+jm,ha+"+"+zm,tC,eC,Gm,rC].join("|"),"g"),oC=RegExp("["+Wm+Zl+Um+$m+"]"),lC=/[a-z][A-Z]|[A-Z]{2}[a-z]|[0-9][a-zA-Z]|[a-zA-Z][0-9]|[^a-zA-Z0-9 ]/,uC=["Array","Buffer","DataView","Date","Error","Float32Array","Float64Array","Function","Int8Array","Int16Array","Int32Array","Map","Math","Object","Promise","RegExp","Set","String","Symbol","TypeError","Uint8Array","Uint8ClampedArray","Uint16Array","Uint32Array","WeakMap","_","clearTimeout","isFinite","parseInt","setTimeout"],fC=-1,Ht={};Ht[K]=Ht[$]=Ht[Z]=Ht[D]=Ht[J]=Ht[fe]=Ht[we]=Ht[Ce]=Ht[ke]=!0,Ht[Ie]=Ht[$e]=Ht[le]=Ht[Fe]=Ht[Ke]=Ht[ot]=Ht[xt]=Ht[zt]=Ht[P]=Ht[re]=Ht[pe]=Ht[N]=Ht[U]=Ht[q]=Ht[Re]=!1;var Gt={};Gt[Ie]=Gt[$e]=Gt[le]=Gt[Ke]=Gt[Fe]=Gt[ot]=Gt[K]=Gt[$]=Gt[Z]=Gt[D]=Gt[J]=Gt[P]=Gt[re]=Gt[pe]=Gt[N]=Gt[U]=Gt[q]=Gt[ge]=Gt[fe]=Gt[we]=Gt[Ce]=Gt[ke]=!0,Gt[xt]=Gt[zt]=Gt[Re]=!1;var cC={À:"A",Á:"A",Â:"A",Ã:"A",Ä:"A",Å:"A",à:"a",á:"a",â:"a",ã:"a",ä:"a",å:"a",Ç:"C",ç:"c",Ð:"D",ð:"d",È:"E",É:"E",Ê:"E",Ë:"E",è:"e",é:"e",ê:"e",ë:"e",Ì:"I",Í:"I",Î:"I",Ï:"I",ì:"i",í:"i",î:"i",ï:"i",Ñ:"N",ñ:"n",Ò:"O",Ó:"O",Ô:"O",Õ:"O",Ö:"O",Ø:"O",ò:"o",ó:"o",ô:"o",õ:"o",ö:"o",ø:"o",Ù:"U",Ú:"U",Û:"U",Ü:"U",ù:"u",ú:"u",û:"u",ü:"u",Ý:"Y",ý:"y",ÿ:"y",Æ:"Ae",æ:"ae",Þ:"Th",þ:"th",ß:"ss",Ā:"A",Ă:"A",Ą:"A",ā:"a",ă:"a",ą:"a",Ć:"C",Ĉ:"C",Ċ:"C",Č:"C",ć:"c",ĉ:"c",ċ:"c",č:"c",Ď:"D",Đ:"D",ď:"d",đ:"d",Ē:"E",Ĕ:"E",Ė:"E",Ę:"E",Ě:"E",ē:"e",ĕ:"e",ė:"e",ę:"e",ě:"e",Ĝ:"G",Ğ:"G",Ġ:"G",Ģ:"G",ĝ:"g",ğ:"g",ġ:"g",ģ:"g",Ĥ:"H",Ħ:"H",ĥ:"h",ħ:"h",Ĩ:"I",Ī:"I",Ĭ:"I",Į:"I",İ:"I",ĩ:"i",ī:"i",ĭ:"i",į:"i",ı:"i",Ĵ:"J",ĵ:"j",Ķ:"K",ķ:"k",ĸ:"k",Ĺ:"L",Ļ:"L",Ľ:"L",Ŀ:"L",Ł:"L",ĺ:"l",ļ:"l",ľ:"l",ŀ:"l",ł:"l",Ń:"N",Ņ:"N",Ň:"N",Ŋ:"N",ń:"n",ņ:"n",ň:"n",ŋ:"n",Ō:"O",Ŏ:"O",Ő:"O",ō:"o",ŏ:"o",ő:"o",Ŕ:"R",Ŗ:"R",Ř:"R",ŕ:"r",ŗ:"r",ř:"r",Ś:"S",Ŝ:"S",Ş:"S",Š:"S",ś:"s",ŝ:"s",ş:"s",š:"s",Ţ:"T",Ť:"T",Ŧ:"T",ţ:"t",ť:"t",ŧ:"t",Ũ:"U",Ū:"U",Ŭ:"U",Ů:"U",Ű:"U",Ų:"U",ũ:"u",ū:"u",ŭ:"u",ů:"u",ű:"u",ų:"u",Ŵ:"W",ŵ:"w",Ŷ:"Y",ŷ:"y",Ÿ:"Y",Ź:"Z",Ż:"Z",Ž:"Z",ź:"z",ż:"z",ž:"z",Ĳ:"IJ",ĳ:"ij",Œ:"Oe",œ:"oe",ŉ:"'n",ſ:"s"},pC={"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#39;"},dC={"&amp;":"&","&lt;":"<","&gt;":">","&quot;":'"',"&#39;":"'"},hC={"\\":"\\","'":"'","\n":"n","\r":"r","\u2028":"u2028","\u2029":"u2029"},EC=parseFloat,mC=parseInt,Qm=typeof Ut=="object"&&Ut&&Ut.Object===Object&&Ut,gC=typeof self=="object"&&self&&self.Object===Object&&self,_r=Qm||gC||Function("return this")(),ep=e&&!e.nodeType&&e,ws=ep&&!0&&t&&!t.nodeType&&t,Zm=ws&&ws.exports===ep,tp=Zm&&Qm.process,En=function(){try{var te=ws&&ws.require&&ws.require("util").types;return te||tp&&tp.binding&&tp.binding("util")}catch{}}(),eg=En&&En.isArrayBuffer,tg=En&&En.isDate,rg=En&&En.isMap,ng=En&&En.isRegExp,ig=En&&En.isSet,sg=En&&En.isTypedArray;function en(te,Ee,oe){switch(oe.length){case 0:return te.call(Ee);case 1:return te.call(Ee,oe[0]);case 2:return te.call(Ee,oe[0],oe[1]);case 3:return te.call(Ee,oe[0],oe[1],oe[2])}return te.apply(Ee,oe)}function _C(te,Ee,oe,Be){for(var tt=-1,At=te==null?0:te.length;++tt<At;){var ur=te[tt];Ee(Be,ur,oe(ur),te)}return Be}function mn(te,Ee){for(var oe=-1,Be=te==null?0:te.length;++oe<Be&&Ee(te[oe],oe,te)!==!1;);return te}function TC(te,Ee){for(var oe=te==null?0:te.length;oe--&&Ee(te[oe],oe,te)!==!1;);return te}function ag(te,Ee){for(var oe=-1,Be=te==null?0:te.length;++oe<Be;)if(!Ee(te[oe],oe,te))return!1;return!0}function Gi(te,Ee){for(var oe=-1,Be=te==null?0:te.length,tt=0,At=[];++oe<Be;){var ur=te[oe];Ee(ur,oe,te)&&(At[tt++]=ur)}return At}function tu(te,Ee){var oe=te==null?0:te.length;return!!oe&&Ea(te,Ee,0)>-1}function rp(te,Ee,oe){for(var Be=-1,tt=te==null?0:te.length;++Be<tt;)if(oe(Ee,te[Be]))return!0;return!1}function qt(te,Ee){for(var oe=-1,Be=te==null?0:te.length,tt=Array(Be);++oe<Be;)tt[oe]=Ee(te[oe],oe,te);return tt}function Vi(te,Ee){for(var oe=-1,Be=Ee.length,tt=te.length;++oe<Be;)te[tt+oe]=Ee[oe];return te}function np(te,Ee,oe,Be){var tt=-1,At=te==null?0:te.length;for(Be&&At&&(oe=te[++tt]);++tt<At;)oe=Ee(oe,te[tt],tt,te);return oe}function vC(te,Ee,oe,Be){var tt=te==null?0:te.length;for(Be&&tt&&(oe=te[--tt]);tt--;)oe=Ee(oe,te[tt],tt,te);return oe}function ip(te,Ee){for(var oe=-1,Be=te==null?0:te.length;++oe<Be;)if(Ee(te[oe],oe,te))return!0;return!1}var bC=sp("length");function xC(te){return te.split("")}function RC(te){return te.match(IL)||[]}function og(te,Ee,oe){var Be;return oe(te,function(tt,At,ur){if(Ee(tt,At,ur))return Be=At,!1}),Be}function ru(te,Ee,oe,Be){for(var tt=te.length,At=oe+(Be?1:-1);Be?At--:++At<tt;)if(Ee(te[At],At,te))return At;return-1}function Ea(te,Ee,oe){return Ee===Ee?DC(te,Ee,oe):ru(te,lg,oe)}function SC(te,Ee,oe,Be){for(var tt=oe-1,At=te.length;++tt<At;)if(Be(te[tt],Ee))return tt;return-1}function lg(te){return te!==te}function ug(te,Ee){var oe=te==null?0:te.length;return oe?op(te,Ee)/oe:ve}function sp(te){return function(Ee){return Ee==null?r:Ee[te]}}function ap(te){return function(Ee){return te==null?r:te[Ee]}}function fg(te,Ee,oe,Be,tt){return tt(te,function(At,ur,Bt){oe=Be?(Be=!1,At):Ee(oe,At,ur,Bt)}),oe}function yC(te,Ee){var oe=te.length;for(te.sort(Ee);oe--;)te[oe]=te[oe].value;return te}function op(te,Ee){for(var oe,Be=-1,tt=te.length;++Be<tt;){var At=Ee(te[Be]);At!==r&&(oe=oe===r?At:oe+At)}return oe}function lp(te,Ee){for(var oe=-1,Be=Array(te);++oe<te;)Be[oe]=Ee(oe);return Be}function AC(te,Ee){return qt(Ee,function(oe){return[oe,te[oe]]})}function cg(te){return te&&te.slice(0,Eg(te)+1).replace(zc,"")}function tn(te){return function(Ee){return te(Ee)}}function up(te,Ee){return qt(Ee,function(oe){return te[oe]})}function Do(te,Ee){return te.has(Ee)}function pg(te,Ee){for(var oe=-1,Be=te.length;++oe<Be&&Ea(Ee,te[oe],0)>-1;);return oe}function dg(te,Ee){for(var oe=te.length;oe--&&Ea(Ee,te[oe],0)>-1;);return oe}function LC(te,Ee){for(var oe=te.length,Be=0;oe--;)te[oe]===Ee&&++Be;return Be}var CC=ap(cC),wC=ap(pC);function OC(te){return"\\"+hC[te]}function IC(te,Ee){return te==null?r:te[Ee]}function ma(te){return oC.test(te)}function NC(te){return lC.test(te)}function PC(te){for(var Ee,oe=[];!(Ee=te.next()).done;)oe.push(Ee.value);return oe}function fp(te){var Ee=-1,oe=Array(te.size);return te.forEach(function(Be,tt){oe[++Ee]=[tt,Be]}),oe}function hg(te,Ee){return function(oe){return te(Ee(oe))}}function Fi(te,Ee){for(var oe=-1,Be=te.length,tt=0,At=[];++oe<Be;){var ur=te[oe];(ur===Ee||ur===p)&&(te[oe]=p,At[tt++]=oe)}return At}function nu(te){var Ee=-1,oe=Array(te.size);return te.forEach(function(Be){oe[++Ee]=Be}),oe}function UC(te){var Ee=-1,oe=Array(te.size);return te.forEach(function(Be){oe[++Ee]=[Be,Be]}),oe}function DC(te,Ee,oe){for(var Be=oe-1,tt=te.length;++Be<tt;)if(te[Be]===Ee)return Be;return-1}function BC(te,Ee,oe){for(var Be=oe+1;Be--;)if(te[Be]===Ee)return Be;return Be}function ga(te){return ma(te)?$C(te):bC(te)}function wn(te){return ma(te)?KC(te):xC(te)}function Eg(te){for(var Ee=te.length;Ee--&&LL.test(te.charAt(Ee)););return Ee}var MC=ap(dC);function $C(te){for(var Ee=Zc.lastIndex=0;Zc.test(te);)++Ee;return Ee}function KC(te){return te.match(Zc)||[]}function kC(te){return te.match(aC)||[]}var GC=function te(Ee){Ee=Ee==null?_r:_a.defaults(_r.Object(),Ee,_a.pick(_r,uC));var oe=Ee.Array,Be=Ee.Date,tt=Ee.Error,At=Ee.Function,ur=Ee.Math,Bt=Ee.Object,cp=Ee.RegExp,VC=Ee.String,gn=Ee.TypeError,iu=oe.prototype,FC=At.prototype,Ta=Bt.prototype,su=Ee["__core-js_shared__"],au=FC.toString,Nt=Ta.hasOwnProperty,HC=0,mg=function(){var a=/[^.]+$/.exec(su&&su.keys&&su.keys.IE_PROTO||"");return a?"Symbol(src)_1."+a:""}(),ou=Ta.toString,WC=au.call(Bt),XC=_r._,jC=cp("^"+au.call(Nt).replace(jc,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$"),lu=Zm?Ee.Buffer:r,Hi=Ee.Symbol,uu=Ee.Uint8Array,gg=lu?lu.allocUnsafe:r,fu=hg(Bt.getPrototypeOf,Bt),_g=Bt.create,Tg=Ta.propertyIsEnumerable,cu=iu.splice,vg=Hi?Hi.isConcatSpreadable:r,Bo=Hi?Hi.iterator:r,Os=Hi?Hi.toStringTag:r,pu=function(){try{var a=Ds(Bt,"defineProperty");return a({},"",{}),a}catch{}}(),zC=Ee.clearTimeout!==_r.clearTimeout&&Ee.clearTimeout,qC=Be&&Be.now!==_r.Date.now&&Be.now,YC=Ee.setTimeout!==_r.setTimeout&&Ee.setTimeout,du=ur.ceil,hu=ur.floor,pp=Bt.getOwnPropertySymbols,JC=lu?lu.isBuffer:r,bg=Ee.isFinite,QC=iu.join,ZC=hg(Bt.keys,Bt),fr=ur.max,Lr=ur.min,ew=Be.now,tw=Ee.parseInt,xg=ur.random,rw=iu.reverse,dp=Ds(Ee,"DataView"),Mo=Ds(Ee,"Map"),hp=Ds(Ee,"Promise"),va=Ds(Ee,"Set"),$o=Ds(Ee,"WeakMap"),Ko=Ds(Bt,"create"),Eu=$o&&new $o,ba={},nw=Bs(dp),iw=Bs(Mo),sw=Bs(hp),aw=Bs(va),ow=Bs($o),mu=Hi?Hi.prototype:r,ko=mu?mu.valueOf:r,Rg=mu?mu.toString:r;function C(a){if(Zt(a)&&!it(a)&&!(a instanceof mt)){if(a instanceof _n)return a;if(Nt.call(a,"__wrapped__"))return S_(a)}return new _n(a)}var xa=function(){function a(){}return function(l){if(!Jt(l))return{};if(_g)return _g(l);a.prototype=l;var h=new a;return a.prototype=r,h}}();function gu(){}function _n(a,l){this.__wrapped__=a,this.__actions__=[],this.__chain__=!!l,this.__index__=0,this.__values__=r}C.templateSettings={escape:bL,evaluate:xL,interpolate:Nm,variable:"",imports:{_:C}},C.prototype=gu.prototype,C.prototype.constructor=C,_n.prototype=xa(gu.prototype),_n.prototype.constructor=_n;function mt(a){this.__wrapped__=a,this.__actions__=[],this.__dir__=1,this.__filtered__=!1,this.__iteratees__=[],this.__takeCount__=ae,this.__views__=[]}function lw(){var a=new mt(this.__wrapped__);return a.__actions__=Hr(this.__actions__),a.__dir__=this.__dir__,a.__filtered__=this.__filtered__,a.__iteratees__=Hr(this.__iteratees__),a.__takeCount__=this.__takeCount__,a.__views__=Hr(this.__views__),a}function uw(){if(this.__filtered__){var a=new mt(this);a.__dir__=-1,a.__filtered__=!0}else a=this.clone(),a.__dir__*=-1;return a}function fw(){var a=this.__wrapped__.value(),l=this.__dir__,h=it(a),T=l<0,A=h?a.length:0,I=xO(0,A,this.__views__),F=I.start,Y=I.end,ne=Y-F,_e=T?Y:F-1,Te=this.__iteratees__,Le=Te.length,Ne=0,Ge=Lr(ne,this.__takeCount__);if(!h||!T&&A==ne&&Ge==ne)return jg(a,this.__actions__);var je=[];e:for(;ne--&&Ne<Ge;){_e+=l;for(var lt=-1,ze=a[_e];++lt<Le;){var dt=Te[lt],_t=dt.iteratee,sn=dt.type,Mr=_t(ze);if(sn==B)ze=Mr;else if(!Mr){if(sn==ee)continue e;break e}}je[Ne++]=ze}return je}mt.prototype=xa(gu.prototype),mt.prototype.constructor=mt;function Is(a){var l=-1,h=a==null?0:a.length;for(this.clear();++l<h;){var T=a[l];this.set(T[0],T[1])}}function cw(){this.__data__=Ko?Ko(null):{},this.size=0}function pw(a){var l=this.has(a)&&delete this.__data__[a];return this.size-=l?1:0,l}function dw(a){var l=this.__data__;if(Ko){var h=l[a];return h===c?r:h}return Nt.call(l,a)?l[a]:r}function hw(a){var l=this.__data__;return Ko?l[a]!==r:Nt.call(l,a)}function Ew(a,l){var h=this.__data__;return this.size+=this.has(a)?0:1,h[a]=Ko&&l===r?c:l,this}Is.prototype.clear=cw,Is.prototype.delete=pw,Is.prototype.get=dw,Is.prototype.has=hw,Is.prototype.set=Ew;function pi(a){var l=-1,h=a==null?0:a.length;for(this.clear();++l<h;){var T=a[l];this.set(T[0],T[1])}}function mw(){this.__data__=[],this.size=0}function gw(a){var l=this.__data__,h=_u(l,a);if(h<0)return!1;var T=l.length-1;return h==T?l.pop():cu.call(l,h,1),--this.size,!0}function _w(a){var l=this.__data__,h=_u(l,a);return h<0?r:l[h][1]}function Tw(a){return _u(this.__data__,a)>-1}function vw(a,l){var h=this.__data__,T=_u(h,a);return T<0?(++this.size,h.push([a,l])):h[T][1]=l,this}pi.prototype.clear=mw,pi.prototype.delete=gw,pi.prototype.get=_w,pi.prototype.has=Tw,pi.prototype.set=vw;function di(a){var l=-1,h=a==null?0:a.length;for(this.clear();++l<h;){var T=a[l];this.set(T[0],T[1])}}function bw(){this.size=0,this.__data__={hash:new Is,map:new(Mo||pi),string:new Is}}function xw(a){var l=Ou(this,a).delete(a);return this.size-=l?1:0,l}function Rw(a){return Ou(this,a).get(a)}function Sw(a){return Ou(this,a).has(a)}function yw(a,l){var h=Ou(this,a),T=h.size;return h.set(a,l),this.size+=h.size==T?0:1,this}di.prototype.clear=bw,di.prototype.delete=xw,di.prototype.get=Rw,di.prototype.has=Sw,di.prototype.set=yw;function Ns(a){var l=-1,h=a==null?0:a.length;for(this.__data__=new di;++l<h;)this.add(a[l])}function Aw(a){return this.__data__.set(a,c),this}function Lw(a){return this.__data__.has(a)}Ns.prototype.add=Ns.prototype.push=Aw,Ns.prototype.has=Lw;function On(a){var l=this.__data__=new pi(a);this.size=l.size}function Cw(){this.__data__=new pi,this.size=0}function ww(a){var l=this.__data__,h=l.delete(a);return this.size=l.size,h}function Ow(a){return this.__data__.get(a)}function Iw(a){return this.__data__.has(a)}function Nw(a,l){var h=this.__data__;if(h instanceof pi){var T=h.__data__;if(!Mo||T.length<i-1)return T.push([a,l]),this.size=++h.size,this;h=this.__data__=new di(T)}return h.set(a,l),this.size=h.size,this}On.prototype.clear=Cw,On.prototype.delete=ww,On.prototype.get=Ow,On.prototype.has=Iw,On.prototype.set=Nw;function Sg(a,l){var h=it(a),T=!h&&Ms(a),A=!h&&!T&&qi(a),I=!h&&!T&&!A&&Aa(a),F=h||T||A||I,Y=F?lp(a.length,VC):[],ne=Y.length;for(var _e in a)(l||Nt.call(a,_e))&&!(F&&(_e=="length"||A&&(_e=="offset"||_e=="parent")||I&&(_e=="buffer"||_e=="byteLength"||_e=="byteOffset")||gi(_e,ne)))&&Y.push(_e);return Y}function yg(a){var l=a.length;return l?a[yp(0,l-1)]:r}function Pw(a,l){return Iu(Hr(a),Ps(l,0,a.length))}function Uw(a){return Iu(Hr(a))}function Ep(a,l,h){(h!==r&&!In(a[l],h)||h===r&&!(l in a))&&hi(a,l,h)}function Go(a,l,h){var T=a[l];(!(Nt.call(a,l)&&In(T,h))||h===r&&!(l in a))&&hi(a,l,h)}function _u(a,l){for(var h=a.length;h--;)if(In(a[h][0],l))return h;return-1}function Dw(a,l,h,T){return Wi(a,function(A,I,F){l(T,A,h(A),F)}),T}function Ag(a,l){return a&&Fn(l,Er(l),a)}function Bw(a,l){return a&&Fn(l,Xr(l),a)}function hi(a,l,h){l=="__proto__"&&pu?pu(a,l,{configurable:!0,enumerable:!0,value:h,writable:!0}):a[l]=h}function mp(a,l){for(var h=-1,T=l.length,A=oe(T),I=a==null;++h<T;)A[h]=I?r:Yp(a,l[h]);return A}function Ps(a,l,h){return a===a&&(h!==r&&(a=a<=h?a:h),l!==r&&(a=a>=l?a:l)),a}function Tn(a,l,h,T,A,I){var F,Y=l&E,ne=l&m,_e=l&g;if(h&&(F=A?h(a,T,A,I):h(a)),F!==r)return F;if(!Jt(a))return a;var Te=it(a);if(Te){if(F=SO(a),!Y)return Hr(a,F)}else{var Le=Cr(a),Ne=Le==zt||Le==V;if(qi(a))return Yg(a,Y);if(Le==pe||Le==Ie||Ne&&!A){if(F=ne||Ne?{}:E_(a),!Y)return ne?dO(a,Bw(F,a)):pO(a,Ag(F,a))}else{if(!Gt[Le])return A?a:{};F=yO(a,Le,Y)}}I||(I=new On);var Ge=I.get(a);if(Ge)return Ge;I.set(a,F),H_(a)?a.forEach(function(ze){F.add(Tn(ze,l,h,ze,a,I))}):V_(a)&&a.forEach(function(ze,dt){F.set(dt,Tn(ze,l,h,dt,a,I))});var je=_e?ne?Bp:Dp:ne?Xr:Er,lt=Te?r:je(a);return mn(lt||a,function(ze,dt){lt&&(dt=ze,ze=a[dt]),Go(F,dt,Tn(ze,l,h,dt,a,I))}),F}function Mw(a){var l=Er(a);return function(h){return Lg(h,a,l)}}function Lg(a,l,h){var T=h.length;if(a==null)return!T;for(a=Bt(a);T--;){var A=h[T],I=l[A],F=a[A];if(F===r&&!(A in a)||!I(F))return!1}return!0}function Cg(a,l,h){if(typeof a!="function")throw new gn(o);return zo(function(){a.apply(r,h)},l)}function Vo(a,l,h,T){var A=-1,I=tu,F=!0,Y=a.length,ne=[],_e=l.length;if(!Y)return ne;h&&(l=qt(l,tn(h))),T?(I=rp,F=!1):l.length>=i&&(I=Do,F=!1,l=new Ns(l));e:for(;++A<Y;){var Te=a[A],Le=h==null?Te:h(Te);if(Te=T||Te!==0?Te:0,F&&Le===Le){for(var Ne=_e;Ne--;)if(l[Ne]===Le)continue e;ne.push(Te)}else I(l,Le,T)||ne.push(Te)}return ne}var Wi=t_(Vn),wg=t_(_p,!0);function $w(a,l){var h=!0;return Wi(a,function(T,A,I){return h=!!l(T,A,I),h}),h}function Tu(a,l,h){for(var T=-1,A=a.length;++T<A;){var I=a[T],F=l(I);if(F!=null&&(Y===r?F===F&&!nn(F):h(F,Y)))var Y=F,ne=I}return ne}function Kw(a,l,h,T){var A=a.length;for(h=at(h),h<0&&(h=-h>A?0:A+h),T=T===r||T>A?A:at(T),T<0&&(T+=A),T=h>T?0:X_(T);h<T;)a[h++]=l;return a}function Og(a,l){var h=[];return Wi(a,function(T,A,I){l(T,A,I)&&h.push(T)}),h}function Tr(a,l,h,T,A){var I=-1,F=a.length;for(h||(h=LO),A||(A=[]);++I<F;){var Y=a[I];l>0&&h(Y)?l>1?Tr(Y,l-1,h,T,A):Vi(A,Y):T||(A[A.length]=Y)}return A}var gp=r_(),Ig=r_(!0);function Vn(a,l){return a&&gp(a,l,Er)}function _p(a,l){return a&&Ig(a,l,Er)}function vu(a,l){return Gi(l,function(h){return _i(a[h])})}function Us(a,l){l=ji(l,a);for(var h=0,T=l.length;a!=null&&h<T;)a=a[Hn(l[h++])];return h&&h==T?a:r}function Ng(a,l,h){var T=l(a);return it(a)?T:Vi(T,h(a))}function Dr(a){return a==null?a===r?ye:me:Os&&Os in Bt(a)?bO(a):UO(a)}function Tp(a,l){return a>l}function kw(a,l){return a!=null&&Nt.call(a,l)}function Gw(a,l){return a!=null&&l in Bt(a)}function Vw(a,l,h){return a>=Lr(l,h)&&a<fr(l,h)}function vp(a,l,h){for(var T=h?rp:tu,A=a[0].length,I=a.length,F=I,Y=oe(I),ne=1/0,_e=[];F--;){var Te=a[F];F&&l&&(Te=qt(Te,tn(l))),ne=Lr(Te.length,ne),Y[F]=!h&&(l||A>=120&&Te.length>=120)?new Ns(F&&Te):r}Te=a[0];var Le=-1,Ne=Y[0];e:for(;++Le<A&&_e.length<ne;){var Ge=Te[Le],je=l?l(Ge):Ge;if(Ge=h||Ge!==0?Ge:0,!(Ne?Do(Ne,je):T(_e,je,h))){for(F=I;--F;){var lt=Y[F];if(!(lt?Do(lt,je):T(a[F],je,h)))continue e}Ne&&Ne.push(je),_e.push(Ge)}}return _e}function Fw(a,l,h,T){return Vn(a,function(A,I,F){l(T,h(A),I,F)}),T}function Fo(a,l,h){l=ji(l,a),a=T_(a,l);var T=a==null?a:a[Hn(bn(l))];return T==null?r:en(T,a,h)}function Pg(a){return Zt(a)&&Dr(a)==Ie}function Hw(a){return Zt(a)&&Dr(a)==le}function Ww(a){return Zt(a)&&Dr(a)==ot}function Ho(a,l,h,T,A){return a===l?!0:a==null||l==null||!Zt(a)&&!Zt(l)?a!==a&&l!==l:Xw(a,l,h,T,Ho,A)}function Xw(a,l,h,T,A,I){var F=it(a),Y=it(l),ne=F?$e:Cr(a),_e=Y?$e:Cr(l);ne=ne==Ie?pe:ne,_e=_e==Ie?pe:_e;var Te=ne==pe,Le=_e==pe,Ne=ne==_e;if(Ne&&qi(a)){if(!qi(l))return!1;F=!0,Te=!1}if(Ne&&!Te)return I||(I=new On),F||Aa(a)?p_(a,l,h,T,A,I):TO(a,l,ne,h,T,A,I);if(!(h&_)){var Ge=Te&&Nt.call(a,"__wrapped__"),je=Le&&Nt.call(l,"__wrapped__");if(Ge||je){var lt=Ge?a.value():a,ze=je?l.value():l;return I||(I=new On),A(lt,ze,h,T,I)}}return Ne?(I||(I=new On),vO(a,l,h,T,A,I)):!1}function jw(a){return Zt(a)&&Cr(a)==P}function bp(a,l,h,T){var A=h.length,I=A,F=!T;if(a==null)return!I;for(a=Bt(a);A--;){var Y=h[A];if(F&&Y[2]?Y[1]!==a[Y[0]]:!(Y[0]in a))return!1}for(;++A<I;){Y=h[A];var ne=Y[0],_e=a[ne],Te=Y[1];if(F&&Y[2]){if(_e===r&&!(ne in a))return!1}else{var Le=new On;if(T)var Ne=T(_e,Te,ne,a,l,Le);if(!(Ne===r?Ho(Te,_e,_|b,T,Le):Ne))return!1}}return!0}function Ug(a){if(!Jt(a)||wO(a))return!1;var l=_i(a)?jC:ML;return l.test(Bs(a))}function zw(a){return Zt(a)&&Dr(a)==N}function qw(a){return Zt(a)&&Cr(a)==U}function Yw(a){return Zt(a)&&Mu(a.length)&&!!Ht[Dr(a)]}function Dg(a){return typeof a=="function"?a:a==null?jr:typeof a=="object"?it(a)?$g(a[0],a[1]):Mg(a):nT(a)}function xp(a){if(!jo(a))return ZC(a);var l=[];for(var h in Bt(a))Nt.call(a,h)&&h!="constructor"&&l.push(h);return l}function Jw(a){if(!Jt(a))return PO(a);var l=jo(a),h=[];for(var T in a)T=="constructor"&&(l||!Nt.call(a,T))||h.push(T);return h}function Rp(a,l){return a<l}function Bg(a,l){var h=-1,T=Wr(a)?oe(a.length):[];return Wi(a,function(A,I,F){T[++h]=l(A,I,F)}),T}function Mg(a){var l=$p(a);return l.length==1&&l[0][2]?g_(l[0][0],l[0][1]):function(h){return h===a||bp(h,a,l)}}function $g(a,l){return kp(a)&&m_(l)?g_(Hn(a),l):function(h){var T=Yp(h,a);return T===r&&T===l?Jp(h,a):Ho(l,T,_|b)}}function bu(a,l,h,T,A){a!==l&&gp(l,function(I,F){if(A||(A=new On),Jt(I))Qw(a,l,F,h,bu,T,A);else{var Y=T?T(Vp(a,F),I,F+"",a,l,A):r;Y===r&&(Y=I),Ep(a,F,Y)}},Xr)}function Qw(a,l,h,T,A,I,F){var Y=Vp(a,h),ne=Vp(l,h),_e=F.get(ne);if(_e){Ep(a,h,_e);return}var Te=I?I(Y,ne,h+"",a,l,F):r,Le=Te===r;if(Le){var Ne=it(ne),Ge=!Ne&&qi(ne),je=!Ne&&!Ge&&Aa(ne);Te=ne,Ne||Ge||je?it(Y)?Te=Y:nr(Y)?Te=Hr(Y):Ge?(Le=!1,Te=Yg(ne,!0)):je?(Le=!1,Te=Jg(ne,!0)):Te=[]:qo(ne)||Ms(ne)?(Te=Y,Ms(Y)?Te=j_(Y):(!Jt(Y)||_i(Y))&&(Te=E_(ne))):Le=!1}Le&&(F.set(ne,Te),A(Te,ne,T,I,F),F.delete(ne)),Ep(a,h,Te)}function Kg(a,l){var h=a.length;if(h)return l+=l<0?h:0,gi(l,h)?a[l]:r}function kg(a,l,h){l.length?l=qt(l,function(I){return it(I)?function(F){return Us(F,I.length===1?I[0]:I)}:I}):l=[jr];var T=-1;l=qt(l,tn(We()));var A=Bg(a,function(I,F,Y){var ne=qt(l,function(_e){return _e(I)});return{criteria:ne,index:++T,value:I}});return yC(A,function(I,F){return cO(I,F,h)})}function Zw(a,l){return Gg(a,l,function(h,T){return Jp(a,T)})}function Gg(a,l,h){for(var T=-1,A=l.length,I={};++T<A;){var F=l[T],Y=Us(a,F);h(Y,F)&&Wo(I,ji(F,a),Y)}return I}function eO(a){return function(l){return Us(l,a)}}function Sp(a,l,h,T){var A=T?SC:Ea,I=-1,F=l.length,Y=a;for(a===l&&(l=Hr(l)),h&&(Y=qt(a,tn(h)));++I<F;)for(var ne=0,_e=l[I],Te=h?h(_e):_e;(ne=A(Y,Te,ne,T))>-1;)Y!==a&&cu.call(Y,ne,1),cu.call(a,ne,1);return a}function Vg(a,l){for(var h=a?l.length:0,T=h-1;h--;){var A=l[h];if(h==T||A!==I){var I=A;gi(A)?cu.call(a,A,1):Cp(a,A)}}return a}function yp(a,l){return a+hu(xg()*(l-a+1))}function tO(a,l,h,T){for(var A=-1,I=fr(du((l-a)/(h||1)),0),F=oe(I);I--;)F[T?I:++A]=a,a+=h;return F}function Ap(a,l){var h="";if(!a||l<1||l>j)return h;do l%2&&(h+=a),l=hu(l/2),l&&(a+=a);while(l);return h}function ut(a,l){return Fp(__(a,l,jr),a+"")}function rO(a){return yg(La(a))}function nO(a,l){var h=La(a);return Iu(h,Ps(l,0,h.length))}function Wo(a,l,h,T){if(!Jt(a))return a;l=ji(l,a);for(var A=-1,I=l.length,F=I-1,Y=a;Y!=null&&++A<I;){var ne=Hn(l[A]),_e=h;if(ne==="__proto__"||ne==="constructor"||ne==="prototype")return a;if(A!=F){var Te=Y[ne];_e=T?T(Te,ne,Y):r,_e===r&&(_e=Jt(Te)?Te:gi(l[A+1])?[]:{})}Go(Y,ne,_e),Y=Y[ne]}return a}var Fg=Eu?function(a,l){return Eu.set(a,l),a}:jr,iO=pu?function(a,l){return pu(a,"toString",{configurable:!0,enumerable:!1,value:Zp(l),writable:!0})}:jr;function sO(a){return Iu(La(a))}function vn(a,l,h){var T=-1,A=a.length;l<0&&(l=-l>A?0:A+l),h=h>A?A:h,h<0&&(h+=A),A=l>h?0:h-l>>>0,l>>>=0;for(var I=oe(A);++T<A;)I[T]=a[T+l];return I}function aO(a,l){var h;return Wi(a,function(T,A,I){return h=l(T,A,I),!h}),!!h}function xu(a,l,h){var T=0,A=a==null?T:a.length;if(typeof l=="number"&&l===l&&A<=Se){for(;T<A;){var I=T+A>>>1,F=a[I];F!==null&&!nn(F)&&(h?F<=l:F<l)?T=I+1:A=I}return A}return Lp(a,l,jr,h)}function Lp(a,l,h,T){var A=0,I=a==null?0:a.length;if(I===0)return 0;l=h(l);for(var F=l!==l,Y=l===null,ne=nn(l),_e=l===r;A<I;){var Te=hu((A+I)/2),Le=h(a[Te]),Ne=Le!==r,Ge=Le===null,je=Le===Le,lt=nn(Le);if(F)var ze=T||je;else _e?ze=je&&(T||Ne):Y?ze=je&&Ne&&(T||!Ge):ne?ze=je&&Ne&&!Ge&&(T||!lt):Ge||lt?ze=!1:ze=T?Le<=l:Le<l;ze?A=Te+1:I=Te}return Lr(I,he)}function Hg(a,l){for(var h=-1,T=a.length,A=0,I=[];++h<T;){var F=a[h],Y=l?l(F):F;if(!h||!In(Y,ne)){var ne=Y;I[A++]=F===0?0:F}}return I}function Wg(a){return typeof a=="number"?a:nn(a)?ve:+a}function rn(a){if(typeof a=="string")return a;if(it(a))return qt(a,rn)+"";if(nn(a))return Rg?Rg.call(a):"";var l=a+"";return l=="0"&&1/a==-W?"-0":l}function Xi(a,l,h){var T=-1,A=tu,I=a.length,F=!0,Y=[],ne=Y;if(h)F=!1,A=rp;else if(I>=i){var _e=l?null:gO(a);if(_e)return nu(_e);F=!1,A=Do,ne=new Ns}else ne=l?[]:Y;e:for(;++T<I;){var Te=a[T],Le=l?l(Te):Te;if(Te=h||Te!==0?Te:0,F&&Le===Le){for(var Ne=ne.length;Ne--;)if(ne[Ne]===Le)continue e;l&&ne.push(Le),Y.push(Te)}else A(ne,Le,h)||(ne!==Y&&ne.push(Le),Y.push(Te))}return Y}function Cp(a,l){return l=ji(l,a),a=T_(a,l),a==null||delete a[Hn(bn(l))]}function Xg(a,l,h,T){return Wo(a,l,h(Us(a,l)),T)}function Ru(a,l,h,T){for(var A=a.length,I=T?A:-1;(T?I--:++I<A)&&l(a[I],I,a););return h?vn(a,T?0:I,T?I+1:A):vn(a,T?I+1:0,T?A:I)}function jg(a,l){var h=a;return h instanceof mt&&(h=h.value()),np(l,function(T,A){return A.func.apply(A.thisArg,Vi([T],A.args))},h)}function wp(a,l,h){var T=a.length;if(T<2)return T?Xi(a[0]):[];for(var A=-1,I=oe(T);++A<T;)for(var F=a[A],Y=-1;++Y<T;)Y!=A&&(I[A]=Vo(I[A]||F,a[Y],l,h));return Xi(Tr(I,1),l,h)}function zg(a,l,h){for(var T=-1,A=a.length,I=l.length,F={};++T<A;){var Y=T<I?l[T]:r;h(F,a[T],Y)}return F}function Op(a){return nr(a)?a:[]}function Ip(a){return typeof a=="function"?a:jr}function ji(a,l){return it(a)?a:kp(a,l)?[a]:R_(wt(a))}var oO=ut;function zi(a,l,h){var T=a.length;return h=h===r?T:h,!l&&h>=T?a:vn(a,l,h)}var qg=zC||function(a){return _r.clearTimeout(a)};function Yg(a,l){if(l)return a.slice();var h=a.length,T=gg?gg(h):new a.constructor(h);return a.copy(T),T}function Np(a){var l=new a.constructor(a.byteLength);return new uu(l).set(new uu(a)),l}function lO(a,l){var h=l?Np(a.buffer):a.buffer;return new a.constructor(h,a.byteOffset,a.byteLength)}function uO(a){var l=new a.constructor(a.source,Pm.exec(a));return l.lastIndex=a.lastIndex,l}function fO(a){return ko?Bt(ko.call(a)):{}}function Jg(a,l){var h=l?Np(a.buffer):a.buffer;return new a.constructor(h,a.byteOffset,a.length)}function Qg(a,l){if(a!==l){var h=a!==r,T=a===null,A=a===a,I=nn(a),F=l!==r,Y=l===null,ne=l===l,_e=nn(l);if(!Y&&!_e&&!I&&a>l||I&&F&&ne&&!Y&&!_e||T&&F&&ne||!h&&ne||!A)return 1;if(!T&&!I&&!_e&&a<l||_e&&h&&A&&!T&&!I||Y&&h&&A||!F&&A||!ne)return-1}return 0}function cO(a,l,h){for(var T=-1,A=a.criteria,I=l.criteria,F=A.length,Y=h.length;++T<F;){var ne=Qg(A[T],I[T]);if(ne){if(T>=Y)return ne;var _e=h[T];return ne*(_e=="desc"?-1:1)}}return a.index-l.index}function Zg(a,l,h,T){for(var A=-1,I=a.length,F=h.length,Y=-1,ne=l.length,_e=fr(I-F,0),Te=oe(ne+_e),Le=!T;++Y<ne;)Te[Y]=l[Y];for(;++A<F;)(Le||A<I)&&(Te[h[A]]=a[A]);for(;_e--;)Te[Y++]=a[A++];return Te}function e_(a,l,h,T){for(var A=-1,I=a.length,F=-1,Y=h.length,ne=-1,_e=l.length,Te=fr(I-Y,0),Le=oe(Te+_e),Ne=!T;++A<Te;)Le[A]=a[A];for(var Ge=A;++ne<_e;)Le[Ge+ne]=l[ne];for(;++F<Y;)(Ne||A<I)&&(Le[Ge+h[F]]=a[A++]);return Le}function Hr(a,l){var h=-1,T=a.length;for(l||(l=oe(T));++h<T;)l[h]=a[h];return l}function Fn(a,l,h,T){var A=!h;h||(h={});for(var I=-1,F=l.length;++I<F;){var Y=l[I],ne=T?T(h[Y],a[Y],Y,h,a):r;ne===r&&(ne=a[Y]),A?hi(h,Y,ne):Go(h,Y,ne)}return h}function pO(a,l){return Fn(a,Kp(a),l)}function dO(a,l){return Fn(a,d_(a),l)}function Su(a,l){return function(h,T){var A=it(h)?_C:Dw,I=l?l():{};return A(h,a,We(T,2),I)}}function Ra(a){return ut(function(l,h){var T=-1,A=h.length,I=A>1?h[A-1]:r,F=A>2?h[2]:r;for(I=a.length>3&&typeof I=="function"?(A--,I):r,F&&Br(h[0],h[1],F)&&(I=A<3?r:I,A=1),l=Bt(l);++T<A;){var Y=h[T];Y&&a(l,Y,T,I)}return l})}function t_(a,l){return function(h,T){if(h==null)return h;if(!Wr(h))return a(h,T);for(var A=h.length,I=l?A:-1,F=Bt(h);(l?I--:++I<A)&&T(F[I],I,F)!==!1;);return h}}function r_(a){return function(l,h,T){for(var A=-1,I=Bt(l),F=T(l),Y=F.length;Y--;){var ne=F[a?Y:++A];if(h(I[ne],ne,I)===!1)break}return l}}function hO(a,l,h){var T=l&x,A=Xo(a);function I(){var F=this&&this!==_r&&this instanceof I?A:a;return F.apply(T?h:this,arguments)}return I}function n_(a){return function(l){l=wt(l);var h=ma(l)?wn(l):r,T=h?h[0]:l.charAt(0),A=h?zi(h,1).join(""):l.slice(1);return T[a]()+A}}function Sa(a){return function(l){return np(tT(eT(l).replace(iC,"")),a,"")}}function Xo(a){return function(){var l=arguments;switch(l.length){case 0:return new a;case 1:return new a(l[0]);case 2:return new a(l[0],l[1]);case 3:return new a(l[0],l[1],l[2]);case 4:return new a(l[0],l[1],l[2],l[3]);case 5:return new a(l[0],l[1],l[2],l[3],l[4]);case 6:return new a(l[0],l[1],l[2],l[3],l[4],l[5]);case 7:return new a(l[0],l[1],l[2],l[3],l[4],l[5],l[6])}var h=xa(a.prototype),T=a.apply(h,l);return Jt(T)?T:h}}function EO(a,l,h){var T=Xo(a);function A(){for(var I=arguments.length,F=oe(I),Y=I,ne=ya(A);Y--;)F[Y]=arguments[Y];var _e=I<3&&F[0]!==ne&&F[I-1]!==ne?[]:Fi(F,ne);if(I-=_e.length,I<h)return l_(a,l,yu,A.placeholder,r,F,_e,r,r,h-I);var Te=this&&this!==_r&&this instanceof A?T:a;return en(Te,this,F)}return A}function i_(a){return function(l,h,T){var A=Bt(l);if(!Wr(l)){var I=We(h,3);l=Er(l),h=function(Y){return I(A[Y],Y,A)}}var F=a(l,h,T);return F>-1?A[I?l[F]:F]:r}}function s_(a){return mi(function(l){var h=l.length,T=h,A=_n.prototype.thru;for(a&&l.reverse();T--;){var I=l[T];if(typeof I!="function")throw new gn(o);if(A&&!F&&wu(I)=="wrapper")var F=new _n([],!0)}for(T=F?T:h;++T<h;){I=l[T];var Y=wu(I),ne=Y=="wrapper"?Mp(I):r;ne&&Gp(ne[0])&&ne[1]==(k|v|w|H)&&!ne[4].length&&ne[9]==1?F=F[wu(ne[0])].apply(F,ne[3]):F=I.length==1&&Gp(I)?F[Y]():F.thru(I)}return function(){var _e=arguments,Te=_e[0];if(F&&_e.length==1&&it(Te))return F.plant(Te).value();for(var Le=0,Ne=h?l[Le].apply(this,_e):Te;++Le<h;)Ne=l[Le].call(this,Ne);return Ne}})}function yu(a,l,h,T,A,I,F,Y,ne,_e){var Te=l&k,Le=l&x,Ne=l&S,Ge=l&(v|R),je=l&O,lt=Ne?r:Xo(a);function ze(){for(var dt=arguments.length,_t=oe(dt),sn=dt;sn--;)_t[sn]=arguments[sn];if(Ge)var Mr=ya(ze),an=LC(_t,Mr);if(T&&(_t=Zg(_t,T,A,Ge)),I&&(_t=e_(_t,I,F,Ge)),dt-=an,Ge&&dt<_e){var ir=Fi(_t,Mr);return l_(a,l,yu,ze.placeholder,h,_t,ir,Y,ne,_e-dt)}var Nn=Le?h:this,vi=Ne?Nn[a]:a;return dt=_t.length,Y?_t=DO(_t,Y):je&&dt>1&&_t.reverse(),Te&&ne<dt&&(_t.length=ne),this&&this!==_r&&this instanceof ze&&(vi=lt||Xo(vi)),vi.apply(Nn,_t)}return ze}function a_(a,l){return function(h,T){return Fw(h,a,l(T),{})}}function Au(a,l){return function(h,T){var A;if(h===r&&T===r)return l;if(h!==r&&(A=h),T!==r){if(A===r)return T;typeof h=="string"||typeof T=="string"?(h=rn(h),T=rn(T)):(h=Wg(h),T=Wg(T)),A=a(h,T)}return A}}function Pp(a){return mi(function(l){return l=qt(l,tn(We())),ut(function(h){var T=this;return a(l,function(A){return en(A,T,h)})})})}function Lu(a,l){l=l===r?" ":rn(l);var h=l.length;if(h<2)return h?Ap(l,a):l;var T=Ap(l,du(a/ga(l)));return ma(l)?zi(wn(T),0,a).join(""):T.slice(0,a)}function mO(a,l,h,T){var A=l&x,I=Xo(a);function F(){for(var Y=-1,ne=arguments.length,_e=-1,Te=T.length,Le=oe(Te+ne),Ne=this&&this!==_r&&this instanceof F?I:a;++_e<Te;)Le[_e]=T[_e];for(;ne--;)Le[_e++]=arguments[++Y];return en(Ne,A?h:this,Le)}return F}function o_(a){return function(l,h,T){return T&&typeof T!="number"&&Br(l,h,T)&&(h=T=r),l=Ti(l),h===r?(h=l,l=0):h=Ti(h),T=T===r?l<h?1:-1:Ti(T),tO(l,h,T,a)}}function Cu(a){return function(l,h){return typeof l=="string"&&typeof h=="string"||(l=xn(l),h=xn(h)),a(l,h)}}function l_(a,l,h,T,A,I,F,Y,ne,_e){var Te=l&v,Le=Te?F:r,Ne=Te?r:F,Ge=Te?I:r,je=Te?r:I;l|=Te?w:M,l&=~(Te?M:w),l&y||(l&=~(x|S));var lt=[a,l,A,Ge,Le,je,Ne,Y,ne,_e],ze=h.apply(r,lt);return Gp(a)&&v_(ze,lt),ze.placeholder=T,b_(ze,a,l)}function Up(a){var l=ur[a];return function(h,T){if(h=xn(h),T=T==null?0:Lr(at(T),292),T&&bg(h)){var A=(wt(h)+"e").split("e"),I=l(A[0]+"e"+(+A[1]+T));return A=(wt(I)+"e").split("e"),+(A[0]+"e"+(+A[1]-T))}return l(h)}}var gO=va&&1/nu(new va([,-0]))[1]==W?function(a){return new va(a)}:rd;function u_(a){return function(l){var h=Cr(l);return h==P?fp(l):h==U?UC(l):AC(l,a(l))}}function Ei(a,l,h,T,A,I,F,Y){var ne=l&S;if(!ne&&typeof a!="function")throw new gn(o);var _e=T?T.length:0;if(_e||(l&=~(w|M),T=A=r),F=F===r?F:fr(at(F),0),Y=Y===r?Y:at(Y),_e-=A?A.length:0,l&M){var Te=T,Le=A;T=A=r}var Ne=ne?r:Mp(a),Ge=[a,l,h,T,A,Te,Le,I,F,Y];if(Ne&&NO(Ge,Ne),a=Ge[0],l=Ge[1],h=Ge[2],T=Ge[3],A=Ge[4],Y=Ge[9]=Ge[9]===r?ne?0:a.length:fr(Ge[9]-_e,0),!Y&&l&(v|R)&&(l&=~(v|R)),!l||l==x)var je=hO(a,l,h);else l==v||l==R?je=EO(a,l,Y):(l==w||l==(x|w))&&!A.length?je=mO(a,l,h,T):je=yu.apply(r,Ge);var lt=Ne?Fg:v_;return b_(lt(je,Ge),a,l)}function f_(a,l,h,T){return a===r||In(a,Ta[h])&&!Nt.call(T,h)?l:a}function c_(a,l,h,T,A,I){return Jt(a)&&Jt(l)&&(I.set(l,a),bu(a,l,r,c_,I),I.delete(l)),a}function _O(a){return qo(a)?r:a}function p_(a,l,h,T,A,I){var F=h&_,Y=a.length,ne=l.length;if(Y!=ne&&!(F&&ne>Y))return!1;var _e=I.get(a),Te=I.get(l);if(_e&&Te)return _e==l&&Te==a;var Le=-1,Ne=!0,Ge=h&b?new Ns:r;for(I.set(a,l),I.set(l,a);++Le<Y;){var je=a[Le],lt=l[Le];if(T)var ze=F?T(lt,je,Le,l,a,I):T(je,lt,Le,a,l,I);if(ze!==r){if(ze)continue;Ne=!1;break}if(Ge){if(!ip(l,function(dt,_t){if(!Do(Ge,_t)&&(je===dt||A(je,dt,h,T,I)))return Ge.push(_t)})){Ne=!1;break}}else if(!(je===lt||A(je,lt,h,T,I))){Ne=!1;break}}return I.delete(a),I.delete(l),Ne}function TO(a,l,h,T,A,I,F){switch(h){case Ke:if(a.byteLength!=l.byteLength||a.byteOffset!=l.byteOffset)return!1;a=a.buffer,l=l.buffer;case le:return!(a.byteLength!=l.byteLength||!I(new uu(a),new uu(l)));case Fe:case ot:case re:return In(+a,+l);case xt:return a.name==l.name&&a.message==l.message;case N:case q:return a==l+"";case P:var Y=fp;case U:var ne=T&_;if(Y||(Y=nu),a.size!=l.size&&!ne)return!1;var _e=F.get(a);if(_e)return _e==l;T|=b,F.set(a,l);var Te=p_(Y(a),Y(l),T,A,I,F);return F.delete(a),Te;case ge:if(ko)return ko.call(a)==ko.call(l)}return!1}function vO(a,l,h,T,A,I){var F=h&_,Y=Dp(a),ne=Y.length,_e=Dp(l),Te=_e.length;if(ne!=Te&&!F)return!1;for(var Le=ne;Le--;){var Ne=Y[Le];if(!(F?Ne in l:Nt.call(l,Ne)))return!1}var Ge=I.get(a),je=I.get(l);if(Ge&&je)return Ge==l&&je==a;var lt=!0;I.set(a,l),I.set(l,a);for(var ze=F;++Le<ne;){Ne=Y[Le];var dt=a[Ne],_t=l[Ne];if(T)var sn=F?T(_t,dt,Ne,l,a,I):T(dt,_t,Ne,a,l,I);if(!(sn===r?dt===_t||A(dt,_t,h,T,I):sn)){lt=!1;break}ze||(ze=Ne=="constructor")}if(lt&&!ze){var Mr=a.constructor,an=l.constructor;Mr!=an&&"constructor"in a&&"constructor"in l&&!(typeof Mr=="function"&&Mr instanceof Mr&&typeof an=="function"&&an instanceof an)&&(lt=!1)}return I.delete(a),I.delete(l),lt}function mi(a){return Fp(__(a,r,L_),a+"")}function Dp(a){return Ng(a,Er,Kp)}function Bp(a){return Ng(a,Xr,d_)}var Mp=Eu?function(a){return Eu.get(a)}:rd;function wu(a){for(var l=a.name+"",h=ba[l],T=Nt.call(ba,l)?h.length:0;T--;){var A=h[T],I=A.func;if(I==null||I==a)return A.name}return l}function ya(a){var l=Nt.call(C,"placeholder")?C:a;return l.placeholder}function We(){var a=C.iteratee||ed;return a=a===ed?Dg:a,arguments.length?a(arguments[0],arguments[1]):a}function Ou(a,l){var h=a.__data__;return CO(l)?h[typeof l=="string"?"string":"hash"]:h.map}function $p(a){for(var l=Er(a),h=l.length;h--;){var T=l[h],A=a[T];l[h]=[T,A,m_(A)]}return l}function Ds(a,l){var h=IC(a,l);return Ug(h)?h:r}function bO(a){var l=Nt.call(a,Os),h=a[Os];try{a[Os]=r;var T=!0}catch{}var A=ou.call(a);return T&&(l?a[Os]=h:delete a[Os]),A}var Kp=pp?function(a){return a==null?[]:(a=Bt(a),Gi(pp(a),function(l){return Tg.call(a,l)}))}:nd,d_=pp?function(a){for(var l=[];a;)Vi(l,Kp(a)),a=fu(a);return l}:nd,Cr=Dr;(dp&&Cr(new dp(new ArrayBuffer(1)))!=Ke||Mo&&Cr(new Mo)!=P||hp&&Cr(hp.resolve())!=be||va&&Cr(new va)!=U||$o&&Cr(new $o)!=Re)&&(Cr=function(a){var l=Dr(a),h=l==pe?a.constructor:r,T=h?Bs(h):"";if(T)switch(T){case nw:return Ke;case iw:return P;case sw:return be;case aw:return U;case ow:return Re}return l});function xO(a,l,h){for(var T=-1,A=h.length;++T<A;){var I=h[T],F=I.size;switch(I.type){case"drop":a+=F;break;case"dropRight":l-=F;break;case"take":l=Lr(l,a+F);break;case"takeRight":a=fr(a,l-F);break}}return{start:a,end:l}}function RO(a){var l=a.match(wL);return l?l[1].split(OL):[]}function h_(a,l,h){l=ji(l,a);for(var T=-1,A=l.length,I=!1;++T<A;){var F=Hn(l[T]);if(!(I=a!=null&&h(a,F)))break;a=a[F]}return I||++T!=A?I:(A=a==null?0:a.length,!!A&&Mu(A)&&gi(F,A)&&(it(a)||Ms(a)))}function SO(a){var l=a.length,h=new a.constructor(l);return l&&typeof a[0]=="string"&&Nt.call(a,"index")&&(h.index=a.index,h.input=a.input),h}function E_(a){return typeof a.constructor=="function"&&!jo(a)?xa(fu(a)):{}}function yO(a,l,h){var T=a.constructor;switch(l){case le:return Np(a);case Fe:case ot:return new T(+a);case Ke:return lO(a,h);case K:case $:case Z:case D:case J:case fe:case we:case Ce:case ke:return Jg(a,h);case P:return new T;case re:case q:return new T(a);case N:return uO(a);case U:return new T;case ge:return fO(a)}}function AO(a,l){var h=l.length;if(!h)return a;var T=h-1;return l[T]=(h>1?"& ":"")+l[T],l=l.join(h>2?", ":" "),a.replace(CL,`{
-/* [wrapped with `+l+`] */
-`)}function LO(a){return it(a)||Ms(a)||!!(vg&&a&&a[vg])}function gi(a,l){var h=typeof a;return l=l??j,!!l&&(h=="number"||h!="symbol"&&KL.test(a))&&a>-1&&a%1==0&&a<l}function Br(a,l,h){if(!Jt(h))return!1;var T=typeof l;return(T=="number"?Wr(h)&&gi(l,h.length):T=="string"&&l in h)?In(h[l],a):!1}function kp(a,l){if(it(a))return!1;var h=typeof a;return h=="number"||h=="symbol"||h=="boolean"||a==null||nn(a)?!0:SL.test(a)||!RL.test(a)||l!=null&&a in Bt(l)}function CO(a){var l=typeof a;return l=="string"||l=="number"||l=="symbol"||l=="boolean"?a!=="__proto__":a===null}function Gp(a){var l=wu(a),h=C[l];if(typeof h!="function"||!(l in mt.prototype))return!1;if(a===h)return!0;var T=Mp(h);return!!T&&a===T[0]}function wO(a){return!!mg&&mg in a}var OO=su?_i:id;function jo(a){var l=a&&a.constructor,h=typeof l=="function"&&l.prototype||Ta;return a===h}function m_(a){return a===a&&!Jt(a)}function g_(a,l){return function(h){return h==null?!1:h[a]===l&&(l!==r||a in Bt(h))}}function IO(a){var l=Du(a,function(T){return h.size===d&&h.clear(),T}),h=l.cache;return l}function NO(a,l){var h=a[1],T=l[1],A=h|T,I=A<(x|S|k),F=T==k&&h==v||T==k&&h==H&&a[7].length<=l[8]||T==(k|H)&&l[7].length<=l[8]&&h==v;if(!(I||F))return a;T&x&&(a[2]=l[2],A|=h&x?0:y);var Y=l[3];if(Y){var ne=a[3];a[3]=ne?Zg(ne,Y,l[4]):Y,a[4]=ne?Fi(a[3],p):l[4]}return Y=l[5],Y&&(ne=a[5],a[5]=ne?e_(ne,Y,l[6]):Y,a[6]=ne?Fi(a[5],p):l[6]),Y=l[7],Y&&(a[7]=Y),T&k&&(a[8]=a[8]==null?l[8]:Lr(a[8],l[8])),a[9]==null&&(a[9]=l[9]),a[0]=l[0],a[1]=A,a}function PO(a){var l=[];if(a!=null)for(var h in Bt(a))l.push(h);return l}function UO(a){return ou.call(a)}function __(a,l,h){return l=fr(l===r?a.length-1:l,0),function(){for(var T=arguments,A=-1,I=fr(T.length-l,0),F=oe(I);++A<I;)F[A]=T[l+A];A=-1;for(var Y=oe(l+1);++A<l;)Y[A]=T[A];return Y[l]=h(F),en(a,this,Y)}}function T_(a,l){return l.length<2?a:Us(a,vn(l,0,-1))}function DO(a,l){for(var h=a.length,T=Lr(l.length,h),A=Hr(a);T--;){var I=l[T];a[T]=gi(I,h)?A[I]:r}return a}function Vp(a,l){if(!(l==="constructor"&&typeof a[l]=="function")&&l!="__proto__")return a[l]}var v_=x_(Fg),zo=YC||function(a,l){return _r.setTimeout(a,l)},Fp=x_(iO);function b_(a,l,h){var T=l+"";return Fp(a,AO(T,BO(RO(T),h)))}function x_(a){var l=0,h=0;return function(){var T=ew(),A=X-(T-h);if(h=T,A>0){if(++l>=G)return arguments[0]}else l=0;return a.apply(r,arguments)}}function Iu(a,l){var h=-1,T=a.length,A=T-1;for(l=l===r?T:l;++h<l;){var I=yp(h,A),F=a[I];a[I]=a[h],a[h]=F}return a.length=l,a}var R_=IO(function(a){var l=[];return a.charCodeAt(0)===46&&l.push(""),a.replace(yL,function(h,T,A,I){l.push(A?I.replace(PL,"$1"):T||h)}),l});function Hn(a){if(typeof a=="string"||nn(a))return a;var l=a+"";return l=="0"&&1/a==-W?"-0":l}function Bs(a){if(a!=null){try{return au.call(a)}catch{}try{return a+""}catch{}}return""}function BO(a,l){return mn(He,function(h){var T="_."+h[0];l&h[1]&&!tu(a,T)&&a.push(T)}),a.sort()}function S_(a){if(a instanceof mt)return a.clone();var l=new _n(a.__wrapped__,a.__chain__);return l.__actions__=Hr(a.__actions__),l.__index__=a.__index__,l.__values__=a.__values__,l}function MO(a,l,h){(h?Br(a,l,h):l===r)?l=1:l=fr(at(l),0);var T=a==null?0:a.length;if(!T||l<1)return[];for(var A=0,I=0,F=oe(du(T/l));A<T;)F[I++]=vn(a,A,A+=l);return F}function $O(a){for(var l=-1,h=a==null?0:a.length,T=0,A=[];++l<h;){var I=a[l];I&&(A[T++]=I)}return A}function KO(){var a=arguments.length;if(!a)return[];for(var l=oe(a-1),h=arguments[0],T=a;T--;)l[T-1]=arguments[T];return Vi(it(h)?Hr(h):[h],Tr(l,1))}var kO=ut(function(a,l){return nr(a)?Vo(a,Tr(l,1,nr,!0)):[]}),GO=ut(function(a,l){var h=bn(l);return nr(h)&&(h=r),nr(a)?Vo(a,Tr(l,1,nr,!0),We(h,2)):[]}),VO=ut(function(a,l){var h=bn(l);return nr(h)&&(h=r),nr(a)?Vo(a,Tr(l,1,nr,!0),r,h):[]});function FO(a,l,h){var T=a==null?0:a.length;return T?(l=h||l===r?1:at(l),vn(a,l<0?0:l,T)):[]}function HO(a,l,h){var T=a==null?0:a.length;return T?(l=h||l===r?1:at(l),l=T-l,vn(a,0,l<0?0:l)):[]}function WO(a,l){return a&&a.length?Ru(a,We(l,3),!0,!0):[]}function XO(a,l){return a&&a.length?Ru(a,We(l,3),!0):[]}function jO(a,l,h,T){var A=a==null?0:a.length;return A?(h&&typeof h!="number"&&Br(a,l,h)&&(h=0,T=A),Kw(a,l,h,T)):[]}function y_(a,l,h){var T=a==null?0:a.length;if(!T)return-1;var A=h==null?0:at(h);return A<0&&(A=fr(T+A,0)),ru(a,We(l,3),A)}function A_(a,l,h){var T=a==null?0:a.length;if(!T)return-1;var A=T-1;return h!==r&&(A=at(h),A=h<0?fr(T+A,0):Lr(A,T-1)),ru(a,We(l,3),A,!0)}function L_(a){var l=a==null?0:a.length;return l?Tr(a,1):[]}function zO(a){var l=a==null?0:a.length;return l?Tr(a,W):[]}function qO(a,l){var h=a==null?0:a.length;return h?(l=l===r?1:at(l),Tr(a,l)):[]}function YO(a){for(var l=-1,h=a==null?0:a.length,T={};++l<h;){var A=a[l];T[A[0]]=A[1]}return T}function C_(a){return a&&a.length?a[0]:r}function JO(a,l,h){var T=a==null?0:a.length;if(!T)return-1;var A=h==null?0:at(h);return A<0&&(A=fr(T+A,0)),Ea(a,l,A)}function QO(a){var l=a==null?0:a.length;return l?vn(a,0,-1):[]}var ZO=ut(function(a){var l=qt(a,Op);return l.length&&l[0]===a[0]?vp(l):[]}),eI=ut(function(a){var l=bn(a),h=qt(a,Op);return l===bn(h)?l=r:h.pop(),h.length&&h[0]===a[0]?vp(h,We(l,2)):[]}),tI=ut(function(a){var l=bn(a),h=qt(a,Op);return l=typeof l=="function"?l:r,l&&h.pop(),h.length&&h[0]===a[0]?vp(h,r,l):[]});function rI(a,l){return a==null?"":QC.call(a,l)}function bn(a){var l=a==null?0:a.length;return l?a[l-1]:r}function nI(a,l,h){var T=a==null?0:a.length;if(!T)return-1;var A=T;return h!==r&&(A=at(h),A=A<0?fr(T+A,0):Lr(A,T-1)),l===l?BC(a,l,A):ru(a,lg,A,!0)}function iI(a,l){return a&&a.length?Kg(a,at(l)):r}var sI=ut(w_);function w_(a,l){return a&&a.length&&l&&l.length?Sp(a,l):a}function aI(a,l,h){return a&&a.length&&l&&l.length?Sp(a,l,We(h,2)):a}function oI(a,l,h){return a&&a.length&&l&&l.length?Sp(a,l,r,h):a}var lI=mi(function(a,l){var h=a==null?0:a.length,T=mp(a,l);return Vg(a,qt(l,function(A){return gi(A,h)?+A:A}).sort(Qg)),T});function uI(a,l){var h=[];if(!(a&&a.length))return h;var T=-1,A=[],I=a.length;for(l=We(l,3);++T<I;){var F=a[T];l(F,T,a)&&(h.push(F),A.push(T))}return Vg(a,A),h}function Hp(a){return a==null?a:rw.call(a)}function fI(a,l,h){var T=a==null?0:a.length;return T?(h&&typeof h!="number"&&Br(a,l,h)?(l=0,h=T):(l=l==null?0:at(l),h=h===r?T:at(h)),vn(a,l,h)):[]}function cI(a,l){return xu(a,l)}function pI(a,l,h){return Lp(a,l,We(h,2))}function dI(a,l){var h=a==null?0:a.length;if(h){var T=xu(a,l);if(T<h&&In(a[T],l))return T}return-1}function hI(a,l){return xu(a,l,!0)}function EI(a,l,h){return Lp(a,l,We(h,2),!0)}function mI(a,l){var h=a==null?0:a.length;if(h){var T=xu(a,l,!0)-1;if(In(a[T],l))return T}return-1}function gI(a){return a&&a.length?Hg(a):[]}function _I(a,l){return a&&a.length?Hg(a,We(l,2)):[]}function TI(a){var l=a==null?0:a.length;return l?vn(a,1,l):[]}function vI(a,l,h){return a&&a.length?(l=h||l===r?1:at(l),vn(a,0,l<0?0:l)):[]}function bI(a,l,h){var T=a==null?0:a.length;return T?(l=h||l===r?1:at(l),l=T-l,vn(a,l<0?0:l,T)):[]}function xI(a,l){return a&&a.length?Ru(a,We(l,3),!1,!0):[]}function RI(a,l){return a&&a.length?Ru(a,We(l,3)):[]}var SI=ut(function(a){return Xi(Tr(a,1,nr,!0))}),yI=ut(function(a){var l=bn(a);return nr(l)&&(l=r),Xi(Tr(a,1,nr,!0),We(l,2))}),AI=ut(function(a){var l=bn(a);return l=typeof l=="function"?l:r,Xi(Tr(a,1,nr,!0),r,l)});function LI(a){return a&&a.length?Xi(a):[]}function CI(a,l){return a&&a.length?Xi(a,We(l,2)):[]}function wI(a,l){return l=typeof l=="function"?l:r,a&&a.length?Xi(a,r,l):[]}function Wp(a){if(!(a&&a.length))return[];var l=0;return a=Gi(a,function(h){if(nr(h))return l=fr(h.length,l),!0}),lp(l,function(h){return qt(a,sp(h))})}function O_(a,l){if(!(a&&a.length))return[];var h=Wp(a);return l==null?h:qt(h,function(T){return en(l,r,T)})}var OI=ut(function(a,l){return nr(a)?Vo(a,l):[]}),II=ut(function(a){return wp(Gi(a,nr))}),NI=ut(function(a){var l=bn(a);return nr(l)&&(l=r),wp(Gi(a,nr),We(l,2))}),PI=ut(function(a){var l=bn(a);return l=typeof l=="function"?l:r,wp(Gi(a,nr),r,l)}),UI=ut(Wp);function DI(a,l){return zg(a||[],l||[],Go)}function BI(a,l){return zg(a||[],l||[],Wo)}var MI=ut(function(a){var l=a.length,h=l>1?a[l-1]:r;return h=typeof h=="function"?(a.pop(),h):r,O_(a,h)});function I_(a){var l=C(a);return l.__chain__=!0,l}function $I(a,l){return l(a),a}function Nu(a,l){return l(a)}var KI=mi(function(a){var l=a.length,h=l?a[0]:0,T=this.__wrapped__,A=function(I){return mp(I,a)};return l>1||this.__actions__.length||!(T instanceof mt)||!gi(h)?this.thru(A):(T=T.slice(h,+h+(l?1:0)),T.__actions__.push({func:Nu,args:[A],thisArg:r}),new _n(T,this.__chain__).thru(function(I){return l&&!I.length&&I.push(r),I}))});function kI(){return I_(this)}function GI(){return new _n(this.value(),this.__chain__)}function VI(){this.__values__===r&&(this.__values__=W_(this.value()));var a=this.__index__>=this.__values__.length,l=a?r:this.__values__[this.__index__++];return{done:a,value:l}}function FI(){return this}function HI(a){for(var l,h=this;h instanceof gu;){var T=S_(h);T.__index__=0,T.__values__=r,l?A.__wrapped__=T:l=T;var A=T;h=h.__wrapped__}return A.__wrapped__=a,l}function WI(){var a=this.__wrapped__;if(a instanceof mt){var l=a;return this.__actions__.length&&(l=new mt(this)),l=l.reverse(),l.__actions__.push({func:Nu,args:[Hp],thisArg:r}),new _n(l,this.__chain__)}return this.thru(Hp)}function XI(){return jg(this.__wrapped__,this.__actions__)}var jI=Su(function(a,l,h){Nt.call(a,h)?++a[h]:hi(a,h,1)});function zI(a,l,h){var T=it(a)?ag:$w;return h&&Br(a,l,h)&&(l=r),T(a,We(l,3))}function qI(a,l){var h=it(a)?Gi:Og;return h(a,We(l,3))}var YI=i_(y_),JI=i_(A_);function QI(a,l){return Tr(Pu(a,l),1)}function ZI(a,l){return Tr(Pu(a,l),W)}function eN(a,l,h){return h=h===r?1:at(h),Tr(Pu(a,l),h)}function N_(a,l){var h=it(a)?mn:Wi;return h(a,We(l,3))}function P_(a,l){var h=it(a)?TC:wg;return h(a,We(l,3))}var tN=Su(function(a,l,h){Nt.call(a,h)?a[h].push(l):hi(a,h,[l])});function rN(a,l,h,T){a=Wr(a)?a:La(a),h=h&&!T?at(h):0;var A=a.length;return h<0&&(h=fr(A+h,0)),$u(a)?h<=A&&a.indexOf(l,h)>-1:!!A&&Ea(a,l,h)>-1}var nN=ut(function(a,l,h){var T=-1,A=typeof l=="function",I=Wr(a)?oe(a.length):[];return Wi(a,function(F){I[++T]=A?en(l,F,h):Fo(F,l,h)}),I}),iN=Su(function(a,l,h){hi(a,h,l)});function Pu(a,l){var h=it(a)?qt:Bg;return h(a,We(l,3))}function sN(a,l,h,T){return a==null?[]:(it(l)||(l=l==null?[]:[l]),h=T?r:h,it(h)||(h=h==null?[]:[h]),kg(a,l,h))}var aN=Su(function(a,l,h){a[h?0:1].push(l)},function(){return[[],[]]});function oN(a,l,h){var T=it(a)?np:fg,A=arguments.length<3;return T(a,We(l,4),h,A,Wi)}function lN(a,l,h){var T=it(a)?vC:fg,A=arguments.length<3;return T(a,We(l,4),h,A,wg)}function uN(a,l){var h=it(a)?Gi:Og;return h(a,Bu(We(l,3)))}function fN(a){var l=it(a)?yg:rO;return l(a)}function cN(a,l,h){(h?Br(a,l,h):l===r)?l=1:l=at(l);var T=it(a)?Pw:nO;return T(a,l)}function pN(a){var l=it(a)?Uw:sO;return l(a)}function dN(a){if(a==null)return 0;if(Wr(a))return $u(a)?ga(a):a.length;var l=Cr(a);return l==P||l==U?a.size:xp(a).length}function hN(a,l,h){var T=it(a)?ip:aO;return h&&Br(a,l,h)&&(l=r),T(a,We(l,3))}var EN=ut(function(a,l){if(a==null)return[];var h=l.length;return h>1&&Br(a,l[0],l[1])?l=[]:h>2&&Br(l[0],l[1],l[2])&&(l=[l[0]]),kg(a,Tr(l,1),[])}),Uu=qC||function(){return _r.Date.now()};function mN(a,l){if(typeof l!="function")throw new gn(o);return a=at(a),function(){if(--a<1)return l.apply(this,arguments)}}function U_(a,l,h){return l=h?r:l,l=a&&l==null?a.length:l,Ei(a,k,r,r,r,r,l)}function D_(a,l){var h;if(typeof l!="function")throw new gn(o);return a=at(a),function(){return--a>0&&(h=l.apply(this,arguments)),a<=1&&(l=r),h}}var Xp=ut(function(a,l,h){var T=x;if(h.length){var A=Fi(h,ya(Xp));T|=w}return Ei(a,T,l,h,A)}),B_=ut(function(a,l,h){var T=x|S;if(h.length){var A=Fi(h,ya(B_));T|=w}return Ei(l,T,a,h,A)});function M_(a,l,h){l=h?r:l;var T=Ei(a,v,r,r,r,r,r,l);return T.placeholder=M_.placeholder,T}function $_(a,l,h){l=h?r:l;var T=Ei(a,R,r,r,r,r,r,l);return T.placeholder=$_.placeholder,T}function K_(a,l,h){var T,A,I,F,Y,ne,_e=0,Te=!1,Le=!1,Ne=!0;if(typeof a!="function")throw new gn(o);l=xn(l)||0,Jt(h)&&(Te=!!h.leading,Le="maxWait"in h,I=Le?fr(xn(h.maxWait)||0,l):I,Ne="trailing"in h?!!h.trailing:Ne);function Ge(ir){var Nn=T,vi=A;return T=A=r,_e=ir,F=a.apply(vi,Nn),F}function je(ir){return _e=ir,Y=zo(dt,l),Te?Ge(ir):F}function lt(ir){var Nn=ir-ne,vi=ir-_e,iT=l-Nn;return Le?Lr(iT,I-vi):iT}function ze(ir){var Nn=ir-ne,vi=ir-_e;return ne===r||Nn>=l||Nn<0||Le&&vi>=I}function dt(){var ir=Uu();if(ze(ir))return _t(ir);Y=zo(dt,lt(ir))}function _t(ir){return Y=r,Ne&&T?Ge(ir):(T=A=r,F)}function sn(){Y!==r&&qg(Y),_e=0,T=ne=A=Y=r}function Mr(){return Y===r?F:_t(Uu())}function an(){var ir=Uu(),Nn=ze(ir);if(T=arguments,A=this,ne=ir,Nn){if(Y===r)return je(ne);if(Le)return qg(Y),Y=zo(dt,l),Ge(ne)}return Y===r&&(Y=zo(dt,l)),F}return an.cancel=sn,an.flush=Mr,an}var gN=ut(function(a,l){return Cg(a,1,l)}),_N=ut(function(a,l,h){return Cg(a,xn(l)||0,h)});function TN(a){return Ei(a,O)}function Du(a,l){if(typeof a!="function"||l!=null&&typeof l!="function")throw new gn(o);var h=function(){var T=arguments,A=l?l.apply(this,T):T[0],I=h.cache;if(I.has(A))return I.get(A);var F=a.apply(this,T);return h.cache=I.set(A,F)||I,F};return h.cache=new(Du.Cache||di),h}Du.Cache=di;function Bu(a){if(typeof a!="function")throw new gn(o);return function(){var l=arguments;switch(l.length){case 0:return!a.call(this);case 1:return!a.call(this,l[0]);case 2:return!a.call(this,l[0],l[1]);case 3:return!a.call(this,l[0],l[1],l[2])}return!a.apply(this,l)}}function vN(a){return D_(2,a)}var bN=oO(function(a,l){l=l.length==1&&it(l[0])?qt(l[0],tn(We())):qt(Tr(l,1),tn(We()));var h=l.length;return ut(function(T){for(var A=-1,I=Lr(T.length,h);++A<I;)T[A]=l[A].call(this,T[A]);return en(a,this,T)})}),jp=ut(function(a,l){var h=Fi(l,ya(jp));return Ei(a,w,r,l,h)}),k_=ut(function(a,l){var h=Fi(l,ya(k_));return Ei(a,M,r,l,h)}),xN=mi(function(a,l){return Ei(a,H,r,r,r,l)});function RN(a,l){if(typeof a!="function")throw new gn(o);return l=l===r?l:at(l),ut(a,l)}function SN(a,l){if(typeof a!="function")throw new gn(o);return l=l==null?0:fr(at(l),0),ut(function(h){var T=h[l],A=zi(h,0,l);return T&&Vi(A,T),en(a,this,A)})}function yN(a,l,h){var T=!0,A=!0;if(typeof a!="function")throw new gn(o);return Jt(h)&&(T="leading"in h?!!h.leading:T,A="trailing"in h?!!h.trailing:A),K_(a,l,{leading:T,maxWait:l,trailing:A})}function AN(a){return U_(a,1)}function LN(a,l){return jp(Ip(l),a)}function CN(){if(!arguments.length)return[];var a=arguments[0];return it(a)?a:[a]}function wN(a){return Tn(a,g)}function ON(a,l){return l=typeof l=="function"?l:r,Tn(a,g,l)}function IN(a){return Tn(a,E|g)}function NN(a,l){return l=typeof l=="function"?l:r,Tn(a,E|g,l)}function PN(a,l){return l==null||Lg(a,l,Er(l))}function In(a,l){return a===l||a!==a&&l!==l}var UN=Cu(Tp),DN=Cu(function(a,l){return a>=l}),Ms=Pg(function(){return arguments}())?Pg:function(a){return Zt(a)&&Nt.call(a,"callee")&&!Tg.call(a,"callee")},it=oe.isArray,BN=eg?tn(eg):Hw;function Wr(a){return a!=null&&Mu(a.length)&&!_i(a)}function nr(a){return Zt(a)&&Wr(a)}function MN(a){return a===!0||a===!1||Zt(a)&&Dr(a)==Fe}var qi=JC||id,$N=tg?tn(tg):Ww;function KN(a){return Zt(a)&&a.nodeType===1&&!qo(a)}function kN(a){if(a==null)return!0;if(Wr(a)&&(it(a)||typeof a=="string"||typeof a.splice=="function"||qi(a)||Aa(a)||Ms(a)))return!a.length;var l=Cr(a);if(l==P||l==U)return!a.size;if(jo(a))return!xp(a).length;for(var h in a)if(Nt.call(a,h))return!1;return!0}function GN(a,l){return Ho(a,l)}function VN(a,l,h){h=typeof h=="function"?h:r;var T=h?h(a,l):r;return T===r?Ho(a,l,r,h):!!T}function zp(a){if(!Zt(a))return!1;var l=Dr(a);return l==xt||l==et||typeof a.message=="string"&&typeof a.name=="string"&&!qo(a)}function FN(a){return typeof a=="number"&&bg(a)}function _i(a){if(!Jt(a))return!1;var l=Dr(a);return l==zt||l==V||l==nt||l==xe}function G_(a){return typeof a=="number"&&a==at(a)}function Mu(a){return typeof a=="number"&&a>-1&&a%1==0&&a<=j}function Jt(a){var l=typeof a;return a!=null&&(l=="object"||l=="function")}function Zt(a){return a!=null&&typeof a=="object"}var V_=rg?tn(rg):jw;function HN(a,l){return a===l||bp(a,l,$p(l))}function WN(a,l,h){return h=typeof h=="function"?h:r,bp(a,l,$p(l),h)}function XN(a){return F_(a)&&a!=+a}function jN(a){if(OO(a))throw new tt(s);return Ug(a)}function zN(a){return a===null}function qN(a){return a==null}function F_(a){return typeof a=="number"||Zt(a)&&Dr(a)==re}function qo(a){if(!Zt(a)||Dr(a)!=pe)return!1;var l=fu(a);if(l===null)return!0;var h=Nt.call(l,"constructor")&&l.constructor;return typeof h=="function"&&h instanceof h&&au.call(h)==WC}var qp=ng?tn(ng):zw;function YN(a){return G_(a)&&a>=-j&&a<=j}var H_=ig?tn(ig):qw;function $u(a){return typeof a=="string"||!it(a)&&Zt(a)&&Dr(a)==q}function nn(a){return typeof a=="symbol"||Zt(a)&&Dr(a)==ge}var Aa=sg?tn(sg):Yw;function JN(a){return a===r}function QN(a){return Zt(a)&&Cr(a)==Re}function ZN(a){return Zt(a)&&Dr(a)==se}var eP=Cu(Rp),tP=Cu(function(a,l){return a<=l});function W_(a){if(!a)return[];if(Wr(a))return $u(a)?wn(a):Hr(a);if(Bo&&a[Bo])return PC(a[Bo]());var l=Cr(a),h=l==P?fp:l==U?nu:La;return h(a)}function Ti(a){if(!a)return a===0?a:0;if(a=xn(a),a===W||a===-W){var l=a<0?-1:1;return l*ue}return a===a?a:0}function at(a){var l=Ti(a),h=l%1;return l===l?h?l-h:l:0}function X_(a){return a?Ps(at(a),0,ae):0}function xn(a){if(typeof a=="number")return a;if(nn(a))return ve;if(Jt(a)){var l=typeof a.valueOf=="function"?a.valueOf():a;a=Jt(l)?l+"":l}if(typeof a!="string")return a===0?a:+a;a=cg(a);var h=BL.test(a);return h||$L.test(a)?mC(a.slice(2),h?2:8):DL.test(a)?ve:+a}function j_(a){return Fn(a,Xr(a))}function rP(a){return a?Ps(at(a),-j,j):a===0?a:0}function wt(a){return a==null?"":rn(a)}var nP=Ra(function(a,l){if(jo(l)||Wr(l)){Fn(l,Er(l),a);return}for(var h in l)Nt.call(l,h)&&Go(a,h,l[h])}),z_=Ra(function(a,l){Fn(l,Xr(l),a)}),Ku=Ra(function(a,l,h,T){Fn(l,Xr(l),a,T)}),iP=Ra(function(a,l,h,T){Fn(l,Er(l),a,T)}),sP=mi(mp);function aP(a,l){var h=xa(a);return l==null?h:Ag(h,l)}var oP=ut(function(a,l){a=Bt(a);var h=-1,T=l.length,A=T>2?l[2]:r;for(A&&Br(l[0],l[1],A)&&(T=1);++h<T;)for(var I=l[h],F=Xr(I),Y=-1,ne=F.length;++Y<ne;){var _e=F[Y],Te=a[_e];(Te===r||In(Te,Ta[_e])&&!Nt.call(a,_e))&&(a[_e]=I[_e])}return a}),lP=ut(function(a){return a.push(r,c_),en(q_,r,a)});function uP(a,l){return og(a,We(l,3),Vn)}function fP(a,l){return og(a,We(l,3),_p)}function cP(a,l){return a==null?a:gp(a,We(l,3),Xr)}function pP(a,l){return a==null?a:Ig(a,We(l,3),Xr)}function dP(a,l){return a&&Vn(a,We(l,3))}function hP(a,l){return a&&_p(a,We(l,3))}function EP(a){return a==null?[]:vu(a,Er(a))}function mP(a){return a==null?[]:vu(a,Xr(a))}function Yp(a,l,h){var T=a==null?r:Us(a,l);return T===r?h:T}function gP(a,l){return a!=null&&h_(a,l,kw)}function Jp(a,l){return a!=null&&h_(a,l,Gw)}var _P=a_(function(a,l,h){l!=null&&typeof l.toString!="function"&&(l=ou.call(l)),a[l]=h},Zp(jr)),TP=a_(function(a,l,h){l!=null&&typeof l.toString!="function"&&(l=ou.call(l)),Nt.call(a,l)?a[l].push(h):a[l]=[h]},We),vP=ut(Fo);function Er(a){return Wr(a)?Sg(a):xp(a)}function Xr(a){return Wr(a)?Sg(a,!0):Jw(a)}function bP(a,l){var h={};return l=We(l,3),Vn(a,function(T,A,I){hi(h,l(T,A,I),T)}),h}function xP(a,l){var h={};return l=We(l,3),Vn(a,function(T,A,I){hi(h,A,l(T,A,I))}),h}var RP=Ra(function(a,l,h){bu(a,l,h)}),q_=Ra(function(a,l,h,T){bu(a,l,h,T)}),SP=mi(function(a,l){var h={};if(a==null)return h;var T=!1;l=qt(l,function(I){return I=ji(I,a),T||(T=I.length>1),I}),Fn(a,Bp(a),h),T&&(h=Tn(h,E|m|g,_O));for(var A=l.length;A--;)Cp(h,l[A]);return h});function yP(a,l){return Y_(a,Bu(We(l)))}var AP=mi(function(a,l){return a==null?{}:Zw(a,l)});function Y_(a,l){if(a==null)return{};var h=qt(Bp(a),function(T){return[T]});return l=We(l),Gg(a,h,function(T,A){return l(T,A[0])})}function LP(a,l,h){l=ji(l,a);var T=-1,A=l.length;for(A||(A=1,a=r);++T<A;){var I=a==null?r:a[Hn(l[T])];I===r&&(T=A,I=h),a=_i(I)?I.call(a):I}return a}function CP(a,l,h){return a==null?a:Wo(a,l,h)}function wP(a,l,h,T){return T=typeof T=="function"?T:r,a==null?a:Wo(a,l,h,T)}var J_=u_(Er),Q_=u_(Xr);function OP(a,l,h){var T=it(a),A=T||qi(a)||Aa(a);if(l=We(l,4),h==null){var I=a&&a.constructor;A?h=T?new I:[]:Jt(a)?h=_i(I)?xa(fu(a)):{}:h={}}return(A?mn:Vn)(a,function(F,Y,ne){return l(h,F,Y,ne)}),h}function IP(a,l){return a==null?!0:Cp(a,l)}function NP(a,l,h){return a==null?a:Xg(a,l,Ip(h))}function PP(a,l,h,T){return T=typeof T=="function"?T:r,a==null?a:Xg(a,l,Ip(h),T)}function La(a){return a==null?[]:up(a,Er(a))}function UP(a){return a==null?[]:up(a,Xr(a))}function DP(a,l,h){return h===r&&(h=l,l=r),h!==r&&(h=xn(h),h=h===h?h:0),l!==r&&(l=xn(l),l=l===l?l:0),Ps(xn(a),l,h)}function BP(a,l,h){return l=Ti(l),h===r?(h=l,l=0):h=Ti(h),a=xn(a),Vw(a,l,h)}function MP(a,l,h){if(h&&typeof h!="boolean"&&Br(a,l,h)&&(l=h=r),h===r&&(typeof l=="boolean"?(h=l,l=r):typeof a=="boolean"&&(h=a,a=r)),a===r&&l===r?(a=0,l=1):(a=Ti(a),l===r?(l=a,a=0):l=Ti(l)),a>l){var T=a;a=l,l=T}if(h||a%1||l%1){var A=xg();return Lr(a+A*(l-a+EC("1e-"+((A+"").length-1))),l)}return yp(a,l)}var $P=Sa(function(a,l,h){return l=l.toLowerCase(),a+(h?Z_(l):l)});function Z_(a){return Qp(wt(a).toLowerCase())}function eT(a){return a=wt(a),a&&a.replace(kL,CC).replace(sC,"")}function KP(a,l,h){a=wt(a),l=rn(l);var T=a.length;h=h===r?T:Ps(at(h),0,T);var A=h;return h-=l.length,h>=0&&a.slice(h,A)==l}function kP(a){return a=wt(a),a&&vL.test(a)?a.replace(Im,wC):a}function GP(a){return a=wt(a),a&&AL.test(a)?a.replace(jc,"\\$&"):a}var VP=Sa(function(a,l,h){return a+(h?"-":"")+l.toLowerCase()}),FP=Sa(function(a,l,h){return a+(h?" ":"")+l.toLowerCase()}),HP=n_("toLowerCase");function WP(a,l,h){a=wt(a),l=at(l);var T=l?ga(a):0;if(!l||T>=l)return a;var A=(l-T)/2;return Lu(hu(A),h)+a+Lu(du(A),h)}function XP(a,l,h){a=wt(a),l=at(l);var T=l?ga(a):0;return l&&T<l?a+Lu(l-T,h):a}function jP(a,l,h){a=wt(a),l=at(l);var T=l?ga(a):0;return l&&T<l?Lu(l-T,h)+a:a}function zP(a,l,h){return h||l==null?l=0:l&&(l=+l),tw(wt(a).replace(zc,""),l||0)}function qP(a,l,h){return(h?Br(a,l,h):l===r)?l=1:l=at(l),Ap(wt(a),l)}function YP(){var a=arguments,l=wt(a[0]);return a.length<3?l:l.replace(a[1],a[2])}var JP=Sa(function(a,l,h){return a+(h?"_":"")+l.toLowerCase()});function QP(a,l,h){return h&&typeof h!="number"&&Br(a,l,h)&&(l=h=r),h=h===r?ae:h>>>0,h?(a=wt(a),a&&(typeof l=="string"||l!=null&&!qp(l))&&(l=rn(l),!l&&ma(a))?zi(wn(a),0,h):a.split(l,h)):[]}var ZP=Sa(function(a,l,h){return a+(h?" ":"")+Qp(l)});function eU(a,l,h){return a=wt(a),h=h==null?0:Ps(at(h),0,a.length),l=rn(l),a.slice(h,h+l.length)==l}function tU(a,l,h){var T=C.templateSettings;h&&Br(a,l,h)&&(l=r),a=wt(a),l=Ku({},l,T,f_);var A=Ku({},l.imports,T.imports,f_),I=Er(A),F=up(A,I),Y,ne,_e=0,Te=l.interpolate||Ql,Le="__p += '",Ne=cp((l.escape||Ql).source+"|"+Te.source+"|"+(Te===Nm?UL:Ql).source+"|"+(l.evaluate||Ql).source+"|$","g"),Ge="//# sourceURL="+(Nt.call(l,"sourceURL")?(l.sourceURL+"").replace(/\s/g," "):"lodash.templateSources["+ ++fC+"]")+`
-`;a.replace(Ne,function(ze,dt,_t,sn,Mr,an){return _t||(_t=sn),Le+=a.slice(_e,an).replace(GL,OC),dt&&(Y=!0,Le+=`' +
-__e(`+dt+`) +
-'`),Mr&&(ne=!0,Le+=`';
-`+Mr+`;
-__p += '`),_t&&(Le+=`' +
-((__t = (`+_t+`)) == null ? '' : __t) +
-'`),_e=an+ze.length,ze}),Le+=`';
-`;var je=Nt.call(l,"variable")&&l.variable;if(!je)Le=`with (obj) {
-`+Le+`
-}
-`;else if(NL.test(je))throw new tt(f);Le=(ne?Le.replace(Ct,""):Le).replace(hr,"$1").replace(Ve,"$1;"),Le="function("+(je||"obj")+`) {
-`+(je?"":`obj || (obj = {});
-`)+"var __t, __p = ''"+(Y?", __e = _.escape":"")+(ne?`, __j = Array.prototype.join;
-function print() { __p += __j.call(arguments, '') }
-`:`;
-`)+Le+`return __p
-}`;var lt=rT(function(){return At(I,Ge+"return "+Le).apply(r,F)});if(lt.source=Le,zp(lt))throw lt;return lt}function rU(a){return wt(a).toLowerCase()}function nU(a){return wt(a).toUpperCase()}function iU(a,l,h){if(a=wt(a),a&&(h||l===r))return cg(a);if(!a||!(l=rn(l)))return a;var T=wn(a),A=wn(l),I=pg(T,A),F=dg(T,A)+1;return zi(T,I,F).join("")}function sU(a,l,h){if(a=wt(a),a&&(h||l===r))return a.slice(0,Eg(a)+1);if(!a||!(l=rn(l)))return a;var T=wn(a),A=dg(T,wn(l))+1;return zi(T,0,A).join("")}function aU(a,l,h){if(a=wt(a),a&&(h||l===r))return a.replace(zc,"");if(!a||!(l=rn(l)))return a;var T=wn(a),A=pg(T,wn(l));return zi(T,A).join("")}function oU(a,l){var h=z,T=ie;if(Jt(l)){var A="separator"in l?l.separator:A;h="length"in l?at(l.length):h,T="omission"in l?rn(l.omission):T}a=wt(a);var I=a.length;if(ma(a)){var F=wn(a);I=F.length}if(h>=I)return a;var Y=h-ga(T);if(Y<1)return T;var ne=F?zi(F,0,Y).join(""):a.slice(0,Y);if(A===r)return ne+T;if(F&&(Y+=ne.length-Y),qp(A)){if(a.slice(Y).search(A)){var _e,Te=ne;for(A.global||(A=cp(A.source,wt(Pm.exec(A))+"g")),A.lastIndex=0;_e=A.exec(Te);)var Le=_e.index;ne=ne.slice(0,Le===r?Y:Le)}}else if(a.indexOf(rn(A),Y)!=Y){var Ne=ne.lastIndexOf(A);Ne>-1&&(ne=ne.slice(0,Ne))}return ne+T}function lU(a){return a=wt(a),a&&TL.test(a)?a.replace(da,MC):a}var uU=Sa(function(a,l,h){return a+(h?" ":"")+l.toUpperCase()}),Qp=n_("toUpperCase");function tT(a,l,h){return a=wt(a),l=h?r:l,l===r?NC(a)?kC(a):RC(a):a.match(l)||[]}var rT=ut(function(a,l){try{return en(a,r,l)}catch(h){return zp(h)?h:new tt(h)}}),fU=mi(function(a,l){return mn(l,function(h){h=Hn(h),hi(a,h,Xp(a[h],a))}),a});function cU(a){var l=a==null?0:a.length,h=We();return a=l?qt(a,function(T){if(typeof T[1]!="function")throw new gn(o);return[h(T[0]),T[1]]}):[],ut(function(T){for(var A=-1;++A<l;){var I=a[A];if(en(I[0],this,T))return en(I[1],this,T)}})}function pU(a){return Mw(Tn(a,E))}function Zp(a){return function(){return a}}function dU(a,l){return a==null||a!==a?l:a}var hU=s_(),EU=s_(!0);function jr(a){return a}function ed(a){return Dg(typeof a=="function"?a:Tn(a,E))}function mU(a){return Mg(Tn(a,E))}function gU(a,l){return $g(a,Tn(l,E))}var _U=ut(function(a,l){return function(h){return Fo(h,a,l)}}),TU=ut(function(a,l){return function(h){return Fo(a,h,l)}});function td(a,l,h){var T=Er(l),A=vu(l,T);h==null&&!(Jt(l)&&(A.length||!T.length))&&(h=l,l=a,a=this,A=vu(l,Er(l)));var I=!(Jt(h)&&"chain"in h)||!!h.chain,F=_i(a);return mn(A,function(Y){var ne=l[Y];a[Y]=ne,F&&(a.prototype[Y]=function(){var _e=this.__chain__;if(I||_e){var Te=a(this.__wrapped__),Le=Te.__actions__=Hr(this.__actions__);return Le.push({func:ne,args:arguments,thisArg:a}),Te.__chain__=_e,Te}return ne.apply(a,Vi([this.value()],arguments))})}),a}function vU(){return _r._===this&&(_r._=XC),this}function rd(){}function bU(a){return a=at(a),ut(function(l){return Kg(l,a)})}var xU=Pp(qt),RU=Pp(ag),SU=Pp(ip);function nT(a){return kp(a)?sp(Hn(a)):eO(a)}function yU(a){return function(l){return a==null?r:Us(a,l)}}var AU=o_(),LU=o_(!0);function nd(){return[]}function id(){return!1}function CU(){return{}}function wU(){return""}function OU(){return!0}function IU(a,l){if(a=at(a),a<1||a>j)return[];var h=ae,T=Lr(a,ae);l=We(l),a-=ae;for(var A=lp(T,l);++h<a;)l(h);return A}function NU(a){return it(a)?qt(a,Hn):nn(a)?[a]:Hr(R_(wt(a)))}function PU(a){var l=++HC;return wt(a)+l}var UU=Au(function(a,l){return a+l},0),DU=Up("ceil"),BU=Au(function(a,l){return a/l},1),MU=Up("floor");function $U(a){return a&&a.length?Tu(a,jr,Tp):r}function KU(a,l){return a&&a.length?Tu(a,We(l,2),Tp):r}function kU(a){return ug(a,jr)}function GU(a,l){return ug(a,We(l,2))}function VU(a){return a&&a.length?Tu(a,jr,Rp):r}function FU(a,l){return a&&a.length?Tu(a,We(l,2),Rp):r}var HU=Au(function(a,l){return a*l},1),WU=Up("round"),XU=Au(function(a,l){return a-l},0);function jU(a){return a&&a.length?op(a,jr):0}function zU(a,l){return a&&a.length?op(a,We(l,2)):0}return C.after=mN,C.ary=U_,C.assign=nP,C.assignIn=z_,C.assignInWith=Ku,C.assignWith=iP,C.at=sP,C.before=D_,C.bind=Xp,C.bindAll=fU,C.bindKey=B_,C.castArray=CN,C.chain=I_,C.chunk=MO,C.compact=$O,C.concat=KO,C.cond=cU,C.conforms=pU,C.constant=Zp,C.countBy=jI,C.create=aP,C.curry=M_,C.curryRight=$_,C.debounce=K_,C.defaults=oP,C.defaultsDeep=lP,C.defer=gN,C.delay=_N,C.difference=kO,C.differenceBy=GO,C.differenceWith=VO,C.drop=FO,C.dropRight=HO,C.dropRightWhile=WO,C.dropWhile=XO,C.fill=jO,C.filter=qI,C.flatMap=QI,C.flatMapDeep=ZI,C.flatMapDepth=eN,C.flatten=L_,C.flattenDeep=zO,C.flattenDepth=qO,C.flip=TN,C.flow=hU,C.flowRight=EU,C.fromPairs=YO,C.functions=EP,C.functionsIn=mP,C.groupBy=tN,C.initial=QO,C.intersection=ZO,C.intersectionBy=eI,C.intersectionWith=tI,C.invert=_P,C.invertBy=TP,C.invokeMap=nN,C.iteratee=ed,C.keyBy=iN,C.keys=Er,C.keysIn=Xr,C.map=Pu,C.mapKeys=bP,C.mapValues=xP,C.matches=mU,C.matchesProperty=gU,C.memoize=Du,C.merge=RP,C.mergeWith=q_,C.method=_U,C.methodOf=TU,C.mixin=td,C.negate=Bu,C.nthArg=bU,C.omit=SP,C.omitBy=yP,C.once=vN,C.orderBy=sN,C.over=xU,C.overArgs=bN,C.overEvery=RU,C.overSome=SU,C.partial=jp,C.partialRight=k_,C.partition=aN,C.pick=AP,C.pickBy=Y_,C.property=nT,C.propertyOf=yU,C.pull=sI,C.pullAll=w_,C.pullAllBy=aI,C.pullAllWith=oI,C.pullAt=lI,C.range=AU,C.rangeRight=LU,C.rearg=xN,C.reject=uN,C.remove=uI,C.rest=RN,C.reverse=Hp,C.sampleSize=cN,C.set=CP,C.setWith=wP,C.shuffle=pN,C.slice=fI,C.sortBy=EN,C.sortedUniq=gI,C.sortedUniqBy=_I,C.split=QP,C.spread=SN,C.tail=TI,C.take=vI,C.takeRight=bI,C.takeRightWhile=xI,C.takeWhile=RI,C.tap=$I,C.throttle=yN,C.thru=Nu,C.toArray=W_,C.toPairs=J_,C.toPairsIn=Q_,C.toPath=NU,C.toPlainObject=j_,C.transform=OP,C.unary=AN,C.union=SI,C.unionBy=yI,C.unionWith=AI,C.uniq=LI,C.uniqBy=CI,C.uniqWith=wI,C.unset=IP,C.unzip=Wp,C.unzipWith=O_,C.update=NP,C.updateWith=PP,C.values=La,C.valuesIn=UP,C.without=OI,C.words=tT,C.wrap=LN,C.xor=II,C.xorBy=NI,C.xorWith=PI,C.zip=UI,C.zipObject=DI,C.zipObjectDeep=BI,C.zipWith=MI,C.entries=J_,C.entriesIn=Q_,C.extend=z_,C.extendWith=Ku,td(C,C),C.add=UU,C.attempt=rT,C.camelCase=$P,C.capitalize=Z_,C.ceil=DU,C.clamp=DP,C.clone=wN,C.cloneDeep=IN,C.cloneDeepWith=NN,C.cloneWith=ON,C.conformsTo=PN,C.deburr=eT,C.defaultTo=dU,C.divide=BU,C.endsWith=KP,C.eq=In,C.escape=kP,C.escapeRegExp=GP,C.every=zI,C.find=YI,C.findIndex=y_,C.findKey=uP,C.findLast=JI,C.findLastIndex=A_,C.findLastKey=fP,C.floor=MU,C.forEach=N_,C.forEachRight=P_,C.forIn=cP,C.forInRight=pP,C.forOwn=dP,C.forOwnRight=hP,C.get=Yp,C.gt=UN,C.gte=DN,C.has=gP,C.hasIn=Jp,C.head=C_,C.identity=jr,C.includes=rN,C.indexOf=JO,C.inRange=BP,C.invoke=vP,C.isArguments=Ms,C.isArray=it,C.isArrayBuffer=BN,C.isArrayLike=Wr,C.isArrayLikeObject=nr,C.isBoolean=MN,C.isBuffer=qi,C.isDate=$N,C.isElement=KN,C.isEmpty=kN,C.isEqual=GN,C.isEqualWith=VN,C.isError=zp,C.isFinite=FN,C.isFunction=_i,C.isInteger=G_,C.isLength=Mu,C.isMap=V_,C.isMatch=HN,C.isMatchWith=WN,C.isNaN=XN,C.isNative=jN,C.isNil=qN,C.isNull=zN,C.isNumber=F_,C.isObject=Jt,C.isObjectLike=Zt,C.isPlainObject=qo,C.isRegExp=qp,C.isSafeInteger=YN,C.isSet=H_,C.isString=$u,C.isSymbol=nn,C.isTypedArray=Aa,C.isUndefined=JN,C.isWeakMap=QN,C.isWeakSet=ZN,C.join=rI,C.kebabCase=VP,C.last=bn,C.lastIndexOf=nI,C.lowerCase=FP,C.lowerFirst=HP,C.lt=eP,C.lte=tP,C.max=$U,C.maxBy=KU,C.mean=kU,C.meanBy=GU,C.min=VU,C.minBy=FU,C.stubArray=nd,C.stubFalse=id,C.stubObject=CU,C.stubString=wU,C.stubTrue=OU,C.multiply=HU,C.nth=iI,C.noConflict=vU,C.noop=rd,C.now=Uu,C.pad=WP,C.padEnd=XP,C.padStart=jP,C.parseInt=zP,C.random=MP,C.reduce=oN,C.reduceRight=lN,C.repeat=qP,C.replace=YP,C.result=LP,C.round=WU,C.runInContext=te,C.sample=fN,C.size=dN,C.snakeCase=JP,C.some=hN,C.sortedIndex=cI,C.sortedIndexBy=pI,C.sortedIndexOf=dI,C.sortedLastIndex=hI,C.sortedLastIndexBy=EI,C.sortedLastIndexOf=mI,C.startCase=ZP,C.startsWith=eU,C.subtract=XU,C.sum=jU,C.sumBy=zU,C.template=tU,C.times=IU,C.toFinite=Ti,C.toInteger=at,C.toLength=X_,C.toLower=rU,C.toNumber=xn,C.toSafeInteger=rP,C.toString=wt,C.toUpper=nU,C.trim=iU,C.trimEnd=sU,C.trimStart=aU,C.truncate=oU,C.unescape=lU,C.uniqueId=PU,C.upperCase=uU,C.upperFirst=Qp,C.each=N_,C.eachRight=P_,C.first=C_,td(C,function(){var a={};return Vn(C,function(l,h){Nt.call(C.prototype,h)||(a[h]=l)}),a}(),{chain:!1}),C.VERSION=n,mn(["bind","bindKey","curry","curryRight","partial","partialRight"],function(a){C[a].placeholder=C}),mn(["drop","take"],function(a,l){mt.prototype[a]=function(h){h=h===r?1:fr(at(h),0);var T=this.__filtered__&&!l?new mt(this):this.clone();return T.__filtered__?T.__takeCount__=Lr(h,T.__takeCount__):T.__views__.push({size:Lr(h,ae),type:a+(T.__dir__<0?"Right":"")}),T},mt.prototype[a+"Right"]=function(h){return this.reverse()[a](h).reverse()}}),mn(["filter","map","takeWhile"],function(a,l){var h=l+1,T=h==ee||h==Q;mt.prototype[a]=function(A){var I=this.clone();return I.__iteratees__.push({iteratee:We(A,3),type:h}),I.__filtered__=I.__filtered__||T,I}}),mn(["head","last"],function(a,l){var h="take"+(l?"Right":"");mt.prototype[a]=function(){return this[h](1).value()[0]}}),mn(["initial","tail"],function(a,l){var h="drop"+(l?"":"Right");mt.prototype[a]=function(){return this.__filtered__?new mt(this):this[h](1)}}),mt.prototype.compact=function(){return this.filter(jr)},mt.prototype.find=function(a){return this.filter(a).head()},mt.prototype.findLast=function(a){return this.reverse().find(a)},mt.prototype.invokeMap=ut(function(a,l){return typeof a=="function"?new mt(this):this.map(function(h){return Fo(h,a,l)})}),mt.prototype.reject=function(a){return this.filter(Bu(We(a)))},mt.prototype.slice=function(a,l){a=at(a);var h=this;return h.__filtered__&&(a>0||l<0)?new mt(h):(a<0?h=h.takeRight(-a):a&&(h=h.drop(a)),l!==r&&(l=at(l),h=l<0?h.dropRight(-l):h.take(l-a)),h)},mt.prototype.takeRightWhile=function(a){return this.reverse().takeWhile(a).reverse()},mt.prototype.toArray=function(){return this.take(ae)},Vn(mt.prototype,function(a,l){var h=/^(?:filter|find|map|reject)|While$/.test(l),T=/^(?:head|last)$/.test(l),A=C[T?"take"+(l=="last"?"Right":""):l],I=T||/^find/.test(l);A&&(C.prototype[l]=function(){var F=this.__wrapped__,Y=T?[1]:arguments,ne=F instanceof mt,_e=Y[0],Te=ne||it(F),Le=function(dt){var _t=A.apply(C,Vi([dt],Y));return T&&Ne?_t[0]:_t};Te&&h&&typeof _e=="function"&&_e.length!=1&&(ne=Te=!1);var Ne=this.__chain__,Ge=!!this.__actions__.length,je=I&&!Ne,lt=ne&&!Ge;if(!I&&Te){F=lt?F:new mt(this);var ze=a.apply(F,Y);return ze.__actions__.push({func:Nu,args:[Le],thisArg:r}),new _n(ze,Ne)}return je&&lt?a.apply(this,Y):(ze=this.thru(Le),je?T?ze.value()[0]:ze.value():ze)})}),mn(["pop","push","shift","sort","splice","unshift"],function(a){var l=iu[a],h=/^(?:push|sort|unshift)$/.test(a)?"tap":"thru",T=/^(?:pop|shift)$/.test(a);C.prototype[a]=function(){var A=arguments;if(T&&!this.__chain__){var I=this.value();return l.apply(it(I)?I:[],A)}return this[h](function(F){return l.apply(it(F)?F:[],A)})}}),Vn(mt.prototype,function(a,l){var h=C[l];if(h){var T=h.name+"";Nt.call(ba,T)||(ba[T]=[]),ba[T].push({name:l,func:h})}}),ba[yu(r,S).name]=[{name:"wrapper",func:r}],mt.prototype.clone=lw,mt.prototype.reverse=uw,mt.prototype.value=fw,C.prototype.at=KI,C.prototype.chain=kI,C.prototype.commit=GI,C.prototype.next=VI,C.prototype.plant=HI,C.prototype.reverse=WI,C.prototype.toJSON=C.prototype.valueOf=C.prototype.value=XI,C.prototype.first=C.prototype.head,Bo&&(C.prototype[Bo]=FI),C},_a=GC();ws?((ws.exports=_a)._=_a,ep._=_a):_r._=_a}).call(Ut)})(Yf,Yf.exports);Yf.exports;const Oj=lr({props:{modelValue:String,sanitizers:Array},emits:{"update:modelValue":t=>!0},watch:{modelValue(t,e){if(t!==e){const r=this.$refs.input;r.value=t}}},methods:{focus(){this.$refs.input.focus()},async onInput(t){const e=t.target,r=e.maxLength===-1?Number.MAX_SAFE_INTEGER:e.maxLength;if(this.sanitizers&&(e.value=rE.withTypes(e.value,[...this.sanitizers])),e.value.length>r){e.value=e.value.substring(0,r);return}this.$emit("update:modelValue",e.value),await this.$nextTick(),e.value!==this.modelValue&&(e.value=this.modelValue)}}}),Ij=["value"];function Nj(t,e,r,n,i,s){return Oe(),Pe("input",{ref:"input",value:t.modelValue,onInput:e[0]||(e[0]=(...o)=>t.onInput&&t.onInput(...o))},null,40,Ij)}const Pj=Ar(Oj,[["render",Nj]]);var Tl=new Map;function Uj(t){var e=Tl.get(t);e&&e.destroy()}function Dj(t){var e=Tl.get(t);e&&e.update()}var Ju=null;typeof window>"u"?((Ju=function(t){return t}).destroy=function(t){return t},Ju.update=function(t){return t}):((Ju=function(t,e){return t&&Array.prototype.forEach.call(t.length?t:[t],function(r){return function(n){if(n&&n.nodeName&&n.nodeName==="TEXTAREA"&&!Tl.has(n)){var i,s=null,o=window.getComputedStyle(n),f=(i=n.value,function(){d({testForHeightReduction:i===""||!n.value.startsWith(i),restoreTextAlign:null}),i=n.value}),c=(function(E){n.removeEventListener("autosize:destroy",c),n.removeEventListener("autosize:update",p),n.removeEventListener("input",f),window.removeEventListener("resize",p),Object.keys(E).forEach(function(m){return n.style[m]=E[m]}),Tl.delete(n)}).bind(n,{height:n.style.height,resize:n.style.resize,textAlign:n.style.textAlign,overflowY:n.style.overflowY,overflowX:n.style.overflowX,wordWrap:n.style.wordWrap});n.addEventListener("autosize:destroy",c),n.addEventListener("autosize:update",p),n.addEventListener("input",f),window.addEventListener("resize",p),n.style.overflowX="hidden",n.style.wordWrap="break-word",Tl.set(n,{destroy:c,update:p}),p()}function d(E){var m,g,_=E.restoreTextAlign,b=_===void 0?null:_,x=E.testForHeightReduction,S=x===void 0||x,y=o.overflowY;if(n.scrollHeight!==0&&(o.resize==="vertical"?n.style.resize="none":o.resize==="both"&&(n.style.resize="horizontal"),S&&(m=function(R){for(var w=[];R&&R.parentNode&&R.parentNode instanceof Element;)R.parentNode.scrollTop&&w.push([R.parentNode,R.parentNode.scrollTop]),R=R.parentNode;return function(){return w.forEach(function(M){var k=M[0],H=M[1];k.style.scrollBehavior="auto",k.scrollTop=H,k.style.scrollBehavior=null})}}(n),n.style.height=""),g=o.boxSizing==="content-box"?n.scrollHeight-(parseFloat(o.paddingTop)+parseFloat(o.paddingBottom)):n.scrollHeight+parseFloat(o.borderTopWidth)+parseFloat(o.borderBottomWidth),o.maxHeight!=="none"&&g>parseFloat(o.maxHeight)?(o.overflowY==="hidden"&&(n.style.overflow="scroll"),g=parseFloat(o.maxHeight)):o.overflowY!=="hidden"&&(n.style.overflow="hidden"),n.style.height=g+"px",b&&(n.style.textAlign=b),m&&m(),s!==g&&(n.dispatchEvent(new Event("autosize:resized",{bubbles:!0})),s=g),y!==o.overflow&&!b)){var v=o.textAlign;o.overflow==="hidden"&&(n.style.textAlign=v==="start"?"end":"start"),d({restoreTextAlign:v,testForHeightReduction:!0})}}function p(){d({testForHeightReduction:!0,restoreTextAlign:null})}}(r)}),t}).destroy=function(t){return t&&Array.prototype.forEach.call(t.length?t:[t],Uj),t},Ju.update=function(t){return t&&Array.prototype.forEach.call(t.length?t:[t],Dj),t});var tl=function(t){return t&&t.Math===Math&&t},Qr=tl(typeof globalThis=="object"&&globalThis)||tl(typeof window=="object"&&window)||tl(typeof self=="object"&&self)||tl(typeof Ut=="object"&&Ut)||tl(typeof Ut=="object"&&Ut)||function(){return this}()||Function("return this")(),H0={},hn=function(t){try{return!!t()}catch{return!0}},Bj=hn,Ls=!Bj(function(){return Object.defineProperty({},1,{get:function(){return 7}})[1]!==7}),Mj=hn,W0=!Mj(function(){var t=(function(){}).bind();return typeof t!="function"||t.hasOwnProperty("prototype")}),$j=W0,Qu=Function.prototype.call,ki=$j?Qu.bind(Qu):function(){return Qu.apply(Qu,arguments)},zA={},qA={}.propertyIsEnumerable,YA=Object.getOwnPropertyDescriptor,Kj=YA&&!qA.call({1:2},1);zA.f=Kj?function(e){var r=YA(this,e);return!!r&&r.enumerable}:qA;var JA=function(t,e){return{enumerable:!(t&1),configurable:!(t&2),writable:!(t&4),value:e}},QA=W0,ZA=Function.prototype,nE=ZA.call,kj=QA&&ZA.bind.bind(nE,nE),Fr=QA?kj:function(t){return function(){return nE.apply(t,arguments)}},e1=Fr,Gj=e1({}.toString),Vj=e1("".slice),$c=function(t){return Vj(Gj(t),8,-1)},Fj=Fr,Hj=hn,Wj=$c,Wd=Object,Xj=Fj("".split),jj=Hj(function(){return!Wd("z").propertyIsEnumerable(0)})?function(t){return Wj(t)==="String"?Xj(t,""):Wd(t)}:Wd,Kc=function(t){return t==null},zj=Kc,qj=TypeError,jl=function(t){if(zj(t))throw new qj("Can't call method on "+t);return t},Yj=jj,Jj=jl,kc=function(t){return Yj(Jj(t))},Xd=typeof document=="object"&&document.all,Zr=typeof Xd>"u"&&Xd!==void 0?function(t){return typeof t=="function"||t===Xd}:function(t){return typeof t=="function"},Qj=Zr,zl=function(t){return typeof t=="object"?t!==null:Qj(t)},jd=Qr,Zj=Zr,ez=function(t){return Zj(t)?t:void 0},X0=function(t,e){return arguments.length<2?ez(jd[t]):jd[t]&&jd[t][e]},tz=Fr,t1=tz({}.isPrototypeOf),rz=typeof navigator<"u"&&String(navigator.userAgent)||"",r1=Qr,zd=rz,kb=r1.process,Gb=r1.Deno,Vb=kb&&kb.versions||Gb&&Gb.version,Fb=Vb&&Vb.v8,Dn,Jf;Fb&&(Dn=Fb.split("."),Jf=Dn[0]>0&&Dn[0]<4?1:+(Dn[0]+Dn[1]));!Jf&&zd&&(Dn=zd.match(/Edge\/(\d+)/),(!Dn||Dn[1]>=74)&&(Dn=zd.match(/Chrome\/(\d+)/),Dn&&(Jf=+Dn[1])));var nz=Jf,Hb=nz,iz=hn,sz=Qr,az=sz.String,n1=!!Object.getOwnPropertySymbols&&!iz(function(){var t=Symbol("symbol detection");return!az(t)||!(Object(t)instanceof Symbol)||!Symbol.sham&&Hb&&Hb<41}),oz=n1,i1=oz&&!Symbol.sham&&typeof Symbol.iterator=="symbol",lz=X0,uz=Zr,fz=t1,cz=i1,pz=Object,s1=cz?function(t){return typeof t=="symbol"}:function(t){var e=lz("Symbol");return uz(e)&&fz(e.prototype,pz(t))},dz=String,hz=function(t){try{return dz(t)}catch{return"Object"}},Ez=Zr,mz=hz,gz=TypeError,_z=function(t){if(Ez(t))return t;throw new gz(mz(t)+" is not a function")},Tz=_z,vz=Kc,j0=function(t,e){var r=t[e];return vz(r)?void 0:Tz(r)},qd=ki,Yd=Zr,Jd=zl,bz=TypeError,xz=function(t,e){var r,n;if(e==="string"&&Yd(r=t.toString)&&!Jd(n=qd(r,t))||Yd(r=t.valueOf)&&!Jd(n=qd(r,t))||e!=="string"&&Yd(r=t.toString)&&!Jd(n=qd(r,t)))return n;throw new bz("Can't convert object to primitive value")},a1={exports:{}},Wb=Qr,Rz=Object.defineProperty,z0=function(t,e){try{Rz(Wb,t,{value:e,configurable:!0,writable:!0})}catch{Wb[t]=e}return e},Sz=Qr,yz=z0,Xb="__core-js_shared__",jb=a1.exports=Sz[Xb]||yz(Xb,{});(jb.versions||(jb.versions=[])).push({version:"3.37.1",mode:"global",copyright:"© 2014-2024 Denis Pushkarev (zloirock.ru)",license:"https://github.com/zloirock/core-js/blob/v3.37.1/LICENSE",source:"https://github.com/zloirock/core-js"});var q0=a1.exports,zb=q0,Y0=function(t,e){return zb[t]||(zb[t]=e||{})},Az=jl,Lz=Object,o1=function(t){return Lz(Az(t))},Cz=Fr,wz=o1,Oz=Cz({}.hasOwnProperty),Cs=Object.hasOwn||function(e,r){return Oz(wz(e),r)},Iz=Fr,Nz=0,Pz=Math.random(),Uz=Iz(1 .toString),l1=function(t){return"Symbol("+(t===void 0?"":t)+")_"+Uz(++Nz+Pz,36)},Dz=Qr,Bz=Y0,qb=Cs,Mz=l1,$z=n1,Kz=i1,Va=Dz.Symbol,Qd=Bz("wks"),kz=Kz?Va.for||Va:Va&&Va.withoutSetter||Mz,ca=function(t){return qb(Qd,t)||(Qd[t]=$z&&qb(Va,t)?Va[t]:kz("Symbol."+t)),Qd[t]},Gz=ki,Yb=zl,Jb=s1,Vz=j0,Fz=xz,Hz=ca,Wz=TypeError,Xz=Hz("toPrimitive"),jz=function(t,e){if(!Yb(t)||Jb(t))return t;var r=Vz(t,Xz),n;if(r){if(e===void 0&&(e="default"),n=Gz(r,t,e),!Yb(n)||Jb(n))return n;throw new Wz("Can't convert object to primitive value")}return e===void 0&&(e="number"),Fz(t,e)},zz=jz,qz=s1,u1=function(t){var e=zz(t,"string");return qz(e)?e:e+""},Yz=Qr,Qb=zl,iE=Yz.document,Jz=Qb(iE)&&Qb(iE.createElement),f1=function(t){return Jz?iE.createElement(t):{}},Qz=Ls,Zz=hn,eq=f1,c1=!Qz&&!Zz(function(){return Object.defineProperty(eq("div"),"a",{get:function(){return 7}}).a!==7}),tq=Ls,rq=ki,nq=zA,iq=JA,sq=kc,aq=u1,oq=Cs,lq=c1,Zb=Object.getOwnPropertyDescriptor;H0.f=tq?Zb:function(e,r){if(e=sq(e),r=aq(r),lq)try{return Zb(e,r)}catch{}if(oq(e,r))return iq(!rq(nq.f,e,r),e[r])};var ql={},uq=Ls,fq=hn,p1=uq&&fq(function(){return Object.defineProperty(function(){},"prototype",{value:42,writable:!1}).prototype!==42}),cq=zl,pq=String,dq=TypeError,pa=function(t){if(cq(t))return t;throw new dq(pq(t)+" is not an object")},hq=Ls,Eq=c1,mq=p1,Zu=pa,ex=u1,gq=TypeError,Zd=Object.defineProperty,_q=Object.getOwnPropertyDescriptor,eh="enumerable",th="configurable",rh="writable";ql.f=hq?mq?function(e,r,n){if(Zu(e),r=ex(r),Zu(n),typeof e=="function"&&r==="prototype"&&"value"in n&&rh in n&&!n[rh]){var i=_q(e,r);i&&i[rh]&&(e[r]=n.value,n={configurable:th in n?n[th]:i[th],enumerable:eh in n?n[eh]:i[eh],writable:!1})}return Zd(e,r,n)}:Zd:function(e,r,n){if(Zu(e),r=ex(r),Zu(n),Eq)try{return Zd(e,r,n)}catch{}if("get"in n||"set"in n)throw new gq("Accessors not supported");return"value"in n&&(e[r]=n.value),e};var Tq=Ls,vq=ql,bq=JA,J0=Tq?function(t,e,r){return vq.f(t,e,bq(1,r))}:function(t,e,r){return t[e]=r,t},d1={exports:{}},sE=Ls,xq=Cs,h1=Function.prototype,Rq=sE&&Object.getOwnPropertyDescriptor,Sq=xq(h1,"name"),yq=Sq&&(!sE||sE&&Rq(h1,"name").configurable),Aq={CONFIGURABLE:yq},Lq=Fr,Cq=Zr,aE=q0,wq=Lq(Function.toString);Cq(aE.inspectSource)||(aE.inspectSource=function(t){return wq(t)});var Oq=aE.inspectSource,Iq=Qr,Nq=Zr,tx=Iq.WeakMap,Pq=Nq(tx)&&/native code/.test(String(tx)),Uq=Y0,Dq=l1,rx=Uq("keys"),E1=function(t){return rx[t]||(rx[t]=Dq(t))},Q0={},Bq=Pq,m1=Qr,Mq=J0,nh=Cs,ih=q0,$q=E1,Kq=Q0,nx="Object already initialized",ix=m1.TypeError,kq=m1.WeakMap,oE,Qf,lE,Gq=function(t){return lE(t)?Qf(t):oE(t,{})};if(Bq||ih.state){var zn=ih.state||(ih.state=new kq);zn.get=zn.get,zn.has=zn.has,zn.set=zn.set,oE=function(t,e){if(zn.has(t))throw new ix(nx);return e.facade=t,zn.set(t,e),e},Qf=function(t){return zn.get(t)||{}},lE=function(t){return zn.has(t)}}else{var Ia=$q("state");Kq[Ia]=!0,oE=function(t,e){if(nh(t,Ia))throw new ix(nx);return e.facade=t,Mq(t,Ia,e),e},Qf=function(t){return nh(t,Ia)?t[Ia]:{}},lE=function(t){return nh(t,Ia)}}var g1={get:Qf,enforce:Gq},Z0=Fr,Vq=hn,Fq=Zr,ef=Cs,uE=Ls,Hq=Aq.CONFIGURABLE,Wq=Oq,_1=g1,Xq=_1.enforce,jq=_1.get,sx=String,mf=Object.defineProperty,zq=Z0("".slice),qq=Z0("".replace),Yq=Z0([].join),Jq=uE&&!Vq(function(){return mf(function(){},"length",{value:8}).length!==8}),Qq=String(String).split("String"),Zq=d1.exports=function(t,e,r){zq(sx(e),0,7)==="Symbol("&&(e="["+qq(sx(e),/^Symbol\(([^)]*)\).*$/,"$1")+"]"),r&&r.getter&&(e="get "+e),r&&r.setter&&(e="set "+e),(!ef(t,"name")||Hq&&t.name!==e)&&(uE?mf(t,"name",{value:e,configurable:!0}):t.name=e),Jq&&r&&ef(r,"arity")&&t.length!==r.arity&&mf(t,"length",{value:r.arity});try{r&&ef(r,"constructor")&&r.constructor?uE&&mf(t,"prototype",{writable:!1}):t.prototype&&(t.prototype=void 0)}catch{}var n=Xq(t);return ef(n,"source")||(n.source=Yq(Qq,typeof e=="string"?e:"")),t};Function.prototype.toString=Zq(function(){return Fq(this)&&jq(this).source||Wq(this)},"toString");var eY=d1.exports,tY=Zr,rY=ql,nY=eY,iY=z0,T1=function(t,e,r,n){n||(n={});var i=n.enumerable,s=n.name!==void 0?n.name:e;if(tY(r)&&nY(r,s,n),n.global)i?t[e]=r:iY(e,r);else{try{n.unsafe?t[e]&&(i=!0):delete t[e]}catch{}i?t[e]=r:rY.f(t,e,{value:r,enumerable:!1,configurable:!n.nonConfigurable,writable:!n.nonWritable})}return t},v1={},sY=Math.ceil,aY=Math.floor,oY=Math.trunc||function(e){var r=+e;return(r>0?aY:sY)(r)},lY=oY,Gc=function(t){var e=+t;return e!==e||e===0?0:lY(e)},uY=Gc,fY=Math.max,cY=Math.min,pY=function(t,e){var r=uY(t);return r<0?fY(r+e,0):cY(r,e)},dY=Gc,hY=Math.min,b1=function(t){var e=dY(t);return e>0?hY(e,9007199254740991):0},EY=b1,mY=function(t){return EY(t.length)},gY=kc,_Y=pY,TY=mY,vY=function(t){return function(e,r,n){var i=gY(e),s=TY(i);if(s===0)return!t&&-1;var o=_Y(n,s),f;if(t&&r!==r){for(;s>o;)if(f=i[o++],f!==f)return!0}else for(;s>o;o++)if((t||o in i)&&i[o]===r)return t||o||0;return!t&&-1}},bY={indexOf:vY(!1)},xY=Fr,sh=Cs,RY=kc,SY=bY.indexOf,yY=Q0,ax=xY([].push),x1=function(t,e){var r=RY(t),n=0,i=[],s;for(s in r)!sh(yY,s)&&sh(r,s)&&ax(i,s);for(;e.length>n;)sh(r,s=e[n++])&&(~SY(i,s)||ax(i,s));return i},em=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"],AY=x1,LY=em,CY=LY.concat("length","prototype");v1.f=Object.getOwnPropertyNames||function(e){return AY(e,CY)};var R1={};R1.f=Object.getOwnPropertySymbols;var wY=X0,OY=Fr,IY=v1,NY=R1,PY=pa,UY=OY([].concat),DY=wY("Reflect","ownKeys")||function(e){var r=IY.f(PY(e)),n=NY.f;return n?UY(r,n(e)):r},ox=Cs,BY=DY,MY=H0,$Y=ql,KY=function(t,e,r){for(var n=BY(e),i=$Y.f,s=MY.f,o=0;o<n.length;o++){var f=n[o];!ox(t,f)&&!(r&&ox(r,f))&&i(t,f,s(e,f))}},kY=hn,GY=Zr,VY=/#|\.prototype\./,Yl=function(t,e){var r=HY[FY(t)];return r===XY?!0:r===WY?!1:GY(e)?kY(e):!!e},FY=Yl.normalize=function(t){return String(t).replace(VY,".").toLowerCase()},HY=Yl.data={},WY=Yl.NATIVE="N",XY=Yl.POLYFILL="P",jY=Yl,tf=Qr,zY=H0.f,qY=J0,YY=T1,JY=z0,QY=KY,ZY=jY,S1=function(t,e){var r=t.target,n=t.global,i=t.stat,s,o,f,c,d,p;if(n?o=tf:i?o=tf[r]||JY(r,{}):o=tf[r]&&tf[r].prototype,o)for(f in e){if(d=e[f],t.dontCallGetSet?(p=zY(o,f),c=p&&p.value):c=o[f],s=ZY(n?f:r+(i?".":"#")+f,t.forced),!s&&c!==void 0){if(typeof d==typeof c)continue;QY(d,c)}(t.sham||c&&c.sham)&&qY(d,"sham",!0),YY(o,f,d,t)}},eJ=zl,tJ=$c,rJ=ca,nJ=rJ("match"),iJ=function(t){var e;return eJ(t)&&((e=t[nJ])!==void 0?!!e:tJ(t)==="RegExp")},sJ=ca,aJ=sJ("toStringTag"),y1={};y1[aJ]="z";var oJ=String(y1)==="[object z]",lJ=oJ,uJ=Zr,gf=$c,fJ=ca,cJ=fJ("toStringTag"),pJ=Object,dJ=gf(function(){return arguments}())==="Arguments",hJ=function(t,e){try{return t[e]}catch{}},EJ=lJ?gf:function(t){var e,r,n;return t===void 0?"Undefined":t===null?"Null":typeof(r=hJ(e=pJ(t),cJ))=="string"?r:dJ?gf(e):(n=gf(e))==="Object"&&uJ(e.callee)?"Arguments":n},mJ=EJ,gJ=String,Vc=function(t){if(mJ(t)==="Symbol")throw new TypeError("Cannot convert a Symbol value to a string");return gJ(t)},_J=pa,A1=function(){var t=_J(this),e="";return t.hasIndices&&(e+="d"),t.global&&(e+="g"),t.ignoreCase&&(e+="i"),t.multiline&&(e+="m"),t.dotAll&&(e+="s"),t.unicode&&(e+="u"),t.unicodeSets&&(e+="v"),t.sticky&&(e+="y"),e},TJ=ki,vJ=Cs,bJ=t1,xJ=A1,lx=RegExp.prototype,RJ=function(t){var e=t.flags;return e===void 0&&!("flags"in lx)&&!vJ(t,"flags")&&bJ(lx,t)?TJ(xJ,t):e},tm=Fr,SJ=o1,yJ=Math.floor,ah=tm("".charAt),AJ=tm("".replace),oh=tm("".slice),LJ=/\$([$&'`]|\d{1,2}|<[^>]*>)/g,CJ=/\$([$&'`]|\d{1,2})/g,L1=function(t,e,r,n,i,s){var o=r+t.length,f=n.length,c=CJ;return i!==void 0&&(i=SJ(i),c=LJ),AJ(s,c,function(d,p){var E;switch(ah(p,0)){case"$":return"$";case"&":return t;case"`":return oh(e,0,r);case"'":return oh(e,o);case"<":E=i[oh(p,1,-1)];break;default:var m=+p;if(m===0)return d;if(m>f){var g=yJ(m/10);return g===0?d:g<=f?n[g-1]===void 0?ah(p,1):n[g-1]+ah(p,1):d}E=n[m-1]}return E===void 0?"":E})},wJ=S1,OJ=ki,rm=Fr,ux=jl,IJ=Zr,NJ=Kc,PJ=iJ,rl=Vc,UJ=j0,DJ=RJ,BJ=L1,MJ=ca,$J=MJ("replace"),KJ=TypeError,lh=rm("".indexOf);rm("".replace);var fx=rm("".slice),kJ=Math.max;wJ({target:"String",proto:!0},{replaceAll:function(e,r){var n=ux(this),i,s,o,f,c,d,p,E,m,g=0,_=0,b="";if(!NJ(e)){if(i=PJ(e),i&&(s=rl(ux(DJ(e))),!~lh(s,"g")))throw new KJ("`.replaceAll` does not allow non-global regexes");if(o=UJ(e,$J),o)return OJ(o,e,n,r)}for(f=rl(n),c=rl(e),d=IJ(r),d||(r=rl(r)),p=c.length,E=kJ(1,p),g=lh(f,c);g!==-1;)m=d?rl(r(c,g,f)):BJ(c,f,g,[],void 0,r),b+=fx(f,_,g)+m,_=g+p,g=g+E>f.length?-1:lh(f,c,g+E);return _<f.length&&(b+=fx(f,_)),b}});var nm=hn,GJ=Qr,im=GJ.RegExp,C1=nm(function(){var t=im("a","y");return t.lastIndex=2,t.exec("abcd")!==null});C1||nm(function(){return!im("a","y").sticky});var VJ=C1||nm(function(){var t=im("^r","gy");return t.lastIndex=2,t.exec("str")!==null}),FJ={BROKEN_CARET:VJ},w1={},HJ=x1,WJ=em,XJ=Object.keys||function(e){return HJ(e,WJ)},jJ=Ls,zJ=p1,qJ=ql,YJ=pa,JJ=kc,QJ=XJ;w1.f=jJ&&!zJ?Object.defineProperties:function(e,r){YJ(e);for(var n=JJ(r),i=QJ(r),s=i.length,o=0,f;s>o;)qJ.f(e,f=i[o++],n[f]);return e};var ZJ=X0,eQ=ZJ("document","documentElement"),tQ=pa,rQ=w1,cx=em,nQ=Q0,iQ=eQ,sQ=f1,aQ=E1,px=">",dx="<",fE="prototype",cE="script",O1=aQ("IE_PROTO"),uh=function(){},I1=function(t){return dx+cE+px+t+dx+"/"+cE+px},hx=function(t){t.write(I1("")),t.close();var e=t.parentWindow.Object;return t=null,e},oQ=function(){var t=sQ("iframe"),e="java"+cE+":",r;return t.style.display="none",iQ.appendChild(t),t.src=String(e),r=t.contentWindow.document,r.open(),r.write(I1("document.F=Object")),r.close(),r.F},rf,_f=function(){try{rf=new ActiveXObject("htmlfile")}catch{}_f=typeof document<"u"?document.domain&&rf?hx(rf):oQ():hx(rf);for(var t=cx.length;t--;)delete _f[fE][cx[t]];return _f()};nQ[O1]=!0;var lQ=Object.create||function(e,r){var n;return e!==null?(uh[fE]=tQ(e),n=new uh,uh[fE]=null,n[O1]=e):n=_f(),r===void 0?n:rQ.f(n,r)},uQ=hn,fQ=Qr,cQ=fQ.RegExp,pQ=uQ(function(){var t=cQ(".","s");return!(t.dotAll&&t.test(`
-`)&&t.flags==="s")}),dQ=hn,hQ=Qr,EQ=hQ.RegExp,mQ=dQ(function(){var t=EQ("(?<a>b)","g");return t.exec("b").groups.a!=="b"||"b".replace(t,"$<a>c")!=="bc"}),Fa=ki,Fc=Fr,gQ=Vc,_Q=A1,TQ=FJ,vQ=Y0,bQ=lQ,xQ=g1.get,RQ=pQ,SQ=mQ,yQ=vQ("native-string-replace",String.prototype.replace),Zf=RegExp.prototype.exec,pE=Zf,AQ=Fc("".charAt),LQ=Fc("".indexOf),CQ=Fc("".replace),fh=Fc("".slice),dE=function(){var t=/a/,e=/b*/g;return Fa(Zf,t,"a"),Fa(Zf,e,"a"),t.lastIndex!==0||e.lastIndex!==0}(),N1=TQ.BROKEN_CARET,hE=/()??/.exec("")[1]!==void 0,wQ=dE||hE||N1||RQ||SQ;wQ&&(pE=function(e){var r=this,n=xQ(r),i=gQ(e),s=n.raw,o,f,c,d,p,E,m;if(s)return s.lastIndex=r.lastIndex,o=Fa(pE,s,i),r.lastIndex=s.lastIndex,o;var g=n.groups,_=N1&&r.sticky,b=Fa(_Q,r),x=r.source,S=0,y=i;if(_&&(b=CQ(b,"y",""),LQ(b,"g")===-1&&(b+="g"),y=fh(i,r.lastIndex),r.lastIndex>0&&(!r.multiline||r.multiline&&AQ(i,r.lastIndex-1)!==`
-`)&&(x="(?: "+x+")",y=" "+y,S++),f=new RegExp("^(?:"+x+")",b)),hE&&(f=new RegExp("^"+x+"$(?!\\s)",b)),dE&&(c=r.lastIndex),d=Fa(Zf,_?f:r,y),_?d?(d.input=fh(d.input,S),d[0]=fh(d[0],S),d.index=r.lastIndex,r.lastIndex+=d[0].length):r.lastIndex=0:dE&&d&&(r.lastIndex=r.global?d.index+d[0].length:c),hE&&d&&d.length>1&&Fa(yQ,d[0],f,function(){for(p=1;p<arguments.length-2;p++)arguments[p]===void 0&&(d[p]=void 0)}),d&&g)for(d.groups=E=bQ(null),p=0;p<g.length;p++)m=g[p],E[m[0]]=d[m[1]];return d});var sm=pE,OQ=S1,Ex=sm;OQ({target:"RegExp",proto:!0,forced:/./.exec!==Ex},{exec:Ex});var IQ=W0,P1=Function.prototype,mx=P1.apply,gx=P1.call,NQ=typeof Reflect=="object"&&Reflect.apply||(IQ?gx.bind(mx):function(){return gx.apply(mx,arguments)}),_x=ki,Tx=T1,PQ=sm,vx=hn,U1=ca,UQ=J0,DQ=U1("species"),ch=RegExp.prototype,BQ=function(t,e,r,n){var i=U1(t),s=!vx(function(){var d={};return d[i]=function(){return 7},""[t](d)!==7}),o=s&&!vx(function(){var d=!1,p=/a/;return t==="split"&&(p={},p.constructor={},p.constructor[DQ]=function(){return p},p.flags="",p[i]=/./[i]),p.exec=function(){return d=!0,null},p[i](""),!d});if(!s||!o||r){var f=/./[i],c=e(i,""[t],function(d,p,E,m,g){var _=p.exec;return _===PQ||_===ch.exec?s&&!g?{done:!0,value:_x(f,p,E,m)}:{done:!0,value:_x(d,E,p,m)}:{done:!1}});Tx(String.prototype,t,c[0]),Tx(ch,i,c[1])}n&&UQ(ch[i],"sham",!0)},am=Fr,MQ=Gc,$Q=Vc,KQ=jl,kQ=am("".charAt),bx=am("".charCodeAt),GQ=am("".slice),VQ=function(t){return function(e,r){var n=$Q(KQ(e)),i=MQ(r),s=n.length,o,f;return i<0||i>=s?t?"":void 0:(o=bx(n,i),o<55296||o>56319||i+1===s||(f=bx(n,i+1))<56320||f>57343?t?kQ(n,i):o:t?GQ(n,i,i+2):(o-55296<<10)+(f-56320)+65536)}},FQ={charAt:VQ(!0)},HQ=FQ.charAt,WQ=function(t,e,r){return e+(r?HQ(t,e).length:1)},xx=ki,XQ=pa,jQ=Zr,zQ=$c,qQ=sm,YQ=TypeError,JQ=function(t,e){var r=t.exec;if(jQ(r)){var n=xx(r,t,e);return n!==null&&XQ(n),n}if(zQ(t)==="RegExp")return xx(qQ,t,e);throw new YQ("RegExp#exec called on incompatible receiver")},QQ=NQ,Rx=ki,Hc=Fr,ZQ=BQ,eZ=hn,tZ=pa,rZ=Zr,nZ=Kc,iZ=Gc,sZ=b1,Na=Vc,aZ=jl,oZ=WQ,lZ=j0,uZ=L1,fZ=JQ,cZ=ca,EE=cZ("replace"),pZ=Math.max,dZ=Math.min,hZ=Hc([].concat),ph=Hc([].push),Sx=Hc("".indexOf),yx=Hc("".slice),EZ=function(t){return t===void 0?t:String(t)},mZ=function(){return"a".replace(/./,"$0")==="$0"}(),Ax=function(){return/./[EE]?/./[EE]("a","$0")==="":!1}(),gZ=!eZ(function(){var t=/./;return t.exec=function(){var e=[];return e.groups={a:"7"},e},"".replace(t,"$<a>")!=="7"});ZQ("replace",function(t,e,r){var n=Ax?"$":"$0";return[function(s,o){var f=aZ(this),c=nZ(s)?void 0:lZ(s,EE);return c?Rx(c,s,f,o):Rx(e,Na(f),s,o)},function(i,s){var o=tZ(this),f=Na(i);if(typeof s=="string"&&Sx(s,n)===-1&&Sx(s,"$<")===-1){var c=r(e,o,f,s);if(c.done)return c.value}var d=rZ(s);d||(s=Na(s));var p=o.global,E;p&&(E=o.unicode,o.lastIndex=0);for(var m=[],g;g=fZ(o,f),!(g===null||(ph(m,g),!p));){var _=Na(g[0]);_===""&&(o.lastIndex=oZ(f,sZ(o.lastIndex),E))}for(var b="",x=0,S=0;S<m.length;S++){g=m[S];for(var y=Na(g[0]),v=pZ(dZ(iZ(g.index),f.length),0),R=[],w,M=1;M<g.length;M++)ph(R,EZ(g[M]));var k=g.groups;if(d){var H=hZ([y],R,v,f);k!==void 0&&ph(H,k),w=Na(QQ(s,void 0,H))}else w=uZ(y,f,v,R,k,s);v>=x&&(b+=yx(f,x,v)+w,x=v+y.length)}return b+yx(f,x)}]},!gZ||!mZ||Ax);var _Z=Qr,TZ=Fr,vZ=function(t,e){return TZ(_Z[t].prototype[e])},bZ=vZ;bZ("String","replaceAll");var yi={},Wc={},D1={},Xc={},om={};(function(t){Object.defineProperty(t,"__esModule",{value:!0}),t.Token=void 0;var e=function(){function r(n,i,s,o){this.type=n,this.content=i,this.attributes=s,this.text=o}return r.prototype.toString=function(){return this.content+" ("+this.type+")"},r.prototype.equals=function(n){return this.type===n.type&&this.content===n.content},r.prototype.convertToTextToken=function(){var n;this.type===r.Type.startTag?(this.content=(n=this.text)!==null&&n!==void 0?n:"",this.type=r.Type.text):this.type===r.Type.endTag&&(this.content="[/"+this.content+"]",this.type=r.Type.text)},r}();t.Token=e,function(r){(function(n){n[n.text=0]="text",n[n.startTag=1]="startTag",n[n.endTag=2]="endTag"})(r.Type||(r.Type={}))}(e=t.Token||(t.Token={})),t.Token=e})(om);Object.defineProperty(Xc,"__esModule",{value:!0});Xc.Tokenizer=void 0;var Qi=om,xZ=function(){function t(e){this.tags=e}return t.prototype.tokenizeString=function(e){var r=this,n=this.getTokens(e),i=[],s=!1,o="",f="";return n.forEach(function(c){var d=r.tags[c.content],p=!0;!d&&!s?c.convertToTextToken():s?c.type===Qi.Token.Type.endTag&&c.content===o?(s=!1,i.push(t.createTextToken(f))):(c.convertToTextToken(),f+=c.content,p=!1):d.noNesting&&c.type===Qi.Token.Type.startTag&&(s=!0,o=c.content,f=""),p&&i.push(c)}),i},t.prototype.getTokens=function(e){for(var r='\\[(/\\w*)\\]|\\[(\\w*)+(=(["])'+t.valueChars+"*\\4)?( ("+t.nameChars+'+)?=(["])('+t.valueChars+"+)\\7)*\\]",n=new RegExp(r,"g"),i=[],s=n.exec(e),o=0;s;){var f=s.index-o;f>0&&i.push(t.createTextToken(e.substr(o,f))),i.push(t.createTagToken(s)),o=n.lastIndex,s=n.exec(e)}var c=e.length-o;return c>0&&i.push(t.createTextToken(e.substr(o,c))),i},t.createTextToken=function(e){return new Qi.Token(Qi.Token.Type.text,e)},t.createTagToken=function(e){if(!e[1]){for(var r=e[2],n={},i=new RegExp("("+t.nameChars+'+)?=(["])('+t.valueChars+"+)\\2","g"),s=e[0].substr(1+r.length,e[0].length-2-r.length),o=i.exec(s);o;)o[1]?n[o[1]]=o[3]:n[r]=o[3],o=i.exec(s);return new Qi.Token(Qi.Token.Type.startTag,r,n,e[0])}return new Qi.Token(Qi.Token.Type.endTag,e[1].substr(1,e[1].length-1))},t.nameChars="[a-zA-Z0-9\\.\\-_:;/]",t.valueChars="[a-zA-Z0-9\\.\\-_:;#/\\s]",t}();Xc.Tokenizer=xZ;(function(t){Object.defineProperty(t,"__esModule",{value:!0}),t.ParseTree=void 0;var e=Xc,r=om,n=function(){function i(s){this.subTrees=[],this.type=s.type,this.content=s.content,s.attributes&&(this.attributes=s.attributes),s.subTrees&&(this.subTrees=s.subTrees)}return Object.defineProperty(i.prototype,"isValid",{get:function(){return this.subTrees.length?this.subTrees.every(function(s){return s.isValid}):!0},enumerable:!1,configurable:!0}),i.prototype.toString=function(){return this.type+" - "+this.content},i.buildTree=function(s,o){var f=new e.Tokenizer(o),c=f.tokenizeString(s),d=new i({type:i.Type.root,content:s});return this.buildTreeFromTokens(d,c.reverse())},i.buildTreeFromTokens=function(s,o,f){if(f===void 0&&(f=""),!s)return null;if(!o.length)return s;var c=o.pop();if(!c)return null;if(c.type===r.Token.Type.text){var d=new i({type:i.Type.text,content:c.content});s.subTrees.push(d)}if(c.type===r.Token.Type.startTag){var p=c.content,d=new i({type:i.Type.tag,content:p,attributes:c.attributes}),E=i.buildTreeFromTokens(d,o,p);if(!E)return null;s.subTrees.push(E)}if(c.type===r.Token.Type.endTag){var p=c.content;return p===f?s:null}return!o.length&&f!==""?null:this.buildTreeFromTokens(s,o,f)},i}();t.ParseTree=n,function(i){(function(s){s[s.root=0]="root",s[s.text=1]="text",s[s.tag=2]="tag"})(i.Type||(i.Type={}))}(n=t.ParseTree||(t.ParseTree={})),t.ParseTree=n})(D1);var Jl={};Object.defineProperty(Jl,"__esModule",{value:!0});Jl.Tag=void 0;var RZ=function(){function t(e){var r;this.tagName=e.tagName,this.insertLineBreaks=e.insertLineBreaks,this.suppressLineBreaks=e.suppressLineBreaks,this.noNesting=e.noNesting,this.markupGenerator=(r=e.markupGenerator)!==null&&r!==void 0?r:function(n,i){return"<"+n.tagName+">"+i+"</"+n.tagName+">"}}return t.create=function(e,r,n){var i,s,o;return n===void 0&&(n={}),new t({tagName:e,insertLineBreaks:(i=n.insertLineBreaks)!==null&&i!==void 0?i:!0,suppressLineBreaks:(s=n.suppressLineBreaks)!==null&&s!==void 0?s:!1,noNesting:(o=n.noNesting)!==null&&o!==void 0?o:!1,markupGenerator:r})},t}();Jl.Tag=RZ;Object.defineProperty(Wc,"__esModule",{value:!0});Wc.BBCodeParser=void 0;var Lx=D1,Cx=Jl,SZ=function(){function t(e,r){this.options=r,this.escapeHTML=!1,this.tags=e,r&&(this.escapeHTML=r.escapeHTML)}return Object.defineProperty(t,"defaultTags",{get:function(){return{b:Cx.Tag.create("b"),i:Cx.Tag.create("i")}},enumerable:!1,configurable:!0}),t.prototype.parse=function(e,r,n,i){r===void 0&&(r=!1),n===void 0&&(n=!0),i===void 0&&(i=!0);var s=Lx.ParseTree.buildTree(e,this.tags);return!s||!s.isValid?e:this.treeToHtml(s.subTrees,n,i,r)},t.prototype.addTag=function(e,r){this.tags[e]=r},t.prototype.treeToHtml=function(e,r,n,i){var s=this;i===void 0&&(i=!1);var o="",f=!1;return e.forEach(function(c){var d;if(c.type===Lx.ParseTree.Type.text){var p=c.content;n&&(p=s.escapeHTML?t.escapeHTML(p):p),r&&!f&&(p=p.replace(/(\r\n|\n|\r)/gm,"<br>"),f=!1),o+=p}else{var E=s.tags[c.content],m=s.treeToHtml(c.subTrees,E.insertLineBreaks,n,i);i?o+=m:o+=E.markupGenerator(E,m,(d=c.attributes)!==null&&d!==void 0?d:{}),f=E.suppressLineBreaks}}),o},t.escapeHTML=function(e){return e.replace(/[&<>]/g,function(r){return t.tagsToReplace[r]||r})},t.tagsToReplace={"&":"&amp;","<":"&lt;",">":"&gt;"},t}();Wc.BBCodeParser=SZ;(function(t){Object.defineProperty(t,"__esModule",{value:!0}),t.Tag=t.BBCodeParser=void 0;var e=Wc;Object.defineProperty(t,"BBCodeParser",{enumerable:!0,get:function(){return e.BBCodeParser}});var r=Jl;Object.defineProperty(t,"Tag",{enumerable:!0,get:function(){return r.Tag}})})(yi);const yZ={install:t=>{const e={section:yi.Tag.create("section",(s,o,{section:f})=>`<div ${f?`class="section ${f}"`:'class="section"'}>${o}</div>`)};["b","bold","B"].forEach(s=>{e[s]=yi.Tag.create(s,(o,f)=>`<strong>${f}</strong>`)}),["i","italic","I"].forEach(s=>{e[s]=yi.Tag.create(s,(o,f)=>`<em>${f}</em>`)}),e.tos=yi.Tag.create("tos",(s,o)=>`<a class="tosLink" href="https://jackboxgames.com/terms-of-service/" target="_blank">${o}</a>`),e.pp=yi.Tag.create("pp",(s,o)=>`<a class="ppLink" href="https://jackboxgames.com/privacy-policy/" target="_blank">${o}</a>`);const i=new yi.BBCodeParser(e);t.directive("bb",{mounted(s,o){const f=document.createElement("div");f.textContent=o.value,s.innerHTML=i.parse(f.innerHTML)},updated(s,o){const f=document.createElement("div");f.textContent=o.value,s.innerHTML=i.parse(f.innerHTML)}}),t.mixin({beforeCreate(){this.$options.bb&&Object.keys(this.$options.bb).forEach(s=>{const o=this.$options.bb[s];if(o instanceof Function){i.addTag(s,yi.Tag.create(s,o));return}i.addTag(s,yi.Tag.create(s,o.generator,o.options))})}}),t.config.globalProperties.$bb=s=>(typeof s!="string"&&console.warn(`[BBCodePlugin] Received unexpected ${typeof s} with value ${s};converting to string before parsing.`),i.parse(String(s)))}};/*!
-* CookieConsent 3.0.1
-* https://github.com/orestbida/cookieconsent
-* Author Orest Bida
-* Released under the MIT License
-*/const B1="opt-in",al="opt-out",lm="show--consent",um="show--preferences",mE="disable--interaction",ec="data-category",bt="div",Bn="button",Mn="aria-hidden",vl="btn-group",Nr="click",ro="data-role",fm="consentModal",cm="preferencesModal";class M1{constructor(){this.t={mode:B1,revision:0,autoShow:!0,lazyHtmlGeneration:!0,autoClearCookies:!0,manageScriptTags:!0,hideFromBots:!0,cookie:{name:"cc_cookie",expiresAfterDays:182,domain:"",path:"/",sameSite:"Lax"}},this.o={i:{},l:"",_:{},u:{},p:{},m:[],v:!1,h:null,C:null,S:null,M:"",D:!0,T:!1,k:!1,A:!1,N:!1,H:[],V:!1,I:!0,L:[],j:!1,F:"",P:!1,O:[],R:[],B:[],G:[],J:!1,U:!1,$:!1,q:[],K:[],W:[],X:{},Y:{},Z:{},ee:{},te:{},oe:[]},this.ne={ae:{},se:{}},this.ce={},this.re={ie:"cc:onFirstConsent",le:"cc:onConsent",de:"cc:onChange",fe:"cc:onModalShow",_e:"cc:onModalHide",ue:"cc:onModalReady"}}}const de=new M1,$1=(t,e)=>t.indexOf(e),St=(t,e)=>$1(t,e)!==-1,Po=t=>Array.isArray(t),Mi=t=>typeof t=="string",tc=t=>!!t&&typeof t=="object"&&!Po(t),ti=t=>typeof t=="function",si=t=>Object.keys(t),pm=t=>Array.from(new Set(t)),rc=()=>document.activeElement,Ha=t=>t.preventDefault(),dm=(t,e)=>t.querySelectorAll(e),nf=t=>t.dispatchEvent(new Event("change")),Me=t=>{const e=document.createElement(t);return t===Bn&&(e.type=t),e},Qe=(t,e,r)=>t.setAttribute(e,r),dh=(t,e,r)=>{t.removeAttribute(r?"data-"+e:e)},Tf=(t,e,r)=>t.getAttribute(r?"data-"+e:e),De=(t,e)=>t.appendChild(e),$t=(t,e)=>t.classList.add(e),$r=(t,e)=>$t(t,"cm__"+e),Tt=(t,e)=>$t(t,"pm__"+e),ds=(t,e)=>t.classList.remove(e),Ii=t=>{if(typeof t!="object")return t;if(t instanceof Date)return new Date(t.getTime());let e=Array.isArray(t)?[]:{};for(let r in t){let n=t[r];e[r]=Ii(n)}return e},AZ=()=>{const t={},{O:e,X:r,Y:n}=de.o;for(const i of e)t[i]=vf(n[i],si(r[i]));return t},wx=(t,e)=>dispatchEvent(new CustomEvent(t,{detail:e})),Qt=(t,e,r,n)=>{t.addEventListener(e,r),n&&de.o.m.push({pe:t,me:e,ge:r})},Ox=()=>{const t=de.t.cookie.expiresAfterDays;return ti(t)?t(de.o.F):t},vf=(t,e)=>{const r=t||[],n=e||[];return r.filter(i=>!St(n,i)).concat(n.filter(i=>!St(r,i)))},K1=t=>{de.o.R=pm(t),de.o.F=(()=>{let e="custom";const{R:r,O:n,B:i}=de.o,s=r.length;return s===n.length?e="all":s===i.length&&(e="necessary"),e})()},k1=(t,e,r,n)=>{const i="accept-",{show:s,showPreferences:o,hide:f,hidePreferences:c,acceptCategory:d}=e,p=t||document,E=v=>dm(p,`[data-cc="${v}"]`),m=(v,R)=>{Ha(v),d(R),c(),f()},g=E("show-preferencesModal"),_=E("show-consentModal"),b=E(i+"all"),x=E(i+"necessary"),S=E(i+"custom"),y=de.t.lazyHtmlGeneration;for(const v of g)Qe(v,"aria-haspopup","dialog"),Qt(v,Nr,R=>{Ha(R),o()}),y&&(Qt(v,"mouseenter",R=>{Ha(R),de.o.N||r(e,n)},!0),Qt(v,"focus",()=>{de.o.N||r(e,n)}));for(let v of _)Qe(v,"aria-haspopup","dialog"),Qt(v,Nr,R=>{Ha(R),s(!0)},!0);for(let v of b)Qt(v,Nr,R=>{m(R,"all")},!0);for(let v of S)Qt(v,Nr,R=>{m(R)},!0);for(let v of x)Qt(v,Nr,R=>{m(R,[])},!0)},ai=(t,e)=>{t&&(e&&(t.tabIndex=-1),t.focus(),e&&t.removeAttribute("tabindex"))},G1=(t,e)=>{const r=n=>{n.target.removeEventListener("transitionend",r),n.propertyName==="opacity"&&getComputedStyle(t).opacity==="1"&&ai((i=>i===1?de.ne.be:de.ne.ve)(e))};Qt(t,"transitionend",r)};let Ix;const V1=t=>{clearTimeout(Ix),t?$t(de.ne.ye,mE):Ix=setTimeout(()=>{ds(de.ne.ye,mE)},500)},LZ=["M 19.5 4.5 L 4.5 19.5 M 4.5 4.501 L 19.5 19.5","M 3.572 13.406 L 8.281 18.115 L 20.428 5.885","M 21.999 6.94 L 11.639 17.18 L 2.001 6.82 "],Pl=(t=0,e=1.5)=>`<svg viewBox="0 0 24 24" stroke-width="${e}"><path d="${LZ[t]}"/></svg>`,F1=t=>{const e=de.ne,r=de.o;(n=>{const i=n===e.he,s=r.i.disablePageInteraction?e.ye:i?e.Ce:e.ye;Qt(s,"keydown",o=>{if(o.key!=="Tab"||!(i?r.k&&!r.A:r.A))return;const f=rc(),c=i?r.q:r.K;c.length!==0&&(o.shiftKey?f!==c[0]&&n.contains(f)||(Ha(o),ai(c[1])):f!==c[1]&&n.contains(f)||(Ha(o),ai(c[0])))},!0)})(t)},CZ=["[href]",Bn,"input","details","[tabindex]"].map(t=>t+':not([tabindex="-1"])').join(","),H1=t=>{const{o:e,ne:r}=de,n=(i,s)=>{const o=dm(i,CZ);s[0]=o[0],s[1]=o[o.length-1]};t===1&&e.T&&n(r.he,e.q),t===2&&e.N&&n(r.we,e.K)},oi=(t,e,r)=>{const{de:n,le:i,ie:s,_e:o,ue:f,fe:c}=de.ce,d=de.re;if(e){const E={modalName:e};return t===d.fe?ti(c)&&c(E):t===d._e?ti(o)&&o(E):(E.modal=r,ti(f)&&f(E)),wx(t,E)}const p={cookie:de.o.p};t===d.ie?ti(s)&&s(Ii(p)):t===d.le?ti(i)&&i(Ii(p)):(p.changedCategories=de.o.L,p.changedServices=de.o.ee,ti(n)&&n(Ii(p))),wx(t,Ii(p))},Ul=(t,e)=>{try{return t()}catch(r){return!e&&console.warn("CookieConsent:",r),!1}},gE=t=>{const{Y:e,ee:r,O:n,X:i,oe:s,p:o,L:f}=de.o;for(const E of n){const m=r[E]||e[E]||[];for(const g of m){const _=i[E][g];if(!_)continue;const{onAccept:b,onReject:x}=_;!_.Se&&St(e[E],g)?(_.Se=!0,ti(b)&&b()):_.Se&&!St(e[E],g)&&(_.Se=!1,ti(x)&&x())}}if(!de.t.manageScriptTags)return;const c=s,d=t||o.categories||[],p=(E,m)=>{if(m>=E.length)return;const g=s[m];if(g.xe)return p(E,m+1);const _=g.Me,b=g.De,x=g.Te,S=St(d,b),y=!!x&&St(e[b],x);if(!x&&!g.ke&&S||!x&&g.ke&&!S&&St(f,b)||x&&!g.ke&&y||x&&g.ke&&!y&&St(r[b]||[],x)){g.xe=!0;const v=Tf(_,"type",!0);dh(_,"type",!!v),dh(_,ec);let R=Tf(_,"src",!0);R&&dh(_,"src",!0);const w=Me("script");w.textContent=_.innerHTML;for(const{nodeName:k}of _.attributes)Qe(w,k,_[k]||Tf(_,k));v&&(w.type=v),R?w.src=R:R=_.src;const M=!!R&&(!v||["text/javascript","module"].includes(v));if(M&&(w.onload=w.onerror=()=>{p(E,++m)}),_.replaceWith(w),M)return}p(E,++m)};p(c,0)},bf="bottom",_E="left",W1="center",hm="right",hh="inline",X1="wide",j1="pm--",Eh=["middle","top",bf],Nx=[_E,W1,hm],wZ={box:{Ee:[X1,hh],Ae:Eh,Ne:Nx,He:bf,Ve:hm},cloud:{Ee:[hh],Ae:Eh,Ne:Nx,He:bf,Ve:W1},bar:{Ee:[hh],Ae:Eh.slice(1),Ne:[],He:bf,Ve:""}},OZ={box:{Ee:[],Ae:[],Ne:[],He:"",Ve:""},bar:{Ee:[X1],Ae:[],Ne:[_E,hm],He:"",Ve:_E}},z1=t=>{const e=de.o.i.guiOptions,r=e&&e.consentModal,n=e&&e.preferencesModal;t===0&&Px(de.ne.he,wZ,r,"cm--","box","cm"),t===1&&Px(de.ne.we,OZ,n,j1,"box","pm")},Px=(t,e,r,n,i,s)=>{t.className=s;const o=r&&r.layout,f=r&&r.position,c=r&&r.flipButtons,d=!r||r.equalWeightButtons!==!1,p=o&&o.split(" ")||[],E=p[0],m=p[1],g=E in e?E:i,_=e[g],b=St(_.Ee,m)&&m,x=f&&f.split(" ")||[],S=x[0],y=n===j1?x[0]:x[1],v=St(_.Ae,S)?S:_.He,R=St(_.Ne,y)?y:_.Ve,w=k=>{k&&$t(t,n+k)};w(g),w(b),w(v),w(R),c&&w("flip");const M=s+"__btn--secondary";if(s==="cm"){const{Ie:k,Le:H}=de.ne;k&&(d?ds(k,M):$t(k,M)),H&&(d?ds(H,M):$t(H,M))}else{const{je:k}=de.ne;k&&(d?ds(k,M):$t(k,M))}},To=(t,e)=>{const r=de.o,n=de.ne,{hide:i,hidePreferences:s,acceptCategory:o}=t,f=R=>{o(R),s(),i()},c=r.u&&r.u.preferencesModal;if(!c)return;const d=c.title,p=c.closeIconLabel,E=c.acceptAllBtn,m=c.acceptNecessaryBtn,g=c.savePreferencesBtn,_=c.sections||[],b=E||m||g;if(n.Fe)n.Pe=Me(bt),Tt(n.Pe,"body");else{n.Fe=Me(bt),$t(n.Fe,"pm-wrapper");const R=Me("div");$t(R,"pm-overlay"),De(n.Fe,R),Qt(R,Nr,s),n.we=Me(bt),$t(n.we,"pm"),Qe(n.we,"role","dialog"),Qe(n.we,Mn,!0),Qe(n.we,"aria-modal",!0),Qe(n.we,"aria-labelledby","pm__title"),Qt(n.ye,"keydown",w=>{w.keyCode===27&&s()},!0),n.Oe=Me(bt),Tt(n.Oe,"header"),n.Re=Me("h2"),Tt(n.Re,"title"),n.Re.id="pm__title",n.Be=Me(Bn),Tt(n.Be,"close-btn"),Qe(n.Be,"aria-label",c.closeIconLabel||""),Qt(n.Be,Nr,s),n.Ge=Me("span"),n.Ge.innerHTML=Pl(),De(n.Be,n.Ge),n.Je=Me(bt),Tt(n.Je,"body"),n.Ue=Me(bt),Tt(n.Ue,"footer");var x=Me(bt);$t(x,"btns");var S=Me(bt),y=Me(bt);Tt(S,vl),Tt(y,vl),De(n.Ue,S),De(n.Ue,y),De(n.Oe,n.Re),De(n.Oe,n.Be),n.ve=Me(bt),Qe(n.ve,"tabIndex",-1),De(n.we,n.ve),De(n.we,n.Oe),De(n.we,n.Je),b&&De(n.we,n.Ue),De(n.Fe,n.we)}let v;d&&(n.Re.innerHTML=d,p&&Qe(n.Be,"aria-label",p)),_.forEach((R,w)=>{const M=R.title,k=R.description,H=R.linkedCategory,O=H&&r.P[H],z=R.cookieTable,ie=z&&z.body,G=z&&z.caption,X=ie&&ie.length>0,ee=!!O,B=ee&&r.X[H],Q=tc(B)&&si(B)||[],W=ee&&(!!k||!!X||si(B).length>0);var j=Me(bt);if(Tt(j,"section"),W||k){var ue=Me(bt);Tt(ue,"section-desc-wrapper")}let ve=Q.length;if(W&&ve>0){const $e=Me(bt);Tt($e,"section-services");for(const nt of Q){const Fe=B[nt],ot=Fe&&Fe.label||nt,et=Me(bt),xt=Me(bt),zt=Me(bt),V=Me(bt);Tt(et,"service"),Tt(V,"service-title"),Tt(xt,"service-header"),Tt(zt,"service-icon");const P=Ux(ot,nt,O,!0,H);V.innerHTML=ot,De(xt,zt),De(xt,V),De(et,xt),De(et,P),De($e,et)}De(ue,$e)}if(M){var ae=Me(bt),he=Me(ee?Bn:bt);if(Tt(ae,"section-title-wrapper"),Tt(he,"section-title"),he.innerHTML=M,De(ae,he),ee){const $e=Me("span");$e.innerHTML=Pl(2,3.5),Tt($e,"section-arrow"),De(ae,$e),j.className+="--toggle";const nt=Ux(M,H,O);let Fe=c.serviceCounterLabel;if(ve>0&&Mi(Fe)){let ot=Me("span");Tt(ot,"badge"),Tt(ot,"service-counter"),Qe(ot,Mn,!0),Qe(ot,"data-servicecounter",ve),Fe&&(Fe=Fe.split("|"),Fe=Fe.length>1&&ve>1?Fe[1]:Fe[0],Qe(ot,"data-counterlabel",Fe)),ot.innerHTML=ve+(Fe?" "+Fe:""),De(he,ot)}if(W){Tt(j,"section--expandable");var Se=H+"-desc";Qe(he,"aria-expanded",!1),Qe(he,"aria-controls",Se)}De(ae,nt)}else Qe(he,"role","heading"),Qe(he,"aria-level","3");De(j,ae)}if(k){var He=Me("p");Tt(He,"section-desc"),He.innerHTML=k,De(ue,He)}if(W&&(Qe(ue,Mn,"true"),ue.id=Se,(($e,nt,Fe)=>{Qt(he,Nr,()=>{nt.classList.contains("is-expanded")?(ds(nt,"is-expanded"),Qe(Fe,"aria-expanded","false"),Qe($e,Mn,"true")):($t(nt,"is-expanded"),Qe(Fe,"aria-expanded","true"),Qe($e,Mn,"false"))})})(ue,j,he),X)){const $e=Me("table"),nt=Me("thead"),Fe=Me("tbody");if(G){const P=Me("caption");Tt(P,"table-caption"),P.innerHTML=G,$e.appendChild(P)}Tt($e,"section-table"),Tt(nt,"table-head"),Tt(Fe,"table-body");const ot=z.headers,et=si(ot),xt=n.$e.createDocumentFragment(),zt=Me("tr");for(const P of et){const re=ot[P],me=Me("th");me.id="cc__row-"+re+w,Qe(me,"scope","col"),Tt(me,"table-th"),me.innerHTML=re,De(xt,me)}De(zt,xt),De(nt,zt);const V=n.$e.createDocumentFragment();for(const P of ie){const re=Me("tr");Tt(re,"table-tr");for(const me of et){const pe=ot[me],be=P[me],xe=Me("td"),N=Me(bt);Tt(xe,"table-td"),Qe(xe,"data-column",pe),Qe(xe,"headers","cc__row-"+pe+w),N.insertAdjacentHTML("beforeend",be),De(xe,N),De(re,xe)}De(V,re)}De(Fe,V),De($e,nt),De($e,Fe),De(ue,$e)}(W||k)&&De(j,ue);const Ie=n.Pe||n.Je;ee?(v||(v=Me(bt),Tt(v,"section-toggles")),v.appendChild(j)):v=null,De(Ie,v||j)}),E&&(n.ze||(n.ze=Me(Bn),Tt(n.ze,"btn"),Qe(n.ze,ro,"all"),De(S,n.ze),Qt(n.ze,Nr,()=>f("all"))),n.ze.innerHTML=E),m&&(n.je||(n.je=Me(Bn),Tt(n.je,"btn"),Qe(n.je,ro,"necessary"),De(S,n.je),Qt(n.je,Nr,()=>f([]))),n.je.innerHTML=m),g&&(n.qe||(n.qe=Me(Bn),Tt(n.qe,"btn"),Tt(n.qe,"btn--secondary"),Qe(n.qe,ro,"save"),De(y,n.qe),Qt(n.qe,Nr,()=>f())),n.qe.innerHTML=g),n.Pe&&(n.we.replaceChild(n.Pe,n.Je),n.Je=n.Pe),z1(1),r.N||(r.N=!0,oi(de.re.ue,cm,n.we),e(t),De(n.Ce,n.Fe),F1(n.we),setTimeout(()=>$t(n.Fe,"cc--anim"),100)),H1(2)};function Ux(t,e,r,n,i){const s=de.o,o=de.ne,f=Me("label"),c=Me("input"),d=Me("span"),p=Me("span"),E=Me("span"),m=Me("span"),g=Me("span");if(m.innerHTML=Pl(1,3),g.innerHTML=Pl(0,3),c.type="checkbox",$t(f,"section__toggle-wrapper"),$t(c,"section__toggle"),$t(m,"toggle__icon-on"),$t(g,"toggle__icon-off"),$t(d,"toggle__icon"),$t(p,"toggle__icon-circle"),$t(E,"toggle__label"),Qe(d,Mn,"true"),n?($t(f,"toggle-service"),Qe(c,ec,i),o.se[i][e]=c):o.ae[e]=c,n?(_=>{Qt(c,"change",()=>{const b=o.se[_],x=o.ae[_];s.Z[_]=[];for(let S in b){const y=b[S];y.checked&&s.Z[_].push(y.value)}x.checked=s.Z[_].length>0})})(i):(_=>{Qt(c,Nr,()=>{const b=o.se[_],x=c.checked;s.Z[_]=[];for(let S in b)b[S].checked=x,x&&s.Z[_].push(S)})})(e),c.value=e,E.textContent=t.replace(/<.*>.*<\/.*>/gm,""),De(p,g),De(p,m),De(d,p),s.D)(r.readOnly||r.enabled)&&(c.checked=!0);else if(n){const _=s.Y[i];c.checked=r.readOnly||St(_,e)}else St(s.R,e)&&(c.checked=!0);return r.readOnly&&(c.disabled=!0),De(f,c),De(f,d),De(f,E),f}const mh=()=>{const t=Me("span");return de.ne.Ke||(de.ne.Ke=t),t},Em=(t,e)=>{const r=de.o,n=de.ne,{hide:i,showPreferences:s,acceptCategory:o}=t,f=r.u&&r.u.consentModal;if(!f)return;const c=f.acceptAllBtn,d=f.acceptNecessaryBtn,p=f.showPreferencesBtn,E=f.closeIconLabel,m=f.footer,g=f.label,_=f.title,b=S=>{i(),o(S)};if(!n.Qe){n.Qe=Me(bt),n.he=Me(bt),n.We=Me(bt),n.Xe=Me(bt),n.Ye=Me(bt),$t(n.Qe,"cm-wrapper"),$t(n.he,"cm"),$r(n.We,"body"),$r(n.Xe,"texts"),$r(n.Ye,"btns"),Qe(n.he,"role","dialog"),Qe(n.he,"aria-modal","true"),Qe(n.he,Mn,"false"),Qe(n.he,"aria-describedby","cm__desc"),g?Qe(n.he,"aria-label",g):_&&Qe(n.he,"aria-labelledby","cm__title");const S="box",y=r.i.guiOptions,v=y&&y.consentModal,R=(v&&v.layout||S).split(" ")[0]===S;_&&E&&R&&(n.Le||(n.Le=Me(Bn),n.Le.innerHTML=Pl(),$r(n.Le,"btn"),$r(n.Le,"btn--close"),Qt(n.Le,Nr,()=>{b([])}),De(n.We,n.Le)),Qe(n.Le,"aria-label",E)),De(n.We,n.Xe),(c||d||p)&&De(n.We,n.Ye),n.be=Me(bt),Qe(n.be,"tabIndex",-1),De(n.he,n.be),De(n.he,n.We),De(n.Qe,n.he)}_&&(n.Ze||(n.Ze=Me("h2"),n.Ze.className=n.Ze.id="cm__title",De(n.Xe,n.Ze)),n.Ze.innerHTML=_);let x=f.description;if(x&&(r.V&&(x=x.replace("{{revisionMessage}}",r.I?"":f.revisionMessage||"")),n.et||(n.et=Me("p"),n.et.className=n.et.id="cm__desc",De(n.Xe,n.et)),n.et.innerHTML=x),c&&(n.tt||(n.tt=Me(Bn),De(n.tt,mh()),$r(n.tt,"btn"),Qe(n.tt,ro,"all"),Qt(n.tt,Nr,()=>{b("all")})),n.tt.firstElementChild.innerHTML=c),d&&(n.Ie||(n.Ie=Me(Bn),De(n.Ie,mh()),$r(n.Ie,"btn"),Qe(n.Ie,ro,"necessary"),Qt(n.Ie,Nr,()=>{b([])})),n.Ie.firstElementChild.innerHTML=d),p&&(n.ot||(n.ot=Me(Bn),De(n.ot,mh()),$r(n.ot,"btn"),$r(n.ot,"btn--secondary"),Qe(n.ot,ro,"show"),Qt(n.ot,"mouseenter",()=>{r.N||To(t,e)}),Qt(n.ot,Nr,s)),n.ot.firstElementChild.innerHTML=p),n.nt||(n.nt=Me(bt),$r(n.nt,vl),c&&De(n.nt,n.tt),d&&De(n.nt,n.Ie),(c||d)&&De(n.We,n.nt),De(n.Ye,n.nt)),n.ot&&!n.st&&(n.st=Me(bt),n.Ie&&n.tt?($r(n.st,vl),De(n.st,n.ot),De(n.Ye,n.st)):(De(n.nt,n.ot),$r(n.nt,vl+"--uneven"))),m){if(!n.ct){let S=Me(bt),y=Me(bt);n.ct=Me(bt),$r(S,"footer"),$r(y,"links"),$r(n.ct,"link-group"),De(y,n.ct),De(S,y),De(n.he,S)}n.ct.innerHTML=m}z1(0),r.T||(r.T=!0,oi(de.re.ue,fm,n.he),e(t),De(n.Ce,n.Qe),F1(n.he),setTimeout(()=>$t(n.Qe,"cc--anim"),100)),H1(1),k1(n.We,t,To,e)},mm=t=>{if(!Mi(t))return null;if(t in de.o._)return t;let e=t.slice(0,2);return e in de.o._?e:null},gm=()=>de.o.l||de.o.i.language.default,_m=t=>{t&&(de.o.l=t)},q1=async t=>{const e=de.o;let r=mm(t)?t:gm(),n=e._[r];return Mi(n)?n=await(async i=>{try{return await(await fetch(i)).json()}catch(s){return console.error(s),!1}})(n):ti(n)&&(n=await n()),!!n&&(e.u=n,_m(r),!0)},Y1=()=>{let t=de.o.i.language.rtl,e=de.ne.Ce;t&&e&&(Po(t)||(t=[t]),St(t,de.o.l)?$t(e,"cc--rtl"):ds(e,"cc--rtl"))},ea=()=>{const t=de.ne;if(t.Ce)return;t.Ce=Me(bt),t.Ce.id="cc-main",t.Ce.setAttribute("data-nosnippet",""),Y1();let e=de.o.i.root;e&&Mi(e)&&(e=document.querySelector(e)),(e||t.$e.body).appendChild(t.Ce)},J1=t=>Ul(()=>localStorage.removeItem(t)),Dx=(t,e)=>{if(e instanceof RegExp)return t.filter(r=>e.test(r));{const r=$1(t,e);return r>-1?[t[r]]:[]}},Q1=t=>{const{hostname:e,protocol:r}=location,{name:n,path:i,domain:s,sameSite:o,useLocalStorage:f}=de.t.cookie,c=t?(()=>{const m=de.o.S,g=m?new Date-m:0;return 864e5*Ox()-g})():864e5*Ox(),d=new Date;d.setTime(d.getTime()+c),de.o.p.expirationTime=d.getTime();const p=JSON.stringify(de.o.p);let E=n+"="+encodeURIComponent(p)+(c!==0?"; expires="+d.toUTCString():"")+"; Path="+i+"; SameSite="+o;St(e,".")&&(E+="; Domain="+s),r==="https:"&&(E+="; Secure"),f?((m,g)=>{Ul(()=>localStorage.setItem(m,g))})(n,p):document.cookie=E,de.o.p},TE=(t,e,r)=>{if(t.length===0)return;const n=r||de.t.cookie.domain,i=e||de.t.cookie.path,s=n.slice(0,4)==="www.",o=s&&n.substring(4),f=(c,d)=>{document.cookie=c+"=; path="+i+(d?"; domain=."+d:"")+"; expires=Thu, 01 Jan 1970 00:00:01 GMT;"};for(const c of t)f(c),f(c,n),s&&f(c,o)},Z1=t=>{const e=t||de.t.cookie.name,r=de.t.cookie.useLocalStorage;return((i,s)=>{let o;return o=Ul(()=>JSON.parse(s?i:decodeURIComponent(i)),!0)||{},o})(r?(n=e,Ul(()=>localStorage.getItem(n))||""):Tm(e,!0),r);var n},Tm=(t,e)=>{const r=document.cookie.match("(^|;)\\s*"+t+"\\s*=\\s*([^;]+)");return r?e?r.pop():t:""},eL=t=>{const e=document.cookie.split(/;\s*/),r=[];for(const n of e){let i=n.split("=")[0];t?Ul(()=>{t.test(i)&&r.push(i)}):r.push(i)}return r},vm=(t,e=[])=>{((r,n)=>{const{O:i,R:s,B:o,N:f,Z:c,G:d,X:p}=de.o;let E=[];if(r){Po(r)?E.push(...r):Mi(r)&&(E=r==="all"?i:[r]);for(const m of i)c[m]=St(E,m)?si(p[m]):[]}else E=[...s,...d],f&&(E=(()=>{const m=de.ne.ae;if(!m)return[];let g=[];for(let _ in m)m[_].checked&&g.push(_);return g})());E=E.filter(m=>!St(i,m)||!St(n,m)),E.push(...o),K1(E)})(t,e),(r=>{const n=de.o,{Z:i,B:s,Y:o,X:f,O:c}=n,d=c;n.te=Ii(o);for(const p of d){const E=f[p],m=si(E),g=i[p]&&i[p].length>0,_=St(s,p);if(m.length!==0){if(o[p]=[],_)o[p].push(...m);else if(g){const b=i[p];o[p].push(...b)}else o[p]=n.Z[p];o[p]=pm(o[p])}}})(),(()=>{const r=de.o;r.L=de.t.mode===al&&r.D?vf(r.G,r.R):vf(r.R,r.p.categories);let n=r.L.length>0,i=!1;for(const c of r.O)r.ee[c]=vf(r.Y[c],r.te[c]),r.ee[c].length>0&&(i=!0);const s=de.ne.ae;for(const c in s)s[c].checked=St(r.R,c);for(const c of r.O){const d=de.ne.se[c],p=r.Y[c];for(const E in d)d[E].checked=St(p,E)}r.C||(r.C=new Date),r.M||(r.M=("10000000-1000-4000-8000"+-1e11).replace(/[018]/g,c=>(c^crypto.getRandomValues(new Uint8Array(1))[0]&15>>c/4).toString(16))),r.p={categories:Ii(r.R),revision:de.t.revision,data:r.h,consentTimestamp:r.C.toISOString(),consentId:r.M,services:Ii(r.Y)};let o=!1;const f=n||i;(r.D||f)&&(r.D&&(r.D=!1,o=!0),r.S=r.S?new Date:r.C,r.p.lastConsentTimestamp=r.S.toISOString(),Q1(),de.t.autoClearCookies&&(o||f)&&(c=>{const d=de.o,p=eL(),E=(m=>{const g=de.o;return(m?g.O:g.L).filter(_=>{const b=g.P[_];return!!b&&!b.readOnly&&!!b.autoClear})})(c);for(const m in d.ee)for(const g of d.ee[m]){const _=d.X[m][g].cookies;if(!St(d.Y[m],g)&&_)for(const b of _){const x=Dx(p,b.name);TE(x,b.path,b.domain)}}for(const m of E){const g=d.P[m].autoClear,_=g&&g.cookies||[],b=St(d.L,m),x=!St(d.R,m),S=b&&x;if(c?x:S){g.reloadPage&&S&&(d.j=!0);for(const y of _){const v=Dx(p,y.name);TE(v,y.path,y.domain)}}}})(o),gE()),o&&(oi(de.re.ie),oi(de.re.le),de.t.mode===B1)||(f&&oi(de.re.de),r.j&&(r.j=!1,location.reload()))})()},tL=t=>{const e=de.o.D?[]:de.o.R;return St(e,t)},IZ=(t,e)=>{const{O:r,X:n}=de.o;if(!(t&&e&&Mi(e)&&St(r,e)&&si(n[e]).length!==0))return!1;((i,s)=>{const o=de.o,{X:f,Z:c,N:d}=o,p=de.ne.se[s]||{},E=de.ne.ae[s]||{},m=si(f[s]);if(c[s]=[],Mi(i)){if(i==="all"){if(c[s].push(...m),d)for(let _ in p)p[_].checked=!0,nf(p[_])}else if(St(m,i)&&c[s].push(i),d)for(let _ in p)p[_].checked=i===_,nf(p[_])}else if(Po(i))for(let _ of m){const b=St(i,_);b&&c[s].push(_),d&&(p[_].checked=b,nf(p[_]))}const g=c[s].length===0;o.R=g?o.R.filter(_=>_!==s):pm([...o.R,s]),d&&(E.checked=!g,nf(E))})(t,e),vm()},rL=(t,e)=>{const r=de.o.D?[]:de.o.Y[e]||[];return St(r,t)},NZ=t=>Tm(t,!0)!=="",nL=(t,e,r)=>{let n=[];const i=s=>{if(Mi(s)){let o=Tm(s);o!==""&&n.push(o)}else n.push(...eL(s))};if(Po(t))for(let s of t)i(s);else i(t);TE(n,e,r)},bm=t=>{const{ne:e,o:r}=de;if(!r.k){if(!r.T){if(!t)return;Em(Dl,ea)}r.k=!0,r.U=rc(),r.v&&V1(!0),G1(e.he,1),$t(e.ye,lm),Qe(e.he,Mn,"false"),setTimeout(()=>{ai(de.ne.be)},100),oi(de.re.fe,fm)}},iL=()=>{const{ne:t,o:e,re:r}=de;e.k&&(e.k=!1,e.v&&V1(),ai(t.Ke,!0),ds(t.ye,lm),Qe(t.he,Mn,"true"),ai(e.U),e.U=null,oi(r._e,fm))},sL=()=>{const t=de.o;t.A||(t.N||To(Dl,ea),t.A=!0,t.k?t.$=rc():t.U=rc(),G1(de.ne.we,2),$t(de.ne.ye,um),Qe(de.ne.we,Mn,"false"),setTimeout(()=>{ai(de.ne.ve)},100),oi(de.re.fe,cm))},aL=()=>{const t=de.o;t.A&&(t.A=!1,(()=>{const e=xm(),r=de.o.P,n=de.ne.ae,i=de.ne.se,s=o=>St(de.o.G,o);for(const o in n){const f=!!r[o].readOnly;n[o].checked=f||(e?tL(o):s(o));for(const c in i[o])i[o][c].checked=f||(e?rL(c,o):s(o))}})(),ai(de.ne.Ge,!0),ds(de.ne.ye,um),Qe(de.ne.we,Mn,"true"),t.k?(ai(t.$),t.$=null):(ai(t.U),t.U=null),oi(de.re._e,cm))};var Dl={show:bm,hide:iL,showPreferences:sL,hidePreferences:aL,acceptCategory:vm};const PZ=async(t,e)=>{if(!mm(t))return!1;const r=de.o;return!(t===gm()&&e!==!0||!await q1(t)||(_m(t),r.T&&Em(Dl,ea),r.N&&To(Dl,ea),Y1(),0))},UZ=()=>{const{F:t,Y:e}=de.o,{accepted:r,rejected:n}=(()=>{const{D:i,R:s,O:o}=de.o;return{accepted:s,rejected:i?[]:o.filter(f=>!St(s,f))}})();return Ii({acceptType:t,acceptedCategories:r,rejectedCategories:n,acceptedServices:e,rejectedServices:AZ()})},DZ=(t,e)=>{let r=document.querySelector('script[src="'+t+'"]');return new Promise(n=>{if(r)return n(!0);if(r=Me("script"),tc(e))for(const i in e)Qe(r,i,e[i]);r.onload=()=>n(!0),r.onerror=()=>{r.remove(),n(!1)},r.src=t,De(document.head,r)})},BZ=t=>{let e,r=t.value,n=t.mode,i=!1;const s=de.o;if(n==="update"){s.h=e=oL("data");const o=typeof e==typeof r;if(o&&typeof e=="object"){!e&&(e={});for(let f in r)e[f]!==r[f]&&(e[f]=r[f],i=!0)}else!o&&e||e===r||(e=r,i=!0)}else e=r,i=!0;return i&&(s.h=e,s.p.data=e,Q1(!0)),i},oL=(t,e)=>{const r=Z1(e);return t?r[t]:r},MZ=t=>{const e=de.t,r=de.o.i;return t?e[t]||r[t]:{...e,...r,cookie:{...e.cookie}}},xm=()=>!de.o.D,$Z=async t=>{const{o:e,t:r,re:n}=de,i=window;if(!i._ccRun){if(i._ccRun=!0,(f=>{const{ne:c,t:d,o:p}=de,E=d,m=p,{cookie:g}=E,_=de.ce,b=f.cookie,x=f.categories,S=si(x)||[],y=navigator,v=document;c.$e=v,c.ye=v.documentElement,g.domain=location.hostname,m.i=f,m.P=x,m.O=S,m._=f.language.translations,m.v=!!f.disablePageInteraction,_.ie=f.onFirstConsent,_.le=f.onConsent,_.de=f.onChange,_._e=f.onModalHide,_.fe=f.onModalShow,_.ue=f.onModalReady;const{mode:R,autoShow:w,lazyHtmlGeneration:M,autoClearCookies:k,revision:H,manageScriptTags:O,hideFromBots:z}=f;R===al&&(E.mode=R),typeof k=="boolean"&&(E.autoClearCookies=k),typeof O=="boolean"&&(E.manageScriptTags=O),typeof H=="number"&&H>=0&&(E.revision=H,m.V=!0),typeof w=="boolean"&&(E.autoShow=w),typeof M=="boolean"&&(E.lazyHtmlGeneration=M),z===!1&&(E.hideFromBots=!1),E.hideFromBots===!0&&y&&(m.J=y.userAgent&&/bot|crawl|spider|slurp|teoma/i.test(y.userAgent)||y.webdriver),tc(b)&&(E.cookie={...g,...b}),E.autoClearCookies,m.V,E.manageScriptTags,(ie=>{const{P:G,X,Y:ee,Z:B,B:Q}=de.o;for(let W of ie){const j=G[W],ue=j.services||{},ve=tc(ue)&&si(ue)||[];X[W]={},ee[W]=[],B[W]=[],j.readOnly&&(Q.push(W),ee[W]=ve),de.ne.se[W]={};for(let ae of ve){const he=ue[ae];he.Se=!1,X[W][ae]=he}}})(S),(()=>{if(!de.t.manageScriptTags)return;const ie=de.o,G=dm(document,"script["+ec+"]");for(const X of G){let ee=Tf(X,ec),B=X.dataset.service||"",Q=!1;if(ee&&ee.charAt(0)==="!"&&(ee=ee.slice(1),Q=!0),B.charAt(0)==="!"&&(B=B.slice(1),Q=!0),St(ie.O,ee)&&(ie.oe.push({Me:X,xe:!1,ke:Q,De:ee,Te:B}),B)){const W=ie.X[ee];W[B]||(W[B]={Se:!1})}}})(),_m((()=>{const ie=de.o.i.language.autoDetect;if(ie){const G={browser:navigator.language,document:document.documentElement.lang},X=mm(G[ie]);if(X)return X}return gm()})())})(t),e.J)return;(()=>{const f=de.o,c=de.t,d=Z1(),{categories:p,services:E,consentId:m,consentTimestamp:g,lastConsentTimestamp:_,data:b,revision:x}=d,S=Po(p);f.p=d,f.M=m;const y=!!m&&Mi(m);f.C=g,f.C&&(f.C=new Date(g)),f.S=_,f.S&&(f.S=new Date(_)),f.h=b!==void 0?b:null,f.V&&y&&x!==c.revision&&(f.I=!1),f.D=!(y&&f.I&&f.C&&f.S&&S),c.cookie.useLocalStorage&&!f.D&&(f.D=new Date().getTime()>(d.expirationTime||0),f.D&&J1(c.cookie.name)),f.D,(()=>{const v=de.o;for(const R of v.O){const w=v.P[R];if(w.readOnly||w.enabled){v.G.push(R);const M=v.X[R]||{};for(let k in M)v.Z[R].push(k),v.i.mode===al&&v.Y[R].push(k)}}})(),f.D?c.mode===al&&(f.R=[...f.G]):(f.Z={...f.Y},f.Y={...f.Y,...E},K1([...f.B,...p]))})();const o=xm();if(!await q1())return!1;if(k1(null,s=Dl,To,ea),de.o.D&&Em(s,ea),de.t.lazyHtmlGeneration||To(s,ea),r.autoShow&&!o&&bm(!0),o)return gE(),oi(n.le);r.mode===al&&gE(e.G)}var s},KZ=t=>{const{Ce:e,ye:r}=de.ne,{name:n,path:i,domain:s,useLocalStorage:o}=de.t.cookie;t&&(o?J1(n):nL(n,i,s));for(const{pe:c,me:d,ge:p}of de.o.m)c.removeEventListener(d,p);e&&e.remove(),r&&r.classList.remove(mE,um,lm);const f=new M1;for(const c in de)de[c]=f[c];window._ccRun=!1},kZ=Object.freeze(Object.defineProperty({__proto__:null,acceptCategory:vm,acceptService:IZ,acceptedCategory:tL,acceptedService:rL,eraseCookies:nL,getConfig:MZ,getCookie:oL,getUserPreferences:UZ,hide:iL,hidePreferences:aL,loadScript:DZ,reset:KZ,run:$Z,setCookieData:BZ,setLanguage:PZ,show:bm,showPreferences:sL,validConsent:xm,validCookie:NZ},Symbol.toStringTag,{value:"Module"})),GZ={install:(t,e)=>{t.config.globalProperties.$cc=kZ,t.config.globalProperties.$cc.run(e)}};var VZ=Ty,FZ=VZ(Object.keys,Object),HZ=FZ,WZ=v0,XZ=HZ,jZ=Object.prototype,zZ=jZ.hasOwnProperty;function qZ(t){if(!WZ(t))return XZ(t);var e=[];for(var r in Object(t))zZ.call(t,r)&&r!="constructor"&&e.push(r);return e}var YZ=qZ,JZ=wy,QZ=YZ,ZZ=Uc;function eee(t){return ZZ(t)?JZ(t):QZ(t)}var tee=eee,ree=fa,nee=ci,iee=ree(nee,"DataView"),see=iee,aee=fa,oee=ci,lee=aee(oee,"Promise"),uee=lee,fee=fa,cee=ci,pee=fee(cee,"Set"),dee=pee,hee=fa,Eee=ci,mee=hee(Eee,"WeakMap"),gee=mee,vE=see,bE=_0,xE=uee,RE=dee,SE=gee,lL=yo,Uo=Ey,Bx="[object Map]",_ee="[object Object]",Mx="[object Promise]",$x="[object Set]",Kx="[object WeakMap]",kx="[object DataView]",Tee=Uo(vE),vee=Uo(bE),bee=Uo(xE),xee=Uo(RE),Ree=Uo(SE),Pa=lL;(vE&&Pa(new vE(new ArrayBuffer(1)))!=kx||bE&&Pa(new bE)!=Bx||xE&&Pa(xE.resolve())!=Mx||RE&&Pa(new RE)!=$x||SE&&Pa(new SE)!=Kx)&&(Pa=function(t){var e=lL(t),r=e==_ee?t.constructor:void 0,n=r?Uo(r):"";if(n)switch(n){case Tee:return kx;case vee:return Bx;case bee:return Mx;case xee:return $x;case Ree:return Kx}return e});var Gx=Ic,Vx=Gx?Gx.prototype:void 0;Vx&&Vx.valueOf;var Fx=b0;Fx&&Fx.isMap;var Hx=b0;Hx&&Hx.isSet;var See=yo,yee=wo,Aee="[object Symbol]";function Lee(t){return typeof t=="symbol"||yee(t)&&See(t)==Aee}var Rm=Lee,Cee=Oo,wee=Rm,Oee=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,Iee=/^\w*$/;function Nee(t,e){if(Cee(t))return!1;var r=typeof t;return r=="number"||r=="symbol"||r=="boolean"||t==null||wee(t)?!0:Iee.test(t)||!Oee.test(t)||e!=null&&t in Object(e)}var Pee=Nee,uL=my,Uee="Expected a function";function Sm(t,e){if(typeof t!="function"||e!=null&&typeof e!="function")throw new TypeError(Uee);var r=function(){var n=arguments,i=e?e.apply(this,n):n[0],s=r.cache;if(s.has(i))return s.get(i);var o=t.apply(this,n);return r.cache=s.set(i,o)||s,o};return r.cache=new(Sm.Cache||uL),r}Sm.Cache=uL;var Dee=Sm,Bee=Dee,Mee=500;function $ee(t){var e=Bee(t,function(n){return r.size===Mee&&r.clear(),n}),r=e.cache;return e}var Kee=$ee,kee=Kee,Gee=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,Vee=/\\(\\)?/g,Fee=kee(function(t){var e=[];return t.charCodeAt(0)===46&&e.push(""),t.replace(Gee,function(r,n,i,s){e.push(i?s.replace(Vee,"$1"):n||r)}),e}),Hee=Fee;function Wee(t,e){for(var r=-1,n=t==null?0:t.length,i=Array(n);++r<n;)i[r]=e(t[r],r,t);return i}var fL=Wee,Wx=Ic,Xee=fL,jee=Oo,zee=Rm,qee=1/0,Xx=Wx?Wx.prototype:void 0,jx=Xx?Xx.toString:void 0;function cL(t){if(typeof t=="string")return t;if(jee(t))return Xee(t,cL)+"";if(zee(t))return jx?jx.call(t):"";var e=t+"";return e=="0"&&1/t==-qee?"-0":e}var Yee=cL,Jee=Yee;function Qee(t){return t==null?"":Jee(t)}var Zee=Qee,ete=Oo,tte=Pee,rte=Hee,nte=Zee;function ite(t,e){return ete(t)?t:tte(t,e)?[t]:rte(nte(t))}var ste=ite,ate=Rm,ote=1/0;function lte(t){if(typeof t=="string"||ate(t))return t;var e=t+"";return e=="0"&&1/t==-ote?"-0":e}var ute=lte;const ym={fatal:{error:Symbol("fatal.error")}},fte=Object.prototype.toString;function cte(t,e){return fte.call(t)===`[object ${e}]`}function pte(t){return cte(t,"Object")}function dte(t){return!!(t&&t.then&&typeof t.then=="function")}const bl="8.38.0",ui=globalThis;function Am(t,e,r){const n=r||ui,i=n.__SENTRY__=n.__SENTRY__||{},s=i[bl]=i[bl]||{};return s[t]||(s[t]=e())}const Lm=typeof __SENTRY_DEBUG__>"u"||__SENTRY_DEBUG__,hte="Sentry Logger ",zx=["debug","info","warn","error","log","assert","trace"],qx={};function pL(t){if(!("console"in ui))return t();const e=ui.console,r={},n=Object.keys(qx);n.forEach(i=>{const s=qx[i];r[i]=e[i],e[i]=s});try{return t()}finally{n.forEach(i=>{e[i]=r[i]})}}function Ete(){let t=!1;const e={enable:()=>{t=!0},disable:()=>{t=!1},isEnabled:()=>t};return Lm?zx.forEach(r=>{e[r]=(...n)=>{t&&pL(()=>{ui.console[r](`${hte}[${r}]:`,...n)})}}):zx.forEach(r=>{e[r]=()=>{}}),e}const Kn=Am("logger",Ete),mte=/^(?:(\w+):)\/\/(?:(\w+)(?::(\w+)?)?@)([\w.-]+)(?::(\d+))?\/(.+)/;function gte(t){return t==="http"||t==="https"}function _te(t,e=!1){const{host:r,path:n,pass:i,port:s,projectId:o,protocol:f,publicKey:c}=t;return`${f}://${c}${e&&i?`:${i}`:""}@${r}${s?`:${s}`:""}/${n&&`${n}/`}${o}`}function Tte(t){const e=mte.exec(t);if(!e){pL(()=>{console.error(`Invalid Sentry Dsn: ${t}`)});return}const[r,n,i="",s="",o="",f=""]=e.slice(1);let c="",d=f;const p=d.split("/");if(p.length>1&&(c=p.slice(0,-1).join("/"),d=p.pop()),d){const E=d.match(/^\d+/);E&&(d=E[0])}return dL({host:s,pass:i,path:c,projectId:d,port:o,protocol:r,publicKey:n})}function dL(t){return{protocol:t.protocol,publicKey:t.publicKey||"",pass:t.pass||"",host:t.host,port:t.port||"",path:t.path||"",projectId:t.projectId}}function vte(t){if(!Lm)return!0;const{port:e,projectId:r,protocol:n}=t;return["protocol","publicKey","host","projectId"].find(o=>t[o]?!1:(Kn.error(`Invalid Sentry Dsn: ${o} missing`),!0))?!1:r.match(/^\d+$/)?gte(n)?e&&isNaN(parseInt(e,10))?(Kn.error(`Invalid Sentry Dsn: Invalid port ${e}`),!1):!0:(Kn.error(`Invalid Sentry Dsn: Invalid protocol ${n}`),!1):(Kn.error(`Invalid Sentry Dsn: Invalid projectId ${r}`),!1)}function bte(t){const e=typeof t=="string"?Tte(t):dL(t);if(!(!e||!vte(e)))return e}function xte(t,e,r){try{Object.defineProperty(t,e,{value:r,writable:!0,configurable:!0})}catch{Lm&&Kn.log(`Failed to add non-enumerable property "${e}" to object`,t)}}const hL=1e3;function EL(){return Date.now()/hL}function Rte(){const{performance:t}=ui;if(!t||!t.now)return EL;const e=Date.now()-t.now(),r=t.timeOrigin==null?e:t.timeOrigin;return()=>(r+t.now())/hL}const Ste=Rte();(()=>{const{performance:t}=ui;if(!t||!t.now)return;const e=3600*1e3,r=t.now(),n=Date.now(),i=t.timeOrigin?Math.abs(t.timeOrigin+r-n):e,s=i<e,o=t.timing&&t.timing.navigationStart,c=typeof o=="number"?Math.abs(o+r-n):e,d=c<e;return s||d?i<=c?t.timeOrigin:o:n})();function no(){const t=ui,e=t.crypto||t.msCrypto;let r=()=>Math.random()*16;try{if(e&&e.randomUUID)return e.randomUUID().replace(/-/g,"");e&&e.getRandomValues&&(r=()=>{const n=new Uint8Array(1);return e.getRandomValues(n),n[0]})}catch{}return("10000000100040008000"+1e11).replace(/[018]/g,n=>(n^(r()&15)>>n/4).toString(16))}function Yx(){return{traceId:no(),spanId:no().substring(16)}}function Cm(){return wm(ui),ui}function wm(t){const e=t.__SENTRY__=t.__SENTRY__||{};return e.version=e.version||bl,e[bl]=e[bl]||{}}function yte(t,e={}){if(e.user&&(!t.ipAddress&&e.user.ip_address&&(t.ipAddress=e.user.ip_address),!t.did&&!e.did&&(t.did=e.user.id||e.user.email||e.user.username)),t.timestamp=e.timestamp||Ste(),e.abnormal_mechanism&&(t.abnormal_mechanism=e.abnormal_mechanism),e.ignoreDuration&&(t.ignoreDuration=e.ignoreDuration),e.sid&&(t.sid=e.sid.length===32?e.sid:no()),e.init!==void 0&&(t.init=e.init),!t.did&&e.did&&(t.did=`${e.did}`),typeof e.started=="number"&&(t.started=e.started),t.ignoreDuration)t.duration=void 0;else if(typeof e.duration=="number")t.duration=e.duration;else{const r=t.timestamp-t.started;t.duration=r>=0?r:0}e.release&&(t.release=e.release),e.environment&&(t.environment=e.environment),!t.ipAddress&&e.ipAddress&&(t.ipAddress=e.ipAddress),!t.userAgent&&e.userAgent&&(t.userAgent=e.userAgent),typeof e.errors=="number"&&(t.errors=e.errors),e.status&&(t.status=e.status)}const yE="_sentrySpan";function Jx(t,e){e?xte(t,yE,e):delete t[yE]}function Qx(t){return t[yE]}const Ate=100;class Om{constructor(){this._notifyingListeners=!1,this._scopeListeners=[],this._eventProcessors=[],this._breadcrumbs=[],this._attachments=[],this._user={},this._tags={},this._extra={},this._contexts={},this._sdkProcessingMetadata={},this._propagationContext=Yx()}clone(){const e=new Om;return e._breadcrumbs=[...this._breadcrumbs],e._tags={...this._tags},e._extra={...this._extra},e._contexts={...this._contexts},e._user=this._user,e._level=this._level,e._session=this._session,e._transactionName=this._transactionName,e._fingerprint=this._fingerprint,e._eventProcessors=[...this._eventProcessors],e._requestSession=this._requestSession,e._attachments=[...this._attachments],e._sdkProcessingMetadata={...this._sdkProcessingMetadata},e._propagationContext={...this._propagationContext},e._client=this._client,e._lastEventId=this._lastEventId,Jx(e,Qx(this)),e}setClient(e){this._client=e}setLastEventId(e){this._lastEventId=e}getClient(){return this._client}lastEventId(){return this._lastEventId}addScopeListener(e){this._scopeListeners.push(e)}addEventProcessor(e){return this._eventProcessors.push(e),this}setUser(e){return this._user=e||{email:void 0,id:void 0,ip_address:void 0,username:void 0},this._session&&yte(this._session,{user:e}),this._notifyScopeListeners(),this}getUser(){return this._user}getRequestSession(){return this._requestSession}setRequestSession(e){return this._requestSession=e,this}setTags(e){return this._tags={...this._tags,...e},this._notifyScopeListeners(),this}setTag(e,r){return this._tags={...this._tags,[e]:r},this._notifyScopeListeners(),this}setExtras(e){return this._extra={...this._extra,...e},this._notifyScopeListeners(),this}setExtra(e,r){return this._extra={...this._extra,[e]:r},this._notifyScopeListeners(),this}setFingerprint(e){return this._fingerprint=e,this._notifyScopeListeners(),this}setLevel(e){return this._level=e,this._notifyScopeListeners(),this}setTransactionName(e){return this._transactionName=e,this._notifyScopeListeners(),this}setContext(e,r){return r===null?delete this._contexts[e]:this._contexts[e]=r,this._notifyScopeListeners(),this}setSession(e){return e?this._session=e:delete this._session,this._notifyScopeListeners(),this}getSession(){return this._session}update(e){if(!e)return this;const r=typeof e=="function"?e(this):e,[n,i]=r instanceof Bl?[r.getScopeData(),r.getRequestSession()]:pte(r)?[e,e.requestSession]:[],{tags:s,extra:o,user:f,contexts:c,level:d,fingerprint:p=[],propagationContext:E}=n||{};return this._tags={...this._tags,...s},this._extra={...this._extra,...o},this._contexts={...this._contexts,...c},f&&Object.keys(f).length&&(this._user=f),d&&(this._level=d),p.length&&(this._fingerprint=p),E&&(this._propagationContext=E),i&&(this._requestSession=i),this}clear(){return this._breadcrumbs=[],this._tags={},this._extra={},this._user={},this._contexts={},this._level=void 0,this._transactionName=void 0,this._fingerprint=void 0,this._requestSession=void 0,this._session=void 0,Jx(this,void 0),this._attachments=[],this._propagationContext=Yx(),this._notifyScopeListeners(),this}addBreadcrumb(e,r){const n=typeof r=="number"?r:Ate;if(n<=0)return this;const i={timestamp:EL(),...e},s=this._breadcrumbs;return s.push(i),this._breadcrumbs=s.length>n?s.slice(-n):s,this._notifyScopeListeners(),this}getLastBreadcrumb(){return this._breadcrumbs[this._breadcrumbs.length-1]}clearBreadcrumbs(){return this._breadcrumbs=[],this._notifyScopeListeners(),this}addAttachment(e){return this._attachments.push(e),this}clearAttachments(){return this._attachments=[],this}getScopeData(){return{breadcrumbs:this._breadcrumbs,attachments:this._attachments,contexts:this._contexts,tags:this._tags,extra:this._extra,user:this._user,level:this._level,fingerprint:this._fingerprint||[],eventProcessors:this._eventProcessors,propagationContext:this._propagationContext,sdkProcessingMetadata:this._sdkProcessingMetadata,transactionName:this._transactionName,span:Qx(this)}}setSDKProcessingMetadata(e){return this._sdkProcessingMetadata={...this._sdkProcessingMetadata,...e},this}setPropagationContext(e){return this._propagationContext=e,this}getPropagationContext(){return this._propagationContext}captureException(e,r){const n=r&&r.event_id?r.event_id:no();if(!this._client)return Kn.warn("No client configured on scope - will not capture exception!"),n;const i=new Error("Sentry syntheticException");return this._client.captureException(e,{originalException:e,syntheticException:i,...r,event_id:n},this),n}captureMessage(e,r,n){const i=n&&n.event_id?n.event_id:no();if(!this._client)return Kn.warn("No client configured on scope - will not capture message!"),i;const s=new Error(e);return this._client.captureMessage(e,r,{originalException:e,syntheticException:s,...n,event_id:i},this),i}captureEvent(e,r){const n=r&&r.event_id?r.event_id:no();return this._client?(this._client.captureEvent(e,{...r,event_id:n},this),n):(Kn.warn("No client configured on scope - will not capture event!"),n)}_notifyScopeListeners(){this._notifyingListeners||(this._notifyingListeners=!0,this._scopeListeners.forEach(e=>{e(this)}),this._notifyingListeners=!1)}}const Bl=Om;function Lte(){return Am("defaultCurrentScope",()=>new Bl)}function Cte(){return Am("defaultIsolationScope",()=>new Bl)}class wte{constructor(e,r){let n;e?n=e:n=new Bl;let i;r?i=r:i=new Bl,this._stack=[{scope:n}],this._isolationScope=i}withScope(e){const r=this._pushScope();let n;try{n=e(r)}catch(i){throw this._popScope(),i}return dte(n)?n.then(i=>(this._popScope(),i),i=>{throw this._popScope(),i}):(this._popScope(),n)}getClient(){return this.getStackTop().client}getScope(){return this.getStackTop().scope}getIsolationScope(){return this._isolationScope}getStackTop(){return this._stack[this._stack.length-1]}_pushScope(){const e=this.getScope().clone();return this._stack.push({client:this.getClient(),scope:e}),e}_popScope(){return this._stack.length<=1?!1:!!this._stack.pop()}}function vo(){const t=Cm(),e=wm(t);return e.stack=e.stack||new wte(Lte(),Cte())}function Ote(t){return vo().withScope(t)}function Ite(t,e){const r=vo();return r.withScope(()=>(r.getStackTop().scope=t,e(t)))}function Zx(t){return vo().withScope(()=>t(vo().getIsolationScope()))}function Nte(){return{withIsolationScope:Zx,withScope:Ote,withSetScope:Ite,withSetIsolationScope:(t,e)=>Zx(e),getCurrentScope:()=>vo().getScope(),getIsolationScope:()=>vo().getIsolationScope()}}function mL(t){const e=wm(t);return e.acs?e.acs:Nte()}function Pte(){const t=Cm();return mL(t).getCurrentScope()}function Ute(){const t=Cm();return mL(t).getIsolationScope()}function Dte(){return Ute().lastEventId()}function Bte(t){const e=t.protocol?`${t.protocol}:`:"",r=t.port?`:${t.port}`:"";return`${e}//${t.host}${r}${t.path?`/${t.path}`:""}/api/`}function Mte(t,e){const r=bte(t);if(!r)return"";const n=`${Bte(r)}embed/error-page/`;let i=`dsn=${_te(r)}`;for(const s in e)if(s!=="dsn"&&s!=="onClose")if(s==="user"){const o=e.user;if(!o)continue;o.name&&(i+=`&name=${encodeURIComponent(o.name)}`),o.email&&(i+=`&email=${encodeURIComponent(o.email)}`)}else i+=`&${encodeURIComponent(s)}=${encodeURIComponent(e[s])}`;return`${n}?${i}`}const Ua=ui,gh=typeof __SENTRY_DEBUG__>"u"||__SENTRY_DEBUG__;function $te(t={}){if(!Ua.document){gh&&Kn.error("Global document not defined in showReportDialog call");return}const e=Pte(),r=e.getClient(),n=r&&r.getDsn();if(!n){gh&&Kn.error("DSN not configured for showReportDialog call");return}if(e&&(t.user={...e.getUser(),...t.user}),!t.eventId){const f=Dte();f&&(t.eventId=f)}const i=Ua.document.createElement("script");i.async=!0,i.crossOrigin="anonymous",i.src=Mte(n,t),t.onLoad&&(i.onload=t.onLoad);const{onClose:s}=t;if(s){const f=c=>{if(c.data==="__sentry_reportdialog_closed__")try{s()}finally{Ua.removeEventListener("message",f)}};Ua.addEventListener("message",f)}const o=Ua.document.head||Ua.document.body;o?o.appendChild(i):gh&&Kn.error("Not injecting report dialog. No injection point found in HTML")}const Kte=lr({setup(){return{fatalError:qs(ym.fatal.error)}},computed:{message(){var n,i,s,o;const t=((i=(n=this.fatalError)==null?void 0:n.event)==null?void 0:i.event_id)??"Unknown";let e="";const r=(o=(s=this.fatalError)==null?void 0:s.hint)==null?void 0:o.originalException;return r?typeof r=="string"?e=r:e=r.message:e="An unknown error occured",`Version:
-${window.tv.manifest.loader.version}
-
-Event ID:
-${t}
-
-${e}`}},methods:{onFeedbackClick(){var t,e;$te({id:((e=(t=this.fatalError)==null?void 0:t.event)==null?void 0:e.event_id)??"Unknown"})}}}),kte={class:"jbg fatal"},Gte={class:"constrain"},Vte={class:"content"},Fte={class:"error"};function Hte(t,e,r,n,i,s){return Oe(),Pe("div",kte,[Ae("div",Gte,[e[5]||(e[5]=Ae("a",{class:"logo",href:"/","aria-label":"Jackbox Games Logo"},null,-1)),Ae("div",Vte,[e[1]||(e[1]=Ae("h1",null,"You have encountered an error",-1)),e[2]||(e[2]=Ae("p",null,"Something went wrong! But don't worry, you can try a few things to get going.",-1)),e[3]||(e[3]=Ae("ul",null,[Ae("li",null,"Refresh the page"),Ae("li",null,"Turn off adblockers or other browser extensions."),Ae("li",null,"Check your connection to the Internet."),Ae("li",null,"Make sure you're using an up-to-date browser."),Ae("li",null,"If that doesn't work, let us know.")],-1)),Ae("button",{onClick:e[0]||(e[0]=(...o)=>t.onFeedbackClick&&t.onFeedbackClick(...o))},"Tell us what happened"),e[4]||(e[4]=Ae("hr",null,null,-1)),Ae("pre",Fte,Ye(t.message),1)])])])}const Wte=Ar(Kte,[["render",Hte],["__scopeId","data-v-d0abff79"]]),sf=fc({hasCrashed:!1}),Xte={install:t=>{if(t.config.globalProperties.$handleEcastError)return;t.provide(ym.fatal.error,Sn(()=>sf));const e=(r,n)=>{var i,s;if(r instanceof _l.EcastEntityNotFound||r instanceof _l.EcastFilterError||r instanceof _l.EcastRateLimitExceeded||r instanceof Error&&((i=r.message)!=null&&i.includes("Socket not ready to send"))||r instanceof Error&&((s=r.message)!=null&&s.includes("No connection available")))return console.warn(r);throw n?console.error(n,r):console.error(r),r};window.tv.onError=async(r,n)=>{if(r.level==="error"&&(sf.hasCrashed=!0,sf.event=r,sf.hint=n),t.config.globalProperties.$debugRecorder)return await t.config.globalProperties.$debugRecorder.sendToEcast()},t.component("Fatal",Wte),t.config.globalProperties.$handleEcastError=e}};var jte=ste,zte=ute;function qte(t,e){e=jte(e,t);for(var r=0,n=e.length;t!=null&&r<n;)t=t[zte(e[r++])];return r&&r==n?t:void 0}var Yte=qte,Jte=Yte;function Qte(t,e,r){var n=t==null?void 0:Jte(t,e);return n===void 0?r:n}var Zte=Qte;const ere=Sc(Zte);var tre=Math.floor,rre=Math.random;function nre(t,e){return t+tre(rre()*(e-t+1))}var ire=nre,sre=ire;function are(t){var e=t.length;return e?t[sre(0,e-1)]:void 0}var gL=are,ore=fL;function lre(t,e){return ore(e,function(r){return t[r]})}var ure=lre,fre=ure,cre=tee;function pre(t){return t==null?[]:fre(t,cre(t))}var dre=pre,hre=gL,Ere=dre;function mre(t){return hre(Ere(t))}var gre=mre,_re=gL,Tre=gre,vre=Oo;function bre(t){var e=vre(t)?_re:Tre;return e(t)}var xre=bre;const Rre=Sc(xre);function eR(t,e){const r=t.global.locale,n=t.global.messages[r],i=ere(n,e);return Array.isArray(i)||console.warn(`[i18nPlugin] Translation with key ${e} is not an array`),Rre(i)}const Sre={install:(t,e)=>{t.directive("ts",(r,n)=>{const i=eR(e.i18n,n.value);r.textContent=i||""}),t.config.globalProperties.$ts=function(n){return eR(e.i18n,n)||""},t.config.globalProperties.$messages=e.i18n.global.messages,t.config.globalProperties.$t=e.i18n.global.t,t.config.globalProperties.$tc=e.i18n.global.tc,t.config.globalProperties.$te=e.i18n.global.te,t.config.globalProperties.$tm=e.i18n.global.tm}},yre=lr({props:{image:String,text:String,subtext:String,classes:{type:[Array,String],default:()=>"jbg"},dismissText:String}}),Are="https://bundles.jackbox.tv/main/@connect/assets/Bwlnl62i.png",Lre="https://bundles.jackbox.tv/main/@connect/assets/DN8YV_ih.png",Cre="https://bundles.jackbox.tv/main/@connect/assets/Dv-2T4fF.png",wre={key:0,class:"image",src:Are,alt:"Kicked"},Ore={key:1,class:"image",src:Lre,alt:"Thank You"},Ire={key:2,class:"image",src:Cre,alt:"Error"},Nre={class:"text"},Pre={key:3,class:"subtext"},Ure={class:"actions"};function Dre(t,e,r,n,i,s){const o=hs("bb");return Oe(),Pe("div",{class:Vr(["error-model",t.classes])},[t.image==="tear"?(Oe(),Pe("img",wre)):t.image==="moon"?(Oe(),Pe("img",Ore)):(Oe(),Pe("img",Ire)),or(Ae("h3",Nre,null,512),[[o,t.text]]),t.subtext?or((Oe(),Pe("h3",Pre,null,512)),[[o,t.subtext]]):vt("",!0),Ae("div",Ure,[or(Ae("button",{onClick:e[0]||(e[0]=dn(f=>t.$emit("resolve"),["prevent"]))},null,512),[[o,t.dismissText]])])],2)}const Bre=Ar(yre,[["render",Dre],["__scopeId","data-v-420dd700"]]),Mre=lr({props:{text:String,subtext:String,classes:{type:[Array,String],default:()=>"jbg"},options:Array},emits:["resolve"]}),$re={class:"text"},Kre={key:0,class:"subtext"},kre={class:"actions"},Gre=["onClick"];function Vre(t,e,r,n,i,s){const o=hs("bb");return Oe(),Pe("div",{class:Vr(["options-modal",t.classes])},[or(Ae("h3",$re,null,512),[[o,t.text]]),t.subtext?or((Oe(),Pe("h3",Kre,null,512)),[[o,t.subtext]]):vt("",!0),Ae("div",kre,[(Oe(!0),Pe(Yt,null,Es(t.options,(f,c)=>or((Oe(),Pe("button",{key:c,class:Vr(f.classes),onClick:dn(d=>t.$emit("resolve",f.value),["prevent"])},null,10,Gre)),[[o,f.text]])),128))])],2)}const Fre=Ar(Mre,[["render",Vre],["__scopeId","data-v-db592987"]]),Hre=lr({data(){return{classes:"jbg",props:null,resolve:null,content:null}},beforeMount(){this.$registerModal(this)},methods:{show(t,e={},r={}){return this.props=e,this.classes=r.classes||"jbg",t==="Error"?this.content=Bre:t==="Options"?this.content=Fre:this.content=t,new Promise(n=>{this.resolve=n})},hide(){this.props=null,this.resolve&&this.resolve()},onResolve(...t){this.props=null,this.resolve(...t)},onBackgroundClick(){this.props=null,this.resolve()}}}),Wre={class:"sandbox"};function Xre(t,e,r,n,i,s){return Oe(),Bi(gS,{name:"modal-transition"},{default:pc(()=>[t.props?(Oe(),Pe("div",{key:0,class:Vr(["modal",t.classes]),onKeyup:e[0]||(e[0]=Ys((...o)=>t.onBackgroundClick&&t.onBackgroundClick(...o),["esc"])),onClick:e[1]||(e[1]=dn((...o)=>t.onBackgroundClick&&t.onBackgroundClick(...o),["self"]))},[Ae("div",Wre,[t.content?(Oe(),Bi(tB(t.content),cS({key:0,class:"content"},t.props,{onResolve:t.onResolve}),null,16,["onResolve"])):vt("",!0)])],34)):vt("",!0)]),_:1})}const jre=Ar(Hre,[["render",Xre],["__scopeId","data-v-0f35a352"]]),zre={install:t=>{let e;const r=()=>{if(!e)throw new Error("No ModalComponent is registered");return e.hide()},n=(s,o,f)=>{if(!e)throw new Error("No ModalComponent is registered");return e.show(s,o,f)},i=s=>{e=s};t.component("Modal",jre),t.config.globalProperties.$hideModal=r,t.config.globalProperties.$showModal=n,t.config.globalProperties.$registerModal=i}};Hs("");const qre={LABEL:"BRANCH",REFRESH_REQUIRED:"Refresh Required",PREFERRED:"PREFERRED BRANCH",SELECT:"Select a Branch",WAITING:"Waiting for Room"},Yre={ACCEPT_ALL:"Got it!",CONSENT_MODAL:{ARIA:"Cookie consent form"},DESCRIPTION:"We use cookies to improve your game experience and analyze website traffic. Find out more in our [pp]Privacy Policy[/pp].",REJECT_ALL:"Opt out"},Jre={UNSUPPORTED_BROWSER:"This game is not supported on this browser. View '?' or HELP to see a list of compatible browsers.",ROOM_IS_FULL:"The game is full",ROOM_NOT_FOUND:"Room not found",AUDIENCE_IS_FULL:"The audience is full",UNABLE_TO_CONNECT:"Unable to connect to the Jackbox Games server. This is commonly caused by adblockers or privacy extensions.",UNABLE_TO_PRELOAD:"Unable to preload this game bundle",KICKED:"You cannot join because you have been kicked by a moderator",REQUIRES_TWITCH_LOGIN:"Game requires Twitch login",ROOM_IS_LOCKED:"Game is locked",INCORRECT_PASSWORD:"Incorrect password",GENERIC:"Error joining this game",FILTER_NAME:"This game has profanity filters enabled. Please pick a different name."},Qre={NAME:"NAME",NAME_PLACEHOLDER:"ENTER YOUR NAME",PASSWORD_PLACEHOLDER:"ENTER 5-DIGIT PASSWORD",PASSWORD_REQUIRED_TITLE:"Password required",PASSWORD_REQUIRED_BODY:"Please enter the password or join as an audience member",PASSWORD_JOIN_AS_PLAYER:"Join as Player",PASSWORD_JOIN_AS_AUDIENCE:"Join Audience",ROOM_CODE:"ROOM CODE",ROOM_CODE_PLACEHOLDER:"ENTER 4-LETTER CODE"},Zre="Link to Jackbox Games Homepage",ene={APPEARANCE:"APPEARANCE",DARK:"dark",HELP:"HELP",TWITCH:"TWITCH",LIGHT:"light",LOGOUT:"LOGOUT",MERCH:"MERCH",PAST_GAMES:"PAST GAMES",MAILING_LIST:"MAILING LIST",MODERATOR:"MODERATOR"},tne={EMAIL_INPUT_PLACEHOLDER:"Email address",JOIN:"Join our Newsletter",SUBSCRIBED:"Thanks for signing up to our email list!"},rne={CALL_TO_ACTION:{SHOP:"VIEW GAME & SHOP",VIEW:"VIEW THIS GAME"},NEW:"NEW",PLAYED_ON:"PLAYED ON",REMOVE:{CONFIRM:"Are you sure?",DESCRIPTION:`This will permanently remove this game
-from your past games list.`,MANAGE:"Remove Game?",TITLE:"Are You Sure?"}},nne={EMPTY:"No Past Games Yet",MANAGE:"MANAGE",TITLE:"YOUR PAST GAMES"},ine={TITLE:"RECENT GAMES",VIEW_ALL:{BUTTON:"VIEW ALL",LINK:"VIEW ALL PAST GAMES"}},sne={GAME_FULL:"Game is full",GAME_STARTED:"Game has started",ROOM_NOT_FOUND:"Room not found"},ane={GAME_FULL:"GAME IS FULL",GAME_STARTED:"GAME HAS STARTED",JOIN_AUDIENCE:"JOIN AUDIENCE",RECONNECT:"RECONNECT",TWITCH_LOGIN:"LOGIN WITH TWITCH"},one={CAMERA:"[b]HEADS UP:[/b] We’re not detecting a camera, but you can still play the game without a photo. If this seems wrong, try joining with a different browser.",STYLE:"[b]HEADS UP:[/b] Your browser seems a bit outdated, and will have some issues displaying this game.",TOS:"By clicking {submit}, you agree to our [tos]Terms of Service[/tos]"},lne={BRANCH:qre,COOKIE:Yre,ERROR:Jre,FORM:Qre,HOMEPAGE_LINK:Zre,MENU:ene,NEWSLETTER:tne,PAST_GAME:rne,PAST_GAMES:nne,RECENT_GAMES:ine,STATUS:sne,SUBMIT:ane,WARNING:one},une={LABEL:"SECTION",REFRESH_REQUIRED:"Actualisation requise",PREFERRED:"SECTION PRÉFÉRÉE",SELECT:"Choisissez une section",WAITING:"En attente de la salle"},fne={ACCEPT_ALL:"Compris !",CONSENT_MODAL:{ARIA:"Formulaire d'acceptation des cookies"},DESCRIPTION:"Nous utilisons les cookies pour améliorer votre expérience de jeu et analyser le trafic du site. Plus d'infos sur notre [pp]politique de confidentialité[/pp].",REJECT_ALL:"Refuser"},cne={UNSUPPORTED_BROWSER:"Le jeu n'est pas compatible avec votre navigateur. Allez sur '?' ou sur AIDE pour afficher une liste des navigateurs compatibles.",ROOM_IS_FULL:"La salle est pleine.",ROOM_NOT_FOUND:"Salle introuvable",AUDIENCE_IS_FULL:"Il n'y a plus de place dans le public.",UNABLE_TO_CONNECT:"Impossible de se connecter au serveur de Jackbox Games. Les bloqueurs de publicité ou les modules de protection de la confidentialité sont généralement à l'origine de ce problème.",UNABLE_TO_PRELOAD:"Impossible de précharger ce pack de jeux",KICKED:"Vous ne pouvez pas rejoindre la partie, parce que vous avez été éjecté(e) par un modérateur.",REQUIRES_TWITCH_LOGIN:"Ce jeu nécessite une connexion Twitch.",ROOM_IS_LOCKED:"La salle est fermée.",INCORRECT_PASSWORD:"Mot de passe incorrect",GENERIC:"Erreur en rejoignant la salle",FILTER_NAME:"Le filtre anti-grossièreté est activé pour cette partie. Veuillez choisir un autre nom."},pne={NAME:"NOM",NAME_PLACEHOLDER:"INDIQUEZ VOTRE NOM",PASSWORD_PLACEHOLDER:"TAPEZ UN MOT DE PASSE À 5 CHIFFRES",PASSWORD_REQUIRED_TITLE:"Mot de passe requis",PASSWORD_REQUIRED_BODY:"Indiquez le mot de passe ou rejoignez la salle en tant que spectateur.",PASSWORD_JOIN_AS_PLAYER:"Rejoindre en tant que joueur",PASSWORD_JOIN_AS_AUDIENCE:"Rejoindre en tant que spectateur",ROOM_CODE:"CODE DE SALLE",ROOM_CODE_PLACEHOLDER:"TAPEZ LE CODE À 4 LETTRES"},dne="Lien vers la page d'accueil de Jackbox Games",hne={APPEARANCE:"APPARENCE",DARK:"sombre",HELP:"AIDE",TWITCH:"TWITCH",LIGHT:"clair",LOGOUT:"DÉCONNEXION",MERCH:"PRODUITS DÉRIVÉS",PAST_GAMES:"ANCIENNES PARTIES",MAILING_LIST:"LISTE DE DIFFUSION",MODERATOR:"MODÉRATEUR"},Ene={EMAIL_INPUT_PLACEHOLDER:"Adresse e-mail",JOIN:"Abonnez-vous à notre newsletter",SUBSCRIBED:"Merci pour votre inscription à notre liste de diffusion !"},mne={CALL_TO_ACTION:{SHOP:"VOIR LE JEU ET LA BOUTIQUE",VIEW:"VOIR CETTE PARTIE"},NEW:"NOUVEAU",PLAYED_ON:"JOUÉE LE",REMOVE:{CONFIRM:"Êtes-vous sûr ?",DESCRIPTION:`Cela supprimera définitivement cette partie
-de votre liste d'anciennes parties.`,MANAGE:"Supprimer la partie ?",TITLE:"Êtes-vous sûr ?"}},gne={EMPTY:"Aucune ancienne partie",MANAGE:"GÉRER",TITLE:"VOS ANCIENNES PARTIES"},_ne={TITLE:"PARTIES RÉCENTES",VIEW_ALL:{BUTTON:"VOIR TOUT",LINK:"VOIR TOUTES LES ANCIENNES PARTIES"}},Tne={GAME_FULL:"La salle est pleine.",GAME_STARTED:"La partie a commencé.",ROOM_NOT_FOUND:"Salle introuvable"},vne={GAME_FULL:"LA SALLE EST PLEINE.",GAME_STARTED:"LA PARTIE A COMMENCÉ.",JOIN_AUDIENCE:"REJOINDRE EN TANT QUE SPECTATEUR",RECONNECT:"SE RECONNECTER",TWITCH_LOGIN:"SE CONNECTER AVEC TWITCH"},bne={CAMERA:"[b]ATTENTION :[/b] Nous ne détectons aucune caméra, mais vous pouvez jouer sans afficher votre photo. Si vous pensez qu'il s'agit d'une erreur, essayez de rejoindre en utilisant un autre navigateur.",STYLE:"[b]ATTENTION :[/b] Votre navigateur semble obsolète. Vous risquez de rencontrer des problèmes d'affichage avec ce jeu.",TOS:"En cliquant sur {submit}, vous acceptez nos [tos]Conditions de service[/tos]."},xne={BRANCH:une,COOKIE:fne,ERROR:cne,FORM:pne,HOMEPAGE_LINK:dne,MENU:hne,NEWSLETTER:Ene,PAST_GAME:mne,PAST_GAMES:gne,RECENT_GAMES:_ne,STATUS:Tne,SUBMIT:vne,WARNING:bne},Rne={LABEL:"BRANCH",REFRESH_REQUIRED:"Ricarica necessaria",PREFERRED:"BRANCH PREFERITA",SELECT:"Scegli una branch",WAITING:"In attesa di una stanza"},Sne={ACCEPT_ALL:"Capito!",CONSENT_MODAL:{ARIA:"Modulo di consenso sui cookie"},DESCRIPTION:"Usiamo i cookie per migliorare l'esperienza di gioco e analizzare il traffico del sito web. Per maggiori informazioni consulta la nostra [pp]Informativa sulla privacy[/pp].",REJECT_ALL:"Nega consenso"},yne={UNSUPPORTED_BROWSER:"Il gioco non è supportato dal browser attualmente in uso. Clicca su '?' o AIUTO per visualizzare la lista dei browser compatibili.",ROOM_IS_FULL:"La partita è al completo",ROOM_NOT_FOUND:"Stanza non trovata",AUDIENCE_IS_FULL:"Il pubblico è al completo",UNABLE_TO_CONNECT:"Impossibile collegarsi al server Jackbox Games. Solitamente il problema è causato da adblocker o estensioni per la privacy.",UNABLE_TO_PRELOAD:"Impossibile pre-caricare questo bundle di giochi",KICKED:"Non puoi unirti perché un moderatore ti ha cacciato",REQUIRES_TWITCH_LOGIN:"Questo gioco richiede l'accesso a Twitch",ROOM_IS_LOCKED:"La stanza è bloccata",INCORRECT_PASSWORD:"Password errata",GENERIC:"Impossibile entrare in questa stanza",FILTER_NAME:"Questa partita ha i filtri delle volgarità attivi. Scegli un nome diverso."},Ane={NAME:"NOME",NAME_PLACEHOLDER:"INSERISCI IL TUO NOME",PASSWORD_PLACEHOLDER:"INSERISCI LA PASSWORD DI 5 CARATTERI",PASSWORD_REQUIRED_TITLE:"Password necessaria",PASSWORD_REQUIRED_BODY:"Inserisci la password o partecipa come pubblico",PASSWORD_JOIN_AS_PLAYER:"Partecipa come giocatore",PASSWORD_JOIN_AS_AUDIENCE:"Partecipa come pubblico",ROOM_CODE:"CODICE STANZA",ROOM_CODE_PLACEHOLDER:"INSERISCI IL CODICE DI 4 LETTERE"},Lne="Link alla homepage di Jackbox Games",Cne={APPEARANCE:"ASPETTO",DARK:"scuro",HELP:"AIUTO",TWITCH:"TWITCH",LIGHT:"chiaro",LOGOUT:"ESCI",MERCH:"NEGOZIO",PAST_GAMES:"PARTITE PRECEDENTI",MAILING_LIST:"NEWSLETTER",MODERATOR:"MODERATORE"},wne={EMAIL_INPUT_PLACEHOLDER:"Indirizzo email",JOIN:"Iscriviti alla nostra newsletter",SUBSCRIBED:"Grazie per esserti iscritto alla nostra lista email!"},One={CALL_TO_ACTION:{SHOP:"VISUALIZZA GIOCO E NEGOZIO",VIEW:"VISUALIZZA QUESTO GIOCO"},NEW:"NUOVO",PLAYED_ON:"GIOCATO IL",REMOVE:{CONFIRM:"Confermi?",DESCRIPTION:`Quest'azione rimuoverà per sempre questo gioco
-dalla lista dei giochi precedenti.`,MANAGE:"Rimuovere gioco?",TITLE:"Confermi?"}},Ine={EMPTY:"Nessun gioco precedente",MANAGE:"GESTISCI",TITLE:"I TUOI GIOCHI PRECEDENTI"},Nne={TITLE:"GIOCHI RECENTI",VIEW_ALL:{BUTTON:"VISUALIZZA TUTTO",LINK:"VISUALIZZA TUTTI I GIOCHI RECENTI"}},Pne={GAME_FULL:"La partita è al completo",GAME_STARTED:"La partita è già iniziata",ROOM_NOT_FOUND:"Stanza non trovata"},Une={GAME_FULL:"LA PARTITA È AL COMPLETO",GAME_STARTED:"LA PARTITA È GIÀ INIZIATA",JOIN_AUDIENCE:"PARTECIPA COME PUBBLICO",RECONNECT:"RICOLLEGATI",TWITCH_LOGIN:"ACCEDI CON TWITCH"},Dne={CAMERA:"[b]AVVISO:[/b] Non rileviamo la telecamera, ma puoi giocare anche senza aggiungere una foto. Se la cosa non ti torna, prova ad accedere usando un altro browser.",STYLE:"[b]AVVISO:[/b] Il tuo browser è obsoleto e avrà dei problemi a visualizzare il gioco.",TOS:"Selezionando {submit}, accetti le [tos]Condizioni del servizio[/tos]"},Bne={BRANCH:Rne,COOKIE:Sne,ERROR:yne,FORM:Ane,HOMEPAGE_LINK:Lne,MENU:Cne,NEWSLETTER:wne,PAST_GAME:One,PAST_GAMES:Ine,RECENT_GAMES:Nne,STATUS:Pne,SUBMIT:Une,WARNING:Dne},Mne={LABEL:"ZWEIG",REFRESH_REQUIRED:"Refresh benötigt",PREFERRED:"BEVORZUGTER ZWEIG",SELECT:"Wähle deinen Zweig aus",WAITING:"Warte auf Raum"},$ne={ACCEPT_ALL:"Okay!",CONSENT_MODAL:{ARIA:"Cookie-Zustimmung"},DESCRIPTION:"Wir verwenden Cookies, um deine Spielerfahrung zu verbessern und unseren Web-Traffic zu analysieren. Mehr darüber kannst du in unserer [pp]Datenschutzrichtlinie[/pp] erfahren.",REJECT_ALL:"Ablehnen"},Kne={UNSUPPORTED_BROWSER:"Dieses Spiel wird von diesem Browser nicht unterstützt. Unter '?' und HILFE findest du eine vollständige Liste an kompatiblen Browsern.",ROOM_IS_FULL:"Das Spiel ist voll",ROOM_NOT_FOUND:"Raum wurde nicht gefunden.",AUDIENCE_IS_FULL:"Das Publikum ist voll",UNABLE_TO_CONNECT:"Es konnte keine Verbindung zum Server von Jackbox Games hergestellt werden. Dies wird häufig durch Adblocker oder Privacy Extensions verursacht.",UNABLE_TO_PRELOAD:"Preload dieses Bundles ist nicht möglich",KICKED:"Du kannst nicht beitreten, weil du von einem Moderator gekickt wurdest",REQUIRES_TWITCH_LOGIN:"Für diesen Spiel ist Twitch erforderlich",ROOM_IS_LOCKED:"Spiel verschlossen",INCORRECT_PASSWORD:"Falsches Passwort",GENERIC:"Fehler beim Betreten des Spiels",FILTER_NAME:"Der Familientauglichkeits-Filter des Spiels ist aktiviert. Wähle einen anderen Namen."},kne={NAME:"NAME",NAME_PLACEHOLDER:"GIB DEINEN NAMEN EIN",PASSWORD_PLACEHOLDER:"FÜNFSTELLIGES PASSWORT EINGEBEN",PASSWORD_REQUIRED_TITLE:"Passwort benötigt",PASSWORD_REQUIRED_BODY:"Bitte gib das Passwort ein oder setze dich ins Publikum",PASSWORD_JOIN_AS_PLAYER:"Als Spieler beitreten",PASSWORD_JOIN_AS_AUDIENCE:"Ins Publikum setzen",ROOM_CODE:"RAUMCODE",ROOM_CODE_PLACEHOLDER:"GIB DEN 4-STELLIGEN CODE EIN"},Gne="Link zur Homepage von Jackbox Games",Vne={APPEARANCE:"DARSTELLUNG",DARK:"Dunkel",HELP:"HILFE",TWITCH:"TWITCH",LIGHT:"Hell",LOGOUT:"ABMELDEN",MERCH:"MERCH",PAST_GAMES:"ANDERE SPIELE",MAILING_LIST:"MAILINGLISTE",MODERATOR:"MODERATOR"},Fne={EMAIL_INPUT_PLACEHOLDER:"E-Mail-Adresse",JOIN:"Abonniere unseren Newsletter",SUBSCRIBED:"Danke fürs Eintragen in unsere E-Mail-Liste!"},Hne={CALL_TO_ACTION:{SHOP:"SPIEL UND SHOP ANSEHEN",VIEW:"DIESES SPIEL ANSEHEN"},NEW:"NEU",PLAYED_ON:"GESPIELT AM",REMOVE:{CONFIRM:"Bist du sicher?",DESCRIPTION:`Dies wird das Spiel dauerhaft aus der Liste
-deiner bisherigen Spiele entfernen.`,MANAGE:"Spiel entfernen?",TITLE:"Bist du sicher?"}},Wne={EMPTY:"Noch keine bisherigen Spiele",MANAGE:"VERWALTEN",TITLE:"DEINE BISHERIGEN SPIELE"},Xne={TITLE:"AKTUELLE SPIELE",VIEW_ALL:{BUTTON:"ALLE ANSEHEN",LINK:"ALLE BISHERIGEN SPIELE ANSEHEN"}},jne={GAME_FULL:"Spiel ist voll",GAME_STARTED:"Spiel hat bereits begonnen",ROOM_NOT_FOUND:"Raum wurde nicht gefunden."},zne={GAME_FULL:"SPIEL IST VOLL",GAME_STARTED:"SPIEL HAT BEREITS BEGONNEN",JOIN_AUDIENCE:"INS PUBLIKUM SETZEN",RECONNECT:"NEU VERBINDEN",TWITCH_LOGIN:"MIT TWITCH ANMELDEN"},qne={CAMERA:"[b]ACHTUNG:[/b] Es wurde keine Kamera erkannt, aber du kannst das Spiel auch ohne Foto spielen. Falls eine Kamera vorhanden ist, probiere es mit einem anderen Browser.",STYLE:"[b]ACHTUNG:[/b] Dein Browser scheint etwas veraltet zu sein. Es könnte Probleme bei der Anzeige dieses Spiels geben.",TOS:"Wenn du auf {submit} klickst, erklärst du dich mit unseren [tos]Nutzungsbedingungen[/tos] einverstanden"},Yne={BRANCH:Mne,COOKIE:$ne,ERROR:Kne,FORM:kne,HOMEPAGE_LINK:Gne,MENU:Vne,NEWSLETTER:Fne,PAST_GAME:Hne,PAST_GAMES:Wne,RECENT_GAMES:Xne,STATUS:jne,SUBMIT:zne,WARNING:qne},Jne={LABEL:"RAMA",REFRESH_REQUIRED:"Actualización requerida",PREFERRED:"RAMA PREFERIDA",SELECT:"Selecciona una rama",WAITING:"Esperando la sala"},Qne={ACCEPT_ALL:"¡Vale!",CONSENT_MODAL:{ARIA:"Formulario de consentimiento para el uso de cookies"},DESCRIPTION:"Usamos las cookies para mejorar tu experiencia de juego y analizar el tráfico del sitio web. Puedes encontrar más información en nuestra [pp]política de privacidad[/pp].",REJECT_ALL:"No aceptar"},Zne={UNSUPPORTED_BROWSER:"El juego no es compatible con este navegador. En '?' y AYUDA puedes ver la lista de navegadores compatibles.",ROOM_IS_FULL:"La sala está llena",ROOM_NOT_FOUND:"No se encuentra la sala",AUDIENCE_IS_FULL:"El público está completo",UNABLE_TO_CONNECT:"No ha podido establecerse conexión con el servidor de Jackbox Games. Puede ser debido a los bloqueadores de anuncios o a las extensiones de privacidad.",UNABLE_TO_PRELOAD:"No se ha podido precargar este lote de juegos",KICKED:"No puedes unirte porque te ha expulsado un moderador",REQUIRES_TWITCH_LOGIN:"Este juego requiere un inicio de sesión de Twitch",ROOM_IS_LOCKED:"El juego está bloqueado",INCORRECT_PASSWORD:"Contraseña incorrecta",GENERIC:"Error al unirte al juego",FILTER_NAME:"Esta partida tiene activados los filtros de lenguaje malsonante. Elige un nombre diferente."},eie={NAME:"NOMBRE",NAME_PLACEHOLDER:"INDICA TU NOMBRE",PASSWORD_PLACEHOLDER:"INTRODUCIR CONTRASEÑA DE 5 DÍGITOS",PASSWORD_REQUIRED_TITLE:"Hace falta una contraseña",PASSWORD_REQUIRED_BODY:"Introduce la contraseña o únete como público",PASSWORD_JOIN_AS_PLAYER:"Unirse como jugador",PASSWORD_JOIN_AS_AUDIENCE:"Unirse como público",ROOM_CODE:"CÓDIGO DE LA SALA",ROOM_CODE_PLACEHOLDER:"INTRODUCIR CÓDIGO DE 4 CARACTERES"},tie="Enlace a la página inicial de Jackbox Games",rie={APPEARANCE:"APARIENCIA",DARK:"oscura",HELP:"AYUDA",TWITCH:"TWITCH",LIGHT:"clara",LOGOUT:"CERRAR SESIÓN",MERCH:"MERCHANDISING",PAST_GAMES:"PARTIDAS ANTERIORES",MAILING_LIST:"LISTA DE CORREO",MODERATOR:"MODERADOR"},nie={EMAIL_INPUT_PLACEHOLDER:"Dirección de correo electrónico",JOIN:"Únete a nuestro boletín de noticias",SUBSCRIBED:"¡Gracias por apuntarte a nuestra lista de correo!"},iie={CALL_TO_ACTION:{SHOP:"VER JUEGO Y COMPRAR",VIEW:"VER ESTE JUEGO"},NEW:"NUEVO",PLAYED_ON:"SE JUEGA EN",REMOVE:{CONFIRM:"¿Estás seguro?",DESCRIPTION:`Esto eliminará de forma permanente esta partida
-de tu lista de partidas anteriores.`,MANAGE:"¿Retirar partida?",TITLE:"¿Estás seguro?"}},sie={EMPTY:"Todavía no hay partidas anteriores",MANAGE:"ADMINISTRAR",TITLE:"PARTIDAS ANTERIORES"},aie={TITLE:"PARTIDAS RECIENTES",VIEW_ALL:{BUTTON:"VER TODO",LINK:"VER TODAS LAS PARTIDAS ANTERIORES"}},oie={GAME_FULL:"La partida está completa",GAME_STARTED:"La partida ha empezado",ROOM_NOT_FOUND:"No se encuentra la sala"},lie={GAME_FULL:"LA PARTIDA ESTÁ COMPLETA",GAME_STARTED:"LA PARTIDA HA EMPEZADO",JOIN_AUDIENCE:"UNIRSE COMO PÚBLICO",RECONNECT:"RECONECTAR",TWITCH_LOGIN:"INICIAR SESIÓN CON TWITCH"},uie={CAMERA:"[b]AVISO:[/b] No se detecta ninguna cámara, pero puedes jugar sin foto. Si crees que se trata de un error, cambia de navegador.",STYLE:"[b]AVISO:[/b] Tu navegador está un poco desactualizado, así que es posible que el juego no se vea del todo bien.",TOS:"Al hacer clic en {submit}, aceptas las [tos]Condiciones del servicio[/tos]"},fie={BRANCH:Jne,COOKIE:Qne,ERROR:Zne,FORM:eie,HOMEPAGE_LINK:tie,MENU:rie,NEWSLETTER:nie,PAST_GAME:iie,PAST_GAMES:sie,RECENT_GAMES:aie,STATUS:oie,SUBMIT:lie,WARNING:uie},cie={LABEL:"RAMA",REFRESH_REQUIRED:"Requiere actualizar",PREFERRED:"RAMA PREFERIDA",SELECT:"Selecciona una rama",WAITING:"Esperando una sala"},pie={ACCEPT_ALL:"¡Listo!",CONSENT_MODAL:{ARIA:"Formulario de consentimiento de cookies"},DESCRIPTION:"Usamos cookies para mejorar tu experiencia de juego y analizar el tráfico web. Para obtener más información, consulta nuestro [pp]Aviso de Privacidad[/pp].",REJECT_ALL:"No participar"},die={UNSUPPORTED_BROWSER:"El juego no es compatible con este navegador. En '?' o AYUDA puedes ver la lista de navegadores compatibles.",ROOM_IS_FULL:"La partida está completa",ROOM_NOT_FOUND:"No se encuentra la sala",AUDIENCE_IS_FULL:"El público está completo",UNABLE_TO_CONNECT:"No podemos conectarte a los servidores de Jackbox Games. Puede ser debido a los bloqueadores de anuncios y las extensiones de privacidad.",UNABLE_TO_PRELOAD:"No se puede precargar este paquete de juegos",KICKED:"No puedes unirte porque un moderador te expulsó",REQUIRES_TWITCH_LOGIN:"Este juego requiere inicio de sesión de Twitch",ROOM_IS_LOCKED:"La partida está bloqueada",INCORRECT_PASSWORD:"Contraseña incorrecta",GENERIC:"Error al unirte a la partida",FILTER_NAME:"Esta partida tiene activados los filtros de lenguaje soez. Elige un nombre diferente."},hie={NAME:"NOMBRE",NAME_PLACEHOLDER:"ESCRIBE TU NOMBRE",PASSWORD_PLACEHOLDER:"INGRESA CONTRASEÑA DE 5 DÍGITOS",PASSWORD_REQUIRED_TITLE:"Requiere contraseña",PASSWORD_REQUIRED_BODY:"Ingresa la contraseña o únete como parte del público",PASSWORD_JOIN_AS_PLAYER:"Unirse como jugador",PASSWORD_JOIN_AS_AUDIENCE:"Unirse al público",ROOM_CODE:"CÓDIGO DE LA SALA",ROOM_CODE_PLACEHOLDER:"INGRESA EL CÓDIGO DE 4 CARACTERES"},Eie="Enlace a la página de inicio de Jackbox Games",mie={APPEARANCE:"APARIENCIA",DARK:"oscura",HELP:"AYUDA",TWITCH:"TWITCH",LIGHT:"clara",LOGOUT:"CERRAR SESIÓN",MERCH:"PRODUCTOS",PAST_GAMES:"PARTIDAS ANTERIORES",MAILING_LIST:"LISTA DE CORREO",MODERATOR:"MODERADOR"},gie={EMAIL_INPUT_PLACEHOLDER:"Dirección de correo electrónico",JOIN:"Únete a nuestro boletín de noticias",SUBSCRIBED:"¡Gracias por suscribirte a nuestra lista de correo!"},_ie={CALL_TO_ACTION:{SHOP:"VER JUEGO Y TIENDA",VIEW:"VER ESTE JUEGO"},NEW:"NUEVO",PLAYED_ON:"SE JUGÓ EN",REMOVE:{CONFIRM:"¿De verdad?",DESCRIPTION:`Eliminarás permanentemente este juego
-de tu lista de partidas anteriores.`,MANAGE:"¿Eliminar juego?",TITLE:"¿De verdad?"}},Tie={EMPTY:"Aún no hay partidas anteriores",MANAGE:"ADMINISTRAR",TITLE:"TUS PARTIDAS ANTERIORES"},vie={TITLE:"PARTIDAS RECIENTES",VIEW_ALL:{BUTTON:"VER TODOS",LINK:"VER TODAS LAS PARTIDAS ANTERIORES"}},bie={GAME_FULL:"La partida está completa",GAME_STARTED:"La partida ha empezado",ROOM_NOT_FOUND:"No se encuentra la sala"},xie={GAME_FULL:"LA PARTIDA ESTÁ COMPLETA",GAME_STARTED:"LA PARTIDA HA EMPEZADO",JOIN_AUDIENCE:"UNIRSE AL PÚBLICO",RECONNECT:"RECONECTAR",TWITCH_LOGIN:"INICIAR SESIÓN CON TWITCH"},Rie={CAMERA:"[b]AVISO:[/b] No se detecta ninguna cámara, pero igual puedes jugar sin una foto. Si crees que se trata de un error, cambia de navegador.",STYLE:"[b]AVISO:[/b] Tu navegador está un poco desactualizado, así que es posible que el juego no se vea del todo bien.",TOS:"Al hacer clic en {submit}, aceptas las [tos]Condiciones del servicio[/tos]"},Sie={BRANCH:cie,COOKIE:pie,ERROR:die,FORM:hie,HOMEPAGE_LINK:Eie,MENU:mie,NEWSLETTER:gie,PAST_GAME:_ie,PAST_GAMES:Tie,RECENT_GAMES:vie,STATUS:bie,SUBMIT:xie,WARNING:Rie},yie={LABEL:"RAMO",REFRESH_REQUIRED:"Atualização obrigatória",PREFERRED:"RAMO DE PREFERÊNCIA",SELECT:"Selecione um ramo",WAITING:"Aguardando sala"},Aie={ACCEPT_ALL:"Entendi!",CONSENT_MODAL:{ARIA:"Formulário de consentimento ao uso de cookies"},DESCRIPTION:"Nós usamos cookies para aprimorar sua experiência de jogo e analisar o tráfego do site. Saiba mais na nossa [pp]Política de Privacidade[/pp].",REJECT_ALL:"Recusar"},Lie={UNSUPPORTED_BROWSER:"Este jogo não é compatível com este navegador. Clique em “?” ou “AJUDA” para ver uma lista de navegadores compatíveis.",ROOM_IS_FULL:"O jogo está lotado",ROOM_NOT_FOUND:"Sala não encontrada",AUDIENCE_IS_FULL:"A plateia atingiu lotação máxima",UNABLE_TO_CONNECT:"Não foi possível se conectar ao servidor da Jackbox Games. Geralmente isso se deve a bloqueadores de anúncios ou extensões de privacidade.",UNABLE_TO_PRELOAD:"Não foi possível pré-carregar este pacote de jogo",KICKED:"Não é possível entrar, pois um moderador expulsou você",REQUIRES_TWITCH_LOGIN:"O jogo requer login na Twitch",ROOM_IS_LOCKED:"O jogo é privado",INCORRECT_PASSWORD:"Senha incorreta",GENERIC:"Erro ao entrar neste jogo",FILTER_NAME:"Filtros de linguagem imprópria estão ativos neste jogo. Escolha outro nome."},Cie={NAME:"NOME",NAME_PLACEHOLDER:"INSIRA SEU NOME",PASSWORD_PLACEHOLDER:"INSIRA UMA SENHA DE 5 DÍGITOS",PASSWORD_REQUIRED_TITLE:"Senha obrigatória",PASSWORD_REQUIRED_BODY:"Insira a senha ou entre como espectador",PASSWORD_JOIN_AS_PLAYER:"Entrar como jogador",PASSWORD_JOIN_AS_AUDIENCE:"Entrar como espectador",ROOM_CODE:"CÓDIGO DA SALA",ROOM_CODE_PLACEHOLDER:"INSIRA O CÓDIGO DE 4 LETRAS"},wie="Link para a página da Jackbox Games",Oie={APPEARANCE:"TEMA",DARK:"escuro",HELP:"AJUDA",TWITCH:"TWITCH",LIGHT:"claro",LOGOUT:"DESCONECTAR",MERCH:"PRODUTOS",PAST_GAMES:"JOGOS ANTERIORES",MAILING_LIST:"LISTA DE E-MAILS",MODERATOR:"MODERADOR"},Iie={EMAIL_INPUT_PLACEHOLDER:"Endereço de e-mail",ERROR:{EMAIL_EMPTY:"Forneça um e-mail"},JOIN:"Assine o nosso boletim de notícias",SUBSCRIBED:"Obrigado por se inscrever na lista de e-mails!"},Nie={CALL_TO_ACTION:{SHOP:"VER JOGO E EXPLORAR",VIEW:"VER ESTE JOGO"},NEW:"NOVO",PLAYED_ON:"JOGADO EM",REMOVE:{CONFIRM:"Tem certeza?",DESCRIPTION:`Este jogo será removido permanentemente
-de sua lista de jogos anteriores.`,MANAGE:"Remover jogo?",TITLE:"Tem certeza?"}},Pie={EMPTY:"Nenhum jogo anterior",MANAGE:"GERENCIAR",TITLE:"SEUS JOGOS ANTERIORES"},Uie={TITLE:"JOGOS RECENTES",VIEW_ALL:{BUTTON:"VER TUDO",LINK:"VER TODOS OS JOGOS ANTERIORES"}},Die={GAME_FULL:"O jogo está lotado",GAME_STARTED:"O jogo começou",ROOM_NOT_FOUND:"Sala não encontrada"},Bie={GAME_FULL:"O JOGO ESTÁ LOTADO",GAME_STARTED:"O JOGO COMEÇOU",JOIN_AUDIENCE:"ENTRAR COMO ESPECTADOR",RECONNECT:"RECONECTAR",TWITCH_LOGIN:"FAZER LOGIN COM A TWITCH"},Mie={CAMERA:"[b]AVISO:[/b] não detectamos nenhuma câmera, mas você ainda pode jogar sem foto. Se preferir, tente entrar com outro navegador.",STYLE:"[b]AVISO:[/b] seu navegador está desatualizado e terá problemas para exibir o jogo.",TOS:"Clicando em {submit}, você concordará com os nossos [tos]Termos de Serviço[/tos]"},$ie={BRANCH:yie,COOKIE:Aie,ERROR:Lie,FORM:Cie,HOMEPAGE_LINK:wie,MENU:Oie,NEWSLETTER:Iie,PAST_GAME:Nie,PAST_GAMES:Pie,RECENT_GAMES:Uie,STATUS:Die,SUBMIT:Bie,WARNING:Mie},Da={en:lne,fr:xne,it:Bne,de:Yne,es:fie,"es-XL":Sie,"pt-BR":$ie},br=[];for(let t=0;t<256;++t)br.push((t+256).toString(16).slice(1));function Kie(t,e=0){return(br[t[e+0]]+br[t[e+1]]+br[t[e+2]]+br[t[e+3]]+"-"+br[t[e+4]]+br[t[e+5]]+"-"+br[t[e+6]]+br[t[e+7]]+"-"+br[t[e+8]]+br[t[e+9]]+"-"+br[t[e+10]]+br[t[e+11]]+br[t[e+12]]+br[t[e+13]]+br[t[e+14]]+br[t[e+15]]).toLowerCase()}let _h;const kie=new Uint8Array(16);function Gie(){if(!_h){if(typeof crypto>"u"||!crypto.getRandomValues)throw new Error("crypto.getRandomValues() not supported. See https://github.com/uuidjs/uuid#getrandomvalues-not-supported");_h=crypto.getRandomValues.bind(crypto)}return _h(kie)}const Vie=typeof crypto<"u"&&crypto.randomUUID&&crypto.randomUUID.bind(crypto),tR={randomUUID:Vie};function Fie(t,e,r){if(tR.randomUUID&&!e&&!t)return tR.randomUUID();t=t||{};const n=t.random||(t.rng||Gie)();return n[6]=n[6]&15|64,n[8]=n[8]&63|128,Kie(n)}const Hie=lr({props:{room:Object},emits:["resolve"],data(){return{passwordLength:5,password:""}},computed:{canSubmit(){return this.password.length>=this.passwordLength}},mounted(){this.$refs.input.focus()},methods:{onInput(t){const e=t.target;this.password=e.value.toUpperCase()}}}),Wie="https://bundles.jackbox.tv/main/@connect/assets/BP6xhM9y.png",Xie={class:"jbg password"},jie={class:"text"},zie={key:0,class:"subtext"},qie={class:"actions"},Yie=["value","placeholder","maxlength"],Jie=["disabled"],Qie={class:"or"};function Zie(t,e,r,n,i,s){const o=hs("bb");return Oe(),Pe("div",Xie,[e[5]||(e[5]=Ae("img",{class:"image",src:Wie,alt:"Enter Password"},null,-1)),Ae("h3",jie,Ye(t.$t("FORM.PASSWORD_REQUIRED_TITLE")),1),t.room.audienceEnabled?(Oe(),Pe("p",zie,Ye(t.$t("FORM.PASSWORD_REQUIRED_BODY")),1)):vt("",!0),Ae("div",qie,[Ae("input",{ref:"input",type:"text",value:t.password,placeholder:t.$t("FORM.PASSWORD_PLACEHOLDER"),maxlength:t.passwordLength,autocapitalize:"off",autocorrect:"off",autocomplete:"off","aria-label":"password",onInput:e[0]||(e[0]=(...f)=>t.onInput&&t.onInput(...f))},null,40,Yie),Ae("button",{type:"submit",disabled:!t.canSubmit,onClick:e[1]||(e[1]=dn(f=>t.$emit("resolve",t.password),["prevent"]))},Ye(t.$t("FORM.PASSWORD_JOIN_AS_PLAYER")),9,Jie),t.room.audienceEnabled?(Oe(),Pe(Yt,{key:0},[e[4]||(e[4]=Ae("hr",null,null,-1)),Ae("p",Qie,Ye(t.$t("SEPARATOR.OR")),1),or(Ae("button",{class:"audience",type:"submit",onClick:e[2]||(e[2]=dn(f=>t.$emit("resolve",!0),["prevent"]))},null,512),[[o,t.$t("FORM.PASSWORD_JOIN_AS_AUDIENCE")]])],64)):(Oe(),Pe("button",{key:1,class:"cancel",onClick:e[3]||(e[3]=dn(f=>t.$emit("resolve",!1),["prevent"]))},Ye(t.$t("ACTION.CANCEL")),1))])])}const ese=Ar(Hie,[["render",Zie],["__scopeId","data-v-711f56b2"]]),tse=lr({components:{TextInput:Pj},props:{match:Object,twitchUser:Object},emits:{twitchLoginWasClicked:()=>!0},data(){return{codeLength:4,code:"",nameLength:12,name:"",passwordLength:5,password:"",branch:"",isConnecting:!1,reconnectData:null,api:new vW.APIClient({host:us.serverUrl,scheme:"https"}),isPreloading:!1,preloaded:{appTag:null,branch:null},room:null,roomNotFound:!1,warnings:[]}},computed:{canConnect(){return!(!this.hasFormData||this.isConnecting||this.isPreloading||!this.preloaded.appTag)},hasFormData(){return!(this.code.length!==this.codeLength||!this.name||this.name.length>this.nameLength)},isReconnectable(){var t,e,r;return!(!this.reconnectData||((t=this.room)==null?void 0:t.code)!==this.reconnectData.code||(r=(e=this.game)==null?void 0:e.features)!=null&&r.includes("dropInDropOut")&&this.room&&this.reconnectData.joinAs==="audience"&&!this.room.full)},game(){var t;return(t=this.room)!=null&&t.appTag?Fl(this.room.appTag)??null:null},state(){var e,r;if(!this.room)return{canSubmit:!1,statusKey:this.code.length===this.codeLength&&this.roomNotFound?"STATUS.ROOM_NOT_FOUND":"",submitKey:"ACTION.PLAY"};let t="???";return(e=this.game)!=null&&e.name&&((r=this.game)!=null&&r.isPublic||us.isDevelopment())&&(t=this.game.name),this.isReconnectable?{canSubmit:this.canConnect,statusKey:t,submitKey:"SUBMIT.RECONNECT",joinAs:this.reconnectData.joinAs}:this.room.locked?this.room.audienceEnabled?{canSubmit:this.canConnect,statusKey:"STATUS.GAME_STARTED",submitKey:"SUBMIT.JOIN_AUDIENCE",joinAs:"audience"}:{canSubmit:!1,statusKey:"STATUS.GAME_STARTED",submitKey:"SUBMIT.GAME_STARTED"}:this.room.full?this.room.audienceEnabled?{canSubmit:this.canConnect,statusKey:"STATUS.GAME_FULL",submitKey:"SUBMIT.JOIN_AUDIENCE",joinAs:"audience"}:{canSubmit:!1,statusKey:"STATUS.GAME_FULL",submitKey:"SUBMIT.GAME_FULL"}:{canSubmit:this.canConnect,statusText:t,submitKey:"ACTION.PLAY",joinAs:"player"}},shouldShowBranchOptions(){return window.tv.manifest.environment!=="production"},branchOptions(){if(!this.room)return{};const t={};return Object.entries(window.tv.manifest.branches).forEach(([e,r])=>{r.bundles[this.room.appTag]&&(t[e]=r)}),t},selectedBranch(){return window.tv.manifest.branches[this.branch]},selectedBundle(){var t;if(this.room)return(t=window.tv.manifest.branches[this.branch])==null?void 0:t.bundles[this.room.appTag]},displayBranchLastUpdated(){if(this.selectedBranch)return new Date(this.selectedBranch.lastUpdated).toLocaleString()},displayBranchType(){if(this.selectedBranch)return this.selectedBranch.type==="production"?"PROD":"DEV"},displayVersion(){var t,e;return((t=this.selectedBundle)==null?void 0:t.version)??((e=this.selectedBranch)==null?void 0:e.version)}},watch:{twitchUser:"twitchDidUpdate",branch:"preloadBundle"},beforeMount(){this.populateFromStorage(),this.populateFromURL(),this.checkReconnect()},methods:{populateFromStorage(){Je.isSupported&&(this.code=(Je.get("code")??"").toUpperCase(),this.name=(Je.get("name")??"").toUpperCase())},populateFromURL(){var n,i,s,o,f,c;const t=(i=(n=this.match)==null?void 0:n.params)==null?void 0:i.code,e=(o=(s=this.match)==null?void 0:s.params)==null?void 0:o.name,r=(c=(f=this.match)==null?void 0:f.params)==null?void 0:c.password;t&&t.length===this.codeLength&&(this.code=t.toUpperCase(),this.getRoomInfo()),e&&(this.name=e),r&&(this.password=r)},async checkReconnect(){if(!this.code)return;if(await this.getRoomInfo(),!this.room){this.code="",Je.remove("code"),Je.remove("reconnect");return}const t=Je.get("reconnect");if(t){const[e,r,n,i]=t.split(":");this.reconnectData={code:this.code,id:parseInt(e,10),joinAs:r,secret:n,branch:i}}},onCodeInput(){const t=/\s/g;if(this.code=this.code.replace(t,"").trim().toUpperCase(),this.code.length!==this.codeLength){this.room=null;return}this.getRoomInfo()},onNameInput(){const t=/^\s+/;this.name=this.name.replace(t,"");const e=rE.username(this.name);this.name=e.toUpperCase()},async onFormSubmit(){await this.connect(this.state.joinAs)},getBranchForRoom(){var n,i;if(!this.room)return null;const t=this.room.appTag,e=window.tv.manifest.branches,r=[this.branch,(i=(n=this.match)==null?void 0:n.params)==null?void 0:i.branch,this.room.controllerBranch,"** hmr **",Je.get("preference:branch"),"** dist **","main"];for(let s=0;s<=r.length;s++){const o=r[s];if(o&&e[o]&&e[o].bundles[t])return o}return null},shouldPromptForPassword(t){return!(t!=="player"||this.isReconnectable||!this.room.passwordRequired||this.password)},async promptForPassword(){const t=await this.$showModal(ese,{room:this.room});if(t){if(t===!0){this.connect("audience");return}this.password=t,this.connect("player")}},shouldPromptForTwitch(t){return!(t!=="player"||!this.room.twitchLocked||this.twitchUser)},async promptForTwitch(){var r;const t=[{text:this.$t("SUBMIT.TWITCH_LOGIN"),classes:["twitch"],value:"twitch"}];switch((r=this.room)!=null&&r.audienceEnabled?t.push({text:this.$t("SUBMIT.JOIN_AUDIENCE"),classes:["audience"],value:"audience"}):t.push({text:this.$t("ACTION.CANCEL"),classes:["cancel"],value:"cancel"}),await this.$showModal("Options",{text:this.$t("ERROR.REQUIRES_TWITCH_LOGIN"),options:t})){case"twitch":this.$emit("twitchLoginWasClicked");return;case"audience":this.connect("audience")}},twitchDidUpdate(t,e){if(t){let r=t.display_name;r.length>this.nameLength&&(r=`${r.slice(0,this.nameLength-1)}…`),this.name=r;return}e&&!t&&(this.name="")},async promptForRetry(t){var n;let e=[{text:this.$t("ACTION.OK"),classes:["cancel"],value:"close"}];if((n=this.room)!=null&&n.audienceEnabled&&(e=[{text:this.$t("FORM.PASSWORD_JOIN_AS_AUDIENCE"),classes:["audience"],value:"audience"},{text:this.$t("ACTION.CANCEL"),classes:["cancel"],value:"close"}]),t==="ERROR.AUDIENCE_IS_FULL"&&(e=[{text:this.$t("ACTION.OK"),classes:["ok"],value:"ok"}]),await this.$showModal("Options",{text:this.$t(t),options:e})==="audience")return this.connect("audience")},async getRoomInfo(){this.roomNotFound=!1;try{const t=await this.api.getRoom({code:this.code});this.room=t,this.warnings=await NW.warningsForAppTag(t.appTag),this.$i18n.locale=this.room.locale;const e=this.getBranchForRoom();if(!e)return;this.branch=e,await this.preloadBundle()}catch(t){console.warn(t),this.room=null,this.roomNotFound=!0,this.branch=""}},async preloadBundle(){if(!this.room||!this.branch||this.isPreloading)return;const t=this.preloaded.appTag!==this.room.appTag,e=this.preloaded.branch!==this.branch;if(!(!t&&!e)){this.preloaded={appTag:null,branch:null};try{this.isPreloading=!0,await window.tv.load({app:this.room.appTag,branch:this.branch}),this.preloaded={appTag:this.room.appTag,branch:this.branch}}catch(r){console.error(r),this.showError("ERROR.UNABLE_TO_PRELOAD")}this.isPreloading=!1}},getConnectOptions(t){const e=t==="audience"?this.room.audienceHost:this.room.host;let r=rE.username(this.name).trim();r.length>this.nameLength&&(r=`${r.substring(0,this.nameLength-1)}…`);let n=Fie();Je.isSupported&&(n=Je.get("uuid")??n,Je.set("uuid",n));const i={host:e,code:this.code.toUpperCase(),name:r,password:this.password,role:t,userId:n,debug:"false"};return this.twitchUser&&(i.twitchToken=this.twitchUser.token),this.isReconnectable&&(i.id=this.reconnectData.id,i.secret=this.reconnectData.secret),i},async connect(t){var r,n,i,s;if(!t||this.isConnecting||!this.state.canSubmit)return;if(await this.getRoomInfo(),!this.room)return this.showError("ERROR.ROOM_NOT_FOUND");if(this.shouldPromptForPassword(t))return this.promptForPassword();if(this.shouldPromptForTwitch(t))return this.promptForTwitch();if(!window.tv.connect||!window.tv.mount)return this.showError("ERROR.GENERIC");const e=this.getConnectOptions(t);if(e.host&&e.code&&e.name&&!this.isConnecting)try{this.isConnecting=!0;const o=await window.tv.connect(e);return this.storeReconnectData(e,o,t),aa.setup(),aa.gameJoined(this.room.appTag,{role:t,locale:this.room.locale||"en",isQR:((n=(r=this.match)==null?void 0:r.params)==null?void 0:n.ref)==="qr",isTwitchConnected:!!e.twitchToken,isReconnect:o.reconnect}),window.tv.mount({app:this.room.appTag,branch:this.branch,match:this.match,room:this.room,version:((i=this.selectedBundle)==null?void 0:i.version)??((s=this.selectedBranch)==null?void 0:s.version),welcome:o})}catch(o){console.error("[connect]",o),this.isConnecting=!1,this.onConnectionError(o,t)}},storeReconnectData(t,e,r){Je.isSupported&&this.shouldReplaceReconnectData(r)&&(Je.set("name",t.name),Je.set("code",this.code),Je.set("branch",this.branch),Je.set("reconnect",`${e.id}:${r}:${e.secret}:${this.branch}`))},shouldReplaceReconnectData(t){var e,r,n;return t==="player"||((e=this.reconnectData)==null?void 0:e.joinAs)!=="player"||!((n=(r=this.game)==null?void 0:r.features)!=null&&n.includes("dropInDropOut"))},isEcastError(t){return"code"in t},async onConnectionError(t,e){var r;if(this.isEcastError(t))return t.code===2010?e==="audience"?this.promptForRetry("ERROR.AUDIENCE_IS_FULL"):this.promptForRetry("ERROR.ROOM_IS_FULL"):t.code===2009?this.promptForRetry("ERROR.ROOM_IS_LOCKED"):t.code===2018?(await this.$showModal("Error",{text:this.$t("ERROR.TITLE"),subtext:this.$t("ERROR.INCORRECT_PASSWORD"),dismissText:this.$t("ACTION.TRY_AGAIN")}),this.password="",this.connect("player")):t.code===2013?this.showError("ERROR.ROOM_NOT_FOUND"):t.code===2015?this.showError("ERROR.REQUIRES_TWITCH_LOGIN"):t.code===2017?this.showError("FORM.PASSWORD_REQUIRED_TITLE"):t.code===2021?this.showError("ERROR.FILTER_NAME"):t.code===2023?this.showError("ERROR.KICKED"):void 0;if((r=t.message)!=null&&r.includes("Network request failed"))return this.showError("ERROR.UNABLE_TO_CONNECT");this.showError("ERROR.GENERIC")},showError(t){this.$showModal("Error",{text:this.$t("ERROR.TITLE"),subtext:this.$t(t),dismissText:this.$t("ACTION.OK")})}}}),rse={for:"roomcode"},nse={key:0,class:"status"},ise={key:1,class:"status"},sse={key:0,class:"warnings"},ase={for:"username"},ose={class:"remaining"},lse={for:"branch"},use={key:0,class:"status date"},fse=["disabled"],cse={key:0,value:"",disabled:""},pse={key:1,value:"",disabled:""},dse=["value"],hse={key:0,class:"details"},Ese=["disabled"],mse={class:"tos",role:"complementary"};function gse(t,e,r,n,i,s){const o=qr("TextInput"),f=hs("t"),c=hs("bb");return Oe(),Pe("form",{autocomplete:"off",onSubmit:e[3]||(e[3]=dn((...d)=>t.onFormSubmit&&t.onFormSubmit(...d),["prevent"]))},[Ae("fieldset",null,[Ae("label",rse,[ps(Ye(t.$t("FORM.ROOM_CODE"))+" ",1),t.state.statusKey?or((Oe(),Pe("span",nse,null,512)),[[f,t.state.statusKey]]):t.state.statusText?(Oe(),Pe("span",ise,Ye(t.state.statusText),1)):vt("",!0)]),Kt(o,{id:"roomcode",modelValue:t.code,"onUpdate:modelValue":e[0]||(e[0]=d=>t.code=d),type:"text",autocapitalize:"off",autocorrect:"off",autocomplete:"off",placeholder:t.$t("FORM.ROOM_CODE_PLACEHOLDER"),maxlength:t.codeLength,onInput:t.onCodeInput},null,8,["modelValue","placeholder","maxlength","onInput"]),t.room&&t.warnings.length?(Oe(),Pe("div",sse,[(Oe(!0),Pe(Yt,null,Es(t.warnings,d=>(Oe(),Pe(Yt,null,[d==="flexbox"?or((Oe(),Pe("p",{key:d})),[[c,t.$t("WARNING.STYLE")]]):vt("",!0),d==="canvas"?or((Oe(),Pe("p",{key:d})),[[c,t.$t("ERROR.UNSUPPORTED_BROWSER")]]):vt("",!0),d==="camera"?or((Oe(),Pe("p",{key:d})),[[c,t.$t("WARNING.CAMERA")]]):vt("",!0)],64))),256))])):vt("",!0),Ae("label",ase,[ps(Ye(t.$t("FORM.NAME"))+" ",1),Ae("span",ose,Ye(t.nameLength-t.name.length),1)]),Kt(o,{id:"username",modelValue:t.name,"onUpdate:modelValue":e[1]||(e[1]=d=>t.name=d),type:"text",autocapitalize:"off",autocorrect:"off",autocomplete:"off",disabled:t.twitchUser!==void 0,placeholder:t.$t("FORM.NAME_PLACEHOLDER"),maxlength:t.nameLength,onInput:t.onNameInput},null,8,["modelValue","disabled","placeholder","maxlength","onInput"]),t.shouldShowBranchOptions?(Oe(),Pe(Yt,{key:1},[Ae("label",lse,[ps(Ye(t.$t("BRANCH.LABEL"))+" ",1),t.selectedBranch?(Oe(),Pe("span",use,Ye(t.displayBranchLastUpdated),1)):vt("",!0)]),Ae("div",{class:Vr(["select",{disabled:!t.room}])},[or(Ae("select",{id:"branch","onUpdate:modelValue":e[2]||(e[2]=d=>t.branch=d),class:Vr({"no-selection":!t.selectedBranch}),disabled:!t.room||t.isPreloading},[t.room?(Oe(),Pe("option",pse,Ye(t.$t("BRANCH.SELECT")),1)):(Oe(),Pe("option",cse,Ye(t.$t("BRANCH.WAITING")),1)),(Oe(!0),Pe(Yt,null,Es(t.branchOptions,(d,p)=>(Oe(),Pe("option",{key:p,value:p},Ye(p),9,dse))),128))],10,fse),[[xS,t.branch]]),t.selectedBranch?(Oe(),Pe("p",hse,Ye(t.displayBranchType)+" "+Ye(t.displayVersion),1)):vt("",!0)],2)],64)):vt("",!0),Ae("button",{id:"button-join",type:"submit",class:Vr({connecting:t.isConnecting,audience:t.state.joinAs==="audience"}),disabled:!t.state.canSubmit},[Ae("span",null,Ye(t.$t(t.state.submitKey)),1),e[4]||(e[4]=Ae("div",{class:"loading"},null,-1))],10,Ese)]),or(Ae("p",mse,null,512),[[c,t.$t("WARNING.TOS",{submit:t.$t(t.state.submitKey)})]])],32)}const _se=Ar(tse,[["render",gse],["__scopeId","data-v-b605d1d7"]]),Tse=lr({props:{pastGame:{type:Object,required:!0},isManaging:Boolean,index:Number,location:String},emits:{remove:t=>!0},data(){return{viewed:!1,status:"loading",showConfirm:!1}},computed:{cta(){var t;return(t=this.pastGame.game.shopItems)!=null&&t.length?this.$t("PAST_GAME.CALL_TO_ACTION.SHOP"):this.$t("PAST_GAME.CALL_TO_ACTION.VIEW")},hasPreviews(){var t;return((t=this.pastGame.game.features)==null?void 0:t.includes("previews"))??!1},imageClasses(){return this.status==="error"||!this.hasPreviews?["fallback",this.pastGame.artifact.categoryId]:this.status==="success"?["preview"]:[]},imageSrc(){return`https://s3.amazonaws.com/jbg-blobcast-artifacts/${this.pastGame.artifact.categoryId}/${this.pastGame.artifact.artifactId}/preview.png`},name(){return this.showConfirm?this.$t("PAST_GAME.REMOVE.CONFIRM"):this.isManaging?this.$t("PAST_GAME.REMOVE.MANAGE"):this.pastGame.game.name??""}},watch:{isManaging(){this.showConfirm=!1}},mounted(){aa.galleryImpression(this.pastGame.artifact.categoryId,this.location)},methods:{onImageLoad(){this.status="success"},onImageError(){this.status="error"},onClick(t){if(this.isManaging){t.preventDefault(),this.showConfirm=!0;return}Za.setAsViewed(this.index),this.viewed=!0,aa.galleryClick(this.pastGame.artifact.categoryId,this.location)},onCancelClick(){this.showConfirm=!1}}}),vse=["href"],bse=["src","alt"],xse={class:"cta"},Rse={class:"content"},Sse={class:"name"},yse={class:"date"},Ase={key:0,class:"new"},Lse={key:0,class:"items"},Cse={key:0,viewBox:"0 0 200 200"},wse={key:1,viewBox:"0 0 200 200"},Ose={key:2,viewBox:"0 0 200 200"},Ise={key:0,class:"confirm"},Nse={class:"contain"};function Pse(t,e,r,n,i,s){return t.pastGame.game?(Oe(),Pe("div",{key:0,class:Vr(["past-game",{managing:t.isManaging,confirming:t.showConfirm}])},[Ae("a",{class:"card",href:t.pastGame.artifact.url,target:"_blank",onClick:e[2]||(e[2]=(...o)=>t.onClick&&t.onClick(...o))},[Ae("div",{class:Vr(["image",t.imageClasses])},[t.hasPreviews?(Oe(),Pe("img",{key:0,ref:"image",src:t.imageSrc,alt:t.pastGame.artifact.gameName,onError:e[0]||(e[0]=(...o)=>t.onImageError&&t.onImageError(...o)),onLoad:e[1]||(e[1]=(...o)=>t.onImageLoad&&t.onImageLoad(...o))},null,40,bse)):vt("",!0)],2),Ae("p",xse,[ps(Ye(t.cta)+" ",1),e[5]||(e[5]=Ae("svg",{viewBox:"0 0 200 200",class:"external-icon"},[Ae("path",{d:`M185,106c-8.3,0-15,6.7-15,15v44c0,2.8-2.2,5-5,5H35c-2.8,0-5-2.2-5-5V35c0-2.8,2.2-5,5-5h44c8.3,0,15-6.7,15-15
-                       S87.3,0,79,0H35C15.7,0,0,15.7,0,35v130c0,19.3,15.7,35,35,35h130
-                       c19.3,0,35-15.7,35-35v-44C200,112.7,193.3,106,185,106z`}),Ae("path",{d:`M184,0h-54c-8.3,0-15,6.7-15,15s6.7,15,15,15h18.8L90.4,88.4c-5.9,5.9-5.9,15.4,0,21.2c2.9,2.9,6.8,4.4,10.6,4.4
-                        s7.7-1.5,10.6-4.4L170,51.2V70c0,8.3,6.7,15,15,15s15-6.7,15-15V16C200,7.2,192.8,0,184,0z`})],-1))]),Ae("div",Rse,[Ae("p",Sse,Ye(t.name),1),Ae("p",yse,[Ae("span",null,Ye(t.$t("PAST_GAME.PLAYED_ON")),1),ps(Ye(t.pastGame.artifact.date),1)])]),!t.viewed&&!t.pastGame.artifact.isViewed?(Oe(),Pe("p",Ase,Ye(t.$t("PAST_GAME.NEW")),1)):vt("",!0)],8,vse),t.pastGame.game.shopItems&&t.pastGame.game.shopItems.length?(Oe(),Pe("div",Lse,[(Oe(!0),Pe(Yt,null,Es(t.pastGame.game.shopItems,o=>(Oe(),Pe("div",{key:o,class:"item"},[o==="cards"?(Oe(),Pe("svg",Cse,e[6]||(e[6]=[Ae("path",{d:`M187.4,47.8l-34.1-15.9V29c0-8.8-7.2-16-16-16H57.8c-8.8,0-16,7.2-16,16v18.9L13.6,61.1c-3.9,1.8-6.8,5-8.3,9
-                    c-1.5,4-1.3,8.4,0.5,12.2l45,96.4c1.8,3.9,5,6.8,9,8.3c1.8,0.6,3.6,1,5.5,1c2.3,0,4.6-0.5,6.8-1.5l42.7-19.9l14.2,6.6
-                    c2.2,1,4.5,1.5,6.7,1.5c6,0,11.8-3.4,14.5-9.2l45-96.4C198.9,61,195.4,51.5,187.4,47.8z M133.4,91.7L107,35.2
-                    c-0.4-0.8-0.8-1.5-1.2-2.1h27.6V91.7z M61.8,33h12l-12,5.6V33z M67.2,166.7L25.7,77.5l64.9-30.3l41.6,89.2l-21.7,10.1
-                    c0,0,0,0,0,0L67.2,166.7z M153.4,111.4V54l22,10.3L153.4,111.4z`},null,-1)]))):o==="mugs"?(Oe(),Pe("svg",wse,e[7]||(e[7]=[Ae("path",{d:`M164.7,52.2h-20.7V35.5c0-6.2-5-11.2-11.2-11.2H47.6c-6.2,0-11.2,5-11.2,11.2v118c0,12.8,10.4,23.2,23.2,23.2h61.3
-                       c12.8,0,23.2-10.4,23.2-23.2v-16.2h20.7c14.3,0,25.9-11.6,25.9-25.9V78.1C190.7,63.8,179,52.2,164.7,52.2z
-                       M174.2,111.4c0,5.2-4.3,9.5-9.5,9.5h-20.7V68.6h20.7c5.2,0,9.5,4.3,9.5,9.5V111.4z`},null,-1)]))):o==="shirts"?(Oe(),Pe("svg",Ose,e[8]||(e[8]=[Ae("path",{d:`M145.5,184.5H55.5c-4.1,0-7.5-3.4-7.5-7.5V95.2H29.6c-3.3,0-6.2-2.1-7.2-5.2L10,50.5c-1.2-3.7,0.7-7.7,4.3-9.2
-                       L72.5,17c1.8-0.7,3.8-0.8,5.6-0.1c0.1,0,6.3,15.1,22.4,15.1S122.7,17,122.9,17c1.8-0.7,3.8-0.7,5.6,0.1l58.2,24.2
-                       c3.6,1.5,5.4,5.5,4.3,9.2L178.5,90c-1,3.1-3.9,5.2-7.2,5.2H153V177C153,181.2,149.7,184.5,145.5,184.5z`},null,-1)]))):vt("",!0)]))),128))])):vt("",!0),Kt(gS,{name:"fade-transition"},{default:pc(()=>[t.showConfirm?(Oe(),Pe("div",Ise,[Ae("div",Nse,[Ae("p",null,[Ae("span",null,Ye(t.$t("PAST_GAME.REMOVE.TITLE")),1),ps(" "+Ye(t.$t("PAST_GAME.REMOVE.DESCRIPTION")),1)]),Ae("button",{class:"confirm-yes",onClick:e[3]||(e[3]=o=>t.$emit("remove",t.index))},Ye(t.$t("ACTION.REMOVE")),1),Ae("button",{class:"confirm-no",onClick:e[4]||(e[4]=(...o)=>t.onCancelClick&&t.onCancelClick(...o))},Ye(t.$t("ACTION.CANCEL")),1)])])):vt("",!0)]),_:1})],2)):vt("",!0)}const _L=Ar(Tse,[["render",Pse],["__scopeId","data-v-8f45b65c"]]),Use=lr({components:{PastGame:_L},props:{recentGames:{type:Array,default:()=>[]}},emits:["pastGamesWasClicked"],methods:{onPastGamesClick(){this.$emit("pastGamesWasClicked")}}}),Dse={key:0,class:"recent"},Bse={class:"constrain"},Mse={class:"top-items"};function $se(t,e,r,n,i,s){const o=qr("PastGame");return t.recentGames.length?(Oe(),Pe("div",Dse,[Ae("div",Bse,[Ae("div",Mse,[Ae("h3",null,Ye(t.$t("RECENT_GAMES.TITLE")),1),Ae("button",{class:"view-all",onClick:e[0]||(e[0]=dn((...f)=>t.onPastGamesClick&&t.onPastGamesClick(...f),["prevent"]))},Ye(t.$t("RECENT_GAMES.VIEW_ALL.BUTTON")),1)]),(Oe(!0),Pe(Yt,null,Es(t.recentGames,f=>(Oe(),Bi(o,{key:f.artifact.url,"past-game":f,class:"home",location:"recent_game"},null,8,["past-game"]))),128)),t.recentGames.length>=3?(Oe(),Pe("a",{key:0,class:"more",href:"#",onClick:e[1]||(e[1]=dn((...f)=>t.onPastGamesClick&&t.onPastGamesClick(...f),["prevent"]))},Ye(t.$t("RECENT_GAMES.VIEW_ALL.LINK")),1)):vt("",!0)])])):vt("",!0)}const Kse=Ar(Use,[["render",$se],["__scopeId","data-v-b57c3cb3"]]),kse=lr({data(){return{isLoading:!1,banners:[]}},watch:{"$i18n.locale":function(){this.load()}},mounted(){this.load()},methods:{async load(){try{const e=await(await fetch("https://cdn.jackboxgames.com/banners.json")).json(),r=(e==null?void 0:e.bannerAds)??[];this.banners=r.filter(this.isValidBanner.bind(this)).map(n=>({url:n.href,image:n.src,text:n.text})),this.banners.length||this.showDefault()}catch(t){this.showDefault(),console.warn("[SlideBanner] Could not load or parse banner data",t)}finally{this.isLoading=!1}},showDefault(){this.banners=[{url:"https://www.jackboxgames.com/packs/the-jackbox-party-pack-10?utm_source=jbgtvpp10&utm_medium=jbgtvpp10&utm_campaign=jbgtvpp10",image:"https://cdn.jackboxgames.com/banner-images/pp10.png",text:"AVAILABLE NOW!"}]},isValidBanner(t){const e=new Date;if(Je.isSupported&&t.tags){const r=t.tags??[],n=JSON.parse(Je.get("tags")??"[]");if(!r.every(s=>n.includes(s)))return!1}if(t.start){const r=new Date(t.start);if(e<r)return!1}if(t.end){const r=new Date(t.end);if(e>r)return!1}return!(!t.locale&&this.$i18n.locale!=="en"||t.locale&&this.$i18n.locale!==t.locale)},onClick(t){window.open(t.url,"_blank"),aa.bannerClick(t.url,"connect")}}}),Gse={class:"slide-banner"},Vse={key:0,class:"loading"},Fse={key:1,"autoplay-delay":5e3,"autoplay-disable-on-interaction":!1,"centered-slides":!0,"edge-swipe-detection":"prevent",loop:!0,pagination:!0,"slides-per-view":1.5,"space-between":6},Hse=["onClick"],Wse=["src"];function Xse(t,e,r,n,i,s){return Oe(),Pe("div",Gse,[t.isLoading?(Oe(),Pe("div",Vse,Ye(t.$t("LOADING")),1)):vt("",!0),!t.isLoading&&t.banners.length?(Oe(),Pe("swiper-container",Fse,[(Oe(!0),Pe(Yt,null,Es(t.banners,o=>(Oe(),Pe("swiper-slide",{key:o.url,class:"slide"},[Ae("button",{onClick:f=>t.onClick(o)},[Ae("img",{src:o.image,draggable:"false",alt:"Advert"},null,8,Wse),Ae("p",null,Ye(o.text),1)],8,Hse)]))),128))])):vt("",!0)])}const jse=Ar(kse,[["render",Xse],["__scopeId","data-v-1a297816"]]),zse=lr({data(){return{value:Je.get("preference:theme")||"device"}},watch:{value(t){Je.set("preference:theme",t),window.dispatchEvent(new CustomEvent("themedidchange"))}}}),qse={class:"appearance"},Yse={for:"appearance"},Jse={id:"appearance"},Qse=["aria-label"],Zse=["aria-label"];function eae(t,e,r,n,i,s){const o=hs("t");return Oe(),Pe("li",qse,[or(Ae("label",Yse,null,512),[[o,"MENU.APPEARANCE"]]),Ae("fieldset",Jse,[e[2]||(e[2]=UB('<svg viewBox="0 0 340 85" data-v-727b0bbe><rect class="frame" x="87.5" width="165" height="85" rx="42.5" vector-effect="non-scaling-stroke" data-v-727b0bbe></rect><circle class="indicator" cx="170" cy="42.5" r="29.8" data-v-727b0bbe></circle><path class="celestial moon" d="M314.64,14.79A29.36,29.36,0,0,1,275,54.4a29.37,29.37,0,1,0,39.6-39.61Z" vector-effect="non-scaling-stroke" data-v-727b0bbe></path><circle class="celestial sun" cx="32.19" cy="42.72" r="13.05" vector-effect="non-scaling-stroke" data-v-727b0bbe></circle><line x1="32.19" y1="10.53" x2="32.19" y2="21.59" vector-effect="non-scaling-stroke" data-v-727b0bbe></line><line x1="32.19" y1="63.85" x2="32.19" y2="74.91" vector-effect="non-scaling-stroke" data-v-727b0bbe></line><line x1="0" y1="42.72" x2="11.06" y2="42.72" vector-effect="non-scaling-stroke" data-v-727b0bbe></line><line x1="53.32" y1="42.72" x2="64.38" y2="42.72" vector-effect="non-scaling-stroke" data-v-727b0bbe></line><line x1="12.01" y1="22.55" x2="17.25" y2="27.78" vector-effect="non-scaling-stroke" data-v-727b0bbe></line><line x1="47.13" y1="57.66" x2="52.36" y2="62.89" vector-effect="non-scaling-stroke" data-v-727b0bbe></line><line x1="12.01" y1="62.89" x2="17.25" y2="57.66" vector-effect="non-scaling-stroke" data-v-727b0bbe></line><line x1="47.13" y1="27.78" x2="52.36" y2="22.55" vector-effect="non-scaling-stroke" data-v-727b0bbe></line></svg>',1)),or(Ae("input",{id:"light","onUpdate:modelValue":e[0]||(e[0]=f=>t.value=f),type:"radio",name:"theme",value:"light","aria-label":t.$t("MENU.LIGHT")},null,8,Qse),[[GT,t.value]]),or(Ae("input",{id:"dark","onUpdate:modelValue":e[1]||(e[1]=f=>t.value=f),type:"radio",name:"theme",value:"dark","aria-label":t.$t("MENU.DARK")},null,8,Zse),[[GT,t.value]])])])}const tae=Ar(zse,[["render",eae],["__scopeId","data-v-727b0bbe"]]),rae=lr({data(){return{canJoinNewsletter:document.getElementById("listrak-sdk")!=null,didSubscribe:!1,email:"",isLoadingSDK:!1,submitText:this.$t("ACTION.SUBMIT")}},computed:{canSubmit(){return!(!this.canJoinNewsletter||!this.hasValidEmail)},hasValidEmail(){return!(!this.email.length||!this.email.match(/.+@.+\..+/))},listrakLocale(){switch(this.$i18n.locale){case"es":return"es-es";case"es-XL":case"es-419":return"es-la"}return this.$i18n.locale}},beforeUnmount(){document.removeEventListener("ltkAsyncListener",this.handleListrakSDKReady)},methods:{addListrakSDKReadyListener(){window._ltk==null?document.addEventListener("ltkAsyncListener",this.handleListrakSDKReady):this.handleListrakSDKReady()},handleListrakSDKReady(){window._ltk_util.ready(()=>{window._ltk.Signup.New("JackboxTVSignUp","listrak-newsletter-input",window._ltk.Signup.TYPE.CLICK,"listrak-newsletter-submit","email"),window._ltk.Signup.SetValue("JackboxTVSignUp","language",this.listrakLocale)})},loadListrakSDK(){if(this.canJoinNewsletter)return;this.isLoadingSDK=!0,this.submitText=this.$t("LOADING");const t=document.createElement("script");t.setAttribute("id","listrak-sdk"),t.setAttribute("src","https://cdn.listrakbi.com/scripts/script.js?m=qIEdIpdHdLiP&v=1"),t.onload=()=>{this.addListrakSDKReadyListener(),this.canJoinNewsletter=!0,this.isLoadingSDK=!1,this.submitText=this.$t("ACTION.SUBMIT")},t.onerror=()=>{this.canJoinNewsletter=!1,this.isLoadingSDK=!1,this.submitText=this.$t("ERROR.TITLE")},document.head.appendChild(t)},onSubscribe(){this.hasValidEmail&&(this.didSubscribe=!0)}}}),nae=["disabled","placeholder"],iae=["value"],sae=["disabled","textContent"],aae={key:1,class:"success"};function oae(t,e,r,n,i,s){const o=hs("t");return Oe(),Pe("form",{class:"signup",onSubmit:e[4]||(e[4]=dn(()=>{},["prevent"]))},[or(Ae("input",{id:"listrak-newsletter-input","onUpdate:modelValue":e[0]||(e[0]=f=>t.email=f),disabled:t.didSubscribe,inputmode:"email",placeholder:t.$t("NEWSLETTER.EMAIL_INPUT_PLACEHOLDER"),type:"email",onFocusOnce:e[1]||(e[1]=(...f)=>t.loadListrakSDK&&t.loadListrakSDK(...f))},null,40,nae),[[vM,t.email]]),Ae("input",{id:"4242",name:"language",value:t.listrakLocale,type:"hidden"},null,8,iae),t.didSubscribe?or((Oe(),Pe("p",aae,null,512)),[[o,"NEWSLETTER.SUBSCRIBED"]]):(Oe(),Pe("button",{key:0,id:"listrak-newsletter-submit",disabled:!t.canSubmit,onClick:e[2]||(e[2]=(...f)=>t.onSubscribe&&t.onSubscribe(...f)),onKeydown:e[3]||(e[3]=Ys((...f)=>t.onSubscribe&&t.onSubscribe(...f),["enter"])),textContent:Ye(t.submitText)},null,40,sae))],32)}const lae=Ar(rae,[["render",oae],["__scopeId","data-v-e33a6bed"]]),uae=lr({data(){const t=Object.keys(window.tv.manifest.branches);let e="main";return t.includes("** hmr **")?e="** hmr **":t.includes("** dist **")&&(e="** dist **"),{branch:Je.get("preference:branch")||e,branchHasChanged:!1}},computed:{branchOptions(){return Object.keys(window.tv.manifest.branches)}},watch:{branch(t,e){e&&e!==t&&(Je.set("preference:branch",t),this.branchHasChanged=!0)}},methods:{reload(){window.location.reload()}}}),fae={key:1,for:"branch"},cae={class:"select"},pae=["value"];function dae(t,e,r,n,i,s){return Oe(),Pe("li",null,[t.branchHasChanged?(Oe(),Pe("label",{key:0,for:"branch",class:"changed",role:"button",tabIndex:"0",onClick:e[0]||(e[0]=(...o)=>t.reload&&t.reload(...o)),onKeyup:e[1]||(e[1]=Ys((...o)=>t.reload&&t.reload(...o),["enter"]))},Ye(t.$t("BRANCH.REFRESH_REQUIRED")),33)):(Oe(),Pe("label",fae,Ye(t.$t("BRANCH.PREFERRED")),1)),Ae("div",cae,[or(Ae("select",{id:"branch","onUpdate:modelValue":e[2]||(e[2]=o=>t.branch=o)},[(Oe(!0),Pe(Yt,null,Es(t.branchOptions,o=>(Oe(),Pe("option",{key:o,value:o},Ye(o),9,pae))),128))],512),[[xS,t.branch]])])])}const hae=Ar(uae,[["render",dae],["__scopeId","data-v-4e7c2aa2"]]),Eae=lr({components:{AppearanceRadio:tae,NewsletterSignup:lae,PreferredBranch:hae},props:{hasUnseenGames:Boolean,twitch:Object},emits:["pastGameWasClicked","twitchLoginWasClicked","twitchLogoutWasClicked"],computed:{shouldShowPreferredBranch(){return window.tv.manifest.environment!=="production"},version(){return window.tv.manifest.loader.version},isTwitchAuthenticated(){return this.twitch.user!==void 0}},methods:{onPastGamesClick(){this.$emit("pastGameWasClicked")},onTwitchLoginClick(){this.$emit("twitchLoginWasClicked")},onTwitchLogoutClick(){this.$emit("twitchLogoutWasClicked")},onLinkClick(t){aa.externalLinkClick(t,"hamburger")}}}),mae={class:"nav"},gae={key:0,class:"twitch"},_ae={key:1,class:"twitch"},Tae={class:"moderator"},vae={href:"/moderator"},bae={key:0,class:"indicator"},xae={class:"newsletter"},Rae={class:"social"},Sae={class:"version"},yae={href:"/manifest"};function Aae(t,e,r,n,i,s){const o=qr("NewsletterSignup"),f=qr("AppearanceRadio"),c=qr("PreferredBranch"),d=hs("t");return Oe(),Pe("nav",mae,[Ae("ul",null,[t.isTwitchAuthenticated?(Oe(),Pe("li",_ae,[Ae("a",{role:"link",tabindex:"0",onKeyup:e[2]||(e[2]=Ys((...p)=>t.onTwitchLogoutClick&&t.onTwitchLogoutClick(...p),["enter"])),onClick:e[3]||(e[3]=dn((...p)=>t.onTwitchLogoutClick&&t.onTwitchLogoutClick(...p),["prevent"]))},Ye(t.$t("MENU.LOGOUT")),33)])):(Oe(),Pe("li",gae,[Ae("a",{role:"link",tabindex:"0",onKeyup:e[0]||(e[0]=Ys((...p)=>t.onTwitchLoginClick&&t.onTwitchLoginClick(...p),["enter"])),onClick:e[1]||(e[1]=dn((...p)=>t.onTwitchLoginClick&&t.onTwitchLoginClick(...p),["prevent"]))},Ye(t.$t("MENU.TWITCH")),33)])),Ae("li",Tae,[Ae("a",vae,Ye(t.$t("MENU.MODERATOR")),1)]),Ae("li",null,[Ae("a",{href:"https://support.jackboxgames.com",target:"_blank",onClick:e[4]||(e[4]=p=>t.onLinkClick("help"))},Ye(t.$t("MENU.HELP")),1)]),Ae("li",null,[Ae("a",{href:"https://jackboxgames.com/shop",target:"_blank",onClick:e[5]||(e[5]=p=>t.onLinkClick("merch"))},Ye(t.$t("MENU.MERCH")),1)]),Ae("li",{role:"link",tabindex:"0",onKeyup:e[6]||(e[6]=Ys((...p)=>t.onPastGamesClick&&t.onPastGamesClick(...p),["enter"])),onClick:e[7]||(e[7]=dn((...p)=>t.onPastGamesClick&&t.onPastGamesClick(...p),["prevent"]))},[Ae("a",null,[ps(Ye(t.$t("MENU.PAST_GAMES"))+" ",1),t.hasUnseenGames?(Oe(),Pe("div",bae)):vt("",!0)])],32),Ae("li",xae,[or(Ae("p",null,null,512),[[d,"NEWSLETTER.JOIN"]]),Kt(o)]),Kt(f),t.shouldShowPreferredBranch?(Oe(),Bi(c,{key:2})):vt("",!0),Ae("li",Rae,[Ae("a",{class:"facebook","aria-label":"facebook",target:"_blank",href:"https://www.facebook.com/JackboxGames",onClick:e[8]||(e[8]=p=>t.onLinkClick("https://www.facebook.com/JackboxGames"))}),Ae("a",{class:"twitter","aria-label":"twitter",target:"_blank",href:"https://twitter.com/jackboxgames",onClick:e[9]||(e[9]=p=>t.onLinkClick("https://twitter.com/jackboxgames"))}),Ae("a",{class:"instagram","aria-label":"instagram",target:"_blank",href:"https://www.instagram.com/playjackboxgames",onClick:e[10]||(e[10]=p=>t.onLinkClick("https://www.instagram.com/playjackboxgames"))})]),Ae("li",Sae,[Ae("a",yae,Ye(t.version),1)])])])}const Lae=Ar(Eae,[["render",Aae],["__scopeId","data-v-23454837"]]),Cae=lr({components:{PastGame:_L},props:{artifacts:Object,filter:String},data(){return{isManaging:!1}},computed:{pastGames(){var e;return(e=this.artifacts)!=null&&e.artifacts?this.artifacts.artifacts.map(r=>({artifact:r,game:Fl(r.categoryId)})).filter(r=>r.game?this.filter?this.filter===r.game.tag||this.filter===r.game.categoryId:!0:!1):[]}},methods:{onManage(){this.isManaging=!this.isManaging},onRemove(t){this.artifacts.remove(t)}}}),wae={key:0,class:"past-games"},Oae={class:"constrain"},Iae={key:0,class:"top-items"},Nae={key:1,class:"empty"};function Pae(t,e,r,n,i,s){const o=qr("PastGame");return t.artifacts?(Oe(),Pe("div",wae,[Ae("div",Oae,[t.pastGames&&t.pastGames.length?(Oe(),Pe("div",Iae,[Ae("h3",null,Ye(t.$t("PAST_GAMES.TITLE")),1),Ae("button",{class:"manage",onClick:e[0]||(e[0]=(...f)=>t.onManage&&t.onManage(...f))},Ye(t.isManaging?t.$t("ACTION.DONE"):t.$t("PAST_GAMES.MANAGE")),1)])):(Oe(),Pe("p",Nae,Ye(t.$t("PAST_GAMES.EMPTY")),1)),Kt(hM,{name:"list-transition"},{default:pc(()=>[(Oe(!0),Pe(Yt,null,Es(t.pastGames,(f,c)=>(Oe(),Bi(o,{key:f.artifact.url,"past-game":f,index:c,"is-managing":t.isManaging,location:"past_game",onRemove:t.onRemove},null,8,["past-game","index","is-managing","onRemove"]))),128))]),_:1})])])):vt("",!0)}const Uae=Ar(Cae,[["render",Pae],["__scopeId","data-v-40ec1b21"]]),Dae=lr({components:{HamburgerMenu:Lae,PastGames:Uae},props:{artifacts:Object,twitch:Object},emits:["twitchLoginWasClicked","twitchLogoutWasClicked"],data(){return{graphicClass:null,openedTo:null,pastGamesFilter:null}},computed:{hasUnseenGames(){return this.artifacts.artifacts.length?this.artifacts.hasUnviewed:!1}},methods:{onHamburgerClick(){this.openedTo=this.openedTo?null:"menu",this.pastGamesFilter=null},onPastGamesClick(){this.openedTo="pastGames"},onTwitchLoginClick(){this.$emit("twitchLoginWasClicked")},onTwitchLogoutClick(){this.$emit("twitchLogoutWasClicked"),this.openedTo=null}}}),Bae={class:"header constrain"},Mae={class:"accessory"},$ae={key:0,class:"indicator"},Kae={key:0,class:"graphic"},kae={class:"accessory"},Gae={key:0,class:"open-container"};function Vae(t,e,r,n,i,s){const o=qr("PastGames"),f=qr("HamburgerMenu");return t.twitch?(Oe(),Pe("div",{key:0,class:Vr(["top-bar",{open:t.openedTo!==null}])},[Ae("header",Bae,[Ae("div",Mae,[Ae("button",{class:"hamburger-icon",onKeyup:e[0]||(e[0]=Ys((...c)=>t.onHamburgerClick&&t.onHamburgerClick(...c),["enter"])),onClick:e[1]||(e[1]=(...c)=>t.onHamburgerClick&&t.onHamburgerClick(...c))},[!t.openedTo&&t.hasUnseenGames?(Oe(),Pe("div",$ae)):vt("",!0)],32)]),Ae("div",{class:Vr(["center",t.graphicClass])},[e[2]||(e[2]=Ae("div",{class:"logo"},null,-1)),t.graphicClass?(Oe(),Pe("div",Kae)):vt("",!0)],2),Ae("div",kae,[t.twitch.user?(Oe(),Pe("div",{key:0,class:"twitch-avatar",style:lc(`background-image: url(${t.twitch.user.profile_image_url});`)},null,4)):vt("",!0)])]),t.openedTo?(Oe(),Pe("div",Gae,[t.openedTo==="pastGames"?(Oe(),Bi(o,{key:"pastGames",class:"screen",artifacts:t.artifacts,filter:t.pastGamesFilter},null,8,["artifacts","filter"])):vt("",!0),t.openedTo==="menu"?(Oe(),Bi(f,{key:"menu",class:"screen","has-unseen-games":t.hasUnseenGames,twitch:t.twitch,onPastGameWasClicked:t.onPastGamesClick,onTwitchLoginWasClicked:t.onTwitchLoginClick,onTwitchLogoutWasClicked:t.onTwitchLogoutClick},null,8,["has-unseen-games","twitch","onPastGameWasClicked","onTwitchLoginWasClicked","onTwitchLogoutWasClicked"])):vt("",!0)])):vt("",!0)],2)):vt("",!0)}const Fae=Ar(Dae,[["render",Vae],["__scopeId","data-v-c7a91389"]]),Hae=lr({name:"@connect",components:{Connect:_se,TopBar:Fae,RecentGames:Kse,SlideBanner:jse},props:{options:Object},setup(){return{fatalError:qs(ym.fatal.error)}},data(){return{artifacts:new Za,theme:Je.get("preference:theme")||"device",twitch:new $W(this.options.match.hashString)}},computed:{classes(){const t=[`locale-${this.$i18n.locale}`,`theme-${this.theme}`];return this.recentGames.length&&t.push("has-recent"),t},recentGames(){var t,e;return(e=(t=this.artifacts)==null?void 0:t.artifacts)==null?void 0:e.slice(0,3).map(r=>({artifact:r,game:Fl(r.categoryId)})).filter(r=>r.game)},shouldShowFatal(){var t;return((t=this.fatalError)==null?void 0:t.hasCrashed)??!1}},watch:{theme:{immediate:!0,handler:function(){this.theme==="dark"||window.matchMedia("(prefers-color-scheme: dark)").matches?document.documentElement.classList.add("cc--darkmode"):document.documentElement.classList.remove("cc--darkmode")}}},beforeMount(){this.setupTwitch(),window.addEventListener("themedidchange",this.onThemeChange)},mounted(){this.checkForPastGamesUrl()},beforeUnmount(){window.removeEventListener("themedidchange",this.onThemeChange),this.$cc.hide()},methods:{setupTwitch(){this.twitch.prepare()},onTwitchLoginClick(){this.twitch.login()},onTwitchLogoutClick(){this.twitch.logout()},onPastGamesClick(){const t=this.$refs.topBar;t.$data.openedTo="pastGames"},onThemeChange(t){this.theme=Je.get("preference:theme")||"device"},checkForPastGamesUrl(){var r;const t=(r=this.options)==null?void 0:r.match;if(!t||!t.url.includes("past-games"))return;const e=this.$refs.topBar;t.data.game&&(e.$data.pastGamesFilter=t.data.game),e.$data.openedTo="pastGames"}}}),Wae={class:"form"},Xae={class:"constrain"},jae={key:0,class:"bottom-logo",target:"_blank",href:"https://www.jackboxgames.com/?utm_source=jackboxtv&utm_medium=logo&utm_campaign=jackboxgames"};function zae(t,e,r,n,i,s){const o=qr("Fatal"),f=qr("TopBar"),c=qr("Connect"),d=qr("SlideBanner"),p=qr("RecentGames"),E=qr("Modal");return t.shouldShowFatal?(Oe(),Bi(o,{key:0})):(Oe(),Pe("div",{key:1,class:Vr(["jbg schemable sign-in",t.classes])},[Kt(f,{ref:"topBar",twitch:t.twitch,artifacts:t.artifacts,onTwitchLoginWasClicked:t.onTwitchLoginClick,onTwitchLogoutWasClicked:t.onTwitchLogoutClick},null,8,["twitch","artifacts","onTwitchLoginWasClicked","onTwitchLogoutWasClicked"]),Ae("div",Wae,[Ae("div",Xae,[Kt(c,{match:t.options.match,"twitch-user":t.twitch.user,onTwitchLoginWasClicked:t.onTwitchLoginClick},null,8,["match","twitch-user","onTwitchLoginWasClicked"]),Kt(d),t.recentGames.length?vt("",!0):(Oe(),Pe("a",jae,Ye(t.$t("HOMEPAGE_LINK")),1))])]),Kt(p,{"recent-games":t.recentGames,onPastGamesWasClicked:t.onPastGamesClick},null,8,["recent-games","onPastGamesWasClicked"]),Kt(E)],2))}const qae=Ar(Hae,[["render",zae],["__scopeId","data-v-d720b942"]]);R2();window.tv.register({mount:t=>{var i;let e=AM(qae,{options:t}),r;(i=t.match)!=null&&i.params.locale&&(r=t.match.params.locale),js.set(r);const n=pK({fallbackLocale:"en",locale:js.locale,messages:js.mergeMessages(wj,Da)});return e.use(yZ),e.use(Xte),e.use(n),e.use(Sre,{i18n:n}),e.use(zre),e.use(GZ,{revision:1,guiOptions:{consentModal:{layout:"bar inline",position:"bottom",equalWeightButtons:!0,flipButtons:!0},preferencesModal:{layout:"box",position:"right",equalWeightButtons:!0,flipButtons:!1}},categories:{necessary:{readOnly:!0}},language:{default:"en",autoDetect:"browser",translations:js.supported.reduce((s,o)=>{var f;return(f=Da[o])!=null&&f.COOKIE&&(s[o]={consentModal:{label:Da[o].COOKIE.CONSENT_MODAL.ARIA,description:e.config.globalProperties.$bb(Da[o].COOKIE.DESCRIPTION),acceptAllBtn:Da[o].COOKIE.ACCEPT_ALL,acceptNecessaryBtn:Da[o].COOKIE.REJECT_ALL},preferencesModal:{sections:[]}}),s},{})}}),e.mount("#app"),()=>{e.unmount(),e=null}},info:t=>({tag:"@connect",version:t.version,type:t.type,branch:t.branch})});
-//# sourceMappingURL=BsmqOaD1.js.map